@@ -0,0 +1,627 @@
+#!/usr/bin/env python3
+
+# Headless latency benchmarks for the editor. They drive NotesTabWidget
+# directly under the offscreen Qt platform, inside a scratch directory so no
+# real notes are touched:
+#
+#     python benchmarks/suite.py                  # run, compare with baseline.json
+#     python benchmarks/suite.py --quick          # leave out the biggest documents
+#     python benchmarks/suite.py --save-baseline  # make this run the new baseline
+#
+# Every result is a time in milliseconds, lower is better. A result more than
+# --tolerance slower than the baseline is a regression and makes the run exit
+# with status 1. Results are always written to --output as well. A result the
+# baseline doesn't have can't regress, so a change that adds results saves a
+# new baseline along with them.
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import unittest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, ROOT)
+
+import newmain
+import notefiles
+import notehistory
+from newmain import NotesTabWidget, app
+from PyQt5 import QtCore, QtTest, QtWidgets
+
+BASELINE = os.path.join(ROOT, 'benchmarks', 'baseline.json')
+OUTPUT = os.path.join(ROOT, 'benchmarks', 'results.json')
+
+KB = 1024
+MB = 1024 * 1024
+# document sizes each benchmark runs at, --quick stops at QUICK_MAX_BYTES
+KEYSTROKE_SIZES = [KB, 64 * KB, MB, 10 * MB, 50 * MB]
+OPEN_SIZES = [KB, 64 * KB, MB, 10 * MB, 50 * MB]
+SAVE_SIZES = [64 * KB, MB, 10 * MB]
+FORMAT_SIZES = [64 * KB, MB]
+COMPRESS_SIZES = [MB, 10 * MB]
+# versions of a MB note with small edits recorded by the history benchmark
+HISTORY_VERSIONS = 1000
+# undo steps made before the undo benchmark drops the older half of them
+UNDO_STEPS = 200
+UNDO_SIZES = [64 * KB, MB]
+EXPORT_SIZES = [64 * KB, MB, 10 * MB]
+QUICK_MAX_BYTES = MB
+
+KEYSTROKES = 20
+SCROLL_PAGES = 20
+TABS = 100
+AUTOSAVE_ROUNDS = 50
+# one off measurements are repeated and the median kept, except for the
+# biggest documents where a single run takes long enough to be stable
+REPEATS = 5
+
+# differences below this are noise, whatever the ratio
+NOISE_MS = 1.0
+
+# name -> function(sizes filter) returning {result name: ms}
+BENCHMARKS = {}
+
+
+def benchmark(func):
+    BENCHMARKS[func.__name__] = func
+    return func
+
+
+class CompareTest(unittest.TestCase):
+    def test_compare(self):
+        baseline = {'fast': 1.0, 'slow': 100.0, 'steady': 50.0, 'gone': 3.0}
+        results = {'fast': 1.9, 'slow': 140.0, 'steady': 52.0, 'new': 7.0}
+        rows, regressions = compare(results, baseline, tolerance=0.25)
+
+        # 'fast' doubled but stays under the noise floor
+        self.assertEqual(regressions, ['slow'])
+        self.assertEqual([row[0] for row in rows], ['fast', 'new', 'slow', 'steady'])
+        self.assertIsNone(dict((row[0], row[2]) for row in rows)['new'])
+
+    def test_size_name(self):
+        self.assertEqual(sizeName(KB), '1KB')
+        self.assertEqual(sizeName(64 * KB), '64KB')
+        self.assertEqual(sizeName(50 * MB), '50MB')
+
+
+def sizeName(size):
+    if size >= MB:
+        return '%dMB' % (size // MB)
+    return '%dKB' % (size // KB)
+
+
+# ascii prose in lines of about 80 characters, so bytes and characters agree
+def makeText(size):
+    line = 'The quick brown fox jumps over the lazy dog, again and again and again.\n'
+    text = line * (size // len(line) + 1)
+    return text[:size]
+
+
+# the same with headings, emphasis, code spans, lists and fenced code blocks
+def makeMarkdown(size):
+    section = (
+        '## The quick brown fox\n\n'
+        + 'The *quick* brown fox jumps over the **lazy** dog, `again` and [again](x).\n' * 6
+        + '\n- jumps over the lazy dog\n- and again\n\n'
+        + '```\nfox = quick(brown)\ndog.jump(lazy=True)\n```\n\n')
+    text = section * (size // len(section) + 1)
+    return text[:size]
+
+
+def writeNote(name, size, suffix='.txt', makeText=makeText):
+    path = os.path.join('saved_notes', name + suffix)
+    with open(path, 'w', encoding='utf-8') as note:
+        note.write(makeText(size))
+    return path
+
+
+def settle():
+    app.processEvents()
+    app.processEvents()
+
+
+def milliseconds(seconds):
+    return round(seconds * 1000, 3)
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def repeats(size=0):
+    return REPEATS if size <= MB else 1
+
+
+def newWidget():
+    widget = NotesTabWidget()
+    widget.resize(900, 700)
+    widget.show()
+    settle()
+    return widget
+
+
+def dispose(widget):
+    for i in range(widget.count()):
+        tab = widget.widget(i)
+        if tab.loading:
+            tab.loader.stop()
+        widget.autoSaver.cancel(tab)
+        widget.detachJournal(tab, discard=True)
+    widget.autoSaver.waitForDone()
+    widget.searchIndex.close()
+    widget.history.close()
+    widget.hide()
+    widget.deleteLater()
+    settle()
+    # processEvents() leaves deferred deletes alone, big documents would pile up
+    QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+
+
+def waitLoaded(tab):
+    while tab.loading:
+        app.processEvents()
+    settle()
+
+
+# plain picks the plain (True) or rich (False) text editor, by default the
+# note gets the one it would get in the app
+def openNote(widget, path, plain=None):
+    index = widget.openFileUsingPath(path, lazy=True)
+    tab = widget.widget(index)
+    tab.plainEditing = plain
+    widget.setCurrentIndex(index)
+    widget.materialize(tab)
+    waitLoaded(tab)
+    return tab
+
+
+def modeName(plain):
+    return '.plain' if plain else ''
+
+
+# typing in the rich text editor (keystroke.<size>) and the plain text one
+# (keystroke.plain.<size>)
+@benchmark
+def keystroke(sizes):
+    results = {}
+    for size in sizes(KEYSTROKE_SIZES):
+        for plain in (False, True):
+            widget = newWidget()
+            editor = openNote(widget, writeNote('keystroke', size), plain).plainTextEdit
+            cursor = editor.textCursor()
+            cursor.setPosition(size // 2)
+            editor.setTextCursor(cursor)
+            settle()
+
+            # from the key press until the event loop has nothing left to do
+            times = []
+            for i in range(KEYSTROKES):
+                start = time.perf_counter()
+                QtTest.QTest.keyClick(editor, QtCore.Qt.Key_A)
+                settle()
+                times.append(time.perf_counter() - start)
+
+            name = 'keystroke%s.%s' % (modeName(plain), sizeName(size))
+            times.sort()
+            results[name + '.median'] = milliseconds(statistics.median(times))
+            results[name + '.p95'] = milliseconds(times[int(len(times) * 0.95) - 1])
+            dispose(widget)
+    return results
+
+
+# a page down in the middle of the note until it has been painted, in the
+# rich and the plain text editor
+@benchmark
+def scroll(sizes):
+    results = {}
+    for size in sizes(KEYSTROKE_SIZES):
+        for plain in (False, True):
+            widget = newWidget()
+            editor = openNote(widget, writeNote('scroll', size), plain).plainTextEdit
+            scrollBar = editor.verticalScrollBar()
+            scrollBar.setValue(scrollBar.maximum() // 2)
+            settle()
+
+            times = []
+            for i in range(SCROLL_PAGES):
+                start = time.perf_counter()
+                scrollBar.triggerAction(QtWidgets.QAbstractSlider.SliderPageStepAdd)
+                editor.viewport().repaint()
+                settle()
+                times.append(time.perf_counter() - start)
+
+            name = 'scroll%s.%s' % (modeName(plain), sizeName(size))
+            times.sort()
+            results[name + '.median'] = milliseconds(statistics.median(times))
+            results[name + '.p95'] = milliseconds(times[int(len(times) * 0.95) - 1])
+            dispose(widget)
+    return results
+
+
+# typing in a Markdown note that is highlighted, and opening it
+# (markdown.keystroke.<size>, markdown.open.<size>)
+@benchmark
+def markdown(sizes):
+    results = {}
+    for size in sizes(KEYSTROKE_SIZES):
+        path = writeNote('markdown', size, '.md', makeMarkdown)
+        widget = newWidget()
+        start = time.perf_counter()
+        editor = openNote(widget, path).plainTextEdit
+        results['markdown.open.%s' % sizeName(size)] = milliseconds(time.perf_counter() - start)
+        cursor = editor.textCursor()
+        cursor.setPosition(size // 2)
+        editor.setTextCursor(cursor)
+        settle()
+
+        times = []
+        for i in range(KEYSTROKES):
+            start = time.perf_counter()
+            QtTest.QTest.keyClick(editor, QtCore.Qt.Key_A)
+            settle()
+            times.append(time.perf_counter() - start)
+
+        name = 'markdown.keystroke.%s' % sizeName(size)
+        times.sort()
+        results[name + '.median'] = milliseconds(statistics.median(times))
+        results[name + '.p95'] = milliseconds(times[int(len(times) * 0.95) - 1])
+        dispose(widget)
+    return results
+
+
+@benchmark
+def tabs(sizes):
+    widget = newWidget()
+
+    def addTabs():
+        for i in range(TABS):
+            widget.add_new_tab()
+            app.processEvents()
+
+    def closeTabs():
+        while widget.count() > 1:
+            widget.close_tab(widget.count() - 1)
+            app.processEvents()
+
+    adding = []
+    closing = []
+    for i in range(repeats()):
+        adding.append(timed(addTabs) / TABS)
+        closing.append(timed(closeTabs) / TABS)
+        QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+
+    results = {
+        'tabs.add_new_tab': milliseconds(statistics.median(adding)),
+        'tabs.close_tab': milliseconds(statistics.median(closing)),
+    }
+    dispose(widget)
+    return results
+
+
+# the same in a fully set up, styled main window
+@benchmark
+def window_tabs(sizes):
+    window = QtWidgets.QMainWindow()
+    ui = newmain.Ui_MainWindow()
+    ui.setupUi(window, deferSetup=True)
+    window.show()
+    settle()
+
+    def addTabs():
+        for i in range(TABS):
+            ui.tabWidget.add_new_tab()
+            app.processEvents()
+
+    results = {'tabs.add_new_tab.window': milliseconds(timed(addTabs) / TABS)}
+    dispose(ui.tabWidget)
+    window.close()
+    window.deleteLater()
+    QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+    # setupUi styled the whole application, the other benchmarks run unstyled
+    app.setStyleSheet('')
+    settle()
+    return results
+
+
+@benchmark
+def open_file(sizes):
+    results = {}
+    for size in sizes(OPEN_SIZES):
+        path = writeNote('open', size)
+        times = []
+        for i in range(repeats(size)):
+            widget = newWidget()
+            times.append(timed(openNote, widget, path))
+            dispose(widget)
+        results['open.%s' % sizeName(size)] = milliseconds(statistics.median(times))
+    return results
+
+
+@benchmark
+def save(sizes):
+    results = {}
+    for size in sizes(SAVE_SIZES):
+        times = []
+        for i in range(repeats(size)):
+            widget = newWidget()
+            widget.currentWidget().plainTextEdit.setPlainText(makeText(size))
+            name = 'save_%s_%d' % (sizeName(size), i)
+            times.append(timed(widget.saveTab, name))
+            dispose(widget)
+        results['save.saveTab.%s' % sizeName(size)] = milliseconds(statistics.median(times))
+    return results
+
+
+@benchmark
+def autosave(sizes):
+    widget = newWidget()
+    tab = openNote(widget, writeNote('autosave', MB))
+    editor = tab.plainTextEdit
+
+    # a small edit that goes to the journal
+    def append():
+        editor.insertPlainText('x')
+        widget.autoSaver.flush(tab)
+        widget.autoSaver.waitForDone()
+
+    def appendRounds():
+        for i in range(AUTOSAVE_ROUNDS):
+            append()
+
+    # the whole note rewritten and its journal folded in
+    def compact():
+        editor.insertPlainText('y')
+        widget.autoSaver.flush(tab, compact=True)
+        widget.autoSaver.waitForDone()
+
+    # the first save of a note also records what it held before and a first
+    # version in its history, which later appends don't do again until the
+    # history interval is up
+    results = {
+        'autosave.history_version.1MB': milliseconds(timed(append)),
+        'autosave.journal_append': milliseconds(timed(appendRounds) / AUTOSAVE_ROUNDS),
+        'autosave.compact.1MB': milliseconds(statistics.median(timed(compact) for i in range(repeats()))),
+    }
+    dispose(widget)
+    return results
+
+
+@benchmark
+def formatting(sizes):
+    actions = ['setBold', 'setItalic', 'setUnderline', 'setStrikethrough', 'setCenterAlign']
+    results = {}
+    for size in sizes(FORMAT_SIZES):
+        widget = newWidget()
+        editor = widget.currentWidget().plainTextEdit
+        editor.setPlainText(makeText(size))
+        editor.selectAll()
+        settle()
+
+        # every action runs an even number of times, so it ends up undone
+        for action in actions:
+            def apply():
+                getattr(widget, action)()
+                settle()
+            times = [timed(apply) for i in range(2 * (repeats(size) // 2))]
+            results['format.%s.%s' % (action, sizeName(size))] = milliseconds(statistics.median(times))
+        dispose(widget)
+    return results
+
+
+# Opening a note stored plain and with either codec. How much smaller the
+# compressed files are goes to stderr, it isn't a time. The text repeats one
+# line, so it packs far better than real notes do.
+@benchmark
+def compression(sizes):
+    results = {}
+    for size in sizes(COMPRESS_SIZES):
+        data = makeText(size).encode('utf-8')
+        for codec, suffix in [('plain', ''), ('zlib', notefiles.ZLIB_SUFFIX), ('lzma', notefiles.LZMA_SUFFIX)]:
+            path = os.path.join('saved_notes', 'compressed_%s.txt%s' % (sizeName(size), suffix))
+            with open(path, 'wb') as note:
+                note.write(notefiles.encode(path, data))
+            if suffix:
+                print('  %s %s: %.2f%% of plain' % (codec, sizeName(size), 100 * os.path.getsize(path) / size),
+                      file=sys.stderr)
+
+            times = []
+            for i in range(repeats(size)):
+                widget = newWidget()
+                times.append(timed(openNote, widget, path))
+                dispose(widget)
+            results['compression.open.%s.%s' % (codec, sizeName(size))] = milliseconds(statistics.median(times))
+    return results
+
+
+# Recording versions of a note that gets a small edit each time, and reading
+# back the oldest one. What the history takes on disk goes to stderr.
+@benchmark
+def history(sizes):
+    path = os.path.join('saved_notes', 'history.db')
+    store = notehistory.NoteHistory(path, maxVersions=HISTORY_VERSIONS, interval=0)
+    data = notehistory.sampleText(MB)
+    times = []
+    for i in range(HISTORY_VERSIONS):
+        position = (i * 7919) % len(data)
+        data = data[:position] + b'edit %d\n' % i + data[position:]
+        times.append(timed(store.record, 'note.txt', data))
+    oldest = store.versions('note.txt')[-1][0]
+    read = statistics.median(timed(store.read, oldest) for i in range(repeats()))
+
+    print('  %d versions of 1MB: %.1fMB stored, %.1fMB database' % (
+        HISTORY_VERSIONS, store.storedBytes() / MB, os.path.getsize(path) / MB), file=sys.stderr)
+    store.close()
+    return {
+        'history.record.1MB': milliseconds(statistics.median(times)),
+        'history.read.1MB': milliseconds(read),
+    }
+
+
+# Dropping the older half of a note's undo steps, which makes the document
+# again from scratch, and a keystroke right after.
+@benchmark
+def undo(sizes):
+    results = {}
+    for size in sizes(UNDO_SIZES):
+        times = []
+        for i in range(repeats(size)):
+            widget = newWidget()
+            editor = openNote(widget, writeNote('undo', size)).plainTextEdit
+            budget = editor.undoBudget
+            cursor = editor.textCursor()
+            for step in range(UNDO_STEPS):
+                cursor.setPosition((step * 7919) % size)
+                cursor.insertText('edit %d ' % step)
+            settle()
+            budget.maxSteps = UNDO_STEPS - 1
+            times.append(timed(budget.trim))
+            dispose(widget)
+        results['undo.trim.%s' % sizeName(size)] = milliseconds(statistics.median(times))
+    return results
+
+
+# Exporting the current note to PDF in the background: how long the GUI thread
+# is busy starting it (export.start.<size>), the longest the event loop went
+# without running while the job did the rest (export.stall.<size>) and the
+# whole export (export.pdf.<size>).
+@benchmark
+def export(sizes):
+    results = {}
+    for size in sizes(EXPORT_SIZES):
+        widget = newWidget()
+        tab = openNote(widget, writeNote('export', size))
+        pdfPath = os.path.join('saved_notes', 'export.pdf')
+
+        start = time.perf_counter()
+        job = newmain.PrintJob([widget.noteToPrint(tab)], widget)
+        job.pdfPath = pdfPath
+        widget.startPrintJob(job, 'Export to PDF')
+        started = time.perf_counter()
+        stall = 0
+        last = started
+        while not job.isFinished():
+            app.processEvents()
+            now = time.perf_counter()
+            stall = max(stall, now - last)
+            last = now
+        settle()
+
+        name = sizeName(size)
+        results['export.start.%s' % name] = milliseconds(started - start)
+        results['export.stall.%s' % name] = milliseconds(stall)
+        results['export.pdf.%s' % name] = milliseconds(time.perf_counter() - start)
+        os.remove(pdfPath)
+        dispose(widget)
+    return results
+
+
+def run(names, quick=False):
+    def sizes(candidates):
+        return [size for size in candidates if not quick or size <= QUICK_MAX_BYTES]
+
+    results = {}
+    workingDirectory = os.getcwd()
+    with tempfile.TemporaryDirectory() as scratch:
+        os.chdir(scratch)
+        os.mkdir('saved_notes')
+        try:
+            for name in names:
+                print('running %s...' % name, file=sys.stderr)
+                results.update(BENCHMARKS[name](sizes))
+        finally:
+            os.chdir(workingDirectory)
+    return results
+
+
+# rows of (name, result, baseline, ratio), sorted by name, and the names
+# of the results that regressed
+def compare(results, baseline, tolerance):
+    rows = []
+    regressions = []
+    for name in sorted(results):
+        value = results[name]
+        base = baseline.get(name)
+        if base is None:
+            rows.append((name, value, None, None))
+            continue
+        ratio = value / base if base else float('inf')
+        rows.append((name, value, base, ratio))
+        if ratio > 1 + tolerance and value - base > NOISE_MS:
+            regressions.append(name)
+    return rows, regressions
+
+
+def meta(quick):
+    return {
+        'python': platform.python_version(),
+        'qt': QtCore.QT_VERSION_STR,
+        'pyqt': QtCore.PYQT_VERSION_STR,
+        'platform': platform.platform(),
+        'qpa': os.environ.get('QT_QPA_PLATFORM'),
+        'quick': quick,
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Editor latency benchmarks')
+    parser.add_argument('benchmarks', nargs='*',
+                        help='benchmarks to run, all of them by default: ' + ', '.join(BENCHMARKS))
+    parser.add_argument('--quick', action='store_true',
+                        help='only use documents up to %s' % sizeName(QUICK_MAX_BYTES))
+    parser.add_argument('--baseline', default=BASELINE)
+    parser.add_argument('--output', '-o', default=OUTPUT)
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='allowed slowdown against the baseline, 0.25 is 25%%')
+    parser.add_argument('--save-baseline', action='store_true')
+    args = parser.parse_args(argv)
+    unknown = set(args.benchmarks) - set(BENCHMARKS)
+    if unknown:
+        parser.error('unknown benchmarks: ' + ', '.join(sorted(unknown)))
+
+    # always in the same order, earlier benchmarks leave some state behind in Qt
+    names = [name for name in BENCHMARKS if not args.benchmarks or name in args.benchmarks]
+    results = run(names, args.quick)
+    report = {'meta': meta(args.quick), 'results': results}
+    with open(args.output, 'w') as output:
+        json.dump(report, output, indent=2, sort_keys=True)
+
+    if args.save_baseline:
+        newmain.atomicWrite(args.baseline, json.dumps(report, indent=2, sort_keys=True).encode('utf-8'))
+        print('saved baseline to %s' % args.baseline)
+        return 0
+
+    try:
+        with open(args.baseline) as file:
+            baseline = json.load(file)['results']
+    except FileNotFoundError:
+        baseline = {}
+
+    rows, regressions = compare(results, baseline, args.tolerance)
+    for name, value, base, ratio in rows:
+        if base is None:
+            print('%-32s %10.2f ms' % (name, value))
+        else:
+            flag = '  REGRESSION' if name in regressions else ''
+            print('%-32s %10.2f ms  baseline %10.2f ms  x%.2f%s' % (name, value, base, ratio, flag))
+
+    missing = [name for name, value, base, ratio in rows if base is None]
+    if missing:
+        print('%d result(s) not in %s, save a new baseline to compare them' % (len(missing), args.baseline))
+    if regressions:
+        print('%d regression(s) against %s' % (len(regressions), args.baseline))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
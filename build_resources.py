@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+
+# Packs the images NotiSimplifi uses into resources_rc.py, a compiled Qt
+# resource bundle. newmain.py imports it in one go instead of reading every
+# icon from resources/ on its own. Run it again after adding an 'icons:' name:
+#
+#     python build_resources.py
+#
+# Names that don't match a file under resources/ are reported and nothing is
+# written.
+
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import unittest
+from xml.sax.saxutils import escape
+
+
+# 'icons:<path under resources>' is how newmain.py refers to its images, see
+# the search path set up next to the QApplication
+ICON_NAME = re.compile(r'icons:([\w./-]+)')
+SOURCES = ['newmain.py']
+RESOURCE_DIR = 'resources'
+OUTPUT = 'resources_rc.py'
+
+
+class BuildResourcesTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.resources = os.path.join(self.tmp.name, 'resources')
+        os.makedirs(os.path.join(self.resources, 'tree_icons'))
+        for name in ['plus.png', 'tree_icons/arrow.png']:
+            with open(os.path.join(self.resources, name), 'wb') as image:
+                image.write(b'\x89PNG not really')
+
+        self.source = os.path.join(self.tmp.name, 'app.py')
+        with open(self.source, 'w') as source:
+            source.write("QIcon('icons:plus.png')\n"
+                         "style = 'image: url(icons:tree_icons/arrow.png);'\n"
+                         "deferIcon(button, \"icons:gone.png\")\n"
+                         "again = QIcon('icons:plus.png')\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_find_icon_names(self):
+        names = findIconNames([self.source])
+        self.assertEqual(names, ['gone.png', 'plus.png', 'tree_icons/arrow.png'])
+        self.assertEqual(missingIcons(names, self.resources), ['gone.png'])
+
+    # nothing is written while an icon is missing
+    def test_build(self):
+        output = os.path.join(self.tmp.name, 'resources_rc.py')
+        missing = build([self.source], self.resources, output)
+        self.assertEqual(missing, ['gone.png'])
+        self.assertFalse(os.path.exists(output))
+
+        with open(os.path.join(self.resources, 'gone.png'), 'wb') as image:
+            image.write(b'\x89PNG not really either')
+        self.assertEqual(build([self.source], self.resources, output), [])
+        with open(output) as bundle:
+            self.assertIn('qRegisterResourceData', bundle.read())
+
+
+def findIconNames(sources):
+    names = set()
+    for path in sources:
+        with open(path, encoding='utf-8') as source:
+            names.update(ICON_NAME.findall(source.read()))
+    return sorted(names)
+
+
+def missingIcons(names, resourceDir=RESOURCE_DIR):
+    return [name for name in names if not os.path.isfile(os.path.join(resourceDir, name))]
+
+
+# pyrcc5 only finds files relative to the .qrc, so it is written into resourceDir
+def writeQrc(names, qrcPath):
+    with open(qrcPath, 'w', encoding='utf-8') as qrc:
+        qrc.write('<RCC>\n  <qresource prefix="/icons">\n')
+        for name in names:
+            qrc.write('    <file>%s</file>\n' % escape(name))
+        qrc.write('  </qresource>\n</RCC>\n')
+
+
+# returns the names that are missing, the bundle is only written if there are none
+def build(sources=SOURCES, resourceDir=RESOURCE_DIR, output=OUTPUT):
+    names = findIconNames(sources)
+    missing = missingIcons(names, resourceDir)
+    if missing:
+        return missing
+
+    qrcPath = os.path.join(resourceDir, '.icons.qrc')
+    writeQrc(names, qrcPath)
+    try:
+        # the images are PNGs already, compressing them again only slows loading
+        subprocess.run([sys.executable, '-m', 'PyQt5.pyrcc_main', '-no-compress', '-o', output, qrcPath],
+                       check=True)
+    finally:
+        os.remove(qrcPath)
+    return []
+
+
+if __name__ == '__main__':
+    os.chdir(os.path.dirname(os.path.realpath(__file__)))
+    missing = build()
+    if missing:
+        print('missing icons, %s was not written:' % OUTPUT, file=sys.stderr)
+        for name in missing:
+            print('  ' + os.path.join(RESOURCE_DIR, name), file=sys.stderr)
+        sys.exit(1)
+    print('packed %d icons into %s' % (len(findIconNames(SOURCES)), OUTPUT))
@@ -4,25 +4,223 @@
 
 # Authors: Team Ironman -- James, Terryl, and Ryan
 
+import bisect
+import collections
+import concurrent.futures
+import contextlib
+import functools
 import glob
+import hashlib
+import inspect
+import io
+import itertools
+import json
+import mmap
 import os
+import queue
+import string
+import struct
 import sys
+import tempfile
+import threading
+import time
+import traceback
 import unittest
+import unittest.mock
+import uuid
 import xml.etree.ElementTree as et
 import unittest
+import zlib
 
-from PyQt5 import QtCore, QtGui, QtWidgets
-from PyQt5.QtCore import QEventLoop, QTimer, Qt, QSize, QDir
+# taken before Qt is loaded, --startup-trace timings start from here
+LAUNCH_TIME = time.perf_counter()
+
+from PyQt5 import QtCore, QtGui, QtTest, QtWidgets, sip
+from PyQt5.QtCore import QTimer, Qt, QSize, QDir
 from PyQt5.QtGui import QPixmap
 from PyQt5.QtWidgets import *
-from PyQt5.QtPrintSupport import QPrintDialog, QPrinter, QPrintPreviewDialog
+
+import notefiles
+import noteformat
+import notemarkdown
+import notestore
+from notehistory import NoteHistory
+from notesearch import SearchIndex
 
 
 app = QtWidgets.QApplication(sys.argv)
 
+# images are looked up as 'icons:<path under resources>'. They come out of the
+# compiled bundle once build_resources.py has been run, from the files otherwise.
+try:
+    import resources_rc
+    QDir.setSearchPaths('icons', [':/icons', 'resources'])
+except ImportError:
+    QDir.setSearchPaths('icons', ['resources'])
+
+# notes are kept in NOTES_DIR, --notes-dir=<path> points the app at another folder
+NOTES_DIR = 'saved_notes'
+for arg in sys.argv:
+    if arg.startswith('--notes-dir='):
+        NOTES_DIR = arg[len('--notes-dir='):]
+
+# --compress-notes saves notes compressed (see notefiles.py), compressed notes
+# are opened either way
+COMPRESS_NOTES = '--compress-notes' in sys.argv
+
+# Notes are read and written through NOTE_STORE (see notestore.py), files
+# outside of it through FILES. --notes-db=<file> keeps the notes in a SQLite
+# database instead of NOTES_DIR, which then only holds the journals, the
+# session and the search index.
+NOTES_DB = None
+for arg in sys.argv:
+    if arg.startswith('--notes-db='):
+        NOTES_DB = arg[len('--notes-db='):]
+
+FILES = notestore.FolderStore()
+if NOTES_DB:
+    NOTE_STORE = notestore.SqliteStore(NOTES_DB)
+else:
+    NOTE_STORE = notestore.FolderStore(NOTES_DIR)
+
+
+def storeFor(path):
+    return NOTE_STORE if NOTE_STORE.contains(path) else FILES
+
+# the notes tree only lists files ending in NOTE_SUFFIXES. Big folders are
+# added to it TREE_BATCH_ROWS rows per event loop iteration, and changes on
+# disk are picked up at most every TREE_REFRESH_MS. Notes are saved in the
+# note format (see noteformat.py), the others are opened as plain text. Any of
+# them can be compressed as well.
+NOTE_SUFFIXES = (noteformat.SUFFIX, '.txt', '.md')
+TREE_BATCH_ROWS = 2000
+TREE_REFRESH_MS = 500
+
+# autosave waits until typing has paused for AUTOSAVE_IDLE_MS, but a note is
+# never left unsaved for longer than AUTOSAVE_MAX_STALE_MS while it is being edited
+AUTOSAVE_IDLE_MS = 1000
+AUTOSAVE_MAX_STALE_MS = 10000
+
+# edits to saved notes are appended to a journal in JOURNAL_DIR, which is
+# folded back into the note once it grows past the size of the note itself
+# (or JOURNAL_COMPACT_BYTES for small notes)
+JOURNAL_DIR = os.path.join(NOTES_DIR, '.journal')
+JOURNAL_COMPACT_BYTES = 64 * 1024
+JOURNAL_MAGIC = b'NSJ1'
+# the search index gets the text of a note whose edits only went to its
+# journal JOURNAL_INDEX_MS after the first of them, however many followed
+JOURNAL_INDEX_MS = 5000
+
+# the versions of every note are kept in HISTORY_DIR (see notehistory.py).
+# Autosave records one at most every HISTORY_INTERVAL_S, saving or closing a
+# note always does. --history-versions=<n> and --history-days=<n> set how
+# many versions of a note are kept and for how long.
+HISTORY_DIR = os.path.join(NOTES_DIR, '.history')
+HISTORY_INTERVAL_S = 60
+HISTORY_VERSIONS = 1000
+HISTORY_DAYS = 90
+for arg in sys.argv:
+    if arg.startswith('--history-versions='):
+        HISTORY_VERSIONS = int(arg[len('--history-versions='):])
+    elif arg.startswith('--history-days='):
+        HISTORY_DAYS = int(arg[len('--history-days='):])
+
+# QTextCursor.selectedText() uses unicode separators where toPlainText() uses newlines
+PLAIN_TEXT_MAP = {0x2029: '\n', 0x2028: '\n', 0xa0: ' '}
+
+# files at least this big are streamed into their tab in chunks instead of
+# being read in one go; the GUI thread spends at most STREAM_SLICE_MS per
+# event loop iteration appending chunks
+STREAM_LOAD_MIN_BYTES = 1024 * 1024
+# compressed files are several times bigger once they are decompressed
+STREAM_LOAD_MIN_COMPRESSED_BYTES = 128 * 1024
+STREAM_CHUNK_CHARS = 64 * 1024
+STREAM_SLICE_MS = 15
+
+# files at least this big are opened from the tree in a read only viewer that
+# only reads the lines on screen (see FileViewer)
+VIEWER_MIN_BYTES = 64 * 1024 * 1024
+VIEWER_BLOCK_BYTES = 1024 * 1024
+# longer lines are cut off in the viewer
+VIEWER_MAX_LINE_CHARS = 4096
+
+
+# the open tabs are remembered in SESSION_DIR, changes are written out at most
+# every SESSION_SAVE_MS
+SESSION_DIR = os.path.join(NOTES_DIR, '.session')
+SESSION_SAVE_MS = 2000
+
+# edits spanning at least this many characters don't wait for the document
+# to be laid out again, see editBlock()
+EDIT_DEFER_LAYOUT_CHARS = 64 * 1024
+
+# a tab's undo history is kept within UNDO_MAX_BYTES (an estimate of the memory
+# Qt keeps for it) and UNDO_MAX_STEPS steps, --undo-max-bytes=<n> and
+# --undo-max-steps=<n> change them. Going over either drops the oldest steps
+# until the history is down to half of both. Typing with pauses shorter than
+# UNDO_MERGE_MS in between is undone as a single step, new lines included.
+UNDO_MAX_BYTES = 32 * 1024 * 1024
+UNDO_MAX_STEPS = 1000
+UNDO_MERGE_MS = 1000
+UNDO_STEP_BYTES = 64
+for arg in sys.argv:
+    if arg.startswith('--undo-max-bytes='):
+        UNDO_MAX_BYTES = int(arg[len('--undo-max-bytes='):])
+    elif arg.startswith('--undo-max-steps='):
+        UNDO_MAX_STEPS = int(arg[len('--undo-max-steps='):])
+
+# notes in these formats, which keep no formatting anyway, and notes of
+# PLAIN_EDIT_MIN_BYTES or more are edited in a QPlainTextEdit, which lays out
+# only what is on screen. Edit > Plain Text Editing switches a tab either way.
+PLAIN_EDIT_SUFFIXES = ('.txt', '.md')
+PLAIN_EDIT_MIN_BYTES = 4 * 1024 * 1024
+
+# notes in these formats are highlighted as Markdown, NotiSimplifi > Highlight
+# Markdown or --no-markdown-highlight turn it off
+MARKDOWN_SUFFIXES = ('.md',)
+MARKDOWN_HIGHLIGHT = '--no-markdown-highlight' not in sys.argv
+
+# notes are printed and exported to PDF on a PrintJob thread, which lays them
+# out EXPORT_BATCH_BLOCKS blocks at a time. Exported pages are A4 with
+# EXPORT_MARGIN_MM margins at EXPORT_RESOLUTION dpi, and the print preview
+# keeps the page layouts of its last PAGE_LAYOUT_CACHE page setups.
+EXPORT_RESOLUTION = 300
+EXPORT_MARGIN_MM = 15
+EXPORT_BATCH_BLOCKS = 1000
+PAGE_LAYOUT_CACHE = 4
+
+# what indenting a line puts in front of it
+INDENT = '    '
+
+# --trace keeps the last TRACE_EVENTS timed calls, and counts the event loop as
+# stalled when a timer due every TRACE_STALL_CHECK_MS is TRACE_STALL_MS late
+TRACE_EVENTS = 100000
+TRACE_STALL_CHECK_MS = 50
+TRACE_STALL_MS = 100
+TRACE_FILE = 'notisimplifi-trace.json'
+
+# Points the notes folder, and the journals, history and session kept in it,
+# at a temporary folder for the length of test, so running the tests leaves
+# saved_notes/ alone. Returns the folder.
+def useTemporaryNotes(test):
+    tmp = tempfile.TemporaryDirectory()
+    test.addCleanup(tmp.cleanup)
+    folders = {
+        'NOTES_DIR': tmp.name,
+        'NOTE_STORE': notestore.FolderStore(tmp.name),
+        'JOURNAL_DIR': os.path.join(tmp.name, '.journal'),
+        'HISTORY_DIR': os.path.join(tmp.name, '.history'),
+        'SESSION_DIR': os.path.join(tmp.name, '.session'),
+    }
+    for name, value in folders.items():
+        test.addCleanup(globals().__setitem__, name, globals()[name])
+        globals()[name] = value
+    return tmp.name
+
 
 class TabWidgetTest(unittest.TestCase):
     def setUp(self):
+        useTemporaryNotes(self)
         self.widget = NotesTabWidget()
 
     # test to make sure newly added tab from add_new_tab() is set to the current tab
@@ -61,16 +259,18 @@ class TabWidgetTest(unittest.TestCase):
         self.assertEqual(self.widget.tabBar().tabText(newIndex), "newmain")
 
     def test_folderTab(self):
-        path = QDir.currentPath()
+        path = os.path.join(NOTES_DIR, 'test')
+        self.addCleanup(os.rmdir, path)
         self.widget.folderTab('test')
 
-        self.assertTrue(os.path.isdir('test'))
+        self.assertTrue(os.path.isdir(path))
     
     def test_fileTab(self):
-        path = QDir.currentPath()
+        path = os.path.join(NOTES_DIR, 'test' + noteformat.SUFFIX)
+        self.addCleanup(os.remove, path)
         self.widget.fileTab('test')
 
-        self.assertTrue(os.path.isfile('test.txt'))
+        self.assertTrue(os.path.isfile(path))
     
     # test to see if an obviously unique file name returns a valid true
     def test_validname_knowntrue(self):
@@ -78,6 +278,8 @@ class TabWidgetTest(unittest.TestCase):
     
     # checking to see if an already known file name returns false
     def test_validname_knownfalse(self):
+        NOTE_STORE.write(os.path.join(NOTES_DIR, 'untitled.txt'), b'')
+        self.widget.nameIndex.rescan()
         self.assertEqual(self.widget.validName('untitled'), False)
     
     # checking to see if unsaved tab can change names
@@ -91,43 +293,2534 @@ class TabWidgetTest(unittest.TestCase):
         self.widget.set_savestate_true()
         self.assertEqual(self.widget.exit_app(), True)
 
+
+class AutoSaverTest(unittest.TestCase):
+    def setUp(self):
+        useTemporaryNotes(self)
+        self.widget = NotesTabWidget()
+        self.path = os.path.join(NOTES_DIR, 'autosave_test.txt')
+        self.tab = self.widget.currentWidget()
+        self.tab.filePath = self.path
+        self.tab.saveState = True
+
+    def tearDown(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    # edits are coalesced into a single write that happens off the GUI thread
+    def test_flush_writes_snapshot(self):
+        self.tab.plainTextEdit.setPlainText('first')
+        self.tab.plainTextEdit.setPlainText('second')
+        self.widget.autoSaver.flush(self.tab)
+        self.widget.autoSaver.waitForDone()
+
+        with open(self.path) as note:
+            self.assertEqual(note.read(), 'second')
+        stats = self.widget.autoSaver.stats()
+        self.assertEqual(stats['snapshotsTaken'], 1)
+        self.assertEqual(stats['bytesWritten'], len('second'))
+
+    # closing the window quits without going through exit_app, the edits
+    # still waiting for the idle timer are written all the same
+    def test_quit_writes_pending_edits(self):
+        self.tab.plainTextEdit.setPlainText('first')
+        self.widget.autoSaver.flush(self.tab, compact=True)
+        self.widget.autoSaver.waitForDone()
+        self.tab.plainTextEdit.moveCursor(QtGui.QTextCursor.End)
+        self.tab.plainTextEdit.insertPlainText(', then more')
+
+        app.aboutToQuit.connect(self.widget.saveAll)
+        self.addCleanup(app.aboutToQuit.disconnect, self.widget.saveAll)
+        app.aboutToQuit.emit()
+        with open(self.path) as note:
+            self.assertEqual(note.read(), 'first, then more')
+
+    # unchanged content does not get written again
+    def test_unchanged_content_skipped(self):
+        self.tab.plainTextEdit.setPlainText('same')
+        self.widget.autoSaver.flush(self.tab)
+        self.widget.autoSaveTab(self.tab)
+        self.widget.autoSaver.flush(self.tab)
+        self.widget.autoSaver.waitForDone()
+
+        self.assertEqual(self.widget.autoSaver.stats()['writesSkipped'], 1)
+
+
+class LazyTabTest(unittest.TestCase):
+    def setUp(self):
+        useTemporaryNotes(self)
+        self.widget = NotesTabWidget()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.paths = []
+        for name in ('lazy_one', 'lazy_two', 'lazy_three'):
+            path = os.path.join(self.tmp.name, name + '.txt')
+            with open(path, 'w') as note:
+                note.write(name + ' text')
+            self.paths.append(path)
+
+    def tearDown(self):
+        for i in range(self.widget.count()):
+            self.widget.detachJournal(self.widget.widget(i), discard=True)
+        self.tmp.cleanup()
+
+    # only the first of a batch of files is read right away
+    def test_background_tabs_not_materialized(self):
+        self.widget.openFiles(self.paths)
+        tabs = [self.widget.widget(self.widget.count() - 3 + i) for i in range(3)]
+
+        self.assertIs(self.widget.currentWidget(), tabs[0])
+        self.assertTrue(tabs[0].isMaterialized())
+        self.assertFalse(tabs[1].isMaterialized())
+        self.assertFalse(tabs[2].isMaterialized())
+
+        # showing a tab reads its file
+        self.widget.setCurrentWidget(tabs[1])
+        self.assertTrue(tabs[1].isMaterialized())
+        self.assertEqual(tabs[1].plainTextEdit.toPlainText(), 'lazy_two text')
+
+        # so does using its editor
+        self.assertEqual(tabs[2].plainTextEdit.toPlainText(), 'lazy_three text')
+
+
+class StreamingOpenTest(unittest.TestCase):
+    def setUp(self):
+        global STREAM_LOAD_MIN_BYTES
+        useTemporaryNotes(self)
+        self.minBytes = STREAM_LOAD_MIN_BYTES
+        STREAM_LOAD_MIN_BYTES = 0
+
+        self.widget = NotesTabWidget()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'streamed.txt')
+        self.text = ''.join('line %d \u00e9\n' % i for i in range(50000))
+        with open(self.path, 'w', encoding='utf-8') as note:
+            note.write(self.text)
+
+    def tearDown(self):
+        global STREAM_LOAD_MIN_BYTES
+        STREAM_LOAD_MIN_BYTES = self.minBytes
+        for i in range(self.widget.count()):
+            self.widget.detachJournal(self.widget.widget(i), discard=True)
+        self.tmp.cleanup()
+
+    def test_stream_whole_file(self):
+        index = self.widget.openFileUsingPath(self.path)
+        tab = self.widget.widget(index)
+        self.assertTrue(tab.loading)
+        self.assertTrue(tab.plainTextEdit.isReadOnly())
+
+        deadline = QtCore.QElapsedTimer()
+        deadline.start()
+        while tab.loading and deadline.elapsed() < 30000:
+            app.processEvents()
+
+        self.assertFalse(tab.loading)
+        self.assertFalse(tab.plainTextEdit.isReadOnly())
+        self.assertEqual(tab.plainTextEdit.toPlainText(), self.text)
+        self.assertEqual(tab.journal.baseCrc, zlib.crc32(self.text.encode('utf-8')))
+        self.assertTrue(tab.journal.baseMatches)
+
+    # cancelling closes the half loaded tab
+    def test_cancel(self):
+        count = self.widget.count()
+        index = self.widget.openFileUsingPath(self.path)
+        tab = self.widget.widget(index)
+        tab.loadingBar.cancelButton.click()
+
+        self.assertEqual(self.widget.count(), count)
+        self.assertEqual(self.widget.indexOf(tab), -1)
+
+
+class RichNoteTest(unittest.TestCase):
+    def setUp(self):
+        useTemporaryNotes(self)
+        self.widget = NotesTabWidget()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'rich' + noteformat.SUFFIX)
+
+        self.editor = self.widget.currentWidget().plainTextEdit
+        self.editor.setPlainText('title\nfirst item\nsecond item\nthe end')
+        cursor = self.editor.textCursor()
+        cursor.setPosition(0)
+        cursor.setPosition(5, QtGui.QTextCursor.KeepAnchor)
+        self.editor.setTextCursor(cursor)
+        self.widget.setBold()
+        self.widget.setCenterAlign()
+        cursor.setPosition(6)
+        cursor.setPosition(20, QtGui.QTextCursor.KeepAnchor)
+        self.editor.setTextCursor(cursor)
+        self.widget.setNumberList()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def checkFormatting(self, document):
+        self.assertEqual(document.toPlainText(), 'title\nfirst item\nsecond item\nthe end')
+        blocks = [document.findBlockByNumber(i) for i in range(4)]
+        self.assertEqual(blocks[0].blockFormat().alignment(), Qt.AlignCenter)
+        self.assertEqual(blocks[0].begin().fragment().charFormat().fontWeight(), QtGui.QFont.Bold)
+        self.assertEqual(blocks[3].begin().fragment().charFormat().fontWeight(), QtGui.QFont.Normal)
+        self.assertIsNone(blocks[0].textList())
+        self.assertEqual(blocks[1].textList().count(), 2)
+        self.assertEqual(blocks[2].textList().format().style(), QtGui.QTextListFormat.ListDecimal)
+
+    def test_round_trip(self):
+        with open(self.path, 'wb') as note:
+            note.write(self.widget.noteData(self.widget.currentWidget()))
+        index = self.widget.openFileUsingPath(self.path)
+        self.checkFormatting(self.widget.widget(index).plainTextEdit.document())
+
+        # saving it again only encodes the list items, the rest is as it was read
+        self.widget.noteData(self.widget.widget(index))
+        self.assertEqual(self.widget.widget(index).serializer.blocksEncoded, 2)
+
+    # only the blocks an edit touched are encoded again
+    def test_incremental(self):
+        tab = self.widget.currentWidget()
+        first = self.widget.noteData(tab)
+        self.assertEqual(tab.serializer.blocksEncoded, 4)
+        self.assertEqual(self.widget.noteData(tab), first)
+        self.assertEqual(tab.serializer.blocksEncoded, 4)
+
+        cursor = self.editor.textCursor()
+        cursor.setPosition(len('title'))
+        cursor.insertText('\nsubtitle')
+        cursor.setPosition(len(self.editor.toPlainText()))
+        cursor.setPosition(len(self.editor.toPlainText()) - 3, QtGui.QTextCursor.KeepAnchor)
+        self.editor.setTextCursor(cursor)
+        self.widget.setItalic()
+        data = self.widget.noteData(tab)
+        self.assertEqual(tab.serializer.blocksEncoded, 4 + 3)
+
+        # the cached lines are what encoding everything again gives
+        self.assertEqual(data, NoteSerializer(self.editor.document()).serialize())
+
+    def test_stream(self):
+        global STREAM_LOAD_MIN_BYTES
+        minBytes = STREAM_LOAD_MIN_BYTES
+        STREAM_LOAD_MIN_BYTES = 0
+        self.addCleanup(globals().__setitem__, 'STREAM_LOAD_MIN_BYTES', minBytes)
+
+        with open(self.path, 'wb') as note:
+            note.write(self.widget.noteData(self.widget.currentWidget()))
+        index = self.widget.openFileUsingPath(self.path)
+        tab = self.widget.widget(index)
+        self.assertIsInstance(tab.loader, NoteLoader)
+        while tab.loading:
+            app.processEvents()
+
+        self.checkFormatting(tab.plainTextEdit.document())
+        self.assertIsNone(tab.journal)
+        self.assertFalse(tab.plainTextEdit.isReadOnly())
+
+    # compressed notes open under their name and are written back compressed
+    def test_compressed(self):
+        global STREAM_LOAD_MIN_COMPRESSED_BYTES
+        path = self.path + notefiles.ZLIB_SUFFIX
+        with open(path, 'wb') as note:
+            note.write(notefiles.encode(path, self.widget.noteData(self.widget.currentWidget())))
+        index = self.widget.openFileUsingPath(path)
+        tab = self.widget.widget(index)
+        self.assertEqual(self.widget.tabText(index), 'rich')
+        self.checkFormatting(tab.plainTextEdit.document())
+
+        cursor = tab.plainTextEdit.textCursor()
+        cursor.setPosition(0)
+        cursor.insertText('new ')
+        self.widget.autoSaver.schedule(tab)
+        self.widget.autoSaver.flush(tab)
+        self.widget.autoSaver.waitForDone()
+        self.assertEqual(noteformat.readText(path), 'new title\nfirst item\nsecond item\nthe end')
+
+        # plain text too, streamed in
+        text = ''.join('line %d\n' % i for i in range(20000))
+        path = os.path.join(self.tmp.name, 'log.txt' + notefiles.LZMA_SUFFIX)
+        with open(path, 'wb') as log:
+            log.write(notefiles.encode(path, text.encode('utf-8')))
+        self.assertLess(os.path.getsize(path), STREAM_LOAD_MIN_COMPRESSED_BYTES)
+        minBytes = STREAM_LOAD_MIN_COMPRESSED_BYTES
+        STREAM_LOAD_MIN_COMPRESSED_BYTES = 0
+        self.addCleanup(globals().__setitem__, 'STREAM_LOAD_MIN_COMPRESSED_BYTES', minBytes)
+
+        tab = self.widget.widget(self.widget.openFileUsingPath(path))
+        self.assertIsInstance(tab.loader, FileLoader)
+        while tab.loading:
+            app.processEvents()
+        self.assertEqual(tab.plainTextEdit.toPlainText(), text)
+        self.assertIsNone(tab.journal)
+
+
+class FileViewerTest(unittest.TestCase):
+    def setUp(self):
+        useTemporaryNotes(self)
+        self.widget = NotesTabWidget()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'huge.log')
+        self.lines = ['entry %d ' % i + 'x' * (i % 300) for i in range(20000)]
+        with open(self.path, 'w') as log:
+            log.write('\n'.join(self.lines))
+
+    def tearDown(self):
+        for i in range(self.widget.count()):
+            tab = self.widget.widget(i)
+            if isinstance(tab, ViewerTab):
+                tab.viewer.release()
+            else:
+                self.widget.detachJournal(tab, discard=True)
+        self.tmp.cleanup()
+
+    def test_lines(self):
+        global VIEWER_BLOCK_BYTES
+        blockBytes = VIEWER_BLOCK_BYTES
+        # small blocks so lines cross block boundaries
+        VIEWER_BLOCK_BYTES = 4096
+        try:
+            tab = self.widget.widget(self.widget.openViewer(self.path))
+            tab.viewer.indexer.join()
+        finally:
+            VIEWER_BLOCK_BYTES = blockBytes
+
+        viewer = tab.viewer
+        self.assertEqual(viewer.lineCount(), len(self.lines))
+        for line in (0, 1, 4096, 12345, len(self.lines) - 1):
+            self.assertEqual(viewer.lineText(line), self.lines[line])
+
+    def test_open_for_editing(self):
+        tab = self.widget.widget(self.widget.openViewer(self.path))
+        index = self.widget.openForEditing(tab)
+
+        editorTab = self.widget.widget(index)
+        self.assertNotIsInstance(editorTab, ViewerTab)
+        self.assertIs(self.widget.currentWidget(), editorTab)
+
+
+class DeferredSetupTest(unittest.TestCase):
+    def setUp(self):
+        useTemporaryNotes(self)
+        self.window = QtWidgets.QMainWindow()
+        self.ui = Ui_MainWindow()
+        self.ui.setupUi(self.window, deferSetup=True)
+
+    def tearDown(self):
+        self.ui.indexWorker.waitForDone()
+
+    # icons and the tree are only loaded by finishSetup()
+    def test_finish_setup(self):
+        self.assertTrue(self.ui.boldButton.icon().isNull())
+        self.assertIsNone(self.ui.tree.model())
+        self.assertGreater(self.ui.tabWidget.count(), 0)
+
+        self.ui.finishSetup()
+        self.assertFalse(self.ui.boldButton.icon().isNull())
+        self.assertIs(self.ui.tree.model(), self.ui.model)
+
+        # running it again changes nothing
+        model = self.ui.model
+        self.ui.finishSetup()
+        self.assertIs(self.ui.model, model)
+
+
+class IconRegistryTest(unittest.TestCase):
+    # every lookup after the first is served from QPixmapCache
+    def test_decoded_once(self):
+        registry = IconRegistry()
+        pixmap = registry.pixmap('icons:plus_icon.png')
+        self.assertFalse(pixmap.isNull())
+        self.assertEqual(registry.pixmap('icons:plus_icon.png').cacheKey(), pixmap.cacheKey())
+        self.assertIs(registry.icon('icons:plus_icon.png'), registry.icon('icons:plus_icon.png'))
+
+
+class ThemeTest(unittest.TestCase):
+    def setUp(self):
+        useTemporaryNotes(self)
+
+    def tearDown(self):
+        themeManager.apply('Dark')
+
+    # switching restyles the existing widgets, nothing is rebuilt
+    def test_switch_theme(self):
+        widget = NotesTabWidget()
+        button = widget.addTabButton
+        self.assertEqual(widget.styleSheet(), '')
+
+        themeManager.apply('Dark')
+        self.assertIn(THEMES['Dark']['window'], app.styleSheet())
+        widget.tabBar().tabSizeHint(0)
+        self.assertIsNotNone(widget.tabBar().tabHeight)
+
+        switched = []
+        themeManager.themeChanged.connect(switched.append)
+        themeManager.apply('Light')
+        self.assertEqual(switched, ['Light'])
+        self.assertIn(THEMES['Light']['window'], app.styleSheet())
+        self.assertIs(widget.addTabButton, button)
+        # the tab height is worked out again for the new style
+        app.processEvents()
+        self.assertIsNone(widget.tabBar().tabHeight)
+        themeManager.themeChanged.disconnect(switched.append)
+
+
+class SessionTest(unittest.TestCase):
+    def setUp(self):
+        useTemporaryNotes(self)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.tmp.name, 'session')
+        self.notePath = os.path.join(self.tmp.name, 'kept.txt')
+        with open(self.notePath, 'w', encoding='utf-8') as note:
+            note.write('kept note\n' * 50)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def openSession(self):
+        widget = NotesTabWidget()
+        return widget, Session(widget, self.directory)
+
+    def test_restore(self):
+        widget, session = self.openSession()
+        widget.openFileUsingPath(self.notePath)
+        cursor = widget.currentWidget().plainTextEdit.textCursor()
+        cursor.setPosition(15)
+        widget.currentWidget().plainTextEdit.setTextCursor(cursor)
+
+        index = widget.add_new_tab('scratch')
+        widget.widget(index).plainTextEdit.setPlainText('never saved')
+        widget.setCurrentIndex(1)
+        session.saveNow()
+
+        restored, session = self.openSession()
+        self.assertTrue(session.restore())
+        # the empty starting tab is replaced by the restored ones
+        self.assertEqual([restored.tabText(i) for i in range(restored.count())],
+                         ['untitled', 'kept', 'scratch'])
+        self.assertEqual(restored.currentIndex(), 1)
+        self.assertTrue(restored.widget(1).isMaterialized())
+        self.assertEqual(restored.widget(1).plainTextEdit.textCursor().position(), 15)
+
+        # the others are filled in from the event loop
+        while session.restoreTimer.isActive():
+            app.processEvents()
+        self.assertTrue(restored.widget(2).isMaterialized())
+        self.assertEqual(restored.widget(2).plainTextEdit.toPlainText(), 'never saved')
+
+    # unchanged buffers aren't written again, closed tabs' buffers are removed
+    def test_incremental(self):
+        widget, session = self.openSession()
+        widget.currentWidget().plainTextEdit.setPlainText('first')
+        index = widget.add_new_tab('second')
+        widget.widget(index).plainTextEdit.setPlainText('second')
+        session.saveNow()
+        self.assertEqual(session.buffersWritten, 2)
+
+        widget.widget(index).plainTextEdit.setPlainText('second, edited')
+        session.saveNow()
+        self.assertEqual(session.buffersWritten, 3)
+
+        widget.close_tab(index)
+        session.saveNow()
+        self.assertEqual(session.buffersWritten, 3)
+        self.assertEqual(len([name for name in os.listdir(self.directory) if name.endswith(noteformat.SUFFIX)]), 1)
+
+
+class NoteNameIndexTest(unittest.TestCase):
+    def setUp(self):
+        useTemporaryNotes(self)
+        self.widget = NotesTabWidget()
+
+    # names of open tabs and saved notes are both skipped
+    def test_get_valid_name(self):
+        self.assertEqual(self.widget.get_valid_name('  foobar '), 'foobar')
+        self.widget.add_new_tab('foobar')
+        self.widget.add_new_tab('foobar1')
+        self.assertEqual(self.widget.get_valid_name('foobar'), 'foobar2')
+
+    # notes saved by the app show up without waiting for the watcher
+    def test_saved_note_is_taken(self):
+        path = os.path.join(NOTES_DIR, 'name_index_test' + noteformat.SUFFIX)
+        self.assertTrue(self.widget.validName('name_index_test'))
+        self.widget.saveTab('name_index_test')
+        try:
+            self.assertFalse(self.widget.validName('name_index_test'))
+        finally:
+            self.widget.detachJournal(self.widget.tab, discard=True)
+            os.remove(path)
+
+    # replacing a note saved in another format removes it, and closes its tab
+    def test_replace_other_format(self):
+        path = os.path.join(NOTES_DIR, 'replaced.txt')
+        NOTE_STORE.write(path, b'old')
+        self.widget.nameIndex.rescan()
+        old = self.widget.widget(self.widget.openFileUsingPath(path))
+        self.widget.add_new_tab()
+        self.widget.tab.plainTextEdit.setPlainText('new')
+
+        with unittest.mock.patch.object(ErrorDialog, 'exec_', return_value=QDialog.Accepted):
+            self.assertTrue(self.widget.saveTab('replaced'))
+        self.widget.detachJournal(self.widget.tab, discard=True)
+
+        # the dialog names the note that is replaced
+        self.assertEqual(self.widget.errorDialog.text, os.path.abspath(path))
+        self.assertEqual([name for name in os.listdir(NOTES_DIR) if not name.startswith('.')],
+                         ['replaced' + noteformat.SUFFIX])
+        self.assertEqual(self.widget.indexOf(old), -1)
+        self.assertEqual(self.widget.nameIndex.savedPaths('replaced'),
+                         [os.path.join(self.widget.nameIndex.directory, 'replaced' + noteformat.SUFFIX)])
+
+
+class NoteJournalTest(unittest.TestCase):
+    def setUp(self):
+        useTemporaryNotes(self)
+        self.widget = NotesTabWidget()
+        self.path = os.path.join(NOTES_DIR, 'journal_test.txt')
+        with open(self.path, 'w') as note:
+            note.write('hello world\nsecond line')
+        index = self.widget.openFileUsingPath(self.path)
+        self.tab = self.widget.widget(index)
+
+    def tearDown(self):
+        self.widget.detachJournal(self.tab, discard=True)
+        os.remove(self.path)
+
+    def edit(self):
+        cursor = self.tab.plainTextEdit.textCursor()
+        cursor.setPosition(5)
+        cursor.setPosition(11, QtGui.QTextCursor.KeepAnchor)
+        cursor.insertText(', journal\nnew line')
+        cursor.movePosition(QtGui.QTextCursor.End)
+        cursor.insertText(' \u00e9\U0001f600!')
+
+    # edits are appended to the journal and can be replayed after a crash
+    def test_replay_recovers_edits(self):
+        self.edit()
+        self.widget.autoSaver.flush(self.tab)
+        self.widget.autoSaver.waitForDone()
+
+        # the note itself hasn't been rewritten yet
+        with open(self.path) as note:
+            self.assertEqual(note.read(), 'hello world\nsecond line')
+
+        self.assertEqual(replayJournal(self.tab.journal.journalPath), os.path.abspath(self.path))
+        with open(self.path) as note:
+            self.assertEqual(note.read(), self.tab.plainTextEdit.toPlainText())
+
+    # a journal that is older than its note is discarded
+    def test_stale_journal_ignored(self):
+        self.edit()
+        self.widget.autoSaver.flush(self.tab)
+        self.widget.autoSaver.waitForDone()
+        journalPath = self.tab.journal.journalPath
+
+        with open(self.path, 'w') as note:
+            note.write('rewritten')
+        self.assertIsNone(replayJournal(journalPath))
+        self.assertFalse(os.path.exists(journalPath))
+
+    # edits that only went to the journal can be searched for all the same
+    def test_journaled_edits_indexed(self):
+        self.widget.autoSaver.indexMs = 0
+        self.edit()
+        self.widget.autoSaver.flush(self.tab)
+        self.widget.autoSaver.waitForDone()
+        self.assertEqual(self.widget.searchIndex.search('journal'), [])
+
+        app.processEvents()
+        self.widget.autoSaver.waitForDone()
+        self.assertEqual([path for score, path in self.widget.searchIndex.search('journal')],
+                         [os.path.abspath(self.path)])
+        self.assertFalse(self.widget.autoSaver.listenersDue)
+
+    # compaction rewrites the note and removes the journal
+    def test_compaction(self):
+        self.edit()
+        self.widget.autoSaver.flush(self.tab, compact=True)
+        self.widget.autoSaver.waitForDone()
+
+        with open(self.path) as note:
+            self.assertEqual(note.read(), self.tab.plainTextEdit.toPlainText())
+        self.assertFalse(os.path.exists(self.tab.journal.journalPath))
+
+
+class NotesTreeModelTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = self.tmp.name
+        os.makedirs(os.path.join(self.root, 'projects'))
+        os.makedirs(os.path.join(self.root, '.journal'))
+        for name in ['b.txt', 'A.md', 'image.png', '.hidden.txt', 'projects/plan.txt', 'projects/old.txt.xz']:
+            open(os.path.join(self.root, name), 'w').close()
+        self.model = NotesTreeModel(self.root)
+        self.settle()
+
+    def tearDown(self):
+        self.model.worker.waitForDone()
+        self.tmp.cleanup()
+
+    def names(self, parent=QtCore.QModelIndex()):
+        return [self.model.index(row, 0, parent).data() for row in range(self.model.rowCount(parent))]
+
+    def settle(self):
+        while self.model.isListing():
+            self.model.worker.waitForDone()
+            app.processEvents()
+
+    # folders are only listed when they are expanded, and only notes are shown
+    def test_lazy(self):
+        self.assertEqual(self.names(), ['projects', 'A.md', 'b.txt'])
+        projects = self.model.index(0, 0)
+        self.assertTrue(self.model.hasChildren(projects))
+        self.assertTrue(self.model.canFetchMore(projects))
+
+        self.model.fetchMore(projects)
+        self.settle()
+        self.assertFalse(self.model.canFetchMore(projects))
+        # compressed notes are shown without the compression suffix
+        self.assertEqual(self.names(projects), ['old.txt', 'plan.txt'])
+        old = self.model.index(0, 0, projects)
+        self.assertEqual(self.model.filePath(old), os.path.join(self.root, 'projects', 'old.txt.xz'))
+        plan = self.model.index(1, 0, projects)
+        self.assertFalse(self.model.isDir(plan))
+        self.assertEqual(self.model.filePath(plan), os.path.join(self.root, 'projects', 'plan.txt'))
+
+    def test_batches(self):
+        global TREE_BATCH_ROWS
+        for i in range(25):
+            open(os.path.join(self.root, 'projects', 'note%02d.txt' % i), 'w').close()
+        projects = self.model.index(0, 0)
+
+        batchRows = TREE_BATCH_ROWS
+        TREE_BATCH_ROWS = 10
+        try:
+            self.model.fetchMore(projects)
+            self.model.worker.waitForDone()
+            app.processEvents()
+            self.assertLess(self.model.rowCount(projects), 27)
+            self.settle()
+        finally:
+            TREE_BATCH_ROWS = batchRows
+        self.assertEqual(self.model.rowCount(projects), 27)
+
+    # changes on disk are applied in place, rows that stay keep their index
+    def test_refresh(self):
+        projects = QtCore.QPersistentModelIndex(self.model.index(0, 0))
+        os.remove(os.path.join(self.root, 'A.md'))
+        open(os.path.join(self.root, 'c.txt'), 'w').close()
+        open(os.path.join(self.root, 'a.txt'), 'w').close()
+        os.makedirs(os.path.join(self.root, 'archive'))
+
+        self.model.folderChanged(self.root)
+        self.model.refresh()
+        self.model.worker.waitForDone()
+        app.processEvents()
+        self.assertEqual(self.names(), ['archive', 'projects', 'a.txt', 'b.txt', 'c.txt'])
+        self.assertEqual(projects.row(), 1)
+
+
+class SqliteStoreTest(unittest.TestCase):
+    def setUp(self):
+        global NOTE_STORE
+        useTemporaryNotes(self)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = notestore.SqliteStore(os.path.join(self.tmp.name, 'notes.db'))
+        self.addCleanup(globals().__setitem__, 'NOTE_STORE', NOTE_STORE)
+        NOTE_STORE = self.store
+        self.widgets = [NotesTabWidget()]
+        self.widget = self.widgets[0]
+
+    def tearDown(self):
+        self.widget.autoSaver.waitForDone()
+        # nothing is left to look at the database once it is closed
+        app.processEvents()
+        for widget in self.widgets:
+            widget.nameIndex.rescanTimer.stop()
+        self.store.close()
+        self.tmp.cleanup()
+
+    # notes are saved to, named after and opened from the database
+    def test_save_and_open(self):
+        self.widget.currentWidget().plainTextEdit.setPlainText('kept in sqlite')
+        self.assertTrue(self.widget.validName('db_note'))
+        self.widget.saveTab('db_note')
+        path = os.path.join(self.store.root, 'db_note' + noteformat.SUFFIX)
+        self.assertTrue(self.store.isFile(path))
+        self.assertFalse(os.path.exists(os.path.join(NOTES_DIR, 'db_note' + noteformat.SUFFIX)))
+        self.assertFalse(self.widget.validName('db_note'))
+        self.assertEqual(self.widget.get_valid_name('db_note'), 'db_note1')
+
+        # autosave writes it there too
+        self.widget.tab.plainTextEdit.moveCursor(QtGui.QTextCursor.End)
+        self.widget.tab.plainTextEdit.insertPlainText(', autosaved')
+        self.widget.autoSaver.flush(self.widget.tab)
+        self.widget.autoSaver.waitForDone()
+
+        other = NotesTabWidget()
+        self.widgets.append(other)
+        tab = other.widget(other.openFileUsingPath(path))
+        self.assertEqual(tab.plainTextEdit.toPlainText(), 'kept in sqlite, autosaved')
+        self.assertIsNone(tab.journal)
+
+    # the tree lists the database and picks up what is written to it
+    def test_tree(self):
+        self.store.makeFolder(os.path.join(self.store.root, 'work'))
+        self.store.write(os.path.join(self.store.root, 'work', 'plan.txt'), b'')
+        model = NotesTreeModel(self.store.root)
+        while model.isListing():
+            model.worker.waitForDone()
+            app.processEvents()
+        self.assertEqual(model.index(0, 0).data(), 'work')
+
+        self.store.write(os.path.join(self.store.root, 'a.txt'), b'')
+        app.processEvents()
+        model.refresh()
+        model.worker.waitForDone()
+        app.processEvents()
+        self.assertEqual([model.index(row, 0).data() for row in range(model.rowCount())], ['work', 'a.txt'])
+        model.worker.waitForDone()
+
+
+class HistoryTest(unittest.TestCase):
+    def setUp(self):
+        useTemporaryNotes(self)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.widget = NotesTabWidget()
+        self.widget.history = self.widget.autoSaver.history = NoteHistory(os.path.join(self.tmp.name, 'history.db'))
+        self.path = os.path.abspath(os.path.join(self.tmp.name, 'history.txt'))
+        with open(self.path, 'w') as note:
+            note.write('first draft')
+        self.tab = self.widget.widget(self.widget.openFileUsingPath(self.path))
+
+    def tearDown(self):
+        self.widget.autoSaver.waitForDone()
+        self.widget.detachJournal(self.tab, discard=True)
+        self.widget.history.close()
+        self.tmp.cleanup()
+
+    def edit(self, text):
+        self.tab.plainTextEdit.moveCursor(QtGui.QTextCursor.End)
+        self.tab.plainTextEdit.insertPlainText(text)
+        self.widget.autoSaver.flush(self.tab, compact=True)
+        self.widget.autoSaver.waitForDone()
+
+    # what the note held before it was first written is kept as well
+    def test_versions(self):
+        self.edit(', edited')
+        self.edit(' again')
+        versions = self.widget.history.versions(self.path)
+        self.assertEqual([self.widget.history.read(row[0]) for row in versions],
+                         [b'first draft, edited again', b'first draft, edited', b'first draft'])
+
+    # restoring an open note is an edit that can be undone
+    def test_restore(self):
+        self.edit(', edited')
+        index = self.widget.openHistory(self.path)
+        history = self.widget.widget(index)
+        self.assertEqual(self.widget.tabText(index), 'history (history)')
+        self.assertEqual(history.versionList.count(), 2)
+
+        history.versionList.setCurrentRow(1)
+        self.assertEqual(history.preview.toPlainText(), 'first draft')
+        history.restoreSelected()
+        self.assertEqual(self.tab.plainTextEdit.toPlainText(), 'first draft')
+        self.tab.plainTextEdit.undo()
+        self.assertEqual(self.tab.plainTextEdit.toPlainText(), 'first draft, edited')
+
+        # a note that isn't open is rewritten
+        self.widget.close_tab(self.widget.indexOf(self.tab))
+        self.widget.restoreVersion(self.path, history.versionList.item(1).data(Qt.UserRole))
+        with open(self.path) as note:
+            self.assertEqual(note.read(), 'first draft')
+        self.tab = self.widget.tabs.tabForPath(self.path)
+        self.assertEqual(self.tab.plainTextEdit.toPlainText(), 'first draft')
+
+
+class FormattingTest(unittest.TestCase):
+    def setUp(self):
+        useTemporaryNotes(self)
+        self.widget = NotesTabWidget()
+        self.other = self.widget.widget(self.widget.add_new_tab('other')).plainTextEdit
+        self.other.setPlainText('untouched text')
+        self.widget.setCurrentIndex(0)
+        self.editor = self.widget.currentWidget().plainTextEdit
+        self.editor.setPlainText('one two three')
+
+    def weightAt(self, editor, position):
+        cursor = QtGui.QTextCursor(editor.document())
+        cursor.setPosition(position)
+        return cursor.charFormat().fontWeight()
+
+    # only the selection of the current tab changes
+    def test_selection(self):
+        cursor = self.editor.textCursor()
+        cursor.setPosition(4)
+        cursor.setPosition(7, QtGui.QTextCursor.KeepAnchor)
+        self.editor.setTextCursor(cursor)
+        self.widget.setBold()
+
+        self.assertEqual(self.weightAt(self.editor, 6), QtGui.QFont.Bold)
+        self.assertEqual(self.weightAt(self.editor, 3), QtGui.QFont.Normal)
+        self.assertEqual(self.weightAt(self.editor, 9), QtGui.QFont.Normal)
+        self.assertEqual(self.weightAt(self.other, 5), QtGui.QFont.Normal)
+        self.assertEqual(self.other.fontWeight(), QtGui.QFont.Normal)
+
+    def test_word_under_cursor(self):
+        cursor = self.editor.textCursor()
+        cursor.setPosition(9)
+        self.editor.setTextCursor(cursor)
+        self.widget.setItalic()
+
+        cursor = QtGui.QTextCursor(self.editor.document())
+        italic = []
+        for position in range(1, len('one two three') + 1):
+            cursor.setPosition(position)
+            italic.append(cursor.charFormat().fontItalic())
+        self.assertEqual(italic, [False] * 8 + [True] * 5)
+        self.assertTrue(self.editor.fontItalic())
+
+    # a big selection is one change and one undo step, and the other
+    # properties of the text are kept
+    def test_large_selection(self):
+        text = '\n'.join('line %d of the note' % i for i in range(10000))
+        self.assertGreater(len(text), EDIT_DEFER_LAYOUT_CHARS)
+        self.editor.setPlainText(text)
+        self.editor.selectAll()
+        self.widget.setItalic()
+        self.editor.moveCursor(QtGui.QTextCursor.Start)
+
+        changes = []
+        self.editor.textChanged.connect(lambda: changes.append(True))
+        self.editor.selectAll()
+        self.widget.setBold()
+        self.assertEqual(len(changes), 1)
+        self.assertEqual(self.weightAt(self.editor, len(text) - 1), QtGui.QFont.Bold)
+        self.assertTrue(self.editor.fontItalic())
+
+        self.editor.document().undo()
+        self.assertEqual(self.weightAt(self.editor, 5), QtGui.QFont.Normal)
+        self.assertEqual(self.weightAt(self.editor, len(text) - 1), QtGui.QFont.Normal)
+
+
+class BlockOperationsTest(unittest.TestCase):
+    def setUp(self):
+        useTemporaryNotes(self)
+        self.widget = NotesTabWidget()
+        self.editor = self.widget.currentWidget().plainTextEdit
+        self.editor.setPlainText('zero\none\n  two\n\tthree\nfour')
+
+    # selects from the start of line first to the start of line last, which
+    # leaves line last out
+    def selectLines(self, first, last):
+        document = self.editor.document()
+        cursor = self.editor.textCursor()
+        cursor.setPosition(document.findBlockByNumber(first).position())
+        cursor.setPosition(document.findBlockByNumber(last).position(), QtGui.QTextCursor.KeepAnchor)
+        self.editor.setTextCursor(cursor)
+
+    def test_indent(self):
+        self.selectLines(1, 4)
+        self.widget.indentRight()
+        self.assertEqual(self.editor.toPlainText(),
+                         'zero\n    one\n      two\n    \tthree\nfour')
+        self.assertEqual(self.editor.textCursor().selectedText(),
+                         '    one\u2029      two\u2029    \tthree\u2029')
+
+        self.widget.indentLeft()
+        self.widget.indentLeft()
+        self.assertEqual(self.editor.toPlainText(), 'zero\none\ntwo\nthree\nfour')
+
+        # both outdents were one undo step each
+        self.editor.undo()
+        self.editor.undo()
+        self.assertEqual(self.editor.toPlainText(),
+                         'zero\n    one\n      two\n    \tthree\nfour')
+
+    # without a selection only the line the cursor is in changes
+    def test_current_line(self):
+        cursor = self.editor.textCursor()
+        cursor.setPosition(7)
+        self.editor.setTextCursor(cursor)
+        self.widget.indentRight()
+        self.assertEqual(self.editor.toPlainText(), 'zero\n    one\n  two\n\tthree\nfour')
+
+    def test_lists(self):
+        self.selectLines(1, 3)
+        document = self.editor.document()
+        blocks = lambda: [document.findBlockByNumber(i) for i in range(5)]
+
+        self.widget.setBulletList()
+        lists = [block.textList() for block in blocks()]
+        self.assertIsNone(lists[0])
+        self.assertIsNone(lists[3])
+        self.assertEqual(lists[1].count(), 2)
+        self.assertEqual(lists[1].format().style(), QtGui.QTextListFormat.ListDisc)
+
+        self.widget.setNumberList()
+        self.assertEqual(blocks()[2].textList().format().style(), QtGui.QTextListFormat.ListDecimal)
+
+        self.widget.setNumberList()
+        self.assertEqual([block.textList() for block in blocks()], [None] * 5)
+        self.assertEqual([block.blockFormat().indent() for block in blocks()], [0] * 5)
+
+    # thousands of lines are one change and one undo step (Qt renumbers a
+    # whole list every time a line joins it, so the list has fewer)
+    def test_large_selection(self):
+        text = '\n'.join('line %d of the note' % i for i in range(10000))
+        self.editor.setPlainText(text)
+        self.editor.selectAll()
+
+        changes = []
+        self.editor.textChanged.connect(lambda: changes.append(True))
+        self.widget.indentRight()
+        self.assertEqual(len(changes), 1)
+        self.assertEqual(self.editor.document().lastBlock().text(), INDENT + 'line 9999 of the note')
+
+        self.selectLines(9000, 9999)
+        self.widget.setBulletList()
+        self.assertEqual(len(changes), 2)
+        self.assertEqual(self.editor.document().findBlockByNumber(9000).textList().count(), 999)
+
+        self.editor.undo()
+        self.editor.undo()
+        self.assertEqual(self.editor.toPlainText(), text)
+        self.assertIsNone(self.editor.document().findBlockByNumber(9000).textList())
+
+
+class UndoBudgetTest(unittest.TestCase):
+    def setUp(self):
+        useTemporaryNotes(self)
+        self.widget = NotesTabWidget()
+        self.editor = self.widget.currentWidget().plainTextEdit
+        self.budget = self.editor.undoBudget
+
+    # separate edits, every third one in bold
+    def edit(self, count):
+        cursor = QtGui.QTextCursor(self.editor.document())
+        for i in range(count):
+            cursor.movePosition(QtGui.QTextCursor.End)
+            format = QtGui.QTextCharFormat()
+            if i % 3 == 0:
+                format.setFontWeight(QtGui.QFont.Bold)
+            cursor.insertText('step %d\n' % i, format)
+
+    def test_typing(self):
+        QtTest.QTest.keyClicks(self.editor, 'first line')
+        QtTest.QTest.keyClick(self.editor, Qt.Key_Return)
+        QtTest.QTest.keyClicks(self.editor, 'secont')
+        QtTest.QTest.keyClick(self.editor, Qt.Key_Backspace)
+        QtTest.QTest.keyClicks(self.editor, 'd')
+        self.assertEqual(self.editor.toPlainText(), 'first line\nsecond')
+        self.assertEqual(len(self.budget.steps), 1)
+        self.assertGreaterEqual(self.budget.bytes, 2 * len('first line\nsecond'))
+
+        # after a pause typing is a step of its own
+        self.budget.lastTypedTime -= UNDO_MERGE_MS / 1000
+        QtTest.QTest.keyClicks(self.editor, '!')
+        self.assertEqual(len(self.budget.steps), 2)
+        self.editor.undo()
+        self.assertEqual(self.editor.toPlainText(), 'first line\nsecond')
+        self.editor.undo()
+        self.assertEqual(self.editor.toPlainText(), '')
+
+        # undone steps count until something new takes their place
+        self.assertEqual(len(self.budget.steps), 2)
+        self.editor.insertPlainText('other')
+        self.assertEqual(len(self.budget.steps), 1)
+
+    def test_max_steps(self):
+        self.budget.maxSteps = 10
+        self.edit(12)
+        text = self.editor.toPlainText()
+        app.processEvents()
+
+        self.assertEqual(len(self.budget.steps), 5)
+        self.assertEqual(self.budget.droppedSteps, 7)
+        self.assertEqual(self.editor.toPlainText(), text)
+        block = self.editor.document().findBlockByNumber(9)
+        self.assertEqual(block.text(), 'step 9')
+        self.assertEqual(block.begin().fragment().charFormat().fontWeight(), QtGui.QFont.Bold)
+
+        # the steps that are left still undo and redo, the rest are gone
+        for _ in range(5):
+            self.editor.undo()
+        self.assertEqual(self.editor.toPlainText(), ''.join('step %d\n' % i for i in range(7)))
+        self.editor.undo()
+        self.assertEqual(self.editor.toPlainText(), ''.join('step %d\n' % i for i in range(7)))
+        self.editor.redo()
+        self.assertEqual(self.editor.document().findBlockByNumber(7).text(), 'step 7')
+
+    def test_max_bytes(self):
+        self.budget.maxBytes = 64 * 1024
+        self.editor.insertPlainText('x' * 40000)
+        self.edit(3)
+        app.processEvents()
+        self.assertEqual(len(self.budget.steps), 3)
+        self.assertLessEqual(self.budget.bytes, self.budget.maxBytes // 2)
+
+        label, steps, size, dropped = self.widget.undoUsage()[0]
+        self.assertEqual((steps, size, dropped), (3, self.budget.memory(), 1))
+        dialog = UndoMemoryDialog(self.widget)
+        self.assertEqual(dialog.table.item(0, 1).text(), '3')
+        dialog.timer.stop()
+
+    # a trim leaves the text as it was, so a saved note's journal only has
+    # the edits themselves, and the document is only filled again once the
+    # text of the dropped steps is over budget
+    def test_trim_saved_note(self):
+        path = os.path.join(NOTES_DIR, 'long.txt')
+        text = 'a line of the note\n' * 5000
+        with open(path, 'w') as note:
+            note.write(text)
+        tab = self.widget.widget(self.widget.openFileUsingPath(path))
+        self.addCleanup(self.widget.detachJournal, tab, True)
+        self.editor = tab.plainTextEdit
+        self.budget = self.editor.undoBudget
+        self.budget.maxSteps = 10
+
+        self.edit(12)
+        app.processEvents()
+        self.assertEqual(self.budget.droppedSteps, 7)
+        self.assertGreater(self.budget.garbage, 0)
+        self.assertLess(tab.journal.pendingBytes, 1000)
+
+        self.budget.maxBytes = self.budget.memory() - 1
+        self.budget.trim()
+        self.assertEqual(self.budget.garbage, 0)
+        self.assertLess(tab.journal.pendingBytes, 1000)
+
+        # the journal still takes the note to what the tab holds
+        self.widget.autoSaver.flush(tab)
+        self.widget.autoSaver.waitForDone()
+        replayJournal(tab.journal.journalPath)
+        with open(path) as note:
+            self.assertEqual(note.read(), self.editor.toPlainText())
+        self.assertTrue(self.editor.toPlainText().startswith(text))
+
+
+class PlainEditingTest(unittest.TestCase):
+    def setUp(self):
+        useTemporaryNotes(self)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.widget = NotesTabWidget()
+
+    def tearDown(self):
+        self.widget.autoSaver.waitForDone()
+        for i in range(self.widget.count()):
+            self.widget.detachJournal(self.widget.widget(i), discard=True)
+        self.tmp.cleanup()
+
+    def open(self, name, data):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, 'wb') as note:
+            note.write(data)
+        return self.widget.widget(self.widget.openFileUsingPath(path))
+
+    def test_automatic(self):
+        global PLAIN_EDIT_MIN_BYTES
+        self.assertIsInstance(self.widget.currentWidget().plainTextEdit, TabPlainTextEdit)
+        self.assertIsInstance(self.open('list.txt', b'milk').plainTextEdit, PlainNoteEdit)
+        self.assertIsInstance(self.open('readme.md', b'# title').plainTextEdit, PlainNoteEdit)
+        note = noteformat.MAGIC + noteformat.encodeBlock('formatted')
+        self.assertIsInstance(self.open('small.note', note).plainTextEdit, TabPlainTextEdit)
+
+        self.addCleanup(globals().__setitem__, 'PLAIN_EDIT_MIN_BYTES', PLAIN_EDIT_MIN_BYTES)
+        PLAIN_EDIT_MIN_BYTES = len(note)
+        self.assertIsInstance(self.open('big.note', note).plainTextEdit, PlainNoteEdit)
+
+    # the document and its undo history go along, formatting can't be changed
+    # in the plain text editor but isn't lost either
+    def test_switch(self):
+        tab = self.widget.currentWidget()
+        editor = tab.plainTextEdit
+        editor.setPlainText('bold words')
+        editor.selectAll()
+        self.widget.setBold()
+        modes = []
+        self.widget.editingModeChanged.connect(modes.append)
+
+        self.assertTrue(self.widget.setPlainEditing(tab, True))
+        editor = tab.plainTextEdit
+        self.assertIsInstance(editor, PlainNoteEdit)
+        self.assertIs(editor.undoBudget.editor, editor)
+        self.assertEqual(editor.toPlainText(), 'bold words')
+        editor.moveCursor(QtGui.QTextCursor.End)
+        QtTest.QTest.keyClicks(editor, '!')
+        self.widget.setItalic()
+        self.assertFalse(editor.document().firstBlock().begin().fragment().charFormat().fontItalic())
+
+        self.widget.setPlainEditing(tab, False)
+        editor = tab.plainTextEdit
+        self.assertIsInstance(editor, TabPlainTextEdit)
+        self.assertEqual(modes, [True, False])
+        self.assertEqual(editor.toPlainText(), 'bold words!')
+        self.assertEqual(editor.document().firstBlock().begin().fragment().charFormat().fontWeight(), QtGui.QFont.Bold)
+        editor.undo()
+        editor.undo()
+        self.assertEqual(editor.document().firstBlock().begin().fragment().charFormat().fontWeight(), QtGui.QFont.Normal)
+        self.assertEqual(tab.plainEditing, False)
+
+
+class MarkdownHighlightTest(unittest.TestCase):
+    def setUp(self):
+        useTemporaryNotes(self)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.widget = NotesTabWidget()
+
+    def tearDown(self):
+        self.widget.autoSaver.waitForDone()
+        for i in range(self.widget.count()):
+            self.widget.detachJournal(self.widget.widget(i), discard=True)
+        self.tmp.cleanup()
+
+    def open(self, name, text):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, 'w', encoding='utf-8') as note:
+            note.write(text)
+        tab = self.widget.widget(self.widget.openFileUsingPath(path))
+        app.processEvents()
+        return tab
+
+    def kinds(self, block):
+        formats = self.widget.currentWidget().highlighter.formats
+        return [next(kind for kind, charFormat in formats.items() if charFormat == format.format)
+                for format in block.layout().formats()]
+
+    # typing re-highlights the line typed in, opening a fence the lines after it
+    def test_incremental(self):
+        tab = self.open('readme.md', '# Title\n' + 'some *text*\n' * 50 + '```\ncode\n```\n')
+        self.assertIsNotNone(tab.highlighter)
+        document = tab.plainTextEdit.document()
+        self.assertEqual(self.kinds(document.firstBlock()), ['heading'])
+        self.assertEqual(self.kinds(document.findBlockByNumber(1)), ['emphasis'])
+        self.assertEqual(self.kinds(document.findBlockByNumber(52)), ['code'])
+
+        highlighted = []
+        highlightLine = notemarkdown.highlightLine
+        self.addCleanup(setattr, notemarkdown, 'highlightLine', highlightLine)
+        notemarkdown.highlightLine = lambda text, state: highlighted.append(text) or highlightLine(text, state)
+        cursor = QtGui.QTextCursor(document.findBlockByNumber(10))
+        cursor.insertText('more ')
+        self.assertEqual(highlighted, ['more some *text*'])
+
+        del highlighted[:]
+        QtGui.QTextCursor(document.findBlockByNumber(2)).insertText('```\n')
+        # down to the end, the fence that was closed opens one now
+        self.assertEqual(len(highlighted), document.blockCount() - 2)
+        self.assertEqual(self.kinds(document.findBlockByNumber(10)), ['code'])
+        self.assertEqual(document.findBlockByNumber(52).userState(), notemarkdown.NORMAL)
+        self.assertEqual(document.findBlockByNumber(54).userState(), notemarkdown.BACKTICK_FENCE)
+
+    def test_setting(self):
+        self.assertIsNone(self.open('list.txt', '# not markdown').highlighter)
+        tab = self.open('readme.md', '# Title')
+        block = tab.plainTextEdit.document().firstBlock()
+        self.assertTrue(block.layout().formats())
+
+        self.widget.setMarkdownHighlighting(False)
+        self.assertIsNone(tab.highlighter)
+        self.assertFalse(block.layout().formats())
+        self.widget.setMarkdownHighlighting(True)
+        app.processEvents()
+        self.assertTrue(block.layout().formats())
+        self.assertEqual(tab.plainTextEdit.document().toPlainText(), '# Title')
+
+
+class PrintJobTest(unittest.TestCase):
+    def setUp(self):
+        useTemporaryNotes(self)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.widget = NotesTabWidget()
+
+    def tearDown(self):
+        self.widget.stopPrintJobs()
+        self.widget.autoSaver.waitForDone()
+        for i in range(self.widget.count()):
+            self.widget.detachJournal(self.widget.widget(i), discard=True)
+        self.tmp.cleanup()
+
+    def note(self, name, text):
+        path = os.path.join(self.tmp.name, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as note:
+            note.write(text)
+        return path
+
+    def finish(self, job):
+        job.wait()
+        app.processEvents()
+        self.assertIsNone(job.error)
+        self.assertEqual(self.widget.printJobs, [])
+
+    def pages(self, path):
+        with open(path, 'rb') as pdf:
+            data = pdf.read()
+        self.assertTrue(data.startswith(b'%PDF'))
+        return data.count(b'/Type /Page\n')
+
+    # open notes are exported as their tab has them, the others as saved
+    def test_one_pdf(self):
+        opened = self.note('opened.txt', 'saved')
+        tab = self.widget.widget(self.widget.openFileUsingPath(opened))
+        tab.plainTextEdit.setPlainText('edited\n' * 300)
+        pdfPath = os.path.join(self.tmp.name, 'all.pdf')
+        job = self.widget.exportNotes([opened, self.note('other.md', '# other')], pdfPath=pdfPath)
+        self.finish(job)
+
+        self.assertEqual(job.written, [pdfPath])
+        self.assertGreater(self.pages(pdfPath), 2)
+        self.assertEqual(tab.plainTextEdit.toPlainText(), 'edited\n' * 300)
+
+    def test_pdf_per_note(self):
+        paths = [self.note(os.path.join(folder, 'todo.txt'), folder) for folder in ('work', 'home')]
+        self.assertEqual(notesIn(self.tmp.name), paths[::-1])
+        folder = os.path.join(self.tmp.name, 'pdf')
+        os.makedirs(folder)
+        self.finish(self.widget.exportNotes(paths, pdfFolder=folder))
+
+        self.assertEqual(sorted(os.listdir(folder)), ['todo (2).pdf', 'todo.pdf'])
+        self.assertEqual(self.pages(os.path.join(folder, 'todo.pdf')), 1)
+
+    def test_cancel(self):
+        pdfPath = os.path.join(self.tmp.name, 'long.pdf')
+        job = self.widget.exportNotes([self.note('long.txt', 'line\n' * 20000)], pdfPath=pdfPath)
+        pages = []
+        job.progress.connect(lambda value, text: text.startswith('Page') and pages.append(job.requestInterruption()))
+        while not job.isFinished():
+            app.processEvents()
+        app.processEvents()
+        self.assertTrue(pages)
+        self.assertFalse(os.path.exists(pdfPath))
+        self.assertEqual(self.widget.printJobs, [])
+
+    # the preview lays a page setup out once
+    def test_preview_layouts(self):
+        tab = self.widget.currentWidget()
+        tab.plainTextEdit.setPlainText('preview\n' * 300)
+        document = tab.plainTextEdit.document()
+        writer = PrintJob.pdfWriter(os.path.join(self.tmp.name, 'preview.pdf'), 'preview')
+        self.widget.printPreviewText(writer, tab)
+        layout = next(iter(self.widget.pageLayouts.values()))
+        self.widget.printPreviewText(writer, tab)
+        self.assertEqual(list(self.widget.pageLayouts.values()), [layout])
+
+        writer.setPageOrientation(QtGui.QPageLayout.Landscape)
+        self.widget.printPreviewText(writer, tab)
+        self.assertEqual(len(self.widget.pageLayouts), 2)
+        self.assertGreater(self.widget.pageLayouts.popitem()[1].pages, layout.pages)
+
+        tab.plainTextEdit.insertPlainText('more')
+        self.assertNotIn(PageLayout.key(document, writer), self.widget.pageLayouts)
+
+
+class TabRegistryTest(unittest.TestCase):
+    def setUp(self):
+        useTemporaryNotes(self)
+        self.widget = NotesTabWidget()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.paths = []
+        for folder in ['work', 'home']:
+            os.makedirs(os.path.join(self.tmp.name, folder))
+            path = os.path.join(self.tmp.name, folder, 'todo.txt')
+            with open(path, 'w') as note:
+                note.write(folder)
+            self.paths.append(path)
+
+    def tearDown(self):
+        for i in range(self.widget.count()):
+            self.widget.detachJournal(self.widget.widget(i), discard=True)
+        self.tmp.cleanup()
+
+    # files are told apart by their path, not their name
+    def test_same_name(self):
+        work = self.widget.openFileUsingPath(self.paths[0], lazy=True)
+        home = self.widget.openFileUsingPath(self.paths[1], lazy=True)
+        self.assertNotEqual(work, home)
+        self.assertEqual(self.widget.tabs.tabsWithLabel('todo'), [self.widget.widget(work), self.widget.widget(home)])
+
+        # the same file through another path is found again
+        other = os.path.join(self.tmp.name, 'home', '..', 'work', 'todo.txt')
+        self.assertEqual(self.widget.openFileUsingPath(other, lazy=True), work)
+
+    # tabs are found wherever they were moved, under their new label
+    def test_move_and_rename(self):
+        work = self.widget.widget(self.widget.openFileUsingPath(self.paths[0], lazy=True))
+        self.widget.tabBar().moveTab(self.widget.indexOf(work), 0)
+        self.assertEqual(self.widget.openFileUsingPath(self.paths[0], lazy=True), 0)
+
+        self.widget.setTabText(0, 'chores')
+        self.assertEqual(self.widget.tabs.tabsWithLabel('chores'), [work])
+        self.assertFalse(self.widget.tabs.hasLabel('todo'))
+        self.assertIs(self.widget.tabs.tabForPath(self.paths[0]), work)
+
+        self.widget.close_tab(0)
+        self.assertIsNone(self.widget.tabs.tabForPath(self.paths[0]))
+        self.assertFalse(self.widget.tabs.hasLabel('chores'))
+
+    # renaming a file opened from outside the notes saves it as a new note,
+    # the file itself stays
+    def test_rename_outside_notes(self):
+        tab = self.widget.widget(self.widget.openFileUsingPath(self.paths[0]))
+        self.assertTrue(self.widget.savedTabNameChange('renamed'))
+
+        with open(self.paths[0]) as note:
+            self.assertEqual(note.read(), 'work')
+        self.assertEqual(tab.filePath, os.path.join(NOTE_STORE.root, 'renamed' + noteformat.SUFFIX))
+        self.assertEqual(noteformat.readText(tab.filePath), 'work')
+
+
+class TracerTest(unittest.TestCase):
+    def test_disabled(self):
+        def slot():
+            pass
+        self.assertIs(Tracer(False).traced('slot')(slot), slot)
+        self.assertFalse(Tracer.fromArgs(['newmain.py', '--startup-trace']).enabled)
+        self.assertEqual(Tracer.fromArgs(['newmain.py', '--trace=out.json']).path, 'out.json')
+
+    def test_ring_buffer(self):
+        tracer = Tracer(True, capacity=3)
+
+        class Widget(QtWidgets.QWidget):
+            @tracer.traced('slot')
+            def setBold(self):
+                return 'bold'
+
+        # the checked argument of triggered() is dropped like for a plain slot
+        widget = Widget()
+        action = QtWidgets.QAction(widget)
+        action.triggered.connect(widget.setBold)
+        for i in range(5):
+            action.trigger()
+        self.assertEqual(widget.setBold(), 'bold')
+        self.assertEqual([event[:2] for event in tracer.events], [(Widget.setBold.__qualname__, 'slot')] * 3)
+
+        tmp = tempfile.TemporaryDirectory()
+        path = os.path.join(tmp.name, 'trace.json')
+        tracer.dump(path)
+        with open(path) as trace:
+            events = json.load(trace)['traceEvents']
+        tmp.cleanup()
+        self.assertEqual([event['ph'] for event in events], ['M', 'X', 'X', 'X'])
+        self.assertEqual(events[0]['args']['name'], threading.current_thread().name)
+        self.assertTrue(all(event['dur'] >= 0 for event in events[1:]))
+
+    def test_stall(self):
+        tracer = Tracer(True)
+        monitor = StallMonitor(tracer)
+        time.sleep((TRACE_STALL_CHECK_MS + TRACE_STALL_MS) / 1000 + 0.05)
+        monitor.check()
+        self.assertEqual([event[:2] for event in tracer.events], [('event loop stall', 'stall')])
+        monitor.timer.stop()
+
+
+# Opt-in timing of the editor's hot paths, turned on with --trace (or
+# --trace=<file>). Calls to functions decorated with tracer.traced() are timed
+# into a ring buffer holding the last TRACE_EVENTS of them, which can be
+# written out in the Chrome trace event format and opened in chrome://tracing
+# or Perfetto. Without --trace the decorator hands the function back as it is,
+# so an untraced session runs exactly the same code as before.
+class Tracer(object):
+    def __init__(self, enabled, path=TRACE_FILE, capacity=TRACE_EVENTS, start=LAUNCH_TIME):
+        self.enabled = enabled
+        self.path = path
+        self.start = start
+        # appending to a deque is atomic, so any thread can record without a
+        # lock and the oldest events drop off once it is full
+        self.events = collections.deque(maxlen=capacity)
+        self.threadNames = {}
+
+    @classmethod
+    def fromArgs(cls, argv):
+        for arg in argv:
+            if arg == '--trace':
+                return cls(True)
+            if arg.startswith('--trace='):
+                return cls(True, arg[len('--trace='):])
+        return cls(False)
+
+    def traced(self, category):
+        def decorate(func):
+            if not self.enabled:
+                return func
+            name = func.__qualname__
+            # Qt hands slots the signal arguments they don't take (like the
+            # checked flag of triggered), PyQt drops those by looking at the
+            # function so the wrapper has to do the same
+            code = func.__code__
+            maxArgs = None if code.co_flags & inspect.CO_VARARGS else code.co_argcount
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if maxArgs is not None:
+                    args = args[:maxArgs]
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.record(name, category, start, time.perf_counter() - start)
+            return wrapper
+        return decorate
+
+    def record(self, name, category, start, duration):
+        thread = threading.current_thread()
+        if thread.ident not in self.threadNames:
+            self.threadNames[thread.ident] = thread.name
+        self.events.append((name, category, start, duration, thread.ident))
+
+    # complete ('X') events in microseconds since launch, plus the thread names
+    def traceEvents(self):
+        pid = os.getpid()
+        events = [{'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': name}}
+                  for tid, name in list(self.threadNames.items())]
+        for name, category, start, duration, tid in self.events.copy():
+            events.append({'name': name, 'cat': category, 'ph': 'X', 'pid': pid, 'tid': tid,
+                           'ts': round((start - self.start) * 1e6, 1),
+                           'dur': round(duration * 1e6, 1)})
+        return events
+
+    def dump(self, path=None):
+        data = json.dumps({'traceEvents': self.traceEvents(), 'displayTimeUnit': 'ms'})
+        atomicWrite(path or self.path, data.encode('utf-8'))
+
+
+tracer = Tracer.fromArgs(sys.argv)
+
+
+# Records the event loop being blocked. The timer is due every
+# TRACE_STALL_CHECK_MS, when it comes in TRACE_STALL_MS late or more whatever
+# ran in between held up the GUI thread.
+class StallMonitor(QtCore.QObject):
+    def __init__(self, tracer, parent=None):
+        super(StallMonitor, self).__init__(parent)
+        self.tracer = tracer
+        self.last = time.perf_counter()
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.setInterval(TRACE_STALL_CHECK_MS)
+        self.timer.timeout.connect(self.check)
+        self.timer.start()
+
+    def check(self):
+        now = time.perf_counter()
+        late = now - self.last - TRACE_STALL_CHECK_MS / 1000
+        if late * 1000 >= TRACE_STALL_MS:
+            self.tracer.record('event loop stall', 'stall', self.last, now - self.last)
+        self.last = now
+
+
+# Writes data to path through a temp file and a rename, so a crash part way
+# through never leaves a truncated note behind
+@tracer.traced('io')
+def atomicWrite(path, data):
+    notestore.atomicWrite(path, data)
+
+
+# every note gets its own journal file in JOURNAL_DIR, named after its full path
+def journalPathFor(path):
+    key = hashlib.sha1(os.path.abspath(path).encode('utf-8')).hexdigest()
+    return os.path.join(JOURNAL_DIR, key + '.journal')
+
+
+# Write-ahead journal for one note. Each edit reported by the document's
+# contentsChange signal is stored as a (position, chars removed, text inserted)
+# record that gets appended to the journal file by the AutoSaver. The journal
+# header holds a crc of the note file it applies to, so a journal that is
+# older than its note (i.e. the note was compacted but the journal wasn't
+# removed yet) is simply thrown away on replay.
+#
+# Positions are in QTextDocument units (utf-16 code units), which is why
+# replayJournal() applies the records to utf-16 encoded text.
+class NoteJournal(object):
+    # baseCrc and baseSize describe the utf-8 encoded text of the note on disk.
+    # baseMatches is False if the document doesn't hold exactly that text
+    # (e.g. setText() decided the file was html); the journal can't be
+    # replayed onto the note then, so a full write is forced first.
+    def __init__(self, document, path, baseCrc, baseSize, baseMatches=True):
+        self.document = document
+        self.path = os.path.abspath(path)
+        self.journalPath = journalPathFor(path)
+
+        # edits not yet handed to the AutoSaver
+        self.records = []
+        self.pendingBytes = 0
+        # bytes already queued or written to the journal file
+        self.diskBytes = 0
+
+        self.baseCrc = baseCrc
+        self.baseSize = baseSize
+        self.baseMatches = baseMatches
+        # the next append starts a new journal file
+        self.fresh = True
+        # set while edits that leave the text as it was are made, see UndoBudget
+        self.paused = False
+
+        # length of the document in utf-16 units, used to clamp the final
+        # paragraph separator Qt sometimes includes in the change counts
+        self.length = document.characterCount() - 1
+
+        document.contentsChange.connect(self.contentsChange)
+
+    def detach(self):
+        self.document.contentsChange.disconnect(self.contentsChange)
+
+    # runs on the GUI thread for every edit
+    def contentsChange(self, position, removed, added):
+        if self.paused:
+            return
+        removed = max(0, min(removed, self.length - position))
+        end = min(position + added, self.document.characterCount() - 1)
+
+        text = ''
+        if end > position:
+            cursor = QtGui.QTextCursor(self.document)
+            cursor.setPosition(position)
+            cursor.setPosition(end, QtGui.QTextCursor.KeepAnchor)
+            text = cursor.selectedText().translate(PLAIN_TEXT_MAP)
+        self.length += max(0, end - position) - removed
+
+        if removed == 0 and not text:
+            return
+
+        payload = text.encode('utf-8')
+        head = struct.pack('<III', position, removed, len(payload))
+        record = head + payload + struct.pack('<I', zlib.crc32(head + payload))
+        self.records.append(record)
+        self.pendingBytes += len(record)
+
+    def isEmpty(self):
+        return self.baseMatches and not self.records and not self.diskBytes
+
+    def needsCompaction(self):
+        if not self.baseMatches:
+            return True
+        return self.diskBytes + self.pendingBytes > max(JOURNAL_COMPACT_BYTES, self.baseSize)
+
+    # hands the pending records over for appending
+    def takeRecords(self):
+        data = b''.join(self.records)
+        self.records = []
+        self.diskBytes += self.pendingBytes
+        self.pendingBytes = 0
+        return data
+
+    # called when a full snapshot of the document has been taken; the
+    # snapshot already contains every edit recorded so far
+    def compacting(self, size):
+        self.records = []
+        self.pendingBytes = 0
+        self.diskBytes = 0
+        self.baseSize = size
+        self.baseMatches = True
+
+    # runs on the worker thread
+    @tracer.traced('io')
+    def append(self, data):
+        os.makedirs(JOURNAL_DIR, exist_ok=True)
+        if self.fresh:
+            path = self.path.encode('utf-8')
+            data = JOURNAL_MAGIC + struct.pack('<IH', self.baseCrc, len(path)) + path + data
+            mode = 'wb'
+        else:
+            mode = 'ab'
+
+        # no fsync here, a crashed process still leaves its writes with the OS
+        with open(self.journalPath, mode) as journal:
+            journal.write(data)
+        self.fresh = False
+        return len(data)
+
+    # runs on the worker thread once the note itself has been rewritten
+    def reset(self, baseCrc):
+        self.baseCrc = baseCrc
+        self.fresh = True
+        self.discard()
+
+    def discard(self):
+        try:
+            os.remove(self.journalPath)
+        except FileNotFoundError:
+            pass
+
+
+# Applies a leftover journal to the note it belongs to. Returns the path of
+# the recovered note, or None if there was nothing to recover.
+@tracer.traced('io')
+def replayJournal(journalPath):
+    with open(journalPath, 'rb') as journal:
+        data = journal.read()
+
+    recovered = None
+    try:
+        if not data.startswith(JOURNAL_MAGIC):
+            return None
+        offset = len(JOURNAL_MAGIC)
+        baseCrc, pathLength = struct.unpack_from('<IH', data, offset)
+        offset += 6
+        path = data[offset:offset + pathLength].decode('utf-8')
+        offset += pathLength
+
+        base = ''
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as note:
+                base = note.read()
+        # the note was rewritten after this journal was started
+        if zlib.crc32(base.encode('utf-8')) != baseCrc:
+            return None
+
+        text = bytearray(base.encode('utf-16-le'))
+        applied = 0
+        while offset + 12 <= len(data):
+            position, removed, size = struct.unpack_from('<III', data, offset)
+            end = offset + 12 + size
+            if end + 4 > len(data):
+                break
+            crc, = struct.unpack_from('<I', data, end)
+            # a torn or damaged record ends the journal
+            if crc != zlib.crc32(data[offset:end]) or position * 2 > len(text):
+                break
+            inserted = data[offset + 12:end].decode('utf-8')
+            text[position * 2:(position + removed) * 2] = inserted.encode('utf-16-le')
+            offset = end + 4
+            applied += 1
+
+        if applied:
+            atomicWrite(path, text.decode('utf-16-le').encode('utf-8'))
+            recovered = path
+    finally:
+        os.remove(journalPath)
+
+    return recovered
+
+
+# replays every journal left behind by a crash, called on startup
+def replayJournals(directory=None):
+    if directory is None:
+        directory = JOURNAL_DIR
+    recovered = []
+    for journalPath in glob.glob(os.path.join(directory, '*.journal')):
+        path = replayJournal(journalPath)
+        if path:
+            recovered.append(path)
+    return recovered
+
+
+def reportJobError(future):
+    error = future.exception()
+    if error is not None:
+        traceback.print_exception(type(error), error, error.__traceback__)
+
+
+# Runs jobs one after another on a background thread. This uses a plain Python
+# thread rather than QThreadPool, since a QThreadPool thread running Python
+# code can deadlock with Qt loading a plugin (e.g. an image format) on the
+# GUI thread.
+class BackgroundWorker(object):
+    def __init__(self, name):
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix=name)
+
+    def start(self, func, *args):
+        self.executor.submit(func, *args).add_done_callback(reportJobError)
+
+    # jobs run in order, so once a no-op has run everything before it is done
+    def waitForDone(self):
+        self.executor.submit(lambda: None).result()
+
+
+# Collects how long each phase of starting up took. Phases are marked as they
+# end; with --startup-trace they are printed to stderr once the app is usable.
+class StartupTrace(object):
+    def __init__(self, enabled, start=LAUNCH_TIME):
+        self.enabled = enabled
+        self.start = start
+        self.last = start
+        self.phases = []
+
+    def mark(self, phase):
+        now = time.perf_counter()
+        self.phases.append((phase, now - self.last))
+        self.last = now
+
+    def elapsed(self):
+        return self.last - self.start
+
+    def report(self, file=None):
+        if not self.enabled:
+            return
+        file = file or sys.stderr
+        for phase, seconds in self.phases:
+            print('startup: %-16s %8.1f ms' % (phase, seconds * 1000), file=file)
+        print('startup: %-16s %8.1f ms' % ('total', self.elapsed() * 1000), file=file)
+
+
+startupTrace = StartupTrace('--startup-trace' in sys.argv)
+
+
+# Icons by 'icons:' name. Each image is decoded once and kept in QPixmapCache,
+# so widgets asking for the same icon share one pixmap.
+class IconRegistry(object):
+    def __init__(self):
+        self.icons = {}
+
+    def pixmap(self, name):
+        pixmap = QtGui.QPixmapCache.find(name)
+        if pixmap is None:
+            pixmap = QPixmap(name)
+            QtGui.QPixmapCache.insert(name, pixmap)
+        return pixmap
+
+    def icon(self, name):
+        icon = self.icons.get(name)
+        if icon is None:
+            icon = self.icons[name] = QtGui.QIcon(self.pixmap(name))
+        return icon
+
+
+iconRegistry = IconRegistry()
+
+
+# Colours of the built in themes, THEME_STYLESHEET is filled in with one of them
+THEMES = {
+    'Dark': {
+        'window': '#171e24',
+        'panel': '#282f39',
+        'text': 'white',
+        'accent': '#77dd77',
+        'accentHover': '#8be28b',
+        'accentSelected': '#b4ecb4',
+        'tabText': 'black',
+        'tabBorder': 'black',
+        'menu': '#2b3844',
+        'toolbar': '#212b34',
+        'toolChecked': '#5d7992',
+        'tooltipBorder': 'gray',
+        'markdownHeading': '#77dd77',
+        'markdownCode': '#e5c07b',
+        'markdownLink': '#61afef',
+        'markdownQuote': '#9aa5b1',
+        'markdownMarker': '#d19a66',
+    },
+    'Light': {
+        'window': '#e9edf1',
+        'panel': '#f7f9fb',
+        'text': '#1b2128',
+        'accent': '#77dd77',
+        'accentHover': '#8be28b',
+        'accentSelected': '#b4ecb4',
+        'tabText': 'black',
+        'tabBorder': '#5b6670',
+        'menu': '#dde3e9',
+        'toolbar': '#d3dae1',
+        'toolChecked': '#aebdcc',
+        'tooltipBorder': 'gray',
+        'markdownHeading': '#2e7d32',
+        'markdownCode': '#8a5a00',
+        'markdownLink': '#1565c0',
+        'markdownQuote': '#5b6670',
+        'markdownMarker': '#a0522d',
+    },
+}
+
+# The whole app's style sheet. Rules that used to sit on a single widget are
+# scoped with object names instead, later rules win over earlier ones of the
+# same specificity.
+THEME_STYLESHEET = string.Template("""
+    QMainWindow, QMainWindow QWidget {
+        background: $window;
+        color: $text;
+    }
+
+    #Tags, #Tags QWidget {
+        background-color: $panel;
+        color: $text;
+    }
+
+    #Notes, #Notes QWidget {
+        background: $panel;
+        color: $text;
+        border: none;
+    }
+
+    QHeaderView#treeHeader {
+        background-color: $accent;
+        color: $text;
+    }
+
+    QTreeView::branch:has-siblings:!adjoins-item {
+        border-image: url(icons:tree_icons/vline-lightgreen.png) 0;
+    }
+
+    QTreeView::branch:has-siblings:adjoins-item {
+        border-image: url(icons:tree_icons/branch-more-lightgreen.png) 0;
+    }
+
+    QTreeView::branch:!has-children:!has-siblings:adjoins-item {
+        border-image: url(icons:tree_icons/branch-end-lightgreen.png) 0;
+    }
+
+    QTreeView::branch:has-children:!has-siblings:closed,
+    QTreeView::branch:closed:has-children:has-siblings {
+        border-image: none;
+        image: url(icons:tree_icons/right-arrow.png);
+    }
+
+    QTreeView::branch:open:has-children:!has-siblings,
+    QTreeView::branch:open:has-children:has-siblings  {
+        border-image: none;
+        image: url(icons:tree_icons/down-arrow.png);
+    }
+
+    QTabBar::close-button {
+        image: url(icons:delete_tab.png);
+        subcontrol-position: left;
+    }
+    QTabBar::tab {
+        color: $tabText;
+        background: $accent;
+        border-left: 1px solid $tabBorder;
+        text-align: center;
+    }
+    QTabBar::tab::first {
+        border-left: none;
+    }
+    QTabBar::tab::only-one {
+        border-left: none;
+    }
+    QTabBar::tab::hover {
+        background: $accentHover;
+    }
+    QTabBar::tab::selected {
+        font: bold;
+        background: $accentSelected;
+    }
+
+    QToolButton#addTabButton {
+        background-color: $accent;
+        border-left: 1px solid $tabBorder;
+    }
+    QToolButton#addTabButton::hover {
+        background-color: $accentHover;
+    }
+    QToolButton#addTabButton::pressed {
+        background-color: $accentSelected;
+    }
+
+    QMainWindow QMenuBar {
+        background-color: $menu;
+        color: $text;
+    }
+    QMenuBar::item:selected {
+        background-color: $accent;
+    }
+
+    QMainWindow QMenu {
+        background-color: $menu;
+        color: $text;
+    }
+    QMenu::item:selected {
+        background-color: $accent;
+    }
+
+    QMainWindow QToolBar {
+        background-color: $toolbar;
+        border-bottom: 1px solid $toolbar;
+    }
+
+    QToolBar::separator:horizontal {
+        background-color: $toolbar;
+        width: 1px;
+        margin-left: 10px;
+        margin-right: 10px;
+    }
+
+    QMainWindow QToolBar QToolButton {
+        background-color: $toolbar;
+        border: 1px solid $toolbar;
+        border-radius: 2px;
+    }
+
+    QToolBar QToolButton QToolTip {
+        color: $text;
+        border: 1px solid $tooltipBorder;
+        border-radius: 3px;
+    }
+
+    QMainWindow QToolBar QToolButton:hover {
+        border: 1px solid $accent;
+    }
+
+    QMainWindow QToolBar QToolButton:checked {
+        border: 1px solid $accentSelected;
+        background-color: $toolChecked;
+    }
+
+    QMainWindow QToolBar QToolButton:checked:hover {
+        border: 1px solid $accent;
+    }
+""")
+
+
+# Styles the whole application from one style sheet. Qt parses it once and
+# styles new widgets from the parsed rules, switching themes restyles the
+# existing widgets in place.
+class ThemeManager(QtCore.QObject):
+    themeChanged = QtCore.pyqtSignal(str)
+
+    def __init__(self, application, themes=THEMES, current='Dark'):
+        super(ThemeManager, self).__init__(application)
+        self.application = application
+        self.themes = themes
+        self.current = current
+        # theme name -> filled in style sheet
+        self.styleSheets = {}
+
+    def styleSheet(self, name):
+        styleSheet = self.styleSheets.get(name)
+        if styleSheet is None:
+            styleSheet = self.styleSheets[name] = THEME_STYLESHEET.substitute(self.themes[name])
+        return styleSheet
+
+    def apply(self, name):
+        styleSheet = self.styleSheet(name)
+        if self.application.styleSheet() != styleSheet:
+            self.application.setStyleSheet(styleSheet)
+        if name != self.current:
+            self.current = name
+            self.themeChanged.emit(name)
+
+
+themeManager = ThemeManager(app)
+
+
+# Coalesces edits per tab and writes notes on a worker thread. The snapshot
+# (the journal records or the full text) is always taken on the GUI thread
+# since QTextDocument isn't thread safe, only the hashing and file writes
+# happen in the background.
+class AutoSaver(QtCore.QObject):
+    def __init__(self, parent=None, idleMs=AUTOSAVE_IDLE_MS, maxStaleMs=AUTOSAVE_MAX_STALE_MS,
+                 indexMs=JOURNAL_INDEX_MS):
+        super(AutoSaver, self).__init__(parent)
+        self.idleMs = idleMs
+        self.maxStaleMs = maxStaleMs
+        self.indexMs = indexMs
+
+        # tab -> (idle timer, time since the tab first became dirty)
+        self.pending = {}
+        # absolute file path -> hash of the last content written to it
+        self.lastHash = {}
+        self.lock = threading.Lock()
+
+        # a single worker keeps writes to the same file in order
+        self.pool = BackgroundWorker('autosave')
+
+        # called on the worker thread with (path, text) after a note was written
+        self.writeListeners = []
+        # tab -> timer that hands the write listeners the text of a note whose
+        # edits were only appended to its journal
+        self.listenersDue = {}
+
+        # the NoteHistory written notes are recorded in, if any, and the notes
+        # whose content from before this session is in it
+        self.history = None
+        self.historyBases = set()
+
+        self.snapshotsTaken = 0
+        self.bytesWritten = 0
+        self.writesSkipped = 0
+        self.compactions = 0
+
+    def schedule(self, tab):
+        entry = self.pending.get(tab)
+        if entry is None:
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.timeout.connect(lambda: self.flush(tab))
+            dirtySince = QtCore.QElapsedTimer()
+            dirtySince.start()
+            entry = self.pending[tab] = (timer, dirtySince)
+
+        timer, dirtySince = entry
+        remaining = self.maxStaleMs - dirtySince.elapsed()
+        if remaining <= 0:
+            self.flush(tab)
+        else:
+            timer.start(min(self.idleMs, remaining))
+
+    # drop any pending save for tab without writing it
+    def cancel(self, tab):
+        entry = self.pending.pop(tab, None)
+        if entry is not None:
+            entry[0].stop()
+            entry[0].deleteLater()
+
+    # writes out the tab's pending edits; with compact=True the note file is
+    # rewritten and its journal cleared even if the journal is still small
+    def flush(self, tab, compact=False):
+        if tab not in self.pending and not compact:
+            return
+        self.cancel(tab)
+
+        if not tab.saveState:
+            return
+
+        # nothing can have changed in a tab that was never shown, and a tab
+        # that is still loading its file doesn't have all of it yet
+        if not tab.isMaterialized() or tab.loading:
+            return
+
+        journal = tab.journal
+        if journal is None:
+            self.cancelListeners(tab)
+            path = self.parent().notePath(tab)
+            text = tab.plainTextEdit.toPlainText()
+            data = None
+            if noteformat.isNotePath(path):
+                data = self.parent().noteData(tab)
+            self.snapshotsTaken += 1
+            self.pool.start(self.writeNote, path, text, data, compact)
+        elif journal.needsCompaction() or (compact and not journal.isEmpty()):
+            self.cancelListeners(tab)
+            text = tab.plainTextEdit.toPlainText()
+            self.snapshotsTaken += 1
+            journal.compacting(len(text))
+            self.pool.start(self.compactNote, journal, text, compact)
+        else:
+            data = journal.takeRecords()
+            if data:
+                self.pool.start(self.appendJournal, journal, data)
+                self.scheduleListeners(tab)
+            # the note itself isn't written, its history needs a snapshot
+            if self.history is not None and self.history.due(os.path.abspath(journal.path)):
+                text = tab.plainTextEdit.toPlainText()
+                self.snapshotsTaken += 1
+                self.pool.start(self.recordVersion, journal.path, text.encode('utf-8'))
+
+    def flushAll(self):
+        for tab in list(self.pending):
+            self.flush(tab)
+
+    # The note wasn't written, only its journal, but what it holds now counts
+    # as saved and the write listeners (the search index) should know it. They
+    # get its text indexMs later, the appends until then don't take it again.
+    def scheduleListeners(self, tab):
+        if tab in self.listenersDue or not self.writeListeners:
+            return
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.timeout.connect(lambda: self.notifyListeners(tab))
+        self.listenersDue[tab] = timer
+        timer.start(self.indexMs)
+
+    def cancelListeners(self, tab):
+        timer = self.listenersDue.pop(tab, None)
+        if timer is not None:
+            timer.stop()
+            timer.deleteLater()
+
+    def notifyListeners(self, tab):
+        self.cancelListeners(tab)
+        if sip.isdeleted(tab) or tab.journal is None or tab.loading:
+            return
+        self.snapshotsTaken += 1
+        self.pool.start(self.callWriteListeners, os.path.abspath(tab.journal.path),
+                        tab.plainTextEdit.toPlainText())
+
+    def waitForDone(self):
+        self.pool.waitForDone()
+
+    # lets the write listeners know about a note that was written elsewhere,
+    # and records data, what was written, in its history
+    def notifyWritten(self, path, text, data=None):
+        self.pool.start(self.noteWritten, os.path.abspath(path), text, data)
+
+    # forget what was last written to path, e.g. after saveTab wrote it directly
+    def invalidate(self, path):
+        with self.lock:
+            self.lastHash.pop(os.path.abspath(path), None)
+
+    # the following run on the worker thread
+
+    # writes data, or text if there is no data, and tells the write listeners
+    # about text; returns False when the content is identical to what was
+    # last written. The history gets a version if one is due, or with force.
+    @tracer.traced('io')
+    def writeNote(self, path, text, data=None, force=False):
+        path = os.path.abspath(path)
+        if data is None:
+            data = text.encode('utf-8')
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+
+        with self.lock:
+            if self.lastHash.get(path) == digest:
+                self.writesSkipped += 1
+                return False
+
+        self.recordBase(path)
+        stored = notefiles.encode(path, data)
+        storeFor(path).write(path, stored)
+
+        with self.lock:
+            self.lastHash[path] = digest
+            self.bytesWritten += len(stored)
+        if self.history is not None:
+            self.history.record(path, data, force)
+        self.callWriteListeners(path, text)
+        return True
+
+    def noteWritten(self, path, text, data):
+        if data is not None:
+            self.recordVersion(path, data, force=True)
+        self.callWriteListeners(path, text)
+
+    def recordVersion(self, path, data, force=False):
+        if self.history is not None:
+            path = os.path.abspath(path)
+            self.recordBase(path)
+            self.history.record(path, data, force)
+
+    # The first time a note is written in a session, what it held before
+    # goes into its history as well: it may have been changed outside the
+    # app, or never been recorded at all.
+    def recordBase(self, path):
+        if self.history is None or path in self.historyBases:
+            return
+        self.historyBases.add(path)
+        store = storeFor(path)
+        if store.isFile(path):
+            with store.open(path) as raw, notefiles.reader(raw, path) as file:
+                self.history.record(path, file.read(), force=True)
+
+    def callWriteListeners(self, path, text):
+        for listener in self.writeListeners:
+            listener(path, text)
+
+    @tracer.traced('io')
+    def appendJournal(self, journal, data):
+        written = journal.append(data)
+        with self.lock:
+            self.bytesWritten += written
+
+    @tracer.traced('io')
+    def compactNote(self, journal, text, force=False):
+        self.writeNote(journal.path, text, force=force)
+        journal.reset(zlib.crc32(text.encode('utf-8')))
+        with self.lock:
+            self.compactions += 1
+
+    def stats(self):
+        with self.lock:
+            return {
+                'snapshotsTaken': self.snapshotsTaken,
+                'bytesWritten': self.bytesWritten,
+                'writesSkipped': self.writesSkipped,
+                'compactions': self.compactions,
+            }
+
+
+# the same file reached through a different path (relative, symlinked, ...)
+# maps to the same key
+def canonicalPath(path):
+    return os.path.normcase(os.path.realpath(path))
+
+
+# The open tabs by the file they show and by their label, so finding a tab
+# never means walking the tab bar. Tabs are kept as widgets rather than
+# indexes, which makes moving them around in the tab bar a non-event.
+class TabRegistry(object):
+    def __init__(self):
+        # canonical path -> tab
+        self.byPath = {}
+        # label -> tabs with that label, a dict keeps them in the order added
+        self.byLabel = {}
+        self.paths = {}
+        self.labels = {}
+
+    def add(self, tab, label):
+        self.labels[tab] = label
+        self.byLabel.setdefault(label, {})[tab] = None
+
+    def remove(self, tab):
+        self.setPath(tab, None)
+        label = self.labels.pop(tab)
+        tabs = self.byLabel[label]
+        del tabs[tab]
+        if not tabs:
+            del self.byLabel[label]
+
+    def rename(self, tab, label):
+        path = self.paths.get(tab)
+        self.remove(tab)
+        self.add(tab, label)
+        self.setPath(tab, path)
+
+    def setPath(self, tab, path):
+        old = self.paths.pop(tab, None)
+        if old is not None and self.byPath.get(old) is tab:
+            del self.byPath[old]
+        if path is not None:
+            key = canonicalPath(path)
+            self.paths[tab] = key
+            self.byPath[key] = tab
+
+    def tabForPath(self, path):
+        return self.byPath.get(canonicalPath(path))
+
+    def tabsWithLabel(self, label):
+        return list(self.byLabel.get(label, ()))
+
+    def hasLabel(self, label):
+        return label in self.byLabel
+
+
+# Keeps track of which note names are taken so name checks don't have to list
+# the notes folder. Saved names come from a single scan at startup and are
+# kept current by a QFileSystemWatcher (plus the notify calls the tab widget
+# makes for its own saves, since the watcher reports changes asynchronously).
+class NoteNameIndex(QtCore.QObject):
+    # emitted by the store, from whichever thread changed it
+    storeChanged = QtCore.pyqtSignal(str)
+
+    def __init__(self, directory=NOTES_DIR, tabs=None, parent=None):
+        super(NoteNameIndex, self).__init__(parent)
+        self.directory = os.path.abspath(directory)
+        self.store = storeFor(directory)
+
+        # file names of the saved notes, e.g. 'untitled.note'
+        self.saved = set()
+        # the open tabs, whose labels are taken as well
+        self.tabs = tabs if tabs is not None else TabRegistry()
+        # base name -> first numeric suffix that might still be free
+        self.nextSuffix = {}
+
+        # bursts of directory changes only cause a single rescan
+        self.rescanTimer = QTimer(self)
+        self.rescanTimer.setSingleShot(True)
+        self.rescanTimer.setInterval(200)
+        self.rescanTimer.timeout.connect(self.rescan)
+
+        self.watcher = QtCore.QFileSystemWatcher(self)
+        if self.store.local and os.path.isdir(self.directory):
+            self.watcher.addPath(self.directory)
+        # connected straight to the timer, a python slot here could be torn
+        # down by the garbage collector while it is running
+        self.watcher.directoryChanged.connect(self.rescanTimer.start)
+        if not self.store.local:
+            self.storeChanged.connect(self.rescanTimer.start)
+            self.store.addListener(self.folderChanged)
+
+        self.rescan()
+
+    # called by the store
+    def folderChanged(self, path):
+        if os.path.abspath(path) == self.directory:
+            self.storeChanged.emit(path)
+
+    def rescan(self):
+        try:
+            self.saved = {name for name, isDir in self.store.list(self.directory)
+                          if not isDir and isNoteFile(name)}
+        except FileNotFoundError:
+            self.saved = set()
+        # names may have been freed up
+        self.nextSuffix.clear()
+
+    # a note is saved under its name whatever format it is in
+    def isSaved(self, name):
+        return bool(self.savedPaths(name))
+
+    # the paths of the saved notes called name, one per format it is saved in
+    def savedPaths(self, name):
+        return [os.path.join(self.directory, name + suffix + compression)
+                for suffix in NOTE_SUFFIXES for compression in ('',) + notefiles.COMPRESSED_SUFFIXES
+                if name + suffix + compression in self.saved]
+
+    def inUse(self, name):
+        return self.isSaved(name) or self.tabs.hasLabel(name)
+
+    # returns name, or name followed by the lowest free number we can find
+    def allocate(self, name):
+        if not self.inUse(name):
+            return name
+
+        num = self.nextSuffix.get(name, 1)
+        while self.inUse(name + str(num)):
+            num += 1
+        self.nextSuffix[name] = num
+        return name + str(num)
+
+    def noteSaved(self, path):
+        if os.path.dirname(os.path.abspath(path)) == self.directory:
+            self.saved.add(os.path.basename(path))
+
+    def noteRemoved(self, path):
+        if os.path.dirname(os.path.abspath(path)) == self.directory:
+            self.saved.discard(os.path.basename(path))
+            self.nextSuffix.clear()
+
+    # a tab was closed or renamed, its old label may be free now
+    def labelFreed(self):
+        self.nextSuffix.clear()
+
+
+# Remembers the open tabs across restarts: their order, files, cursor and
+# scroll positions, and the text of notes that were never saved. The tab list
+# is a small json file that is rewritten (at most every SESSION_SAVE_MS) when
+# anything about the tabs changed. The text of each unsaved note has a file of
+# its own, which is only rewritten when that note was edited. Snapshots are
+# taken on the GUI thread, the atomic writes happen on a worker thread.
+class Session(QtCore.QObject):
+    def __init__(self, tabWidget, directory=SESSION_DIR, saveMs=SESSION_SAVE_MS):
+        super(Session, self).__init__(tabWidget)
+        self.tabWidget = tabWidget
+        self.directory = directory
+        self.path = os.path.join(directory, 'session.json')
+        tabWidget.session = self
+
+        self.pool = BackgroundWorker('session')
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(saveMs)
+        self.timer.timeout.connect(self.save)
+
+        # buffer name -> document revision that was last written to it
+        self.written = {}
+        self.buffersWritten = 0
+
+        # restored tabs that are filled in one per event loop iteration
+        self.restoreQueue = collections.deque()
+        self.restoreTimer = QTimer(self)
+        self.restoreTimer.setInterval(0)
+        self.restoreTimer.timeout.connect(self.restoreNext)
+
+    def changed(self):
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def save(self):
+        self.timer.stop()
+        state, buffers = self.snapshot()
+        self.pool.start(self.write, state, buffers)
+
+    # writes the session and waits for it, e.g. when the app quits
+    def saveNow(self):
+        self.save()
+        self.pool.waitForDone()
+
+    def snapshot(self):
+        tabWidget = self.tabWidget
+        tabs = []
+        # (buffer name, note data) of unsaved notes that changed since they were written
+        buffers = []
+        written = {}
+
+        for i in range(tabWidget.count()):
+            tab = tabWidget.widget(i)
+            entry = {'label': tabWidget.tabText(i)}
+            if isinstance(tab, HistoryTab):
+                entry['history'] = tab.notePath
+                tabs.append(entry)
+                continue
+
+            path = tab.filePath or tab.sourcePath
+            if path:
+                entry['path'] = path
+            if tab.plainEditing is not None:
+                entry['plain'] = tab.plainEditing
+            if isinstance(tab, ViewerTab):
+                entry['viewer'] = True
+            elif tab.isMaterialized():
+                entry['cursor'] = tab.editor.textCursor().position()
+                entry['scroll'] = tab.editor.verticalScrollBar().value()
+            elif tab.viewState is not None:
+                entry['cursor'], entry['scroll'] = tab.viewState
+
+            # a note that was never saved only exists in the session
+            if not path:
+                if tab.sessionId is None:
+                    tab.sessionId = uuid.uuid4().hex
+                name = tab.sessionId + noteformat.SUFFIX
+                if tab.isMaterialized():
+                    revision = tab.editor.document().revision()
+                    if self.written.get(name, tab.bufferRevision) != revision:
+                        buffers.append((name, tabWidget.noteData(tab)))
+                    written[name] = revision
+                else:
+                    written[name] = self.written.get(name)
+                entry['buffer'] = name
+
+            tabs.append(entry)
+
+        self.written = written
+        state = {'version': 1, 'current': tabWidget.currentIndex(), 'tabs': tabs}
+        return state, buffers
+
+    # runs on the worker thread
+    @tracer.traced('io')
+    def write(self, state, buffers):
+        os.makedirs(self.directory, exist_ok=True)
+        # the buffers go first, the session never names one that isn't there
+        for name, data in buffers:
+            atomicWrite(os.path.join(self.directory, name), data)
+            self.buffersWritten += 1
+        atomicWrite(self.path, json.dumps(state, separators=(',', ':')).encode('utf-8'))
+
+        # buffers of tabs that have been closed since, and plain text buffers
+        # from before notes had a format of their own
+        keep = {entry['buffer'] for entry in state['tabs'] if 'buffer' in entry}
+        for name in os.listdir(self.directory):
+            if name.endswith(('.txt', noteformat.SUFFIX)) and name not in keep:
+                os.remove(os.path.join(self.directory, name))
+
+    # Opens the tabs of the last session in place of the empty tab the tab
+    # widget starts with. Only the current tab is read right away, the others
+    # are filled in the background. Returns False if there was nothing to restore.
+    def restore(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as file:
+                state = json.load(file)
+        except (OSError, ValueError):
+            return False
+
+        tabWidget = self.tabWidget
+        placeholders = [tabWidget.widget(i) for i in range(tabWidget.count())
+                        if tabWidget.isPristine(tabWidget.widget(i))]
+
+        restored = []
+        current = None
+        for i, entry in enumerate(state.get('tabs', [])):
+            tab = self.restoreTab(entry)
+            if tab is None:
+                continue
+            restored.append(tab)
+            if i <= state.get('current', 0):
+                current = tab
+        if not restored:
+            return False
+        current = current or restored[0]
+
+        for tab in placeholders:
+            tabWidget.removeTab(tabWidget.indexOf(tab))
+        tabWidget.setCurrentWidget(current)
+        tabWidget.materialize(current)
+
+        self.restoreQueue.extend(tab for tab in restored if tab is not current)
+        self.restoreTimer.start()
+        return True
+
+    def restoreTab(self, entry):
+        tabWidget = self.tabWidget
+        path = entry.get('path')
+        label = entry.get('label', 'untitled')
+
+        if entry.get('history'):
+            return tabWidget.widget(tabWidget.openHistory(entry['history'], current=False))
+        if path:
+            if not storeFor(path).isFile(path):
+                return None
+            if entry.get('viewer'):
+                index = tabWidget.addTab(ViewerTab(tabWidget, path), label)
+            else:
+                index = tabWidget.openFileUsingPath(path, lazy=True)
+            tab = tabWidget.widget(index)
+        else:
+            tab = tabWidget.widget(tabWidget.add_new_tab(label, current=False))
+            bufferPath = os.path.join(self.directory, entry.get('buffer', ''))
+            if os.path.isfile(bufferPath):
+                tab.pendingBuffer = bufferPath
+                tab.sessionId = os.path.splitext(entry['buffer'])[0]
+
+        if 'cursor' in entry:
+            tab.viewState = (entry['cursor'], entry.get('scroll', 0))
+        tab.plainEditing = entry.get('plain')
+        return tab
+
+    def restoreNext(self):
+        while self.restoreQueue:
+            tab = self.restoreQueue.popleft()
+            if self.tabWidget.indexOf(tab) != -1:
+                self.tabWidget.materialize(tab)
+                return
+        self.restoreTimer.stop()
+
+
+# scrolls the editor to value once the document has been laid out that far,
+# which QTextEdit does a bit at a time in the background
+def restoreScroll(editor, value):
+    scrollBar = editor.verticalScrollBar()
+    if value <= scrollBar.maximum():
+        scrollBar.setValue(value)
+        return
+
+    # scrolling or typing before then wins over the restored position
+    def done(*args):
+        scrollBar.rangeChanged.disconnect(rangeChanged)
+        scrollBar.actionTriggered.disconnect(done)
+        editor.cursorPositionChanged.disconnect(done)
+
+    def rangeChanged(minimum, maximum):
+        if value <= maximum:
+            done()
+            scrollBar.setValue(value)
+
+    scrollBar.rangeChanged.connect(rangeChanged)
+    scrollBar.actionTriggered.connect(done)
+    editor.cursorPositionChanged.connect(done)
+
+
+# Edits made with cursor inside the block are one undo step, and the document
+# reports them (to the autosave, the journal and the layout) once, at the end.
+# The layout redoes a changed range on the spot, but a whole new document a
+# bit at a time. Without a page size it skips changes altogether, and putting
+# the page size back counts as a new document, so edits spanning length
+# characters or more don't keep the window waiting until all of it has been
+# laid out again.
+@contextlib.contextmanager
+def editBlock(editor, cursor, length):
+    document = editor.document()
+    deferLayout = length >= EDIT_DEFER_LAYOUT_CHARS
+    if deferLayout:
+        pageSize = document.pageSize()
+        scroll = editor.verticalScrollBar().value()
+        document.setPageSize(QtCore.QSizeF())
+
+    cursor.beginEditBlock()
+    try:
+        yield
+    finally:
+        cursor.endEditBlock()
+        if deferLayout:
+            document.setPageSize(pageSize)
+            restoreScroll(editor, scroll)
+
+
+# the blocks the selection of cursor touches, or the one it's in; a selection
+# ending right at the start of a line doesn't take that line along
+def selectedBlocks(cursor):
+    document = cursor.document()
+    first = document.findBlock(cursor.selectionStart())
+    last = document.findBlock(cursor.selectionEnd())
+    if last != first and cursor.selectionEnd() == last.position():
+        last = last.previous()
+
+    blocks = [first]
+    while blocks[-1] != last:
+        blocks.append(blocks[-1].next())
+    return blocks
+
+
 class TabBar(QTabBar):
     def __init__(self, parent):
         super(TabBar, self).__init__()
         self.parent = parent
         self.setAutoFillBackground(True)
-        self.setStyleSheet("""
-            QTabBar::close-button {
-                image: url(./resources/delete_tab.png);
-                subcontrol-position: left;
-            }
-            QTabBar::tab {
-                color: black;
-                background: #77dd77;
-                border-left: 1px solid black;
-                text-align: center;
-            }
-            QTabBar::tab::first {
-                border-left: none;
-            }
-            QTabBar::tab::only-one {
-                border-left: none;
-            }
-            QTabBar::tab::hover {
-                background: #8be28b;
-            }
-            QTabBar::tab::selected {
-                font: bold;
-                background: #b4ecb4;
-            }
-            """)
+        # every tab is as high as the first one, see tabSizeHint()
+        self.tabHeight = None
 
     def tabSizeHint(self, index):
-        size = QTabBar.tabSizeHint(self, index)
-
         # Need this on startup to avoid division by 0 error
         if self.parent.count() == 0:
-            return QSize(size.width(), size.height())
+            return QTabBar.tabSizeHint(self, index)
+
+        # only the height is taken from Qt, and only once: working it out
+        # goes through the style sheet, and adding a tab asks for the size of
+        # every tab
+        if self.tabHeight is None:
+            self.tabHeight = QTabBar.tabSizeHint(self, index).height()
 
         # this takes the parent widgets width and divides it by
         # the number of tabs to prevent the tabbar expanding past
@@ -136,7 +2829,13 @@ class TabBar(QTabBar):
                     int(self.parent.addTabButton.width())
         width = int(max_width / self.parent.count()) + 1
 
-        return QSize(width, size.height())
+        return QSize(width, self.tabHeight)
+
+    # a new theme or font can change the height of the tabs
+    def changeEvent(self, event):
+        if event.type() in (QtCore.QEvent.StyleChange, QtCore.QEvent.FontChange):
+            self.tabHeight = None
+        super(TabBar, self).changeEvent(event)
 
     # based on https://stackoverflow.com/questions/44450775/pyqt-gui-with-multiple-tabs
     def mouseDoubleClickEvent(self, event):
@@ -152,15 +2851,618 @@ class TabBar(QTabBar):
         if ok:
             allowNameChange = self.parent.savedTabNameChange(newName)
             if allowNameChange:
-                self.setTabText(index, newName)
+                self.parent.setTabText(index, newName)
+
+
+# The plain values of a format's properties, which is what the note format
+# keeps. Brushes, fonts and the like are left out, and so is the object index,
+# which only means something inside one document.
+def formatProperties(format):
+    return {key: value for key, value in format.properties().items()
+            if key != QtGui.QTextFormat.ObjectIndex and isinstance(value, (bool, int, float, str))}
+
+
+def applyProperties(format, properties):
+    for key, value in properties.items():
+        format.setProperty(key, value)
+    return format
+
+
+# Encodes a document in the note format and keeps the encoded line of every
+# block, so a save only encodes the blocks that changed since the last one.
+# Which ones did is taken from the document's contentsChange signal: a block's
+# revision only changes with its text, not with its formatting.
+class NoteSerializer(object):
+    # lines can be the encoded lines the document was just read from
+    def __init__(self, document, lines=None):
+        self.document = document
+        # encoded line per block number, None where it has to be encoded
+        if lines is None or len(lines) != document.blockCount():
+            lines = [None] * document.blockCount()
+        self.lines = lines
+        self.blocksEncoded = 0
+        # set while edits that leave the document as it was are made
+        self.paused = False
+        document.contentsChange.connect(self.contentsChange)
+
+    def detach(self):
+        self.document.contentsChange.disconnect(self.contentsChange)
+
+    # runs on the GUI thread for every edit; the blocks the change ends up
+    # covering replace however many blocks were there before
+    def contentsChange(self, position, removed, added):
+        if self.paused:
+            return
+        document = self.document
+        last = document.characterCount() - 1
+        first = document.findBlock(min(position, last)).blockNumber()
+        end = document.findBlock(min(position + added, last)).blockNumber()
+        oldEnd = end - (document.blockCount() - len(self.lines))
+        self.lines[first:oldEnd + 1] = [None] * (end - first + 1)
+
+    def serialize(self):
+        document = self.document
+        # shouldn't happen, but a wrong cache would be written as the note
+        if len(self.lines) != document.blockCount():
+            self.lines = [None] * document.blockCount()
+
+        # a document without any formatting is encoded straight from its
+        # text, that saves going through it block by block
+        lines = self.lines
+        if lines.count(None) > len(lines) // 2 and self.isPlain():
+            texts = document.toRawText().split('\u2029')
+            if len(texts) == len(lines):
+                self.lines = lines = [noteformat.encodeText(text) for text in texts]
+                self.blocksEncoded += len(lines)
+
+        for number, line in enumerate(lines):
+            if line is None:
+                lines[number] = self.encodeBlock(document.findBlockByNumber(number))
+                self.blocksEncoded += 1
+        return noteformat.MAGIC + b''.join(lines)
+
+    # formats that are no longer used count as well, the document keeps them
+    def isPlain(self):
+        return not any(formatProperties(format) for format in self.document.allFormats()
+                       if format.isCharFormat() or format.isBlockFormat() or format.isListFormat())
+
+    def encodeBlock(self, block):
+        spans = []
+        offset = 0
+        fragments = block.begin()
+        while not fragments.atEnd():
+            fragment = fragments.fragment()
+            length = len(fragment.text())
+            properties = formatProperties(fragment.charFormat())
+            if properties:
+                spans.append([offset, length, properties])
+            offset += length
+            fragments += 1
+
+        textList = block.textList()
+        if textList is not None:
+            textList = [textList.objectIndex(), formatProperties(textList.format())]
+        return noteformat.encodeBlock(block.text(), spans, formatProperties(block.blockFormat()), textList)
+
+
+# Appends blocks read from a note file to a document, a batch of (encoded
+# line, decoded block) pairs at a time
+class NoteBuilder(object):
+    def __init__(self, document):
+        self.cursor = QtGui.QTextCursor(document)
+        self.cursor.movePosition(QtGui.QTextCursor.End)
+        # list id in the file -> the QTextList made for it
+        self.lists = {}
+        # the first block read goes into the empty block an empty document has
+        self.first = document.isEmpty()
+        # the encoded lines, for a NoteSerializer to start out with. Lines of
+        # list items are left out, their list ids only mean something in the file.
+        self.lines = []
+
+    def insertBlocks(self, blocks):
+        # runs of blocks that are nothing but text go in with a single
+        # insertText, the newlines make the blocks
+        plain = []
+        for line, entry in blocks:
+            self.lines.append(None if 'list' in entry else line)
+            if len(entry) == 1:
+                plain.append(entry['text'])
+                continue
+            self.insertPlain(plain)
+            plain = []
+            self.insertBlock(entry)
+        self.insertPlain(plain)
+
+    def insertPlain(self, texts):
+        if texts:
+            self.insertBlock({'text': ''})
+            self.cursor.insertText('\n'.join(texts), QtGui.QTextCharFormat())
+
+    def insertBlock(self, entry):
+        cursor = self.cursor
+        blockFormat = applyProperties(QtGui.QTextBlockFormat(), entry.get('block', {}))
+        if self.first:
+            cursor.setBlockFormat(blockFormat)
+            self.first = False
+        else:
+            cursor.insertBlock(blockFormat, QtGui.QTextCharFormat())
+
+        if 'list' in entry:
+            listId, properties = entry['list']
+            textList = self.lists.get(listId)
+            if textList is None:
+                self.lists[listId] = cursor.createList(applyProperties(QtGui.QTextListFormat(), properties))
+            else:
+                textList.add(cursor.block())
+
+        text = entry['text']
+        position = 0
+        for offset, length, properties in entry.get('spans', ()):
+            if offset > position:
+                cursor.insertText(text[position:offset], QtGui.QTextCharFormat())
+            cursor.insertText(text[offset:offset + length], applyProperties(QtGui.QTextCharFormat(), properties))
+            position = offset + length
+        if position < len(text):
+            cursor.insertText(text[position:], QtGui.QTextCharFormat())
+
+
+# Reads a note file into an empty document, which isn't something to undo.
+# Returns a NoteSerializer that already has the lines that were read.
+def loadNote(document, path):
+    builder = NoteBuilder(document)
+    document.setUndoRedoEnabled(False)
+    with storeFor(path).open(path) as raw, notefiles.reader(raw, path) as file:
+        builder.insertBlocks((line, noteformat.decodeBlock(line)) for line in noteformat.readLines(file))
+    document.setUndoRedoEnabled(True)
+    return NoteSerializer(document, builder.lines)
+
+
+# Puts data, a note as it is stored in path, in place of editor's text as a
+# single edit
+def replaceNote(editor, path, data):
+    cursor = QtGui.QTextCursor(editor.document())
+    cursor.select(QtGui.QTextCursor.Document)
+    with editBlock(editor, cursor, max(len(data), editor.document().characterCount())):
+        cursor.removeSelectedText()
+        if noteformat.isNotePath(path):
+            builder = NoteBuilder(editor.document())
+            builder.insertBlocks((line, noteformat.decodeBlock(line))
+                                 for line in noteformat.readLines(io.BytesIO(data)))
+        else:
+            cursor.insertText(data.decode('utf-8'), QtGui.QTextCharFormat())
+
+
+# Streams a file into a tab's document. A worker thread reads and decodes the
+# file in chunks, the GUI thread appends them through a QTextCursor in time
+# slices so the window keeps painting and responding while big files load.
+class FileLoader(QtCore.QObject):
+    progress = QtCore.pyqtSignal(int)
+    # True once the whole file is in the document, False if loading was
+    # cancelled or failed
+    finished = QtCore.pyqtSignal(bool)
+
+    def __init__(self, document, filePath, parent=None):
+        super(FileLoader, self).__init__(parent)
+        self.filePath = filePath
+        self.cursor = QtGui.QTextCursor(document)
+        self.size = max(1, storeFor(filePath).size(filePath))
+
+        # a few chunks of read ahead is plenty, the document is the bottleneck
+        self.chunks = queue.Queue(maxsize=8)
+        self.stopped = threading.Event()
+        self.error = None
+
+        # filled in by the reader thread, describe the text that was read
+        self.bytesRead = 0
+        self.crc = 0
+        self.length = 0
+        # False if the text has characters toPlainText() doesn't give back as is
+        self.plain = True
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(0)
+        self.timer.timeout.connect(self.appendChunks)
+        self.reader = threading.Thread(target=self.readFile, name='file-loader', daemon=True)
+
+    def start(self):
+        self.reader.start()
+        self.timer.start()
+
+    # runs on the reader thread
+    @tracer.traced('io')
+    def readFile(self):
+        try:
+            # progress goes by the file as stored, compressed or not
+            with storeFor(self.filePath).open(self.filePath) as raw, \
+                    io.TextIOWrapper(notefiles.reader(raw, self.filePath), encoding='utf-8') as file:
+                while not self.stopped.is_set():
+                    chunk = file.read(STREAM_CHUNK_CHARS)
+                    if not chunk:
+                        break
+                    data = chunk.encode('utf-8')
+                    self.crc = zlib.crc32(data, self.crc)
+                    self.length += len(data)
+                    if self.plain and chunk != chunk.translate(PLAIN_TEXT_MAP):
+                        self.plain = False
+                    self.bytesRead = raw.tell()
+                    self.put(chunk)
+            self.put(None)
+        except Exception as error:
+            self.put(error)
+
+    def put(self, item):
+        while not self.stopped.is_set():
+            try:
+                self.chunks.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def appendChunks(self):
+        elapsed = QtCore.QElapsedTimer()
+        elapsed.start()
+        while elapsed.elapsed() < STREAM_SLICE_MS:
+            try:
+                item = self.chunks.get_nowait()
+            except queue.Empty:
+                break
+
+            if item is None:
+                self.stop()
+                self.finished.emit(True)
+                return
+            if isinstance(item, Exception):
+                self.error = item
+                self.stop()
+                self.finished.emit(False)
+                return
+
+            self.insert(item)
+
+        self.progress.emit(int(100 * self.bytesRead / self.size))
+
+    def insert(self, chunk):
+        self.cursor.insertText(chunk)
+
+    # stops loading without telling anybody
+    def stop(self):
+        self.stopped.set()
+        self.timer.stop()
+
+    def cancel(self):
+        self.stop()
+        self.finished.emit(False)
+
+
+# Streams in a file in the note format. The reader thread decodes the blocks
+# and hands them over in batches of about STREAM_CHUNK_CHARS characters.
+class NoteLoader(FileLoader):
+    def __init__(self, document, filePath, parent=None):
+        super(NoteLoader, self).__init__(document, filePath, parent)
+        self.builder = NoteBuilder(document)
+
+    # runs on the reader thread
+    @tracer.traced('io')
+    def readFile(self):
+        try:
+            with storeFor(self.filePath).open(self.filePath) as raw, notefiles.reader(raw, self.filePath) as file:
+                batch = []
+                chars = 0
+                for line in noteformat.readLines(file):
+                    if self.stopped.is_set():
+                        break
+                    entry = noteformat.decodeBlock(line)
+                    batch.append((line, entry))
+                    chars += len(entry['text'])
+                    if chars >= STREAM_CHUNK_CHARS:
+                        self.bytesRead = raw.tell()
+                        self.put(batch)
+                        batch = []
+                        chars = 0
+                if batch:
+                    self.put(batch)
+            self.put(None)
+        except Exception as error:
+            self.put(error)
+
+    def insert(self, blocks):
+        self.builder.insertBlocks(blocks)
+
+
+# shown above a tab's editor while its file is being streamed in
+class LoadingBar(QtWidgets.QWidget):
+    def __init__(self, parent=None):
+        super(LoadingBar, self).__init__(parent)
+        self.progressBar = QProgressBar(self)
+        self.progressBar.setRange(0, 100)
+        self.progressBar.setTextVisible(True)
+        self.cancelButton = QPushButton("Cancel", self)
+
+        self.layout = QHBoxLayout(self)
+        self.layout.setContentsMargins(4, 2, 4, 2)
+        self.layout.addWidget(self.progressBar)
+        self.layout.addWidget(self.cancelButton)
+
+
+UNDO_TYPING_KEYS = (Qt.Key_Return, Qt.Key_Enter, Qt.Key_Backspace, Qt.Key_Delete, Qt.Key_Tab)
+
+
+# Keeps count of an editor's undo steps and what they cost, and drops the
+# oldest ones when the history goes over budget.
+#
+# Qt can only clear an undo history as a whole, so the history is made again
+# instead: the document is undone back to the oldest step that stays, the
+# steps that stay are redone one at a time to copy out what each of them put
+# in, and the copied steps are applied again as new undo steps once the old
+# history is gone. That only touches the text of the steps that stay.
+#
+# Clearing the history doesn't free the text of the steps it dropped, it stays
+# in the document's buffer until the document is cleared. That text is counted
+# as garbage, and once the history and the garbage together go over maxBytes
+# the document is cleared and filled again from its note format encoding
+# before the steps are applied. That costs as much as reading the note in, but
+# only happens after half a byte budget of edits.
+#
+# The document ends up holding what it held before, so the edits a trim makes
+# aren't the user's: rebuilding is emitted around them, and the journal and
+# the serializer don't record them (see NotesTabWidget.pauseTracking).
+class UndoBudget(QtCore.QObject):
+    # True before a trim changes the document, False once it is done
+    rebuilding = QtCore.pyqtSignal(bool)
+
+    def __init__(self, editor, maxBytes=None, maxSteps=None):
+        super(UndoBudget, self).__init__(editor)
+        self.editor = editor
+        self.document = editor.document()
+        self.maxBytes = UNDO_MAX_BYTES if maxBytes is None else maxBytes
+        self.maxSteps = UNDO_MAX_STEPS if maxSteps is None else maxSteps
+
+        # [undo commands up to the end of the step, estimated bytes] per step,
+        # oldest first. Steps that were undone and can be redone are included.
+        # Qt counts the commands that make up an edit block one by one.
+        self.steps = []
+        self.bytes = 0
+        # estimated bytes of dropped steps still in the document's buffer
+        self.garbage = 0
+        self.droppedSteps = 0
+        # availableUndoSteps() when the last change came in, and whether a
+        # command was added since; changes that move the count without one
+        # are undos and redos
+        self.commands = self.document.availableUndoSteps()
+        self.added = False
+        # set while typing is joined onto the last step
+        self.joining = False
+        # (cursor position, commands) the last typed key left behind, and when
+        self.lastTyped = None
+        self.lastTypedTime = 0
+        # set while the history is being made again, the changes that come in
+        # are the history's own; while capturing, captured collects the change
+        # a redo made
+        self.trimming = False
+        self.capturing = False
+        self.captured = None
+
+        self.trimTimer = QTimer(self)
+        self.trimTimer.setSingleShot(True)
+        self.trimTimer.setInterval(0)
+        self.trimTimer.timeout.connect(self.trim)
+        self.document.undoCommandAdded.connect(self.commandAdded)
+        self.document.contentsChange.connect(self.contentsChange)
+
+    def overBudget(self):
+        return self.memory() > self.maxBytes or len(self.steps) > self.maxSteps
+
+    # estimated bytes the history keeps in memory
+    def memory(self):
+        return self.bytes + self.garbage
+
+    # Qt signals a new command before the change it made
+    def commandAdded(self):
+        if self.trimming:
+            return
+        count = self.document.availableUndoSteps()
+        # a new command takes the place of anything that could be redone
+        while self.steps and self.steps[-1][0] >= count:
+            self.bytes -= self.steps.pop()[1]
+        if self.joining and self.steps:
+            self.steps[-1][0] = count
+        else:
+            self.steps.append([count, UNDO_STEP_BYTES])
+            self.bytes += UNDO_STEP_BYTES
+        self.added = True
+
+    # runs on the GUI thread for every edit. Qt keeps both the text an edit
+    # removes and the text it puts in, two bytes a character.
+    def contentsChange(self, position, removed, added):
+        if self.trimming:
+            if self.capturing:
+                change = (position, removed, added)
+                self.captured = change if self.captured is None else mergeChange(self.captured, change)
+            return
+        document = self.document
+        count = document.availableUndoSteps()
+        if not count and not document.availableRedoSteps():
+            # the history was cleared, e.g. by setText(), which clears the
+            # buffer as well
+            self.steps = []
+            self.bytes = 0
+            self.garbage = 0
+        elif self.steps and self.steps[-1][0] == count and (self.added or count == self.commands):
+            cost = 2 * (removed + added)
+            self.steps[-1][1] += cost
+            self.bytes += cost
+            if self.overBudget():
+                self.trimTimer.start()
+        self.added = False
+        self.commands = count
+
+    # Typed keys go in as edit blocks, and keys typed soon enough after the
+    # last one right where it left the cursor are joined onto its block.
+    # Qt merges plain typing on its own but starts a new step at every new
+    # line, backspace and cursor move.
+    @contextlib.contextmanager
+    def typing(self, event):
+        editor = self.editor
+        text = event.text()
+        typed = (event.key() in UNDO_TYPING_KEYS or (text and text.isprintable())) and \
+            not event.modifiers() & (Qt.ControlModifier | Qt.AltModifier | Qt.MetaModifier)
+        if not typed or editor.isReadOnly():
+            self.lastTyped = None
+            yield
+            return
+
+        now = time.monotonic()
+        cursor = editor.textCursor()
+        self.joining = (not cursor.hasSelection() and now - self.lastTypedTime < UNDO_MERGE_MS / 1000 and
+                        self.lastTyped == (cursor.position(), self.document.availableUndoSteps()))
+        if self.joining:
+            cursor.joinPreviousEditBlock()
+        else:
+            cursor.beginEditBlock()
+        try:
+            yield
+        finally:
+            cursor.endEditBlock()
+            self.joining = False
+            self.lastTyped = (editor.textCursor().position(), self.document.availableUndoSteps())
+            self.lastTypedTime = now
+
+    # drops the oldest steps until what is left fits in half the budget. Only
+    # done once nothing is left to redo, so the user isn't in the middle of
+    # going back and forth through the history.
+    @tracer.traced('slot')
+    def trim(self):
+        document = self.document
+        if not self.overBudget() or document.availableRedoSteps():
+            return
+
+        keep = []
+        size = 0
+        for step in reversed(self.steps):
+            if len(keep) + 1 > self.maxSteps // 2 or size + step[1] > self.maxBytes // 2:
+                break
+            keep.insert(0, step)
+            size += step[1]
+
+        # the document is only cleared when the buffer is what is over budget
+        refill = self.memory() > self.maxBytes
+
+        editor = self.editor
+        cursor = editor.textCursor()
+        anchor, position = cursor.anchor(), cursor.position()
+        scroll = editor.verticalScrollBar().value()
+        # laid out once at the end rather than after every undo and redo; an
+        # empty page puts the layout off altogether, where an invalid one
+        # (as in editBlock()) still lays out every change
+        pageSize = document.pageSize()
+        document.setPageSize(QtCore.QSizeF(0, 0))
+        self.trimming = True
+        self.rebuilding.emit(True)
+        try:
+            for _ in keep:
+                document.undo()
+            if refill:
+                serializer = NoteSerializer(document)
+                data = serializer.serialize()
+                serializer.detach()
+
+            # what each step put in, with its formatting
+            changes = []
+            self.capturing = True
+            for step in keep:
+                self.captured = None
+                document.redo()
+                if self.captured is not None:
+                    changes.append((self.captureChange(*self.captured), step[1]))
+            self.capturing = False
+
+            cursor = QtGui.QTextCursor(document)
+            if refill:
+                document.setUndoRedoEnabled(False)
+                document.clear()
+                cursor.beginEditBlock()
+                NoteBuilder(document).insertBlocks((line, noteformat.decodeBlock(line))
+                                                   for line in noteformat.readLines(io.BytesIO(data)))
+                cursor.endEditBlock()
+                document.setUndoRedoEnabled(True)
+                garbage = 0
+            else:
+                # back to where the steps that stay start, without the history
+                for _ in keep:
+                    document.undo()
+                document.setUndoRedoEnabled(False)
+                document.setUndoRedoEnabled(True)
+                # the text of every step so far, the ones that stay are put in again
+                garbage = self.memory()
+
+            steps = []
+            for (start, removed, fragment), cost in changes:
+                last = document.characterCount() - 1
+                cursor.setPosition(min(start, last))
+                cursor.setPosition(min(start + removed, last), QtGui.QTextCursor.KeepAnchor)
+                cursor.beginEditBlock()
+                if fragment.isEmpty():
+                    cursor.removeSelectedText()
+                else:
+                    cursor.insertFragment(fragment)
+                cursor.endEditBlock()
+                steps.append([document.availableUndoSteps(), cost])
+        finally:
+            self.trimming = False
+            self.capturing = False
+            document.setPageSize(pageSize)
+            self.rebuilding.emit(False)
+
+        self.droppedSteps += len(self.steps) - len(steps)
+        self.steps = steps
+        self.bytes = sum(step[1] for step in self.steps)
+        self.garbage = garbage
+        self.commands = document.availableUndoSteps()
+        self.lastTyped = None
+
+        last = document.characterCount() - 1
+        cursor = editor.textCursor()
+        cursor.setPosition(min(anchor, last))
+        cursor.setPosition(min(position, last), QtGui.QTextCursor.KeepAnchor)
+        editor.setTextCursor(cursor)
+        restoreScroll(editor, scroll)
+
+    # (position, characters removed, what was put in their place) of a change
+    # that was just redone
+    def captureChange(self, position, removed, added):
+        document = self.document
+        last = document.characterCount() - 1
+        cursor = QtGui.QTextCursor(document)
+        cursor.setPosition(min(position, last))
+        cursor.setPosition(min(position + added, last), QtGui.QTextCursor.KeepAnchor)
+        return position, removed, cursor.selection()
+
+
+# one change covering two consecutive ones, each given as (position, removed,
+# added) in the document as it was when it was made
+def mergeChange(first, second):
+    start, removed, added = first
+    position, removed2, added2 = second
+    low = min(start, position)
+    high = max(start + added, position + removed2)
+    return low, high - added + removed - low, high + added2 - removed2 - low
 
 
 class TabPlainTextEdit(QtWidgets.QTextEdit):
     def __init__(self, parent):
         super(TabPlainTextEdit, self).__init__(parent)
         self.parent = parent
+        # set for the editors of notes, see UndoBudget
+        self.undoBudget = None
         self.initUI()
 
+    def keyPressEvent(self, event):
+        if self.undoBudget is None:
+            super(TabPlainTextEdit, self).keyPressEvent(event)
+            return
+        with self.undoBudget.typing(event):
+            super(TabPlainTextEdit, self).keyPressEvent(event)
+
     def initUI(self):
         sizePolicy = QtWidgets.QSizePolicy(
             QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
@@ -171,7 +3473,566 @@ class TabPlainTextEdit(QtWidgets.QTextEdit):
         self.setAutoFormatting(QTextEdit.AutoAll)
 
 
+# Editor of tabs in plain text mode. QPlainTextEdit lays out a line at a time
+# and only as far as it is shown, where QTextEdit keeps the whole document
+# laid out, which is what makes it so much faster on long notes. It does
+# what the tab widget asks of TabPlainTextEdit, except for character and
+# block formatting, whose actions are turned off for these tabs. Formatting
+# the note already has stays in the document (and in the saved note), it
+# just isn't all shown.
+class PlainNoteEdit(QtWidgets.QPlainTextEdit):
+    def __init__(self, parent):
+        super(PlainNoteEdit, self).__init__(parent)
+        self.parent = parent
+        self.undoBudget = None
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHeightForWidth(self.sizePolicy().hasHeightForWidth())
+        self.setSizePolicy(sizePolicy)
+
+    def setText(self, text):
+        self.setPlainText(text)
+
+    def keyPressEvent(self, event):
+        if self.undoBudget is None:
+            super(PlainNoteEdit, self).keyPressEvent(event)
+            return
+        with self.undoBudget.typing(event):
+            super(PlainNoteEdit, self).keyPressEvent(event)
+
+
+# Highlights a Markdown note as notemarkdown splits it up. Qt calls
+# highlightBlock for the blocks an edit touched and goes on to the next block
+# only while the state a block ends in changes, so typing re-highlights a
+# single line however long the note is. The formats only change how the text
+# is shown, the document and the saved note stay as they are.
+class MarkdownHighlighter(QtGui.QSyntaxHighlighter):
+    def __init__(self, document):
+        super(MarkdownHighlighter, self).__init__(document)
+        self.formats = self.makeFormats(themeManager.themes[themeManager.current])
+
+    # kind of span -> QTextCharFormat in the colours of theme
+    @staticmethod
+    def makeFormats(theme):
+        def coloured(name):
+            charFormat = QtGui.QTextCharFormat()
+            charFormat.setForeground(QtGui.QColor(theme[name]))
+            return charFormat
+
+        fixed = QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.FixedFont).family()
+        formats = {
+            'heading': coloured('markdownHeading'),
+            'rule': coloured('markdownMarker'),
+            'list': coloured('markdownMarker'),
+            'quote': coloured('markdownQuote'),
+            'fence': coloured('markdownMarker'),
+            'code': coloured('markdownCode'),
+            'link': coloured('markdownLink'),
+            'strong': QtGui.QTextCharFormat(),
+            'emphasis': QtGui.QTextCharFormat(),
+        }
+        formats['heading'].setFontWeight(QtGui.QFont.Bold)
+        formats['strong'].setFontWeight(QtGui.QFont.Bold)
+        formats['emphasis'].setFontItalic(True)
+        formats['link'].setFontUnderline(True)
+        formats['fence'].setFontFamily(fixed)
+        formats['code'].setFontFamily(fixed)
+        return formats
+
+    def setTheme(self, name):
+        self.formats = self.makeFormats(themeManager.themes[name])
+        self.rehighlight()
+
+    def highlightBlock(self, text):
+        spans, state = notemarkdown.highlightLine(text, self.previousBlockState())
+        for start, length, kind in spans:
+            self.setFormat(start, length, self.formats[kind])
+        self.setCurrentBlockState(state)
+
+
+# Page widget for a single tab. The editor (and with it the QTextDocument)
+# is only created once the tab is first shown or its plainTextEdit is used,
+# so tabs that are opened in bulk cost little more than their label.
+class NoteTab(QtWidgets.QWidget):
+    def __init__(self, tabWidget):
+        super(NoteTab, self).__init__()
+        self.tabWidget = tabWidget
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.sizePolicy().hasHeightForWidth())
+        self.setSizePolicy(sizePolicy)
+        self.setObjectName("tab")
+        self.setAccessibleName("tab")
+
+        # adding a "save state" to tab
+        # set to 'unsaved' as default
+        self.saveState = False
+        # file the tab was opened from or saved to, None for new notes
+        self.filePath = None
+        # file the tab shows, also set for read only files that aren't saved to
+        self.sourcePath = None
+        self.journal = None
+        # NoteSerializer, made the first time the tab is saved in the note format
+        self.serializer = None
+        # True or False once the user picked the plain or the rich text editor
+        # for the tab, None leaves it to the note's format and size
+        self.plainEditing = None
+        # MarkdownHighlighter of the tab's document while it is highlighted
+        self.highlighter = None
+
+        # file that still has to be read into the editor
+        self.pendingPath = None
+        self.editor = None
+
+        # FileLoader while the file is being streamed in, autosave leaves
+        # the tab alone until it is done
+        self.loader = None
+        self.loadingBar = None
+
+        # set for tabs restored from the session: the unsaved text still to
+        # be read in, the (cursor, scroll) position to go back to, the name
+        # of the tab's text in the session and the document revision it has
+        self.pendingBuffer = None
+        self.viewState = None
+        self.sessionId = None
+        self.bufferRevision = None
+
+    @property
+    def loading(self):
+        return self.loader is not None
+
+    @property
+    def plainTextEdit(self):
+        if self.editor is None:
+            self.tabWidget.materialize(self)
+        return self.editor
+
+    def isMaterialized(self):
+        return self.editor is not None
+
+
+# Read only view of a huge file. The file is memory mapped and a background
+# thread counts the newlines in every VIEWER_BLOCK_BYTES block, which is all
+# the line index holds. The exact start of a line is found by scanning its
+# block when the line is painted (the last few blocks are cached), so memory
+# use stays the same however big the file is.
+class FileViewer(QtWidgets.QAbstractScrollArea):
+    # more of the line index is available
+    indexed = QtCore.pyqtSignal()
+
+    def __init__(self, filePath, parent=None):
+        super(FileViewer, self).__init__(parent)
+        self.filePath = filePath
+        self.file = open(filePath, 'rb')
+        self.size = os.path.getsize(filePath)
+        self.map = None
+        if self.size:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # blockLines[i] is the number of newlines before block i
+        self.blockBytes = VIEWER_BLOCK_BYTES
+        self.blockLines = [0]
+        self.indexDone = False
+        # block number -> offsets of the newlines in it
+        self.blockCache = collections.OrderedDict()
+        self.widest = 0
+
+        self.setFont(QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.FixedFont))
+        self.indexed.connect(self.updateScrollRange)
+
+        self.stopped = threading.Event()
+        self.indexer = threading.Thread(target=self.buildIndex, name='line-index', daemon=True)
+        self.indexer.start()
+
+    # runs on the indexer thread
+    def buildIndex(self):
+        blocks = (self.size + self.blockBytes - 1) // self.blockBytes
+        for block in range(blocks):
+            if self.stopped.is_set():
+                return
+            start = block * self.blockBytes
+            newlines = self.map[start:start + self.blockBytes].count(b'\n')
+            self.blockLines.append(self.blockLines[-1] + newlines)
+            if block % 64 == 0:
+                self.indexed.emit()
+        self.indexDone = True
+        self.indexed.emit()
+
+    def release(self):
+        self.stopped.set()
+        self.indexer.join()
+        if self.map is not None:
+            self.map.close()
+        self.file.close()
+
+    def lineCount(self):
+        newlines = self.blockLines[-1]
+        # a last line without a newline only counts once the whole file is indexed
+        if self.indexDone and self.size and self.map[self.size - 1:self.size] != b'\n':
+            return newlines + 1
+        return newlines
+
+    def blockNewlines(self, block):
+        offsets = self.blockCache.get(block)
+        if offsets is None:
+            start = block * self.blockBytes
+            data = self.map[start:start + self.blockBytes]
+            offsets = []
+            position = data.find(b'\n')
+            while position != -1:
+                offsets.append(start + position)
+                position = data.find(b'\n', position + 1)
+            self.blockCache[block] = offsets
+            if len(self.blockCache) > 16:
+                self.blockCache.popitem(last=False)
+        else:
+            self.blockCache.move_to_end(block)
+        return offsets
+
+    # file offset of the nth newline (counting from 1), None if it isn't indexed
+    def newlineOffset(self, n):
+        blockLines = self.blockLines
+        if n > blockLines[-1]:
+            return None
+        block = bisect.bisect_left(blockLines, n) - 1
+        return self.blockNewlines(block)[n - blockLines[block] - 1]
+
+    def lineText(self, line):
+        start = 0 if line == 0 else self.newlineOffset(line) + 1
+        end = self.newlineOffset(line + 1)
+        if end is None:
+            end = self.size
+        end = min(end, start + VIEWER_MAX_LINE_CHARS * 4)
+        text = self.map[start:end].decode('utf-8', 'replace').rstrip('\r')
+        return text[:VIEWER_MAX_LINE_CHARS].expandtabs(4)
+
+    def visibleLines(self):
+        return max(1, self.viewport().height() // self.fontMetrics().lineSpacing())
+
+    def updateScrollRange(self):
+        # the widget still gets resize events after release() while it is
+        # being deleted, there is no file left to look at by then
+        if self.stopped.is_set():
+            return
+        visible = self.visibleLines()
+        self.verticalScrollBar().setRange(0, max(0, self.lineCount() - visible))
+        self.verticalScrollBar().setPageStep(visible)
+        self.horizontalScrollBar().setRange(0, max(0, self.widest - self.viewport().width()))
+        self.horizontalScrollBar().setPageStep(self.viewport().width())
+        self.viewport().update()
+
+    def resizeEvent(self, event):
+        super(FileViewer, self).resizeEvent(event)
+        self.updateScrollRange()
+
+    def paintEvent(self, event):
+        if self.stopped.is_set():
+            return
+        painter = QtGui.QPainter(self.viewport())
+        painter.setPen(self.palette().color(QtGui.QPalette.Text))
+        metrics = self.fontMetrics()
+
+        x = 4 - self.horizontalScrollBar().value()
+        y = metrics.ascent()
+        first = self.verticalScrollBar().value()
+        widest = self.widest
+        for line in range(first, min(self.lineCount(), first + self.visibleLines() + 1)):
+            text = self.lineText(line)
+            painter.drawText(x, y, text)
+            widest = max(widest, metrics.horizontalAdvance(text) + 8)
+            y += metrics.lineSpacing()
+        painter.end()
+
+        if widest != self.widest:
+            self.widest = widest
+            self.horizontalScrollBar().setRange(0, max(0, widest - self.viewport().width()))
+
+
+# tab that shows a file in a FileViewer instead of an editor
+class ViewerTab(NoteTab):
+    def __init__(self, tabWidget, filePath):
+        super(ViewerTab, self).__init__(tabWidget)
+        self.filePath = filePath
+        self.viewer = FileViewer(filePath, self)
+
+        self.infoLabel = QLabel("Read only view, file is too large to edit comfortably", self)
+        self.editButton = QPushButton("Open for Editing", self)
+        self.editButton.clicked.connect(lambda: tabWidget.openForEditing(self))
+
+        self.header = QHBoxLayout()
+        self.header.setContentsMargins(4, 2, 4, 2)
+        self.header.addWidget(self.infoLabel, 1)
+        self.header.addWidget(self.editButton)
+
+        self.verticalLayout = QVBoxLayout(self)
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout.setSpacing(0)
+        self.verticalLayout.addLayout(self.header)
+        self.verticalLayout.addWidget(self.viewer)
+
+    # the toolbar actions get an empty, read only editor to work on
+    @property
+    def plainTextEdit(self):
+        if self.editor is None:
+            self.editor = TabPlainTextEdit(self)
+            self.editor.setReadOnly(True)
+            self.editor.hide()
+        return self.editor
+
+
+# The versions of a note (see notehistory.py), newest first. The selected one
+# is shown read only and can be restored over the note.
+class HistoryTab(NoteTab):
+    def __init__(self, tabWidget, notePath):
+        super(HistoryTab, self).__init__(tabWidget)
+        self.notePath = notePath
+
+        self.infoLabel = QLabel("Versions of " + notefiles.noteName(notePath), self)
+        self.restoreButton = QPushButton("Restore", self)
+        self.restoreButton.setEnabled(False)
+        self.restoreButton.clicked.connect(self.restoreSelected)
+
+        self.versionList = QListWidget(self)
+        self.versionList.setMaximumWidth(220)
+        self.versionList.currentItemChanged.connect(self.showVersion)
+        self.preview = QtWidgets.QTextEdit(self)
+        self.preview.setReadOnly(True)
+        self.preview.setUndoRedoEnabled(False)
+
+        self.header = QHBoxLayout()
+        self.header.setContentsMargins(4, 2, 4, 2)
+        self.header.addWidget(self.infoLabel, 1)
+        self.header.addWidget(self.restoreButton)
+        self.body = QHBoxLayout()
+        self.body.addWidget(self.versionList)
+        self.body.addWidget(self.preview, 1)
+
+        self.verticalLayout = QVBoxLayout(self)
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout.setSpacing(0)
+        self.verticalLayout.addLayout(self.header)
+        self.verticalLayout.addLayout(self.body)
+        self.refresh()
+
+    def refresh(self):
+        self.versionList.clear()
+        for versionId, when, size in self.tabWidget.history.versions(self.notePath):
+            text = '%s  (%s)' % (time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(when)), formatSize(size))
+            item = QListWidgetItem(text)
+            item.setData(Qt.UserRole, versionId)
+            self.versionList.addItem(item)
+
+    def showVersion(self, item):
+        self.restoreButton.setEnabled(item is not None)
+        self.preview.clear()
+        if item is not None:
+            replaceNote(self.preview, self.notePath, self.tabWidget.history.read(item.data(Qt.UserRole)))
+
+    def restoreSelected(self):
+        item = self.versionList.currentItem()
+        if item is not None and self.tabWidget.restoreVersion(self.notePath, item.data(Qt.UserRole)):
+            self.tabWidget.autoSaver.waitForDone()
+            self.refresh()
+
+    # the toolbar actions get an empty, read only editor to work on
+    @property
+    def plainTextEdit(self):
+        if self.editor is None:
+            self.editor = TabPlainTextEdit(self)
+            self.editor.setReadOnly(True)
+            self.editor.hide()
+        return self.editor
+
+
+# the (encoded line, decoded block) pairs of a note, given as the data of a
+# note in the note format or as the path of a note in any format
+def noteBlocks(note):
+    if isinstance(note, bytes):
+        for line in noteformat.readLines(io.BytesIO(note)):
+            yield line, noteformat.decodeBlock(line)
+        return
+    with storeFor(note).open(note) as raw, notefiles.reader(raw, note) as file:
+        if noteformat.isNotePath(note):
+            for line in noteformat.readLines(file):
+                yield line, noteformat.decodeBlock(line)
+        else:
+            for text in file.read().decode('utf-8').split('\n'):
+                yield None, {'text': text}
+
+
+# A note laid out in pages for a paint device (a QPrinter or QPdfWriter),
+# painting its pages doesn't lay anything out again. The note goes into a
+# document of its own EXPORT_BATCH_BLOCKS blocks at a time, and the document
+# is laid out after each batch. Laying out only what was just added keeps
+# every call into Qt short, which matters on a PrintJob thread: PyQt holds the
+# GIL for as long as a call takes, and the GUI thread waits for it meanwhile.
+class PageLayout(object):
+    def __init__(self, device):
+        self.document = QtGui.QTextDocument()
+        self.document.setUndoRedoEnabled(False)
+        self.document.documentLayout().setPaintDevice(device)
+        self.document.setPageSize(QtCore.QSizeF(device.width(), device.height()))
+        self.builder = NoteBuilder(self.document)
+        self.pages = 0
+
+    # what a layout of document for device is cached under
+    @staticmethod
+    def key(document, device):
+        return (document, document.revision(), device.resolution(), device.width(), device.height())
+
+    # adds the blocks from noteBlocks(), False if stopped() said to stop first
+    def addBlocks(self, blocks, stopped=lambda: False):
+        blocks = iter(blocks)
+        while True:
+            batch = list(itertools.islice(blocks, EXPORT_BATCH_BLOCKS))
+            if not batch:
+                return True
+            if stopped():
+                return False
+            self.builder.insertBlocks(batch)
+            self.pages = self.document.pageCount()
+
+    def paint(self, painter, page):
+        size = self.document.pageSize()
+        painter.save()
+        painter.translate(0, -page * size.height())
+        self.document.drawContents(painter, QtCore.QRectF(0, page * size.height(), size.width(), size.height()))
+        painter.restore()
+
+    # every page onto device, which the layout was made for
+    def print_(self, device):
+        painter = QtGui.QPainter(device)
+        for page in range(self.pages):
+            if page:
+                device.newPage()
+            self.paint(painter, page)
+        painter.end()
+
+
+# Lays out and paints notes on a thread of its own. Notes are given as
+# (name, note) with the note as noteBlocks() takes it: the data of an open
+# note (see NotesTabWidget.noteToPrint) or the path of one, which is read on
+# the job's thread. Depending on what is set before start() the pages go to
+#
+#   printer    a QPrinter, all notes one after the other
+#   pdfPath    one PDF with all notes
+#   pdfFolder  a PDF per note, named after it
+#
+# With none of them the notes are only laid out for layoutDevice, and their
+# PageLayouts are left in layouts, moved over to the GUI thread. A job can be
+# stopped with requestInterruption(), which removes the PDFs it started.
+class PrintJob(QtCore.QThread):
+    # percent done and what is being done
+    progress = QtCore.pyqtSignal(int, str)
+
+    def __init__(self, notes, parent=None):
+        super(PrintJob, self).__init__(parent)
+        self.notes = notes
+        self.printer = None
+        self.pdfPath = None
+        self.pdfFolder = None
+        self.layoutDevice = None
+
+        self.layouts = []
+        # PDFs written, and the exception the job stopped on
+        self.written = []
+        self.error = None
+
+    def run(self):
+        try:
+            self.printNotes()
+        except Exception as error:
+            traceback.print_exception(type(error), error, error.__traceback__)
+            self.error = error
+        finally:
+            if self.isInterruptionRequested() or self.error is not None:
+                for path in self.written:
+                    if os.path.exists(path):
+                        os.remove(path)
+                self.written = []
+            for layout in self.layouts:
+                layout.document.moveToThread(app.thread())
+
+    def printNotes(self):
+        device = self.printer or self.layoutDevice
+        painter = None
+        pdfPaths = set()
+        for i, (name, note) in enumerate(self.notes):
+            if self.isInterruptionRequested():
+                break
+            self.progress.emit(i * 100 // len(self.notes), 'Laying out %s' % name)
+
+            # a new PDF for every note, or the first one for all of them
+            if device is None or self.pdfFolder is not None:
+                if painter is not None:
+                    painter.end()
+                    painter = None
+                    sip.delete(device)
+                path = self.pdfPath or self.pdfPathFor(name, pdfPaths)
+                device = self.pdfWriter(path, name)
+                self.written.append(path)
+
+            layout = PageLayout(device)
+            if not layout.addBlocks(noteBlocks(note), self.isInterruptionRequested):
+                break
+            if self.layoutDevice is not None:
+                self.layouts.append(layout)
+                continue
+            for page in range(layout.pages):
+                if self.isInterruptionRequested():
+                    break
+                if painter is None:
+                    painter = QtGui.QPainter(device)
+                else:
+                    device.newPage()
+                layout.paint(painter, page)
+                self.progress.emit((i * layout.pages + page + 1) * 100 // (len(self.notes) * layout.pages),
+                                   'Page %d of %d of %s' % (page + 1, layout.pages, name))
+            sip.delete(layout.document)
+
+        if painter is not None:
+            if self.printer is not None and self.isInterruptionRequested():
+                self.printer.abort()
+            painter.end()
+        if isinstance(device, QtGui.QPdfWriter):
+            sip.delete(device)
+
+    # <name>.pdf in pdfFolder, numbered if a note of the same name came first
+    def pdfPathFor(self, name, taken):
+        path = os.path.join(self.pdfFolder, name + '.pdf')
+        for n in itertools.count(2):
+            if path not in taken:
+                break
+            path = os.path.join(self.pdfFolder, '%s (%d).pdf' % (name, n))
+        taken.add(path)
+        return path
+
+    @staticmethod
+    def pdfWriter(path, title):
+        writer = QtGui.QPdfWriter(path)
+        writer.setTitle(title)
+        writer.setCreator('NotiSimplifi')
+        writer.setResolution(EXPORT_RESOLUTION)
+        writer.setPageSize(QtGui.QPageSize(QtGui.QPageSize.A4))
+        writer.setPageMargins(QtCore.QMarginsF(*[EXPORT_MARGIN_MM] * 4), QtGui.QPageLayout.Millimeter)
+        return writer
+
+
+def formatSize(size):
+    if size >= 1024 * 1024:
+        return '%.1f MB' % (size / (1024 * 1024))
+    if size >= 1024:
+        return '%.1f KB' % (size / 1024)
+    return '%d bytes' % size
+
+
 class NotesTabWidget(QtWidgets.QTabWidget):
+    # the current tab was switched to or from the plain text editor, or
+    # another tab became the current one; True for the plain text editor
+    editingModeChanged = QtCore.pyqtSignal(bool)
+
     def __init__(self, parent=None):
         super(NotesTabWidget, self).__init__(parent)
         self.parent = parent
@@ -194,155 +4055,546 @@ class NotesTabWidget(QtWidgets.QTabWidget):
         self.setObjectName("tabWidget")
 
         self.addTabButton = QtWidgets.QToolButton()
+        self.addTabButton.setObjectName('addTabButton')
         self.addTabButton.setToolTip('Add New Tab')
         self.addTabButton.clicked.connect(lambda: self.add_new_tab())
-        self.addTabButton.setIcon(QtGui.QIcon('resources/plus_icon.png'))
+        self.addTabButton.setIcon(QtGui.QIcon('icons:plus_icon.png'))
         self.addTabButton.setAutoRaise(True)
 
-        self.addTabButton.setStyleSheet("""
-            QToolButton {
-                background-color: #77dd77;
-                border-left: 1px solid black;
-            }
-            QToolButton::hover {
-                background-color: #8be28b;
-            }
-            QToolButton::pressed {
-                background-color: #b4ecb4;
-            }
-            """)
-
         self.setCornerWidget(self.addTabButton, QtCore.Qt.TopRightCorner)
         self.setTabsClosable(True)
         self.setMovable(True)
         self.setDocumentMode(True)
         self.tabCloseRequested.connect(self.close_tab)
         # self.currentChanged.connect(self.setToolBar)
+        self.currentChanged.connect(self.tabShown)
+
+        self.autoSaver = AutoSaver(self)
+        self.tabs = TabRegistry()
+        # PrintJobs that are running, and the PageLayouts print previews keep
+        self.printJobs = []
+        self.pageLayouts = collections.OrderedDict()
+        # whether .md notes are highlighted
+        self.markdownHighlighting = MARKDOWN_HIGHLIGHT
+        self.nameIndex = NoteNameIndex(NOTE_STORE.root, self.tabs, self)
+        # the Session remembering the open tabs, if there is one
+        self.session = None
+        self.tab.tabMoved.connect(self.sessionChanged)
+
+        # notes are (re)indexed for search whenever they are written to disk
+        self.searchIndex = SearchIndex(os.path.join(NOTES_DIR, '.index'), NOTES_DIR)
+        self.autoSaver.writeListeners.append(self.searchIndex.update)
+
+        # and their versions kept, old ones are cleared out in the background
+        os.makedirs(HISTORY_DIR, exist_ok=True)
+        self.history = NoteHistory(os.path.join(HISTORY_DIR, 'history.db'),
+                                   HISTORY_VERSIONS, HISTORY_DAYS, HISTORY_INTERVAL_S)
+        self.autoSaver.history = self.history
+        self.autoSaver.pool.start(self.history.collect)
         self.add_new_tab()
 
+    # tab labels go through these so the tab registry sees every change
+    def addTab(self, widget, label):
+        index = super(NotesTabWidget, self).addTab(widget, label)
+        self.tabs.add(widget, label)
+        self.sessionChanged()
+        return index
+
+    def removeTab(self, index):
+        self.tabs.remove(self.widget(index))
+        super(NotesTabWidget, self).removeTab(index)
+        self.nameIndex.labelFreed()
+        self.sessionChanged()
+
+    def setTabText(self, index, label):
+        self.tabs.rename(self.widget(index), label)
+        super(NotesTabWidget, self).setTabText(index, label)
+        self.nameIndex.labelFreed()
+        self.sessionChanged()
+
+    # the file a tab is saved to or was opened from, by which openFileUsingPath
+    # finds it again
+    def setTabPath(self, tab, path):
+        self.tabs.setPath(tab, path)
+        self.setTabToolTip(self.indexOf(tab), path)
+        self.updateHighlighter(tab)
+
+    def sessionChanged(self, *args):
+        if self.session is not None:
+            self.session.changed()
+
+    # an empty new tab nobody has typed in yet
+    def isPristine(self, tab):
+        if isinstance(tab, (ViewerTab, HistoryTab)) or tab.filePath or tab.sourcePath or tab.pendingBuffer:
+            return False
+        return not tab.isMaterialized() or tab.editor.document().isEmpty()
+
     # this prevents duplicate file names so that way we don't overwrite
     # any existing note files
     def get_valid_name(self, label):
         # remove leading and trailing whitespace
-        label = label.strip()
-
-        # create list of all current file names
-        current_tab_names = [self.tabBar().tabText(i)
-                             for i in range(self.count())]
-        saved_file_names = [os.path.basename(
-            name) for name in glob.glob("saved_notes/*.txt")]
-        # combines the two lists above into a single list of unique values
-        used_names = list(set(current_tab_names + saved_file_names))
-
-        taken = True
-        base_name = label
-        num = 1
-        while True:
-            label += '.txt'
-            # This try catch is necessary because {list}.index() will return
-            # a ValueError if a match isn't found. If a ValueError is returned
-            # then we know that a file name is valid and we can break out of
-            # the loop.
-            try:
-                temp = used_names.index(label)
-            except ValueError:
-                break
-
-            # if we get here name is taken
-            label = base_name + str(num)
-            num += 1
-
-        return label
+        return self.nameIndex.allocate(label.strip())
 
-    def add_new_tab(self, label="untitled"):
+    # with current=False the tab is added in the background and its editor
+    # isn't created until the tab is shown
+    def add_new_tab(self, label="untitled", current=True):
         # self.setUpdatesEnabled(False)
-        self.tab = QtWidgets.QWidget()
-        sizePolicy = QtWidgets.QSizePolicy(
-            QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.tab.sizePolicy().hasHeightForWidth())
-        self.tab.setSizePolicy(sizePolicy)
-        self.tab.setObjectName("tab")
-        self.tab.setAccessibleName("tab")
-
-        # adding a "save state" to tab
-        # set to 'unsaved' as default
-        self.tab.saveState = False
-
-        self.horizontalLayout_7 = QtWidgets.QHBoxLayout(self.tab)
-        self.horizontalLayout_7.setContentsMargins(0, 0, 0, 0)
-        self.horizontalLayout_7.setObjectName("horizontalLayout_7")
-        self.tab.plainTextEdit = TabPlainTextEdit(self.tab)
-
-        # Connecting save tab function to text changed property on text edit page
-        self.tab.plainTextEdit.textChanged.connect(self.autoSaveTab)
-        self.horizontalLayout_7.addWidget(self.tab.plainTextEdit)
+        tab = NoteTab(self)
 
         # getting valid name (i.e. a name that is not being used in one of
         # the open tabs or an already saved note
 
         # label = self.get_valid_name(label)
-        index = self.addTab(self.tab, label)
+        index = self.addTab(tab, label)
         # self.setUpdatesEnabled(True)
-        self.setCurrentWidget(self.tab)
+        if current:
+            self.setCurrentWidget(tab)
+            self.materialize(tab)
 
         return index
 
+    # builds the editor for a tab and reads its file if it has one
+    def materialize(self, tab):
+        if tab.editor is not None or isinstance(tab, (ViewerTab, HistoryTab)):
+            return
+
+        tab.verticalLayout = QtWidgets.QVBoxLayout(tab)
+        tab.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        tab.verticalLayout.setSpacing(0)
+        tab.verticalLayout.setObjectName("verticalLayout_7")
+        if self.usesPlainEditor(tab):
+            tab.editor = PlainNoteEdit(tab)
+        else:
+            tab.editor = TabPlainTextEdit(tab)
+        # while the document is still empty, so the note is highlighted as it
+        # is read in rather than in one go after
+        self.updateHighlighter(tab)
+
+        if tab.pendingPath is not None:
+            self.loadFile(tab, tab.pendingPath)
+            tab.pendingPath = None
+        elif tab.pendingBuffer is not None:
+            if noteformat.isNotePath(tab.pendingBuffer):
+                tab.serializer = loadNote(tab.editor.document(), tab.pendingBuffer)
+            else:
+                with open(tab.pendingBuffer, 'r', encoding='utf-8') as file:
+                    tab.editor.setPlainText(file.read())
+            tab.bufferRevision = tab.editor.document().revision()
+            tab.pendingBuffer = None
+        if not tab.loading:
+            self.restoreView(tab)
+        tab.editor.undoBudget = UndoBudget(tab.editor)
+        tab.editor.undoBudget.rebuilding.connect(lambda paused: self.pauseTracking(tab, paused))
+        self.connectEditor(tab)
+
+    # An undo budget trim makes edits that leave the document as it was. The
+    # journal and the serializer don't record them, what they have so far
+    # still holds once the trim is done.
+    def pauseTracking(self, tab, paused):
+        for tracker in (tab.journal, tab.serializer):
+            if tracker is not None:
+                tracker.paused = paused
+
+    def connectEditor(self, tab):
+        # Connecting save tab function to text changed property on text edit page
+        tab.editor.textChanged.connect(lambda: self.autoSaveTab(tab))
+        tab.editor.cursorPositionChanged.connect(self.sessionChanged)
+        tab.editor.verticalScrollBar().valueChanged.connect(self.sessionChanged)
+        tab.verticalLayout.addWidget(tab.editor)
+
+    # whether tab is edited in the plain text editor: what the user picked,
+    # otherwise going by the format and size of its note
+    def usesPlainEditor(self, tab):
+        if tab.plainEditing is not None:
+            return tab.plainEditing
+        path = tab.pendingPath or tab.filePath
+        if not path:
+            return False
+        if notefiles.uncompressedName(path).endswith(PLAIN_EDIT_SUFFIXES):
+            return True
+        try:
+            return storeFor(path).size(path) >= PLAIN_EDIT_MIN_BYTES
+        except OSError:
+            return False
+
+    # Starts or stops highlighting tab as Markdown to match its note and the
+    # Highlight Markdown setting. Starting on a note that is already read in
+    # highlights all of it at once, which takes a while on big notes.
+    def updateHighlighter(self, tab):
+        if not tab.isMaterialized() or isinstance(tab, (ViewerTab, HistoryTab)):
+            return
+        path = tab.pendingPath or tab.sourcePath or tab.filePath
+        highlighted = bool(self.markdownHighlighting and path and
+                           notefiles.uncompressedName(path).endswith(MARKDOWN_SUFFIXES))
+        if highlighted and tab.highlighter is None:
+            tab.highlighter = MarkdownHighlighter(tab.editor.document())
+        elif not highlighted and tab.highlighter is not None:
+            tab.highlighter.setDocument(None)
+            tab.highlighter.setParent(None)
+            tab.highlighter = None
+
+    def setMarkdownHighlighting(self, highlighted):
+        self.markdownHighlighting = highlighted
+        for i in range(self.count()):
+            self.updateHighlighter(self.widget(i))
+
+    def setHighlightTheme(self, name):
+        for i in range(self.count()):
+            tab = self.widget(i)
+            if tab.highlighter is not None:
+                tab.highlighter.setTheme(name)
+
+    # Moves tab over to the plain text editor or back. The document goes
+    # along, with its undo history and everything connected to it (journal,
+    # serializer, undo budget); only the layout it has is swapped, which a
+    # document can't have while an editor still shows it.
+    def setPlainEditing(self, tab, plain):
+        if isinstance(tab, (ViewerTab, HistoryTab)) or tab.loading:
+            return False
+        tab.plainEditing = plain
+        if tab.isMaterialized() and isinstance(tab.editor, PlainNoteEdit) != plain:
+            old = tab.editor
+            document = old.document()
+            cursor = old.textCursor()
+            readOnly = old.isReadOnly()
+            budget = old.undoBudget
+            document.setParent(None)
+            budget.setParent(None)
+            tab.verticalLayout.removeWidget(old)
+            sip.delete(old)
+
+            if plain:
+                document.setDocumentLayout(QtWidgets.QPlainTextDocumentLayout(document))
+                tab.editor = PlainNoteEdit(tab)
+            else:
+                # the document makes itself the rich text layout again
+                document.setDocumentLayout(None)
+                tab.editor = TabPlainTextEdit(tab)
+            tab.editor.setDocument(document)
+            document.setParent(tab.editor)
+            tab.editor.setReadOnly(readOnly)
+            budget.setParent(tab.editor)
+            budget.editor = tab.editor
+            tab.editor.undoBudget = budget
+            tab.editor.setTextCursor(cursor)
+            self.connectEditor(tab)
+            tab.editor.ensureCursorVisible()
+            if tab is self.currentWidget():
+                tab.editor.setFocus()
+
+        self.sessionChanged()
+        if tab is self.currentWidget():
+            self.editingModeChanged.emit(plain)
+        return True
+
+    # puts the cursor and scroll bar back where the session left them
+    def restoreView(self, tab):
+        if tab.viewState is None:
+            return
+        position, scroll = tab.viewState
+        tab.viewState = None
+
+        cursor = tab.editor.textCursor()
+        cursor.setPosition(min(position, tab.editor.document().characterCount() - 1))
+        tab.editor.setTextCursor(cursor)
+        restoreScroll(tab.editor, scroll)
+
+    @tracer.traced('io')
+    def loadFile(self, tab, filePath):
+        minBytes = STREAM_LOAD_MIN_BYTES
+        if notefiles.isCompressed(filePath):
+            minBytes = STREAM_LOAD_MIN_COMPRESSED_BYTES
+        if storeFor(filePath).size(filePath) >= minBytes:
+            self.streamFile(tab, filePath)
+            return
+
+        # Setting file to non-editable
+        if self.tabText(self.indexOf(tab)) == 'About':
+            tab.editor.setReadOnly(True)
+
+        if noteformat.isNotePath(filePath):
+            tab.serializer = loadNote(tab.editor.document(), filePath)
+            return
+
+        # write the files text to the new tab's textedit and setting
+        with storeFor(filePath).open(filePath) as raw, notefiles.reader(raw, filePath) as file:
+            text = file.read().decode('utf-8')
+        tab.editor.setText(text)
+
+        # turn auto-save on for all other files
+        if not tab.editor.isReadOnly() and self.journaled(filePath):
+            self.attachJournal(tab, text)
+
+    # Edits to plain text files are journaled. The journal's records can't be
+    # replayed onto a note in the note format, a compressed one or one that
+    # isn't a file of its own, those are written whole instead, which for the
+    # note format only costs encoding the blocks that changed.
+    def journaled(self, filePath):
+        return (not noteformat.isNotePath(filePath) and not notefiles.isCompressed(filePath)
+                and storeFor(filePath).local)
+
+    # big files are appended to the document bit by bit, the tab stays
+    # read only (and isn't autosaved) until the whole file is in
+    def streamFile(self, tab, filePath):
+        document = tab.editor.document()
+        document.setUndoRedoEnabled(False)
+        tab.editor.setReadOnly(True)
+
+        if noteformat.isNotePath(filePath):
+            tab.loader = NoteLoader(document, filePath, self)
+        else:
+            tab.loader = FileLoader(document, filePath, self)
+        tab.loadingBar = LoadingBar(tab)
+        tab.verticalLayout.insertWidget(0, tab.loadingBar)
+
+        tab.loader.progress.connect(tab.loadingBar.progressBar.setValue)
+        tab.loader.finished.connect(lambda ok: self.fileLoaded(tab, ok))
+        tab.loadingBar.cancelButton.clicked.connect(tab.loader.cancel)
+        tab.loader.start()
+
+    def fileLoaded(self, tab, ok):
+        loader = tab.loader
+        tab.loader = None
+        tab.loadingBar.deleteLater()
+        tab.loadingBar = None
+        tab.editor.document().setUndoRedoEnabled(True)
+
+        if ok:
+            self.restoreView(tab)
+            if self.tabText(self.indexOf(tab)) == 'About':
+                return
+            tab.editor.setReadOnly(False)
+            if isinstance(loader, NoteLoader):
+                tab.serializer = NoteSerializer(tab.editor.document(), loader.builder.lines)
+            elif self.journaled(loader.filePath):
+                self.startJournal(tab, loader.crc, loader.length, loader.plain)
+            return
+
+        if loader.error is not None:
+            QMessageBox.warning(self, '', "Could not open '" + loader.filePath + "':\n" + str(loader.error))
+
+        # a partially loaded file must never be saved, so the tab goes away
+        index = self.indexOf(tab)
+        if index != -1:
+            if self.count() < 2:
+                self.add_new_tab()
+            self.removeTab(index)
+
+    def tabShown(self, index):
+        tab = self.widget(index)
+        if tab is not None:
+            self.tab = tab
+            self.materialize(tab)
+            self.editingModeChanged.emit(isinstance(tab.editor, PlainNoteEdit))
+        self.sessionChanged()
+
     def copyText(self):
         self.currentWidget().plainTextEdit.copy()
 
     def pasteText(self):
         self.currentWidget().plainTextEdit.paste()
 
-    # toolbar functions that make the buttons work
+    # Character formatting only touches the current tab: the selection, or
+    # the word under the cursor when nothing is selected. format only carries
+    # the properties to change, everything else about the text is kept. The
+    # change is a single edit block, so it is one undo step and the document
+    # reports it (to the autosave, the journal and the layout) once, at the end.
+    def mergeFormat(self, format):
+        editor = self.richEditor()
+        if editor is None:
+            return
+
+        cursor = editor.textCursor()
+        if not cursor.hasSelection():
+            cursor.select(QtGui.QTextCursor.WordUnderCursor)
+        if cursor.hasSelection():
+            with editBlock(editor, cursor, cursor.selectionEnd() - cursor.selectionStart()):
+                cursor.mergeCharFormat(format)
+
+        # what gets typed next is formatted the same way
+        if not editor.textCursor().hasSelection():
+            editor.mergeCurrentCharFormat(format)
+
+    # the current tab's editor if it takes formatting, that is if it isn't
+    # read only or the plain text editor
+    def richEditor(self):
+        editor = self.currentWidget().plainTextEdit
+        if isinstance(editor, PlainNoteEdit) or editor.isReadOnly():
+            return None
+        return editor
+
+    # toolbar functions that make the buttons work, each one toggles the
+    # format found at the cursor
+    @tracer.traced('slot')
     def setItalic(self):
-        italic = self.currentWidget().plainTextEdit.fontItalic()
-        for i in range(self.count()):
-            if italic:
-                self.widget(i).plainTextEdit.setFontItalic(False)
-            else:
-                self.widget(i).plainTextEdit.setFontItalic(True)
+        editor = self.richEditor()
+        if editor is None:
+            return
+        format = QtGui.QTextCharFormat()
+        format.setFontItalic(not editor.fontItalic())
+        self.mergeFormat(format)
 
+    @tracer.traced('slot')
     def setBold(self):
-        # get current text edit font weight
-        weight = self.currentWidget().plainTextEdit.fontWeight()
-
-        # set weight for all tabs
-        for i in range(self.count()):
-            if weight == QtGui.QFont.Bold:
-                self.widget(i).plainTextEdit.setFontWeight(QtGui.QFont.Normal)
-            else:
-                self.widget(i).plainTextEdit.setFontWeight(QtGui.QFont.Bold)
+        editor = self.richEditor()
+        if editor is None:
+            return
+        format = QtGui.QTextCharFormat()
+        if editor.fontWeight() == QtGui.QFont.Bold:
+            format.setFontWeight(QtGui.QFont.Normal)
+        else:
+            format.setFontWeight(QtGui.QFont.Bold)
+        self.mergeFormat(format)
 
+    @tracer.traced('slot')
     def setUnderline(self):
-        underline = self.currentWidget().plainTextEdit.fontUnderline()
-        for i in range(self.count()):
-            if underline:
-                self.widget(i).plainTextEdit.setFontUnderline(False)
-            else:
-                self.widget(i).plainTextEdit.setFontUnderline(True)
+        editor = self.richEditor()
+        if editor is None:
+            return
+        format = QtGui.QTextCharFormat()
+        format.setFontUnderline(not editor.fontUnderline())
+        self.mergeFormat(format)
 
+    @tracer.traced('slot')
     def setStrikethrough(self):
-        textEdit = self.currentWidget().plainTextEdit
-        format = textEdit.currentCharFormat()
-        format.setFontStrikeOut(not format.fontStrikeOut())
-        textEdit.setCurrentCharFormat(format)
-
+        editor = self.richEditor()
+        if editor is None:
+            return
+        format = QtGui.QTextCharFormat()
+        format.setFontStrikeOut(not editor.currentCharFormat().fontStrikeOut())
+        self.mergeFormat(format)
+
+    # (name, the note as note format data) of tab for a PrintJob, which can
+    # lay it out while the tab goes on being edited. A tab that was saved in
+    # the note format has a serializer, which only encodes the blocks that
+    # changed since.
+    def noteToPrint(self, tab):
+        serializer = tab.serializer
+        if serializer is None:
+            serializer = NoteSerializer(tab.plainTextEdit.document())
+            serializer.detach()
+        return self.tabText(self.indexOf(tab)), serializer.serialize()
+
+    # Runs job with a progress dialog that can cancel it, and calls done(job)
+    # once it got through. The dialog doesn't block the window, the job has
+    # copies of the notes it prints.
+    def startPrintJob(self, job, title, done=None):
+        progress = QtWidgets.QProgressDialog(title, 'Cancel', 0, 100, self)
+        progress.setWindowTitle(title)
+        progress.setMinimumDuration(500)
+        progress.setValue(0)
+        progress.canceled.connect(job.requestInterruption)
+
+        def showProgress(value, text):
+            progress.setLabelText(text)
+            progress.setValue(value)
+
+        def finished():
+            self.printJobs.remove(job)
+            # closing the dialog counts as cancelling it
+            progress.canceled.disconnect()
+            progress.close()
+            progress.deleteLater()
+            if job.error is not None:
+                QMessageBox.warning(self, title, "Could not finish:\n" + str(job.error))
+            elif done is not None and not job.isInterruptionRequested():
+                done(job)
+            job.deleteLater()
+
+        job.progress.connect(showProgress)
+        job.finished.connect(finished)
+        self.printJobs.append(job)
+        job.start()
+        return job
+
+    # stops the print jobs that are still going, before the app quits
+    def stopPrintJobs(self):
+        for job in self.printJobs:
+            job.requestInterruption()
+        for job in self.printJobs:
+            job.wait()
+
+    # print support is imported on first use, it's slow to load and most
+    # sessions never print
     def printNote(self):
+        from PyQt5.QtPrintSupport import QPrintDialog, QPrinter
         printer = QPrinter(QPrinter.HighResolution)
         printerDialog = QPrintDialog(printer, self)
         if printerDialog.exec_() == QPrintDialog.Accepted:
-            self.currentWidget().plainTextEdit.print_(printer)
+            job = PrintJob([self.noteToPrint(self.currentWidget())], self)
+            job.printer = printer
+            self.startPrintJob(job, 'Printing')
 
+    # The note is laid out in the background first, the preview only paints
+    # the pages. The layouts of the last few page setups are kept, so the
+    # preview doesn't lay the note out again when it goes back to one.
     def printPreview(self):
+        from PyQt5.QtPrintSupport import QPrinter
         printer = QPrinter(QPrinter.HighResolution)
+        tab = self.currentWidget()
+        document = tab.plainTextEdit.document()
+        key = PageLayout.key(document, printer)
+        if key in self.pageLayouts:
+            self.showPrintPreview(printer, tab)
+            return
+
+        def laidOut(job):
+            self.cacheLayout(key, job.layouts[0])
+            self.showPrintPreview(printer, tab)
+
+        job = PrintJob([self.noteToPrint(tab)], self)
+        job.layoutDevice = printer
+        self.startPrintJob(job, 'Print Preview', laidOut)
+
+    def showPrintPreview(self, printer, tab):
+        from PyQt5.QtPrintSupport import QPrintPreviewDialog
         printPreview = QPrintPreviewDialog(printer, self)
-        printPreview.paintRequested.connect(self.printPreviewText)
+        printPreview.paintRequested.connect(lambda printer: self.printPreviewText(printer, tab))
         printPreview.exec_()
 
-    def printPreviewText(self, printer):
-        self.currentWidget().plainTextEdit.print_(printer)
+    # Called by the preview whenever the page setup changed. The preview is
+    # modal, a page setup it had no layout for yet is laid out right here.
+    def printPreviewText(self, printer, tab):
+        key = PageLayout.key(tab.plainTextEdit.document(), printer)
+        layout = self.pageLayouts.get(key)
+        if layout is None:
+            layout = PageLayout(printer)
+            layout.addBlocks(noteBlocks(self.noteToPrint(tab)[1]))
+        self.cacheLayout(key, layout)
+        layout.print_(printer)
+
+    def cacheLayout(self, key, layout):
+        self.pageLayouts.pop(key, None)
+        self.pageLayouts[key] = layout
+        while len(self.pageLayouts) > PAGE_LAYOUT_CACHE:
+            self.pageLayouts.popitem(last=False)
+
+    def exportPdf(self):
+        tab = self.currentWidget()
+        if isinstance(tab, (ViewerTab, HistoryTab)):
+            return
+        name = self.tabText(self.indexOf(tab))
+        path, _filter = QtWidgets.QFileDialog.getSaveFileName(self, 'Export to PDF', name + '.pdf', 'PDF (*.pdf)')
+        if path:
+            job = PrintJob([self.noteToPrint(tab)], self)
+            job.pdfPath = path
+            self.startPrintJob(job, 'Export to PDF')
+
+    # Exports the notes at paths into the PDF pdfPath, or each into a PDF of
+    # its own in pdfFolder. Notes that are open are exported as they are in
+    # their tab, the others are read in by the job.
+    def exportNotes(self, paths, pdfPath=None, pdfFolder=None):
+        notes = []
+        for path in paths:
+            tab = self.tabs.tabForPath(path)
+            if tab is not None and tab.isMaterialized() and not tab.loading:
+                notes.append(self.noteToPrint(tab))
+            else:
+                notes.append((notefiles.noteName(path), path))
+        job = PrintJob(notes, self)
+        job.pdfPath = pdfPath
+        job.pdfFolder = pdfFolder
+        return self.startPrintJob(job, 'Export to PDF')
 
     def undoText(self):
         self.currentWidget().plainTextEdit.undo()
@@ -350,90 +4602,212 @@ class NotesTabWidget(QtWidgets.QTabWidget):
     def redoText(self):
         self.currentWidget().plainTextEdit.redo()
 
+    @tracer.traced('slot')
     def setLeftAlign(self):
-        self.currentWidget().plainTextEdit.setAlignment(Qt.AlignLeft)
+        self.alignText(Qt.AlignLeft)
 
+    @tracer.traced('slot')
     def setRightAlign(self):
-        self.currentWidget().plainTextEdit.setAlignment(Qt.AlignRight)
+        self.alignText(Qt.AlignRight)
 
+    @tracer.traced('slot')
     def setCenterAlign(self):
-        self.currentWidget().plainTextEdit.setAlignment(Qt.AlignCenter)
+        self.alignText(Qt.AlignCenter)
 
+    @tracer.traced('slot')
     def setJustify(self):
-        self.currentWidget().plainTextEdit.setAlignment(Qt.AlignJustify)
-
+        self.alignText(Qt.AlignJustify)
+
+    def alignText(self, alignment):
+        editor = self.richEditor()
+        if editor is not None:
+            editor.setAlignment(alignment)
+
+    # Block operations work on every line the selection touches (or the one
+    # the cursor is in) as one edit block, going from block to block instead
+    # of rebuilding the text. Indentation is text, so it's kept in the saved note.
+    def blockCursor(self):
+        editor = self.currentWidget().plainTextEdit
+        if editor.isReadOnly():
+            return editor, None, []
+        cursor = editor.textCursor()
+        return editor, cursor, selectedBlocks(cursor)
+
+    @tracer.traced('slot')
     def indentRight(self):
-        text = self.currentWidget().plainTextEdit
-
-        cursor = text.textCursor()
-        cursor.clearSelection()
+        editor, cursor, blocks = self.blockCursor()
+        if not blocks:
+            return
 
-        cursor.movePosition(QtGui.QTextCursor.StartOfLine)
-        cursor.movePosition(QtGui.QTextCursor.NextWord, QtGui.QTextCursor.KeepAnchor)
-        newText = '    ' + cursor.selectedText()
-        cursor.insertText(newText)
+        start = blocks[0].position()
+        edit = QtGui.QTextCursor(cursor)
+        with editBlock(editor, edit, cursor.selectionEnd() - start):
+            for block in blocks:
+                edit.setPosition(block.position())
+                edit.insertText(INDENT)
+
+        # a selection starting at the start of a line would otherwise be
+        # pushed past the new indent
+        if cursor.hasSelection() and cursor.selectionStart() == start + len(INDENT):
+            anchor, position = cursor.anchor(), cursor.position()
+            if anchor < position:
+                anchor = start
+            else:
+                position = start
+            cursor.setPosition(anchor)
+            cursor.setPosition(position, QtGui.QTextCursor.KeepAnchor)
+            editor.setTextCursor(cursor)
 
+    # takes away up to one INDENT worth of leading spaces, or a leading tab
+    @tracer.traced('slot')
     def indentLeft(self):
-        text = self.currentWidget().plainTextEdit
-
-        cursor = text.textCursor()
-        cursor.clearSelection()
-
-        cursor.movePosition(QtGui.QTextCursor.StartOfLine)
-        cursor.movePosition(QtGui.QTextCursor.NextWord, QtGui.QTextCursor.KeepAnchor)
-        tmpText = cursor.selectedText()
+        editor, cursor, blocks = self.blockCursor()
+        if not blocks:
+            return
 
-        if tmpText.startswith('    '):
-            newText = tmpText.replace('    ', '', 1)
-            cursor.insertText(newText)
+        document = editor.document()
+        edit = QtGui.QTextCursor(cursor)
+        with editBlock(editor, edit, cursor.selectionEnd() - blocks[0].position()):
+            for block in blocks:
+                position = block.position()
+                end = position + min(len(INDENT), block.length() - 1)
+                if document.characterAt(position) == '\t':
+                    end = position + 1
+                else:
+                    end = next((i for i in range(position, end) if document.characterAt(i) != ' '), end)
+                if end > position:
+                    edit.setPosition(position)
+                    edit.setPosition(end, QtGui.QTextCursor.KeepAnchor)
+                    edit.removeSelectedText()
 
+    @tracer.traced('slot')
     def setSuperscript(self):
-        textEdit = self.currentWidget().plainTextEdit
-        curCharFormat = textEdit.currentCharFormat()
-
-        if curCharFormat.verticalAlignment() == QtGui.QTextCharFormat.AlignSuperScript:
-            curCharFormat.setVerticalAlignment(QtGui.QTextCharFormat.AlignNormal)
-        else:
-            curCharFormat.setVerticalAlignment(QtGui.QTextCharFormat.AlignSuperScript)
-
-        textEdit.setCurrentCharFormat(curCharFormat)
+        self.toggleVerticalAlignment(QtGui.QTextCharFormat.AlignSuperScript)
 
+    @tracer.traced('slot')
     def setSubscript(self):
-        textEdit = self.currentWidget().plainTextEdit
-        curCharFormat = textEdit.currentCharFormat()
+        self.toggleVerticalAlignment(QtGui.QTextCharFormat.AlignSubScript)
 
-        if curCharFormat.verticalAlignment() == QtGui.QTextCharFormat.AlignSubScript:
-            curCharFormat.setVerticalAlignment(QtGui.QTextCharFormat.AlignNormal)
+    def toggleVerticalAlignment(self, alignment):
+        editor = self.richEditor()
+        if editor is None:
+            return
+        format = QtGui.QTextCharFormat()
+        if editor.currentCharFormat().verticalAlignment() == alignment:
+            format.setVerticalAlignment(QtGui.QTextCharFormat.AlignNormal)
         else:
-            curCharFormat.setVerticalAlignment(QtGui.QTextCharFormat.AlignSubScript)
-
-        textEdit.setCurrentCharFormat(curCharFormat)
+            format.setVerticalAlignment(alignment)
+        self.mergeFormat(format)
 
+    @tracer.traced('slot')
     def setBulletList(self):
-        list = QtGui.QTextListFormat()
-        list.setStyle(QtGui.QTextListFormat.ListDisc)
-        self.currentWidget().plainTextEdit.textCursor().insertList(list)
+        self.toggleList(QtGui.QTextListFormat.ListDisc)
 
+    @tracer.traced('slot')
     def setNumberList(self):
-        list = QtGui.QTextListFormat()
-        list.setStyle(QtGui.QTextListFormat.ListDecimal)
-        self.currentWidget().plainTextEdit.textCursor().insertList(list)
+        self.toggleList(QtGui.QTextListFormat.ListDecimal)
+
+    # Lines that are all in lists of this style stop being list items, lists
+    # of another style switch to this one, and otherwise the lines become one
+    # new list.
+    def toggleList(self, style):
+        editor, cursor, blocks = self.blockCursor()
+        if not blocks or isinstance(editor, PlainNoteEdit):
+            return
+
+        lists = [block.textList() for block in blocks]
+        edit = QtGui.QTextCursor(cursor)
+        edit.setPosition(blocks[0].position())
+        edit.setPosition(blocks[-1].position(), QtGui.QTextCursor.KeepAnchor)
+        with editBlock(editor, edit, edit.selectionEnd() - edit.selectionStart()):
+            if all(textList is not None and textList.format().style() == style for textList in lists):
+                # leaving a list adds the list's indent to the line's own,
+                # the line goes back to where it was instead
+                for block, textList in zip(blocks, lists):
+                    indent = block.blockFormat().indent()
+                    textList.remove(block)
+                    format = block.blockFormat()
+                    format.setIndent(indent)
+                    edit.setPosition(block.position())
+                    edit.setBlockFormat(format)
+            elif any(textList is not None for textList in lists):
+                self.setListStyle(lists, style)
+            else:
+                format = QtGui.QTextListFormat()
+                format.setStyle(style)
+                edit.createList(format)
+
+    # changes the style of every list in lists, the whole list and not only
+    # the lines that were selected
+    def setListStyle(self, lists, style):
+        seen = set()
+        for textList in lists:
+            if textList is None or textList.objectIndex() in seen:
+                continue
+            seen.add(textList.objectIndex())
+            format = textList.format()
+            format.setStyle(style)
+            textList.setFormat(format)
 
     def close_tab(self, index):
         # will not close current tab if it's the only tab open
         if self.count() < 2:
             return
+
+        # fold the note's journal back into the note before it goes away
+        tab = self.widget(index)
+        if tab.loading:
+            tab.loader.stop()
+            tab.loader = None
+        if isinstance(tab, ViewerTab):
+            tab.viewer.release()
+        self.autoSaver.flush(tab, compact=True)
+        self.detachJournal(tab)
         self.removeTab(index)
 
-    def autoSaveTab(self):
-        if self.tab.saveState:
-            note_text = self.tab.plainTextEdit.toPlainText()
-            # TODO: change this to {current directory}/saved_notes/{note_name}
-            file_name = 'saved_notes/' + \
-                        self.tabText(self.currentIndex()) + '.txt'
-            with open(file_name, 'w') as note:
-                note.write(note_text)
+    # path a tab's note is saved to
+    def notePath(self, tab):
+        if tab.filePath:
+            return tab.filePath
+        return os.path.join(NOTE_STORE.root, self.tabText(self.indexOf(tab)) + noteformat.SUFFIX)
+
+    # the tab's note in the note format
+    def noteData(self, tab):
+        if tab.serializer is None:
+            tab.serializer = NoteSerializer(tab.plainTextEdit.document())
+        return tab.serializer.serialize()
+
+    # starts journaling the tab's edits against text, the note as it is on disk
+    def attachJournal(self, tab, text):
+        data = text.encode('utf-8')
+        matches = tab.plainTextEdit.toPlainText() == text
+        self.startJournal(tab, zlib.crc32(data), len(data), matches)
+
+    def startJournal(self, tab, baseCrc, baseSize, baseMatches):
+        self.detachJournal(tab, discard=True)
+        tab.journal = NoteJournal(tab.plainTextEdit.document(), self.notePath(tab),
+                                  baseCrc, baseSize, baseMatches)
+
+    def detachJournal(self, tab, discard=False):
+        if tab.journal is not None:
+            tab.journal.detach()
+            if discard:
+                tab.journal.discard()
+            tab.journal = None
+
+    # called on every edit; the actual write is debounced by the AutoSaver
+    @tracer.traced('slot')
+    def autoSaveTab(self, tab=None):
+        if tab is None:
+            tab = self.currentWidget()
+        # an undo budget trim doesn't change what the note holds
+        if tab.editor.undoBudget is not None and tab.editor.undoBudget.trimming:
+            return
+        if tab.saveState and not tab.loading:
+            self.autoSaver.schedule(tab)
+        self.sessionChanged()
 
+    @tracer.traced('slot')
     def saveTab(self, name=" "):
         # if note has not been saved previously
         if not self.tab.saveState:
@@ -442,87 +4816,226 @@ class NotesTabWidget(QtWidgets.QTabWidget):
             # added the checks for false or true to handle when signal fills the name argument
             if name == "" or name == False or name == True:
                 tab_text = self.tabText(self.currentIndex())
-                file_name = 'saved_notes/' + tab_text + '.txt'
+                file_name = os.path.join(NOTE_STORE.root, tab_text + noteformat.SUFFIX)
             else:
                 tab_text = name
-                file_name = 'saved_notes/' + name + '.txt'
+                file_name = os.path.join(NOTE_STORE.root, name + noteformat.SUFFIX)
+
+            data = self.noteData(self.tab)
+            if COMPRESS_NOTES:
+                file_name = notefiles.compressedName(file_name, len(data))
+
+            # the whole note is written below, so any pending autosave is redundant
+            self.autoSaver.cancel(self.tab)
+            self.autoSaver.waitForDone()
+            self.autoSaver.invalidate(file_name)
 
             # TODO: change this to {current directory}/saved_notes/{note_name}
             # this will present user with an error if a note name is already in use
             if not self.validName(tab_text):
-                self.errorDialog = ErrorDialog(self, file_name)
+                # the notes that go by that name, whatever format they were
+                # saved in; the new note takes their place
+                replaced = self.nameIndex.savedPaths(tab_text.strip())
+                self.errorDialog = ErrorDialog(self, replaced[0])
                 if self.errorDialog.exec_():
-                    # close other matching tab if open
-                    current_tab_names = [self.tabBar().tabText(i)
-                                         for i in range(self.count())]
-                    for i in range(self.count()):
-                        if (self.tabBar().tabText(i) == tab_text) and (i != self.currentIndex()):
-                            self.removeTab(i)
-
-                    os.remove(file_name)
-                    with open(file_name, 'w') as note:
-                        note.write(note_text)
+                    for path in replaced:
+                        self.dropReplacedNote(path)
+                    self.autoSaver.waitForDone()
+                    for path in replaced:
+                        if canonicalPath(path) != canonicalPath(file_name):
+                            storeFor(path).remove(path)
+                            self.autoSaver.invalidate(path)
+                            self.nameIndex.noteRemoved(path)
+                            self.searchIndex.remove(path)
+
+                    storeFor(file_name).write(file_name, notefiles.encode(file_name, data))
+                    self.nameIndex.noteSaved(file_name)
+                    self.autoSaver.notifyWritten(file_name, note_text, data)
                     self.tab.saveState = True
+                    self.tab.filePath = file_name
+                    self.setTabPath(self.tab, file_name)
+                    self.detachJournal(self.tab, discard=True)
                     return True
                 else:
                     return False
             else:
-                if name:
-                    f_name = 'saved_notes/' + \
-                             self.tabText(self.currentIndex()) + '.txt'
-                    os.remove(f_name)
-                with open(file_name, 'w') as note:
-                    note.write(note_text)
+                # renaming a note that was saved before removes the old file.
+                # A file opened from outside the notes is left where it is,
+                # the renamed note is a new note next to the others.
+                if name and self.tab.filePath and NOTE_STORE.contains(self.tab.filePath):
+                    f_name = self.tab.filePath
+                    storeFor(f_name).remove(f_name)
+                    self.nameIndex.noteRemoved(f_name)
+                    self.searchIndex.remove(f_name)
+                storeFor(file_name).write(file_name, notefiles.encode(file_name, data))
+                self.nameIndex.noteSaved(file_name)
+                self.autoSaver.notifyWritten(file_name, note_text, data)
                 self.tab.saveState = True
+                self.tab.filePath = file_name
+                self.setTabPath(self.tab, file_name)
+                self.detachJournal(self.tab, discard=True)
                 return True
 
+    # closes the tab showing the note at path, which another note is about to
+    # replace, without saving it first
+    def dropReplacedNote(self, path):
+        other = self.tabs.tabForPath(path)
+        if other is None or other is self.tab:
+            return
+        if other.loading:
+            other.loader.stop()
+            other.loader = None
+        if isinstance(other, ViewerTab):
+            other.viewer.release()
+        self.autoSaver.cancel(other)
+        self.detachJournal(other, discard=True)
+        self.removeTab(self.indexOf(other))
+
     # code from https://pythonprogramming.net/open-files-pyqt-tutorial/
     def openFileFromMenu(self):
-        name, _filter = QtWidgets.QFileDialog.getOpenFileName(self, 'Open File')
+        names, _filter = QtWidgets.QFileDialog.getOpenFileNames(self, 'Open File')
+
+        if names:
+            self.openFiles(names)
+
+    # opens the first file in the current tab, the rest are only read once
+    # their tab is shown
+    def openFiles(self, filePaths):
+        for i, filePath in enumerate(filePaths):
+            self.openFileUsingPath(filePath, lazy=i > 0)
+
+    @tracer.traced('slot')
+    def openFileUsingPath(self, filePath, lazy=False):
+        if not storeFor(filePath).isFile(filePath):
+            raise FileNotFoundError(filePath)
+
+        # check to see if file is already open, files with the same name in
+        # different folders each get their own tab
+        tab = self.tabs.tabForPath(filePath)
+        if tab is not None:
+            index = self.indexOf(tab)
+            if not lazy:
+                self.setCurrentIndex(index)
+            return index if lazy else None
 
-        if name != "":
-            self.openFileUsingPath(name)
+        # strip path and file extension from file name
+        name = notefiles.noteName(filePath)
 
-    def openFileUsingPath(self, filePath):
-        file = open(filePath, 'r')
+        # create new tab for file, the file gets read when it is shown
+        index = self.add_new_tab(name, current=False)
+        tab = self.widget(index)
+        tab.pendingPath = filePath
+        tab.sourcePath = filePath
+        self.setTabPath(tab, filePath)
 
-        # strip path and file extension from file name
-        name = os.path.splitext(os.path.basename(filePath))[0]
+        # turn auto-save on for everything but the About page
+        if name != 'About':
+            tab.filePath = filePath
+            tab.saveState = True
 
-        # check to see if file is already open
-        current_tab_names = [self.tabBar().tabText(i) for i in range(self.count())]
+        if not lazy:
+            self.setCurrentIndex(index)
+            self.materialize(tab)
 
-        inUse = True
-        try:
-            temp = current_tab_names.index(name)
-        except ValueError:
-            # if exception is hit, the file is not in use
-            inUse = False
+        return index
 
-        if inUse:
-            self.setCurrentIndex(temp)
-            return
+    def openViewer(self, filePath):
+        tab = self.tabs.tabForPath(filePath)
+        if tab is not None:
+            index = self.indexOf(tab)
+            self.setCurrentIndex(index)
+            return index
+
+        name = notefiles.noteName(filePath)
+        tab = ViewerTab(self, filePath)
+        index = self.addTab(tab, name)
+        self.setTabPath(tab, filePath)
+        self.setCurrentIndex(index)
+        return index
 
-        # create new tab for file
-        self.add_new_tab()
+    # swaps a viewer tab for a regular editor tab on the same file
+    def openForEditing(self, tab):
+        index = self.indexOf(tab)
+        tab.viewer.release()
+        self.removeTab(index)
 
-        # write the files text to the new tab's textedit and setting
-        with file:
-            text = file.read()
-            self.tabBar().setTabText(self.currentIndex(), name)
-            self.currentWidget().plainTextEdit.setText(text)
+        # the editor tab takes the viewer's place in the tab bar
+        newIndex = self.openFileUsingPath(tab.filePath)
+        if newIndex != index:
+            self.tabBar().moveTab(newIndex, index)
+        return index
 
-        # Setting file to non-editable
-        if self.tabBar().tabText(self.currentIndex()) == 'About':
-            self.currentWidget().plainTextEdit.setReadOnly(True)
-        # turn auto-save on for all other files
+    # the history of the note at path, or of the current tab's note
+    def openHistory(self, path=None, current=True):
+        if not path:
+            tab = self.currentWidget()
+            if isinstance(tab, HistoryTab):
+                return self.currentIndex()
+            path = self.notePath(tab)
+        path = os.path.abspath(path)
+
+        label = notefiles.noteName(path) + ' (history)'
+        for tab in self.tabs.tabsWithLabel(label):
+            if isinstance(tab, HistoryTab) and tab.notePath == path:
+                index = self.indexOf(tab)
+                break
         else:
-            self.currentWidget().saveState = True
+            # whatever is still pending is a version too
+            self.autoSaver.flushAll()
+            self.autoSaver.waitForDone()
+            index = self.addTab(HistoryTab(self, path), label)
+        if current:
+            self.setCurrentIndex(index)
+        return index
+
+    # (label, undo steps, estimated undo bytes, steps dropped) per open tab,
+    # tabs without an editor yet have no history
+    def undoUsage(self):
+        usage = []
+        for index in range(self.count()):
+            tab = self.widget(index)
+            budget = tab.editor.undoBudget if tab.isMaterialized() else None
+            if budget is None:
+                usage.append((self.tabText(index), 0, 0, 0))
+            else:
+                usage.append((self.tabText(index), len(budget.steps), budget.memory(), budget.droppedSteps))
+        return usage
+
+    # Brings back a version of a note. An open note gets the version as an
+    # edit that can be undone (and is autosaved), one that isn't open is
+    # rewritten and opened. What the note held before is recorded first.
+    def restoreVersion(self, path, versionId):
+        data = self.history.read(versionId)
+        tab = self.tabs.tabForPath(path)
+        if tab is not None and (tab.loading or isinstance(tab, ViewerTab)):
+            return False
+
+        if tab is not None and tab.isMaterialized():
+            current = tab.editor.toPlainText().encode('utf-8')
+            if noteformat.isNotePath(path):
+                current = self.noteData(tab)
+            self.autoSaver.pool.start(self.autoSaver.recordVersion, path, current, True)
+            replaceNote(tab.editor, path, data)
+            self.setCurrentWidget(tab)
+            return True
 
-        return self.currentIndex()
+        if tab is not None:
+            self.removeTab(self.indexOf(tab))
+        self.autoSaver.pool.start(self.autoSaver.recordBase, path)
+        self.autoSaver.waitForDone()
+        storeFor(path).write(path, notefiles.encode(path, data))
+        self.autoSaver.invalidate(path)
+        if noteformat.isNotePath(path):
+            text = noteformat.blocksText(io.BytesIO(data))
+        else:
+            text = data.decode('utf-8')
+        self.autoSaver.notifyWritten(path, text, data)
+        self.openFileUsingPath(path)
+        return True
 
+    # new folders and files go into the notes folder, where the tree shows them
     def folderTab(self, folderName=''):
-        path = QDir.currentPath()
+        path = NOTE_STORE.root
 
         if not folderName:
             self.text_name = QLineEdit(self)
@@ -532,15 +5045,20 @@ class NotesTabWidget(QtWidgets.QTabWidget):
             text, result = QInputDialog.getText(self, 'Add Folder', 'Folder Name:')
             if result == True:
                 self.text_name.setText(str(text))
-                os.mkdir(path + '/' + text)
+                NOTE_STORE.makeFolder(os.path.join(path, text))
         
         else:
-            os.mkdir(path + '/' + folderName)
+            NOTE_STORE.makeFolder(os.path.join(path, folderName))
+
+        return NOTE_STORE.isDir(os.path.join(path, folderName))
 
-        return os.path.isdir(folderName)
+    # an empty note, unless there is one already
+    def touchNote(self, path):
+        if not NOTE_STORE.isFile(path):
+            NOTE_STORE.write(path, b'')
 
     def fileTab(self, fileName=''):
-        path = QDir.currentPath()
+        path = NOTE_STORE.root
 
         if not fileName:
             self.text_name = QLineEdit(self)
@@ -551,7 +5069,7 @@ class NotesTabWidget(QtWidgets.QTabWidget):
             if result == True:
                 self.text_name.setText(str(text))
                 self.add_new_tab()
-                os.system('touch ' + path + '/' + text + '.txt')
+                self.touchNote(os.path.join(path, text + noteformat.SUFFIX))
 
                 index = self.currentIndex()
                 nameChange = self.savedTabNameChange(text)
@@ -559,9 +5077,9 @@ class NotesTabWidget(QtWidgets.QTabWidget):
                     self.setTabText(index, text)
         
         else:
-            os.system('touch ' + path + '/' + fileName + '.txt')
+            self.touchNote(os.path.join(path, fileName + noteformat.SUFFIX))
 
-        return os.path.isfile(fileName)
+        return NOTE_STORE.isFile(os.path.join(path, fileName + noteformat.SUFFIX))
 
     def savedTabNameChange(self, newName):
         if self.tab.saveState == False:
@@ -578,28 +5096,32 @@ class NotesTabWidget(QtWidgets.QTabWidget):
 
     def validName(self, label):
         # remove leading and trailing whitespace
-        label = label.strip() + '.txt'
-
-        # create list of all saved notes
         # TODO: change this to check for duplicates in current directory specified by tree
         # once tree has been implemented
-        namesInUse = [os.path.basename(name)
-                      for name in glob.glob("saved_notes/*.txt")]
-
-        notInUse = False
-        # label += '.txt'
-        try:
-            temp = namesInUse.index(label)
-        except ValueError:
-            notInUse = True
-
-        return notInUse
+        return not self.nameIndex.isSaved(label.strip())
 
     def menubar_newtab(self):
         self.add_new_tab()
 
     # Function to exit out of application
+    # Writes every saved note's pending edits to disk and folds its journal
+    # back in. Runs when the app quits, however that happens.
+    def saveAll(self):
+        for i in range(self.count()):
+            self.autoSaver.flush(self.widget(i), compact=True)
+        self.autoSaver.waitForDone()
+        self.searchIndex.flush()
+
     def exit_app(self):
+        # make sure pending autosaves hit the disk before quitting
+        self.saveAll()
+
+        # unsaved notes are kept in the session, there is nothing to ask
+        if self.session is not None:
+            self.session.saveNow()
+            qApp.quit()
+            return True
+
         # additional check to make sure you save before you exit
         # if not already saved, it asks you if you want to save
         if self.tab.saveState == True:
@@ -661,14 +5183,323 @@ class ErrorDialog(QtWidgets.QDialog):
         self.setLayout(self.layout)
 
 
+# How much memory the undo history of each open tab takes, against the
+# budget every tab gets. Kept up to date while it is open.
+class UndoMemoryDialog(QtWidgets.QDialog):
+    def __init__(self, tabWidget, parent=None):
+        super(UndoMemoryDialog, self).__init__(parent)
+        self.tabWidget = tabWidget
+        self.setWindowTitle('Undo Memory')
+
+        self.table = QtWidgets.QTableWidget(0, 4, self)
+        self.table.setHorizontalHeaderLabels(['Tab', 'Undo steps', 'Memory', 'Dropped steps'])
+        self.table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.table.verticalHeader().hide()
+        self.table.horizontalHeader().setSectionResizeMode(0, QtWidgets.QHeaderView.Stretch)
+        self.totalLabel = QLabel(self)
+
+        self.layout = QVBoxLayout(self)
+        self.layout.addWidget(self.table)
+        self.layout.addWidget(self.totalLabel)
+        self.resize(520, 300)
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+        self.timer.start(1000)
+        self.refresh()
+
+    def refresh(self):
+        usage = self.tabWidget.undoUsage()
+        self.table.setRowCount(len(usage))
+        for row, (label, steps, size, dropped) in enumerate(usage):
+            for column, value in enumerate((label, str(steps), formatSize(size), str(dropped))):
+                self.table.setItem(row, column, QTableWidgetItem(value))
+        self.totalLabel.setText('%s in all, each tab keeps up to %s or %d steps' % (
+            formatSize(sum(entry[2] for entry in usage)), formatSize(UNDO_MAX_BYTES), UNDO_MAX_STEPS))
+
+
+# Search box and ranked results for the notes' contents. Words have to all
+# appear in a note for it to match, "quoted text" has to appear as a phrase.
+class SearchPanel(QtWidgets.QWidget):
+    def __init__(self, tabWidget, parent=None):
+        super(SearchPanel, self).__init__(parent)
+        self.tabWidget = tabWidget
+
+        self.searchBox = QLineEdit(self)
+        self.searchBox.setPlaceholderText('Search notes')
+        self.searchBox.setClearButtonEnabled(True)
+
+        self.results = QListWidget(self)
+        self.results.itemActivated.connect(self.openResult)
+
+        # search once typing pauses instead of on every keystroke
+        self.searchTimer = QTimer(self)
+        self.searchTimer.setSingleShot(True)
+        self.searchTimer.setInterval(150)
+        self.searchTimer.timeout.connect(self.runSearch)
+        self.searchBox.textChanged.connect(lambda text: self.searchTimer.start())
+        self.searchBox.returnPressed.connect(self.runSearch)
+
+        self.layout = QVBoxLayout(self)
+        self.layout.setContentsMargins(0, 0, 0, 0)
+        self.layout.addWidget(self.searchBox)
+        self.layout.addWidget(self.results)
+
+    def runSearch(self):
+        self.searchTimer.stop()
+        self.results.clear()
+
+        query = self.searchBox.text().strip()
+        if not query:
+            return
+
+        for score, path in self.tabWidget.searchIndex.search(query):
+            item = QListWidgetItem(notefiles.noteName(path))
+            item.setToolTip(path)
+            item.setData(Qt.UserRole, path)
+            self.results.addItem(item)
+
+    def openResult(self, item):
+        path = item.data(Qt.UserRole)
+        if storeFor(path).isFile(path):
+            self.tabWidget.openFileUsingPath(path)
+
+
+# whether name is a note the tree shows, compressed or not
+def isNoteFile(name):
+    return notefiles.uncompressedName(name).endswith(NOTE_SUFFIXES)
+
+
+# runs on the tree's worker thread. Only folders and notes are kept, hidden
+# entries (.journal, .session, ...) are skipped. The folder is listed through
+# the note store it is in, which says which entries are folders.
+def listNotes(path):
+    folders = []
+    notes = []
+    try:
+        for name, isDir in storeFor(path).list(path):
+            if name.startswith('.'):
+                continue
+            if isDir:
+                folders.append(name)
+            elif isNoteFile(name):
+                notes.append(name)
+    except OSError:
+        pass
+    folders.sort(key=str.casefold)
+    notes.sort(key=str.casefold)
+    return [(name, True) for name in folders] + [(name, False) for name in notes]
+
+
+# every note in the folder at path and in the folders in it, in tree order
+def notesIn(path):
+    notes = []
+    for name, isDir in listNotes(path):
+        if isDir:
+            notes.extend(notesIn(os.path.join(path, name)))
+        else:
+            notes.append(os.path.join(path, name))
+    return notes
+
+
+# Model for the notes tree. A folder is only listed once it is expanded, on a
+# background thread, and its rows are added TREE_BATCH_ROWS at a time so even
+# a folder with tens of thousands of notes never blocks the window for long.
+# Only the listed folders are watched, and their changes are applied at most
+# every TREE_REFRESH_MS.
+#
+# The rows are plain QStandardItems: the view asks the model about every row
+# each time it lays out a folder, and those calls stay in C++ this way.
+class NotesTreeModel(QtGui.QStandardItemModel):
+    # emitted from the worker thread with the listNotes() of a folder
+    listed = QtCore.pyqtSignal(str, object)
+    # emitted by a store that isn't local, from whichever thread changed it
+    storeChanged = QtCore.pyqtSignal(str)
+    # set on the items of folders
+    FolderRole = Qt.UserRole
+    # the file name of compressed notes, which are shown under the name
+    # they'd have uncompressed
+    FileNameRole = Qt.UserRole + 1
+
+    def __init__(self, rootPath=NOTES_DIR, parent=None):
+        super(NotesTreeModel, self).__init__(parent)
+        self.setHorizontalHeaderLabels(['Name'])
+        self.rootPath = os.path.abspath(rootPath)
+        self.store = storeFor(rootPath)
+
+        # folders that have been (or are being) listed, by path
+        self.folders = {self.rootPath: self.invisibleRootItem()}
+        # path -> (name, isDir) of the rows added so far, None while it is listed
+        self.entries = {self.rootPath: None}
+        # (path, entries) still being added to the model
+        self.pending = collections.deque()
+
+        self.folderIcon = iconRegistry.icon('icons:potential_icons/icons5/png/folder.png')
+        self.noteIcon = iconRegistry.icon('icons:potential_icons/icons5/png/document.png')
+
+        self.worker = BackgroundWorker('notes-tree')
+        self.listed.connect(self.folderListed)
+
+        self.insertTimer = QTimer(self)
+        self.insertTimer.setInterval(0)
+        self.insertTimer.timeout.connect(self.insertBatch)
+
+        # folders that changed on disk since the last refresh
+        self.changed = set()
+        self.refreshTimer = QTimer(self)
+        self.refreshTimer.setSingleShot(True)
+        self.refreshTimer.setInterval(TREE_REFRESH_MS)
+        self.refreshTimer.timeout.connect(self.refresh)
+
+        # the folders of a store that isn't local can't be watched, it says
+        # what changed itself
+        self.watcher = QtCore.QFileSystemWatcher(self)
+        self.watcher.directoryChanged.connect(self.folderChanged)
+        if not self.store.local:
+            self.storeChanged.connect(self.folderChanged)
+            self.store.addListener(self.storeFolderChanged)
+
+        self.worker.start(self.listFolder, self.rootPath)
+
+    # folders get an empty child so the view shows them as expandable, it is
+    # replaced by their notes once they have been listed
+    def makeItem(self, name, isDir):
+        if not isDir:
+            item = QtGui.QStandardItem(self.noteIcon, notefiles.uncompressedName(name))
+            if notefiles.isCompressed(name):
+                item.setData(name, self.FileNameRole)
+            return item
+        item = QtGui.QStandardItem(self.folderIcon, name)
+        item.setData(True, self.FolderRole)
+        item.appendRow(QtGui.QStandardItem())
+        return item
+
+    def filePath(self, index):
+        names = []
+        while index.isValid():
+            names.append(index.data(self.FileNameRole) or index.data())
+            index = index.parent()
+        return os.path.join(self.rootPath, *reversed(names))
+
+    def isDir(self, index):
+        return not index.isValid() or bool(index.data(self.FolderRole))
+
+    def canFetchMore(self, parent):
+        return self.isDir(parent) and self.filePath(parent) not in self.folders
+
+    def fetchMore(self, parent):
+        path = self.filePath(parent)
+        self.folders[path] = self.itemFromIndex(parent)
+        self.entries[path] = None
+        self.worker.start(self.listFolder, path)
+
+    # runs on the worker thread
+    def listFolder(self, path):
+        self.listed.emit(path, listNotes(path))
+
+    def isListing(self):
+        return None in self.entries.values() or bool(self.pending)
+
+    def folderListed(self, path, entries):
+        if path not in self.folders:
+            return
+
+        if self.entries[path] is None:
+            item = self.folders[path]
+            if item is not self.invisibleRootItem():
+                item.removeRow(0)
+            self.entries[path] = []
+            if self.store.local:
+                self.watcher.addPath(path)
+            if entries:
+                self.pending.append((path, entries))
+                self.insertTimer.start()
+        elif any(pendingPath == path for pendingPath, _entries in self.pending):
+            # still being filled in, look again once that is done
+            self.folderChanged(path)
+        else:
+            self.update(path, entries)
+
+    def insertBatch(self):
+        path, entries = self.pending[0]
+        added = self.entries.get(path)
+        if added is not None:
+            batch = entries[len(added):len(added) + TREE_BATCH_ROWS]
+            self.folders[path].appendRows([self.makeItem(name, isDir) for name, isDir in batch])
+            added.extend(batch)
+
+        if added is None or len(added) == len(entries):
+            self.pending.popleft()
+            if not self.pending:
+                self.insertTimer.stop()
+
+    # brings a listed folder in line with a new listing of it. Both are sorted
+    # the same way, so the rows that stay keep their order.
+    def update(self, path, entries):
+        item = self.folders[path]
+        rows = self.entries[path]
+        keep = set(entries)
+
+        last = len(rows) - 1
+        while last >= 0:
+            if rows[last] in keep:
+                last -= 1
+                continue
+            first = last
+            while first > 0 and rows[first - 1] not in keep:
+                first -= 1
+            for name, isDir in rows[first:last + 1]:
+                if isDir:
+                    self.forget(os.path.join(path, name))
+            item.removeRows(first, last - first + 1)
+            del rows[first:last + 1]
+            last = first - 1
+
+        row = 0
+        while row < len(entries):
+            if row < len(rows) and rows[row] == entries[row]:
+                row += 1
+                continue
+            # entries up to the next row that is already there are new
+            end = row
+            while end < len(entries) and not (row < len(rows) and rows[row] == entries[end]):
+                end += 1
+            item.insertRows(row, [self.makeItem(name, isDir) for name, isDir in entries[row:end]])
+            rows[row:row] = entries[row:end]
+            row = end
+
+    # called by the store
+    def storeFolderChanged(self, path):
+        self.storeChanged.emit(os.path.abspath(path))
+
+    # stops watching a folder that is gone from the model, and everything in it
+    def forget(self, path):
+        if path not in self.folders:
+            return
+        del self.folders[path]
+        for name, isDir in self.entries.pop(path) or ():
+            if isDir:
+                self.forget(os.path.join(path, name))
+        if self.store.local:
+            self.watcher.removePath(path)
+
+    # a burst of changes is picked up by a single refresh
+    def folderChanged(self, path):
+        self.changed.add(path)
+        if not self.refreshTimer.isActive():
+            self.refreshTimer.start()
+
+    def refresh(self):
+        for path in self.changed:
+            if self.entries.get(path) is not None:
+                self.worker.start(self.listFolder, path)
+        self.changed.clear()
+
+
 class TreeHeader(QtWidgets.QHeaderView):
     def __init__(self, orientation, parent=None):
         super(TreeHeader, self).__init__(orientation, parent)
-
-        self.setStyleSheet("""
-            background-color: #77dd77;
-            color: white;
-        """)
+        self.setObjectName('treeHeader')
         self.setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
         self.setDefaultSectionSize(198)
 
@@ -678,14 +5509,17 @@ class Ui_MainWindow(object):
     
         
 
-    def setupUi(self, MainWindow):
+    # with deferSetup=True the caller has to run finishSetup() itself, once
+    # the window has been shown
+    def setupUi(self, MainWindow, deferSetup=False):
+        # toolbar actions start out without icons, see deferIcon()
+        self.deferredIcons = []
+
         MainWindow.setObjectName("MainWindow")
         MainWindow.resize(747, 601)
 
-        MainWindow.setStyleSheet("""
-            background: #171e24;
-            color: white;
-        """)
+        # all of the window's styling comes from the application wide theme
+        themeManager.apply(themeManager.current)
 
         self.centralwidget = QtWidgets.QWidget(MainWindow)
 
@@ -724,69 +5558,43 @@ class Ui_MainWindow(object):
         '''self.setWindowTitle(self.title)
         self.setGeometry(self.left, self.top, self.width, self.height)'''
 
-        # path = '/saved_notes'
-        self.model = QFileSystemModel()
-        # print(QDir.setPath(path))
-        self.model.setRootPath(QDir.currentPath())
+        # the model is only set in populateTree(), scanning the directory can
+        # wait until the window is up
+        self.model = None
         self.tree = QTreeView()
-
-        self.tree.setModel(self.model)
-        self.tree.setRootIndex(self.model.index(QDir.currentPath()))
         self.tree.setGeometry(QtCore.QRect(0, 0, 201, 481))
 
         self.tree.setAnimated(False)
         self.tree.setIndentation(20)
-        self.tree.setSortingEnabled(True)
+        # every row is one line high, the view doesn't have to measure them
+        self.tree.setUniformRowHeights(True)
+        # double clicking opens a note rather than renaming it
+        self.tree.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
 
         # connect double click signal to open file
         self.tree.doubleClicked.connect(self.treeDblClicked)
 
+        # notes (and folders of them) picked in the tree can be exported
+        # together from its context menu
+        self.tree.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+        self.tree.setContextMenuPolicy(Qt.ActionsContextMenu)
+        self.actionExportSelected = QtWidgets.QAction('Export to PDF...', self.tree)
+        self.actionExportSelected.triggered.connect(lambda checked: self.exportSelected(each=False))
+        self.tree.addAction(self.actionExportSelected)
+        self.actionExportEach = QtWidgets.QAction('Export Each to PDF...', self.tree)
+        self.actionExportEach.triggered.connect(lambda checked: self.exportSelected(each=True))
+        self.tree.addAction(self.actionExportEach)
+
         self.tree.setWindowTitle("Dir View")
 
         self.treeHeader = TreeHeader(QtCore.Qt.Horizontal)
         self.treeHeader.setMinimumWidth(self.tree.width())
         self.tree.setHeader(self.treeHeader)
 
-        # https://stackoverflow.com/questions/58937754/hide-size-type-and-date-modified-columns-in-qfilesystemmodel
-        for i in range(1, self.tree.model().columnCount()):
-            self.tree.header().hideSection(i)
-
         # adding custom header
         self.verticalLayout_3.addWidget(self.tree)
 
-        #b4ecb4
-        self.tree.setStyleSheet("""
-            QTreeView::branch:has-siblings:!adjoins-item {
-                border-image: url(resources/tree_icons/vline-lightgreen.png) 0;
-            }
 
-            QTreeView::branch:has-siblings:adjoins-item {
-                border-image: url(resources/tree_icons/branch-more-lightgreen.png) 0;
-            }
-            
-            QTreeView::branch:!has-children:!has-siblings:adjoins-item {
-                border-image: url(resources/tree_icons/branch-end-lightgreen.png) 0;
-            }
-            
-            QTreeView::branch:has-children:!has-siblings:closed,
-            QTreeView::branch:closed:has-children:has-siblings {
-                border-image: none;
-                image: url(resources/tree_icons/right-arrow.png);
-            }
-            
-            QTreeView::branch:open:has-children:!has-siblings,
-            QTreeView::branch:open:has-children:has-siblings  {
-                border-image: none;
-                image: url(resources/tree_icons/down-arrow.png);
-            }
-        """)
-        # image: url(resources/tree_icons/branch-open.png);
-
-
-        self.Tags.setStyleSheet("""
-            background-color: #282f39;
-            color: white;
-        """)
 
         self.horizontalLayout_3.addWidget(self.Tags)
         self.Notes = QtWidgets.QFrame(self.Notes_Tags)
@@ -805,18 +5613,24 @@ class Ui_MainWindow(object):
         sizePolicy.setVerticalStretch(0)
         self.Notes.setSizePolicy(sizePolicy)
 
-        self.Notes.setStyleSheet("""
-            background: #282f39;
-            color: white;
-            border: none;
-        """)
-
         self.tabWidget = NotesTabWidget(self.Notes)
 
         # self.horizontalLayout_6.addLayout(self.tabWidgetHorizontalLayout)
         self.horizontalLayout_6.addWidget(self.tabWidget)
         self.horizontalLayout_3.addWidget(self.Notes)
 
+        # search dock, docked next to the tree and hidden until it's toggled
+        # from the Edit menu
+        self.searchPanel = SearchPanel(self.tabWidget)
+        self.searchDock = QtWidgets.QDockWidget(MainWindow)
+        self.searchDock.setObjectName("searchDock")
+        self.searchDock.setWidget(self.searchPanel)
+        MainWindow.addDockWidget(Qt.LeftDockWidgetArea, self.searchDock)
+        self.searchDock.hide()
+        self.actionSearch = self.searchDock.toggleViewAction()
+        self.actionSearch.setObjectName("actionSearch")
+        self.actionSearch.triggered.connect(lambda checked: checked and self.searchPanel.searchBox.setFocus())
+
         # self.horizontalLayout_9.addLayout(self.verticalLayout)
         # self.horizontalLayout_3.addWidget(self.Tools, 0, QtCore.Qt.AlignTop)
         self.Menu_Notes_Tags.addWidget(self.Notes_Tags)
@@ -848,27 +5662,11 @@ class Ui_MainWindow(object):
         # Add
         self.menu_Add = QtWidgets.QMenu(self.menubar)
         self.menu_Add.setObjectName("menu_Add")
+        # Help
+        self.menu_Help = QtWidgets.QMenu(self.menubar)
+        self.menu_Help.setObjectName("menu_Help")
         MainWindow.setMenuBar(self.menubar)
 
-        self.menubar.setStyleSheet("""
-            QMenuBar {
-                background-color: #2b3844;
-                color: white;
-            }
-            QMenuBar:item::selected {
-                background-color: #77dd77;
-            }
-            
-            QMenu {
-                background-color: #2b3844;
-                color: white;
-            }
-            
-            QMenu:item:selected{
-                background-color: #77dd77;
-            }
-        """)
-
         # initalize section for add button
         # addMenu.setGeometry(QtCore.QRect(500, 0, 200, 50))
         '''self.addMenubar.setObjectName("addmenu")
@@ -907,6 +5705,10 @@ class Ui_MainWindow(object):
         self.actionSave.setObjectName("actionSave")
         self.actionSaveas = QtWidgets.QAction(MainWindow)
         self.actionSaveas.setObjectName("actionSaveas")
+        self.actionHistory = QtWidgets.QAction(MainWindow)
+        self.actionHistory.setObjectName("actionHistory")
+        self.actionExportPdf = QtWidgets.QAction(MainWindow)
+        self.actionExportPdf.setObjectName("actionExportPdf")
 
         # Undo and Copy
         self.actionUndo = QtWidgets.QAction(MainWindow)
@@ -917,6 +5719,9 @@ class Ui_MainWindow(object):
         self.actionCopy.setObjectName("actionCopy")
         self.actionPaste = QtWidgets.QAction(MainWindow)
         self.actionPaste.setObjectName("actionPaste")
+        self.actionPlainEditing = QtWidgets.QAction(MainWindow)
+        self.actionPlainEditing.setObjectName("actionPlainEditing")
+        self.actionPlainEditing.setCheckable(True)
 
         # connecting action to current tab
         self.actionAbout.triggered.connect(lambda x: self.tabWidget.openFileUsingPath('./resources/About.txt'))
@@ -925,14 +5730,48 @@ class Ui_MainWindow(object):
         self.actionRedo.triggered.connect(self.tabWidget.redoText)
         self.actionCopy.triggered.connect(self.tabWidget.copyText)
         self.actionPaste.triggered.connect(self.tabWidget.pasteText)
+        self.actionPlainEditing.triggered.connect(
+            lambda checked: self.tabWidget.setPlainEditing(self.tabWidget.currentWidget(), checked))
         self.actionSave.triggered.connect(self.tabWidget.saveTab)
         self.actionOpen.triggered.connect(self.tabWidget.openFileFromMenu)
+        self.actionHistory.triggered.connect(lambda checked: self.tabWidget.openHistory())
+        self.actionExportPdf.triggered.connect(self.tabWidget.exportPdf)
         self.actionNewtab.triggered.connect(self.tabWidget.menubar_newtab)
         self.addFolder.triggered.connect(self.tabWidget.folderTab)
         self.addFile.triggered.connect(self.tabWidget.fileTab)
 
+        # Theme submenu, one checkable action per theme
+        self.menu_Theme = QtWidgets.QMenu(self.menu_Notisimplifi)
+        self.menu_Theme.setObjectName("menu_Theme")
+        self.themeActions = QtWidgets.QActionGroup(MainWindow)
+        for name in themeManager.themes:
+            action = self.menu_Theme.addAction(name)
+            action.setCheckable(True)
+            action.setChecked(name == themeManager.current)
+            action.triggered.connect(lambda checked, name=name: themeManager.apply(name))
+            self.themeActions.addAction(action)
+        themeManager.themeChanged.connect(self.tabWidget.setHighlightTheme)
+
+        self.actionHighlightMarkdown = QtWidgets.QAction(MainWindow)
+        self.actionHighlightMarkdown.setObjectName("actionHighlightMarkdown")
+        self.actionHighlightMarkdown.setCheckable(True)
+        self.actionHighlightMarkdown.setChecked(self.tabWidget.markdownHighlighting)
+        self.actionHighlightMarkdown.triggered.connect(self.tabWidget.setMarkdownHighlighting)
+
+        # only a session started with --trace has anything to save
+        self.actionSaveTrace = QtWidgets.QAction(MainWindow)
+        self.actionSaveTrace.setObjectName("actionSaveTrace")
+        self.actionSaveTrace.setEnabled(tracer.enabled)
+        self.actionSaveTrace.triggered.connect(self.saveTrace)
+
+        self.actionUndoMemory = QtWidgets.QAction(MainWindow)
+        self.actionUndoMemory.setObjectName("actionUndoMemory")
+        self.actionUndoMemory.triggered.connect(self.showUndoMemory)
+
         # Setting layout and separators of 'File' drop down actions
         self.menu_Notisimplifi.addAction(self.actionAbout)
+        self.menu_Notisimplifi.addMenu(self.menu_Theme)
+        self.menu_Notisimplifi.addAction(self.actionHighlightMarkdown)
         self.menu_Notisimplifi.addSeparator()
         self.menu_Notisimplifi.addAction(self.actionQuit)
 
@@ -943,6 +5782,9 @@ class Ui_MainWindow(object):
         self.menu_File.addSeparator()
         self.menu_File.addAction(self.actionSave)
         self.menu_File.addAction(self.actionSaveas)
+        self.menu_File.addAction(self.actionExportPdf)
+        self.menu_File.addSeparator()
+        self.menu_File.addAction(self.actionHistory)
         # self.menu_File.addSeparator()
         # self.menu_File.addAction()
 
@@ -952,17 +5794,25 @@ class Ui_MainWindow(object):
         self.menu_Edit.addSeparator()
         self.menu_Edit.addAction(self.actionCopy)
         self.menu_Edit.addAction(self.actionPaste)
+        self.menu_Edit.addSeparator()
+        self.menu_Edit.addAction(self.actionSearch)
+        self.menu_Edit.addSeparator()
+        self.menu_Edit.addAction(self.actionPlainEditing)
 
         # Setting layout and seperators of 'Add' drop down actions
         self.menu_Add.addAction(self.addFolder)
         self.menu_Add.addSeparator()
         self.menu_Add.addAction(self.addFile)
 
+        self.menu_Help.addAction(self.actionSaveTrace)
+        self.menu_Help.addAction(self.actionUndoMemory)
+
         # Adding actions to menu actions that can take place
         self.menubar.addAction(self.menu_Notisimplifi.menuAction())
         self.menubar.addAction(self.menu_File.menuAction())
         self.menubar.addAction(self.menu_Edit.menuAction())
         self.menubar.addAction(self.menu_Add.menuAction())
+        self.menubar.addAction(self.menu_Help.menuAction())
 
         ###################################################################
         #                     TOOLBAR and TOOL BUTTONS                    #
@@ -982,58 +5832,46 @@ class Ui_MainWindow(object):
         # self.tb2.addSeparator()
 
         # undo button
-        self.undo_icon = QtGui.QIcon()
-        self.undo_icon.addPixmap(QtGui.QPixmap("resources/potential_icons/icons5/png/undo-new.png"), QtGui.QIcon.Normal,
-                                 QtGui.QIcon.Off)
-        self.undoButton = QAction(self.undo_icon, '', self.tb2)
+        self.undoButton = QAction('', self.tb2)
+        self.deferIcon(self.undoButton, "icons:potential_icons/icons5/png/undo-new.png")
         self.undoButton.setToolTip('Undo')
         self.undoButton.triggered.connect(self.tabWidget.undoText)
         self.tb2.addAction(self.undoButton)
 
         # redo button
-        self.redo_icon = QtGui.QIcon()
-        self.redo_icon.addPixmap(QtGui.QPixmap("resources/potential_icons/icons5/png/redo-new.png"), QtGui.QIcon.Normal,
-                                 QtGui.QIcon.Off)
-        self.redoButton = QAction(self.redo_icon, '', self.tb2)
+        self.redoButton = QAction('', self.tb2)
+        self.deferIcon(self.redoButton, "icons:potential_icons/icons5/png/redo-new.png")
         self.redoButton.setToolTip('Redo')
         self.redoButton.triggered.connect(self.tabWidget.redoText)
         self.tb2.addAction(self.redoButton)
 
         # save button
-        self.save_icon = QtGui.QIcon()
-        self.save_icon.addPixmap(QtGui.QPixmap("resources/potential_icons/icons5/png/save.png"), QtGui.QIcon.Normal,
-                                 QtGui.QIcon.Off)
-        self.saveButton = QAction(self.save_icon, '', self.tb2)
+        self.saveButton = QAction('', self.tb2)
+        self.deferIcon(self.saveButton, "icons:potential_icons/icons5/png/save.png")
         self.saveButton.setToolTip('Save')
         self.saveButton.triggered.connect(self.tabWidget.saveTab)
         self.tb2.addAction(self.saveButton)
         # self.tb2.addSeparator()
 
         # newFile button
-        self.newFile_icon = QtGui.QIcon()
-        self.newFile_icon.addPixmap(QtGui.QPixmap("resources/potential_icons/icons5/png/document-1.png"),
-                                    QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.newFileButton = QAction(self.newFile_icon, '', self.tb2)
+        self.newFileButton = QAction('', self.tb2)
+        self.deferIcon(self.newFileButton, "icons:potential_icons/icons5/png/document-1.png")
         self.newFileButton.setToolTip('New Note')
         self.newFileButton.triggered.connect(self.tabWidget.menubar_newtab)
         self.tb2.addAction(self.newFileButton)
         # self.tb2.addSeparator()
 
         # print button
-        self.print_icon = QtGui.QIcon()
-        self.print_icon.addPixmap(QtGui.QPixmap("resources/potential_icons/icons5/png/printer.png"), QtGui.QIcon.Normal,
-                                  QtGui.QIcon.Off)
-        self.printButton = QAction(self.print_icon, '', self.tb2)
+        self.printButton = QAction('', self.tb2)
+        self.deferIcon(self.printButton, "icons:potential_icons/icons5/png/printer.png")
         self.printButton.setToolTip('Print')
         self.printButton.triggered.connect(self.tabWidget.printNote)
         self.tb2.addAction(self.printButton)
         # self.tb2.addSeparator()
 
         # print preview button
-        self.printPreview_icon = QtGui.QIcon()
-        self.printPreview_icon.addPixmap(QtGui.QPixmap("resources/potential_icons/icons5/png/preview.png"),
-                                         QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.printPreviewButton = QAction(self.printPreview_icon, '', self.tb2)
+        self.printPreviewButton = QAction('', self.tb2)
+        self.deferIcon(self.printPreviewButton, "icons:potential_icons/icons5/png/preview.png")
         self.printPreviewButton.setToolTip('Print Preview')
         self.printPreviewButton.triggered.connect(self.tabWidget.printPreview)
         self.tb2.addAction(self.printPreviewButton)
@@ -1042,10 +5880,8 @@ class Ui_MainWindow(object):
         self.tb2.addSeparator()
 
         # bold button
-        self.bold_icon = QtGui.QIcon()
-        self.bold_icon.addPixmap(QtGui.QPixmap("resources/potential_icons/icons5/png/bold.png"), QtGui.QIcon.Normal,
-                                 QtGui.QIcon.Off)
-        self.boldButton = QAction(self.bold_icon, '', self.tb2)
+        self.boldButton = QAction('', self.tb2)
+        self.deferIcon(self.boldButton, "icons:potential_icons/icons5/png/bold.png")
         self.boldButton.setCheckable(True)
         self.boldButton.setToolTip('Bold')
         self.boldButton.triggered.connect(self.tabWidget.setBold)  # pass in bold button
@@ -1053,10 +5889,8 @@ class Ui_MainWindow(object):
         # self.tb2.addSeparator()
 
         # underline button
-        self.underline_icon = QtGui.QIcon()
-        self.underline_icon.addPixmap(QtGui.QPixmap("resources/potential_icons/icons5/png/underline.png"),
-                                      QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.underlineButton = QAction(self.underline_icon, '', self.tb2)
+        self.underlineButton = QAction('', self.tb2)
+        self.deferIcon(self.underlineButton, "icons:potential_icons/icons5/png/underline.png")
         self.underlineButton.setCheckable(True)
         self.underlineButton.setToolTip('Underline')
         self.underlineButton.triggered.connect(self.tabWidget.setUnderline)
@@ -1064,10 +5898,8 @@ class Ui_MainWindow(object):
         # self.tb2.addSeparator()
 
         # italic button
-        self.italic_icon = QtGui.QIcon()
-        self.italic_icon.addPixmap(QtGui.QPixmap("resources/potential_icons/icons5/png/italic.png"), QtGui.QIcon.Normal,
-                                   QtGui.QIcon.Off)
-        self.italicButton = QAction(self.italic_icon, '', self.tb2)
+        self.italicButton = QAction('', self.tb2)
+        self.deferIcon(self.italicButton, "icons:potential_icons/icons5/png/italic.png")
         self.italicButton.setCheckable(True)
         self.italicButton.setToolTip('Italic')
         self.italicButton.triggered.connect(self.tabWidget.setItalic)
@@ -1075,10 +5907,8 @@ class Ui_MainWindow(object):
         # self.tb2.addSeparator()
 
         # strikethrough button
-        self.strikethrough_icon = QtGui.QIcon()
-        self.strikethrough_icon.addPixmap(QtGui.QPixmap("resources/potential_icons/icons5/png/strikethrough.png"),
-                                          QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.strikethroughButton = QAction(self.strikethrough_icon, '', self.tb2)
+        self.strikethroughButton = QAction('', self.tb2)
+        self.deferIcon(self.strikethroughButton, "icons:potential_icons/icons5/png/strikethrough.png")
         self.strikethroughButton.setCheckable(True)
         self.strikethroughButton.setToolTip('Strikethrough')
         self.strikethroughButton.triggered.connect(self.tabWidget.setStrikethrough)
@@ -1086,10 +5916,8 @@ class Ui_MainWindow(object):
         # self.tb2.addSeparator()
 
         # superscript button
-        self.superscript_icon = QtGui.QIcon()
-        self.superscript_icon.addPixmap(QtGui.QPixmap("resources/potential_icons/icons5/png/superscript.png"),
-                                        QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.superscriptButton = QAction(self.superscript_icon, '', self.tb2)
+        self.superscriptButton = QAction('', self.tb2)
+        self.deferIcon(self.superscriptButton, "icons:potential_icons/icons5/png/superscript.png")
         self.superscriptButton.setCheckable(True)
         self.superscriptButton.setToolTip('Superscript')
         self.superscriptButton.triggered.connect(self.tabWidget.setSuperscript)
@@ -1097,10 +5925,8 @@ class Ui_MainWindow(object):
         # self.tb2.addSeparator()
 
         # subscript button
-        self.subscript_icon = QtGui.QIcon()
-        self.subscript_icon.addPixmap(QtGui.QPixmap("resources/potential_icons/icons5/png/subscript.png"),
-                                      QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.subscriptButton = QAction(self.subscript_icon, '', self.tb2)
+        self.subscriptButton = QAction('', self.tb2)
+        self.deferIcon(self.subscriptButton, "icons:potential_icons/icons5/png/subscript.png")
         self.subscriptButton.setCheckable(True)
         self.subscriptButton.setToolTip('Subscript')
         self.subscriptButton.triggered.connect(self.tabWidget.setSubscript)
@@ -1110,10 +5936,8 @@ class Ui_MainWindow(object):
         self.tb2.addSeparator()
 
         # left align
-        self.leftAlign_icon = QtGui.QIcon()
-        self.leftAlign_icon.addPixmap(QtGui.QPixmap("resources/potential_icons/icons5/png/left-alignment.png"),
-                                      QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.leftAlignButton = QAction(self.leftAlign_icon, '', self.tb2)
+        self.leftAlignButton = QAction('', self.tb2)
+        self.deferIcon(self.leftAlignButton, "icons:potential_icons/icons5/png/left-alignment.png")
         # self.leftAlignButton.setCheckable(True)
         self.leftAlignButton.setToolTip('Align Left')
         self.leftAlignButton.triggered.connect(self.tabWidget.setLeftAlign)
@@ -1121,10 +5945,8 @@ class Ui_MainWindow(object):
         # self.tb2.addSeparator()
 
         # center align
-        self.centerAlign_icon = QtGui.QIcon()
-        self.centerAlign_icon.addPixmap(QtGui.QPixmap("resources/potential_icons/icons5/png/center-alignment.png"),
-                                        QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.centerAlignButton = QAction(self.centerAlign_icon, '', self.tb2)
+        self.centerAlignButton = QAction('', self.tb2)
+        self.deferIcon(self.centerAlignButton, "icons:potential_icons/icons5/png/center-alignment.png")
         # self.centerAlignButton.setCheckable(True)
         self.centerAlignButton.setToolTip('Center Text')
         self.centerAlignButton.triggered.connect(self.tabWidget.setCenterAlign)
@@ -1132,10 +5954,8 @@ class Ui_MainWindow(object):
         # self.tb2.addSeparator()
 
         # right align
-        self.rightAlign_icon = QtGui.QIcon()
-        self.rightAlign_icon.addPixmap(QtGui.QPixmap("resources/potential_icons/icons5/png/right-alignment.png"),
-                                       QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.rightAlignButton = QAction(self.rightAlign_icon, '', self.tb2)
+        self.rightAlignButton = QAction('', self.tb2)
+        self.deferIcon(self.rightAlignButton, "icons:potential_icons/icons5/png/right-alignment.png")
         # self.rightAlignButton.setCheckable(True)
         self.rightAlignButton.setToolTip('Align Right')
         self.rightAlignButton.triggered.connect(self.tabWidget.setRightAlign)
@@ -1143,30 +5963,24 @@ class Ui_MainWindow(object):
         # self.tb2.addSeparator()
 
         # justify
-        self.justify_icon = QtGui.QIcon()
-        self.justify_icon.addPixmap(QtGui.QPixmap("resources/potential_icons/icons5/png/justify-align.png"),
-                                    QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.justifyButton = QAction(self.justify_icon, '', self.tb2)
+        self.justifyButton = QAction('', self.tb2)
+        self.deferIcon(self.justifyButton, "icons:potential_icons/icons5/png/justify-align.png")
         self.justifyButton.setToolTip('Align Right')
         self.justifyButton.triggered.connect(self.tabWidget.setJustify)
         self.tb2.addAction(self.justifyButton)
         # self.tb2.addSeparator()
 
         # right indent
-        self.rightIdent_icon = QtGui.QIcon()
-        self.rightIdent_icon.addPixmap(QtGui.QPixmap("resources/potential_icons/icons5/png/indent.png"),
-                                       QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.rightIdentButton = QAction(self.rightIdent_icon, '', self.tb2)
+        self.rightIdentButton = QAction('', self.tb2)
+        self.deferIcon(self.rightIdentButton, "icons:potential_icons/icons5/png/indent.png")
         self.rightIdentButton.setToolTip('Justify')
         self.rightIdentButton.triggered.connect(self.tabWidget.indentRight)
         self.tb2.addAction(self.rightIdentButton)
         # self.tb2.addSeparator()
 
         # left indent
-        self.leftIdent_icon = QtGui.QIcon()
-        self.leftIdent_icon.addPixmap(QtGui.QPixmap("resources/potential_icons/icons5/png/outdent.png"),
-                                      QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.leftIdentButton = QAction(self.leftIdent_icon, '', self.tb2)
+        self.leftIdentButton = QAction('', self.tb2)
+        self.deferIcon(self.leftIdentButton, "icons:potential_icons/icons5/png/outdent.png")
         self.leftIdentButton.setToolTip('Indent Left')
         self.leftIdentButton.triggered.connect(self.tabWidget.indentLeft)
         self.tb2.addAction(self.leftIdentButton)
@@ -1174,67 +5988,27 @@ class Ui_MainWindow(object):
         self.tb2.addSeparator()
 
         # bullet list
-        self.bulletList_icon = QtGui.QIcon()
-        self.bulletList_icon.addPixmap(QtGui.QPixmap("resources/potential_icons/icons5/png/list.png"),
-                                       QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.bulletListButton = QAction(self.bulletList_icon, '', self.tb2)
+        self.bulletListButton = QAction('', self.tb2)
+        self.deferIcon(self.bulletListButton, "icons:potential_icons/icons5/png/list.png")
         self.bulletListButton.setToolTip('Bulleted List')
         self.bulletListButton.triggered.connect(self.tabWidget.setBulletList)
         self.tb2.addAction(self.bulletListButton)
 
         # numbered list
-        self.numberList_icon = QtGui.QIcon()
-        self.numberList_icon.addPixmap(QtGui.QPixmap("resources/potential_icons/icons5/png/list-1.png"),
-                                       QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.numberListButton = QAction(self.numberList_icon, '', self.tb2)
+        self.numberListButton = QAction('', self.tb2)
+        self.deferIcon(self.numberListButton, "icons:potential_icons/icons5/png/list-1.png")
         self.numberListButton.setToolTip('Numbered List')
         self.numberListButton.triggered.connect(self.tabWidget.setNumberList)
         self.tb2.addAction(self.numberListButton)
 
-        # QToolBar::separator:horizontal {
-        #   image: url("./resources/potential_icons/icons5/png/separator-gray.png");
-        # }
+        # formatting doesn't apply to tabs in the plain text editor
+        self.formatActions = [
+            self.boldButton, self.underlineButton, self.italicButton, self.strikethroughButton,
+            self.superscriptButton, self.subscriptButton, self.leftAlignButton, self.centerAlignButton,
+            self.rightAlignButton, self.justifyButton, self.bulletListButton, self.numberListButton]
+        self.tabWidget.editingModeChanged.connect(self.editingModeChanged)
+        self.editingModeChanged(isinstance(self.tabWidget.currentWidget().editor, PlainNoteEdit))
 
-        self.tb2.setStyleSheet("""
-            QToolBar {
-              background-color: #212b34;
-              border-bottom: 1px solid #212b34;
-            }
-
-            QToolBar::separator:horizontal {
-              background-color: #212b34;
-              width: 1px;
-              margin-left: 10px;
-              margin-right: 10px;
-            }
-
-            QToolBar QToolButton {
-              background-color: #212b34;
-              border: 1px solid #212b34;
-              border-radius: 2px;
-            }
-
-            QToolBar QToolButton QToolTip {
-              color: white;
-              border: 1px solid gray;
-              border-radius: 3px;
-            }
-
-            QToolBar QToolButton:hover {
-              border: 1px solid #77dd77;
-            }
-
-            QToolBar QToolButton:checked {
-              border: 1px solid #b4ecb4;
-              background-color: #5d7992;
-            }
-
-            QToolBar QToolButton:checked:hover {
-              border: 1px solid #77dd77;
-            }
-        """)
-        # background - color:  # 19232D;
-        # border: 1px solid #b4ecb4;
 
         ###################################################################
         #                     TOOLBAR and TOOL BUTTONS                    #
@@ -1244,11 +6018,96 @@ class Ui_MainWindow(object):
         self.tabWidget.setCurrentIndex(0)
         QtCore.QMetaObject.connectSlotsByName(MainWindow)
 
+        self.indexWorker = BackgroundWorker('search-index')
+        self.setupFinished = False
+        if not deferSetup:
+            self.finishSetup()
+
+    # the parts of the window that aren't needed to start typing, the app
+    # runs this once the first frame is on screen
+    def finishSetup(self):
+        if self.setupFinished:
+            return
+        self.setupFinished = True
+
+        self.loadDeferredIcons()
+        startupTrace.mark('toolbar icons')
+        self.populateTree()
+        startupTrace.mark('notes tree')
+
+        # catch up on notes that changed while the app was closed
+        self.indexWorker.start(self.tabWidget.searchIndex.refresh)
+
+    def saveTrace(self):
+        path, _filter = QtWidgets.QFileDialog.getSaveFileName(
+            self.centralwidget, 'Save Trace', TRACE_FILE, 'Chrome trace (*.json)')
+        if path:
+            tracer.dump(path)
+
+    def editingModeChanged(self, plain):
+        for action in self.formatActions:
+            action.setEnabled(not plain)
+        self.actionPlainEditing.setChecked(plain)
+        self.actionPlainEditing.setEnabled(not isinstance(self.tabWidget.currentWidget(), (ViewerTab, HistoryTab)))
+
+    def showUndoMemory(self):
+        dialog = UndoMemoryDialog(self.tabWidget, self.centralwidget)
+        dialog.setAttribute(Qt.WA_DeleteOnClose)
+        dialog.show()
+
+    def deferIcon(self, action, name):
+        self.deferredIcons.append((action, name))
+
+    def loadDeferredIcons(self):
+        for action, name in self.deferredIcons:
+            action.setIcon(iconRegistry.icon(name))
+        self.deferredIcons = []
+
+    # the tree shows the notes folder, see NotesTreeModel
+    def populateTree(self):
+        os.makedirs(NOTES_DIR, exist_ok=True)
+        self.model = NotesTreeModel(NOTE_STORE.root, self.tree)
+        self.tree.setModel(self.model)
+
+    # the notes selected in the tree, those in selected folders included
+    def selectedNotes(self):
+        paths = []
+        for index in self.tree.selectionModel().selectedRows():
+            path = self.model.filePath(index)
+            if self.model.isDir(index):
+                paths.extend(notesIn(path))
+            else:
+                paths.append(path)
+        return list(dict.fromkeys(paths))
+
+    def exportSelected(self, each):
+        paths = self.selectedNotes()
+        if not paths:
+            return
+        if each:
+            folder = QtWidgets.QFileDialog.getExistingDirectory(self.centralwidget, 'Export Each to PDF')
+            if folder:
+                self.tabWidget.exportNotes(paths, pdfFolder=folder)
+        else:
+            path, _filter = QtWidgets.QFileDialog.getSaveFileName(
+                self.centralwidget, 'Export to PDF', 'notes.pdf', 'PDF (*.pdf)')
+            if path:
+                self.tabWidget.exportNotes(paths, pdfPath=path)
+
+    @tracer.traced('slot')
     def treeDblClicked(self, index):
         filePath = self.model.filePath(index)
 
-        if not os.path.isdir(filePath):
-            self.tabWidget.openFileUsingPath(filePath)
+        if not self.model.isDir(index):
+            # huge files get the read only viewer, it has a button to open
+            # them for editing anyway. It maps the file, so compressed notes
+            # and notes that aren't files of their own are always opened for
+            # editing.
+            store = storeFor(filePath)
+            if store.local and not notefiles.isCompressed(filePath) and store.size(filePath) >= VIEWER_MIN_BYTES:
+                self.tabWidget.openViewer(filePath)
+            else:
+                self.tabWidget.openFileUsingPath(filePath)
 
     def retranslateUi(self, MainWindow):
         _translate = QtCore.QCoreApplication.translate
@@ -1263,6 +6122,8 @@ class Ui_MainWindow(object):
         self.menu_File.setTitle(_translate("MainWindow", "&File"))
         self.menu_Edit.setTitle(_translate("MainWindow", "&Edit"))
         self.menu_Add.setTitle(_translate("MainWindow", "&Add"))
+        self.menu_Help.setTitle(_translate("MainWindow", "&Help"))
+        self.menu_Theme.setTitle(_translate("MainWindow", "Theme"))
 
         self.addFolder.setText(_translate("MainWindow", "Folder"))
         self.addFolder.setShortcut(_translate("MainWindow", "Ctrl+F"))
@@ -1271,6 +6132,9 @@ class Ui_MainWindow(object):
         self.addFile.setShortcut(_translate("MainWindow", "Ctrl+N"))
 
         self.actionAbout.setText(_translate("MainWindow", "About"))
+        self.actionSaveTrace.setText(_translate("MainWindow", "Save Trace..."))
+        self.actionSaveTrace.setToolTip(_translate("MainWindow", "Save the timings recorded since NotiSimplifi was started with --trace"))
+        self.actionUndoMemory.setText(_translate("MainWindow", "Undo Memory"))
 
         self.actionQuit.setText(_translate("MainWindow", "Quit"))
         self.actionQuit.setShortcut(_translate("MainWindow", "Ctrl+Q"))
@@ -1286,6 +6150,9 @@ class Ui_MainWindow(object):
 
         self.actionSaveas.setText(_translate("MainWindow", "Save As..."))
         self.actionSaveas.setShortcut(_translate("MainWindow", "Ctrl+Shift+S"))
+        self.actionHistory.setText(_translate("MainWindow", "Note History"))
+        self.actionExportPdf.setText(_translate("MainWindow", "Export to PDF..."))
+        self.actionHistory.setShortcut(_translate("MainWindow", "Ctrl+Shift+H"))
 
         self.actionUndo.setText(_translate("MainWindow", "Undo"))
         self.actionUndo.setShortcut(_translate("MainWindow", "Ctrl+Z"))
@@ -1299,11 +6166,19 @@ class Ui_MainWindow(object):
         self.actionPaste.setText(_translate("MainWindow", "Paste"))
         self.actionPaste.setShortcut(_translate("MainWindow", "Ctrl+V"))
 
+        self.searchDock.setWindowTitle(_translate("MainWindow", "Search"))
+        self.actionSearch.setText(_translate("MainWindow", "Search Notes"))
+        self.actionSearch.setShortcut(_translate("MainWindow", "Ctrl+Shift+F"))
+        self.actionPlainEditing.setText(_translate("MainWindow", "Plain Text Editing"))
+        self.actionHighlightMarkdown.setText(_translate("MainWindow", "Highlight Markdown"))
+        self.actionPlainEditing.setShortcut(_translate("MainWindow", "Ctrl+Shift+P"))
+
 # executes program
 if __name__ == "__main__":
     # app = QtWidgets.QApplication(sys.argv)
+    startupTrace.mark('imports')
 
-    # Splash screen & logo
+    # Splash screen & logo, it goes away as soon as the main window is up
     logo_path = os.path.dirname(os.path.realpath(__file__))
     pixmap = QPixmap('/'.join([logo_path, 'resources/logo.png']))
     splashScreen = QSplashScreen(pixmap, Qt.WindowStaysOnTopHint)
@@ -1312,18 +6187,41 @@ if __name__ == "__main__":
     # this checks for button clicks while main form is loading
     # keeping for future use
     app.processEvents()
+    startupTrace.mark('splash')
 
-    # delay main form from showing until 2 seconds has passed
-    loop = QEventLoop()
-    QTimer.singleShot(2000, loop.quit)
-    loop.exec_()
+    # recover edits that didn't make it into their notes before a crash
+    replayJournals()
+    startupTrace.mark('journal replay')
 
     w = QtWidgets.QMainWindow()
     ui = Ui_MainWindow()
-    ui.setupUi(w)
+    ui.setupUi(w, deferSetup=True)
+    startupTrace.mark('setup ui')
+
+    # bring back the tabs from last time, the window shows the current one
+    # and the rest fill in once it is up
+    session = Session(ui.tabWidget)
+    session.restore()
+    app.aboutToQuit.connect(ui.tabWidget.saveAll)
+    app.aboutToQuit.connect(session.saveNow)
+    app.aboutToQuit.connect(ui.tabWidget.stopPrintJobs)
+    startupTrace.mark('session restore')
+
+    # with --trace the last calls are written out when the app quits
+    if tracer.enabled:
+        stallMonitor = StallMonitor(tracer, app)
+        app.aboutToQuit.connect(tracer.dump)
 
     w.show()
 
     # stop showing splashscreen once main form has loaded in
     splashScreen.finish(w)
+    app.processEvents()
+    startupTrace.mark('first frame')
+
+    # icons, the notes tree and the search index catch up right after
+    def finishStartup():
+        ui.finishSetup()
+        startupTrace.report()
+    QTimer.singleShot(0, finishStartup)
     sys.exit(app.exec_())
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+
+# Compressed note files. A note can be stored compressed, with ZLIB_SUFFIX or
+# LZMA_SUFFIX added to its file name (notes.txt.z, big.note.xz); everything
+# else about it stays the same, it is still the note 'notes' or 'big'. zlib is
+# quick enough for notes that are saved all the time, lzma packs the big ones
+# (logs, transcripts) a lot tighter and is used from LZMA_MIN_BYTES.
+#
+# Compressed files are read as a stream, the whole file is never in memory
+# at once, compressed or not.
+#
+# This module doesn't import Qt so the search index process pool can read
+# notes without loading it.
+
+import io
+import lzma
+import os
+import tempfile
+import unittest
+import zlib
+
+ZLIB_SUFFIX = '.z'
+LZMA_SUFFIX = '.xz'
+COMPRESSED_SUFFIXES = (ZLIB_SUFFIX, LZMA_SUFFIX)
+LZMA_MIN_BYTES = 1024 * 1024
+
+# compressed bytes read (and at most decompressed) at a time
+READ_BYTES = 64 * 1024
+
+
+def isCompressed(path):
+    return path.endswith(COMPRESSED_SUFFIXES)
+
+
+# the file name the note would have uncompressed, 'notes.txt.z' -> 'notes.txt'
+def uncompressedName(path):
+    for suffix in COMPRESSED_SUFFIXES:
+        if path.endswith(suffix):
+            return path[:-len(suffix)]
+    return path
+
+
+# the name of a note as the tabs show it, 'notes.txt.z' -> 'notes'
+def noteName(path):
+    return os.path.splitext(os.path.basename(uncompressedName(path)))[0]
+
+
+# path with the suffix of the codec for a note of size bytes
+def compressedName(path, size):
+    return path + (LZMA_SUFFIX if size >= LZMA_MIN_BYTES else ZLIB_SUFFIX)
+
+
+# data as it is stored in path
+def encode(path, data):
+    if path.endswith(ZLIB_SUFFIX):
+        return zlib.compress(data)
+    if path.endswith(LZMA_SUFFIX):
+        return lzma.compress(data)
+    return data
+
+
+# Decompresses a zlib stream read from raw. The standard library only has a
+# file object for gzip and lzma streams.
+class ZlibReader(io.RawIOBase):
+    def __init__(self, raw):
+        super(ZlibReader, self).__init__()
+        self.raw = raw
+        self.decompressor = zlib.decompressobj()
+        self.pending = b''
+        self.offset = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while self.offset == len(self.pending):
+            if self.decompressor.eof:
+                return 0
+            data = self.decompressor.unconsumed_tail or self.raw.read(READ_BYTES)
+            if not data:
+                raise EOFError('compressed note ends early')
+            self.pending = self.decompressor.decompress(data, READ_BYTES)
+            self.offset = 0
+
+        size = min(len(buffer), len(self.pending) - self.offset)
+        buffer[:size] = self.pending[self.offset:self.offset + size]
+        self.offset += size
+        return size
+
+
+# The contents of path as a binary file object that reads from raw, the file
+# opened as is (so raw.tell() says how much of the file has been read).
+# Closing it leaves raw open.
+def reader(raw, path):
+    if path.endswith(ZLIB_SUFFIX):
+        return io.BufferedReader(ZlibReader(raw), READ_BYTES)
+    if path.endswith(LZMA_SUFFIX):
+        return lzma.LZMAFile(raw)
+    return io.BufferedReader(NonClosing(raw), READ_BYTES)
+
+
+# raw for reader() when there is nothing to decompress
+class NonClosing(io.RawIOBase):
+    def __init__(self, raw):
+        super(NonClosing, self).__init__()
+        self.raw = raw
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        return self.raw.readinto(buffer)
+
+
+# reads the whole of a note file, decompressed
+def readBytes(path):
+    with open(path, 'rb') as raw, reader(raw, path) as file:
+        return file.read()
+
+
+class NoteFilesTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.data = ''.join('line %d of a long transcript\n' % i for i in range(20000)).encode('utf-8')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_names(self):
+        self.assertEqual(noteName('saved_notes/foo.txt.z'), 'foo')
+        self.assertEqual(noteName('foo.note.xz'), 'foo')
+        self.assertEqual(noteName('foo.txt'), 'foo')
+        self.assertEqual(uncompressedName('foo.txt.xz'), 'foo.txt')
+        self.assertEqual(compressedName('foo.note', 10), 'foo.note.z')
+        self.assertEqual(compressedName('foo.note', LZMA_MIN_BYTES), 'foo.note.xz')
+
+    # the data comes back the same, read in small pieces as well as whole
+    def test_round_trip(self):
+        for name in ['plain.txt', 'small.txt.z', 'big.txt.xz']:
+            path = os.path.join(self.tmp.name, name)
+            with open(path, 'wb') as file:
+                file.write(encode(path, self.data))
+            if isCompressed(path):
+                self.assertLess(os.path.getsize(path), len(self.data) // 4)
+
+            self.assertEqual(readBytes(path), self.data)
+            with open(path, 'rb') as raw:
+                with io.TextIOWrapper(reader(raw, path), encoding='utf-8') as text:
+                    lines = list(text)
+                self.assertFalse(raw.closed)
+            self.assertEqual(''.join(lines).encode('utf-8'), self.data)
+
+    def test_truncated(self):
+        path = os.path.join(self.tmp.name, 'torn.txt.z')
+        with open(path, 'wb') as file:
+            file.write(encode(path, self.data)[:1000])
+        with self.assertRaises(EOFError):
+            readBytes(path)
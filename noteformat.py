@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+
+# NotiSimplifi's own note format, which keeps the formatting set from the
+# toolbar (bold, lists, alignment, ...) that a plain .txt note loses.
+#
+# A note file starts with MAGIC, followed by one line of json per text block
+# (paragraph). Each line holds the block's text and, only where there is any:
+#
+#   spans  [[offset, length, properties], ...] for formatted runs of the text,
+#          offsets and lengths count characters of text
+#   block  the block format's properties
+#   list   [list id, list format properties] for blocks in a list, blocks
+#          with the same id are in the same list
+#
+# Properties are {Qt property id: value} dicts of the formats' plain values.
+# Blocks are encoded on their own, which lets the editor keep the encoded
+# lines of blocks that didn't change, and lets a note be read line by line.
+#
+# This module doesn't import Qt so the search index process pool can read
+# notes without loading it.
+
+import io
+import json
+import unittest
+
+import notefiles
+
+MAGIC = b'NSN1\n'
+SUFFIX = '.note'
+
+ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+
+def isNotePath(path):
+    return notefiles.uncompressedName(path).endswith(SUFFIX)
+
+
+# one block as a line of the note file
+def encodeBlock(text, spans=None, block=None, textList=None):
+    if not spans and not block and not textList:
+        return encodeText(text)
+    entry = {'text': text}
+    if spans:
+        entry['spans'] = spans
+    if block:
+        entry['block'] = block
+    if textList:
+        entry['list'] = textList
+    return ENCODER.encode(entry).encode('utf-8') + b'\n'
+
+
+# the line of a block that is nothing but text, which is most of them
+def encodeText(text):
+    return ('{"text":%s}\n' % ENCODER.encode(text)).encode('utf-8')
+
+
+# property dicts come back with int keys, the way Qt numbers them
+def decodeBlock(line):
+    entry = json.loads(line)
+    for span in entry.get('spans', ()):
+        span[2] = {int(key): value for key, value in span[2].items()}
+    if 'block' in entry:
+        entry['block'] = {int(key): value for key, value in entry['block'].items()}
+    if 'list' in entry:
+        entry['list'][1] = {int(key): value for key, value in entry['list'][1].items()}
+    return entry
+
+
+# yields the encoded lines of the note open in file (binary mode) one at a
+# time; an empty file is an empty note
+def readLines(file):
+    head = file.read(len(MAGIC))
+    if not head:
+        return
+    if head != MAGIC:
+        raise ValueError('not a note file: %r' % getattr(file, 'name', file))
+    for line in file:
+        if line.strip():
+            yield line
+
+
+def readBlocks(file):
+    for line in readLines(file):
+        yield decodeBlock(line)
+
+
+# the text of a note without its formatting, one line per block
+def readText(path):
+    with open(path, 'rb') as raw, notefiles.reader(raw, path) as file:
+        return blocksText(file)
+
+
+def blocksText(file):
+    return '\n'.join(block['text'] for block in readBlocks(file))
+
+
+class NoteFormatTest(unittest.TestCase):
+    def test_round_trip(self):
+        data = MAGIC + b''.join([
+            encodeBlock('plain'),
+            encodeBlock('bold and "quoted" line', spans=[[0, 4, {8195: 75}]], block={4112: 4}),
+            encodeBlock('item', textList=[7, {12288: -1}]),
+        ])
+        blocks = list(readBlocks(io.BytesIO(data)))
+
+        self.assertEqual(data.count(b'\n'), 4)
+        self.assertEqual(blocks[0], {'text': 'plain'})
+        self.assertEqual(blocks[1]['text'], 'bold and "quoted" line')
+        self.assertEqual(blocks[1]['spans'], [[0, 4, {8195: 75}]])
+        self.assertEqual(blocks[1]['block'], {4112: 4})
+        self.assertEqual(blocks[2]['list'], [7, {12288: -1}])
+
+    def test_not_a_note(self):
+        self.assertEqual(list(readBlocks(io.BytesIO(b''))), [])
+        with self.assertRaises(ValueError):
+            list(readBlocks(io.BytesIO(b'just some text\n')))
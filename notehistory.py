@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+
+# Version history of notes. Every version of a note is split into chunks at
+# boundaries that depend only on the text around them, so a small edit
+# changes one or two chunks and the rest of the version is made of the same
+# chunks as the last one. Chunks are stored once (zlib compressed) under
+# their hash, and a version is just the list of its chunk ids, delta encoded
+# and compressed, which for a version that shares most of its chunks with
+# others comes to a few dozen bytes.
+#
+# Chunks end at the end of a line, which is where edits to notes (and to the
+# lines of the note format) line up anyway. A line ends a chunk when its
+# crc32 modulo CHUNK_TARGET_BYTES is below its length, so chunks come out
+# around CHUNK_TARGET_BYTES whatever the length of the lines, and always
+# between CHUNK_MIN_BYTES and CHUNK_MAX_BYTES.
+#
+# Everything is kept in one SQLite database. Each note keeps at most
+# maxVersions versions, and collect() drops versions older than maxDays along
+# with the chunks no version uses any more.
+#
+# This module doesn't import Qt so it can be used without loading it.
+
+import array
+import hashlib
+import itertools
+import os
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+import unittest
+import zlib
+
+CHUNK_MIN_BYTES = 512
+CHUNK_TARGET_BYTES = 2 * 1024
+CHUNK_MAX_BYTES = 64 * 1024
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS chunks (
+    id INTEGER PRIMARY KEY,
+    hash BLOB NOT NULL UNIQUE,
+    data BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS versions (
+    id INTEGER PRIMARY KEY,
+    note TEXT NOT NULL,
+    time REAL NOT NULL,
+    size INTEGER NOT NULL,
+    hash BLOB NOT NULL,
+    chunks BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS versionsByNote ON versions (note, id);
+'''
+
+# see SqliteStore
+CACHED_STATEMENTS = 32
+
+
+def chunkHash(data):
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+# the chunks of data, see the top of the file
+def split(data):
+    chunks = []
+    start = 0
+    end = 0
+    for line in data.splitlines(True):
+        # lines too long to be a chunk, a note that is one long line say,
+        # are cut where they pass the maximum
+        pieces = [line]
+        if len(line) > CHUNK_MAX_BYTES:
+            pieces = [line[i:i + CHUNK_MAX_BYTES] for i in range(0, len(line), CHUNK_MAX_BYTES)]
+        for piece in pieces:
+            end += len(piece)
+            size = end - start
+            if size >= CHUNK_MAX_BYTES or (size >= CHUNK_MIN_BYTES and
+                                           zlib.crc32(piece) % CHUNK_TARGET_BYTES < len(piece)):
+                chunks.append(data[start:end])
+                start = end
+    if start < len(data):
+        chunks.append(data[start:])
+    return chunks
+
+
+def encodeIds(ids):
+    deltas = array.array('q', (b - a for a, b in zip(itertools.chain((0,), ids), ids)))
+    return zlib.compress(deltas.tobytes())
+
+
+def decodeIds(blob):
+    deltas = array.array('q')
+    deltas.frombytes(zlib.decompress(blob))
+    return list(itertools.accumulate(deltas))
+
+
+# Notes are told apart by their path. The connection is shared between the
+# GUI thread, which browses the history, and the autosave worker, which
+# records it.
+class NoteHistory(object):
+    def __init__(self, path, maxVersions=1000, maxDays=90, interval=60):
+        self.maxVersions = maxVersions
+        self.maxDays = maxDays
+        # seconds between the versions autosave records of a note
+        self.interval = interval
+
+        self.lock = threading.RLock()
+        self.connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None,
+                                          cached_statements=CACHED_STATEMENTS)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.executescript(SCHEMA)
+
+        # note -> (time, hash) of its last version
+        self.last = {}
+        # note -> {chunk hash: id} of its last version, most of the next
+        # version's chunks are found here without a query
+        self.known = {}
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+    def lastVersion(self, note):
+        last = self.last.get(note)
+        if last is None:
+            row = self.connection.execute('SELECT time, hash FROM versions WHERE note = ? ORDER BY id DESC LIMIT 1',
+                                          (note,)).fetchone()
+            last = self.last[note] = tuple(row) if row else (0.0, None)
+        return last
+
+    # whether autosave should record a version of note again
+    def due(self, note):
+        with self.lock:
+            return time.time() - self.lastVersion(note)[0] >= self.interval
+
+    # Adds data as the newest version of note, unless it is the same as the
+    # last one or (without force) the last one is less than interval old.
+    # Returns the version's id, or None.
+    def record(self, note, data, force=False):
+        digest = chunkHash(data)
+        with self.lock:
+            lastTime, lastDigest = self.lastVersion(note)
+            now = time.time()
+            if digest == lastDigest or (not force and now - lastTime < self.interval):
+                return None
+
+            known = self.known.get(note, {})
+            chunks = {}
+            ids = []
+            self.connection.execute('BEGIN IMMEDIATE')
+            try:
+                for chunk in split(data):
+                    key = chunkHash(chunk)
+                    chunkId = known.get(key) or chunks.get(key)
+                    if chunkId is None:
+                        row = self.connection.execute('SELECT id FROM chunks WHERE hash = ?', (key,)).fetchone()
+                        if row is not None:
+                            chunkId = row[0]
+                        else:
+                            chunkId = self.connection.execute('INSERT INTO chunks (hash, data) VALUES (?, ?)',
+                                                              (key, zlib.compress(chunk))).lastrowid
+                    chunks[key] = chunkId
+                    ids.append(chunkId)
+
+                versionId = self.connection.execute(
+                    'INSERT INTO versions (note, time, size, hash, chunks) VALUES (?, ?, ?, ?, ?)',
+                    (note, now, len(data), digest, encodeIds(ids))).lastrowid
+                # the oldest versions beyond maxVersions go, their chunks are
+                # left to collect()
+                self.connection.execute(
+                    'DELETE FROM versions WHERE note = ? AND id <= '
+                    '(SELECT id FROM versions WHERE note = ? ORDER BY id DESC LIMIT 1 OFFSET ?)',
+                    (note, note, self.maxVersions))
+            except BaseException:
+                self.connection.execute('ROLLBACK')
+                raise
+            self.connection.execute('COMMIT')
+
+            self.last[note] = (now, digest)
+            self.known[note] = chunks
+            return versionId
+
+    # [(id, time, size), ...] of note's versions, newest first
+    def versions(self, note):
+        with self.lock:
+            return [tuple(row) for row in self.connection.execute(
+                'SELECT id, time, size FROM versions WHERE note = ? ORDER BY id DESC', (note,))]
+
+    def read(self, versionId):
+        with self.lock:
+            row = self.connection.execute('SELECT chunks FROM versions WHERE id = ?', (versionId,)).fetchone()
+            if row is None:
+                raise KeyError(versionId)
+            ids = decodeIds(row[0])
+            found = {}
+            for chunkId in set(ids):
+                found[chunkId] = self.connection.execute('SELECT data FROM chunks WHERE id = ?',
+                                                         (chunkId,)).fetchone()[0]
+        return b''.join(zlib.decompress(found[chunkId]) for chunkId in ids)
+
+    # Drops the versions older than maxDays (a note's newest version is
+    # always kept) and the chunks no version uses any more. Returns the
+    # number of (versions, chunks) removed.
+    def collect(self, now=None):
+        cutoff = (now or time.time()) - self.maxDays * 24 * 3600
+        with self.lock:
+            self.connection.execute('BEGIN IMMEDIATE')
+            try:
+                versions = self.connection.execute(
+                    'DELETE FROM versions WHERE time < ? AND id NOT IN (SELECT MAX(id) FROM versions GROUP BY note)',
+                    (cutoff,)).rowcount
+
+                live = set()
+                for (blob,) in self.connection.execute('SELECT chunks FROM versions'):
+                    live.update(decodeIds(blob))
+                self.connection.execute('CREATE TEMP TABLE IF NOT EXISTS live (id INTEGER PRIMARY KEY)')
+                self.connection.execute('DELETE FROM live')
+                self.connection.executemany('INSERT INTO live (id) VALUES (?)', ((chunkId,) for chunkId in live))
+                chunks = self.connection.execute('DELETE FROM chunks WHERE id NOT IN (SELECT id FROM live)').rowcount
+                self.connection.execute('DELETE FROM live')
+            except BaseException:
+                self.connection.execute('ROLLBACK')
+                raise
+            self.connection.execute('COMMIT')
+            self.last.clear()
+            self.known.clear()
+        return versions, chunks
+
+    # bytes taken by the chunks and the version lists
+    def storedBytes(self):
+        with self.lock:
+            chunks = self.connection.execute('SELECT COALESCE(SUM(LENGTH(data)), 0) FROM chunks').fetchone()[0]
+            versions = self.connection.execute('SELECT COALESCE(SUM(LENGTH(chunks)), 0) FROM versions').fetchone()[0]
+        return chunks + versions
+
+
+# text that doesn't compress to nothing the way a repeated line would
+def sampleText(size, seed=0):
+    words = ['note', 'history', 'chunk', 'version', 'edit', 'restore', 'the', 'a', 'of', 'meeting',
+             'tomorrow', 'list', 'idea', 'draft', 'fix', 'later', 'important', 'maybe', 'and', 'with']
+    generator = random.Random(seed)
+    lines = []
+    length = 0
+    while length < size:
+        line = ' '.join(generator.choice(words) for i in range(generator.randint(3, 16))) + '\n'
+        lines.append(line)
+        length += len(line)
+    return ''.join(lines)[:size].encode('utf-8')
+
+
+class NoteHistoryTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.history = NoteHistory(os.path.join(self.tmp.name, 'history.db'), interval=0)
+
+    def tearDown(self):
+        self.history.close()
+        self.tmp.cleanup()
+
+    # an edit only changes the chunks around it
+    def test_split(self):
+        data = sampleText(256 * 1024)
+        chunks = split(data)
+        self.assertEqual(b''.join(chunks), data)
+        self.assertTrue(all(len(chunk) <= CHUNK_MAX_BYTES for chunk in chunks))
+        self.assertTrue(all(len(chunk) >= CHUNK_MIN_BYTES for chunk in chunks[:-1]))
+
+        edited = data[:100000] + b'an inserted line\n' + data[100000:]
+        self.assertLessEqual(len(set(split(edited)) - set(chunks)), 2)
+        self.assertEqual(split(b'x' * (3 * CHUNK_MAX_BYTES)), [b'x' * CHUNK_MAX_BYTES] * 3)
+
+    def test_ids(self):
+        ids = [5, 6, 7, 3, 900, 901]
+        self.assertEqual(decodeIds(encodeIds(ids)), ids)
+        self.assertEqual(decodeIds(encodeIds([])), [])
+
+    # many versions with small edits take little more room than one
+    def test_versions(self):
+        data = sampleText(256 * 1024)
+        versions = []
+        for i in range(100):
+            position = (i * 7919) % len(data)
+            data = data[:position] + b'edit %d\n' % i + data[position:]
+            versions.append((self.history.record('a.txt', data), data))
+        self.assertIsNone(self.history.record('a.txt', data))
+
+        # each version costs less than a chunk would uncompressed
+        self.assertLess(self.history.storedBytes(), len(zlib.compress(data)) + 100 * CHUNK_TARGET_BYTES)
+        self.assertEqual([row[0] for row in self.history.versions('a.txt')][:2],
+                         [versions[-1][0], versions[-2][0]])
+        for versionId, expected in versions[::17]:
+            self.assertEqual(self.history.read(versionId), expected)
+
+    def chunkCount(self):
+        return self.history.connection.execute('SELECT COUNT(*) FROM chunks').fetchone()[0]
+
+    def test_retention(self):
+        self.history.maxVersions = 3
+        texts = [sampleText(8 * 1024, seed=i) for i in range(5)]
+        for text in texts:
+            self.history.record('a.txt', text)
+        self.assertEqual(len(self.history.versions('a.txt')), 3)
+        self.assertEqual(self.history.collect()[0], 0)
+        self.assertEqual(self.chunkCount(), len(set().union(*(split(text) for text in texts[2:]))))
+
+        # old versions go, the newest is kept however old it is
+        self.history.record('b.txt', b'b')
+        self.assertEqual(self.history.collect(now=time.time() + 365 * 24 * 3600)[0], 2)
+        self.assertEqual(self.chunkCount(), len(set(split(texts[4]))) + 1)
+        self.assertEqual(self.history.read(self.history.versions('a.txt')[0][0]), texts[4])
+
+    # without force, autosave only records a version every interval
+    def test_interval(self):
+        self.history.interval = 3600
+        self.assertTrue(self.history.due('a.txt'))
+        self.assertIsNotNone(self.history.record('a.txt', b'one'))
+        self.assertFalse(self.history.due('a.txt'))
+        self.assertIsNone(self.history.record('a.txt', b'two'))
+        self.assertIsNotNone(self.history.record('a.txt', b'two', force=True))
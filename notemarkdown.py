@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+
+# What the editor highlights in a Markdown note. A line is highlighted on its
+# own, given the state the line before it ended in, and all that carries over
+# from one line to the next is whether it is inside a fenced code block. The
+# editor keeps that state with every block, so an edit only re-highlights the
+# blocks it touched, and the blocks after them only as long as their state
+# changes (opening a fence re-highlights the lines up to where it closes).
+#
+# The patterns are compiled once when the module is imported. It doesn't import
+# Qt, like the other note helpers.
+
+import re
+import unittest
+
+# states a line can end in, NORMAL is also the state Qt gives a block that
+# hasn't been highlighted yet, so highlighting one never changes it
+NORMAL = -1
+BACKTICK_FENCE = 1
+TILDE_FENCE = 2
+
+FENCES = {'`': BACKTICK_FENCE, '~': TILDE_FENCE}
+
+# lines longer than this only get the highlighting of the whole line (heading,
+# quote, ...), matching emphasis in them can take long and a keystroke
+# re-highlights the line it is in
+MAX_INLINE_CHARS = 10000
+
+FENCE = re.compile(r' {0,3}(`{3,}|~{3,})')
+HEADING = re.compile(r' {0,3}#{1,6}(?:\s|$)')
+RULE = re.compile(r' {0,3}([-*_])(?: *\1){2,} *$')
+QUOTE = re.compile(r' {0,3}>')
+LIST = re.compile(r' *(?:[-+*]|\d{1,9}[.)])(?=\s|$)')
+
+# one scan for everything inside a line, code spans come first so nothing in
+# them counts as emphasis or a link. Emphasis ends at the next marker of its
+# kind, which keeps a line with many unmatched markers linear. The lookahead
+# lets the scan skip over plain text without trying every alternative.
+INLINE = re.compile(
+    r'(?=[`*_!\[<])(?:'
+    r'(?P<code>(?P<ticks>`+).+?(?P=ticks))'
+    r'|(?P<strong>\*\*(?=\S)(?:[^*]|\*(?!\*))*?(?<=\S)\*\*|__(?=\S)(?:[^_]|_(?!_))*?(?<=\S)__)'
+    r'|(?P<emphasis>\*(?=[^\s*])[^*]*?(?<=[^\s*])\*|\b_(?=[^\s_])[^_]*?(?<=[^\s_])_\b)'
+    r'|(?P<link>!?\[[^\]]*\]\([^)]*\)|<[a-z][a-z0-9+.-]*:[^\s<>]*>))')
+
+
+# the spans [(start, length, kind), ...] to highlight in a line and the state
+# it ends in, given the state the line before ended in. Kinds are heading,
+# rule, quote, list, fence (a fence line), code (in a fence or a code span),
+# strong, emphasis and link. Later spans go over earlier ones.
+def highlightLine(text, state=NORMAL):
+    fence = FENCE.match(text)
+    if state != NORMAL:
+        if fence and FENCES[fence.group(1)[0]] == state and not text[fence.end():].strip():
+            return [(0, len(text), 'fence')], NORMAL
+        return [(0, len(text), 'code')], state
+    if fence and not (fence.group(1)[0] == '`' and '`' in text[fence.end():]):
+        return [(0, len(text), 'fence')], FENCES[fence.group(1)[0]]
+
+    if HEADING.match(text):
+        return [(0, len(text), 'heading')], NORMAL
+    if RULE.match(text):
+        return [(0, len(text), 'rule')], NORMAL
+
+    spans = []
+    marker = QUOTE.match(text)
+    if marker:
+        spans.append((0, len(text), 'quote'))
+    else:
+        marker = LIST.match(text)
+        if marker:
+            spans.append((0, marker.end(), 'list'))
+    if len(text) <= MAX_INLINE_CHARS:
+        for match in INLINE.finditer(text, marker.end() if marker else 0):
+            start, end = match.span()
+            spans.append((start, end - start, match.lastgroup))
+    return spans, NORMAL
+
+
+class MarkdownTest(unittest.TestCase):
+    def test_blocks(self):
+        self.assertEqual(highlightLine('## Title'), ([(0, 8, 'heading')], NORMAL))
+        self.assertEqual(highlightLine('#hashtag'), ([], NORMAL))
+        self.assertEqual(highlightLine('- - -'), ([(0, 5, 'rule')], NORMAL))
+        self.assertEqual(highlightLine('> quoted')[0], [(0, 8, 'quote')])
+        self.assertEqual(highlightLine('  12. item')[0], [(0, 5, 'list')])
+        self.assertEqual(highlightLine('-not a list')[0], [])
+
+    def test_inline(self):
+        text = 'a **b** *c* `*d*` [e](f) _g_ snake_case_name 2 * 3 * 4'
+        spans = highlightLine(text)[0]
+        self.assertEqual([(text[start:start + length], kind) for start, length, kind in spans], [
+            ('**b**', 'strong'), ('*c*', 'emphasis'), ('`*d*`', 'code'),
+            ('[e](f)', 'link'), ('_g_', 'emphasis')])
+
+    def test_fences(self):
+        lines = ['text', '```python', '# not a heading', '~~~', '```', '*again*', '~~~~', 'x']
+        highlighted = []
+        states = []
+        state = NORMAL
+        for line in lines:
+            spans, state = highlightLine(line, state)
+            highlighted.append(spans)
+            states.append(state)
+        self.assertEqual(states, [NORMAL, BACKTICK_FENCE, BACKTICK_FENCE, BACKTICK_FENCE,
+                                  NORMAL, NORMAL, TILDE_FENCE, TILDE_FENCE])
+        self.assertEqual(highlighted[2], [(0, 15, 'code')])
+        self.assertEqual(highlighted[5], [(0, 7, 'emphasis')])
+
+        # a code span at the start of a line doesn't open a fence
+        self.assertEqual(highlightLine('```code``` after')[1], NORMAL)
+
+    def test_long_line(self):
+        text = '*' * (MAX_INLINE_CHARS + 1)
+        self.assertEqual(highlightLine(text), ([(0, len(text), 'rule')], NORMAL))
+        self.assertEqual(highlightLine('> ' + '*a* ' * MAX_INLINE_CHARS)[0], [(0, 4 * MAX_INLINE_CHARS + 2, 'quote')])
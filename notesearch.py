@@ -0,0 +1,505 @@
+#!/usr/bin/env python3
+
+# Full text search index for NotiSimplifi notes
+
+# The index maps every token to its postings, i.e. the notes it appears in and
+# its positions in those notes. Recently saved notes go into an in memory
+# segment which gets written out as an immutable, memory mapped segment file
+# once it grows large enough. Segments are merged once there are too many of
+# them, which is also when postings of deleted or re-saved notes get dropped.
+#
+# This module doesn't import Qt so the process pool used for rebuilds doesn't
+# have to load it.
+
+import array
+import concurrent.futures
+import json
+import math
+import mmap
+import os
+import re
+import struct
+import tempfile
+import threading
+import unittest
+
+import notefiles
+import noteformat
+
+TOKEN_RE = re.compile(r'\w+')
+# a query is a list of words and "quoted phrases"
+QUERY_RE = re.compile(r'"([^"]*)"|(\S+)')
+
+# compressed notes are indexed too, see isNoteName()
+NOTE_EXTENSIONS = ('.txt', noteformat.SUFFIX)
+
+# segment file layout: header, one entry per term (sorted by term), the term
+# bytes and then the postings. Postings are native uint32 arrays of
+# [doc id, position count, positions...] per note.
+SEGMENT_MAGIC = b'NSX1'
+SEGMENT_HEADER = struct.Struct('<4sI')
+SEGMENT_ENTRY = struct.Struct('<IIII')
+
+# the in memory segment is written to disk after this many postings entries
+LIVE_SEGMENT_LIMIT = 500000
+# segments are merged into one once there are more than this
+MAX_SEGMENTS = 8
+# refresh() tokenizes notes in a process pool when at least this many changed
+PARALLEL_INDEX_MIN = 200
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def isNoteName(name):
+    return notefiles.uncompressedName(name).endswith(NOTE_EXTENSIONS)
+
+
+# returns ({token: [positions]}, number of tokens)
+def tokenize(text):
+    postings = {}
+    length = 0
+    for length, token in enumerate(TOKEN_RE.findall(text.lower()), 1):
+        postings.setdefault(token, []).append(length - 1)
+    return postings, length
+
+
+# reads and tokenizes a note, runs in the rebuild process pool
+def indexFile(path):
+    if noteformat.isNotePath(path):
+        text = noteformat.readText(path)
+    else:
+        text = notefiles.readBytes(path).decode('utf-8', errors='replace')
+    postings, length = tokenize(text)
+    return path, os.stat(path).st_mtime_ns, length, postings
+
+
+def parseQuery(query):
+    groups = []
+    for phrase, word in QUERY_RE.findall(query.lower()):
+        tokens = TOKEN_RE.findall(phrase or word)
+        if tokens:
+            groups.append(tokens)
+    return groups
+
+
+def writeSegment(path, postings):
+    terms = sorted(postings)
+    encoded = [term.encode('utf-8') for term in terms]
+
+    termStart = SEGMENT_HEADER.size + SEGMENT_ENTRY.size * len(terms)
+    postingsStart = termStart + sum(len(term) for term in encoded)
+
+    entries = []
+    termOffset = termStart
+    postingsOffset = postingsStart
+    for term, data in zip(terms, encoded):
+        size = len(postings[term]) * postings[term].itemsize
+        entries.append(SEGMENT_ENTRY.pack(termOffset, len(data), postingsOffset, size))
+        termOffset += len(data)
+        postingsOffset += size
+
+    fd, tmpPath = tempfile.mkstemp(suffix='.tmp', dir=os.path.dirname(path))
+    with os.fdopen(fd, 'wb') as segment:
+        segment.write(SEGMENT_HEADER.pack(SEGMENT_MAGIC, len(terms)))
+        segment.write(b''.join(entries))
+        segment.write(b''.join(encoded))
+        for term in terms:
+            postings[term].tofile(segment)
+    os.replace(tmpPath, path)
+
+
+# Read only view of a segment file. Term lookups are a binary search over the
+# mapped entry table, so only the pages that are touched get read.
+class Segment(object):
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, 'rb')
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.termCount = SEGMENT_HEADER.unpack_from(self.map, 0)
+        if magic != SEGMENT_MAGIC:
+            self.close()
+            raise ValueError("'" + path + "' is not a search index segment")
+
+    def close(self):
+        self.map.close()
+        self.file.close()
+
+    def entry(self, i):
+        termOffset, termLength, postingsOffset, size = \
+            SEGMENT_ENTRY.unpack_from(self.map, SEGMENT_HEADER.size + i * SEGMENT_ENTRY.size)
+        return self.map[termOffset:termOffset + termLength], postingsOffset, size
+
+    def readPostings(self, offset, size):
+        postings = array.array('I')
+        postings.frombytes(self.map[offset:offset + size])
+        return postings
+
+    def postings(self, term):
+        term = term.encode('utf-8')
+        lo, hi = 0, self.termCount
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.entry(mid)[0] < term:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        if lo < self.termCount:
+            found, offset, size = self.entry(lo)
+            if found == term:
+                return self.readPostings(offset, size)
+        return None
+
+    def items(self):
+        for i in range(self.termCount):
+            term, offset, size = self.entry(i)
+            yield term.decode('utf-8'), self.readPostings(offset, size)
+
+
+class SearchIndex(object):
+    def __init__(self, directory, notesDirectory='saved_notes'):
+        self.directory = directory
+        self.notesDirectory = os.path.abspath(notesDirectory)
+        # queries come from the GUI thread, updates from the autosave worker
+        self.lock = threading.RLock()
+
+        # doc id -> [note path, number of tokens, mtime in ns]
+        self.docs = {}
+        self.pathIds = {}
+        self.nextDocId = 0
+        self.totalLength = 0
+
+        self.segments = []
+        self.nextSegment = 0
+
+        # the in memory segment, term -> postings array
+        self.live = {}
+        self.liveSize = 0
+        self.closed = False
+
+        self.load()
+
+    def manifestPath(self):
+        return os.path.join(self.directory, 'manifest.json')
+
+    def load(self):
+        try:
+            with open(self.manifestPath(), 'r') as manifest:
+                state = json.load(manifest)
+        except (FileNotFoundError, ValueError):
+            return
+
+        self.nextDocId = state['nextDocId']
+        self.nextSegment = state['nextSegment']
+        for docId, doc in state['docs'].items():
+            self.docs[int(docId)] = doc
+            self.pathIds[doc[0]] = int(docId)
+            self.totalLength += doc[1]
+        for name in state['segments']:
+            self.segments.append(Segment(os.path.join(self.directory, name)))
+
+    def saveManifest(self):
+        state = {
+            'nextDocId': self.nextDocId,
+            'nextSegment': self.nextSegment,
+            'segments': [os.path.basename(segment.path) for segment in self.segments],
+            'docs': self.docs,
+        }
+        fd, tmpPath = tempfile.mkstemp(suffix='.tmp', dir=self.directory)
+        with os.fdopen(fd, 'w') as manifest:
+            json.dump(state, manifest)
+        os.replace(tmpPath, self.manifestPath())
+
+    def isNote(self, path):
+        return os.path.dirname(path) == self.notesDirectory and isNoteName(path)
+
+    # called from the save path whenever a note has been written
+    def update(self, path, text):
+        path = os.path.abspath(path)
+        if not self.isNote(path):
+            return
+        postings, length = tokenize(text)
+        mtime = os.stat(path).st_mtime_ns if os.path.exists(path) else 0
+        with self.lock:
+            self.addDocument(path, mtime, length, postings)
+
+    def remove(self, path):
+        with self.lock:
+            self.removeDocument(os.path.abspath(path))
+
+    def addDocument(self, path, mtime, length, postings):
+        self.removeDocument(path)
+
+        docId = self.nextDocId
+        self.nextDocId += 1
+        self.docs[docId] = [path, length, mtime]
+        self.pathIds[path] = docId
+        self.totalLength += length
+
+        for term, positions in postings.items():
+            termPostings = self.live.get(term)
+            if termPostings is None:
+                termPostings = self.live[term] = array.array('I')
+            termPostings.append(docId)
+            termPostings.append(len(positions))
+            termPostings.extend(positions)
+            self.liveSize += len(positions) + 2
+
+        if self.liveSize >= LIVE_SEGMENT_LIMIT:
+            self.flush()
+
+    # postings of removed notes stay in their segment until the next merge,
+    # lookups skip any doc id that isn't in self.docs anymore
+    def removeDocument(self, path):
+        docId = self.pathIds.pop(path, None)
+        if docId is not None:
+            self.totalLength -= self.docs.pop(docId)[1]
+
+    # writes the in memory segment to disk
+    def flush(self):
+        with self.lock:
+            os.makedirs(self.directory, exist_ok=True)
+            if self.live:
+                self.addSegment(self.live)
+                self.live = {}
+                self.liveSize = 0
+            if len(self.segments) > MAX_SEGMENTS:
+                self.merge()
+            self.saveManifest()
+
+    def addSegment(self, postings):
+        path = os.path.join(self.directory, 'segment%d.idx' % self.nextSegment)
+        self.nextSegment += 1
+        writeSegment(path, postings)
+        self.segments.append(Segment(path))
+
+    # rewrites every segment into a single one without the dead postings
+    def merge(self):
+        merged = {}
+        for segment in self.segments:
+            for term, postings in segment.items():
+                alive = self.filterPostings(postings)
+                if alive:
+                    merged.setdefault(term, array.array('I')).extend(alive)
+
+        old = self.segments
+        self.segments = []
+        if merged:
+            self.addSegment(merged)
+        for segment in old:
+            segment.close()
+            os.remove(segment.path)
+
+    def filterPostings(self, postings):
+        alive = array.array('I')
+        i = 0
+        while i < len(postings):
+            end = i + 2 + postings[i + 1]
+            if postings[i] in self.docs:
+                alive.extend(postings[i:end])
+            i = end
+        return alive
+
+    # returns {doc id: positions} for every live note containing term
+    def lookup(self, term):
+        found = {}
+        sources = [segment.postings(term) for segment in self.segments]
+        sources.append(self.live.get(term))
+        for postings in sources:
+            if postings is None:
+                continue
+            i = 0
+            while i < len(postings):
+                docId = postings[i]
+                end = i + 2 + postings[i + 1]
+                if docId in self.docs:
+                    found[docId] = postings[i + 2:end]
+                i = end
+        return found
+
+    # Returns up to limit (score, note path) pairs, best match first. Every
+    # word and "quoted phrase" in the query has to be in a note for it to match.
+    def search(self, query, limit=50):
+        groups = parseQuery(query)
+        if not groups:
+            return []
+
+        with self.lock:
+            terms = {term for group in groups for term in group}
+            postings = {term: self.lookup(term) for term in terms}
+
+            candidates = None
+            for term in terms:
+                docs = set(postings[term])
+                candidates = docs if candidates is None else candidates & docs
+                if not candidates:
+                    return []
+
+            for group in groups:
+                if len(group) > 1:
+                    candidates = {docId for docId in candidates
+                                  if self.hasPhrase(docId, group, postings)}
+
+            results = [(self.score(docId, terms, postings), self.docs[docId][0])
+                       for docId in candidates]
+
+        results.sort(key=lambda result: (-result[0], result[1]))
+        return results[:limit]
+
+    def hasPhrase(self, docId, phrase, postings):
+        following = [set(postings[term][docId]) for term in phrase[1:]]
+        for start in postings[phrase[0]][docId]:
+            if all(start + offset in positions for offset, positions in enumerate(following, 1)):
+                return True
+        return False
+
+    # BM25
+    def score(self, docId, terms, postings):
+        count = len(self.docs)
+        averageLength = self.totalLength / count if count else 1.0
+        length = self.docs[docId][1]
+
+        score = 0.0
+        for term in terms:
+            frequency = len(postings[term][docId])
+            documents = len(postings[term])
+            idf = math.log(1 + (count - documents + 0.5) / (documents + 0.5))
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * length / (averageLength or 1.0))
+            score += idf * frequency * (BM25_K1 + 1) / (frequency + norm)
+        return score
+
+    # Brings the index up to date with the notes folder, e.g. after notes were
+    # changed while the app wasn't running. Large batches of notes are
+    # tokenized across a process pool.
+    def refresh(self, processes=None):
+        try:
+            with os.scandir(self.notesDirectory) as entries:
+                notes = {os.path.abspath(entry.path): entry.stat().st_mtime_ns
+                         for entry in entries if isNoteName(entry.name)}
+        except FileNotFoundError:
+            notes = {}
+
+        with self.lock:
+            for path in list(self.pathIds):
+                if path not in notes:
+                    self.removeDocument(path)
+            stale = [path for path, mtime in notes.items()
+                     if path not in self.pathIds or self.docs[self.pathIds[path]][2] != mtime]
+
+        if len(stale) >= PARALLEL_INDEX_MIN and processes != 1:
+            with concurrent.futures.ProcessPoolExecutor(processes) as pool:
+                self.addResults(pool.map(indexFile, stale, chunksize=64))
+        else:
+            self.addResults(map(indexFile, stale))
+
+        self.flush()
+        return len(stale)
+
+    def addResults(self, results):
+        for path, mtime, length, postings in results:
+            with self.lock:
+                # the note may have been saved again while it was being read
+                docId = self.pathIds.get(path)
+                if docId is not None and self.docs[docId][2] > mtime:
+                    continue
+                self.addDocument(path, mtime, length, postings)
+
+    # throws the whole index away and indexes every note again
+    def rebuild(self, processes=None):
+        with self.lock:
+            for segment in self.segments:
+                segment.close()
+                os.remove(segment.path)
+            self.segments = []
+            self.live = {}
+            self.liveSize = 0
+            self.docs = {}
+            self.pathIds = {}
+            self.totalLength = 0
+        return self.refresh(processes)
+
+    def close(self):
+        with self.lock:
+            if self.closed:
+                return
+            self.closed = True
+            self.flush()
+            for segment in self.segments:
+                segment.close()
+            self.segments = []
+
+
+class SearchIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.notes = os.path.join(self.tmp.name, 'notes')
+        os.mkdir(self.notes)
+        self.index = SearchIndex(os.path.join(self.tmp.name, 'index'), self.notes)
+
+    def tearDown(self):
+        self.index.close()
+        self.tmp.cleanup()
+
+    def save(self, name, text):
+        path = os.path.join(self.notes, name + '.txt')
+        with open(path, 'w') as note:
+            note.write(text)
+        self.index.update(path, text)
+        return path
+
+    def test_ranked_results(self):
+        often = self.save('often', 'apple apple apple pie')
+        once = self.save('once', 'apple tart and some other words')
+        self.save('never', 'banana')
+
+        results = [path for score, path in self.index.search('apple')]
+        self.assertEqual(results, [often, once])
+
+    def test_phrase_query(self):
+        inOrder = self.save('inorder', 'the quick brown fox')
+        self.save('reversed', 'brown quick')
+
+        self.assertEqual([path for score, path in self.index.search('"quick brown"')], [inOrder])
+
+    # results survive segments being written, merged and loaded again
+    def test_segments_persist(self):
+        path = self.save('first', 'first version')
+        self.index.flush()
+        for i in range(MAX_SEGMENTS + 1):
+            self.save('other%d' % i, 'filler')
+            self.index.flush()
+        self.save('first', 'second version')
+        self.index.close()
+
+        index = SearchIndex(self.index.directory, self.notes)
+        try:
+            self.assertEqual(index.search('first'), [])
+            self.assertEqual([result[1] for result in index.search('second')], [path])
+            self.assertLess(len(index.segments), MAX_SEGMENTS)
+        finally:
+            index.close()
+
+    def test_refresh_picks_up_changes(self):
+        path = os.path.join(self.notes, 'offline.txt')
+        with open(path, 'w') as note:
+            note.write('written while closed')
+        self.assertEqual(self.index.refresh(processes=1), 1)
+        self.assertEqual([result[1] for result in self.index.search('closed')], [path])
+        self.assertEqual(self.index.refresh(processes=1), 0)
+
+    # notes in the note format are indexed by their text, not their markup
+    def test_refresh_note_format(self):
+        path = os.path.join(self.notes, 'formatted' + noteformat.SUFFIX)
+        with open(path, 'wb') as note:
+            note.write(noteformat.MAGIC + noteformat.encodeBlock('bold words', spans=[[0, 4, {8195: 75}]]))
+        self.assertEqual(self.index.refresh(processes=1), 1)
+        self.assertEqual([result[1] for result in self.index.search('bold')], [path])
+        self.assertEqual(self.index.search('spans'), [])
+
+    def test_refresh_compressed(self):
+        path = os.path.join(self.notes, 'transcript.txt' + notefiles.ZLIB_SUFFIX)
+        with open(path, 'wb') as note:
+            note.write(notefiles.encode(path, b'squeezed meeting transcript'))
+        self.assertEqual(self.index.refresh(processes=1), 1)
+        self.assertEqual([result[1] for result in self.index.search('squeezed')], [path])
@@ -0,0 +1,483 @@
+#!/usr/bin/env python3
+
+# Where notes are kept. The app reads, writes and lists notes through a
+# NoteStore, which takes note paths the way the rest of the app knows them:
+#
+#   FolderStore  notes are files in folders, saved_notes/ by default
+#   SqliteStore  notes, their folders and their metadata are rows of a single
+#                SQLite database. The paths of its notes are the database's
+#                path followed by folder and note names, notes.db/work/plan.note
+#
+# In a SqliteStore, listing a folder or looking up a name is one query on one
+# file instead of a directory listing and a stat() per note, which is what
+# network drives are slow at. A folder of notes is moved into a database (or
+# back out of one) in a single transaction:
+#
+#     python notestore.py import notes.db saved_notes
+#     python notestore.py export notes.db exported_notes
+#
+# This module doesn't import Qt so it can be used without loading it.
+
+import contextlib
+import io
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+import unittest
+import weakref
+
+# parent of the entries at the top of a database
+ROOT_ID = 0
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    parent INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    isDir INTEGER NOT NULL,
+    content BLOB,
+    size INTEGER NOT NULL DEFAULT 0,
+    modified REAL NOT NULL,
+    UNIQUE (parent, name)
+);
+'''
+
+# sqlite3 keeps this many prepared statements per connection. Every query
+# below is a constant string with ? parameters, so each is prepared once.
+CACHED_STATEMENTS = 64
+
+
+# The interface both stores implement. Paths that don't exist raise
+# FileNotFoundError and friends, the way os functions do.
+class NoteStore(object):
+    # notes are files of their own, so they can be watched for changes,
+    # journaled and memory mapped
+    local = False
+
+    def __init__(self, root):
+        self.root = root
+        # see addListener
+        self.listeners = []
+
+    def contains(self, path):
+        raise NotImplementedError
+
+    # [(name, isDir), ...] of everything in a folder, in no particular order
+    def list(self, path):
+        raise NotImplementedError
+
+    def isFile(self, path):
+        raise NotImplementedError
+
+    def isDir(self, path):
+        raise NotImplementedError
+
+    def size(self, path):
+        raise NotImplementedError
+
+    # the note as a binary file object
+    def open(self, path):
+        raise NotImplementedError
+
+    def read(self, path):
+        with self.open(path) as note:
+            return note.read()
+
+    # replaces the note with data in one go, a crash never leaves half of it
+    def write(self, path, data):
+        raise NotImplementedError
+
+    def remove(self, path):
+        raise NotImplementedError
+
+    def makeFolder(self, path):
+        raise NotImplementedError
+
+    # Calls listener(folder path) after something in that folder changed,
+    # from whichever thread changed it. Stores that aren't local can't be
+    # watched otherwise. Listeners are bound methods, which are only weakly
+    # referenced, so a listener going away doesn't have to remove itself.
+    def addListener(self, listener):
+        self.listeners.append(weakref.WeakMethod(listener))
+
+    def changed(self, path):
+        self.listeners = [listener for listener in self.listeners if listener() is not None]
+        for listener in self.listeners:
+            method = listener()
+            if method is not None:
+                method(os.path.dirname(path))
+
+
+# Writes data to path through a temp file and a rename, so a crash part way
+# through never leaves a truncated note behind
+def atomicWrite(path, data):
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmpPath = tempfile.mkstemp(prefix='.' + os.path.basename(path), suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as tmp:
+            tmp.write(data)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        if os.path.exists(path):
+            shutil.copymode(path, tmpPath)
+        os.replace(tmpPath, path)
+    except BaseException:
+        if os.path.exists(tmpPath):
+            os.remove(tmpPath)
+        raise
+
+
+# Notes as plain files. Without a root it takes any path, e.g. for files
+# opened from elsewhere on disk.
+class FolderStore(NoteStore):
+    local = True
+
+    def __init__(self, root=None):
+        super(FolderStore, self).__init__(root)
+
+    def contains(self, path):
+        if self.root is None:
+            return True
+        root = os.path.abspath(self.root)
+        path = os.path.abspath(path)
+        return path == root or path.startswith(root + os.sep)
+
+    # scandir knows which entries are folders without a stat() for each one
+    def list(self, path):
+        entries = []
+        with os.scandir(path) as found:
+            for entry in found:
+                try:
+                    entries.append((entry.name, entry.is_dir()))
+                except OSError:
+                    continue
+        return entries
+
+    def isFile(self, path):
+        return os.path.isfile(path)
+
+    def isDir(self, path):
+        return os.path.isdir(path)
+
+    def size(self, path):
+        return os.path.getsize(path)
+
+    def open(self, path):
+        return open(path, 'rb')
+
+    def write(self, path, data):
+        atomicWrite(path, data)
+
+    def remove(self, path):
+        os.remove(path)
+
+    def makeFolder(self, path):
+        os.mkdir(path)
+
+
+# Notes in a SQLite database, in WAL mode so reading never waits for a
+# write. The connection is shared by the GUI and the worker threads, one
+# statement (or transaction) at a time.
+class SqliteStore(NoteStore):
+    def __init__(self, path):
+        super(SqliteStore, self).__init__(path)
+        self.rootPath = os.path.abspath(path)
+        self.lock = threading.RLock()
+        # transactions are started explicitly, see transaction()
+        self.connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None,
+                                          cached_statements=CACHED_STATEMENTS)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        # in WAL mode a commit is still atomic without syncing every time
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.executescript(SCHEMA)
+        # folder names from the top -> id
+        self.folderIds = {(): ROOT_ID}
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+    @contextlib.contextmanager
+    def transaction(self):
+        with self.lock:
+            self.connection.execute('BEGIN IMMEDIATE')
+            try:
+                yield self.connection
+            except BaseException:
+                self.connection.execute('ROLLBACK')
+                # folders made by the transaction are gone again
+                self.folderIds = {(): ROOT_ID}
+                raise
+            self.connection.execute('COMMIT')
+
+    def contains(self, path):
+        path = os.path.abspath(path)
+        return path == self.rootPath or path.startswith(self.rootPath + os.sep)
+
+    # ('work', 'plan.note') for notes.db/work/plan.note
+    def names(self, path):
+        if not self.contains(path):
+            raise FileNotFoundError(path)
+        relative = os.path.relpath(os.path.abspath(path), self.rootPath)
+        if relative == os.curdir:
+            return ()
+        return tuple(relative.split(os.sep))
+
+    def folderId(self, names):
+        folderId = self.folderIds.get(names)
+        if folderId is not None:
+            return folderId
+        parent = self.folderId(names[:-1])
+        if parent is None:
+            return None
+        row = self.connection.execute('SELECT id FROM entries WHERE parent = ? AND name = ? AND isDir = 1',
+                                      (parent, names[-1])).fetchone()
+        if row is None:
+            return None
+        self.folderIds[names] = row[0]
+        return row[0]
+
+    # (id of the folder it is in, its name, its row or None)
+    def lookup(self, path):
+        names = self.names(path)
+        if not names:
+            return None, None, (ROOT_ID, 1, 0)
+        parent = self.folderId(names[:-1])
+        if parent is None:
+            return None, names[-1], None
+        row = self.connection.execute('SELECT id, isDir, size FROM entries WHERE parent = ? AND name = ?',
+                                      (parent, names[-1])).fetchone()
+        return parent, names[-1], row
+
+    def list(self, path):
+        with self.lock:
+            folderId = self.folderId(self.names(path))
+            if folderId is None:
+                raise FileNotFoundError(path)
+            return [(name, bool(isDir)) for name, isDir in
+                    self.connection.execute('SELECT name, isDir FROM entries WHERE parent = ?', (folderId,))]
+
+    def isFile(self, path):
+        if not self.contains(path):
+            return False
+        with self.lock:
+            row = self.lookup(path)[2]
+        return row is not None and not row[1]
+
+    def isDir(self, path):
+        if not self.contains(path):
+            return False
+        with self.lock:
+            row = self.lookup(path)[2]
+        return row is not None and bool(row[1])
+
+    def size(self, path):
+        with self.lock:
+            row = self.lookup(path)[2]
+        if row is None or row[1]:
+            raise FileNotFoundError(path)
+        return row[2]
+
+    # notes are read whole, a blob can't be read past the statement that
+    # found it without holding the connection
+    def open(self, path):
+        return io.BytesIO(self.read(path))
+
+    def read(self, path):
+        with self.lock:
+            row = self.lookup(path)[2]
+            if row is None:
+                raise FileNotFoundError(path)
+            if row[1]:
+                raise IsADirectoryError(path)
+            return self.connection.execute('SELECT content FROM entries WHERE id = ?', (row[0],)).fetchone()[0]
+
+    def write(self, path, data):
+        with self.lock:
+            parent, name, row = self.lookup(path)
+            if parent is None:
+                raise FileNotFoundError(path)
+            if row is not None and row[1]:
+                raise IsADirectoryError(path)
+            self.connection.execute(
+                'INSERT INTO entries (parent, name, isDir, content, size, modified) VALUES (?, ?, 0, ?, ?, ?) '
+                'ON CONFLICT (parent, name) DO UPDATE SET content = excluded.content, '
+                'size = excluded.size, modified = excluded.modified',
+                (parent, name, data, len(data), time.time()))
+        self.changed(path)
+
+    # only notes are removed, like os.remove()
+    def remove(self, path):
+        with self.lock:
+            row = self.lookup(path)[2]
+            if row is None:
+                raise FileNotFoundError(path)
+            if row[1]:
+                raise IsADirectoryError(path)
+            self.connection.execute('DELETE FROM entries WHERE id = ?', (row[0],))
+        self.changed(path)
+
+    def makeFolder(self, path):
+        with self.lock:
+            parent, name, row = self.lookup(path)
+            if parent is None:
+                raise FileNotFoundError(path)
+            if row is not None:
+                raise FileExistsError(path)
+            self.connection.execute('INSERT INTO entries (parent, name, isDir, modified) VALUES (?, ?, 1, ?)',
+                                    (parent, name, time.time()))
+        self.changed(path)
+
+    # Copies the notes and folders under folder into the database, replacing
+    # notes of the same name. Hidden files and folders (the app's journals,
+    # session and search index) are left out. Either everything is imported
+    # or, on an error, nothing is. Returns the number of notes.
+    def importFolder(self, folder):
+        count = 0
+        with self.transaction() as connection:
+            for directory, dirNames, fileNames in os.walk(folder):
+                dirNames[:] = sorted(name for name in dirNames if not name.startswith('.'))
+                relative = os.path.relpath(directory, folder)
+                names = () if relative == os.curdir else tuple(relative.split(os.sep))
+                parent = self.folderId(names)
+
+                connection.executemany(
+                    'INSERT INTO entries (parent, name, isDir, modified) VALUES (?, ?, 1, ?) '
+                    'ON CONFLICT (parent, name) DO NOTHING',
+                    [(parent, name, os.path.getmtime(os.path.join(directory, name))) for name in dirNames])
+
+                notes = []
+                for name in fileNames:
+                    if name.startswith('.'):
+                        continue
+                    path = os.path.join(directory, name)
+                    with open(path, 'rb') as note:
+                        data = note.read()
+                    notes.append((parent, name, data, len(data), os.path.getmtime(path)))
+                connection.executemany(
+                    'INSERT INTO entries (parent, name, isDir, content, size, modified) VALUES (?, ?, 0, ?, ?, ?) '
+                    'ON CONFLICT (parent, name) DO UPDATE SET content = excluded.content, '
+                    'size = excluded.size, modified = excluded.modified',
+                    notes)
+                count += len(notes)
+        self.changed(os.path.join(self.root, ''))
+        return count
+
+    # Writes every note and folder of the database out under folder, with
+    # their modification times. Returns the number of notes.
+    def exportFolder(self, folder):
+        count = 0
+        # parents always have a lower id than what is in them
+        paths = {ROOT_ID: folder}
+        os.makedirs(folder, exist_ok=True)
+        with self.lock:
+            rows = self.connection.execute('SELECT id, parent, name, isDir, content, modified FROM entries ORDER BY id')
+            for entryId, parent, name, isDir, content, modified in rows:
+                path = os.path.join(paths[parent], name)
+                if isDir:
+                    paths[entryId] = path
+                    os.makedirs(path, exist_ok=True)
+                    continue
+                with open(path, 'wb') as note:
+                    note.write(content)
+                os.utime(path, (modified, modified))
+                count += 1
+        return count
+
+
+class NoteStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = SqliteStore(os.path.join(self.tmp.name, 'notes.db'))
+        self.root = self.store.root
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_notes(self):
+        work = os.path.join(self.root, 'work')
+        plan = os.path.join(work, 'plan.note')
+        with self.assertRaises(FileNotFoundError):
+            self.store.write(plan, b'x')
+
+        self.store.makeFolder(work)
+        self.store.write(plan, b'first')
+        self.store.write(plan, b'second draft')
+        self.store.write(os.path.join(self.root, 'todo.txt'), b'milk')
+
+        self.assertEqual(self.store.read(plan), b'second draft')
+        self.assertEqual(self.store.size(plan), 12)
+        self.assertTrue(self.store.isFile(plan))
+        self.assertTrue(self.store.isDir(work))
+        self.assertFalse(self.store.isFile(work))
+        self.assertFalse(self.store.isFile(os.path.join(self.tmp.name, 'plan.note')))
+        self.assertEqual(sorted(self.store.list(self.root)), [('todo.txt', False), ('work', True)])
+        self.assertEqual(self.store.list(work), [('plan.note', False)])
+
+        self.store.remove(plan)
+        self.assertFalse(self.store.isFile(plan))
+        with self.assertRaises(IsADirectoryError):
+            self.store.remove(work)
+        self.assertEqual(self.store.connection.execute('PRAGMA journal_mode').fetchone()[0], 'wal')
+
+    def test_listeners(self):
+        class Listener(object):
+            def __init__(self):
+                self.folders = []
+
+            def changed(self, path):
+                self.folders.append(path)
+
+        listener = Listener()
+        self.store.addListener(listener.changed)
+        self.store.write(os.path.join(self.root, 'a.txt'), b'')
+        self.assertEqual(listener.folders, [self.root])
+        del listener
+        self.store.write(os.path.join(self.root, 'b.txt'), b'')
+        self.assertEqual(self.store.listeners, [])
+
+    # a folder goes in and comes back out the same, without the hidden parts
+    def test_import_export(self):
+        source = os.path.join(self.tmp.name, 'notes')
+        for name in ['a.txt', 'work/plan.note', 'work/old/log.txt.z', '.journal/1.log']:
+            path = os.path.join(source, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as note:
+                note.write(name.encode('utf-8'))
+        self.assertEqual(self.store.importFolder(source), 3)
+        self.assertEqual(self.store.read(os.path.join(self.root, 'work', 'old', 'log.txt.z')), b'work/old/log.txt.z')
+
+        target = os.path.join(self.tmp.name, 'exported')
+        self.assertEqual(self.store.exportFolder(target), 3)
+        for name in ['a.txt', 'work/plan.note', 'work/old/log.txt.z']:
+            with open(os.path.join(target, name), 'rb') as note:
+                self.assertEqual(note.read(), name.encode('utf-8'))
+        self.assertFalse(os.path.exists(os.path.join(target, '.journal')))
+
+    # an import that fails part way leaves nothing behind
+    def test_import_is_atomic(self):
+        source = os.path.join(self.tmp.name, 'notes')
+        os.makedirs(source)
+        with open(os.path.join(source, 'a.txt'), 'wb') as note:
+            note.write(b'a')
+        os.symlink(os.path.join(source, 'missing'), os.path.join(source, 'b.txt'))
+        with self.assertRaises(OSError):
+            self.store.importFolder(source)
+        self.assertEqual(self.store.list(self.root), [])
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 4 or sys.argv[1] not in ('import', 'export'):
+        print('usage: python notestore.py import|export <database> <folder>', file=sys.stderr)
+        sys.exit(2)
+    store = SqliteStore(sys.argv[2])
+    if sys.argv[1] == 'import':
+        print('imported %d notes into %s' % (store.importFolder(sys.argv[3]), sys.argv[2]))
+    else:
+        print('exported %d notes to %s' % (store.exportFolder(sys.argv[3]), sys.argv[3]))
+    store.close()
@@ -0,0 +1,12044 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.14)
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x25\xe6\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\xb4\x00\x00\x02\x52\x08\x06\x00\x00\x00\x32\x23\x56\x45\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
+\x84\x65\x58\x49\x66\x4d\x4d\x00\x2a\x00\x00\x00\x08\x00\x05\x01\
+\x12\x00\x03\x00\x00\x00\x01\x00\x01\x00\x00\x01\x1a\x00\x05\x00\
+\x00\x00\x01\x00\x00\x00\x4a\x01\x1b\x00\x05\x00\x00\x00\x01\x00\
+\x00\x00\x52\x01\x28\x00\x03\x00\x00\x00\x01\x00\x02\x00\x00\x87\
+\x69\x00\x04\x00\x00\x00\x01\x00\x00\x00\x5a\x00\x00\x00\x00\x00\
+\x00\x00\x48\x00\x00\x00\x01\x00\x00\x00\x48\x00\x00\x00\x01\x00\
+\x03\xa0\x01\x00\x03\x00\x00\x00\x01\x00\x01\x00\x00\xa0\x02\x00\
+\x04\x00\x00\x00\x01\x00\x00\x02\xb4\xa0\x03\x00\x04\x00\x00\x00\
+\x01\x00\x00\x02\x52\x00\x00\x00\x00\x4a\x67\x03\x8d\x00\x00\x00\
+\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\x9a\
+\x9c\x18\x00\x00\x01\x59\x69\x54\x58\x74\x58\x4d\x4c\x3a\x63\x6f\
+\x6d\x2e\x61\x64\x6f\x62\x65\x2e\x78\x6d\x70\x00\x00\x00\x00\x00\
+\x3c\x78\x3a\x78\x6d\x70\x6d\x65\x74\x61\x20\x78\x6d\x6c\x6e\x73\
+\x3a\x78\x3d\x22\x61\x64\x6f\x62\x65\x3a\x6e\x73\x3a\x6d\x65\x74\
+\x61\x2f\x22\x20\x78\x3a\x78\x6d\x70\x74\x6b\x3d\x22\x58\x4d\x50\
+\x20\x43\x6f\x72\x65\x20\x35\x2e\x34\x2e\x30\x22\x3e\x0a\x20\x20\
+\x20\x3c\x72\x64\x66\x3a\x52\x44\x46\x20\x78\x6d\x6c\x6e\x73\x3a\
+\x72\x64\x66\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x30\x32\x2f\x32\
+\x32\x2d\x72\x64\x66\x2d\x73\x79\x6e\x74\x61\x78\x2d\x6e\x73\x23\
+\x22\x3e\x0a\x20\x20\x20\x20\x20\x20\x3c\x72\x64\x66\x3a\x44\x65\
+\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x20\x72\x64\x66\x3a\x61\x62\
+\x6f\x75\x74\x3d\x22\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\x74\x69\x66\x66\x3d\x22\x68\
+\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\
+\x6f\x6d\x2f\x74\x69\x66\x66\x2f\x31\x2e\x30\x2f\x22\x3e\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x3c\x74\x69\x66\x66\x3a\x4f\x72\
+\x69\x65\x6e\x74\x61\x74\x69\x6f\x6e\x3e\x31\x3c\x2f\x74\x69\x66\
+\x66\x3a\x4f\x72\x69\x65\x6e\x74\x61\x74\x69\x6f\x6e\x3e\x0a\x20\
+\x20\x20\x20\x20\x20\x3c\x2f\x72\x64\x66\x3a\x44\x65\x73\x63\x72\
+\x69\x70\x74\x69\x6f\x6e\x3e\x0a\x20\x20\x20\x3c\x2f\x72\x64\x66\
+\x3a\x52\x44\x46\x3e\x0a\x3c\x2f\x78\x3a\x78\x6d\x70\x6d\x65\x74\
+\x61\x3e\x0a\x4c\xc2\x27\x59\x00\x00\x23\x96\x49\x44\x41\x54\x78\
+\x01\xed\xdd\x6b\xc8\x25\x75\x1d\x07\xf0\xad\x4d\x53\x57\xcc\x76\
+\xb5\x28\x8b\xa2\x50\x53\x13\x13\x5b\xca\xca\xec\x42\xb4\xb9\x90\
+\x2f\xb2\x0b\x84\x84\x2f\xb6\x28\x8a\x2e\xaf\xb3\x17\x05\x41\x41\
+\x50\x74\xb3\x8b\x05\xbd\x29\x92\x20\x2b\xcd\x92\xc0\x2c\xb4\x14\
+\x4b\xb7\xda\xcc\xc8\x5a\xd3\x0d\x53\x57\xb1\xdd\xb4\x55\x77\xfb\
+\xfe\x9f\x55\x78\x9e\xf5\x5c\x66\xce\x99\x33\x67\xce\x99\xcf\xc0\
+\x8f\x3d\x67\xe6\xf7\xbf\x7d\xe6\xc0\xf3\x7b\x66\xe7\xcc\xb3\x6e\
+\x9d\x8d\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x81\xae\x08\x3c\xa5\x2b\x13\x31\x8f\xa9\x04\x8e\x48\xeb\
+\x2d\x89\x73\x13\x67\x24\x4e\x48\x6c\x4a\x6c\x48\x1c\x96\x78\x6a\
+\xc2\xb9\x0e\x82\x8d\x00\x01\x02\x04\x7a\x27\x70\x20\x2b\xde\x9f\
+\x78\x24\xb1\x37\x71\x5f\xe2\xce\xc4\x2d\x89\x6b\x13\x57\x25\x1e\
+\x4e\xd8\x16\x58\x40\x91\xb3\x98\x27\xaf\x14\xac\xef\x4d\x9c\x97\
+\x78\x49\xe2\xe8\x84\x8d\x00\x01\x02\x04\x08\x10\x98\x4c\xe0\x3f\
+\x69\x76\x6b\xe2\xca\xc4\x37\x12\x77\x25\x6c\x0b\x24\xa0\xa0\x5d\
+\x9c\x93\x75\x66\xa6\x7a\x71\xe2\x75\x89\x67\x26\x6c\x04\x08\x10\
+\x20\x40\x80\xc0\x6c\x04\x76\xa7\xdb\x6b\x12\x9f\x4a\xdc\x9c\xb0\
+\x75\x5c\x40\x41\xdb\xed\x13\x74\x6c\xa6\xf7\xe9\xc4\xbb\x12\x8a\
+\xd8\x6e\x9f\x2b\xb3\x23\x40\x80\x00\x81\xe5\x14\x28\xc5\xed\x77\
+\x13\x1f\x4f\x3c\xb0\x9c\x4b\x5c\xfc\x55\x29\x68\xbb\x79\x0e\xcb\
+\xd5\xd8\xaf\x24\x5e\x91\x70\x8e\xba\x79\x8e\xcc\x8a\x00\x01\x02\
+\x04\xfa\x25\x50\xee\xc5\xbd\x2e\xf1\x81\xc4\xf6\x7e\x2d\xbd\xfb\
+\xab\x55\x2c\x75\xeb\x1c\x95\x02\xf6\x5b\x89\x53\xbb\x35\x2d\xb3\
+\x21\x40\x80\x00\x01\x02\x04\x56\x09\xfc\x21\xaf\x2f\x4a\xdc\xb4\
+\x6a\x9f\x97\x73\x14\x50\xd0\xce\x11\x7f\xd5\xd0\x2f\xc8\xeb\xcb\
+\x12\x9b\x57\xed\xf3\x92\x00\x01\x02\x04\x08\x10\xe8\xb6\xc0\x6f\
+\x32\xbd\x0b\x12\xbe\x44\x36\xe7\xf3\x54\x1e\xe7\x64\x9b\x9f\x40\
+\xf1\xff\x66\xe2\xf6\x84\x62\x76\x7e\xe7\xc1\xc8\x04\x08\x10\x20\
+\x40\x60\x12\x81\x57\xa6\xd1\x1d\x89\xaf\x26\xd4\x54\x93\x08\x36\
+\xd4\xc6\x15\xda\x86\x20\x27\xe8\xe6\xb5\x69\x73\x79\xa2\x7c\xf1\
+\xcb\x46\x80\x00\x01\x02\x04\x08\x2c\xb6\x40\xf9\xf2\xd8\xd6\x44\
+\xb9\x6a\x6b\x6b\x59\xc0\x6f\x13\x2d\x83\x67\xb8\x62\x7e\x69\xe2\
+\x9a\x84\x62\x36\x08\x36\x02\x04\x08\x10\x20\xb0\x04\x02\x1b\xb3\
+\x86\xf2\xa5\xb1\x4b\x96\x60\x2d\x0b\xb7\x04\x57\x68\xdb\x3d\x65\
+\xcf\xca\x70\xe5\xc3\xfe\xe2\x76\x87\x35\x1a\x01\x02\x04\x08\x10\
+\x20\xd0\xa2\xc0\x6d\x19\xeb\xec\x44\xb9\x6a\x6b\x6b\x41\xc0\x15\
+\xda\x16\x90\x1f\x1f\xa2\xdc\x23\xfb\x8f\x84\x62\xf6\x71\x10\xff\
+\x10\x20\x40\x80\x00\x81\x25\x15\x38\x29\xeb\xba\x23\x71\xd6\x92\
+\xae\xaf\x73\xcb\x52\xd0\xb6\x73\x4a\xde\x99\x61\xca\x3d\x35\x47\
+\xb6\x33\x9c\x51\x08\x10\x20\x40\x80\x00\x81\x39\x0b\x6c\xc8\xf8\
+\xbf\x4d\x94\xa7\x20\xd8\x66\x2c\xb0\x7e\xc6\xfd\xeb\x7e\xdd\xba\
+\x0f\x05\xa1\x3c\xc9\xc0\x2f\x0f\x3e\x0d\x04\x08\x10\x20\x40\xa0\
+\x5f\x02\xe5\x67\xff\xdb\x13\xf7\x24\x6e\xec\xd7\xd2\xdb\x5d\xad\
+\x82\x76\xb6\xde\x1f\x49\xf7\x5f\x48\xb8\x57\x79\xb6\xce\x7a\x27\
+\x40\x80\x00\x01\x02\x5d\x15\x28\x35\x40\x79\xfa\xc1\xbd\x09\x45\
+\xed\x8c\xce\x92\x82\x76\x46\xb0\xe9\x76\x5b\xe2\xcb\xb3\xeb\x5e\
+\xcf\x04\x08\x10\x20\x40\x80\xc0\x02\x09\x9c\x97\xb9\x96\xfb\x6a\
+\x6f\x5e\xa0\x39\x2f\xcc\x54\x5d\x39\x9c\xcd\xa9\x2a\x1f\xda\x9f\
+\x24\xf8\xce\xc6\x57\xaf\x04\x08\x10\x20\x40\x60\x11\x05\xf6\x67\
+\xd2\x5b\x12\x57\x2f\xe2\xe4\xbb\x3c\x67\x05\x57\xf3\x67\xa7\x3c\
+\xc5\xe0\xcf\x89\xc3\x9a\xef\x5a\x8f\x04\x08\x10\x20\x40\x80\xc0\
+\x82\x0b\xec\xcb\xfc\xcb\x53\x10\x76\x2e\xf8\x3a\x3a\x35\x7d\x05\
+\x6d\xb3\xa7\xe3\xf0\x74\xb7\x2b\xb1\xa9\xd9\x6e\xf5\x46\x80\x00\
+\x01\x02\x04\x08\x2c\x91\x40\xf9\x92\xd8\x73\x13\x8f\x2e\xd1\x9a\
+\xe6\xba\x14\xdf\xbc\x6f\x96\xff\x8a\x74\xa7\x98\x6d\xd6\x54\x6f\
+\x04\x08\x10\x20\x40\x60\xd9\x04\x8e\xcf\x82\x2e\x5f\xb6\x45\xcd\
+\x73\x3d\xbe\x14\xd6\x9c\xfe\x45\xe9\xea\xa3\xcd\x75\xa7\x27\x02\
+\x04\x08\x10\x20\x40\x60\x89\x05\x4e\xcc\xda\xfe\x96\xd8\xbe\xc4\
+\x6b\x6c\x6d\x69\x6e\x39\x68\x86\xfa\x98\x74\xf3\xef\xc4\xd3\x9b\
+\xe9\x4e\x2f\x04\x08\x10\x20\x40\x80\x40\x0f\x04\x1e\xce\x1a\xcb\
+\xd5\xda\x3d\x3d\x58\xeb\x4c\x97\xe8\x96\x83\x66\x78\x7f\x90\x6e\
+\x14\xb3\xcd\x58\xea\x85\x00\x01\x02\x04\x08\xf4\x45\xe0\x88\x2c\
+\xf4\xfb\x7d\x59\xec\x2c\xd7\xe9\x0a\xed\xf4\xba\x9b\xd3\xc5\x0d\
+\xd3\x77\xa3\x07\x02\x04\x08\x10\x20\x40\xa0\x87\x02\x07\xb2\xe6\
+\xb3\x12\xbf\xef\xe1\xda\x1b\x5b\xb2\x82\x76\x7a\xca\x5b\xd3\xc5\
+\xc9\xd3\x77\xa3\x07\x02\x04\x08\x10\x20\x40\xa0\xa7\x02\x3b\xb2\
+\xee\xd3\x7a\xba\xf6\x46\x96\xed\x96\x83\xe9\x18\x5f\x9f\xe6\x8a\
+\xd9\xe9\x0c\xb5\x26\x40\x80\x00\x01\x02\x7d\x17\x38\x35\x00\xe7\
+\xf6\x1d\x61\x9a\xf5\xbb\x42\x3b\x8d\xde\xba\x75\x7f\x4a\xf3\xf2\
+\x21\xb4\x11\x20\x40\x80\x00\x01\x02\x04\xa6\x11\x28\x4f\x3b\x38\
+\x63\x9a\x0e\xfa\xdc\x56\x41\x3b\xf9\xd9\x2f\x7f\xe5\xe3\x2f\x93\
+\x37\xd7\x92\x00\x01\x02\x04\x08\x10\x20\xb0\x46\xe0\x45\x79\xf7\
+\xf7\x35\x7b\xbc\xa9\x24\xe0\x96\x83\x4a\x4c\x03\x93\x3e\x3b\x70\
+\xaf\x9d\x04\x08\x10\x20\x40\x80\x00\x81\xc9\x04\x3e\x33\x59\x33\
+\xad\x5c\xa1\x9d\xfc\x33\xf0\x50\x9a\x96\xc7\x6d\xd8\x08\x10\x20\
+\x40\x80\x00\x01\x02\x4d\x08\x94\xda\xe2\xa8\x26\x3a\xea\x5b\x1f\
+\xae\xd0\x4e\x76\xc6\xb7\xa6\x99\x62\x76\x32\x3b\xad\x08\x10\x20\
+\x40\x80\x00\x81\xc1\x02\x47\x66\xf7\x1b\x07\x1f\xb2\x77\x94\x80\
+\x82\x76\x94\xce\xf0\x63\x1f\x1e\x7e\xc8\x11\x02\x04\x08\x10\x20\
+\x40\x80\xc0\xc4\x02\x1f\x9b\xb8\x65\x8f\x1b\xba\xe5\x60\xb2\x93\
+\x7f\x7f\x9a\x1d\x3b\x59\x53\xad\x08\x10\x20\x40\x80\x00\x01\x02\
+\x43\x05\x76\xe7\xc8\xa6\xa1\x47\x1d\x18\x28\xe0\x0a\xed\x40\x96\
+\x91\x3b\x37\xe6\xa8\x62\x76\x24\x91\x83\x04\x08\x10\x20\x40\x80\
+\xc0\x84\x02\xea\x8c\x09\xe0\x14\xb4\xf5\xd1\xde\x56\xbf\x89\x16\
+\x04\x08\x10\x20\x40\x80\x00\x81\xca\x02\xe7\x57\xce\x94\xb8\x22\
+\xa0\xa0\xad\xff\x41\x78\x53\xfd\x26\x5a\x10\x20\x40\x80\x00\x01\
+\x02\x04\x2a\x0b\x6c\xa9\x9c\x29\x71\x45\x40\x41\x5b\xff\x83\x70\
+\x4a\xfd\x26\x5a\x10\x20\x40\x80\x00\x01\x02\x04\x2a\x0b\xa8\x35\
+\x2a\x53\x1d\x4c\x54\xd0\xd6\x04\x4b\xfa\x73\xea\x37\xd1\x82\x00\
+\x01\x02\x04\x08\x10\x20\x50\x59\xe0\x84\xca\x99\x12\x57\x04\x14\
+\xb4\xf5\x3f\x08\x1b\xea\x37\xd1\x82\x00\x01\x02\x04\x08\x10\x20\
+\x50\x59\x40\xad\x51\x99\xea\x60\xa2\xc7\x76\xd5\x04\x4b\xfa\x63\
+\x09\xbf\x08\xd4\x77\xd3\x82\x00\x01\x02\x04\x08\x10\xa8\x26\xb0\
+\x3f\x69\xeb\xab\xa5\xca\x2a\x02\x0a\xda\xfa\x9f\x83\x03\xf5\x9b\
+\x68\x41\x80\x00\x01\x02\x04\x08\x10\xa8\x25\xa0\x46\xab\xc1\xe5\
+\x4a\x63\x0d\x2c\xa9\x04\x08\x10\x20\x40\x80\x00\x01\x02\xdd\x13\
+\x50\xd0\x76\xef\x9c\x98\x11\x01\x02\x04\x08\x10\x20\x40\x80\x40\
+\x0d\x01\x05\x6d\x0d\x2c\xa9\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\xdd\x13\x50\xd0\xd6\x3f\x27\xe5\x46\x6d\x1b\x01\x02\x04\x08\x10\
+\x20\x40\x60\x56\x02\x6a\x8d\x9a\xb2\x0a\xda\x9a\x60\x49\xdf\x57\
+\xbf\x89\x16\x04\x08\x10\x20\x40\x80\x00\x81\xca\x02\xff\xab\x9c\
+\x29\x71\x45\x40\x41\x5b\xff\x83\xb0\xb7\x7e\x13\x2d\x08\x10\x20\
+\x40\x80\x00\x01\x02\x95\x05\xf6\x54\xce\x94\xb8\x22\xa0\xa0\xad\
+\xff\x41\xd8\x55\xbf\x89\x16\x04\x08\x10\x20\x40\x80\x00\x81\xca\
+\x02\x77\x55\xce\x94\xb8\x22\xa0\xa0\xad\xff\x41\xb8\xb5\x7e\x13\
+\x2d\x08\x10\x20\x40\x80\x00\x01\x02\x95\x05\xd4\x1a\x95\xa9\x0e\
+\x26\x2a\x68\x6b\x82\x25\xfd\xe7\xf5\x9b\x68\x41\x80\x00\x01\x02\
+\x04\x08\x10\xa8\x2c\x70\x55\xe5\x4c\x89\x2b\x02\xfe\x0a\x45\xfd\
+\x0f\xc2\xb1\x69\x72\x7f\xfd\x66\x5a\x10\x20\x40\x80\x00\x01\x02\
+\x04\x2a\x09\x3c\x23\x59\x0f\x56\xca\x94\xb4\x22\xe0\x0a\x6d\xfd\
+\x0f\xc2\x03\x69\xa2\xa0\xad\xef\xa6\x05\x01\x02\x04\x08\x10\x20\
+\x30\x5e\x60\x77\x52\x14\xb3\xe3\x9d\xd6\x64\x28\x68\xd7\x70\x54\
+\x7e\x73\x43\xe5\x4c\x89\x04\x08\x10\x20\x40\x80\x00\x81\xea\x02\
+\xd7\x57\x4f\x95\xf9\x84\x80\x82\xf6\x09\x89\x7a\xff\x7e\xbe\x5e\
+\xba\x6c\x02\x04\x08\x10\x20\x40\x80\x40\x25\x81\xcf\x55\xca\x92\
+\xb4\x46\xc0\x3d\xb4\x6b\x38\x6a\xbd\x79\x28\xd9\x47\xd4\x6a\x21\
+\x99\x00\x01\x02\x04\x08\x10\x20\x30\x5c\xe0\xbf\x39\xb4\x61\xf8\
+\x61\x47\x86\x09\xb8\x42\x3b\x4c\x66\xfc\xfe\x9f\x8e\x4f\x91\x41\
+\x80\x00\x01\x02\x04\x08\x10\xa8\x2c\xf0\xe3\xca\x99\x12\xd7\x08\
+\xb8\x42\xbb\x86\xa3\xd6\x9b\x13\x93\x7d\x5b\xad\x16\x92\x09\x10\
+\x20\x40\x80\x00\x01\x02\xc3\x05\x5e\x98\x43\x3b\x87\x1f\x76\x64\
+\x98\x80\x2b\xb4\xc3\x64\xc6\xef\xff\x6b\x52\xfe\x38\x3e\x4d\x06\
+\x01\x02\x04\x08\x10\x20\x40\x60\xac\xc0\x2d\xc9\x50\xcc\x8e\x65\
+\x1a\x9c\xa0\xa0\x1d\xec\x52\x75\xef\x07\xab\x26\xca\x23\x40\x80\
+\x00\x01\x02\x04\x08\x8c\x10\x50\x53\x8c\xc0\x19\x77\xc8\x2d\x07\
+\xe3\x84\xc6\x1f\xdf\x91\x94\x53\xc6\xa7\xc9\x20\x40\x80\x00\x01\
+\x02\x04\x08\x0c\x14\x28\xff\xe3\x7b\xfa\xc0\x23\x76\x56\x12\x70\
+\x85\xb6\x12\xd3\xc8\xa4\x0b\x47\x1e\x75\x90\x00\x01\x02\x04\x08\
+\x10\x20\x30\x5c\xe0\x40\x0e\xbd\x7b\xf8\x61\x47\xaa\x08\x28\x68\
+\xab\x28\x8d\xce\xb9\x29\x87\x7f\x36\x3a\xc5\x51\x02\x04\x08\x10\
+\x20\x40\x80\xc0\x40\x81\x2b\xb2\x77\xfb\xc0\x23\x76\x56\x16\x70\
+\xcb\x41\x65\xaa\x91\x89\x47\xe7\xe8\x3d\x09\xcf\xa5\x1d\xc9\xe4\
+\x20\x01\x02\x04\x08\x10\x20\xb0\x4a\xa0\x3c\xd3\xfe\xb8\x44\x79\
+\xfe\xac\x6d\x0a\x01\x57\x68\xa7\xc0\x5b\xd5\x74\x4f\x5e\x6f\x5b\
+\xf5\xde\x4b\x02\x04\x08\x10\x20\x40\x80\xc0\x38\x81\x8b\x92\xa0\
+\x98\x1d\xa7\x54\xe1\xb8\x2b\xb4\x15\x90\x6a\xa4\x5c\x99\xdc\xb7\
+\xd4\xc8\x97\x4a\x80\x00\x01\x02\x04\x08\xf4\x53\xa0\xfc\x11\x85\
+\xb7\xf6\x73\xe9\xcd\xaf\x5a\x41\xdb\xac\xe9\xd3\xd2\xdd\xae\xc4\
+\xf1\xcd\x76\xab\x37\x02\x04\x08\x10\x20\x40\x60\x89\x04\xee\xce\
+\x5a\x9e\x97\x78\x74\x89\xd6\x34\xd7\xa5\xb8\xe5\xa0\x59\xfe\xf2\
+\xc1\xdc\x9c\x78\xa4\xd9\x6e\xf5\x46\x80\x00\x01\x02\x04\x08\x2c\
+\x89\xc0\xbe\xac\xa3\xd4\x0a\x8a\xd9\x06\x4f\xa8\x82\xb6\x41\xcc\
+\xc7\xbb\xda\x99\x7f\xb7\x26\xf6\x37\xdf\xb5\x1e\x09\x10\x20\x40\
+\x80\x00\x81\x05\x16\x28\xb5\xc1\x96\xc4\x3f\x17\x78\x0d\x9d\x9c\
+\xfa\xfa\x4e\xce\x6a\xf1\x27\x75\x7b\x96\x50\x0a\xdb\xf3\x13\x6e\
+\xeb\x58\xfc\xf3\x69\x05\x04\x08\x10\x20\x40\x60\x5a\x81\xf2\xbc\
+\xd9\xf7\x24\x7e\x34\x6d\x47\xda\x3f\x59\x40\x41\xfb\x64\x93\xa6\
+\xf6\x94\xbf\xc9\x5c\x1e\xe5\x55\xae\xd6\xda\x08\x10\x20\x40\x80\
+\x00\x81\xfe\x0a\x94\x62\xf6\xfd\x89\x6f\xf7\x97\x60\xb6\x2b\x57\
+\xd0\xce\xd6\xf7\xc6\x74\x5f\x6e\xfc\x2e\x45\xad\x2b\xb5\xb3\xb5\
+\xd6\x3b\x01\x02\x04\x08\x10\xe8\xa2\x40\x29\x66\xdf\x97\xf8\x7a\
+\x17\x27\xb7\x2c\x73\x52\x64\xb5\x73\x26\x2f\xc8\x30\xdf\x4b\xf8\
+\x05\xa2\x1d\x6f\xa3\x10\x20\x40\x80\x00\x81\x2e\x08\x3c\x96\x49\
+\x94\x1a\xe0\x87\x5d\x98\xcc\x32\xcf\x41\x41\xdb\xde\xd9\x3d\x2b\
+\x43\x5d\x9b\x38\xaa\xbd\x21\x8d\x44\x80\x00\x01\x02\x04\x08\xcc\
+\x49\x60\x6f\xc6\x7d\x4d\xe2\xe6\x39\x8d\xdf\xab\x61\x15\xb4\xed\
+\x9e\xee\x8d\x19\xee\xfa\xc4\x49\xed\x0e\x6b\x34\x02\x04\x08\x10\
+\x20\x40\xa0\x45\x81\x1d\x19\xeb\xd5\x89\x07\x5a\x1c\xb3\xd7\x43\
+\x79\x6c\x57\xbb\xa7\x7f\x77\x86\x3b\x39\xf1\xb5\x44\xb9\xa7\xc6\
+\x46\x80\x00\x01\x02\x04\x08\x2c\x8f\x40\xf9\xd9\xfe\xa5\xc4\x69\
+\x09\xc5\x6c\x8b\xe7\xd5\x15\xda\x16\xb1\x0f\x19\xea\x55\x79\x5f\
+\xfe\xec\x5d\xb9\x6a\x6b\x23\x40\x80\x00\x01\x02\x04\x16\x5b\xe0\
+\xde\x4c\xff\xbc\x44\xf9\x42\xb8\xad\x65\x01\x57\x68\x5b\x06\x5f\
+\x35\xdc\x75\x79\x5d\xfe\x44\xee\x25\x09\x7f\x84\x61\x15\x8c\x97\
+\x04\x08\x10\x20\x40\x60\x81\x04\xca\xcf\xf0\x2f\x26\x9e\x9d\x50\
+\xcc\xce\xe9\xc4\xb9\x42\x3b\x27\xf8\x43\x86\x3d\x21\xef\x2f\x4b\
+\x9c\x7d\xc8\x7e\x6f\x09\x10\x20\x40\x80\x00\x81\xee\x0a\xfc\x3a\
+\x53\x7b\x47\xe2\x5f\xdd\x9d\x62\x3f\x66\xe6\x0a\x6d\x37\xce\xf3\
+\x5d\x99\x46\xb9\x05\xe1\xe5\x89\xed\xdd\x98\x92\x59\x10\x20\x40\
+\x80\x00\x01\x02\x43\x04\xca\x93\x0b\xce\x4c\x9c\x93\x50\xcc\x0e\
+\x41\x6a\x73\xb7\x82\xb6\x4d\xed\xf1\x63\xdd\x94\x94\x33\x12\xa7\
+\x27\x7e\x95\x70\x2b\x42\x10\x6c\x04\x08\x10\x20\x40\xa0\x03\x02\
+\xe5\x67\xf2\x2f\x13\xe5\x0b\x5f\xa5\x98\xf5\x38\xae\x20\x74\x65\
+\x73\xcb\x41\x57\xce\xc4\xe0\x79\x1c\x93\xdd\x9f\x4c\x5c\x98\xf0\
+\xe5\xb1\xc1\x46\xf6\x12\x20\x40\x80\x00\x81\x59\x0a\xdc\x97\xce\
+\xbf\x93\xf8\x44\x62\xcf\x2c\x07\xd2\xf7\xe4\x02\x0a\xda\xc9\xed\
+\xda\x6e\xf9\xd2\x0c\x78\x71\xe2\x0d\x89\xe3\xda\x1e\xdc\x78\x04\
+\x08\x10\x20\x40\xa0\x47\x02\xe5\x89\x05\xbf\x48\x94\x8b\x4a\xe5\
+\x99\xb2\xb6\x8e\x0b\x28\x68\x3b\x7e\x82\x86\x4c\xaf\x7c\x93\x72\
+\x5b\x62\x6b\xe2\xd4\x44\xb9\x92\x6b\x23\x40\x80\x00\x01\x02\x04\
+\x26\x13\x78\x30\xcd\x4a\xe1\x5a\x1e\xa7\x79\x69\xe2\xee\x84\x6d\
+\x81\x04\x14\xb4\x0b\x74\xb2\x46\x4c\xf5\xf0\x1c\x7b\x73\xe2\x9c\
+\xc4\xcb\x12\xcf\x4f\x6c\x4a\x1c\x9d\x38\x2c\xb1\x3e\xe1\x5c\x07\
+\xc1\x46\x80\x00\x01\x02\xbd\x13\x28\x7f\xec\xe0\xb1\xc4\x23\x89\
+\x72\xcb\x40\xb9\xfa\x7a\x67\xe2\x77\x89\xf2\x7d\x95\xab\x13\xfb\
+\x12\x36\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x60\xa9\x04\xfe\
+\x0f\x3e\xf4\xe0\x2f\x14\x2e\xcf\xc1\x00\x00\x00\x00\x49\x45\x4e\
+\x44\xae\x42\x60\x82\
+\x00\x00\x10\x98\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x03\x20\x00\x00\x03\x20\x08\x04\x00\x00\x00\x71\x79\xce\xe3\
+\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
+\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\
+\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\
+\x00\x00\x3a\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x00\x02\
+\x62\x4b\x47\x44\x00\x00\xaa\x8d\x23\x32\x00\x00\x00\x09\x70\x48\
+\x59\x73\x00\x00\x0b\x12\x00\x00\x0b\x12\x01\xd2\xdd\x7e\xfc\x00\
+\x00\x00\x07\x74\x49\x4d\x45\x07\xe4\x0a\x10\x03\x29\x37\xa5\x15\
+\x38\xb7\x00\x00\x00\x01\x6f\x72\x4e\x54\x01\xcf\xa2\x77\x9a\x00\
+\x00\x0e\x6b\x49\x44\x41\x54\x78\xda\xed\xdd\x4b\x88\x9d\x67\x01\
+\xc6\xf1\x27\xb6\x99\xd6\xe8\xc6\x9a\x54\xb4\x49\xcd\xa6\x20\x8c\
+\x14\x5d\x98\xe0\xce\xe0\xd2\x82\x88\x01\x6b\x21\x56\x04\x17\x6a\
+\x2b\x45\x71\xe5\xa5\xee\x04\x37\x6e\xbc\x20\x52\x05\xb5\xd5\xa5\
+\x6e\xc4\x85\xd8\x8d\x22\xd3\x26\xb6\x15\x83\x45\x17\x46\x2b\xda\
+\x9b\x8a\xda\x99\x88\x92\x1c\x17\xe3\xd8\x54\x63\x9a\x3c\x9d\x73\
+\xde\xef\xf4\xfc\x7e\x67\xff\xf1\xbc\x21\x39\x7f\xbe\x73\x4b\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\xbb\x67\xcf\xe8\x01\x30\x31\x87\x72\x2c\
+\x47\xb2\x9e\xc3\x39\x90\x7d\x49\xb6\xf2\x74\xce\xe4\x74\x1e\xc8\
+\x0f\xf3\xd8\xe8\x71\x00\x4c\xd1\xfe\x7c\x34\x3f\xcd\xec\x12\x8f\
+\x87\xf2\xb1\x1c\x18\x3d\x13\x80\x29\x39\x98\x2f\xe6\xec\x25\xe3\
+\xb1\xf3\xf8\x7b\xbe\x94\x43\xa3\xe7\x02\x30\x05\x6b\xf9\x54\xb6\
+\x2e\x2b\x1e\x3b\x8f\xb3\xb9\x3b\xd7\x8c\x9e\x0d\xc0\x58\xeb\x79\
+\xe4\x8a\xe2\xb1\xf3\xf8\x59\x5e\x3f\x7a\x3a\x00\xe3\x1c\xcf\x66\
+\x95\x8f\x59\x66\xd9\xcc\xf1\xd1\xf3\x01\x18\xe3\x43\x75\x3c\x76\
+\x1e\x77\x8e\x3e\x02\x00\x8b\xf7\xc1\x17\x9c\x0f\x09\x01\x58\x41\
+\xef\xcc\xf9\x5d\x09\xc8\xcc\x0b\x59\x00\xab\x64\xfd\x05\xbc\xf7\
+\xf1\xbf\xef\x85\xac\x8f\x3e\x0e\x00\x8b\xb1\x56\x7e\xf2\xea\xff\
+\x3d\x1e\xc9\xda\xe8\x23\x01\xb0\x08\x9f\xdc\xd5\x7c\xcc\x32\xcb\
+\x27\x46\x1f\x09\x80\xf9\x3b\x78\x85\x5f\x1b\xbc\x9c\xc7\x56\x6e\
+\x18\x7d\x2c\x00\xe6\xed\x0b\xbb\x9e\x8f\x59\x66\xf9\xfc\xe8\x63\
+\x01\x30\x5f\xaf\xbc\xcc\xdf\xbc\xba\xd2\xc7\xd9\xec\x1f\x7d\x34\
+\x58\xac\x97\x8c\x1e\x00\x0b\x76\x7b\xae\x9d\xcb\x75\xaf\xcd\x89\
+\xd1\x47\x03\x60\x9e\x4e\xcd\xe5\xfe\x63\x96\x59\x4e\x8e\x3e\x1a\
+\x00\xf3\x73\x70\x6e\xf9\x98\x65\x96\xd7\x8c\x3e\x1e\x2c\x92\x97\
+\xb0\x58\x2d\xc7\x96\xf8\xea\x30\x31\x02\xc2\x6a\x39\x32\xd7\xab\
+\x1f\x1d\x7d\x3c\x58\x24\x01\x61\xb5\xcc\xf7\x47\x47\xfc\xa4\x09\
+\x2b\x45\x40\x58\x2d\x87\x97\xf8\xea\x30\x31\x02\xc2\x6a\xb9\x7e\
+\xae\x57\x3f\x30\xfa\x78\xb0\x48\x7b\x46\x0f\x80\x85\x3a\x3f\xd7\
+\xbf\xf3\xe7\x72\xf5\xe8\x03\xc2\xe2\x08\x08\xab\x65\x36\xe7\xeb\
+\xfb\x17\xc5\x0a\xf1\x12\x16\x00\x15\x01\x01\xa0\x22\x20\x00\x54\
+\x04\x04\x80\x8a\x80\x00\x50\x11\x10\x00\x2a\x02\x02\x40\x45\x40\
+\x00\xa8\x08\x08\x00\x15\x01\x01\xa0\x22\x20\x00\x54\x04\x04\x80\
+\x8a\x80\x00\x50\x11\x10\x00\x2a\x02\x02\x40\x45\x40\x00\xa8\x08\
+\x08\x00\x15\x01\x01\xa0\x22\x20\x00\x54\x04\x04\x80\x8a\x80\x00\
+\x50\x11\x10\x00\x2a\x02\x02\x40\x45\x40\x00\xa8\x08\x08\x00\x15\
+\x01\x01\xa0\x22\x20\x00\x54\x04\x04\x80\x8a\x80\x00\x50\x11\x10\
+\x00\x2a\x02\x02\x40\x45\x40\x00\xa8\x08\x08\x00\x15\x01\x01\xa0\
+\x22\x20\x00\x54\x04\x04\x80\x8a\x80\x00\x50\x11\x10\x00\x2a\x02\
+\x02\x40\x45\x40\x00\xa8\x08\x08\x00\x15\x01\x01\xa0\x22\x20\x00\
+\x54\x04\x04\x80\x8a\x80\x00\x50\x11\x10\x00\x2a\x02\x02\x40\x45\
+\x40\x00\xa8\x08\x08\x00\x15\x01\x01\xa0\x22\x20\x00\x54\x04\x04\
+\x80\x8a\x80\x00\x50\x11\x10\x00\x2a\x02\x02\x40\x45\x40\x00\xa8\
+\x08\x08\x00\x15\x01\x01\xa0\x22\x20\x00\x54\x04\x04\x80\x8a\x80\
+\x00\x50\x11\x10\x00\x2a\x02\x02\x40\x45\x40\x00\xa8\x08\x08\x00\
+\x15\x01\x01\xa0\x22\x20\x00\x54\x04\x04\x80\x8a\x80\x00\x50\x11\
+\x10\x00\x2a\x02\x02\x40\x45\x40\x00\xa8\x08\x08\x00\x15\x01\x01\
+\xa0\x22\x20\x00\x54\x04\x04\x80\x8a\x80\x00\x50\x11\x10\x00\x2a\
+\x02\x02\x40\x45\x40\x00\xa8\x08\x08\x00\x15\x01\x01\xa0\x22\x20\
+\x00\x54\x04\x04\x80\x8a\x80\x00\x50\x11\x10\x00\x2a\x02\x02\x40\
+\x45\x40\x00\xa8\x08\x08\x00\x15\x01\x01\xa0\x22\x20\x00\x54\x04\
+\x04\x80\x8a\x80\x00\x50\x11\x10\x00\x2a\x02\x02\x40\x45\x40\x00\
+\xa8\x08\x08\x00\x15\x01\x01\xa0\x22\x20\x00\x54\x04\x04\x80\x8a\
+\x80\x00\x50\x11\x10\x00\x2a\x02\x02\x40\x45\x40\x00\xa8\x08\x08\
+\x00\x15\x01\x01\xa0\x22\x20\x00\x54\x04\x04\x80\x8a\x80\x00\x50\
+\x11\x10\x00\x2a\x02\x02\x40\x45\x40\x00\xa8\x08\x08\x00\x15\x01\
+\x01\xa0\x22\x20\x00\x54\x04\x04\x80\x8a\x80\x00\x50\x11\x10\x00\
+\x2a\x02\x02\x40\x45\x40\x00\xa8\x08\x08\x00\x15\x01\x01\xa0\x22\
+\x20\x00\x54\x04\x04\x80\x8a\x80\x00\x50\x11\x10\x00\x2a\x02\x02\
+\x40\x45\x40\x00\xa8\x08\x08\x00\x15\x01\x01\xa0\x22\x20\x00\x54\
+\x04\x04\x80\x8a\x80\x00\x50\x11\x10\x00\x2a\x02\x02\x40\x45\x40\
+\x00\xa8\x08\x08\x00\x15\x01\x01\xa0\x22\x20\x00\x54\x04\x04\x80\
+\x8a\x80\x00\x50\x11\x10\x00\x2a\x02\x02\x40\x45\x40\x00\xa8\x08\
+\x08\x00\x15\x01\x01\xa0\x22\x20\x00\x54\x04\x04\x80\x8a\x80\x00\
+\x50\x11\x10\x00\x2a\x02\x02\x40\x45\x40\x00\xa8\x08\x08\x00\x15\
+\x01\x01\xa0\x22\x20\x00\x54\x04\x04\x80\x8a\x80\x00\x50\x11\x10\
+\x00\x2a\x02\x02\x40\x45\x40\x00\xa8\x08\x08\x00\x15\x01\x01\xa0\
+\x22\x20\x00\x54\x04\x04\x80\x8a\x80\x00\x50\x11\x10\x00\x2a\x02\
+\x02\x40\x45\x40\x00\xa8\x08\x08\x00\x15\x01\x01\xa0\x22\x20\x00\
+\x54\x04\x04\x80\x8a\x80\x00\x50\x11\x10\x00\x2a\x02\x02\x40\x45\
+\x40\x00\xa8\x08\x08\x00\x15\x01\x01\xa0\x22\x20\x00\x54\x04\x04\
+\x80\x8a\x80\x00\x50\x11\x10\x00\x2a\x02\x02\x40\x45\x40\x00\xa8\
+\x08\x08\x00\x15\x01\x01\xa0\x22\x20\x00\x54\x04\x04\x80\x8a\x80\
+\x00\x50\x11\x10\x00\x2a\x02\x02\x40\x45\x40\x00\xa8\x08\x08\x00\
+\x15\x01\x01\xa0\x22\x20\x00\x54\x04\x04\x80\x8a\x80\x00\x50\x11\
+\x10\x00\x2a\x02\x02\x40\x45\x40\x00\xa8\x08\x08\x00\x15\x01\x01\
+\xa0\x22\x20\x00\x54\x04\x04\x80\x8a\x80\x00\x50\x11\x10\x00\x2a\
+\x02\x02\x40\x45\x40\x00\xa8\x08\x08\x00\x15\x01\x01\xa0\x22\x20\
+\x00\x54\x04\x04\x80\x8a\x80\x00\x50\x11\x10\x00\x2a\x02\x02\x40\
+\x45\x40\x00\xa8\x08\x08\x00\x15\x01\x01\xa0\x22\x20\x00\x54\x04\
+\x04\x80\x8a\x80\x00\x50\xd9\x33\x7a\xc0\x92\x38\x94\x63\x39\x92\
+\xf5\x1c\xce\x81\xec\xf3\xa7\x06\x2f\x42\xb3\x6c\xe6\xc9\x9c\xc9\
+\xe9\x6c\xe4\xfe\xfc\x7e\xf4\x9c\x65\xe0\xa9\xf0\xf9\x5c\x9f\xdb\
+\x73\x5b\xde\x30\x7a\x06\xb0\x50\x27\x73\x6f\xbe\x9e\x3f\x8d\x9e\
+\x31\x6d\x02\x72\x29\x37\xe6\xe3\xb9\x3d\xd7\x8c\x9e\x01\x0c\xb1\
+\x95\x7b\xf2\x99\xfc\x61\xf4\x8c\xe9\xba\x6a\xf4\x80\xc9\xba\x26\
+\x77\xe7\xdb\x39\x9a\xab\x47\x0f\x01\x06\xd9\x9b\xa3\xf9\x40\x66\
+\xd9\xc8\xf9\xd1\x53\xa6\xc9\x1d\xc8\xc5\xdd\x9c\xfb\xb2\x3e\x7a\
+\x04\x30\x09\x0f\xe5\xb6\x3c\x3a\x7a\xc4\x14\xf9\x14\xd6\xc5\xdc\
+\x9a\x0d\xf9\x00\xfe\xed\x8d\x79\x30\x6f\x1f\x3d\x62\x8a\xbc\x84\
+\xf5\xbf\xee\xca\x57\xbc\x70\x05\x5c\x60\x2d\xef\xca\xe3\x39\x35\
+\x7a\xc6\xd4\x08\xc8\x7f\xbb\x2b\x9f\x1b\x3d\x01\x98\x9c\x3d\xb9\
+\x25\x4f\xe4\xe4\xe8\x19\xd3\xe2\x3d\x90\xe7\xba\x35\xdf\x1a\x3d\
+\x01\x98\xa8\x59\xde\x91\xef\x8e\x1e\x31\x25\x02\x72\xa1\x9b\xb3\
+\x91\x6b\x47\x8f\x00\x26\xeb\x99\xbc\xc9\xdb\xe9\xcf\x12\x90\x67\
+\x5d\x93\x53\xde\x3a\x07\x2e\xe9\xa1\x1c\xcd\x3f\x47\x8f\x98\x0a\
+\xef\x81\x3c\xeb\xee\x1c\x1f\x3d\x01\x98\xb8\x57\x67\x2b\x3f\x1a\
+\x3d\x62\x2a\xdc\x81\xec\xb8\x31\xbf\xf4\x9d\x73\xe0\x79\x6d\xe6\
+\x26\xdf\x4e\xdf\xe6\x0e\x64\xc7\x67\x73\x74\xf4\x04\x60\x09\xac\
+\x65\x6f\xbe\x3f\x7a\xc4\x34\xb8\x03\xd9\x76\x7d\x7e\xeb\xfe\x03\
+\xb8\x2c\x5b\x39\xe4\x67\x16\x13\xdf\x44\xdf\xf1\x5e\xf9\x00\x2e\
+\xd3\xbe\xbc\x67\xf4\x84\x69\x10\x90\x6d\xb7\x8d\x1e\x00\x2c\x11\
+\xcf\x18\x49\xbc\x84\xb5\xed\xc6\xfc\x66\xf4\x04\x60\xa9\xdc\xe0\
+\xbf\x9c\x72\x07\xb2\xed\xd8\xe8\x01\xc0\x92\xf1\xac\x11\x01\xd9\
+\x76\x64\xf4\x00\x60\xc9\xf8\xd4\x66\x04\x64\x9b\xef\x9f\x03\x57\
+\xc6\xb3\x46\x04\x64\xdb\xe1\xd1\x03\x80\x25\x73\x78\xf4\x80\x29\
+\x10\x90\x24\xd9\x3f\x7a\x00\xb0\x64\x0e\x8c\x1e\x30\x05\x3e\x85\
+\x95\x24\xe7\xfd\x39\x00\x57\xe4\x9c\xff\x76\xce\x1d\x08\x00\x25\
+\x01\x49\x92\xad\xd1\x03\x80\x25\xe3\x59\x23\x02\xb2\xed\xa9\xd1\
+\x03\x80\x25\xe3\x59\x23\x02\xb2\xed\xd7\xa3\x07\x00\x4b\xe6\xcc\
+\xe8\x01\x53\x20\x20\x49\x72\x7a\xf4\x00\x60\xc9\x78\xd6\x88\x80\
+\x6c\x7b\x60\xf4\x00\x60\xc9\x78\xd6\x88\x8f\xf1\x6e\x3b\x98\xc7\
+\x46\x4f\x00\x96\x8a\x1f\x53\x8c\x3b\x90\x6d\xbf\xcb\xa9\xd1\x13\
+\x80\x25\x72\x52\x3e\x12\x01\xd9\x71\xef\xe8\x01\xc0\x12\xf1\x8c\
+\x91\xc4\x4b\x58\x3b\x5e\x99\xc7\xf2\xd2\xd1\x23\x80\xa5\x70\x36\
+\x87\xf2\xc7\xd1\x23\xa6\xc0\x1d\xc8\xb6\x3f\xe6\x9e\xd1\x13\x80\
+\x25\x71\x8f\x7c\x6c\x73\x07\xb2\xe3\x35\xf9\x55\xf6\x8d\x1e\x01\
+\x4c\xde\x56\x6e\xf2\x0e\xc8\xb6\xab\x46\x0f\x98\x8c\xbf\x25\x79\
+\xeb\xe8\x11\xc0\xe4\x7d\x3a\xdf\x1b\x3d\x61\x2a\xdc\x81\x3c\x6b\
+\x2d\x1b\x79\xc3\xe8\x11\xc0\xa4\x3d\x9c\xa3\xf9\xc7\xe8\x11\x53\
+\x21\x20\x17\x7a\x5d\x1e\xcc\xcb\x47\x8f\x00\x26\x6b\x33\x6f\xca\
+\x2f\x46\x8f\x98\x0e\x6f\xa2\x5f\xe8\xd1\x9c\xc8\x6c\xf4\x08\x60\
+\xa2\x66\x39\x21\x1f\x17\xf2\x1e\xc8\x73\x3d\x9a\x27\x72\xcb\xe8\
+\x11\xc0\x24\xdd\x91\x6f\x8c\x9e\x30\x2d\x02\xf2\xdf\x4e\xe6\x89\
+\xbc\xcd\x4b\x7b\xc0\x73\xcc\x72\x47\xbe\x38\x7a\xc4\xd4\x78\xa2\
+\xbc\x98\xb7\xe7\x9b\xde\x0b\x01\xfe\xe3\x99\x9c\xc8\x77\x46\x8f\
+\x98\x1e\x01\xb9\xb8\xd7\xe5\xbe\xbc\x71\xf4\x08\x60\x12\x1e\xce\
+\xbb\xf3\xe8\xe8\x11\x53\xe4\x25\xac\x8b\x7b\x3a\x5f\xcd\x66\xde\
+\x9c\xb5\xd1\x43\x80\xa1\x36\x73\x77\xde\x97\x27\x47\xcf\x98\x26\
+\x01\xf9\x7f\xce\xe7\xc7\xf9\x6a\xf6\xe6\xe6\xec\x1d\x3d\x05\x18\
+\xe2\x6c\xbe\x94\x77\xe5\xfb\x39\x3f\x7a\xc8\x54\x79\x09\xeb\xf9\
+\x5c\x97\x13\xb9\x2d\x47\x46\xcf\x00\x16\xea\x81\xdc\x97\x6f\xfa\
+\xcd\xab\x4b\x13\x90\xcb\xf3\xea\x1c\xcb\xd1\xac\xe7\x70\x0e\xe4\
+\x65\xee\xdb\xe0\x45\xe8\x5c\x36\xf3\x54\xce\xe4\x74\x36\x72\x7f\
+\xfe\x30\x7a\xce\x32\x10\x10\x56\xcb\xbc\xbf\x28\xea\x5f\x14\x2b\
+\xc4\x37\xd1\x01\xa8\x08\x08\x00\x15\x01\x01\xa0\x22\x20\x00\x54\
+\x04\x04\x80\x8a\x80\x00\x50\x11\x10\x00\x2a\x02\x02\x40\x45\x40\
+\x00\xa8\x08\x08\x00\x15\x01\x01\xa0\x22\x20\x00\x54\x04\x04\x80\
+\x8a\x80\x00\x50\x11\x10\x00\x2a\x02\x02\x40\x45\x40\x00\xa8\x08\
+\x08\x00\x15\x01\x01\xa0\x22\x20\x00\x54\x04\x04\x80\x8a\x80\x00\
+\x50\x11\x10\x00\x2a\x02\x02\x40\x45\x40\x00\xa8\x08\x08\x00\x15\
+\x01\x01\xa0\x22\x20\x00\x54\x04\x04\x80\x8a\x80\x00\x50\x11\x10\
+\x00\x2a\x02\x02\x40\x45\x40\x00\xa8\x08\x08\x00\x15\x01\x01\xa0\
+\x22\x20\x00\x54\x04\x04\x80\x8a\x80\x00\x50\x11\x10\x00\x2a\x02\
+\x02\x40\x45\x40\x00\xa8\x08\x08\x00\x15\x01\x01\xa0\x22\x20\x00\
+\x54\x04\x04\x80\x8a\x80\x00\x50\x11\x10\x00\x2a\x02\x02\x40\x45\
+\x40\x00\xa8\x08\x08\x00\x15\x01\x01\xa0\x22\x20\x00\x54\x04\x04\
+\x80\x8a\x80\x00\x50\x11\x10\x00\x2a\x02\x02\x40\x45\x40\x00\xa8\
+\x08\x08\x00\x15\x01\x01\xa0\x22\x20\x00\x54\x04\x04\x80\x8a\x80\
+\x00\x50\x11\x10\x00\x2a\x02\x02\x40\x45\x40\x00\xa8\x08\x08\x00\
+\x15\x01\x01\xa0\x22\x20\x00\x54\x04\x04\x80\x8a\x80\x00\x50\x11\
+\x10\x00\x2a\x02\x02\x40\x45\x40\x00\xa8\x08\x08\x00\x15\x01\x01\
+\xa0\x22\x20\x00\x54\x04\x04\x80\x8a\x80\x00\x50\x11\x10\x00\x2a\
+\x02\x02\x40\x45\x40\x00\xa8\x08\x08\x00\x15\x01\x01\xa0\x22\x20\
+\x00\x54\x04\x04\x80\x8a\x80\x00\x50\x11\x10\x00\x2a\x02\x02\x40\
+\x45\x40\x00\xa8\x08\x08\x00\x15\x01\x01\xa0\x22\x20\x00\x54\x04\
+\x04\x80\x8a\x80\x00\x50\x11\x10\x00\x2a\x02\x02\x40\x45\x40\x00\
+\xa8\x08\x08\x00\x15\x01\x01\xa0\x22\x20\x00\x54\x04\x04\x80\x8a\
+\x80\x00\x50\x11\x10\x00\x2a\x02\x02\x40\x45\x40\x00\xa8\x08\x08\
+\x00\x15\x01\x01\xa0\x22\x20\x00\x54\x04\x04\x80\x8a\x80\x00\x50\
+\x11\x10\x00\x2a\x02\x02\x40\x45\x40\x00\xa8\x08\x08\x00\x15\x01\
+\x01\xa0\x22\x20\x00\x54\x04\x04\x80\x8a\x80\x00\x50\x11\x10\x00\
+\x2a\x02\x02\x40\x45\x40\x00\xa8\x08\x08\x00\x15\x01\x01\xa0\x22\
+\x20\x00\x54\x04\x04\x80\x8a\x80\x00\x50\x11\x10\x00\x2a\x02\x02\
+\x40\x45\x40\x00\xa8\x08\x08\x00\x15\x01\x01\xa0\x22\x20\x00\x54\
+\x04\x04\x80\x8a\x80\x00\x50\x11\x10\x00\x2a\x02\x02\x40\x45\x40\
+\x00\xa8\x08\x08\x00\x15\x01\x01\xa0\x22\x20\x00\x54\x04\x04\x80\
+\x8a\x80\x00\x50\x11\x10\x00\x2a\x02\x02\x40\x45\x40\x00\xa8\x08\
+\x08\x00\x15\x01\x01\xa0\x22\x20\x00\x54\x04\x04\x80\x8a\x80\x00\
+\x50\x11\x10\x00\x2a\x02\x02\x40\x45\x40\x00\xa8\x08\x08\x00\x15\
+\x01\x01\xa0\x22\x20\x00\x54\x04\x04\x80\x8a\x80\x00\x50\x11\x10\
+\x00\x2a\x02\x02\x40\x45\x40\x00\xa8\x08\x08\x00\x15\x01\x01\xa0\
+\x22\x20\x00\x54\x04\x04\x80\x8a\x80\x00\x50\x11\x10\x00\x2a\x02\
+\x02\x40\x45\x40\x00\xa8\x08\x08\x00\x15\x01\x01\xa0\x22\x20\x00\
+\x54\x04\x04\x80\x8a\x80\x00\x50\x11\x10\x00\x2a\x02\x02\x40\x45\
+\x40\x00\xa8\x08\x08\x00\x15\x01\x01\xa0\x22\x20\x00\x54\x04\x04\
+\x80\x8a\x80\x00\x50\x11\x10\x00\x2a\x02\x02\x40\x45\x40\x00\xa8\
+\x08\x08\x00\x15\x01\x01\xa0\x22\x20\x00\x54\x04\x04\x80\x8a\x80\
+\x00\x50\x11\x10\x00\x2a\x02\x02\x40\x45\x40\x00\xa8\x08\x08\x00\
+\x15\x01\x01\xa0\x22\x20\x00\x54\x04\x04\x80\x8a\x80\x00\x50\x11\
+\x10\x00\x2a\x02\x02\x40\x45\x40\x00\xa8\x08\x08\x00\x15\x01\x01\
+\xa0\x22\x20\x00\x54\x04\x04\x80\x8a\x80\x00\x50\x11\x10\x00\x2a\
+\x02\x02\x40\x45\x40\x00\xa8\x08\x08\x00\x15\x01\x01\xa0\x22\x20\
+\x00\x54\x04\x04\x80\x8a\x80\x00\x50\x11\x10\x00\x2a\x02\x02\x40\
+\x45\x40\x00\xa8\x08\x08\x00\x15\x01\x01\xa0\x22\x20\x00\x54\x04\
+\x04\x80\x8a\x80\xb0\x5a\x66\x73\xbd\xfa\xb9\xd1\xc7\x83\x45\x12\
+\x10\x56\xcb\xd6\x5c\xaf\xbe\x39\xfa\x78\xb0\x48\x02\xc2\x6a\x79\
+\x6a\xae\x57\x7f\x72\xf4\xf1\x60\x91\x04\x84\xd5\x72\x66\x89\xaf\
+\x0e\x13\x23\x20\xac\x96\x9f\x2f\xf1\xd5\x61\x62\x04\x84\xd5\xf2\
+\xc0\x5c\xaf\xbe\x31\xfa\x78\x00\xcc\xcb\xc1\xcc\xe6\xf8\x78\xd5\
+\xe8\xe3\x01\x30\x3f\xa7\xe6\x96\x8f\x9f\x8c\x3e\x1a\x2c\x96\x97\
+\xb0\x58\x35\xf7\xcd\xed\xca\xf7\x8e\x3e\x1a\x00\xf3\xb4\x3f\x67\
+\xe7\x72\xff\xf1\x4c\x5e\x31\xfa\x68\xb0\x58\xee\x40\x58\x35\x4f\
+\xe7\x6b\x73\xb9\xee\x97\xf3\xe7\xd1\x47\x03\x60\xbe\x0e\x66\x6b\
+\xd7\xef\x3f\xfe\x9a\xeb\x47\x1f\x0b\x16\xed\xaa\xd1\x03\x60\xe1\
+\xfe\x9a\x97\xe4\xd8\x2e\x5f\xf3\xe3\xf9\xc1\xe8\x63\x01\x30\x7f\
+\x6b\x79\x64\x57\xef\x3f\x1e\xcc\xd5\xa3\x8f\x04\xc0\x62\xac\x67\
+\x73\xd7\xf2\xf1\x97\xdc\x34\xfa\x38\x00\x2c\xce\xf1\x5d\xca\xc7\
+\xb9\xdc\x32\xfa\x28\x00\x2c\xd6\x1d\xbb\x12\x90\xf7\x8f\x3e\x06\
+\x00\x8b\x77\xe7\x0b\xbe\xfb\x90\x0f\x80\x15\x75\xfc\x05\xbc\x17\
+\xf2\x17\x2f\x5e\x01\xac\xb2\xf5\xf2\x13\x59\x27\xbd\x75\x0e\xb0\
+\xea\xd6\xf2\xc9\x2b\xfc\x6a\xe1\xdf\xf2\xb1\xec\x1d\x3d\x1b\x80\
+\x29\xb8\x21\x5f\xb8\xcc\xdf\xc8\xda\xcc\xe7\xfc\x6c\x3b\x00\x17\
+\xda\x9f\x8f\xe4\xe4\x25\xe3\xb1\x91\x0f\xe7\xba\xd1\x33\x61\x2a\
+\xf6\x8c\x1e\x00\x13\x73\x30\x6f\xc9\xd1\xac\xe7\xb5\x39\x90\x7d\
+\x49\x36\xf3\x54\xce\xe4\x74\x36\xf2\xc3\x3c\x3e\x7a\x1c\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xcb\xe3\x5f\x0c\x49\
+\xc2\x85\x2a\x8f\x05\x54\x00\x00\x00\x84\x65\x58\x49\x66\x4d\x4d\
+\x00\x2a\x00\x00\x00\x08\x00\x05\x01\x12\x00\x03\x00\x00\x00\x01\
+\x00\x01\x00\x00\x01\x1a\x00\x05\x00\x00\x00\x01\x00\x00\x00\x4a\
+\x01\x1b\x00\x05\x00\x00\x00\x01\x00\x00\x00\x52\x01\x28\x00\x03\
+\x00\x00\x00\x01\x00\x02\x00\x00\x87\x69\x00\x04\x00\x00\x00\x01\
+\x00\x00\x00\x5a\x00\x00\x00\x00\x00\x00\x00\x48\x00\x00\x00\x01\
+\x00\x00\x00\x48\x00\x00\x00\x01\x00\x03\xa0\x01\x00\x03\x00\x00\
+\x00\x01\x00\x01\x00\x00\xa0\x02\x00\x04\x00\x00\x00\x01\x00\x00\
+\x02\x5e\xa0\x03\x00\x04\x00\x00\x00\x01\x00\x00\x02\x59\x00\x00\
+\x00\x00\xc6\xf2\x71\x23\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\
+\x74\x65\x3a\x63\x72\x65\x61\x74\x65\x00\x32\x30\x32\x30\x2d\x31\
+\x30\x2d\x31\x36\x54\x30\x33\x3a\x33\x39\x3a\x34\x39\x2b\x30\x30\
+\x3a\x30\x30\x74\x23\x95\x3f\x00\x00\x00\x25\x74\x45\x58\x74\x64\
+\x61\x74\x65\x3a\x6d\x6f\x64\x69\x66\x79\x00\x32\x30\x32\x30\x2d\
+\x31\x30\x2d\x31\x36\x54\x30\x33\x3a\x33\x39\x3a\x34\x39\x2b\x30\
+\x30\x3a\x30\x30\x05\x7e\x2d\x83\x00\x00\x00\x11\x74\x45\x58\x74\
+\x65\x78\x69\x66\x3a\x43\x6f\x6c\x6f\x72\x53\x70\x61\x63\x65\x00\
+\x31\x0f\x9b\x02\x49\x00\x00\x00\x12\x74\x45\x58\x74\x65\x78\x69\
+\x66\x3a\x45\x78\x69\x66\x4f\x66\x66\x73\x65\x74\x00\x39\x30\x59\
+\x8c\xde\x9b\x00\x00\x00\x18\x74\x45\x58\x74\x65\x78\x69\x66\x3a\
+\x50\x69\x78\x65\x6c\x58\x44\x69\x6d\x65\x6e\x73\x69\x6f\x6e\x00\
+\x36\x30\x36\xaa\x1e\xf3\xdd\x00\x00\x00\x18\x74\x45\x58\x74\x65\
+\x78\x69\x66\x3a\x50\x69\x78\x65\x6c\x59\x44\x69\x6d\x65\x6e\x73\
+\x69\x6f\x6e\x00\x36\x30\x31\xa9\x75\x87\x08\x00\x00\x00\x00\x49\
+\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x02\xa7\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x01\x95\x00\x00\x01\x22\x04\x03\x00\x00\x00\xc3\xba\x52\xc5\
+\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
+\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\
+\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\
+\x00\x00\x3a\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x00\x12\
+\x50\x4c\x54\x45\x00\x00\x00\x80\x80\x80\xbf\xbf\xbf\x40\x40\x40\
+\xb4\xec\xb4\xff\xff\xff\x75\x94\x8f\x79\x00\x00\x00\x04\x74\x52\
+\x4e\x53\x00\x80\xbf\x40\x47\x27\x8e\xfd\x00\x00\x00\x01\x62\x4b\
+\x47\x44\x05\xf8\x6f\xe9\xc7\x00\x00\x00\x07\x74\x49\x4d\x45\x07\
+\xe4\x0b\x0b\x03\x18\x03\xf8\x84\x32\x9e\x00\x00\x00\x01\x6f\x72\
+\x4e\x54\x01\xcf\xa2\x77\x9a\x00\x00\x01\x75\x49\x44\x41\x54\x78\
+\xda\xed\xdd\xc1\x0d\xc2\x40\x0c\x00\xc1\x94\x10\x04\x8d\xa4\x03\
+\x40\xf4\x5f\x13\x8f\x90\x12\xee\xb4\x9c\x66\x1b\xb0\xe6\x67\xbf\
+\xbc\x6d\x63\x7b\x7c\xce\x5e\x83\xe7\xcc\x88\xa5\x19\x4b\x33\x96\
+\x66\x2c\xcd\x58\x9a\xb1\x34\x63\x69\xc6\xd2\x8c\xa5\x19\x4b\x33\
+\x96\x66\x2c\xcd\x58\x9a\xb1\x34\x63\x69\xc6\xd2\x8c\xa5\x19\x4b\
+\x33\x96\x66\x2c\xcd\x58\x9a\xb1\x34\x63\x69\xc6\xd2\x8c\xa5\x19\
+\x4b\x33\x96\x66\x2c\xcd\x58\x9a\xb1\x34\x63\x69\xc6\xd2\x8c\xa5\
+\x19\x4b\x33\x96\x66\x2c\xcd\x58\x9a\xb1\x34\x63\x69\xc6\xd2\x8c\
+\xa5\x19\x4b\x33\x96\x66\x2c\xcd\x58\x9a\xb1\x34\x63\x69\xc6\xd2\
+\x8c\xa5\x19\x4b\x33\x96\x66\x2c\xcd\x58\x9a\xb1\x34\x63\x69\xc6\
+\xd2\x8c\xa5\x19\x4b\x33\x96\x66\x2c\xcd\x58\x9a\xb1\x34\x63\x69\
+\xc6\xd2\x8c\xa5\x19\x4b\x33\x96\x66\x97\xe5\x7d\x1b\xde\x3e\xcb\
+\x32\xa1\x27\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\xcb\xbf\x59\x56\
+\xda\xf9\x57\xba\xc5\x58\x5a\xb1\x34\x63\x69\xc6\xd2\x8c\xa5\x19\
+\x4b\x33\x96\x66\x2c\xcd\x58\x9a\xb1\x34\x63\x69\xc6\xd2\x8c\xa5\
+\x19\x4b\x33\x96\x66\x2c\xcd\x58\x9a\xb1\x34\x63\x69\xc6\xd2\x8c\
+\xa5\x19\x4b\x33\x96\x66\x2c\xcd\x58\x9a\xb1\x34\x63\x69\xc6\xd2\
+\x8c\xa5\x19\x4b\x33\x96\x66\x2c\xcd\x58\x9a\xb1\x34\x63\x69\xc6\
+\xd2\x8c\xa5\x19\x4b\x33\x96\x66\x2c\xcd\x58\x9a\xb1\x34\x63\x69\
+\xc6\xd2\x8c\xa5\x19\x4b\x33\x96\x66\x2c\xcd\x58\x9a\xb1\x34\x63\
+\x69\xc6\xd2\x8c\xa5\x19\x4b\x33\x96\x66\x2c\xcd\x58\x9a\xb1\x34\
+\x63\x69\xc6\xd2\x8c\xa5\x19\x4b\x33\x96\x66\x2c\xcd\x58\x9a\xb1\
+\x34\x63\x69\xc6\xd2\x6c\x25\xcb\xf1\x7b\x30\x77\x9f\x30\xeb\x0b\
+\xf0\xde\xf7\x7a\xb8\x6e\x06\xbb\x00\x00\x00\x25\x74\x45\x58\x74\
+\x64\x61\x74\x65\x3a\x63\x72\x65\x61\x74\x65\x00\x32\x30\x32\x30\
+\x2d\x31\x31\x2d\x31\x31\x54\x30\x33\x3a\x32\x34\x3a\x30\x33\x2b\
+\x30\x30\x3a\x30\x30\x4a\x72\xe8\xd6\x00\x00\x00\x25\x74\x45\x58\
+\x74\x64\x61\x74\x65\x3a\x6d\x6f\x64\x69\x66\x79\x00\x32\x30\x32\
+\x30\x2d\x31\x31\x2d\x31\x31\x54\x30\x33\x3a\x32\x34\x3a\x30\x33\
+\x2b\x30\x30\x3a\x30\x30\x3b\x2f\x50\x6a\x00\x00\x00\x00\x49\x45\
+\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x1f\xe1\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x01\x48\x00\x00\x01\xe0\x08\x06\x00\x00\x00\xc7\x5b\xf4\xb0\
+\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
+\x00\x00\x00\x50\x65\x58\x49\x66\x4d\x4d\x00\x2a\x00\x00\x00\x08\
+\x00\x02\x01\x12\x00\x03\x00\x00\x00\x01\x00\x01\x00\x00\x87\x69\
+\x00\x04\x00\x00\x00\x01\x00\x00\x00\x26\x00\x00\x00\x00\x00\x03\
+\xa0\x01\x00\x03\x00\x00\x00\x01\x00\x01\x00\x00\xa0\x02\x00\x04\
+\x00\x00\x00\x01\x00\x00\x01\x48\xa0\x03\x00\x04\x00\x00\x00\x01\
+\x00\x00\x01\xe0\x00\x00\x00\x00\xe6\xb5\xd9\xe2\x00\x00\x01\x59\
+\x69\x54\x58\x74\x58\x4d\x4c\x3a\x63\x6f\x6d\x2e\x61\x64\x6f\x62\
+\x65\x2e\x78\x6d\x70\x00\x00\x00\x00\x00\x3c\x78\x3a\x78\x6d\x70\
+\x6d\x65\x74\x61\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x3d\x22\x61\x64\
+\x6f\x62\x65\x3a\x6e\x73\x3a\x6d\x65\x74\x61\x2f\x22\x20\x78\x3a\
+\x78\x6d\x70\x74\x6b\x3d\x22\x58\x4d\x50\x20\x43\x6f\x72\x65\x20\
+\x35\x2e\x34\x2e\x30\x22\x3e\x0a\x20\x20\x20\x3c\x72\x64\x66\x3a\
+\x52\x44\x46\x20\x78\x6d\x6c\x6e\x73\x3a\x72\x64\x66\x3d\x22\x68\
+\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\
+\x2f\x31\x39\x39\x39\x2f\x30\x32\x2f\x32\x32\x2d\x72\x64\x66\x2d\
+\x73\x79\x6e\x74\x61\x78\x2d\x6e\x73\x23\x22\x3e\x0a\x20\x20\x20\
+\x20\x20\x20\x3c\x72\x64\x66\x3a\x44\x65\x73\x63\x72\x69\x70\x74\
+\x69\x6f\x6e\x20\x72\x64\x66\x3a\x61\x62\x6f\x75\x74\x3d\x22\x22\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x78\x6d\x6c\
+\x6e\x73\x3a\x74\x69\x66\x66\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\
+\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x74\x69\x66\
+\x66\x2f\x31\x2e\x30\x2f\x22\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x3c\x74\x69\x66\x66\x3a\x4f\x72\x69\x65\x6e\x74\x61\x74\
+\x69\x6f\x6e\x3e\x31\x3c\x2f\x74\x69\x66\x66\x3a\x4f\x72\x69\x65\
+\x6e\x74\x61\x74\x69\x6f\x6e\x3e\x0a\x20\x20\x20\x20\x20\x20\x3c\
+\x2f\x72\x64\x66\x3a\x44\x65\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\
+\x3e\x0a\x20\x20\x20\x3c\x2f\x72\x64\x66\x3a\x52\x44\x46\x3e\x0a\
+\x3c\x2f\x78\x3a\x78\x6d\x70\x6d\x65\x74\x61\x3e\x0a\x4c\xc2\x27\
+\x59\x00\x00\x1d\xd7\x49\x44\x41\x54\x78\x01\xed\xdd\x0b\xb0\xed\
+\x55\x5d\x07\x70\x48\x4c\xb0\x51\xd3\x1a\x9b\xc9\xb1\x69\x6a\xc6\
+\xc6\x9e\xda\xd8\x8c\xda\x43\x2d\xad\x31\x2b\xd3\x9c\x9a\x72\x1a\
+\xab\x61\x9a\x78\xc8\x43\x7c\xa2\x0c\x4d\x0e\x3a\x84\x86\x95\x98\
+\xa6\x65\x3e\x52\xcb\x54\x14\x05\x11\x05\x14\x44\x9e\x02\x82\x04\
+\x28\x08\x12\x2a\xc5\xe3\xc2\xe5\x82\x0a\x4a\xdf\xdf\x70\x37\x1c\
+\xcf\xbd\xe7\x9e\x7d\xee\xf9\xaf\xbd\xff\x8f\xcf\x7f\xe6\x77\xcf\
+\x3e\x7b\xef\xb3\xfe\x6b\x7d\xd6\xbe\xbf\xbd\xd6\xfe\xaf\xff\x7f\
+\xef\xb1\x87\x8d\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\xdb\x05\xee\xb9\xe7\x9e\x27\x26\x1e\x00\x84\x00\x01\
+\x02\x04\x56\x09\x24\x39\xde\x94\x38\x24\xf1\xa0\x55\x0f\xf9\x95\
+\x00\x01\x02\xd3\x16\x48\x62\xac\xed\x8e\xc4\x07\x12\x8f\x4e\xec\
+\x39\x6d\x11\xad\x27\x40\x80\x40\x04\x92\x0c\x7f\x2c\xb1\x72\xbb\
+\x39\xbf\x3c\x2b\xb1\x17\x20\x02\x04\x08\x4c\x5a\x20\x89\xf0\xb8\
+\x95\xd9\x71\xc5\xed\xcf\xe5\xf6\x23\x26\x8d\xa3\xf1\x04\x08\x4c\
+\x5b\x20\x49\xf0\xfa\x15\x49\x71\xf5\xcd\x1b\x72\xc7\x4f\x25\xbe\
+\x6f\xda\x4a\x5a\x4f\xa0\xff\x02\xfe\x93\xb6\xe9\xa3\xe3\x77\x51\
+\xec\x23\xf3\xd8\x19\x89\x3f\x4c\x92\x7c\xe0\x2e\x9e\xe7\x21\x02\
+\x04\x08\x8c\x4f\x20\x89\x6f\xf5\x67\x90\xb9\x6b\x87\xed\xce\xdc\
+\xf3\xa6\xc4\xc3\x13\x0e\xe0\x8c\xef\x65\xa0\x45\x04\x08\xac\x25\
+\xb0\x43\x3a\xdc\xf9\x1d\xdf\xcd\xdd\x17\x25\x9e\x90\xb0\x66\x72\
+\x2d\x4c\xf7\x13\x20\x30\x2e\x81\x9d\xe7\xc3\x35\xef\xad\x35\x93\
+\xfb\x27\xbe\x7f\x5c\x0a\x5a\x43\x80\x00\x81\x9d\x08\xac\x99\x0a\
+\xd7\x7e\xa0\xd6\x4c\xbe\x37\xf1\xa3\x09\x53\xee\x9d\x98\xba\x8b\
+\x00\x81\x91\x08\xac\x9d\x07\x77\xf9\xc8\x5d\x79\xf4\xb2\xc4\xd3\
+\x12\xd6\x4c\x8e\xe4\xb5\xa0\x19\x04\x08\xac\x12\xd8\x65\x1a\xdc\
+\xf5\x83\xdf\xc9\xc3\x5b\x12\x47\x24\xf6\x59\x55\xac\x5f\x09\x10\
+\x20\x30\x7c\x81\x5d\xe7\xc0\xb9\x1e\xad\xa3\xdc\x27\x25\x7e\x32\
+\x61\x39\xd6\xf0\x5f\x12\x5a\x40\x80\xc0\x4c\x60\xae\x14\xb8\xfe\
+\x93\x6a\xca\x7d\x4d\xe2\xb9\x09\x6b\x26\x67\xb8\x7e\x12\x20\x30\
+\x6c\x81\xf5\x73\xdf\xdc\xcf\xa8\xa5\x40\xb7\x27\x8e\x4d\x3c\x6c\
+\xd8\x2a\x6a\x4f\x80\x00\x81\x08\xcc\x9d\xfe\xe6\x7f\xe2\x37\xf3\
+\xd4\xcf\x26\x7e\x21\x61\xca\xed\x55\x46\x80\xc0\x70\x05\xe6\xcf\
+\x7b\x1b\x7a\x66\x8d\x26\xff\x37\xb1\x6f\xc2\x9a\xc9\xe1\xbe\x3c\
+\xd4\x9c\xc0\xb4\x05\x36\x94\xf6\x36\xfe\xe4\x3a\x80\xf3\x8e\xc4\
+\x23\x13\xd6\x4c\x4e\xfb\xa5\xa6\xf5\x0d\x05\xfc\xe7\x6a\x84\x5b\
+\x39\xaf\x51\xd1\xb3\x62\xab\xfc\x2f\x25\xf6\x4d\x9c\xb5\xe7\x9e\
+\x7b\x7e\x67\xf6\x80\x9f\x04\x08\x74\x23\xe0\xb3\xac\x6e\x1c\x97\
+\x51\x4a\xbd\xb9\x3d\x26\xf1\xe1\xc4\x61\xc9\xc7\x7b\x2f\xa3\x12\
+\xf6\x49\x60\xcc\x02\x46\x90\x8d\x7a\x77\x01\x23\xc8\x95\x35\xff\
+\x66\x7e\x39\x25\x71\x50\xe2\xda\x8c\x26\x5b\x8f\x5e\x57\xee\xdb\
+\x6d\x02\xa3\x15\x90\x20\x1b\x75\xed\x82\x13\x64\xb5\xe2\xee\xc4\
+\xb5\x89\x83\x13\x27\x27\x49\xd6\xef\x36\x02\x04\x36\x21\x20\x41\
+\x6e\x02\x6f\x57\x7f\xba\x84\x04\x59\xd5\xa9\x91\xe3\xb6\xc4\x71\
+\x89\xa3\x92\x24\xb7\xe6\xa7\x8d\x00\x81\xdd\x14\x90\x20\x77\x13\
+\x6e\xbd\x3f\x5b\x52\x82\x9c\x55\xeb\x5b\xb9\x71\x4e\x62\xbf\xc4\
+\xe5\x49\x94\xdf\x9d\x3d\xe0\x27\x01\x02\xf3\x0b\x38\x48\x33\xbf\
+\xd5\x90\x9e\x59\xdf\xc5\xfd\xcb\x89\xfa\x5c\xf2\xf9\x49\xd6\xd6\
+\x4c\x0e\xa9\xf7\xd4\xb5\x37\x02\x46\x90\x8d\xba\x62\xc9\x23\xc8\
+\x59\xab\x6a\xca\x7d\x67\xe2\x3d\x89\x97\x27\x6e\x76\x00\x27\x0a\
+\x36\x02\x73\x0a\x48\x90\x73\x42\x6d\xf4\x69\x3d\x49\x90\xb3\x6a\
+\x7f\x3b\x37\x2e\x4d\xec\x9f\x38\x3f\x49\xd2\x9a\xc9\x99\x8c\x9f\
+\x04\x76\x21\x60\x8a\xbd\x0b\x9c\x11\x3d\x54\x53\xec\xc7\x25\x3e\
+\x96\x38\x30\xc9\xbb\xa6\xe0\x36\x02\x04\xd6\x11\x30\x82\x5c\x07\
+\x68\x77\x1f\xee\xd9\x08\x72\x65\x33\x6a\xca\x5d\x89\xf2\xd0\xc4\
+\xf5\xa6\xdc\x2b\x69\xdc\x26\xf0\xbd\x02\x12\xe4\xf7\x7a\x74\xf6\
+\x5b\x8f\x13\x64\xb5\xf1\xae\xc4\xd5\x89\x5a\x58\x7e\x6a\x92\xa4\
+\x35\x93\x81\xb0\x11\x58\x2d\x20\x41\xae\x16\xe9\xe8\xf7\x9e\x27\
+\xc8\x6a\x65\x2d\xfd\xb9\x3d\xf1\xf7\x89\xa3\x93\x24\x6b\xfd\xa4\
+\x8d\x00\x81\x15\x02\x12\xe4\x0a\x8c\x2e\x6f\x0e\x20\x41\xce\x9a\
+\x5b\x6b\x26\xcf\x48\x1c\x90\xf8\x72\x12\xa5\x35\x93\x33\x19\x3f\
+\x27\x2f\xe0\x20\xcd\xe4\x5f\x02\x7b\xd4\x01\x9b\x5f\x4f\x9c\x9e\
+\x78\x5e\x12\xbb\xaf\x76\x08\x84\x8d\x40\x09\x18\x41\x36\x7a\x1d\
+\x0c\x68\x04\xb9\x52\xa0\x3e\x8b\xac\x35\x93\x87\x24\xb6\x38\x80\
+\xb3\x92\xc6\xed\x29\x0a\x48\x90\x8d\x7a\x7d\xa0\x09\x72\xa6\xf1\
+\xc5\xdc\x78\x41\xe2\xa2\x24\x49\x6b\x26\x67\x2a\x7e\x4e\x4e\xc0\
+\x14\x7b\x72\x5d\x3e\x57\x83\x7f\x26\xcf\x3a\x2b\xf1\xf2\x24\xfa\
+\x5a\x43\x69\x23\x30\x49\x01\x23\xc8\x46\xdd\x3e\xf0\x11\xe4\x4a\
+\x95\x5a\x0e\xf4\xb4\xc4\x75\xa6\xdc\x2b\x59\xdc\x9e\x82\x80\x11\
+\xe4\x14\x7a\x79\x73\x6d\xfc\x89\xfc\xf9\x25\x89\xa7\x26\xe9\xef\
+\xb5\xb9\xa2\xfc\x35\x81\x61\x09\x48\x90\xc3\xea\xaf\x65\xd5\xf6\
+\xa1\xd9\xf1\x27\x12\xaf\x4d\x92\xdc\x67\x59\x95\xb0\x5f\x02\x8b\
+\x16\x30\xc5\x6e\x24\x3e\xa2\x29\xf6\x4a\xa1\xba\x3a\x50\xad\x99\
+\xfc\xf3\xc4\x35\xd6\x4c\xae\xa4\x71\x7b\x8c\x02\x46\x90\x63\xec\
+\xd5\x76\x6d\xaa\x37\xd4\x5f\x4b\x7c\x26\xf1\xec\xbc\x09\x58\x33\
+\xd9\xce\x5a\xc9\x3d\x10\x90\x20\x7b\xd0\x09\x03\xac\xc2\xa3\x52\
+\xe7\x77\x27\x8e\x4e\x92\xac\xe9\xb7\x8d\xc0\x28\x05\x4c\xb1\x1b\
+\x75\xeb\x48\xa7\xd8\xab\xb5\xea\x34\xc5\xf3\x13\x75\x9d\xc9\x4b\
+\x4d\xb9\x57\xf3\xf8\x7d\xe8\x02\x46\x90\x43\xef\xc1\xe5\xd6\xbf\
+\x4e\x53\x7c\x62\xa2\x0e\xe0\xfc\x59\xde\x14\xac\x99\x5c\x6e\x7f\
+\xd8\x7b\xc7\x02\x46\x90\x1d\x83\xce\x8a\x9b\xc8\x08\xf2\xbe\xe6\
+\xe6\x46\x5d\x67\xf2\x3f\x13\x2f\x4b\xfc\x9f\x35\x93\x51\xb0\x0d\
+\x5e\x40\x82\x6c\xd4\x85\x13\x4b\x90\x33\xc5\xfa\x6a\x87\xcb\x13\
+\x35\xe5\x3e\x3b\x49\xd2\x69\x8a\x33\x19\x3f\x07\x29\x60\x8a\x3d\
+\xc8\x6e\xeb\x5d\xa5\x67\x89\xb0\xa6\xd8\x3f\x9b\x38\x21\xf1\xa2\
+\xbc\x49\xec\xdd\xbb\x9a\xaa\x10\x81\x0d\x08\x18\x41\x6e\x00\x6b\
+\x23\x4f\x9d\xd8\x08\xf2\x9b\xb1\xa9\xe4\xb8\xf2\x0d\xb7\xa6\xdc\
+\xf5\xb5\xb3\x75\xd5\xf2\xaf\x9a\x72\x47\xc1\x36\x38\x01\x09\xb2\
+\x51\x97\x4d\x2c\x41\xae\xa5\x58\x97\x4f\xbb\x36\x71\x70\xe2\xe4\
+\x24\x49\x5f\xed\xb0\x96\x94\xfb\x7b\x29\x20\x41\x36\xea\x16\x09\
+\xf2\x3e\xd8\x3a\xfb\xa6\xbe\xda\xe1\xb8\xc4\x6b\x92\x24\xb7\xde\
+\xf7\x88\x1b\x04\x7a\x2e\x20\x41\x36\xea\x20\x09\x72\x07\xd8\x5a\
+\x33\x79\x76\xa2\x0e\xe0\x5c\x9e\x44\xe9\xab\x1d\x76\x20\x72\x47\
+\xdf\x04\x56\x7e\x66\xd4\xb7\xba\xa9\xcf\xb8\x04\x6a\xcd\xe4\xaf\
+\x24\xea\x73\xc9\x3f\xc9\x1b\x88\xd3\x14\xc7\xd5\xbf\xa3\x6c\x8d\
+\x11\x64\xa3\x6e\x35\x82\x5c\x13\xb6\xa6\xdc\x75\x00\xa7\x4e\x55\
+\x3c\x3c\x71\xb3\x03\x38\x51\xb0\xf5\x52\x40\x82\x6c\xd4\x2d\x12\
+\xe4\xba\xb0\xf5\xdd\xdc\x75\x9d\xc9\xfd\x12\x17\x24\x49\xce\x96\
+\x0a\xad\xfb\x87\x9e\x40\x60\x51\x02\xa6\xd8\x8b\x92\xb6\x9f\xd5\
+\x02\x35\xc5\x7e\x7c\xe2\xc4\xc4\x01\x79\x43\xa9\x29\xb8\x8d\x40\
+\xaf\x04\x8c\x20\x1b\x75\x87\x11\xe4\x86\x60\x6b\xca\xfd\xb1\xc4\
+\xa1\x89\xeb\x4d\xb9\x37\x64\xe7\xc9\x0d\x05\x24\xc8\x46\xb8\x12\
+\xe4\x86\x61\x6b\x8d\xe4\x55\x89\x17\x26\x4e\x4b\x92\xb4\x66\x72\
+\xc3\x84\xfe\xa0\x6b\x01\x09\xb2\x6b\xd1\xed\xe5\x49\x90\xbb\x05\
+\x5b\x4b\x7f\x6a\xcd\xe4\xb1\x89\x63\x92\x24\xb7\xed\x56\x29\xfe\
+\x88\x40\x47\x02\x12\x64\x47\x90\xab\x8b\x91\x20\x57\x8b\x6c\xe8\
+\xf7\x3a\x75\xf1\xcc\x44\xad\x99\xbc\x2a\x89\xd2\x9a\xc9\x0d\xf1\
+\x79\x72\x57\x02\x0e\xd2\x74\x25\xa9\x9c\x2e\x05\xea\x22\x17\x4f\
+\x4d\x7c\x2a\xf1\x07\x79\xb3\xb1\x66\x32\x10\xb6\xc5\x0b\x18\x41\
+\x36\x32\x37\x82\xec\x04\xb6\xd6\x4c\xde\x91\x78\x7b\xe2\x88\x8c\
+\x24\xb7\x74\x52\xaa\x42\x08\xcc\x29\x20\x41\xce\x09\xb5\xd1\xa7\
+\x49\x90\x1b\x15\xdb\xe1\xf9\x95\x1c\x67\xaf\xcf\x3a\x4d\xf1\xa2\
+\x44\x4d\xb9\x2f\x4e\xa2\xb4\x66\x32\x10\xb6\xf6\x02\xa6\xd8\xed\
+\x8d\xed\x61\xf7\x04\x66\xc9\xb1\xfe\xba\xd6\x48\x3e\x21\xf1\xf1\
+\xc4\xbe\x79\xf3\xf1\xd5\x0e\x81\xb0\xb5\x17\x58\xf9\x22\x6c\xbf\
+\xb7\x09\xed\xc1\x08\xb2\xd3\xce\x9e\x8d\x26\xeb\x67\xad\x99\xfc\
+\x50\xe2\xc5\x89\x1b\x32\x9a\xac\xfb\x6c\x04\x9a\x08\x48\x90\x4d\
+\x58\xf7\xd8\x43\x82\x6c\x04\x7b\x6f\xb1\x75\x9a\xe2\x95\x89\x03\
+\x13\x67\x26\x49\x5a\x33\x79\xaf\x8b\x7f\x3b\x16\x30\xc5\xee\x18\
+\x54\x71\x0b\x11\xa8\xa3\xda\x8f\x4d\xd4\x48\xf2\xa5\x79\x33\xda\
+\x67\x21\x7b\xb5\x93\xc9\x09\x18\x41\x36\xea\x72\x23\xc8\x46\xb0\
+\x3b\x16\x5b\x6b\x26\x4f\x4d\xd4\x19\x38\xd7\x64\x34\x69\xcd\xe4\
+\x8e\x46\xee\xd9\x4d\x01\x09\x72\x37\xe1\xd6\xfb\x33\x09\x72\x3d\
+\xa1\x4e\x1f\xaf\xa3\xda\x5f\x4d\xd4\xb9\xdc\x27\x26\x49\xd6\x14\
+\xdc\x46\x60\xd3\x02\x12\xe4\xa6\x09\x77\x5e\x80\x04\xb9\x73\x97\
+\x86\xf7\xd6\xc1\x9a\x3a\x35\xf1\x2d\x89\xbf\x49\x92\xbc\xad\xe1\
+\xbe\x14\x3d\x11\x01\x09\xb2\x51\x47\x4b\x90\x8d\x60\xd7\x2f\xb6\
+\xbe\x9b\xfb\xdc\x44\xad\x99\xfc\xa2\x29\xf7\xfa\x60\x9e\xb1\xb6\
+\x80\x83\x34\x6b\xdb\x78\x64\x98\x02\xb5\x46\xf2\x49\x89\x4f\x24\
+\x5e\x90\x37\x2a\x6b\x26\x87\xd9\x8f\xbd\xa8\xb5\x11\x64\xa3\x6e\
+\x30\x82\x6c\x04\x3b\x7f\xb1\xb3\x35\x93\xff\x91\x3f\x79\x59\xe2\
+\xc6\x8c\x26\xad\x99\x9c\xdf\xcf\x33\x23\x20\x41\x36\x7a\x19\x48\
+\x90\x8d\x60\x37\x5e\x6c\x1d\xb0\xb9\x2c\x51\x53\xee\x73\x92\x24\
+\x9d\xa6\xb8\x71\xc3\xc9\xfe\x85\x29\xf6\x64\xbb\x7e\x32\x0d\xaf\
+\x35\x93\x3f\x97\x38\x21\x71\x48\xde\xb8\xea\x4a\x41\x36\x02\x73\
+\x09\x18\x41\xce\xc5\xb4\xf1\x27\x19\x41\x6e\xdc\x6c\x01\x7f\x51\
+\xa7\x29\x9e\x9c\x38\x38\x71\x9d\x29\xf7\x02\xc4\x07\xbe\x0b\x09\
+\xb2\x51\x07\x4a\x90\x8d\x60\x37\x5f\x6c\x4d\xb9\xaf\x4d\x54\x92\
+\xfc\x44\x92\xa4\xd3\x14\x37\x6f\x3a\xda\x12\x24\xc8\x46\x5d\x2b\
+\x41\x36\x82\xed\xa6\xd8\x3a\x58\x53\x5f\xed\xf0\xc6\xc4\x6b\x92\
+\x24\xeb\xb6\x8d\xc0\x0e\x02\x12\xe4\x0e\x24\xdd\xdc\x21\x41\x76\
+\xe3\xd8\xa0\x94\x4a\x8e\xb3\xd7\x7d\x5d\x67\xf2\x73\x89\x3a\x80\
+\x73\x45\x12\xa5\xd3\x14\x03\x61\xbb\x5f\xc0\x41\x9a\xfb\x2d\xdc\
+\x9a\x86\xc0\x2c\x39\x56\x6b\xeb\x3a\x93\xbf\x9a\x38\x25\xf1\xc7\
+\x79\x53\xf3\xd5\x0e\x81\xb0\xdd\x2f\xb0\xf2\xc5\x72\xff\xbd\x6e\
+\x6d\x5a\xc0\x08\x72\xd3\x84\xad\x0b\xa8\xd1\xe2\x6c\x80\x30\x5b\
+\x33\xf9\xae\xdc\x77\x78\xe2\x16\x07\x70\x5a\xf3\x0f\xa3\x7c\x09\
+\xb2\x51\x3f\x49\x90\x8d\x60\xbb\x2f\x76\xe5\x94\xbb\x4e\x53\xbc\
+\x24\xb1\x5f\xe2\xf3\x49\x92\xd6\x4c\x76\xef\x3d\xa8\x12\x67\xef\
+\xa0\x83\xaa\xb4\xca\x12\xe8\x50\xa0\x06\x09\xb3\x23\xd9\x75\x5a\
+\xe2\xe3\x12\x27\x26\xf6\xcf\x9b\x5c\x4d\xc1\x6d\x13\x16\x30\x82\
+\x6c\xd4\xf9\x46\x90\x8d\x60\xdb\x15\x7b\x73\x8a\x7e\x78\x62\xf6\
+\x7f\xa2\xd6\x4c\x7e\x34\x51\x97\x50\xfb\x9a\x29\x77\x14\x26\xb8\
+\xcd\x5e\x0c\x13\x6c\x7a\xdb\x26\x4b\x90\x6d\x7d\x1b\x95\x5e\x5f\
+\x2b\xfb\x90\xc4\x03\xb6\x97\x5f\x6b\x26\xaf\x4e\xd4\x57\x3b\x9c\
+\x9e\x24\x39\x1b\x69\x6e\x7f\xd8\x8f\xb1\x0b\x48\x90\x8d\x7a\x58\
+\x82\x6c\x04\xbb\x98\x62\x2b\x31\xce\x8e\x68\xd7\xc1\x9c\xad\x89\
+\x63\x13\xaf\x4b\x92\xac\x6b\x4e\xda\x26\x22\x20\x41\x36\xea\x68\
+\x09\xb2\x11\xec\xe2\x8a\xad\x44\xf8\xe0\xc4\xec\xff\x48\x7d\xb5\
+\xc3\x19\x89\x5a\x33\x79\x75\x12\xa5\x35\x93\x81\x18\xfb\x36\xeb\
+\xfc\xb1\xb7\x73\xe1\xed\x93\x20\x17\x4e\xbe\x88\x1d\xd6\x14\xfb\
+\x6b\x89\x17\x27\x8e\x4f\x92\xac\x91\xa6\x6d\xc4\x02\x12\x64\xa3\
+\xce\x95\x20\x1b\xc1\x2e\xbf\xd8\x5a\x16\x74\x47\xe2\x5f\x12\x47\
+\x26\x49\xd6\xe7\x96\xb6\x91\x0a\x48\x90\x8d\x3a\x56\x82\x6c\x04\
+\xdb\x9f\x62\xeb\x34\xc5\x0b\x13\x35\xe5\xfe\x42\x12\xa5\x35\x93\
+\xfd\xe9\x9b\xce\x6a\x62\x1d\x64\x67\x94\x0a\x9a\x98\x40\xad\x91\
+\xfc\xa5\xc4\xc7\x13\xfb\xe6\x0d\xd1\x57\x3b\x8c\xf0\x05\x60\x04\
+\xd9\xa8\x53\x8d\x20\x1b\xc1\xf6\xaf\xd8\xd9\x69\x8a\x1f\x4a\xd5\
+\xea\xb3\xc9\x1b\x32\x9a\xac\xfb\x6c\x23\x10\x90\x20\x1b\x75\xa2\
+\x04\xd9\x08\xb6\xbf\xc5\xd6\x01\x9b\x2b\x13\x07\x24\xce\x34\xe5\
+\xee\x6f\x47\x6d\xa4\x66\xa6\xd8\x1b\xd1\xf2\x5c\x02\x6b\x0b\xd4\
+\xba\xc9\xc7\x26\x8e\x4f\xbc\x24\x6f\x90\xfb\xac\xfd\x54\x8f\x0c\
+\x45\xc0\x08\xb2\x51\x4f\x19\x41\x36\x82\x1d\x46\xb1\xb5\x66\xf2\
+\x93\x89\x83\x12\xd7\x98\x72\x0f\xa3\xd3\x76\x56\x4b\x09\x72\x67\
+\x2a\x1d\xdc\x27\x41\x76\x80\x38\xec\x22\x6a\xcd\xe4\x75\x89\x43\
+\x12\x27\x25\x49\x5a\x33\x39\xc0\xfe\x94\x20\x1b\x75\x9a\x04\xd9\
+\x08\x76\x58\xc5\xd6\xc1\x9a\x3a\x23\xe7\xcd\x89\x57\x27\x49\xde\
+\x36\xac\xea\xab\xad\x04\xd9\xe8\x35\x20\x41\x36\x82\x1d\x66\xb1\
+\xb5\x66\xf2\xbc\x44\x5d\x67\xf2\xb2\x24\x4a\xa7\x29\x0e\xa4\x1f\
+\x1d\xa4\x19\x48\x47\xa9\xe6\xa0\x05\x6a\xcd\xe4\x93\x12\xa7\x24\
+\xfe\x34\x6f\x9e\xd6\x4c\x0e\xa4\x3b\x8d\x20\x1b\x75\x94\x11\x64\
+\x23\xd8\x61\x17\x3b\x5b\x33\xf9\xbe\x34\xe3\xe5\x89\x1b\x1d\xc0\
+\xe9\x77\x87\x4a\x90\x8d\xfa\x47\x82\x6c\x04\x3b\x8e\x62\xeb\xab\
+\x1d\x2e\x4b\xd4\x69\x8a\xe7\x26\x49\x3a\x4d\xb1\xa7\xfd\x6a\x8a\
+\xdd\xd3\x8e\x51\xad\x51\x0b\xd4\x14\xfb\xe7\x13\x75\xc5\xf2\x83\
+\xf3\x66\xba\xf7\xa8\x5b\x3b\xe0\xc6\x19\x41\x36\xea\x3c\x23\xc8\
+\x46\xb0\xc3\x2f\xb6\x0e\xd0\xd4\xff\xbb\xd9\xff\xbd\xfa\x6a\x87\
+\x3a\x9f\xbb\x96\x03\x5d\x67\xca\x1d\x85\x1e\x6d\xb3\x4e\xea\x51\
+\x95\xc6\x51\x15\x09\x72\x1c\xfd\xd8\xb0\x15\x35\xad\x5e\xf9\xd5\
+\x0e\xd7\xe4\xf7\x83\x13\xa7\x24\x49\xfa\x6a\x87\x40\xf4\x61\x93\
+\x20\x1b\xf5\x82\x04\xd9\x08\x76\xbc\xc5\xd6\xc8\xf2\xf6\xc4\x1b\
+\x13\xaf\x4d\x92\xac\xdb\xb6\x25\x0b\x48\x90\x8d\x3a\x40\x82\x6c\
+\x04\x3b\xfe\x62\xeb\x8c\x9b\xfa\x6a\x87\xba\xe8\xc5\x95\x49\x94\
+\xd6\x4c\x2e\xb1\xcf\x1d\xa4\x59\x22\xbe\x5d\x13\xd8\x89\x40\x5d\
+\xf4\xe2\x29\x89\x3a\x97\xfb\x8f\xf2\x46\x3b\xfb\xf2\xb0\x9d\x3c\
+\xd5\x5d\xad\x05\x8c\x20\x1b\x09\x1b\x41\x36\x82\x9d\x56\xb1\xf5\
+\xd5\x0e\xef\x48\xbc\x2a\x71\x8b\x03\x38\x8b\xef\x7c\x09\xb2\x91\
+\xb9\x04\xd9\x08\x76\x7a\xc5\xd6\x01\x9b\x8b\x12\x75\x9a\xe2\x85\
+\x49\x92\xd6\x4c\x2e\xf0\x35\x60\x8a\xbd\x40\x6c\xbb\x22\xb0\x1b\
+\x02\x7b\xe5\x6f\x7e\x31\x71\x52\x62\xbf\xbc\xf1\xd6\x69\x8b\xb6\
+\x05\x09\x18\x41\x36\x82\x36\x82\x6c\x04\x3b\xed\x62\x6b\xcd\xe4\
+\x47\x12\x2f\x4a\x7c\xdd\x94\xbb\xfd\x8b\x41\x82\x6c\x64\x2c\x41\
+\x36\x82\x55\x6c\x1d\xe5\xbe\x2a\x51\x47\xb9\x3f\x93\x24\x69\xcd\
+\x64\xc3\xd7\x84\x29\x76\x43\x5c\x45\x13\x68\x20\x50\x47\xb5\x1f\
+\x93\xf8\x60\xe2\xf0\xbc\x11\x3f\xb8\xc1\x3e\x14\xb9\x5d\xc0\x08\
+\xb2\xd1\x4b\xc1\x08\xb2\x11\xac\x62\x57\x0a\xd4\x57\x3b\x7c\x3a\
+\x71\x60\xe2\xea\x8c\x26\xad\x99\x5c\xa9\xd3\xc1\x6d\x23\xc8\x0e\
+\x10\x15\x41\x60\x49\x02\x75\x91\x8b\xa7\x27\x6a\xcd\xe4\x73\xf2\
+\xa6\x6c\xcd\x64\xc7\x1d\x61\x04\xd9\x31\xe8\xac\x38\x23\xc8\x99\
+\x84\x9f\x0b\x10\xa8\xeb\x4c\xd6\x9a\xc9\xb7\x25\x8e\xcc\x48\xf2\
+\xd6\x05\xec\x73\x12\xbb\x90\x20\x1b\x75\xb3\x04\xd9\x08\x56\xb1\
+\xbb\x12\xa8\x03\x38\x17\x24\xf6\x4b\x92\xac\xb5\x93\xb6\x4d\x0a\
+\x48\x90\x9b\x04\x5c\xeb\xcf\x25\xc8\xb5\x64\xdc\xdf\x58\xa0\x3e\
+\x87\xac\x2b\x95\xff\x48\xe3\xfd\x4c\xa2\x78\x9f\x41\x4e\xa2\x9b\
+\x35\x72\x42\x02\xf5\x7f\x7a\xcb\x84\xda\xdb\xb4\xa9\x12\x64\x53\
+\x5e\x85\x13\x68\x2e\x50\xa7\x1e\xd6\x67\x90\xb3\xad\x6e\xbf\x65\
+\xf6\x8b\x9f\x9b\x13\xa8\xd3\x98\x6c\x04\x08\x0c\x53\xa0\xbe\xdb\
+\x66\xe5\x37\x24\x7e\x29\xbf\xd7\x77\x70\xd7\xc1\x1a\x5b\x07\x02\
+\x3e\x83\xec\x00\x71\x67\x45\xf8\x0c\x72\x67\x2a\xee\x6b\x28\xf0\
+\xee\x94\xfd\xaa\xc4\x37\xf2\xf9\x63\x7d\x0f\xb7\xad\x03\x01\x23\
+\xc8\x0e\x10\x15\x41\x60\x89\x02\xb7\x65\xdf\x2f\x4d\xd4\x57\xc9\
+\xde\x96\xe4\xb8\x72\xba\xbd\xc4\x6a\x8d\x63\xd7\x12\xe4\x38\xfa\
+\x51\x2b\xa6\x29\xf0\xf9\x34\xbb\xbe\x3a\xf6\xe2\x24\xc6\x3a\xab\
+\xc6\xd6\xb1\x80\x83\x34\x1d\x83\x2a\x8e\xc0\x02\x04\x6a\x94\xf8\
+\xa6\xc4\xef\x24\xce\x97\x1c\xdb\x89\x1b\x41\xb6\xb3\x55\x32\x81\
+\x16\x02\x37\xa6\xd0\xfa\x8a\xd8\x13\x12\x5b\x4d\xa9\x5b\x10\xdf\
+\x5f\xa6\x04\x79\xbf\x85\x5b\x04\xfa\x2e\x50\x5f\xe6\xf5\xc2\xc4\
+\xe5\x49\x8c\x0e\xc4\x2c\xa0\xb7\x24\xc8\x05\x20\xdb\x05\x81\x4d\
+\x0a\xd4\x5a\xc7\xd7\x25\x5e\x9f\xb8\x29\xc9\xd1\x55\x7b\x36\x09\
+\x3a\xef\x9f\x4b\x90\xf3\x4a\x79\x1e\x81\xe5\x08\x5c\x9f\xdd\xd6\
+\xc5\x71\x3f\x95\xd8\x66\x4a\xbd\xd8\x4e\x90\x20\x17\xeb\x6d\x6f\
+\x04\x36\x22\xf0\xf1\x3c\xf9\xd0\xc4\x55\x49\x8c\x75\x21\x0a\xdb\
+\x82\x05\x24\xc8\x05\x83\xdb\x1d\x81\x39\x04\xea\xf3\xc5\x57\x27\
+\xfe\x29\xb1\xc5\x94\x7a\x0e\xb1\x46\x4f\x91\x20\x1b\xc1\x2a\x96\
+\xc0\x9c\x02\xb5\x64\x67\xe5\x19\x6d\x5f\xce\xef\xb5\xb6\xf1\xb3\
+\x49\x8c\x75\x8d\x47\xdb\x12\x05\xac\x83\x5c\x22\xbe\x5d\x4f\x5e\
+\xa0\x0e\xb6\xac\x4c\x8e\xef\xcf\xef\xbf\x99\x38\x4d\x72\xec\xc7\
+\x6b\xc3\x08\xb2\x1f\xfd\xa0\x16\xd3\x13\xa8\x91\xe3\x6c\x80\xb2\
+\x2d\xb7\x0f\x4f\xbc\x33\x71\x6b\x92\xa3\xd3\x05\x03\xd1\x87\x4d\
+\x82\xec\x43\x2f\xa8\xc3\x14\x05\x66\x23\xc7\x4b\xd3\xf8\xfd\x12\
+\x17\x24\x31\xd6\xf7\x5e\xdb\x7a\x24\x30\x7b\x07\xeb\x51\x95\x54\
+\x85\xc0\x64\x04\xfe\x35\x2d\x7d\x66\xe2\x6c\xc9\xb1\x9f\x7d\x6e\
+\x04\xd9\xcf\x7e\x51\xab\x71\x0b\xdc\x92\xe6\xbd\x38\xf1\x81\x84\
+\x2b\xf0\xf4\xb8\xaf\x25\xc8\x1e\x77\x8e\xaa\x8d\x52\xe0\x9c\xb4\
+\xaa\x16\x7e\x5f\x9a\x51\xa3\xd3\x05\x7b\xde\xc5\xa6\xd8\x3d\xef\
+\x20\xd5\x1b\x8d\x40\x9d\x2e\xf8\x86\xc4\xef\x27\x2e\x92\x1c\x87\
+\xd1\xaf\x46\x90\xc3\xe8\x27\xb5\x1c\xb6\xc0\x37\x52\xfd\x83\x13\
+\x27\x25\x6e\x4f\x72\x74\x94\x7a\x20\xfd\x29\x41\x0e\xa4\xa3\x54\
+\x73\xb0\x02\xa7\xa6\xe6\x07\x25\xbe\x94\xc4\x58\xdf\x21\x63\x1b\
+\x90\x80\x04\x39\xa0\xce\x52\xd5\x41\x09\xd4\xb9\xd3\x47\x27\x6a\
+\x5a\x7d\x4b\x92\xa3\x2b\xf0\x0c\xaa\xfb\xee\xad\xac\x04\x39\xc0\
+\x4e\x53\xe5\xde\x0b\x5c\x9b\x1a\xd6\x81\x98\xd3\x13\x77\x98\x52\
+\x47\x61\xa0\x9b\x04\x39\xd0\x8e\x53\xed\xde\x0a\x7c\x24\x35\x3b\
+\x2c\x71\x6d\x12\xa3\x2b\xf0\xf4\xb6\x9b\xe6\xab\x98\x04\x39\x9f\
+\x93\x67\x11\x58\x4f\xa0\xbe\x34\xeb\xc8\xc4\x5b\x13\x75\xba\xa0\
+\x29\xf5\x7a\x62\x03\x78\x5c\x82\x1c\x40\x27\xa9\x62\xef\x05\xae\
+\x48\x0d\xeb\x74\xc1\x73\x92\x18\x5d\x81\xa7\xf7\xdd\x35\x7f\x05\
+\xad\x83\x9c\xdf\xca\x33\x09\xec\x4c\xe0\xdd\xb9\xb3\xae\xc0\x73\
+\x86\xe4\xb8\x33\x9e\x61\xdf\x67\x04\x39\xec\xfe\x53\xfb\xe5\x09\
+\xdc\x9e\x5d\xbf\x24\xf1\xbe\x84\x2b\xf0\x2c\xaf\x1f\x9a\xee\x59\
+\x82\x6c\xca\xab\xf0\x91\x0a\x5c\x96\x76\xfd\x45\xe2\xe2\x8c\x1a\
+\xeb\xb3\x47\xdb\x48\x05\x4c\xb1\x47\xda\xb1\x9a\xd5\x44\xa0\xce\
+\x80\x79\x73\xe2\xe9\x89\xf3\x25\xc7\x26\xc6\xbd\x2a\xd4\x08\xb2\
+\x57\xdd\xa1\x32\x3d\x16\xb8\x31\x75\xab\x2f\xd0\xaa\x65\x3c\x5b\
+\x93\x1c\x9d\x2e\xd8\xe3\xce\xea\xaa\x6a\x12\x64\x57\x92\xca\x19\
+\xb3\xc0\x99\x69\xdc\x81\x89\xcb\x93\x18\x5d\x81\x67\xcc\x3d\xbd\
+\xaa\x6d\xa6\xd8\xab\x40\xfc\x4a\x60\x85\x40\x5d\x81\xe7\x98\xc4\
+\x73\x13\x97\x48\x8e\x2b\x64\x26\x72\xd3\x08\x72\x22\x1d\xad\x99\
+\x1b\x16\xb8\x3e\x7f\x51\xa3\xc6\x4f\x26\xb6\x99\x52\x6f\xd8\x6f\
+\x14\x7f\x20\x41\x8e\xa2\x1b\x35\xa2\x63\x81\x93\x53\xde\x21\x89\
+\xab\x93\x18\x5d\x81\xa7\x63\xdc\x21\x15\x27\x41\x0e\xa9\xb7\xd4\
+\xb5\xb5\x40\x7d\xbe\x78\x54\xe2\xb8\xc4\x96\x24\x47\xa7\x0b\xb6\
+\x16\xef\x79\xf9\x12\x64\xcf\x3b\x48\xf5\x16\x26\x70\x55\xf6\xb4\
+\x7f\xe2\xb3\x49\x8c\xf5\x35\xac\x36\x02\xf7\x7d\x2f\x2f\x0a\x02\
+\x53\x16\xf8\xaf\x34\xbe\x4e\x17\x3c\x55\x72\x9c\xf2\xcb\x60\xc7\
+\xb6\x1b\x41\xee\x68\xe2\x9e\xe9\x08\xd4\x48\xf1\x95\x89\x77\x26\
+\x6a\x4a\x6d\x6d\xe3\x74\xfa\x7e\xae\x96\x4a\x90\x73\x31\x79\xd2\
+\x08\x05\x2e\x4d\x9b\xea\x0a\x3c\x17\x24\x31\xde\x39\xc2\xf6\x69\
+\x52\x07\x02\xd6\x41\x76\x80\xa8\x88\xc1\x09\xbc\x3d\x35\x7e\x66\
+\xe2\x6c\xc9\x71\x70\x7d\xb7\xd0\x0a\x1b\x41\x2e\x94\xdb\xce\x96\
+\x2c\x70\x4b\xf6\x5f\x57\xe0\xa9\xcf\x1c\x6f\x33\xa5\x5e\x72\x6f\
+\x0c\x60\xf7\x12\xe4\x00\x3a\x49\x15\x3b\x11\x38\x37\xa5\xd4\xf7\
+\xc4\x5c\x9a\xc4\xe8\x0a\x3c\x9d\x90\x8e\xbf\x10\x53\xec\xf1\xf7\
+\xf1\xd4\x5b\x58\x6b\x19\xff\x21\xf1\xec\xc4\x85\x92\xe3\xd4\x5f\
+\x0e\x1b\x6b\xbf\x11\xe4\xc6\xbc\x3c\x7b\x58\x02\x37\xa4\xba\x07\
+\x27\x4e\x4c\xdc\x6e\x4a\x3d\xac\xce\xeb\x43\x6d\x25\xc8\x3e\xf4\
+\x82\x3a\xb4\x10\x38\x2d\x85\x1e\x94\xb8\x32\x89\xd1\xe9\x82\x2d\
+\x84\x27\x50\xa6\x04\x39\x81\x4e\x9e\x58\x13\xef\x4e\x7b\x8f\x4e\
+\xbc\x21\x71\x73\x92\xa3\xd3\x05\x27\xf6\x02\xe8\xb2\xb9\x12\x64\
+\x97\x9a\xca\x5a\xb6\xc0\xb5\xa9\x40\x5d\x81\xa7\x46\x8f\x77\x98\
+\x52\x2f\xbb\x3b\x86\xbf\x7f\x09\x72\xf8\x7d\xa8\x05\xf7\x0a\x9c\
+\x90\x1f\x87\x25\xae\x49\x62\xbc\x0b\x0a\x81\x2e\x04\x24\xc8\x2e\
+\x14\x95\xb1\x4c\x81\xfa\x7c\xf1\x88\xc4\xdb\x12\xae\xc0\xb3\xcc\
+\x9e\x18\xe1\xbe\x25\xc8\x11\x76\xea\x84\x9a\x74\x65\xda\x5a\xa7\
+\x0b\xd6\x19\x31\x77\x4c\xa8\xdd\x9a\xba\x20\x01\xeb\x20\x17\x04\
+\x6d\x37\x9d\x0b\xbc\x27\x25\xd6\x15\x78\x3e\x23\x39\x76\x6e\xab\
+\xc0\xed\x02\x46\x90\x5e\x0a\x43\x13\xd8\x9a\x0a\xbf\x2c\xf1\xde\
+\xc4\xad\x0e\xc4\x0c\xad\xfb\x86\x55\x5f\x09\x72\x58\xfd\x35\xf5\
+\xda\x5e\x14\x80\x9a\x52\x5f\x94\xc4\xe8\x74\xc1\xa9\xbf\x1a\x16\
+\xd0\x7e\x53\xec\x05\x20\xdb\xc5\xa6\x05\xea\x3a\x8d\x6f\x49\x3c\
+\x2b\x71\x9e\xe4\xb8\x69\x4f\x05\xcc\x29\x60\x04\x39\x27\x94\xa7\
+\x2d\x4d\xe0\xa6\xec\xf9\xd0\xc4\x87\x13\x5b\x4d\xa9\x97\xd6\x0f\
+\x93\xdc\xb1\x04\x39\xc9\x6e\x1f\x4c\xa3\xcf\x4a\x4d\xeb\x0a\x3c\
+\xff\x9d\xc4\x58\x5f\xa8\x65\x23\xb0\x50\x01\x53\xec\x85\x72\xdb\
+\xd9\x2e\x04\x6a\x1a\x3d\xdb\xbe\x93\x1b\xaf\x4b\x3c\x27\xf1\x05\
+\xc9\x71\xc6\xe2\xe7\xa2\x05\x8c\x20\x17\x2d\x6e\x7f\x3b\x13\xa8\
+\xe4\xb8\xe7\xf6\x07\xbe\x96\x9f\x75\xba\xe0\x29\x89\x6d\xa6\xd4\
+\xdb\x55\xfc\x58\x8a\x80\x04\xb9\x14\x76\x3b\x5d\x25\x30\x4b\x8e\
+\x27\xe7\xfe\xfa\xbc\xf1\xaa\x24\x46\x57\xe0\x59\x85\xe4\xd7\xc5\
+\x0b\x48\x90\x8b\x37\xb7\xc7\x1d\x05\x2a\x19\x1e\x95\x38\x2e\x71\
+\x4b\x92\xa3\x2b\xf0\xec\x68\xe4\x9e\x25\x08\x48\x90\x4b\x40\xb7\
+\xcb\xef\x11\xb8\x3a\xbf\xed\x9f\x38\x33\x89\xb1\xbe\x86\xd5\x46\
+\xa0\x37\x02\x0e\xd2\xf4\xa6\x2b\x26\x59\x91\x0f\xa4\xd5\xcf\x48\
+\x9c\x2a\x39\x4e\xb2\xff\x7b\xdf\x68\x23\xc8\xde\x77\xd1\x28\x2b\
+\x58\x17\x96\x78\x65\xe2\x1d\x89\xba\x02\xcf\xca\x23\xd8\xa3\x6c\
+\xb0\x46\x0d\x53\x40\x82\x1c\x66\xbf\x0d\xb9\xd6\x5f\x4c\xe5\xeb\
+\x74\xc1\xf3\x93\x18\xef\x1c\x72\x43\xd4\x7d\xfc\x02\xa6\xd8\xe3\
+\xef\xe3\x3e\xb5\xf0\xdf\x52\x99\x67\x26\x3e\x27\x39\xf6\xa9\x5b\
+\xd4\x65\x2d\x01\x23\xc8\xb5\x64\xdc\xdf\xa5\xc0\x96\x14\xf6\x92\
+\xc4\xfb\x13\xb7\x99\x52\x77\x49\xab\xac\x96\x02\x12\x64\x4b\x5d\
+\x65\x97\xc0\x79\x89\x3a\x4a\x7d\x69\x12\xa3\x2b\xf0\x94\x88\x6d\
+\x30\x02\xa6\xd8\x83\xe9\xaa\xc1\x55\xb4\xd6\x32\xfe\x63\xe2\xf7\
+\x12\x17\x4a\x8e\x83\xeb\x3f\x15\x8e\x80\x11\xa4\x97\x41\x0b\x81\
+\x1b\x52\xe8\x21\x89\x8f\x25\x6e\x37\xa5\x6e\x41\xac\xcc\x45\x08\
+\x48\x90\x8b\x50\x9e\xd6\x3e\x4e\x4f\x73\x0f\x4a\x5c\x91\xc4\xe8\
+\x74\xc1\x69\xf5\xfd\xe8\x5a\x2b\x41\x8e\xae\x4b\x97\xd6\xa0\xba\
+\x02\xcf\xd1\x89\x63\x13\x37\x27\x39\x3a\x5d\x70\x69\x5d\x61\xc7\
+\x5d\x09\x48\x90\x5d\x49\x4e\xbb\x9c\xaf\xa6\xf9\x75\x05\x9e\xd3\
+\x12\xae\xc0\x33\xed\xd7\xc2\xa8\x5a\x2f\x41\x8e\xaa\x3b\x97\xd2\
+\x98\x8f\x66\xaf\x2f\x4a\x5c\x93\x51\xe3\x5d\x4b\xa9\x81\x9d\x12\
+\x68\x24\x20\x41\x36\x82\x9d\x40\xb1\x95\x0c\x8f\x48\xbc\x35\x51\
+\xa7\x0b\x9a\x52\x4f\xa0\xd3\xa7\xd6\x44\x09\x72\x6a\x3d\xde\x4d\
+\x7b\xaf\x4c\x31\xb5\xb6\xb1\xce\x88\xa9\xf3\xaa\x6d\x04\x46\x29\
+\x60\x1d\xe4\x28\xbb\xb5\x69\xa3\xea\xfb\xa8\x7f\x2b\xf1\x69\xc9\
+\xb1\xa9\xb3\xc2\x7b\x20\x60\x04\xd9\x83\x4e\x18\x48\x15\xb6\xa6\
+\x9e\xaf\x48\xfc\x7b\xe2\xd6\x24\x47\x57\xe0\x19\x48\xc7\xa9\xe6\
+\xee\x0b\x48\x90\xbb\x6f\x37\xa5\xbf\xbc\x38\x8d\xad\x2b\xf0\x38\
+\x23\x66\x4a\xbd\xae\xad\x7b\x98\x62\x7b\x11\xec\x4a\xa0\x46\x89\
+\xff\x9c\x78\x56\xe2\xdc\x8c\x1a\x9d\x4b\xbd\x2b\x2d\x8f\x8d\x4e\
+\xc0\x08\x72\x74\x5d\xda\x59\x83\x6e\x4e\x49\xf5\x05\x5a\xc7\x27\
+\xb6\x9a\x52\x77\xe6\xaa\xa0\x01\x09\x48\x90\x03\xea\xac\x05\x56\
+\xf5\xac\xec\xab\x16\x7e\x5f\x96\xc4\xf8\xad\x05\xee\xd7\xae\x08\
+\xf4\x4a\xc0\x14\xbb\x57\xdd\xb1\xf4\xca\xd4\xe9\x82\xaf\x4f\x3c\
+\x27\xf1\x05\xc9\x71\xe9\xfd\xa1\x02\x4b\x16\x30\x82\x5c\x72\x07\
+\xf4\x68\xf7\x5f\x4f\x5d\x5e\x98\xa8\xef\xa6\x76\xba\x60\x8f\x3a\
+\x46\x55\x96\x27\x20\x41\x2e\xcf\xbe\x4f\x7b\x3e\x25\x95\xa9\xcb\
+\x93\x7d\x39\xa3\x46\x57\xe0\xe9\x53\xcf\xa8\xcb\x52\x05\x24\xc8\
+\xa5\xf2\x2f\x7d\xe7\x95\x0c\x8f\x4a\x1c\x97\xb8\x25\xc9\xd1\xe9\
+\x82\x4b\xef\x12\x15\xe8\x93\x80\x04\xd9\xa7\xde\x58\x6c\x5d\xbe\
+\x92\xdd\xd5\xe9\x82\x67\x24\x31\x6e\x5b\xec\xae\xed\x8d\xc0\x30\
+\x04\x1c\xa4\x19\x46\x3f\x75\x5d\xcb\x0f\xa6\xc0\x67\x24\x3e\x25\
+\x39\x76\x4d\xab\xbc\x31\x09\x18\x41\x8e\xa9\x37\xd7\x6f\x4b\x7d\
+\x0f\xf5\xab\x12\x6f\x4f\xd4\x15\x78\x9c\x2e\xb8\xbe\x99\x67\x4c\
+\x58\x40\x82\x9c\x4e\xe7\xff\x4f\x9a\xfa\xfc\xc4\x79\x49\x8c\x95\
+\x28\x6d\x04\x08\xac\x23\x60\x8a\xbd\x0e\xd0\x48\x1e\x7e\x57\xda\
+\xf1\xe4\xc4\x59\x92\xe3\x48\x7a\x54\x33\x16\x22\x60\x04\xb9\x10\
+\xe6\xa5\xed\xa4\x2e\x6a\x7b\x64\xe2\x4d\x89\xdb\x4c\xa9\x97\xd6\
+\x0f\x76\x3c\x50\x01\x09\x72\xa0\x1d\x37\x47\xb5\xcf\xcf\x73\xea\
+\x28\xf5\x25\x49\x8c\x2e\x32\x31\x07\x98\xa7\x10\x58\x2d\x60\x8a\
+\xbd\x5a\x64\xf8\xbf\xd7\x81\x97\x37\x26\x7e\x37\xf1\x79\xc9\x71\
+\xf8\x1d\xaa\x05\xcb\x13\x30\x82\x5c\x9e\x7d\x8b\x3d\xdf\x96\x42\
+\xff\x2a\x51\x5f\xa4\x75\xbb\x29\x75\x0b\x62\x65\x4e\x49\x40\x82\
+\x1c\x4f\x6f\x7f\x3a\x4d\xa9\x73\xa9\xaf\x48\x62\x74\xba\xe0\x78\
+\xfa\x55\x4b\x96\x28\x20\x41\x2e\x11\xbf\xa3\x5d\xdf\x9d\x72\x8e\
+\x49\x1c\x9b\xb8\x29\xc9\xd1\xe9\x82\x1d\xc1\x2a\x86\x80\x04\x39\
+\xec\xd7\xc0\x75\xa9\xfe\x01\x89\xd3\x12\xae\xc0\x33\xec\xbe\x54\
+\x7b\x02\xd3\x11\xb8\xa7\xfd\xf6\xd1\xec\xe2\x31\x89\x07\x4e\x47\
+\x55\x4b\x09\x10\x18\x85\x40\xc3\xfc\x78\x67\xca\x7e\x45\xe2\x11\
+\x09\xab\x10\x46\xf1\x6a\xd1\x08\x02\x13\x13\x68\x94\x20\xaf\x4c\
+\xb9\xbf\x91\x78\xf0\xc4\x38\x35\x97\x00\x81\x31\x09\x34\x48\x90\
+\xef\x4d\x99\x3f\x9e\xf0\xb9\xf1\x98\x5e\x28\xda\x42\x60\x8a\x02\
+\x1d\x26\xc8\xad\x29\xeb\xc0\xc4\x0f\x26\xf6\x9c\xa2\xa5\x36\x13\
+\x20\x30\x32\x81\x8e\x12\xe4\xc5\x29\xe7\xc9\x89\x7d\x46\xc6\xa3\
+\x39\x04\x08\x4c\x59\x60\x93\x09\xf2\xbb\xf9\xfb\xb7\x26\x1e\x95\
+\x78\xc0\x94\x1d\xb5\x9d\x00\x81\x11\x0a\x6c\x22\x41\xde\x94\xbf\
+\x7d\x41\xe2\xa1\x09\x53\xea\x11\xbe\x36\x34\x89\xc0\xe4\x05\x92\
+\xdc\x76\x67\x3b\x2b\x7f\xf4\xf8\xc4\x83\x26\x0f\x08\x80\x00\x81\
+\xf1\x0a\x6c\x30\x3b\xde\x9d\xe7\xff\x5d\xe2\x91\x09\x53\xea\xf1\
+\xbe\x2c\xb4\x8c\x00\x81\x24\xb9\x07\x26\xe6\xdd\xbe\x9e\x27\x3e\
+\x2f\xf1\x90\x84\x29\xb5\x97\x0f\x01\x02\xe3\x15\x48\x92\xdb\x2b\
+\x31\xef\x76\x4a\x9e\xf8\xd3\x89\xef\x1f\xaf\x88\x96\x11\x20\x40\
+\x20\x02\x49\x74\x95\x1c\xdf\x93\x58\x6f\xfb\x76\x9e\xf0\xd7\x89\
+\x1f\x4a\x38\x5d\xd0\xab\x87\x00\x81\xf1\x0b\x24\xd9\xfd\x6d\x62\
+\xbd\xed\x2b\x79\xc2\x33\x13\x3f\x30\x7e\x11\x2d\x24\x30\x6c\x01\
+\xa3\x97\x6e\xfb\xef\x87\xd7\x29\xee\xf8\x3c\xfe\xf4\xc4\x27\x73\
+\xdd\xc6\x6d\xeb\x3c\xd7\xc3\x04\x08\x10\x18\x8f\x40\x46\x85\xbf\
+\x9d\xd8\xd9\xb6\x2d\x77\x1e\x96\x78\x78\xc2\x81\x98\xf1\x74\xb9\
+\x96\x10\x20\x30\xaf\x40\x92\x5f\x7d\x06\x79\x4c\x62\x4b\x62\xb6\
+\x5d\x96\x1b\x4f\x49\x38\x5d\x70\x5e\x48\xcf\x23\x40\x60\xdc\x02\
+\xdb\xb3\xe3\x3b\xf3\xf3\xd1\x09\x57\xe0\x19\x77\x77\x6b\x1d\x01\
+\x02\x1b\x11\x48\x52\xfc\xcb\xc4\xc3\x12\xa6\xd4\x1b\x81\xf3\x5c\
+\x02\x04\xc6\x2f\x90\xc4\xb8\xf7\xf8\x5b\xa9\x85\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\xc0\xb0\x05\xfe\x1f\x32\xd7\x81\x4e\
+\xc9\xf8\xc3\x27\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\
+\x00\x00\x0e\x52\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x01\xe0\x00\x00\x01\x48\x08\x04\x00\x00\x00\x22\x92\xe5\x9d\
+\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
+\x00\x00\x00\x02\x62\x4b\x47\x44\x00\x00\xaa\x8d\x23\x32\x00\x00\
+\x00\x07\x74\x49\x4d\x45\x07\xe4\x0b\x0b\x03\x11\x12\x43\xf6\xa9\
+\x25\x00\x00\x00\x01\x6f\x72\x4e\x54\x01\xcf\xa2\x77\x9a\x00\x00\
+\x0d\x79\x49\x44\x41\x54\x78\xda\xed\xdd\xff\x93\x55\xf5\x7d\xc7\
+\xf1\xd7\x67\x17\xc4\x2f\x14\x11\xca\xf8\x25\x14\xab\xb5\x29\x8e\
+\xad\xa6\x6d\x52\x27\xb6\xf9\x62\x05\x93\x9a\x98\x98\xa6\xcd\x34\
+\xb1\x6d\x66\x3a\x99\x26\xe0\x17\x22\x99\xd4\xc4\x94\x74\x46\x47\
+\x9b\x84\xe9\x60\x9a\xac\x2d\xc9\x18\xd2\x62\x6c\xc4\x44\xb4\x06\
+\x09\xb2\x4a\x2b\x46\x68\x34\xc1\x54\x44\x05\x25\x88\x6b\x11\x91\
+\x2f\x0a\xcb\xee\xde\xbd\xf7\xbe\xfa\x83\x8c\xf2\x75\xb9\x7b\xf7\
+\xdc\xfb\x3e\xf7\x9e\xe7\xe3\x2f\x78\x9d\xb3\xf3\x9a\xcf\xfb\xb3\
+\xe7\x73\xee\x91\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x38\x1a\x8f\xf2\x25\xfe\x8e\xbf\
+\xe6\x51\xd1\x49\x00\x0c\x9b\xe7\xfa\x75\xb7\x53\x61\xa0\xe5\x78\
+\x97\xdf\x34\x3a\x3a\x0d\xea\xe3\x29\xee\xf2\x8b\xee\xf2\x94\xe8\
+\x24\x31\x52\x74\x80\x08\x3e\x56\x7f\xad\xf9\xd1\x29\x90\xb9\x1d\
+\xfa\x40\x5a\x1d\x1d\xa2\xb9\x3a\xa2\x03\x44\x48\xfd\xba\x43\x0b\
+\xa3\x53\x20\x63\x7d\xba\x41\x8f\x46\x87\x68\xb6\x42\xae\xc0\x92\
+\x93\x26\x6b\x99\xce\x8e\xce\x81\x0c\xdd\xa5\x4f\xa4\x81\xe8\x10\
+\xcd\x56\xd0\x02\x4b\x1e\xa5\x3f\xd4\x7d\x3a\x3e\x3a\x07\x32\xb2\
+\x53\xe7\xa5\x17\xa2\x43\x34\x5f\x21\x47\x68\x49\x4a\x65\xfd\x54\
+\x5f\x8e\x4e\x81\xcc\xfc\x95\x7a\xa2\x23\x44\x28\x6c\x81\xa5\xd4\
+\xa7\xef\xe8\xee\xe8\x14\xc8\xc4\x6a\x2d\x4b\x8e\x0e\x11\xa1\xb0\
+\x23\xb4\x24\x39\xe9\x4c\x75\xeb\xd7\xa3\x73\x60\x84\x5e\xd6\xd9\
+\x69\x47\x74\x88\x18\x05\x5e\x81\xa5\x64\x6d\xd6\x4c\x0d\x46\xe7\
+\xc0\x88\x6c\xd3\xbb\x8b\x5a\xdf\x82\x17\x58\x4a\x83\x7a\x48\x37\
+\x45\xa7\xc0\x08\xf4\xeb\x6a\x6d\x88\x0e\x11\xa7\xe0\x05\x96\x52\
+\xaf\xbe\xa1\xee\xe8\x14\xa8\x93\xb5\x40\x3f\x4c\xd5\xe8\x18\x71\
+\x0a\xbd\x07\x7e\x9d\x3b\x34\x55\x0f\xe8\x94\xe8\x1c\xa8\xc3\x2f\
+\x74\x61\xda\x19\x1d\x22\x52\xe1\x57\x60\x29\x55\xf5\xac\xae\x52\
+\x25\x3a\x07\x86\x6d\x87\x3e\xa5\x5d\xd1\x21\x62\x51\x60\x49\xa9\
+\xa4\x65\xfa\xe7\xe8\x14\x18\xa6\x3e\xcd\xd1\x9a\x62\x3e\x3c\x7a\
+\x13\x23\xb4\x24\xc9\x49\x93\x74\xb7\xde\x19\x9d\x03\x35\x2b\xeb\
+\x07\xfa\x64\x2a\x45\xc7\x88\x46\x81\xf7\x71\xa7\xce\x55\xb7\x26\
+\x44\xe7\x40\x4d\xaa\x7a\x46\xd3\xd2\xff\x45\xc7\x88\xc7\x08\xbd\
+\x4f\xaa\x68\x9d\x66\xab\xe0\x03\x59\xcb\xd8\xad\x2b\xb4\x25\x3a\
+\x44\x1e\x50\xe0\x37\xa4\x01\x2d\xd6\xad\xd1\x29\x50\x83\x7e\xfd\
+\x93\x56\x16\x7d\xf7\xfb\x3a\x46\xe8\xfd\x38\xe9\x34\xdd\xa7\x73\
+\xa3\x73\x60\x48\x65\x75\xeb\x4f\x53\x5f\x74\x8c\x7c\xa0\xc0\x07\
+\x70\xa7\xce\xd7\x32\x8d\x8d\xce\x81\x23\xb2\x36\xeb\xa2\xf4\x5c\
+\x74\x8c\xbc\x60\x84\x3e\x40\xaa\x68\x8d\xbe\x18\x9d\x02\x43\xd8\
+\xab\xd9\xfa\x65\x74\x88\xfc\xa0\xc0\x07\x49\x7d\xba\x4d\xdf\x8f\
+\x4e\x81\x23\x18\xd0\xb7\x75\x6f\x91\x8f\x4e\x1e\x8c\x11\xfa\x10\
+\x4e\x3a\x5d\xf7\xeb\x37\xa3\x73\xe0\x10\xd6\x2a\x5d\x92\x5e\x8d\
+\x8e\x91\x27\xac\xc0\x87\x48\x56\x8f\x66\xa8\x3f\x3a\x07\x0e\xf1\
+\x8a\x66\x52\xdf\x03\x51\xe0\xc3\x48\x65\xad\xd2\xf5\xd1\x29\x70\
+\x90\x7e\x5d\xa7\x27\xa2\x43\xe4\x0d\x05\x3e\xac\xb4\x57\xf3\xb5\
+\x24\x3a\x05\xf6\x63\x2d\xd2\xbf\xb3\xfb\x3d\x18\x7b\xe0\x23\x70\
+\x87\xce\x52\xb7\x7e\x2d\x3a\x07\xf6\x59\xaf\x77\xa5\x97\xa3\x43\
+\xe4\x0f\x2b\xf0\x11\xa4\xaa\x7e\xa9\x2b\x54\x8e\xce\x01\x49\xd2\
+\x4e\x7d\x4a\xdb\xa2\x43\xe4\x11\x05\x3e\xa2\x34\xa8\x15\x9a\x1b\
+\x9d\x02\x92\xfa\xf5\x15\x3d\xc2\xd1\xc9\xc3\x61\x84\x1e\x82\x93\
+\x7e\x55\x77\xea\x3d\xd1\x39\x0a\xae\xac\xa5\xfa\x58\xe2\xa9\xc0\
+\x61\x51\xe0\x21\xb9\x43\xe7\xe8\x61\x8d\x8b\xce\x51\x60\xd6\x46\
+\x4d\x4b\x9b\xa2\x63\xe4\x15\x23\xf4\x90\x52\x55\xcf\xe8\x33\xbc\
+\x64\x18\xa8\x57\xb3\xf4\x7c\x74\x88\xfc\xa2\xc0\x47\x91\x4a\xfa\
+\x91\xba\xa2\x53\x14\xd6\x80\xba\x8a\xfa\xcd\x85\xda\x30\x42\x1f\
+\x95\x93\x4e\xd6\xbd\x7a\x7b\x74\x8e\x02\xaa\xe8\x27\xfa\x60\xda\
+\x1d\x1d\x23\xcf\x28\x70\x0d\xdc\xa9\xdf\xd3\x4f\x34\x3a\x3a\x47\
+\xc1\x58\x5b\x34\x3d\xad\x8b\x8e\x91\x6f\x8c\xd0\x35\x48\x15\x3d\
+\xa1\x7f\x88\x4e\x51\x38\x7d\xfa\x82\x9e\x8e\x0e\x91\x77\x14\xb8\
+\x26\xa9\x5f\xb7\x68\x61\x74\x8a\x42\x29\xe9\x76\xdd\xc1\xd1\xc9\
+\xa3\x61\x84\xae\x91\x93\x26\xeb\x11\x4d\x8e\xce\x51\x10\x55\x3d\
+\xae\x8b\xd3\xf6\xe8\x18\xf9\xc7\x0a\x5c\xa3\x64\x6d\xd1\xe5\xe2\
+\x97\x98\x9a\x63\xa7\x66\xaa\xb0\x5f\x1c\x1c\x0e\x0a\x5c\xb3\x54\
+\xd6\xa3\xfa\xfb\xe8\x14\x85\xd0\xa7\x1b\xf4\x18\x0f\x8f\x6a\x41\
+\x81\x87\x21\xf5\x69\x81\xee\x8a\x4e\xd1\xf6\x06\xb5\x44\xff\x9a\
+\xf8\x56\x55\x4d\xd8\x03\x0f\x8b\x93\xce\xd4\x72\x9d\x11\x9d\xa3\
+\x8d\x55\xb5\x41\xd3\x52\x4f\x74\x8c\x56\xc1\x0a\x3c\x2c\xc9\xda\
+\xac\x99\x2a\xfc\x17\x79\x1a\x68\x8f\xae\xd6\x8b\xd1\x21\x5a\x07\
+\x05\x1e\xa6\x34\xa8\x95\xba\x31\x3a\x45\xdb\x1a\xd0\xd7\xf5\x20\
+\xbb\xdf\xda\x31\x42\xd7\xc1\x13\xf5\x1f\x9a\x1e\x9d\xa2\x0d\x55\
+\xf5\xa0\x2e\x4b\xbd\xd1\x31\x5a\x09\x05\xae\x83\x3b\x34\x55\xdd\
+\x3a\x35\x3a\x47\xdb\xd9\xa2\xf7\xa6\xf5\xd1\x21\x5a\x0b\x23\x74\
+\x1d\x52\x55\xcf\xea\x2a\xf1\x7f\xd2\x6c\x95\xf5\x59\x3d\x1b\x1d\
+\xa2\xd5\x50\xe0\xba\xa4\x92\x96\xe9\xe6\xe8\x14\x6d\xe6\x76\x2d\
+\xe6\xe8\xe4\x70\x31\x42\xd7\xc9\x49\x93\xb4\x58\x17\x44\xe7\x68\
+\x1b\x4f\xea\x5d\x69\x67\x74\x88\xd6\x43\x81\xeb\xe6\x4e\x9d\xab\
+\x6e\x4d\x88\xce\xd1\x16\x4a\xba\x40\x3f\xe7\xbf\xcf\xc3\xc7\x08\
+\x5d\xb7\x54\xd1\x3a\x5d\xc3\xcf\xed\x64\xe2\x7a\x3d\x4e\x7d\xeb\
+\xc1\x0a\x3c\x22\x1e\xa7\xb9\xfa\xdb\xe8\x14\x2d\x6f\xa3\xce\x4e\
+\x1c\x8e\xa9\x0b\x05\x1e\x11\x27\x9d\xa6\x25\x3a\x2f\x3a\x47\x4b\
+\x7b\x4d\xbf\x93\x36\x47\x87\x68\x55\x8c\xd0\x23\x92\xac\x97\x34\
+\x43\xfc\x6a\x53\xfd\xca\xba\x4c\x2f\x44\x87\x68\x5d\x14\x78\x84\
+\x52\x45\x6b\xf4\xc5\xe8\x14\x2d\xcb\xba\x59\x2b\xd9\xfd\xd6\x8f\
+\x11\x3a\x03\x1e\xaf\x5b\xf4\xf1\xe8\x14\x2d\xe9\x21\xbd\x3f\xf1\
+\x23\x09\x23\x40\x81\x33\xe0\xa4\xd3\xb5\x4c\x6f\x8d\xce\xd1\x72\
+\x5e\xd4\xbb\xd3\xc6\xe8\x10\xad\x8d\x11\x3a\x03\xc9\xea\xd1\x4c\
+\x0d\x46\xe7\x68\x31\x7b\x75\x95\x36\x45\x87\x68\x75\x14\x38\x13\
+\xa9\xac\x55\x9a\x13\x9d\xa2\xa5\x0c\x68\xbe\x7e\xc4\xd1\xc9\x91\
+\x62\x84\xce\x8c\x27\xe8\xdf\xf4\xc1\xe8\x14\x2d\xa2\xa2\xd5\xba\
+\x24\xbd\x16\x1d\xa3\xf5\x51\xe0\xcc\xb8\x43\xbf\xa1\x6e\x4d\x89\
+\xce\x91\x6b\xfd\x1a\xad\x4e\x59\x2f\xeb\xe2\xf4\xbf\xd1\x61\xda\
+\x01\x23\x74\x66\x52\x55\x9b\x74\x25\x2f\x19\x0e\xe9\x18\x75\x4a\
+\xea\xd3\x75\x5a\x1b\x1d\xa5\x3d\x50\xe0\x0c\xa5\x41\xad\xd0\x57\
+\xa3\x53\xe4\x5a\x87\xa4\x92\x16\xe9\x36\x76\xbf\xd9\x60\x84\xce\
+\x94\x93\x26\xea\x4e\xbd\x37\x3a\x47\x8e\x55\xb5\x56\xd3\xd3\xcb\
+\xd1\x31\xda\x05\x05\xce\x98\x3b\x74\x8e\x96\xeb\xe4\xe8\x1c\xb9\
+\xb5\x53\x97\xea\x11\xce\x5e\x65\x85\x11\x3a\x63\xa9\xaa\x67\xf4\
+\x59\x31\x20\x1e\x5e\x9f\xfe\x51\xab\xa9\x6f\x76\x28\x70\xe6\x52\
+\x49\x4b\xd4\x15\x9d\x22\x97\xca\x5a\xae\x6f\xf0\xcd\x85\x2c\x31\
+\x42\x37\x80\x93\x4e\xd6\x7f\xea\x1d\xd1\x39\x72\xc6\xda\xa8\x8b\
+\xd2\xf3\xd1\x31\xda\x0b\x2b\x70\x03\x24\x6b\x9b\x66\x6a\x57\x74\
+\x8e\x9c\xd9\xa3\x59\xe2\xbd\xdf\x8c\x51\xe0\x86\x48\x15\xad\xd5\
+\xe7\xa3\x53\xe4\xca\x80\xba\xb4\x8c\xdd\x6f\xd6\x28\x70\x83\xa4\
+\x7e\xdd\xa9\xef\x46\xa7\xc8\x8d\x8a\x56\xeb\xa6\x54\x8e\x8e\xd1\
+\x7e\xd8\x03\x37\x8c\x93\x26\x6b\xa9\xce\x89\xce\x91\x03\xd6\x16\
+\x4d\x4f\xeb\xa2\x63\xb4\x23\x56\xe0\x86\x49\xd6\x16\xcd\xd0\xde\
+\xe8\x1c\x39\xd0\xa7\x6b\xf5\x74\x74\x88\xf6\x44\x81\x1b\x28\x95\
+\xf5\x98\xbe\x14\x9d\x22\xdc\xa0\x6e\xd3\x1d\x1c\x9d\x6c\x0c\x46\
+\xe8\x06\xf3\x49\xfa\xb6\x3e\x1a\x9d\x22\xf2\x06\x68\x8d\x2e\x4e\
+\xdb\xa3\x63\xb4\x2b\x0a\xdc\x60\x4e\x3a\x43\xcb\x75\x66\x74\x8e\
+\x30\xdb\x75\x89\x1e\xe5\xbf\xcf\x8d\xc2\x08\xdd\x60\xc9\x7a\x41\
+\x33\x55\x92\x0a\xf9\x0d\x87\x3e\x5d\xaf\x9f\x51\xdf\xc6\xa1\xc0\
+\x0d\x97\x06\xf5\xb0\x6e\x94\x94\x0a\x57\xe1\xb2\x96\x68\x3e\x47\
+\x27\x1b\x89\x11\xba\x29\x3c\x51\xdf\xd3\xfb\xa2\x53\x34\x59\x55\
+\x1b\x34\x2d\xf5\x44\xc7\x68\x6f\x14\xb8\x29\xdc\xa1\xdf\x52\xb7\
+\x4e\x8b\xce\xd1\x54\xaf\xe9\xcf\xd4\xcd\xf8\xdc\x58\x8c\xd0\x4d\
+\x91\xaa\x7a\xae\x60\x3f\xb7\xd3\xaf\x79\x5a\x41\x7d\x1b\x8d\x02\
+\x37\x49\x2a\x69\xb9\xe6\x45\xa7\x68\x0a\x4b\x2a\xeb\x61\xcd\xe5\
+\xe8\x64\xe3\x31\x42\x37\x8d\x93\x26\x69\xb1\x2e\x88\xce\xd1\x8c\
+\x4b\x55\x8f\x2e\x4a\x1b\xa2\x63\x14\x01\x2b\x70\xd3\x24\xeb\x15\
+\x5d\xa1\x22\x1c\x69\xd8\xab\xcf\xe9\xb9\xe8\x10\xc5\x40\x81\x9b\
+\x28\x55\xf5\x94\xae\x69\xeb\x87\x49\x96\x34\xa0\x05\xba\x9b\xa3\
+\x93\xcd\x41\x81\x9b\x2a\x0d\xe8\x1e\x7d\x2b\x3a\x45\x23\x2f\x50\
+\x15\x3d\xae\x39\x89\xef\x44\x35\x09\x7b\xe0\x26\x73\xd2\xa9\x5a\
+\xa2\xb7\x45\xe7\x68\xd4\xe5\xe9\x15\xbd\x3f\xfd\x3c\x3a\x46\x71\
+\xb0\x02\x37\x59\xb2\xb6\x6a\x86\x76\x47\xe7\x68\x90\x3e\xcd\xd1\
+\x2f\xa2\x43\x14\x09\x05\x6e\xba\x54\xd1\xe3\xba\x36\x3a\x45\x43\
+\x0c\x6a\xb1\x16\x70\x74\xb2\x99\x18\xa1\x43\x78\xbc\xba\xf4\x89\
+\xe8\x14\x19\xab\xea\x29\x4d\x4b\x2f\x45\xc7\x28\x16\x0a\x1c\xc2\
+\x49\x53\x74\xbf\xde\x1a\x9d\x23\x53\xbb\xf4\x11\xfd\x37\x67\xaf\
+\x9a\x8b\x11\x3a\x44\xb2\x5e\xd4\x0c\x95\xa2\x73\x64\xa8\x5f\x73\
+\xf5\x30\xf5\x6d\x36\x0a\x1c\x24\x95\xb5\x5a\x73\xa2\x53\x64\xa6\
+\xa2\x07\x35\x8f\xa3\x93\xcd\xc7\x08\x1d\xc8\x13\xf4\x5d\x5d\x1a\
+\x9d\x22\x8b\x0b\xd1\x26\x4d\x4b\x1b\xa3\x63\x14\x11\x2b\x70\xa4\
+\x5d\xfa\x9c\xda\xe1\x53\x23\xbd\xba\x46\x9b\xa2\x43\x14\x13\x05\
+\x0e\x94\xaa\xda\xa4\x2b\xd5\xea\x83\x67\x49\xf3\x75\x1f\x47\x27\
+\x63\x50\xe0\x50\x69\x50\x2b\xf4\xd5\xe8\x14\x23\x52\xd1\x4f\x75\
+\x3d\x47\x27\xa3\xb0\x07\x0e\xe6\xa4\x89\x5a\xa4\x0b\xa3\x73\xd4\
+\x1b\x5f\x5b\x75\x71\x7a\x22\x3a\x46\x71\xb1\x02\x07\x4b\xd6\x0e\
+\x5d\xad\xad\xd1\x39\xea\xd4\xa7\xeb\xf4\x64\x74\x88\x22\xa3\xc0\
+\xe1\x52\x55\xeb\x35\x4b\xad\xb8\x87\x1c\xd4\x1d\xfa\x1e\xbb\xdf\
+\x48\x14\x38\x07\x52\x49\xf7\xe9\x9b\xd1\x29\x86\xad\xaa\x75\xba\
+\x36\xb5\xd3\x61\x94\x16\xc4\x1e\x38\x17\x9c\x74\xb2\xee\xd1\x1f\
+\x44\xe7\x18\x96\x1d\xba\x54\xab\x38\x7b\x15\x8b\x15\x38\x17\x92\
+\xb5\x4d\x57\x68\x67\x74\x8e\x61\xe8\xd3\x4d\xfa\x1f\xea\x1b\x8d\
+\x02\xe7\x44\xaa\x68\xad\x3e\x1f\x9d\xa2\x26\x96\x34\xa8\x65\xea\
+\xe2\xc5\xc1\x78\x14\x38\x37\x52\xbf\x7e\xa0\x05\xd1\x29\x6a\x09\
+\x2a\xeb\x79\xcd\x4a\xfd\xd1\x41\xc0\x1e\x38\x57\x9c\xf4\x16\x2d\
+\xd5\x6f\x47\xe7\x18\x42\x55\x1d\x92\x76\xeb\x2f\xb4\x94\xf1\x39\
+\x0f\x58\x81\x73\x24\x59\x2f\x69\x86\x7a\xa3\x73\x0c\xa1\x43\xd2\
+\x80\xbe\xa9\xfb\xa9\x2f\x70\x18\x3e\xce\xb3\x9c\x57\x55\xdb\x65\
+\xaf\xf0\xd8\xe8\xbb\x04\xe4\x96\x4f\xf2\x9d\xd1\x4d\x3d\xac\x41\
+\xdb\x55\xf7\xf8\xec\xe8\x3b\x04\xe4\x98\x93\xcf\xf4\xb3\xd1\x6d\
+\x3d\xc4\x76\xdb\x76\xaf\x2f\x37\xdb\xae\x1c\xe1\x8f\x91\x3b\xc9\
+\xda\xac\x99\x1a\x88\xce\x71\x80\x5d\x3a\x49\x52\x49\x0b\xb5\x88\
+\xa3\x93\xc0\x51\xf8\x04\xcf\x89\x5e\x72\x0f\x50\xb6\x5d\xf6\x63\
+\x9e\x10\x7d\x67\x80\x96\xe0\x09\xfe\x71\x74\x6b\xdf\x50\xb2\x6d\
+\x6f\xf3\x3b\xcc\x63\x47\xa0\x16\xee\xf0\x54\xf7\x44\x37\xd7\xb6\
+\xbd\xc7\xb6\xbd\xd7\x57\xb9\x33\xfa\xae\x00\x2d\xc3\xc7\xf8\x32\
+\x97\xa3\xdb\xeb\xd7\x1f\x1e\x95\xbc\xc8\x63\xa2\xef\x08\xd0\x52\
+\x3c\xd6\x5f\x8b\x6e\xaf\x6d\xbb\xe2\xa7\xfd\x96\xe8\xbb\x01\xb4\
+\x18\x27\x4f\xf2\xca\xe8\xf6\xda\xde\xe5\x69\xec\x7e\xf3\x89\xc7\
+\x48\x39\x96\xac\xed\xba\x52\xaf\x04\xc7\xe8\xd7\x3c\xfd\x17\x47\
+\x27\x81\x3a\x78\x8c\xff\xd2\xd5\xc0\xd5\x77\xd0\xf7\xfb\x84\xe8\
+\xbb\x00\xb4\x2c\x8f\xf3\xbf\x84\xd5\xb7\xea\xe7\x7d\x56\xf4\x1d\
+\x00\x5a\x98\x93\x4f\xf5\x93\x41\x05\xde\xe3\x3f\xe7\xe8\x24\x30\
+\x22\xee\xf4\xf9\xde\x1d\x50\xdf\x7e\x7f\xdd\xa3\xa3\xaf\x1e\x68\
+\x79\x3e\xd6\x9f\x69\x7a\x7d\xcb\x5e\xe5\xf1\xd1\x57\x0e\xb4\x05\
+\x8f\xf7\xc2\xa6\xd6\xb7\xea\xad\xfe\xdd\xe8\xab\x06\xda\x84\x93\
+\xa7\xf8\xe9\x26\x16\xb8\xd7\x9f\xe6\xe8\x24\x90\x19\x8f\xf2\x85\
+\xee\x6b\x52\x7d\x4b\xbe\xcd\xc7\x44\x5f\x31\xd0\x56\x7c\xbc\xff\
+\xae\x29\xf5\xad\x78\xad\x4f\x89\xbe\x5a\xa0\xed\xf8\x24\xdf\xd3\
+\x84\x02\xef\xf4\x7b\x38\x3a\x09\x64\xce\x1d\x3e\xcb\x9b\x1a\x5c\
+\xdf\x3e\x7f\x81\xdd\x2f\xd0\x10\x1e\xed\x0f\xec\x7b\xc1\xbe\x31\
+\x06\x7d\xaf\x8f\x8b\xbe\x4a\xa0\x6d\xf9\x04\xdf\xd0\xb0\xfa\x56\
+\xbd\xd1\x67\x44\x5f\x21\xd0\xc6\x9c\x3c\xd1\x0f\x34\xa8\xc0\xbb\
+\xfd\x21\x76\xbf\x40\x43\xb9\xc3\xe7\x78\x4b\x03\xea\xdb\xef\xb9\
+\x1c\x9d\x04\x1a\xce\xc7\xf8\x63\x99\xff\xdc\x4e\xd9\x2b\x3d\x2e\
+\xfa\xca\x80\x42\xf0\xaf\x78\x5e\xa6\xf5\xad\x7a\x8b\xf3\xfc\x59\
+\x35\xa0\x9d\x38\xf9\x14\xaf\xce\xa4\xba\x15\xdb\x76\xaf\x3f\xc9\
+\x8b\x83\x40\xd3\xb8\xd3\xbf\xef\x1d\x99\xac\xbd\xf6\x80\x6f\xe5\
+\xe8\x24\xd0\x54\x1e\xe3\xbf\x79\xa3\x82\xf5\x2a\xdb\xae\x78\x8d\
+\x27\x45\x5f\x0d\x50\x38\x3e\xd1\xb7\xee\x37\x06\xd7\x6b\xbb\xdf\
+\xc9\xc3\x23\xa0\xe9\x9c\x3c\xd9\x4f\x8c\x70\x15\xde\xeb\xd9\x1c\
+\x9d\x04\x42\x78\x94\xff\x68\xdf\xc7\x4f\xea\x53\xf2\x5d\x3e\x36\
+\xfa\x2a\x80\xc2\xf2\x71\xbe\xba\xee\xfa\x56\xbc\xde\x53\xa2\xaf\
+\x00\x28\x34\x8f\xf7\xa2\x3a\x0b\xfc\xaa\xff\x84\xdd\x2f\x10\xca\
+\xc9\x67\x78\x43\x5d\xe3\xf3\x8d\x1e\x15\x9d\x1e\x28\x3c\x8f\xf2\
+\x74\xf7\x0f\xb3\xbe\x65\x3f\xe0\xb1\xd1\xc9\x01\x48\xf2\xf1\xfe\
+\xd2\x30\x0b\xdc\xe3\xa9\xd1\xa9\x01\xec\xe3\x09\x5e\x3a\x8c\xfa\
+\xf6\xfa\xe3\x1c\x9d\x04\x72\xc3\x1d\x9e\xea\x9e\x1a\xeb\x3b\xe8\
+\x5b\x78\x71\x10\xc8\x15\x8f\xf6\x87\x6b\x7a\xc9\xb0\xe2\x47\x3d\
+\x21\x3a\x2d\x80\x83\x78\xac\xbf\x52\x43\x81\xb7\xf9\xed\x3c\x3c\
+\x02\x72\xc7\xc9\x93\xfc\xd0\x51\xea\xbb\xd7\x57\x72\x74\x12\xc8\
+\x25\x77\xf8\x3c\x6f\x1b\xa2\xbe\x25\x7f\xdf\x63\xa2\x53\x02\x38\
+\x02\x8f\xf1\xe5\x47\x7c\xb5\xa1\xe2\xa7\x7c\x5a\x74\x42\x00\x43\
+\xf0\x38\x77\x1d\xa1\xc0\xbb\xfc\xc7\xec\x7e\x81\x5c\x73\xf2\xa9\
+\xfe\x99\x6d\x7b\xe0\x80\xfa\xf6\xf9\xcb\x1c\x9d\x04\x72\xcf\x9d\
+\x3e\xdf\xaf\xda\xf6\x7e\x8f\x95\xca\xfe\xb1\x8f\x8f\x4e\x06\xa0\
+\x06\x3e\xd6\x9f\xb6\xfd\xe6\x8b\xfe\x55\x6f\xf2\x59\xd1\xa9\x00\
+\xd4\xc8\x27\x7a\xe1\x7e\xe3\xf3\x1e\x7f\x94\xa3\x93\x40\xcb\x70\
+\xf2\xe9\x5e\xff\xc6\xc3\xa3\x9b\x39\x3a\x09\xb4\x14\x8f\xf1\x6c\
+\x57\x6d\x57\xbc\xca\x27\x46\xa7\x01\x30\x4c\x1e\xe7\xd9\x7e\xc6\
+\x5b\xfd\xb6\xe8\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x40\x7b\xf8\x7f\xf0\xdc\x4f\x5e\x5a\
+\x29\x37\x04\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\
+\x63\x72\x65\x61\x74\x65\x00\x32\x30\x32\x30\x2d\x31\x31\x2d\x31\
+\x31\x54\x30\x33\x3a\x31\x37\x3a\x31\x38\x2b\x30\x30\x3a\x30\x30\
+\xf6\x0a\x61\xb0\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\
+\x3a\x6d\x6f\x64\x69\x66\x79\x00\x32\x30\x32\x30\x2d\x31\x31\x2d\
+\x31\x31\x54\x30\x33\x3a\x31\x37\x3a\x31\x38\x2b\x30\x30\x3a\x30\
+\x30\x87\x57\xd9\x0c\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
+\x82\
+\x00\x00\x02\x32\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x01\x95\x00\x00\x01\x22\x04\x03\x00\x00\x00\xc3\xba\x52\xc5\
+\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
+\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\
+\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\
+\x00\x00\x3a\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x00\x15\
+\x50\x4c\x54\x45\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\
+\xff\xff\xff\xb4\xec\xb4\xff\xff\xff\x46\x05\xa5\xc5\x00\x00\x00\
+\x05\x74\x52\x4e\x53\x00\x80\xbf\x40\x9f\x71\xf9\xc8\x77\x00\x00\
+\x00\x01\x62\x4b\x47\x44\x01\xff\x02\x2d\xde\x00\x00\x00\x07\x74\
+\x49\x4d\x45\x07\xe4\x0b\x0b\x03\x18\x3b\xd0\x86\x8a\x00\x00\x00\
+\x00\x01\x6f\x72\x4e\x54\x01\xcf\xa2\x77\x9a\x00\x00\x00\xfc\x49\
+\x44\x41\x54\x78\xda\xed\xd6\x41\x0d\xc2\x50\x00\x05\xc1\x4a\x68\
+\x0f\x18\x20\x18\xa8\x85\x2a\x00\x92\xfa\xb7\x42\x02\x41\xc2\xff\
+\x59\xc8\x8c\x81\x97\xbd\xbd\x65\x19\xeb\x72\x7e\x3c\x06\xef\xcc\
+\xa0\xa5\x49\x4b\x93\x96\x26\x2d\x4d\x5a\x9a\xb4\x34\x69\x69\xd2\
+\xd2\xa4\xa5\x49\x4b\x93\x96\x26\x2d\x4d\x5a\x9a\xb4\x34\x69\x69\
+\xd2\xd2\xa4\xa5\x49\x4b\x93\x96\x26\x2d\x4d\x5a\x9a\xb4\x34\x69\
+\x69\xd2\xd2\xa4\xa5\x49\x4b\x93\x96\x26\x2d\x4d\x5a\x9a\xb4\x34\
+\x69\x69\xd2\xd2\xa4\xa5\x49\x4b\x93\x96\x26\x2d\x4d\x5a\x9a\xb4\
+\x34\x69\x69\xd2\xd2\xa4\xa5\x49\x4b\x93\x96\x26\x2d\x4d\x5a\x9a\
+\xb4\x34\x69\x69\xd2\xd2\xa4\xa5\x49\x4b\x93\x96\x26\x2d\x4d\x5a\
+\x9a\xb4\x34\x69\x69\xd2\xd2\xa4\xa5\x49\x4b\x93\x96\x26\x2d\x4d\
+\x5a\x9a\xb4\x34\x69\x69\xd2\xd2\xa4\xa5\x49\x4b\x93\x96\xa6\x6f\
+\xcb\x73\x1b\x6e\x9d\xd5\x32\xc1\x5d\x8b\x16\x2d\x5a\xb4\x68\xd1\
+\xa2\x45\x8b\x96\x5f\x69\xd9\x8f\xeb\xdb\xed\x0f\x3e\x3f\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1d\x2f\x7a\x3b\x73\x40\xf7\
+\xe3\xb9\xc1\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\
+\x63\x72\x65\x61\x74\x65\x00\x32\x30\x32\x30\x2d\x31\x31\x2d\x31\
+\x31\x54\x30\x33\x3a\x32\x34\x3a\x35\x39\x2b\x30\x30\x3a\x30\x30\
+\xa6\xe2\xb9\xfc\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\
+\x3a\x6d\x6f\x64\x69\x66\x79\x00\x32\x30\x32\x30\x2d\x31\x31\x2d\
+\x31\x31\x54\x30\x33\x3a\x32\x34\x3a\x35\x39\x2b\x30\x30\x3a\x30\
+\x30\xd7\xbf\x01\x40\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
+\x82\
+\x00\x00\x02\x8e\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x01\x95\x00\x00\x01\x22\x04\x03\x00\x00\x00\xc3\xba\x52\xc5\
+\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
+\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\
+\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\
+\x00\x00\x3a\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x00\x0f\
+\x50\x4c\x54\x45\x00\x00\x00\xff\xff\xff\xff\xff\xff\xb4\xec\xb4\
+\xff\xff\xff\x81\x88\x16\xa9\x00\x00\x00\x03\x74\x52\x4e\x53\x00\
+\x80\x40\xb7\x29\x1d\x05\x00\x00\x00\x01\x62\x4b\x47\x44\x01\xff\
+\x02\x2d\xde\x00\x00\x00\x07\x74\x49\x4d\x45\x07\xe4\x0b\x0b\x03\
+\x19\x31\x29\x48\x52\x5f\x00\x00\x00\x01\x6f\x72\x4e\x54\x01\xcf\
+\xa2\x77\x9a\x00\x00\x01\x60\x49\x44\x41\x54\x78\xda\xed\xcf\x41\
+\x0d\x80\x30\x00\xc0\xc0\x59\x00\x14\x20\x81\xe0\xdf\xdb\x1e\xd3\
+\xb0\xe5\x1e\x3d\x03\x4d\xc7\xd8\xeb\xf9\x97\x6f\x73\xe7\x84\x5e\
+\x4c\xbd\x98\x7a\x31\xf5\x62\xea\xc5\xd4\x8b\xa9\x17\x53\x2f\xa6\
+\x5e\x4c\xbd\x98\x7a\x31\xf5\x62\xea\xc5\xd4\x8b\xa9\x17\x53\x2f\
+\xa6\x5e\x4c\xbd\x98\x7a\x31\xf5\x62\xea\xc5\xd4\x8b\xa9\x17\x53\
+\x2f\xa6\x5e\x4c\xbd\x98\x7a\x31\xf5\x62\xea\xc5\xd4\x8b\xa9\x17\
+\x53\x2f\xa6\x5e\x4c\xbd\x98\x7a\x31\xf5\x62\xea\xc5\xd4\x8b\xa9\
+\x17\x53\x2f\xa6\x5e\x4c\xbd\x98\x7a\x31\xf5\x62\xea\xc5\xd4\x8b\
+\xa9\x17\x53\x2f\xa6\x5e\x4c\xbd\x98\x7a\x31\xf5\x62\xea\xc5\xd4\
+\x8b\xa9\x17\x53\x2f\xa6\x5e\x4c\xbd\x98\x7a\x31\xf5\x62\xea\xc5\
+\xd4\x8b\xa9\x17\x53\x2f\xa6\x5e\x4c\xbd\x98\x7a\x31\xf5\x62\xea\
+\xc5\xd4\x8b\xa9\x17\x53\x2f\xa6\x5e\x4c\xbd\x98\x7a\x31\xf5\x62\
+\xea\xc5\xd4\x8b\xa9\x17\x53\x2f\xa6\x5e\x4c\xbd\x98\x7a\x31\xf5\
+\x62\xea\xc5\xd4\x8b\xa9\x17\x53\x2f\xa6\x5e\x4c\xbd\x98\x7a\x31\
+\xf5\x62\xea\xc5\xd4\x8b\xa9\x17\x53\x2f\xa6\x5e\x4c\xbd\x98\x7a\
+\x31\xf5\x62\xea\xc5\xd4\x8b\xa9\x17\x53\x2f\xa6\x5e\x4c\xbd\x98\
+\x7a\x31\xf5\x62\xea\xc5\xd4\x8b\xa9\x17\x53\x2f\xa6\x5e\x4c\xbd\
+\x98\x7a\x31\xf5\x62\xea\xc5\xd4\x8b\xa9\x17\x53\x2f\xa6\x5e\x4c\
+\xbd\x98\x7a\x31\xf5\x62\xea\xc5\xd4\x8b\xa9\x17\x53\x2f\xa6\x5e\
+\x4c\xbd\x98\x7a\x31\xf5\x62\xea\xc5\xd4\x8b\xa9\x17\x53\x2f\xa6\
+\x5e\x4c\xbd\x98\x7a\x31\xf5\x62\xea\xc5\xd4\x8b\xa9\x17\x53\x2f\
+\xa6\xf7\x5a\xee\x03\xad\x09\xf7\xf3\xe0\x83\x61\x8b\xb6\xfb\x00\
+\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x63\x72\x65\x61\
+\x74\x65\x00\x32\x30\x32\x30\x2d\x31\x31\x2d\x31\x31\x54\x30\x33\
+\x3a\x32\x35\x3a\x34\x39\x2b\x30\x30\x3a\x30\x30\x85\x8a\xd2\x5c\
+\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\x6f\x64\
+\x69\x66\x79\x00\x32\x30\x32\x30\x2d\x31\x31\x2d\x31\x31\x54\x30\
+\x33\x3a\x32\x35\x3a\x34\x39\x2b\x30\x30\x3a\x30\x30\xf4\xd7\x6a\
+\xe0\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x05\x03\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x03\x00\x00\x00\xc3\xa6\x24\xc8\
+\x00\x00\x00\x03\x73\x42\x49\x54\x08\x08\x08\xdb\xe1\x4f\xe0\x00\
+\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\x95\x00\x00\x0e\x95\x01\
+\xf1\x59\xb9\x5c\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\
+\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\x70\
+\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\x5a\x50\x4c\x54\
+\x45\xff\xff\xff\x00\x00\x00\x00\x00\x00\x07\x07\x07\x15\x15\x15\
+\x25\x25\x25\x2d\x2d\x2d\x34\x34\x34\x3c\x3c\x3c\x5a\x5a\x5a\x62\
+\x62\x62\x71\x71\x71\x88\x88\x88\x97\x97\x97\xbd\xbd\xbd\xbf\xbf\
+\xbf\xc5\xc5\xc5\xc7\xc7\xc7\xc9\xc9\xc9\xca\xca\xca\xcc\xcc\xcc\
+\xd1\xd1\xd1\xd3\xd3\xd3\xdb\xdb\xdb\xde\xde\xde\xe3\xe3\xe3\xe7\
+\xe7\xe7\xea\xea\xea\xef\xef\xef\xf2\xf2\xf2\x77\x1b\x1f\xd2\x00\
+\x00\x00\x02\x74\x52\x4e\x53\x00\x40\x00\x4f\x8c\xa8\x00\x00\x04\
+\x0d\x49\x44\x41\x54\x78\xda\xed\xdd\x61\x4a\xc3\x30\x00\x86\xe1\
+\xb5\x1d\x76\x4a\xdd\x10\x84\x09\xde\xff\x68\x0a\x2a\x8a\x73\x6c\
+\xb3\x76\x54\x4f\x90\x31\x58\x53\x53\xf2\x3c\x07\x68\x21\x7d\xe9\
+\xf7\x33\xe5\xec\x32\x45\xc9\xbf\x2a\x2e\xfc\x80\xe5\x8c\xac\x09\
+\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x70\xfe\xf3\xe6\x44\x55\x26\x1e\x40\xbd\x26\
+\xaa\xda\x04\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\
+\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x20\x00\x04\
+\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\
+\x00\x02\x40\x00\x08\x00\x01\x0c\x60\xf3\x44\xd0\xc6\x1f\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\
+\x80\x00\x10\x00\x93\x0d\xa0\x72\xfd\x6b\x58\x95\x41\x00\x8d\xeb\
+\x5f\xc3\x1a\x13\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\
+\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\
+\x40\x00\x8e\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x88\x66\xf7\x9a\x14\x01\x8c\xed\xd8\x25\x45\x00\x08\x00\x01\x20\
+\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\
+\x00\x10\xc0\x30\x56\x8f\x49\x11\x00\x02\x40\x00\x08\x00\x01\x20\
+\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\
+\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\
+\x20\x00\x72\x09\xa0\x7d\x27\xa8\xcd\x20\x80\x6f\x4e\x30\x01\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\
+\x00\x04\x80\x00\x98\x6c\x00\x0d\x27\x64\x10\x40\xb5\x22\xa8\x32\
+\x01\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\
+\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\
+\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x04\xe0\x08\
+\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\xc4\xd4\x7d\x26\x45\
+\x00\x63\xdb\xef\x92\x22\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x60\x18\xd7\
+\x37\x49\x11\xc0\xd8\xae\xee\x92\x22\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\
+\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\
+\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\
+\x02\x20\xa3\x00\xfa\x03\x41\x7d\x06\x01\x6c\x3f\x08\xda\x9a\x00\
+\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\
+\x10\x00\x02\x40\x00\x4c\x36\x80\x9a\x13\x32\x08\x60\x71\x4f\xd0\
+\xc2\x04\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\
+\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\
+\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x10\x80\
+\x23\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\xa2\xf9\
+\x7a\x4e\x8a\x00\xc6\xf6\x9b\x16\x01\x20\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x18\xee\
+\x8d\x55\x52\x04\x30\xb6\xdb\x87\xa4\x08\x00\x01\x20\x00\x04\x80\
+\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\
+\x80\x00\x10\x00\xb9\x04\xb0\x7f\x23\x68\x9f\x41\x00\xdd\x0f\x41\
+\x9d\x09\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\
+\x00\x08\x00\x01\x20\x00\x04\xc0\x64\x03\x58\xae\x09\x5a\x66\x10\
+\x40\x31\x27\xa8\x30\x01\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\
+\x80\x00\x04\xe0\x08\x04\x80\x00\x06\xd3\xbe\x10\x55\x9b\x78\x00\
+\xfd\x91\xa8\x7a\x13\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\
+\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x80\xb3\xfc\x01\x15\xad\
+\xf7\xc6\x54\xea\xc7\xa7\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\
+\x60\x82\
+\x00\x00\x2b\xb1\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\x95\x00\x00\x0e\x95\
+\x01\xf1\x59\xb9\x5c\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x2b\x2e\x49\x44\
+\x41\x54\x78\xda\xed\xdd\x07\x7c\x15\x55\xde\xff\xf1\x1f\x90\x04\
+\x08\x35\x0d\x92\x48\x80\xb5\xd0\xa4\x23\x09\x01\xfe\x0a\x44\x85\
+\x90\x28\x02\x2e\x4d\x3a\x0a\x51\x56\x45\x01\x41\x7a\x40\xa4\x48\
+\x95\xa2\x4b\x5b\x08\x48\x93\x15\xd1\x04\x10\x05\x03\x51\x42\xaf\
+\x22\x48\x5b\x6a\x0a\xa4\x60\x08\x09\x69\xe4\xc9\x99\xe7\xaf\x8f\
+\xee\xba\xbb\x90\x99\xe4\xde\xb9\xf3\x79\xbf\x5e\xf3\x8a\xee\xf3\
+\xcc\xc9\x3d\x33\x27\xce\xf7\x9e\x39\xa5\x44\x7e\x7e\xbe\x58\x55\
+\x89\x12\x25\xda\x14\xfc\xf8\x56\x00\x00\x56\xd4\xb6\xe0\x19\x18\
+\x6d\xd5\xca\x97\xe4\xfe\x03\x00\x40\x00\x00\x00\x00\x04\x00\x00\
+\x00\x40\x00\x00\x00\x00\x04\x00\x00\x00\x40\x00\x00\x00\x00\x04\
+\x00\x00\x00\x40\x00\x00\x00\x00\x04\x00\x00\x00\x40\x00\x00\x00\
+\x00\x04\x00\x00\x00\x40\x00\x00\x00\x00\x04\x00\x00\x00\x40\x00\
+\x00\x00\x00\x0f\xc8\x89\x4b\x50\x78\x5e\x5e\x5e\xe2\xed\xed\xcd\
+\x85\x00\x00\x1b\x48\x48\x48\x90\x9b\x37\x6f\x72\x21\x08\x00\xc5\
+\xaf\x77\xef\xde\x12\x1e\x1e\xce\x85\x00\x00\x1b\x98\x38\x71\xa2\
+\xcc\x9d\x3b\x97\x0b\x51\x48\xbc\x02\x00\x00\x80\x00\x00\x00\x00\
+\x08\x00\x00\x00\x80\x00\x00\x00\x00\x08\x00\x00\x00\x80\x00\x00\
+\x00\x00\x08\x00\x00\x00\x80\x00\x00\x00\x00\x08\x00\x00\x00\x80\
+\x00\x00\x00\x00\x08\x00\x00\x00\x80\x00\x00\x00\x00\x08\x00\x00\
+\x00\x80\x00\x00\x00\x00\x08\x00\x00\x00\x80\x00\x00\x00\x00\x08\
+\x00\x00\x00\x80\x00\x00\x00\x00\x01\x00\x00\x00\x10\x00\x00\x00\
+\x00\x01\x00\x00\x00\x10\x00\x00\x00\x00\x01\x00\x00\x00\x10\x00\
+\x00\x00\x00\x01\x00\x00\x00\x10\x00\x00\x00\x00\x01\x00\x00\x00\
+\x10\x00\x00\x00\x00\x01\x00\x00\x00\x10\x00\x00\x00\x00\x01\x00\
+\x00\x00\x10\x00\x00\x00\x00\x01\x00\x00\x00\x10\x00\x00\x00\x00\
+\x01\x00\x00\x00\x02\x00\x00\x00\x20\x00\x00\x00\x00\x02\x00\x00\
+\x00\x20\x00\x00\x00\x00\x02\x00\x00\x00\x20\x00\x00\x00\x00\x02\
+\x00\x00\x00\x20\x00\x00\x00\x00\x02\x00\x00\x00\x20\x00\x00\x00\
+\x00\x02\x00\x00\x00\x20\x00\x00\x00\x00\x02\x00\x00\x00\x20\x00\
+\x00\x00\x00\x02\x00\x00\x00\x20\x00\x00\x00\x00\x02\x00\x00\x00\
+\x04\x00\x00\x00\x40\x00\x00\x00\x00\x04\x00\x00\x00\x40\x00\x00\
+\x00\x00\x04\x00\x00\x00\x40\x00\x00\x00\x00\x04\x00\x00\x00\x40\
+\x00\x00\x00\x00\x04\x00\x00\x00\x40\x00\x00\x00\x00\x04\x00\x00\
+\x00\x40\x00\x00\x00\x00\x04\x00\x00\x00\x40\x00\x00\x00\x00\x04\
+\x00\x00\x00\x40\x00\x00\x00\x00\x04\x00\x00\x00\x08\x00\x00\x00\
+\x80\x00\x00\x00\x00\x08\x00\x00\x00\xc0\xf1\x38\x71\x09\x50\xdc\
+\x52\x52\x52\x24\x21\x21\x41\x12\x13\x13\xb5\x9f\x99\x99\x99\xe2\
+\xed\xed\xad\x1d\x55\xab\x56\x95\x2a\x55\xaa\x88\xb3\xb3\x33\x17\
+\x0a\x00\x08\x00\x30\xa3\xab\x57\xaf\x4a\x54\x54\x94\x7c\xf7\xdd\
+\x77\x12\x17\x17\xa7\x3d\xec\x6f\xdc\xb8\x21\xd9\xd9\xd9\xff\xf1\
+\xbc\x12\x25\x4a\x88\x87\x87\x87\xf8\xf8\xf8\x68\x81\xa0\x7e\xfd\
+\xfa\x12\x12\x12\x22\xcd\x9b\x37\x97\x92\x25\xe9\xb4\x02\x00\x02\
+\x00\xec\xce\x0f\x3f\xfc\x20\x91\x91\x91\xda\x83\xff\xf8\xf1\xe3\
+\x85\x2a\x23\x3f\x3f\x5f\x92\x92\x92\xb4\xe3\xe4\xc9\x93\xf2\xcd\
+\x37\xdf\xc8\xbc\x79\xf3\xb4\x9e\x81\xe0\xe0\x60\x09\x0d\x0d\x95\
+\xa7\x9e\x7a\x4a\xca\x94\x29\xc3\x05\x07\x00\x02\x00\x6c\xe5\xd4\
+\xa9\x53\xb2\x66\xcd\x1a\xed\xc1\x7f\xf9\xf2\xe5\x22\xfb\x3d\xaa\
+\xf7\x60\xd5\xaa\x55\xda\xe1\xea\xea\x2a\xcf\x3c\xf3\x8c\xbc\xf0\
+\xc2\x0b\xd2\xb9\x73\x67\x7a\x06\x00\xe0\x01\xf1\x5f\x4d\x14\xda\
+\xb5\x6b\xd7\x24\x2c\x2c\x4c\x5a\xb5\x6a\x25\x8b\x16\x2d\x2a\xd2\
+\x87\xff\x3f\xcb\xc8\xc8\x90\x2d\x5b\xb6\xc8\x80\x01\x03\xb4\xdf\
+\xaf\x7a\x09\x00\x00\x04\x00\x14\xa1\xb4\xb4\x34\x99\x38\x71\xa2\
+\x34\x6d\xda\x54\xd6\xae\x5d\x2b\xf7\xee\xdd\xb3\xe9\xe7\x51\x3d\
+\x10\x5d\xba\x74\x91\xe7\x9f\x7f\xbe\xd0\xaf\x1d\x00\x80\x00\x00\
+\xfc\x1b\x6a\xf0\xde\xe2\xc5\x8b\xa5\x61\xc3\x86\x32\x77\xee\x5c\
+\xb9\x7b\xf7\xae\x5d\x7d\xbe\xe8\xe8\x68\x79\xf2\xc9\x27\xe5\xe5\
+\x97\x5f\x96\x2b\x57\xae\x70\xc3\x00\x80\x00\x00\xbd\x8e\x1c\x39\
+\x22\x4f\x3c\xf1\x84\x8c\x1e\x3d\x5a\x9b\xc6\x67\xaf\xd4\x00\xc2\
+\x8d\x1b\x37\x4a\xb3\x66\xcd\x64\xf6\xec\xd9\xdc\x38\x00\x20\x00\
+\xa0\xb0\xd4\x03\xb5\x43\x87\x0e\x72\xe9\xd2\x25\xd3\x7c\xe6\xac\
+\xac\x2c\x09\x0f\x0f\x97\x81\x03\x07\x6a\xeb\x0c\x00\x00\x08\x00\
+\xb8\x4f\xea\xdd\xfe\x84\x09\x13\xb4\x2e\x75\x7b\xeb\xee\xbf\x5f\
+\x9b\x36\x6d\x92\xf6\xed\xdb\x6b\xeb\x10\x00\x00\x08\x00\xf8\x2f\
+\x6e\xdf\xbe\x2d\xdd\xba\x75\xd3\xe6\xdf\x9b\xdd\xb1\x63\xc7\xb4\
+\x75\x03\x0e\x1d\x3a\xc4\x8d\x05\x80\xff\x8f\x75\x00\xf0\x2f\x2e\
+\x5c\xb8\x20\xdd\xbb\x77\x97\xb3\x67\xcf\x3a\x4c\x9d\xd4\xb2\xc3\
+\x6a\x11\xa1\x05\x0b\x16\x48\x8f\x1e\x3d\x2c\x77\x4f\xf7\xec\xd9\
+\xa3\xbd\x0e\x81\x7d\xdb\xb7\x6f\x9f\x78\x7a\x7a\x72\x21\x40\x00\
+\x40\xf1\x53\xef\xf9\x9f\x7e\xfa\x69\x49\x4e\x4e\x76\xb8\xba\xa9\
+\x71\x01\x83\x07\x0f\xd6\xd6\x10\xb0\xda\xc3\x50\xcd\xe0\x50\x0b\
+\x29\xc1\xbe\xe5\xe5\xe5\x71\x11\x50\x6c\x78\x05\x80\x5f\xa5\xa7\
+\xa7\x6b\xdf\xfc\x1d\xf1\xe1\xff\x5b\x23\x47\x8e\x94\x98\x98\x18\
+\x6e\x38\x00\x02\x00\xa0\x06\xfc\x0d\x1a\x34\x48\x4e\x9f\x3e\xed\
+\xf0\x75\xcd\xc9\xc9\x91\x3e\x7d\xfa\xc8\x3f\xfe\xf1\x0f\x6e\x3c\
+\x00\x02\x00\xac\x6d\xf2\xe4\xc9\xb2\x6d\xdb\x36\xcb\xd4\x57\xad\
+\x65\xa0\x7a\x3b\xd4\x60\x47\x00\xb0\x22\xc6\x00\x40\x3e\xfd\xf4\
+\x53\x99\x33\x67\x4e\xb1\xfc\x2e\xdf\x87\xaa\x89\x57\x95\xaa\xe2\
+\xe1\xe9\x21\xee\xee\x05\x87\x87\xa7\xb8\x94\x2e\x2d\xa9\xc9\xc9\
+\x05\x0f\xe5\x64\x49\x4e\x4a\x92\x94\xe4\x24\xb9\x7c\xf9\x92\xe4\
+\xfc\x97\x6d\x83\xf5\x3a\x73\xe6\x8c\xb6\x97\x80\x5a\xe7\x80\xcd\
+\x84\x00\x10\x00\x60\x29\x6a\x85\xbf\xa1\x43\x87\x16\x59\xf9\xa5\
+\x4a\x95\x92\x7a\x8f\x37\x10\xff\xc0\x96\xe2\xdf\xa2\xa5\x54\xa9\
+\x5a\xf5\xbe\xce\x53\xeb\x0e\x1c\x3b\x72\x58\x0e\xec\xdb\x2b\x87\
+\x0e\xec\x93\xdb\x69\x69\x45\xf2\xf9\x76\xec\xd8\x21\xe3\xc7\x8f\
+\x97\xa9\x53\xa7\xd2\x18\x00\x10\x00\x60\x0d\x6a\xc4\xf1\x90\x21\
+\x43\x8a\x64\x91\x1f\xd7\x72\xe5\xa4\xcb\x9f\xbb\x4b\xfb\xe0\x50\
+\x29\x5f\xa1\xc2\x03\x9f\x5f\xa6\x4c\x19\x69\xd1\xb2\x95\x76\xa8\
+\xf1\x09\xc7\x8e\x1c\x92\x4f\x56\xfd\x4d\x2e\x5e\x38\x6f\xf8\x67\
+\x55\x53\x03\xd5\x46\x42\x01\x01\x01\x34\x0a\x00\x04\x00\x38\xbe\
+\xd5\xab\x57\xcb\x4f\x3f\xfd\x64\x6c\x83\x72\x72\x92\x8e\xcf\x75\
+\x92\x17\xbb\xf7\x92\x0a\x15\x2b\x1a\x52\xa6\xea\x9e\x6f\xfa\x84\
+\xbf\x34\x69\xd6\x5c\x62\x76\x7f\x5b\x10\x04\x56\xc8\x8d\xc4\x44\
+\x43\x3f\xb7\xea\x05\x50\xbd\x01\x00\x60\x15\xbc\xf8\xb4\x28\xb5\
+\x3e\xfe\xfb\xef\xbf\x6f\x68\x99\xf5\x1b\x36\x92\x45\x4b\x57\xca\
+\x80\x57\xc2\x0c\x7b\xf8\xff\x56\x89\x12\x25\xe4\xc9\x36\xed\xb4\
+\xdf\xd1\xab\x4f\x7f\xed\xdf\x8d\xa2\x16\x60\x89\x8c\x8c\xa4\x61\
+\x00\x20\x00\xc0\xb1\x2d\x5c\xb8\x50\x12\x12\x12\x0c\x2b\xef\xd9\
+\xe0\x10\x99\xf4\xde\xf4\xfb\x7e\xc7\xaf\xb7\x97\xe1\xcf\x3d\x5f\
+\x92\x31\x13\x27\x4b\xd9\xb2\xae\x86\x95\x3b\x69\xd2\x24\xc9\xcd\
+\xcd\xa5\x71\x00\x20\x00\xc0\x31\x25\x25\x25\xc9\xdc\xb9\x73\x8d\
+\x69\x40\x25\x4b\xca\xcb\x43\x5e\x93\x57\x5f\x1f\x26\xa5\x9c\x8a\
+\xf7\x8d\xd2\x13\xfe\x2d\x64\xfa\x9c\xf9\x52\xd5\xdb\xdb\x90\xf2\
+\xd4\xd2\xc7\x11\x11\x11\x34\x10\x00\x04\x00\x38\xa6\x19\x33\x66\
+\x68\xab\xfe\xe9\xa5\xba\xe0\x47\x8d\x9b\x28\x21\x9d\x3a\xdb\xac\
+\x2e\xd5\x6b\xd4\x94\x99\xf3\x16\xca\x43\xd5\xfc\x0c\x29\x6f\xda\
+\xb4\x69\xda\x52\xc1\x00\x40\x00\x80\x43\xb9\x72\xe5\x8a\xac\x58\
+\xb1\xc2\x90\xb2\xfa\x0d\x1a\xac\x4d\xed\xb3\xb5\x8a\x15\x2b\xc9\
+\xd8\x49\x53\xa4\x7c\xf9\xf2\xba\xcb\x52\x9b\x06\x2d\x5e\xbc\x98\
+\x86\x02\x80\x00\x00\xc7\xb2\x69\xd3\x26\x6d\x29\x5c\xbd\x82\x9e\
+\x69\x2f\x9d\xba\xbc\x68\x37\xf5\xf2\xf1\x7d\x48\x46\x8e\x99\xa0\
+\xad\x3b\xa0\xd7\xba\x75\xeb\x68\x28\x00\x1c\x1e\xd3\x00\x2d\xc6\
+\x88\x91\xee\x75\xea\x3e\x2e\x61\xaf\x0f\xb3\xbb\xba\x35\x6c\xdc\
+\x44\x06\x0d\x79\x4d\x96\x2c\x5e\xa0\xab\x9c\x73\xe7\xce\xc9\xf9\
+\xf3\xe7\xe5\xd1\x47\x1f\x75\x98\xfb\xae\xd6\x55\xf0\xf3\xf3\xe3\
+\x0f\xc0\xce\x19\x11\x60\x01\x02\x00\xfe\x45\x7c\x7c\xbc\x1c\x3e\
+\x7c\x58\x57\x19\x6a\xd0\xdf\xab\x6f\x0c\xd3\x46\xe2\xdb\xa3\xe0\
+\xd0\xe7\x25\x7a\xd7\x37\x72\xf6\x8c\xbe\x4d\x8d\xa2\xa2\xa2\xe4\
+\xcd\x37\xdf\x74\x98\x7b\xdf\xba\x75\x6b\x39\x75\xea\x14\x7f\x04\
+\x00\xfe\xef\xbf\xe7\x5c\x02\xeb\xd8\xba\x75\xab\xe4\xe7\xe7\xeb\
+\x2a\xa3\xed\xd3\xcf\x6a\x03\xef\xec\x59\xbf\x81\xaf\xe8\x2e\x43\
+\x05\x00\x00\x20\x00\xc0\x21\xe8\xed\xfe\x77\x71\x29\x2d\x3d\xfb\
+\xf4\xb3\xfb\x7a\xd6\xab\xdf\x40\x9a\x07\xb4\xd0\x55\xc6\x81\x03\
+\x07\xe4\xe6\xcd\x9b\x34\x1a\x00\x04\x00\x98\x9b\xda\xf6\x36\x26\
+\x26\x46\x57\x19\xa1\x9d\x5e\x10\x0f\x0f\x4f\x53\xd4\xb7\xcf\x80\
+\x97\x75\xad\x14\xa8\xf6\x1f\xd8\xbe\x7d\x3b\x0d\x07\x00\x01\x00\
+\xe6\xf6\xd5\x57\x5f\x49\xb6\xce\xed\x75\x9f\x6e\xdf\xd1\x34\xf5\
+\xf5\xab\x5e\x43\xea\xd4\x7b\x5c\x57\x19\xbc\x06\x00\x40\x00\x80\
+\xe9\xa9\x2e\x6d\x3d\xd4\x7b\x7f\x1f\x5f\x5f\x53\xd5\x59\xef\x1a\
+\x05\x7a\xaf\x19\x00\x10\x00\x60\x73\x7a\xd7\xfd\xf7\x6f\x11\x68\
+\xba\x3a\x07\x04\xea\x0b\x00\xc9\xc9\xc9\xba\x7b\x4d\x00\x80\x00\
+\x00\x53\x07\x80\x80\xc0\x56\xa6\xab\xb3\x5a\x1c\x48\xbd\x0a\x28\
+\x2c\x35\x63\xe2\xc6\x8d\x1b\x34\x1e\x00\x04\x00\x58\x33\x00\xa8\
+\x1d\xf7\x1e\x79\xac\x96\x29\xeb\xad\xb6\x28\xd6\x43\xad\x9d\x00\
+\x00\x04\x00\x98\x96\x5a\xe3\xbe\xb0\xdc\x3d\x3d\x74\x8d\xa8\xb7\
+\x25\x0f\x4f\x7d\xb3\x16\xe2\xe2\xe2\x68\x3c\x00\x08\x00\x30\xa7\
+\xb4\xb4\x34\xc9\xcc\xcc\x2c\xfc\x43\xd4\x24\x53\xff\xfe\x88\x9b\
+\x9b\x87\xae\xf3\xf5\xbe\x3a\x01\x00\x02\x00\x6c\x46\xef\x43\xcc\
+\xd4\x01\xc0\xdd\x5d\xd7\xf9\xbc\x02\x00\x40\x00\x80\x65\x03\x80\
+\x9b\x87\x87\x69\xeb\x4e\x00\x00\x00\x02\x80\x65\xe5\xe5\xe5\xe9\
+\x3a\xdf\xcc\x3b\x94\xa9\xcd\x8b\x6c\x79\xed\x00\x80\x00\x00\x9b\
+\xf1\xf6\xf6\xd6\x75\x7e\x4a\x52\x92\x69\xeb\x9e\x9a\x92\xa2\xeb\
+\x7c\x1f\x1f\x1f\x1a\x10\x00\x02\x00\xac\x19\x00\x92\x93\x4d\x1c\
+\x00\x52\x09\x00\x00\x40\x00\xb0\x28\x37\x37\x37\x29\x5d\xba\x74\
+\xe1\x7b\x00\x92\x93\x4d\xdc\x03\xa0\xef\xb3\x13\x00\x00\x10\x00\
+\x60\x6a\x55\xaa\x54\x29\xf4\xb9\x49\x49\xe6\xdd\x16\x37\x39\x99\
+\x00\x00\x00\x04\x00\x0b\xd3\xf3\x20\xcb\xb8\x73\x47\x2e\xfd\xe3\
+\xa2\x29\xeb\x7d\xfa\x87\x93\x04\x00\x00\x20\x00\x58\x97\xde\x71\
+\x00\x07\xf7\xc5\x9a\xae\xce\x49\x37\x6f\xca\xc5\x0b\xe7\x6d\x7a\
+\xdd\x00\x80\x00\x00\x53\x07\x80\x03\xfb\xf6\x9a\xae\xce\x07\xf7\
+\xeb\x0b\x2d\x7a\xc7\x4e\x00\x00\x01\x00\x36\xd7\xa4\x49\x13\x5d\
+\xe7\x5f\x38\x7f\xce\x74\xb3\x01\xf6\xc7\xea\x0b\x2d\x4d\x9b\x36\
+\xa5\xe1\x00\x20\x00\xc0\xdc\x82\x83\x83\x75\x2d\xe8\xa3\xb6\xc6\
+\xdd\xbd\xf3\x1b\xd3\xd4\xf7\xe6\xcd\x1b\xf2\xc3\xc9\xe3\xba\xca\
+\x08\x09\x09\xa1\xe1\x00\x20\x00\xc0\xdc\xdc\xdd\xdd\x25\x30\x30\
+\x50\x57\x19\x9f\x7d\xba\x41\xd2\x6f\xdf\x36\x45\x7d\xd7\x45\xac\
+\x94\xbc\xdc\xdc\x42\x9f\xaf\x76\x3f\xec\xd8\xb1\x23\x0d\x07\x00\
+\x01\x00\xe6\x17\x1a\x1a\xaa\xeb\xfc\x3b\x77\xd2\x65\xd3\x86\xb5\
+\x76\x5f\x4f\x35\x63\x21\x7a\x97\xbe\xde\x8a\x46\x8d\x1a\x89\xaf\
+\xaf\x2f\x8d\x06\x00\x01\x00\x04\x00\x65\xeb\x97\x5b\xb4\xee\x75\
+\x7b\x16\xb1\x62\x99\xf6\xca\x42\x0f\xba\xff\x01\x38\x3a\x27\x2e\
+\x81\x75\x54\xaf\x5e\x5d\x1a\x34\x68\x20\x27\x4f\x16\x7e\x6e\x7c\
+\x4e\x4e\x8e\x2c\xfb\x68\xa1\x8c\x1e\x1f\xae\x75\x93\xdb\x9b\xd8\
+\xef\x63\xe4\xe8\xe1\x83\xba\xcb\x71\xb4\x00\x70\xf0\xe0\x41\x19\
+\x35\x6a\x14\x7f\x04\x30\xc4\xa2\x45\x8b\xa4\x6e\xdd\xba\x5c\x08\
+\x02\x00\xcc\xd6\x0b\xa0\x27\x00\x28\x07\xf6\xc5\xca\xda\xd5\x2b\
+\xe5\xa5\xbe\x03\xec\xaa\x6e\x97\x2e\x5e\x94\x0f\x67\xcf\x34\x24\
+\x28\xd5\xaf\x5f\xdf\xa1\xee\xfb\xcf\x3f\xff\x2c\x87\x0e\x1d\xe2\
+\x0f\x00\x86\x48\x4f\x4f\xe7\x22\x38\x00\x5e\x01\x58\x4c\xd7\xae\
+\x5d\x75\x6f\x91\xab\x6c\x5a\xbf\x56\x62\xa2\xbf\xb5\x9b\x7a\xdd\
+\xba\x95\x2a\xef\x87\x8f\x97\xbb\x77\xef\xea\x2e\xab\x5b\xb7\x6e\
+\x34\x14\x00\x04\x00\x38\x96\x5a\xb5\x6a\x49\xcf\x9e\x3d\x0d\x29\
+\x6b\xc1\xbc\x59\x72\xf6\xa7\x33\x36\xaf\x53\x76\x76\x96\x4c\x9f\
+\x32\xc9\x90\xb1\x09\x95\x2b\x57\x96\x37\xde\x78\x83\x86\x02\x80\
+\x00\x00\xc7\x33\x76\xec\x58\x29\x53\xa6\x8c\xee\x72\x72\xb2\xb3\
+\x65\xe2\x98\x77\x64\x7f\xec\xf7\x36\xab\x4b\x6a\x4a\x8a\x8c\x7d\
+\x67\xb8\xfc\x74\xfa\x47\x43\xca\x1b\x31\x62\x84\x16\x02\x00\x80\
+\x00\x00\x87\x53\xad\x5a\x35\x09\x0b\x0b\x33\xa4\xac\xbb\x99\x99\
+\x32\xe3\xbd\x70\xf9\xfb\xc6\x75\xc5\x5e\x0f\xb5\x3a\xe1\xc8\x37\
+\x87\xca\xf9\xb3\x3f\x19\x76\x5d\x86\x0c\x19\x42\x03\x01\x40\x00\
+\x80\xe3\x1a\x3e\x7c\xb8\xb6\xd6\xbd\x11\xd4\x94\xbb\x35\x2b\x57\
+\xc8\xdc\x0f\xa6\x4b\x46\x46\x46\xb1\x7c\xfe\xdd\xbb\x76\xca\x98\
+\x11\x6f\x19\xba\x3c\xf1\x84\x09\x13\x58\xfb\x1f\x00\x01\x00\x8e\
+\xad\x52\xa5\x4a\x32\x72\xe4\x48\x43\xcb\xdc\xf3\xed\x4e\x79\x75\
+\x60\x5f\x89\xda\xb2\x59\x72\x75\xac\xc2\xf7\x9f\x9c\xf9\xf1\x94\
+\xbc\x3b\x7c\x98\xcc\x9b\x35\x5d\x7b\xf7\x6f\x14\x35\x3d\x92\xc1\
+\x7f\x00\x08\x00\xb0\x84\x57\x5e\x79\x45\x9b\xf2\x66\xa4\xb4\xb4\
+\x9f\x65\xd9\x5f\x17\xcb\x5f\x06\x0f\xd4\x66\x09\xe8\x5d\x90\xe7\
+\x17\x57\xaf\x5c\xd6\x06\xfa\xbd\x3b\x62\x98\x9c\x39\x7d\xca\xf0\
+\x6b\x31\x79\xf2\x64\x43\x66\x47\x00\x80\x59\xb0\x0e\x80\x85\xa9\
+\xee\xee\x05\x0b\x16\x48\x97\x2e\x5d\x24\x2f\x2f\xcf\xd0\xb2\x13\
+\x13\xe2\x65\xce\xcc\xf7\x0b\xc2\xc0\x22\x69\xee\xdf\x42\xfc\x03\
+\x5b\x4a\xe3\xa6\xcd\xc4\xc5\xe5\xfe\xbb\xd8\x2f\x5e\x38\xaf\x6d\
+\x43\xac\x06\x19\xaa\x39\xfe\x45\xe5\xa5\x97\x5e\x92\xa0\xa0\x20\
+\x1a\x04\x00\x02\x00\xac\xa3\x6d\xdb\xb6\x32\x6d\xda\x34\x79\xe7\
+\x9d\x77\x8a\xa4\xfc\xb4\x9f\x7f\x96\x9d\x5f\x7f\xa5\x1d\xea\xe1\
+\x5f\xf7\xf1\xfa\xe2\x55\xa5\x8a\xb8\xb9\xbb\x8b\x9b\x5b\xc1\xe1\
+\xee\x51\x10\x44\x5c\x24\x35\x25\x55\x52\x52\x92\x0b\x7e\x26\x6b\
+\x23\xfb\xd5\xc0\xbe\xe2\x58\x72\x38\x20\x20\x40\xe6\xcf\x9f\x4f\
+\x43\x00\x40\x00\x80\xf5\xa8\x19\x01\xa7\x4e\x9d\x92\x55\xab\x56\
+\x15\xe9\xef\x51\xef\xec\x8f\x1f\x3d\x6c\x37\xf5\x56\xa3\xfe\xd7\
+\xae\x5d\x5b\x10\x4c\x5c\x68\x04\x00\x2c\x87\x97\x9e\xd0\xcc\x99\
+\x33\x47\x5a\xb6\x6c\x69\x99\xfa\xba\xba\xba\xca\x86\x0d\x1b\xc4\
+\xcb\xcb\x8b\x9b\x0f\x80\x00\x00\xeb\x72\x76\x76\x96\x35\x6b\xd6\
+\x88\x9f\x9f\x9f\xc3\xd7\x55\x6d\x62\xb4\x74\xe9\x52\x6d\xe4\x3f\
+\x00\x10\x00\x60\x79\x9e\x9e\x9e\xda\xb7\x62\xf5\xed\xd8\x91\x8d\
+\x1b\x37\x4e\x9e\x7b\xee\x39\x6e\x38\x00\x02\x00\xf0\x0b\xb5\x0b\
+\xde\xd6\xad\x5b\xc5\xc7\xc7\xc7\xf1\x1a\x7b\xc9\x92\x32\x65\xca\
+\x14\xc3\xd7\x3f\x00\x00\x33\x62\x10\x20\xfe\x45\xd3\xa6\x4d\x25\
+\x3a\x3a\x5a\xdb\x34\xe8\xc8\x91\x23\x0e\x51\xa7\xf2\xe5\xcb\xcb\
+\x8a\x15\x2b\xa4\x43\x87\x0e\x96\xbc\xa7\xed\xda\xb5\x93\x1b\x37\
+\x6e\xd0\xb8\x61\x08\x56\xcc\x24\x00\xc0\x81\xa9\x1e\x80\xed\xdb\
+\xb7\xcb\xd0\xa1\x43\xe5\xd3\x4f\x3f\x35\x75\x5d\x6a\xd4\xa8\x21\
+\x1b\x37\x6e\x94\xba\x75\xeb\x5a\xf6\x7e\xaa\xde\x0f\x23\x36\x80\
+\x02\xe0\x40\xff\x5d\xe0\x12\xe0\xdf\x51\x0f\x8c\xe5\xcb\x97\xcb\
+\xc4\x89\x13\x4d\xbb\x4a\x5e\xab\x56\xad\xb4\xde\x0c\x2b\x3f\xfc\
+\x01\x80\x00\x80\x42\x51\x1b\x07\xa9\xf9\xf2\x15\x2b\x56\x34\xd5\
+\xe7\x1e\x38\x70\xa0\x7c\xf1\xc5\x17\xe2\xe1\xe1\xc1\x4d\x04\x00\
+\x02\x00\x0a\xa3\x63\xc7\x8e\x72\xe2\xc4\x09\xed\x95\x80\xbd\x2f\
+\x9c\xa3\xd6\x33\xd8\xb9\x73\xa7\xcc\x9b\x37\x4f\x9b\xde\x08\x00\
+\x20\x00\x40\x07\x77\x77\x77\x6d\xd9\x60\x35\x30\x50\xed\x9c\xa7\
+\xe6\xd3\xdb\x93\x3a\x75\xea\x68\xd3\x18\xd5\xd8\x85\xe6\xcd\x9b\
+\x73\xc3\x00\x80\x00\x00\x23\xa9\x1d\x04\x97\x2d\x5b\x26\x31\x31\
+\x31\xda\xe8\x72\x5b\xf3\xf5\xf5\x95\x85\x0b\x17\x4a\x6c\x6c\xac\
+\x04\x07\x07\x73\x83\x00\xe0\x3e\x30\x0b\x00\x85\xd6\xb0\x61\x43\
+\xf9\xfc\xf3\xcf\xb5\x41\x76\x11\x11\x11\xb2\x63\xc7\x0e\x49\x4b\
+\x4b\x2b\x9e\xe4\x5a\xb2\xa4\xf8\xfb\xfb\x4b\xe7\xce\x9d\xa5\x7f\
+\xff\xfe\x52\xb6\x6c\x59\x6e\x08\x00\x10\x00\x50\x9c\xda\xb4\x69\
+\xa3\x1d\x39\x39\x39\x5a\xaf\x40\x64\x64\xa4\x44\x45\x45\x49\x7c\
+\x7c\xbc\xa1\xbf\x47\xcd\x4a\x50\xbf\x27\x34\x34\x54\xfb\xa6\xcf\
+\x3a\xfe\x00\x40\x00\x80\x1d\x50\x03\xee\xd4\x2b\x01\x75\xcc\x9e\
+\x3d\x5b\x1b\x2b\xa0\xc2\x80\x0a\x05\x71\x71\x71\x92\x98\x98\xa8\
+\x85\x84\xfb\xa1\xc6\x17\xa8\xd1\xfb\x6a\x3d\x02\xb5\x3a\x61\x48\
+\x48\x88\x3c\xfd\xf4\xd3\x0e\xbf\x4c\x31\x00\x10\x00\x60\x6a\xea\
+\x01\xde\xac\x59\x33\xed\xf8\x45\x7e\x7e\xbe\x24\x27\x27\x6b\x3d\
+\x03\x09\x09\x09\xda\x4f\x15\x0c\xb2\xb2\xb2\xc4\xdb\xdb\x5b\x3b\
+\xd4\x03\x5f\xbd\xd3\xaf\x52\xa5\x0a\xdb\xf4\x02\x00\x01\x00\x8e\
+\x12\x0a\xd4\x86\x43\xea\x60\x27\x3e\x00\xb0\x2d\x66\x01\x00\x00\
+\x40\x00\x00\x00\x00\x04\x00\x00\x00\x40\x00\x00\x00\x00\x04\x00\
+\x00\x00\x40\x00\x00\x00\x00\x04\x00\x00\x00\x40\x00\x00\x00\x00\
+\x04\x00\x00\x00\x40\x00\x00\x00\x00\x04\x00\x00\x00\x40\x00\x00\
+\x00\x00\x04\x00\x00\x00\x40\x00\x00\x00\x00\x04\x00\x00\x00\x40\
+\x00\x00\x00\x00\x04\x00\x00\x00\x40\x00\x00\x00\x80\x00\x00\x00\
+\x00\x08\x00\x00\x00\x80\x00\x00\x00\x00\x08\x00\x00\x00\x80\x00\
+\x00\x00\x00\x08\x00\x00\x00\x80\x00\x00\x00\x00\x08\x00\x00\x00\
+\x80\x00\x00\x00\x00\x08\x00\x00\x00\x80\x00\x00\x00\x00\x08\x00\
+\x00\x00\x80\x00\x00\x00\x00\x08\x00\x00\x00\x80\x00\x00\x00\x00\
+\x08\x00\x00\x00\x80\x00\x00\x00\x00\x01\x00\x00\x00\x10\x00\x00\
+\x00\x00\x01\x00\x00\x00\x10\x00\x00\x00\x00\x01\x00\x00\x00\x10\
+\x00\x00\x00\x00\x01\x00\x00\x00\x10\x00\x00\x00\x00\x01\x00\x00\
+\x00\x10\x00\x00\x00\x00\x01\x00\x56\x70\xef\xde\x3d\x2e\x02\x00\
+\x14\x33\x27\x2e\x01\x8a\x52\x66\x66\xa6\x1c\x39\x72\x44\xe2\xe3\
+\xe3\x7f\x3d\x12\x12\x12\x7e\xf7\xef\xd9\xd9\xd9\x52\xa5\x4a\x15\
+\xf1\xf6\xf6\x16\x1f\x1f\x1f\xf1\xf5\xf5\xfd\xf5\x9f\xd5\x51\xaf\
+\x5e\x3d\xed\x7f\x03\x00\x10\x00\x60\xc7\x92\x92\x92\x64\xfb\xf6\
+\xed\x12\x15\x15\x25\xbb\x76\xed\xd2\x42\xc0\x7f\xf3\x4b\x18\x38\
+\x7a\xf4\xe8\xbf\xfc\xdf\x4a\x94\x28\x21\x8d\x1a\x35\x92\x90\x90\
+\x10\xed\xa8\x5f\xbf\x3e\x17\x19\x00\x08\x00\xb0\x07\xe7\xcf\x9f\
+\xd7\x1e\xf8\x5b\xb7\x6e\x95\xfd\xfb\xf7\x1b\xda\xad\x9f\x9f\x9f\
+\x2f\xc7\x8e\x1d\xd3\x8e\xa9\x53\xa7\x8a\x9f\x9f\x9f\x16\x04\x3a\
+\x76\xec\x28\xad\x5a\xb5\x12\x67\x67\x67\x6e\x00\x00\x10\x00\x50\
+\x9c\x0e\x1e\x3c\x28\xe3\xc6\x8d\x93\xd8\xd8\xd8\x62\xfb\x9d\x57\
+\xaf\x5e\x95\x8f\x3f\xfe\x58\x3b\xbc\xbc\xbc\x64\xd4\xa8\x51\x32\
+\x60\xc0\x00\x82\x00\x00\x3c\x00\x06\x01\xa2\x50\x2e\x5c\xb8\x20\
+\x7d\xfa\xf4\x91\xa0\xa0\xa0\x62\x7d\xf8\xff\xb3\x9b\x37\x6f\xca\
+\x88\x11\x23\xa4\x79\xf3\xe6\xf2\xf9\xe7\x9f\x73\x63\x00\x80\x00\
+\x80\xa2\xa0\xde\xef\xab\x07\xae\xbf\xbf\xbf\x6c\xd9\xb2\xc5\x6e\
+\x3e\xd7\xc5\x8b\x17\xa5\x6f\xdf\xbe\xd2\xae\x5d\x3b\xd9\xbb\x77\
+\x2f\x37\x0a\x00\x08\x00\x30\x42\x6e\x6e\xae\x7c\xf0\xc1\x07\xd2\
+\xb0\x61\x43\x59\xb2\x64\x89\xe4\xe4\xe4\xd8\xe5\xe7\x3c\x74\xe8\
+\x90\x74\xe8\xd0\x41\x7a\xf6\xec\x29\x97\x2e\x5d\xe2\xc6\x01\x00\
+\x01\x00\x85\x95\x92\x92\x22\x9d\x3a\x75\x92\x29\x53\xa6\x48\x7a\
+\x7a\xba\x29\x3e\xb3\x1a\x90\xf8\xe4\x93\x4f\x4a\x74\x74\x34\x37\
+\x10\x00\x08\x00\x78\x50\xa7\x4f\x9f\x96\x36\x6d\xda\x48\x4c\x4c\
+\x8c\xe9\x3e\xfb\xad\x5b\xb7\xa4\x4b\x97\x2e\xb2\x74\xe9\x52\x6e\
+\x24\x00\x10\x00\x70\xbf\xb6\x6d\xdb\xa6\x0d\xf2\x33\x73\x57\xba\
+\x7a\x75\x31\x7c\xf8\x70\x79\xfb\xed\xb7\xb5\x7f\x06\x00\xfc\x2f\
+\xa6\x01\xe2\x0f\xcd\x9d\x3b\x57\xc2\xc3\xc3\x1d\x66\x99\xde\x65\
+\xcb\x96\xc9\xb9\x73\xe7\x24\x22\x22\x42\xdc\xdc\xdc\x2c\x77\x3f\
+\xd5\x20\xc9\x0d\x1b\x36\xd0\xb0\xed\xdc\x1b\x6f\xbc\x21\xe5\xca\
+\x95\xe3\x42\x80\x00\x80\xe2\xa7\x16\xdd\x09\x0b\x0b\x93\x75\xeb\
+\xd6\x39\x5c\xdd\x76\xef\xde\x2d\x6d\xdb\xb6\x95\x2f\xbf\xfc\x52\
+\x5b\x4c\xc8\x6a\x01\x60\xda\xb4\x69\x34\x70\x3b\x37\x70\xe0\x40\
+\x02\x00\x8a\x0d\xaf\x00\xf0\x3b\x6a\xa0\x9f\x23\x3e\xfc\x7f\xfb\
+\x20\xec\xd6\xad\x9b\xdc\xb9\x73\x87\x9b\x0d\x80\x00\x00\x28\x9b\
+\x36\x6d\x92\x59\xb3\x66\x39\x7c\x3d\x4f\x9d\x3a\x25\x83\x06\x0d\
+\x62\x17\x42\x00\x04\x00\x40\x6d\xc2\x33\x74\xe8\x50\xcb\xd4\x57\
+\xed\x59\x30\x79\xf2\x64\x6e\x3c\x00\x02\x00\xac\x4b\x6d\xcf\xab\
+\x16\xce\xb9\x9f\x5d\xfb\x8c\x54\xb6\xac\xab\xf8\x3e\x54\x4d\x6a\
+\x3e\xfc\xb0\x54\xae\xec\xa6\xed\xfa\x57\x9c\xe6\xcc\x99\xc3\xc0\
+\x38\x00\x96\xc5\x20\x40\x8b\xbb\x7b\xf7\xae\xf4\xea\xd5\x4b\xe2\
+\xe2\xe2\x8a\xf4\xf7\x3c\xe4\xe7\x27\x01\x81\xad\xa4\x71\x93\x66\
+\xe2\xe9\x55\x45\xdc\xdc\xdd\xa5\x4c\x99\x32\xbf\xfb\xff\xc9\xcb\
+\xcb\x93\x5b\xb7\x52\x25\x35\x25\x45\xce\xfd\x74\x46\x0e\xec\xdb\
+\x2b\x3f\x9c\x38\x5e\xa4\xd3\xf7\x5e\x7f\xfd\x75\x79\xe4\x91\x47\
+\xe4\x89\x27\x9e\xa0\x31\x00\x20\x00\xc0\x3a\xde\x7d\xf7\x5d\x6d\
+\xf9\xdc\xa2\xe0\xe3\xeb\x2b\xcf\x76\x08\x11\xff\xc0\x96\xda\x37\
+\xfd\xff\xa6\x54\xa9\x52\xe2\xe1\xe1\xa9\x1d\x8f\x3e\x56\x4b\x82\
+\x43\x9f\x97\x8c\x8c\x0c\x39\x72\x70\xbf\xc4\xec\xfe\xb6\x20\x10\
+\x18\xbf\xe9\x90\x0a\x40\xaa\xf7\xe3\xf0\xe1\xc3\x52\xb1\x62\x45\
+\x1a\x04\x00\x02\x00\x1c\x9f\x5a\xe5\x6f\xe5\xca\x95\x86\x97\x5b\
+\xa9\x72\x65\xe9\xd6\xb3\xb7\xb4\x0f\x0e\x91\x52\x4e\xfa\x9a\x98\
+\xab\xab\xab\xb4\x7e\xaa\xad\x76\x9c\x3d\x73\x5a\x56\xad\x58\x2a\
+\x3f\xfe\x70\xd2\xd0\xcf\x9b\x98\x98\x28\xb3\x67\xcf\xd6\xd6\x3d\
+\x00\x00\xab\x60\x0c\x80\x85\x4d\x9c\x38\x51\xeb\x76\x37\x8a\xb3\
+\x8b\x8b\x74\xeb\xd5\x5b\x3e\x5a\xbe\x4a\x3a\x3e\xd7\x49\xf7\xc3\
+\xff\x9f\xd5\xaa\x53\x57\xa6\xce\x9c\x23\x63\x26\x4e\x91\x87\xaa\
+\x19\x3b\x8f\xff\xa3\x8f\x3e\x92\xeb\xd7\xaf\xd3\x28\x00\x10\x00\
+\xe0\xd8\xbe\xfb\xee\x3b\xd9\xbe\x7d\xbb\x61\xe5\xa9\x77\xfa\xef\
+\x17\x3c\x9c\x7b\xf6\xee\xa7\x0d\xee\x2b\x4a\xcd\x03\x5a\xc8\xac\
+\xf9\x8b\xb4\x31\x05\x46\x51\xaf\x02\xa6\x4e\x9d\x4a\xc3\x00\x40\
+\x00\x80\x63\x1b\x3f\x7e\xbc\x61\x65\x3d\xf2\xe8\x63\xf2\x41\xc1\
+\x03\xf9\xd1\x5a\xb5\x8b\xed\xf3\x97\x29\x5b\x56\x46\x8d\x9b\x28\
+\x5d\xbb\xf5\x34\xac\xcc\xb5\x6b\xd7\xca\x8f\x3f\xfe\x48\xe3\x00\
+\x40\x00\x80\x63\xda\xbc\x79\xb3\x36\xe8\xcd\x08\x2d\x5a\xb5\x96\
+\xf7\x67\xcd\xd5\x06\xee\x15\x37\x35\x6d\xb0\x77\xff\x81\xf2\xd6\
+\xc8\xd1\xda\x00\x42\xbd\xd4\xc2\x40\x13\x26\x4c\xa0\x81\x00\x20\
+\x00\xc0\xf1\xe4\xe4\xe4\x18\x36\xd8\xad\xee\xe3\xf5\x65\xf8\xa8\
+\xb1\xe2\xe2\x52\xda\xa6\x75\x7a\xb2\x6d\x90\xbc\x1c\x66\xcc\x22\
+\x46\x3b\x76\xec\x90\x3d\x7b\xf6\xd0\x50\x00\x10\x00\xe0\x58\x22\
+\x23\x23\xb5\xf5\xf0\xf5\xaa\x52\xb5\xaa\x8c\x1e\x37\x49\x9c\x9c\
+\xec\x63\x22\x49\x87\x90\xe7\xb4\x69\x83\x46\xf8\xf0\xc3\x0f\x69\
+\x28\x00\x08\x00\x70\xbc\x00\xa0\x97\x7a\xff\xae\x46\xe2\x57\xac\
+\x54\xc9\xae\xea\x36\x68\xc8\x6b\xd2\xb0\x71\x13\xdd\xe5\xa8\x5d\
+\x03\xd9\x2c\x08\x80\xa3\x63\x1d\x00\x0b\x51\xdd\xff\x5f\x7d\xf5\
+\x95\xee\x72\x5e\x2e\x78\xd0\xd6\xa8\xf9\x27\xbb\xab\x9f\x1a\x07\
+\x30\x62\xf4\x38\x79\x75\x50\xbf\x82\x07\x78\x7a\xa1\xcb\xc9\xca\
+\xca\x92\x6f\xbe\xf9\x46\x3a\x75\xea\xe4\x30\xf7\xbe\x51\xa3\x46\
+\xda\x20\x47\xd8\xb7\xca\x95\x2b\x73\x11\x40\x00\x80\xf1\xd4\xd4\
+\xbf\xb4\xb4\x34\x5d\x65\x54\xaf\x51\x53\xda\x3d\xd3\xde\x6e\xeb\
+\x58\xa1\x62\x45\xe9\xda\xbd\x87\x44\xac\x58\xa6\xab\x9c\xa8\xa8\
+\x28\x87\x0a\x00\x5e\x5e\x5e\x12\x1a\x1a\xca\x1f\x01\x80\x5f\xf1\
+\x0a\xc0\x42\x8c\xe8\xfe\xef\x3b\xe0\xe5\x62\xdf\xb4\xe7\x41\x85\
+\x3e\xdf\x59\x3c\x0b\x1e\x78\x7a\xa8\x9e\x12\x23\x17\x49\x02\x00\
+\x02\x00\x6c\x22\x3f\x3f\x5f\xfb\x56\xab\xc7\xe3\x0d\x1a\x4a\x33\
+\xff\x00\xbb\xaf\xab\x5a\x91\xb0\x67\xef\xfe\xba\xca\x48\x4d\x4d\
+\x95\xd8\xd8\x58\x1a\x0e\x00\x02\x00\xcc\xed\xe8\xd1\xa3\xba\x77\
+\xfc\x7b\xb1\x7b\x2f\xd3\xd4\xb7\xed\xd3\xcf\x88\x87\xa7\xbe\x5e\
+\x00\xbd\x81\x09\x00\x08\x00\xb0\x39\xbd\x83\xff\xca\x95\x2b\x2f\
+\x0d\x1a\x36\x32\x4d\x7d\xd5\x6b\x0a\xff\x16\x81\xba\xca\xf8\xfa\
+\xeb\xaf\x69\x38\x00\x08\x00\x30\xb7\xcb\x97\x2f\xeb\x3a\xbf\x59\
+\x73\x7f\xc3\x37\xf7\x29\x6a\x01\x81\x2d\x6d\x7a\xcd\x00\x80\x00\
+\x00\x9b\x4b\x48\x48\xd0\x75\xbe\xbf\xce\x87\xa9\x2d\xd4\x6f\xd0\
+\x48\x5c\xcb\x95\x2b\xf4\xf9\x6a\x3a\x60\x4a\x4a\x0a\x8d\x07\x00\
+\x01\x00\xe6\xa5\xf6\xbc\x2f\x2c\x35\xbf\xbe\xe9\x13\xcd\x4d\x57\
+\x67\xd5\x63\xd1\xa4\xe9\x13\xba\xca\x88\x8f\x8f\xa7\xf1\x00\x20\
+\x00\xc0\x9a\x3d\x00\x6a\xab\xdf\xa2\xde\xe2\xb7\xa8\xf8\x56\xab\
+\x46\x00\x00\x00\x02\x80\x35\x65\x67\x67\xeb\xea\xca\x76\xb7\xc1\
+\x4e\x7f\x46\x71\x73\x73\x27\x00\x00\x00\x01\xc0\x9a\x6e\xdc\xb8\
+\xa1\xad\x03\x50\x58\x1e\x66\x0e\x00\xee\x1e\x04\x00\x00\x20\x00\
+\x58\x93\xde\x01\x80\xee\x9e\xe6\x0d\x00\xee\xee\xee\x36\xbd\x76\
+\x00\x40\x00\x80\xcd\xa8\x55\xed\xf4\xa8\x58\xa1\xa2\x69\xeb\x5e\
+\xbe\x42\x05\x5d\xe7\x33\x0b\x00\x00\x01\x00\x96\xfd\x16\xfc\xf3\
+\xcf\xb7\x4c\x5b\xf7\xdb\x3a\x37\x3f\xf2\xf0\xf0\xa0\x01\x01\x20\
+\x00\xc0\x9c\xaa\x56\xad\xaa\xef\x5b\x70\x72\x92\x69\xeb\x9e\xaa\
+\xf3\x1b\xbc\x8f\x8f\x0f\x0d\x08\x00\x01\x00\xe6\x0d\x00\x7a\x76\
+\xf0\x4b\x4e\x4e\x36\x6d\xdd\x53\x52\xf4\x7d\x76\x02\x00\x00\x02\
+\x00\x4c\xcb\xd9\xd9\x59\x57\x57\x76\x8a\x89\x03\x40\x2a\x01\x00\
+\x00\x08\x00\x56\xe6\xed\xed\xad\xeb\x21\x7a\xe7\x4e\xba\x29\xeb\
+\x7d\xed\xda\x55\x9b\x5d\x37\x00\x20\x00\xc0\xe6\xf4\x8c\x03\xb8\
+\x77\xef\x9e\x1c\x3e\xb0\xdf\x74\x75\xce\xc9\xc9\x91\x63\x47\x0e\
+\xd3\x03\x00\x00\x04\x00\x7a\x00\x0a\x6b\xff\xbe\xbd\xa6\xab\xf3\
+\x89\x63\x47\xe5\x6e\x66\x66\xa1\xcf\x2f\x53\xa6\x8c\xb8\xb9\xb9\
+\xd1\x78\x00\x10\x00\x60\x5e\x35\x6b\xd6\xd4\x75\xfe\xd1\x43\x87\
+\xb4\x6f\xd4\x66\x72\x40\x67\x68\xa9\x51\xa3\x06\x0d\x07\x00\x01\
+\x00\xe6\xd6\xbe\x7d\x7b\x5d\xe7\x67\x66\x66\xc8\xf1\xa3\x87\x4d\
+\x53\xdf\xbc\xbc\xbc\x82\x00\x10\xab\xab\x8c\x67\x9f\x7d\x96\x86\
+\x03\x80\x00\x00\x73\x6b\xdc\xb8\xb1\x54\xd3\xb9\x33\xde\xa7\xeb\
+\x3e\x31\x4d\x7d\xbf\xf9\x6a\x9b\xdc\x4a\xd5\xb7\x06\x40\x48\x48\
+\x08\x0d\x07\x00\x01\x00\xe6\xd7\xb1\x63\x47\x5d\xe7\x9f\xfd\xe9\
+\x8c\xc4\x7e\x1f\x63\xf7\xf5\xbc\x7b\xf7\xae\xac\xff\x64\xb5\xae\
+\x32\xd4\xb4\xc9\x80\x80\x00\x1a\x0d\x00\x02\x00\xcc\x2f\x34\x34\
+\x54\x77\x19\x6b\x56\xae\xd0\xba\xd7\xed\xd9\x17\x9f\x6d\xd2\xfd\
+\xed\xbf\x43\x87\x0e\x52\xaa\x54\x29\x1a\x0d\x00\x87\xe5\xc4\x25\
+\xb0\x8e\xd6\xad\x5b\x4b\xe5\xca\x95\xe5\xd6\xad\xc2\xaf\xed\x1f\
+\x77\xfd\x9a\x7c\xb5\x35\x52\x3a\x3e\xd7\xc9\x2e\xeb\xa8\x96\xfe\
+\xdd\xfc\xf7\x8d\xba\xcb\x71\xb4\xee\xff\xc4\xc4\x44\x89\x89\x89\
+\xe1\x8f\x00\x86\x68\xd7\xae\x9d\xee\x3d\x46\x40\x00\x40\x71\xde\
+\x6c\x27\x27\x6d\x30\xe0\x86\x0d\x1b\x74\x95\xb3\x72\xf9\x12\x79\
+\xac\x56\x6d\x79\xac\x76\x1d\xbb\xaa\x9f\x9a\xa5\x30\x63\x6a\xb8\
+\xae\xa9\x7f\x8a\x9a\xfe\x17\x14\x14\xe4\x50\xf7\xfe\xe4\xc9\x93\
+\x32\x70\xe0\x40\xfe\x08\x60\x88\x9d\x3b\x77\x12\x00\x1c\x00\xaf\
+\x00\x2c\xe6\xb9\xe7\x9e\xd3\xff\xa0\xcd\xce\x96\x69\x53\x26\x4a\
+\xb2\x9d\x6d\x12\xb4\x78\xfe\x1c\xf9\xe9\xf4\x8f\xba\xcb\x69\xdb\
+\xb6\xad\x94\x2d\x5b\x96\xc6\x02\x80\x00\x00\xc7\xa1\x06\x02\xd6\
+\xaa\x55\x4b\x77\x39\xaa\xab\xfd\xfd\xf0\x09\x92\x95\x95\x65\x17\
+\xf5\xfa\xec\xd3\x0d\x12\xbd\xeb\x1b\x43\xca\x1a\x36\x6c\x18\x0d\
+\x05\x00\x01\x00\x8e\x45\xbd\x06\x98\x34\x69\x92\x21\x65\x5d\x3c\
+\x7f\x4e\xa6\x4f\x99\x28\x19\x77\xee\xd8\xb4\x4e\xdb\x22\xbf\x90\
+\x35\x2b\x97\x1b\x52\x96\x7a\xf7\x1f\x18\x18\x48\x43\x01\x40\x00\
+\x80\xe3\x51\xb3\x01\x8c\x7a\xc8\xa9\xb5\xf6\x47\xbd\xfd\x86\xc4\
+\xc7\xc5\x15\x7b\x3d\xd4\x6c\x84\xbf\x2e\xfa\x50\x96\x2c\x5e\x20\
+\xf9\xf9\xf9\x86\x84\xa3\xf0\xf0\x70\x1a\x08\x00\x02\x00\x1c\xd7\
+\x7b\xef\xbd\x67\x58\x59\xd7\xae\x5e\x91\x77\xde\xfa\x8b\x9c\x3c\
+\x71\xac\xd8\x3e\x7f\xfa\xed\xdb\x12\x3e\x6e\xb4\x6c\x8f\xfa\xd2\
+\xb0\x32\xfb\xf6\xed\x6b\xc8\xeb\x11\x00\x20\x00\xc0\x6e\x35\x6f\
+\xde\x5c\x3a\x75\x32\x6e\x2a\x9f\xf6\x40\x1e\x3b\x5a\x96\xfd\x75\
+\xb1\xa4\xfd\xfc\x73\x91\x7d\x6e\xf5\x4d\x5f\xbd\xeb\x7f\xeb\x2f\
+\x43\xe4\xe4\x71\xe3\x02\x87\xab\xab\xab\xbc\xfb\xee\xbb\x34\x0c\
+\x00\x04\x00\x38\x3e\x35\x16\xc0\xd9\xd9\xd9\xb0\xf2\x54\x97\x7c\
+\xd4\x96\xcd\xf2\xea\xa0\xbe\xda\xb2\xc1\x46\x0f\x10\x3c\x7a\xf8\
+\x90\xbc\xfd\x7a\x98\xcc\x9f\x35\x43\x92\x6e\xde\x34\xb4\xec\x37\
+\xdf\x7c\x53\xd7\x96\xc9\x00\x60\x36\xac\x03\x60\x61\x8f\x3c\xf2\
+\x88\x84\x85\x85\xc9\x82\x05\x0b\x0c\x2d\x37\x23\x23\x43\xd6\xae\
+\x5e\x29\xdb\xa2\xbe\x90\xa0\x67\xda\x8b\x7f\x8b\x96\xf2\x68\xad\
+\xda\x52\xa2\x44\x89\x07\x2e\x2b\x25\x39\x59\x0e\xee\x8f\x95\x98\
+\xe8\x5d\x72\xea\x87\x93\x45\x72\x1d\xfc\xfc\xfc\xe4\x8d\x37\xde\
+\xa0\x41\x00\x20\x00\xc0\x3a\xd4\xa0\xb7\x63\xc7\x8e\x15\xc9\x2a\
+\x71\x6a\xaa\xe0\xa6\x0d\xeb\xb4\xc3\xdd\xc3\x43\x9a\x07\x04\x4a\
+\xe3\xa6\x4f\x48\x95\x2a\x55\xc4\xdd\xd3\x53\x2a\x55\xaa\xfc\xbb\
+\x50\xa0\x76\x1c\x4c\x49\x4a\xd6\xd6\x17\x50\xfb\x0e\xa8\xed\x7c\
+\xcf\x9f\xfd\xc9\x90\x01\x7e\xff\x8e\xea\xfa\x5f\xbf\x7e\xbd\x94\
+\x2b\x57\x8e\xc6\x00\x80\x00\x00\x0b\x35\x00\x27\x27\x89\x88\x88\
+\x90\x36\x6d\xda\xc8\xe5\xcb\x97\x8b\xec\xf7\xa8\x6f\xf2\x6a\x09\
+\x61\x75\xfc\x42\xad\xb5\xef\xe6\xee\x2e\x2e\x2e\xa5\x25\x25\x25\
+\x59\xf7\x0a\x7e\x0f\x4a\x85\x8f\xa5\x4b\x97\x4a\x83\x06\x0d\x68\
+\x08\x00\x2c\x87\x31\x00\xd0\x76\xbe\xb3\xc5\xb7\x60\x35\x66\x40\
+\xbd\xcb\x57\xfb\x0b\x14\xf7\xc3\x5f\x19\x33\x66\x8c\x21\x2b\x23\
+\x02\x00\x01\x00\xa6\xf5\xf8\xe3\x8f\xcb\x92\x25\x4b\x0a\xf5\x9e\
+\xde\x8c\xba\x74\xe9\x22\xa3\x46\x8d\xe2\xc6\x03\x20\x00\x00\xea\
+\xdb\xb0\x15\xa6\xc2\x35\x6a\xd4\x48\x3e\xfa\xe8\x23\x6e\x38\x00\
+\x02\x00\xf0\x0b\xf5\xad\x78\xc0\x80\x01\x0e\x5b\xbf\xda\xb5\x6b\
+\x6b\xaf\x3b\xd8\xec\x07\x80\xd5\x31\x08\x10\xbf\xa3\x5e\x01\xcc\
+\x9f\x3f\x5f\xea\xd6\xad\xab\xbd\x23\xcf\xcd\xcd\x75\x98\xba\x3d\
+\xfb\xec\xb3\xf2\xb7\xbf\xfd\x4d\x2a\x54\xa8\x60\xb9\xfb\xaa\x82\
+\xcf\xf4\xe9\xd3\x69\xe0\x30\x44\xf5\xea\xd5\xb9\x08\x04\x00\x38\
+\x2a\xb5\x3e\x40\x9d\x3a\x75\xa4\x5f\xbf\x7e\x92\x9a\x9a\x6a\xfa\
+\xfa\xa8\x85\x7e\xd4\x94\xc7\x92\x25\xad\xd9\xe9\xa5\xd6\x3a\x78\
+\xed\xb5\xd7\x68\xd8\x00\x7e\xc5\x2b\x00\xfc\x5b\x6a\x6a\x60\x74\
+\x74\xb4\x16\x04\xcc\xaa\x74\xe9\xd2\xda\xe0\xc6\x29\x53\xa6\x58\
+\xf6\xe1\x0f\x00\x04\x00\x3c\xb0\x3f\xfd\xe9\x4f\xb2\x6b\xd7\x2e\
+\x09\x0e\x0e\x36\xdd\x67\x57\x4b\xfb\x6e\xdd\xba\x55\x7a\xf4\xe8\
+\xc1\x8d\x04\x00\x02\x00\x1e\x54\xf9\xf2\xe5\x65\xdd\xba\x75\x32\
+\x6b\xd6\x2c\xf1\xf4\xf4\xb4\xff\x46\x5d\xf0\x4d\xbf\x57\xaf\x5e\
+\xda\xea\x86\x6a\xd3\x23\x00\x00\x01\x00\x3a\x1e\xaa\x83\x07\x0f\
+\x96\x13\x27\x4e\xc8\xc8\x91\x23\xed\x76\x14\x7d\x50\x50\x90\xf6\
+\xe0\xff\xf8\xe3\x8f\xc5\xdb\xdb\x9b\x1b\x07\x00\x04\x00\x18\xd5\
+\x1b\x30\x7e\xfc\x78\x6d\xff\x80\xbe\x7d\xfb\x6a\xcb\xf9\xda\x03\
+\x35\xb7\x7f\xcb\x96\x2d\xb2\x79\xf3\x66\x96\xf6\x05\x00\x02\x00\
+\x8a\x8a\x8f\x8f\x8f\x2c\x5c\xb8\x50\xf6\xee\xdd\x2b\x1d\x3a\x74\
+\xb0\xd9\x0a\x82\x35\x6a\xd4\xd0\xd6\xf3\xdf\xb3\x67\x8f\xb4\x6d\
+\xdb\x96\x1b\x03\x00\xf7\x89\x69\x80\xd0\x45\xad\x17\xb0\x71\xe3\
+\x46\x49\x4c\x4c\xd4\x06\xdc\x45\x46\x46\xca\xee\xdd\xbb\x25\x3b\
+\x3b\xbb\xc8\x7e\x67\xbd\x7a\xf5\x24\x24\x24\x44\x42\x43\x43\xa5\
+\x71\xe3\xc6\x96\x59\xbe\x18\x00\x08\x00\xb0\x3b\x6a\xc4\xbd\x5a\
+\x41\x50\x1d\xe9\xe9\xe9\xb2\x63\xc7\x0e\x2d\x0c\xa8\x9f\x69\x69\
+\x69\xba\xca\x56\xe3\x0f\x5a\xb4\x68\xa1\x3d\xf0\xd5\x83\x5f\xcd\
+\x4c\x00\x00\x10\x00\x60\x67\xd4\x38\x01\xb5\xd9\x8e\x3a\x72\x72\
+\x72\xe4\xe4\xc9\x93\x12\x17\x17\x27\x09\x09\x09\x5a\x4f\x81\xfa\
+\xf9\xcb\xa1\xfe\x3d\x33\x33\x53\x1b\xb0\xa7\x0e\x15\x24\x7e\xf9\
+\xe7\x5f\x0e\xd5\xcb\xa0\x76\x2c\x04\x00\x10\x00\x60\x12\xce\xce\
+\xce\xd2\xb4\x69\x53\xed\x00\x00\xd8\x0f\x06\x01\x02\x00\x40\x00\
+\x00\x00\x00\x04\x00\x00\x00\x40\x00\x00\x00\x00\x04\x00\x00\x00\
+\x40\x00\x00\x00\x00\x04\x00\x00\x00\x40\x00\x00\x00\x00\x04\x00\
+\x00\x00\x40\x00\x00\x00\x00\x04\x00\x00\x00\x40\x00\x00\x00\x00\
+\x04\x00\x00\x00\x40\x00\x00\x00\x00\x04\x00\x00\x00\x40\x00\x00\
+\x00\x00\x04\x00\x00\x00\x40\x00\x00\x00\x80\x00\x00\x00\x00\x08\
+\x00\x00\x00\x80\x00\x00\x00\x00\x08\x00\x00\x00\x80\x00\x00\x00\
+\x00\x08\x00\x00\x00\x80\x00\x00\x00\x00\x08\x00\x00\x00\x80\x00\
+\x00\x00\x00\x08\x00\x00\x00\x80\x00\x00\x00\x00\x08\x00\x00\x00\
+\x80\x00\x00\x00\x00\x08\x00\x00\x00\x80\x00\x00\x00\x00\x08\x00\
+\x00\x00\x80\x00\x00\x00\x00\x01\x00\x00\x00\x10\x00\x00\x00\x00\
+\x01\x00\x00\x00\x10\x00\x00\x00\x00\x01\x00\x00\x00\x10\x00\x00\
+\x00\x00\x01\x00\x00\x00\x10\x00\x00\x00\x00\x01\x00\x00\x00\x10\
+\x00\x00\x00\x00\x01\x00\x00\x00\x14\x05\x27\x2e\x01\x8a\x4b\x46\
+\x46\x86\xc4\xc7\xc7\x6b\x47\x42\x42\x82\xf6\x33\x2e\x2e\x4e\xb2\
+\xb2\xb2\xa4\x6a\xd5\xaa\xe2\xe3\xe3\xf3\xbb\xc3\xdd\xdd\x5d\x4a\
+\x94\x28\xc1\x85\x03\x00\x02\x00\xcc\x22\x27\x27\x47\x62\x62\x62\
+\x24\x32\x32\x52\xfb\xa9\x1e\xf4\xb7\x6f\xdf\x7e\xa0\x32\x5c\x5c\
+\x5c\xb4\x60\xd0\xa0\x41\x03\x09\x09\x09\x91\xe0\xe0\x60\xf1\xf4\
+\xf4\xe4\xe2\x02\x00\x01\x00\xf6\x24\x3d\x3d\x5d\x76\xec\xd8\xa1\
+\x3d\xf4\xd5\xcf\xb4\xb4\x34\x5d\xe5\x65\x67\x67\xcb\xd5\xab\x57\
+\xb5\x63\xeb\xd6\xad\x52\xb2\x64\x49\x09\x08\x08\x90\xd0\xd0\x50\
+\x2d\x10\x3c\xfc\xf0\xc3\x5c\x74\x00\x20\x00\xc0\x56\xb6\x6c\xd9\
+\x22\x11\x11\x11\xb2\x7b\xf7\x6e\xed\xa1\x5d\x54\xee\xdd\xbb\x27\
+\xb1\xb1\xb1\xda\x31\x76\xec\x58\xa9\x5b\xb7\xae\xbc\xf0\xc2\x0b\
+\x32\x74\xe8\x50\xa9\x58\xb1\x22\x37\x02\x00\x1e\x00\x83\x00\x51\
+\x68\xea\x41\x1c\x14\x14\x24\x7d\xfa\xf4\x91\xaf\xbf\xfe\xba\x48\
+\x1f\xfe\x7f\xe4\xf4\xe9\xd3\x32\x6d\xda\x34\x69\xd8\xb0\xa1\x2c\
+\x5e\xbc\xb8\xd8\x7f\x3f\x00\x10\x00\x60\x29\x67\xcf\x9e\x95\x9e\
+\x3d\x7b\x4a\xfb\xf6\xed\xe5\xe0\xc1\x83\x36\xff\x3c\x29\x29\x29\
+\x32\x7a\xf4\x68\x69\xd6\xac\x99\x6c\xda\xb4\x49\xf2\xf3\xf3\xb9\
+\x49\x00\x40\x00\x80\x51\x12\x13\x13\x65\xd8\xb0\x61\xd2\xa2\x45\
+\x0b\x89\x8a\x8a\xb2\xbb\xcf\x77\xf9\xf2\x65\x19\x38\x70\xa0\xb4\
+\x69\xd3\x46\xf6\xec\xd9\xc3\x0d\x03\x00\x02\x00\xf4\xda\xbc\x79\
+\xb3\x34\x6e\xdc\x58\x56\xac\x58\x21\xb9\xb9\xb9\x76\xfd\x59\x8f\
+\x1e\x3d\xaa\x0d\x14\x1c\x32\x64\x88\x36\xc5\x10\x00\x40\x00\xc0\
+\x03\x52\xdd\xe9\xef\xbd\xf7\x9e\xf4\xeb\xd7\x4f\xee\xdc\xb9\x63\
+\xaa\xcf\xbe\x6e\xdd\x3a\x6d\xea\xa0\x5a\x73\x00\x00\x40\x00\xc0\
+\x7d\x52\x0f\xfc\x97\x5e\x7a\x49\x66\xce\x9c\x69\xda\x3a\x1c\x3a\
+\x74\x48\x7b\x25\xa0\x7a\x05\x00\x00\xff\x87\x69\x80\xf8\x43\xea\
+\x7d\x7a\xf7\xee\xdd\xe5\xc7\x1f\x7f\x34\x7d\x5d\xd4\x22\x44\x1d\
+\x3a\x74\x90\x45\x8b\x16\xc9\x8b\x2f\xbe\x68\xc9\xfb\xa9\x66\x48\
+\xa4\xa6\xa6\xd2\xb0\xed\x9c\x97\x97\x97\xb6\xde\x05\x40\x00\x80\
+\x4d\xa8\x01\x74\x7d\xfb\xf6\xd5\x46\xd7\x3b\x8a\xcc\xcc\x4c\x6d\
+\x80\xa0\x0a\x34\xe3\xc7\x8f\xb7\xdc\x12\xc3\xea\x9e\x76\xe9\xd2\
+\x85\xc6\x6d\xe7\xce\x9d\x3b\xa7\xad\x7e\x09\x10\x00\x50\xec\x54\
+\x97\x79\xd7\xae\x5d\x1d\x76\xf0\xdc\xac\x59\xb3\x24\x2f\x2f\x4f\
+\xc2\xc3\xc3\xb9\xd9\x00\x2c\x8d\xbe\x26\xfc\x4a\x75\x95\xab\xf9\
+\xfd\x8e\x3e\x72\x7e\xee\xdc\xb9\xb2\x7e\xfd\x7a\x6e\x38\x00\x02\
+\x00\xa0\xba\xc8\x7b\xf4\xe8\xa1\xcd\xf5\xb7\x82\xd7\x5f\x7f\xdd\
+\x2e\x16\x31\x02\x00\x02\x00\x6c\x4a\xad\xa7\x7f\xec\xd8\x31\xcb\
+\xd4\x57\xf5\x72\xa8\xde\x8e\x6b\xd7\xae\x71\xf3\x01\x58\x12\x63\
+\x00\x20\x1f\x7c\xf0\x81\xb6\x84\x6e\x51\x2b\x5f\xa1\x82\x34\x6c\
+\xdc\x44\xbc\xbc\xaa\x88\x9b\xbb\x47\xc1\xe1\xae\x1d\xa5\x5d\x4a\
+\x4b\x6a\x6a\x8a\xa4\x24\x27\x6b\x3f\x53\x53\x52\xe4\xec\x99\xd3\
+\x72\xe5\xf2\xa5\x22\xfd\x3c\x37\x6e\xdc\xd0\x42\x80\xda\xb9\xb0\
+\x6c\xd9\xb2\x34\x04\x00\x04\x00\x58\x87\xda\x66\x57\x2d\xf4\x53\
+\x54\x3c\x3c\xbd\x24\x20\xb0\xa5\xb4\x68\xd9\x5a\xea\xd5\x6f\x20\
+\xa5\x4a\x95\xba\xef\x73\xe3\xe3\xe2\x64\xff\xde\xef\x64\x5f\xec\
+\xf7\x5a\x20\x28\x8a\x35\xfe\x8f\x1f\x3f\x2e\x83\x07\x0f\x96\xd5\
+\xab\x57\xd3\x18\x00\x10\x00\x60\x0d\xea\xbd\xff\x5b\x6f\xbd\x55\
+\x24\x0f\xd6\x87\xfc\xfc\xa4\x77\xbf\x41\xda\xc3\xbf\xb0\x53\xee\
+\x7c\x7c\x7d\xe5\x85\x17\xbb\x69\x47\x42\x7c\x9c\x7c\x12\xb1\x52\
+\xbe\xdf\x13\x6d\xf8\xe7\x55\xdb\x19\xab\xbd\x0d\x42\x42\x42\x68\
+\x14\x00\x2c\x83\x31\x00\x16\xb6\x70\xe1\x42\x89\x8f\x8f\x37\xb4\
+\x4c\xd5\xa5\xff\xea\xeb\xc3\x64\xfe\xe2\xa5\x05\xdf\xfa\x5b\x19\
+\x36\xdf\xde\xdb\xc7\x57\x86\x8f\x1a\x23\x33\xe7\x2d\x94\x06\x8d\
+\x1a\x1b\x7e\x2d\x26\x4e\x9c\xa8\x4d\x0f\x04\x00\x02\x00\x1c\x5a\
+\x72\x72\xb2\xcc\x9b\x37\xcf\xd0\x32\x9f\x6e\x1f\x2c\x8b\x97\xad\
+\x92\x67\x83\x43\x1e\xa8\xab\xff\x41\x3c\xfa\x58\x2d\x99\x3c\xed\
+\x03\x79\x67\xec\x04\x29\x63\xe0\x7b\x7b\xb5\xc5\x71\x44\x44\x04\
+\x0d\x03\x00\x01\x00\x8e\x6d\xc6\x8c\x19\x72\xfb\xf6\x6d\x63\x1a\
+\x51\xc9\x92\xf2\xf2\x90\xd7\x64\xe8\x9b\x6f\x4b\x99\x32\x65\x8a\
+\xe5\xf3\x07\xb6\xfa\x7f\x32\x63\xce\x87\x52\xd5\xdb\xdb\xb0\x32\
+\xa7\x4d\x9b\x26\x19\x19\x19\x34\x0e\x00\x04\x00\x38\xa6\x4b\x97\
+\x2e\xc9\xf2\xe5\xcb\x0d\x29\xab\x7c\xf9\xf2\x32\x61\xca\x34\x09\
+\xe9\xd4\xb9\xd8\xeb\x51\xbd\x46\x4d\xf9\x60\xde\x22\xa9\xdf\xb0\
+\x91\x21\xe5\xa9\x5d\x03\x17\x2c\x58\x40\x03\x01\x40\x00\x80\x63\
+\x52\xcb\xe0\xe6\xe4\xe4\xe8\x2e\x47\x75\xc1\x4f\x99\x31\x5b\x1a\
+\x35\x69\x6a\xb3\xba\x54\xa8\x58\x51\x26\xbd\x37\x5d\x9b\x5e\x68\
+\x84\xf9\xf3\xe7\x4b\x52\x52\x12\x8d\x04\x00\x01\x00\x8e\xe5\x87\
+\x1f\x7e\x90\xcf\x3e\xfb\x4c\x77\x39\x6a\x70\xdf\xb0\x11\xa3\xa4\
+\xe6\x9f\x1e\xb6\x79\x9d\x4a\x39\x39\xc9\xc8\x77\xc7\x6b\x03\x05\
+\xf5\x4a\x4f\x4f\x97\x39\x73\xe6\xd0\x50\x00\x10\x00\xe0\x58\xd4\
+\xc3\xdf\x88\x69\x74\xbd\xfa\xf4\x97\x80\xc0\x56\x76\x53\x2f\xb5\
+\xc8\xd0\xd8\x49\x53\xc4\xd5\xd5\x55\x77\x59\x9b\x37\x6f\xa6\xa1\
+\x00\x70\x78\xac\x03\x60\x31\x91\x91\x91\xba\xcb\x50\x03\xf0\x5e\
+\xec\xd1\xcb\xee\xea\x56\xcd\xaf\xba\x0c\x1b\xf9\xae\xbc\x1f\x3e\
+\x5e\x57\x39\xd7\xaf\x5f\xd7\x96\x45\x6e\xdc\xb8\xb1\xc3\xdc\x77\
+\x4f\x4f\x4f\x09\x0a\x0a\xe2\x0f\xc0\xce\x95\x2e\x5d\x9a\x8b\x00\
+\x02\x00\x8c\x77\xe1\xc2\x05\x39\x73\xe6\x8c\xae\x32\x5c\x5c\x4a\
+\xcb\xa0\x21\xaf\xda\x6d\x1d\x9b\x07\xb4\xd0\x8e\x83\xfb\xf7\xe9\
+\x2a\x47\x2d\x0c\xe4\x48\x01\x40\xd5\x85\x9e\x0d\x00\xbf\xc5\x2b\
+\x00\xbe\xfd\x3f\x90\xd0\x17\x3a\x6b\xcb\xfb\xda\xb3\xde\xfd\x07\
+\x69\x53\x13\xf5\x50\x4b\x24\x03\x00\x01\x00\x04\x00\xf9\xdf\xf7\
+\xec\x5d\xff\xdc\xc3\xee\xeb\xa9\xa6\x07\xb6\x7b\xa6\xbd\xae\x32\
+\x4e\x9e\x3c\x29\x57\xae\x5c\xa1\xd1\x00\x20\x00\xc0\xdc\xd4\xce\
+\x77\x07\x0f\x1e\xd4\x55\x46\xd7\x6e\x3d\xc5\xb5\x5c\x39\x53\xd4\
+\xb7\x47\xef\xbe\xe2\xe4\xa4\xef\x0d\x17\xbd\x00\x00\x08\x00\x30\
+\xbd\x6d\xdb\xb6\xc9\xbd\x7b\xf7\x0a\x7d\xbe\x9a\xf6\xf7\x54\x5b\
+\xf3\x0c\x22\xf3\xf0\xf0\x94\x06\x8d\xf4\xad\x0d\xa0\xc6\x01\x00\
+\x00\x01\x00\xa6\xa6\xb6\xbd\xd5\xe3\xb1\x5a\xb5\xb5\x8d\x7e\xcc\
+\x44\xed\x44\x68\xcb\x6b\x06\x00\x04\x00\xd8\x9c\x5a\xe6\x56\xdf\
+\xc3\xb4\x95\xe9\xea\xdc\x3c\x20\x50\xd7\x6e\x84\xb7\x6e\xdd\xd2\
+\xb6\x4c\x06\x00\x02\x00\x2c\x1b\x00\xfc\x75\x7e\x9b\xb6\x05\x77\
+\x0f\x0f\x79\xb4\x56\x6d\x5d\x65\x24\x26\x26\xd2\x78\x00\x10\x00\
+\x60\xcd\x00\xa0\x36\xfc\x51\x8b\xec\x98\x51\x9d\xba\xf5\x74\x9d\
+\x1f\x1f\x1f\x4f\xe3\x01\x40\x00\x80\x79\xa9\x59\x00\x85\xff\x26\
+\xed\x69\xda\x7a\xbb\xbb\x7b\xe8\x3a\x3f\x2e\x2e\x8e\xc6\x03\x80\
+\x00\x00\x73\x4a\x49\x49\x91\xec\xec\xec\x42\x9f\xef\xe1\x69\xde\
+\x00\xe0\xa6\x33\x00\xe8\x7d\x75\x02\x00\x04\x00\xd8\x8c\xde\x87\
+\x98\x99\x7b\x00\xf4\xce\x5c\xe0\x15\x00\x00\x02\x00\x4c\x4b\xef\
+\x40\x36\x35\x98\x8e\x00\x00\x00\x04\x00\x98\x4c\xa9\x52\xa5\x74\
+\x9d\x9f\x97\x9b\x6b\xda\xba\xe7\xe5\xe6\xe9\x3a\xdf\xd9\xd9\x99\
+\x06\x04\x80\x00\x00\x73\xf2\xf1\xf1\xd1\x75\x7e\x4a\x72\xb2\x69\
+\xeb\x9e\x9a\x9a\x6c\xd3\x6b\x07\x00\x04\x00\xd8\x8c\xb7\xb7\xb7\
+\xae\xf3\x93\x93\x93\x4c\x5b\x77\x35\x00\x92\x00\x00\x00\x04\x00\
+\x4b\xaa\x50\xa1\x82\x94\x2d\x5b\xd6\x9a\x3d\x00\x04\x00\x00\x20\
+\x00\xd0\x0b\x50\xc8\x1e\x80\xa4\x9b\x92\x9f\x9f\x6f\xca\x7a\x27\
+\xdd\xbc\xa1\xeb\x7c\x02\x00\x00\x02\x00\x2c\x1b\x00\xee\xde\xbd\
+\x2b\x3f\x9d\xf9\xd1\x94\xf5\x3e\x71\xec\xa8\xcd\xae\x1b\x00\x10\
+\x00\x60\x73\x7a\xbf\xc9\x1e\x88\x8d\x35\x5d\x9d\xaf\x5d\xbd\x22\
+\xf1\x71\xd7\x0b\x7d\xbe\xda\x48\xa8\x6a\xd5\xaa\x34\x1e\x00\x04\
+\x00\x58\xb3\x07\x40\x0b\x00\xfb\xf6\x9a\xae\xce\x07\xf6\xe9\x0b\
+\x2d\x5e\x5e\x5e\x4c\x03\x04\x40\x00\x80\xb9\x05\x06\x06\xea\x3a\
+\xff\xfa\xb5\xab\x12\x77\xfd\x9a\xc9\x02\xc0\x5e\x9b\x5e\x33\x00\
+\x20\x00\xc0\xe6\x9e\x79\xe6\x19\x29\x53\xa6\x8c\xae\x32\x76\x6c\
+\x8b\x32\x4d\x7d\x2f\xfd\xe3\xa2\x9c\x3d\x73\x5a\x57\x19\x21\x21\
+\x21\x34\x1c\x00\x04\x00\x98\x9b\xab\xab\xab\xb4\x69\xd3\x46\x57\
+\x19\x5b\xbf\xdc\x22\x37\x6f\x24\x9a\xa2\xbe\x11\x2b\x96\xea\x9a\
+\xb9\xa0\x56\x4f\x6c\xdf\xbe\x3d\x0d\x07\x00\x01\x00\xe6\x17\x1a\
+\x1a\xaa\xeb\xfc\x9c\x9c\x1c\x59\xb3\xea\x6f\x76\x5f\xcf\xe3\x47\
+\x8f\xc8\xd1\xc3\x87\x74\x95\xd1\xb2\x65\x4b\x71\x73\x73\xa3\xd1\
+\x00\x20\x00\xc0\xfc\x82\x83\x83\xa5\x64\x49\x7d\xb7\x3c\x26\x7a\
+\x97\x5c\x3c\x7f\xce\x6e\xeb\xa8\xbe\xf5\xab\x6f\xff\x7a\xd1\xfd\
+\x0f\xc0\xd1\x39\x71\x09\xac\x43\x8d\x6a\x0f\x08\x08\x90\x58\x1d\
+\x53\xfa\xd4\x03\x76\xd1\x87\x73\x65\xda\xac\xb9\xe2\xe2\x52\xda\
+\xee\xea\xb8\x79\xd3\x46\xb9\x78\xe1\xbc\xee\x72\x3a\x76\xec\xe8\
+\x50\xf7\x3e\x3a\x3a\x5a\x7a\xf7\xee\xcd\x1f\x01\x0c\xf1\xe5\x97\
+\x5f\x4a\x93\x26\x4d\xb8\x10\x04\x00\x98\x89\x7a\x0d\x10\xab\x73\
+\x4e\xbf\xea\x01\x58\x30\x67\x96\x0c\x1f\x3d\xd6\xae\xea\x76\xe8\
+\xc0\x3e\x59\xb3\x72\xb9\xee\x72\xea\xd5\xab\x27\x35\x6b\xd6\x74\
+\xa8\xfb\x9e\x9b\x9b\x2b\x69\x69\x69\xfc\x01\xc0\xb0\xf6\x04\xf3\
+\xe3\x15\x80\xc5\x74\xed\xda\x55\xf7\x6c\x00\xe5\xbb\x3d\xd1\xf2\
+\xe9\xba\x4f\xec\xa6\x5e\x57\xaf\x5c\x96\xb9\x33\xa7\x19\xb2\x64\
+\xf1\x4b\x2f\xbd\x44\x43\x01\x40\x00\x80\x63\xf1\xf5\xf5\x95\xb0\
+\xb0\x30\x43\xca\x5a\xb7\x66\x95\x7c\x1f\xb3\xdb\xe6\x75\xba\x95\
+\x9a\x22\xef\x87\x4f\x90\x8c\x8c\x0c\xdd\x65\x55\xab\x56\x4d\x5e\
+\x79\xe5\x15\x1a\x0a\x00\x02\x00\x1c\xcf\xf0\xe1\xc3\x0d\x19\xe1\
+\xae\xbe\x6d\xcf\x9e\x3e\x55\x3e\xdb\xb8\xde\x66\x75\xb9\x70\xfe\
+\x9c\x8c\x78\xf3\x2f\x92\x10\x1f\x67\x48\x79\xe3\xc7\x8f\x37\xa4\
+\x87\x04\x00\x08\x00\xb0\x3b\x95\x2a\x55\x92\x11\x23\x46\x18\x52\
+\x96\x0a\x01\xab\x57\x2e\xd7\xba\xdf\x73\xb2\xb3\x8b\xb5\x1e\xdf\
+\xed\xfe\x56\xc6\x8c\x78\x4b\xdb\xad\xd0\x08\xf5\xeb\xd7\x97\xee\
+\xdd\xbb\xd3\x40\x00\x10\x00\xe0\xb8\x06\x0f\x1e\x2c\x7e\x7e\x7e\
+\x86\x95\xb7\x27\x7a\x97\x8c\x19\xf9\x96\x5c\xb9\x7c\xa9\xc8\x3f\
+\xfb\xdd\xcc\x4c\x59\xb5\x7c\x89\xcc\x9e\xf1\xbe\x64\x67\x67\x19\
+\x56\xee\x94\x29\x53\x74\x4f\x93\x04\x00\x02\x00\xec\x5a\xe9\xd2\
+\xa5\x65\xc2\x84\x09\x86\x96\x79\xfe\xdc\x59\x19\xf6\xda\x60\x59\
+\x38\x77\x96\x61\xdf\xca\x7f\x2b\x2f\x37\x57\xb6\x45\x7e\x21\x61\
+\x83\xfa\xca\xe7\x7f\xff\xd4\xd0\xb2\xd5\x2a\x89\x41\x41\x41\x34\
+\x0c\x00\x04\x00\x38\xbe\x6e\xdd\xba\x49\xc3\x86\x0d\x0d\x2d\x53\
+\xbd\x12\xd8\xf9\xf5\x57\xf2\xea\xcb\xfd\x25\x62\xc5\x32\x49\xba\
+\xa9\x3f\x08\xa8\x6f\xf9\x31\xd1\xdf\xca\xeb\x61\x2f\xcb\x92\xc5\
+\x0b\xe4\xe7\x5b\xb7\x0c\xfd\xcc\x6a\xdb\x5f\xf5\xed\x1f\x00\xac\
+\x84\x75\x00\x2c\x4c\x3d\xf8\x96\x2c\x59\xa2\x7d\xf3\xbd\x73\xe7\
+\x8e\xa1\x65\xab\xf1\x00\x9b\x37\x6d\xd0\x8e\x47\x1f\xab\x25\x01\
+\x2d\x5b\x4b\x8b\x96\xad\xa4\x9a\x5f\xf5\xfb\x3a\xff\xce\x9d\x74\
+\x39\xb4\x7f\xbf\xec\x8b\xfd\x4e\x8e\x1e\x3a\x28\x59\x59\x59\x45\
+\x76\x1d\x46\x8f\x1e\x2d\x8d\x1a\x35\xa2\x41\x00\x20\x00\xc0\x3a\
+\xd4\xa2\x37\xcb\x96\x2d\x93\x5e\xbd\x7a\x19\x32\x87\xfe\x8f\xa8\
+\x57\x03\xea\xf8\x64\xd5\x0a\xf1\xf4\xf2\x2a\x38\xaa\x88\xbb\xbb\
+\x87\xb8\xb9\xbb\x6b\x87\x5a\x51\x50\x4d\xe5\x4b\x49\x4e\x96\xd4\
+\x82\x9f\xa9\x29\x29\x72\xfd\xfa\x35\xad\xcb\xbf\xa8\x75\xee\xdc\
+\x59\x0b\x00\x00\x40\x00\x80\xe5\xa8\x75\xef\xd5\xf4\xb7\xc9\x93\
+\x27\x17\xf9\xef\x52\xaf\x04\x8c\x78\x2d\x60\x84\xc6\x8d\x1b\xcb\
+\xc7\x1f\x7f\xac\xf5\x84\x00\x80\xd5\x30\x06\x00\x1a\x35\x2d\xf0\
+\xc5\x17\x5f\xb4\x4c\x7d\xbd\xbd\xbd\x65\xfd\xfa\xf5\x52\xb6\x6c\
+\x59\x6e\x3e\x00\x02\x00\xac\x6d\xd1\xa2\x45\x96\xd8\xe0\x43\x2d\
+\xf4\xb3\x6e\xdd\x3a\x6d\x55\x44\x00\x20\x00\xc0\xf2\xd4\xb7\x61\
+\x47\x7f\x30\xaa\xee\x7e\x15\x74\x9a\x35\x6b\xc6\x0d\x07\x60\x69\
+\x8c\x01\xc0\xef\xa8\x87\xff\xce\x9d\x3b\xa5\x47\x8f\x1e\x72\xfc\
+\xf8\x71\x87\xaa\x5b\xb9\x72\xe5\xb4\x01\x8f\x6a\xcc\x83\xd5\xa8\
+\x5e\x0f\x23\x17\x7e\x82\xb5\xb9\xb8\xb8\x70\x11\x08\x00\x70\x44\
+\x0f\x3d\xf4\x90\xec\xd8\xb1\x43\x5e\x7d\xf5\x55\xf9\xec\xb3\xcf\
+\x1c\xa2\x4e\xea\xe1\xb7\x61\xc3\x06\x6d\xb9\x5f\x2b\x6a\xdd\xba\
+\xb5\x9c\x3a\x75\x8a\xc6\x0d\xe0\x57\xbc\x02\xc0\x1f\x52\xaf\x03\
+\x56\xae\x5c\x29\x63\xc7\x8e\x35\xfd\x28\xf9\x16\x2d\x5a\xc8\xee\
+\xdd\xbb\x2d\xfb\xf0\x07\x00\x02\x00\x1e\xd8\xa8\x51\xa3\x64\xf5\
+\xea\xd5\xe2\xea\xea\x6a\xca\xcf\xdf\xbb\x77\x6f\x89\x8c\x8c\x14\
+\x4f\x4f\x4f\x6e\x26\x00\x10\x00\xf0\x20\x9e\x7f\xfe\x79\xf9\xfa\
+\xeb\xaf\xa5\x56\xad\x5a\xa6\xf9\xcc\xaa\x07\x63\xfa\xf4\xe9\xb2\
+\x78\xf1\x62\xde\x57\x02\x00\x01\x00\x85\xd5\xa0\x41\x03\xd9\xb7\
+\x6f\x9f\xcc\x9f\x3f\x5f\x9b\x43\x6f\xaf\x4a\x95\x2a\x25\xfd\xfb\
+\xf7\x97\x63\xc7\x8e\xc9\x6b\xaf\xbd\xc6\x8d\x03\x00\x02\x00\xf4\
+\x72\x72\x72\x92\x01\x03\x06\x68\xb3\x03\xc6\x8d\x1b\x27\xe5\xcb\
+\x97\xb7\xab\xcf\xa7\x46\xf7\xab\x90\xf2\xe1\x87\x1f\x8a\x8f\x8f\
+\x0f\x37\x0c\x00\x08\x00\x30\x92\xea\x5e\x7f\xe7\x9d\x77\xe4\xc4\
+\x89\x13\x12\x16\x16\x26\xce\xce\xce\x36\xfd\x3c\x01\x01\x01\xda\
+\xac\x05\xb5\x86\x41\xed\xda\xb5\xb9\x41\x00\x40\x00\x40\x51\x52\
+\x03\xeb\x66\xce\x9c\x29\x47\x8e\x1c\x91\x31\x63\xc6\x14\xeb\x8e\
+\x7a\x5e\x5e\x5e\xd2\xb7\x6f\x5f\xd9\xbc\x79\xb3\x36\x3e\x41\x8d\
+\xf4\x07\x00\xdc\x3f\xd6\x01\x80\x6e\x35\x6a\xd4\xd0\x76\xd4\x53\
+\xc7\xd5\xab\x57\x25\x2a\x2a\x4a\x1b\x79\xbf\x77\xef\x5e\xc9\x35\
+\x70\x47\xbf\x47\x1e\x79\x44\xeb\xe6\x0f\x0d\x0d\x15\x7f\x7f\x7f\
+\x29\x59\x92\xfc\x0a\x00\x04\x00\xd8\x05\xb5\xe0\x8e\x7a\x2d\xa0\
+\x8e\xd4\xd4\x54\xd9\xbe\x7d\xbb\xc4\xc4\xc4\x48\x5c\x5c\x9c\x24\
+\x24\x24\x48\x7c\x7c\xbc\xf6\xbf\xff\x27\xea\x15\x83\x1a\x68\xa8\
+\xde\xe3\xab\x43\xcd\xdf\x57\x0f\xfe\x3a\x75\xea\x70\x81\x01\x80\
+\x00\x00\x7b\xe7\xe6\xe6\x26\x3d\x7b\xf6\xd4\x8e\xdf\xba\x7b\xf7\
+\xae\x24\x26\x26\x6a\x61\x40\x05\x83\xac\xac\x2c\xed\x81\xff\xcb\
+\x43\xbf\x72\xe5\xca\x5c\x3c\x00\x20\x00\xc0\xd1\xa8\x75\xe9\xd5\
+\x6b\x03\x75\x00\x00\x6c\x83\x97\xa8\x00\x00\x10\x00\x00\x00\x00\
+\x01\x00\x00\x00\x10\x00\x00\x00\x00\x01\x00\x00\x00\x10\x00\x00\
+\x00\x00\x01\x00\x00\x00\x10\x00\x00\x00\x00\x01\x00\x00\x00\x10\
+\x00\x00\x00\x00\x01\x00\x00\x00\x10\x00\x00\x00\x00\x01\x00\x00\
+\x00\x10\x00\x00\x00\x00\x01\x00\x00\x00\x10\x00\x00\x00\x00\x01\
+\x00\x00\x00\x10\x00\x00\x00\x20\x00\x00\x00\x00\x02\x00\x00\x00\
+\x20\x00\x00\x00\x00\x02\x00\x00\x00\x20\x00\x00\x00\x00\x02\x00\
+\x00\x00\x20\x00\x00\x00\x00\x02\x00\x00\x00\x20\x00\x00\x00\x00\
+\x02\x00\x00\x00\x20\x00\x00\x00\x00\x02\x00\x00\x00\x20\x00\x00\
+\x00\x00\x02\x00\x00\x00\x20\x00\x00\x00\x00\x02\x00\x00\x00\x20\
+\x00\x00\x00\x40\x00\x00\x00\x00\x04\x00\x00\x00\x40\x00\x00\x00\
+\x00\x04\x00\x00\x00\x40\x00\x00\x00\x00\x04\x00\x00\x00\x40\x00\
+\x00\x00\x00\x04\x00\x00\x00\x40\x00\x00\x00\x00\x04\x00\x00\x00\
+\x40\x00\x00\x00\x00\x04\x00\x00\x00\x40\x00\x00\x00\x00\x04\x00\
+\x00\x00\x40\x00\x00\x00\x00\x04\x00\x00\x00\x40\x00\x00\x00\x80\
+\x00\x00\x00\x00\x08\x00\x00\x00\x80\x00\x00\x00\x00\x08\x00\x00\
+\x00\x80\x00\x00\x00\x00\x08\x00\x00\x00\x80\x00\x00\x00\x00\x08\
+\x00\x00\x00\x80\x00\x00\x00\x00\x08\x00\x00\x00\x80\x00\x00\x00\
+\x00\x08\x00\x00\x00\x80\x00\x00\x00\x00\x08\x00\x00\x00\x80\x00\
+\x00\x00\x00\x08\x00\x00\x00\x80\x00\x00\x00\x00\x01\x00\x00\x00\
+\x10\x00\x00\x00\x00\x01\x00\x00\x00\x10\x00\x00\x00\x80\x03\x28\
+\x91\x9f\x9f\x6f\xdd\xca\x97\x28\xd1\xa6\xe0\xc7\xb7\x85\x3d\xdf\
+\xcb\xcb\x4b\xbc\xbd\xbd\x69\x45\x00\x60\x03\x09\x09\x09\x72\xf3\
+\xe6\x4d\x3d\x45\xb4\x2d\x78\x06\x46\x5b\xf5\xfa\x39\xd1\x84\x0a\
+\x4f\x35\x3c\x9d\x8d\x0f\x00\x00\x9b\xe0\x15\x00\x00\x00\x04\x00\
+\x00\x00\x40\x00\x00\x00\x00\x04\x00\x00\x00\x40\x00\x00\x00\x00\
+\x04\x00\x00\x00\x40\x00\x00\x00\x00\x04\x00\x00\x00\x40\x00\x00\
+\x00\x00\x04\x00\x00\x00\x40\x00\x00\x00\x00\x04\x00\x00\x00\x40\
+\x00\x00\x00\x00\x04\x00\x00\x00\xf0\xa0\xfe\x07\xf3\x68\xaf\x3a\
+\xf4\x7d\x68\x6c\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\
+\x00\x00\x05\x0b\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x03\x00\x00\x00\xc3\xa6\x24\xc8\
+\x00\x00\x00\x03\x73\x42\x49\x54\x08\x08\x08\xdb\xe1\x4f\xe0\x00\
+\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\x95\x00\x00\x0e\x95\x01\
+\xf1\x59\xb9\x5c\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\
+\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\x70\
+\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\x5a\x50\x4c\x54\
+\x45\xff\xff\xff\x00\x00\x00\x00\x00\x00\x07\x07\x07\x15\x15\x15\
+\x25\x25\x25\x2d\x2d\x2d\x34\x34\x34\x3c\x3c\x3c\x5a\x5a\x5a\x62\
+\x62\x62\x71\x71\x71\x88\x88\x88\x97\x97\x97\xbd\xbd\xbd\xbf\xbf\
+\xbf\xc5\xc5\xc5\xc7\xc7\xc7\xc9\xc9\xc9\xca\xca\xca\xcc\xcc\xcc\
+\xd1\xd1\xd1\xd3\xd3\xd3\xdb\xdb\xdb\xde\xde\xde\xe3\xe3\xe3\xe7\
+\xe7\xe7\xea\xea\xea\xef\xef\xef\xf2\xf2\xf2\x77\x1b\x1f\xd2\x00\
+\x00\x00\x02\x74\x52\x4e\x53\x00\x40\x00\x4f\x8c\xa8\x00\x00\x04\
+\x15\x49\x44\x41\x54\x78\xda\xed\xdd\x5b\x4a\xc3\x50\x14\x86\xd1\
+\x26\x29\xbd\x48\x2f\x08\x42\x05\xe7\x3f\x34\x05\x15\xc5\xb6\x34\
+\x35\xa6\x44\x47\xb0\x43\xa1\x3d\xd8\x70\xd6\x1a\x40\x1e\x76\x3e\
+\xf2\x3f\xa6\x1c\x5d\xa6\x28\xf9\x57\xc5\x85\x2f\xb0\x1c\x91\x35\
+\x01\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\
+\x01\x20\x00\x04\x80\x00\xce\x7f\xde\x98\xa4\xca\x1b\x0f\x60\xba\
+\x21\xa9\xa9\x09\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x40\x00\
+\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\x02\xb8\x82\xed\x33\xa1\xad\x2f\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\x01\x20\x00\x06\x1b\x40\xe5\xf7\xaf\xb1\x2a\x83\x00\x16\
+\x7e\xff\x1a\x5b\x98\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\
+\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\
+\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x02\x70\x02\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x20\x99\xc3\x1b\xa1\x43\x06\x01\x9c\x5a\x42\x27\x13\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x08\x80\xc1\x06\xb0\x7e\x22\xb4\xf6\x05\x40\x00\x08\x00\
+\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\
+\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x08\x00\x01\x20\x00\x04\x20\x00\x27\x10\x00\x02\x40\x00\
+\x08\x00\x01\x20\x00\x04\x80\x00\x92\x69\x3e\x08\x35\x19\x04\xf0\
+\x4d\x0f\x13\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\
+\x80\x00\x10\x00\x02\x40\x00\x08\x80\xc1\x06\xb0\xa0\x47\x06\x01\
+\x54\x6b\x42\x95\x09\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\
+\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\
+\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\
+\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\
+\x04\x20\x00\x27\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x90\
+\x52\xfb\x45\xa8\xcd\x20\x80\xfa\x40\xa8\x36\x01\x08\x00\x01\x20\
+\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\
+\x00\x18\x6c\x00\xf3\x3b\x42\xf3\x0c\x02\x98\xdc\x13\x9a\x98\x00\
+\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x02\x70\x02\x01\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x29\x75\x47\x42\x5d\x06\
+\x01\xec\x3f\x09\xed\x4d\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\
+\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x06\x1b\xc0\x94\
+\x1e\x19\x04\x30\x7b\x20\x34\x33\x01\x08\x00\x01\x20\x00\x04\x80\
+\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\
+\x20\x00\x04\x80\x00\x04\xe0\x04\x02\x40\x00\x08\x00\x01\x20\x00\
+\x04\x80\x00\x10\x40\x32\xbb\x17\x42\xbb\x0c\x02\xf8\xa5\x87\x09\
+\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x86\x1c\x40\x59\x11\x2a\x33\x08\x60\xf9\x48\x68\
+\x69\x02\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\
+\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\
+\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\
+\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x08\xc0\
+\x09\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x80\x64\xea\
+\x77\x42\x75\x06\x01\xb4\x3f\x84\x5a\x13\x80\x00\x10\x00\x02\x40\
+\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x80\
+\xc1\x06\xb0\xda\x10\x5a\x65\x10\x40\x31\x26\x54\x98\x00\x04\x80\
+\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x02\x70\x02\x01\x20\x80\
+\xab\x69\x5e\x49\xaa\xb9\xf1\x00\xba\x13\x49\x75\x26\x00\x01\x20\
+\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\
+\x00\x10\x00\x67\xf9\x03\x06\x0d\x52\x02\xaf\x99\xe9\xc9\x00\x00\
+\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x35\x68\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\x9d\x00\x00\x0e\x9d\
+\x01\xd5\xd3\xb1\x39\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x34\xe5\x49\x44\
+\x41\x54\x78\xda\xed\xdd\x09\x74\x9c\x67\x7d\xef\xf1\xff\x48\xd6\
+\x66\xc9\x92\xbc\xc6\xda\x67\xb4\x79\xcb\x52\x12\x12\x28\x49\x68\
+\x21\x71\x7a\xc8\xed\x72\x1a\x92\xb4\x2c\x29\x04\x4a\xcb\xe9\xe5\
+\x50\xc2\x52\xba\x5c\xe8\x81\xb4\x14\x0a\x69\xb8\xdc\xde\x53\x5a\
+\x5a\x02\x84\xa5\x24\x21\x3d\x87\x7b\xcb\x12\x13\xe2\x35\xd0\x38\
+\xe1\x12\x5b\xe3\x45\x92\x2d\x59\x9a\xd1\xea\x45\xd6\xbe\xcf\x7d\
+\x9e\xd1\xd8\x91\xd7\xc8\xef\xf3\xce\x78\x9e\xf7\xf9\x7e\x7a\xde\
+\x8e\xb1\xf3\x8e\x66\xde\x79\xed\xff\x6f\x9e\xf7\x7d\xfe\x4f\x28\
+\x91\x48\x88\x4b\x42\xa1\x50\xa5\x7a\x68\x56\xdb\x86\xd4\xa3\xfe\
+\xdf\x2b\x2e\xb2\x95\xaa\xad\x48\x00\x00\x36\x9b\x50\xdb\xb0\xda\
+\x46\x2e\xb2\xf5\xa8\xad\x55\x6d\x87\xf5\xa3\xaa\x87\x3d\x4e\xd5\
+\xc3\xa0\x06\x00\x55\xe8\x73\xd4\xc3\x0d\x6a\xbb\x43\x6d\x37\x2e\
+\x2a\xf8\x25\xfc\x7d\x00\x00\x5c\xc4\xe8\xa2\x40\xf0\x0b\xb5\x3d\
+\xab\xb6\x97\x55\x9d\x9c\x27\x00\x64\x7f\xd1\x6f\x4e\x15\xfc\x37\
+\xab\xed\x4d\x6a\x5b\xcd\xf9\x0c\x00\x30\x70\x42\x6d\xcf\xa9\xed\
+\xa7\x3a\x10\xa8\x9a\xd9\x4a\x00\xc8\x9e\xa2\x7f\x93\x7a\x78\x40\
+\x6d\xf7\xa8\xad\x86\x73\x15\x00\x90\x46\xdd\x6a\x7b\x5a\x6d\x8f\
+\xab\xfa\xf9\x12\x01\x20\xf3\x45\xbf\x56\x3d\xbc\x23\x55\xf8\x37\
+\x71\x3e\x02\x00\xae\x82\x83\x3a\x08\xa8\xed\x5b\xaa\x96\x76\x11\
+\x00\xd2\x57\xf4\x97\xa9\x87\xb7\xa9\xed\x3d\x6a\xfb\x35\xfd\x5b\
+\x9c\x7b\x00\x80\x2c\xa0\x0b\xe9\x0e\xb5\x7d\x55\x6d\xdf\x51\x75\
+\x75\x96\x00\xe0\x4f\xe1\x2f\x50\x0f\xef\x56\xdb\x9f\xab\x2d\xcc\
+\x79\x06\x00\xc8\x62\x9d\x6a\xfb\xac\xda\xbe\xa6\xea\xeb\x14\x01\
+\xc0\x5b\xe1\xd7\x53\xf0\xfe\x48\x6d\x1f\x53\x5b\x15\xe7\x14\x00\
+\xc0\x22\x71\xb5\x7d\x5e\x6d\xff\xa2\xea\xec\x04\x01\x60\xe9\xdf\
+\xf8\x3f\xa8\xb6\x8f\xaa\x6d\x1d\xe7\x10\x00\xc0\x62\x03\x6a\xfb\
+\x82\xda\xbe\x94\x6d\x23\x02\x59\x15\x00\x54\xf1\xbf\x4b\x3d\xfc\
+\xa3\xda\x9a\x38\x67\x00\x00\x01\xd2\xa6\xb6\x0f\xa8\x9a\xfb\x4c\
+\xb6\xbc\xa0\x9c\x2c\x29\xfc\xd5\x6a\x7b\x52\xfd\xf2\xc7\x14\x7f\
+\x00\x40\x00\xe9\xda\xf6\x63\x5d\xeb\x74\xcd\x73\x3e\x00\xe8\x3b\
+\xfb\xd5\xa6\x87\xfa\xf5\x54\x8a\x7b\x39\x3f\x00\x00\x01\xa7\x6b\
+\xdd\x41\x5d\xfb\x52\xb3\xdb\xae\x5e\x0d\xbe\x5a\x97\x00\xd4\x1b\
+\xdf\xa8\x1e\xbe\xab\xb6\xeb\x39\x1f\x00\x00\x0e\xda\xa7\xb6\xdf\
+\x53\x75\xf8\x90\x33\x23\x00\xaa\xf8\xbf\x53\x3d\xbc\x48\xf1\x07\
+\x00\x38\x4c\xd7\xc0\x17\x53\x35\x31\xd8\x01\x40\x4f\xed\x53\xdb\
+\xbf\xc9\x42\xe7\xa4\x62\x3e\x7b\x00\x80\xe3\x74\x2d\x7c\x5c\xd7\
+\xc6\xd4\xf4\xf7\xcc\xd5\xe4\x4c\x5d\x02\x50\x6f\x4c\xb7\xec\x7d\
+\x42\x6d\xd7\x66\xf3\x27\x91\x97\x97\x27\xcb\x8b\x8b\xa5\xa4\xa4\
+\x44\x0a\x0b\x0b\x39\x35\x01\xc0\x62\x93\x93\x93\x32\x3a\x3a\x2a\
+\xe3\x63\x63\x32\x33\x33\x93\xed\x2f\xb7\x45\x6d\xf7\xab\xba\x7c\
+\x30\x30\x01\x40\x15\xff\xdf\x56\x0f\xdf\xce\x86\x6f\xfd\x6b\xd7\
+\xae\x95\xc6\xa6\x66\x69\x68\x6c\x94\x46\xbd\x35\x37\x49\xa4\xbe\
+\x41\xca\xcb\xca\xa4\x64\x45\x89\xe4\xe7\x17\xf0\x37\x06\x00\x02\
+\x68\x7a\x7a\x4a\x46\x47\x46\x65\xe8\xf4\x69\xe9\x38\x7a\x44\xda\
+\x5b\xdb\xa4\xbd\xbd\x5d\x8e\xa8\xad\xbd\xad\x55\x06\x07\x07\xb3\
+\xe1\x65\x8e\xa9\xed\xed\xaa\x36\x7f\xdf\xfa\x00\xa0\x8a\xff\x83\
+\xea\xe1\x2b\x6a\xcb\xbd\x1a\x47\x72\xfd\xfa\xf5\x72\xeb\xed\x6f\
+\x94\xdb\x6e\xbf\x3d\xb9\x55\xd7\xb0\x60\x20\x00\xe0\x42\xb1\xee\
+\x6e\xd9\xbd\x6b\x57\x72\xdb\xb3\x6b\xa7\xf4\xf5\xf5\x5d\xad\x97\
+\x32\xa7\xb6\xf7\xa9\xfa\xfc\x98\xb5\x01\x40\x15\xff\x3f\x53\x0f\
+\x9f\xcb\xf4\x91\xdb\x72\xed\x75\x72\xdf\xfd\xf7\xcb\x1d\x5b\xb7\
+\xaa\x6f\xfb\xb4\x15\x00\x00\x5c\xb9\xf6\xb6\x36\x79\x76\xdb\x36\
+\x79\xf2\x89\x27\x24\xda\xb2\xff\x6a\xbc\x84\x8f\xab\x1a\xfd\xf7\
+\x56\x05\x00\x55\xf8\xf5\x4a\x7d\xba\x07\xf2\x47\x32\xf6\x4d\xbf\
+\xa2\x42\xde\x7a\xef\x7d\x72\xaf\x2a\xfc\x1b\x37\xb1\x42\x30\x00\
+\xc0\x3f\x87\x0e\x1e\x94\xa7\x54\x10\xf8\xde\x53\x4f\x4a\x5f\x6f\
+\x6f\x26\x7f\xf4\x23\x6a\xfb\x58\x22\x0d\xc5\xda\xf7\x00\x90\x6a\
+\x6c\xa0\xef\xf4\xff\x83\x4c\x1c\x99\xd7\xde\x7c\xb3\x7c\xf0\xa1\
+\x87\xe4\x8e\x3b\xb7\x4a\x4e\x4e\x0e\x67\x29\x00\x20\x6d\xe6\xe7\
+\xe7\xe5\xd9\x9f\x6c\x93\x2f\x3d\xfa\xa8\xbc\xb8\x77\x6f\xa6\x7e\
+\xec\x37\xd4\xf6\x5e\xbf\x97\x19\xf6\x35\x00\xa4\xbe\xf9\x7f\x2d\
+\x13\xc5\xff\xd6\xdb\x6e\x93\x0f\x7d\xe4\xa3\xc9\xeb\xfa\x00\x00\
+\x64\x9a\xbe\x57\xe0\x8b\x8f\x7c\x41\xf6\xec\xde\x9d\xa9\x10\xf0\
+\x6e\x3f\x47\x02\xfc\x0e\x00\x7a\xc5\xa3\xb4\x0e\xfb\xbf\xfe\x57\
+\xdf\x20\x7f\xf9\x89\x4f\xc8\xcd\xb7\xdc\xc2\xd9\x07\x00\xb8\xea\
+\xf6\xbe\xf0\x82\x7c\xe6\xe1\x87\xe5\xe7\x3f\x7b\x3e\xdd\x3f\xea\
+\x11\x55\xb3\x3f\x9a\x75\x01\x20\xdd\x37\xfc\xe9\xe9\x7b\x9f\xfc\
+\xd4\xa7\x93\xd7\xf8\x01\x00\xc8\x36\xfa\x1e\x81\x4f\xff\xf5\x27\
+\xd3\x3d\x9d\xd0\xb7\x1b\x03\x7d\x09\x00\xa9\xa9\x7e\x5f\x4d\xc7\
+\x3b\xcd\xcd\xcd\x95\x77\x3d\xf8\xa0\x7c\xfc\x2f\xff\x4a\x4a\x4b\
+\x4b\x39\xc3\x00\x00\x59\x6b\x78\x78\x58\x3e\xf7\x99\xbf\x95\xaf\
+\x3f\xf6\x98\xcc\xcd\xcd\xa5\xeb\xc7\xbc\xc7\x8f\x29\x82\xc6\x01\
+\x20\xd5\xe4\xe7\x69\x49\xc3\x3c\xff\xfa\x86\x06\xf9\xf2\x57\xfe\
+\x55\xae\xbb\x9e\x25\x03\x00\x00\xf6\xd8\xbf\x6f\x9f\xbc\xff\x7d\
+\x7f\x28\x47\x8f\x1c\x49\xc7\xd3\xeb\x64\x71\x8f\x69\xb3\x20\xa3\
+\xdb\xe6\x53\xed\x7d\xbf\x9d\x8e\xe2\x7f\xcf\x5b\xef\x95\x67\x7e\
+\xfa\x1c\xc5\x1f\x00\x60\x1d\x5d\xbb\x74\x0d\xd3\xb5\x2c\x0d\x74\
+\xcd\xfd\x76\xaa\x06\x67\x7e\x04\x20\xb5\x68\xc1\x0b\xe2\x73\x6f\
+\xff\x82\x82\x02\xf9\x9b\xbf\xfb\x3b\x79\xe7\x1f\xbc\x8b\x33\x08\
+\x00\x60\xbd\x6f\x7e\xe3\xeb\xf2\x3f\xfe\xe2\x2f\x64\x6a\x6a\xca\
+\xef\xa7\xd6\x6b\x07\xdc\xa2\xea\xf8\x44\xa6\x03\x80\x9e\xeb\xff\
+\x1e\x3f\xdf\x89\x6e\xd3\xfb\xf5\x6f\x7e\x4b\x36\x6f\xd9\xc2\x19\
+\x03\x00\x08\x8c\x03\xd1\xa8\xbc\xeb\x9d\xef\x48\xb6\x1b\xf6\xd9\
+\x57\x55\x1d\x7f\x6f\xc6\x02\x40\x6a\xed\xe2\xc7\xfd\x7c\x07\x1b\
+\x36\x6e\x94\x7f\x7f\xf2\xa9\x64\x47\x3f\x00\x00\x82\x46\x77\x10\
+\xfc\xfd\xfb\xee\x95\xc3\x87\x0e\xf9\xfd\xd4\x0f\xa8\x5a\xfe\xcd\
+\xb4\x07\x00\x55\xfc\x37\xaa\x87\x17\xc5\xc7\x95\xfd\xf4\x9c\xfe\
+\xc7\xbf\xfd\x1d\x29\x2b\x2f\xe7\x0c\x01\x00\x04\xd6\xe9\xa1\x21\
+\x79\xe0\xed\x6f\x4b\xf6\x0e\xf0\x91\x5e\x41\xf0\xb5\xaa\x9e\x5f\
+\x51\xb2\xb8\xa2\x9b\x00\x53\x6d\x7e\xbf\xeb\x67\xf1\xbf\x73\xeb\
+\x5d\xf2\xc4\xd3\xff\x41\xf1\x07\x00\x04\x9e\xae\x75\xba\xe6\xe9\
+\xda\xe7\x23\x5d\x93\xbf\x9b\xaa\xd1\xe9\x09\x00\xca\x87\xd4\xe6\
+\xdb\x6d\xf9\xfa\x00\x3c\xf6\xf8\xe3\x52\x58\x58\xc8\x59\x01\x00\
+\x70\x82\xae\x79\xba\xf6\xf9\x1c\x02\xae\x4f\xd5\xe8\xa5\x7f\xa9\
+\x5f\xea\x25\x00\x95\x2c\xaa\xd5\xc3\x41\xb5\x95\xf8\xf1\x4a\xf5\
+\xb0\xbf\x4e\x41\x14\x7f\x00\x80\x8b\x26\x27\x27\xe5\xfe\x7b\x7e\
+\xd7\xcf\xcb\x01\xa3\x6a\xdb\xa4\xea\x7a\xcc\xef\x11\x80\x47\xfd\
+\x2a\xfe\xfa\x86\x3f\x7d\xcd\x9f\xe2\x0f\x00\x70\x79\x24\x40\xd7\
+\x42\x5d\x13\x7d\x52\x92\xaa\xd5\xfe\x8d\x00\xa8\x6f\xff\x7a\x9c\
+\xe2\xc7\x7e\xbc\x3a\x3d\xd5\xef\xff\xfc\xe0\x87\xdc\xed\x0f\x00\
+\x80\x2c\xcc\x0e\xf8\xad\xbb\xdf\xe2\xe7\x14\xc1\xdf\x50\xb5\xfd\
+\x19\xe3\x00\xa0\x8a\x7f\x81\x7a\xd8\xaf\xb6\x26\xd3\x57\xa4\x9b\
+\xfc\xfc\xe0\x99\x6d\xcc\xf3\x07\x00\x60\x11\xdd\x27\xe0\xee\xbb\
+\xb6\xfa\xd5\x2c\xa8\x4d\x6d\xd7\xa9\xfa\x7e\xd9\x27\x5b\xca\x25\
+\x80\x0f\xfa\x51\xfc\x35\xdd\xe1\x8f\xe2\x0f\x00\xc0\xb9\x74\x6d\
+\xd4\x35\xd2\x27\x4d\xa9\xda\xed\x7d\x04\x20\xd5\xee\xb7\x53\x6d\
+\xeb\x4c\x5f\x8d\xee\x87\xfc\xbf\xff\xf9\x9f\xf9\x94\x01\x00\xb8\
+\x84\xff\xfe\xc7\x7f\x2c\x4f\x7f\xef\x29\x3f\x9e\x6a\x40\x6d\xe1\
+\xcb\xb5\x09\x7e\xb5\x00\xf0\xa7\xea\xe1\x8b\xa6\xaf\x42\xaf\xea\
+\xa7\x17\x45\x28\x2e\x2e\xe6\xd3\x05\x00\xe0\x12\xc6\xc6\xc6\xe4\
+\xae\x37\xbf\xc9\xaf\x55\x04\x3f\xa4\x6a\xfc\xff\xbc\xe2\x00\x90\
+\xba\xf6\xaf\x5f\x41\x95\xc9\x4f\xcf\xcd\xcd\x95\x1f\x6e\xfb\x09\
+\xab\xfa\x01\x00\xb0\x04\x7a\x29\xe1\xb7\x6c\xbd\x53\xe6\xe6\xe6\
+\x4c\x9f\x2a\xae\xb6\x86\x4b\xdd\x0b\x70\xb9\x7b\x00\xde\x6d\x5a\
+\xfc\xb5\x77\x3d\xf8\x20\xc5\x1f\x00\x80\x25\xd2\x35\x53\xd7\x4e\
+\x1f\x54\xa5\x6a\xf9\xd2\x47\x00\x52\xed\x04\xf5\x5d\x84\x61\x93\
+\x9f\xbc\x76\xed\x5a\xd9\xfd\x5f\x2f\x48\x69\x69\x29\x9f\x28\x00\
+\x00\x4b\x34\x3c\x3c\x2c\xb7\xbd\xee\x16\x19\x1c\x1c\x34\x7d\xaa\
+\x4e\xb5\x35\xa9\x5a\x3f\xbb\xd4\x11\x80\xb7\x99\x16\x7f\xed\x93\
+\x9f\xfa\x34\xc5\x1f\x00\x80\x2b\xa4\x6b\xa7\xae\xa1\x3e\x08\xa7\
+\x6a\xba\x2c\x35\x00\xbc\xc7\xf4\x27\xbe\xfe\x57\xdf\x20\xf7\xde\
+\x7f\x3f\x9f\x22\x00\x00\x1e\xe8\x1a\xaa\x6b\xa9\x0f\x2e\x5a\xd3\
+\x2f\xb8\x04\x10\x0a\x85\x6a\x53\x43\x06\x21\x93\x9f\xf6\xfd\x1f\
+\xfc\x30\xd9\xef\x1f\x00\x00\x78\xa3\xd7\x09\xf8\xed\xbb\xdf\x62\
+\xfa\x34\xba\xd0\xeb\x29\x81\x5d\xaf\x36\x02\xf0\x0e\xd3\xe2\x7f\
+\xeb\x6d\xb7\x51\xfc\x01\x00\x30\xa4\x6b\xa9\xae\xa9\x86\x42\xa9\
+\xda\x2e\xaf\x16\x00\x1e\x30\xfd\x49\x1f\xfa\xc8\x47\xf9\xd4\x00\
+\x00\xf0\x81\x4f\x35\xf5\x81\xcb\x06\x80\x50\x28\x74\x93\x7a\xd8\
+\x64\xf2\x13\x5e\x7b\xf3\xcd\x72\xdb\xed\xb7\xf3\x89\x01\x00\xe0\
+\x03\x5d\x53\x75\x6d\x35\xb4\x29\x55\xe3\x2f\x39\x02\x60\xfc\xed\
+\xff\x83\x0f\x3d\xc4\xa7\x05\x00\x80\x8f\x7c\xaa\xad\xe7\xd4\xf8\
+\x73\x6e\x02\x54\xe9\x40\xdf\x20\x50\xe3\xf5\x99\xf5\x12\xbf\x2f\
+\xbd\xbc\x4f\x72\x72\x72\xf8\xb4\x00\x00\xf0\xc9\xfc\xfc\xbc\xdc\
+\x74\xc3\xf5\xc9\xa5\x83\x0d\x74\xab\x9a\x5f\x7b\xc1\x08\x80\x2a\
+\xfe\xcd\x26\xc5\x5f\x7b\xeb\xbd\xf7\x51\xfc\x01\x00\xf0\x99\xae\
+\xad\xba\xc6\x1a\xaa\x49\xd5\xfa\x73\x03\x80\x72\x87\xe9\x33\x33\
+\xef\x1f\x00\x80\xf4\xf0\xa9\xc6\xde\xe1\x7b\x00\xd8\x72\xed\x75\
+\xb2\x71\xd3\x26\x3e\x21\x00\x00\xd2\x40\xd7\x58\x5d\x6b\x0d\xbd\
+\xf9\x9c\x00\x10\x0a\x85\xf4\xe3\xaf\x9b\x3c\xe3\x7d\x7c\xfb\x07\
+\x00\x20\xad\x7c\xa8\xb5\x6f\x4a\xd5\xfc\xb3\x23\x00\x37\xa8\x6d\
+\xb5\xc9\x33\xde\xb1\x75\x2b\x9f\x0c\x00\x00\x69\xe4\x43\xad\x5d\
+\x9d\xaa\xf9\x67\x03\x80\xd1\xf0\xff\xfa\xf5\xeb\xa5\xb1\xa9\x89\
+\x4f\x06\x00\x80\x34\xd2\xb5\x56\xd7\x5c\xd3\x1c\xb1\x38\x00\xdc\
+\x68\xf2\x4c\xb7\xde\xfe\x46\x3e\x15\x00\x00\x32\xc0\x87\x9a\x7b\
+\xe3\xe2\x00\xb0\xc1\xe4\x99\xe8\xfc\x07\x00\x40\x66\xf8\x50\x73\
+\x37\x2c\x0e\x00\xcd\x04\x00\x00\x00\x9c\x08\x00\xc9\x9a\x9f\x13\
+\x0a\x85\x2a\xd5\x63\x89\xd7\x67\x59\xbb\x76\xad\x54\xd7\xd4\xf0\
+\x89\x00\x00\x90\x01\xba\xe6\xea\xda\x6b\xa0\x44\xd7\xfe\x1c\xd3\
+\x6f\xff\x8d\x4d\xcd\x7c\x1a\x00\x00\x64\x90\x0f\xb5\xb7\x59\x07\
+\x00\xa3\xeb\xff\x0d\x8d\x8d\x7c\x12\x00\x00\x64\x90\x0f\xb5\x77\
+\xc3\x32\xe3\x11\x00\x02\x00\x2c\xf0\xe3\x1f\xfd\x48\xfe\xe3\x7b\
+\x4f\x71\x20\x10\x48\xb9\x39\xb9\xf2\xbf\xfe\xe9\x9f\x58\x8b\xc5\
+\xa5\x11\x00\xf3\xda\xdb\xac\x03\x40\xa5\xd1\x8b\x68\x66\xfe\x3f\
+\xb2\xdf\xbf\x7f\xeb\x9b\xf2\xa3\x1f\xfe\x90\x03\x81\x40\xaa\xaf\
+\xaf\xa7\xf8\xbb\x16\x00\xcc\x6b\x6f\xf2\x1e\x80\x15\x26\xcf\x10\
+\xa9\x6f\xe0\x93\x40\x56\x9b\x9d\x9d\x95\xdd\xbb\x76\x71\x20\x10\
+\x58\x9b\xaf\xbd\x96\x83\xe0\x18\x1f\x6a\xef\x0a\xe3\x00\x50\x5e\
+\x56\xc6\x27\x81\xac\xf6\x8b\x17\x5f\x94\xd1\xd1\x51\x0e\x04\x82\
+\x1b\x00\x36\x6f\xe1\x20\x38\xc6\x87\xda\x6b\x1e\x00\x4a\x56\x94\
+\xf0\x49\x20\xab\x6d\xdf\xfe\x1c\x07\x01\x8c\x00\x20\x50\x7c\xa8\
+\xbd\x66\x01\x20\x2f\x2f\x4f\xf2\xf3\x0b\xf8\x24\x90\xd5\x76\x3c\
+\x47\x00\x40\xb0\x6d\xd9\xc2\x08\x80\x6b\x74\xed\xd5\x35\xf8\xaa\
+\x05\x80\xe5\xc5\xc5\x7c\x0a\xc8\x6a\xa7\x87\x86\xe4\xe5\x5f\xfe\
+\x92\x03\x81\xc0\x2a\x2d\x2d\xa5\x19\x9b\xa3\x0c\x6b\x70\x32\x00\
+\x94\x7a\xdd\xbb\xa4\x84\xe1\x7f\x64\xb7\x5d\x3b\x77\xca\xdc\xdc\
+\x1c\x07\x02\x81\xb5\x89\xeb\xff\xce\x32\xac\xc1\xa5\x3a\x00\x14\
+\x79\xdd\xbb\xb0\xb0\x90\x4f\x00\x59\x6d\x3b\xc3\xff\x08\xb8\xcd\
+\x5b\x36\x73\x10\x1c\x65\x58\x83\x8b\x98\x38\x8a\x40\xdb\xb9\x63\
+\x3b\x07\x01\x81\xb6\x85\x1b\x00\xe1\x11\x01\x00\x81\x75\xf4\xe8\
+\x51\xe9\xee\xea\xe2\x40\x20\xd0\xb8\x04\x00\x02\x00\x70\x1e\xee\
+\xfe\x47\xe0\xff\x01\xcf\xc9\x51\x01\x80\x4b\x00\x20\x00\x00\xe7\
+\x05\x80\x9f\x72\x10\x10\x68\xe1\x70\x58\x8a\x8a\x8a\x38\x10\x20\
+\x00\x00\x67\xcc\xcc\xcc\xc8\x9e\xdd\xbb\x39\x10\x08\x34\x1a\x00\
+\x81\x00\x00\x9c\xe7\x17\x2f\xd1\xfe\x17\x0e\x04\x00\xae\xff\x83\
+\x00\x00\x9c\x8b\xe9\x7f\x60\x04\x00\xb8\xbc\x65\x1c\x02\x04\x91\
+\xe9\x0d\x80\xaf\x7f\xc3\xad\x72\xff\xdb\x1f\xe0\x40\x22\x6d\x12\
+\xf3\xf3\xf2\xf1\x0f\x7f\x30\xb9\x5a\xa5\x57\xb4\x00\x06\x01\x00\
+\x58\xc4\x8f\xf6\xbf\xaf\x7f\xc3\xed\x2c\x75\x8d\xb4\xea\xed\x89\
+\x1b\x15\x7f\x5a\x00\xc3\x14\x97\x00\x10\x38\x3b\x77\xec\x90\x79\
+\xf5\xed\xca\xab\x50\x28\x24\x37\xdc\x78\x23\x07\x12\x69\xd5\xd9\
+\x71\xd4\x68\x7f\xe6\xff\x83\x00\x00\x9c\x67\xc7\xf6\xed\x46\xfb\
+\xd7\x45\x22\x52\x5e\xbe\x92\x03\x89\xf4\x06\x80\xa3\x66\x01\x80\
+\x16\xc0\x20\x00\x00\x17\x04\x00\xb3\xeb\xff\xbf\x72\xe3\x6b\x39\
+\x88\xc8\xc0\x08\xc0\x11\xa3\xfd\x69\x01\x0c\x02\x00\xb0\xc8\xd1\
+\x23\x47\x24\xd6\xdd\x6d\x16\x00\x5e\x73\x13\x07\x12\x19\x08\x00\
+\x5c\x02\x00\x01\x00\xf0\x8d\xe9\xf4\xbf\xfc\xfc\x02\xd9\xbc\x85\
+\x6f\x56\x48\xaf\xf1\xb1\x31\x19\xe8\xef\xf7\xfe\x0f\x37\x2d\x80\
+\x41\x00\x00\xce\x65\x3a\xfd\x4f\xcf\xab\xce\xcb\xcf\xe7\x40\x22\
+\xab\xbf\xfd\xd3\x02\x18\x04\x00\x60\x91\x85\xf6\xbf\xbb\x8c\x9e\
+\x83\xeb\xff\xc8\x84\x63\x9d\x1d\xc6\x41\x15\x20\x00\x00\x29\x2f\
+\xbd\xb8\x57\xc6\xc6\xc6\x0c\x03\x00\xd7\xff\x91\x7e\x1d\x47\xcd\
+\x6e\x00\xa4\x05\x30\x08\x00\xc0\x22\xa6\xd7\xff\x57\xae\x5a\x25\
+\x75\xe1\x08\x07\x12\x69\x67\x7a\x09\x80\x11\x00\x10\x00\x80\x45\
+\x4c\xaf\xff\x73\xf7\x3f\x32\x21\x91\x48\x48\x97\xe1\x25\x00\x5a\
+\x00\x83\x00\x00\xa4\x0c\x9d\x3a\x25\xfb\x5e\x7e\xd9\xe8\x39\x6e\
+\x20\x00\x20\x03\x74\x0b\xe0\xa9\xa9\x29\xcf\xfb\xd3\x02\x18\x04\
+\x00\x60\x91\x5d\x3b\x77\xd2\xfe\x17\x56\x30\xed\x00\xc8\xfc\x7f\
+\x10\x00\x80\x45\x4c\xbb\xff\xd1\xfe\x17\x19\x0b\x00\x9d\xb4\x00\
+\x06\x01\x00\xf0\x8d\xe9\x0d\x80\x4c\xff\x43\xe6\x46\x00\x68\x01\
+\x0c\x02\x00\xe0\x8b\x23\xed\xed\x12\x8f\xc5\xcc\x02\x00\xd7\xff\
+\x91\xa9\x00\xd0\x61\x76\x03\x20\x97\x00\x40\x00\x00\x7c\xfa\xf6\
+\x4f\xfb\x5f\x64\xca\xd8\xd8\xa8\x0c\x0e\xd0\x02\x18\x04\x00\xc0\
+\x17\xb4\xff\x85\x2b\xdf\xfe\x69\x01\x0c\x02\x00\x90\xa2\xdb\xff\
+\x3e\xbf\x67\xb7\xd1\x73\x70\xfd\x1f\x99\x72\x8c\x06\x40\x20\x00\
+\x00\xfe\x78\x71\xef\x0b\xb4\xff\x85\x3d\x23\x00\xb4\x00\x06\x01\
+\x00\xf0\xc7\x0e\xda\xff\xc2\x22\x1d\x8c\x00\x80\x00\x00\xf8\x63\
+\x3b\xed\x7f\x61\x89\x85\x16\xc0\x9d\x46\xcf\x41\x0b\x60\x10\x00\
+\x00\xe5\xd4\xc9\x93\xb2\x7f\xdf\x3e\xb3\x00\xc0\xf0\x3f\x32\xa4\
+\x27\x1e\x93\xe9\x69\x5a\x00\x83\x00\x00\x18\xf3\xa3\xfd\xef\xf5\
+\xaf\xa1\xfd\x2f\x32\xc3\x74\x05\x40\xe6\xff\x83\x00\x00\xa4\xd0\
+\xfe\x17\x2e\x05\x00\x5a\x00\x83\x00\x00\xa4\xd0\xfe\x17\x56\x05\
+\x00\xc3\x45\x80\x68\x01\x0c\x02\x00\xa0\xb4\xb7\xb5\x49\x4f\x3c\
+\x6e\x16\x00\xb8\x01\x10\x19\x1d\x01\x30\x9b\x02\xc8\x25\x00\x10\
+\x00\x00\xa1\xfd\x2f\xec\x32\x3a\x3a\x2a\xc7\x07\x07\xbd\xff\x43\
+\x4d\x0b\x60\x10\x00\x80\x05\xa6\xf3\xff\xb7\x5c\x77\x1d\xed\x7f\
+\x91\x31\xa6\x1d\x00\x69\x01\x0c\x02\x00\xa0\xcc\x4c\x4f\x1b\xb7\
+\xff\xbd\x81\xe1\x7f\x64\x90\x71\x07\x40\xae\xff\x83\x00\x00\x88\
+\xec\xdd\xbb\x57\xc6\xc7\xc7\x8d\x9e\x83\xf9\xff\xc8\x68\x00\xe8\
+\x34\x5b\x04\x88\x16\xc0\x20\x00\x00\xca\xce\xed\xb4\xff\x05\x23\
+\x00\x00\x01\x00\xce\xa1\xfd\x2f\x6c\xa2\x9b\x55\x75\x1d\x3b\x66\
+\xf4\x1c\xb4\x00\x06\x01\x00\xce\xa3\xfd\x2f\x6c\xd3\x1b\x8f\xd3\
+\x02\x18\x04\x00\xc0\xd4\xce\x1d\x3b\x68\xff\x0b\xab\x74\x30\xff\
+\x1f\x04\x00\xc0\x1c\xed\x7f\x61\x9b\x63\xb4\x00\x06\x01\x00\x30\
+\x47\xfb\x5f\xd8\x37\x02\x40\x0b\x60\x10\x00\x00\x23\x6d\xad\xad\
+\xd2\xdb\xd3\x63\x16\x00\xb8\x01\x10\x19\x66\xba\x06\x00\x97\x00\
+\x40\x00\x00\xdf\xfe\x69\xff\x0b\xcb\x8c\x8e\x8c\xc8\x89\xe3\xb4\
+\x00\x06\x01\x00\x30\x42\xfb\x5f\x58\xf7\xed\x9f\x16\xc0\x20\x00\
+\x00\x66\x74\xfb\xdf\x9f\x3d\xbf\xc7\xe8\x39\x98\xfe\x07\xdb\x02\
+\x00\x0d\x80\x90\x4e\xcb\x38\x04\xb0\x81\x1f\xed\x7f\xf7\xfe\xd7\
+\xcf\xa5\xf5\xd0\x21\x49\xe8\xff\x9b\x4f\xfe\x7f\x91\x44\x42\xe6\
+\xd5\xaf\x45\xff\xaf\x84\xde\xf4\x6f\xcd\xa7\x1e\x13\x67\x7f\x7d\
+\xf6\xcf\x53\xfb\x25\x12\xa9\x7d\x13\x67\x7e\x2d\xea\xd7\xf3\xc9\
+\xdf\x4b\x3e\x5b\xf2\xbf\x9d\x97\x85\x5d\x13\xa9\x3f\x3b\xf3\x9c\
+\x8b\xb6\x33\xaf\x25\x71\xe6\x35\x9c\xf9\xf9\x0b\xbf\x3e\xf3\x33\
+\x24\xf5\xdf\x26\x5f\x6b\xe2\x95\xd7\x90\x48\x9c\xfb\x5a\xe4\xcc\
+\x7b\x90\xd4\xcf\x57\xbf\xfe\xb5\x37\xbd\x59\xfe\xe4\x4f\x3f\x6c\
+\xd5\xe7\xfd\xc2\xcf\x9f\x97\x1f\xfd\xe7\xff\x4d\xfe\x5a\x4f\xdd\
+\x5c\x78\x4c\xfd\xe1\x99\xff\x2d\xe7\xfe\x7e\xe8\x95\xff\x60\x49\
+\xfb\x9d\xb3\xcf\xd9\x87\xd0\x79\xbf\x7f\xde\xcf\x90\xcb\xff\xfe\
+\xf9\xfb\xb5\xb7\x1e\x36\x0b\x00\x5c\xff\x07\x01\x00\xae\xdb\xf1\
+\xdc\x4f\x8d\x9f\xa3\x65\xdf\xcb\x4e\x1e\xbb\xea\xda\x3a\xeb\x5e\
+\xf3\xbe\x97\x7f\x29\xff\xef\xa5\xbd\xce\x9f\xf7\x8c\x00\x20\x9d\
+\xb8\x04\x00\x2b\x98\xde\x00\xe8\xb2\x48\x43\x83\x75\xaf\x39\xde\
+\xdd\xc5\x07\x27\xb4\x00\x06\x01\x00\x8e\x3b\x79\xe2\x84\x71\xfb\
+\x5f\xa7\x03\x40\xc4\xbe\x00\x10\x23\x00\xd0\x02\x18\x04\x00\x60\
+\xe7\xce\x1d\xa9\x6b\xe4\xb8\x52\x6b\xd7\xae\x93\x92\x15\x2b\xac\
+\x7a\xcd\x93\x13\x13\x72\xe2\xf8\x71\xe7\x3f\x3b\xe6\xff\x83\x00\
+\x00\xe7\xed\x60\xf8\xdf\xfb\xb7\x7f\x1b\x87\xff\xe3\x31\x02\x9f\
+\xd0\x02\x18\x04\x00\x40\x76\x6c\xdf\xce\x41\xf0\x28\x5c\xcf\xf5\
+\x7f\x5b\xd1\x02\x18\x04\x00\x38\xad\xf5\xf0\x61\xe3\xf6\xbf\x4e\
+\x8f\x00\xd4\x37\x5a\xf7\x9a\xbb\x09\x00\x49\x5c\x02\x00\x01\x00\
+\x6e\x7f\xfb\x67\xf8\xdf\x30\x00\x70\x03\xa0\x95\xff\x30\xd3\x02\
+\x18\x04\x00\xb8\x6e\xfb\x76\x02\x80\x57\xcb\x8b\x8b\x65\xdd\x35\
+\xd7\x58\xf7\xba\xe3\xdd\xdd\xce\x7f\x76\xb4\x00\x06\x01\x00\x4e\
+\x4b\xb6\xff\xdd\xb3\x87\x03\xe1\xf5\xdb\x7f\xa4\x7e\x51\x77\x3c\
+\x3b\xcc\xcd\xcd\x49\x6f\x4f\xdc\xf9\xcf\x8e\x06\x40\x20\x00\xc0\
+\x69\x2f\xbc\xf0\x82\x4c\x4c\x4c\x70\x20\xbc\x7e\x8b\x6c\xb0\xef\
+\xfa\x7f\x7f\x5f\xaf\xcc\xce\xce\x12\x00\xb8\xfe\x0f\x02\x00\x5c\
+\xc6\xf5\x7f\xf3\x11\x00\xdb\x70\xfd\x9f\x11\x00\x10\x00\x00\xd9\
+\xee\x43\xff\x7f\xa7\x03\x80\x95\x37\x00\x72\xfd\x5f\xa3\x05\x30\
+\x08\x00\x70\xd6\x89\x13\xc7\xa5\x65\xff\x7e\x0e\x84\x47\xb9\xb9\
+\xb9\x52\x53\x17\x66\x04\xc0\x42\xb4\x00\x46\xa6\xb0\x1a\x20\xb2\
+\xd2\xce\x1d\xee\xb4\xff\xd5\x37\xea\xe9\x4d\x4f\xfd\x4a\xde\xb4\
+\xa7\x36\xbd\x94\xaf\xc9\xb5\xf0\xea\x9a\x5a\xc9\xcb\xcb\xb3\xee\
+\x58\xd0\x04\x88\xf9\xff\x20\x00\xc0\x71\x37\xfc\xca\x6b\xe4\xdf\
+\x9f\x7c\x2a\x59\x0c\x17\x17\xc7\x85\x6d\x61\x9e\xb4\x5e\x83\xfd\
+\x4c\xc1\x3c\xf7\xcf\x17\xff\xef\x33\x05\xf6\xdc\x3f\x3f\xff\x39\
+\x17\x9e\x23\xf5\x67\x72\xb1\x9f\xa9\xb6\xf3\x7f\xc6\x79\xcf\x17\
+\xba\xe4\x6b\x38\xf3\x3a\x2e\xfc\xf3\x4b\xf9\xd2\x17\xbf\x28\x7f\
+\xf7\x37\x0f\x7b\x3e\x7e\x36\x0e\xff\x27\x47\x00\x62\x66\x97\x00\
+\xbe\xff\x9f\x3f\x90\x95\xab\x56\x9d\x0d\x8f\xaf\xf6\x78\xce\xef\
+\x49\xe2\xcc\x6f\x9c\xf7\xdf\xca\x92\x9e\xeb\x55\x7f\xd6\xf9\xbf\
+\x2f\x17\x79\x0d\xea\x71\xcd\x9a\xb5\xfc\x03\x00\x02\x00\xdc\x55\
+\x5f\x5f\x9f\xdc\x5c\x15\x6d\x31\xbb\xfc\x61\xe3\x1a\x00\xa7\x4e\
+\x9e\x94\xf1\xb1\x31\xcf\xfb\xaf\x58\xb1\x42\x6e\x7e\xdd\xeb\xf8\
+\xcb\x03\x2c\x11\xf7\x00\x00\x59\xc8\xf4\xfe\x07\x1b\x5b\x00\x9b\
+\x5e\xff\x6f\x6c\x6a\xe2\xc4\x01\x08\x00\x80\xbd\xc6\xc7\xc7\xa5\
+\xb3\xa3\xc3\x30\x00\xb8\xd7\x02\xb8\xa9\xb9\x99\x93\x07\x20\x00\
+\x00\xf6\x3a\x10\x8d\xca\xfc\xfc\xbc\xe7\xfd\xd7\xac\x5d\x2b\x25\
+\x2b\x56\x30\x02\x00\x80\x00\x00\xd8\xc4\xf8\xfa\xbf\xa5\x37\x00\
+\xc6\x0d\x6f\x00\x6c\x6a\xde\xc0\xc9\x03\x10\x00\x00\x7b\xb5\xec\
+\x6f\x31\x0c\x00\x8d\x56\xbe\xef\x58\x97\xe1\x25\x00\x46\x00\x00\
+\x02\x00\xc0\x08\x80\x5d\x26\x26\xc6\x93\xcd\x9f\xbc\xd2\x3d\x0f\
+\xea\xc2\x61\x4e\x1e\x80\x00\x00\xd8\x49\xaf\x86\x77\xf0\xc0\x01\
+\xb3\x00\x60\xe1\x14\x40\xd3\x25\x80\xc3\x91\x88\x2c\x5b\xc6\xac\
+\x66\x80\x00\x00\x58\xaa\xe3\xe8\x51\x99\x9c\x9c\xf4\xbc\xff\xf2\
+\xe5\xcb\x65\xdd\x35\xeb\xad\x7b\xdf\x31\xe3\xeb\xff\xcc\x00\x00\
+\x08\x00\x80\xc5\x5a\x0c\x87\xff\xc3\xf5\x0d\x0b\x9d\x0d\x6d\x0b\
+\x00\x5c\xff\x07\x08\x00\x80\xcb\xa2\xc6\x37\x00\xda\x3a\x03\x80\
+\x1e\x00\x00\x01\x00\x60\x04\xc0\xb9\x00\xd0\x6d\xdc\x03\x80\x00\
+\x00\x10\x00\x00\xab\x47\x00\xdc\x0b\x00\x73\xb3\xb3\xd2\xd7\xdb\
+\x6b\x18\x00\xb8\x04\x00\x10\x00\x00\x4b\x0d\x0c\x0c\xc8\xe0\xe0\
+\xa0\xe7\xfd\x73\x73\x73\xa5\xa6\x2e\x6c\xdd\xfb\xd6\xc5\x7f\xce\
+\x60\xe9\xe3\xca\xaa\x2a\x29\x2e\x2e\xe6\x04\x02\x08\x00\x80\x9b\
+\xdf\xfe\xab\x6b\x6a\x93\xf3\xe1\x6d\x13\x8b\x71\x03\x20\x40\x00\
+\x00\x1c\xe6\xea\xf5\x7f\x16\x01\x02\x08\x00\x80\xdb\x23\x00\x2d\
+\x86\x33\x00\x1a\x2c\x9d\x01\x60\xd8\x04\x88\xeb\xff\x00\x01\x00\
+\xb0\x7b\x04\xc0\xf8\x06\x40\x3b\xd7\x00\xe8\x36\x1e\x01\x60\x11\
+\x20\x80\x00\x00\x58\x6a\x62\x62\x22\xd9\x05\xd0\x44\x38\x52\xcf\
+\x08\x00\x00\x02\x00\x60\x93\x03\xd1\xa8\xcc\xcf\xcf\x7b\xde\x7f\
+\xcd\xda\xb5\xb2\xa2\xb4\xd4\xba\xf7\xad\x17\x00\xd2\x0b\x01\x79\
+\x55\x5a\x56\x26\xeb\xd6\xad\xe3\x04\x02\x08\x00\x80\x9d\x4c\x57\
+\x00\x0c\x47\x2c\xbd\x01\x90\x16\xc0\x00\x01\x00\x70\x59\xcb\x7e\
+\x47\x6f\x00\x64\x11\x20\x80\x00\x00\x30\x02\x60\x10\x00\x1c\x9d\
+\x02\xc8\xf5\x7f\x80\x00\x00\x58\x4b\x5f\xfb\x3f\x78\xe0\x00\x01\
+\x80\x11\x00\x80\x00\x00\xb8\xe4\xe8\x91\x23\xc9\x59\x00\x5e\x2d\
+\x5f\xbe\x5c\xae\x59\x5f\xe1\xe8\x08\x00\x01\x00\x20\x00\x00\x96\
+\x32\x6d\x00\x54\x17\xa9\x97\x50\x28\x64\xdd\xfb\x1e\x1f\x1b\x93\
+\x53\x27\x4f\x7a\xde\x3f\x2f\x3f\x5f\xea\xea\xea\x38\x81\x00\x02\
+\x00\xe0\x66\x00\xb0\x76\xf8\xdf\xf0\x06\xc0\xfa\xfa\xfa\xe4\x02\
+\x48\x00\x08\x00\x80\x95\x5c\x5d\x03\x20\xce\xf5\x7f\x80\x00\x00\
+\x38\x3d\x02\x60\xda\x02\xb8\xc1\xce\x16\xc0\xcc\x00\x00\x08\x00\
+\x80\xb3\x06\x07\x07\x65\x60\x60\xc0\xf3\xfe\x7a\x08\xbc\xb6\x2e\
+\x6c\x69\x00\xa0\x07\x00\x40\x00\x00\xf8\xf6\xef\x49\x55\x75\x8d\
+\xe4\xe5\xe5\x39\x39\x02\xd0\xc4\x0c\x00\x80\x00\x00\xd8\xca\xf8\
+\xfa\xbf\xa5\x1d\x00\xe7\x66\x67\xa5\xbf\xaf\xd7\xf3\xfe\x7a\xd6\
+\x43\x43\x63\x23\x27\x10\x40\x00\x00\x6c\x1d\x01\x30\x9d\x01\x60\
+\x67\x11\xec\xe9\x89\xcb\xdc\xdc\x9c\xe7\xfd\x2b\xab\xaa\x92\xfd\
+\x0f\x00\x10\x00\x00\x37\x47\x00\xac\x9d\x01\xc0\xf5\x7f\x80\x00\
+\x00\x38\x4a\x77\xff\xd3\x5d\x00\x5d\x0c\x00\xe6\xd7\xff\x99\x01\
+\x00\x10\x00\x00\x4b\xe9\xfe\xff\x7a\x1d\x00\xaf\x56\xaf\x59\x2b\
+\x2b\x4a\x4b\xed\x0c\x00\x31\x7a\x00\x00\x04\x00\xc0\x51\xae\xae\
+\x00\x98\x0c\x00\x5d\xf4\x00\x00\x08\x00\x80\xa3\x5a\x4c\x6f\x00\
+\xb4\x74\x06\x40\x22\x91\x90\x78\x3c\x66\x38\x02\xb0\x81\x13\x08\
+\x20\x00\x00\x8c\x00\xd8\xe4\xc4\xf1\xe3\x32\x69\xb0\xfa\x61\x59\
+\x79\xb9\xac\x59\xb3\x86\x13\x08\x20\x00\x00\xf6\xd1\xd7\xfe\xf5\
+\x3d\x00\x2e\x06\x80\xb8\xe1\xf5\xff\x66\xae\xff\x03\x04\x00\xc0\
+\x56\x1d\x47\x8f\xca\xf8\xf8\xb8\xe7\xfd\x8b\x8a\x96\xcb\x35\xeb\
+\x2b\xac\x7c\xef\x5c\xff\x07\x08\x00\x80\xb3\x5a\x0c\x5b\x00\x87\
+\xeb\xeb\x93\xdd\xf0\xac\x0c\x00\x31\x7a\x00\x00\x04\x00\xc0\x51\
+\xd1\x16\xd3\x0e\x80\x16\xcf\x00\x60\x15\x40\x80\x00\x00\x38\x1b\
+\x00\xa2\x2e\x07\x00\x46\x00\x00\x02\x00\xe0\x6a\x00\x30\xbe\x04\
+\x60\x67\x00\x18\x1b\x1b\x95\xa1\x53\x27\x3d\xef\x9f\x9f\x5f\x20\
+\xb5\xb5\x75\x9c\x40\x00\x01\x00\xb0\xcf\xf1\xe3\xc7\xa5\xbf\xbf\
+\xdf\xf3\xfe\xb9\xb9\xb9\x52\x57\x17\xb6\xf2\xbd\x9b\xae\x01\xd0\
+\xd0\xd8\x20\x39\x39\xfc\xb3\x05\x10\x00\x00\x07\xbf\xfd\x57\x55\
+\xd7\x48\x5e\x7e\xbe\x95\xef\xbd\x9b\xeb\xff\x00\x01\x00\x70\x95\
+\xe9\x0a\x80\x61\x87\x6f\x00\xe4\xfa\x3f\x40\x00\x00\x2c\x1e\x01\
+\x70\xf7\x06\xc0\x38\x23\x00\x00\x01\x00\x60\x04\xc0\xbd\x00\x60\
+\x3a\x02\x40\x17\x40\x80\x00\x00\x58\x69\x72\x72\x52\x8e\x1e\x39\
+\x62\x16\x00\x2c\x5d\x04\x68\x66\x66\x46\xfa\xfb\xfa\x3c\xef\xaf\
+\x1b\x1f\xd5\x37\x34\x72\x12\x01\x04\x00\xc0\x3e\xba\xff\xff\xdc\
+\xdc\x9c\xe7\xfd\x57\xaf\x5e\x23\xa5\xa5\x65\x56\xbe\xf7\xde\x9e\
+\x78\x72\x0d\x04\xaf\xaa\x6b\x6a\xa4\xa8\xa8\x88\x93\x08\x20\x00\
+\x00\xf6\x31\x5d\x01\x30\xdc\x40\x07\x40\x00\x04\x00\xc0\x3a\x2d\
+\xfb\x69\x01\xec\x15\x33\x00\x00\x02\x00\xe0\xec\x08\x80\xdd\x33\
+\x00\x0c\x5b\x00\x33\x02\x00\x10\x00\x00\x1b\xe9\xeb\xdf\x07\xa2\
+\x51\xc3\x00\x60\xef\x4d\x70\x8c\x00\x00\x04\x00\xc0\x49\x9d\x1d\
+\x1d\x32\x3e\x3e\xee\x79\xff\xa2\xa2\xe5\xb2\xbe\xa2\xc2\xca\xf7\
+\x9e\x48\x24\x24\x6e\xb8\x0c\x30\xf7\x00\x00\x04\x00\xc0\x4a\x2d\
+\x86\x2d\x80\xeb\x22\x91\xe4\x54\x38\x1b\x1d\x1f\x1c\x90\xa9\xa9\
+\x29\xcf\xfb\xaf\x5c\xb5\x2a\x39\x03\x02\x00\x01\x00\xb0\x4e\xd4\
+\xe9\x06\x40\x7c\xfb\x07\x08\x00\x80\xab\x23\x00\x2d\x86\x33\x00\
+\x1a\xdc\xbd\xfe\x4f\x07\x40\x80\x00\x00\xd8\x3b\x02\xb0\xdf\xe1\
+\x19\x00\x5c\xff\x07\x08\x00\x80\x8b\x4e\x9c\x38\x2e\xfd\xfd\xfd\
+\xde\xff\xa2\xe6\xe4\x48\x5d\x5d\xd8\xde\x11\x80\xae\x63\x46\xfb\
+\x33\x03\x00\x20\x00\x00\x56\x32\x6d\x00\x54\x5d\x53\x2b\x79\xf9\
+\xf9\xf6\x06\x00\x46\x00\x00\x02\x00\xe0\x22\xe3\x16\xc0\x16\x0f\
+\xff\x8f\x8e\x8c\xc8\xe9\xa1\x21\xcf\xfb\x17\x14\x14\x48\x8d\x0a\
+\x40\x00\x08\x00\x80\x7d\x01\xc0\xe5\x16\xc0\x31\xb3\x1b\x00\x1b\
+\x1a\x1b\x93\x97\x40\x00\x10\x00\x00\xeb\xb4\xb8\x3c\x05\xb0\x8b\
+\x0e\x80\x00\x01\x00\x70\xd0\xe4\xe4\xa4\x1c\x69\x6f\x77\x36\x00\
+\x30\x03\x00\x20\x00\x00\x4e\x3a\x74\xf0\xa0\xcc\xcd\xcd\x79\xde\
+\x5f\x77\xc0\x2b\x2d\x2b\xb3\xf6\xfd\x77\x9b\xae\x01\xd0\xc4\x08\
+\x00\x40\x00\x00\x2c\x64\x7c\x03\x60\x43\x83\xd5\xef\xdf\x74\x15\
+\xc0\xc6\x66\x46\x00\x00\x02\x00\x60\x21\xd3\x29\x80\x91\x48\xbd\
+\xb5\xef\x7d\x66\x7a\x5a\xfa\xfb\x7a\xbd\xff\x03\x95\x93\x23\x8d\
+\x8d\x04\x00\x80\x00\x00\x38\x38\x02\x60\xf3\x12\xc0\x3d\x3d\xf1\
+\xe4\x4a\x80\x5e\x55\xd7\xd4\x24\xa7\x01\x02\x20\x00\x00\x56\xd1\
+\xc5\xef\x40\x34\x6a\x16\x00\x1a\x6c\x5e\x04\x88\xeb\xff\x00\x01\
+\x00\x70\x50\x47\x47\x87\x8c\x8d\x8d\x79\xde\xbf\xb0\xa8\x48\xd6\
+\x57\x54\x5a\xfb\xfe\xb9\xfe\x0f\x10\x00\x00\x27\x99\x2e\x00\x14\
+\x0e\xd7\x4b\x28\x14\xb2\xf6\xfd\x33\x03\x00\x20\x00\x00\x6e\x06\
+\x00\xd3\xeb\xff\xd6\xcf\x00\x30\x0d\x00\x8c\x00\x00\x04\x00\xc0\
+\x42\x2d\x0e\xb7\x00\xd6\xf7\x3f\xc4\x63\x31\xb3\x00\x40\x17\x40\
+\x80\x00\x00\x38\x39\x02\x60\x71\x00\x18\xe8\xef\x97\xe9\xe9\x29\
+\xcf\xfb\xaf\x5a\xbd\x5a\x56\xae\x5a\xc5\x49\x04\x10\x00\x00\xbb\
+\x9c\x38\x71\x5c\xfa\xfa\xfa\xbc\xff\xe5\xcc\xc9\x91\xba\x70\xc4\
+\xda\xf7\x1f\x8f\x71\xfd\x1f\x20\x00\x00\x4e\x7e\xfb\x37\x9b\xfe\
+\x57\x55\x5d\x23\x79\xf9\xf9\xd6\xbe\x7f\xd3\x29\x80\xac\x01\x00\
+\x10\x00\x00\x4b\x03\x80\xbb\xc3\xff\x0b\x01\xc0\x6c\x0a\x60\x33\
+\xd7\xff\x01\x02\x00\x60\x23\x97\x6f\x00\x64\x04\x00\x20\x00\x00\
+\x8c\x00\x78\x0d\x00\x8e\x2f\x02\xc4\x0c\x00\x80\x00\x00\x58\x67\
+\x6a\x6a\x4a\xda\xdb\xda\x0c\x47\x00\xec\x5d\x03\x60\x78\xf8\x74\
+\x72\xf3\xaa\xb0\xb0\x30\xb9\x0e\x00\x00\x02\x00\x60\x95\x43\x07\
+\x0f\xca\xdc\xdc\x9c\xe7\xfd\xf5\x14\xb8\xd2\xb2\x32\x67\xbf\xfd\
+\x37\x34\x36\x59\xdd\x01\x11\x20\x00\x00\x8e\x6a\xd9\xef\xfa\x0d\
+\x80\x74\x00\x04\x08\x00\x80\x83\x98\x01\xc0\xf5\x7f\x80\x00\x00\
+\xb8\x38\x02\xd0\x62\x3a\x03\xa0\xd1\xea\xf7\xcf\x0c\x00\x80\x00\
+\x00\x38\x47\xf7\xc0\x3f\x18\x35\x6b\x02\x64\xfd\x0c\x00\xd3\x2e\
+\x80\x8c\x00\x00\x04\x00\xc0\x36\x9d\x9d\x9d\x32\x3a\x3a\xea\x79\
+\xff\xc2\xa2\x22\x59\x5f\x51\x69\xed\xfb\xd7\xfd\xff\xf5\x3a\x00\
+\x9e\xff\x51\xca\xc9\x91\x86\xc6\x06\x4e\x24\x80\x00\x00\xd8\x25\
+\x6a\x78\x03\x60\x38\x5c\x6f\xf5\x1d\xf0\x3d\xb1\x78\x72\x14\xc4\
+\xab\xda\xda\x3a\xc9\xcf\x2f\xe0\x44\x02\x08\x00\x80\x5d\x5a\x1c\
+\x6f\x00\x14\xeb\x3e\x66\xb4\x3f\xd7\xff\x01\x02\x00\x60\xe9\x08\
+\x80\xe3\x2d\x80\x63\xcc\x00\x00\x08\x00\x00\x23\x00\xee\x05\x80\
+\x2e\x66\x00\x00\x04\x00\xc0\x31\x27\x4f\x9c\x90\xbe\xde\x5e\xef\
+\x7f\x21\x73\x72\xa4\x36\x1c\xb6\xfa\x18\xc4\x19\x01\x00\x08\x00\
+\x80\x7b\xdf\xfe\xcd\x86\xff\x2b\xab\xaa\xad\xbe\x01\x4e\xdf\xfc\
+\x17\x8f\xc7\xcc\x02\x00\x23\x00\x00\x01\x00\xb0\x8d\xeb\x2b\x00\
+\x0e\xf4\xf7\xc9\xcc\xf4\xb4\xe7\xfd\xd7\xac\x59\x23\xe5\x2b\x57\
+\x72\x22\x01\x04\x00\xc0\xb6\x00\x60\xd8\x00\xc8\xf1\xeb\xff\x4d\
+\xcd\x1b\x38\x89\x00\x02\x00\xe0\xe0\x08\x80\xed\x2d\x80\x0d\xaf\
+\xff\x73\x03\x20\x40\x00\x00\xac\x33\x35\x35\x25\xed\x6d\x6d\x6e\
+\x8f\x00\x74\xd3\x02\x18\x20\x00\x00\x8e\x39\x7c\xe8\x90\xcc\xce\
+\xce\x7a\xde\x7f\xe5\xaa\x55\x52\x56\x5e\xee\x76\x00\x60\x04\x00\
+\x20\x00\x00\xb6\x69\xd9\xef\xf6\xf0\x3f\x23\x00\x00\x01\x00\x70\
+\x52\xd4\xf1\x06\x40\xc3\xa7\x4f\xcb\xe8\xc8\x88\xe7\xfd\x8b\x8a\
+\x8a\xa4\xb2\xaa\x8a\x13\x09\x20\x00\x00\x96\x8d\x00\x18\xf6\x00\
+\xb0\x7d\x0a\x60\x77\xb7\x79\x07\x40\x9b\x17\x41\x02\x08\x00\x80\
+\x83\x74\x03\x9c\x03\x2d\x8e\xaf\x01\xd0\x65\xb6\x08\x50\x53\x13\
+\xc3\xff\x00\x01\x00\xb0\xcc\xb1\x63\x9d\x32\x3a\x3a\xea\x79\xff\
+\xc2\xc2\x42\xa9\xa8\xb4\x7b\xf8\x9b\x16\xc0\x00\x01\x00\x70\x8e\
+\xe9\x0a\x80\x75\x91\x7a\xeb\x87\xbf\x63\xdd\x2c\x02\x04\x10\x00\
+\x00\xc7\xb8\xbe\x02\xe0\x42\x00\x60\x04\x00\x20\x00\x00\x8c\x00\
+\x38\x15\x00\x74\x13\xa4\xe3\x83\x03\x9e\xf7\xcf\xcd\xcd\x95\xfa\
+\xfa\x7a\x4e\x24\x80\x00\x00\x30\x02\x60\x13\x7d\xfd\x5f\xdf\x08\
+\xe9\x55\x5d\x5d\x9d\xe4\xe5\xe7\x73\x22\x01\x04\x00\xc0\x1e\xa7\
+\x4e\x9e\x94\xde\x9e\x1e\xef\x7f\x09\x73\x72\xa4\x2e\x12\xb1\xfa\
+\x18\x98\x5f\xff\x67\xf8\x1f\x20\x00\x00\xd6\x7d\xfb\x37\x1b\xfe\
+\xaf\xac\xaa\x96\xfc\xfc\x02\xbb\x47\x00\xb8\xfe\x0f\x10\x00\x00\
+\xd7\x18\x77\x00\x6c\x08\xc2\x0d\x80\xcc\x00\x00\x08\x00\x80\x6b\
+\x23\x00\x8e\xdf\x00\xe8\x47\x00\x60\x04\x00\x20\x00\x00\xd6\x39\
+\x10\x35\x0d\x00\x76\x2f\x02\x34\x3f\x3f\x2f\xbd\x3d\x71\xb3\x00\
+\xc0\x08\x00\x40\x00\x00\x6c\x32\x3d\x3d\x25\x6d\xad\xad\x4e\x8f\
+\x00\xf4\xf7\xf5\xc9\xcc\xcc\x8c\xe7\xfd\xd7\xad\x5b\x27\xa5\x65\
+\x65\x9c\x4c\x00\x01\x00\xb0\xc7\xe1\x43\x87\x65\x76\x76\xd6\xf3\
+\xfe\x2b\x57\xad\x92\xb2\xf2\x72\xab\x8f\x01\xd7\xff\x01\x02\x00\
+\xe0\x9c\x96\xfd\xa6\xf3\xff\x1b\xad\x3f\x06\x71\xe3\xeb\xff\x1b\
+\x38\x91\x00\x02\x00\x60\x97\x28\x2d\x80\x19\x01\x00\x08\x00\x80\
+\x8b\x23\x00\x66\x37\x00\x86\x03\xd0\xfe\x36\xc6\x2a\x80\x00\x01\
+\x00\x70\x89\x6e\x7d\x6b\x3e\x03\x20\x00\x23\x00\x5d\x86\x97\x00\
+\x18\x01\x00\x08\x00\x80\x4d\xba\xba\x8e\xc9\xc8\xc8\x88\xe7\xfd\
+\x0b\x0b\x0b\x93\x5d\x00\x6d\x36\x34\x74\x4a\xc6\xc6\x46\x3d\xef\
+\x5f\x5c\x5c\x2c\x15\x95\x95\x9c\x4c\x00\x01\x00\xb0\x87\xe9\x0a\
+\x80\xb5\xe1\x88\x84\x42\x21\xa7\xbf\xfd\x37\x34\x36\x5a\x7f\x0c\
+\x00\x02\x00\xe0\x98\x16\x6e\x00\x4c\xae\x02\x68\x82\x19\x00\x00\
+\x01\x00\x70\x6e\x04\x20\x08\x01\xa0\xbb\x9b\xeb\xff\x00\x01\x00\
+\x60\x04\xe0\xca\x02\x40\x03\x3d\x00\x98\x01\x00\x10\x00\x00\xab\
+\x0c\x9d\x3a\x25\x3d\x71\xef\xfd\xef\xf5\x75\xef\xba\x70\xc4\xfa\
+\xe3\x40\x0f\x00\x80\x00\x00\x38\xf6\xed\xdf\x6c\xf8\xbf\xb2\xba\
+\x5a\x0a\x0a\x0a\xac\x3e\x06\x93\x13\x13\x72\xe2\xf8\x71\xcf\xfb\
+\x2f\x5b\xb6\x4c\x22\x91\x08\x27\x13\x40\x00\x00\xec\x11\xa5\x05\
+\xb0\xc4\xe3\xb1\x64\x2f\x04\xaf\x6a\xeb\xea\x24\x2f\x3f\x9f\x93\
+\x09\x20\x00\x00\x36\x8d\x00\x30\x03\xc0\xf4\xfa\x7f\x33\xd7\xff\
+\x01\x02\x00\x60\xdd\x08\x40\x0b\x33\x00\xba\x8d\xaf\xff\x13\x00\
+\x00\x02\x00\x60\x91\xe9\xe9\x29\x69\x6f\x6b\x33\x0b\x00\x0d\x2c\
+\x02\xc4\x0c\x00\x80\x00\x00\x58\xa5\xf5\xf0\x61\x99\x99\x99\xf1\
+\xbc\x7f\xf9\xca\x55\x52\x5e\xbe\xd2\xfa\xe3\x10\xef\x36\x6b\x02\
+\xc4\x0c\x00\x80\x00\x00\x58\xa5\x85\x06\x40\x32\x37\x37\x27\xbd\
+\x3d\x71\xa3\xe7\x20\x00\x00\x04\x00\xc0\x2a\x51\xe3\x06\x40\xf6\
+\x07\x80\xfe\xbe\x5e\x99\x9d\x9d\xf5\xbc\xff\x35\xd7\x5c\x23\xa5\
+\xa5\xa5\x9c\x4c\x00\x01\x00\x60\x04\xc0\x26\x5c\xff\x07\x08\x00\
+\x80\x73\x0e\x44\x09\x00\x31\xe3\xeb\xff\x04\x00\x80\x00\x00\x58\
+\xa4\xeb\xd8\x31\x19\x1e\x1e\xf6\xbc\xbf\xee\xfe\x57\x59\x55\xcd\
+\x08\x00\x23\x00\x00\x01\x00\xb0\x89\xe9\xfc\xff\xba\x48\x7d\x72\
+\x1d\x00\xdb\xc5\x59\x03\x00\x20\x00\x00\x2e\xa1\x03\x60\x6a\x04\
+\x20\x66\x76\x09\x80\x2e\x80\x00\x01\x00\xb0\x6b\x04\x60\x3f\x01\
+\xe0\xd4\xc9\x93\x32\x3e\x36\xe6\x79\xff\x92\x92\x12\x59\x5f\x51\
+\xc1\xc9\x04\x10\x00\x00\x9b\x46\x00\x0c\x6f\x00\x6c\xb0\x7f\x11\
+\x20\x96\x00\x06\x08\x00\x80\x53\x4e\x0f\x0d\x49\x3c\x16\xf3\xbc\
+\xbf\xbe\xf6\x5f\x17\xb6\x7f\xf9\x5b\x02\x00\x40\x00\x00\xf8\xf6\
+\x7f\x05\xf4\xdd\xff\x7a\x16\x80\xeb\x01\xa0\xa9\x79\x03\x27\x13\
+\x40\x00\x00\xec\xc1\xf5\xff\x05\x71\xc3\x1b\x00\x9b\x18\x01\x00\
+\x08\x00\x80\x5d\x23\x00\x04\x80\xe4\x08\x40\x17\x3d\x00\x00\x02\
+\x00\xe0\xd2\x08\x80\xf1\x0d\x80\xf6\x07\x80\x89\x89\x71\x39\x71\
+\xe2\xb8\xe7\xfd\x97\x2d\x5b\x26\x75\xe1\x30\x27\x13\x40\x00\x00\
+\xec\x30\x33\x3d\x2d\x6d\xad\xad\xce\x8f\x00\x98\x2e\x01\x1c\x8e\
+\x44\x24\x2f\x2f\x8f\x13\x0a\x20\x00\x00\x76\x38\x7c\xf8\x90\xcc\
+\xcc\xcc\x78\xde\xbf\xbc\x7c\xa5\x94\xaf\x5c\x65\xfd\x71\x30\x6d\
+\x00\xc4\x0c\x00\x80\x00\x00\x58\xc5\x78\x05\xc0\x06\xae\xff\x6b\
+\x74\x00\x04\x08\x00\x80\x55\x58\x01\x70\x41\x3c\x66\xda\x03\x80\
+\x00\x00\x10\x00\x00\x97\x46\x00\x02\x12\x00\xba\x59\x05\x10\x20\
+\x00\x00\x2e\x89\x1a\x4f\x01\xb4\xbf\x05\xf0\xdc\xec\xac\xf4\xf5\
+\xf6\x1a\x8e\x00\x70\x0f\x00\x40\x00\x00\x6c\xf9\xd6\xdb\xd5\x25\
+\xc3\xc3\xc3\x9e\xf7\xd7\xdd\xff\x2a\xab\xab\xad\x3f\x0e\xba\xf8\
+\xeb\x10\xe0\x95\x5e\x00\x48\x2f\x04\x04\x80\x00\x00\x58\xf2\xed\
+\xdf\x6c\xf8\x5f\xf7\xff\xd7\xeb\x00\xd8\x2e\x66\x78\xfd\x9f\x0e\
+\x80\x00\x01\x00\xb0\x8a\x71\x07\xc0\x00\xac\x00\x98\x0c\x00\x5c\
+\xff\x07\x08\x00\x80\x53\x23\x00\xac\x01\x90\x64\xda\x04\x88\x19\
+\x00\x00\x01\x00\xb0\x6c\x04\x80\x19\x00\x1a\x33\x00\x00\x02\x00\
+\xe0\x8c\xd3\x43\x43\x12\x33\xf8\xe6\xab\xaf\xfd\xd7\x86\x23\x8c\
+\x00\x08\x33\x00\x00\x02\x00\x60\x91\x68\x34\x6a\xb4\x7f\x65\x55\
+\xb5\x14\x16\x16\x5a\x7f\x1c\xf4\x02\x40\x7a\x21\x20\xaf\x56\xac\
+\x58\x21\xeb\xd7\xaf\xe7\x84\x02\x08\x00\x80\x25\x01\x80\xeb\xff\
+\x49\xa6\x2d\x80\xf9\xf6\x0f\x10\x00\x00\xab\x18\xcf\x00\x08\x4c\
+\x0b\x60\xb3\xe1\x7f\xae\xff\x03\x04\x00\xc0\xb2\x11\x00\x16\x01\
+\x4a\x8e\x00\x74\x33\x02\x00\x10\x00\x00\x47\xcc\x4c\x4f\x4b\x6b\
+\xeb\x61\x46\x00\xc4\x8f\x1e\x00\x1b\x38\xa1\x00\x02\x00\x60\x07\
+\x5d\xfc\x67\x66\x66\x3c\xef\x5f\x5e\xbe\x52\xca\x57\xae\x22\x00\
+\x08\x5d\x00\x01\x02\x00\x60\x91\x16\x86\xff\x93\xc6\xc7\xc6\xe4\
+\xd4\xc9\x93\x9e\xf7\xcf\xcb\xcb\x93\xba\x70\x98\x13\x0a\x20\x00\
+\x00\x76\x88\x72\x03\xe0\xc2\xb7\x7f\xc3\x1b\x00\xc3\x91\x88\x2c\
+\x5b\xb6\x8c\x13\x0a\x20\x00\x00\xb6\x04\x00\x3a\x00\x6a\x71\x3a\
+\x00\x02\x04\x00\xc0\x25\xa6\x2d\x80\xc3\xdc\x00\xb8\x10\x00\xb8\
+\xfe\x0f\x10\x00\x00\x7b\x8a\x5e\xb7\x0c\x9f\x3e\xed\x79\xff\xfc\
+\xfc\x82\x64\x17\xc0\xa0\x1c\x0b\x46\x00\x00\x02\x00\xc0\xb7\xff\
+\x25\xa8\x8b\x44\x24\x27\x27\x18\x7f\xbd\xcc\x7b\x00\x10\x00\x00\
+\x02\x00\x60\x09\x5a\x00\x2f\x98\x9b\x9d\x95\xfe\xbe\x5e\xc3\x00\
+\xc0\x25\x00\x80\x00\x00\x58\x33\x02\x40\x00\xd0\x7a\x7a\xe2\x32\
+\x37\x37\xe7\x79\xff\x8a\xca\x4a\x29\x2e\x2e\xe6\x84\x02\x08\x00\
+\x80\x25\x23\x00\xcc\x00\x48\x32\x5d\x02\xb8\x99\xeb\xff\x00\x01\
+\x00\xb0\x85\xbe\xf9\xaf\xdb\x60\xf5\xbb\x50\x28\x24\x75\x91\xfa\
+\x40\x1c\x0b\xd6\x00\x00\x08\x00\x80\x3b\xdf\xfe\xa3\x66\xdf\xfe\
+\x2b\x2a\xab\xa4\xb0\xb0\x30\x18\x01\x20\x46\x0f\x00\x80\x00\x00\
+\x38\xc2\xb8\x05\x70\x40\x86\xff\x93\x01\xa0\x8b\x19\x00\x00\x01\
+\x00\x70\x65\x04\xc0\xf4\x06\xc0\x80\xac\x01\x90\x48\x24\x24\x1e\
+\x8f\x31\x02\x00\x10\x00\x00\x46\x00\x5c\x1a\x01\x38\x71\xfc\xb8\
+\x4c\x4e\x4c\x78\xde\xbf\xb4\xac\x4c\xd6\xad\x5b\xc7\x09\x05\x10\
+\x00\x80\xec\xa7\x97\xff\xd5\xcb\x00\x9b\x05\x80\xc6\x40\x1c\x8b\
+\x78\x8c\x16\xc0\x00\x01\x00\x70\x84\x2e\xfe\x33\xd3\xd3\x9e\xf7\
+\x2f\x2b\x2f\x97\x95\xab\x56\x05\xe2\x58\x98\x5e\xff\x67\xf8\x1f\
+\x20\x00\x00\xd6\x88\x32\xfc\xff\x4a\x00\x30\x5c\x06\x98\x29\x80\
+\x00\x01\x00\xb0\x86\x79\x07\xc0\xc6\xc0\x1c\x8b\x18\xcb\x00\x03\
+\x04\x00\xc0\x9d\x11\x00\x5a\x00\xbf\x12\x00\x4c\x47\x00\x08\x00\
+\x00\x01\x00\xb0\x25\x00\x44\xa3\x66\x01\x20\x20\x53\x00\xc7\xc6\
+\x46\x65\xe8\xd4\x49\xcf\xfb\xe7\xe5\xe7\x4b\x5d\x5d\x1d\x27\x14\
+\x40\x00\x00\xb2\x5f\x3c\x16\x93\xd3\x43\x43\x9e\xf7\xcf\xcf\x2f\
+\x90\xca\xaa\xea\x60\x1c\x0b\xc3\x6f\xff\xf5\xf5\xf5\x92\x9b\x9b\
+\xcb\x49\x05\x10\x00\x80\xec\xd7\x62\xb8\x00\x50\x5d\x24\x22\x39\
+\x39\xc1\xf8\x2b\xd5\xcd\xf5\x7f\x80\x00\x00\xb8\x82\xeb\xff\xaf\
+\x60\x11\x20\x80\x00\x00\x38\x34\x02\x40\x00\x38\x23\xce\x08\x00\
+\x40\x00\x00\x9c\x19\x01\x68\xa1\x07\x80\x5f\x23\x00\x4d\xcc\x00\
+\x00\x08\x00\x80\x0d\x86\x87\x87\xa5\xeb\xd8\x31\xcf\xfb\x87\x42\
+\x21\xa9\x8b\xd4\x07\xe2\x58\xe8\x76\xc8\xfd\x7d\x7d\x46\xc7\xa2\
+\xa1\xb1\x91\x93\x0a\x20\x00\x00\xd9\xef\x40\xd4\xec\xdb\x7f\x45\
+\x65\x95\x14\x16\x16\x06\xe2\x58\xf4\xf6\xc4\x65\x7e\x7e\xde\xf3\
+\xfe\x95\x55\x55\xb2\x7c\xf9\x72\x4e\x2a\x80\x00\x00\x64\x3f\xd3\
+\x15\x00\xc3\xf5\xf5\x81\x39\x16\x74\x00\x04\x08\x00\x80\x33\xa2\
+\xb4\x00\xf6\x2f\x00\x30\x03\x00\x20\x00\x00\xae\x8c\x00\x04\x6b\
+\x06\x80\x59\x13\x20\x46\x00\x00\x02\x00\x60\x05\x7d\xd3\xdb\xe1\
+\xc3\x87\x08\x00\x3e\x8d\x00\xd0\x03\x00\x20\x00\x00\x56\x68\x6b\
+\x6d\x95\x99\xe9\x69\xcf\xfb\x97\x96\x95\xc9\xaa\xd5\xab\x03\x71\
+\x2c\x12\x89\x84\xc4\x63\xa6\x23\x00\x1b\x38\xa9\x00\x02\x00\x90\
+\xfd\xcc\xe7\xff\x07\xe7\xfa\xff\xf1\xc1\x01\x99\x9a\x9a\xf2\xbc\
+\x7f\x59\x79\xb9\xac\x59\xb3\x86\x93\x0a\x20\x00\x00\xd9\xcf\xb8\
+\x03\x60\x03\x4b\x00\x9f\xd1\xcc\xf5\x7f\x80\x00\x00\x58\x33\x02\
+\xc0\x1a\x00\x8b\x02\x00\xd7\xff\x01\x02\x00\xe0\x4a\x00\x88\x46\
+\x09\x00\x29\xe6\xd7\xff\x19\x01\x00\x08\x00\x80\x15\x05\x2f\x26\
+\x43\xa7\x4e\x79\xde\x3f\x3f\xbf\x40\xaa\xaa\x6b\x82\x33\x02\xd0\
+\x75\xcc\x68\x7f\x46\x00\x00\x02\x00\x60\x85\x16\xc3\x1b\x00\x6b\
+\xc3\x61\xc9\xc9\x09\xce\x5f\xa3\x18\x23\x00\x00\x01\x00\x70\xc1\
+\x01\x56\x00\x3c\x6b\x74\x64\x44\x4e\x0f\x0d\x79\xde\x5f\x8f\x86\
+\xd4\xd6\xd6\x71\x52\x01\x04\x00\xc0\x86\x11\x00\x6e\x00\x7c\xe5\
+\xdb\xbf\xd9\x0d\x80\x0d\x8d\x0d\x81\x1a\x0d\x01\x08\x00\x40\x80\
+\x45\x4d\x5b\x00\x07\x69\x0a\x60\x17\x33\x00\x00\x02\x00\xe0\x80\
+\x91\x91\x11\xe9\x32\xb8\xe9\x4d\xaf\x7b\x1f\x0e\x07\x67\x15\x40\
+\x66\x00\x00\x04\x00\xc0\x09\x07\xa2\x2d\xc9\xd6\xb7\x5e\xad\xaf\
+\xa8\x94\xc2\xa2\xa2\xc0\x1c\x8f\x6e\x7a\x00\x00\x04\x00\xc0\x05\
+\x2d\x0c\xff\x9f\x3b\x02\x40\x17\x40\x80\x00\x00\xb8\x20\x6a\x7c\
+\x03\x60\x70\xd6\x00\xd0\x8b\x21\xf5\xf7\xf5\x7a\xde\x5f\x5f\x0e\
+\xa9\x6f\x68\xe4\xa4\x02\x08\x00\x80\x0d\x23\x00\xcc\x00\x38\xa3\
+\xa7\x27\x6e\x74\x39\xa4\xba\xa6\x46\x8a\x02\x74\x39\x04\x20\x00\
+\x00\x01\x35\x3b\x3b\x2b\x87\x0f\x1d\x26\x00\xa4\xb0\x06\x00\x40\
+\x00\x00\x9c\xd0\xd6\xda\x2a\xd3\xd3\xde\x97\xbd\x2d\x2d\x2b\x93\
+\x55\xab\x57\x07\xe6\x78\x98\x5e\xff\x67\x06\x00\x40\x00\x00\xac\
+\x10\x35\xee\x00\x18\xac\xeb\xdd\xa6\x33\x00\x9a\x18\x01\x00\x08\
+\x00\x80\x0d\x8c\x3b\x00\x06\x6e\x06\x80\x61\x00\x60\x04\x00\x20\
+\x00\x00\x56\x8c\x00\x70\x03\xe0\x59\xfa\xe6\x3f\xbd\x2a\xa2\x09\
+\xee\x01\x00\x08\x00\x80\x1d\x01\x20\x1a\x25\x00\xa4\x0c\xf4\xf7\
+\x1b\xdd\x0f\xb1\x72\xd5\x2a\x59\xbd\x7a\x0d\x27\x15\x40\x00\x00\
+\xb2\x5b\x4f\x3c\x2e\xa7\x4e\x9e\xf4\xbc\x7f\x5e\x7e\xbe\x54\x55\
+\xd7\x04\xe6\x78\xc4\x63\xcc\x00\x00\x08\x00\x80\x03\x4c\xaf\xff\
+\xd7\xd5\x85\x03\xb5\xea\x9d\xe9\x14\x40\x3a\x00\x02\x04\x00\xc0\
+\x0a\xc6\x2b\x00\xd6\x07\xeb\x06\xc0\x98\xe1\x14\x40\x46\x00\x00\
+\x02\x00\x60\x47\x00\x88\x9a\xae\x01\x10\xac\x29\x80\x31\x66\x00\
+\x00\x04\x00\x80\x11\x00\xf7\x46\x00\xe2\x8c\x00\x00\x04\x00\x20\
+\xe8\x46\x46\x46\xe4\xd8\xb1\x4e\xcf\xfb\xeb\x45\x6f\xc2\x91\xfa\
+\xc0\x1c\x8f\xe1\xe1\xd3\xc9\xcd\xab\x82\x82\x02\xa9\xa9\xa9\xe5\
+\xc4\x02\x08\x00\x40\x76\x3b\x18\x8d\x1a\x2d\x7a\xb3\xbe\xa2\x42\
+\x0a\x03\xb4\xe8\x8d\xe9\xb7\xff\x86\xc6\xc6\x40\xdd\x10\x09\x10\
+\x00\x80\x80\x6a\xa1\x05\xf0\x39\xb8\xfe\x0f\x10\x00\x00\x27\x44\
+\x5b\xe8\x00\x78\x6e\x00\xe0\xfa\x3f\x40\x00\x00\x5c\x18\x01\xa0\
+\x05\xb0\xbf\x23\x00\x4d\x8c\x00\x00\x04\x00\x20\xcb\xcd\xce\xce\
+\xca\xa1\x83\x87\x8c\x9e\x23\x1c\xb4\x45\x80\x4c\xbb\x00\x36\x33\
+\x02\x00\x10\x00\x80\x2c\xd7\xde\xd6\x66\xd4\xf3\xbe\xb4\xb4\x2c\
+\x50\x3d\xef\xf5\xb1\xd0\xeb\x00\x78\xfe\xc7\x23\x27\x47\x1a\x1b\
+\x09\x00\x00\x01\x00\xc8\x72\x51\x96\x00\x3e\x47\x4f\x2c\x6e\x34\
+\x23\xa2\xba\xa6\x26\x39\x0d\x10\x00\x01\x00\xc8\x6a\x2d\x34\x00\
+\x3a\x47\xac\xfb\x98\xd1\xfe\x5c\xff\x07\x08\x00\x80\x1b\x23\x00\
+\x41\x0b\x00\x31\xc3\x19\x00\x5c\xff\x07\x08\x00\x80\x15\x23\x00\
+\x86\x3d\x00\xc2\x41\x0b\x00\x5d\xcc\x00\x00\x08\x00\x40\xc0\xf5\
+\xf6\xf4\xc8\xa9\x93\x27\x3d\xef\x9f\x97\x9f\x2f\x55\xd5\x35\x81\
+\x3a\x26\x71\xc3\x11\x80\x26\x7a\x00\x00\x04\x00\x20\xfb\xbf\xfd\
+\x9b\x0d\xff\xd7\xd5\x85\x25\x37\x37\x37\x30\xc7\x43\xdf\xfc\x17\
+\x8f\xc7\xcc\x02\x00\x5d\x00\x01\x02\x00\x90\xed\x58\x01\xf0\x5c\
+\x03\xfd\x7d\x32\x33\x3d\xed\x79\xff\x55\xab\x57\xcb\xca\x55\xab\
+\x38\xb1\x00\x02\x00\x10\xec\x11\x80\x48\x43\xc0\xd6\x00\xe0\xfa\
+\x3f\xe0\xbc\x65\x1c\x02\x5c\xf0\x6d\x39\xda\x22\xa7\x87\x4e\x07\
+\xea\x3d\xbd\xfc\xcb\x5f\x32\x02\xb0\x38\x00\x18\x5e\xff\x5f\x5e\
+\xbc\x5c\x9e\xdf\xb3\x27\xf0\x7f\x17\x56\xac\x58\x21\xd7\x5d\x7f\
+\x3d\xff\x28\x80\x00\x00\x37\xfc\xd1\x83\x0f\xca\xd1\xa3\x47\x39\
+\x10\x29\xa1\x50\x48\xea\x22\x91\x60\x05\x00\xc3\x35\x00\x9e\x7b\
+\xf6\xd9\xe4\x16\x74\x77\xff\xe6\x6f\xca\xbf\x7d\xed\xeb\xfc\x25\
+\x40\x20\x71\x09\x00\xe7\x18\x1f\x1f\x97\xce\xce\x4e\x0e\xc4\x22\
+\xeb\x2b\x2a\xa4\xa8\x68\x39\x01\xc0\x41\x5b\xb6\x5c\xcb\x41\x00\
+\x01\x00\x6e\x38\x78\xe0\x80\xcc\xcf\xcf\x73\x20\x16\x89\xd4\x37\
+\x06\xee\x3d\x11\x00\x96\x66\xf3\x96\x2d\x1c\x04\x10\x00\xe0\x4a\
+\x00\x88\x72\x10\xce\x13\x8e\xd4\x07\xea\xfd\x0c\x9f\x3e\x2d\xa3\
+\x23\x23\x7c\xb0\x04\x00\x10\x00\x80\x57\x44\x5b\x08\x00\x17\x8c\
+\x00\x04\x6c\x11\xa0\x6e\xbe\xfd\x2f\x49\x49\x49\x89\xd4\xd4\xd6\
+\x72\x20\x40\x00\x80\x1b\x0e\x30\x02\x70\x61\x00\x08\x5c\x0b\xe0\
+\x63\x7c\xa8\x4b\xb0\x49\x7d\xfb\xd7\x37\x80\x02\x04\x00\x38\xe1\
+\x60\x94\x00\xb0\x58\x69\x69\x99\xac\x5e\xb3\x36\x50\xef\xc9\xb4\
+\x05\xb0\x2b\x36\x6f\x66\xf8\x1f\x04\x00\x38\xa2\xbb\xab\x4b\x46\
+\xb8\x36\x7c\x8e\x70\x7d\x7d\xe0\xde\x13\x37\x00\x2e\x31\x00\x6c\
+\xd9\xcc\x41\x00\x01\x00\x6e\x88\xf2\xed\xff\x02\x41\x1b\xfe\x5f\
+\x08\x00\x8c\x00\x2c\x2d\x00\x30\x05\x10\x04\x00\x38\x82\xe1\xff\
+\x8b\x05\x80\x60\x4d\x01\x9c\x9a\x9a\x92\xe3\x83\x03\x7c\xb0\xaf\
+\x42\x5f\xfb\xdf\xb4\x99\x11\x00\x10\x00\xe0\xcc\x08\x40\x0b\x07\
+\xe1\xfc\x00\x10\xb0\x19\x00\xfa\xfa\xbf\x5e\x09\x10\x97\xa7\x57\
+\x7f\x2c\x2e\x2e\xe6\x40\x80\x00\x00\x46\x00\x5c\x94\x97\x97\x27\
+\x55\xd5\x35\x81\x7a\x4f\x5c\xff\x5f\x9a\x4d\x5c\xff\x07\x01\x00\
+\xae\xa0\x05\xf0\x85\x6a\xd5\xb7\xc0\xdc\xdc\xdc\x60\x8d\x00\x70\
+\xfd\x7f\x49\x68\x01\x0c\x02\x00\xdc\xf9\xf6\x4f\x0b\xe0\x0b\x04\
+\x6d\x09\x60\x46\x00\x96\x8e\x0e\x80\x20\x00\xc0\xa1\x00\xc0\xf0\
+\xff\x05\x01\x20\x90\x33\x00\x08\x00\x4b\xc1\x25\x00\xb8\x80\xe5\
+\x80\x91\x64\xda\x02\xb8\x79\xc3\xc6\xc0\x7d\x63\xbe\xfe\x57\x5e\
+\x13\xb8\xcf\x59\xbf\xa7\x4d\x01\x1f\xde\xd6\x6b\x1d\xfc\x6c\xcf\
+\x2e\xcf\xfb\xeb\x9b\xff\xf4\x4d\x80\x00\x01\x00\x4e\x30\x6d\x01\
+\xfc\x3b\xf7\xdc\x27\x6f\xb8\xfd\x8d\x1c\xc8\x2c\xf7\xde\x3f\xfe\
+\x93\xc0\xbf\xc7\x9f\xef\xd9\x6d\x14\x00\xf4\xf4\x3f\x5a\x00\xc3\
+\x05\x5c\x02\x40\x92\xe9\x0c\x80\xba\x48\x84\x83\x88\xac\xd0\xd9\
+\x79\xd4\x68\x7f\x1a\x00\x81\x00\x00\x67\x98\xb6\x00\x2e\x28\x28\
+\x90\xca\xaa\x6a\x0e\x24\xb2\xc2\xb1\x0e\xd3\x00\xc0\xf5\x7f\x10\
+\x00\xe0\x08\xd3\x16\xc0\xb5\xe1\x08\x43\xa6\xc8\x1a\x1d\x47\x19\
+\x01\x00\x08\x00\x58\x12\xd3\xe1\xff\x70\x98\xe1\x7f\x64\x87\x89\
+\x89\x71\x19\xe8\xef\xf3\xbc\x3f\x2d\x80\x41\x00\x80\x63\x23\x00\
+\x66\x2d\x80\xc3\x01\x9c\x2e\x07\x3b\x1d\xeb\xec\x30\x6a\x75\x5c\
+\x5b\x5b\x27\x25\x25\x25\x1c\x48\x10\x00\xc0\x08\xc0\x52\xd4\x45\
+\xea\x39\x88\xc8\x8e\x00\xd0\xd1\x61\xb4\x3f\xf3\xff\x41\x00\x80\
+\x33\xfc\x68\x01\x1c\x66\x06\x00\xb2\x44\xc7\xd1\x23\x46\xfb\xd3\
+\x01\x10\x04\x00\xb8\xf3\xed\xdf\xb0\x05\xf0\xda\x75\xd7\x48\x71\
+\x31\x43\xa6\x08\xc6\x08\x00\x6b\x00\x80\x00\x00\x87\x02\x80\xe1\
+\x0d\x80\x7c\xfb\x47\x96\xd0\xd7\xfe\xf5\x3d\x00\x26\x36\x31\x02\
+\x00\x02\x00\x5c\x61\xda\x02\x98\x1b\x00\x91\x2d\xf4\xdd\xff\x7a\
+\x16\x80\x57\xba\x05\x70\x38\x1c\xe6\x40\x82\x00\x00\x37\x1c\x30\
+\x1e\x01\xe0\x06\x40\x64\x87\x4e\xc3\x06\x40\x1b\x37\x6d\xa2\x9f\
+\x05\x08\x00\x70\x87\x71\x0f\x00\x02\x00\xb2\x25\x00\xd0\x00\x08\
+\x20\x00\x60\x69\xfc\x68\x01\x5c\x51\x59\xc5\x81\x44\x76\x04\x80\
+\x4e\x5a\x00\x03\x04\x00\x2c\x09\x2d\x80\xc1\x08\xc0\xa2\x00\xb0\
+\x99\x1b\x00\x41\x00\x80\x23\x18\xfe\x47\x50\x4c\x4e\x4c\x48\x7f\
+\x5f\xaf\xd1\x73\x30\x03\x00\x04\x00\x38\x34\x02\x60\xd6\x02\x38\
+\xc2\x0c\x00\x64\x89\xae\x63\x9d\x46\x2d\x80\x6b\x6a\x6b\x65\xc5\
+\x8a\x15\x1c\x48\x10\x00\xc0\x08\xc0\x52\xd4\xb1\x08\x10\xb2\x84\
+\x69\x07\xc0\x2d\x7c\xfb\x07\x01\x00\xae\xf0\xa7\x05\x30\x97\x00\
+\x90\x1d\x68\x00\x04\x10\x00\xb0\xd4\x6f\xff\x3e\xb4\x00\x5e\x5e\
+\x5c\xcc\x81\x44\x40\x46\x00\x98\x02\x08\x02\x00\x9c\x09\x00\x66\
+\xc3\xff\x91\x7a\xbe\xfd\x23\x3b\xe8\x6b\xff\x5d\x8c\x00\x00\x04\
+\x00\x2c\x8d\x71\x0b\xe0\x08\x37\x00\x22\x3b\x0c\x0e\x0c\x24\x2f\
+\x69\x79\xb5\x7c\xf9\x72\x5a\x00\x83\x00\x00\x77\x98\xb6\x00\xae\
+\x63\x11\x20\x64\x89\xce\x0e\xb3\xe1\x7f\xdd\x02\x38\x27\x87\x7f\
+\x0a\x41\x00\x80\x23\x4c\x67\x00\x30\x05\x10\xd9\x13\x00\xcc\x1a\
+\x00\x6d\xa2\x01\x10\x08\x00\x70\x85\x69\x0b\xe0\xc2\xc2\x42\x59\
+\x5f\x51\xc9\x81\x44\x76\x04\x00\xc3\x0e\x80\x5b\xae\xe5\x06\x40\
+\x10\x00\xe0\x08\xe3\x16\xc0\x75\x61\x5a\x00\x23\x30\x23\x00\xac\
+\x01\x00\x02\x00\x9c\x61\xdc\x02\x98\xe1\x7f\x64\x89\xc9\xc9\x49\
+\xe9\xeb\xed\x31\x7a\x0e\x2e\x01\x80\x00\x00\x87\x46\x00\xcc\x5a\
+\x00\xd3\x00\x08\xd9\xc2\xb4\x05\x70\x75\x4d\x8d\x94\x96\x96\x72\
+\x20\x41\x00\x00\x23\x00\x04\x00\xd8\xe4\x98\xe1\xf0\x3f\x2d\x80\
+\x41\x00\x80\x33\xfc\x68\x01\x5c\x47\x00\x40\x96\x30\xed\x00\x48\
+\x03\x20\x10\x00\xe0\xce\xb7\x7f\xc3\x16\xc0\xeb\xae\xb9\x26\xd9\
+\x38\x05\xc8\x8a\x11\x00\xc3\x0e\x80\x9b\xb9\xfe\x0f\x02\x00\xdc\
+\x09\x00\x74\x00\x44\x70\x98\xce\x00\x60\x0a\x20\x08\x00\x70\x86\
+\x79\x0b\x60\x86\xff\x91\x1d\x06\x07\xfa\x65\x7c\x6c\xcc\xf3\xfe\
+\x45\x45\x45\xea\x7c\xa6\xa3\x25\x08\x00\x70\x84\x69\x0b\xe0\x30\
+\x8b\x00\x21\x4b\x74\x18\x36\x00\xa2\x05\x30\x08\x00\x70\x8a\xf9\
+\x0c\x00\x2e\x01\x20\x3b\x1c\x33\x6e\x00\xc4\xf5\x7f\x10\x00\xe0\
+\x08\x7f\x5a\x00\x57\x70\x20\x91\x15\x3a\x3b\x4d\x03\x00\xd7\xff\
+\x41\x00\x80\x23\x8c\x5b\x00\x87\x23\xb4\x00\x46\xf6\x04\x80\xa3\
+\xb4\x00\x06\x08\x00\x58\x12\x1a\x00\x21\x28\xa6\xa6\xa6\xa4\xb7\
+\x27\x6e\x16\x00\x98\x02\x08\x02\x00\xdc\x19\x01\xa0\x05\x30\x82\
+\xa1\xab\xb3\xc3\xa8\x05\x70\x55\x75\xb5\x94\x96\x95\x71\x20\x41\
+\x00\x00\x23\x00\x4b\x11\x61\x11\x20\x64\x89\x4e\x1a\x00\x01\x04\
+\x00\x2c\x8d\x69\x0b\x60\x7d\xed\x5f\xdf\x03\x00\x64\x45\x00\x30\
+\x6c\x01\xbc\xf9\x5a\x02\x00\xb0\x8c\x43\xe0\xc8\xb7\x7f\xc3\x16\
+\xc0\x65\x65\xe5\xd2\xdf\xd7\xcb\x81\x44\x56\x68\x6b\x3d\xcc\x08\
+\x00\x40\x00\xc0\xd2\x02\x80\xd9\xf0\xff\xd0\xd0\x29\xf9\xf0\x07\
+\xde\xcf\x81\x44\x20\xd0\x02\x18\xe0\x12\x80\x33\x4c\x5b\x00\x03\
+\x41\xa1\xfb\x59\x44\xe8\x68\x09\x10\x00\x5c\x61\xda\x02\x18\x08\
+\x0a\x5a\x00\x03\x04\x00\xa7\x98\xce\x00\x00\x82\x82\x16\xc0\x00\
+\x01\xc0\x19\xa6\x2d\x80\x81\x20\xd9\xc4\x0d\x80\x00\x01\xc0\x15\
+\x51\xbe\xfd\x03\x67\x6d\x61\x0a\x20\x40\x00\x70\x05\xc3\xff\xc0\
+\x2b\x98\x02\x08\x10\x00\x1c\x1a\x01\x68\xe1\x20\x00\x4a\x65\x55\
+\x95\x94\x95\x97\x73\x20\x80\x54\x00\x98\xf0\xba\xf3\xe4\xe4\x24\
+\x47\x90\x11\x00\x80\x6f\xff\xc0\x55\x60\x58\x83\x27\x74\x00\x18\
+\xf6\xba\xf7\xe8\xe8\x28\x9f\x40\x96\x33\x6d\x01\x0c\x04\x09\xd7\
+\xff\x11\x24\x86\x35\x78\x58\x07\x00\xcf\xb7\x87\x8f\x8f\x8d\xf1\
+\x09\x64\xfb\xb7\x7f\xc3\x16\xc0\x40\x90\x30\x03\x00\x81\xfa\x82\
+\x67\x56\x83\x47\x8c\x02\xc0\xcc\xcc\x8c\x4c\x4f\x4f\xf1\x29\x64\
+\x75\x00\x60\xf8\x1f\x38\x83\x1e\x00\x08\x0a\x5d\x7b\x75\x0d\xbe\
+\x6a\x01\x40\x1b\x1d\xe1\x32\x40\x36\xa3\x05\x30\xb0\xa0\xa0\xa0\
+\x40\xea\x1b\x58\xd2\x1a\xc1\xe0\x43\xed\x35\x0f\x00\x43\xa7\x4f\
+\xf3\x49\x64\x31\x5a\x00\x03\x0b\x36\x6c\xdc\x28\xb9\xb9\xb9\x1c\
+\x08\x04\x82\x0f\xb5\xd7\x3c\x00\x74\x18\xae\xcb\x8d\xf4\x62\x06\
+\x00\xb0\x80\x15\x00\x11\x24\x3e\xd4\xde\x11\xbd\x1c\x70\x8f\xc9\
+\x33\xb4\xb7\xb6\xc9\x1d\x77\x6e\xe5\xd3\xc8\x42\xc3\x2a\x21\xbe\
+\xf9\xce\x3b\x39\x10\x80\xf2\x1b\x6f\xb9\x9b\x83\x80\xc0\xd0\xb5\
+\xd7\x50\x8f\x0e\x00\xad\x46\x2f\xa2\xbd\x9d\x4f\x22\x4b\x95\x96\
+\x95\xc9\x97\xbf\xf2\xaf\x1c\x08\x00\x08\x5a\x00\x30\xaf\xbd\xad\
+\xfa\x12\xc0\x61\x93\x67\x38\x42\x00\x00\x00\x20\xa3\x7c\xa8\xbd\
+\x87\x73\x8c\x47\x00\xda\x5a\xf9\x24\x00\x00\xc8\xe4\x08\x80\x79\
+\xed\x6d\xcd\x49\x24\x12\xfa\x1e\x00\xcf\xf3\x09\x06\x07\x07\x25\
+\xd6\xdd\xcd\xa7\x01\x00\x40\x06\xe8\x9a\xab\x6b\xaf\x81\x51\x5d\
+\xfb\xcf\x2c\x06\x64\x14\x25\x76\xef\xda\xc5\x27\x02\x00\x40\x06\
+\xf8\x50\x73\x93\x35\xff\x4c\x00\x38\x7c\x95\x5f\x0c\x00\x00\xc8\
+\x4c\xcd\x3d\xbc\x38\x00\xfc\xc2\xe4\x99\xf6\xec\xda\xc9\x27\x02\
+\x00\x40\x06\xf8\x50\x73\x7f\xb1\x38\x00\x3c\x6b\xf2\x4c\x7d\x7d\
+\x7d\xd2\xde\xd6\xc6\xa7\x02\x00\x40\x1a\xe9\x5a\xab\x6b\xae\xa1\
+\x67\x17\x07\x80\x97\xd5\x76\xc2\xe8\xd9\xb6\x6d\xe3\x93\x01\x00\
+\x20\x8d\x7c\xa8\xb5\x27\x52\x35\x7f\x21\x00\x24\x12\x09\xbd\x5e\
+\xec\x76\x93\x67\x7c\xf2\x89\x27\xf8\x64\x00\x00\x48\x23\x1f\x6a\
+\xed\x73\xa9\x9a\x7f\x76\x04\xe0\xec\x90\x80\x57\xd1\x96\xfd\x72\
+\xe8\xe0\x41\x3e\x1d\x00\x00\xd2\x40\xd7\x58\x5d\x6b\x0d\xfd\xf4\
+\xcc\x2f\x7c\x0b\x00\xda\x53\x8c\x02\x00\x00\x90\x16\x3e\xd5\xd8\
+\xb3\xb5\x3e\x94\x48\x24\xce\xfe\x6e\x28\x14\xea\x52\x0f\x35\x5e\
+\x9f\x75\x7d\x45\x85\xbc\xf4\xf2\x3e\xc9\xc9\xc9\xe1\x93\x02\x00\
+\xc0\x27\xf3\xf3\xf3\x72\xd3\x0d\xd7\x4b\x5f\x6f\xaf\xc9\xd3\x74\
+\xab\x9a\x5f\x7b\xb1\x11\x00\xed\x69\x93\x67\xd6\x2f\xec\xd9\x9f\
+\x70\x33\x20\x00\x00\x7e\xd2\xb5\xd5\xb0\xf8\x5f\x50\xe3\xcf\x0f\
+\x00\x8f\x9b\x3e\xfb\x97\x1e\x7d\x94\x4f\x0a\x00\x00\x1f\xf9\x54\
+\x5b\x1f\xbf\x64\x00\x48\x24\x12\x2f\xa9\x07\xa3\x3b\xf9\x5e\xdc\
+\xbb\x97\xce\x80\x00\x00\xf8\x44\xd7\x54\x5d\x5b\x0d\x1d\x4c\xd5\
+\xf8\x4b\x8e\x00\xf8\x32\x0a\xf0\xc5\x47\xbe\xc0\x27\x06\x00\x80\
+\x0f\x7c\xaa\xa9\x17\xd4\xf6\x8b\x05\x80\x6f\xe9\xc1\x00\x93\x9f\
+\xb2\x67\xf7\x6e\xd9\xfb\xc2\x0b\x7c\x6a\x00\x00\x18\xd0\xb5\x54\
+\xd7\x54\x43\x89\x54\x6d\xbf\x7c\x00\x48\x24\x12\x7a\x26\xc0\x0e\
+\xd3\x9f\xf6\x99\x87\x1f\xe6\x93\x03\x00\xe0\xea\xd7\xd2\x1d\xa9\
+\xda\xfe\xaa\x23\x00\xda\x57\x4d\x7f\xda\xcf\x7f\xf6\x3c\x7d\x01\
+\x00\x00\xf0\x48\xd7\x50\x5d\x4b\x7d\x70\xd1\x9a\x7e\x4e\x1f\x80\
+\xb3\xbf\x19\x0a\x2d\x53\x0f\x7a\x75\x9f\xb0\xc9\x4f\x5c\xbb\x76\
+\xad\xec\xfe\xaf\x17\xa4\xb4\xb4\x94\x4f\x12\x00\x80\x25\x1a\x1e\
+\x1e\x96\xdb\x5e\x77\x8b\x0c\x0e\x0e\x9a\x3e\x55\xa7\xda\x9a\x54\
+\xad\x9f\x5d\xd2\x08\x40\xea\x3f\xfc\xac\xe9\x4f\xd5\x2f\xfc\x73\
+\x9f\xf9\x5b\x3e\x49\x00\x00\xae\x80\xae\x9d\x3e\x14\x7f\xed\xb3\
+\x17\x2b\xfe\x97\x1c\x01\x48\x8d\x02\x14\xa8\x87\x23\x6a\xab\x32\
+\xf9\xc9\xb9\xb9\xb9\xf2\xc3\x6d\x3f\x91\xeb\xae\xbf\x9e\x4f\x14\
+\x00\x80\x57\xb1\x7f\xdf\x3e\x79\xcb\xd6\x3b\x65\x6e\x6e\xce\xf4\
+\xa9\xe2\x6a\x6b\x50\x75\x7e\xea\x62\x7f\x78\xc9\x9e\xbd\xa9\x1d\
+\x3e\x6f\xfa\xd3\xf5\x1b\x78\xff\xfb\xfe\x50\xc6\xc6\xc6\xf8\x54\
+\x01\x00\xb8\x0c\x5d\x2b\x75\xcd\xf4\xa1\xf8\x6b\x9f\xbf\x54\xf1\
+\xbf\x6c\x00\x48\xf9\x17\xb5\x0d\x98\xbe\x82\xa3\x47\x8e\xc8\x9f\
+\x7d\xf8\xc3\x7c\xb2\x00\x00\x5c\x86\xae\x95\xba\x66\xfa\x60\x20\
+\x55\xc3\xc5\x53\x00\x50\xc9\x61\x42\x3d\xf8\xd2\x81\xe0\xe9\xef\
+\x3d\x25\xdf\xfc\xc6\xd7\xf9\x74\x01\x00\xb8\x08\x5d\x23\x75\xad\
+\xf4\xc9\x17\x52\x35\xfc\x92\x2e\x79\x0f\xc0\xd9\xff\x60\xe1\x5e\
+\x00\xbd\x00\x71\x93\xe9\xab\x29\x28\x28\x90\x1f\x3c\xb3\x4d\x36\
+\x6f\xd9\xc2\x27\x0d\x00\x40\xca\x81\x68\x54\xee\xbe\x6b\xab\x4c\
+\x4d\x4d\xf9\xf1\x74\x7a\x16\xdf\x75\x97\x1b\xfe\x7f\xd5\x11\x80\
+\xd4\x28\x80\x7e\x82\x0f\xf8\xf1\x8a\xf4\x1b\x7b\xd7\x3b\xdf\xe1\
+\xc7\x8a\x46\x00\x00\x04\x82\xae\x89\xba\x36\xfa\x54\xfc\xb5\x0f\
+\xbc\x5a\xf1\x5f\x52\x00\x48\x85\x80\x67\xd4\x83\x2f\xe3\x12\xb1\
+\xee\x6e\xf9\xfd\xfb\xee\x95\xd3\x43\x43\x7c\xea\x00\x00\xa7\xe9\
+\x5a\xa8\x6b\xa2\xae\x8d\x3e\x79\x2a\x55\xb3\x5f\xd5\xab\x5e\x02\
+\x38\xfb\x1f\x86\x42\xd5\xb2\xb0\x52\x60\x89\x1f\xaf\xf0\xe6\x5b\
+\x6e\x91\x27\x9e\xfe\x0f\x29\x2c\x2c\xe4\x0c\x00\x00\x38\x67\x72\
+\x72\x52\xee\xbf\xe7\x77\xfd\x5c\x3b\x67\x54\x6d\x9b\x54\x5d\x8f\
+\x2d\xe5\x3f\xce\x59\xea\xb3\xa6\x9e\xf0\x53\x7e\xbd\x4a\xfd\x86\
+\xdf\xf7\xe0\x83\x32\x3b\x3b\xcb\x59\x00\x00\x70\x8a\xae\x7d\xba\
+\x06\xfa\xbc\x70\xde\xa7\x96\x5a\xfc\xaf\x68\x04\x20\x35\x0a\xa0\
+\x5b\x04\xeb\xf5\x84\x7d\xeb\xea\x73\xe7\xd6\xbb\xe4\x2b\x8f\x3d\
+\xc6\x48\x00\x00\xc0\x99\x6f\xfe\xba\xf8\xff\x64\xdb\x33\x7e\x3e\
+\xed\x3e\xb5\xdd\x74\xa9\xae\x7f\xc6\x01\x20\x15\x02\x36\xaa\x87\
+\x17\xd5\x56\xec\xd7\xab\xd6\x97\x03\x1e\xff\xf6\x77\xa4\xac\xbc\
+\x9c\x33\x03\x00\x10\x58\xfa\x9a\xff\x03\x6f\x7f\x9b\xdf\xdf\xfc\
+\x75\xa7\xbd\xd7\xaa\x7a\x7e\xe8\x4a\x76\xca\xb9\xd2\x9f\x92\xfa\
+\x01\xef\xf7\xf3\x95\xeb\x03\xf1\x3b\xbf\xf9\xdf\x98\x1d\x00\x00\
+\x08\x2c\x5d\xe3\x74\xad\xf3\xb9\xf8\x6b\xef\xbf\xd2\xe2\xef\x29\
+\x00\xa4\x42\xc0\x37\xc5\x87\x25\x83\x17\x3b\x7c\xe8\x90\xfc\xd6\
+\xdd\x6f\x49\xce\x85\x04\x00\x20\x48\x74\x6d\xd3\x35\x4e\xd7\x3a\
+\x9f\x7d\x35\x55\x93\xaf\x58\x8e\xc1\x0f\xd5\xbd\x01\x5a\xfc\x7c\
+\x17\x7a\x1a\x84\x6e\x84\x40\xc7\x40\x00\x40\x50\xe8\x9a\xa6\x6b\
+\x9b\x8f\x53\xfd\xce\x68\x11\x83\x3e\x3d\x57\x7c\x0f\xc0\x39\x3b\
+\x87\x42\x9b\xd4\xc3\x5e\xf1\xf1\x7e\x80\x33\xee\x79\xeb\xbd\xf2\
+\xf7\xff\xf0\x0f\x52\x5c\x5c\xcc\xd9\x03\x00\xb0\x8e\x5e\xd8\x47\
+\xf7\xf6\xf7\xb1\xbd\xef\x39\x4f\xaf\xb6\x9b\x55\x0d\x3f\x78\x55\
+\x02\x40\x2a\x04\xfc\xb6\x7a\x78\x5a\x6d\xb9\x7e\xbf\xbb\xfa\x86\
+\x06\xf9\xf2\x57\xfe\x95\xa5\x84\x01\x00\x56\xd1\x4b\xfa\xea\x55\
+\xfd\x7c\x5a\xd8\xe7\x7c\x7a\xa9\xc0\x7b\x54\xfd\xfe\xbe\xc9\x93\
+\xe4\x98\xbe\x8a\xd4\x0b\x78\x5f\x3a\xde\xa1\x3e\x70\x7a\x4d\xe4\
+\xbf\xfa\xf3\x8f\xcb\xf0\xf0\x30\x67\x14\x00\x20\xab\xe9\x5a\xa5\
+\x6b\x96\xae\x5d\x69\x2a\xfe\xda\xfb\x4c\x8b\xbf\x2f\x23\x00\x8b\
+\x46\x02\xfe\x4c\x3d\x7c\x2e\x5d\xef\x76\xed\xda\xb5\xf2\xc9\x4f\
+\x7d\x5a\xee\xbd\xff\x7e\xce\x30\x00\x40\xd6\x79\xea\x89\x27\xe4\
+\xd3\x7f\xfd\x49\x19\x1c\x1c\x4c\xe7\x8f\xf9\xb8\xaa\xdb\x7f\xef\
+\x4b\xdd\xf6\x2b\x00\xa4\x42\x80\x5e\x3a\xf8\x23\xe9\x7c\xe7\xaf\
+\xff\xd5\x37\xc8\x5f\x7e\xe2\x13\xc9\xde\x01\x00\x00\x5c\x6d\x7a\
+\x5a\xdf\x67\x1e\x7e\x58\x7e\xfe\xb3\xe7\xd3\xfd\xa3\x1e\x51\x35\
+\xfb\xa3\xbe\xd5\x6c\x9f\x03\x40\x48\x3d\x7c\x4d\x6d\x7f\x90\xee\
+\xa3\x70\xeb\x6d\xb7\xc9\x87\x3e\xf2\x51\xb9\xed\xf6\xdb\x39\xfb\
+\x00\x00\x19\xb7\x7b\xd7\x2e\xf9\xe2\x23\x5f\x90\x3d\xbb\x77\x67\
+\xe2\xc7\x7d\x43\x6d\xef\x4e\xf8\x58\xb4\x7d\x0d\x00\xa9\x10\xa0\
+\xdb\x05\xff\x5b\x26\x42\x80\xf6\xda\x9b\x6f\x96\x0f\x3e\xf4\x90\
+\xdc\x71\xe7\x56\xc9\xc9\xc9\xe1\x8c\x04\x00\xa4\xcd\xfc\xfc\xbc\
+\x3c\xfb\x93\x6d\xf2\xa5\x47\x1f\x95\x17\xf7\xee\xcd\xd4\x8f\xd5\
+\xc5\xff\xbd\x57\xd2\xe6\xf7\xaa\x04\x80\x45\x23\x01\x9f\x97\x34\
+\x5f\x0e\x58\x6c\x7d\x45\x85\xbc\xf5\xde\xfb\x92\xf7\x08\x6c\xdc\
+\xb4\x89\xb3\x14\x00\xe0\x9b\x43\x07\x0f\x26\xaf\xf1\x7f\xef\xa9\
+\x27\x33\xdd\xb5\xf6\x11\xb5\x7d\x2c\x91\x86\x62\x9d\x96\x00\xb0\
+\x28\x08\xa4\xf5\xc6\xc0\x4b\xd9\x72\xed\x75\x72\x9f\x0a\x02\x77\
+\x6c\xdd\x2a\x8d\x4d\x4d\x9c\xb9\x00\x80\x2b\xd6\xde\xd6\x26\xcf\
+\x6e\xdb\x26\x4f\xaa\xc2\x1f\x6d\xd9\x7f\x35\x5e\x82\x6f\x37\xfc\
+\x65\x3c\x00\xa4\x42\xc0\x83\xea\xe1\x2b\x92\x86\x3e\x01\x4b\x1a\
+\x19\x58\xbf\x5e\x6e\xbd\xfd\x8d\xc9\x7b\x05\xf4\x56\x5d\x53\xc3\
+\x59\x0d\x00\xb8\x80\xee\xd4\xa7\xaf\xeb\xeb\x6d\xcf\xae\x9d\xd2\
+\xd7\xd7\x77\xb5\x5e\x8a\x9e\xe7\xaf\xa7\xfa\x3d\x96\xd6\xfa\x9c\
+\xee\x00\x90\x0a\x01\xba\x59\xd0\xb7\x25\x0d\x1d\x03\xaf\x94\x9e\
+\x4e\xd8\xd8\xd4\x2c\x0d\x8d\x8d\xd2\xa8\xb7\xe6\x26\x89\xd4\x37\
+\x48\x79\x59\x99\x94\xac\x28\x91\xfc\xfc\x02\xfe\x16\x00\x40\x00\
+\x4d\x4f\x4f\xc9\xe8\xc8\xa8\x0c\x9d\x3e\x2d\x1d\x47\x8f\x48\x7b\
+\x6b\x9b\xb4\xb7\xb7\xcb\x11\xb5\xb5\xb7\xb5\xa6\x7b\xfa\xde\x52\
+\xe9\x0e\x7f\x6f\xf7\x63\x9e\x7f\x56\x04\x80\x54\x08\xd0\x17\xe6\
+\x9f\x50\xdb\xb5\xd9\x7c\x82\xe4\xe5\xe5\xc9\xf2\xe2\x62\x29\x29\
+\x29\x91\xc2\xc2\x42\xfe\xc6\x00\x80\xc5\x26\x27\x27\x65\x74\x74\
+\x54\xc6\xc7\xc6\x64\x66\x66\x26\xdb\x5f\xae\xee\xed\x7f\xbf\x49\
+\x7b\xdf\xac\x0c\x00\xa9\x10\x50\xa4\x1e\xfe\x51\x6d\xef\xe1\xb4\
+\x04\x00\xe0\x2c\xbd\xc2\xee\x07\x54\x4d\x9e\xc8\x58\x4d\xce\x64\
+\x00\x58\x14\x04\xde\xa9\x1e\xbe\x2c\x59\x70\x49\x00\x00\x80\xab\
+\x48\x0f\xf9\xbf\xdf\xeb\x92\xbe\xd6\x05\x80\x54\x08\xd8\xa8\x1e\
+\xbe\xab\x36\x56\xfa\x01\x00\xb8\x68\x9f\xda\x7e\x4f\xd5\xe1\x43\
+\x57\xe3\x87\x5f\xb5\xce\x39\xa9\x37\x7c\x93\xda\x3e\xa6\xb6\x51\
+\xce\x03\x00\x80\x23\x46\x53\xb5\xef\xa6\xab\x55\xfc\xaf\xea\x08\
+\xc0\x79\xa3\x01\xd5\xea\xe1\x51\xb5\xdd\xcb\x79\x01\x00\x08\xb0\
+\xa7\xd4\xf6\x90\xaa\xbd\xb1\xab\x5e\x7b\xb3\x21\x00\x2c\x0a\x02\
+\x77\xc9\xc2\x4d\x82\x74\xef\x01\x00\x04\x49\x9b\x2c\xdc\xe4\xf7\
+\x4c\xb6\xbc\xa0\xac\x6a\x9e\x9f\x3a\x30\xd7\xa9\x4d\x77\x10\x1c\
+\xe0\x7c\x01\x00\x58\x6e\x20\x55\xd3\xae\xcb\xa6\xe2\x9f\x75\x23\
+\x00\xe7\x8d\x06\xe8\x29\x83\x7f\x24\x0b\xd7\x49\xaa\x38\x87\x00\
+\x00\x16\x89\xcb\xc2\x9a\x38\xff\x92\xc9\xa9\x7d\x81\x08\x00\x8b\
+\x82\x80\x6e\xcd\xf7\x6e\xb5\xfd\xb9\xda\xc2\x9c\x53\x00\x80\x2c\
+\xd6\xa9\xb6\xcf\xaa\xed\x6b\xaa\xbe\x4e\x65\x75\x7d\xcd\xf6\x00\
+\xb0\x28\x08\xe8\x65\x86\xdf\x26\x0b\x4d\x84\x7e\x4d\xff\x16\xe7\
+\x19\x00\x20\x0b\xe8\x42\xba\x43\x16\x9a\xf9\x7c\xc7\xef\x65\x7b\
+\x9d\x0f\x00\xe7\x85\x81\x5a\xf5\xf0\x0e\xb5\x3d\xa0\x36\xd6\xfe\
+\x05\x00\x5c\x0d\xba\x65\xef\xe3\x6a\xfb\x96\xaa\xa5\x5d\xd6\xd5\
+\x52\x1b\x03\xc0\x79\x61\xe0\xa6\x54\x10\xb8\x47\x6d\x2c\xf5\x07\
+\x00\x48\xa7\x6e\xb5\x3d\xad\x0b\xbf\xaa\x9f\x2f\x59\x5d\x3f\x6d\
+\x0f\x00\xe7\x85\x81\x66\xf5\x70\x87\xda\xde\xac\xb6\x37\xa9\x6d\
+\x35\xe7\x2a\x00\xc0\xc0\x09\xb5\x3d\xa7\xb6\x9f\xaa\xed\x59\x55\
+\x33\x5b\x03\x53\x33\x83\x14\x00\xce\x0b\x03\x7a\x8a\xe3\x0d\xa9\
+\x40\x70\xa3\xda\x36\xa8\x4d\x07\x84\x12\xce\x67\x00\xc0\x45\xe8\
+\x0e\x7d\xba\xc0\x1f\x56\xdb\x2f\x74\xc1\x57\xdb\xcb\xaa\x4e\xce\
+\x07\xb2\x4e\x06\x35\x00\x5c\x26\x18\x54\xa6\x82\xc0\x99\x40\xa0\
+\xff\xf7\x8a\x8b\x6c\xa5\x6a\x2b\xe2\xef\x03\x00\x58\x4d\x4f\xc1\
+\x1b\x56\xdb\xc8\x45\xb6\x9e\x45\x05\xbf\x55\xd5\xc3\x1e\x97\x0e\
+\xcc\xff\x07\x1a\x23\xb7\x60\xb4\x57\x1e\x76\x00\x00\x00\x00\x49\
+\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x39\x9b\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x12\x56\x00\x00\x12\x56\
+\x01\x33\xb0\xfd\x65\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x39\x18\x49\x44\
+\x41\x54\x78\xda\xed\x9d\x77\x98\x55\xc5\xc1\xb8\xd9\xde\x97\x85\
+\xdd\xa5\x6c\x85\xa5\x2d\x6d\x61\xa9\x4b\x5f\x58\x9a\x46\x8d\x25\
+\xd1\x68\x34\x36\x34\x76\x13\x1b\x1a\x8d\x1d\x8d\x0d\xa5\x0a\x62\
+\x47\xb0\x21\x28\x22\x20\x08\x22\x0a\x82\x54\x05\x6b\x8c\x15\xc1\
+\x82\x51\x63\x89\x05\x9c\x6f\xe6\xe6\xe2\xb7\x2a\x65\xcb\xcc\x39\
+\x73\xce\xbc\x3c\xcf\xfb\xfc\x7e\x7f\x7c\x8f\xd9\x7b\xce\xcc\x79\
+\xdf\x7b\xee\x39\x33\x0d\x84\x10\x0d\x5c\x45\xfe\x4b\x94\x0c\x97\
+\x5c\x2f\x79\x40\xf2\xb4\xe4\x55\xc9\xbf\x25\x1f\x4a\x36\x48\xe6\
+\x4b\x6e\x97\x8c\x96\x74\x71\xf9\x78\x01\x00\x54\xbb\x7e\xc6\x49\
+\xfa\x4a\x2e\x97\xdc\x2d\x59\x24\xd9\x24\xd9\x2e\xf9\x38\xfa\xff\
+\x5f\x2c\xb9\x4f\x72\x95\x64\xa0\x24\x9e\x63\x67\xd1\x39\x74\x70\
+\xd0\xa6\x4a\x8e\x97\xcc\x96\x7c\x29\x11\xb5\xe4\x7d\xc9\x54\xc9\
+\xfe\x92\x18\x06\x11\x00\x38\x74\xfd\x4c\x90\xfc\x41\x32\x43\xf2\
+\x69\x1d\xae\x9f\x9f\x4b\x66\x49\x8e\x55\x5f\xc0\x38\xa6\x04\x80\
+\x57\x03\x37\x49\x72\xa6\x64\x5b\x1d\x06\xed\x9e\x58\x27\x19\xc9\
+\x40\x02\x80\x90\x5f\x3f\x63\x25\xc7\x48\xfe\xa5\xf1\xfa\xf9\xae\
+\x64\x14\x77\x05\x08\x00\xd3\x03\xf7\x24\xc9\x7b\x1a\x07\xee\x2f\
+\x59\x2e\xe9\xc3\x80\x02\x80\x10\x5e\x43\x7f\x2b\xd9\x6c\xf0\xfa\
+\xf9\xa6\xe4\x28\x8e\x35\x01\xa0\x7b\xe0\x66\x49\xe6\x19\x1c\xb8\
+\xd5\xd9\x21\x39\x87\x41\x05\x00\x21\xb9\x7e\xc6\x4b\x26\x78\x74\
+\xfd\x14\xd1\xe7\x08\x92\x39\xf6\x04\x80\x8e\xc1\xdb\x51\xf2\x86\
+\x87\x83\xb7\xfa\x20\x4e\x62\x70\x01\x40\x80\xaf\x9f\xd9\x92\x25\
+\x3e\x5c\x3f\xd7\x4a\x8a\x38\x07\x04\x40\x7d\x06\xef\x21\x75\x7c\
+\xc0\x4f\x17\xab\x24\x4d\x19\x60\x00\x10\xc0\xeb\x67\x07\xcd\xbf\
+\xf5\xd7\x96\x4f\xd4\x1b\x03\x9c\x0b\x02\xa0\x2e\x83\xf7\x8f\xd1\
+\xdb\xf1\xc2\x67\xd4\xeb\x84\xcd\x18\x64\x00\x10\xa0\xeb\x67\xe7\
+\xe8\x2b\x7c\x7e\x5f\x3f\xbf\x96\x0c\xe1\x9c\x10\x00\x41\x94\x3f\
+\x11\x00\x00\xc8\xbf\xfe\x11\x30\x98\x73\x43\x00\x04\x51\xfe\x44\
+\x00\x00\x20\x7f\x22\x80\x00\x70\x54\xfe\x44\x00\x00\x20\x7f\x22\
+\x80\x00\x70\x54\xfe\x44\x00\x00\x20\x7f\x22\x80\x00\x70\x54\xfe\
+\x44\x00\x00\x20\x7f\x22\x80\x00\x70\x54\xfe\x44\x00\x00\xd8\x24\
+\xff\x4f\x02\x78\xfd\x24\x02\x5c\x0f\x80\x00\xcb\x9f\x08\x00\x00\
+\xe4\x4f\x04\x10\x00\x8e\xca\x9f\x08\x00\x00\xe4\x4f\x04\x10\x00\
+\x8e\xca\x9f\x08\x00\x00\xe4\x5f\xff\x08\xa8\xe4\xdc\x3a\x10\x00\
+\x21\x94\x3f\x11\x00\x00\xc8\x9f\x08\x20\x00\x1c\x95\x3f\x11\x00\
+\x00\xc8\x9f\x08\x20\x00\x6c\x91\x7f\x76\x76\x8e\x48\x49\x49\x21\
+\x02\x00\x00\xf9\xd7\x92\xcc\xcc\x4c\x91\xd5\xa8\x11\x11\x40\x00\
+\x04\x4b\xfe\x3d\x7b\xf5\x12\x4b\x97\x3f\x2b\xb6\x6d\xff\x54\x7c\
+\xf0\xf1\x27\xe2\x96\x09\x13\x45\x46\x46\x06\x11\x00\x00\xc8\x7f\
+\x1f\x34\x6b\xde\x5c\xdc\xff\xd0\xc3\x91\xeb\xa7\xe2\xd1\x79\xf3\
+\x44\x49\x49\x09\x11\x40\x00\xd8\x2f\xff\x11\x23\x47\x8a\xf7\xb6\
+\x6e\xfb\x69\xf0\xee\xe2\x89\x27\x17\x45\x8a\x96\x08\x00\x00\xe4\
+\xbf\x7b\x0a\x0a\x0b\xc5\x0b\xeb\x37\xfc\xea\xfa\xb9\xf9\xf5\xd7\
+\x45\xfb\x0e\x1d\x88\x00\x02\x20\x78\xf2\x27\x02\x00\x00\xf9\xd7\
+\x4d\xfe\x44\x00\x01\x10\x78\xf9\x13\x01\x00\x80\xfc\xeb\x26\x7f\
+\x22\x80\x00\x08\xbc\xfc\x89\x00\x00\x40\xfe\x75\x93\xbf\xcf\x11\
+\x30\x88\xb1\x11\x80\x00\xb0\x5d\xfe\xbb\x98\xbf\x68\x31\x11\x00\
+\x00\xc8\xbf\x16\xf2\xf7\x31\x02\xbe\x22\x02\x2c\x0f\x80\xa0\xc8\
+\x9f\x08\x00\x00\xe4\x5f\x37\xf9\x13\x01\x04\x40\xe0\xe5\x4f\x04\
+\x00\x00\xf2\xaf\xdf\xf5\x93\x08\x20\x00\x02\x2b\x7f\x22\x00\x00\
+\x90\x3f\x11\x40\x00\x38\x2a\x7f\x22\x00\x00\x90\x3f\x11\x40\x00\
+\x38\x2a\x7f\x22\x00\x00\x90\x3f\x11\x40\x00\x38\x2a\x7f\x22\x00\
+\x00\x90\x3f\x11\x40\x00\x38\x2a\x7f\x22\x00\x00\x90\x7f\x20\x23\
+\x60\x20\x01\x80\xfc\x89\x00\x00\x40\xfe\x3e\xc9\x9f\x08\x08\x71\
+\x00\xb8\x22\x7f\x22\x00\x00\x0c\x5c\x3f\xcb\x5c\x90\x3f\x11\x10\
+\xc2\x00\x70\x4d\xfe\x44\x00\x00\x20\x7f\x22\xc0\xf9\x00\x70\x55\
+\xfe\x44\x00\x00\x20\x7f\x22\xc0\xd9\x00\x70\x5d\xfe\x44\x00\x00\
+\x20\x7f\x22\xc0\xb9\x00\x40\xfe\x44\x00\x00\x20\x7f\x22\xc0\xb1\
+\x00\x40\xfe\x44\x00\x00\x20\x7f\x22\xc0\xb1\x00\x40\xfe\x44\x00\
+\x00\x20\x7f\x22\xc0\xb1\x00\x40\xfe\x44\x00\x00\x20\xff\x10\x46\
+\xc0\x00\x02\x00\xf9\x13\x01\x00\x80\xfc\x89\x00\x02\x00\xf9\x13\
+\x01\x00\x80\xfc\x89\x00\x47\x03\x00\xf9\x13\x01\x00\x80\xfc\x1d\
+\x89\x80\x2f\xc3\x16\x01\xc8\x9f\x08\x00\x00\xe4\x4f\x04\x38\x18\
+\x01\xc8\x9f\x08\x00\x00\xe4\x4f\x04\x38\x18\x01\xc8\x9f\x08\xe0\
+\xa2\x0c\x80\xfc\x89\x00\x07\x23\x00\xf9\x13\x01\x44\x00\x00\xf2\
+\x27\x02\x1c\x8c\x00\xe4\x4f\x04\x10\x01\x00\xc8\x9f\x08\xa8\x7b\
+\x04\xf4\x0f\x75\x00\x20\x7f\x22\x00\x00\x90\x3f\x11\x10\xae\x08\
+\x40\xfe\x44\x00\x11\x00\x80\xfc\x89\x00\x07\x23\x00\xf9\x13\x01\
+\x44\x00\x00\xf2\x27\x02\x1c\x8c\x80\xbd\x0d\xde\xc3\x90\x3f\x11\
+\x00\x00\xc8\x9f\x08\xa8\x55\x04\x74\x0b\x74\x00\xc8\x7f\x9d\xa3\
+\x4b\x1f\x22\x7f\x22\x00\x00\x90\x3f\x11\x50\x73\xde\x91\xe4\x04\
+\x32\x00\xe4\xbf\x2c\xc9\x9b\xc8\x9f\x08\x20\x02\x00\x90\x3f\x11\
+\x50\x27\x96\x48\xe2\x02\x15\x00\xf2\x5f\xac\x64\x3e\xf2\x27\x02\
+\x88\x00\x00\xe4\x4f\x04\xd4\x8b\x9b\x82\x16\x00\xa7\x22\x7f\xbb\
+\x59\xb0\xf8\x29\x22\x00\x00\xf9\x23\xff\x60\x44\x40\xdf\x40\x04\
+\x80\xfc\x97\x22\xf9\x00\xf9\x13\x01\x44\x00\x00\xf2\x27\x02\xb4\
+\xb0\x2c\x28\x01\x70\x2e\xf2\x27\x02\x88\x00\x00\xe4\x4f\x04\x68\
+\x65\xb8\xd5\x01\x20\xff\x65\x78\x31\x88\x91\x3f\x11\x00\x10\x32\
+\xf9\x6f\x47\xfe\x44\xc0\x3e\x58\x63\x7b\x00\x9c\x82\xfc\x89\x00\
+\x22\x00\x00\xf9\x13\x01\x46\xe8\x67\x73\x00\x3c\x86\xfc\x89\x00\
+\x22\x00\x00\xf9\x13\x01\x46\xb8\xc6\xd2\xb1\xdc\x20\x31\xba\x7a\
+\x11\xf2\x27\x02\x88\x00\x00\xe4\x4f\x04\xe8\x67\xa3\xad\x01\x30\
+\x18\xf9\x13\x01\x44\x00\x00\xf2\x27\x02\x8c\x46\x40\xbe\x8d\x01\
+\x70\x15\xf2\x27\x02\x88\x00\x00\xe4\x4f\x04\x18\x8d\x80\xa3\x6d\
+\x0c\x80\xbb\x91\x3f\x11\x40\x04\x00\xec\xf1\x22\xd9\x05\xf9\x13\
+\x01\x1a\xb8\xd0\xc6\x00\x58\xa0\xf3\x43\xf6\xae\xe8\x83\xfc\x89\
+\x00\x00\xe4\x8f\xfc\x03\x1d\x01\xcd\x9a\x35\xd3\x7d\x7e\x6f\xb1\
+\x31\x00\x36\xe8\xfc\x90\xcf\xac\x58\xc9\x00\x22\x02\x90\x07\x20\
+\x7f\xe4\x1f\x68\x26\x4d\x9d\xaa\xfb\x1c\xdf\x6f\x63\x00\x6c\xd5\
+\xf5\x01\x1b\x66\x65\x31\x70\x88\x00\x22\x00\x90\x3f\xf2\x0f\x3c\
+\x1b\x5f\x7e\x45\xf7\x79\x5e\x6a\x63\x00\xbc\xab\xeb\x03\x26\x24\
+\x24\x88\xf7\xb6\x7d\xc8\xe0\x21\x02\x88\x00\x40\xfe\xc8\x3f\xd0\
+\x3c\xfb\xfc\x2a\xdd\xe7\xfa\x49\x1b\x03\x60\xb5\xce\x0f\x79\xc3\
+\xd8\xb1\x0c\x1e\x22\x80\x08\x00\xe4\x8f\xfc\x03\xcd\xc9\xa7\x9e\
+\xaa\xfb\x7c\xdf\x63\x63\x00\xcc\xd5\xf9\x21\x53\x53\x53\xc5\x63\
+\xf3\x9e\x60\x00\xd9\x1a\x01\x0d\x1b\x12\x01\x00\xc8\x1f\xf6\xf6\
+\xfb\xff\x94\x29\x22\x36\x36\x56\xf7\x39\xbf\xde\xc6\x00\x98\xa6\
+\x7b\x60\xa7\xa5\xa5\x11\x01\x44\x00\x11\x00\xc8\x1f\xf9\x07\x52\
+\xfe\x71\x71\x71\x26\xce\xfb\x39\x36\x06\xc0\x05\x26\x06\x38\x11\
+\x40\x04\x10\x01\x80\xfc\x91\x3f\xf2\xff\x89\x03\x6d\x0c\x80\x4e\
+\xa6\x06\x3a\x11\x40\x04\x10\x01\x80\xfc\x91\x3f\xf2\x6f\xf0\x5f\
+\x49\xaa\xad\xbb\x01\xbe\x45\x04\x10\x01\x44\x00\x20\x7f\xe4\x8f\
+\xfc\x8d\x30\xdf\xe6\xed\x80\xc7\x9b\x1c\xf8\x44\x00\x11\x40\x04\
+\x00\xf2\x47\xfe\x8e\xca\x5f\x71\xaa\xcd\x01\x30\xc8\xf4\x04\x20\
+\x02\x88\x00\x22\x00\x90\x3f\x38\x28\xff\x1f\x6c\xdc\x09\xf0\xa7\
+\x00\x88\x4e\x8a\xe5\x44\x00\x11\x40\x04\x00\xf2\x47\xfe\xc8\x5f\
+\x2b\xd3\xac\x9d\x0f\xd5\x26\x46\x7f\x2f\x26\x04\x11\x40\x04\x10\
+\x01\x80\xfc\xc1\x11\xf9\x7f\x2b\x29\xb4\x3e\x00\xa2\x13\x64\x3e\
+\x11\x40\x04\x10\x01\x80\xfc\x91\x3f\xf2\xd7\xc2\x38\xab\xe7\xc5\
+\x6e\x26\xc9\x77\x44\x00\x11\x40\x04\x00\xf2\x47\xfe\xc8\xbf\x5e\
+\xfc\x5b\xd2\x34\x30\x01\x10\x9d\x2c\x27\x79\x35\x51\x88\x00\x22\
+\x80\x08\x00\xe4\x0f\x21\x94\xff\x0e\xc9\x30\xeb\xe7\xc7\x1e\x26\
+\xcd\x64\x22\x00\x88\x00\x40\xfe\xc8\x1f\xf9\xd7\x89\xbf\x06\x62\
+\x8e\xec\x61\xe2\x24\x48\x9e\x21\x02\x80\x08\x00\xe4\x8f\xfc\x91\
+\x7f\xad\xb8\x2b\x30\xf3\x64\x2f\x13\x28\x47\xf2\x12\x11\x00\x44\
+\x00\x20\x7f\xe4\x8f\xfc\x6b\xc4\x42\x49\x52\xe0\x03\x20\x3a\x91\
+\x72\x89\x00\x20\x02\x00\xf9\x23\x7f\xe4\x5f\x23\xf9\x27\x07\x6a\
+\xbe\xd4\x60\x42\x11\x01\x40\x04\x00\xf2\x47\xfe\xc8\x3f\x44\xf2\
+\xaf\x51\x00\x10\x01\x50\x9d\x85\x4f\x2d\x21\x02\x00\xf9\x23\x7f\
+\xe4\x1f\x70\xf9\xd7\x38\x00\x88\x00\x20\x02\x00\xf9\x23\x7f\xe4\
+\x1f\x1e\xf9\xd7\x2a\x00\x88\x00\x20\x02\x00\xf9\x23\x7f\xe4\x1f\
+\x0e\xf9\xd7\x3a\x00\x88\x00\x20\x02\x00\xf9\x33\xf7\x91\x7f\xf0\
+\xe5\x5f\xa7\x00\x20\x02\x80\x08\x00\xe4\x0f\xc8\x3f\x04\xf3\xa8\
+\x1e\x13\x90\x08\x00\x22\x00\x90\x3f\x20\x7f\xd7\x02\x80\x08\x00\
+\x22\x00\x90\x3f\x20\x7f\x47\x03\x80\x08\x00\x22\x00\x90\x3f\x20\
+\x7f\x47\x03\x80\x08\x00\x22\x00\x3c\x90\x7f\x57\xe4\x0f\xc8\xdf\
+\xc2\x00\x20\x02\x80\x08\x00\xe4\x0f\xc8\xdf\xd1\x00\x20\x02\x80\
+\x08\x00\xe4\x0f\xc8\xdf\xd1\x00\x20\x02\x80\x08\x00\xe4\x0f\xc8\
+\xdf\xd1\x00\x20\x02\x80\x08\x00\xe4\x0f\xc8\xdf\xd1\x00\x20\x02\
+\x80\x08\x00\xe4\x0f\xc8\xdf\xd1\x00\x20\x02\x80\x08\x00\xe4\x0f\
+\xc8\xdf\xd1\x00\x20\x02\x80\x08\x00\xe4\x0f\xc8\xdf\xd1\x00\x20\
+\x02\x80\x08\x00\xe4\x0f\xc8\xdf\xd1\x00\x20\x02\x80\x08\x00\xe4\
+\x0f\xc8\xdf\xd1\x00\x20\x02\x80\x08\x00\xe4\x0f\xc8\xdf\xd1\x00\
+\x20\x02\x80\x08\x00\xe4\x0f\xc8\xdf\xd1\x00\x20\x02\x80\x08\x80\
+\xa8\xfc\x3f\x45\xfe\x80\xfc\x1d\x0b\x00\x22\x00\x88\x00\xe4\x8f\
+\xfc\x01\xf9\x3b\x1a\x00\x44\x00\x10\x01\xc8\x1f\xf9\x23\x7f\xe4\
+\xef\x68\x00\x10\x01\x40\x04\x20\x7f\xe4\x8f\xfc\x91\xbf\xa3\x01\
+\x40\x04\x00\x11\x80\xfc\x91\x3f\xf2\x47\xfe\x8e\x06\x00\x11\x00\
+\x44\x00\xf2\x47\xfe\xc8\x1f\xf9\x3b\x1a\x00\x44\x00\x10\x01\xc8\
+\x1f\xf9\x23\x7f\xe4\xef\x68\x00\x10\x01\x40\x04\x20\x7f\xe4\x8f\
+\xfc\x91\xbf\xa3\x01\x40\x04\x00\x11\x80\xfc\x91\x3f\xf2\x47\xfe\
+\x8e\x06\x00\x11\x00\x44\x00\xf2\x47\xfe\xc8\x1f\xf9\x3b\x1a\x00\
+\x44\x00\x10\x01\xc8\x1f\xf9\x23\x7f\xe4\xef\x68\x00\x10\x01\x40\
+\x04\x20\x7f\xe4\x8f\xfc\x91\xbf\xa3\x01\x40\x04\x40\x75\x9e\x5c\
+\xb2\x94\x08\x40\xfe\xc8\x1f\xf9\x23\x7f\x57\x02\x80\x08\x00\x22\
+\x00\xf9\x23\x7f\xe4\x8f\xfc\x1d\x0d\x00\x22\x00\x88\x00\xe4\x8f\
+\xfc\x91\x3f\xf2\x77\x34\x00\x88\x00\x20\x02\x90\x3f\x63\x1f\xf9\
+\x23\x7f\x47\x03\x80\x08\x00\x22\x00\xf9\x03\xf2\x47\xe0\x8e\x06\
+\x00\x11\x00\x44\x00\xf2\x07\xe4\x0f\x8e\x06\x00\x11\x00\x44\x00\
+\xf2\x07\xe4\x0f\x8e\x06\x00\x11\x00\x44\x80\xa7\x73\xad\x1c\xf9\
+\x03\xf2\x27\x00\x88\x00\x22\x80\x08\x70\x28\x02\x90\x3f\x20\x7f\
+\x02\x80\x08\x20\x02\x02\x11\x01\x0d\xb3\xb2\x88\x00\xe4\x0f\xc8\
+\x1f\x5c\x08\x00\x22\x00\x88\x00\xe4\x0f\xc8\x1f\x1c\x0d\x00\x22\
+\x00\x88\x00\xe4\x0f\xc8\x1f\x1c\x0d\x00\x22\x00\x88\x00\xe4\x0f\
+\xc8\x1f\x1c\x0d\x00\x22\x00\x88\x00\xe4\x0f\xc8\x1f\x1c\x0d\x00\
+\x22\x00\x88\x00\xe4\x0f\xc8\x1f\x1c\x0d\x00\x22\x00\x88\x00\xe4\
+\x0f\xc8\x1f\x1c\x0d\x00\x22\x00\x88\x00\xe4\x0f\xc8\x1f\x1c\x0d\
+\x00\x22\x00\x88\x00\xe4\x0f\xc8\x1f\x1c\x0d\x00\x22\x00\x88\x00\
+\xe4\x0f\xc8\x1f\x1c\x0d\x00\x22\x00\x88\x00\xe4\x0f\xc8\x1f\x1c\
+\x0d\x00\x22\x00\x88\x00\xe4\x0f\xc8\x1f\x1c\x0d\x00\x22\x00\x5c\
+\x8e\x00\xe4\x0f\xc8\x1f\x9c\x0e\x00\x22\x00\x5c\x8c\x00\xe4\x0f\
+\xc8\x1f\x08\x00\x22\x00\x1c\x8b\x00\xe4\x0f\xc8\x1f\x08\x00\x22\
+\x00\x1c\x8b\x00\xe4\x0f\xc8\x1f\x08\x00\x22\x00\x1c\x8b\x00\xe4\
+\x0f\xc8\x1f\x08\x00\x22\x00\x1c\x8b\x00\xe4\x0f\xc8\x1f\x08\x00\
+\x22\x00\x1c\x8b\x00\xe4\x0f\xc8\x1f\x08\x00\x22\x00\x1c\x8b\x00\
+\xe4\x0f\xc8\x1f\x08\x00\x22\x00\x1c\x8b\x00\xe4\x0f\xc8\x1f\x08\
+\x00\x22\x00\x1c\x8b\x00\xe4\x0f\xc8\x1f\x08\x00\x22\x00\x1c\x8b\
+\x00\xe4\x0f\xc8\x1f\x08\x00\x22\x00\x1c\x8b\x00\xe4\x0f\xc8\x1f\
+\x08\x00\x22\x00\x0c\xb3\x68\xe9\xd3\x56\x45\x00\xf2\x07\xe4\x0f\
+\x04\x00\x11\x00\x8e\x45\x00\xf2\x07\xe4\x0f\x04\x00\x11\x00\x8e\
+\x45\x00\xf2\x07\xe4\x0f\x04\x00\x11\x00\x8e\x45\x00\xf2\x07\xe4\
+\x0f\x04\x00\x11\x00\xee\x45\xc0\xeb\x5e\xca\xbf\xb0\xa8\x08\xf9\
+\x23\x7f\xe4\x4f\x00\x00\x11\x00\x96\x44\x00\xdf\xfc\x91\x3f\xf2\
+\x07\x02\x80\x08\x00\x22\x00\xf9\x23\x7f\xe4\x0f\x04\x00\x11\x00\
+\x44\x00\xf2\x47\xfe\xc8\x1f\x08\x00\x22\x00\x88\x00\xe4\x8f\xfc\
+\x91\x3f\x10\x00\x44\x00\x10\x01\xc8\x1f\xf9\x23\x7f\x20\x00\x88\
+\x00\x20\x02\x90\x3f\xf2\x47\xfe\x04\x00\x10\x01\xe0\x64\x04\x20\
+\x7f\xe4\x8f\xfc\x09\x00\x20\x02\xc0\xb1\x08\x40\xfe\xc8\x1f\xf9\
+\x13\x00\x40\x04\x80\x63\x11\x80\xfc\x91\x3f\xf2\x27\x00\x80\x08\
+\x00\xc7\x22\x00\xf9\x23\x7f\xe4\x4f\x00\x00\x11\x00\x8e\x45\x00\
+\xf2\x47\xfe\xc8\x1f\x38\x08\x44\x00\x38\x16\x01\xc8\x1f\xf9\x23\
+\x7f\x20\x00\x88\x00\x70\x2c\x02\x90\x3f\xf2\x47\xfe\x40\x00\x10\
+\x01\xe0\x58\x04\x20\x7f\xe4\x8f\xfc\x81\x00\x20\x02\xc0\xb1\x08\
+\x40\xfe\xc8\x1f\xf9\x03\x01\x40\x04\x80\x63\x11\x80\xfc\x91\x3f\
+\xf2\x07\x02\x80\x08\x20\x02\x1c\x8b\x00\xe4\x8f\xfc\x91\x3f\x10\
+\x00\x44\x00\x11\xe0\x58\x04\x20\x7f\xe4\x8f\xfc\x81\x00\x20\x02\
+\x88\x00\xc7\x22\x00\xf9\x23\x7f\xe4\x0f\x04\x00\x11\x40\x04\x38\
+\x16\x01\xc8\x1f\xf9\x23\x7f\x20\x00\x88\x00\x22\xc0\xb1\x08\x40\
+\xfe\xc8\x1f\xf9\x03\x01\x40\x04\x10\x01\x8e\x45\x00\xf2\x47\xfe\
+\xc8\x1f\x08\x00\x22\x80\x08\x70\x2c\x02\x90\x3f\xf2\x47\xfe\x40\
+\x00\x10\x01\x44\x80\x63\x11\x80\xfc\x91\x3f\xf2\x07\x02\x80\x08\
+\x20\x02\x1c\x8b\x00\xe4\x8f\xfc\x91\x3f\x10\x00\x44\x00\x11\xe0\
+\x58\x04\x20\x7f\xe4\x8f\xfc\x81\x00\x20\x02\x88\x00\xc7\x22\x00\
+\xf9\x23\x7f\xe4\x0f\x04\x00\x11\x40\x04\x38\xc6\xe2\xa7\x9f\x46\
+\xfe\xc8\x1f\xf9\x03\x01\x40\x04\x10\x01\x00\xc8\x1f\x80\x00\x20\
+\x02\x88\x00\x00\xe4\x0f\x40\x00\x10\x01\x44\x00\x00\xf2\x07\x20\
+\x00\x88\x00\x22\x00\x00\xf9\x03\x10\x00\x44\x00\x11\x00\x80\xfc\
+\x81\x00\x00\x22\x80\x08\x00\x40\xfe\x40\x00\x00\x11\x40\x04\x00\
+\x20\x7f\x20\x00\x80\x08\x20\x02\x00\xf9\x23\x7f\x20\x00\x80\x08\
+\x20\x02\x00\xf9\x23\x7f\x20\x00\x80\x08\x40\x10\x80\xfc\x91\x3f\
+\x10\x00\x40\x04\x00\x20\x7f\xe4\x0f\x04\x00\x10\x01\x00\xc8\x1f\
+\xf9\x03\x01\x00\x44\x00\x00\xf2\x47\xfe\x40\x00\x00\x11\x00\x80\
+\xfc\x91\x3f\x10\x00\x40\x04\x00\x20\x7f\x00\x02\x00\x88\x00\x00\
+\xe4\x0f\x40\x00\x00\x11\x00\x80\xfc\x01\x08\x00\x20\x02\x00\x90\
+\x3f\x00\x01\x00\x44\x00\x00\xf2\x07\x20\x00\x80\x08\x00\x40\xfe\
+\x00\x04\x00\x10\x01\x00\xc8\x1f\x80\x00\x00\x22\x00\x90\x3f\xf2\
+\x07\x02\x00\x88\x00\x22\x00\x90\x3f\xf2\x07\x02\x00\x88\x00\x22\
+\x00\x90\x3f\xf2\x07\x02\x00\x88\x00\x22\x00\x90\x3f\xf2\x07\x02\
+\x00\x88\x00\x22\x00\x90\x3f\xf2\x07\x02\x00\x88\x00\x22\x00\x90\
+\x3f\xf2\x07\x02\x00\x88\x00\x22\x00\x90\x3f\xd7\x11\x20\x00\x80\
+\x08\x20\x02\x00\xf9\x03\x10\x00\x40\x04\x10\x01\x80\xfc\x01\x08\
+\x00\x20\x02\x88\x00\x40\xfe\x00\x04\x00\x10\x01\x44\x00\x20\x7f\
+\x00\x02\x00\x88\x00\x22\x00\x90\x3f\x00\x01\x00\x44\x00\x00\xf2\
+\x07\x20\x00\x80\x08\x00\x40\xfe\x00\x04\x00\x10\x01\x80\xfc\x91\
+\x3f\x00\x01\x00\x44\x00\x20\x7f\xe4\x0f\x40\x00\x00\x11\x00\xc8\
+\x1f\xf9\x03\x10\x00\x40\x04\x00\xf2\x47\xfe\x40\x00\x00\x10\x01\
+\x80\xfc\x91\x3f\x10\x00\x00\x44\x00\x20\x7f\xe4\x0f\x04\x00\x00\
+\x11\x00\xc8\x1f\x80\x00\x00\x20\x02\x00\xf9\x03\x10\x00\x00\x44\
+\x00\x20\x7f\x00\x02\x00\x80\x08\x00\xe4\x0f\x40\x00\x00\x03\x8c\
+\x08\x00\xe4\x0f\x40\x00\x00\x11\x40\x04\x00\xf2\x07\x20\x00\x80\
+\x08\x20\x02\x00\xf9\x03\x10\x00\x40\x04\x10\x01\xc8\x1f\xf9\x03\
+\x10\x00\x40\x04\x10\x01\xc8\x1f\xf9\x03\x10\x00\x10\xba\x08\x78\
+\xd9\xcb\x08\x98\x3b\x7f\x01\xa2\xb5\x94\x5b\xa7\x4d\xf3\x5a\xfe\
+\x8b\x90\x3f\x00\x01\x00\xfe\x04\x40\x67\xc9\xc7\x5e\x5d\xf0\x0b\
+\x8b\x8a\xc4\x9a\x0d\x1b\x91\xad\xa5\x3c\xf1\xe4\x22\x91\x99\x99\
+\xe9\x65\x00\xbc\x2a\x69\xc6\x5c\x04\x02\x80\x83\x00\xc8\x1f\x88\
+\x00\x00\x02\x00\x00\xf9\x03\x11\x00\x40\x00\x00\x20\x7f\x20\x02\
+\x00\x08\x00\x00\xe4\x0f\x44\x00\x00\x01\x00\x80\xfc\x81\x08\x00\
+\x20\x00\x00\x90\x3f\x10\x01\x00\x04\x00\x20\x7f\xe4\x0f\x44\x00\
+\x00\x01\x00\xc8\x1f\xf9\x03\x11\x00\x40\x00\x00\xf2\x47\xfe\x40\
+\x04\x00\x10\x00\x80\xfc\x91\x3f\x10\x01\x00\x04\x00\x20\x7f\xe4\
+\x0f\x44\x00\x00\x01\x00\xc8\x1f\xf9\x03\x11\x00\x40\x00\x00\xf2\
+\x47\x84\x44\x00\x11\x00\x40\x00\x00\xf2\x07\x22\x80\x08\x00\x20\
+\x00\x00\xf9\x03\x11\x40\x04\x00\x10\x00\x80\xfc\x81\x08\x20\x02\
+\x00\x08\x00\x40\xfe\x40\x04\x10\x01\x00\x04\x00\x20\x7f\x20\x02\
+\x88\x00\x20\x00\x00\x90\x3f\x10\x01\x44\x00\x10\x00\x00\xc8\x1f\
+\x88\x00\x22\x00\x08\x00\x40\xfe\xc8\x1f\x88\x00\x22\x00\x08\x00\
+\x40\xfe\xc8\x1f\x88\x00\x22\x00\x08\x00\x40\xfe\xc8\x1f\x88\x00\
+\x22\x00\x08\x00\x40\xfe\xc8\x1f\x88\x00\x00\x02\x00\x90\x3f\xf2\
+\x07\x22\x00\x80\x00\x00\xe4\x8f\xfc\x81\x08\x00\x20\x00\x00\xf9\
+\x03\x10\x01\x00\x04\x00\x20\x7f\x00\x22\x00\x80\x00\x00\xe4\x0f\
+\x40\x04\x00\x10\x00\x80\xfc\x01\x88\x00\x00\x02\x00\x90\x3f\x00\
+\x11\x00\x40\x00\x00\xf2\x07\x20\x02\x00\x08\x00\x40\xfe\x00\x44\
+\x00\x00\x01\x80\xfc\x91\x3f\x00\x11\x00\x40\x00\x20\x7f\xe4\x0f\
+\x40\x04\x00\x01\x00\xc8\x1f\xf9\x03\x10\x01\x40\x00\x00\xf2\x47\
+\xfe\x40\x04\x10\x01\x40\x00\x00\xf2\x47\xfe\x40\x04\x10\x01\x40\
+\x00\x00\xf2\x47\xfe\x40\x04\x10\x01\x40\x00\x00\xf2\x47\xfe\x40\
+\x04\x10\x01\x40\x00\x80\x33\xf2\x2f\x2a\x2e\x46\xfe\x40\x04\x10\
+\x01\x40\x00\x80\x6b\xf2\x5f\xbb\xf1\x45\x04\x01\x44\x40\xc8\x22\
+\x40\xfe\x8b\x93\xa4\x4b\x72\x25\x45\x92\x76\x92\x2e\x92\x9e\x92\
+\xf6\x92\x42\x49\x96\xfa\xbf\xe3\xda\x4b\x00\x00\xf2\x07\x20\x02\
+\x2c\x8e\x00\xf9\x2f\x26\x2a\xee\x0a\xc9\x61\x92\xb3\x24\xd7\x49\
+\xee\x93\x3c\x2d\x79\x43\xf2\x85\xe4\xfb\x5a\xfe\x8d\xdf\x48\x3e\
+\x92\xbc\x29\xd9\x20\x59\x2e\x99\x2f\x79\x50\x32\x51\x72\xa6\x64\
+\x58\xf4\x7f\x3b\x86\xeb\x35\x01\x00\xc8\x1f\x80\x08\x30\x14\x01\
+\xd1\x6f\xe7\x03\x24\xa7\x4b\xa6\x48\x56\x4a\xfe\xe3\xe1\xdf\xbc\
+\x27\xbe\x92\xac\x97\xcc\x94\x5c\x2a\x39\x5c\x52\x26\x49\xe1\x5a\
+\x4e\x00\x00\xf2\x07\x20\x02\x6a\x11\x01\xd1\xdb\xf5\xea\xd6\xfc\
+\xf9\x92\xb9\x92\xf7\x2c\x10\x7d\x6d\xd9\x29\x79\x4b\x72\xaf\xe4\
+\x38\xf5\xb3\x03\xd7\x77\x02\x00\x90\x3f\x00\x11\x50\x2d\x02\xa2\
+\xc2\xef\x21\x39\x4f\x32\x2f\x7a\xdb\x5e\x84\x90\x7f\x49\xa6\x49\
+\x8e\xe4\x81\x48\x02\x00\x90\x3f\x80\xeb\x11\xb0\x4d\xf2\x79\x48\
+\x85\xbf\x2f\x5e\x8e\x3e\x53\x70\xa8\xa4\x31\x1e\x20\x00\x90\x3f\
+\xf2\x07\x70\x2d\x02\xe0\x7f\x3f\x19\x3c\x29\x39\x5a\x92\x8a\x17\
+\x08\x00\xe4\x8f\xfc\x01\x88\x00\xf7\xf8\x52\x72\xb7\xa4\x4a\x12\
+\x8b\x27\x08\x00\xe4\x8f\xfc\x01\x88\x00\xf7\x78\x5f\x72\xad\xa4\
+\x03\xce\x20\x00\x90\x3f\xf2\x0f\x1d\xe3\x26\x4e\x12\x8f\xcd\x7b\
+\x82\x63\x41\x04\xc0\xde\x59\x2b\x39\x5b\x92\x83\x43\x08\x00\xe4\
+\x8f\xfc\x03\xcf\xcd\xe3\x27\x88\xd8\xd8\x58\x91\x96\x96\x46\x04\
+\x10\x01\x50\xf3\x85\x8a\xc6\x49\x0a\xf0\x09\x01\x80\xfc\x91\x7f\
+\xa0\xe5\xbf\xeb\x5c\x11\x01\x44\x00\xd4\x8a\xef\x24\xb7\x49\x5a\
+\xe1\x16\x02\x00\xf9\x23\xff\xc0\xca\x9f\x08\x20\x02\xa0\xce\xec\
+\x88\x2e\x7f\xdc\x81\x00\x40\xb4\xc8\x1f\xf9\x07\x52\xfe\x44\x80\
+\xdd\xcc\x78\xe0\x41\x51\x5c\xdc\x02\xe1\xda\xcb\x8f\x92\x47\x24\
+\xdd\x09\x00\x40\xfe\x5c\xb4\x03\x27\xff\xea\x11\xf0\xe8\xbc\x79\
+\x1c\x33\x0b\x58\xf2\xcc\x72\x31\xa8\xb2\x12\xc1\x06\x8b\x05\x6a\
+\x93\x24\x02\x00\x90\x3f\x04\x4a\xfe\x44\x80\x1d\x6c\x7c\xf9\x15\
+\x71\xd4\xd1\x47\xd7\xea\x9c\x81\x75\x77\x04\xee\x72\xe9\xad\x01\
+\xa4\x8b\xfc\xb9\x78\x87\x40\xfe\x44\x80\x7f\xbc\xf5\xfe\x16\x71\
+\xfe\xe8\x0b\x45\x6a\x6a\x2a\x12\x0d\x07\x9f\x4a\x4e\x76\x61\xeb\
+\x62\xc4\x8b\xfc\x21\x24\xf2\x27\x02\xbc\x67\xfc\xa4\xc9\xa2\x59\
+\xb3\x66\x48\x33\x9c\xac\x92\x94\x13\x00\x80\xfc\x21\x10\xf2\x27\
+\x02\xbc\x61\xfd\x4b\x9b\xc4\xe0\xaa\x2a\x24\xe9\xc6\x1b\x03\xe3\
+\x25\x99\x04\x00\x20\x7f\xb0\x5e\xfe\x44\x80\x59\xc6\x8e\x1b\xcf\
+\xeb\x7d\xee\xa1\x76\x61\x3c\x8a\x00\x00\xe4\x0f\xd6\xcb\x9f\x08\
+\xe0\x5b\x7f\x5d\x88\x8d\x8d\x11\xe9\xa9\x71\xa2\x69\x76\xa2\x28\
+\x29\x48\x15\x9d\xdb\x64\x88\x8a\xb2\x2c\x51\xd5\x3b\x5b\x1c\x54\
+\xd9\x44\xfc\x6e\x58\x33\xb1\x5f\xff\x5c\xd1\xbf\xbc\x91\xe8\xd2\
+\x2e\x23\xf2\x7f\x93\xdb\x28\x51\x24\x27\x39\xf3\xe0\xe3\x12\x49\
+\x0b\x02\x00\x90\x3f\x58\x2d\xff\x5d\xa8\x87\xd3\x88\x00\xbe\xf5\
+\x47\xc6\x42\x72\x9c\x68\x5f\x92\x2e\x46\xf6\xcb\x11\xa7\x1c\x5e\
+\x28\xae\x3d\xbb\xad\x98\x79\x5d\x17\xb1\x72\x7a\x85\xf8\x60\xc9\
+\x60\xf1\xe3\x8b\x23\x85\x78\xa9\x6e\xfc\xb0\x61\x84\xf8\xf7\x73\
+\x55\xe2\x9d\x85\x83\xc4\x9a\xfb\xfb\x88\x19\xff\xe8\x22\x2e\x3d\
+\xa5\xb5\x38\x62\x64\x73\xd1\xb5\x34\x53\xa4\xa5\xc4\x85\x25\x02\
+\x3e\x93\x1c\x42\x00\x00\xf2\x07\xab\xe5\x4f\x04\xd4\x8f\x0d\x9b\
+\x36\x07\xf6\x5b\x7f\x9c\xfc\x36\x5f\xd6\x36\x43\x9c\x74\x58\xa1\
+\xb8\xe3\x8a\x4e\x62\xf3\x9c\xfe\x62\xe7\xc6\x11\x75\x16\x7c\x7d\
+\x51\x71\xf1\xfe\xe2\x4a\xf1\xd4\xb4\x9e\x62\xd2\xc5\x1d\xc4\x99\
+\x47\x15\x8b\x6e\xed\x33\x23\x77\x1d\x02\x1a\x02\x6a\x7f\x81\x44\
+\x02\x00\x90\x3f\x58\x2b\x7f\x22\xa0\x6e\xcc\x9e\x3b\x57\xe4\xe4\
+\xe4\x04\x46\x48\x29\x49\x71\xe2\x37\x03\x73\xc5\x75\x7f\x6d\x27\
+\x96\xdd\xd9\x4b\x7c\xb5\x7a\x98\x6f\xb2\xaf\x0d\x9f\x3e\x5b\x25\
+\x1e\x19\x5b\x2e\x4e\x3b\xa2\x48\x94\xb6\x4c\x0b\x5a\x04\xac\x91\
+\x94\x10\x00\x80\xfc\xc1\x5a\xf9\x57\x8f\x80\x39\x8f\x3f\xce\x39\
+\xd8\x07\x57\x5c\x75\xb5\x88\x8f\x8f\xb7\x5e\x40\xea\xb7\xfa\x13\
+\x0e\x29\x10\x8f\x8e\xeb\x26\xbe\x7e\x21\x18\xc2\xdf\x17\xea\xa7\
+\x88\xe9\xd7\x94\x89\xe3\x0f\xce\x17\x45\xcd\x93\x83\x10\x01\x9f\
+\x4b\x7e\x47\x00\x00\xf2\x07\x6b\xe5\x4f\x04\xec\x9b\x7f\xbd\xf7\
+\xbe\x38\xf8\x90\x43\xad\x16\x4e\x87\x56\xe9\xe2\xa2\x51\x25\xe2\
+\xf9\xfb\x2a\x7c\xbd\xa5\xef\x15\x2f\xcc\xec\x23\xce\x38\xb2\x48\
+\xe4\x64\x25\xda\x1e\x02\x13\x25\x49\x04\x00\x20\x7f\xb0\x52\xfe\
+\x44\xc0\x9e\x59\xb9\x66\xad\x68\xdf\xa1\x83\x95\x72\x51\x4f\xd9\
+\x1f\x7b\x50\xbe\x58\x35\xa3\x22\xf4\xc2\xdf\x13\xdf\xaf\x1f\x11\
+\xb9\xd3\x71\xd8\xd0\xa6\x22\x31\xc1\xda\xb7\x0e\xd6\x49\x5a\x13\
+\x00\x80\xfc\xc1\x4a\xf9\x13\x01\xbf\x66\xfa\xfd\xf7\x8b\xcc\x86\
+\x0d\xad\x13\x4a\xdb\xe2\x34\x31\xf6\xfc\xd2\xc8\xef\xe4\xae\x8a\
+\x7f\x77\xa8\xb7\x0d\x6e\xbd\xa4\xa3\xe8\xd3\x25\xcb\xc6\x08\xf8\
+\x42\x52\x45\x00\x20\x7f\xe4\x0f\x56\xca\x9f\x08\xf8\x7f\x2e\xfc\
+\xdb\xc5\x22\x26\xc6\x9e\x27\xd1\xe3\xe3\x62\x22\xef\xdb\xab\xa7\
+\xe5\xeb\xf3\x5a\x9e\x2b\xbc\xfe\xf8\x00\x31\xea\xd0\x02\xdb\xee\
+\x0a\x7c\x27\x39\x9c\x00\x40\xfe\xc8\x1f\xf9\x5b\xbd\x43\x9c\xab\
+\x11\xb0\xf5\x93\xed\xe2\xc4\x93\x4e\xb2\xe6\x3c\x14\x36\x4b\x16\
+\x57\x9d\xd1\x46\x6c\x5d\x32\x18\xb1\xd7\x81\xf7\x16\x55\x46\x5e\
+\x2d\x54\x6f\x43\x58\x72\x4e\x77\x4a\x4e\x23\x00\x90\x3f\xf2\x47\
+\xfe\x76\x2f\x10\xe3\x58\x04\xbc\xff\xe1\x47\xe2\xd0\xdf\xfd\xde\
+\x8a\x63\xdf\x3c\x37\x49\x4c\xbb\xbc\x93\xd8\xe1\xc0\x03\x7d\x5e\
+\xf0\xd1\xb2\x21\x62\xf4\x09\x25\x22\x23\xcd\x9a\xb7\x38\x2e\x27\
+\x00\x90\x3f\xf2\x47\xfe\x44\x80\x05\xbc\xbd\xe5\x03\x31\x74\xd8\
+\x70\xdf\x8f\xb7\x5a\x19\xef\xb2\x53\x5b\x07\xe6\x7d\xfd\x20\x3e\
+\x27\x70\xb9\x3c\xbe\x8d\x1b\x26\xd8\x30\xbf\x26\x4b\x62\x09\x00\
+\xe4\x8f\xfc\x91\x3f\x11\xe0\x13\xaf\xbf\xf5\xb6\xe8\x5d\xd1\xc7\
+\xf7\xf5\xf6\x4f\x3c\xb4\x80\x5b\xfd\x1e\xf1\xe5\xaa\x61\x91\xd7\
+\x26\x2d\x78\x46\xe0\x61\xdb\x56\x0e\x44\xdc\xc8\x1f\x34\x73\xcb\
+\x84\x89\x81\x94\x7f\xd8\x23\x60\xd3\x6b\xaf\x8b\x8e\x9d\x3a\xfb\
+\x7a\x6c\xd5\x1a\xfc\x9b\x66\xf7\x47\xcc\x3e\xf0\xea\x63\x03\xc4\
+\xe0\x5e\x8d\x6d\xd8\x4c\x28\x83\x00\x40\xfe\xc8\x1f\xf9\x5b\x1d\
+\x01\x6a\x29\xdc\xb0\x9c\x17\x35\x5f\x4a\x4a\x4a\x7c\x3b\x9e\x6a\
+\x4d\xfe\x45\x53\x7b\x22\x62\x0b\xb8\xef\xda\xb2\xc8\x0a\x8a\x3e\
+\xaf\x15\x90\x4d\x00\x20\x7f\xe4\x8f\xfc\x89\x00\x0f\xbe\xf9\xfb\
+\x25\x7f\xb5\xfb\xde\xe4\x4b\x3a\x38\xb1\x62\x5f\x90\xf8\x7c\xe5\
+\x50\x71\xfa\x1f\x8a\xfc\xdc\x88\x68\xb5\x24\x8d\x00\x40\xfe\xc8\
+\x1f\xf9\x13\x01\x06\x7f\xf3\xf7\xeb\xb6\x7f\xf7\x0e\x99\xe2\xb5\
+\xb9\x03\x10\xae\xc5\xac\x7d\xa0\xaf\xe8\xd9\xc9\xb7\x05\xa0\x16\
+\x4a\x12\x08\x00\xe4\x8f\xfc\x91\x7f\x6d\x2f\x1c\xeb\x89\x80\x7d\
+\x3f\xed\xef\xc7\x03\x7f\xea\x5b\xe5\x85\x27\x96\x44\x96\xae\x45\
+\xb2\xf6\xa3\xee\xce\xa8\xb7\x05\x7c\xba\x1b\x70\x9f\x24\x86\x00\
+\x40\xfe\xc8\x1f\xf9\xd7\x84\x05\x6a\xc3\x11\x49\x63\x22\x60\xef\
+\xef\xf9\xfb\xf1\xaa\x9f\x5a\xcc\x47\x6d\xc5\x8b\x58\x83\xc7\xd2\
+\xdb\x7b\x45\xd6\x64\xf0\x21\x02\xc6\x12\x00\xc8\x7f\xb7\x14\x17\
+\xb7\x40\xfe\xc8\xff\x67\xf2\xaf\x36\x16\x89\x80\x3d\xac\xf0\xe7\
+\xc7\x22\x3f\x47\x8c\x6c\x2e\x3e\x5b\xc1\x9a\xfd\x41\x5f\x44\x68\
+\x58\x9f\x6c\x3f\x22\x60\x34\x01\x80\xfc\x91\x3f\xf2\xaf\x91\xfc\
+\x89\x80\x3d\xe3\xf5\xf2\xbe\x99\xe9\xf1\xe2\xde\x31\x65\x08\x34\
+\x24\xa8\xfd\x17\xc6\x9c\xd5\x56\xc4\x79\xff\x93\xc0\xf1\x04\x00\
+\xf2\x47\xfe\xc8\xbf\x46\xf2\x27\x02\x76\xbf\xb1\x8f\xd7\x0f\xfa\
+\xbd\xb5\x60\x10\xe2\x0c\x21\xcb\xef\xee\x2d\xf2\x9b\x24\x7b\x39\
+\x9e\x7e\x90\x1c\x40\x00\x20\x7f\xb1\xee\xc5\x97\x90\x2d\xf2\xdf\
+\xa7\xfc\x89\x80\xff\xe7\xde\x99\x33\x3d\xdd\xd5\x4f\x2d\xea\xc3\
+\x32\xbe\xe1\xe6\x93\xe5\x43\xc4\x90\x5e\x9e\xfe\x24\xf0\x8d\xa4\
+\x2f\x01\x80\xfc\x01\xf9\xd7\x48\xfe\x44\xc0\xa7\x62\xc5\x0b\x6b\
+\x44\x66\x66\xa6\x67\xe7\xe6\xd8\x83\xf2\xc5\x0f\x1b\xc2\xff\x94\
+\xff\x7f\x9e\x1f\x1a\xb9\xc3\xb1\x7a\x66\x1f\xb1\x72\x7a\x85\xd8\
+\xf8\x70\x3f\xf1\xcf\x79\x03\x23\xcb\x18\x7f\xb1\x72\xa8\x13\xc7\
+\xe0\xbb\x75\xc3\x23\xcf\x77\x78\x38\xef\x3f\x94\x34\x23\x00\x90\
+\x3f\x20\xff\xda\x8e\x59\x4f\x23\x20\x25\x25\x45\x3c\xf2\x98\xbf\
+\x11\xf0\xe6\xbb\xef\x89\x76\xa5\xa5\x9e\x9d\x1b\xb5\xae\x7c\xd0\
+\xa5\xa6\x24\x3e\xfb\xe6\x72\x31\xf5\xd2\x8e\x91\xdf\xbb\xff\x72\
+\x74\x0b\xf1\xc7\xdf\xe4\x89\xe1\x7d\x73\x44\x79\x69\xa6\x28\x68\
+\x9a\x2c\x92\x12\x6b\x36\xde\x73\x1b\x25\x8a\x8a\xb2\x2c\x71\xd4\
+\xfe\xcd\xc5\xdf\xff\xdc\x4a\xdc\x75\x55\xe7\x48\x2c\x7c\xbb\x76\
+\x78\xa8\x5e\x15\x3c\xe3\xc8\x22\x2f\xe7\xff\x52\x2f\x36\x0f\x42\
+\xf4\xc8\x1f\x42\x22\x7f\x57\x23\xe0\xc0\xdf\xfe\xd6\xb3\xf7\xfb\
+\x27\x5c\xd4\x21\xb0\xc2\x57\x5b\x0e\x2b\xc9\x7b\xf5\xbb\xb6\xda\
+\x7c\xa7\x6f\xd7\x2c\x71\xfe\x71\x2d\xc5\xa3\xe3\xba\x89\xed\xcb\
+\x83\xff\x86\xc4\xd5\x67\xb6\x09\xd5\x36\xc2\xc8\x1e\xf9\x43\x88\
+\xe4\xef\x5a\x04\x5c\x72\xd9\x65\x9e\x7c\x3e\xf5\x6d\x78\xd6\xd8\
+\xf2\xc0\x88\xea\x0d\x29\xfc\xdb\x2e\xeb\x18\xf9\x56\xee\xf1\x83\
+\x6c\x7b\x0d\x28\xb5\x19\xcf\xad\x97\x74\x14\x1f\x3f\x33\x24\xb0\
+\x11\xa0\x42\xca\xa3\x37\x04\x76\x4a\x86\x10\x00\xc8\x1f\x90\x3f\
+\x11\xf0\x0b\x1e\x7c\x64\xb6\x88\x8b\x8b\x33\xfe\xb9\xb2\x32\x12\
+\xc4\x33\x77\xf5\xb2\xfe\x77\x6a\xb5\xc9\x8d\x12\x7e\x9e\x3f\x8b\
+\xd9\xd4\x0a\x25\xd0\xa1\x15\xd9\x62\xfa\x35\x65\x81\x7c\x8e\x60\
+\xce\x2d\xe5\x22\x39\xc9\x93\x6b\xc3\x36\x49\x53\x02\x00\xf9\x03\
+\xf2\x27\x02\xaa\xed\xee\xd7\xa8\xb1\xf9\xad\x5d\x95\x4c\x37\xcf\
+\xb1\x77\xfb\xde\x6d\x4b\x07\x8b\xcb\x4e\x6d\xed\xf7\xee\x76\xf5\
+\xbb\x0e\xe6\xa5\x44\x7e\x5a\xf9\x66\xcd\xb0\xc0\xbd\x26\xa8\xd6\
+\x80\xf0\xe0\x18\x2d\x36\xf5\x3c\x00\xe2\x47\xfe\x10\x52\xf9\x87\
+\x39\x02\x06\x0e\x1a\x64\xfc\x73\x34\x94\x17\xf7\x4d\xb3\xed\x94\
+\xff\x9a\xfb\xfb\x88\xa3\x0f\xc8\x8b\xfc\xce\x1e\x96\x8d\xa7\xd4\
+\xc3\x84\xd7\x9e\xdd\x56\xfc\x77\x4d\x70\x1e\x1e\x54\xcb\x07\xd7\
+\xf4\x61\xc9\x7a\xf2\x77\x02\x00\xf9\x03\xf2\x77\x3e\x02\x6e\x18\
+\x3b\xd6\x93\xdf\xfc\x6d\x5b\xd3\x5f\xdd\x2a\x7f\xf0\x86\xae\x91\
+\x07\xeb\xc2\xb6\xeb\x64\x75\x5a\x15\xa6\x8a\x79\x13\xbb\x07\x26\
+\x02\x1e\xbe\xa9\xab\x17\x1b\x09\xed\x90\x54\x12\x00\xc8\x1f\x90\
+\xbf\xb3\x11\xa0\xe6\x4e\x46\x46\x86\xd1\xbf\x3b\x26\xa6\x41\x44\
+\xb4\xb6\x08\x46\x3d\x3d\xaf\xbe\x19\xab\x57\xf3\xc2\x2c\xfe\x5f\
+\x72\x50\x65\x13\xf1\xf6\xc2\x60\xac\xb2\x38\xf9\x92\x0e\x5e\x1c\
+\x93\xad\x92\x5c\x02\x00\xf9\x03\xf2\x77\x32\x02\x2a\x87\x0c\x31\
+\xfe\x37\xdf\x7c\x41\xa9\x15\x52\x51\xb7\xc2\xd5\x36\xb5\x29\x49\
+\x71\x4e\x89\xff\x97\x0f\x60\x2e\xb9\xbd\x67\x20\x22\x40\x3d\x8b\
+\xe1\xc1\x31\x99\x4e\x00\x20\x7f\x40\xfe\x81\x8a\x80\x59\x8f\x3e\
+\x56\xef\xf3\x74\xd3\x2d\xe3\x8c\xff\xad\xe7\x1d\xd7\xd2\x0a\x99\
+\x3c\x31\xa9\x7b\xe4\x56\xb8\xab\xe2\xaf\x4e\x42\x7c\x8c\xb8\xfd\
+\xf2\x4e\x81\x88\x80\x53\x0e\x2f\xf4\xe2\x98\x54\x12\x00\xc8\x1f\
+\x90\xbf\x33\x11\xb0\x61\xd3\x66\xe3\x4b\xfd\x1e\xb9\x5f\xf3\xc8\
+\x4e\x70\x7e\x0a\xe4\x9d\x85\x83\xc4\xc1\x43\x9a\x22\xfe\xdd\x30\
+\xfa\x84\x12\xdf\xcf\x4f\x4d\x56\x0c\x3c\x6c\xa8\xf1\xf3\xf7\x8a\
+\x24\x81\x00\x40\xfe\x80\xfc\x9d\x88\x80\xaa\xa1\xc3\x8c\xfe\x6d\
+\x6a\xc3\x17\xf5\x2e\xbd\x9f\xf2\x50\x4b\xe8\xa6\xa5\xc4\x21\xfb\
+\xbd\xa0\xe4\x6a\xfb\xeb\x82\x6a\x09\xe4\x7e\xe5\x8d\x4c\x1f\x8b\
+\xd1\x04\x00\xf2\x07\xe4\x1f\xfa\x08\x98\x34\x65\x8a\xd1\xbf\xa9\
+\xac\x6d\x46\x64\x63\x1b\xbf\x84\xa1\xfe\xb7\xd5\xdd\x07\x04\x5f\
+\x33\x7a\x75\x6a\x28\x3e\x7c\xda\xee\x95\x04\xb7\x3c\x55\x29\x72\
+\xb2\x8c\xae\xcd\xf0\xb5\xa4\x88\x00\x40\xfe\x50\x4b\xc6\x4d\x9c\
+\x84\xfc\x03\x12\x01\x6f\x6f\xf9\x40\xe4\xe5\xe7\x1b\xfb\x5b\xd4\
+\x37\xee\xd7\x1f\x1f\xe0\x9b\x28\x56\xcd\xa8\x10\x25\x05\xfc\xd6\
+\x5f\x97\xc5\x83\xfe\x35\x7f\xa0\xd5\x11\x30\x7f\x72\xf7\xc8\x1b\
+\x25\x06\x8f\xc3\x1c\x02\x00\xf9\x03\xf2\x0f\x6d\x04\x5c\xf8\xb7\
+\x8b\x8d\xfe\x1d\xd3\x7c\x7c\xb8\x6c\xdc\xe8\xf6\x22\x3e\x2e\x06\
+\xa1\xd7\x11\xb5\x6b\xa1\xed\x8b\x06\x5d\x70\x7c\x4b\xd3\xc7\xe1\
+\x00\x02\x00\xf9\x03\xf2\x0f\x5d\x04\xbc\xf4\xea\x6b\x22\x3d\x3d\
+\xdd\xd8\xff\xfe\x21\x55\x4d\x7d\x91\xc2\xf7\xeb\x47\x88\x51\x87\
+\x16\x20\x71\x0d\x9c\xfc\xbb\x42\xab\x03\x40\x2d\xde\x64\x78\xe1\
+\xa6\xb7\x24\x29\x04\x00\xf2\x07\xe4\x1f\xaa\x08\x38\xe6\xd8\xe3\
+\x8c\xae\xf1\xef\xd7\xf6\xb4\x6a\x47\x3c\xe4\xad\x0f\xb5\xa1\x90\
+\xcd\x11\xf0\xde\xa2\x4a\xd1\xb8\x61\x82\xc9\x63\x70\x35\x01\x80\
+\xfc\x01\xf9\x87\x26\x02\x96\x3d\xb7\xc2\xd8\x4e\x7f\xea\x77\xd9\
+\xa7\xa6\xf9\xb7\xb8\x8c\xba\xf3\x80\xb8\xf5\x3e\xc7\xf1\xb2\xc5\
+\x1b\x36\x29\xe6\x4e\xe8\x66\xf2\x18\x7c\x27\x69\x41\x00\x20\x7f\
+\xf0\x5f\xfe\xf3\x83\x2c\x7f\x5b\x22\x60\xc8\xd0\xa1\xa1\x5d\xec\
+\x67\xf1\x6d\x3d\x11\xb7\x66\xda\x97\xa4\x8b\xaf\x56\xdb\xfd\x7a\
+\xe0\x39\x7f\x6a\x61\xf2\x18\x4c\x26\x00\x90\x3f\x20\xff\x40\x47\
+\xc0\xc3\x73\x1e\x15\x0f\xcc\x7a\xc4\xd8\xff\x46\xd7\xd2\x4c\xdf\
+\xdf\xf7\x57\x8b\xd9\xb4\x2d\x4e\x43\xdc\x9a\x39\x6a\xff\xe6\xd6\
+\xaf\x0f\xd0\xba\xc8\xd8\x1b\x1f\xdf\x4a\xf2\x9c\x0e\x00\xe4\x0f\
+\xc8\x3f\xf8\x11\x50\x54\x5c\x6c\xe6\xbf\x9d\x14\x27\x5e\x79\xd4\
+\x8e\x5b\xc5\xb7\x8c\x6e\x8f\xb4\x0d\xa0\x76\xe6\xb3\x39\x02\x9e\
+\x9c\xd2\xc3\xe4\xe7\x1f\xeb\x6c\x00\x20\x7f\x40\xfe\xe1\x88\x00\
+\x53\x4c\xb8\xa8\x83\x35\x22\xf8\x6c\x45\x95\x48\x4d\x66\xd5\x3f\
+\xdd\x74\x69\x97\x61\xfd\x7e\x01\xbf\x1f\xde\xcc\xe4\xe2\x40\x39\
+\xce\x05\x00\xf2\x07\xe4\x4f\x04\xec\x8d\x8e\xad\xd2\xc5\x8e\x8d\
+\x23\xac\x12\x01\xaf\x02\x9a\x41\x3d\x70\x67\xfb\x2a\x81\x19\x69\
+\xf1\xa6\x3e\xff\x18\xa7\x02\x00\xf9\x03\xf2\x27\x02\xf6\x85\xda\
+\x5d\xcf\x36\x11\xac\x7f\xa8\x2f\xc2\x36\x40\xef\xce\x59\xd6\xdf\
+\x05\x18\x7b\x7e\xa9\xa9\xcf\xff\x85\x24\xcb\x89\x00\x40\xfe\x80\
+\xfc\x89\x80\x7d\x51\xd5\x3b\xdb\x5a\x11\x54\x94\x65\x21\x6d\x03\
+\xf8\xf9\x9a\x67\x4d\x50\x77\xa3\xd4\xcf\x15\x86\x3e\xff\x25\xa1\
+\x0f\x00\xe4\x0f\xc8\x9f\x08\xa8\xc9\x3b\xff\xea\x9b\xb6\xad\x22\
+\xb8\x77\x4c\x19\xc2\x36\x80\x5a\x6c\xc9\xf6\xbb\x00\x2b\xa7\x57\
+\x98\xda\x2b\x60\xbb\x24\x2d\xb4\x01\x80\xfc\x01\xf9\x13\x01\x35\
+\xe1\x4f\x07\xe6\x5b\xff\x6a\x98\xe1\x5d\xe3\x9c\x45\x09\xd6\xf6\
+\x08\x38\xd1\xdc\x73\x20\xe7\x85\x32\x00\x90\x3f\x20\x7f\x22\xa0\
+\x26\x24\x27\xc5\x46\x96\x61\xb5\x5d\x02\xa3\x4f\x28\x41\xd8\x06\
+\x38\x70\x50\x13\xeb\xcf\xbd\x1a\x9f\x09\xf1\x46\x36\x84\xda\x2a\
+\x89\x0f\x55\x00\x20\x7f\x40\xfe\x44\x40\x4d\xb9\x68\x54\x89\xf5\
+\x02\x50\xbc\xbd\x70\x90\x1c\xcb\xec\x0a\xa8\x9b\xc4\x84\x58\xeb\
+\x57\x07\x34\x7c\x17\xe0\x37\xa1\x09\x00\xe4\x0f\xc8\x9f\x08\xa8\
+\x29\xb9\x8d\x12\xc5\x17\x2b\x87\x06\x22\x00\x14\xbf\x19\x98\xeb\
+\xfb\x31\x53\x11\xd2\x3c\x37\x49\xf4\xe8\xd8\x50\xf4\xea\xd4\x50\
+\xb4\x29\x4a\x8d\xfc\x3c\x11\xe4\x2d\x8b\xe7\x4f\xee\x6e\xfd\xb9\
+\xff\xe7\xbc\x81\x22\xce\x4c\x00\x3e\x10\x8a\x00\x40\xfe\x80\xfc\
+\x89\x80\xa0\x2e\xfa\x53\x13\xd4\x6b\x8a\x5e\x1e\x9f\xf2\xd2\x4c\
+\x71\xe9\x29\xad\xc5\xec\x9b\xcb\xc5\xea\x99\x7d\x22\xef\xa6\xef\
+\x6d\x9d\x84\xad\x4b\x06\x8b\x47\xc7\x75\x13\x7f\x1b\x55\x12\x79\
+\xab\xc2\xd0\x6d\x6b\xed\xa8\xf5\xf7\x83\x70\xfe\xd5\x32\xc6\x06\
+\x3e\xff\x7f\x25\x99\x81\x0e\x00\xe4\x0f\xc8\x9f\x08\xa8\x0d\xcd\
+\x72\x92\xc4\xf7\xeb\x47\x04\x2a\x00\x76\x4a\xf9\x96\x14\x18\x5b\
+\x27\x3e\xb2\x0c\xb2\xba\xcb\x30\xe5\xef\x1d\x23\xb2\xaf\xef\xdf\
+\xbb\x6d\xe9\x60\x71\xc5\x69\xad\x23\xdb\x2a\xdb\x1c\x00\x65\x6d\
+\x33\x02\x71\xfe\x37\xcd\xee\x6f\xea\x8d\x80\x13\x03\x1b\x00\xc8\
+\x1f\x90\x3f\x11\x50\x5b\x2e\x3e\xa9\x55\xa0\xe4\xbf\x8b\xeb\xcf\
+\x69\xa7\xfd\x58\x74\x68\x95\x2e\xa6\x5f\x53\x26\xbe\x7e\xc1\xcc\
+\x6f\xe1\x3f\x6c\x18\x21\xae\x3a\xa3\x8d\xb5\x3f\x13\x28\xa9\x7e\
+\xb4\x6c\x48\x20\xce\xff\xc1\x43\x8c\x6c\x13\xbd\x2c\x90\x01\x80\
+\xfc\x01\xf9\x13\x01\x75\xf9\x1d\xfb\xdd\x27\x2b\x03\x19\x00\xdb\
+\x97\x57\x45\xde\x5c\xd0\x75\x8b\x7f\xd6\xd8\xf2\xc8\xce\x83\x5e\
+\xfc\xed\xcf\xdf\x57\x21\x5a\xe6\xa7\x58\x19\x01\x33\xaf\xeb\x12\
+\x88\xf3\xbf\xe6\xfe\x3e\x26\x3e\xff\x8f\x92\xe2\x40\x05\x00\xf2\
+\x07\xe4\x4f\x04\x84\xf5\xd5\xaf\xbd\xa1\xd6\x2d\xa8\xcf\xe7\x57\
+\x2b\x0b\xce\x9b\xe8\xcf\x83\x6f\xea\x39\x81\x82\xa6\xc9\xd6\x05\
+\xc0\x09\x87\x14\x04\xe6\xfc\x8f\xe8\x9b\x63\xe2\x18\x5c\x1c\x98\
+\x00\xf0\x5a\xfe\x2d\x5a\xb4\x44\xfe\xc8\x1f\xf9\x87\x24\x02\x82\
+\xf0\xd4\xf7\xde\x58\x35\xa3\xa2\x4e\x9f\xbb\xb0\x59\xb2\x15\xfb\
+\x1d\xa8\x55\x17\xd3\x52\xec\xda\xe5\xb0\x45\x5e\x4a\x60\xce\xff\
+\x82\x5b\x8d\x6c\x17\xfc\x5a\x20\x02\x00\xf9\x03\xf2\x27\x02\xea\
+\x8a\xba\x05\xbd\x73\xe3\x88\x40\x07\x80\xa2\x5b\xfb\xcc\x5a\x7f\
+\xc3\xb5\xe9\x95\xc7\x3b\xaf\xec\x6c\x55\x00\xa8\x9f\x85\x76\x04\
+\x64\x5c\xa8\xbf\xb3\xb9\x99\x07\x2b\x7b\x59\x1d\x00\xc8\x1f\x76\
+\x31\x7e\xd2\x64\xe4\x4f\x04\xd4\x9a\x7f\xfc\xa5\x6d\xe0\xe5\xaf\
+\xb8\xfd\xf2\x4e\x35\xfa\xbc\xf9\x4d\x92\xad\xbc\xe3\xa1\x24\xd6\
+\xae\x45\x9a\x55\x11\x10\x94\x07\x01\x15\xe7\x1e\xdb\xc2\xc4\x31\
+\x98\x60\x6d\x00\x20\x7f\x40\xfe\x44\x40\x7d\x57\x7d\xfb\xf8\x99\
+\x21\xa1\x08\x80\x6f\xd6\x0c\x13\x8d\x32\x13\xf6\xfa\x79\x8f\x3d\
+\x28\x5f\x7c\xb6\xa2\xca\xda\xcf\xa0\xde\x3c\xb0\x29\x00\x36\xcf\
+\xe9\x1f\x98\xf3\xff\xe2\xac\x7e\x26\x8e\xc1\x16\x2b\x03\x00\xf9\
+\x03\xf2\x27\x02\xea\x8b\x5a\x48\x25\x0c\xf2\xdf\xc5\x5f\x8f\xd9\
+\xfd\xb7\x40\xb5\x32\xdf\xdc\x09\xdd\x02\x71\x2b\x3b\x3b\x2b\xc1\
+\x9a\x00\x78\xfa\x8e\x5e\x81\x3a\xff\x86\xb6\x0a\x6e\x67\x55\x00\
+\x20\x7f\x40\xfe\x4e\x46\xc0\x3b\xba\xcf\xe7\xb3\xf7\xf4\x0e\x55\
+\x00\xbc\x31\x6f\xe0\xaf\x16\x86\xe9\xdb\x35\x4b\xbc\xbf\x38\x38\
+\xaf\x38\x1e\x52\xd5\xd4\x9a\x00\x78\xf0\x86\xae\x81\x3a\xff\x37\
+\x9d\x57\x6a\xe2\x38\x9c\x66\x4d\x00\x20\x7f\x40\xfe\x4e\x06\x40\
+\x4c\x74\xbf\x72\x6d\xe7\xb3\x55\x61\x6a\xa8\xe4\xbf\x8b\x61\x7d\
+\xb2\x7f\xb6\xa4\xad\x5a\x74\x27\x48\x7f\xff\x2d\xa3\xdb\x5b\x13\
+\x00\x13\xff\x16\xac\xa5\xa1\xd5\x4a\x8b\x06\xf6\x07\x98\x65\x45\
+\x00\xf8\x21\xff\xf5\x2f\x6d\x42\xb6\xc8\x1f\xf9\xfb\x1f\x00\x65\
+\xba\xcf\xa9\xba\x5d\x1e\xc6\x00\x98\x73\x4b\xb9\x68\x98\x1e\x1f\
+\xf9\x7f\x83\xf8\xf7\xaf\x7b\xb0\xaf\x35\x01\xa0\xf6\x3d\x08\xda\
+\xf1\xdb\xaf\xbf\xf6\x0d\xa2\x3e\x95\xc4\xfa\x1a\x00\xc8\x1f\x7c\
+\x94\xff\x13\xc8\xdf\xf7\x00\x38\x4b\xf7\x79\x5d\x76\x67\xaf\x50\
+\x06\x80\xfa\x1d\xfd\xad\x05\x83\x02\xfb\xf7\xab\x27\xef\x6d\x09\
+\x80\x53\x0f\x2f\x0a\xdc\xf1\x53\x2b\x18\x1a\x38\x16\xe5\xbe\x05\
+\x00\xf2\x07\xe4\xef\x7c\x00\xcc\xd6\x79\x5e\x1b\x37\x4c\x08\xcc\
+\x3b\xde\xae\xa1\xce\x8b\xa1\x0d\x6e\x6a\xcd\x99\x47\x15\x07\xee\
+\xf8\xa9\xb5\x1d\x0c\xfc\x0c\x70\x9e\x2f\x01\x80\xfc\x01\xf9\xf3\
+\xfb\x7f\xf4\x36\xa4\xb6\x73\x7b\xcc\x81\x79\xc8\xd6\x62\x54\xa0\
+\xd9\x10\x00\x63\xce\x0a\xe6\x1a\x11\xbd\x3b\x67\x69\xff\x09\xd4\
+\xf3\x00\x40\xfe\x80\xfc\x41\xfe\xeb\xa2\xfb\xfc\xaa\x0d\x6f\x10\
+\xad\xbd\xd8\xb2\x41\x90\x5a\x5c\x29\x88\xc7\xef\xa2\x51\x25\xba\
+\x8f\xc5\x57\x92\x04\xcf\x02\x00\xf9\x03\xf2\x87\xe8\xb5\xe0\x6c\
+\x9d\xe7\x37\x29\x31\x56\x7c\xb9\x6a\x18\xa2\xb5\x18\x5b\xf6\x05\
+\xf0\x6b\x83\xa4\xfa\xb2\xf8\xb6\x9e\x26\x8e\x47\x3f\x4f\x02\x00\
+\xf9\x03\xf2\x87\x6a\xd7\x83\x59\x3a\xcf\xf1\xc8\x7e\x39\x48\xd6\
+\xf2\xed\x8d\x6d\x79\x08\x70\xed\x03\x7d\x03\xbb\x2a\xa4\x0a\x5d\
+\xcd\xc7\xe3\x52\xe3\x01\x80\xfc\x01\xf9\xc3\x2f\xae\x09\xff\xd4\
+\x79\x9e\xaf\x3e\xb3\x0d\xa2\xb5\x18\xb5\x33\xa0\x2d\x01\xb0\xe5\
+\xa9\xca\xc0\x1e\xc7\xca\x9e\x8d\x8d\x3d\x07\x80\xfc\x01\xf9\x83\
+\x17\xf2\x4f\x93\xec\xd4\x79\xae\xd5\xed\x51\x44\x6b\x2f\x8f\x8e\
+\xeb\x66\x85\xfc\xd5\x9b\x08\xdf\xaf\x0f\xee\x9b\x22\x57\x9e\xde\
+\x46\xf7\x31\xf9\x97\xb1\x00\x40\xfe\x80\xfc\x61\x37\xd7\x85\x5e\
+\xba\x2f\xea\x9f\x5b\xb4\x05\x2e\xfc\x9a\xf1\x17\xda\xb1\x12\xa0\
+\xda\x93\x20\xc8\xc7\xf1\xb9\x7b\x7a\xeb\x3e\x26\x3b\x77\x5d\x27\
+\x91\x3f\x20\x7f\xf0\x22\x00\x46\xe9\x3c\xdf\xed\x4b\xd2\x91\xac\
+\xe5\xa8\x1d\x0b\x6d\x08\x80\x8e\xad\x82\x3d\x56\xd4\xdd\x0b\x03\
+\x0f\x53\x76\xd4\x1a\x00\xc8\x1f\x90\x3f\xec\xe5\xfa\x30\x5e\xe7\
+\x39\x3f\xee\xb7\xf9\x48\xd6\x72\x69\xed\x6b\x4b\x63\xaf\xf8\xcd\
+\xc0\xdc\xc0\x1f\xcf\x81\xdd\xb5\x3f\x07\x70\xa8\xb6\x00\x40\xfe\
+\x80\xfc\x61\x1f\xd7\x88\x65\x3a\xcf\xfb\xad\x97\x74\x44\xb4\x16\
+\xb3\xe0\xd6\x1e\xd6\x3c\x00\x38\xf6\xfc\xd2\xc0\x1f\xcf\x93\x0e\
+\x2b\xd4\x7d\x5c\x2e\xd2\x12\x00\xc8\x1f\x90\x3f\xd4\xe0\x3a\xa1\
+\x75\x05\x40\xf5\x84\x39\xa2\xb5\x97\x13\x0f\x2d\xb0\x26\x00\x36\
+\xcf\xe9\x1f\xf8\xe3\x79\xe3\xb9\xda\xb7\x07\xbe\xa7\xde\x01\x80\
+\xfc\x01\xf9\x43\x0d\xae\x13\x4d\x74\x9e\xfb\x84\xf8\x98\xc0\x6d\
+\x8d\xeb\x12\xea\xdc\xa8\x07\xef\x6c\x90\x7f\x5e\x6e\x52\x28\x8e\
+\xe9\xe3\x13\xba\xeb\x3e\x36\xab\xea\x15\x00\xc8\x1f\x90\x3f\xd4\
+\xf0\x5a\x51\xae\xf3\xfc\xb7\x2a\x4c\x45\xb4\x16\xf3\xe4\x14\x7b\
+\x6e\xff\xab\x07\x11\xc3\x70\x4c\xdf\x98\x37\x50\xf7\xb1\xf9\xac\
+\xce\x01\x80\xfc\x01\xf9\x43\x2d\xae\x17\x07\xe8\x1c\x03\x55\xbd\
+\xb3\x11\xad\xc5\x0c\xe9\x95\x6d\x4d\x00\xcc\xf8\x47\x97\xd0\xdc\
+\x55\x51\x77\xbe\x34\x1f\x9f\x26\xc8\x1f\x90\x3f\x98\x0e\x80\x3f\
+\xeb\x1c\x07\xa3\x0e\x2d\x40\xb4\x96\xb2\x68\x6a\x4f\x6b\xe4\xaf\
+\xd6\x8a\xf8\xf8\x99\x21\xa1\x39\xb6\xed\x5a\xa4\xe9\x3e\x46\x03\
+\x90\x3f\x20\x7f\x30\x1d\x00\x57\xb2\x04\x70\xf8\xf9\xf1\xc5\x91\
+\xa2\x7b\x87\x4c\x6b\x02\xa0\xbc\x34\x33\x54\xc7\xf7\xa0\xca\x26\
+\xba\x8f\xd1\x09\xc8\x1f\x6a\xcd\x84\xc9\xb7\x22\x7f\xa8\xcd\xb5\
+\xe3\x0e\x9d\xe3\xe1\xbe\x6b\xcb\x10\xae\x85\x3c\x74\x63\x57\x6b\
+\xe4\xaf\x18\x7d\x42\x49\xa8\x8e\xef\xf9\xc7\xb5\xd4\x7d\x8c\xce\
+\x45\xfe\x80\xfc\xc1\x74\x00\x2c\xd4\x39\x26\x56\xdc\x5b\x81\x70\
+\x2d\xfc\x8d\xba\x6d\x71\x9a\x55\x01\xb0\x6a\x46\xb8\xc6\xc9\x6d\
+\x97\x75\xd4\x7d\x8c\x2e\x47\xfe\x80\xfc\xc1\x74\x00\x6c\xd2\x39\
+\x2e\x3e\x58\x32\x18\xe9\x5a\xc6\xd4\x4b\x3b\x5a\x25\xff\xbe\x5d\
+\xb3\x42\x77\x8c\x1f\xbe\x49\xfb\x1d\x96\x9b\x90\x3f\x20\x7f\x30\
+\x1d\x00\x1f\xe9\x1a\x17\xb1\xb1\x31\x91\xdf\x9a\x91\xae\x3d\xbc\
+\xbf\xb8\xd2\x9a\x65\x7f\x77\x31\xe7\x96\xf2\xd0\x1d\xe7\x85\xfa\
+\x5f\xaf\xbc\x6d\x6f\x93\xb6\x3d\xf2\x07\xe4\x0f\x1a\x02\xe0\x4b\
+\x5d\x63\x43\x6d\x8a\x82\x74\xed\x7a\xf0\x4f\xbd\x96\x69\x93\xfc\
+\xd5\x4f\x11\x3b\x37\x86\x6f\xa1\xa8\x95\xd3\x2b\x74\x1f\xab\xfb\
+\xf7\x34\x61\xb3\xd5\x9e\xc1\xc8\x1f\x90\x3f\x68\x08\x80\x1f\x74\
+\x8d\x8f\xdc\x46\x89\x88\xd7\x22\x6e\xbe\xa0\xd4\x2a\xf9\x2b\xa6\
+\xfc\x3d\x9c\xfb\x44\x6c\x9a\xdd\x5f\xf7\xb1\x9a\xb7\xbb\xc9\x1a\
+\x2f\x59\x8a\xfc\x01\xf9\x83\x06\xf9\xc7\xeb\x1c\x23\xc5\x79\x29\
+\x88\xd7\x12\xd4\x1a\xfb\xc9\x49\xb1\x56\xc9\xbf\x49\xe3\x44\xf1\
+\xdf\x35\xc3\x43\x79\xbc\xdf\x59\x38\x48\xf7\xf1\x7a\x66\x77\x13\
+\x76\x12\xf2\x07\x1f\xe4\x3f\x0f\xf9\x87\x32\x00\x32\x74\x8e\x93\
+\xf6\x25\xe9\xc8\xd7\x02\xbe\x5b\x37\x5c\x74\x69\x97\x61\xdd\xb7\
+\xff\x2b\x4f\x0f\xef\x1a\x11\x9f\x3e\x5b\xa5\xfb\x78\xad\xff\xe5\
+\x64\x3d\x08\xf9\x03\xf2\x07\x5b\x37\x02\x52\x0b\xcd\x20\x60\xff\
+\xb9\xe0\xf8\x96\xd6\xc9\x3f\x35\x39\x4e\x6c\x5f\x5e\x15\xda\x63\
+\xfe\xfd\xfa\x11\xba\x8f\xd9\x1b\xd5\x27\x6a\x9c\xe4\x65\xe4\x8f\
+\xfc\x91\x3f\x68\x0c\x80\x62\x9d\xe3\x65\x40\xb7\x46\x08\xd8\x67\
+\xe6\x4f\xee\x1e\x79\x1b\xc3\xb6\x00\x38\xe3\xc8\xa2\xd0\x1f\xfb\
+\xa4\x44\xad\xd7\xe6\x6d\xd5\x27\xea\xf1\xc8\x1f\xf9\x23\x7f\xd0\
+\x1c\x00\xa5\x3a\xc7\xcc\x88\xbe\x39\x48\xd8\xe7\xdf\xfd\x33\xd3\
+\xe3\xad\x93\x7f\xe3\x86\x09\xa1\x5a\xf7\x7f\x4f\xe4\x64\x25\xea\
+\x3c\x6e\x5f\xed\x9a\xa4\xc9\x92\xf7\x90\x3f\xf2\xf7\x58\xfe\x89\
+\x48\x32\xf4\x01\xd0\x49\xe7\xb8\x39\x60\x50\x2e\x22\xf6\x09\x25\
+\xd8\x16\x79\x29\xd6\xc9\x5f\x71\xfb\xe5\x9d\x9c\x38\x07\x05\x4d\
+\x93\x75\x1e\xb7\x1d\xbb\x26\xe9\xd1\xc8\x1f\xf9\x23\x7f\x30\x10\
+\x00\x2d\x75\x8e\x9d\xc1\xbd\x1a\x23\x63\x1f\xf8\x76\xed\x70\xd1\
+\xaf\xbc\x91\x95\xf2\xef\x2f\xff\x2e\x57\x16\x87\xd2\xbc\xe0\xd2\
+\x17\xbb\x26\xe9\xc3\xc8\x1f\xf9\x23\x7f\x30\x10\x00\x39\x3a\xc7\
+\x4f\x8f\x8e\x0d\x11\xb2\x0f\x1c\x73\x60\x9e\x95\xf2\x4f\x88\x8f\
+\x89\xfc\x2c\xe1\xca\x79\x88\x8f\xd3\xfa\xec\xc5\x16\x35\x41\x93\
+\x74\xae\xd4\xf5\x4b\x5a\xb6\x44\xfe\xc8\x1f\xf9\x3b\x1c\x00\x49\
+\x3a\xc7\x90\xda\x13\x1d\x21\x7b\xcb\x98\xb3\xda\x5a\x29\x7f\xc5\
+\x85\x27\x96\x38\x73\x1e\xd4\xfa\x06\x9a\x8f\xdf\xab\x6a\x82\x8e\
+\x44\xfe\xc8\x1f\xf9\x83\xc1\x08\xf8\x5e\xd7\x38\xca\xcb\x4d\x42\
+\xca\x1e\x32\x6b\x6c\xb9\x88\x89\xb1\x53\xfe\x2d\xf3\x53\xc4\x37\
+\x6b\x86\x39\xf5\x0c\x86\xe6\x63\xf8\x42\x83\xc8\x8e\x40\xc8\x1f\
+\xf9\x23\x7f\x30\x17\x00\xff\xd6\x35\x96\xd2\x53\xd9\x0b\xc0\xcb\
+\xb5\xe7\xd5\xbb\xf5\xb6\x7e\xfb\x57\xaf\x23\xba\x74\x3e\xde\x7c\
+\x62\xa0\xee\x63\xa8\x56\xfc\x6d\xf0\x10\xf2\x47\xfe\xc8\x1f\x0c\
+\x06\xc0\xbb\xba\xc6\x93\xfa\x36\xca\x6e\x80\xe6\xd9\xf0\x50\x5f\
+\x91\x95\x91\x60\xad\xfc\x7f\x3f\xbc\x99\x93\xe7\x44\xf3\x71\x7c\
+\x4c\x4d\xce\x67\x75\xfe\x47\xf3\x0b\x0a\x90\x3f\xf2\x47\xfe\x50\
+\x3d\x00\x36\xeb\x1c\x57\xff\x79\x7e\x28\x92\x36\xc8\x6b\x73\x07\
+\x44\xd6\xd4\xb7\x55\xfe\x85\xcd\x92\xc5\x27\xcb\x87\x38\x77\x5e\
+\x96\xdf\xdd\x5b\xf7\xb1\xbc\x4f\x4d\xce\x7f\xea\xfc\x8f\x4e\xbf\
+\xff\x7e\x64\x8b\xfc\x91\x3f\x54\x0f\x80\xe7\x75\x8e\xad\x0f\x96\
+\x0c\x46\xd4\x06\x37\x9c\xd1\xfc\xae\xb9\x56\x12\x13\x62\xc5\xaa\
+\x19\x15\x4e\x9e\x9b\x27\x26\x75\xd7\x7d\x3c\x6f\x6d\x10\x59\x0d\
+\x48\xd7\x5e\xdd\x69\x69\x62\xeb\x27\xdb\x11\x2e\xf2\x47\xfe\x50\
+\x3d\x00\x16\xe9\x1c\x5f\xea\x1b\x2a\xb2\xd6\xcf\xb6\xa5\x83\x45\
+\xeb\xa2\x54\x6b\xe5\xaf\x98\xf8\xb7\x0e\xce\x9e\x9f\x07\xae\xef\
+\xa2\xfb\x78\x5e\xaf\x26\xe7\x7f\x74\xfd\x07\x53\x52\x52\xc4\x07\
+\x1f\x7f\x82\x74\x91\x3f\xf2\x87\xea\x01\xf0\x88\xce\x31\xa6\x6e\
+\x85\x22\x6c\xfd\x3b\xcd\x75\x6a\x9d\x6e\xb5\xfc\x8f\xda\xbf\xb9\
+\xd3\xe7\x68\xfc\x85\xed\x75\x1f\xd3\xbf\x37\x88\xec\x08\xa4\xf1\
+\x3f\x3a\xf9\xb6\xdb\x10\x2f\xf2\x47\x7c\x50\x3d\x00\xee\xd6\x39\
+\xce\xa6\x39\xb2\xec\xab\x57\xa8\x67\x2a\x7a\x76\x6a\x68\xb5\xfc\
+\x3b\xb6\x4a\x17\x5f\xad\x1e\xe6\xf4\x79\x3a\xfd\x0f\x45\xba\x8f\
+\xeb\x5f\xd4\xe4\x7c\x46\xe7\x7f\x34\x3b\x3b\x47\x3c\xfb\xfc\x2a\
+\x04\x8c\xfc\x01\x76\x05\xc0\x0d\x3a\xc7\xda\xf9\xc7\xb5\x44\xdc\
+\x9a\x50\xef\xd1\x0f\xea\xd1\xd8\x6a\xf9\x67\xa4\xc5\xf3\xb3\x8f\
+\x64\x58\x9f\x6c\xdd\xc7\xf6\x8f\x6a\x72\x3e\xa0\xfb\x84\x35\x69\
+\xd2\x44\x3c\xb7\x6a\x35\x22\xf6\x89\x89\xb7\x22\x7f\xb0\x2a\x00\
+\x46\xe9\x1c\x6f\x07\x55\x36\x41\xde\x9a\xe4\x3f\xbc\x6f\x8e\xd5\
+\xf2\x57\x3c\x7c\x53\x57\xce\x97\xa4\xa8\xb9\xf6\x87\x33\x7b\xa8\
+\xc9\x79\x9d\x89\x93\xd6\xb4\x69\x53\x22\x00\xf9\x03\xa8\x6b\xcc\
+\x00\x96\x03\xb6\x8b\x2f\x57\xd9\xff\xcd\x5f\x71\xce\x9f\x5a\x70\
+\xbe\xa2\xb1\x66\x60\x45\xc6\x4c\x35\x39\x87\x98\x3a\x79\x44\x00\
+\xf2\x07\x90\xff\x9a\xe8\xde\x00\xe6\x87\x0d\x23\x10\x43\x1d\xf9\
+\x7c\xe5\x50\x51\x51\x96\x65\xbd\xfc\x0f\x1e\xd2\x54\xec\xdc\xc8\
+\x79\x56\xbc\x38\xab\x9f\xee\xe3\xbb\x35\x3a\x37\x1b\xc4\x4b\x3e\
+\x33\x19\x01\x2b\x56\xbf\x80\xa0\x91\x3f\xb8\x1d\x01\x5a\xaf\x31\
+\x6f\xcc\x1b\x88\x18\xea\xc0\xf6\xe5\x55\xa2\x5b\xfb\x4c\xeb\xe5\
+\xaf\xb6\xf8\x55\x9b\xdf\x70\xce\xfe\xc7\x43\x37\x76\xd5\x7d\x8c\
+\x9f\x8e\xcc\xcb\xe8\xe4\x9c\x69\xf2\x64\x36\x6b\xd6\x8c\x08\x40\
+\xfe\xe0\x76\x00\xac\xd2\x39\x06\x1f\x9f\xd0\x1d\x31\xd4\x92\x0f\
+\x9f\x1e\x62\xfd\xab\x7e\xbb\x9e\xf8\xff\xf7\x73\x55\x9c\xb3\x6a\
+\x5c\x75\x46\x1b\xdd\xc7\x79\x4a\xf5\x00\x38\xc2\xf4\x49\x25\x02\
+\x90\x3f\x38\x1d\x00\xf7\xe8\x1c\x87\x37\x9e\x5b\x8a\x18\x6a\xc1\
+\xfb\x8b\x2b\x45\xdb\xe2\x34\xeb\xe5\xaf\x56\x21\x54\x7f\x2b\xe7\
+\xec\xe7\x1c\x7d\x40\x9e\xee\x63\xfd\xd7\xea\x01\x90\xa0\x7b\x49\
+\xe0\x3d\x46\xc0\x0b\x6b\x10\x37\xf2\x07\xf7\x02\xe0\x6f\x3a\xc7\
+\xe2\xa8\x43\x0b\x10\x43\x0d\x79\x6b\xc1\xa0\xc8\xd6\xb9\xb6\xcb\
+\xbf\x51\x66\x82\xd8\x3c\xa7\x3f\xe7\x6c\x37\xf4\xe8\xa8\x7d\x9d\
+\x86\xfd\x7f\x0a\x80\xe8\x04\x3d\xdc\x8b\x93\x4c\x04\x20\x7f\x70\
+\x32\x00\x0e\xe3\x4d\x00\xef\x79\xfd\xf1\x01\x56\xaf\xed\xbf\x8b\
+\xe4\xa4\x58\x56\x78\xdc\xcb\x1b\x1b\xf1\x71\x31\xba\x8f\x79\xab\
+\x5f\x06\x40\x8c\x64\x8d\x27\x11\xd0\xbc\xb9\x58\xb9\x66\x2d\x22\
+\x0f\x8e\xfc\x1f\x47\xfe\x50\xcf\x00\xe8\xa4\x7b\x5c\xb2\x29\xd0\
+\xde\xd9\x34\xbb\xbf\x68\x9a\x9d\x68\xbd\xfc\x63\x63\x63\xc4\xec\
+\x9b\xcb\x39\x67\xde\x6d\x02\xf4\x9d\x24\xee\x67\x01\x10\x9d\xa4\
+\x83\xbd\x3a\xe9\x44\x00\xf2\x07\xa7\x02\x20\x49\xb2\x53\xeb\xce\
+\xa3\xd7\x94\x21\x88\x3d\xb0\xee\xc1\xbe\x22\x3b\x2b\xc1\x7a\xf9\
+\xab\x77\xdb\x6f\xbb\xac\x23\xe7\x6c\x2f\x9c\x7b\x6c\x0b\xdd\xc7\
+\xfd\xe5\x9f\xe6\xe5\x6e\x26\xea\x55\x44\x00\xf2\x47\xfe\x60\x20\
+\x02\xde\xd4\x39\x3e\x8f\xfb\x6d\x3e\x82\xd8\x0d\xcf\xdf\x57\x21\
+\xb2\x32\x12\x02\xf1\xcd\xff\x76\xf6\x75\xd8\x27\x5d\x4b\xb5\xbf\
+\xb6\x39\x6b\x6f\x01\xa0\x7e\x0a\x78\xcc\xab\x41\xd0\x3c\x2f\x4f\
+\x3c\xbf\x96\x08\x40\xfe\xe0\x40\x00\xdc\xa5\x73\x8c\xaa\xa5\x51\
+\x11\xc4\xcf\x59\x76\x67\x2f\x91\x9e\x1a\x67\xbd\xfc\xe3\xa4\xfc\
+\xef\x1d\xc3\x1d\x9c\x9a\xac\xdb\x60\x60\x05\xc0\xb3\xf7\x18\x00\
+\xd1\x89\x9a\xa1\x6e\x13\x10\x01\xc8\x1f\x40\x63\x00\x1c\xa3\x7b\
+\xac\xfe\x93\x05\x81\x7e\xe2\xc9\x29\x3d\x44\x4a\x92\xfd\xf2\x57\
+\x0f\xb4\xa9\xbd\xed\x39\x67\xfb\x46\xed\x83\x60\xe0\x1c\x74\xde\
+\x6b\x00\x44\x27\x6b\x89\x64\x0b\x11\x80\xfc\x01\x34\x05\x40\xbe\
+\xee\xf1\x3a\xf5\x52\x7e\x3f\x56\x3c\x36\xbe\x9b\x48\x4a\x8c\xb5\
+\x5e\xfe\x6a\x19\x67\x1e\xf8\xab\x39\xa7\x1e\xae\x7d\x0b\xe0\x8f\
+\xd4\x5d\xfe\x7d\x06\x40\x74\xc2\xb6\xf6\x32\x02\xf2\xf2\xf3\xc5\
+\xaa\x75\xeb\x10\x3f\xf2\x87\xf0\x46\xc0\x6b\x3a\xc7\xec\x11\x23\
+\x9b\x3b\x2f\x89\x07\x6f\xe8\x1a\x11\xab\xed\xf2\x57\x81\xc2\x0a\
+\x8e\xb5\x43\xbd\xee\xaa\xf9\x3c\x3c\xf0\xb3\xf9\x58\x83\x09\x4b\
+\x04\x20\x7f\x00\x5d\x01\x30\x49\xe7\xb8\xcd\x6d\x94\x28\x7e\x7c\
+\xd1\x5d\x41\xdc\x33\xa6\x73\xe4\xf7\x74\xdb\xe5\xaf\x7e\x9a\x58\
+\x38\xa5\x07\x52\xaf\x05\x5b\x9e\xaa\x34\x71\x2e\x4e\xaa\x55\x00\
+\x44\x27\x6d\x1b\x22\x00\xf9\x03\xd8\xb6\x20\x90\xe2\xe9\x3b\x7a\
+\x39\x29\x88\x29\x7f\xef\x68\xe2\x01\x31\xed\xa4\xa5\xc4\x89\x25\
+\xb7\xf7\x44\xea\xb5\xe4\xe6\x0b\x4a\x4d\x9c\x8f\x56\xb5\x0e\x80\
+\x6a\x11\xf0\x81\x57\x83\x26\xbf\xa0\x40\xac\x5e\xb7\x1e\xf9\x23\
+\x7f\x08\x57\x00\x34\xd6\xbd\x1e\xc0\xf1\x07\xe7\x23\x07\x4b\xc9\
+\x48\x8b\x67\x85\xbf\x3a\x52\xae\xff\xf5\xbf\x77\x7e\x35\x1f\x6b\
+\x39\x79\x89\x00\xe4\x0f\x50\xdf\x08\x58\xaf\x5b\x32\xdf\xac\x19\
+\xe6\x8c\x18\xc6\x9c\xd5\x36\x10\xf2\x6f\x98\x1e\x1f\x59\x93\x00\
+\x99\xd7\x6d\x15\x47\x03\xe7\xe4\xce\x7a\x05\x40\x74\xf2\xb6\xf5\
+\x3a\x02\x5e\x58\xbf\x01\xf9\x23\x7f\x08\x4f\x00\xdc\xa0\x7b\x3c\
+\xcf\xf8\x87\x1b\xaf\x95\x5d\x34\xaa\x24\x10\xf2\x6f\xdc\x30\x41\
+\xac\xb9\xbf\x0f\x32\xaf\x23\xe7\x1f\xd7\xd2\xc4\x79\xf9\x63\xbd\
+\x03\xa0\x5a\x04\x6c\xf5\x6c\x8b\xc8\xc2\xc2\x50\x47\x00\xf2\x07\
+\xc7\x02\x60\x3f\xdd\x63\x7a\x64\xbf\x9c\x50\x0b\x41\x3d\xe8\x78\
+\xda\x11\x45\x81\x90\x7f\x4e\x56\xa2\xd8\xf8\x70\x3f\x44\x5e\x47\
+\x76\x6e\x1c\x21\xf2\x72\x93\x4c\x9c\x9b\xe6\x5a\x02\x20\x3a\x89\
+\xdb\x11\x01\xc8\x1f\xa0\x0e\xd7\x8e\xb4\xe8\x86\x24\x5a\x57\x96\
+\xdb\x1a\xd2\xcd\x81\x7e\xd8\x30\x42\xfc\xf1\x37\x79\x81\x90\xbf\
+\xda\x7c\x88\x2d\x7d\xeb\xc7\xa2\xa9\x3d\x4d\x9c\x9b\x97\x77\x3b\
+\x17\xeb\x39\x91\x3d\x8f\x80\x35\x1b\x36\x22\x7f\xe4\x0f\xc1\x8f\
+\x80\x39\xba\xc7\xf7\x8d\xe7\x96\x86\x4e\x06\xdf\xae\x1d\x2e\x0e\
+\xaa\x6c\x12\x08\xf9\xab\x6f\xad\xaf\xcd\x1d\x80\xc4\xeb\xc9\xd1\
+\x07\x18\x89\xbd\xcb\xb4\x07\x40\xb5\x08\xd8\xe6\xd5\x20\x2b\x2c\
+\x2a\x0a\x45\x04\x20\x7f\x70\x3c\x00\x0e\xd1\x3d\xc6\xcb\xda\x66\
+\x84\x6e\x1f\xf8\x21\xbd\xb2\x03\x21\xff\xc2\x66\xc9\x2c\xcb\xac\
+\xe9\x9c\xab\xd7\x26\x0d\x9c\xa3\x12\x23\x01\x10\x9d\xcc\xa5\x44\
+\x40\xcd\x99\x34\x65\x0a\xf2\x07\xd7\x03\x20\x51\xf2\xa9\xee\xb1\
+\xbe\xfe\xa1\xbe\xa1\x10\xc1\xa7\xcf\x56\x89\xde\x9d\xb3\x02\x21\
+\xff\xca\x9e\x8d\xc5\xdb\x0b\x07\x21\x70\x0d\xdc\x79\x65\x67\x13\
+\xe7\xe8\xb9\x3d\xce\x43\x8d\x13\xda\xf3\x08\x58\xbb\xf1\x45\xe4\
+\x8f\xfc\x21\xb8\x11\x30\x59\xf7\x78\xff\x43\x08\x96\x06\xde\xb6\
+\x74\xb0\xe8\xd4\x3a\x3d\x10\xf2\x6f\x5f\x92\x2e\x46\x9f\x50\x62\
+\x2d\x33\xaf\xeb\x12\xa8\x07\x3d\x3b\xb4\x32\x72\xde\x4f\x36\x1e\
+\x00\xd1\x09\xdd\x5e\xf2\xa1\x57\x83\xaf\xa8\xb8\x38\x50\x11\x80\
+\xfc\x01\x7e\x76\xbd\xe8\x63\x62\x8f\xf9\x37\x02\x7c\x2b\x5a\x7d\
+\x93\x6e\x55\x98\x1a\x08\xf9\x07\x81\x20\xed\x15\xf1\xc8\xd8\x72\
+\x13\xc7\xe0\x5b\x49\x96\x27\x01\x40\x04\x20\x7f\x80\x5a\x5e\x2f\
+\xfe\xa9\x7b\xec\x07\x75\x65\xc0\x57\x1e\xed\x2f\xf2\x9b\x24\x23\
+\x6e\x47\x03\xa0\x5b\xfb\x4c\x13\xc7\x60\xd6\x5e\xe7\x9f\xa1\x49\
+\xed\x79\x04\xac\x7b\xf1\x25\xe4\x8f\xfc\x21\x78\x01\x70\xa9\x89\
+\x2d\x67\xdf\x7d\xb2\x32\x50\xf2\x5f\xfb\x40\xdf\xc8\xfb\xf3\x48\
+\xdb\xcd\x00\x98\x3f\xb9\xbb\xa9\x63\x70\x90\xe7\x01\x10\x9d\xd8\
+\x1d\xbc\x8c\x80\xe2\xe2\x16\x56\x46\x00\xf2\x07\xd8\xeb\x75\xa2\
+\xc4\xc4\x3c\x38\xfd\x0f\x45\x81\x91\xbf\x5a\x2b\x3f\x33\x3d\x1e\
+\x61\x3b\x1c\x00\xfd\xca\x1b\x99\xf8\xfc\x9f\x48\x12\x7c\x09\x80\
+\x6a\x11\xf0\x91\xab\x11\xa0\xe4\x1f\x17\x17\x87\xfc\x01\xf6\x7e\
+\x9d\x78\x4e\xf7\x5c\x48\x4e\x8a\x8d\x3c\x4c\x17\x84\x6f\x7e\x6a\
+\xab\x5c\x64\xed\x6e\x00\x2c\xbb\xb3\x97\xa9\xcf\x3f\x71\x9f\x73\
+\xcf\x83\xc9\xed\x69\x04\xb4\x68\xd1\x52\xac\x7f\x69\x13\xf2\x07\
+\x08\x4e\x00\x9c\x6c\x62\x4e\x9c\x77\x5c\x4b\xab\x2f\xfc\x0f\xde\
+\xd0\x35\xf2\x73\x05\xa2\x76\x3b\x00\x86\x56\x18\x5b\xeb\xa1\x97\
+\xef\x01\x10\x9d\xe0\x1d\x5d\x8a\x00\xe4\x0f\x50\xab\xeb\x43\x96\
+\xe4\x3f\xba\xe7\x45\x7a\x6a\x5c\xe4\x7d\x7a\x1b\x2f\xfa\xd3\x2e\
+\xef\x14\x79\x63\x01\x49\xbb\x1d\x00\xab\x67\xf6\x31\xf5\xd9\x5f\
+\xaa\xd1\xdc\xf3\x70\x92\xab\x08\xf8\x38\xec\x11\xe0\x83\xfc\xe7\
+\x22\x7f\x08\x41\x04\x5c\x67\x62\x7e\x9c\x79\x54\xb1\x75\x17\x7d\
+\xb5\x64\x31\x72\x26\x00\x14\x03\xbb\x37\x36\xf5\xd9\x8f\xb4\x2a\
+\x00\xa2\x93\xbc\x93\x97\x11\xd0\xb2\x65\x4b\xb1\x61\xd3\x66\xe4\
+\x0f\x60\x7f\x00\x34\x91\x7c\xa3\x7b\x8e\xa8\x4d\x82\x6c\x5a\x1d\
+\xf0\xea\x33\xdb\x20\x66\x02\x20\xc2\x3d\x63\x3a\x9b\xfa\xdc\x6f\
+\x48\x62\xad\x0b\x80\x30\x47\x00\xf2\x07\xa8\xf7\xb5\x61\x9c\x89\
+\xb9\xa2\x96\xd4\x55\xab\xac\xd9\x70\xd1\x0f\xca\xf2\xbe\x04\x80\
+\x59\x3e\x5b\x51\x25\x9a\x34\x36\xf6\xda\xe7\xf1\x35\x9e\x73\x3e\
+\x4d\xf4\x50\x45\x00\xf2\x07\xd0\x72\x5d\x28\xd0\xbd\x4d\xf0\x2e\
+\xa6\x5e\xda\x91\x00\x20\x00\xac\xe1\xd4\xc3\x8b\x4c\x7d\xe6\x77\
+\xf6\xf5\xea\x9f\xef\x01\x10\x9d\xec\x9d\xa3\xef\x29\x7a\x32\x10\
+\x4a\x4a\x4a\x8c\x44\x00\xf2\x07\xd0\x7a\x5d\xb8\xcd\xc4\xbc\x69\
+\xdc\x30\x41\x7c\xb2\x7c\x08\x01\x40\x00\xf8\xce\x9a\xfb\xfb\x98\
+\x7c\x00\xf4\xb4\x5a\xcd\x37\x9f\x27\xbb\xf7\x11\xb0\xf9\x65\xe4\
+\x0f\x60\xf7\xc2\x40\x3b\x4c\xcc\x9f\x13\x0e\x29\x20\x00\x08\x00\
+\x5f\xd9\xb9\x71\x84\xe8\xd1\xb1\xa1\xa9\xcf\xbb\x55\x92\x1c\x98\
+\x00\x88\x4e\xf8\xb2\x20\x46\x00\xf2\x07\x30\x76\x4d\x98\x6e\x62\
+\x0e\xc5\xc4\x34\x10\xcf\xdd\xd3\x9b\x00\x20\x00\x7c\x63\xf2\x25\
+\x1d\x4c\x7e\xde\x73\x6b\x3d\xd7\x2c\x99\xf0\x2a\x02\xb6\x7b\x16\
+\x01\xad\x5a\xd5\x2b\x02\x90\x3f\x80\xd1\xeb\x81\xda\x4b\x64\xa7\
+\x89\xb9\x54\xd6\x36\x43\xfc\xb0\x61\x04\x01\x40\x00\x78\xce\x47\
+\xcb\x86\x88\xac\x8c\x04\x53\x9f\x55\xf9\x33\x2d\x90\x01\x10\x9d\
+\xf4\x5d\xbc\x8e\x80\x8d\x2f\xbf\x82\xfc\x01\xec\x8c\x80\x87\x4d\
+\xcd\xa9\x0b\x4f\x2c\x21\x00\x08\x00\x4f\x51\x6f\xa1\xec\xd7\x3f\
+\xd7\xe4\x67\xbd\xb8\x4e\xf3\xcc\xb2\x49\xef\x69\x04\xb4\x6a\xdd\
+\xba\x56\x11\x80\xfc\x01\x3c\xbd\x2b\xb8\xc3\xd4\x4f\x01\x6a\x0d\
+\x7e\x02\x80\x00\xf0\x8a\x7f\xfc\xa5\xad\xc9\xcf\xa9\x7e\x42\x6f\
+\x18\xf8\x00\xb0\x39\x02\x90\x3f\x80\xe7\xd7\x82\xf1\xa6\xe6\x97\
+\xda\x7a\x77\xcb\x53\x95\x04\x00\x01\x60\x1c\xf5\xdc\x49\x7c\x9c\
+\xd1\x65\x9f\x4f\xa8\xf3\x1c\xb3\x74\xe2\x77\x95\x7c\xea\x65\x04\
+\xbc\xf8\xca\xab\xc8\x1f\xc0\xae\xeb\x40\xa6\x64\x9b\xa9\x79\xd6\
+\xbf\xbc\x91\xd8\xb1\x71\x04\x01\x40\x00\x18\x63\xfb\xf2\x2a\x51\
+\xd0\x34\xd9\xe4\x67\x54\x3b\x69\xc6\x84\x2a\x00\xfc\x88\x80\xd6\
+\x6d\xda\xec\x36\x02\x90\x3f\x80\xaf\xd7\x81\x23\x4d\xce\xb7\x8b\
+\x46\x95\x10\x00\x04\x80\xb1\xdf\xfd\xf7\x1f\x60\xf4\x77\xff\x1f\
+\xd4\x4f\x65\xf5\x9a\x5f\x96\x4f\xfe\x72\x2f\x23\x20\x37\x37\x57\
+\xdc\x3c\x7e\x82\x58\xbd\x6e\xbd\x58\xf2\xcc\x72\x31\xea\xe4\x93\
+\x45\x6c\x6c\x2c\xf2\x07\xf0\xf7\x3a\xb0\xc4\xd4\x9c\x53\xcf\x03\
+\x2c\xb8\xb5\x07\x01\x40\x00\x68\xe7\xba\xbf\xb6\x33\xfd\xf9\x6e\
+\xaa\xf7\xdc\x0a\xc0\xe4\xf7\x34\x02\x7c\x04\xf9\x03\xec\xfe\x1a\
+\xd0\xce\xd4\x12\xc1\x5e\x3f\x0f\x40\x00\xb8\x11\x00\x2b\xee\xad\
+\x30\xfd\xbb\xff\x16\x49\x46\xe8\x03\xa0\x5a\x04\xfc\x1b\xf9\x03\
+\x38\x1b\x01\x63\x4c\xce\xc1\x8a\xb2\x2c\xf1\xf5\x0b\xc3\x08\x00\
+\x02\xa0\xde\xbc\xb7\xa8\x52\xe4\x37\x49\x36\xfd\xd9\x7e\xaf\x65\
+\x5e\x05\xe8\x02\xd0\x2d\xa4\x11\x80\xfc\x01\xf6\x3d\xff\x53\x24\
+\x6f\x9b\x9c\x8b\xea\xf7\x5a\xd3\x8b\x04\x11\x00\xe1\x0e\x00\xf5\
+\xd0\x5f\xfb\x92\x74\xd3\x9f\xeb\x49\x6d\xf3\x2a\x60\x17\x81\xb0\
+\x45\x00\xf2\x07\xa8\xf9\xfc\x3f\xd0\xf4\x9c\xfc\xd3\x81\xf9\x46\
+\xb7\x0e\x26\x00\xc2\x1b\x00\xea\x0e\x92\xba\x93\x64\xf8\x33\x7d\
+\x2b\x69\xed\x64\x00\x44\x2f\x02\xdd\x43\x12\x01\xc8\x1f\xa0\xf6\
+\xf3\xff\x31\xd3\x73\xf3\xfc\xe3\x5a\x1a\x93\x84\xba\xcb\xd0\x34\
+\x3b\x11\x3c\xe2\xcf\xbf\x2f\xf4\x44\xfe\xea\xce\x91\xe1\x95\xfe\
+\x76\x71\x85\xd6\xf9\x14\xd0\x8b\x80\x8a\x80\xcf\x90\x3f\x80\x73\
+\x01\xd0\x5c\xf2\x91\xe9\x39\x7a\xe3\xb9\xa5\x56\xee\x23\x0f\xf6\
+\xa1\xee\x18\x1d\x73\x60\x9e\x17\xde\x58\xa3\xdb\x1b\x41\xbe\x10\
+\xf4\x08\x68\x04\x20\x7f\x80\xfa\xcd\xfd\x61\xa6\x36\x0b\xaa\xfe\
+\x7a\xe0\xbd\x63\xca\x10\x1c\xec\x93\xf3\x8e\x6b\xe9\x85\x37\x3e\
+\x57\x5b\x65\x6b\x9f\x4b\x01\xbf\x10\x04\x2d\x02\x90\x3f\x80\x9e\
+\xb9\x7f\x95\xe9\xf9\xaa\x5e\xe3\xf2\x6b\xcf\x00\x08\x06\x37\x9c\
+\xd3\xce\x2b\x77\xfc\xce\xc8\x3c\x0a\xc1\x85\xa0\x67\x40\x22\x00\
+\xf9\x03\xe8\x9b\xf7\x71\x92\x65\xa6\xe7\x6d\x4a\x52\x9c\x98\x3b\
+\xa1\x1b\xb2\x83\x5f\x71\xbd\x94\xbf\xba\x53\xe4\x81\x3b\x26\x1a\
+\x9b\x47\x21\xb9\x18\xf4\x8c\xde\x22\x41\xfe\x00\xee\x44\x40\x9e\
+\xe4\x63\xd3\xf3\x37\x2e\x36\x46\xdc\x79\x65\x67\xa4\x07\x3f\xfd\
+\xe6\x7f\xee\xb1\x2d\xbc\x72\xc7\x3a\x49\x12\x01\x10\xdc\x08\x78\
+\x0c\xf9\x03\x18\x9b\xf7\x23\x24\x3f\x7a\x31\x97\xaf\x3d\xbb\x2d\
+\x02\x74\x1c\xf5\xb4\xbf\x47\x0f\xfc\x29\xbe\xd0\xf9\xca\x5f\xa8\
+\x03\x20\x7a\x31\xe8\x65\x59\x04\x20\x7f\x00\xf3\xf3\xfe\x1a\xaf\
+\xe6\xf4\xd9\x7f\x2c\x36\xba\x4e\x00\xd8\x8b\x7a\xcf\xdf\xa3\x57\
+\xfd\x76\x71\xb8\xf1\xb9\x13\xc2\x8b\x81\x2d\x11\x80\xfc\x01\xbc\
+\x7b\x1e\xe0\x59\xaf\xe6\xf6\x51\xfb\x37\x17\xdf\xaf\x1f\x81\x14\
+\x1d\x42\xad\xf0\xe7\xf1\x22\x4e\xb7\x7a\x32\x77\x42\x7a\x41\xe8\
+\x24\x79\xd3\x47\xf9\x4f\x95\x24\x70\x71\x06\xf0\x6c\xce\xe7\x4b\
+\x3e\xf1\x6a\x8e\x0f\xef\x9b\x23\xbe\x5c\x35\x0c\x39\x3a\xc0\xbb\
+\x4f\x56\x8a\xd2\x96\x69\x5e\xfa\x63\x83\x24\x99\x00\xa8\xdf\x05\
+\xa1\x91\x64\x81\xc7\xe2\x57\xfb\x33\x9f\xc1\x05\x19\xc0\x97\x39\
+\xdf\x47\xf2\xb5\x57\xf3\xbd\xbc\x34\x53\xbc\xf9\xc4\x40\x24\x19\
+\x62\x9e\xbd\xa7\xb7\xc8\xcb\x4d\xf2\xd2\x21\xef\x49\x0a\x3c\x9b\
+\x33\x21\xbf\x20\xc4\x4a\xae\xf5\xe8\xc4\xa9\xe5\x89\x87\x72\x21\
+\x06\xf0\x75\xce\xef\x1f\x0d\x71\x4f\x2e\xd8\x99\xe9\xf1\xe2\xc1\
+\x1b\xba\x22\xcb\x10\x3e\xe9\x7f\xcd\x59\x6d\x23\x6f\x80\x78\x28\
+\xff\xed\x92\xf6\x9e\xce\x17\x47\x2e\x0a\x7d\x25\x4b\x0d\x6e\xce\
+\x30\x4e\xd2\x94\x0b\x30\x80\x15\xf3\xfd\x4f\x5e\xbd\x19\xb0\x8b\
+\x53\x0e\x2f\x14\xff\x5d\x33\x1c\x79\x86\x80\x8f\x9f\x19\x12\xf9\
+\x89\xc7\xe3\xbb\xc7\xea\xce\x55\x85\xe7\x73\xc5\xb1\x0b\x43\x95\
+\x64\x95\xc6\xdb\xfd\xd3\x24\x85\x5c\x74\x01\xac\x9b\xeb\xe7\x79\
+\xfd\xec\x4f\x97\x76\x19\xe2\xf5\xc7\x07\x20\xd1\x00\xf3\xf4\x1d\
+\xbd\x44\x73\x6f\x6f\xf9\xef\x72\xc9\x7e\xbe\xcc\x13\x47\x2f\x0e\
+\x15\x6a\x57\x25\xc9\x0b\xb5\xfc\xa6\xf0\x75\x74\x51\x9f\x3f\xab\
+\x87\x8e\xb8\xd0\x02\x58\x3d\xcf\x6f\xf4\x3a\x02\xd2\x53\xe3\xc4\
+\x8c\x7f\x74\x41\xa6\x01\x63\xe7\xc6\x11\xe2\x8a\xd3\x5a\x7b\x7d\
+\xcb\x5f\x44\xfd\x73\x8c\x6f\x73\x84\x8b\x44\x83\x5c\xc9\xef\x25\
+\xe7\x46\x2f\x18\x33\xa2\x3f\x17\xa8\x07\x08\xef\x94\x5c\x2d\x39\
+\x3d\xba\x01\x49\x12\x17\x56\x80\xc0\xcc\xed\x18\xc9\xbd\x7e\xbc\
+\x09\x34\xea\xd0\x02\xde\x12\x08\x08\x5b\x9e\xaa\x14\x55\xbd\xb3\
+\xfd\x7a\x63\xec\x5c\x5f\xe7\x08\x17\x0a\x00\x08\x71\x04\xc4\x4b\
+\xe6\xfb\x71\x71\x2f\x68\x9a\x2c\x66\x8d\x2d\x47\xb2\x96\xb2\x43\
+\x7e\xeb\xbf\xf9\x82\x52\x91\x91\x16\xef\x97\xfc\xaf\xf7\x7d\x7e\
+\x70\x91\x00\x80\x90\x47\x40\xaa\xe4\x79\xbf\xd6\x05\x19\xd9\x2f\
+\x87\xd7\x05\x2d\x63\xe5\xf4\x8a\xc8\x33\x1b\x3e\xae\x15\x73\x8f\
+\xba\x43\x45\x00\x00\x00\x98\x8f\x80\x2c\x2f\x57\x0b\xfc\x25\xc9\
+\x49\xb1\x91\xdf\x98\xbf\x5d\xcb\x9b\x02\x7e\xaf\xe8\xa7\x7e\x9e\
+\xf1\x68\x17\xbf\x3d\x71\xb7\xba\x33\x65\xc5\xbc\xe0\xe2\x00\x00\
+\x8e\x44\x40\x4a\x74\x89\x6e\xdf\x2e\xfe\x6d\x8a\x52\xc5\xa2\xa9\
+\x3d\x91\xb1\x0f\xef\xf5\xdf\x71\x45\x27\x91\x93\x95\xe8\xf7\x12\
+\xf1\xd7\xdb\xf0\xcd\x9f\x00\x00\x00\x57\xf7\x0d\x98\xe6\xf7\x5e\
+\x21\x87\x8f\x68\xc6\x2b\x83\x1e\xb1\xe2\xde\x0a\xd1\xaf\xbc\x91\
+\xdf\xe2\xff\xd1\xef\x07\xfe\x08\x00\x00\x80\xff\x85\xc0\x55\x7e\
+\x47\x40\x6c\x6c\x8c\x38\x62\x64\x73\xf1\xd2\x23\xfd\x10\xb5\x01\
+\x9e\x9a\xd6\x53\x54\xf6\x6c\x6c\xc3\xae\xb0\x3f\xf8\xf9\xaa\x1f\
+\x01\x00\x00\xf0\xeb\x08\x50\xaf\xf7\xee\xf4\x5b\x10\xea\xf7\xe8\
+\x83\x2a\x9b\x88\xd5\x33\xfb\x20\x6e\x0d\xb7\xfa\xe7\x4e\xe8\xe6\
+\xf5\xce\x7d\xfb\x5a\x3b\x66\x3f\x6b\xe7\x00\x17\x02\x00\x70\x38\
+\x02\xd4\x1a\x20\xdf\x59\x22\x0b\x31\xb4\x22\x5b\x2c\xbb\xb3\x17\
+\x32\xaf\xc3\x42\x3e\x0f\x5c\xdf\x45\x94\xb5\xcd\xb0\x45\xfc\xbb\
+\xd6\xf6\xef\x6d\xf5\xf8\xe7\x22\x00\x00\x8e\x47\xc0\x60\xc9\x17\
+\x16\x89\x23\xf2\x9b\xb5\x5a\x43\xe0\xbb\x75\xbc\x35\xb0\x37\x3e\
+\x5f\x39\x54\x4c\xbd\xb4\xa3\x68\x5b\x9c\x66\x93\xf8\x15\xef\x4a\
+\x4a\xad\x1f\xfb\x5c\x00\x00\x80\x08\x68\xd0\x35\x7a\xd1\xb6\x4a\
+\x24\x8d\x32\x13\x22\x1b\x0d\xa9\xf7\xd6\x11\xfe\xff\xf8\x61\xc3\
+\x08\xf1\xc4\xa4\xee\x91\xe7\x27\xd4\xeb\x95\xb6\x9d\x33\xc9\x7a\
+\x2f\xb7\xf4\x25\x00\x00\x00\xea\x1f\x01\x8d\x25\xf3\x2c\x14\xca\
+\x4f\xaf\x10\x5e\x79\x7a\x1b\xf1\xf6\xc2\x41\x4e\x8a\x7f\xfd\x43\
+\x7d\xc5\x5f\x8e\x6e\x21\x9a\x66\x27\x0a\x5b\xcf\x91\x64\x72\x90\
+\x96\x8c\x67\xe2\x03\x00\xfc\x7f\x04\xa8\xfd\x03\x2e\x88\x3e\xb9\
+\x6d\xa5\x64\xd4\x43\x83\x03\xbb\x37\x16\xb7\x5f\xde\x29\xb2\x75\
+\x6d\x98\xa5\xff\xd6\x82\x41\xe2\xfa\x73\xda\x89\x4e\xad\xd3\x6d\
+\x96\xbe\xe2\x3f\x92\xc3\x03\x37\xde\x99\xf4\x00\x00\xbf\x0a\x81\
+\x7e\x92\xf7\x2d\x97\x4e\x24\x06\x3a\xb7\xc9\x88\x7c\x33\x56\x4f\
+\xbf\x7f\xb1\x72\x68\xa0\x85\xbf\x6d\xe9\x60\x31\xf3\xba\x2e\xe2\
+\xc4\x43\x0b\x44\xcb\xfc\x14\xdb\xa5\xbf\x8b\x0d\x92\xd6\x81\x1c\
+\xe7\x4c\x76\x00\x80\xdd\x46\x40\x4e\x74\x57\xd0\xa0\x88\x28\xb2\
+\x9d\xad\x7a\x05\xee\xa2\x51\x25\x91\xf7\xe0\xbf\x59\x63\xf7\x8e\
+\x84\x9f\xad\xa8\x12\x73\x6e\x29\x17\x67\x1e\x55\x2c\x3a\xb4\x4a\
+\x17\x41\x3a\xd6\x51\x6e\x0d\xf2\x2e\xb1\x4c\x74\x00\x80\xbd\xff\
+\x24\x70\x91\x64\x47\x00\xe5\x24\x92\x12\x63\x45\xaf\x4e\x0d\xc5\
+\x31\x07\xe6\x89\xab\xce\x68\x23\x1e\xba\xb1\xab\x78\x71\x56\x3f\
+\xcf\xc3\x40\x3d\xad\xff\xc2\xcc\x3e\x62\xfa\x35\x65\xe2\x92\x93\
+\x5b\x45\x56\x42\x54\x77\x2e\xd4\x62\x48\x41\x3c\xae\xd1\x5b\xfe\
+\x47\x04\x7e\x7c\x33\xc9\x01\x00\xf6\x19\x02\x03\x25\x1f\x04\x54\
+\x56\xbb\xfd\xe9\xa0\xa8\x79\xb2\x18\xd6\x27\x5b\x9c\x71\x64\x91\
+\x18\x37\xba\x7d\x44\xce\x8f\x8e\xeb\x26\x96\xdc\xde\x33\x22\xeb\
+\x57\x1f\x1b\x20\xb6\x3c\x55\x19\xf9\x59\x41\xbd\x67\xff\xcb\xad\
+\x74\xd5\xb7\xf7\xf7\x16\x55\x8a\x97\xe7\xf4\x17\xab\x66\x54\x88\
+\xc5\xb7\xf5\x14\xb3\x6f\x2e\x17\x77\x5f\xdd\x59\xdc\x70\x4e\x3b\
+\x71\xd2\x61\x85\x91\x67\x15\x2c\x7f\x68\xaf\xae\xb7\xfc\xdb\x84\
+\x62\x5c\x33\xb9\x01\x00\x6a\x14\x01\xb9\x92\x7b\x43\x26\xb3\x1a\
+\x07\x43\x7a\x6a\x5c\x64\x33\x9d\x94\xa4\x38\xe1\xe2\x31\x88\x2e\
+\x18\x35\x46\x92\x1c\x9a\x31\xcd\xc4\x06\x00\xa8\xf5\xdd\x80\xcd\
+\x8e\x4a\xd0\x55\x16\x4b\xda\x85\x6e\x2c\x33\xa1\x01\x00\x6a\x1d\
+\x01\xf1\x92\xf3\x24\x5f\x22\xc7\x50\xf3\x41\x18\x7e\xeb\x27\x00\
+\x00\x00\xf4\x87\x40\x81\xe4\x61\x44\x19\x3a\xd4\x3a\x10\x63\x25\
+\x19\xa1\x1e\xbf\x4c\x62\x00\x80\x7a\x87\xc0\x70\xc9\x1b\x88\x33\
+\x14\x3c\x2b\xe9\xec\xc4\xb8\x65\xf2\x02\x00\x68\x89\x80\x24\xc9\
+\x25\x92\x6f\x90\x68\x20\xf9\x58\x72\xac\x7a\xf5\xd3\x99\x31\xcb\
+\xc4\x05\x00\xd0\x1a\x02\x79\xd1\xdb\xc7\x5f\x23\xd5\x40\xf0\x91\
+\x64\x74\xd8\x6f\xf7\x13\x00\x00\x00\xde\xae\x24\xa8\x5e\x1b\xfb\
+\x1c\xc9\x5a\x89\x5a\xea\xf9\x4c\x49\x8a\xb3\x63\x94\x89\x0a\x00\
+\x60\x34\x04\x1a\x4a\x2e\x96\x7c\x82\x74\xad\xe0\x4d\xc9\x28\x49\
+\xa2\xf3\x63\x93\x09\x0a\x00\xe0\x49\x08\xa4\x49\xce\x09\xd3\x8a\
+\x82\x01\x43\xad\xdd\x70\x94\x24\x8e\xf1\x48\x00\x00\x00\xf8\xf5\
+\xb0\xe0\x29\x92\xb7\x90\xb2\x27\xac\x91\x1c\xe2\xd2\xc3\x7d\x04\
+\x00\x00\x80\xdd\x21\xa0\x36\x1a\x1a\x2c\xb9\x8b\x05\x85\xb4\xf3\
+\x61\xf4\x41\xcc\x2e\x8c\x35\x02\x00\x00\xc0\xe6\x18\x48\x95\x1c\
+\x2d\x59\x24\xd9\x89\xc0\xeb\xc4\x7f\x25\x0f\x4a\xf6\x57\x2b\x35\
+\x32\xae\x08\x00\x00\x80\xa0\xc5\x40\x7e\xf4\xb5\xb4\x97\x91\x7a\
+\x8d\x78\x4e\x72\xb2\x7a\xd8\x92\xf1\x43\x00\x00\x00\x84\x25\x06\
+\x7a\x48\xc6\x4b\xb6\x20\xfa\x9f\xf1\xaa\xe4\x0a\x49\x2b\xc6\x09\
+\x01\x00\x00\x10\xf6\x18\x68\x2b\xf9\x73\xf4\x36\xf7\xc7\x8e\x09\
+\xff\x6d\xc9\x1d\xd1\x9f\x49\xf2\x18\x0f\x04\x00\x00\x80\xcb\x0f\
+\x10\x76\x92\x9c\x25\x79\x54\xf2\x59\xc8\x84\xbf\x55\x32\x43\x72\
+\xa2\xa4\x25\xe7\x9c\x00\x00\x00\x80\xdd\x07\x41\xac\xa4\x7b\x74\
+\x8b\xe2\x47\xa2\xef\xbc\x7f\x1b\x10\xd9\x7f\x25\x59\x2f\x99\x29\
+\x39\x4d\x52\xca\x39\x25\x00\x00\x00\xa0\xee\x51\x10\x27\x29\x89\
+\x3e\x15\xff\x57\xc9\x14\xc9\xd3\xd1\x6f\xd7\x5e\x4b\x7e\x67\xf4\
+\x36\xfe\x42\xc9\xb8\xa8\xe8\xab\xa2\xdb\x29\xf3\x7e\x3e\x01\x00\
+\x00\x00\x1e\xc5\x41\xa6\xa4\x67\x74\x65\xbc\xd3\x25\x17\x46\xf7\
+\x2d\x18\x1f\x5d\x97\xe0\xe1\xa8\xac\x57\x48\x5e\x8a\xca\x7b\x7b\
+\xf4\xdb\xba\xda\x3c\xe7\x5f\x92\x8d\xd1\xad\x73\xe7\x47\x9f\x4b\
+\xb8\x5d\x72\xb3\xe4\x4a\xc9\x05\x92\x53\x25\xbf\x53\x5b\xeb\x4a\
+\x92\x39\xee\xf6\xf1\x7f\xb8\x85\xdf\x3c\x14\x50\x8e\xc3\x00\x00\
+\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x3b\xe0\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\x9d\x00\x00\x0e\x9d\
+\x01\xd5\xd3\xb1\x39\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x3b\x5d\x49\x44\
+\x41\x54\x78\xda\xed\xdd\x59\x74\x54\x65\xda\xb8\x7d\xda\x6e\x17\
+\xab\x8f\xda\x13\xd6\xd2\x6e\xda\xbf\x90\x79\x22\x84\x90\x90\x01\
+\x02\x08\x86\x39\xcc\xa0\x21\x8c\x09\xb3\x84\x79\x1e\x13\x64\x4e\
+\x18\xc2\x10\xa6\x00\x61\x08\x81\x40\x02\x21\x80\x60\x2b\x22\xe2\
+\x00\x82\x22\x82\x0c\x2a\x83\x80\x02\x7e\x47\xbe\xab\x8f\xde\xd5\
+\xf7\x57\x4f\x75\xd9\x6f\x1a\x03\x24\x79\x9e\x5d\xb5\x2b\x75\xb1\
+\xd6\xef\x4c\x2b\x61\xef\xcd\x73\x5f\x55\xb5\x87\x7a\x22\x52\xcf\
+\x97\x38\xfe\xfc\xd5\xa1\x8d\xc3\x48\x87\x5c\x87\xbd\x0e\x15\x0e\
+\xa7\x1d\x2e\x3a\xdc\x74\xf8\xd9\xe1\x9f\x0e\x02\x00\xf0\x6a\xff\
+\x74\xad\xe9\x37\x5d\x6b\xfc\x69\xd7\x9a\xbf\xd7\x35\x03\x46\xba\
+\x66\xc2\x5f\x7d\x6e\x1e\xd6\xe1\x41\xff\x82\x43\x94\xc3\x14\x87\
+\x22\x87\x0b\x0e\xbf\xf2\x8f\x01\x00\xf0\x14\xbf\xba\x66\x45\x91\
+\x6b\x76\xa8\x19\xf2\x02\x01\xe0\x1d\x43\x3f\xd0\x61\xb4\x43\x89\
+\xc3\x2f\x1c\xcc\x00\x00\x4d\xbf\xb8\x66\x8a\x9a\x2d\x81\x04\x80\
+\xbd\x86\x7e\xb4\xc3\x6a\x87\xbb\x1c\xa8\x00\x00\x8b\xdd\x75\xcd\
+\x9c\x68\x02\xc0\x33\x43\xff\x55\x87\x99\x0e\x57\x39\x18\x01\x00\
+\x1e\x72\xd5\x35\x8b\x5e\x25\x00\xac\x1d\xfa\x7f\x72\x18\xe8\x70\
+\xca\xe1\x5f\x1c\x78\x00\x00\x9b\xf8\x97\x6b\x36\xa9\x19\xf5\x27\
+\x02\xc0\xdc\xe0\xaf\xef\x3a\x4b\xf3\x16\x07\x19\x00\xc0\xe6\x6e\
+\xb9\x66\x56\x7d\x02\xa0\xf6\x83\xff\xcf\x0e\xe3\x1d\xee\x71\x40\
+\x01\x00\xbc\xcc\x3d\xd7\x0c\xfb\x33\x01\x50\xb3\x77\xfc\x53\x1d\
+\x1e\x72\x00\x01\x00\xbc\xdc\x43\xd7\x4c\xab\x4f\x00\x3c\x7b\xf8\
+\x27\x3b\xdc\xe0\x80\x01\x00\xd4\x31\x6a\xb6\x25\x13\x00\xbf\x1f\
+\xfc\x0d\x5d\xd7\x59\x72\x90\x00\x00\xea\x32\x35\xeb\x1a\xfa\x7c\
+\x00\xb8\xce\xec\x9f\x52\x8f\x3b\xf4\x01\x00\x7c\xc7\xaf\xae\xd9\
+\xf7\x27\x9f\x0c\x00\xc7\x9f\x60\x87\x4b\x1c\x08\x00\x00\x1f\xa5\
+\x66\x60\xb0\x4f\x05\x80\xe3\x4f\x9a\xc3\xff\xb0\xf3\x01\x00\x3e\
+\x4e\xcd\xc2\xb4\x3a\x1f\x00\xae\x4b\xfb\x0a\xd8\xe1\x00\x00\xfc\
+\x97\x02\x77\x5f\x32\xe8\xce\xe1\x1f\xe2\x70\xd9\xee\x3b\xe1\xc5\
+\x17\x5f\x94\xbf\xbc\xf4\x92\xfc\xad\x61\x43\xf1\xf3\xf7\x07\x00\
+\x78\x31\xb5\x96\xab\x35\x5d\xad\xed\x5e\x10\x01\x6a\x46\x86\xd4\
+\xa9\x00\x70\xfc\x49\xb1\xcb\x47\xfe\x0d\x1a\x34\x90\xf8\x84\x44\
+\x49\x1b\x34\x58\x16\x64\x2f\x94\xdd\xc5\xc5\x72\xf6\xdc\x79\xb9\
+\x72\xfd\x86\xdc\x79\xf0\x40\x7e\xfa\xe5\xff\x03\x00\xd4\x41\x6a\
+\x8d\x57\x6b\xbd\x5a\xf3\xd5\xda\xaf\x66\x80\x9a\x05\x6a\x26\xa8\
+\xd9\x60\xa3\xaf\x04\x52\xea\x44\x00\x38\xfe\x0c\x75\xf8\x5f\x4f\
+\x6d\xcc\x97\x5f\x7e\x59\x7a\xf7\xed\x27\xab\xf2\xd6\xca\xf9\x2f\
+\xbf\xe2\x1f\x01\x00\xa0\x4a\x6a\x46\xa8\x59\xa1\x66\x86\x9a\x1d\
+\x1e\x8c\x00\x35\x33\x87\x7a\x75\x00\x38\xfe\x4c\xf3\xc4\xc6\x0b\
+\x0b\x8f\x70\x96\xdd\x99\x4f\x3f\xe3\xa0\x06\x00\xd4\x8a\x9a\x21\
+\x6a\x96\xa8\x99\xe2\xa1\x10\x98\xe6\x75\x01\xe0\xf8\xf3\x07\x87\
+\x1c\xb7\xbe\xd3\x7f\xe5\x15\x19\x3b\x2e\x53\x4e\x9d\xf9\x98\x03\
+\x17\x00\x60\x94\x9a\x2d\x6a\xc6\xa8\x59\xe3\xe6\x08\x50\xb3\xf4\
+\x0f\x5e\x11\x00\xae\x9b\xfb\x14\xba\x6b\xe3\x34\x8f\x89\x91\x9d\
+\x45\x45\x72\xff\xd1\x63\x0e\x52\x00\x80\xa5\xd4\xac\x51\x33\x47\
+\xcd\x1e\x37\x46\x40\xa1\x15\x37\x0d\xb2\xe2\x9d\xbf\x5b\x86\x7f\
+\x62\xcb\x96\x52\x52\x76\x88\x03\x12\x00\xe0\x11\x6a\x06\xa9\x59\
+\xe4\xc6\x08\xf8\x83\x9d\x03\xc0\xf2\x8f\xfd\xe3\xe2\x13\xa4\xfc\
+\xd8\x71\x0e\x3e\x00\x80\x2d\xa8\x99\xa4\x66\x93\x3b\xbe\x0e\xb0\
+\x65\x00\x58\x7d\xc2\x9f\xba\x44\x63\xed\x86\x7c\x0e\x36\x00\x80\
+\x2d\xa9\x19\xe5\x86\xcb\x09\xa7\xd9\x2a\x00\x5c\x97\xfa\x59\xf2\
+\x97\xfd\xe3\x1f\xff\x28\xc3\x32\x32\xe4\xfa\x0f\xb7\x38\xc0\x00\
+\x00\xb6\xa6\x66\x95\x9a\x59\x6a\x76\x59\x18\x01\x43\x6d\x11\x00\
+\xae\x9b\xfc\x58\x72\x9d\x7f\x63\x3f\x3f\x39\xf9\xc1\x29\x0e\x2a\
+\x00\x80\x57\x51\xb3\x4b\xcd\x30\x0b\xef\x13\x90\xe2\xd1\x00\x70\
+\xdd\xde\xd7\x92\x3b\xfc\xf5\xea\xdd\x47\xbe\xbb\x73\x97\x03\x09\
+\x00\xe0\x95\xd4\x0c\x53\xb3\xcc\xc2\x3b\x06\x86\x78\x24\x00\x5c\
+\x0f\xf6\x31\x7e\x6f\xff\xfa\xf5\xeb\xcb\x8a\x95\x2b\x39\x78\x00\
+\x00\x75\x82\x9a\x69\x6a\xb6\x59\xf4\xec\x80\x3f\x7b\x22\x00\x8c\
+\x3f\xd5\xaf\xe1\xdf\xff\x2e\xef\x9f\xfe\x88\x03\x06\x00\x50\xa7\
+\xa8\xd9\xa6\x66\x9c\x15\x4f\x11\x74\x6b\x00\xa8\x67\x17\x9b\xfe\
+\x4b\x04\x05\x07\xcb\x97\x97\xbf\xe1\x40\x01\x00\xd4\x49\x6a\xc6\
+\xa9\x59\x67\x41\x04\xa4\xb9\x25\x00\x1c\x7f\x82\x4d\x7f\xef\x1f\
+\x13\x1b\x2b\xd7\xbe\xfb\x9e\x03\x04\x00\x50\xa7\xa9\x59\xa7\x66\
+\x9e\x05\xe7\x03\x04\x5b\x1a\x00\xae\xdb\xfc\x5e\x32\xf9\x8b\xb7\
+\x7f\x23\x59\x6e\xdd\xbb\xcf\x81\x01\x00\xf0\x09\x6a\xe6\xa9\xd9\
+\x67\x38\x02\x2e\xd5\xf4\x76\xc1\x35\x0d\x80\x29\xa6\x87\xff\x8f\
+\x3f\x3f\xe4\x80\x00\x00\xf8\x14\x35\xfb\x2c\x88\x80\x29\x96\x04\
+\x80\xe3\x4f\x43\x87\x5f\x4d\x7e\xec\xcf\x3b\x7f\x00\x80\x2f\x7f\
+\x12\x60\xf8\xeb\x00\x35\xa3\x1b\x5a\x11\x00\x25\x26\x4f\xf8\xe3\
+\x3b\x7f\x00\x00\xe7\x04\x7c\x6f\xfa\xc4\xc0\x12\xa3\x01\xe0\xf8\
+\x93\x6c\xf2\x52\x3f\xce\xf6\x07\x00\xe0\xff\xae\x0e\x30\x7c\x89\
+\x60\xb2\x91\x00\x70\xfc\xa9\xef\x70\xc3\xd4\x4d\x7e\xb8\xce\x1f\
+\x00\x80\xdf\xdf\x27\xc0\xe0\xcd\x82\xd4\xcc\xae\x6f\x22\x00\xa6\
+\x9a\xaa\x12\xee\xf0\x07\x00\x40\xd5\xd4\x8c\x34\xf8\x29\xc0\x54\
+\xad\x00\x70\xdd\xee\xf7\xa1\xa9\x7b\xfb\xb3\x83\x01\x00\x78\x3a\
+\x83\xcf\x0e\x78\xf8\xbc\xdb\x04\x3f\x2f\x00\xc6\x9b\x7a\xaa\x1f\
+\x0f\xf6\x01\x00\xe0\xd9\xd4\xac\x34\xf8\x14\xc1\xf1\xb5\x0a\x00\
+\xd7\x77\xff\xf7\x74\x7f\x01\xf5\x4c\x64\x1e\xe9\x0b\x00\x40\xf5\
+\xa8\x99\xa9\x66\xa7\x81\x00\xb8\xf7\xac\x73\x01\x9e\x15\x00\x23\
+\x4d\x14\xc8\xb0\x8c\x0c\x76\x28\x00\x00\x35\xa0\x66\xa7\xa1\x4f\
+\x01\x46\xd6\x28\x00\x5c\xb7\xfc\xbd\xa5\xfb\x83\x1b\x34\x68\x20\
+\xd7\x7f\xb8\xc5\xce\x04\x00\xa0\x06\xd4\xec\x54\x33\xd4\x40\x00\
+\xdc\x7a\xda\x2d\x82\x9f\x16\x00\x03\x4d\x94\xc7\xda\x0d\xf9\xec\
+\x48\x00\x00\x6a\x41\xcd\x50\x43\x9f\x02\x0c\xac\x49\x00\x9c\xd2\
+\xfd\x81\x71\xf1\x09\xec\x40\x00\x00\x34\xa8\x59\x6a\x20\x00\x4e\
+\x55\x2b\x00\x1c\x7f\x5e\x75\xf8\x97\xee\x0f\x2c\x3f\x76\x9c\x9d\
+\x07\x00\x80\x06\x35\x4b\x0d\x04\x80\x9a\xe9\xaf\x56\x27\x00\x66\
+\xea\xfe\xb0\xc4\x96\x2d\xd9\x71\x00\x00\x18\xa0\x66\xaa\x81\x08\
+\x98\x59\x9d\x00\xb8\xaa\xfb\x83\x4a\xca\x0e\xb1\xd3\x00\x00\x30\
+\x40\xcd\x54\x03\x01\x70\xf5\x99\x01\xe0\xf8\x13\xad\xfb\x43\x9a\
+\xc7\xc4\xb0\xc3\x00\x00\x30\x48\xcd\x56\x03\x11\x10\xfd\xac\x00\
+\x58\xad\xfb\x03\x76\x16\x15\xb1\xb3\x00\x00\x30\x48\xcd\x56\x03\
+\x01\xb0\xfa\x59\x01\x70\x57\xe7\xc5\x5f\x7e\xe5\x15\xb9\xff\xe8\
+\x31\x3b\x0b\x00\x00\x83\xd4\x6c\x55\x33\x56\x33\x00\xee\x56\x19\
+\x00\x8e\x3f\x81\xba\x75\x31\x76\x5c\x26\x3b\x0a\x00\x00\x0b\xa8\
+\x19\x6b\xe0\x53\x80\xc0\xaa\x02\x60\xb4\xee\x0b\x9f\x3a\xf3\x31\
+\x3b\x09\x00\x00\x0b\xa8\x19\x6b\x20\x00\x46\x57\x15\x00\x07\x74\
+\x5e\x34\x2c\x3c\x82\x1d\x04\x00\x80\x85\xd4\xac\xd5\x0c\x80\x92\
+\xff\x0a\x00\xc7\x9f\x17\x1c\x7e\xd1\x79\xd1\x05\xd9\x0b\xd9\x39\
+\x00\x00\x58\x48\xcd\x5a\xcd\x00\x50\xb3\xfe\x85\xca\x01\x10\xa5\
+\xfb\xb1\xc2\x99\x4f\x3f\x63\xe7\x00\x00\x60\x21\x35\x6b\x0d\x7c\
+\x0d\x10\x55\x39\x00\xa6\x68\x9d\xfd\xff\xf2\xcb\xec\x18\x00\x00\
+\xdc\x40\xcd\x5c\xcd\x00\x98\x52\x39\x00\x8a\x74\x5e\xac\x77\xdf\
+\x7e\xec\x14\x00\x00\xdc\x40\xcd\x5c\xcd\x00\x28\xaa\x1c\x00\x17\
+\x74\x5e\x6c\x55\xde\x5a\x76\x0a\x00\x00\x6e\xa0\x66\xae\x66\x00\
+\x5c\xa8\x1c\x00\xbf\xea\xbc\xd8\xf9\x2f\xbf\x62\xa7\x00\x00\xe0\
+\x06\x6a\xe6\x6a\x06\xc0\xaf\xae\xd9\x5f\xef\xaf\x3a\x2f\xd4\xa0\
+\x41\x03\x76\x08\x00\x00\x6e\xa4\x66\xaf\x66\x04\xa8\xd9\x5f\xaf\
+\x8d\xce\x8b\xc4\x27\x24\xb2\x33\x00\x00\x70\x23\x35\x7b\x35\x03\
+\x40\xcd\xfe\x7a\x23\x75\x5e\x24\x6d\xd0\x60\x76\x06\x00\x00\x6e\
+\xa4\x66\xaf\x66\x00\xa8\xd9\x5f\x2f\x97\x1b\x00\x01\x00\xe0\x3d\
+\x0c\xdc\x10\x48\xcd\xfe\x7a\x7b\x75\x5e\x64\x77\x71\x31\x3b\x03\
+\x00\x00\x37\x52\xb3\x57\x33\x00\xd4\xec\xaf\x57\xa1\xf3\x22\x67\
+\xcf\x9d\x67\x67\x00\x00\xe0\x46\x6a\xf6\x6a\x06\x80\x9a\xfd\xf5\
+\x4e\xeb\xbc\xc8\x95\xeb\x37\xd8\x19\x00\x00\xb8\x91\x9a\xbd\x9a\
+\x01\xa0\x66\x7f\xbd\x8b\x3a\x2f\x72\xe7\xc1\x03\x76\x06\x00\x00\
+\x6e\xa4\x66\xaf\x66\x00\xa8\xd9\x5f\xef\x66\x6d\x5f\xe0\xc5\x17\
+\x5f\x64\x47\x00\x00\xe0\x01\x6a\x06\x6b\x04\x80\x9a\xfd\xf5\x7e\
+\xae\xed\x0b\xfc\xe5\xa5\x97\xd8\x09\x00\x00\x78\x80\x9a\xc1\x1a\
+\x01\xa0\x66\x7f\xbd\x7f\xd6\xf6\x05\xfe\xd6\xb0\x21\x3b\x01\x00\
+\x00\x0f\x50\x33\x58\x23\x00\xd4\xec\xaf\xfd\x77\x08\x7e\xfe\xfe\
+\xec\x04\x00\x00\x3c\x40\xcd\x60\xcd\xf3\x00\x08\x00\x00\x00\x08\
+\x00\x02\xc0\x27\xdc\x7d\xf0\x93\xf3\x32\x12\xa0\x2e\xf8\xf6\xe6\
+\x77\x72\xeb\xde\x7d\xfe\x6d\x83\x00\x20\x00\xf0\x3c\xfb\x0f\x1c\
+\x14\xbf\xff\xf7\x1a\x50\xa7\x04\x34\x6a\x2c\xe1\x21\xa1\x12\xd3\
+\x2c\x5a\x5a\xb7\x6c\x25\x1d\x93\x3b\x48\x8f\x94\xee\x92\xfa\xe6\
+\x5b\x92\x3e\x2c\x5d\xc6\xbd\x3d\x4e\x16\x2d\x5e\x22\x3b\x76\xee\
+\x92\x7f\x9c\xfa\x50\xae\x7d\xf7\x3d\xeb\x01\x08\x00\x02\x80\x00\
+\x00\x7c\x51\x64\x58\xb8\x74\xea\xd0\x51\x86\x67\x0c\x97\x05\x0b\
+\xb2\x64\x6b\xc1\x36\x39\xf9\xfe\x07\x72\xe7\xc1\x4f\xac\x15\x20\
+\x00\x08\x00\x02\x00\xf0\x35\xc1\xfe\x01\xce\x4f\x0f\xe6\xcf\x5f\
+\x20\xa5\x87\xcb\xe5\xe6\xad\xdb\xac\x1d\x20\x00\x08\x00\x02\x00\
+\xf0\xc5\xaf\x17\x92\xdb\xbf\x21\x53\xa7\x4e\x93\xdd\x45\x7b\xe5\
+\xf2\xb7\xd7\x58\x4b\x40\x00\x80\x00\x00\x7c\x51\xa7\xe4\x0e\x92\
+\x93\xbb\x52\x2e\x7e\x7d\x99\x75\x05\x04\x00\x08\x00\xc0\x17\xa5\
+\x74\xed\x26\x79\x6b\xd7\xf1\xc9\x00\x08\x00\x10\x00\x80\xaf\x7e\
+\x55\xd0\xbb\x57\x6f\xc9\xdf\xb8\xc9\x79\x79\x22\xeb\x0d\x08\x00\
+\x10\x00\x80\x8f\x09\x6c\xec\x27\x19\xe9\x19\xf2\xfe\xe9\x8f\x58\
+\x77\x40\x00\x80\x00\x00\x7c\x51\xaf\x1e\x3d\xa5\xe4\x60\xa9\x3c\
+\x78\xfc\x0b\x6b\x10\x08\x00\x10\x00\x80\xaf\x69\x93\xd4\x5a\x36\
+\x6e\xda\xcc\x7d\x06\x40\x00\x80\x00\x00\x7c\x51\x74\xd3\x28\xe7\
+\x5d\x09\xb9\x1b\x21\x08\x00\x10\x00\x80\x0f\x52\xb7\x2e\x5e\x91\
+\x93\xeb\x7c\x3e\x07\x6b\x13\x08\x00\x10\x00\x80\x8f\x69\x95\x90\
+\xe8\xfc\x77\xc9\xfa\x04\x02\x00\x04\x00\xe0\x83\xfa\xf5\xed\x27\
+\x67\x3f\x3f\xc7\x3a\x05\x02\x00\x04\x00\xe0\x8b\xf7\x12\x50\xb7\
+\x1c\xbe\xfe\xc3\x2d\xd6\x2b\x10\x00\xb0\x57\x00\xc4\x36\x8f\x91\
+\xce\x9d\xba\x00\xb6\xd0\xa9\x63\x67\x69\xd7\xb6\x9d\xb4\x4a\x6c\
+\xe5\x3c\x36\x9b\x46\x44\x4a\x68\x60\x90\xf8\xbf\xd6\xc8\xab\x43\
+\x20\x2a\xa2\x89\xf3\x86\x42\xac\x59\x20\x00\x60\x9b\x00\x18\x3d\
+\x66\x9c\x94\x1d\x7b\x0f\xb0\xbd\xfd\x87\x8e\xca\xae\x7d\xa5\x92\
+\x97\xbf\x45\x16\x2c\x5c\x22\xe3\xc6\x4f\x92\xd4\xd4\x81\xd2\x21\
+\xb9\xa3\x34\x8f\x8a\x76\xbe\xdb\xb6\x7b\x08\xa4\xa5\x0e\x90\xab\
+\x37\x6e\xb2\x76\x81\x00\x00\x01\x00\x98\x72\xe0\xc8\xbb\xb2\x65\
+\xc7\x1e\x99\x9f\xbd\x58\x06\x0d\x1e\x26\x49\x2d\x93\x6c\x19\x05\
+\x31\x51\xcd\xa4\xec\x70\x39\xeb\x17\x08\x00\x10\x00\x80\x55\x8a\
+\x4b\x8f\xc8\xb2\xdc\x35\xce\xe3\xbc\x63\x87\x4e\xce\xaf\x13\xec\
+\x10\x01\xea\x2b\x8d\x19\xd3\x67\x70\xc9\x20\x08\x00\x10\x00\x80\
+\xbb\x3e\x25\x58\x9a\xb3\x5a\xde\x4a\x4d\x93\x88\xd0\x70\x8f\x87\
+\x40\x72\xbb\xf6\xf2\x09\x57\x0a\x10\x00\x04\x00\x08\x00\xc0\x7d\
+\x0e\x56\x9c\x70\x7e\x3a\x30\x60\xc0\x20\x89\x0c\x8b\xf0\x58\x04\
+\x84\x04\x04\xca\xfa\x0d\xf9\xac\x67\x04\x00\x01\x00\x02\x00\xf0\
+\x44\x0c\x2c\x5f\x99\x27\xfd\xfb\xa7\x4a\x90\x9f\xbf\x47\x42\x20\
+\x73\x5c\xa6\xdc\x7b\xf8\x88\x75\x8d\x00\x20\x00\x40\x00\x00\x9e\
+\xb0\xb3\xf8\xa0\xf3\xdf\x45\x64\xb8\xfb\x3f\x15\x48\x7d\xf3\x2d\
+\xf9\xfe\xee\x8f\xac\x6d\x04\x00\x01\x00\x02\x00\xf0\x94\x92\xf2\
+\xe3\x32\x6b\xee\x02\x69\x99\xd0\xd2\xad\x11\xd0\x29\xb9\x83\x7c\
+\x73\xed\x3a\xeb\x1b\x01\x40\x00\x80\x00\x00\x3c\x6d\xc5\xaa\xb5\
+\xd2\xa5\x73\x57\xb7\x45\x40\x62\x5c\xbc\x7c\x7a\xfe\x0b\xd6\x38\
+\x02\x80\x00\x00\x01\x00\xd8\x81\x3a\x4f\xc0\x5d\x9f\x08\x34\x8d\
+\x68\x22\xc7\x4f\xbe\xc7\x3a\x47\x00\x10\x00\x20\x00\x00\x3b\x28\
+\x3d\x7a\x52\x66\xce\x9e\x2f\x51\x4d\x22\x2d\x8f\x80\xe0\x80\x40\
+\xd9\x5d\xb4\x97\xb5\x8e\x00\x20\x00\x40\x00\x00\x76\xb1\xaf\xac\
+\x42\x46\x39\xfe\xfd\xa8\x21\x6d\xf5\x03\x85\x76\xed\x29\x62\xbd\
+\x23\x00\x08\x00\x10\x00\x80\x9d\xec\x28\x2a\x91\x9e\x3d\x7b\x5b\
+\x1a\x01\xea\xd2\x44\x6e\x1f\x4c\x00\x10\x00\x20\x00\x00\x1b\x9a\
+\x33\x3f\x5b\xc2\x82\x42\x2c\x8b\x00\x75\x1b\xe3\x13\xff\x78\x9f\
+\x75\x8f\x00\x20\x00\x40\x00\x00\x76\xb3\x6d\x77\xb1\xb4\x6f\xf7\
+\x86\x65\x11\x10\x19\x16\x2e\x1f\x9d\xfd\x84\xb5\x8f\x00\x20\x00\
+\x40\x00\x00\x76\x3c\x49\x50\x3d\xaa\x38\xb0\xb1\x9f\x65\x4f\x13\
+\x3c\x7f\xf1\x4b\xd6\x3f\x02\x80\x00\x20\x00\x08\x00\xc0\x8e\xd6\
+\x6d\x2a\x90\x84\x16\xf1\x96\xdd\x27\xe0\xeb\xab\xdf\xb2\x06\x12\
+\x00\x04\x00\x01\x40\x00\x00\xb6\x7c\x1c\x71\x59\x85\x74\xed\xd2\
+\xcd\x92\x08\x68\xd7\xa6\xad\xdc\xbc\x75\x9b\x75\x90\x00\x20\x00\
+\x08\x00\x02\x00\xb0\xeb\x83\x86\xd2\x06\x0e\xb6\x24\x02\x86\x0c\
+\x1e\xc2\x3a\x48\x00\x10\x00\x04\x00\x01\x00\xd8\xd9\xf8\x89\x53\
+\xc4\xff\xb5\x46\xc6\x23\x60\xe5\xaa\xd5\xac\x85\x04\x00\x01\x40\
+\x00\x10\x00\x80\x9d\x65\xbd\xb3\x54\x82\xfc\x03\x8c\x06\x80\x3a\
+\xd9\xf0\xe4\xfb\x1f\xb0\x1e\x12\x00\x04\x00\x01\x40\x00\x00\x76\
+\xb6\x7a\xdd\x46\x69\x12\x16\x6e\x34\x02\xe2\x63\x5b\xc8\xb5\xef\
+\xbe\x67\x4d\x24\x00\x08\x00\x02\x80\x00\x00\xec\x6c\x63\x41\xa1\
+\x44\x84\x9a\x8d\x80\xd4\x37\xdf\x92\x07\x8f\x7f\x61\x5d\x24\x00\
+\x08\x00\x02\x80\x00\x00\xec\x6c\xed\xc6\xad\xc6\xef\x1c\xb8\x74\
+\xe9\x32\xd6\x45\x02\x80\x00\x20\x00\x08\x00\xc0\xee\x56\xe6\x6d\
+\x30\xfa\x30\x21\xf5\xe0\xa0\xa3\xef\x9e\x60\x6d\x24\x00\x08\x00\
+\x02\x80\x00\x00\xec\x6e\x69\xce\x6a\x09\xf4\xf3\x37\x16\x01\x2d\
+\xe3\x13\xe4\xf6\xfd\x07\xac\x8f\x04\x00\x01\x40\x00\x10\x00\x80\
+\xdd\x65\x2f\x5a\xe6\x7c\xf7\x6e\x2a\x02\xb2\xb2\xb2\x59\x1f\x09\
+\x00\x02\x80\x00\x20\x00\x00\x6f\x30\x6b\x6e\x96\xb1\x00\x08\xf6\
+\x0f\x90\xcf\xbe\xb8\xc0\x1a\x49\x00\x10\x00\x04\x00\x01\x00\x78\
+\x83\xc1\x43\x86\x19\x8b\x80\x7e\x7d\xfa\xb2\x46\x12\x00\x04\x00\
+\x01\x40\x00\x00\xde\xe0\x40\xf9\x71\x69\x93\xd4\xc6\x58\x04\xec\
+\xdc\xbd\x87\x75\x92\x00\x20\x00\x08\x00\x02\x00\xf0\x06\x05\xbb\
+\x8a\x25\x3c\x24\xd4\xcc\xa3\x83\x9b\x45\xcb\xcd\xdb\x77\x58\x2b\
+\x09\x00\x02\x80\x00\x20\x00\x00\x6f\xf0\xce\xd2\x1c\x63\x9f\x02\
+\x4c\x9b\x36\x9d\xb5\x92\x00\x20\x00\x08\x00\x02\x00\xf0\x16\xc3\
+\xd2\x47\x18\xbb\x37\xc0\x47\x67\x3f\x61\xbd\x24\x00\x08\x00\x02\
+\x80\x00\x00\xbc\xe5\x31\xc2\xaf\xb7\x6d\xc7\x63\x83\x09\x00\x02\
+\x00\x04\x00\xe0\x6b\x36\x6f\xdf\x65\xe4\x26\x41\xea\x31\xc4\x67\
+\x3f\x3f\xc7\x9a\x49\x00\x10\x00\x04\x00\x01\x00\x78\x8b\x91\xa3\
+\xc6\x1a\xf9\x14\x60\xe4\xc8\x51\xac\x99\x04\x00\x01\x40\x00\xf8\
+\x5e\x00\x6c\x2d\x2c\x92\x85\x4b\x96\xa3\x86\xde\x59\xb2\x42\x56\
+\xac\x5a\x2b\xf9\x05\x85\xb2\x7b\x7f\x99\x94\x1e\x3d\xc9\x50\x76\
+\xb3\xfd\x87\x8f\x49\x4c\x74\x73\x23\xe7\x02\x9c\xff\xf2\x2b\xd6\
+\x4d\x02\x80\x00\x20\x00\x7c\x2b\x00\x26\x4d\x99\x6e\xf4\xa9\x6b\
+\xbe\x4a\x0d\x91\xa8\x26\x91\xd2\x2a\xb1\x95\x74\xee\xd4\x45\xfa\
+\xf7\x7f\x4b\x86\x8f\x18\x2d\x8b\x97\xaf\x94\xfd\x87\x8e\x32\xb0\
+\x2d\xb2\x78\x79\xae\x91\xfd\x37\x7e\xfc\x04\xd6\x4d\x02\x80\x00\
+\x20\x00\x08\x00\x98\x15\xe4\xe7\x2f\x1d\x3b\x74\x92\xf1\x13\xa7\
+\xc8\xfa\xcd\xdb\x18\xdc\x86\x75\x4f\xe9\x69\x64\x1f\x5d\xba\x72\
+\x95\xb5\x93\x00\x20\x00\x08\x00\x02\x00\xd6\x69\x1a\x11\xe9\xfc\
+\x84\x60\x7e\xf6\x62\x39\x70\xe4\x5d\x86\xb8\xa6\xed\xbb\xf7\x49\
+\x48\x60\x10\xf7\x05\x20\x00\x08\x00\x10\x00\x04\x80\xf7\x50\x77\
+\xa4\x9b\x3e\x6b\x2e\x21\xa0\x69\xec\xb8\x09\xda\xfb\x22\xd4\x11\
+\x11\x57\x6e\xdc\x64\xfd\x24\x00\x08\x00\x02\x80\x00\x80\xfb\x44\
+\x47\x35\x93\x69\x33\xe6\x38\xef\x79\xcf\x40\xaf\xb9\xbd\xa5\xe5\
+\x12\x16\x1c\xa2\xbd\x1f\x96\xaf\xc8\x61\xfd\x24\x00\x08\x00\x02\
+\x80\x00\x80\x07\x42\xa0\x69\x33\x99\x3a\x7d\xb6\x94\x10\x02\x35\
+\x36\x7c\xe4\x18\xed\xed\xdf\xae\x4d\x5b\xd6\x4f\x02\x80\x00\x20\
+\x00\x08\x00\x78\x4e\xb3\xa6\x51\xce\xcb\x0c\x19\xec\xd5\xb7\x6b\
+\x5f\xa9\x04\xfb\x07\x68\x6f\xfb\x53\x1f\x9d\x61\x0d\x25\x00\x08\
+\x00\x02\x80\x00\x80\xe7\xa8\xbb\xd4\xa9\xef\xb6\xb9\xc7\x40\xf5\
+\x0d\x1a\x3c\x4c\x7b\xbb\xcf\x98\x3e\x83\x35\x94\x00\x20\x00\x08\
+\x00\x02\x00\x9e\xd7\xa5\x73\x57\xd9\x53\x52\xc6\x80\xaf\x86\x6d\
+\xbb\x8b\x9d\xf7\x64\xd0\xfb\x1a\x26\x4a\xee\x3d\x7c\xc4\x3a\x4a\
+\x00\x10\x00\x04\x00\x01\x00\x7b\x9c\x24\xb8\x66\xfd\x66\x86\x7c\
+\x35\xa8\x4b\x2c\x75\xb7\xf7\xc1\x43\x87\x59\x47\x09\x00\x02\x80\
+\x00\x20\x00\x60\x0f\x81\x8d\xfd\x64\xf2\xd4\x99\x0c\xf9\xe7\xd8\
+\xb0\x65\x87\xf6\xb6\x1e\x9e\x31\x9c\x75\x94\x00\x20\x00\x08\x00\
+\x02\x00\xf6\x32\x7a\x6c\x26\x83\xfe\x39\x92\x5a\x26\x69\x6d\xe3\
+\x90\x80\x40\xb9\x79\xfb\x0e\x6b\x29\x01\xc0\x4e\x20\x00\x08\x00\
+\xd8\xcb\xec\x79\x59\x0c\xfa\x67\x98\x30\x69\xaa\xf6\x36\xde\x5a\
+\xb0\x8d\xb5\x94\x00\x60\x27\x10\x00\x04\x00\xec\xf7\x75\xc0\xf2\
+\x95\x79\x0c\xfb\xa7\x28\xdc\x5b\xe2\xbc\x8a\x42\x67\x1b\x67\xa4\
+\x67\xb0\x96\x12\x00\xec\x04\x02\x80\x00\x80\xfd\xa8\x3b\xdf\xa9\
+\xc7\x11\x33\xf0\xab\xa6\x1e\xc0\xa4\xb3\x7d\x9b\x47\x35\x63\x2d\
+\x25\x00\xd8\x09\x04\x00\x01\xf0\x34\x03\x07\xa4\xc9\xa2\x45\x8b\
+\x7d\xd2\xec\xd9\x73\x64\xcc\x98\xb1\x92\xfa\x56\xaa\x74\xea\xd0\
+\x51\xe2\x63\x5b\x48\x70\x40\xa0\xdb\xaf\x0e\x28\xdc\x7b\x80\x81\
+\x5f\x85\x59\x73\xb3\xb4\xb7\xef\xa7\xe7\xce\xb3\x9e\x12\x00\x20\
+\x00\x08\x80\xaa\xe4\x6f\xdc\xc4\xf1\x56\x89\xba\x7e\xfc\x1f\xa7\
+\x3e\x94\x15\x39\xb9\xf2\x56\xff\x37\x8d\xdc\x9f\xfe\x79\xd4\x09\
+\x6f\xfb\x0f\x1d\x65\xe8\x57\xf1\x7c\x80\x20\xcd\x3b\x03\x6e\xc8\
+\xdf\xc8\x71\x4d\x00\x80\x00\x20\x00\x08\x80\x9a\xfb\xf1\xe7\x87\
+\x72\xfc\xe4\x7b\xce\xef\x93\x75\x6f\x50\xf3\x2c\x23\x47\x8d\x65\
+\xe8\x57\xa1\x57\xcf\x3e\x9c\x07\x40\x00\x10\x00\x04\x00\x01\x40\
+\x00\x78\xd6\xf9\x8b\x5f\xca\xc4\x09\x13\x2d\xf9\x9a\x40\xdd\x03\
+\x7f\xfb\x9e\x7d\x0c\xfd\x27\xcc\x9c\x33\x5f\xfb\xae\x80\x0f\x1e\
+\xff\xc2\xf1\x4b\x00\x80\x00\x20\x00\x08\x00\x7d\x57\xae\xdf\x90\
+\xd1\xa3\x46\x1b\x8f\x80\xbe\x7d\xfb\x33\xf4\x9f\xb0\xa5\x70\x8f\
+\xf6\x76\xfd\xe4\xf3\x73\x1c\xb7\x04\x00\x08\x00\x02\x80\x00\x30\
+\x67\xdb\x8e\x42\xa3\xe7\x08\xa8\xcb\xde\xd6\x6c\xe0\x76\xc1\x4f\
+\x8a\x6a\xd2\x54\x6b\xbb\xae\xdf\x90\xcf\xf1\x4a\x00\x80\x00\x20\
+\x00\x08\x00\xb3\xce\x5d\xb8\x28\x9d\x92\x3b\x18\x8b\x80\x76\x6d\
+\xdb\x31\xf4\x9f\xd0\xa7\x4f\x3f\xce\x03\x20\x00\x08\x00\x02\x80\
+\x00\x20\x00\xec\xe7\xee\x83\x9f\xe4\xcd\x7e\xfd\x8d\x45\xc0\x82\
+\x85\x4b\x18\xfc\x95\x4c\x9b\x31\x47\x6b\x7b\xb6\x4a\x48\xe4\x38\
+\x25\x00\x40\x00\x10\x00\x04\x80\x35\xbe\xbf\xfb\xa3\xf3\x5e\x02\
+\x26\x02\x20\x26\xba\xb9\x94\x1e\x3d\xc9\xf0\x77\xd9\xb8\x6d\xa7\
+\xd6\xf6\x54\x57\x6f\xdc\xfd\xe9\x67\x8e\x53\x02\x00\x04\x00\x01\
+\x40\x00\x58\x74\x72\xe0\x8d\x9b\x92\x94\xd8\xd2\x48\x04\xac\x5a\
+\x9b\xcf\xf0\xaf\x24\x32\x3c\x82\x1b\x02\x11\x00\x04\x00\x01\x40\
+\x00\x10\x00\xf6\xf5\xc5\x57\x97\x24\x32\x2c\x5c\x3b\x00\x86\xa5\
+\x8f\x60\xf0\x57\x92\x92\xd2\x43\x6b\x7b\xaa\xf5\x84\xe3\x93\x00\
+\x00\x01\x40\x00\x10\x00\x96\x5a\xb5\x7a\x8d\x76\x00\xc4\x36\x8f\
+\x61\xf0\x57\x92\x31\x7c\x94\xd6\xf6\xcc\xc9\xc9\xe5\xd8\x24\x00\
+\x40\x00\x10\x00\x04\x80\xf5\x77\x0f\x6c\x9b\xd4\x5a\x3b\x02\x36\
+\x6c\xd9\xc1\xf0\x37\x74\x43\xa0\xcc\xcc\xf1\x1c\x9b\x04\x00\x08\
+\x00\x02\x80\x00\xb0\x5e\xe9\xe1\x72\xed\x00\x18\x33\x36\x93\xe1\
+\xef\xb2\x32\x6f\x83\xd6\xb6\xec\xd9\xbd\x07\xc7\x25\x01\x00\x02\
+\x80\x00\x20\x00\xdc\xa3\xbf\xe6\xa5\x81\xad\x12\x5b\x31\xfc\x5d\
+\x76\x16\x1f\xd4\xbe\x25\x30\xc7\x24\x01\x00\x02\x80\x00\x20\x00\
+\xdc\xa2\x70\xd7\x6e\xed\x4f\x01\x0a\x76\x15\x13\x00\x2e\xa1\x41\
+\xc1\x5a\xdb\xf2\xe6\xad\xdb\x1c\x97\x04\x00\x08\x00\x02\x80\x00\
+\xb0\x9e\x1a\x38\x41\x7e\xfe\x5a\xfb\x67\x5e\xd6\x3b\x0c\x7f\x97\
+\xa4\x56\x49\x5a\xdb\xf2\xc3\x33\x1f\x73\x5c\x12\x00\x20\x00\x08\
+\x00\x02\xc0\x3d\x74\xef\x10\x38\x61\xd2\x54\x86\xbf\x4b\xef\xde\
+\x7d\xb5\xb6\x65\xc5\xb1\xe3\x1c\x93\x04\x00\x08\x00\x02\x80\x00\
+\x70\x8f\x0d\x8e\xed\xab\x77\x3f\x80\xe1\x0c\x7f\x97\xe1\x23\x46\
+\x73\x2f\x00\x02\x80\x00\x20\x00\x08\x00\x02\xc0\x3b\xa8\x3b\xd0\
+\xe9\xec\x1f\xf5\x20\x1c\x86\xff\xbf\xbd\x9d\x39\x51\x6b\x5b\xaa\
+\x73\x32\x38\x26\x09\x00\x10\x00\x04\x00\x01\xe0\x9e\xf3\x00\x6e\
+\xdf\xd1\xda\x3f\xc9\x6f\x74\x60\xf8\xbb\x4c\x9e\x3a\x43\x6b\x5b\
+\x6e\xdc\xb4\x99\x63\x92\x00\x00\x01\x40\x00\x10\x00\xee\x13\x1a\
+\x18\x54\xeb\xfd\x13\x17\xdb\x82\xe1\x6f\xe8\x66\x40\xea\x0e\x8d\
+\x1c\x8f\x04\x00\x08\x00\x02\x80\x00\x70\x1b\xf5\x38\xda\xda\xee\
+\x1f\x75\xe9\x1b\xc3\xff\xdf\xe6\x67\x2f\xd6\x3a\xd6\x17\x2d\x5e\
+\xc2\xf1\x48\x00\x80\x00\x20\x00\x08\x00\xf7\x51\x77\xa1\xd3\xd9\
+\x47\xc5\x65\x15\x04\x80\xc3\xe2\xe5\xb9\x5a\xdb\x71\xce\x9c\xb9\
+\x1c\x8f\x04\x00\x08\x00\x02\x80\x00\x70\x9f\xd4\xb7\x52\xb5\xf6\
+\xd1\xce\xe2\x03\x04\x80\x43\xce\x9a\xf5\x5a\xdb\x71\xf2\xe4\x29\
+\x1c\x8f\x04\x00\x08\x00\x02\x80\x00\x70\x9f\x8e\xc9\x1d\x6a\xbd\
+\x7f\xfc\x5f\x6b\x24\x07\x2b\x4e\x10\x00\x0e\x6b\x37\x6e\xd5\x7b\
+\xb6\xc2\xe8\x31\x1c\x8f\x04\x00\x08\x00\x02\x80\x00\x70\x9f\x98\
+\xa8\x66\xb5\xde\x3f\x4d\x23\x22\x19\xfe\x2e\xf9\x05\x85\x5a\xc7\
+\x7a\xfa\xb0\x74\x8e\x47\x02\x00\x04\x00\x01\x40\x00\xb8\xc7\xbd\
+\x87\x8f\x24\xa0\x51\xe3\x5a\xef\x1f\x75\xfb\x5b\x86\xff\xbf\xe5\
+\xe5\x6f\xe1\x13\x00\x02\x80\x00\x20\x00\x08\x00\x02\xc0\x3b\x7c\
+\x7d\xf5\x5b\xad\xfd\xd3\xb5\x4b\x0a\xc3\xdf\x65\xc5\xea\xb5\x9c\
+\x03\x40\x00\x10\x00\x04\x00\x01\x40\x00\x78\x87\xa3\xef\x9e\xd0\
+\xda\x3f\xa9\x03\x06\x32\xfc\x5d\x16\x2d\xcd\xe1\x2a\x00\x02\x80\
+\x00\x20\x00\x08\x00\x02\xc0\x3b\xcc\x9c\x39\x4b\x6b\xff\x8c\xf2\
+\x91\xe3\xb8\x3a\xd4\x93\x11\xb9\x0f\x00\x01\x40\x00\x10\x00\x04\
+\x00\x01\xe0\x15\x5a\xc6\x27\x68\xed\x9f\x69\x33\xe7\x30\xfc\x5d\
+\xd4\xb6\xe0\x4e\x80\x04\x00\x01\x40\x00\x10\x00\x04\x80\xed\x9d\
+\x3e\xfb\x89\xd6\xbe\x51\x96\xe5\xae\x61\xf8\xbb\xa8\x47\x23\xeb\
+\x6c\xcb\x4d\x9b\xb7\x70\x5c\x12\x00\x20\x00\x08\x00\x02\xc0\x7a\
+\x0b\x17\xea\x7d\x64\xad\x6e\x03\x5c\x52\x7e\x9c\xe1\xef\xa2\xfe\
+\x4d\x6b\xdd\x50\x69\xf7\x1e\x8e\x4b\x02\x00\x04\x00\x01\x40\x00\
+\x58\xfc\x14\xc0\x5b\xb7\xa5\x59\x64\x53\xad\x7d\xd3\xab\x57\x1f\
+\x06\x7f\x25\x43\x87\x0d\xd7\xda\x9e\x25\x07\x4b\x39\x36\x09\x00\
+\x10\x00\x04\x00\x01\x60\xef\x93\xff\x14\xf5\xf0\x1b\x06\xff\xff\
+\xe9\xd1\xa3\x97\xd6\xf6\x54\x57\x64\x70\x6c\x12\x00\x20\x00\x08\
+\x00\x02\xc0\x32\x9f\x7d\x71\x41\x02\x1b\xfb\x69\xed\x97\x40\x3f\
+\x7f\xd9\x5b\x5a\xce\xe0\xaf\x24\x31\x3e\x51\x6b\x9b\x9e\xf9\xe4\
+\x53\x8e\x4f\x02\x00\x04\x00\x01\x40\x00\xd8\xf7\xe1\x3f\x4a\x97\
+\xce\x5d\x19\xfa\x95\x94\x1e\x3d\x29\x41\xfe\x01\x5a\xdb\xf4\xd6\
+\x8f\xf7\x38\x3e\x09\x00\x10\x00\x04\x00\x01\x60\x8d\xe5\x2b\x72\
+\xb4\x87\xbf\x32\x7d\xd6\x5c\x06\x7f\x25\xdb\x76\x17\x6b\x6d\xcf\
+\xb8\x98\x58\x8e\x4f\x02\x00\x04\x00\x01\x40\x00\x58\xa3\x60\xfb\
+\x0e\x23\xc3\x5f\x3d\x01\x70\x67\xf1\x41\x06\x7f\x25\xcb\x57\xe6\
+\x69\x6d\xd3\x7e\x7d\xfa\x72\x8c\x12\x00\x20\x00\x08\x00\x02\xc0\
+\xbc\xd2\xc3\xe5\xda\xdf\xfb\xff\x67\x58\xf5\x7d\x93\xa1\xff\x84\
+\xa9\xd3\x67\xf3\x1c\x00\x02\x80\x00\x20\x00\x08\x00\x02\xc0\x5e\
+\xd4\xe5\x65\x61\x41\xc1\x46\x86\x7f\xb0\x7f\x80\xec\xd8\xb3\x9f\
+\xa1\xff\x84\x21\x43\xd3\xb5\xb6\xeb\xea\x35\x79\x1c\xab\x04\x00\
+\x08\x00\x02\x80\x00\x30\xe3\xee\x83\x9f\x64\xfa\xf4\x19\x46\x06\
+\x3f\xf7\xfe\x7f\x36\x75\x52\xa4\xce\x76\x55\x9f\xd0\x70\xcc\x12\
+\x00\x20\x00\x08\x00\x02\x40\xdb\xe7\x17\x2e\x4a\xc7\xe4\x0e\x46\
+\x87\x7f\x54\x93\xa6\xb2\xaf\xac\x82\x81\x5f\xc5\x15\x00\xe1\x21\
+\xa1\x5a\xdb\xf6\xfc\x97\x5f\x71\xdc\x12\x00\x20\x00\x08\x00\x02\
+\xa0\xf6\xbe\xb9\x76\x5d\xe6\xcd\x9b\x2f\x61\xc1\x21\x46\x87\xbf\
+\x32\x6b\x6e\x16\x03\xbf\x0a\xeb\x37\x6f\xd3\xda\xae\x41\x7e\xfe\
+\x72\xff\xd1\x63\x8e\x5f\x02\x00\x04\x00\x01\x40\x00\xd4\xdc\x39\
+\xc7\x3b\xfe\x09\xe3\x27\x48\x70\x40\xa0\xf1\xc1\xaf\x24\xb5\x4c\
+\x72\xbe\xd3\x65\xe0\x9b\x3f\xc6\x5f\x6f\xdd\x86\x63\x98\x00\x00\
+\x01\xc0\xe2\x48\x00\x54\x8f\x7a\xc7\xa8\x9e\xe6\xa7\x4e\x1e\x1b\
+\x90\x3a\x40\x02\x1a\x35\xb6\x64\xf0\xff\x76\xd9\x5f\xee\x9a\xf5\
+\x0c\xfb\xa7\x48\x49\xe9\xa1\xb5\x7d\xc7\x8e\x7d\x9b\x63\x9a\x00\
+\x00\x01\x40\x00\x10\x00\xff\xe7\xc7\x9f\x1f\xca\xe5\x6f\xaf\x39\
+\x6f\x11\x5b\x7e\xf4\x98\xf3\x69\x71\xb9\x2b\x57\xc9\x90\xc1\x43\
+\xa4\x69\x44\x13\xcb\x06\xfe\x93\x26\x4e\x9e\xc6\xa0\xb7\xf0\xfb\
+\xff\xad\xdb\xb6\xb3\xa6\x12\x00\x20\x00\x08\x80\xdf\xdd\x73\xbe\
+\xb1\x9f\xf3\x63\x6d\x5f\xe4\xae\x01\xff\x2c\x83\x87\x0c\x63\xd0\
+\x3f\xc3\xba\x4d\x05\xda\xdb\xf8\xe2\xa5\xaf\x59\x53\x09\x00\x10\
+\x00\x04\x00\xec\x23\xa5\x5b\x77\xbe\xf7\x7f\x0e\xf5\xe9\x88\xce\
+\x36\x4e\x68\x11\xc7\x7a\x4a\x00\x80\x00\x20\x00\x60\x1f\x6d\x92\
+\xda\xc8\xfe\x43\x47\x19\xf2\xcf\xd1\xb5\x4b\x0a\xdf\xff\x13\x00\
+\x04\x00\x01\x40\x00\x10\x00\x75\x43\x4c\x74\x73\xee\xf5\x5f\x0d\
+\x45\x07\x0e\x3b\x1f\x8b\xac\xb3\xad\xd5\xf3\x19\x58\x4f\x09\x00\
+\x10\x00\x04\x00\x3c\x2e\xba\x69\x33\xd9\xb4\x6d\x17\x03\xbe\x1a\
+\xa6\xcd\x9c\xa3\xff\xfd\xff\xd7\x97\x59\x4f\x09\x00\x10\x00\x04\
+\x00\x3c\x4b\xdd\xce\x76\x4f\x49\x19\xc3\xbd\x9a\xda\xb7\x6b\xaf\
+\xb5\xbd\x13\xe3\xe2\x59\x4b\x09\x00\x76\x02\x01\x40\x00\xc0\x73\
+\xd4\x75\xfe\x63\xde\x1e\xcf\x09\x7f\x35\x50\xb0\xab\xd8\xb9\xdd\
+\x74\xb6\xfb\xdb\x7c\xff\x4f\x00\xb0\x13\x08\x00\x02\x00\x9e\x12\
+\x19\x1e\xe1\x7c\x96\x3d\x43\xbd\x66\xc6\x8e\x9b\xa0\xbd\xed\x77\
+\xed\x29\x62\x2d\x25\x00\xd8\x09\x04\x00\x01\x00\xf7\x53\x1f\x61\
+\x17\xee\x2d\x61\xa0\xd7\x42\x7c\x8b\x38\xad\x6d\x1f\x11\x12\x2a\
+\xb7\xef\x3f\x60\x2d\x25\x00\xd8\x09\x04\x00\x01\x00\xf7\x51\x77\
+\x11\x9c\x30\x69\x9a\x1c\xac\x38\xc1\x30\xaf\x85\xb5\x1b\xb7\x6a\
+\xef\x03\x3e\xfe\x27\x00\x08\x00\x02\x80\x00\x80\x1b\x07\x7f\xa4\
+\xf3\xc6\x35\xfb\x0f\x1f\x63\x90\x6b\x48\x1d\x30\x50\x7b\x5f\x1c\
+\x39\x7a\x8c\x75\x94\x00\x20\x00\x08\x00\x02\x00\xd6\x8a\x6a\xd2\
+\xd4\xb1\x1f\x66\x48\x09\x83\x5f\x9b\xfa\xca\x24\x48\xf3\xda\xff\
+\x16\xcd\x63\x78\xfc\x2f\x01\x40\x00\x10\x00\x04\x00\x2c\xbc\xa1\
+\x4f\xb3\x68\x99\x32\x6d\x26\x83\xdf\xa0\x61\xe9\x23\xb4\xf7\xcb\
+\xec\xd9\x73\x58\x43\x09\x00\x02\x80\x00\x20\x00\x60\x8e\x7a\x67\
+\xda\xa9\x63\x67\xe7\xf7\xfb\x1b\x0b\x0a\x19\xd8\x86\xed\x29\x39\
+\x24\xa1\x81\x41\xda\xfb\xe9\xa3\xb3\x9f\xb0\x86\x12\x00\x04\x00\
+\x01\x40\x00\x40\x4f\x5c\x6c\x0b\x19\x3c\x24\x5d\x96\xac\x58\xc5\
+\xbd\xfb\x2d\x36\x7a\x6c\xa6\xfe\x95\x17\xaf\xb7\x63\xfd\x24\x00\
+\x08\x00\x02\xc0\x37\x02\x60\xf6\xbc\x6c\xc7\x90\x8a\x43\x0d\xa9\
+\xcb\xcc\xd4\x03\x79\xd4\xc3\x66\xde\x7c\x73\x80\x64\x0c\x1f\xe5\
+\x7c\x67\x3f\x67\xc1\x42\x59\x96\xbb\x5a\xd6\x6f\xde\xc6\xfd\xfa\
+\xdd\x68\x5f\x59\x85\x44\x84\x86\x6b\x07\x40\x4e\x4e\x2e\xeb\x27\
+\x01\x40\x00\x10\x00\xe3\x58\x58\x01\x1f\x79\xec\xaf\x12\xec\x1f\
+\x20\x97\xbf\xbd\xc6\xfa\x49\x00\x10\x00\x04\x00\x01\x00\x78\xcb\
+\xbb\x7f\x75\x25\x85\x6e\x00\x4c\x9c\x30\x91\xb5\x93\x00\x20\x00\
+\x08\x00\x02\x00\xf0\x16\xe9\x19\x23\xb5\x87\x7f\x40\xa3\xc6\xf2\
+\xc5\x57\x97\x58\x3b\x09\x00\x02\x80\x00\x20\x00\x00\x6f\x90\x5f\
+\x50\x28\x81\x8d\xfd\xb4\x03\x60\xd4\xc8\x51\xac\x9b\x04\x00\x01\
+\x40\x00\x10\x00\x80\xb7\x78\xa3\x7d\xb2\x91\xa7\x2d\x9e\xfd\xfc\
+\x1c\xeb\x26\x01\x40\x00\x10\x00\x04\x00\xe0\x2d\x57\xb0\x98\xb8\
+\x54\x73\xf0\xa0\xc1\xac\x99\x04\x00\x01\x40\x00\x10\x00\x80\x37\
+\x28\x3a\x78\xd8\xf9\xa8\x64\x13\x01\xf0\xfe\xe9\x8f\x58\x33\x09\
+\x00\x02\x80\x00\x20\x00\x00\x6f\x30\x70\xe0\x10\x23\xc3\xbf\x5f\
+\xdf\x7e\xac\x97\x04\x00\x01\x40\x00\x10\x00\x80\x37\x58\x99\xb7\
+\xc1\xf9\xbd\xbd\x89\x00\x38\xfa\xee\x09\xd6\x4b\x02\x80\x00\x20\
+\x00\x08\x00\xc0\xee\x76\xed\x2f\x95\x66\x91\x4d\x8d\x0c\xff\x81\
+\x69\x03\x59\x2b\x09\x00\x02\x80\x00\x20\x00\x00\xbb\x2b\x3d\x7a\
+\x52\x3a\x77\xea\x62\x64\xf8\xab\x87\x06\x5d\xbc\xf4\x35\x6b\x25\
+\x01\x40\x00\x10\x00\x04\x00\x60\x77\x6f\x67\x4e\x34\xf6\x90\xa6\
+\xa5\x4b\x97\xb1\x4e\x12\x00\x04\x00\x01\x40\x00\x00\xde\xf0\xbd\
+\xbf\xba\x5b\x9f\x89\xe1\xdf\x26\xa9\xb5\xdc\xfd\xe9\x67\xd6\x49\
+\x02\x80\x00\x20\x00\x08\x00\xc0\x57\xbe\xf7\x57\x8e\x1c\x3d\xc6\
+\x1a\x49\x00\x10\x00\x04\x00\x01\x00\xf8\xca\xf7\xfe\xca\x88\xe1\
+\x23\x58\x1f\x09\x00\x02\x80\x00\x20\x00\x00\xbb\x4b\x4b\x1b\x6c\
+\x6c\xf8\x47\x84\x84\xf2\xb8\x5f\x02\x80\x00\x20\x00\x08\x00\xc0\
+\xee\x46\x8e\x1a\x6b\x6c\xf8\x2b\xab\xd7\xe4\xb1\x36\x12\x00\x04\
+\x00\x01\x40\x00\x00\x76\x36\x79\xea\x0c\xa3\xc3\xbf\x67\xf7\x1e\
+\x72\xff\xd1\x63\xd6\x46\x02\x80\x00\x20\x00\x08\x00\xc0\xae\xe6\
+\x65\xbd\x63\xec\x4e\x7f\x8a\x3a\x81\xf0\xd2\x95\xab\xac\x8b\x04\
+\x00\x01\x40\x00\x10\x00\x80\x5d\x2d\x59\xb1\x4a\x02\x1b\xfb\x19\
+\x1b\xfe\x2a\x24\xca\x0e\x97\xb3\x26\x12\x00\x04\x00\x01\x40\x00\
+\x00\x76\xb5\x6a\xdd\x46\x09\x0e\x08\x34\xfa\xd1\xff\xbc\xf9\x0b\
+\x58\x0f\x09\x00\x02\x80\x00\x20\x00\x00\x3b\xbf\xf3\x0f\x09\x0c\
+\x32\xfe\xbd\xff\xbd\x87\x8f\x58\x0f\x09\x00\x02\x80\x00\x20\x00\
+\x00\x3b\x9a\x39\x67\xbe\xb1\xbb\xfc\xf1\xbd\x3f\x01\x40\x00\x80\
+\x00\x00\xbc\xc0\xe8\xb1\x99\x46\x07\x3f\xdf\xfb\x13\x00\x04\x00\
+\x08\x00\xc0\xc6\x0e\x56\x9c\x90\xd4\xd4\x81\xc6\x87\xbf\x32\x9f\
+\xef\xfd\x09\x00\x02\x80\x00\x20\x00\x00\xfb\xd9\x57\x56\x21\x5d\
+\xbb\xa4\x58\x32\xfc\x33\xd2\x33\xb8\xde\x9f\x00\x20\x00\x08\x00\
+\x02\x00\xb0\x9b\xad\x85\x45\x92\xd4\x2a\xc9\x92\xe1\xdf\xbf\x5f\
+\x7f\x9e\xf2\x47\x00\x10\x00\x20\x00\x00\xbb\x99\x9f\xbd\x58\xc2\
+\x82\x42\x2c\x19\xfe\x5d\x3b\x77\x91\x1f\xee\xfe\xc8\xda\x47\x00\
+\x10\x00\x20\x00\x00\xbb\xd8\x7f\xe8\xa8\x65\xdf\xf7\x2b\xaf\xb7\
+\x6e\x23\xd7\xbe\xfb\x9e\x75\x8f\x00\x20\x00\x40\x00\x00\x76\x91\
+\xbf\x75\x87\x24\xc4\x25\x58\x36\xfc\xe3\x63\x5b\xc8\x57\xdf\x5c\
+\x61\xcd\x23\x00\x08\x00\x10\x00\x80\x5d\xcc\x98\x35\x4f\x82\xfd\
+\x03\x2c\x1b\xfe\xcd\x9a\x44\xca\xa7\xe7\xbf\x60\xbd\x23\x00\x08\
+\x00\x10\x00\x80\x1d\x6c\xde\xbe\x4b\xba\x74\xee\x6a\xd9\xe0\x57\
+\xc2\x82\x43\xe4\xfd\x0f\x4f\xb3\xd6\x11\x00\x04\x00\x08\x00\xc0\
+\xd3\x8a\x4b\x8f\x48\x7a\xc6\x48\xa3\x0f\xf3\xa9\x4a\x64\x78\x84\
+\x9c\xf8\xc7\xfb\xac\x73\x04\x00\x01\x00\x02\x00\xf0\xa4\xd2\xa3\
+\x27\x65\xf6\xbc\x6c\x89\x6a\x12\x69\xe9\xe0\xff\xed\x3b\xff\x4f\
+\x3e\x3f\xc7\x1a\x47\x00\x10\x00\x20\x00\x00\x4f\x5a\xbb\x71\xab\
+\xbc\xde\xb6\x9d\xe5\x83\x5f\x69\xd7\xf6\x75\xee\xef\x4f\x00\x10\
+\x00\x20\x00\x00\x4f\x5a\xbf\x79\x9b\xf4\xee\xdd\xd7\x79\xdf\x7d\
+\x77\x0c\x7f\xf5\x64\xbf\x1b\x3f\xdc\x62\x6d\x23\x00\x08\x00\x10\
+\x00\x80\x27\xe4\xac\x5e\x67\xf9\x09\x7e\x4f\x1a\x32\x78\x88\xdc\
+\x79\xf0\x13\xeb\x1a\x01\x40\x00\x80\x00\x00\xdc\xfd\x1d\xff\xc2\
+\x25\xcb\xa5\x6d\x9b\xb6\x6e\x1d\xfc\xca\xa4\x49\x93\xb9\xb7\x3f\
+\x01\x40\x00\x80\x00\x00\xdc\xa9\xe8\xc0\x61\x99\x36\x73\x8e\xc4\
+\xb7\x88\x73\xfb\xe0\x0f\x68\xd4\x58\x72\x72\x72\x59\xcb\x08\x00\
+\x02\x00\x04\x00\xe0\xae\x27\xf5\xcd\xcb\x5a\x24\xdd\xba\x75\x97\
+\x40\x3f\x7f\xb7\x0f\xfe\xdf\xce\xf4\xe7\x32\x3f\x10\x00\x20\x00\
+\x00\x8b\x1d\x28\x3f\x2e\x8b\x96\xe6\x48\x9f\x3e\xfd\x24\x24\x30\
+\xc8\x23\x43\xbf\xf2\xf7\xfd\xd7\x39\xd9\x0f\x04\x00\x08\x00\xc0\
+\x1a\x1b\x0b\x0a\x65\xea\x8c\xd9\xce\x33\xf9\xc3\x43\x42\x3d\x3a\
+\xf4\x95\xe0\x80\x40\xc9\x5b\xb7\x9e\xb5\x0b\x04\x00\x08\x00\xc0\
+\xe4\x49\x7c\x1b\xb6\x6c\x97\xc9\x53\x67\x4a\xcf\x1e\xbd\x24\x32\
+\x2c\xc2\xe3\x03\xbf\xb2\xd6\xad\x92\xe4\xf4\xd9\x4f\x58\xb7\x40\
+\x00\x80\x00\x00\x6a\xfb\xfd\xbd\x1a\xf4\x59\x8b\x96\xc9\xb8\xf1\
+\x93\xe4\xad\xd4\x34\x79\xa3\x7d\xb2\x2d\xde\xe1\x3f\xcd\x98\xd1\
+\x63\xe4\x87\xbb\x3f\xb2\x66\x81\x00\x00\x01\x00\xfc\xd7\x99\xf8\
+\x07\x0f\xcb\xc2\xc5\xcb\x65\xce\xfc\x6c\x99\x3a\x7d\xb6\x64\x4e\
+\x98\x2c\x23\x47\x8d\x95\x21\x43\xd3\x9d\x03\xbe\x57\xaf\x3e\xce\
+\x21\x1f\xd5\xa4\xa9\x6d\x87\x7c\x55\x5a\xc6\x27\x38\xff\x8d\xb2\
+\x56\x81\x00\x00\x01\x00\x54\x61\xf5\xfa\x4d\x5e\x35\xd8\xab\xf3\
+\x5d\xff\xc2\x85\xef\xc8\xed\xfb\x0f\x58\xa7\x40\x00\x80\x00\x00\
+\x7c\x21\x00\xd2\x52\x07\xc8\x17\x5f\x5d\x62\x7d\x02\x01\x00\x02\
+\x00\xf0\x85\x00\x50\x1f\xf7\x97\x1c\x2c\x65\x5d\x02\x01\x00\x02\
+\x00\xf0\x85\x00\x08\x0d\x0c\x92\x77\xde\x59\xc4\xc7\xfd\x20\x00\
+\x40\x00\x00\xbe\x10\x00\x91\x61\xe1\xb2\x60\x41\x96\x5c\xbd\x71\
+\x93\xb5\x08\x04\x00\x08\x00\xa0\xae\x07\x40\xf3\xa8\x66\xb2\x7c\
+\x45\x8e\xdc\xbc\x7d\x87\x35\x08\x04\x00\x08\x00\xa0\xae\x07\x40\
+\x62\x5c\xbc\xac\xdf\x90\xcf\x47\xfd\x20\x00\x40\x00\x00\xbe\x10\
+\x00\xea\xa1\x3d\xdb\x77\x14\xca\xbd\x87\x8f\x58\x73\x40\x00\x80\
+\x00\x00\x7c\x25\x00\xd4\x23\x7b\x47\x0c\x1f\x21\x9f\x9e\x3b\xcf\
+\x9a\x03\x02\x00\x04\x00\xe0\x6b\x5f\x01\x10\x02\x20\x00\x40\x00\
+\x00\x3e\x7c\x12\x20\x21\x00\x02\x00\x04\x00\xe0\xc3\x97\x01\x12\
+\x02\x20\x00\x40\x00\x00\x3e\x7c\x23\x20\x15\x02\x53\x26\x4f\xe1\
+\xb2\x40\x10\x00\x20\x00\x00\x5f\xbc\x15\x70\x6c\x74\x73\xd9\xb3\
+\xb7\x98\x75\x09\x04\x00\x08\x00\xc0\x17\x1f\x06\x34\x20\x75\x80\
+\x5c\xbc\xf4\x35\xeb\x13\x08\x00\x10\x00\xc0\xf3\x6c\xdb\x5d\x2c\
+\x03\x06\x0c\x92\x3e\x7d\xfa\x4b\xb7\x6e\xdd\x25\xf9\x8d\x0e\xd2\
+\x26\xa9\x8d\xc4\xc5\xc6\x49\x54\x93\xa6\x12\x1a\x14\xec\x55\x11\
+\x10\xe6\xf8\x7d\x73\x72\x72\xb9\x77\x00\x08\x00\x10\x00\x80\xae\
+\xe2\xd2\x23\x92\x97\xbf\x45\xe6\x2c\x58\x28\x23\x47\x8d\x95\x9e\
+\x3d\x7a\x49\x62\x5c\x82\x04\xf9\xf9\xdb\x36\x04\x92\xdb\xb5\x97\
+\xf7\x3e\x38\xc5\x5a\x05\x02\x00\x04\x00\x60\xda\xc1\x8a\x13\xb2\
+\xa5\x70\x8f\xcc\xcf\x5e\xec\xfc\x14\xa1\x45\xf3\x58\x5b\x45\x80\
+\xff\x6b\x8d\x24\x2b\x2b\x5b\xee\x3f\x7a\xcc\x9a\x05\x02\x00\x04\
+\x00\x60\xa5\x1d\x7b\xf6\xcb\x9c\xf9\xd9\xf2\xe6\x9b\xa9\xd2\x3c\
+\x2a\xda\x16\x21\xd0\xaf\x4f\x5f\x9e\x1c\x08\x02\x00\x04\x00\xe0\
+\x4e\x05\x3b\xf7\x4a\xe6\x84\xc9\x92\x10\x97\xe0\xd1\x08\x88\x8b\
+\x89\x95\x93\xef\x7f\xc0\xda\x05\x02\x00\x04\x00\xe0\x6e\xea\x3c\
+\x82\x41\x83\x86\x4a\x44\x68\xb8\x47\x22\x40\x9d\xb3\xb0\x26\x6f\
+\x2d\xeb\x17\x08\x00\x10\x00\x80\x27\x1c\x28\x3f\x2e\xd9\x8b\x96\
+\x49\x4a\xb7\xee\xce\x9b\xf9\xb8\x3b\x04\x32\xd2\x33\xe4\xfb\xbb\
+\x3f\xb2\x8e\x81\x00\x00\x01\x00\x78\xec\x9c\x81\xa2\x12\x19\x3c\
+\x24\x5d\x82\xfc\x03\xdc\x1a\x01\x6d\x93\x5a\xcb\x27\x9f\x9f\x63\
+\x2d\x23\x00\x08\x00\x10\x00\x80\x27\xed\x2c\x3e\x20\xc3\xd2\x87\
+\x4b\x70\x40\xa0\xdb\x22\x20\x22\x24\x54\x8e\x9f\x38\xc9\x7a\x46\
+\x00\x10\x00\x20\x00\x00\x4f\xdb\xb5\xbf\x54\x32\x86\x8f\x92\xd0\
+\xc0\x20\xb7\x44\x40\x88\x23\x38\x0e\x96\x1d\x62\x4d\x23\x00\x08\
+\x00\x10\x00\x80\x1d\xec\x29\x29\x93\x11\x23\xc7\xb8\xe5\xab\x81\
+\xc0\xc6\x7e\xb2\x73\xf7\x1e\xd6\x35\x02\x80\x00\x00\x01\x00\xd8\
+\xc5\xd6\xc2\x22\xe9\xd2\xb9\xab\x5b\x9e\x2c\xb8\x61\xe3\x26\xd6\
+\x36\x02\x80\x00\x00\x01\x00\xd8\xc9\x82\x77\x96\x38\x9f\x4d\x60\
+\x75\x08\x2c\x5b\xbe\x82\xf5\x8d\x00\x20\x00\x40\x00\x00\x76\x7b\
+\x26\xc1\x90\xa1\x19\x96\x5f\x3a\x38\x77\xee\x3c\xd6\x38\x02\x80\
+\x00\x00\x01\x00\xd8\xcd\xfa\xcd\xdb\xa4\x6d\x9b\xb6\x96\x46\xc0\
+\xc4\x89\x93\x58\xe7\x08\x00\x02\x00\x04\x00\x60\xc7\x07\x11\x0d\
+\x1f\x31\xda\xf9\xc0\x1f\xab\x22\x60\xc1\x82\x2c\xd6\x3a\x02\x80\
+\x00\x00\x01\x00\xd8\xd1\xa2\xa5\x39\x12\x1e\x12\x6a\x59\x04\x70\
+\x62\x20\x01\x40\x00\x80\x00\x00\x6c\xfc\xc0\xa1\xd6\xad\x5a\x5b\
+\x76\x75\x80\xfa\xb7\xce\x9a\x47\x00\x10\x00\x20\x00\x00\x1b\x2a\
+\x29\x3f\x2e\x69\x69\x83\x2d\x89\x00\x75\x53\xa2\xf7\x3e\x38\xc5\
+\xba\x47\x00\x10\x00\x20\x00\x00\xbb\x9a\xb3\x60\xa1\x25\xb7\x13\
+\x6e\xd6\x24\x52\xce\x5d\xb8\xc8\xda\x47\x00\x10\x00\x20\x00\x00\
+\xbb\x5a\xb3\x7e\xb3\x25\xe7\x05\xb4\x4c\x48\x94\x2b\x37\x6e\xb2\
+\xfe\x11\x00\x04\x00\x01\x40\x00\x00\x76\x95\xbf\x75\x87\x44\x39\
+\xde\xb5\x9b\x8e\x80\xce\x1d\x3b\xc9\x0f\x3c\x4a\x98\x00\x20\x00\
+\x08\x00\x02\x00\xb0\xf7\x6d\x84\x63\xa2\x9b\x1b\x8f\x80\xe1\x19\
+\xc3\x59\x03\x09\x00\x02\x80\x00\x20\x00\x00\x3b\x2b\xdc\x5b\x22\
+\x09\x71\x09\xc6\x23\x60\xf3\xd6\x02\xd6\x41\x02\x80\x00\x20\x00\
+\x08\x00\xc0\xee\x4f\x16\x6c\x93\xd4\xc6\x68\x00\x84\x05\x05\xcb\
+\xa7\xe7\xbf\x60\x2d\x24\x00\x08\x00\x02\x80\x00\x00\xec\xfe\x1c\
+\x81\xe4\xf6\xc9\x46\x23\x20\xb9\xfd\x1b\x72\xe7\xc1\x4f\xac\x87\
+\x04\x00\x01\x40\x00\x10\x00\x80\x9d\xed\x2d\x2d\x97\x96\x09\x2d\
+\x8d\x46\xc0\xd4\xa9\xd3\x58\x0f\x09\x00\x02\x80\x00\x20\x00\x00\
+\x6f\x38\x27\x20\xba\x69\x33\xa3\x11\xc0\x9d\x02\x09\x00\x02\x80\
+\x00\x20\x00\x00\x6f\xb8\x44\xb0\xa0\x50\xc2\x83\xcd\xdd\x27\x20\
+\x2a\xa2\x89\x5c\xba\x72\x95\x75\x91\x00\x20\x00\x08\x00\x02\x00\
+\xb0\xbb\x9c\x35\xeb\x25\xc8\xcf\xdf\x58\x04\xf4\xee\xd9\x4b\xee\
+\x3f\x7a\xcc\xda\x48\x00\x10\x00\x04\x00\x01\x00\xd8\xdd\x82\x85\
+\x4b\x8c\x3e\x4e\x38\x6f\xdd\x7a\xd6\x46\x02\x80\x00\x20\x00\x08\
+\x00\xc0\x1b\x4c\x98\x34\xcd\x58\x00\x44\x86\x47\xc8\xb7\x37\xbf\
+\x63\x7d\x24\x00\x08\x00\x02\x80\x00\x00\xbc\x41\xdf\xbe\xfd\x8d\
+\x45\xc0\x84\xf1\x13\x58\x1f\x09\x00\x02\x80\x00\x20\x00\x00\x6f\
+\xb9\x47\x40\x6c\xf3\x18\x23\x01\x10\xd0\xa8\xb1\x7c\x78\xe6\x63\
+\xd6\x48\x02\x80\x00\x20\x00\x08\x00\xc0\x1b\xe4\xe5\x6f\x91\xc0\
+\xc6\x7e\x46\x22\xa0\x7b\xb7\x14\x79\xf0\xf8\x17\xd6\x49\x02\x80\
+\x00\x20\x00\x08\x00\xc0\x3b\xce\x07\x98\x6a\xec\xab\x80\xed\x3b\
+\x0a\x59\x27\x09\x00\x02\x80\x00\x20\x00\x00\x6f\x50\x7a\xf4\xa4\
+\x74\xe9\xdc\xd5\x48\x00\xc4\x34\x8b\x96\xef\x79\x6c\x30\x01\x40\
+\x00\x10\x00\x04\x00\xe0\x1d\x76\xed\x2b\x95\xa6\x11\x91\x46\x22\
+\x60\xce\x9c\xb9\xac\x95\x04\x00\x01\x40\x00\x10\x00\x80\xb7\x58\
+\x96\xbb\xc6\x48\x00\xa8\x1b\x0d\x5d\xb8\xf4\x35\xeb\x25\x01\x40\
+\x00\x10\x00\x04\x00\xe0\x2d\xfa\xf4\x31\x73\x69\xe0\xe4\xc9\x53\
+\x58\x2f\x09\x00\x02\x80\x00\xf0\xcd\x00\x98\x3d\x2f\x5b\xe2\x62\
+\xe3\x50\x43\xf1\x2d\xe2\xe4\xf5\x36\xaf\x4b\xcf\x9e\xbd\x65\xc8\
+\xd0\x74\x19\x3f\x71\x8a\xcc\xcf\x5e\x2c\x2b\xf3\x36\x48\xc1\xce\
+\xbd\x72\xa0\xfc\x38\x83\xda\xe2\x87\x06\x85\x06\x06\x69\x07\x40\
+\x48\x40\xa0\x5c\xb9\x71\x93\x35\x93\x00\x20\x00\x08\x00\xdf\x0b\
+\x80\x49\x53\xa6\x1b\x7d\xf2\x1a\xfe\x4d\xdd\xc2\xb6\x45\x4c\xac\
+\x8c\x18\x39\x46\x36\x6c\xd9\xce\xd0\xb6\x40\xe6\x84\xc9\x46\xf6\
+\xd5\x82\x05\x59\xac\x99\x04\x00\x01\x40\x00\x10\x00\xb0\x46\x42\
+\x8b\x78\x19\x3d\x36\x53\x36\x6d\xdb\xc5\xf0\x36\x44\x7d\xca\x12\
+\x17\xdb\x42\xff\x16\xc1\x61\xe1\xf2\xdd\x9d\xbb\xac\x9b\x04\x00\
+\x01\x40\x00\x10\x00\xb0\x56\xab\xc4\x56\x32\x2e\x73\xa2\xec\x2c\
+\x3e\xc0\x20\xd7\xb4\x64\xc5\x2a\x23\xfb\x24\x27\x77\x25\xeb\x26\
+\x01\x40\x00\x10\x00\x04\x00\xdc\x43\x7d\x87\xad\x3e\xc6\xe6\x7c\
+\x01\x3d\x29\xdd\xba\x6b\xef\x8b\xd8\xe8\xe6\x72\xf7\xc1\x4f\xac\
+\x9d\x04\x00\x01\x40\x00\x10\x00\x70\x1f\x75\xae\xc0\xe2\xe5\xb9\
+\x0c\xf3\x5a\xda\xba\xb3\xc8\x79\x49\x9f\xee\x7e\xd8\xb4\x79\x0b\
+\x6b\x27\x01\x40\x00\x10\x00\x04\x00\xdc\xaf\x6b\x97\x6e\xb2\x65\
+\xc7\x1e\x86\x7a\x2d\xa4\x0e\x18\xa8\xbd\xfd\x5b\xb7\x6c\x25\xf7\
+\x1f\x3d\x66\xfd\x24\x00\x08\x00\x02\x80\x00\x80\xfb\x05\x3a\xde\
+\xc9\x66\x0c\x1f\x25\xc5\x65\x15\x0c\xf6\x1a\x50\xe1\xa4\xae\xbc\
+\xd0\xdd\xfe\x07\x4a\xcb\x58\x3f\x09\x00\x02\x80\x00\x20\x00\xe0\
+\xc1\xab\x06\xe2\x12\x64\xfb\xee\x7d\x0c\xf7\x1a\x50\xf7\x64\xd0\
+\xdd\xee\x23\x86\x8f\x60\xfd\x24\x00\x08\x00\x02\x80\x00\x80\x67\
+\x45\x35\x69\x2a\xeb\x37\x6f\x63\xb8\xd7\xe0\x91\xc1\xba\xdb\x3c\
+\x2c\x28\x58\x7e\xe0\x21\x41\x04\x00\x01\x40\x00\x10\x00\xf0\xf8\
+\x95\x02\x8e\x81\xb4\x2c\x77\x35\x03\xbe\x9a\x3a\x76\xe8\xa4\xbd\
+\xcd\x0b\x77\xed\x66\x0d\x25\x00\x08\x00\x02\x80\x00\x80\xe7\x05\
+\x34\x6a\x2c\xb3\xe6\x66\x31\xe0\xdd\xf4\xa0\xa0\xb4\xd4\x01\xac\
+\xa1\x04\x00\x01\x40\x00\x10\x00\xb0\x8f\x31\x63\x33\x19\xf2\xd5\
+\x90\xd4\x2a\x49\xfb\x29\x81\xd7\xbe\xff\x81\x75\x94\x00\x20\x00\
+\x08\x00\x02\x00\xf6\x31\x68\xd0\x50\x86\xfc\x73\x1f\x70\x95\xa5\
+\xbd\x9d\xf3\x37\x6e\x62\x1d\x25\x00\x08\x00\x02\x80\x00\x80\xbd\
+\x4c\x9f\x35\x97\x41\xff\x0c\xc5\xa5\x47\x24\xd8\x3f\x40\x6b\x1b\
+\xf7\xea\xd1\x93\x75\x94\x00\x20\x00\x08\x00\x02\xe0\x99\xd7\xad\
+\x37\xf6\x93\xe0\x80\x40\x9f\xe4\xc9\x7b\x05\xac\xd9\xb0\x99\x61\
+\xff\x0c\xbd\x7b\xf7\xd5\x7e\x9a\xe3\xa5\x2b\x57\x59\x4b\x09\x00\
+\x76\x02\x01\x40\x00\xf0\x51\xe9\xef\xdd\xba\x77\x5f\x3e\x3d\xff\
+\x85\x1c\x2a\x3f\xe2\xbc\x8d\x6c\x56\x56\xb6\xf4\xeb\xd3\xd7\x79\
+\xd2\x9e\xd5\x11\x10\xdd\xb4\x99\xec\xda\x5f\xca\xb0\x7f\x8a\x45\
+\x4b\x73\xb4\xb7\xf1\xea\x35\x79\xac\xa5\x04\x00\x3b\x81\x00\x20\
+\x00\x08\x80\xea\xfb\xfa\xea\xb7\x92\xbb\x72\x95\x24\xb7\x7f\xc3\
+\xd2\x08\xe8\x90\xdc\x51\x0e\x56\x9c\x60\xe0\x57\xf5\xa8\xe0\x23\
+\xef\x4a\x44\x68\x98\xd6\xf6\x1d\x98\x36\x90\xe3\x99\x00\x60\x27\
+\x10\x00\x04\x00\x01\x50\x3b\x67\x3f\x3f\x27\x19\xe9\x19\x96\x45\
+\x80\xba\x6d\x30\x03\xbf\x6a\x69\x69\x83\xb5\xb6\x6d\x64\x58\x38\
+\xcf\x06\x20\x00\xd8\x09\x04\x00\x01\x40\x00\xe8\x29\x3b\x5c\x2e\
+\xad\x12\x12\x2d\x89\x80\xac\x45\xcb\x18\xf8\x55\x58\x99\xb7\x41\
+\x7b\xdb\x9e\xfe\xf8\x2c\xc7\x2f\x01\x00\x02\x80\x00\x20\x00\xf4\
+\xdc\xbe\xff\x40\xb2\xb3\x17\x6a\x9f\xa1\xfe\xa4\xf0\xe0\x50\x29\
+\x3a\x70\x98\xa1\xff\x84\xd2\xa3\x27\x25\x3a\xaa\x99\xd6\xb6\x5d\
+\xb5\x7a\x0d\xc7\x2e\x01\x00\x02\x80\x00\x20\x00\xcc\x38\xf5\xd1\
+\x19\x89\x6e\x1a\x65\x34\x02\x46\x8c\x1c\xc3\xd0\xaf\xc2\xc0\x81\
+\x43\xb4\xb6\xeb\xe0\x41\x83\x39\x66\x09\x00\x10\x00\x04\x00\x01\
+\x60\xce\xf9\x8b\x5f\x4a\xcb\xf8\x04\x63\x01\x10\x12\x18\xc4\x55\
+\x01\x55\x98\x9f\xbd\x58\xef\x3c\x80\xf0\x08\xce\x03\x20\x00\x40\
+\x00\x10\x00\x04\x80\x59\x97\xbf\xbd\x26\xc9\xed\xda\x1b\x8b\x80\
+\xa1\xc3\x86\x33\xf4\x9f\xb0\xb3\xf8\x80\xfe\x79\x00\x67\x3f\xe1\
+\x78\x25\x00\x40\x00\x10\x00\x04\x80\x59\x37\x6f\xdd\x96\x6e\x5d\
+\xba\x1a\x09\x80\x20\xff\x00\x29\xdc\x5b\xc2\xe0\x7f\x42\x5c\x6c\
+\x9c\xd6\x76\x5d\x93\xb7\x96\x63\x95\x00\x00\x01\x40\x00\x10\x00\
+\xe6\x7d\x73\xed\xba\x34\xd7\x3c\x59\xed\x3f\xd7\xae\x0f\x1c\xc2\
+\xd0\x7f\xc2\x80\x01\x83\xb4\xb6\xe9\x90\xc1\x43\x38\x4e\x09\x00\
+\x10\x00\x04\x00\x01\x60\x8d\x23\x47\x8f\x19\xb9\x83\xa0\xba\x35\
+\x73\xc1\xae\x62\x06\x7f\x25\xf3\xb2\xde\xd1\xda\xa6\xea\x5c\x0d\
+\x8e\x51\x02\x00\x04\x00\x01\x40\x00\x58\x66\xd1\xa2\xc5\x46\x3e\
+\x05\x78\xeb\xad\x34\x06\x7f\x25\x3b\x8a\x4a\xb4\xb6\xa7\x0a\xb3\
+\x3b\x0f\x7e\xe2\x18\x25\x00\x40\x00\x10\x00\x04\x80\x35\xd4\xd9\
+\xe6\xfd\xfa\xf6\xd3\x0e\x80\xd0\xa0\x60\x39\x50\x7e\x9c\xe1\x5f\
+\x49\x8b\xe6\xb1\x5a\xdb\xf4\x93\xcf\xcf\x71\x8c\x12\x00\x20\x00\
+\x08\x00\x02\xc0\x3a\x17\xbf\xbe\x2c\x41\x7e\xfe\xda\x11\xb0\x2c\
+\x77\x35\x83\xbf\x92\x9e\x3d\x7b\x6b\x6d\xcf\x7d\x25\x07\x38\x3e\
+\x09\x00\x10\x00\x04\x00\x01\x60\xad\x49\x93\x26\x6b\x07\xc0\xe0\
+\x21\xc3\x18\xfc\x95\xa8\x1b\x25\xe9\x6c\xcf\x9c\x9c\x5c\x8e\x4d\
+\x02\x00\x04\x00\x01\x40\x00\x58\x4b\x3d\x87\x3e\x38\x20\x50\x6b\
+\xbf\xc4\x34\x8b\x66\xf0\x57\x32\x6b\x6e\x96\xd6\xf6\xcc\xcc\x1c\
+\xcf\xb1\x49\x00\x80\x00\x20\x00\x08\x00\xeb\x4d\x9b\x36\x5d\xfb\
+\x53\x80\xfc\xad\x3b\x18\xfe\x2e\xab\xd6\xe6\x6b\x6d\xcb\x9e\xdd\
+\x7b\x70\x5c\x12\x00\x20\x00\x08\x00\x02\xc0\x3d\xf7\x06\x08\xd1\
+\xfc\x14\x60\x5c\xe6\x44\x86\xbf\x8b\xba\x4d\xb2\xce\xb6\x54\xf7\
+\x69\xe0\xb8\x24\x00\x40\x00\x10\x00\x04\x80\x5b\x0c\x1b\x3a\x4c\
+\x6b\xdf\xb4\x6b\xdb\x8e\xe1\x5f\x49\x58\x70\x88\xd6\xf6\xbc\x79\
+\xfb\x0e\xc7\x25\x01\x00\x02\x80\x00\x20\x00\xac\xb7\x75\xdb\x76\
+\xad\x7d\xe3\xff\x5a\x23\x1e\x10\x54\x49\x9b\xa4\x36\x5a\xdb\xf3\
+\xc3\x33\x1f\x73\x5c\x12\x00\x20\x00\x08\x00\x02\xc0\x7a\x57\x6e\
+\xdc\x74\x0e\x71\x9d\xfd\xb3\x64\xc5\x2a\x86\xbf\x4b\x9f\x3e\x7a\
+\xf7\x58\xa8\x38\x76\x9c\xe3\x92\x00\x00\x01\x40\x00\x10\x00\xee\
+\xd1\xad\x73\x17\xad\xfd\x33\x73\xf6\x7c\x86\xbf\x4b\x7a\xc6\x48\
+\xad\x6d\xa9\xd6\x14\x8e\x49\x02\x00\x04\x00\x01\x40\x00\xb8\xc5\
+\x92\xa5\xcb\xb4\xf6\xcf\xd8\x71\x13\x18\xfe\x2e\x63\xc6\x66\x6a\
+\x6d\xcb\xc2\x5d\xbb\x39\x26\x09\x00\x10\x00\x04\x00\x01\xe0\x1e\
+\xef\xbe\xf7\x0f\xbd\xa7\x03\x0e\xe2\xe9\x80\xbf\x99\x30\x69\x9a\
+\xd6\xb6\xdc\xb8\x69\x33\xc7\x24\x01\x00\x02\x80\x00\x20\x00\xdc\
+\x74\x6b\xe0\x4b\x5f\x6b\xed\x9f\xee\xdd\x7b\x32\xfc\x5d\x66\xcc\
+\x9a\xa7\xb5\x2d\x57\xad\x5e\xc3\x31\x49\x00\x80\x00\x20\x00\x08\
+\x00\xf7\x50\x4f\xa1\xd3\xd9\x3f\xaf\xb7\x79\x9d\xe1\xff\x9f\xc7\
+\x02\x2f\xd2\xda\x96\xea\x69\x8d\x1c\x93\x04\x00\x08\x00\x02\x80\
+\x00\x70\x9b\xc8\xf0\x88\x5a\xef\x9f\xe8\xa8\x66\x0c\x7f\x97\x45\
+\xcb\x72\xb5\x8e\xf5\xd9\xb3\xe7\x70\x3c\x12\x00\x20\x00\x08\x00\
+\x02\xc0\x7d\xda\xb5\x7d\xbd\xd6\xfb\x27\xd0\xcf\x9f\xe1\xef\x92\
+\xb3\x7a\x9d\xd6\xb1\xae\x1e\xd2\xc4\xf1\x48\x00\x80\x00\x20\x00\
+\x08\x00\xb7\xe9\xd7\x57\xef\xfa\xf5\x3d\x25\x65\x04\x80\xc3\xda\
+\x8d\x5b\xf5\xd6\x84\x51\xa3\x39\x1e\x09\x00\x10\x00\x04\x00\x01\
+\x40\x00\x78\x9b\xfc\x82\x42\xad\xed\x98\x3e\x2c\x9d\xe3\x91\x00\
+\x00\x01\x40\x00\x10\x00\x7c\x05\xe0\x6d\xf2\xf2\xb7\x68\x1d\xeb\
+\x63\xc6\x8c\xe5\x78\x24\x00\x40\x00\x10\x00\x04\x00\x27\x01\xfa\
+\xda\x39\x00\x53\xa6\x4c\xe5\x78\x24\x00\x40\x00\x10\x00\x04\x00\
+\x97\x01\x7a\x9b\xc5\xcb\xf5\xae\x02\x98\x37\x6f\x3e\xc7\x24\x01\
+\x00\x02\x80\x00\x20\x00\xb8\x11\x90\xb7\x99\x9f\xbd\x58\x6b\x5b\
+\x2e\x5d\xba\x8c\x63\x92\x00\x00\x01\x40\x00\x10\x00\xdc\x0a\xd8\
+\xdb\xa8\x07\x23\xe9\x6c\xcb\xbc\xb5\xeb\x38\x26\x09\x00\x10\x00\
+\x04\x00\x01\xc0\xc3\x80\xbc\xcd\xe4\xa9\x33\xb4\xb6\xe5\xd6\x82\
+\x6d\x1c\x93\x04\x00\x08\x00\x02\x80\x00\x70\x0f\x1e\x07\x6c\xce\
+\xdb\x99\x13\xf5\x2e\xa7\xdc\x5b\xcc\x31\x49\x00\x80\x00\x20\x00\
+\x08\x00\xeb\x5d\xb9\x71\x53\xfc\x5f\x6b\xa4\xb5\x7f\x96\xac\x58\
+\xc5\xf0\x77\x19\x3e\x62\xb4\xd6\xb6\x2c\x3b\x5c\xce\x71\x49\x00\
+\x80\x00\x20\x00\x08\x00\xeb\x6d\xdd\xb6\x5d\x6b\xdf\xa8\x78\xd8\
+\xb5\xbf\x94\xe1\xef\xd2\xa7\x8f\xde\x0d\x95\x4e\xfc\xe3\x7d\x8e\
+\x4b\x02\x00\x04\x00\x01\x40\x00\x58\x6f\xd8\xd0\x61\x7a\x97\x00\
+\xb6\x6d\xc7\xe0\xaf\xa4\x4d\x52\x1b\xad\xed\x79\xf6\xf3\x73\x1c\
+\x97\x04\x00\x08\x00\x02\x80\x00\xb0\xd6\x37\xd7\xae\x4b\x48\x40\
+\xa0\xd6\xbe\x19\x97\x39\x91\xc1\x5f\x49\x58\x70\x88\xd6\xf6\xbc\
+\xf5\xe3\x3d\x8e\x4d\x02\x00\x04\x00\x01\x40\x00\x58\x6b\xfa\x74\
+\xbd\x33\xd6\x95\x0d\x5b\x76\x30\xf8\x5d\xd4\x57\x21\x3a\xdb\x32\
+\x2e\x26\x96\xe3\x92\x00\x00\x01\x40\x00\x10\x00\xd6\xfa\xfa\xea\
+\xb7\x12\xac\xf9\xee\xbf\x79\x54\x34\x83\xbf\x92\xd5\xeb\x36\x6a\
+\x6d\xcf\xbe\xbd\xfb\x70\x6c\x12\x00\x20\x00\x08\x00\x02\xc0\x5a\
+\xea\x9e\xf3\xba\xef\xfe\x07\x0d\x1a\xca\xe0\xaf\x64\xf6\xbc\x6c\
+\xad\xed\x39\x71\xe2\x24\x8e\x4d\x02\x00\x04\x00\x01\x40\x00\x58\
+\xe7\xd2\x95\xab\x12\xec\x1f\xa0\x1d\x00\x5c\xfe\xf7\xdf\x46\x8e\
+\x1a\xab\xb5\x3d\x57\xad\x5e\xc3\xf1\x49\x00\x80\x00\x20\x00\x08\
+\x00\x6b\x3c\x78\xfc\x8b\xa4\xbe\x95\xaa\x3d\xfc\x43\x02\x83\xa4\
+\xa4\xfc\x38\x83\xbf\x92\xde\xbd\xfb\x6a\x6d\xd3\x03\xa5\x65\x1c\
+\xa3\x04\x00\x08\x00\x02\x80\x00\xb0\xc6\x52\xcd\xdb\xfe\xfe\xa6\
+\x7f\xff\x54\x86\xfe\x13\xd4\x39\x11\x3a\xdb\xf4\xf3\x0b\x17\x39\
+\x46\x09\x00\x10\x00\x04\x00\x01\x60\x5e\xc5\xf1\x77\x25\xa0\x51\
+\x63\xed\xe1\xaf\x5e\x63\x6b\x61\x11\x43\xbf\x92\x6d\xbb\x8b\xb5\
+\xb7\xe9\x8f\x3f\x3f\xe4\x38\x25\x00\x40\x00\x10\x00\x04\x80\xf9\
+\x6b\xfe\x63\xa2\x9a\x19\x79\xf7\x9f\x3a\x60\x20\x43\xdf\xf0\x09\
+\x80\x49\x89\x2d\x39\x4e\x09\x00\x10\x00\x04\x00\x01\x60\xd6\xcd\
+\x5b\xb7\x25\xa5\x6b\x37\x23\xc3\x3f\xc8\xcf\x5f\xb6\xef\xd9\xc7\
+\xd0\x7f\xc2\x5b\x6f\xa5\x69\x6d\xd7\x21\x83\x87\x70\xac\x12\x00\
+\x20\x00\x08\x00\x02\xc0\xe0\xc3\x7e\xae\xdf\x90\xe4\xf6\x6f\x18\
+\x19\xfe\xca\xe0\x21\xc3\x18\xf8\x55\x68\xd1\x3c\x56\x6b\xbb\xe6\
+\xad\x5d\xc7\xf1\x4a\x00\x80\x00\x20\x00\x08\x00\x33\x2e\x5c\xfa\
+\x5a\x5a\x25\x24\x1a\x1b\xfe\xea\xc6\x41\x3b\x8b\x0f\x30\xf0\x9f\
+\x50\xb8\xb7\x44\x7b\xdb\x7e\xfc\xe9\x67\x1c\xb3\x04\x00\x08\x00\
+\x02\x80\x00\xd0\x77\xe6\x93\x4f\x25\xa6\x59\xb4\xb1\xe1\xaf\x64\
+\x0c\x1f\xc5\xc0\xaf\xc2\xbc\xac\x45\x5a\xdb\xb5\x59\x93\x48\xe7\
+\xe5\x99\x1c\xb7\x04\x00\x08\x00\x02\x80\x00\xa8\xb5\xbb\x3f\xfd\
+\xec\xbc\xd4\x4f\xf7\x21\x3f\x4f\x0a\x0b\x0a\x91\x3d\x25\x65\x0c\
+\xfc\x2a\xa4\xa6\x0e\xd4\xda\xb6\xea\x89\x8c\x1c\xbb\x04\x00\x08\
+\x00\x02\x80\x00\xa8\xb5\xa3\xef\x9e\x90\xb6\x49\xad\x8d\x0e\xfe\
+\xdf\xa8\x77\xb9\x0c\xfb\xdf\x3b\x58\x71\x42\x22\x42\xc3\xb5\xb6\
+\xed\xba\xf5\x1b\x38\x7e\x09\x00\x10\x00\x04\x00\x01\x50\x73\xe7\
+\x2f\x7e\x29\x63\x46\x8f\xb1\x64\xf0\x3b\xcf\x50\x1f\x9a\xce\xb0\
+\x7f\x8a\xc5\xcb\x57\x6a\x6f\xdf\xb3\x9f\x9f\xe3\x38\x26\x00\x40\
+\x00\x10\x00\x04\x40\xf5\x7c\x7b\xf3\x3b\x59\xbb\x6e\xbd\x74\xeb\
+\xdc\xc5\xb2\xc1\xaf\xb4\x6f\xf7\x86\xf3\x5d\x2e\xc3\xbe\x6a\xfd\
+\xfa\xbe\xa9\xb5\x7d\xa3\x9b\x46\xf1\xfd\x3f\x01\xc0\x4e\x20\x00\
+\x08\x00\x02\xe0\xf7\x6e\xdf\x7f\x20\xe7\x2e\x5c\x94\x8a\x63\xc7\
+\x65\xeb\xb6\xed\xb2\x78\xc9\x52\x49\x4b\x1d\x20\x81\x8d\xfd\x2c\
+\x1d\xfc\x4a\x54\x93\x48\xce\xfa\x7f\x86\xfd\x87\x8f\x49\x68\x60\
+\x90\xde\x89\x95\xe9\x19\xac\xa5\x04\x00\x3b\x81\x00\x20\x00\x9e\
+\x46\x0d\x3b\x75\x09\x9a\x2f\xb2\x7a\xc8\x3f\x6b\x9b\xaf\x5a\x9b\
+\xcf\xa0\x7f\x86\x05\x0b\x97\x68\x6f\x67\x3e\xdd\x22\x00\xd8\x09\
+\x04\x00\x01\x00\x5b\x99\x3c\x75\x26\x43\xfe\x39\xba\xa7\xf4\xd4\
+\x8e\xac\xab\x37\x6e\xb2\x96\x12\x00\xec\x04\x02\x80\x00\x80\x3d\
+\xa8\xcb\xda\x18\xf0\xcf\xb6\xf7\x60\xb9\xf3\xb6\xc8\x3a\xdb\x79\
+\x40\xea\x00\xd6\x51\x02\x80\x00\x20\x00\x08\x00\xd8\xc3\xf0\x91\
+\x63\xa4\xf4\xe8\x49\x86\xfc\x73\x8f\xe9\x19\xda\xdb\x7a\xe7\xee\
+\x3d\xac\xa3\x04\x00\x01\x40\x00\x10\x00\xf0\x2c\xf5\x38\xda\x69\
+\x33\xe6\x30\xdc\xab\x79\xed\x7f\xb4\xe6\x93\x15\xc3\x43\x42\xe5\
+\xd6\xbd\xfb\xac\xa3\x04\x00\x01\x40\x00\x10\x00\xf0\x1c\x75\xb2\
+\xe1\xa2\x65\xb9\x0c\x77\x37\x3d\xfa\x57\x19\x33\x66\x2c\x6b\x28\
+\x01\x40\x00\x10\x00\x04\x00\x3c\x27\x32\x3c\x42\xf2\xf2\xb7\x30\
+\xd8\xab\x49\x7d\x3d\x92\x18\xaf\xff\x80\xa5\x43\x47\x2a\x58\x43\
+\x09\x00\x02\x80\x00\x20\x00\xe0\x19\x71\xb1\x2d\x64\xeb\xce\x22\
+\x06\x7b\x0d\xa8\x4f\x4a\x74\xb7\xbb\x7a\x48\xd3\xfd\x47\x8f\x59\
+\x43\x09\x00\x02\x80\x00\x20\x00\xe0\xfe\xef\xfb\x07\x0f\x49\x97\
+\xa2\x83\x87\x19\xea\x35\xd4\xbe\x5d\x7b\xed\xed\x3f\x73\xe6\x2c\
+\xd6\x4f\x02\x80\x00\x20\x00\x08\x00\xb8\x57\x87\xe4\x8e\x92\x5f\
+\x50\xc8\x30\xaf\x85\x55\xeb\x36\x1a\xd9\x07\xa7\xcf\x7e\xc2\xfa\
+\x49\x00\x10\x00\x04\x00\x01\x00\xf7\x50\x1f\x3b\x67\x2d\x5a\xc6\
+\x20\xd7\xd0\xb1\x43\x27\xed\xfd\xd0\xaf\x4f\x5f\xd6\x4e\x02\x80\
+\x00\x20\x00\x08\x00\xb8\xe1\x0c\x7f\xff\x00\x19\x33\x36\x53\x4a\
+\x0e\x1f\x63\x88\x6b\xc8\x76\xc4\x93\x89\xfd\xa1\x9e\xe9\xc0\xda\
+\x49\x00\x10\x00\x04\x00\x01\x00\xcb\x24\xb4\x88\x77\x1e\x5f\xdb\
+\xf7\xec\x63\x80\xeb\x3e\xf4\xe7\xd0\x51\xed\xeb\xfe\x15\xf5\xe4\
+\x46\xd6\x4d\x02\x80\x00\x20\x00\x08\x00\x58\x72\x56\xff\xc8\x51\
+\x63\x65\xc3\x96\x1d\x0c\x6e\x83\xd4\x36\x35\xb1\x7f\xd4\x7a\xc1\
+\xba\x49\x00\x10\x00\x04\x00\x01\x00\x6d\xfe\xaf\x35\x92\x16\x31\
+\xb1\xce\xdb\xf7\xae\xdf\xbc\x8d\x61\x6d\x81\xad\x85\x45\xda\xf7\
+\xfc\x57\xda\xbf\xde\x4e\x1e\x3c\xfe\x85\x75\x93\x00\x20\x00\x08\
+\x00\xdf\x0a\x80\x99\x73\xe6\x4b\xf3\xa8\x68\xd4\x90\x3a\x71\x2f\
+\xa9\x65\x92\x74\xeb\xd6\x5d\x06\x0e\x1a\x22\xe3\x32\x27\xca\x9c\
+\x05\x0b\x25\x67\xcd\x7a\xe7\x60\x2a\x29\x3f\xce\x90\xb6\x58\xb7\
+\xae\x29\x46\x62\xad\x70\xd7\x6e\xd6\x4c\x02\x80\x00\x20\x00\x7c\
+\x2f\x00\x00\x6f\xb4\x78\x79\xae\x91\xe1\xdf\x2a\x21\x91\x1b\xff\
+\x10\x00\x04\x00\x01\x40\x00\x00\xde\x60\x4f\xc9\x21\x69\xd6\x34\
+\xca\x48\x00\x6c\xdc\xb4\x99\xf5\x92\x00\x20\x00\x08\x00\x02\x00\
+\xf0\x06\x29\x29\x3d\x8c\x0c\xff\xd6\x2d\x5b\xc9\xdd\x07\x3f\xb1\
+\x5e\x12\x00\x04\x00\x01\x40\x00\x00\x76\x37\x65\xda\x4c\x63\x27\
+\x6a\x96\x1d\x2e\x67\xad\x24\x00\x08\x00\x02\x80\x00\x00\xec\x4e\
+\x5d\x4d\x61\xe2\xac\x7f\x65\xc8\xe0\x21\xac\x93\x04\x00\x01\x40\
+\x00\x10\x00\x80\xdd\xed\x2b\xab\x90\xf8\x16\x71\x46\x86\x7f\x58\
+\x50\xb0\x7c\x79\xf9\x1b\xd6\x49\x02\x80\x00\x20\x00\x08\x00\xc0\
+\xee\xde\x7c\x73\x80\xb1\x8f\xfe\x97\x2e\x5b\xce\x1a\x49\x00\x10\
+\x00\x04\x00\x01\x00\xd8\xdd\xac\xb9\x0b\x8c\x0d\xff\xd6\xad\x92\
+\xe4\xee\x4f\x3f\xb3\x46\x12\x00\x04\x00\x01\x40\x00\x00\xf6\xbe\
+\xde\x7f\xa5\x04\x34\x6a\x6c\x2c\x00\x0e\x1d\xa9\x60\x7d\x24\x00\
+\x08\x00\x02\x80\x00\x00\xec\x6c\xcd\xfa\xcd\x12\x1c\x10\x68\x6c\
+\xf8\x0f\x1b\x3a\x8c\xb5\x91\x00\x20\x00\x08\x00\x02\x00\xb0\xb3\
+\x4d\xdb\x76\x49\x44\x68\xb8\xb1\xe1\xdf\x2c\xb2\xa9\x5c\xfe\xf6\
+\x1a\x6b\x23\x01\x40\x00\x10\x00\x04\x00\x60\x57\x3b\x8a\x4a\x8c\
+\x3c\xe2\xb7\xf2\x83\x99\xb8\xe6\x9f\x00\x20\x00\x08\x00\x02\x00\
+\xb0\xb1\xa2\x83\x87\x25\x31\x3e\xd1\xe8\x93\x19\xe7\xcd\x9b\xcf\
+\x9a\x48\x00\x10\x00\x04\x00\x01\x00\xd8\x76\xf8\x1f\x38\x2c\xaf\
+\xb7\x6d\x67\x74\xf8\xf7\x48\xe9\x2e\xf7\x1e\x3e\x62\x4d\x24\x00\
+\x08\x00\x02\x80\x00\x00\x6c\xf9\xb1\xff\x9e\xfd\x92\x18\x97\x60\
+\x74\xf8\x47\x45\x34\x91\xaf\xbe\xb9\xc2\x7a\x48\x00\x10\x00\x04\
+\x00\x01\x00\xd8\xd1\xc6\x82\x42\x89\x6e\xda\xcc\xe8\xf0\x57\x4a\
+\x0e\x96\xb2\x16\x12\x00\x04\x00\x01\x40\x00\x00\x76\xb4\x6a\x6d\
+\xbe\x84\x87\x84\x1a\x1f\xfe\xb3\x66\xcd\x66\x1d\x24\x00\x08\x00\
+\x02\x80\x00\x00\xec\xe8\x9d\x25\x2b\x24\xd8\x3f\xc0\xf8\xf0\x4f\
+\xe9\xda\x4d\x7e\xfc\xf9\x21\xeb\x20\x01\x40\x00\x10\x00\x04\x00\
+\x60\x37\xd3\x66\xcc\x31\x7a\x87\xbf\xdf\xb4\x4d\x6a\x2d\xd7\xbe\
+\xfb\x9e\x35\x90\x00\x20\x00\x08\x00\x02\x00\xb0\x93\xe2\xb2\x0a\
+\xe9\xdb\xb7\xbf\xf1\xc1\xaf\xb4\x68\x1e\xc3\x53\xfe\x08\x00\x02\
+\x00\x04\x00\x60\x37\xeb\x37\x6f\x93\x16\x31\xb1\x96\x0c\xff\xc8\
+\xb0\x70\xf9\xf8\xd3\xcf\x58\xfb\x08\x00\x02\x00\x04\x00\x60\x27\
+\x53\xa6\xcf\x92\x20\x3f\x7f\x4b\x86\x7f\x48\x40\xa0\x1c\x3f\xf9\
+\x1e\xeb\x1e\x01\x40\x00\x80\x00\x00\xec\x74\x67\xbf\x1e\x3d\x7a\
+\x59\x32\xf8\x15\x75\x1e\x41\xf1\xfe\x12\xd6\x3c\x02\x80\x00\x00\
+\x01\x00\xd8\xc5\x92\x15\xab\xa4\x79\x54\xb4\x65\xc3\x5f\xd9\xb8\
+\x69\x33\xeb\x1d\x01\x40\x00\x80\x00\x00\xec\x60\x4b\xe1\x1e\xe9\
+\xd6\xad\xbb\xa5\x83\x5f\x59\xbe\x22\x87\xb5\x8e\x00\x20\x00\x40\
+\x00\x00\x76\x38\xc3\x7f\xf8\x88\xd1\x12\x68\xd1\x77\xfd\x95\x3f\
+\xf6\xe7\x9d\x3f\x01\x40\x00\x80\x00\x00\x3c\xac\xf4\xe8\x49\x99\
+\xb3\x60\xa1\x44\x35\x69\x6a\xf9\xbb\x7e\x75\xc2\x1f\xdf\xf9\x13\
+\x00\x04\x00\x08\x00\xc0\xc3\x96\xe5\xae\x36\xfe\x04\xbf\x67\x5d\
+\xea\xc7\xd9\xfe\x04\x00\x01\x00\x02\x00\xf0\x90\x83\x15\x27\x64\
+\x7e\xf6\x62\x49\x6a\x99\xe4\x96\xc1\xff\xdb\x4d\x7e\xb8\xce\x9f\
+\x00\x20\x00\x40\x00\x00\x1e\x50\x72\xf8\x98\x4c\x9d\x31\x5b\x62\
+\xa3\x63\xdc\x36\xf8\x7f\xbb\xbd\x2f\x77\xf8\x23\x00\x08\x00\x10\
+\x00\x80\x9b\xed\xda\x57\x2a\x63\xc7\x4d\x90\xc8\xf0\x08\xb7\x0e\
+\xfe\xdf\x1e\xec\xc3\xbd\xfd\x09\x00\x02\x00\x04\x00\xe0\x26\x7b\
+\x0f\x96\xcb\xac\xb9\x59\xd2\xa9\x63\x67\x4b\x1e\xda\x53\x1d\xb3\
+\x67\xcf\xe1\xa9\x7e\x04\x00\x01\x00\x02\x00\xb0\xda\xfe\xc3\xc7\
+\x64\xc1\x3b\x4b\xa4\x7b\xf7\x9e\x96\xdd\xb6\xb7\x3a\x9a\x35\x89\
+\x94\x83\x65\x87\x58\xc7\x40\x00\x80\x00\x00\x2c\xbb\x69\xcf\x8e\
+\x3d\x32\x73\xf6\x7c\xe9\xd3\xa7\xbf\x84\x06\x05\x7b\x6c\xe8\xff\
+\xa6\x67\xf7\x1e\x72\xe9\xca\x55\xd6\x30\x10\x00\x20\x00\x00\x93\
+\xd7\xeb\xe7\x17\x14\x3a\x4f\xe4\xeb\xdd\xbb\xaf\x44\x39\xde\x69\
+\x7b\x7a\xe0\x57\xbe\xb9\x4f\x56\x56\xb6\xdc\x7f\xf4\x98\xf5\x0b\
+\x04\x00\x08\x00\xa0\xb6\x83\x7e\xfb\xee\x7d\xb2\x7c\x65\x9e\x4c\
+\x9b\x31\x47\x86\xa5\x0f\x97\x6e\x5d\x53\xa4\x49\x58\xb8\x6d\x06\
+\x7e\x65\x31\x51\xcd\xe4\xc8\xd1\x63\xac\x5b\x20\x00\x60\x8f\x00\
+\x48\x4b\x1b\xec\x7c\x7e\x39\x60\x07\xeb\x36\x16\xc8\xca\xbc\x0d\
+\xce\x07\xec\x64\xbd\xb3\xd4\x79\x82\x9e\x7a\xc4\x6e\xe6\x84\xc9\
+\x32\x6a\xf4\xdb\x32\x64\x68\xba\xa4\xa4\xf4\x90\x84\xb8\x04\x09\
+\xf2\x0f\xb0\xe5\xa0\xaf\xca\x88\xe1\x23\xe4\xca\x8d\x9b\xac\x59\
+\x20\x00\x60\x9f\x00\x00\x60\x9d\x76\x6d\xda\x4a\xc5\xf1\x77\x59\
+\xab\x40\x00\x80\x00\x00\x7c\x41\x58\x70\x88\xe4\xe4\xae\xe4\xf2\
+\x3e\x10\x00\x20\x00\x00\x5f\x91\x91\x9e\xc1\x19\xfe\x20\x00\x40\
+\x00\x00\xbe\x42\xdd\xca\x97\x93\xfc\x40\x00\x80\x00\x00\x7c\x44\
+\x1b\xc7\xe0\xdf\xb2\xb5\x80\x8f\xfb\x41\x00\x80\x00\x00\x7c\x41\
+\xa7\xe4\x0e\x52\x54\xbc\x8f\x6b\xfa\x41\x00\x80\x00\x00\x7c\x41\
+\xef\x5e\xbd\xe5\xd0\x91\x0a\xd6\x1f\x10\x00\x20\x00\x80\xba\xce\
+\xff\xb5\x46\x32\x68\xe0\x20\x79\xef\x83\x53\xac\x3b\xb0\x65\x00\
+\xfc\xb3\xb6\xff\xf3\xdf\x1a\x36\x64\x27\x10\x00\x00\x9e\xd0\x32\
+\x21\x51\xb2\xb3\x17\xca\xe7\x17\x2e\xb2\xde\xc0\x32\x6a\x06\x6b\
+\x0c\x7f\x35\xfb\xeb\xfd\x5c\xdb\x17\xf8\xcb\x4b\x2f\xb1\x13\x08\
+\x00\x00\xae\xa7\xf4\x4d\x99\x3c\x45\x4e\xbe\xff\x01\x6b\x0c\xdc\
+\x42\xcd\x60\x8d\x00\x50\xb3\xbf\xde\xcd\xda\xbe\xc0\x8b\x2f\xbe\
+\xc8\x4e\x20\x00\x00\x9f\x15\x1a\x18\x24\xc3\x33\x86\xcb\x81\xd2\
+\x32\xce\xe6\x87\xdb\xa9\x19\xac\x11\x00\x6a\xf6\xd7\xbb\xa8\xf3\
+\x1d\xc2\x9d\x07\x0f\xd8\x11\x04\x00\xe0\x3b\x1f\xef\xc7\x27\x48\
+\xe6\xb8\x4c\x29\xdc\xb5\x5b\xbe\xbb\x73\x97\xf5\x04\x1e\xa1\x66\
+\xaf\xe6\xf7\xff\x6a\xf6\xd7\x3b\xad\xf3\x22\x57\xae\xdf\x60\x67\
+\x10\x00\x40\x9d\x15\x1f\xdb\x42\xc6\x8c\x19\x2b\x5b\xb7\x6d\x97\
+\x8b\x5f\x5f\x66\xfd\x80\x2d\xa8\xd9\xab\x19\x00\x6a\xf6\xd7\xab\
+\xd0\x79\x91\xb3\xe7\xce\xb3\x33\x08\x00\xa0\xce\x7c\xa4\xff\xc6\
+\xeb\xed\x64\xd4\xc8\x51\xb2\x79\x6b\x81\x9c\xff\xf2\x2b\xd6\x0b\
+\xd8\x92\x9a\xbd\x9a\x01\xa0\x66\x7f\xbd\xbd\x3a\x2f\xb2\xbb\xb8\
+\x98\x9d\x41\x00\x00\x5e\x23\xb0\xb1\x9f\xb4\x6e\x95\x24\x03\x07\
+\xa4\xc9\xcc\x99\xb3\x64\xc3\xc6\x4d\x52\x71\xec\xb8\x7c\xf5\xcd\
+\x15\x79\xf0\xf8\x17\xd6\x07\x78\x05\x35\x7b\x35\x03\x40\xcd\xfe\
+\x7a\xb9\x3a\x2f\xb2\x20\x7b\x21\x3b\xc3\x0b\x9d\xfa\xe8\x8c\xf3\
+\x59\xe3\x40\x5d\xa0\xde\xb1\x4f\x9c\x38\x49\x66\xcf\x9e\x23\x8b\
+\x16\x2f\x91\x55\xab\xd7\xc8\xa6\xcd\x5b\x64\xd7\xee\x3d\xce\x13\
+\xf4\x8e\x9d\x38\x29\x1f\x9e\xf9\x58\xbe\xf8\xea\x92\xdc\x7b\xf8\
+\x88\x35\x00\x5e\x4f\xcd\x5e\xcd\x00\x50\xb3\xbf\xde\x48\x9d\x17\
+\x49\x1b\x34\x98\x9d\x01\x00\x80\x1b\xa9\xd9\xab\x19\x00\x6a\xf6\
+\xd7\x6b\xa3\xf3\x22\xf1\x09\x89\xec\x0c\x00\x00\xdc\x48\xcd\x5e\
+\xcd\x00\x50\xb3\xbf\xde\x5f\x75\x5e\xa4\x41\x83\x06\xec\x0c\x00\
+\x00\xdc\x48\xcd\x5e\xcd\x00\xf8\x6b\x3d\x11\xe7\xed\x80\x7f\xd5\
+\x79\x21\xce\x94\x05\x00\xc0\x3d\xd4\xcc\xd5\x1c\xfe\xbf\x3a\x67\
+\xbf\x2b\x00\x2e\xe8\xbc\xd8\xaa\xbc\xb5\xec\x14\x00\x00\xdc\x40\
+\xcd\x5c\xcd\x00\xb8\x50\x39\x00\x8a\x74\x5e\xac\x77\xdf\x7e\xec\
+\x14\x00\x00\xdc\x40\xcd\x5c\xcd\x00\x28\xaa\x1c\x00\x53\x74\x5e\
+\xec\xe5\x97\x5f\x66\xa7\x00\x00\xe0\x06\x6a\xe6\x6a\x06\xc0\x94\
+\xca\x01\x10\xa5\xf9\x62\x72\xe6\xd3\xcf\xd8\x31\x00\x00\x58\x48\
+\xcd\x5a\xdd\x79\xad\x66\x7e\xe5\x00\x78\xc1\xe1\x17\x6e\x08\x04\
+\x00\x80\x7d\x19\xb8\x01\x90\x9a\xf5\x2f\xfc\x27\x00\x5c\x11\x70\
+\x40\xe7\x45\xc3\xc2\x23\xd8\x39\x00\x00\x58\x48\xcd\x5a\xcd\x00\
+\x28\xf9\xcf\xdc\xaf\x14\x00\xa3\x75\x3f\x56\x38\x75\xe6\x63\x76\
+\x10\x00\x00\x16\x50\x33\xd6\xc0\xc7\xff\xa3\xab\x0a\x80\x40\xdd\
+\x17\x1e\x3b\x2e\x93\x9d\x04\x00\x80\x05\xd4\x8c\x35\x10\x00\x81\
+\xbf\x0b\x00\x57\x04\xdc\xd5\xba\x1a\xe0\x95\x57\xe4\xfe\xa3\xc7\
+\xec\x28\x00\x00\x0c\x52\xb3\x55\xcd\x58\xcd\xe1\x7f\xf7\xbf\x66\
+\xfe\x13\x01\xb0\x5a\xb7\x2e\x76\x16\x15\xb1\xb3\x00\x00\x30\x48\
+\xcd\x56\x03\xef\xfe\x57\x3f\x2b\x00\xa2\x75\x7f\x40\xf3\x98\x18\
+\x76\x16\x00\x00\x06\xa9\xd9\x6a\x20\x00\xa2\x9f\x1a\x00\xae\x08\
+\xb8\xaa\xfb\x43\x4a\xca\x0e\xb1\xc3\x00\x00\x30\x40\xcd\x54\x03\
+\xc3\xff\xea\xef\xe6\x7d\x15\x01\x30\x53\xf7\x07\x25\xb6\x6c\xc9\
+\x4e\x03\x00\xc0\x00\x35\x53\x0d\x04\xc0\xcc\xea\x04\xc0\xab\x0e\
+\xff\xd2\xfd\x61\xe5\xc7\x8e\xb3\xe3\x00\x00\xd0\xa0\x66\xa9\x81\
+\xe1\xaf\x66\xfa\xab\xcf\x0d\x00\x57\x04\x9c\xd2\xfd\x81\x71\xf1\
+\x09\xec\x3c\x00\x00\x34\xa8\x59\x6a\x20\x00\x4e\x55\x39\xeb\x9f\
+\x12\x00\x03\x0d\xfc\x40\x59\xbb\x21\x9f\x1d\x08\x00\x40\x2d\xa8\
+\x19\x6a\x62\x16\xab\x99\x5e\x93\x00\xf8\x93\xc3\x2d\xdd\x1f\xda\
+\xa0\x41\x03\xb9\xfe\xc3\x2d\x76\x24\x00\x00\x35\xa0\x66\xa7\x9a\
+\xa1\x06\x86\xbf\x9a\xe5\x7f\xaa\x76\x00\xb8\x22\x60\xa4\x89\xf2\
+\x18\x96\x91\xc1\xce\x04\x00\xa0\x06\xd4\xec\x34\xf4\xee\x7f\xe4\
+\x53\xe7\xfc\x33\x02\xa0\xbe\xc3\x3d\xdd\x1f\xfe\xc7\x3f\xfe\x51\
+\x4e\x7e\x70\x8a\x1d\x0a\x00\x40\x35\xa8\x99\xa9\x66\xa7\x81\xe1\
+\xaf\x66\x78\xfd\x1a\x07\x80\x2b\x02\xc6\x9b\x28\x90\xc6\x7e\x7e\
+\xf2\xdd\x9d\xbb\xec\x58\x00\x00\x9e\x41\xcd\x4a\x35\x33\x0d\xbd\
+\xfb\x1f\xff\xcc\x19\xff\x9c\x00\xf8\xb3\xc3\x43\x13\xbf\x48\xaf\
+\xde\x7d\xd8\xb9\x00\x00\x3c\x83\x9a\x95\x86\x86\xbf\x9a\xdd\x7f\
+\xae\x75\x00\xb8\x22\x60\xaa\xa1\x5f\x46\x56\xac\x5c\xc9\x0e\x06\
+\x00\xa0\x0a\x6a\x46\x9a\x9a\xb7\x6a\x76\x3f\x77\xbe\x57\x23\x00\
+\xd4\xb9\x00\x37\x4c\xfc\x42\xf5\xeb\xd7\x97\xf7\x4f\x7f\xc4\x8e\
+\x06\x00\xa0\x12\x35\x1b\xd5\x8c\x34\x34\xfc\x6f\x3c\xeb\xbb\xff\
+\x6a\x07\x80\x2b\x02\x92\x4d\x55\x49\xc3\xbf\xff\x5d\xbe\xbc\xfc\
+\x0d\x3b\x1c\x00\x00\x07\x35\x13\xd5\x6c\x34\xf8\xee\x3f\xb9\x5a\
+\xb3\xbd\x3a\xff\x91\x2b\x02\x4a\x4c\xfd\x72\x41\xc1\xc1\x72\xed\
+\xbb\xef\xd9\xf1\x00\x00\x9f\xa6\x66\xa1\x9a\x89\x06\x87\x7f\x49\
+\xb5\xe7\x7a\x0d\x02\xa0\xa1\xc3\xaf\xa6\x7e\xc9\x98\xd8\x58\xb9\
+\x75\xef\x3e\x07\x00\x00\xc0\x27\xa9\x19\xa8\x66\xa1\xc1\xe1\xaf\
+\x66\x74\x43\xe3\x01\xe0\x8a\x80\x29\x06\x7f\x51\x69\xff\x46\xb2\
+\xfc\xf8\xf3\x43\x0e\x04\x00\x80\x4f\x51\xb3\x4f\xcd\x40\x93\x33\
+\x55\xcd\xe8\x1a\xcd\xf4\x1a\x06\x80\xba\x45\xf0\x25\xd3\x11\xc0\
+\x27\x01\x00\x00\x5f\x7a\xe7\x6f\xc1\xf0\xbf\xf4\xb4\x5b\xfe\x1a\
+\x09\x00\x57\x04\x04\x3b\xfc\x8f\xc9\x5f\x5c\x7d\x04\xc2\x39\x01\
+\x00\x00\x5f\xf8\xce\xdf\xf0\xc7\xfe\xe2\x9a\xc9\xc1\x35\x9e\xe7\
+\x35\xfd\x1f\x5c\x11\x90\x66\xf8\x97\x77\x9e\x04\xc1\xd5\x01\x00\
+\x80\xba\x7c\xb6\xbf\xe1\x13\xfe\x7e\x93\x56\xab\x59\x5e\x9b\xff\
+\xc9\x15\x01\x05\xa6\xff\x12\xea\x32\x08\xee\x13\x00\x00\xa8\x8b\
+\xd7\xf9\x1b\xbe\xd4\xef\x37\x05\xb5\x9e\xe3\x1a\x01\xa0\x6e\x13\
+\x7c\xd9\xf4\x5f\x46\xdd\x08\x81\x3b\x06\x02\x00\xea\x0a\x35\xd3\
+\x0c\xde\xe4\xa7\xb2\xcb\xcf\xbb\xdd\xaf\x25\x01\xe0\x8a\x80\x10\
+\xd3\xe7\x03\x54\x7e\x76\x00\x0f\x10\x02\x00\x78\x2b\x35\xc3\x0c\
+\xde\xdb\xbf\xaa\xef\xfd\x43\xb4\x66\xb8\xce\xff\xec\x8a\x80\x14\
+\x87\xff\xb5\xe2\x2f\xa8\x9e\x88\xc4\xa3\x84\x01\x00\xde\x46\xcd\
+\x2e\x83\x4f\xf5\x7b\x92\x9a\xb9\x29\xda\xf3\x5b\xf7\x05\x5c\x11\
+\x30\xd4\xa2\xbf\xa4\xf3\x99\xc8\xc3\x32\x32\xe4\xfa\x0f\xb7\x38\
+\xa8\x00\x00\xb6\xa6\x66\x95\x9a\x59\x6a\x76\x59\x35\x17\xd5\xcc\
+\x35\x32\xbb\x4d\xbc\x88\x2b\x02\xa6\x59\xf8\x97\x95\x06\x0d\x1a\
+\xc8\xda\x0d\xf9\x1c\x60\x00\x00\x5b\x52\x33\x4a\xcd\x2a\x2b\x67\
+\xa1\x9a\xb5\xc6\xe6\xb6\xa9\x17\x72\x45\x40\x8e\xc5\x7f\x71\x89\
+\x8b\x4f\x90\xf2\x63\xc7\x39\xd8\x00\x00\xb6\xa0\x66\x92\x9a\x4d\
+\x56\xcf\x3f\x35\x63\x8d\xce\x6c\xc3\x01\xf0\x07\x87\x42\x37\x6c\
+\x04\x49\x6c\xd9\x52\x4a\xca\x0e\x71\xf0\x01\x00\x3c\x42\xcd\x20\
+\x35\x8b\xdc\x31\xf3\x5c\xb3\xf5\x0f\xb6\x0d\x80\x4a\xb7\x0b\x2e\
+\x74\xd3\x06\x91\xe6\x31\x31\xb2\xb3\xa8\x48\xee\x3f\x7a\xcc\x01\
+\x09\x00\xb0\x94\x9a\x35\x6a\xe6\xa8\xd9\xe3\xae\x39\xe7\x9a\xa9\
+\x7f\x32\x3e\xaf\x4d\xbf\x60\xa5\x4f\x02\x72\xdc\xb8\x71\xe4\xe5\
+\x57\x5e\x91\xb1\xe3\x32\xe5\xd4\x99\x8f\x39\x48\x01\x00\x46\xa9\
+\xd9\xa2\x66\x8c\x9a\x35\xee\x9c\x6d\xae\x59\xfa\x07\x4b\x66\xb5\
+\x15\x2f\xea\xae\x13\x03\x9f\x26\x2c\x3c\x42\x16\x64\x2f\x94\x33\
+\x9f\x7e\xc6\x81\x0b\x00\xa8\x15\x35\x43\xd4\x2c\x51\x33\xc5\x13\
+\xb3\xcc\xe4\x09\x7f\x6e\x0f\x80\x4a\x97\x08\xfe\xaf\x87\x36\x9e\
+\xbc\xfc\xf2\xcb\xd2\xbb\x6f\x3f\x59\x95\xb7\x56\xce\x7f\xf9\x15\
+\x07\x35\x00\xa0\x4a\x6a\x46\xa8\x59\xa1\x66\x86\x9a\x1d\x9e\x9a\
+\x5b\xae\x99\x39\xd4\xf2\xf9\x6c\xf5\x0f\xa8\x74\xb3\xa0\xff\xf1\
+\xe0\xc6\xfc\xaf\xcb\x09\xe3\x13\x12\x25\x6d\xd0\x60\x67\xd9\xed\
+\x2e\x2e\x96\xb3\xe7\xce\xcb\x95\xeb\x37\xe4\xce\x83\x07\xfc\x23\
+\x00\x80\x3a\x4a\xad\xf1\x6a\xad\x57\x6b\xbe\x5a\xfb\xd5\x0c\x50\
+\xb3\x40\xcd\x04\x37\x5c\xbe\x57\x93\x3b\xfc\xa5\xb8\x65\x36\xbb\
+\xe3\x87\x54\xba\x6d\xf0\x65\x9b\x6c\xe0\xa7\x7a\xf1\xc5\x17\xe5\
+\x2f\x2f\xbd\x24\x7f\x6b\xd8\x50\xfc\xfc\xfd\x01\x00\x5e\x4c\xad\
+\xe5\x6a\x4d\x57\x6b\xbb\xdd\xe7\x8f\x6b\x46\x86\xb8\x6d\x2e\xbb\
+\xeb\x07\x55\x7a\x80\x50\x81\x17\xec\x04\x00\x00\xdc\xa9\x40\xe7\
+\xc1\x3e\xb6\x0f\x80\x4a\x21\x90\x66\x97\xaf\x04\x00\x00\xf0\xf0\
+\x47\xfe\x69\x1e\x99\xc5\x9e\xf8\xa1\xae\x08\x08\x76\xb8\xc4\xce\
+\x07\x00\xf8\x28\x35\x03\x83\x3d\x36\x87\x3d\xf5\x83\x2b\xdd\x34\
+\x68\x8a\xc3\xaf\x1c\x08\x00\x00\x1f\xf1\xab\x6b\xf6\xfd\xc9\xa3\
+\x33\xd8\x93\x3f\xbc\x52\x08\x34\x74\x28\xe1\xa0\x00\x00\xd4\x71\
+\x6a\xd6\x35\xb4\xc5\xec\xb5\xc3\x2f\x51\x29\x04\x92\x1d\x6e\x70\
+\x80\x00\x00\xea\x18\x35\xdb\x92\x6d\x35\x73\xed\xf4\xcb\xb8\x22\
+\xa0\xbe\xc3\x54\x87\x87\x1c\x30\x00\x00\x2f\xf7\xd0\x35\xd3\xea\
+\xdb\x6e\xde\xda\xed\x17\x7a\xe2\x92\xc1\xf1\x0e\xf7\x38\x80\x00\
+\x00\x5e\xe6\x9e\x6b\x86\xfd\xd9\xb6\x73\xd6\xae\xbf\xd8\x13\x9f\
+\x08\x8c\x74\xb8\xc5\x01\x05\x00\xb0\xb9\x5b\xae\x99\x55\xdf\xf6\
+\xf3\xd5\xee\xbf\xe0\x13\x57\x0c\x0c\x74\x38\xe5\xf0\x2f\x0e\x32\
+\x00\x80\x4d\xfc\xcb\x35\x9b\x06\x7a\xfa\xcc\xfe\x3a\x19\x00\x4f\
+\xc4\xc0\xab\x0e\x33\x1d\xae\x72\xe0\x01\x00\x3c\xe4\xaa\x6b\x16\
+\xbd\xea\x95\xb3\xd4\x1b\x7f\xe9\x27\x62\x20\xda\x61\xb5\xc3\x5d\
+\x0e\x46\x00\x80\xc5\xee\xba\x66\x4e\xb4\xd7\xcf\x4f\x6f\xff\x0b\
+\x3c\x11\x03\x81\x0e\xa3\x5d\xd7\x59\xfe\xc2\x81\x0a\x00\xd0\xf4\
+\x8b\x6b\xa6\xa8\xd9\x12\x58\xa7\x66\x66\x5d\xfa\xcb\x3c\x11\x03\
+\x2f\x38\x44\xb9\xee\xb6\x54\xe4\x70\xa1\x1e\x77\x1c\x04\x00\x3c\
+\xdd\xaf\xae\x59\x51\xe4\x9a\x1d\x6a\x86\xbc\x50\x67\xe7\x64\x5d\
+\xfd\x8b\x3d\x23\x0c\xfe\xea\xd0\xc6\x75\x96\x66\xae\xc3\x5e\x87\
+\x0a\x87\xd3\x0e\x17\x1d\x6e\x3a\xfc\xec\xf0\x4f\xfe\x31\x00\x80\
+\xd7\xfb\xa7\x6b\x4d\xbf\xe9\x5a\xe3\x4f\xbb\xd6\xfc\xbd\xae\x19\
+\x30\xd2\x35\x13\xfe\xea\x6b\xf3\xf0\xff\x07\x34\x34\xbf\x85\xcb\
+\x8a\x7d\x9d\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x06\xd5\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x03\x00\x00\x00\xc3\xa6\x24\xc8\
+\x00\x00\x00\x03\x73\x42\x49\x54\x08\x08\x08\xdb\xe1\x4f\xe0\x00\
+\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\x95\x00\x00\x0e\x95\x01\
+\xf1\x59\xb9\x5c\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\
+\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\x70\
+\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\xdb\x50\x4c\x54\
+\x45\xff\xff\xff\x00\x00\x00\x00\x00\x00\x02\x02\x02\x06\x06\x06\
+\x07\x07\x07\x0e\x0e\x0e\x15\x15\x15\x16\x16\x16\x1b\x1b\x1b\x1d\
+\x1d\x1d\x1e\x1e\x1e\x1f\x1f\x1f\x24\x24\x24\x2b\x2b\x2b\x2d\x2d\
+\x2d\x34\x34\x34\x3c\x3c\x3c\x41\x41\x41\x43\x43\x43\x4f\x4f\x4f\
+\x53\x53\x53\x55\x55\x55\x5a\x5a\x5a\x5f\x5f\x5f\x62\x62\x62\x63\
+\x63\x63\x69\x69\x69\x71\x71\x71\x75\x75\x75\x77\x77\x77\x79\x79\
+\x79\x7a\x7a\x7a\x88\x88\x88\x8f\x8f\x8f\x93\x93\x93\x99\x99\x99\
+\x9e\x9e\x9e\xa6\xa6\xa6\xae\xae\xae\xb2\xb2\xb2\xb5\xb5\xb5\xb6\
+\xb6\xb6\xb7\xb7\xb7\xbd\xbd\xbd\xc1\xc1\xc1\xc3\xc3\xc3\xc4\xc4\
+\xc4\xc9\xc9\xc9\xca\xca\xca\xcc\xcc\xcc\xd4\xd4\xd4\xd5\xd5\xd5\
+\xd6\xd6\xd6\xd7\xd7\xd7\xd9\xd9\xd9\xda\xda\xda\xdb\xdb\xdb\xdc\
+\xdc\xdc\xdd\xdd\xdd\xdf\xdf\xdf\xe0\xe0\xe0\xe2\xe2\xe2\xe3\xe3\
+\xe3\xe9\xe9\xe9\xea\xea\xea\xeb\xeb\xeb\xec\xec\xec\xed\xed\xed\
+\xef\xef\xef\xf0\xf0\xf0\xf1\xf1\xf1\xf2\xf2\xf2\xdb\x70\xeb\x53\
+\x00\x00\x00\x02\x74\x52\x4e\x53\x00\x40\x00\x4f\x8c\xa8\x00\x00\
+\x05\x5e\x49\x44\x41\x54\x78\xda\xed\xdd\xdd\x4b\xd3\x51\x18\xc0\
+\x71\xa7\xae\xcd\x97\x99\x4a\x1a\x6a\x64\x44\x2f\x14\x48\x74\x11\
+\xe4\x8d\xfe\xe5\x45\x77\xe5\x55\x85\x17\x85\x15\x48\x6f\x1a\x3a\
+\xf3\xdd\x9a\x53\xf3\xd2\x9d\xe5\x9c\xb9\x9d\xce\xdc\xe7\x73\xfb\
+\x1c\x74\xdb\xf3\x85\x23\x38\xf8\x75\x76\x5c\x4c\xa6\x93\xff\x2a\
+\x73\xc1\x05\x76\x76\xd0\xd6\x04\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\xa8\x5b\xb6\
+\x40\x53\x65\x13\x0f\x60\x64\x9a\xa6\x1a\x71\x05\x20\x00\x04\x80\
+\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\x01\x20\x00\x04\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\
+\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\
+\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\
+\x00\x08\x00\x01\x20\x00\x04\x40\xbb\x04\x50\x5c\x6a\x94\x7d\xab\
+\x6c\xc5\x00\x3e\xcf\x37\xca\xba\x55\xba\x02\x10\x00\x02\x40\x00\
+\x08\xa0\x1e\xdf\x5f\xc4\x52\x14\x40\x8a\x0e\x4b\xb1\x1c\x0a\x00\
+\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\xb4\x7b\x00\xfd\x23\
+\x35\xf4\x04\x87\x87\xcf\x73\x98\x96\x08\xe0\xee\xe3\x1a\x7a\x83\
+\xc3\x93\xb5\x0e\xf7\x5b\xa5\x2b\x00\x01\x20\x00\x04\x50\xef\x7b\
+\xcf\xc7\xd2\x25\x80\x14\x8d\xcf\xc4\x32\x2c\x00\x04\x80\x00\x10\
+\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\
+\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\
+\x01\x20\x00\x04\xd0\x30\xcb\xaf\xd2\xf3\x55\x00\xf1\x94\x37\xd3\
+\xb3\x2f\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\
+\x04\x80\x00\x10\x00\x02\x40\x00\x5c\x86\x00\xde\x3c\xab\x61\x2d\
+\x38\xfc\xb6\xd6\xe1\xd5\x7f\xf8\xed\x13\xb3\xe9\x99\x6c\xaf\x00\
+\x8e\x0e\x6a\x38\x0a\x0e\x1f\x9e\xe7\x70\x3d\x32\xb9\xf4\x74\xb6\
+\x57\x00\xf8\x1b\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\x01\x20\x00\x04\xc0\x25\x0e\x20\x57\x68\x94\x6e\xab\x6c\
+\xc5\x00\x1e\x4e\x37\xca\x90\x55\xba\x02\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\
+\x00\x04\x80\x00\x10\x00\x02\x10\x00\x02\x40\x00\x08\x00\x01\x20\
+\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\
+\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\x08\xe0\x0c\xc5\xb9\xa6\x7a\x6f\xa9\x89\x07\x70\xb0\
+\xd1\x54\x3b\x96\xea\x0a\x40\x00\x08\x00\x01\xd4\xb4\xf6\x2e\x96\
+\x3d\x01\xa4\x68\xf7\x4b\x2c\xdb\x02\x40\x00\x08\x00\x01\x20\x00\
+\x04\x80\x00\x10\x00\x02\xa0\xfd\x02\x18\x99\xad\x32\x18\x1c\x79\
+\x3a\x7b\x9a\xd1\xe0\xe4\x83\xaa\x13\x8f\x2c\x35\xf1\x00\x32\xb9\
+\x2a\x99\xe0\x48\x36\x77\x9a\xcc\x99\x3f\xac\xdb\x52\x5d\x01\x08\
+\x00\x01\x20\x80\x9a\x86\xef\xc4\x52\x10\x40\x8a\x7a\x6f\xc7\x92\
+\x17\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x40\x23\xed\x7c\x4a\xcf\x86\x00\
+\xe2\xf9\x99\x60\x00\x6b\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\
+\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x40\xcb\x06\xb0\
+\x35\x5f\x25\x7c\xb2\xe6\x87\xf9\xd3\x84\xcf\x06\xff\x51\x75\xe2\
+\x63\xdd\x2f\xa4\x30\x99\x9e\x42\x1b\x04\xb0\xb7\x54\xe5\x57\x70\
+\x64\x79\xe9\x34\xe1\x33\x38\x8b\x55\x27\xea\xff\x4a\xc5\xd5\xfb\
+\xe9\xb9\xe6\x0a\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x40\xcb\x06\x30\xd0\xdc\x7f\
+\xa8\xde\xb0\xd4\xc4\x03\xc8\x37\xf7\x2b\x15\xd7\x2d\xd5\x15\x80\
+\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x08\xc0\x47\x20\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\
+\x20\x80\x3a\xad\xbf\x8e\xa5\x68\xbf\x29\x06\x50\x5a\x89\xa5\x64\
+\xbf\xae\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x80\
+\x63\xe5\x8d\x58\x0e\x04\x90\xa2\xe5\xb9\x58\xd6\x04\x80\x00\x10\
+\x00\x02\xa0\xed\x03\x18\x9c\x3a\x29\x18\xf6\x4d\x55\x9a\x08\xe6\
+\x13\xc1\xbc\x3f\x98\x57\x0c\x87\xec\x37\xc5\x00\xae\x8c\x9d\x14\
+\xbe\x9e\xb1\x4a\xd9\x60\x9e\x0d\xe6\xe1\xeb\xaf\x18\xe6\xed\xd7\
+\x15\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x70\xec\
+\xca\x50\x2c\x39\x01\xa4\x68\xf4\x49\x2c\x03\x02\x40\x00\x08\x00\
+\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\
+\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\
+\x10\x00\x02\x40\x00\x0d\xf3\xed\x79\x7a\x16\x05\x10\xcf\x51\x39\
+\x3d\x47\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x97\
+\x28\x80\xbd\x85\x93\x82\x61\x69\xa1\xd2\x76\x30\xdf\x0e\xe6\xe5\
+\x60\x5e\x31\xdc\xb1\xdf\x14\x03\xd8\x5a\x3c\x29\x18\xfe\x5e\xac\
+\xb4\x1a\xcc\x57\x83\xf9\x6e\x30\xaf\x18\x6e\xda\xaf\x2b\x00\x01\
+\x20\x00\x04\xf0\x97\xf7\x9e\x4f\x4f\x97\x00\xe2\x19\x9f\x49\xcf\
+\x4d\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x70\
+\x59\x02\x28\xdc\x8a\x65\xc0\x7e\x53\x0c\xa0\xe7\x5e\x2c\x7d\xf6\
+\xeb\x0a\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\
+\x00\x08\x00\x01\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\
+\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\
+\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\
+\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x48\x35\x80\x95\x97\x34\xd5\x4a\xe2\
+\x01\xec\x6f\xd1\x54\xfb\xae\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\xd4\xe5\x0f\
+\xde\x38\x6f\xb7\xfe\x11\x3c\x5f\x00\x00\x00\x00\x49\x45\x4e\x44\
+\xae\x42\x60\x82\
+\x00\x00\x07\xf8\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x03\x00\x00\x00\xc3\xa6\x24\xc8\
+\x00\x00\x00\x03\x73\x42\x49\x54\x08\x08\x08\xdb\xe1\x4f\xe0\x00\
+\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0f\x93\x00\x00\x0f\x93\x01\
+\xd6\xef\x9c\x44\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\
+\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\x70\
+\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x01\x35\x50\x4c\x54\
+\x45\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x02\
+\x02\x02\x04\x04\x04\x05\x06\x05\x05\x06\x06\x06\x06\x06\x07\x07\
+\x07\x08\x08\x08\x0a\x0a\x0a\x0a\x0b\x0b\x0b\x0b\x0b\x0d\x0d\x0d\
+\x0e\x0e\x0e\x10\x10\x10\x11\x11\x11\x13\x13\x13\x15\x15\x16\x15\
+\x16\x17\x16\x16\x16\x1c\x1c\x1c\x1c\x1d\x1c\x1d\x1d\x1d\x21\x22\
+\x23\x24\x24\x24\x25\x25\x25\x26\x27\x28\x2c\x2c\x2c\x2e\x2f\x2e\
+\x31\x31\x31\x33\x33\x33\x34\x34\x34\x34\x35\x34\x37\x38\x37\x3c\
+\x3c\x3c\x3c\x3d\x3c\x3d\x3e\x3d\x43\x43\x43\x43\x44\x43\x49\x4a\
+\x49\x4e\x51\x54\x4f\x50\x4f\x53\x53\x53\x54\x54\x54\x54\x55\x54\
+\x56\x57\x56\x57\x58\x57\x5a\x5a\x5a\x5a\x5b\x5a\x5c\x5d\x5c\x5d\
+\x5e\x5d\x5d\x60\x63\x64\x64\x64\x6e\x73\x76\x71\x71\x71\x7c\x7c\
+\x7c\x80\x80\x80\x83\x88\x8c\x85\x85\x85\x94\x99\x9e\x94\x9a\x9e\
+\x99\x9f\xa4\x9e\x9e\x9e\xa6\xa6\xa6\xa9\xa9\xa9\xaa\xb0\xb5\xae\
+\xae\xae\xaf\xb6\xbb\xbd\xbd\xbd\xbf\xbf\xbf\xc3\xc3\xc3\xd0\xd0\
+\xd0\xdc\xdc\xdc\xe3\xe3\xe3\xe7\xe7\xe7\xea\xea\xea\xed\xed\xed\
+\xf1\xf1\xf1\xf2\xf2\xf2\xb4\x1b\x1c\xe6\x00\x00\x00\x18\x74\x52\
+\x4e\x53\x00\x01\x05\x0b\x13\x1e\x2b\x3a\x3b\x4c\x60\x76\x77\x8d\
+\x8e\xa3\xa4\xb7\xc8\xd7\xe4\xee\xf6\xfb\x96\x14\x19\x9a\x00\x00\
+\x06\x11\x49\x44\x41\x54\x78\xda\xed\xdc\xdd\x6b\x1c\x55\x00\xc6\
+\xe1\xec\x47\x36\xd9\xdd\x74\x57\xab\x36\xa9\x5a\x88\xb6\x20\x7a\
+\xe1\x9d\x58\x41\xef\x04\xf5\x0f\x17\xea\x85\x68\x11\xc5\x80\x15\
+\x2a\x22\x69\x4d\xfd\xc0\x86\x56\xd2\x34\x22\x5e\x39\xbb\x27\x9d\
+\x33\x33\xd9\xee\x39\xe7\x79\x6e\x17\x26\xb3\x33\xbf\x70\xc8\x7b\
+\x91\xfe\xc6\xbf\x26\x7b\xa4\xe5\xf2\x70\xa3\x1b\xfd\x0d\x52\x34\
+\x9a\x6f\x0a\xa0\x68\x9b\xf3\x91\x00\x8a\x36\x9c\x6f\x0b\xa0\x68\
+\x83\xd9\x58\x00\x45\xeb\xcf\x26\x02\x28\x5a\x6f\xb6\x23\x80\xb2\
+\xed\xcc\x7a\x02\x28\xda\x64\xde\x17\x40\xd1\xb6\xe7\x03\x01\x14\
+\x6d\x6b\x3e\x14\x40\xd1\xda\x8d\x82\x02\x48\x5f\xab\x51\x50\x00\
+\x19\x18\xce\xb7\x04\x50\xb4\xc1\x7c\x2c\x80\xa2\x35\x1f\x05\x03\
+\x01\x0c\xa7\xd1\x16\x16\x89\x97\xaf\xc4\x7a\xa1\x7a\x89\x9d\x2b\
+\x45\x58\x38\xc2\xc7\xe1\xc7\x1c\xf8\x55\x6f\x3c\x0a\x06\x02\xd8\
+\x7b\x2b\xda\xc2\x0d\xbc\x7f\x33\xd6\xbb\xd5\x4b\xbc\x73\xb3\x08\
+\x57\xab\xdf\xfb\x7a\xf8\x31\xbf\xfd\x5a\xe0\x4d\x36\x1c\x05\x1d\
+\x01\xa9\xd9\xdd\x0f\x7c\xd0\x6c\x14\x14\x40\x72\x2e\x5f\x0f\xbc\
+\xb4\x46\xa3\xa0\x00\xd2\x33\xbf\x11\x78\xd1\x4d\x46\x41\x01\x24\
+\x68\xe7\x46\xe0\xef\xfe\x06\xa3\xa0\x00\x52\x34\x7d\x73\xba\xfc\
+\x83\xf8\x51\x50\x00\x49\x1a\xef\xcf\x02\x7f\xbf\xc7\x8e\x82\x02\
+\x48\xd3\xd6\xfe\x4b\xcb\x3f\x88\x1d\x05\x05\x90\xa8\xe1\xb5\x57\
+\x02\x6f\x34\x6e\x14\x14\x40\xaa\xfa\xaf\xef\x2d\xff\xa0\x37\x9b\
+\x0a\xa0\x04\xbd\x57\x43\xa3\xe0\xa5\x88\x51\x50\x00\x09\xeb\x62\
+\x14\x14\x40\xca\x3a\x18\x05\x05\x90\xb4\xf6\xa3\xa0\x00\xd2\xd6\
+\x7a\x14\x14\x40\xe2\xda\x8e\x82\x02\x48\x5d\xcb\x51\x50\x00\xc9\
+\x6b\x37\x0a\x0a\x20\x7d\xad\x46\x41\x01\x64\xa0\xcd\x28\x28\x80\
+\x1c\xb4\x18\x05\x05\x90\x87\xf0\x28\x38\xeb\x0b\xa0\xbe\x5f\xee\
+\x5e\xa8\xa3\x8b\xbb\xf3\xe0\x28\x38\x3e\x7f\x14\x14\xc0\xff\x1c\
+\xdc\xbe\x50\xbf\x5e\xe0\xad\x37\x1c\x05\x05\x90\x8d\x66\xa3\xa0\
+\x00\xf2\xd1\x68\x14\x14\x40\x46\x9a\x8c\x82\x02\xc8\x49\x83\x51\
+\x50\x00\x59\x89\x1f\x05\x05\x90\x97\xe8\x51\x50\x00\x99\x39\x67\
+\x14\xbc\xd4\x13\x40\x09\x82\xa3\xe0\x74\xd9\x28\x28\x80\xfc\x44\
+\x8d\x82\x02\xc8\x50\xcc\x28\x28\x80\x1c\x45\x8c\x82\x02\xc8\x52\
+\xfd\x51\x50\x00\x79\xaa\x3d\x0a\x0a\x20\x53\x75\x47\x41\x01\xe4\
+\xaa\xe6\x28\x28\x80\x73\x6d\x7f\xd0\xc6\x7b\xcf\xf5\xde\xeb\x8d\
+\x82\x02\x38\xff\x21\x4e\xda\x18\x3d\xdf\x9b\xaf\x35\x0a\x0a\x20\
+\x67\x35\x46\x41\x01\x64\xed\xd9\xa3\xa0\x00\xf2\xf6\xcc\x51\x50\
+\x00\x99\x0b\x8f\x82\x23\x01\x14\x21\x38\x0a\x3a\x02\x0a\x11\x1c\
+\x05\x05\x50\x88\xe0\x28\x28\x80\x42\x04\x47\x41\x01\x14\x22\x38\
+\x0a\x0a\xa0\x10\xe1\x51\x50\x00\x85\xd8\xbd\x2a\x80\xb2\x0d\x04\
+\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x01\x20\x00\x04\
+\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\
+\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\
+\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\
+\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\
+\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\xac\x36\x80\xa3\
+\xfb\xb1\x1e\xb4\xbf\x44\x4b\x27\x95\x1b\x38\xf9\xa3\x8d\x85\xef\
+\xf3\xd7\xf2\x9f\x7a\x9c\x67\x00\x5f\xdc\x8a\xf5\x6d\xf5\x12\x3f\
+\xde\x5a\xb1\xc7\xd5\x00\xbe\x6c\xe3\xfb\xea\xf7\x39\x5c\xfe\x53\
+\x8f\x1c\x01\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\xeb\x1a\xc0\xee\x1b\x74\
+\x65\x98\x62\x00\xb3\x17\xe9\x4a\xdf\x11\x80\x00\x10\x00\x02\x40\
+\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\
+\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\
+\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\
+\x10\x00\x02\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\
+\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\
+\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x01\
+\x74\xe5\xe7\x3b\x74\xe5\x24\xc5\x00\x1e\xfd\x49\x57\xce\x1c\x01\
+\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\xeb\x1a\xc0\xa7\x9f\x51\xcf\xb5\x3c\
+\x03\x18\x6c\x52\x4f\xdf\x11\x80\x00\x10\x00\x02\x40\x00\x08\x00\
+\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\
+\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\
+\x10\x00\x6b\x1d\xc0\xdf\x3f\x34\xf4\xd4\xeb\xca\x22\x80\xd3\xef\
+\x1a\x3a\xf3\xba\x1c\x01\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\xeb\x1a\xc0\
+\xe8\xe3\x86\xc4\x9a\x47\x00\xc3\x49\x43\x3d\xaf\xcb\x11\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x08\x00\x01\xb0\xae\x01\x3c\xfe\x7c\xc5\x1e\x7a\xcd\x6b\
+\x15\xc0\xd3\x07\x2b\x76\xea\x35\x3b\x02\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x04\xe0\x11\x08\x00\x01\x20\x00\x04\
+\x80\x00\x56\xa0\xb7\xb5\x62\xfe\xaf\xc0\x7a\x05\x30\xfe\x64\xc5\
+\x66\x5e\xb3\x23\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x40\x00\x1e\x81\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\
+\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\xff\xf9\xe6\x36\xf5\x1c\xe5\x19\xc0\x4f\x77\xa9\xe7\xd8\
+\x11\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\x90\x4c\x00\x1f\x7e\x44\x3d\xbb\
+\x79\x06\xb0\x39\xa2\x9e\x81\x23\x00\x01\x20\x00\x04\x80\x00\x10\
+\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\
+\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\
+\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\
+\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x08\x00\x01\x2c\x38\
+\x3c\x88\xf6\xb0\x7a\x8d\xaf\xbf\xa2\x9e\x7b\xd5\x47\x77\xe7\xa0\
+\x7b\x87\x51\x01\x3c\x39\x8e\x76\x56\xbd\xc6\xef\xbf\x51\xcf\x69\
+\xf5\xd1\x3d\x3a\xee\xde\x13\x47\x00\x02\x40\x00\x08\x00\x01\x20\
+\x00\x04\x80\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x50\
+\x90\x7f\x00\xd0\x49\x9b\xa9\x81\xcb\x3c\x2e\x00\x00\x00\x00\x49\
+\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x04\xe6\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x03\x00\x00\x00\xc3\xa6\x24\xc8\
+\x00\x00\x00\x03\x73\x42\x49\x54\x08\x08\x08\xdb\xe1\x4f\xe0\x00\
+\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0f\xed\x00\x00\x0f\xed\x01\
+\x56\x7b\xa4\x8d\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\
+\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\x70\
+\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\x5a\x50\x4c\x54\
+\x45\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe7\xec\xed\x09\x0a\x0a\x95\
+\x98\x99\x00\x00\x00\x00\x00\x00\x1f\x1f\x1f\x00\x00\x00\x00\x00\
+\x00\x1b\x1c\x1d\x26\x27\x29\x49\x4c\x4e\x61\x65\x69\x65\x6a\x6d\
+\x77\x79\x7a\x7a\x7d\x7d\x87\x8d\x92\x90\x93\x94\xa8\xab\xac\xad\
+\xb1\xb2\xbe\xc2\xc3\xe0\xe5\xe6\xe7\xec\xed\x0a\xb0\x0a\x21\x00\
+\x00\x00\x0f\x74\x52\x4e\x53\x00\x34\x40\x83\x88\xc3\xd0\xd8\xd8\
+\xe1\xe4\xe8\xf8\xf9\xfb\x7f\x31\xb7\x8d\x00\x00\x03\xe3\x49\x44\
+\x41\x54\x78\xda\xed\xd5\x41\x6a\xc3\x30\x10\x40\x51\xc7\x2a\x85\
+\x24\x8b\xde\xff\x8c\xdd\xa5\x10\x27\x32\xb2\xba\x88\xd3\x45\x17\
+\xa6\x20\x8c\xa4\xf4\xbd\x03\x0c\x68\xf4\x61\xc6\x61\xc3\xf8\xc1\
+\x0b\x18\x37\xff\x78\xe0\x5f\x13\x80\x00\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\
+\x80\x61\x38\x9d\x69\xdc\x69\xd7\x00\x02\xcd\x73\x02\x10\x00\x02\
+\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\
+\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\
+\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\xa0\x97\
+\x00\xee\xdd\x59\xca\xf6\xb3\xf4\xf7\xe2\x5d\x03\x88\xdd\xad\x23\
+\x95\x05\x90\xba\x7b\x70\x74\x02\x10\x00\x02\x40\x00\x08\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\xb6\
+\x03\xc8\x53\x77\xf2\xde\x0b\x7b\xb5\x9d\x6c\x07\x10\xbb\x93\xf6\
+\x0e\x20\xf5\xb7\x93\xec\x04\x20\x00\x04\x80\x00\x10\x00\x02\x40\
+\x00\x08\x00\x01\x20\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\
+\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\
+\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\
+\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\
+\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\
+\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\
+\x02\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\
+\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\
+\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\
+\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\
+\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\
+\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x01\x20\x00\
+\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\
+\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\
+\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\x02\x10\x00\x02\x40\x00\x08\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\
+\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\
+\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\
+\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\
+\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\
+\x04\x80\x00\xfe\x2c\xde\x1e\xe2\xb2\xba\x7c\x16\xb9\x3c\xe7\xfc\
+\x0c\x16\x40\xd3\xe6\xfb\xc3\xf4\xb5\xba\xde\x8a\x5c\x9f\x73\xa6\
+\x75\xf0\x2c\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\
+\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\
+\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\xf4\x10\x40\x78\xa3\x71\x61\xd7\x00\x8e\x67\x1a\x77\
+\x74\x02\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\
+\x00\x02\x40\x00\x08\x00\x01\x20\x00\x8a\x03\x38\x8c\x54\x75\xa8\
+\x1c\x40\x78\xa7\xaa\xe0\x04\x20\x00\x04\x80\x00\x10\x00\x02\x40\
+\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\
+\x01\x20\x00\x04\x80\x00\x10\x00\xa5\x01\xe4\x44\x55\xb9\x72\x00\
+\x69\xa6\xaa\xe4\x04\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x80\x5f\xbe\
+\x01\x4a\x82\x81\x1e\x8a\x16\xf8\x0d\x00\x00\x00\x00\x49\x45\x4e\
+\x44\xae\x42\x60\x82\
+\x00\x00\x08\xf9\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x03\x00\x00\x00\xc3\xa6\x24\xc8\
+\x00\x00\x00\x03\x73\x42\x49\x54\x08\x08\x08\xdb\xe1\x4f\xe0\x00\
+\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\x9d\x00\x00\x0e\x9d\x01\
+\xd5\xd3\xb1\x39\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\
+\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\x70\
+\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x01\xda\x50\x4c\x54\
+\x45\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x01\x01\x01\x02\x02\x02\x03\x03\x03\x03\x04\x04\x05\x06\x06\
+\x06\x06\x07\x09\x09\x0a\x0c\x0d\x0d\x0d\x0d\x0d\x0d\x0e\x0e\x10\
+\x11\x12\x11\x12\x12\x15\x16\x17\x16\x16\x16\x16\x17\x17\x1a\x1b\
+\x1c\x1b\x1c\x1d\x20\x22\x22\x21\x22\x23\x25\x25\x25\x26\x28\x29\
+\x27\x29\x2a\x28\x29\x2b\x2d\x2f\x30\x2e\x30\x31\x2f\x31\x32\x35\
+\x37\x38\x36\x38\x39\x36\x38\x3a\x3d\x40\x41\x3e\x40\x42\x3e\x41\
+\x43\x46\x49\x4b\x47\x4a\x4c\x4f\x52\x54\x50\x53\x55\x50\x54\x56\
+\x59\x5c\x5f\x59\x5d\x5f\x5a\x5a\x5a\x5a\x5d\x60\x5b\x5e\x61\x62\
+\x66\x69\x63\x67\x6a\x64\x67\x6a\x64\x68\x6b\x6b\x6f\x72\x6c\x70\
+\x73\x6c\x71\x74\x6d\x71\x75\x72\x72\x72\x74\x79\x7c\x75\x79\x7d\
+\x75\x7a\x7d\x7c\x80\x84\x7c\x81\x85\x7d\x82\x85\x83\x88\x8c\x84\
+\x89\x8d\x84\x8a\x8e\x89\x8e\x92\x8b\x90\x94\x8b\x91\x95\x91\x97\
+\x9b\x96\x9c\xa1\x97\x9d\xa1\x9b\xa1\xa6\x9c\xa2\xa6\xa0\xa6\xab\
+\xa1\xa7\xac\xa4\xab\xaf\xa7\xad\xb2\xa7\xae\xb3\xaa\xb1\xb6\xac\
+\xb3\xb8\xae\xb5\xba\xaf\xb6\xbb\xf2\xf2\xf2\x6f\x0f\x75\xbb\x00\
+\x00\x00\x4f\x74\x52\x4e\x53\x00\x01\x02\x04\x05\x08\x0c\x0d\x11\
+\x12\x16\x17\x18\x1d\x1e\x24\x25\x26\x2d\x2e\x36\x37\x38\x40\x41\
+\x42\x4b\x4c\x4d\x56\x57\x58\x63\x64\x65\x70\x71\x72\x7e\x7f\x80\
+\x8c\x8d\x8e\x9a\x9b\x9c\xa6\xa7\xa8\xb2\xb3\xb4\xbd\xbe\xbf\xc7\
+\xc8\xc9\xd0\xd1\xd2\xd9\xda\xe0\xe1\xe2\xe7\xe8\xed\xee\xf0\xf2\
+\xf3\xf7\xfa\xfb\xfd\xfe\x66\xe3\x43\x5e\x00\x00\x06\x36\x49\x44\
+\x41\x54\x78\xda\xed\xdd\xc9\x4e\x23\x67\x18\x86\x51\x3c\x60\x30\
+\x66\x34\x66\x9e\x87\x66\xf0\x00\x2e\x1b\xb2\xe8\x1b\x48\x76\xb9\
+\xd8\x2c\x72\x01\x91\x72\x2f\x2d\x65\xdb\xcb\x96\xb2\x6f\x7d\x24\
+\x51\x68\xbb\x0a\x7f\xe7\x2c\xff\x05\x0b\x78\xc4\x6f\xc9\xaf\xaa\
+\xea\x4b\xff\xdb\xcf\xbf\xf2\x9f\xfd\xd2\x5b\xaa\xa6\xfa\x12\xf3\
+\xb0\x52\x74\x05\x90\xda\x5a\xb1\x25\x80\xd4\xd6\x8b\x0d\x01\xa4\
+\xb6\x55\xac\x09\x20\xb5\x9d\x62\x55\x00\xa9\xf5\xc6\x2d\x01\xa4\
+\x76\xf0\xbc\x2c\x80\xd4\x8e\x47\x0d\x01\xa4\x76\x36\xac\x0b\x20\
+\xb5\xcb\xbe\x00\x72\xbb\x79\x14\x40\x6e\x77\x77\x02\xc8\xed\xf1\
+\x46\x00\xb9\x0d\x2e\x17\x31\x80\x46\x8f\xef\xb4\xdf\xf8\x55\xd5\
+\x46\x67\x0b\x18\x40\xe7\x33\xdf\xb9\x78\xf3\xb7\xfe\x74\xec\x0a\
+\x48\xad\x39\x3e\x10\x40\x6a\xcb\x45\x4f\x00\xa9\x55\x65\x22\x24\
+\x80\xb2\xac\x15\xdb\x02\x48\xad\x1a\x13\x21\x01\x94\x67\xb3\xe8\
+\x08\x20\xb5\x2a\x4c\x84\x04\x50\xa6\xdd\xf2\x27\x42\x02\x28\x55\
+\xf9\x13\x21\x01\x94\xeb\xf8\xa9\x21\x80\x34\x6a\xc1\xd9\xe9\xa8\
+\x2e\x80\x2c\x86\x2b\xc1\xe1\x45\x5f\x00\x59\x6c\x4f\xa3\x1b\xff\
+\xa6\x2f\x80\x34\x9f\xfa\x27\xcd\xe0\xf4\xd3\xbd\x00\xb2\xd8\x1f\
+\x47\x9f\x03\x1e\x6e\x05\x90\xc5\xd1\x53\x54\x40\xff\x52\x00\x59\
+\x9c\x47\x37\x7e\x6d\x74\x2e\x80\x2c\xae\xa3\x51\x70\x7d\x74\x2c\
+\x80\x2c\xee\xa3\x51\x70\x69\x13\x21\x01\xcc\x5f\xff\x2a\x38\x5c\
+\x9e\xf4\x04\x90\xc5\x20\xba\xf1\x5b\x93\xae\x00\x92\xa8\x8d\x4e\
+\x82\xd3\xf6\x64\x5b\x00\x49\xd4\x9f\x0f\x83\xd3\x4e\x19\x13\x21\
+\x01\x94\xa2\x31\xde\x0b\x4e\xcb\x98\x08\x09\xa0\x1c\xcb\xe1\x8d\
+\x5f\xc2\x44\x48\x00\x25\x69\x4d\xa3\x1b\x7f\xb7\x68\x09\x20\x89\
+\xd5\x69\x74\xe3\xef\x8f\x97\x05\x90\xc4\xda\x4b\x74\xe3\x1f\x3d\
+\x35\x05\x90\xc4\xfa\x6b\x74\xe3\x9f\xce\xf7\x29\x42\x02\x28\xd1\
+\xc6\x4f\xe1\x44\x68\x20\x80\x2c\xb6\x5e\xa2\xcf\x7c\xd7\x7d\x01\
+\x64\xd1\x2d\x7d\x22\x24\x80\x72\xed\x15\x25\x4f\x84\x04\x50\xb2\
+\xc3\xe7\xa8\x80\xc1\x95\x00\xb2\x38\x0b\x3f\xf3\x0d\xcf\x05\x90\
+\xc5\x55\x74\xe3\xd7\xc3\x2f\x0c\x05\xb0\x90\xee\xa2\x1b\xbf\x19\
+\x7e\x61\x28\x80\x85\xf4\x18\x4e\x84\x8a\x3d\x01\x64\x31\x88\x1e\
+\x28\xd7\x2a\x76\x05\x90\x44\x6d\x78\x1a\x9c\xb6\xe7\xf1\x14\x21\
+\x01\x54\x42\xfd\xe9\x28\x38\xed\x14\x9b\x02\x48\xa2\x31\xde\x0f\
+\x4e\xe7\x30\x11\x12\x40\x45\x34\xc3\xe7\x06\x6e\xcf\x7c\x22\x24\
+\x80\xaa\x68\x4d\x77\x82\xd3\x99\x4f\x84\x04\x50\x19\xe5\x4c\x84\
+\x04\x50\x1d\xed\x32\x26\x42\x02\xa8\x90\x37\x26\x42\x33\x7d\x8a\
+\x90\x00\xaa\x24\x9e\x08\x9d\x0f\x04\x90\xc5\x1b\x13\xa1\x81\x00\
+\xb2\xe8\x4e\xa3\x1b\xff\xf6\x41\x00\x59\xf4\x8a\xe8\x4f\x72\xff\
+\x49\x00\x59\xc4\x13\xa1\xfe\x95\x00\xb2\x38\x1d\x46\xa7\xc3\x0b\
+\x01\x64\x71\x19\xbd\x5c\xb6\x3e\x3c\x11\x40\x16\xb7\xd1\x8d\x3f\
+\xa3\x89\x90\x00\xaa\xe8\xe1\x3a\x38\x9c\xcd\x44\x48\x00\x95\xd4\
+\x9f\xdb\x44\x48\x00\x95\x54\x1b\x46\x2f\x97\x6d\x17\x3b\x02\x48\
+\xa2\x3e\x9a\xd3\x44\x48\x00\x15\x15\x4f\x84\x36\x7e\xf8\x44\x48\
+\x00\x55\xd5\x0c\x6f\xfc\xed\xc9\xaa\x00\x92\x88\x27\x42\xdd\x49\
+\x4b\x00\x49\xac\x4c\xb7\x82\xd3\xbd\x62\x59\x00\x49\xb4\xa7\xeb\
+\xc1\xe9\xe1\x73\x53\x00\x49\x74\x5e\xd6\x82\xd3\x93\x1f\x39\x11\
+\x12\x40\xa5\x6d\xbc\x86\x13\xa1\x61\x4d\x00\x49\x6c\xbe\x46\x9f\
+\xf9\xae\xfa\x02\xc8\x62\x67\xc6\x13\x21\x01\x54\x5d\x6f\x32\xd3\
+\x89\x90\x00\x2a\xef\x20\x7c\xd5\x5c\xff\x5a\x00\x59\x9c\x8c\xa2\
+\xd3\xc1\x85\x00\xb2\x08\x5f\x2f\x5c\x1f\x9d\x0a\x20\x8b\x9b\xe8\
+\xc6\x6f\x84\xcf\x14\x10\xc0\x42\x8a\x27\x42\xe1\x17\x86\x02\x58\
+\x48\xe1\xcb\x65\x5b\xe3\x5d\x01\x24\x51\x1b\xcc\x68\x22\x24\x80\
+\x0f\x22\x7e\xb9\xec\xfb\x27\x42\x02\xf8\x28\x1a\xcf\xd1\xcb\x65\
+\x37\x8a\x75\x01\x7c\x18\x7f\xfc\xf6\x1e\xbf\x7f\x89\x7e\xe6\x76\
+\xd1\x16\x40\x6a\xdd\x62\x45\x00\xa9\xed\xbd\xeb\x29\x42\x02\xf8\
+\xf8\xde\x35\x11\x12\xc0\x02\x38\x19\x08\x20\xf9\xff\x00\x01\x20\
+\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x80\xf2\x74\
+\x7a\xb3\xd2\x10\xc0\x47\x70\xf2\x79\x56\x3a\x02\x40\x00\x08\x00\
+\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\
+\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\
+\x10\x00\x02\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\
+\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\
+\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\
+\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\
+\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\
+\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\
+\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\
+\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\
+\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\
+\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\
+\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\
+\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\
+\x00\x08\x00\x01\x20\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\
+\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\
+\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\
+\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\
+\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\
+\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\
+\x02\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\xfe\xc1\xd7\x3f\x99\
+\x9b\xaf\x15\x0c\xe0\xdb\x5f\xcc\xcd\x37\x57\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\
+\x00\xfe\xc5\xdf\x82\xb8\x9a\x52\xe4\x05\xd7\x26\x00\x00\x00\x00\
+\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x05\x0a\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x03\x00\x00\x00\xc3\xa6\x24\xc8\
+\x00\x00\x00\x03\x73\x42\x49\x54\x08\x08\x08\xdb\xe1\x4f\xe0\x00\
+\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0f\xed\x00\x00\x0f\xed\x01\
+\x56\x7b\xa4\x8d\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\
+\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\x70\
+\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\x63\x50\x4c\x54\
+\x45\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\x08\x08\x10\x11\
+\x12\x11\x12\x12\x1c\x1d\x1d\x27\x29\x2a\x3f\x42\x44\x54\x58\x5b\
+\x55\x57\x57\x6c\x6e\x6f\x77\x79\x7a\x7a\x7d\x7d\x87\x8d\x92\x89\
+\x8c\x8c\x90\x93\x94\xa8\xab\xac\xad\xb1\xb2\xbe\xc2\xc3\xe0\xe5\
+\xe6\xe7\xec\xed\x0e\x32\x67\xa6\x00\x00\x00\x0d\x74\x52\x4e\x53\
+\x00\x34\x40\x4a\x68\xa1\xb8\xd0\xe0\xe8\xf1\xfb\xfd\x9e\x12\x23\
+\xcb\x00\x00\x04\x00\x49\x44\x41\x54\x78\xda\xed\xdd\xcd\x4e\x83\
+\x40\x14\x80\x51\x7e\x82\xb2\x69\xea\xfb\x3f\xa5\x2e\x00\x95\x0e\
+\xe3\x9e\x26\xd5\x74\x24\xe5\xd2\x73\x1e\x80\x0c\x97\x2f\xb9\x9b\
+\x49\x68\xaa\x1b\x9a\x13\x07\xd0\xdc\xfc\xc6\x15\x4f\x4d\x00\x02\
+\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\xaa\xea\xfc\xc6\xce\x9d\x37\x0d\xa0\
+\x65\xf7\xac\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\
+\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x08\x00\x01\x20\
+\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\
+\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\
+\x20\x00\x04\x80\x00\x88\x12\xc0\x67\x38\x4b\xd9\x7c\x96\x78\x6f\
+\xbc\x69\x00\xe3\x10\x4d\x2a\x0b\x20\x85\x7b\xe1\xd1\x0a\x40\x00\
+\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\
+\x20\x00\x04\x80\x00\xb8\x1d\x40\xfe\x0e\x67\xd9\x7a\x60\x4b\xbc\
+\x99\xe4\xfb\x03\xf8\x0a\x67\xfb\x00\xe2\xcd\x24\x5b\x01\x08\x00\
+\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x40\x00\x08\x00\
+\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\
+\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\
+\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\
+\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\x01\x20\x00\x04\x80\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\
+\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\
+\x00\xd1\x03\xe8\xfa\x10\xda\xf5\xb9\x87\x8f\x22\xc3\xfa\x79\x6d\
+\x8c\x39\x74\xff\x1e\x40\xdd\x85\x50\xaf\xcf\x9d\x2e\x45\xd2\x51\
+\xe6\x60\x05\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\
+\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\xf8\x93\xee\x95\xdd\
+\xe8\x1e\x10\x40\x90\x9b\x11\xcf\xa1\xb6\x02\x10\x00\x02\x40\x00\
+\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x02\x40\x00\x08\x00\x01\
+\x20\x00\x04\x80\x00\x10\xc0\xef\xe6\x91\xdd\x98\x1f\x10\x40\x5e\
+\xd8\x8d\x6c\x05\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\
+\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\xdc\x15\x40\x9a\x42\
+\xb8\xfa\xdb\x77\x7f\x2a\xd2\x1f\x65\x0e\xe5\x01\x5c\x42\xb8\xba\
+\x19\xf1\x52\x68\xfd\xbc\x1c\x63\x0e\xc9\x0a\x40\x00\x08\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\
+\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\
+\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\
+\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\
+\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\
+\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\
+\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\
+\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\
+\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\
+\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\
+\x00\x08\x00\x01\x20\x00\x04\x20\x00\x04\x80\x00\x10\x00\x02\x40\
+\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x51\xcd\
+\xa9\xc8\x2c\x80\xe0\xa6\xf7\x22\x93\x00\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\
+\x00\x04\x40\x34\x3f\x8e\x67\x61\xa7\x63\xe8\x7e\xa8\x00\x00\x00\
+\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x17\x16\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\x9d\x00\x00\x0e\x9d\
+\x01\xd5\xd3\xb1\x39\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x16\x93\x49\x44\
+\x41\x54\x78\xda\xed\xdd\x09\x94\x14\xf5\x9d\xc0\xf1\xdf\xcc\xc0\
+\x30\x30\x82\xcc\x81\xc2\x28\xe0\x7d\x05\x6f\x74\xf0\x58\x57\xc3\
+\x6a\xbc\x8f\x08\x5e\xf1\x88\xc6\x64\xc3\xea\xae\x1a\x13\x63\x7c\
+\x2f\x1e\xd1\x78\x45\xd7\x98\xd5\xb8\x1e\x31\x6a\x22\x26\x71\xc3\
+\xc6\x1b\xef\x03\x51\x44\xbc\x12\x3c\x56\x23\x62\x10\x90\x73\x18\
+\x81\x61\x50\x61\xb6\xaa\x83\x79\x09\x89\x0a\x54\xf7\x4c\xcf\xf4\
+\xe7\xf3\x5e\xbd\xf6\xf9\xe8\x9a\xee\x7f\x0d\xfc\xbf\x5d\x55\x5d\
+\x55\xd6\xd6\xd6\x16\x00\x40\x69\x29\x37\x04\x00\x20\x00\x00\x00\
+\x01\x00\x00\x08\x00\x00\x40\x00\x00\x00\x02\x00\x00\x10\x00\x00\
+\x80\x00\x00\x00\x04\x00\x00\x20\x00\x00\x00\x01\x00\x00\x08\x00\
+\x00\x40\x00\x00\x00\x02\x00\x00\x10\x00\x00\x80\x00\x00\x00\x04\
+\x00\x00\x20\x00\x00\x40\x00\x00\x00\x02\x00\x00\xe8\xa2\xba\x15\
+\x6a\xc5\x65\x65\x65\xf5\xc9\xc3\x6e\xc9\xb2\x5e\xb2\x34\xac\xb4\
+\xf4\x4e\xff\x88\xe1\x07\x80\x68\x4b\x96\x85\xc9\x32\x63\xa5\x65\
+\x7a\xb2\x8c\x6f\x6b\x6b\x9b\x5b\x90\x79\x3a\x59\x71\x3e\x27\xfd\
+\x8d\x93\x87\x43\x56\x2c\xe9\xe4\x5f\x61\xbb\x02\xc0\x1a\x5b\x96\
+\x46\x40\xb2\xdc\x95\x2e\xc9\x9c\xfd\x76\xd1\x04\x40\x32\xe9\x57\
+\x25\x0f\xa7\x24\xcb\x57\x93\x65\x88\x6d\x05\x00\x05\x33\x39\x59\
+\x6e\x49\x96\x6b\x93\xf9\xbb\xb5\x43\x02\x20\x99\xf8\xd3\x4f\xf7\
+\x27\x24\xcb\x05\xc9\xb2\xbe\x6d\x02\x00\xed\xe6\xbd\x64\x39\x2f\
+\x59\x6e\x4d\xe6\xf1\x65\xed\x16\x00\xc9\xe4\x7f\x70\xf2\x70\x49\
+\xb2\x6c\x65\x1b\x00\x40\x87\x79\x2d\x59\xbe\x97\xcc\xe5\x77\x17\
+\x34\x00\x92\x89\xbf\x57\xf2\x70\x5b\xb2\x1c\x6e\xcc\x01\xa0\x68\
+\xfc\x36\x59\x8e\x4f\xe6\xf4\x96\xbc\x07\x40\x32\xf9\x0f\x8a\x3f\
+\x9f\x84\xb0\x9d\x71\x06\x80\xa2\xf3\x72\xb2\x1c\x92\xcc\xeb\x7f\
+\x5a\x95\x3f\xbc\x4a\xd7\x01\x48\x26\xff\x5d\x93\x87\x89\x26\x7f\
+\x00\x28\x5a\xe9\x1c\x3d\x71\xc5\x9c\x9d\x3d\x00\x92\x15\x1d\x9d\
+\x3c\x3c\x9e\x2c\xeb\x1a\x5b\x00\x28\x6a\xe9\x5c\xfd\xf8\x8a\xb9\
+\xfb\xb3\xe7\xf7\xcf\x3a\x04\x90\xac\xe0\x9f\x92\x87\x47\x93\xa5\
+\xbb\x31\x05\x80\x4e\xe3\xa3\x64\x19\x9e\xcc\xf1\xe3\x56\x3b\x00\
+\x56\x1c\xf3\x9f\x94\x2c\xfd\x8c\x23\x00\x74\x3a\x73\x92\x65\xe8\
+\xa7\x9d\x13\x50\xfe\x29\x93\x7f\x7a\xb6\xff\x5d\x26\x7f\x00\xe8\
+\xb4\xd2\x39\xfc\xae\x15\x73\xfa\xaa\x05\x40\xe2\xd6\x70\xc2\x1f\
+\x00\x74\x76\xdb\xad\x98\xd3\x3f\x3f\x00\x92\x52\x38\x22\x79\x18\
+\x61\xcc\x00\xa0\x4b\x18\xb1\x62\x6e\xff\xdb\xf9\xfe\xaf\xcf\x01\
+\x48\xfe\x40\x65\xf2\xf0\x7a\xb2\x6c\x64\xbc\x00\xa0\xcb\x98\x92\
+\x2c\x5b\x26\x73\xfe\x87\x9f\xfc\x8f\x95\x6f\x07\x3c\xaa\xd0\x93\
+\x7f\x45\x45\x45\xf4\xa8\xaa\xb2\x29\x00\x60\x85\xa5\xad\xad\xb1\
+\x6c\xd9\xb2\x42\xfe\x88\x8d\x56\xcc\xf1\x57\xff\xdd\x1e\x80\xe4\
+\xd3\xff\xda\xc9\x43\x7a\x9b\xc1\xba\x7c\xfe\xc4\x0d\x37\xda\x38\
+\x86\xed\xba\x7b\x6c\xb7\xc3\x8e\xd1\x6f\x9d\x75\xa3\x6f\x4d\x4d\
+\xfa\xb3\x6c\x6d\x00\x58\x21\x9d\x8b\x17\x34\x35\xc5\x9c\xd9\xb3\
+\xe2\xe5\x17\x5f\x88\x09\xcf\x3c\x1d\xef\x4c\x79\x3b\xdf\x3f\x66\
+\x5e\xb2\x6c\x9c\xfc\xac\xe6\x95\x03\x20\xbd\xb9\xcf\xd9\xf9\xfa\
+\x29\xf5\xfd\xfa\xc5\x29\xa7\x9d\x99\x9b\xf8\x01\x80\xd5\x93\x86\
+\xc0\xb5\x57\x5f\x19\x73\xe7\xcc\xc9\xe7\x6a\x2f\x4d\xe6\xfd\xef\
+\xfd\x25\x00\x92\xc9\x3f\x3d\x19\x70\x66\xb2\xac\x93\x8f\xb5\x0f\
+\xdf\x67\xdf\x38\xe9\x1b\xa3\xa2\x57\xaf\x5e\xb6\x20\x00\xac\xa1\
+\x96\x96\x96\xb8\xf9\x86\xeb\xe2\xd1\x87\xc6\xe6\x6b\x95\xb3\x93\
+\x65\x40\x32\xf7\x2f\xff\x24\x00\xd2\xeb\x06\x8f\xcf\xba\xd6\xbe\
+\x7d\x6b\xe2\xd4\x33\xbe\x1d\x3b\xee\xb4\xb3\xad\x06\x00\x79\xf2\
+\xc2\xf3\x13\xe3\x9a\xab\xae\x88\x05\x0b\x9a\xf2\xb1\xba\xdd\x92\
+\xb9\xff\x99\x4f\xbe\x06\x78\x48\xd6\xb5\xa5\xc7\xf5\xbf\x75\xf6\
+\x39\x26\x7f\x00\xc8\xb3\x74\x6e\x4d\xe7\xd8\x3c\x9d\x43\x97\x9b\
+\xf3\xf3\x16\x00\xfb\x1f\x74\x48\x6c\xbd\x8d\x6b\x07\x01\x40\x21\
+\xa4\x73\x6c\x3a\xd7\xe6\x2d\x00\x92\x9a\xd8\x3c\x79\xdc\x3c\xcb\
+\x9a\x06\x34\xac\x17\xc7\x9d\x78\xb2\xad\x03\x00\x05\x94\xce\xb5\
+\xe9\x9c\x9b\xd1\xe6\xe9\xdc\x9f\xee\x01\x18\x9e\x65\x2d\xe9\xee\
+\x88\xd3\xce\x3c\x2b\x7a\xf4\xe8\x61\xcb\x00\x40\x01\xa5\x73\x6d\
+\x3a\xe7\xe6\xe1\x50\xc0\xf0\x34\x00\xd6\xcf\xb2\x86\xf4\x6b\x7e\
+\x9b\x6f\xb9\x95\xad\x02\x00\xed\x20\x9d\x73\xf3\xf0\x15\xfb\xf5\
+\xd3\x00\x68\xc8\xb2\x86\xc6\x5d\x76\xb3\x35\x00\xa0\x1d\xe5\x61\
+\xee\x6d\xc8\x1c\x00\x3b\x38\xeb\x1f\x00\xda\x55\x1e\xe6\xde\x6c\
+\x01\x50\x5e\x5e\x1e\xf5\xf5\xfd\x6c\x09\x00\x68\x47\xe9\xdc\x9b\
+\xce\xc1\x1d\x16\x00\x7d\xd6\xee\xeb\xba\xfe\x00\xd0\xce\xd2\xb9\
+\x37\x9d\x83\xb3\x06\x40\xcd\x9a\x3e\xbb\xba\xba\xda\x56\x00\x80\
+\x0e\x90\x71\x0e\xae\x29\x37\x84\x00\x50\x7a\x04\x00\x00\x08\x00\
+\x00\x40\x00\x00\x00\x02\x00\x00\x10\x00\x00\x80\x00\x00\x00\x04\
+\x00\x00\x20\x00\x00\x00\x01\x00\x00\x08\x00\x00\x40\x00\x00\x00\
+\x02\x00\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00\x20\x00\x00\
+\x80\xbf\xd7\xcd\x10\x00\x50\x48\x6d\x6d\x6d\xd1\xdc\xbc\x20\xe6\
+\xcf\x9b\x17\x4d\xf3\xe7\x47\xcb\xe2\xc5\xd1\xb7\xa6\x26\x6a\x6a\
+\x6b\xa3\xb6\xb6\x2e\x7a\x55\x57\x1b\x24\x01\x00\x40\x67\xb6\x60\
+\x41\x53\x3c\x3f\xe1\xd9\x78\xe9\x85\x49\x31\x67\xf6\xac\xdc\x84\
+\x9f\xfe\xbf\x65\xcb\x96\x7d\xea\x73\x7a\xf4\xe8\x91\xc4\x40\x5d\
+\x2e\x08\xd6\x1f\x38\x28\x76\x1e\xb6\x4b\x6c\xbb\xdd\x0e\xd1\xbd\
+\xb2\xd2\x80\x0a\x00\x00\x8a\xd5\xf4\xf7\xa6\xc5\xc4\x09\xcf\xc4\
+\x73\xcf\x3e\x13\x6f\xbe\xf1\x7a\xee\x13\xff\xea\x58\xba\x74\x69\
+\xbc\x3f\x73\x46\x6e\x79\xfd\xd5\xc9\xf1\xf0\xd8\xfb\xa3\xaa\xaa\
+\x2a\xb6\xdb\x71\x68\x34\xee\xb2\x5b\x0c\xdd\xa9\x31\xd6\xea\xdd\
+\xdb\x40\x0b\x00\x00\x3a\x5a\xfa\x89\x3e\x9d\xa8\xef\xbd\xfb\x7f\
+\x63\xfa\xb4\x69\x79\x5f\x7f\x6b\x6b\x6b\x4c\x18\xff\x74\x6e\xa9\
+\xa8\xa8\x88\x21\xdb\x6c\x1b\x23\x8f\x3e\x36\xbe\x30\x64\x6b\x83\
+\x2f\x00\x00\xe8\x08\x13\x9e\x19\x1f\xbf\xbc\xe5\x67\xb9\x4f\xfe\
+\xed\x15\x1b\xaf\xbc\xf4\x62\x6e\xd9\xa9\x71\x58\x1c\x77\xe2\xc9\
+\x31\x70\xd0\x60\x1b\x42\x00\x00\xd0\x1e\xd2\xdd\xfb\x3f\xbf\xe9\
+\xfa\x78\xe3\xb5\x57\x3b\xec\x35\x3c\xff\xdc\x84\x78\xe1\xf9\x89\
+\x31\x7c\xef\x2f\xc5\x51\xc7\x9e\x10\xb5\x75\x75\x36\x8c\x00\x00\
+\xa0\x10\x16\x2d\x5c\x18\xd7\x5d\xf3\xe3\x78\x66\xdc\x53\x45\xf1\
+\x7a\x96\x2f\x5f\x1e\x0f\x3f\xf8\x40\x3c\xf5\xc4\x63\x71\xf8\x11\
+\x47\xc7\x88\xa3\x8e\x89\xb2\xb2\x32\x1b\x6a\x35\xb9\x0e\x00\x00\
+\x9f\x6a\xda\x9f\xde\x8d\xef\x9c\x7e\x6a\xd1\x4c\xfe\x7f\x2d\x3d\
+\x79\x70\xf4\x2f\x6e\x89\x4b\x2f\x3c\x3f\x5a\x97\x2c\xb1\xb1\x04\
+\x00\x00\xf9\x30\x69\xe2\x84\xf8\xee\x19\xff\x91\x3b\x3b\xbf\x98\
+\xa5\xdf\x40\x38\xfb\xcc\xd3\x62\xf6\xac\x59\x36\x9a\x00\x00\x20\
+\x8b\x31\x77\xfe\x3a\x2e\xbe\xe0\xdc\x58\xb2\xa4\xa5\x53\xbc\xde\
+\x77\xa7\xbe\x13\xdf\x39\xfd\x94\x78\x6d\xf2\x1f\x6c\x3c\x01\x00\
+\xc0\xea\x4a\xcf\xb8\xbf\xea\x47\x97\xc6\x2f\x7e\x7e\xd3\x6a\x7f\
+\x9f\xbf\xa3\x7d\xd0\xdc\x1c\xe7\x9e\x73\x56\x3c\xfe\xc8\x43\x36\
+\xa4\x00\x00\x60\x75\xfc\xec\xfa\x9f\xc6\x53\x8f\x3f\xda\x79\x03\
+\xe6\xe3\x8f\xe3\x9a\x1f\x5f\x99\xbb\x12\x21\x02\x00\x80\x55\xf0\
+\xe0\xfd\xf7\xc6\x03\xf7\xde\xdd\xe9\xdf\x47\xfa\x2d\x81\x2b\x2e\
+\xbd\xa8\xdd\xae\x53\x20\x00\x00\xe8\xb4\x26\xff\xfe\x95\xb8\xf1\
+\xbf\xaf\xed\x32\xef\x27\xbd\xe1\xd0\x0f\xcf\xff\x7e\x2c\x5a\xb4\
+\xc8\xc6\x15\x00\x00\xfc\x23\xb3\xde\x9f\x19\x97\x5f\xfc\x83\xdc\
+\xee\xf3\xae\x64\xe6\x8c\xe9\x71\xc5\x25\x17\x7e\xe6\x8d\x88\x04\
+\x00\x00\x25\x29\xbd\xe6\x7e\xfa\x49\x79\xe1\x07\x1f\x74\xc9\xf7\
+\x97\x5e\x3e\xf8\x96\x9b\xae\xb7\xa1\xff\x01\x57\x02\x04\x28\x61\
+\x77\xfd\xf6\xce\xdc\xc5\x7e\x0a\xa9\xa1\xba\x22\x36\xec\xd3\x2d\
+\x06\xf4\xaa\x88\x01\xc9\x7f\xf7\xee\x5e\x1e\x73\x96\x2c\x8b\xf7\
+\x5b\x96\xc5\xcc\x64\x79\xbd\xe9\xa3\x58\xfc\x51\xe1\xbe\x71\x70\
+\xdf\xdd\xbf\x8b\xbd\x86\xef\x1d\x1b\x6d\xb2\xa9\x0d\x5e\xca\x01\
+\x90\x9e\xe4\xd2\xd4\x34\xdf\x96\xef\x00\xfb\xee\x7f\x60\xf4\xad\
+\xa9\x35\x10\x50\x24\x9a\x17\x2c\x88\xdf\x8d\xb9\xb3\x20\xeb\xde\
+\xae\xbe\x32\x0e\xd8\xa0\x67\x1c\x30\xb8\x67\x6c\x53\x57\xf9\x99\
+\x7f\x76\xe9\xb2\xb6\x78\x6a\xc6\xd2\xb8\xef\xdd\x96\xb8\x77\xea\
+\x92\x5c\x18\xe4\x53\xfa\x75\xc6\x5b\x6f\xbe\x31\x2e\xb8\xf8\x72\
+\x1b\xbd\x94\x03\x60\xec\xfd\xf7\xc4\xd4\x29\x53\x6c\xf9\x0e\x90\
+\xde\xd7\x5b\x00\x40\xf1\xf8\xf5\xe8\x5f\xe4\xfd\x12\xba\xe9\x64\
+\xff\xc3\x61\x7d\x63\xaf\xf5\xaa\x56\xf9\x39\x3d\x2a\xca\x62\xef\
+\x81\x55\xb9\xe5\xf2\x5d\xdb\xe2\xa6\xd7\x16\xc5\x65\x2f\x36\xc7\
+\xbc\xd6\xe5\x79\x7b\x5d\xbf\x7f\xf9\xa5\xdc\x57\x03\xb7\xdf\x71\
+\xa8\x0d\xbf\x82\x73\x00\x00\x4a\x50\x7a\x79\xdf\x87\xc6\xde\x9f\
+\xb7\xf5\xd5\x56\x95\xc7\x0d\x7b\xd6\xc5\xf8\xc3\xfb\xaf\xd6\xe4\
+\xbf\xb2\xca\xf2\xb2\xf8\xb7\x21\xbd\x63\xf2\x51\x0d\x71\xc6\xb6\
+\x7d\xa2\x3c\x8f\xf7\xf8\xb9\xed\xe6\x1b\x3b\xdd\xc5\x8d\x04\x00\
+\x00\x79\x75\xfb\xad\x3f\xcf\xdb\x59\xff\x5b\xd5\x76\x8f\x27\x0f\
+\xed\x1f\xc7\x6c\x56\x1d\xf9\x9a\xaf\x7b\x57\x96\xc7\x85\x8d\x7d\
+\xe3\x8e\x7d\xfa\x45\x75\xf7\xfc\xac\x75\xea\x3b\x53\xe2\x89\x47\
+\x1f\xb6\xf1\x05\x00\x40\x69\x4a\x0f\x83\x8e\x1f\xf7\x64\x5e\xd6\
+\x95\x1e\xe3\x7f\xfc\x90\xfe\xb9\x93\xfc\x0a\xe1\x93\xf5\x0f\xee\
+\x9d\x9f\xf5\xa7\x77\x0f\x4c\x2f\x14\x84\x00\x00\x28\x39\xe3\x9e\
+\x7c\x2c\x2f\xbb\xc2\xf7\x68\xa8\x8a\xdb\xf7\xce\xdf\x27\xf4\xcf\
+\xda\xc3\x70\xf7\xfe\xeb\x44\xdf\x1e\xd9\xa7\xac\xb9\x73\xe6\xb8\
+\x61\x90\x00\x00\x28\x4d\xcf\x4d\x78\x26\xf3\x3a\xd2\x4f\xfc\xb7\
+\xef\x5d\x1f\xdd\xda\x69\x16\xd9\x78\xed\x6e\xf1\xcb\x7f\xc9\xcf\
+\xcf\x9b\x98\x87\xf7\x2f\x00\x00\xe8\x54\xd2\xeb\xe3\x4f\x9f\x96\
+\xed\x1a\xf9\x55\x15\x65\x71\xe7\x97\xfa\x45\x4d\x8f\xf6\x9d\x42\
+\xf6\x5c\xaf\x2a\x2e\x6a\xac\x11\x00\x02\x00\x80\x8e\x98\xfc\xfe\
+\xf5\x0b\xbd\x63\x8b\x9a\xee\x1d\xf2\xfa\x47\x0d\xe9\x1d\x9b\xf7\
+\xcd\xf6\xb3\x67\xbd\xff\x7e\xee\x84\x40\x01\x00\x40\xc9\x78\xee\
+\xd9\x6c\x01\xd0\xa7\xb2\x3c\xbe\xbd\x7d\x9f\x0e\x7b\xfd\x15\x65\
+\x11\x3f\x68\xec\x9b\x3d\x84\x9e\xb5\x17\x40\x00\x00\x94\x88\x05\
+\x0b\x9a\xe2\xcd\x37\x5e\xcf\xb4\x8e\xd3\xb7\xed\xd3\xee\xbb\xfe\
+\x57\x96\x7e\x33\x60\x58\xff\x1e\xd9\x42\xc8\x61\x00\x01\x00\x50\
+\x2a\xfe\xf8\xe6\xff\x65\x3a\xfb\x3f\x3d\xd7\xff\x2b\x9b\x55\x17\
+\xc5\x7b\xc9\xfa\x3a\xde\x79\xfb\x8f\x5d\xee\xee\x87\x02\x00\x80\
+\x7f\x68\xde\xdc\xb9\x99\x9e\xbf\x43\xbf\xca\x58\xaf\xba\xa2\x28\
+\xde\xcb\xfe\x83\x7a\x66\xba\xe8\x50\x1a\x42\x4d\x4d\x4d\x02\x00\
+\x80\xae\x6f\xfe\xfc\x79\x99\x9e\x7f\xe0\x06\xbd\x8a\xe6\xbd\xac\
+\xdb\xab\x22\x86\xae\x53\x99\x69\x1d\x4d\x19\xc7\x43\x00\x00\xd0\
+\x39\x02\x60\x5e\xb6\x09\x6f\x8f\x86\x1e\x45\xf5\x7e\x76\x1f\x50\
+\x95\x6d\x3c\x04\x00\x00\xa5\x20\xeb\x21\x80\x86\x22\xd9\xfd\x9f\
+\xaf\xd7\xd3\x34\xbf\xb4\x6f\x0d\x5f\x72\xb7\x03\x3e\xfe\xc4\xaf\
+\xc7\xe2\x45\x0b\xfd\x4b\xd0\x01\xd6\x59\x77\x5d\x83\x00\x1d\x28\
+\xcb\x2e\xef\xf4\x78\x7b\xba\xdb\xbd\x98\xf4\xcf\xf8\x7a\x4a\x7d\
+\x0f\x40\xc9\x05\x80\x7b\x41\x03\x25\xbb\x07\x60\xde\x9a\xef\x01\
+\x48\x6f\xf7\x5b\x59\x5e\x56\x54\xef\x67\x40\x2f\x7b\x00\xb2\x70\
+\x08\x00\xa0\x54\xfe\xc1\x2f\x5f\xf3\x7f\xf2\x97\xb5\x15\xdf\xfb\
+\xc9\xfa\x9a\xb2\x8c\x87\x00\x00\xa0\xd3\xa8\xab\xab\x5f\xe3\xe7\
+\x2e\x58\xba\x3c\x5a\x8b\xac\x02\x66\xb6\x2c\xcb\xf4\xfc\x9a\xda\
+\x5a\x01\x00\x40\xd7\x57\x9b\x21\x00\x72\x13\xee\xe2\x65\x45\xf5\
+\x7e\xb2\xbe\x9e\xda\xda\x3a\x01\x00\x40\x29\x04\x40\xb6\x09\x6f\
+\x7a\x91\x05\xc0\x7b\x8b\xb3\x5d\xc9\xaf\x46\x00\x00\x50\x0a\xea\
+\x32\xee\x01\x78\xec\xbd\x25\x45\xf5\x7e\x9e\x98\xde\xda\xa1\x41\
+\x24\x00\x00\x28\x89\x3d\x00\xf7\x4c\x2d\x9e\x00\x78\x77\xe1\xc7\
+\xf1\xea\xfc\x8f\xb2\xed\x01\xa8\x71\x0e\x00\x00\xa5\xb0\x07\xa0\
+\x3e\xdb\x1e\x80\xd7\x9b\x3e\x8a\xb7\x9b\x8b\xe3\x06\x3a\xf7\xbf\
+\x9b\x2d\x46\xd2\x6f\x00\xf4\xad\xa9\x11\x00\x00\x74\x7d\x9b\x6d\
+\xb1\x65\x54\x54\x64\xfb\xee\xfc\xcf\x5e\x5f\xd4\xe1\xef\x63\x79\
+\x5b\xc4\x2d\x6f\x64\x7b\x1d\x9b\x6f\xb9\x95\xaf\x01\xfa\x2b\x01\
+\x50\x1a\xaa\xab\xd7\x8a\x2f\x6c\xbd\x4d\xa6\x75\xdc\xf0\xea\xc2\
+\x98\xb6\xa8\x63\xf7\x02\xdc\xfe\xe6\xe2\xcc\xbb\xff\x77\x1e\xb6\
+\x6b\xc9\xff\x3e\x08\x00\x80\x12\xd2\xb8\xcb\x6e\x99\x9e\x9f\x5e\
+\x0b\xe0\xa2\x49\xcd\x1d\xf6\xfa\x97\x7c\xdc\x16\x17\x4e\x5a\xd0\
+\xe1\xe3\x20\x00\x00\xe8\x54\xf2\xf1\xc9\xf7\x8e\xb7\x16\xc7\x53\
+\x33\x5a\x3b\xe4\xf5\x5f\xf0\xfc\x82\x98\x91\xf1\xeb\x88\x03\x07\
+\x0d\x8e\x01\x0d\x0d\x02\xc0\x5f\x07\x80\xd2\x51\xdf\xaf\x5f\x6c\
+\xb4\xc9\xa6\x99\xd6\x91\x1e\x83\x3f\xf6\x91\xb9\x31\x75\x61\xfb\
+\x1e\x0a\x18\xfd\xe6\xe2\xb8\xe6\x0f\xd9\x6f\xe6\xd6\xb8\x8b\xdd\
+\xff\x02\x00\xa0\x04\x35\xe6\x61\x2f\xc0\xfc\xd6\xe5\x71\xe4\x83\
+\x73\x62\xf1\x47\xed\x73\x79\xe0\xe7\x67\x7f\x18\xff\x3e\x2e\x3f\
+\x37\xef\x71\xfc\x5f\x00\x00\x94\xa4\x3d\xf6\xfa\x62\xe6\x6f\x03\
+\xa4\xd2\x13\xf1\x0e\xb8\x6f\x56\xe6\x6b\xf2\x7f\x9e\xc7\xa7\xb7\
+\xc6\x61\x0f\xcc\x8e\xa5\x79\xb8\x17\x41\xba\xfb\x7f\x93\xcd\x36\
+\xf7\x4b\x10\x25\x78\x3b\xe0\x2b\x2e\xb9\x28\xa6\x4f\x9f\xd6\x65\
+\xde\x4f\xf7\xee\x95\x71\xf9\x55\xff\xe5\x37\x19\x58\x65\xfd\x07\
+\x34\xc4\xde\xfb\xee\x1f\x63\xef\xbb\x27\xf3\xba\x26\x25\x9f\xcc\
+\xff\x69\xcc\xfb\x71\xc7\x3e\xfd\x62\xa7\x75\x2a\xf3\xfe\x5a\xaf\
+\x7f\x75\x61\x7c\xf7\xd9\xa6\xf8\x78\x79\x7e\xd6\x77\xfc\x49\x27\
+\x47\x59\x59\x99\x5f\x82\x52\x0c\x80\x74\xf2\x9f\x3a\x65\x4a\x17\
+\x0a\x80\xee\x7e\x8b\x81\xd5\x76\xe4\x57\x8e\x8b\x27\x1e\x7b\x24\
+\x5a\x97\x64\xbf\xba\xdf\xfb\x2d\xcb\x62\xdf\x7b\x66\xc5\x99\xdb\
+\xf5\x89\xd3\xb6\xe9\x13\xd5\xdd\xb3\x4f\xb0\xef\x7c\xf0\x71\x9c\
+\x37\x71\x41\x8c\x99\xd2\x92\xb7\xf7\x9c\x7e\x05\x72\xe8\xce\xc3\
+\x6c\xfc\x15\x1c\x02\x00\x28\x41\x7d\xfb\xd6\xc4\x21\x5f\x1e\x91\
+\xb7\xf5\xa5\xbb\xe7\x2f\x7e\xa1\x39\xb6\xfe\xd5\x8c\xb8\xf1\xb5\
+\x45\xf1\xd1\xf2\x35\xdb\x5d\x3f\x2b\x89\x89\x6f\x8d\x6f\x8a\x1d\
+\x7e\x33\x33\xaf\x93\x7f\xfa\xa9\xff\xab\x5f\xfb\x86\x0d\x5f\xca\
+\x7b\x00\x00\xf8\xb3\x43\xbf\x3c\x32\x77\x18\xa0\x79\xc1\x82\xbc\
+\xad\x73\xf6\x92\x65\x71\xc6\xd3\xf3\xe3\xfc\xe4\xd3\xfb\x7e\x83\
+\x7b\xc6\xc1\x1b\xf4\x8c\xe1\x03\x7b\x46\x75\xb7\x4f\xdf\x2b\x90\
+\xde\x65\xf0\xde\xa9\x2d\xb9\x7b\x0d\x3c\x3d\xb3\x35\x6f\xbb\xfb\
+\xff\xda\x6e\x7b\xec\xe9\xd8\xbf\x00\x00\x20\x55\xd5\xb3\x67\x1c\
+\x79\xcc\x71\x71\xc3\x4f\xf3\x7f\x1e\x51\xf3\x87\xcb\xe3\x57\x6f\
+\x2d\xce\x2d\xdd\xcb\xcb\xa2\x7f\xaf\x8a\x18\x90\x2c\xfd\xab\x2b\
+\xa2\x4f\xf7\xb2\x98\xd3\xba\x3c\x66\x26\x13\x7f\x7a\x02\xe1\x9c\
+\x25\x85\x3d\x89\xb0\x5b\xb7\x6e\x71\xec\x09\x27\xd9\xe0\x02\x00\
+\x80\x4f\xec\xb3\xdf\x01\xf1\xec\xf8\x71\xf1\x87\x57\x5e\x2e\xd8\
+\xcf\x48\x0f\x07\xa4\x97\x0f\xee\xa8\x4b\x08\x1f\x77\xe2\xd7\x62\
+\xdd\xfe\xfd\x6d\xec\x95\x38\x07\x00\xa0\x84\xa5\x5f\x07\x3c\xeb\
+\x9c\x73\x93\x09\x72\x40\x97\x7c\x7f\x5f\xdc\x7b\x9f\x38\xf8\xb0\
+\x11\x36\xb4\x00\x00\x60\x65\x6b\xf5\xee\x1d\xe7\x9c\xf7\x83\xe8\
+\xd9\xb3\x57\x97\x7a\x5f\xe9\x1d\xff\xbe\x79\xea\xe9\x36\xb0\x00\
+\x00\xe0\xd3\x0c\x1a\xbc\x41\x9c\x71\xd6\xf7\xba\xcc\x77\xe4\xeb\
+\xea\xfb\xc5\xd9\xdf\x3f\xdf\x57\xa5\x05\x00\x00\x9f\x67\xa7\xc6\
+\x61\x5d\xe2\x64\xb9\xca\xca\x1e\x71\xce\xb9\x17\xe4\xbe\xea\x88\
+\x00\x00\x60\x15\x7c\xf9\x88\xa3\x62\xc4\x91\x47\x77\xda\xd7\xdf\
+\xab\xba\x3a\xce\x39\xef\x82\xcc\x37\x3c\x12\x00\x00\x94\x9c\xaf\
+\x9c\x70\x52\x9c\xf9\xdd\x73\x72\x9f\xa4\x3b\x93\x01\x0d\xeb\xe5\
+\x2e\x8d\xbe\xed\xf6\x3b\xda\x88\x02\x00\x80\x35\xb1\xfb\x3f\xef\
+\x15\x17\x5f\x71\x55\xd4\xd5\xd5\x77\x8a\xd7\xbb\xed\xf6\x3b\xc4\
+\xe5\x3f\xbe\x26\xd6\x5b\x7f\xa0\x8d\x27\x00\x00\xc8\x62\xe3\x4d\
+\x36\x8d\x2b\x7e\x72\x6d\x6c\xb6\xc5\x96\x45\xfd\x3a\x0f\x38\xf8\
+\xd0\x38\xf7\xc2\x4b\x62\xad\xb5\xd6\xb2\xd1\x04\x00\x00\xf9\xd0\
+\xb7\xa6\x36\x2e\xba\xec\xca\x38\x74\xc4\x11\x45\x77\x46\x7d\xba\
+\x77\xe2\xf4\x6f\x9f\x1d\x27\x7f\xf3\x94\x28\x2f\x37\x9d\xad\x2e\
+\x57\x02\x04\xe0\x33\xa5\x13\xff\x09\x27\x7d\x3d\xf6\x3f\xe8\x90\
+\xb8\xe3\xb6\x5b\x72\x77\x11\x6c\x6b\x6b\xeb\xb0\xd7\x93\x9e\xe8\
+\x77\xf8\xc8\xa3\xe2\xc0\x43\x0f\xeb\x74\xe7\x29\x14\x93\xf4\x0b\
+\x9f\x6b\xbc\x15\xd3\x63\x2d\xd7\xdc\x70\xb3\x51\x04\x28\x21\x53\
+\xdf\x99\x12\xb7\xdd\x7c\x53\xbc\xf4\xc2\xf3\xed\x1e\x22\xfb\x1d\
+\x78\x48\x8c\x3c\xea\x98\xdc\xc5\x8b\x4a\xdd\xa9\xdf\x38\x29\xa6\
+\xbf\x37\xcd\x1e\x00\x00\xda\xc7\x06\x1b\x6e\x14\xe7\x5e\x78\x71\
+\xee\xfe\x01\xf7\xdd\xfd\xbb\x78\xf9\xc5\x49\xb1\x74\xe9\xd2\x82\
+\xfd\xbc\xda\xba\xba\x68\xdc\x65\xb7\x38\x6c\xc4\x11\xd1\x6f\x9d\
+\x75\x6d\x80\x3c\x11\x00\x00\xac\x91\xad\xb7\xdd\x2e\xb7\x7c\xf8\
+\xe1\xd2\x24\x02\x5e\x8c\x89\xcf\x8e\x8f\xe7\x27\x4e\x88\x0f\x9a\
+\x9b\x33\xaf\x7b\xe0\xa0\xc1\xc9\xa4\xbf\x6b\x6e\xe2\xdf\x78\xd3\
+\xcd\xba\xcc\x15\x0a\x05\x00\x00\x5d\x46\x7a\x1c\x7e\xe7\x61\xbb\
+\xe4\x96\xf4\xdc\x80\xd7\x5f\x9d\x1c\x2f\xbd\x38\x29\x66\xcf\x9a\
+\x15\x4d\xf3\xe6\xc5\xbc\x79\x73\x63\x7e\xb2\xb4\xb6\xb6\xfe\xdd\
+\x73\xfb\xf4\x59\x3b\xf7\x09\xbf\xb6\xae\x3e\xea\x92\xc7\xf5\x07\
+\x0d\x8a\x9d\x1a\x77\x8d\x01\x0d\x0d\x06\x56\x00\x00\xd0\x59\xa4\
+\x9f\xd4\xb7\x1a\xb2\x75\x6e\x59\x59\x4b\x4b\x4b\x2e\x04\x5a\x16\
+\x2f\x8e\xb5\xfb\xd6\xe4\x26\x7e\xd7\xea\x17\x00\x00\x74\x71\xbd\
+\x7a\xf5\x4a\x96\x41\x06\xa2\x48\xf8\xe2\x24\x00\x08\x00\x00\x40\
+\x00\x00\x00\x02\x00\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00\
+\x20\x00\x00\x00\x01\x00\x00\x08\x00\x00\x40\x00\x00\x00\x02\x00\
+\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00\x20\x00\x00\x00\x01\
+\x00\x00\x08\x00\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00\x20\
+\x00\x00\x00\x01\x00\x00\x08\x00\x00\x40\x00\x00\x00\x02\x00\x00\
+\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00\x20\x00\x00\x00\x01\x00\
+\x00\x08\x00\x00\x40\x00\x00\x00\x02\x00\x00\x10\x00\x00\x20\x00\
+\x00\x00\x01\x00\x00\x08\x00\x00\x40\x00\x00\x00\x02\x00\x00\xe8\
+\x5c\xba\x95\xda\x1b\x9e\xf6\xa7\x77\xe3\x89\x47\x1f\xb6\xe5\x01\
+\xf8\x8b\x3d\x87\xef\x1d\x03\x07\x0d\x16\x00\x5d\xd9\x8c\xe9\xef\
+\xc5\x98\x3b\x7f\xed\xb7\x1d\x80\xbf\xd8\x6c\x8b\x2d\x4b\x2e\x00\
+\x1c\x02\x00\x80\x12\x24\x00\x00\x40\x00\x00\x00\x02\x00\x00\x10\
+\x00\x00\x80\x00\x00\x00\x04\x00\x00\x20\x00\x00\x00\x01\x00\x00\
+\x08\x00\x00\x40\x00\x00\x00\x02\x00\x00\x10\x00\x00\x80\x00\x00\
+\x00\x32\x2a\xb9\xdb\x01\x6f\xb6\xf9\x96\x71\xf6\xf7\xcf\x6f\xd7\
+\x9f\x39\xe5\xed\x3f\xc6\x6f\x46\xff\x72\x8d\x9f\xbf\xef\xbe\xfb\
+\xc6\xf1\xc7\x1f\xef\xb7\x15\xe8\x14\x6e\xbb\xed\xb6\x18\x3b\x76\
+\xec\x1a\x3f\xff\x88\x63\x8e\x8d\x8d\x36\xde\xa4\xdd\xe7\x06\x01\
+\xd0\xc5\xd5\xd4\xd6\x46\xe3\x2e\xbb\xb5\xeb\xcf\xac\xac\xac\xcc\
+\xf4\xfc\x0d\x37\xdc\x30\x0e\x3c\xf0\x40\xff\xaa\x00\x9d\xc2\xb8\
+\x71\xe3\x32\x3d\x7f\x8b\x2d\xb7\x8a\xed\x77\xdc\xc9\x40\x16\x98\
+\x43\x00\x00\x20\x00\x00\x00\x01\x00\x00\x08\x00\x00\x40\x00\x00\
+\x00\x02\x00\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00\x20\x00\
+\x00\x00\x01\x00\x00\x08\x00\x00\x40\x00\x00\x00\x02\x00\x00\x10\
+\x00\x00\x80\x00\x00\x00\x04\x00\x00\x20\x00\x00\x40\x00\x00\x00\
+\x02\x00\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00\x20\x00\x00\
+\x00\x01\x00\x00\x08\x00\x00\x40\x00\x00\x00\x02\x00\x00\x10\x00\
+\x00\x80\x00\x00\x00\x04\x00\x00\x20\x00\x00\x00\x01\x00\x00\x08\
+\x00\x00\x40\x00\x00\x80\x00\x00\x00\x04\x00\x00\x20\x00\x00\x00\
+\x01\x00\x00\x08\x00\x00\x40\x00\x00\x00\x02\x00\x00\x10\x00\x00\
+\x80\x00\x00\x00\x04\x00\x00\xd0\x0e\xba\x19\x02\x0a\x61\xc6\x8c\
+\x19\x31\x77\xee\x5c\x03\x01\x19\xd5\xd7\xd7\x47\x43\x43\x83\x81\
+\x40\x00\xd0\x39\x5c\x7d\xf5\xd5\x71\xdd\x75\xd7\x19\x08\xc8\x68\
+\xd4\xa8\x51\x71\xd9\x65\x97\x19\x08\xf2\xce\x21\x00\x00\x10\x00\
+\x00\x80\x00\x00\x00\x04\x00\x00\x20\x00\x00\x00\x01\x00\x00\x08\
+\x00\x00\x40\x00\x00\x00\x02\x00\x00\xe8\x40\x99\xae\x04\xd8\x34\
+\x7f\x5e\xfc\xe4\x3f\x7f\x64\x14\x3f\xc7\xfc\x79\x2e\x89\x0b\xb0\
+\xaa\xee\x1a\xf3\x3f\x31\xee\xc9\x27\x0c\xc4\x2a\xcc\xc1\x1d\x16\
+\x00\x2d\x2d\x2d\xf1\xf8\x23\x0f\xd9\x0a\x00\xe4\xcd\x2b\x2f\xbd\
+\x68\x10\xda\x81\x43\x00\x00\x20\x00\x00\x00\x01\x00\x00\x74\x49\
+\x6e\x07\x4c\x41\x0c\x1d\x3a\x34\x8e\x39\xe6\x18\x03\x01\x79\xf8\
+\xbb\x04\x02\x80\x4e\x63\xe4\xc8\x91\xb9\x05\x80\xe2\xe4\x10\x00\
+\x00\x08\x00\x00\x40\x00\x00\x00\x02\x00\x00\x10\x00\x00\x80\x00\
+\x00\x00\x04\x00\x00\x20\x00\x00\x00\x01\x00\x00\x74\xa0\xf4\x4a\
+\x80\xdb\x1b\x86\x82\xdb\x35\x59\xae\x35\x0c\x00\xab\xe4\x94\x64\
+\x79\xc6\x30\x14\x38\x00\xda\xda\xda\x5e\x36\x0c\x85\x55\x56\x56\
+\xd6\xdf\x28\x00\xac\xb2\x29\xe6\xa6\xc2\x73\x08\x00\x00\x04\x00\
+\x00\x20\x00\x00\x00\x01\x00\x00\x08\x00\x00\x40\x00\x00\x00\x02\
+\x00\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00\x20\x00\x00\x00\
+\x01\x00\x00\x08\x00\x00\x40\x00\x00\x00\x02\x00\x00\x10\x00\x00\
+\x80\x00\x00\x00\x04\x00\x00\x08\x00\x00\x40\x00\x00\x00\x02\x00\
+\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00\x50\xcc\xba\x19\x02\
+\x0a\xe1\xb9\xe7\x9e\x8b\xc9\x93\x27\x1b\x08\xc8\x68\xc8\x90\x21\
+\xd1\xd8\xd8\x68\x20\x10\x00\x74\x0e\x63\xc6\x8c\x89\xeb\xae\xbb\
+\xce\x40\x40\x46\xa3\x46\x8d\x12\x00\x14\x84\x43\x00\x00\x20\x00\
+\x00\x00\x01\x00\x00\x08\x00\x00\x40\x00\x00\x00\x02\x00\x00\x10\
+\x00\x00\x80\x00\x00\x00\x04\x00\x00\x20\x00\x00\x00\x01\x00\x00\
+\x08\x00\x00\x40\x00\x00\x00\x02\x00\x00\x58\x5d\x6e\x07\x4c\x41\
+\x1c\x74\xd0\x41\x31\x78\xf0\x60\x03\x01\x19\x6d\xb3\xcd\x36\x06\
+\x01\x01\x40\xe7\xb1\xfb\xee\xbb\xe7\x16\x00\x8a\x93\x43\x00\x00\
+\x20\x00\x00\x00\x01\x00\x00\x08\x00\x00\x40\x00\x00\x00\x02\x00\
+\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00\x20\x00\x00\x00\x01\
+\x00\x00\x08\x00\x00\x40\x00\x00\x00\x02\x00\x00\x10\x00\x00\x80\
+\x00\x00\x00\x04\x00\x00\x20\x00\x00\x40\x00\x00\x00\x02\x00\x00\
+\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00\x20\x00\x00\x00\x01\x00\
+\x00\x08\x00\x00\x40\x00\x00\x00\x02\x00\x00\x10\x00\x00\x80\x00\
+\x00\x00\x04\x00\x00\x20\x00\x00\x00\x01\x00\x00\x08\x00\x00\x40\
+\x00\x00\x40\xc9\xea\x66\x08\x28\x84\x3b\xef\xbc\x33\x1e\x7d\xf4\
+\x51\x03\x01\x19\x0d\x1f\x3e\x3c\x46\x8e\x1c\x69\x20\x10\x00\x74\
+\x0e\x93\x26\x4d\x8a\xd1\xa3\x47\x1b\x08\xc8\x68\xed\xb5\xd7\x16\
+\x00\x14\x84\x43\x00\x00\x20\x00\x00\x00\x01\x00\x00\x08\x00\x00\
+\x40\x00\x00\x00\x02\x00\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\
+\x00\x20\x00\x00\x00\x01\x00\x00\x08\x00\x00\x40\x00\x00\x00\x02\
+\x00\x00\x58\x5d\x6e\x07\x4c\x41\x9c\x7a\xea\xa9\x31\x62\xc4\x08\
+\x03\x01\x19\xf5\xef\xdf\xdf\x20\x20\x00\xe8\x3c\x06\x0e\x1c\x98\
+\x5b\x00\x28\x4e\x0e\x01\x00\x80\x00\x00\x00\x04\x00\x00\x20\x00\
+\x00\x00\x01\x00\x00\x08\x00\x00\x40\x00\x00\x00\x02\x00\x00\x10\
+\x00\x00\x80\x00\x00\x00\x04\x00\x00\x20\x00\x00\x00\x01\x00\x00\
+\x08\x00\x00\x40\x00\x00\x00\x02\x00\x00\x10\x00\x00\x80\x00\x00\
+\x00\x01\x00\x00\x08\x00\x00\x40\x00\x00\x00\x02\x00\x00\x10\x00\
+\x00\x80\x00\x00\x00\x04\x00\x00\x20\x00\x00\x00\x01\x00\x00\x08\
+\x00\x00\x40\x00\x00\x00\x02\x00\x00\x10\x00\x00\x80\x00\x00\x00\
+\x04\x00\x00\x20\x00\x00\x00\x01\x00\x00\x25\xab\x9b\x21\xa0\x10\
+\xae\xbc\xf2\xca\x18\x3d\x7a\xb4\x81\xa0\xd3\xab\xaf\xaf\x8f\x07\
+\x1f\x7c\xd0\x40\x20\x00\x60\x55\xcc\x9e\x3d\x3b\xde\x7a\xeb\x2d\
+\x03\x41\xa7\xd7\xdc\xdc\x6c\x10\xe8\x92\x1c\x02\x00\x00\x01\x00\
+\x00\x08\x00\x00\x40\x00\x00\x00\x02\x00\x00\x10\x00\x00\x80\x00\
+\x00\x00\x04\x00\x00\x20\x00\x00\x00\x01\x00\x00\x08\x00\x00\x40\
+\x00\x00\x00\x02\x00\x00\x10\x00\x00\xc0\xea\x72\x3b\x60\x0a\xe2\
+\xb2\xcb\x2e\xcb\x2d\x00\xd8\x03\x00\x00\x08\x00\x00\x40\x00\x00\
+\x00\x02\x00\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00\x20\x00\
+\x00\x00\x01\x00\x00\x08\x00\x00\x40\x00\x00\x80\x00\x00\x00\x04\
+\x00\x00\x20\x00\x00\x00\x01\x00\x00\x08\x00\x00\x40\x00\x00\x00\
+\x02\x00\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00\x20\x00\x00\
+\x00\x01\x00\x00\x08\x00\x00\x40\x00\x00\x00\x02\x00\x00\x10\x00\
+\x00\x80\x00\x00\x00\x01\x00\x00\x08\x00\x00\x40\x00\x00\x00\x02\
+\x00\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00\x20\x00\x00\x00\
+\x01\x00\x00\x08\x00\x00\x40\x00\x00\x00\x02\x00\x00\x10\x00\x00\
+\x80\x00\x00\x00\x04\x00\x00\x20\x00\x00\x00\x01\x00\x00\x02\x00\
+\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00\x20\x00\x00\x00\x01\
+\x00\x00\x08\x00\x00\x40\x00\x00\x00\x02\x00\x00\x10\x00\x00\x80\
+\x00\x00\x00\x04\x00\x00\x90\x17\x65\x6d\x6d\x6d\x46\xa1\xd0\x83\
+\x5c\x56\xb6\x6f\xf2\xf0\xc0\x9a\x3e\xbf\xb2\xb2\x32\xaa\xaa\xaa\
+\x0c\x24\xd0\x29\xb4\xb6\xb6\xc6\x87\x1f\x7e\x98\x65\x15\xfb\x25\
+\x73\xd3\x58\x23\x59\x58\xdd\x0c\x41\xf1\x4b\xff\x22\x65\xfc\xcb\
+\x04\x00\x7f\xc3\x21\x00\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\
+\x00\x20\x00\x00\x00\x01\x00\x00\x08\x00\x00\x40\x00\x00\x00\x02\
+\x00\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00\x20\x00\x00\x80\
+\x8c\xdc\x0d\xb0\x7d\x2c\x49\x96\x77\x0d\x03\xc0\x2a\xff\x9b\x49\
+\x81\x95\xb5\xb5\xb5\x19\x05\x00\x28\x31\x0e\x01\x00\x80\x00\x00\
+\x00\x04\x00\x00\x20\x00\x00\x00\x01\x00\x00\x08\x00\x00\x40\x00\
+\x00\x00\x02\x00\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00\x20\
+\x00\x00\x00\x01\x00\x00\x08\x00\x00\x40\x00\x00\x00\x02\x00\x00\
+\x10\x00\x00\x80\x00\x00\x00\x01\x00\x00\x08\x00\x00\xa0\xab\xfa\
+\x7f\xb9\xf7\xf3\xd9\x85\xa5\xa3\x33\x00\x00\x00\x00\x49\x45\x4e\
+\x44\xae\x42\x60\x82\
+\x00\x00\x0e\x41\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x03\x00\x00\x00\xc3\xa6\x24\xc8\
+\x00\x00\x00\x03\x73\x42\x49\x54\x08\x08\x08\xdb\xe1\x4f\xe0\x00\
+\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\x82\x00\x00\x0e\x82\x01\
+\xea\x09\x0f\xe9\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\
+\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\x70\
+\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x02\xe8\x50\x4c\x54\
+\x45\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x01\x00\x01\x01\x00\x01\x02\x01\x02\x04\x02\
+\x03\x07\x04\x04\x0b\x06\x05\x0e\x07\x06\x0f\x08\x07\x05\x02\x07\
+\x06\x02\x07\x12\x09\x08\x14\x0a\x0a\x1a\x0e\x0d\x09\x04\x0d\x0b\
+\x04\x0d\x21\x11\x0f\x28\x15\x12\x30\x19\x13\x31\x1a\x16\x39\x1e\
+\x17\x13\x06\x17\x3d\x20\x19\x42\x22\x19\x43\x23\x1d\x4d\x28\x21\
+\x1b\x09\x21\x58\x2e\x25\x1a\x0a\x26\x63\x34\x29\x22\x0c\x2a\x6d\
+\x39\x2b\x71\x3b\x2d\x1f\x0c\x2d\x77\x3e\x2e\x26\x0d\x2e\x79\x3f\
+\x31\x80\x43\x31\x81\x43\x34\x88\x47\x35\x2c\x0f\x36\x8f\x4b\x39\
+\x96\x4e\x3b\x9b\x51\x3c\x2a\x11\x3d\x32\x11\x3d\xa1\x54\x3f\xa5\
+\x56\x40\xa9\x58\x41\x36\x12\x41\xac\x5a\x42\xae\x5b\x43\xaf\x5c\
+\x43\xb0\x5c\x46\x30\x13\x47\x3a\x14\x4c\x3f\x15\x4f\x41\x16\x52\
+\x44\x17\x57\x48\x19\x61\x44\x1b\x63\x52\x1c\x67\x55\x1d\x68\x56\
+\x1d\x6a\x4a\x1d\x6c\x59\x1e\x6f\x5b\x1f\x75\x51\x20\x77\x62\x22\
+\x84\x5c\x25\x94\x67\x29\x97\x7c\x2b\xa5\x73\x2d\xa8\x8a\x2f\xaf\
+\x90\x31\xbf\x9d\x36\xd1\xac\x3b\xd4\x93\x3a\xd8\xb2\x3d\xe5\xa0\
+\x3f\xe7\xbe\x41\xea\xc1\x42\xef\xc5\x43\xf1\xc6\x44\xf9\xad\x45\
+\xfa\xae\x45\xfe\xd1\x48\xff\xd2\x48\x29\x97\xed\x34\x00\x00\x00\
+\xa0\x74\x52\x4e\x53\x00\x01\x02\x03\x05\x06\x07\x09\x0a\x0b\x0c\
+\x0e\x0f\x10\x11\x13\x14\x15\x16\x17\x18\x19\x1b\x1c\x1d\x1e\x1f\
+\x24\x25\x26\x27\x28\x2c\x2d\x2e\x2f\x30\x31\x32\x38\x39\x3a\x3b\
+\x3c\x3d\x43\x44\x45\x46\x47\x48\x4a\x50\x51\x52\x53\x54\x55\x5d\
+\x5e\x5f\x60\x61\x62\x63\x68\x6c\x6d\x6e\x6f\x70\x71\x72\x73\x7c\
+\x7d\x7e\x7f\x80\x81\x82\x83\x8b\x8c\x8d\x8e\x8f\x90\x91\x92\x95\
+\x96\x9a\x9b\x9c\x9d\x9e\x9f\xa0\xa1\xa8\xa9\xaa\xab\xac\xad\xae\
+\xaf\xb6\xb7\xb8\xb9\xba\xbb\xbc\xbd\xc0\xc2\xc3\xc4\xc5\xc6\xc7\
+\xcd\xce\xcf\xd0\xd1\xd2\xd6\xd7\xd8\xd9\xda\xdb\xdf\xe0\xe1\xe2\
+\xe3\xe5\xe7\xe8\xe9\xea\xee\xef\xf0\xf1\xf3\xf4\xf5\xf6\xf8\xf9\
+\xfa\xfb\xfc\xfd\xfe\x15\x62\x7a\x32\x00\x00\x0a\x1f\x49\x44\x41\
+\x54\x78\xda\xed\xdd\x69\x9c\x55\x65\x01\xc7\xf1\x3b\xce\x8c\x0e\
+\x22\x59\x90\x10\x15\x64\x46\xd9\x42\x05\x66\x8b\xed\x50\xda\x1e\
+\xd1\x06\x69\x8b\xed\xb6\x90\x89\x46\xb4\x90\x4b\x96\x06\x96\xd1\
+\x82\x60\xd1\x3c\xae\x59\x69\xb9\x55\x1a\x99\x65\x99\xa9\xa5\xa6\
+\xde\x6c\x5f\x6d\xdf\xf7\xb7\xb1\x84\x03\x87\x67\xce\xcc\x3d\x73\
+\xcf\x39\xf7\x9c\xf3\xfd\xbd\x3c\xf7\x7e\x86\xc3\xf3\x7c\xdf\xc0\
+\xe7\xff\x81\x56\x4b\x65\x34\xf5\xa8\x99\x0e\xa1\xc1\x4d\x59\x15\
+\x4e\x9c\xea\x18\x1a\xdb\xd0\xca\x10\xc2\xaa\x29\x0e\xa2\xa1\x0d\
+\x1e\x19\xb6\xb4\x72\xc8\x51\x34\xb2\xfe\x23\xc2\xb6\x8e\x1c\x74\
+\x18\x0d\xac\xef\xf0\xb0\xbd\x23\xfa\x1d\x47\xf3\x7a\x61\x18\xe9\
+\xf0\x3e\xe7\xd1\xb4\x9e\x15\x76\x6c\x89\x03\x69\x58\x07\x87\x9d\
+\x7b\xb6\x23\x69\x54\x8f\x1b\x4e\x00\x08\x87\x38\x94\x06\xf5\x88\
+\x8d\xc9\xfb\x0f\xc3\x8f\x77\x2c\x8d\x69\xde\xe9\x61\xd7\x36\x3e\
+\xd2\xc1\x34\xa4\x07\x9c\x16\x62\x9d\x3e\xcf\xd1\x34\xa2\xfb\x7c\
+\x28\xc4\x3b\xed\x81\x0e\xa7\x01\xcd\x3a\x35\x8c\xd6\x87\xe7\x38\
+\x9e\xda\x77\xb7\xf7\x85\xd1\x3b\x75\x96\x03\xaa\x79\x53\x4f\x0c\
+\x69\xad\x36\x0f\xa8\x77\x7b\xad\x0a\xe9\x99\x07\xd4\xba\xa1\xb7\
+\x86\xb1\x7a\x97\x79\x40\x7d\x1b\x7c\x53\x18\xbb\x95\x93\x1c\x54\
+\x4d\xeb\x7f\x6d\x18\x4f\xe6\x01\x35\xad\xef\x65\x61\x7c\xbd\xce\
+\x3c\xa0\x96\xbd\x20\x8c\xb7\x97\x9b\x07\xd4\xb0\x67\xc6\xae\xfa\
+\xbc\x6f\x9e\x1f\x7b\x5c\xc6\x3c\x60\xef\x05\x75\x6f\xef\x52\xef\
+\xff\xe0\xd8\x45\x9f\x7b\x6d\xfb\xba\xf3\x62\x1f\x94\x30\x0f\x98\
+\x13\xea\x5e\xa9\x7f\xcf\xba\xeb\x00\x60\x73\xe7\x5c\xd3\x6e\xb7\
+\xaf\x3d\x37\xf6\xb2\x87\x00\x50\x2b\x00\x91\x01\x40\x08\x67\x5f\
+\xdd\xde\xd2\x35\xe7\x44\x3e\x1b\x7e\x02\x00\x35\x02\xf0\xd0\xd8\
+\x00\xe0\xac\xab\xda\xdb\xba\xfa\xec\xd8\x3c\xe0\x51\x00\xd4\x06\
+\xc0\xfd\xd7\x45\x5e\xe7\x8c\x2b\xdb\xdb\xbb\xea\xac\xd8\x3c\x60\
+\x3e\x00\x35\x01\x10\x1f\x00\x5c\xd1\x1e\xe9\xca\x33\xca\x9f\x07\
+\x00\x90\x57\xf7\xfc\x40\xec\x6d\x36\xb5\x77\xec\x8a\xf2\xe7\x01\
+\x00\xe4\x54\x7c\x00\x70\x79\x7b\xe7\x36\x45\xe7\x01\xb3\x01\xa8\
+\x3c\x80\xbb\xbc\x3b\xf6\x2e\x97\xdd\x9a\x00\xd0\xbe\xbc\xec\x79\
+\x00\x00\xb9\xb4\xd7\x3b\x63\xaf\x72\xe9\x2d\xc9\xfb\x6f\xdf\x7a\
+\x59\xec\x8b\xef\x99\x06\x40\xa5\x01\xc4\x07\x00\x17\xdf\xdc\xde\
+\xb5\x5b\x2e\x2d\x77\x1e\x00\x40\x0e\xc5\x07\x00\x17\xdd\xd4\x8e\
+\x75\xf3\xc5\xb1\x2f\xbf\x6d\x12\x00\x95\x05\x10\x1f\x00\x5c\x78\
+\x63\x3b\xde\x4d\x17\xc5\xbe\xfe\xe6\x41\x00\x2a\x0a\x20\x3e\x00\
+\xb8\xe0\x86\xf6\x68\xdd\x78\x61\x89\xf3\x00\x00\x8a\x19\x00\x9c\
+\x7f\x7d\x7b\xf4\x6e\xb8\xa0\xbc\x79\x00\x00\xc5\x0c\x00\xae\x6b\
+\xa7\x75\x7d\x74\x1e\xb0\xb4\x0c\x00\x3f\xfc\x43\xd5\xfb\x7e\xb9\
+\x00\x9e\x3c\xca\x00\x20\xbd\xf8\x3c\x60\x51\x09\x00\x6e\xff\x6f\
+\xd5\xfb\x65\xa9\x00\x1e\x3b\xea\x00\x20\xbd\xf8\x3c\xe0\x29\x00\
+\x54\x0c\xc0\xc3\x53\x06\x00\xe9\x95\x35\x0f\x00\xa0\xb8\x01\x40\
+\x7a\x25\xcd\x03\x00\x28\x70\x00\x90\x5e\x39\xf3\x00\x00\xba\xd7\
+\x7e\x63\x0e\x00\xd2\x2b\x65\x1e\x00\x40\xa1\x03\x80\xf4\xe2\xf3\
+\x80\xfb\x02\x50\x09\x00\x33\x4e\x1e\xcf\x00\x20\xbd\xe8\x3c\xe0\
+\x83\xb3\x01\xa8\x00\x80\xf1\x0e\x00\xd2\x2b\x7e\x1e\x00\x40\xc1\
+\x03\x80\xf4\x8a\x9f\x07\x00\xd0\x9d\x01\xc0\x8a\x71\x0f\x00\xd2\
+\x2b\x7c\x1e\x00\x40\x57\x06\x00\xcb\x3a\x18\x00\xa4\x57\xf4\x3c\
+\x00\x80\x2e\xb4\xdb\x6b\x3a\x1a\x00\xa4\x57\xf0\x3c\x00\x80\x2e\
+\xf4\xd2\x0e\x07\x00\xe9\xc5\xe7\x01\xaf\xef\x07\xa0\x57\x01\x3c\
+\xbf\xe3\x01\x40\x7a\xf1\x79\xc0\x2b\xfa\x00\xe8\x4d\x00\xcf\xc8\
+\x30\x00\x68\xf7\xcc\x3c\x00\x80\x89\xf6\xa4\x4c\x03\x80\x9e\x99\
+\x07\x00\x30\xc1\x1e\x93\x71\x00\x90\x65\x1e\xf0\x54\x00\x7a\x0e\
+\x40\xf6\x01\x40\x8f\xcc\x03\x00\x98\x50\x0f\xd9\x90\x7d\x00\x90\
+\x65\x1e\x70\x10\x00\x3d\x05\x60\xff\x09\x0d\x00\xb2\xcc\x03\x0e\
+\x00\xa0\x87\x00\xec\xb7\x76\x62\x03\x80\x2c\xf3\x80\x07\x01\xd0\
+\x33\x00\xee\x31\xe1\x01\x40\x0f\xcc\x03\x00\x28\x75\x00\x50\xfe\
+\x3c\x00\x80\xcc\x03\x80\x13\xba\x31\x00\xc8\x30\x0f\x58\x73\x77\
+\x00\x7a\x00\x40\x97\x06\x00\xa5\xcf\x03\x00\xc8\xd6\x1e\xdd\x1a\
+\x00\x64\x99\x07\x1c\x3b\x05\x80\x92\x01\x0c\x74\x6f\x00\x50\xf2\
+\x3c\x00\x80\xd2\x07\x00\x59\xe6\x01\x47\xed\x0e\x40\x99\x00\xba\
+\x3b\x00\x28\x75\x1e\x00\x40\x86\x9e\xd7\xe5\x01\x40\x99\xf3\x00\
+\x00\x3a\xef\xe9\x5d\x1f\x00\x64\x99\x07\xbc\x08\x80\x92\x00\xe4\
+\x31\x00\xc8\x32\x0f\x78\x0e\x00\xa5\x00\xc8\x67\x00\x50\xda\x3c\
+\x00\x80\x0e\x3b\x30\xa7\x01\x40\x86\x79\x40\x78\x22\x00\x85\x03\
+\xc8\x6f\x00\x90\x61\x1e\xf0\x89\x83\x00\x28\x18\x40\x9e\x03\x80\
+\x0c\xf3\x80\x8f\x1d\x00\x40\xa1\x00\xf2\x1d\x00\x94\x32\x0f\x00\
+\xa0\x93\x01\xc0\xfb\xf3\x1d\x00\x94\x31\x0f\x00\xa0\x97\x06\x00\
+\x59\xe6\x01\xf7\x02\xa0\x20\x00\x45\x0c\x00\x8a\x9f\x07\x00\x30\
+\xde\x26\xbf\xa3\x80\x01\x40\x96\x79\xc0\x7b\xa7\x01\x50\x00\x80\
+\x3d\xde\x52\xc8\x00\x20\xd3\x3c\xe0\x4e\x00\xe4\x0e\x60\xe0\x8d\
+\x05\x0d\x00\xb2\xcc\x03\xde\x3e\x09\x80\x9c\x01\xec\xf6\xea\xc2\
+\x06\x00\x05\xcf\x03\x00\x18\x57\x2f\x29\x70\x00\x90\x65\x1e\xf0\
+\x86\x7e\x00\xf2\x04\x50\xec\x00\x20\xcb\x3c\xe0\x95\x7d\x00\xe4\
+\x07\x20\x3a\x00\x08\x5f\xd8\x94\xda\x57\x33\x5f\xf1\x37\xd2\x7f\
+\x70\xf4\x8f\x02\x99\xe7\x01\x00\x8c\xdd\xc2\x4c\xff\x51\xc5\x25\
+\x99\x01\x7c\x31\xd3\xaf\xb7\x18\x80\x9c\x00\x3c\x7a\xb8\x12\x00\
+\xc2\xd3\x00\xc8\x05\xc0\x81\x1f\x0f\xd5\x00\x90\x6d\x1e\x00\xc0\
+\x18\x3d\x78\x43\xa8\x0a\x80\x4c\xf3\x00\x00\xc6\x18\x00\x7c\x34\
+\x54\x06\x40\xa6\x79\x00\x00\xa9\xdd\x7b\x6d\xa8\x10\x80\xb0\x7e\
+\x2e\x00\x5d\x05\x10\x1f\x00\xf4\x2e\x80\xf0\x91\xfb\x01\xd0\x45\
+\x00\xd3\x4f\x0a\x15\x03\xd0\xf9\x3c\x00\x80\xd1\xbb\xf3\x09\xa1\
+\x72\x00\x3a\x9e\x07\x00\xd0\xe1\x00\xa0\xd7\x01\x74\x3a\x0f\x00\
+\xa0\xb3\x01\x40\xef\x03\xe8\x70\x1e\x00\x40\x47\x03\x80\x2a\x00\
+\xe8\x6c\x1e\x00\xc0\x28\x03\x80\x57\x85\xca\x02\x08\xcb\x77\x07\
+\x60\xa2\x00\x5e\x1c\x2a\x0c\xa0\x93\x79\x00\x00\xd1\x9e\x1b\x2a\
+\x0d\xa0\x83\x79\x00\x00\xb1\x06\xf7\xcf\x50\x6e\x00\x1e\x96\xe1\
+\x65\x26\x01\x50\xd0\x3f\x17\x3f\x52\x6e\x00\xee\x9a\xe7\x5b\x03\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x40\
+\xbc\x7f\xfe\xa3\x07\xfb\x59\xe2\x77\x34\x77\x4a\x41\xe5\x06\x60\
+\x56\x5e\x6f\xdc\x3f\x51\x00\x9f\x0f\xea\xcd\x41\xc8\xf8\x9a\x03\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x10\xef\xa7\x3f\xd2\x48\xb9\x01\xf8\x41\xb7\xde\xf0\x2b\
+\xdd\x06\xa0\x1d\xcb\x0d\xc0\xdf\xba\xf5\x86\xb7\x03\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb8\x48\x00\x04\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf2\x02\xf0\xa7\
+\xdb\x94\x5a\xe2\x24\x3f\x79\x49\xd6\x3e\x93\xf8\x49\xdf\xed\xd6\
+\x1b\x7e\x69\x42\x00\xfe\x18\x54\xb3\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x62\x00\x7e\xfd\
+\x6f\x55\xac\x5f\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x38\x50\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\
+\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\
+\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\
+\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\
+\x01\x20\x00\x04\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x81\x02\x20\x00\x04\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\
+\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\
+\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0e\x14\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\
+\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\
+\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\
+\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\
+\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\
+\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x00\x88\x00\
+\xd8\x37\xf1\xec\x17\x00\xd4\xb7\x9f\x27\xae\x70\xdf\xcd\x00\xf6\
+\x49\x3c\xfb\x3a\x00\xf5\xed\x6b\x89\x2b\xdc\x67\x33\x80\x81\xc4\
+\xb3\x33\xff\x0e\x40\x5d\xfb\xeb\x99\x89\x2b\x1c\xd8\x0c\xa0\xb5\
+\x36\xf1\xf0\xf7\x00\xd4\xb5\xdf\x25\x6e\x70\xed\x96\xfb\x6f\x1d\
+\x93\x78\xfa\x13\x00\xea\xda\x8f\x13\x37\x78\xcc\x56\x00\x8b\x13\
+\x4f\x3f\xfd\x17\x00\xea\xd9\x9f\x3f\x95\xb8\xc1\xc5\x5b\x01\xcc\
+\x4b\x3c\x0d\xdf\xf9\x0f\x00\x75\xec\x5f\xdf\x4e\xde\xf4\xbc\xad\
+\x00\xf6\x5c\x97\x7c\xfe\x5b\x00\xea\xd8\x6f\x92\xf7\xbc\x6e\xcf\
+\xad\x00\x5a\x87\x25\x3f\xf8\xdc\x6d\xd1\xbe\x95\xf8\xda\x97\xbf\
+\xa7\x2a\xf5\xd9\xe4\x3d\x1f\xb6\xed\xfe\x5b\xb3\x87\x83\x1a\xd8\
+\xf0\xec\xff\x03\x68\x2d\x73\x18\x4d\x6c\xd9\xf6\xfb\x6f\xcd\x77\
+\x18\x4d\x6c\xfe\x1d\x00\xfa\x8e\x77\x1a\xcd\xeb\xf8\xbe\x3b\x00\
+\xb4\x16\x38\x8e\xe6\xb5\x60\xe4\xfe\x5b\x43\xab\x9d\x47\xd3\x5a\
+\x3d\xb4\x03\x80\xd6\xdc\x8d\x4e\xa4\x59\x6d\x9c\xdb\xda\xa9\x45\
+\x8e\xa4\x59\x2d\xda\xf9\xfe\x5b\xfd\x2b\x9c\x49\x93\x5a\xd1\x9f\
+\x00\xd0\x9a\xb9\xc6\xa9\x34\xa7\x35\x33\x5b\xbb\x34\xe3\x38\xe7\
+\xd2\x94\x8e\x9b\xd1\x8a\x34\x79\xb9\x93\x69\x46\xcb\x27\xb7\xa2\
+\x0d\x2c\xd9\xe0\x70\xea\xdf\x86\x25\x03\xad\xd1\x9a\xbe\x74\xbd\
+\x03\xaa\x77\xeb\x97\x4e\x6f\xa5\x35\x6d\xe1\xa1\x47\x9f\xe2\x98\
+\xea\xd9\x29\x47\x1f\xba\x70\x5a\xe2\xc2\xff\x07\x6f\x5b\xb9\xf1\
+\xc9\xac\x78\xa4\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\
+\x00\x00\x4f\x50\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0d\xd7\x00\x00\x0d\xd7\
+\x01\x42\x28\x9b\x78\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x4e\xcd\x49\x44\
+\x41\x54\x78\xda\xed\xbd\x07\xb4\x15\x45\xba\xb7\x5f\x70\x0e\x70\
+\xc8\x39\x09\x12\x44\x01\x11\x45\x24\x88\x28\x28\x8a\x22\x46\x14\
+\x11\x31\x21\x8a\x02\x8a\x28\x46\x30\x62\x00\x09\x12\x45\x32\x92\
+\x73\x06\xc5\x2c\x8a\x4a\x90\x1c\x9d\xf9\xcf\xfc\x27\x7c\x33\xf3\
+\x4d\xf0\x7a\xbd\x4e\xbc\x33\x86\xfa\xaa\xdc\xcd\x0c\xe3\xa0\xc2\
+\xd9\x6f\x55\x57\xef\x7e\x5c\xeb\x59\xeb\xae\xb9\x0a\xbb\xbb\xaa\
+\x7e\xef\xd3\xdd\x15\x94\xd6\x5a\x01\x40\x7a\x30\xff\xfc\x8f\x41\
+\x03\xc0\x3f\xf9\x5d\x2a\xb3\x80\x40\x04\x40\x00\x00\x10\x00\x04\
+\x00\x00\x10\x00\x00\x04\x00\x01\x00\x00\x04\x00\x00\x01\x40\x00\
+\x00\x00\x01\x00\x40\x00\x10\x00\x00\x40\x00\x00\x10\x00\x04\x00\
+\x00\x10\x00\x00\x04\x00\x01\x00\x00\x04\x00\x00\x01\x40\x00\x00\
+\x00\x01\x00\x40\x00\x10\x00\x00\x40\x00\x00\x10\x00\x04\x00\x00\
+\x10\x00\x00\x04\x00\x01\x00\x00\x04\x00\x00\x01\x40\x00\x00\x00\
+\x01\x00\x40\x00\x10\x00\x00\x40\x00\x00\x10\x00\x04\x00\x00\x10\
+\x00\x00\x04\x00\x01\x00\x00\x04\x00\x00\x01\x40\x00\x00\x00\x01\
+\x00\x40\x00\x10\x00\x00\x04\x40\x40\x00\x1a\x9d\xa6\xd5\xf5\x77\
+\x01\xc4\x8f\xed\x8b\x08\x00\x02\x00\x00\x9e\x04\xe0\x8a\x9b\xb5\
+\x7a\xf9\x63\x80\xf8\xb1\x7d\x11\x01\x40\x00\x00\x00\x01\x00\x04\
+\x00\x01\x40\x00\x00\x00\x01\x00\x04\x00\x01\x40\x00\x00\x00\x01\
+\x00\x04\x00\x01\x40\x00\x00\x10\x00\x04\x00\x10\x00\x04\x00\x00\
+\x10\x00\x04\x00\x10\x00\x04\x00\x00\x10\x00\x04\x00\x10\x00\x04\
+\x00\x00\x10\x00\x04\x00\x10\x00\x04\x00\x00\x10\x00\x0a\x0f\x20\
+\x00\x08\x00\x00\x20\x00\x00\x08\x00\x02\x00\x00\x08\x00\x00\x02\
+\x80\x00\x00\x00\x02\x00\x80\x00\x20\x00\x00\x80\x00\x00\x20\x00\
+\x08\x00\x00\x20\x00\x00\x08\x00\x02\x00\x00\x08\x00\x00\x02\x80\
+\x00\x00\x00\x02\x00\x80\x00\x20\x00\x00\x80\x00\x00\x20\x00\x08\
+\x00\x00\x20\x00\x80\x00\x20\x00\x08\x00\x00\x20\x00\x80\x00\x20\
+\x00\x08\x00\x00\x20\x00\x80\x00\x20\x00\x08\x00\x00\x20\x00\x80\
+\x00\x20\x00\x08\x00\x00\x02\x80\x00\x00\x02\x80\x00\x00\x00\x02\
+\x80\x00\x00\x02\x80\x00\x00\x00\x02\x80\x00\x00\x02\x80\x00\x00\
+\x00\x02\x80\x00\x00\x02\x80\x00\x00\x00\x02\x20\x21\x00\x45\x5f\
+\xf9\x58\x5f\xb7\xf3\x37\x59\x73\xf2\xbb\xff\x3f\x45\x10\x01\x40\
+\x00\x10\x00\x00\x48\x8a\x00\x14\xac\xff\x91\x96\xf8\x67\xd0\xc7\
+\x7f\xa0\x08\x22\x00\x08\x00\x02\x00\x00\x08\x00\x20\x00\x08\x00\
+\x02\x00\x00\x08\x00\x20\x00\x08\x00\x02\x00\x00\x08\x00\x20\x00\
+\x08\x00\x02\x00\x80\x00\x20\x00\x80\x00\x20\x00\x00\x80\x00\x20\
+\x00\x80\x00\x20\x00\x00\x80\x00\x20\x00\x80\x00\x20\x00\x00\x80\
+\x00\x20\x00\x80\x00\x20\x00\x00\x80\x00\x20\x00\x80\x00\x20\x00\
+\x00\x80\x00\x20\x00\x80\x00\x20\x00\x00\x80\x00\x20\x00\x80\x00\
+\x20\x00\x00\x80\x00\x20\x00\x80\x00\x20\x00\x00\x80\x00\x20\x00\
+\x80\x00\x20\x00\x00\x80\x00\x20\x00\x80\x00\x20\x00\x00\x80\x00\
+\x20\x00\x80\x00\x20\x00\x00\x80\x00\x20\x00\x80\x00\x20\x00\x00\
+\x80\x00\x20\x00\x80\x00\x20\x00\x00\x80\x00\x20\x00\x08\x00\x02\
+\x80\x00\x00\x00\x02\x00\x08\x00\x02\x80\x00\x00\x00\x02\x00\x08\
+\x00\x02\x80\x00\x00\x00\x02\x00\x08\x00\x02\x80\x00\x00\x20\x00\
+\x08\x00\x20\x00\x08\x00\x00\x20\x00\x08\x00\x20\x00\x08\x00\x00\
+\x20\x00\x08\x00\x20\x00\x08\x00\x00\x20\x00\x08\x00\x20\x00\x08\
+\x00\x00\x20\x00\x08\x00\x20\x00\x08\x00\x00\x20\x00\x08\x00\x20\
+\x00\x08\x00\x00\x20\x00\x08\x00\x20\x00\x08\x00\x00\x20\x00\x08\
+\x00\x20\x00\x08\x00\x00\x20\x00\x08\x00\x20\x00\x08\x00\x00\x20\
+\x00\x08\x00\x20\x00\x08\x00\x00\x20\x00\x08\xc0\x31\xb0\xee\x80\
+\x56\x0f\x8d\xd5\xea\xde\x61\xe9\xa5\x79\x5b\x04\x00\x01\x00\x00\
+\x04\x20\x85\xbc\xb0\x56\xab\x5a\x0d\x24\x8a\x60\x9a\x41\x00\x00\
+\x00\x01\x40\x00\x12\xc8\xb2\x1d\x5a\xb5\xbb\x92\x42\x8e\x00\x20\
+\x00\x00\x80\x00\xa4\xef\x73\x80\xa1\xef\xb3\x5a\x95\x28\x49\x41\
+\x47\x00\x10\x00\x00\x40\x00\x52\xc7\x98\x35\x5a\xd5\x3a\x91\xa2\
+\x8e\x00\x20\x00\x00\x80\x00\xa4\x8e\x45\xdb\xb5\x6a\xd7\x85\xc2\
+\x8e\x00\x20\x00\x00\x80\x00\xa4\x8e\x35\x07\xb4\xba\xdd\x7e\x12\
+\x28\x45\x81\x47\x00\x10\x00\x00\x40\x00\xd2\x35\x2f\xe0\xa0\x56\
+\x23\x56\x6a\x55\xbb\x21\x45\x1e\x01\x40\x00\x00\x10\x00\x04\x20\
+\x75\xcc\xd9\xaa\x55\xfb\xab\x29\xf4\x08\x00\x02\x00\x80\x00\x20\
+\x00\xa9\x63\xe9\x1e\xad\x6e\x7b\x56\xab\x92\x65\x28\xf8\x08\x00\
+\x02\x00\x80\x00\x20\x00\xe9\xda\x2f\x60\xaf\x56\x43\x96\x69\x55\
+\xa7\x31\x45\x1f\x01\x40\x00\x00\x10\x00\x04\x20\x55\xac\xd8\xa7\
+\xd5\xf8\x77\xb5\x3a\xb7\x1b\x85\x1f\x01\x20\x10\x01\x10\x00\x04\
+\x20\x55\xac\xdc\xaf\xd5\xa4\x4d\x5a\xf5\x1e\xc6\x27\x01\x04\x00\
+\x00\x10\x00\x04\x20\x55\xac\x32\x12\x30\xd9\x48\xc0\x53\xcb\xb4\
+\xaa\xdb\x04\x01\x40\x00\x00\x00\x01\x40\x00\x52\xc3\xea\x03\x5a\
+\x4d\xd9\xac\xd5\xb8\x77\xb5\xea\xd0\x1d\x01\x40\x00\x00\x00\x01\
+\x40\x00\x52\xb5\x61\xd0\x54\x23\x01\x2f\x7c\xa0\xd5\x1d\xc3\xb5\
+\x2a\x55\x0e\x01\x40\x00\x00\x00\x01\x40\x00\x52\xc1\xda\x83\x5a\
+\x4d\xdb\x92\x91\x80\xa7\x57\x68\x55\xf7\x64\x04\x00\x01\x00\x00\
+\x04\x00\x01\x48\xcd\xae\x81\x33\xb6\x66\x24\x60\xec\x06\xad\xda\
+\x5c\x8a\x00\x20\x00\x00\x80\x00\x20\x00\xa9\x91\x80\xe9\x91\x04\
+\x58\xba\x3f\xa0\x55\x5e\x31\x5f\x45\x78\x87\xa1\x91\xa1\x5e\x0c\
+\x1c\x8f\x00\x00\x00\x02\x80\x00\xf0\x39\x60\xea\x96\x7f\x49\xc0\
+\x7d\x53\xb4\x2a\x57\xd9\x97\x04\xbc\x6a\x28\xc1\x38\x45\x00\x00\
+\x00\x01\x40\x00\xe2\x9a\x18\x38\x65\xf3\xbf\x24\x60\xe8\x5a\xad\
+\x4e\x38\xd5\x97\x04\xac\x47\x02\x10\x00\x00\x40\x00\x10\x80\xd8\
+\x96\x08\x46\x9b\x05\x1d\x92\x00\xbb\x54\xb0\xdd\x55\xbe\x24\xe0\
+\x15\x24\x00\x01\x00\x00\x04\x00\x01\x88\x73\xc7\xc0\x17\x3f\xfc\
+\x97\x04\x58\x6e\x7c\x44\xab\x62\xc5\x7d\x48\xc0\xcb\x86\xe2\x8c\
+\x59\x04\x00\x00\x10\x00\x04\x20\x0e\x96\xef\xd5\x6a\xe2\xb7\x24\
+\xe0\xc1\x19\x5a\x55\xac\xee\x43\x02\xd6\x21\x01\x08\x00\x00\x20\
+\x00\x08\x40\x9c\x47\x09\x4f\xfc\xe0\xdf\x25\xe0\xb9\x97\xb5\xaa\
+\xdf\xd4\x87\x04\xac\x45\x02\x10\x00\x00\x40\x00\x10\x80\xb8\x58\
+\xbc\xfb\xdf\x05\xc0\x32\xe6\x6d\xad\x4e\x3d\x07\x09\x40\x00\x00\
+\x00\x01\x40\x00\x72\x9a\x05\x3b\xff\x53\x02\xc6\x6f\xd4\xea\xec\
+\x2b\x7d\x48\xc0\x1a\x43\x31\xc6\x30\x02\x00\x00\x08\x00\x02\x10\
+\x07\x73\x77\xfc\xa7\x04\x58\x2e\xed\xed\x43\x02\x56\x23\x01\x08\
+\x00\x00\x20\x00\x08\x40\x5c\xcc\xfc\xe8\xc8\x12\x70\xc3\x60\xad\
+\x8a\xe6\xb9\x96\x80\x55\x48\x00\x02\x00\x00\x08\x00\x02\x10\xd7\
+\x6e\x81\x87\x6f\x14\x74\x38\x7d\x47\x69\x55\xbc\xc0\xb5\x04\xac\
+\x44\x02\x10\x00\x00\x40\x00\x28\xc8\x71\xb0\xea\x08\x7b\x04\x1c\
+\xe2\x81\xe9\x5a\x95\xa9\xe0\x5a\x02\x56\x18\xf2\x19\xd3\x08\x00\
+\x00\x20\x00\x10\xc7\xf2\xc0\x23\x09\x80\xe5\x89\xc5\x5a\x55\xa9\
+\x85\x04\x20\x00\x00\x80\x00\x20\x00\x39\xc9\xbc\x1d\xdf\x2d\x01\
+\xc3\xd6\x69\x75\x7c\x23\xd7\x12\xb0\x1c\x09\x40\x00\x00\x00\x01\
+\x80\x38\x98\xb1\xf5\xbb\x25\x60\xe4\x6b\x5a\xd5\x6b\xe2\x5a\x02\
+\xe6\x33\xb6\x11\x00\x00\x40\x00\x20\xa4\x49\x81\x96\x51\xaf\x1b\
+\x09\x38\xc5\xb5\x04\x3c\xc6\xf8\x46\x00\x00\x00\x01\x80\x38\x0e\
+\x0e\x9a\xf8\x61\x9c\x12\xf0\xb5\xa1\x2b\x63\x1c\x01\x00\x00\x04\
+\x00\x7c\xb3\xe4\x7b\x26\x05\x1e\x92\x00\xb7\xe7\x07\xfc\xc5\x70\
+\x06\xe3\x1c\x01\x00\x00\x04\x00\x42\xd9\x29\xf0\x10\xcf\xbf\xe1\
+\x5a\x02\x7e\x65\xa8\xc9\x58\x47\x00\x00\x00\x01\x00\xdf\x4c\xdf\
+\x72\x14\x12\x70\xaa\x4b\x09\xd8\x6a\x28\x60\xbc\x23\x00\x00\x80\
+\x00\x80\x4f\x56\x1f\xf8\xee\x4d\x82\x0e\x97\x80\x13\x9c\x4a\xc0\
+\x22\xc6\x3b\x02\x00\x00\x08\x00\xf8\x66\xd1\xee\xef\x17\x80\x6f\
+\x24\xe0\x4d\xd7\x12\xf0\x38\x63\x1e\x01\x00\x00\x04\x00\x42\x39\
+\x34\xe8\xdb\x12\xd0\xe0\x34\x97\x2b\x03\xae\x61\xdc\x23\x00\x00\
+\x80\x00\x80\x4f\xd6\x1c\xd0\x6a\xd2\xa6\x1f\x96\x00\xbb\x59\x50\
+\xad\x06\x2e\x57\x06\xb4\x60\xec\x23\x00\x00\x0c\x7a\x04\x00\x42\
+\x39\x2f\xe0\x70\x9e\x5d\xad\x55\xc5\xea\xae\x24\xe0\xd7\xac\x0c\
+\x40\x00\x00\x18\xf4\x08\x00\xf8\x66\xf6\xb6\xa3\x93\x80\x47\xe7\
+\x6b\x55\xaa\x9c\x2b\x09\xf8\xc8\x50\x92\x0c\x40\x00\x00\x10\x00\
+\x04\x00\x7c\x6e\x15\x3c\x79\xd3\xd1\x49\xc0\x7d\x93\xb5\x2a\x56\
+\xc2\x95\x04\x2c\x26\x03\x10\x00\x00\x04\x00\x01\xf8\x61\x9e\x99\
+\xa9\xd5\x25\x3d\xb4\x5a\xf2\x11\x45\x3c\x5b\x96\xef\x3d\x3a\x01\
+\xb0\xdc\xfe\x9c\x56\x45\x8b\xba\x92\x80\x27\xc9\x01\x04\x00\x00\
+\x01\x40\x00\xbe\x9f\xa7\xa6\x65\xae\xb7\x42\x65\xf3\x64\x3a\x9c\
+\x22\xee\x7a\x97\xc0\xc3\xb9\xee\x41\x97\x2b\x03\xba\x91\x05\x08\
+\x00\x00\x02\x80\x00\xfc\xb0\x00\x1c\xa2\x69\x4b\xad\x26\xad\xa3\
+\x90\x17\x96\x75\x86\xa9\x5b\x8e\x5e\x02\x3a\xf7\x72\x25\x01\x7f\
+\x35\xb4\x44\x00\x08\x44\x00\x04\x00\x01\x38\x3a\x01\xb0\xe4\xe7\
+\x6b\xd5\xf5\x36\xad\x96\xef\xa4\xa0\x17\xea\xd4\xc0\x7d\x47\x2f\
+\x00\x96\xb3\x2e\x73\x25\x01\xbf\x31\xd4\x40\x00\x00\x00\x01\xf0\
+\x2c\x00\x96\x1a\x6f\xfe\x24\x6b\x4a\xbf\xfa\x63\xbf\x02\x70\x88\
+\x2a\x35\xb4\x7a\x64\x02\x05\xbd\x30\xcc\xd9\x7e\xf4\x02\x30\x7e\
+\xa3\x56\x4d\xdb\xba\x92\x80\xd7\x10\x00\x00\x40\x00\x62\x10\x80\
+\xe0\xf9\x3e\x01\x38\x44\xcb\xf6\x5a\xcd\x78\x83\xa2\x7e\xac\xab\
+\x02\x26\x6d\x3a\x7a\x09\x18\xfd\x96\x56\xc7\x37\x72\x25\x01\x77\
+\x21\x00\x00\x80\x00\x20\x00\xc7\x2e\x00\x96\xe2\x25\xb4\xba\xe1\
+\x6e\xad\x56\xed\xa1\xb8\x1f\x2d\x8b\x77\x1f\xdb\xa7\x80\xa7\x57\
+\x6a\x55\xa6\x82\xab\xf9\x00\x8d\x10\x00\x00\x40\x00\x10\x80\x63\
+\x17\x80\x43\x1c\x57\x57\xab\x67\x66\x50\xdc\x8f\xfa\xd8\xe0\xad\
+\xc7\x26\x01\x03\x5e\xd0\xaa\x68\x9e\x0b\x09\xd8\x66\xc8\x47\x00\
+\x00\x00\x01\x40\x00\x0a\x27\x00\x87\x38\xef\x72\xad\x16\x6d\xa6\
+\xc0\xff\xe0\x84\xc0\xfd\x5a\x4d\xfc\xe0\xd8\x24\xe0\x9a\x7b\x5c\
+\x7d\x0a\x78\x1a\x01\x00\x00\x04\x00\x01\xc8\x4e\x00\x0e\xed\x1d\
+\x30\x78\x1c\x45\xfe\x07\xf7\x06\xd8\x7e\x6c\x02\x60\x69\xdd\xc9\
+\x85\x00\x7c\x69\x68\x83\x00\x00\x00\x02\x80\x00\x64\x27\x00\x87\
+\x68\x7b\xa1\x56\xf3\x3f\xa0\xd0\x4b\x4d\x08\xb4\x8c\x79\xc7\xd5\
+\xa4\xc0\x9f\x18\x4a\x23\x00\x00\x80\x00\x20\x00\x32\x85\xa5\x6c\
+\x79\x76\x12\x94\x9c\x10\xf8\xcd\xa4\xc0\x15\xae\x26\x05\x4e\x45\
+\x00\x00\x00\x01\x40\x00\x64\x8b\x8b\x5d\x32\x38\x7b\x03\x05\x5f\
+\x62\x42\xa0\xdb\x49\x81\x97\x21\x00\x00\x80\x00\x20\x00\xb2\x94\
+\x2a\xa3\x55\xff\xa7\x28\xf8\xdf\x66\x55\x21\x26\x04\x5a\xba\x3a\
+\x99\x14\xf8\x7b\x43\x55\x04\x00\x00\x10\x00\x04\x40\x9e\xb3\x3a\
+\x72\xca\x60\x36\x87\x05\xb9\x9f\x14\xb8\x1a\x01\x00\x00\x04\x00\
+\x01\x70\x43\xf5\x5a\x5a\x8d\x59\x42\xe1\x3f\x7c\x42\xe0\x8b\x1f\
+\x1e\xbb\x00\x8c\x79\x5b\xab\x5a\x0d\x5c\xb4\xd1\x6d\x08\x00\x00\
+\x20\x00\x08\x80\x1b\xec\xe1\x42\xbd\x07\x51\xfc\x0f\x31\x7f\x67\
+\xe1\xde\x02\x3c\x32\x4f\xab\x62\xc5\xa5\xdb\xe7\x4f\x86\x13\x10\
+\x00\x00\x40\x00\x10\x00\x77\x9c\x79\xbe\x56\x8b\xb6\x20\x00\xeb\
+\x0a\xb1\x2c\xf0\x10\xdd\x06\xba\x68\x9b\x0f\x0d\x79\x08\x00\x00\
+\x20\x00\x08\x80\x3b\xaa\xd6\xd4\xea\xf9\x45\x48\xc0\xc2\x5d\x85\
+\x13\x00\xcb\x29\x67\xb9\x68\x9b\x47\x10\x00\x00\x40\x00\x10\x00\
+\xb7\xe4\xe5\x69\xd5\xeb\x81\xcc\x93\x70\x6a\xdf\x02\x18\x26\x17\
+\xf2\x2d\xc0\xb0\x75\x5a\x95\xad\x28\xdd\x2e\xff\x30\x9c\x81\x00\
+\x00\x00\x02\x80\x00\xb8\xe7\xec\x4e\x5a\xad\xdc\x95\x5e\x09\x58\
+\xb4\xbb\xf0\x6f\x01\xfa\x8e\x74\xd1\x26\x07\x0d\x25\x11\x00\x00\
+\x40\x00\xb2\x0c\xf8\xbc\x57\x3e\xd6\xf7\x1e\xf8\x7d\xd6\xb4\x7c\
+\xff\xe7\xb9\x29\x00\x96\x93\x4e\xd5\x6a\xee\xc6\xf4\x4a\xc0\x94\
+\xcd\x85\x97\x80\xf6\x57\xbb\x68\x93\xe1\x08\x00\x00\x20\x00\x59\
+\x86\x7b\xc1\xfa\x1f\x69\x89\x7f\x06\x7d\xfc\x87\xdc\x15\x00\x4b\
+\x95\x1a\xa6\xa0\xad\x4a\xa7\x00\x2c\xd9\x53\x78\x01\xb0\xe7\x05\
+\xd4\xac\x2f\xdd\x1e\xff\x9b\x4b\xab\x02\x08\x44\x00\x04\x00\x01\
+\x08\x59\x00\x2c\x05\xa5\xb4\x7a\x62\x72\x3a\x25\x60\xea\x96\xc2\
+\x4b\xc0\xa0\x39\x5a\xe5\x17\x93\x6e\x8f\x95\x08\x00\x00\x20\x00\
+\x08\x80\x3f\x8a\x14\x4d\xe7\x7e\x01\xcb\xf6\x16\x5e\x00\x2c\x57\
+\xdf\xed\xa2\x3d\x3a\x20\x00\x00\x80\x00\x20\x00\x7e\xe9\xdc\x5d\
+\xab\x35\xfb\x53\x76\x50\x50\x16\x6f\x01\x26\xbc\xaf\x55\xe3\x56\
+\xd2\xed\xb0\xdb\x50\x14\x01\x00\x00\x04\x00\x01\xf0\xcb\xe9\x67\
+\xa5\xeb\x1c\x81\xe5\x59\xbe\x05\x78\x6a\xb9\x56\xc5\x0b\xa4\xdb\
+\xe1\x0e\x04\x00\x00\x10\x00\x04\xc0\x3f\x27\x9e\xa2\xd5\xa2\xcd\
+\xbc\x05\x38\x5a\xae\xea\xef\xe2\xc4\xc0\x72\x08\x00\x00\x20\x00\
+\x08\x80\x7f\xea\x9e\xa4\xd5\xfc\x0f\xd2\x21\x00\x4b\xf7\x64\x27\
+\x00\xe3\x37\x6a\x55\xbb\xa1\x74\x1b\x8c\x42\x00\x00\x00\x01\x40\
+\x00\xe2\xa1\x56\x3d\xad\x66\x6f\x60\x5f\x80\xa3\xe1\xc1\x19\x5a\
+\x15\x2d\x2a\x79\xff\xff\x6e\x38\x11\x01\x00\x00\x04\x00\x01\x88\
+\x07\x7b\xac\xf0\xcc\x37\x53\xb0\x3b\xe0\xae\xec\x04\xc0\x72\x5e\
+\x37\xe9\xfb\xbf\x1a\x01\x00\x00\x04\x00\x01\x88\x8f\xca\xd5\xcd\
+\x13\xf2\xfa\x14\x9c\x14\xf8\x61\x76\x02\xf0\xbc\x11\xa5\x8a\xd5\
+\xa4\xef\xff\x05\x08\x00\x00\x20\x00\x08\xc0\x91\x18\x6a\xf8\x9b\
+\x73\x09\xa8\x50\x59\xab\x89\xab\x73\x5b\x02\xe6\xed\xc8\xfe\x2d\
+\xc0\x1d\xc3\xa5\xef\xfd\xde\x24\x1e\x19\x4c\x20\x02\x20\x00\x08\
+\x80\x7b\x01\x38\xdd\xd0\x26\x9a\x39\xee\x56\x02\xca\x96\xd7\x6a\
+\xec\xb2\xdc\x15\x80\x35\x07\x8c\xe4\x7c\x98\xbd\x04\x34\x3b\x57\
+\xfa\xde\xf7\x45\x00\x00\x00\x01\x40\x00\xfe\x43\x00\xa2\x7b\x5f\
+\x3f\x3a\x55\xce\xad\x04\x94\x2e\x6b\x8a\xe4\x9a\xdc\x95\x80\xd9\
+\xdb\xb3\x17\x80\x67\x57\x6b\x55\x50\x5a\xf2\xbe\x7f\x62\x28\x8f\
+\x00\x00\x00\x02\x80\x00\xfc\x87\x00\x44\xf7\xbf\xbc\xe1\x2d\xe7\
+\x12\x50\xa9\xaa\x56\x33\xdf\xca\x4d\x01\x58\xb5\x3f\x7b\x01\xb0\
+\x74\xbb\x4f\xfa\xbe\x8f\x46\x00\x00\x00\x01\x40\x00\x8e\x28\x00\
+\x51\x1b\xe4\x1b\x66\x38\x97\x80\xe3\xea\xe6\xee\x3e\x01\x33\x3f\
+\xca\x5e\x00\x26\x6c\xd4\xaa\x6e\x13\xc9\x7b\xfe\x0f\xc3\x49\x08\
+\x00\x00\x20\x00\x08\xc0\x11\x05\xe0\xb0\xb6\x78\xd8\xf0\xb5\x53\
+\x09\x68\x60\x0a\xdc\xb2\xed\x6c\x0f\xfc\x5d\x0c\x9c\x2c\x7d\xcf\
+\xd7\x22\x00\x00\x80\x00\x20\x00\xdf\x2b\x00\x51\x7b\x5c\x63\xf8\
+\xab\x53\x09\x38\xed\x4c\xad\x56\xed\xc9\x3d\x09\x98\xb6\x45\x46\
+\x02\x9a\xb5\x97\xbe\xe7\x17\x22\x00\x00\x80\x00\x20\x00\xdf\x2b\
+\x00\x51\x9b\x9c\x69\xf8\x9d\x53\x09\x38\xfb\x22\xad\xd6\x1d\xc8\
+\x2d\x01\x58\xbc\x5b\x46\x00\x1e\x5f\xa4\x55\x5e\xbe\xe4\xfd\xde\
+\x9f\x84\xd3\x02\x09\x44\x00\x04\x00\x01\x88\x59\x00\xa2\x76\xa9\
+\x17\x15\x0e\x77\x12\x70\xf1\xb5\xb9\xb7\x31\xd0\x8b\x1f\xca\x48\
+\x40\xfb\xae\xd2\xf7\xbb\x3b\x02\x00\x00\x08\x00\x02\x70\xfa\x51\
+\xb6\x8d\x5d\x21\xf0\x86\x53\x09\xb8\xae\x5f\x6e\x49\xc0\x9c\xed\
+\x32\x02\xf0\xdc\xcb\xd2\xcb\x02\xf7\x20\x00\x00\x80\x00\x20\x00\
+\xa7\x1f\x43\xfb\xd8\x15\x02\xd3\x9c\x4a\xc0\x83\xcf\xe7\x8e\x00\
+\xac\xdc\x27\x23\x00\x96\xcb\xfb\x48\xdf\xeb\xcb\x10\x00\x00\x40\
+\x00\x10\x80\x63\x6d\xa7\x61\xce\x04\xa0\x78\x81\x56\xe3\x57\xe6\
+\x8e\x04\x4c\x15\x9a\x0c\x38\xe6\x6d\xe9\x73\x02\x36\x21\x00\x00\
+\x80\x00\x7c\x8b\xe2\x46\x00\x76\x7f\xfe\xbf\x59\xd3\x6b\xcf\xff\
+\xcd\x49\x01\x88\xda\x6a\x8a\x33\x09\xa8\x5a\x33\x77\xf6\x08\x58\
+\xb8\x4b\xee\x2d\xc0\x4d\x8f\x49\xdf\xeb\x0e\x08\x00\x00\x20\x00\
+\x49\x23\x7e\x01\x28\x6a\x58\xe2\x4c\x02\x4e\x69\xa1\xd5\xea\x7d\
+\xc9\x6f\xa7\xb5\x07\x65\xce\x07\x38\xb4\x39\x50\xed\x93\x24\xef\
+\xf3\x9b\x08\x00\x00\x20\x00\x08\x40\x61\xda\xab\xb8\xe1\x75\x67\
+\x12\x70\x49\x8f\xdc\x68\xab\x59\xdb\xe4\xde\x02\xf4\x1f\x27\x7d\
+\x9f\x5b\x23\x00\x00\x80\x00\x20\x00\x85\x69\xb3\xd2\x86\xcd\xce\
+\x24\xa0\xff\x53\xc9\x6f\xab\x65\x7b\xe5\x04\xc0\xd2\xe4\x4c\xc9\
+\x7b\xbc\x1a\x01\x00\x00\x04\x00\x01\x28\x6c\xbb\x55\x34\xec\x73\
+\x22\x00\xf9\xf9\x5a\x8d\x9c\x9f\xfc\xf6\x9a\xbc\x49\x4e\x00\xee\
+\x9f\x2a\x79\x8f\xed\x76\xcf\x4d\x11\x00\x00\x40\x00\x10\x80\xc2\
+\xb6\xdd\x71\x86\x9f\x39\x91\x80\x0a\x95\xb5\x9a\xbd\x21\xd9\xed\
+\x35\x7f\xa7\xec\x5b\x80\x86\x2d\x24\xef\xf1\x02\x04\x00\x00\x10\
+\x00\x04\x20\x9b\xf6\x6b\xe0\x6c\xdb\xe0\xa6\xad\x92\xbd\x5d\xf0\
+\xea\x03\xb2\x02\x70\xf7\x78\xc9\xfb\xfb\xa5\x6d\x3b\x04\x00\x00\
+\x10\x00\x04\x20\x9b\x36\x6c\x26\xd2\x8e\x47\xa2\xe7\xc0\x64\xb7\
+\xd9\x8c\xad\xb2\x12\x50\x4f\xf4\xb8\xe0\x69\x08\x00\x00\x20\x00\
+\x08\x40\xb6\xed\x78\x8e\x93\x53\x04\xed\x7c\x80\xb1\x4b\x39\x20\
+\xe8\x10\x7d\x46\x48\xde\xdf\xbf\xdb\xcf\x38\x08\x00\x00\x20\x00\
+\x08\x40\xb6\x6d\x79\x89\xe1\x0b\x71\x09\x38\xae\xae\x56\xcb\x77\
+\x24\x78\x4f\x00\x41\x01\x98\xf0\xbe\x56\xb5\x1a\x48\xde\xdf\x27\
+\x11\x00\x00\x40\x00\x10\x00\x89\xf6\xbc\x3e\x9a\x65\x2e\x2b\x01\
+\x17\x76\x4d\x6e\xbb\xcd\xfc\x48\xf6\x2d\xc0\x2d\x43\x24\xef\xed\
+\xaf\x0d\x79\x08\x00\x00\x20\x00\x08\x80\x44\x9b\x0e\x70\x32\x1f\
+\x60\xf0\xb8\x64\xb6\xdb\x22\xe1\xcf\x00\x76\x77\xc0\xaa\xb5\x25\
+\xef\x6d\x17\x04\x00\x00\x10\x00\x04\x40\xaa\x5d\x17\x89\x0b\x40\
+\x99\x72\xc9\x5c\x1a\x28\xfd\x19\xc0\x72\xc3\x60\xc9\x7b\xfb\x1a\
+\x02\x00\x00\x08\x00\x02\x20\xd5\xae\xe5\x0c\x3f\x15\x97\x80\x53\
+\x5b\x27\x73\x69\xa0\xf4\x6a\x80\x71\xef\x4a\x9e\x14\x68\x3f\xd9\
+\x9c\x80\x00\x00\x00\x02\x80\x00\x48\xb5\x6d\x4b\xc3\x3f\xc4\x25\
+\xa0\xf7\xa0\x04\x7e\x06\xd8\x25\x2b\x00\x96\x6b\xee\x95\xbc\xaf\
+\xc3\x11\x00\x00\x40\x00\x10\x00\xc9\xf6\xbd\x4f\x5c\x00\x0a\x4a\
+\x25\xef\x53\xc0\x9a\x03\xf2\x02\x30\xe6\x6d\xad\xca\x54\x90\xba\
+\xaf\x7f\xb0\x07\x3d\x21\x00\x00\x80\x00\x20\x00\x52\xed\x5b\xc4\
+\xf0\x8a\xb8\x04\xb4\xb9\x20\x79\xed\x37\x7d\xab\xbc\x04\x5c\x74\
+\x93\xe4\x7d\xbd\x0e\x01\x00\x00\x04\x00\x01\x90\x6c\xe3\x2a\x86\
+\xdf\x88\x4b\xc0\xe3\x2f\x26\xab\xfd\x16\x3a\xf8\x0c\xf0\xd4\x32\
+\xad\x8a\x14\x95\xba\xa7\xef\x22\x00\x00\x80\x00\x20\x00\xd2\xed\
+\x7c\x9e\xe1\x2b\x51\x01\xa8\x5a\x53\xab\xe5\x3b\xd3\xfd\x19\xe0\
+\x9b\xa3\x82\xdb\x48\x8a\xd5\xc9\x08\x00\x00\x20\x00\x08\x80\x74\
+\x5b\x3f\x25\xfe\x16\xe0\xea\x5b\x93\xd5\x86\xd3\xb6\xc8\x0b\xc0\
+\x1d\xc3\x25\xef\xe9\x38\x04\x00\x00\x10\x00\x04\x40\xba\xad\xf3\
+\x0c\x1b\x45\x05\x20\x2f\x4f\xab\x89\xab\x93\xd3\x86\x0b\x76\xca\
+\x0b\xc0\xf8\x8d\x92\x4b\x02\x3f\x33\x94\x44\x00\x00\x00\x01\x40\
+\x00\xa4\xdb\xbb\xb6\xe1\x53\x51\x09\x68\xdc\x4c\xab\x75\x07\xd3\
+\x79\x44\xf0\x21\x2e\xb9\x4d\xf2\x2d\xc0\x2d\x08\x00\x00\x20\x00\
+\x08\x80\x8b\x36\xbf\x42\xfc\x53\xc0\x5d\x43\x92\xd3\x8e\x53\x36\
+\xcb\x0b\xc0\xb3\xab\xb5\x2a\x9a\x27\x75\x3f\xdf\x41\x00\x00\x00\
+\x01\x40\x00\x5c\xb5\xfb\x78\xf1\x6d\x82\x97\x7c\x94\x8c\x76\x9c\
+\xb3\xdd\xcd\x5b\x80\x66\xe7\x4a\xdd\x4f\x3b\x59\xb3\x3a\x02\x00\
+\x00\x08\x00\x02\xe0\xa2\xdd\x8b\x1b\x76\x8a\x4a\x40\xb7\xdb\x93\
+\xd1\x8e\x4b\xf6\xb8\x11\x80\xbb\xc6\x4a\xbe\x55\xb9\x0b\x01\x00\
+\x00\x04\x00\x01\x70\xd5\xf6\x27\x1b\xbe\x10\x2b\x5a\x25\x0a\xb4\
+\x9a\xbb\x31\x19\x87\x03\xb9\x10\x80\x09\xef\x6b\x55\xa5\x96\x54\
+\x1f\x79\x0f\x01\x00\x00\x04\x00\x01\x48\xce\xa7\x80\xce\xdd\xd3\
+\xbb\x1c\xd0\xd2\xe5\x4e\xc9\xcf\x00\xc7\x21\x00\x00\x10\xb6\x00\
+\x40\x92\x05\xa0\xa2\xe8\xaa\x00\xbb\x2c\x70\xda\x6b\xe1\x0b\xc0\
+\xbc\x1d\x6e\x04\xe0\xb9\x57\xb4\xca\x2f\x26\xd5\x4f\x06\x20\x00\
+\x00\x80\x00\x20\x00\x2e\xfb\xc0\xdd\xa2\xd7\xd7\xae\x73\xf8\x02\
+\xb0\x7c\xaf\x1b\x01\xb0\x9c\xd6\x4e\xea\x5e\x7e\x88\x00\x00\x00\
+\x02\x80\x00\xb8\xec\x03\xf9\x86\x83\x62\xd7\x57\xa4\x88\x56\xe3\
+\x57\x84\x2d\x00\xeb\x0c\x13\x3f\x74\x23\x00\xb7\x0c\x91\xea\x27\
+\x5f\x1b\x8e\x47\x00\x00\x00\x01\x40\x00\x5c\xf6\x83\x8b\x45\xaf\
+\xb1\xf9\xd9\xe1\xbf\x05\x98\xb1\xd5\x8d\x00\x8c\x7e\x4b\xab\x62\
+\x25\xa4\xee\xe5\x7d\x08\x00\x00\x20\x00\x08\x80\xeb\xbe\xb0\x5e\
+\xf4\x3a\x87\xce\x0a\x7c\x5b\xe0\x5d\xee\x3e\x03\x9c\xde\x41\xea\
+\x3e\x6e\x41\x00\x00\x00\x01\x40\x00\x92\xb5\x2c\xb0\xe1\x69\x61\
+\x0b\xc0\xca\xfd\xee\x04\xe0\xb6\x67\x24\xfb\x4b\x3d\x04\x00\x00\
+\x10\x00\x04\xc0\x75\x7f\x98\x20\x7a\xad\xc3\x66\x87\x2d\x01\x93\
+\x36\xb9\x11\x80\x31\x6f\x6b\x55\xbc\x40\xea\x3e\x3e\x88\x00\x00\
+\x00\x02\x80\x00\xb8\xee\x0f\x95\x44\x97\x05\xb6\x6c\x1f\xb6\x00\
+\xcc\xda\xe6\xee\x2d\x40\x8b\x8e\x52\xfd\x65\x3b\x02\x00\x00\x08\
+\x00\x02\xe0\xa3\x4f\x0c\x10\x5d\x11\x30\xe9\xe5\x70\x05\x60\x91\
+\xc3\x79\x00\xb7\x3f\x27\xd9\x67\xea\x22\x00\x00\x80\x00\x20\x00\
+\x3e\x96\x05\x7e\x2c\x76\xbd\x17\x75\x4d\xe7\x3c\x80\x31\xef\x68\
+\x55\xa2\x94\x54\x9f\xb9\x1d\x01\x00\x00\x04\x00\x01\xf0\xd1\x2f\
+\x3a\x8b\x5d\x6f\xb1\xe2\x5a\xcd\x7b\x3f\x5c\x09\x78\xf1\x43\x77\
+\x12\xd0\xaa\x93\x54\x9f\x59\x86\x00\x00\x00\x02\x80\x00\xf8\xea\
+\x1b\xaf\x8a\x5d\x73\xf7\xbe\xe1\x0a\xc0\xf4\xad\xee\x04\xa0\xcf\
+\x08\xa9\x3e\xf3\x99\x21\x0f\x01\x00\x00\x04\x00\x01\xf0\xb5\x2c\
+\xf0\x4b\x91\x6b\x2e\x5b\x5e\xab\x15\xbb\xd2\x75\x2e\x80\x65\xdc\
+\x06\xad\x4a\x96\x91\xea\x37\x6d\x10\x00\x00\x40\x00\x10\x00\x5f\
+\xfd\x63\x85\xd8\x75\xf7\x7d\x2c\x4c\x01\x58\xba\xc7\x9d\x00\x58\
+\x5a\x8b\x7d\x06\x78\x02\x01\x00\x00\x04\x00\x01\xf0\xd5\x3f\xce\
+\x13\xbb\xee\x9a\x75\xb4\x5a\x77\x20\x3c\x01\x58\x73\xc0\xad\x00\
+\xf4\x7c\x22\x11\x87\x03\x11\x88\x00\x08\x00\x20\x00\xdf\xee\x23\
+\xfb\xc4\xae\xfd\xb1\x89\x61\xbe\x05\x98\xbc\xc9\x9d\x00\x0c\x5b\
+\x97\x59\x0e\x99\xfd\xfd\xb3\x9f\x63\xca\x23\x00\x00\x80\x00\x20\
+\x00\xbe\xfa\x48\x1f\xb1\x6b\x6f\xdd\x21\x4c\x01\x78\xe9\x23\xb7\
+\x6f\x01\x6a\x37\x94\xea\x3b\x57\x21\x00\x00\x20\x15\xee\xf7\x1a\
+\x06\x81\x57\xaa\x25\xac\x8f\x94\x8e\x66\xa1\x67\x5f\xc0\xf2\xf2\
+\xb4\x9a\xff\x41\xba\x0e\x06\xb2\x5c\x78\x83\x94\x00\x4c\x41\x00\
+\x00\x00\xc0\xa7\x04\x8c\x11\x7b\x0b\xd0\xfb\xe1\xf0\x04\x60\xc5\
+\x3e\xb7\x02\x70\xf7\x78\x29\x01\xf8\x19\x02\x00\x00\x00\x3e\x05\
+\xa0\x81\xe1\x6b\x91\x22\x56\xaf\x61\x78\x02\xb0\xee\xa0\x56\x13\
+\x1d\x0a\xc0\xd8\x0d\x92\x87\x03\x9d\x88\x00\x00\x00\x80\x4f\x09\
+\x78\x45\xec\x2d\xc0\xf8\x15\xe1\x49\xc0\xb4\x2d\x6e\xdf\x02\x34\
+\x69\x23\x25\x00\x77\x22\x00\x00\x00\xe0\x53\x00\x2e\x16\x13\x80\
+\xcb\x6f\x0c\x4f\x00\xe6\x6c\x77\x2b\x00\x57\x0f\x90\x12\x80\x35\
+\x08\x00\x00\x00\xf8\x14\x80\x22\x86\xff\x4f\x66\x67\xc0\x0a\x5a\
+\xad\xde\x1b\xd8\xc9\x80\xbb\xdd\x0a\xc0\xa3\xf3\xa5\x04\xe0\xd3\
+\x44\x08\x80\xdd\xba\xd0\xf0\x2e\xc4\xca\x60\xc2\x0b\x00\x84\x32\
+\xfd\x1e\xb1\xb7\x00\x8f\x4c\x48\xd7\x44\x40\x4b\x85\x6a\x52\x12\
+\xd0\x20\x09\x02\x30\x88\x35\xbf\xb1\x73\x13\xc1\x05\x00\x42\x99\
+\x5e\xce\xf0\xa7\x9c\xdc\x13\x60\xed\x41\xf7\x02\xd0\xe6\x52\xa9\
+\x5c\xef\x91\x04\x01\x58\x46\x01\x8e\x95\x2f\x0c\x95\x08\x2e\x00\
+\x10\xcc\xf5\x49\x62\x7b\x02\x2c\xdc\x14\x96\x04\x4c\xda\xe4\x56\
+\x00\x7a\x3d\x25\x95\xed\x63\x93\x20\x00\x3f\xa3\x08\xc7\xca\x06\
+\x02\x0b\x00\x84\x73\xbd\x89\x58\x46\xdd\x3b\x2c\x2c\x01\x98\xb1\
+\xd5\xad\x00\x0c\x5d\x2b\x95\xed\x1f\x04\x2d\x00\xf6\xc9\x93\x02\
+\x1c\x3b\xf7\x12\x58\x00\xe0\x40\x02\xde\x12\xc9\xa8\xb3\x3a\xa6\
+\x6b\x25\x80\xa5\xa2\xc8\x3c\x80\xbf\x1a\xf2\x43\x16\x80\x8e\x14\
+\xe0\xd8\xa9\x4f\x58\x01\x80\x03\x01\xb8\x4e\x24\xa3\x0a\x4a\x6a\
+\xb5\x72\x77\x40\x2b\x01\x76\xb9\x17\x80\x66\xe7\x4a\xe5\x7b\xb3\
+\x90\x05\x80\x09\x80\xf1\xb2\x97\xa0\x02\x00\x47\x02\x50\x3e\x9a\
+\x63\x94\x7d\x56\x0d\x99\x1a\x8e\x00\x2c\xf7\xb0\x12\xe0\x8a\x7e\
+\x52\x19\x7f\x7b\xc8\x02\xb0\x84\x22\x1c\x2b\xcf\x10\x54\x00\xe0\
+\x50\x02\x36\x88\x64\x55\xe7\xee\xe9\x5a\x09\x20\x77\x2e\xc0\xf4\
+\x90\x05\xe0\x63\x8a\x70\xac\xb4\x24\xa4\x00\xc0\xa1\x00\xdc\x2f\
+\x92\x55\x95\xab\x67\xf6\xe2\x4f\xcb\x4a\x80\x51\xaf\x6b\x55\xa4\
+\x88\x44\xc6\xef\x0e\x52\x00\xcc\x3f\x05\x86\x2f\x29\xc2\xb1\xf1\
+\x6b\xbb\x6b\x17\x21\x05\x00\x0e\x05\xa0\xa1\x58\x66\x8d\x5b\x9e\
+\x9e\x95\x00\x96\xea\x75\x25\xee\x9b\xad\xb1\xa5\x42\x14\x80\x33\
+\x28\xc2\xb1\x32\x89\x80\x02\x00\x0f\x12\x20\xb3\x35\x70\x8f\x3b\
+\xd3\xb5\x12\xa0\xf5\xc5\x52\x59\x7f\x76\x88\x02\xd0\x93\x22\x1c\
+\x2b\x17\x13\x4e\x00\xe0\x41\x00\xc6\x88\x64\xd6\x09\x8d\xd3\xb5\
+\x12\xa0\xdb\x40\xa9\xac\x1f\x18\xa2\x00\x8c\xa6\x08\xc7\xc6\xff\
+\x1a\x4a\x12\x4e\x00\xe0\x41\x00\xce\x17\xcb\xae\xd9\x1b\x02\x59\
+\x09\xb0\xd7\xbd\x00\x3c\x30\x4d\x2a\xef\x17\x86\x28\x00\x6f\x50\
+\x88\x63\xe3\x6d\x82\x09\x00\x3c\x09\x40\x31\xc3\xe7\x22\xd9\x35\
+\xf0\xb9\x30\x04\x60\xf5\x01\xf7\x02\x30\xd6\xc8\x4e\x5e\x31\x89\
+\xbc\xdf\x13\xa2\x00\xfc\x8e\x42\x1c\x1b\x83\x08\x26\x00\xf0\x28\
+\x01\x4b\x45\xb2\xab\x53\xb7\x70\x3e\x03\x4c\xfc\xc0\xbd\x04\xd4\
+\x69\x2c\x91\xf7\x7f\x91\x9a\xf0\x2d\xd5\x19\xaa\x52\x84\x63\xa5\
+\x05\xa1\x04\x00\x1e\x05\xe0\x66\x91\xec\xaa\xd3\x20\x1c\x01\x98\
+\xbc\xc9\xbd\x00\xb4\xbb\x4a\x2a\xf3\x6b\x87\x24\x00\x17\x50\x84\
+\x63\xe3\xbf\x0c\x45\x09\x25\x00\xf0\x28\x00\x55\x0c\x5f\x65\x9d\
+\x5f\x76\x6d\xfc\xa2\x2d\x61\x08\xc0\x74\x0f\x4b\x01\xaf\xbd\x5f\
+\x2a\xf7\xcf\x0f\x49\x00\xee\x15\xb9\xa8\x13\x4f\xd1\xaa\x69\xab\
+\x78\x69\xd2\xd2\xfc\x8e\xd3\xdd\x53\xa1\x9a\x54\x47\x58\x4a\x20\
+\x01\x40\x0c\x12\xb0\x49\x24\xc3\x9e\x98\x1c\x86\x00\xcc\xda\xe6\
+\x5e\x00\xfa\x8f\x93\xca\xfd\x3e\x21\x09\xc0\x4c\x91\x8b\x7a\xe9\
+\xed\xf8\x3b\xc1\xdc\x1d\xee\x3b\xc1\x37\x87\x43\xb4\x0f\x72\x6f\
+\x68\x00\x80\xa3\xcc\xfd\xc1\x22\x19\x76\x4d\xef\x30\x04\x60\x9e\
+\x87\xec\x7f\x6a\xb9\x54\xee\x8f\x0e\x49\x00\x36\x67\x7d\x41\x79\
+\x79\x5a\xad\xdd\x1f\x7f\x27\x98\xba\xc5\x8f\x00\x54\x14\x7b\x03\
+\xc0\xe9\x7f\x00\x10\x87\x00\x9c\x2a\x92\x61\x4d\x5a\xa4\x67\x2f\
+\x80\x09\x1b\xb5\x2a\x56\x5c\x22\xf7\xd7\x85\x24\x00\xbf\xcd\xfa\
+\x82\xaa\xd7\x4a\xc7\xa1\x10\x96\x61\xeb\xa4\x8a\xff\x4f\x09\x22\
+\x00\x88\x51\x02\x7e\x99\x75\x8e\xd9\x82\xb8\x7a\x6f\xfc\xf9\xbf\
+\x74\x8f\x9f\xfc\xaf\x59\x5f\x22\xfb\x7f\x14\x84\x00\x44\x67\x00\
+\x7c\x9d\xf5\x05\x9d\xda\x3a\x1d\x9b\x41\x58\xfa\x3d\x2f\x25\x00\
+\x93\x09\x21\x00\x88\x51\x00\xa6\x89\x64\xd9\xa8\x85\xf1\xe7\xff\
+\xca\xfd\x7e\xf2\xff\xb4\x76\x12\xd9\xff\x0f\x43\x5e\x08\x02\xd0\
+\x48\xa4\x03\x74\xbc\x3a\xfe\x0e\xb0\x70\x97\x9f\x0e\x70\x69\x6f\
+\x29\x01\xe8\x4e\x08\x01\x40\x8c\x02\xd0\x4f\x24\xcb\x7a\x3d\x90\
+\x9e\x37\xc0\x1d\x6f\x90\xca\xff\x06\x21\x08\x40\x27\x91\x8b\xb9\
+\xe1\xee\x74\xcc\x02\xb5\x9c\x7a\x8e\x54\x07\x68\x48\x08\x01\x40\
+\x8c\x02\x70\x8e\x48\x96\xb5\xbd\x30\x8c\x79\x00\x2f\x7e\xe8\x3e\
+\xff\x7b\x3c\x2c\x95\xff\x9d\x43\x10\x80\x3e\x22\x17\x73\xdf\xf0\
+\x00\x26\x00\x6e\xf6\x23\x00\xe5\xab\x48\x34\xfe\x9f\x58\xff\x0f\
+\x00\x31\x0b\x40\x05\x91\xfc\xaf\x5d\x3f\x0c\x01\xf0\x51\x03\xee\
+\x99\x28\x25\x00\x03\x42\x10\x80\x61\x22\x17\x33\x62\x7e\xbc\x0d\
+\xbf\xee\xa0\x9f\xad\x20\x87\xae\x95\x6a\xfc\x0f\x09\x20\x00\x08\
+\x40\x02\x7e\x95\x75\x9e\x15\xcd\x0b\x63\x22\xe0\xcc\x8f\x3c\xd4\
+\x80\x35\x52\x35\x60\x62\x08\x02\xb0\x30\x27\x4e\x85\x5a\xb9\xcf\
+\xcf\xd3\x7f\x9f\x91\x52\x8d\xff\x22\xe1\x03\x00\x01\x08\xc0\x7a\
+\x91\x4c\x9b\xb8\x26\x7e\x01\x98\xb3\xdd\x4f\x1d\x28\x51\x52\xa2\
+\x06\xbc\x1e\x82\x00\x64\xbf\x1b\x54\x7e\xbe\x79\x02\x3f\x10\xf3\
+\x1a\xd0\xdd\x7e\x1a\xfe\xf2\x3e\x52\x02\xd0\x9b\xf0\x01\x80\x00\
+\x04\x60\x84\x48\xa6\x3d\x3c\x26\x7e\x01\x98\xbf\xd3\x4f\x1d\xa8\
+\xdd\x50\xa2\x06\x1c\x0c\x41\x00\xfe\x6f\xd6\x17\x52\xe3\xf8\xf4\
+\x98\x5f\x9b\x4b\xa5\x04\xa0\x25\xe1\x03\x00\x01\x08\xc0\x8d\x22\
+\x99\xd6\xe3\xce\xf4\xac\x04\x3b\xe3\x7c\x91\x73\x60\x62\x15\x00\
+\xf3\x4f\x09\x91\x3d\x00\x9a\xb5\x09\xe0\x20\x08\x4f\x3b\x00\xda\
+\x73\x00\xb2\x6f\xf8\x2f\xec\xfe\x0b\x84\x0f\x00\x04\x20\x00\xa7\
+\x8b\x08\xc0\xd9\x9d\xe2\xaf\x03\x8b\x3d\xbd\x09\xbe\xa0\x87\x44\
+\x1d\xb0\xb5\x37\x3f\x4e\x01\x68\x28\xd2\xf0\x17\x75\x4d\xc7\xf2\
+\x0f\x4b\xb9\xca\x12\x0d\xbf\x8f\xe0\x01\x80\x40\x04\xa0\x44\xf4\
+\x50\x92\xfc\xa3\x81\x97\x79\xda\x0c\xae\xcb\x5d\x52\x6f\x82\x6b\
+\xc6\x29\x00\xe7\x8b\x5c\xc4\x8d\x03\xe2\x6d\xf4\x55\x9e\x76\x80\
+\x1a\xfd\x96\x54\xa3\xcf\x23\x78\x00\x20\x20\x09\x38\x28\x32\x17\
+\x6c\xf5\xbe\x78\x6b\xc1\x0a\x4f\x93\xc1\x6f\x7a\x5c\xaa\x16\x34\
+\x8b\x53\x00\xae\x15\xb9\x88\xfb\x47\xa4\xc3\xfa\x06\xcd\x96\x6a\
+\xf4\xfb\x08\x1d\x00\x08\x48\x00\x96\x88\x64\xdb\xa4\x97\xd3\xf1\
+\x30\x78\xd7\x18\xa9\x5a\x70\x51\x9c\x02\x20\xb3\x0d\xe4\xc8\x05\
+\xe9\x58\x01\x70\xdb\xb3\x52\x8d\x7e\x31\xa1\x03\x00\x01\x09\xc0\
+\x63\x22\xd9\x36\x78\x5c\x3a\xb6\x03\x96\x7b\x18\xbc\x31\x4e\x01\
+\x90\x69\xf4\x39\xef\xe6\xfe\x39\xd0\x96\x2b\xfa\x4a\x35\xfa\x29\
+\x84\x0e\x00\x04\x24\x00\x5d\x72\xe6\x4c\x80\x17\x12\xb5\x21\xdc\
+\xfd\x71\x0a\xc0\xb8\xec\xbf\xfb\x14\x8b\x7f\x0f\x80\xd9\x9e\xce\
+\x00\x38\xeb\x32\xa9\x46\x2f\x47\xe8\x00\x40\x40\x02\xd0\x40\x24\
+\xdb\xba\xf4\x4c\xc7\x84\xf0\xf1\x1b\xb5\x2a\x52\x54\xa2\x16\x8c\
+\x88\x53\x00\xe6\x65\x7d\x01\x35\xeb\xc4\xdf\xe0\x33\xb6\xfa\x11\
+\x80\x93\x9a\x4b\x34\xf8\xe7\x04\x0e\x00\x04\x26\x00\x45\x0c\x7f\
+\xce\x3a\xdf\xda\x75\x8e\xbf\x1e\x4c\xf6\x74\x26\x4c\x99\x0a\x12\
+\xf5\x60\x76\x9c\x02\x90\xfd\x16\x90\x0d\x4e\x8e\xbf\xc1\xa7\x78\
+\x6a\xf0\x1a\xf5\x24\x1a\x7c\x3f\x81\x03\x00\x01\x4a\xc0\xd6\xac\
+\xf3\xad\x69\xcb\xf8\xeb\xc1\x34\x4f\x7b\xc2\xd4\x3c\x41\xa2\x1e\
+\xac\x8f\x53\x00\xb2\x6f\xf0\x26\x2d\xe2\x6f\xf0\x89\x9e\xf6\x00\
+\x28\x5d\x5e\xa2\xc1\x5f\x25\x6c\x00\x20\x40\x01\xc8\xfe\x8d\xf0\
+\x71\x75\xd3\xf3\x46\xb8\x51\x0b\x89\x7a\xb0\x23\x4e\x01\xf8\x69\
+\xd6\x17\x70\xc6\x39\xe9\x98\xf5\x39\xfe\x3d\xad\x8a\x14\x91\x68\
+\xf0\x69\x84\x0d\x00\x04\x28\x00\xcf\x67\x9d\x6f\x05\xa5\xe2\x17\
+\x80\x97\x3c\xcd\x09\x6b\x79\xa1\x44\x3d\xf8\x55\x9c\x02\xf0\x59\
+\xd6\x17\xd0\xf6\xc2\x74\x9c\x02\x28\x37\xeb\xf3\x71\xc2\x06\x00\
+\x02\x14\x80\x07\x45\x32\x6e\xd9\xf6\x74\x9c\x0b\xd3\xa1\xbb\x44\
+\x3d\xf8\x7b\x2c\x02\x60\xf7\x20\x16\x39\x07\xe0\xfc\x2b\xe2\x6d\
+\xec\xa5\x7b\x3c\xad\xfb\x9c\x23\x25\x00\xbd\x08\x1b\x00\x08\x50\
+\x00\x7a\x8a\x64\xdc\xd4\x57\x53\xb2\x2c\xbc\x9f\x54\x4d\x28\x15\
+\x87\x00\x54\x13\xf9\xf1\x9d\xaf\x4b\xc7\xe9\x4f\xfd\xc7\x49\x35\
+\x76\x47\xc2\x06\x00\x02\x14\x80\xce\x22\x19\x37\x7c\x6e\x3a\x04\
+\xa0\xc7\x43\x52\x35\xa1\x52\x1c\x02\xd0\x48\xe4\xc7\x5f\xd5\x2b\
+\x1d\x8d\x7d\xcb\x10\xa9\xc6\x6e\x44\xd8\x00\x40\x80\x02\x70\x86\
+\x48\xc6\x3d\xf8\x7c\xbc\x35\x61\xfe\x4e\x4f\xe7\x01\x3c\x26\x55\
+\x13\x8e\x8b\x43\x00\x9a\xe5\xc4\x19\xd0\xbe\xbe\xf7\x74\xbd\x47\
+\xaa\xb1\xcb\x13\x36\x00\x10\xa0\x00\xd4\x16\xc9\xb8\xde\x83\xe2\
+\xad\x09\x0b\x3c\x09\x40\xaf\xa7\xa4\x6a\xc2\x09\x71\x08\x40\xab\
+\x9c\xd8\xfa\xd1\xd7\x2e\x80\x17\xdd\x2c\xd5\xd8\xf9\x84\x0d\x00\
+\x04\x28\x00\xc5\x45\x32\xee\x86\xbb\xd3\xf1\x59\xf8\xf6\xe7\xa4\
+\x6a\x42\x93\x38\x04\xe0\x1c\x91\x1f\xdf\xf7\xf1\x78\x1b\x7b\x96\
+\x27\x01\x68\xdf\x55\xa2\xa1\xbf\x20\x68\x00\x20\x60\x09\xc8\x7e\
+\x65\x58\xb7\x3b\x62\x3e\x1c\xce\x93\x00\xf4\x1b\x2d\x25\x00\xcd\
+\xe3\x10\x80\xf3\x45\x7e\xfc\xbd\xc3\xe2\x6d\xec\x99\x1f\xf9\x69\
+\xec\xb6\x57\x48\x34\xf4\x1f\x09\x19\x00\x08\x58\x00\x7e\x95\xf8\
+\xf3\x00\x7c\x9d\x0e\x3b\x60\x82\x94\x00\x9c\x15\x87\x00\xc8\xcc\
+\xf8\x1c\x34\x36\x1d\xbb\x3e\x9d\xd9\x59\xa2\xa1\x7f\x4f\xc8\x00\
+\x40\xc0\x02\xf0\x93\xac\x73\xee\x92\x1e\xf1\xd6\x84\xc5\x9e\x04\
+\xe0\xbe\xc9\x52\x02\xd0\x21\x0e\x01\x90\x39\xfe\x71\xc8\xd4\x78\
+\x1b\x7b\xba\xa7\x7d\x9f\x5b\x74\x94\x68\xe8\x9f\x13\x32\x00\x10\
+\xb0\x00\xec\xcf\x3a\xe7\x3a\x5e\x1d\x6f\x4d\x58\xe2\x69\x6f\x98\
+\x87\x66\x4a\x09\x40\xe7\x38\x04\xe0\xda\x9c\x58\xf3\x39\xd5\x93\
+\x00\x34\x6b\x2f\xd1\xd0\x07\x09\x19\x00\x08\x58\x00\x76\x64\x9d\
+\x73\xed\x2f\x49\xc7\xe6\x70\x8f\xcc\x95\x12\x80\x2e\x71\x08\xc0\
+\x4d\x22\x3f\x7e\xec\xb2\x74\x9c\x04\x78\xca\x59\xb1\x1f\xfc\x00\
+\x00\xe0\x58\x00\x3e\xcc\x3a\xe7\xda\x5c\x10\x6f\x4d\x58\xb6\xd7\
+\x4f\x4d\x78\x62\xb1\x94\x00\x5c\x17\x87\x00\xdc\x26\xf2\xe3\x27\
+\xbf\x1c\xf3\xd9\xcf\x9b\x3c\x9d\xfc\xd4\x52\xa2\xa1\x3f\x20\x64\
+\x00\x20\x60\x01\x78\x27\xeb\x9c\x6b\xd1\x2e\x1d\x02\xf0\xf4\x4a\
+\x29\x01\xb8\x25\x0e\x01\xb8\x53\xe4\xc7\xcf\x7a\x27\xde\xc6\x9e\
+\xe4\xe9\x28\xe0\x06\xcd\x24\x1a\xfa\x0d\x42\x06\x00\x02\x16\x80\
+\xf5\x59\xe7\xdc\xa9\xad\xe3\xad\x09\xcb\x3d\x1d\x10\x37\x6c\x9d\
+\x94\x00\xf4\x8d\x43\x00\x06\x8a\xfc\xf8\x45\x9b\xe3\x6d\xec\x89\
+\x9e\x04\xa0\x6e\x13\x89\x86\x5e\x43\xc8\x00\x40\xc0\x02\xb0\x2a\
+\xeb\x9c\x6b\xdc\x2c\xde\x9a\xb0\xc2\x93\x00\x8c\x7c\x4d\x4a\x00\
+\xee\x89\x43\x00\x1e\x12\xf9\xf1\x2b\x76\xc5\xdb\xd8\x3e\x1a\xda\
+\x72\x7c\x43\x89\x86\x5e\x4a\xc8\x00\x40\xc0\x02\xb0\x34\xeb\x9c\
+\x6b\xd0\x24\x1d\x47\xc4\x8f\x79\x5b\x4a\x00\x1e\x4a\xee\x1b\x80\
+\xa5\xdb\xe2\x6d\xec\x17\x7d\x7d\x02\x38\x4d\xa2\xa1\x5f\x26\x64\
+\x00\x20\x60\x01\x78\x39\xeb\x9c\x6b\xd2\x22\x1d\x6f\x00\x46\xbd\
+\x2e\x25\x00\x03\x93\x3b\x07\x60\xe1\xa6\x98\xe7\x00\x78\x9a\x04\
+\xd8\xa4\x8d\x44\x43\xbf\x47\xc8\x00\x40\xc0\x02\xf0\x5e\xd6\x39\
+\xd7\xb2\x7d\x3a\xe6\x00\x3c\xf7\x8a\x94\x00\xdc\x19\x87\x00\xf4\
+\x16\xf9\xf1\x73\xde\x4d\xc7\x32\xc0\xe6\x1d\x24\x1a\x7a\x17\x21\
+\x03\x00\x01\x0b\xc0\xae\xac\x73\xee\x9c\x8b\xd3\xb1\x0a\xe0\x99\
+\x55\x52\x02\xd0\x3b\xb9\xfb\x00\xcc\x7c\x33\xde\xc6\x9e\xe6\x69\
+\x23\xa0\x36\x97\x4a\x34\xf4\x4f\x09\x19\x00\x08\x58\x00\x7e\x9a\
+\x75\xce\x5d\xd8\x35\x1d\x02\x30\x64\x99\x94\x00\xdc\x14\x87\x00\
+\x74\x17\xf9\xf1\x53\xd6\xc7\xbc\x15\xb0\xa7\xb3\x00\xce\xeb\xc6\
+\x59\x00\x00\x90\xeb\x02\xf0\xfb\xac\x73\xee\x8a\x9b\xd3\xb1\x13\
+\xe0\xe3\x0b\xa5\x04\xa0\x7b\x72\xcf\x02\x98\xb8\x3a\x1d\xa7\x01\
+\x76\xea\x29\xd1\xd0\x7f\x25\x64\x00\x20\x60\x01\xf8\x6b\xd6\x39\
+\x77\x5d\xbf\x74\x9c\x05\x30\x68\x4e\xa2\xb7\x02\xee\x9c\x13\x5b\
+\x01\xcf\xda\xe6\xa7\xb1\xaf\xe8\x27\xd5\xd8\xf9\x04\x0d\x00\x04\
+\x58\xfc\xf3\x45\x32\xee\x96\xfb\xd3\x71\x1a\xe0\x83\x33\x12\x7d\
+\x18\xd0\x05\x22\x3f\x7e\xe4\x82\x78\x1b\x7b\xf6\x76\x3f\x8d\x7d\
+\xed\xfd\x52\x8d\x5d\x91\xb0\x01\x80\x00\x05\xa0\xa2\x48\xc6\xf5\
+\x7b\x22\xde\x9a\xb0\xc8\x93\x00\x0c\x14\x3b\x0e\xf8\x82\x38\x04\
+\xe0\x1c\x91\x1f\x3f\x6c\x76\xbc\x8d\x3d\x77\x87\x9f\xc6\xbe\xe9\
+\x71\xa9\xc6\xae\x43\xd8\x00\x40\x80\x02\x50\x47\x24\xe3\xee\x1b\
+\x11\xb3\x00\xec\xf2\x53\x13\x06\x4c\x90\xaa\x09\xe7\xc4\x21\x00\
+\xad\x44\x7e\xfc\x53\xd3\xe2\x6d\xec\xf9\x3b\xfd\x34\xf6\xed\xcf\
+\x49\x35\xf6\x29\x84\x0d\x00\x04\x28\x00\xa7\x88\x64\xdc\x63\x13\
+\xe3\xad\x09\x0b\x3d\x09\x40\xbf\xd1\x52\x35\xa1\x55\x1c\x02\xd0\
+\x2c\x27\x1a\x7b\x81\xa7\xc6\xee\x3f\x4e\xaa\xb1\xdb\x10\x36\x00\
+\x10\xa0\x00\xb4\x11\xc9\xb8\x67\x5f\x8a\xb9\x26\x24\xee\xa1\xb0\
+\x59\x1c\x02\xd0\x48\xe6\x75\xcf\xf0\x74\xbc\xee\xb9\x7f\x9a\x54\
+\x63\x5f\x48\xd8\x00\x40\x80\x02\x70\xa1\x48\xc6\x8d\x5e\x12\x6f\
+\x4d\x98\xe7\xeb\xb3\xf0\x63\x52\x35\xa1\x51\x1c\x02\x50\x4d\xe4\
+\xc7\xf7\x1e\x14\xf3\x92\x0f\x4f\x13\x3e\x1e\x9d\x2f\xd5\xd8\x5d\
+\x09\x1b\x00\x08\x50\x00\xba\x8a\x64\xdc\xa4\x97\xe3\xad\x09\x73\
+\x3c\x4d\x0c\xbf\xfa\x6e\xa9\x9a\x50\x2d\x0e\x01\x90\x59\xf2\xd1\
+\xbd\x6f\x3a\x36\x7d\x78\x7a\xa5\x54\x63\xdf\x42\xd8\x00\x40\x80\
+\x02\x70\x8b\x48\xc6\xcd\xde\x90\x8e\xa5\xe1\x32\x7b\xc3\x64\xb5\
+\x34\x3c\xdb\x06\xff\x3c\xeb\x1f\x7f\x49\x8f\x98\x0f\x7e\xf0\xb4\
+\xed\xe3\x88\x57\xa5\x1a\x7b\x00\x61\x03\x00\x01\x0a\xc0\x00\x91\
+\x8c\x5b\xbc\x35\xde\x9a\x30\xc3\xd3\xee\xb0\xe7\x74\x91\xa8\x07\
+\x9f\x67\xd5\x66\x59\x36\xf8\xcf\xb2\xbe\x80\x76\x9d\xd3\x71\xf6\
+\xf3\xf8\xf7\xa4\x04\x60\x2c\x61\x03\x00\x01\x0a\xc0\x58\x91\x8c\
+\x5b\xb3\x3f\x1d\xe7\xc3\x9c\x71\xbe\x44\x3d\xf8\x59\x9c\x02\xb0\
+\x2d\xeb\x0b\x68\xd6\x26\xde\xc6\x5e\x7b\xd0\x4f\x63\x5b\x4a\x94\
+\x94\x68\xf0\xf5\x84\x0d\x00\x04\x28\x00\xeb\xb3\xce\xb7\x82\x52\
+\xf1\xd6\x03\xcb\x64\x4f\x27\xc4\x36\x6a\x21\x51\x0f\xb6\xc5\x29\
+\x00\xaf\x67\x7d\x01\x27\x34\x8e\xbf\xc1\x27\x6d\xf2\xd3\xe0\xb5\
+\x4f\x8a\xdd\xf8\x00\x00\x1c\x09\xc0\xcf\x72\xa2\x1e\xbc\xf8\x61\
+\x92\xea\xc1\xeb\x71\x0a\xc0\xc2\xac\x2f\xa0\x6a\xcd\xf8\x1b\xdc\
+\xd7\x89\x80\x67\x5c\x20\xd1\xe0\x5f\x19\x4a\x10\x38\x00\x10\x50\
+\xf1\x2f\x11\x65\x53\xb2\x3f\x09\x5b\x7c\xbd\x11\xae\x58\x4d\xa2\
+\x1e\x2c\x8c\x53\x00\x5e\xc8\xfe\x95\x4f\xc9\xf8\x1b\xdc\xd7\x79\
+\x00\x9d\x6f\x95\x9a\x07\xd0\x94\xd0\x01\x80\x80\x04\xa0\xa9\x48\
+\xb6\x5d\x7f\x57\xbc\xb5\x60\xcd\x01\x7f\x02\x50\xbc\x40\xa2\x16\
+\xbc\x10\xa7\x00\x0c\x11\x69\xf4\x55\x7b\xd2\xb1\x1b\xe0\x2d\x43\
+\xd8\x0b\x00\x00\xd8\x03\xe0\xbb\x78\xf0\xf9\x78\x6b\xc1\xaa\xfd\
+\x7e\x6a\xc1\xd8\x0d\x52\xb5\x60\x48\x9c\x02\x20\xb3\xec\x63\xee\
+\x7b\xe9\xd8\x0b\xe0\xa1\x97\xa4\x1a\xfd\x11\x42\x07\x00\x02\x12\
+\x80\x47\x44\xb2\x6d\xfc\x8a\x98\x97\x85\x7b\x5a\x15\xf6\xcc\xaa\
+\x20\x96\x85\x67\xdb\xe8\x37\x88\x5c\xc4\xd8\xa5\xe9\xb0\xbe\xd1\
+\x6f\x69\x55\xa4\x88\x44\xa3\xcf\x21\x74\x00\x20\x20\x01\x98\x93\
+\x75\xae\xd9\x6c\x5c\xbe\x33\x1d\x0f\x83\x0f\x88\x6d\x0d\x7f\x43\
+\x9c\x02\xd0\x49\xe4\x22\x06\x8d\x8d\x7f\x1e\xc0\x44\x4f\xdf\x7d\
+\x2a\x88\x4c\xfc\xd8\x42\xe8\x00\x40\x40\x02\xb0\x25\xeb\x5c\xab\
+\x52\x23\xfe\x3a\xe0\xeb\x24\xc0\x5b\x9f\x91\x12\x80\x4e\x71\x0a\
+\xc0\xc9\x22\x17\x71\xeb\x83\xf1\x37\xfc\x14\x5f\x6b\x3f\x5b\x4a\
+\x34\xfa\x67\x84\x0e\x00\x04\x24\x00\x9f\x65\x9d\x6b\xa7\x9f\x15\
+\x7f\x1d\x98\xeb\x69\x42\x78\x97\x3b\xa5\x04\xe0\xe4\x38\x05\xa0\
+\xb4\xc8\x45\x5c\x76\x43\xfc\x0d\x3f\xf3\x23\x3f\x0d\xdf\xfe\x6a\
+\xa9\x86\xaf\x4e\xf0\x00\x40\x00\xc5\xbf\xba\x4c\x1d\xb8\x3e\xfe\
+\x3a\xf0\x52\xe2\xea\x40\xe9\xd8\x04\x20\x6a\xfc\x4f\xb2\xbe\x88\
+\xd6\xe7\xc5\xdf\xf0\xbe\x8e\x80\xbc\xe6\x5e\xa9\x86\x6f\x4f\xf8\
+\x00\x40\x00\x02\xd0\x5e\x24\xd3\xfa\x3c\x1a\x7f\x1d\xf0\xb5\x0d\
+\x70\xd3\xb6\x12\x35\xe0\x93\xac\xdb\x4e\xa0\xf1\xb7\x67\x7d\x21\
+\xf5\x1a\xc6\xdf\xf0\x8b\x3d\x1d\x0b\x7c\xd7\x58\x29\x01\xb8\x9d\
+\xf0\x01\x80\x00\x04\xe0\x76\x91\x4c\x7b\x66\x66\x7a\x76\x85\xad\
+\x79\x82\x44\x0d\xd8\x1e\x82\x00\xac\xc8\xfa\x42\x4a\x96\x8e\xbf\
+\xe1\x7d\x2d\xff\x78\x7a\x85\x94\x00\x3c\x4f\xf8\x00\x40\x00\x02\
+\xf0\xbc\x48\xa6\xcd\x7a\x27\xde\x1a\xb0\xce\xe7\xb9\x30\xa5\x24\
+\x6a\xc0\x8a\x10\x04\x60\x4c\x4e\x1c\x01\xe9\xeb\x50\xa0\x09\xef\
+\x4b\xed\x00\xf5\x1a\xe1\x03\x00\x01\x08\xc0\x6b\x59\xe7\x59\x89\
+\x82\x4c\x01\x4e\xc3\x72\xf0\x11\xeb\xa5\x1e\x02\xc7\x84\x20\x00\
+\x32\x9b\x01\x8d\x5f\xc9\x21\x10\xc7\xc6\x9f\x0c\xf9\x04\x10\x00\
+\xc4\x58\xfc\xf3\xa3\x2c\x4a\xfe\x21\x40\xcb\xf6\xfa\xc9\xff\x87\
+\x5f\x0a\x62\x13\x20\x29\x01\xb8\x52\xe4\x62\x1e\x9b\x18\x7f\x07\
+\x98\x91\xa8\x43\x81\x2c\x6d\x09\x21\x00\x88\x51\x00\xda\x8a\x64\
+\x59\x08\x87\x00\x2d\xf2\xb4\x07\xc0\xed\xcf\x49\xe5\xff\x95\x21\
+\x08\xc0\xe9\x22\x17\x73\xfb\xe0\xf8\x3b\xc0\xfc\x9d\x9e\x0e\x05\
+\xea\x25\xd5\x01\x1e\x23\x84\x00\x20\x46\x01\x78\x4c\x24\xcb\x7a\
+\xdc\x99\x9e\x95\x60\x57\x0f\x90\xca\xff\xd3\x43\x10\x80\x8a\x22\
+\x17\x73\xf1\xb5\xf1\x77\x80\x15\x9e\x26\x02\xf6\x1d\x25\xd5\x01\
+\xde\x21\x84\x00\x20\x46\x01\x78\x47\x24\xcb\x86\x4c\x8d\x3f\xff\
+\x67\x6d\xf3\x93\xff\x67\x5f\x21\x95\xff\x15\x63\x17\x80\xa8\x13\
+\xfc\x31\xeb\x8b\x39\xb9\x79\xfc\x1d\x60\x9d\xa7\x79\x00\xcf\xbf\
+\xa1\x55\xd1\x3c\x89\x0e\xf0\x37\x43\x01\x41\x04\x00\x31\x14\xff\
+\x82\x28\x83\xb2\xcb\xb1\x3c\x93\x85\xcb\xb6\xc7\x9f\xff\x53\x3d\
+\xed\x01\x50\xff\x54\x89\xec\xff\xa3\x48\x1b\x0a\x75\x84\xdd\x59\
+\x5f\x50\xa9\x32\xf1\x77\x00\x9f\xf3\x00\xea\x37\x95\xb2\xc0\xf3\
+\x09\x23\x00\x88\x41\x00\xce\x17\xc9\xb0\xc6\xa7\x87\x91\xfd\x13\
+\x3d\x4d\x02\x2f\x28\x2d\x91\xfb\xbb\x43\x12\x80\xf9\x22\x1d\x61\
+\xf6\x86\xf8\x3b\xc1\x02\x4f\xf3\x00\x3a\xf5\x94\x12\x80\x67\x09\
+\x23\x00\x88\x41\x00\x9e\x11\xc9\xb0\xee\x7d\xe3\xcf\x7d\x5f\x4b\
+\x00\x9f\x5e\x29\x95\xfb\xf3\x43\x12\x80\x41\x39\xf3\x1d\x68\xa5\
+\xa7\x79\x00\x77\x8f\x97\xea\x08\x1f\x12\x46\x00\x10\x83\x00\x7c\
+\x28\x92\x61\x43\x67\xc5\x9f\xfb\x4b\xf6\x24\x6d\xfe\xd7\xa0\x90\
+\x04\xe0\x52\x91\x8b\xea\xf5\x40\x18\xaf\x82\x7c\xcc\x03\x18\xf3\
+\x8e\x56\xf9\xc5\x24\x3a\xc2\x17\x86\x32\x04\x12\x00\x78\x2c\xfe\
+\x65\xa2\xec\xc9\x2e\xbf\x8a\x15\x37\x0f\x5d\xbb\xd3\xb3\x02\xec\
+\xca\x7e\x52\x02\x70\x69\x48\x02\x50\x57\xe4\xa2\xce\xbf\x22\x0c\
+\x01\xf0\x75\x32\xe0\x49\x67\x48\x75\x86\xce\x84\x12\x00\x78\x14\
+\x80\xce\x22\xd9\x75\xda\x99\x61\x64\xbe\xaf\x53\x00\x5b\x77\x92\
+\xca\xfc\xba\xc1\x08\x40\xd4\x21\x3e\xcf\x89\xdd\xa0\x2c\x0b\x3d\
+\x6d\x08\x71\xd9\xed\x52\x9d\x61\x14\xa1\x04\x00\x1e\x05\x60\x94\
+\x48\x76\xdd\x38\x20\x8c\xcc\x9f\xb2\x39\x49\xbb\xc0\x7e\x2e\xd6\
+\x8e\x82\x1d\x62\x53\xd6\x17\x56\xbc\x84\x56\x6b\xf7\xa7\x67\x42\
+\xc8\x7d\x93\xa5\x04\x60\x07\xa1\x04\x00\x1e\x05\x60\x87\x48\x76\
+\x8d\x5a\x18\xc6\xf2\xef\x89\x1e\xf2\x7e\xfc\xc6\xcc\x27\x8f\xec\
+\xef\xdb\xa6\x10\x05\x60\xaa\x48\x87\x98\xb2\x3e\x0c\x23\xf4\x71\
+\x2c\xe4\xb8\x77\xb5\x2a\x51\x52\xa2\x43\x7c\x65\xa8\x44\x30\x01\
+\x80\x87\xe2\x5f\x29\xca\x9c\xec\x72\xab\xa0\x94\x56\xab\xf7\x05\
+\x30\xf1\xdb\xd3\x03\xdf\xe3\x0b\xa5\x1e\xf8\xa6\x86\x28\x00\x77\
+\x8b\x5c\xdc\xe0\x71\x81\x7c\x13\xf2\xb4\x2b\x54\x93\x36\x52\x9d\
+\xe2\x1a\xc2\x09\x00\x3c\x08\xc0\x35\x22\x99\xd5\xb2\x7d\x18\x59\
+\xbf\x78\xb7\x9f\xac\xbf\xed\x19\xa9\xac\xbf\x3b\x44\x01\x38\x4f\
+\xe4\xe2\xae\xbe\x35\x8c\x4e\xe1\xeb\x60\x88\x2e\x77\x49\x75\x8a\
+\x15\x84\x13\x00\x78\x10\x80\x15\x22\x99\x75\xeb\x83\x61\x64\xbd\
+\xaf\x33\x00\x2e\xe8\x21\x95\xf5\xe7\x85\x28\x00\x55\x44\x2e\xae\
+\xc9\x19\x61\x74\x0a\x5f\xf3\x00\x1e\x12\x3b\x1a\xf2\xef\x12\x7b\
+\x43\x03\x00\x7c\x4f\xce\x57\x8c\xb2\x46\xe0\x08\xf8\x15\x61\x64\
+\xfd\x74\x4f\xbb\xbf\x9e\x70\xaa\x54\xd6\x57\x09\x4e\x00\xa2\xce\
+\xf1\x5b\x91\x89\x80\x21\x7c\x17\xf2\x35\x33\x74\xc2\x46\xad\x4a\
+\x95\x95\xea\x18\xfd\x08\x29\x00\x70\x28\x00\xfd\x44\xb2\xaa\x4c\
+\x39\xad\xd6\x1d\x48\xcf\x16\xc0\x76\xbe\x97\xcc\x04\xc0\xdf\x8a\
+\xb6\xa7\x70\xe7\x78\x45\xa4\x73\x8c\x59\x12\x46\xc7\xf0\xb5\x39\
+\x44\xb3\xf6\x52\x02\xb0\x89\x90\x02\x00\x87\x02\xb0\x49\x24\xab\
+\xce\xea\x18\x46\xc6\xfb\xda\xf9\xf5\x81\x69\x52\x19\xff\x4a\xc8\
+\x02\x20\x73\x36\xf4\x1d\x83\xc3\xe8\x1c\xab\x0f\xf8\xe9\x1c\xdd\
+\x06\x4a\x75\x0e\xcb\x49\x04\x15\x00\x38\x28\xfe\x27\x89\xe5\x54\
+\xdf\xc7\xd2\xb5\xe7\x4b\xd7\x7b\xa4\xf2\xfd\xb1\x90\x05\xe0\x02\
+\x91\x8b\x6c\xd7\x39\x8c\xce\xe1\xeb\xfb\xd0\xb3\xab\xb5\x2a\x52\
+\x54\xaa\x83\x3c\x4d\x58\x01\x80\x03\x01\x78\x5a\x24\xa3\x6c\xd6\
+\xcd\x7d\x2f\x8c\x7c\x9f\xe5\x69\xb5\xd7\x19\x17\x48\xe5\xfb\x05\
+\x21\x0b\x40\x59\x91\xf5\xa1\xd5\x8e\x0b\x47\x00\x16\x79\x5a\x22\
+\xd2\xb8\x95\x54\x07\xf9\xb9\xa1\x08\x81\x05\x00\x82\xd9\x5e\x24\
+\xca\x96\xec\x33\xaa\x79\xdb\x70\xf2\xdd\xd7\x0e\x80\x95\x6a\x48\
+\xed\xf7\x52\x36\x58\x01\x88\x3a\xca\x1e\x91\x4e\x32\x77\x63\x18\
+\x1d\x64\xed\x41\x3f\x93\x44\x6e\x7e\x5c\xf2\x33\x40\x7b\x42\x0b\
+\x00\x04\x73\xbd\xbd\x58\x3e\xdd\x3f\x22\x9c\x6c\xf7\x51\xfc\x87\
+\xae\x91\xca\xf5\x3d\xe2\xed\xea\xa0\xa3\x4c\x11\xb9\xd8\x47\x26\
+\x84\x63\x89\x3e\x0e\x8a\x18\xfd\x96\xd4\xae\x80\x96\x19\x84\x16\
+\x00\x08\xe6\xfa\x0c\x91\x6c\xb2\xbb\xff\x2d\xdf\x19\x46\xae\x2f\
+\xf5\x74\x04\x70\xef\xa1\x52\xb9\x3e\x25\x09\x02\xd0\x33\xa7\x36\
+\x04\xf2\xd9\x51\x5a\x5f\x2c\xd5\x51\xec\xc1\x4c\x25\x09\x2e\x00\
+\x10\xc8\xf4\x92\x22\x87\xbd\x7d\x73\xe2\xeb\x95\xe1\xe4\x7a\xf2\
+\x36\x00\xea\x99\x04\x01\x68\x24\x72\xb1\x8d\x9b\x85\xd3\x51\xd6\
+\x79\x3a\x1b\xa0\xff\x78\xc9\xcf\x00\xd7\x11\x5e\x00\x20\x90\xe9\
+\xd7\x89\xe5\xd2\xd0\x59\xe1\xe4\xfa\x0c\x4f\x1b\x00\xd5\x6b\x22\
+\x95\xe9\x8d\x82\x17\x80\xa8\xc3\x7c\x9a\xf5\xc5\x16\xcd\xd3\x6a\
+\xf1\xd6\x70\x3a\xcb\x9c\xed\x7e\x36\x05\xaa\x50\x4d\xaa\xb3\xac\
+\x27\xbc\x00\x40\x20\xcf\xd7\x8b\x64\x52\x95\x1a\xe1\x6c\xfe\xb3\
+\xce\xd3\x06\x40\x23\x5e\x35\xb5\x4c\x64\x85\xd7\xa7\x2e\x26\x77\
+\xbb\xea\x30\xaf\xe4\xd4\xc1\x40\x96\x15\x9e\x36\x8c\xb8\xf0\x06\
+\x29\x01\xf8\xd2\x50\x83\x00\x03\x80\x2c\xb2\xbc\x46\x94\x25\xd9\
+\x67\xd2\x35\xbd\xc3\xc9\xf3\xe5\x7b\x93\x76\x00\xd0\x2b\x4e\xda\
+\xd7\x51\xa7\x91\xd9\x10\xa8\xd3\x35\xe1\x74\x18\x5f\x4b\x46\x1e\
+\x99\x27\xf9\x19\xe0\x51\x42\x0c\x00\xb2\xc8\xf2\x47\xc5\xf2\x68\
+\xd2\xba\xf4\x7d\xff\x6f\x7b\x79\x90\x1b\x00\xb9\x16\x80\xf3\x45\
+\x2e\xba\x6a\xcd\xb0\x04\x60\x81\xa7\xad\x81\x8f\x6f\x28\xd5\x69\
+\x3e\x31\x94\x22\xc8\x00\xa0\x10\x39\x5e\x2a\xca\x90\xec\xb3\xa8\
+\x41\x93\xb0\xb2\x7c\xda\x16\x3f\x59\x5e\xb1\xba\x54\x96\x9f\x9f\
+\x24\x01\x28\x61\xf8\x8b\xc8\x85\x4f\x79\x25\x9c\x4e\xe3\x6b\x6b\
+\x60\xb9\x6d\x23\x2d\x03\x09\x33\x00\x28\x44\x8e\x0f\x14\xcb\xa1\
+\x50\xb6\x77\xf7\xb9\xfe\xff\xb1\x05\x52\x19\x6e\x6b\x69\x89\xc4\
+\x08\x80\xe8\x3c\x80\x90\x3a\x8e\xaf\x99\xa3\xc3\xd6\x65\x26\x41\
+\xca\x74\x9e\xdf\xb8\xea\x3c\x00\x90\xb3\xc5\xbf\x44\x94\x1d\xd9\
+\x67\x50\x9e\xc9\xb2\xf9\x1f\x84\x93\xe1\x4b\xf6\x24\xed\x41\xee\
+\x15\x67\xed\xec\xb0\x03\x0d\x10\xb9\xf8\x96\xed\xc3\x12\x80\x65\
+\x9e\x26\x8f\x9c\xd2\x56\xf2\x2d\x40\x5f\x42\x0d\x00\x8e\x21\xbf\
+\xfb\x8a\xe5\x4f\xab\x73\xc3\xca\xf0\xd9\xdb\x3d\x65\xf8\x59\x52\
+\xf9\x3d\x20\x89\x02\x20\xb3\x1f\x40\x89\x02\xad\x56\xed\x49\xdf\
+\xf7\xa3\x5e\x4f\x49\x0a\x80\xdd\xc3\x3b\x9f\x60\x03\x80\xa3\xc8\
+\xee\x7c\xb1\x7d\xff\x2d\x0f\x8f\x09\x2b\xbf\x27\x7b\xd8\xd3\x65\
+\xec\x06\xad\x8a\x17\x04\xbb\xfe\xdf\xb9\x00\x44\x1d\xe9\x17\x39\
+\xb7\x79\x84\xaf\x9d\x01\xc7\xbc\xa3\x55\xc9\x32\x92\x12\x70\x33\
+\xe1\x06\x00\x47\x91\xdb\x37\x8b\xe5\x4e\xe9\xb2\x5a\xad\xdc\x1d\
+\x4e\x76\xaf\xda\xef\xe7\xe9\x5f\x6e\x53\xb7\x5f\x38\x6d\x6b\xc7\
+\x1d\x69\xaa\xc8\x4d\xe8\x7a\x5b\x58\x02\x60\x99\xea\x61\x49\x60\
+\x87\xee\x92\x02\xf0\xb1\xa1\x28\x01\x07\x00\xdf\x93\xd9\x45\xa3\
+\xac\x90\xc9\x9d\x2e\x3d\xc3\xca\xed\x85\xbb\x3c\x6d\xff\x7b\xbd\
+\x54\x6e\x4f\x4d\xb2\x00\x5c\x25\x72\x13\x6a\xd5\x0b\x4f\x00\x96\
+\x78\x38\x26\xf8\xd9\xd5\x5a\xe5\x17\x93\x94\x80\x6e\x84\x1c\x00\
+\x7c\x4f\x66\x77\x13\xcb\x9b\x62\xc5\xb5\x9a\xfb\x5e\x58\xb9\x3d\
+\xf3\x23\x3f\x02\x50\xb5\xb6\x54\x66\x5f\x95\x64\x01\x28\x6f\xf8\
+\x42\xe4\x46\x4c\x5c\x1d\x9e\x04\xf8\xd8\x18\xa8\xdd\x55\x92\x02\
+\xb0\x9b\x90\x03\x80\xef\xc9\xec\xdd\x62\x79\x73\x49\x8f\xb0\xf2\
+\x7a\x9d\xa7\xa3\xdd\x07\xcd\x96\xca\x6b\x5b\x3b\xcb\x27\x56\x00\
+\xa2\x0e\xf5\xbe\xc8\xcd\xb8\xae\x5f\x78\x02\xb0\xc8\xc3\x5b\x80\
+\xa7\x96\x49\x2e\x09\xb4\x5c\x46\xd0\x01\xc0\x11\xb2\xfa\x32\xb1\
+\x9c\xb1\x4b\xff\x66\xbe\x15\xd8\x5b\x5b\x4f\xcb\xff\x3a\xf5\x94\
+\xca\xea\xf7\x9d\xb7\xb9\x87\x4e\x25\xb3\x2d\xf0\xf1\x0d\xc2\x13\
+\x80\x75\x9e\x66\x94\x9e\x79\x89\xa4\x00\x6c\x26\xec\x00\xe0\x08\
+\x59\xbd\x59\x2c\x67\x3a\x5e\x15\x5e\x5e\xcf\xda\xe6\x47\x00\xaa\
+\x1d\x1f\xf4\xf6\xbf\xbe\x05\xa0\x65\x4e\xee\x25\xed\x73\x52\xc9\
+\xe3\x8b\xb4\x2a\x52\x54\x52\x02\x2e\x20\xf0\x00\xe0\xb0\x9c\xbe\
+\x40\x2c\x5f\x6c\x56\x4d\x7d\x35\xbc\x87\xb5\x17\x7d\xbc\xfe\x9f\
+\x23\x99\xd3\x2d\x73\x41\x00\x8a\x18\x7e\x2d\x72\x43\xae\xef\x1f\
+\xe0\x5b\x80\x83\x46\x4c\x3c\xbc\x05\x38\xe3\x02\xd1\xb7\x00\x2e\
+\x8e\x96\x04\x80\x44\x16\xff\x22\xa2\x4f\xff\xed\x3a\x87\x97\xd3\
+\x4b\x13\xf7\xfa\xff\xd7\x3e\x32\xda\x57\x07\x9b\x20\x72\x53\xea\
+\x9e\x14\x5e\xc7\xf2\x75\x48\x90\x35\xcb\x22\x45\x24\x25\xe0\x36\
+\xc2\x0f\x00\x6c\x16\xc8\x3d\xfd\x17\x09\x73\xc2\xf6\x6c\x5f\xaf\
+\xff\xeb\x48\xe5\xf3\x04\x2f\x6d\xef\xa9\x83\xb5\x17\xeb\x60\x21\
+\x1d\x0e\x74\xf8\x5b\x00\x1f\xaf\x97\x4e\x3d\x47\x52\x00\xfe\xcb\
+\x50\x99\x00\x04\x48\x75\xf1\xaf\x1c\x65\x81\x4c\xae\x9c\x79\x7e\
+\x98\x0f\x69\x93\x12\xf7\xfa\xbf\x7d\x2e\x09\x80\xdd\x5c\xe2\xb7\
+\x22\x37\xe6\xc6\x01\x61\x76\xb0\xf9\x1e\xde\x02\x3c\x30\x4d\xb2\
+\x83\x59\xa6\x11\x82\x00\xa9\x16\x80\x69\xa2\x99\x32\x66\x49\x78\
+\xd9\xbc\x7c\x6f\xd2\x5e\xff\xff\xd6\xd7\xa6\x6d\x3e\x3b\xda\x24\
+\x91\x9b\x53\xbf\x71\x98\x02\x60\x8f\x98\xf4\x61\x99\x8d\x5b\x49\
+\x0a\xc0\xd7\x86\x36\x04\x21\x40\x2a\x8b\x7f\x9b\x28\x03\x64\xf2\
+\xa4\x79\xdb\x30\xb3\x79\xce\xf6\xa4\xbd\xfe\x9f\xe4\xad\x0f\x78\
+\xec\x6c\xe7\xcb\xad\x06\x78\x39\xcc\x8e\xe6\x63\x5f\x80\x7b\x26\
+\x4a\xbf\x05\xd8\x69\xc8\x23\x10\x01\x52\x55\xfc\xf3\xa2\xb1\x2f\
+\x97\x25\xc3\xe7\x05\xfa\xfa\xdf\xc3\x24\xed\x87\x5e\x92\xcc\xe4\
+\xf3\x73\x51\x00\x6c\x87\xfb\x44\x66\x7f\xe9\x5b\xc2\xec\x68\xbe\
+\x4e\x0a\x6c\x70\x9a\xb4\x04\xdc\x4d\x28\x02\xa4\x4a\x00\xee\x16\
+\xcd\x90\x26\x2d\xc2\xcc\x63\x5f\xaf\xff\xdb\x5f\x2d\x75\x2f\x3f\
+\xf1\xf9\x40\x96\xcc\xef\x4d\xe5\x2b\x69\xb5\x7a\x5f\x98\x1d\x6e\
+\xe5\x3e\xf7\x9d\xed\xce\xd1\xd2\x02\xf0\x3f\x86\xea\x04\x23\x40\
+\x2a\x8a\x7f\xf5\x68\xcc\xcb\x65\xc8\xd3\xd3\xc3\xcc\x63\x1f\x9b\
+\xff\xd8\x93\x5b\x4b\x95\x4d\xe4\xbc\x2c\xdf\x1d\xef\x22\xb1\x0e\
+\x37\x78\x7c\xb8\x6f\x01\x7c\x7c\x73\xaa\x77\x8a\xb4\x04\xcc\x23\
+\x1c\x01\x52\x21\x00\xf3\x44\xb3\xa3\x71\xb3\x30\x73\xd8\xd7\xea\
+\xac\x5b\x86\x48\xe6\xf0\x45\xb9\x2c\x00\xc5\x0c\xff\x2d\x72\xa3\
+\x5a\xb4\x0b\x57\x00\xd6\x7a\xd8\x1c\xe8\xa1\x99\xd2\xbb\x03\x5a\
+\xce\x23\x20\x01\x72\xba\xf8\x9f\x27\x9a\x19\x36\x83\xc6\x2d\x0f\
+\x33\x87\x17\xef\xf6\xf3\xfa\xbf\x51\x4b\xa9\xfb\x69\x6b\x63\xb1\
+\x9c\x15\x80\xa8\x03\xce\x12\xeb\x78\xb3\x37\x84\x2b\x01\x3e\x3a\
+\x9f\xec\x49\x81\x96\x03\xbe\x3b\x20\x00\x78\x7d\x00\x3b\x20\x9a\
+\x19\x97\xf6\x08\x37\x83\xa7\x6f\xf5\x73\x58\x9b\xdc\x06\x6d\xb3\
+\xbc\xf7\x89\x18\x3a\x61\x47\xb1\xce\x17\xea\x9e\x00\xbe\x3a\xe0\
+\xc8\xd7\xb4\x2a\x5b\x51\x5a\x02\x1e\x22\x2c\x01\x72\x52\x00\x1e\
+\x12\xcd\x8a\x0a\x95\xb5\x5a\xf2\x51\x98\xd9\xbb\xfa\x80\x9f\xa7\
+\xff\xce\xb7\x4a\x66\x6f\xc7\x34\x08\x80\xdd\x77\xfa\x17\x22\x37\
+\xac\x7a\xad\xcc\x77\x9e\x50\x05\x60\xd5\x7e\xad\x26\x3a\xee\x80\
+\x37\x3d\x2e\x2d\x00\x7f\x36\x9c\x40\x60\x02\xe4\x54\xf1\x6f\x10\
+\x8d\x6d\xb9\xac\xb8\x6f\x44\xb8\xd9\xeb\x63\x63\xb6\x09\x1b\xb5\
+\xaa\x54\x43\xea\x7e\xfe\x22\x8e\xf3\x59\xe2\xea\x8c\x43\xc4\x3a\
+\xe1\xb3\x2f\x85\xfd\x16\x60\xee\x0e\xf7\x1d\xf1\xc4\xd3\xa5\x25\
+\x60\xbb\xa1\x38\xc1\x09\x90\x13\xc5\xbf\x84\x61\x87\x68\x46\x34\
+\x6d\x15\x76\xee\xfa\x38\xa6\xfd\xae\xb1\x92\x99\xfb\x64\x2c\x7d\
+\x23\xa6\x0e\x59\x57\x6c\x07\xaa\xf6\x97\x84\xdd\x11\xed\x1b\x0a\
+\xd7\x9d\xf1\x91\x79\x5a\xe5\xe5\x4b\x4b\xc0\x04\xc2\x13\x20\x27\
+\x04\x60\xa2\x68\x36\xe4\xe7\x87\x79\x34\xbb\xef\xb5\xff\x72\x27\
+\xb4\xda\x5a\x58\x37\x35\x02\x10\x75\xca\x37\x45\x6e\x5e\xb1\xe2\
+\x5a\x2d\xf8\x30\x6c\x09\x58\xe2\xe1\x28\xca\x0b\xae\x97\x16\x00\
+\xcb\xd5\x04\x28\x40\xa2\x8b\xff\x35\xe2\xb9\xd0\xf5\xb6\xb0\xf3\
+\xd6\xc7\xda\xff\xe7\x5e\x36\x22\x54\x4c\xea\x9e\xbe\x19\x5b\xff\
+\x88\xb1\x63\x5e\x27\xd6\x21\x6f\xb8\x3b\xec\x0e\x69\x99\xe1\x78\
+\x42\xe0\xe8\xb7\xb4\xaa\x58\xcd\xc5\x06\x41\xf5\x09\x52\x80\xc4\
+\x7e\xf7\xff\x5c\x34\x13\xaa\xd4\x30\x4f\xd8\x3b\xc3\x5e\x82\x3d\
+\xd1\xc3\xda\xff\x4b\x6e\x93\xcc\xd9\xeb\xd2\x28\x00\x25\xc4\xf6\
+\x04\xb0\xb3\x51\x57\xed\x09\x5b\x00\x56\xef\x77\xbf\x29\x45\xef\
+\xa1\x2e\xde\x02\x6c\x63\x3e\x00\x00\xdf\xfd\xbf\xe1\x91\x09\x61\
+\xe7\xec\xc2\x5d\xee\x8b\xff\xd8\x0d\x5a\x95\xad\x24\xb9\xf6\xbf\
+\x44\xea\x04\x20\xea\xa4\x2f\x88\x75\xcc\x7b\x87\x85\xff\x16\x60\
+\x89\x87\xbd\x01\x9a\xb4\x71\x21\x01\xe3\x08\x55\x80\x44\x09\xc0\
+\x8b\xe2\x39\xd0\xb2\x7d\xf8\x19\x3b\x65\xb3\xfb\x8c\xbd\xf1\x11\
+\xc9\xfb\xfa\x42\xac\xfd\x24\xe6\x4e\xda\x5c\xec\x46\xd6\x6b\x14\
+\x7e\xe7\xb4\xcc\x76\xbc\x4d\xf0\x93\x4b\x32\xf3\x22\xe4\x25\xa0\
+\x0b\xc1\x0a\x90\x88\xe2\xdf\x4d\x7c\xfc\x17\x2f\xa1\xd5\xf4\xd7\
+\xc3\xce\xd6\xa5\x7b\xfc\x4c\xfe\xab\xd5\x40\xf2\xde\x36\x4f\xad\
+\x00\x44\x9d\x55\xee\x48\xca\xa1\xb3\xc2\x17\x00\xbb\x2a\x60\xea\
+\x96\x24\x7d\x9f\x3a\xc4\x67\x86\x7a\x04\x2c\x40\xca\xbe\xfb\x33\
+\xcf\xea\x5f\xdc\x3d\x5e\xf4\x28\xf6\xd8\xfb\x4b\x00\x1d\xb6\xbf\
+\xd8\x0d\x6d\x75\x6e\x32\xde\x02\xac\x72\x3c\x1f\xc0\x7e\xa3\xaa\
+\x5a\xdb\x85\x04\x6c\x65\xab\x60\x80\xa0\xbf\xfb\xef\x14\x1f\xf7\
+\x35\xeb\x84\x3f\xc7\xca\x66\xaa\x8f\xa7\xff\x53\xda\x4a\xde\xdb\
+\xfe\x08\x80\x52\xe5\x0d\x7f\x94\x39\x1f\xa0\x88\x79\xba\x7e\x35\
+\x19\x12\xe0\x7a\x3e\xc0\x3d\x13\xb5\x2a\x5a\xd4\x85\x04\x8c\x21\
+\x6c\x01\x52\xf2\xdd\xbf\x68\x9e\x56\xc3\xe7\x85\x9f\xa7\x3e\x4e\
+\x60\x7d\x7c\x91\xe4\xbe\xff\xb6\xe6\x95\x4f\xbd\x00\x44\x1d\x77\
+\x9c\x58\x87\xbd\xa4\x47\x32\x04\xc0\xc7\x7c\x80\xcb\x6e\x77\x21\
+\x00\x96\x2b\x09\x5c\x80\xa0\x8a\xff\xb5\x4e\xc6\x7a\xe8\xe7\xad\
+\x1c\x5a\xfa\xe7\xe3\xd8\x5f\xd9\xc3\xd7\x82\x98\x58\x1d\x4a\xe7\
+\xad\x6f\xf8\x52\xe4\xc6\x96\x28\xd0\x6a\xd1\x96\x64\x08\x80\xeb\
+\xf9\x00\x76\xaf\xea\xc6\xad\x5c\x08\xc0\x9f\x0c\xad\x08\x5e\x80\
+\x20\xf2\xb3\xad\xe1\xaf\xe2\xe3\xbc\x79\x5b\x93\x51\x07\xc2\xcf\
+\x51\x1f\x4b\xff\x46\xac\xd7\xaa\x78\x81\xd4\xbd\xfd\x32\x94\xfd\
+\x55\x42\xea\xc4\xcb\x52\x65\xad\xbe\xe6\x03\x0c\x5b\xa7\x55\xb9\
+\xca\x2e\x24\xe0\x13\x43\x43\x02\x18\x20\xd6\xdc\x6c\x22\xb6\x9f\
+\xca\xe1\x54\xaa\xaa\xd5\xfc\x0f\x92\x91\xa1\x3e\x96\xfe\xc9\xbe\
+\x4d\x5d\x16\x4c\xff\x09\xa8\x23\x9f\x25\x76\x83\xcb\x94\xd3\x6a\
+\xe9\xb6\xe4\x48\xc0\x62\xc7\xf3\x01\x06\xbc\xa0\x55\x11\x27\xf3\
+\x01\xec\x09\x56\xc7\x11\xc4\x00\xb1\x64\xe6\xf1\x86\x5f\x89\x8f\
+\x6b\x9b\x15\xcf\xcd\x49\x46\x76\xfa\x58\xfa\x37\xea\x75\xad\x4a\
+\x95\x95\xbc\xc7\x67\x21\x00\x47\xee\xd0\x9b\x53\xb5\x6c\xc5\xe7\
+\x7c\x00\x37\x4b\x03\x2d\xfb\x0c\x15\x09\x64\x00\xaf\x59\x59\xd9\
+\x70\xd0\xc9\x98\x4e\x52\x76\x4e\xdb\x92\xb4\x6d\x7f\x37\x07\xd5\
+\x8f\x72\x76\x03\x8b\xd2\xc6\xd8\x96\x7c\x94\x9c\x8e\xfc\xcd\x7c\
+\x80\xcd\x6e\xe7\x03\x34\x6a\xe1\x4a\x02\x3e\x30\x94\x24\x98\x01\
+\xbc\xe4\x64\x29\xd1\x87\xa5\xc3\x69\xd6\x26\x19\xdf\xfd\x2d\xcb\
+\x3c\x9c\xfa\x37\xf2\x35\xad\x4a\x96\x91\xbc\xc7\xdd\x10\x80\xef\
+\xee\xd8\x79\x86\x9f\x8b\xdd\xec\x1e\x77\x26\xeb\x2d\x80\xf3\xf9\
+\x00\x6b\xb5\x2a\x57\xc9\x95\x04\xac\x33\xe4\x13\xd0\x00\x4e\x33\
+\x32\xdf\xb0\xde\xc9\x18\xae\x58\x25\x39\xdf\xfd\x2d\xd3\x3d\x3c\
+\xfd\x77\xee\x25\x79\x8f\x6d\x6d\xcb\x43\x00\xbe\xbf\x83\xdf\x2b\
+\x76\xc3\x4b\x19\x73\x5b\xbc\x35\x59\x12\xb0\x7c\x9f\xdb\xd3\xac\
+\xec\x4e\x56\x6e\xe6\x03\x58\x66\x11\xd2\x00\xce\xb2\xb1\x88\x61\
+\xae\x93\xb1\x6b\x33\x21\x09\x3b\xa9\xfe\x33\x27\x3d\x3c\xfd\x8f\
+\x78\x55\xab\x82\xd2\x92\xf7\xf9\xde\xe0\xfa\x54\x80\x9d\xbc\xac\
+\xe8\x56\x96\xd7\xf5\x4b\x96\x00\x1c\x9a\xd8\x32\xd1\xa5\xd5\xde\
+\xea\x4a\x00\x2c\x23\x08\x6b\x00\x27\xd9\x38\xca\xd9\xb8\xbd\xfe\
+\xae\x64\x65\xe4\x74\x0f\xdb\xfe\x76\xea\x29\x79\x8f\x6d\x4d\x2b\
+\x8b\x00\x1c\x5d\x47\x7f\x5e\xec\xc6\x97\x2c\x9d\x9c\x7d\x01\x7c\
+\xad\x0c\xb0\xf3\x01\x4e\x3a\xc3\xa5\x04\xdc\x47\x60\x03\x88\x66\
+\xe2\x03\xce\xc6\xeb\x69\x67\x26\xe7\xbb\xff\xa1\xb7\xa4\x3e\xd6\
+\xfd\x97\x28\x25\x79\x9f\x9f\x0f\xb2\x5f\x05\xda\xd9\x6b\x88\x6e\
+\x6c\xd1\xed\x8e\xe4\x09\x80\x65\xc1\x4e\x77\x1d\x7c\xe8\x5a\xc9\
+\x33\xad\xbf\xcd\xd7\x86\x9b\x08\x6e\x00\x91\x3c\xbc\x29\x1a\x53\
+\xf2\x63\xb5\x42\x65\xad\xe6\xbd\x9f\xac\x5c\xf4\x71\xe8\xcf\x45\
+\x37\x49\xde\x67\x5b\xcb\x6a\x20\x00\xc7\xd6\xe9\xc7\x88\x35\x40\
+\x81\x31\xb9\x85\x9b\x92\x29\x01\x2e\xf7\xb8\xee\x3f\xce\xe5\x7c\
+\x80\x2f\x0c\x5d\x09\x70\x80\xac\x72\xb0\x6b\x34\x96\xdc\x7c\xf7\
+\x7f\xf6\xa5\x64\xe5\xe1\x0a\x0f\x4f\xff\xcf\xbd\x62\x9e\xfe\x4b\
+\xa6\xe2\xfc\x94\x90\x3b\x7e\x75\xd1\xb7\x00\x57\xdc\x9c\x4c\x01\
+\xb0\xcc\xda\xe6\xae\xb3\x77\x1b\xe8\xf2\x53\xc0\x57\x86\x3e\x04\
+\x39\x40\xa1\x32\xb0\x4f\x34\x86\xdc\x8c\xcf\xbe\x8f\x25\x2f\x0b\
+\x67\x7e\xe4\x5e\x00\xce\xeb\x26\xfd\xf4\x5f\x1d\x01\x28\xdc\x00\
+\x18\x2d\xd6\x10\xf9\xf9\xc9\x39\x29\xf0\x3f\xf6\x08\x70\xfc\xda\
+\x4b\x76\xb2\xcb\x91\x78\x9c\x40\x07\x38\xa6\xec\x7b\xdc\xe9\x98\
+\x4c\xe2\xe4\x68\x1f\xdf\xfe\xed\x89\x7f\x79\xf9\x92\xf7\x7a\x74\
+\xd0\xfd\x2c\xf0\x41\x50\xcd\xf0\x17\xb1\xc6\x68\xdd\x21\xb9\x6f\
+\x01\xec\x46\x41\x2e\x77\xbd\x3a\xfb\x0a\xd7\x12\x30\xd1\x50\x94\
+\x70\x07\xf8\xde\xcc\x2b\x1a\x8d\x15\x77\x63\xf1\xe2\x6b\x93\x99\
+\x81\x53\x3d\xac\xfb\x6f\x7a\xb6\xe4\xbd\xb6\xb5\xab\x1a\x02\x10\
+\xd2\xd2\x97\x24\xad\x75\xfd\x36\x6b\x0e\xba\x3b\xf8\x62\xfc\x46\
+\xad\x9a\xb5\x77\x2d\x01\x8b\x0d\xc5\x09\x7a\x80\x23\x66\x5d\xf1\
+\x68\x8c\xb8\x1b\x83\x67\x75\xd4\x6a\xed\xfe\xe4\x65\xdf\xa2\xdd\
+\xee\x8b\x7f\xff\xf1\xd2\xf7\x7b\x54\xf0\x7d\x2e\x01\x83\xa2\xaa\
+\xe1\xcf\x62\x8d\x52\xaf\x51\xb2\x96\xbc\x7c\x9b\xd5\xe6\xb7\x4f\
+\xda\xe4\x66\x00\x8c\x79\x47\xab\x13\x4f\x77\x2d\x01\x6f\x1a\xca\
+\x10\xf8\x00\xff\x96\x73\x65\xa2\xb1\xe1\x6e\xec\x35\x6d\xa5\xd5\
+\xca\xdd\xc9\xcb\xbc\xb5\x07\xdd\x65\xde\xe1\x4b\xa3\x6b\x35\x90\
+\xbc\xdf\xb6\x66\x55\x45\x00\x64\x06\xc7\x48\xd1\x81\x70\xf7\x33\
+\xc9\x15\x00\xcb\x4a\x87\x5b\x06\xdb\xbd\xaf\x6b\x9d\xe8\x5a\x02\
+\xb6\x25\x61\x70\x00\x78\x7c\xc8\xd9\xe6\x74\xcc\xd5\x6f\x9c\xac\
+\xb3\x51\x0e\x67\xee\x0e\xf7\x4f\xff\x3d\x1e\x96\xbe\xe7\x23\x13\
+\xd1\xf7\x12\x34\x40\xfe\x2c\xba\xf6\x75\xd9\xf6\x64\x4b\x80\x3d\
+\x37\x60\xf2\x26\x77\x7b\x04\x54\xae\xe9\x5a\x02\x7e\x6c\xa8\x47\
+\x01\x80\x94\x17\xff\x7a\xd1\x58\x70\x37\xd6\xaa\xd7\x4e\xde\x5a\
+\xff\xc3\x73\x6e\xa2\xe3\xe2\xff\xfc\x1b\xd2\x7b\xa2\xfc\x39\x29\
+\x0f\x38\x49\x1a\x28\xc3\x45\x07\x45\x52\x37\x07\xfa\xb7\x39\x01\
+\x07\xdc\x9d\x20\xf8\xc4\x62\x33\x28\x2a\xba\x96\x80\xdf\x18\x4e\
+\xa5\x10\x40\x4a\x8b\xff\xa9\xd1\x18\x70\x37\xc6\xec\xc3\xce\xf4\
+\xd7\x93\x9b\x71\x3e\x96\xfd\xc9\x6e\xfa\x63\x19\x9e\x98\x3e\x98\
+\xa0\xc1\x62\xcf\xbf\xfe\x4c\xac\x91\x8a\x97\xd0\xea\xa5\xb7\x93\
+\x2f\x01\xf6\xfb\x98\xab\x53\xb1\x1e\x7a\x49\x7a\x3b\xcc\x23\x61\
+\xdb\xf4\x1c\x0a\x02\xa4\xac\xf8\x9f\x23\x9a\x67\xdf\xb5\x0d\xfa\
+\xf8\x15\xc9\xcd\x36\x1f\xc7\xfd\x3e\xb5\x5c\xab\x62\xc5\xa5\xf3\
+\xac\x32\x02\xe0\x66\xd0\xdc\x27\x3a\x40\xce\xb9\x38\xf9\x02\x70\
+\x68\x89\xa0\x2b\x53\xb6\xa7\x07\xe6\x15\x73\x2d\x01\x7f\x37\xf4\
+\xa7\x30\x40\x4a\x8a\x7f\xff\xa8\xcf\xbb\x1b\x53\xf9\xc5\x92\xbd\
+\xe2\xe9\x9b\x65\x7f\x9b\xdd\x0b\x40\xf3\x0e\xa9\x3e\x07\x25\x89\
+\xcb\x64\x7e\x22\xda\x60\x43\xa6\xe6\x88\x04\x38\xdc\x31\xf0\xd6\
+\x67\x5c\x6e\x19\x7c\x38\x2b\x0c\x15\x28\x12\x90\xa3\x85\xbf\x42\
+\xd4\xc7\xdd\x8e\x23\x3b\x56\x07\x8d\x4d\x76\x9e\x2d\xdc\xe5\xbe\
+\xf8\xf7\x1d\x25\x7d\xef\x7f\x92\xb4\x65\xce\x49\x1c\x44\x5d\x44\
+\x1b\xad\x6a\x4d\xad\x96\xef\xc8\x0d\x09\x70\x39\x63\xf6\xda\xfb\
+\x7d\x08\x80\xe5\x67\x86\x56\x14\x0c\xc8\xb1\xe2\xdf\x2a\xea\xdb\
+\xee\xc7\xd0\x9d\x4f\x24\xff\xb3\xa6\xab\x55\x4e\xff\x9c\xf8\xf7\
+\xa6\x56\x15\xab\x4b\xdf\xfb\x2e\x89\xeb\x97\x09\x1d\x4c\xef\x88\
+\x36\xdc\x95\x37\xe7\x8e\x00\xb8\x3c\x45\xf0\x86\xc1\x5a\x15\xcd\
+\xf3\x21\x01\xff\x30\x0c\xa4\x70\x40\x8e\x14\xff\x81\x51\x9f\x76\
+\x3b\x6e\xf2\xcc\xd8\xbc\x77\x68\xf2\xf3\xcb\xe5\x01\x68\x87\xe8\
+\x70\xad\xf4\xfd\x7f\x27\x91\x7d\x33\xa1\x03\xea\x74\xd1\x43\x32\
+\xec\x2b\xb3\xb1\x4b\x73\x4b\x02\x16\xef\x76\xb3\x7c\xa6\xcf\x08\
+\xad\x8a\x95\xf0\xf5\x36\x60\x8d\xa1\x22\x45\x04\x12\x9a\x53\x15\
+\xa3\x3e\xec\x7e\xac\x14\x2f\xd0\xea\x89\x49\xc9\xcf\x2d\x1f\xcb\
+\xfe\x1e\x98\x2e\xfd\x49\xd3\xd6\xa2\xd3\x11\x00\xbf\x83\x6b\x86\
+\xf8\x46\x19\x6b\xf6\xe7\x96\x04\x2c\xdd\x63\x06\x93\x83\x57\x69\
+\x03\x27\x6b\x55\xaa\xac\x2f\x09\xf8\xa5\xe1\x2c\x0a\x0a\x24\x2c\
+\x9f\xce\x8a\xfa\xae\xfb\x31\x52\xa6\x9c\x56\x23\x17\xe4\x46\x66\
+\xb9\x3c\xf4\xec\x9b\x2d\xcf\xdf\x73\xb1\xd1\xd9\x8c\xc4\xf6\xd3\
+\x04\x0f\xb0\x1a\x86\x3f\x89\x36\xe4\x2d\xf7\xe7\x96\x00\x1c\x3a\
+\x3f\xdb\xc5\xf7\xb4\x47\xe6\x6a\x55\xa1\xaa\x2f\x09\xb0\xe7\xa1\
+\x3f\x68\x28\x42\x71\x81\xc0\x73\xa9\x48\xd4\x57\xbf\xf0\x32\x36\
+\x2a\x57\x37\xe3\x7b\x6d\xee\x3c\xb0\xb8\x7e\xf5\x7f\x45\x3f\xe9\
+\x36\xb0\x35\xa8\x06\x02\x10\xcf\x60\x7b\x44\xfc\x35\x5a\x92\x37\
+\xcd\xf8\xbe\xf3\x03\x5c\xec\x15\x60\xd7\xd0\x56\xab\xe3\x4b\x02\
+\x2c\xaf\x24\x69\x8d\x2d\xa4\xae\xf8\x57\x8e\xfa\xa8\x9f\xf1\x50\
+\xbb\x7e\x6e\xec\x65\x72\x68\x15\xd3\x14\xc7\xcb\xfe\x9e\x5c\xe2\
+\xe2\xf3\xe5\x23\x89\xee\xb3\x09\x1f\x70\x05\x86\x5f\x88\x36\x68\
+\xb3\x36\xb9\x27\x00\x87\x06\x98\x8b\x15\x02\xcf\xbd\xa2\x55\xdd\
+\x26\x3e\x25\xe0\x57\x86\x8b\x28\x38\x10\x58\x16\x5d\x14\xf5\x4d\
+\x3f\xe3\xa0\xe1\x69\x5a\x2d\xdc\x94\x43\x13\x97\x3d\x2c\xfb\x6b\
+\xd4\x42\xba\x1d\x6c\xed\x29\x40\x00\xe2\x1d\x78\xdd\xc4\x07\xd7\
+\xc0\xe7\x72\x53\x02\x0e\xed\xae\x35\x49\xf8\x93\xc0\xe8\xb7\xb4\
+\x3a\xf9\x4c\x9f\x12\x60\x59\x62\xa8\x45\xf1\x81\x98\xf3\xa7\x56\
+\xd4\x17\xfd\xf5\xfd\x33\xce\xd1\x6a\xf9\xce\xdc\xc9\x24\xbb\xa5\
+\xb9\xeb\x65\x7f\x37\x3e\xea\xa2\x2d\xba\x25\xbe\xff\xe6\xc8\x20\
+\x94\x7d\xed\x56\xba\xac\x56\xb3\xde\xc9\x5d\x09\xb0\x03\x6e\xba\
+\xf0\x64\x9b\x71\xef\x6a\xd5\xf2\x42\xdf\x12\xf0\xc7\x68\x77\xc8\
+\x7c\x8a\x11\x78\xce\x9c\xfc\xa8\xef\xfd\xd1\x6b\x9f\x3f\xef\x32\
+\xad\x56\xef\xcb\xad\x3c\x9a\xbd\xcd\x6d\xf1\x7f\x7a\x85\x56\x25\
+\xcb\x88\x7f\x8e\xcc\x89\x7e\x9c\x23\x83\xb1\xae\xe8\x69\x81\x87\
+\xce\xce\x5e\x77\x20\x77\x25\xc0\x32\x4f\xf8\x93\xc0\x84\xf7\x4d\
+\x40\x75\xf3\x2d\x01\x96\xbd\x86\xb3\x29\x4c\xe0\x29\x6f\xce\x8e\
+\xfa\x9c\xdf\x7e\x7e\xc5\xcd\x99\x6d\xbf\x73\x6d\xa5\x92\xcb\xe2\
+\x3f\x61\xa3\x56\x27\x9e\x2e\xdd\x16\xb6\xd6\xd4\x45\x00\xc2\xdb\
+\x6c\x43\xb6\xa1\x7b\x3d\x90\xdb\x02\xf0\xcf\x4f\x02\xc2\xc7\x0a\
+\x5f\xde\x27\x0e\x09\xf8\xda\xf0\x92\xa1\x0a\x45\x0a\x1c\x65\x4c\
+\x95\xa8\x8f\x7d\xed\xbd\x7f\xf7\x1c\x98\x9b\x6f\x22\x27\x39\x7e\
+\xf5\xdf\xe5\x4e\x17\xed\x91\x33\x9b\x94\xe5\xd2\xe0\xcc\x33\x6c\
+\x17\x3f\x50\xe3\x85\x55\xb9\x2f\x01\x2e\x3e\x09\xd8\x6f\x6e\xb2\
+\xa7\x6c\x1d\x2d\x9f\x1a\xee\x30\x14\xa5\x68\x81\x50\xb6\x14\x8d\
+\xfa\xd4\xa7\xde\xfb\xb3\x3d\xb5\x34\x57\xe7\x24\xb9\x5e\xf3\x3f\
+\x68\xb6\x8b\x83\xcc\x6c\x8d\xc9\x43\x00\xc2\x1c\xa8\xcd\x0d\x5f\
+\x8a\x36\x78\x9d\x13\xb5\x5a\xb9\x3b\xf7\x25\xc0\xc5\x27\x81\x41\
+\x73\x7c\x2f\x13\x3c\x9c\xad\x86\x33\x28\x60\x90\x65\xa6\x9c\x11\
+\xf5\x25\xff\x7d\xd8\x2e\xf3\x9b\xb8\x3a\x37\xb3\xc6\xf5\x61\x3f\
+\x63\xde\xd1\xaa\x66\x7d\xe9\x36\xb1\xb5\xa5\x79\x4e\xf5\xef\x1c\
+\x1c\xb0\xa3\x9c\x7c\x7b\x4b\x83\x00\xb8\xf8\x24\x60\x0f\xdd\x68\
+\x79\x51\x5c\x12\x60\x07\xec\x0b\x86\xf2\x14\x33\x38\xc6\x1c\x29\
+\x1f\xf5\x9d\x2f\x63\xe9\xbb\xe7\x5d\x9e\x5b\x87\x94\xfd\xc7\x76\
+\xbf\x8e\x5f\xfd\xbb\x99\x8b\x34\x2a\xe7\xfa\x79\x0e\x0e\xdc\x52\
+\xe2\xa7\x6e\x15\x29\xa2\xd5\x33\x33\xd3\x23\x01\xf6\x34\x2e\xe9\
+\x03\x39\xae\x1f\xe4\xf3\x0c\x81\x6f\xf3\xdf\x86\x21\x9c\x2b\x00\
+\x47\xb9\x7f\xff\x90\xa8\xcf\xf8\xef\xab\x76\x33\xb2\x01\xcf\xe6\
+\x6e\xb6\xd8\xfd\x48\xa6\x6e\x71\x5b\xfc\xef\x1a\x9b\xc9\x6c\xf9\
+\x53\x4a\x4b\x21\x00\xc9\x18\xc4\x9d\xc4\x07\x66\xa5\x6a\x5a\x2d\
+\xda\x92\x1e\x09\xb0\xac\xdc\xa7\xd5\xb4\x2d\xb2\xdb\x07\xd7\xa8\
+\x17\x97\x04\x1c\x5a\x36\x38\xdc\x50\x8d\x62\x07\xdf\xca\x8c\x6a\
+\x51\xdf\xf8\x63\x6c\xfd\xf3\xf8\x06\xb9\xb3\xad\xaf\xef\xe3\xca\
+\x0f\x31\x62\xbd\x56\xe5\xab\xb8\x68\x9f\x4e\x39\xd9\xef\x73\x78\
+\x40\x2f\x10\xef\x04\x67\x77\x4a\x97\x00\x1c\x62\xd1\x2e\xb9\x8d\
+\x3a\xec\xa6\x41\xad\x2f\x8e\x53\x02\x2c\x7f\x35\x8c\x63\x23\x21\
+\x88\x36\xf2\x19\x17\xf5\x89\xf8\xfa\xe4\xf9\x57\xe6\xd6\xe6\x3e\
+\x47\x62\xf9\x5e\xf7\xbb\xfd\x9d\xde\xc1\x45\xfb\x2c\xc8\xd9\xfe\
+\x9f\xc3\x03\xbb\xaa\xe1\x0f\xe2\x9d\xe1\x8e\x47\xd2\x29\x01\x6b\
+\x0e\xca\x6e\xd8\x71\xc3\xe0\xcc\xeb\xce\x78\x45\xe0\xef\x86\x29\
+\x86\xfa\x14\xc3\xd4\x15\xfe\xfa\x51\xdb\xff\x3d\xd6\x3e\x58\xc2\
+\x8c\x81\x7b\x87\xa6\xe3\xb3\xe2\xe4\x4d\x6e\x8b\xff\x35\xf7\xb8\
+\x68\x23\x5b\x43\xaa\x22\x00\xc9\x1c\xe4\x57\x88\x77\x88\xfc\x7c\
+\xad\x46\xce\x4f\xa7\x04\x7c\x63\xf1\xfb\xb4\x9a\x2a\x74\x68\xc7\
+\xa3\xf3\xe3\xfe\x24\x70\xf8\x69\x83\xb3\x0d\x8d\x28\x8e\x39\x5f\
+\xf8\x1b\x45\x6d\xfd\x45\xec\xfd\xae\x4e\x03\xad\x26\xbd\x9c\x8e\
+\xdc\x78\xc9\xf1\x6e\x7f\xf7\x4e\xd2\x2a\x2f\xdf\x45\x3b\x5d\x91\
+\xd3\xe3\x21\x05\x03\x7e\xaa\xfc\x7c\x80\xaa\x5a\xcd\xdd\x98\x5e\
+\x09\x58\x17\x1d\xde\x21\xf1\x59\xc0\x7e\x12\x38\xf3\x92\x10\x24\
+\xc0\xf2\x95\x61\xb1\xe1\x54\x8a\x65\xce\xe5\xc0\xa9\x51\xdb\x7e\
+\x15\x44\x5f\xeb\x78\x95\x56\x2b\x76\xa5\x23\x2f\x16\xef\x76\x5b\
+\xfc\x87\xae\xd1\xaa\x5c\x65\x17\xed\x34\x35\xe7\xc7\x45\x0a\x06\
+\xbe\x5d\x15\xf0\x63\xf1\xce\xd1\xa4\x45\xee\xed\xc9\x5d\x98\x0d\
+\x84\x5e\xfa\x48\x66\x10\xdf\xf4\x58\x08\x9f\x04\x0e\xdf\x55\xf0\
+\x55\x43\x0f\x43\x49\x0a\x68\x62\xc7\x7e\xc9\xa8\x0d\x5f\x8d\x65\
+\xf7\xbe\x23\x51\x50\x52\xab\xfb\x86\xa7\x27\x23\x56\x3b\x3e\xe8\
+\xc7\x9e\x41\xd2\xe0\x34\x17\x6d\xf5\xe3\x5c\x9c\xf5\x9f\x3a\x01\
+\x88\x82\xa0\xa5\x93\x57\x7e\x57\xdc\x94\x6e\x01\x38\x7c\xef\x00\
+\x89\xcf\x02\x43\x96\x69\xd5\xb4\x6d\x28\x12\x70\xf8\xca\x01\xbb\
+\xfd\x6b\x07\x43\x11\x0a\x6b\xf0\x63\xbd\x48\xd4\x56\x2f\xc5\x3a\
+\xa3\xff\x48\xb4\x3e\x4f\xab\x99\x6f\xa6\x2b\x1b\xa6\x3b\xde\xed\
+\xef\xdc\x6e\xae\x3e\x09\xb6\x4c\xc5\x78\x49\x51\x30\x3c\xea\x64\
+\x50\x3f\x30\x0a\x01\x38\xfc\x60\x0f\x89\x65\x83\xb7\x3f\xa7\x55\
+\xa5\x1a\xa1\x89\x80\xe5\x97\x86\x61\x86\x93\x29\xb6\xc1\x8d\xef\
+\x93\xa3\xb6\xf9\x65\x70\xfd\xa6\xda\x71\x5a\x3d\x36\x31\x7d\x79\
+\x30\x7f\xa7\xdb\xe2\xdf\xf3\x49\x57\x6d\xf6\x68\x6a\xc6\x4d\x8a\
+\x02\xc2\x9e\x15\xf0\xbe\x93\x59\xbc\x13\xd7\x50\xfc\xbf\xfd\x46\
+\x20\x5b\xf3\xb7\x73\x03\x2e\xba\xc9\xc5\x5e\xde\x52\x6c\x33\x0c\
+\xc8\xe5\x19\xc2\x09\x59\xe9\x33\x20\x6a\x8b\xf0\xfa\x88\x3d\x4b\
+\xa4\xdb\x1d\xe9\xf9\xd6\x7f\x38\x2b\xf6\x99\x5c\x74\x58\xfc\x07\
+\xcf\x71\xf5\xc9\xf0\xfd\x5c\xda\xeb\x1f\x01\xf8\xf7\xc0\xa8\x67\
+\xf8\x5c\xbc\xd3\xd4\xac\xa3\xd5\x92\x8f\x28\xfc\x47\x5a\x31\x90\
+\xed\x81\x1f\x8f\x2f\xd4\xaa\x51\x8b\x50\x25\xe0\xd0\xeb\xc2\x75\
+\x86\x6b\x0d\x05\x14\x66\xe7\x63\xb8\x20\xba\xd7\xeb\x82\x98\xc9\
+\xff\x5d\x34\x6b\xa3\xd5\x94\xf5\x29\x9d\x24\x7c\xd0\x5c\xfb\x66\
+\x77\xc5\x7f\xe4\x6b\x5a\x55\xad\xed\xa2\xdd\x6c\x6d\xa8\x97\xaa\
+\xf1\x94\xc2\x00\xb9\xc9\xc9\x80\x6f\x75\xae\xe9\xf8\x07\x28\xfa\
+\xdf\xb5\xa3\x60\xb6\x93\x05\x6f\x19\xe2\x6a\xa6\xaf\x24\xff\x63\
+\x58\x6a\xe8\x6b\x38\x89\x82\x2d\x36\x66\x4f\x8a\xee\xe9\xd2\xe8\
+\x1e\x87\xdb\x07\xec\x0a\xa1\x87\x46\xa7\x7b\xbc\x4b\x6f\x23\x7e\
+\x38\x13\x36\x6a\x75\x8a\xb3\x79\x42\x37\xa5\x6e\x6c\xa5\x34\x50\
+\x16\x3b\xe9\x40\x97\xdf\x48\xb1\xff\xa1\x43\x40\x66\x6d\x2b\xfc\
+\xab\xc1\xe7\xdf\xd0\xaa\xc3\xb5\x5a\x15\x2d\x1a\xba\x08\x1c\xe2\
+\x57\x86\x39\x86\x9b\x0d\xb5\x29\xe6\x47\x3d\x3e\x6b\x47\xf7\x6c\
+\x4e\x74\x0f\xc3\x6f\xeb\xa2\x79\x5a\x5d\x79\xb3\x56\xcb\xb6\xa7\
+\x7b\x8c\x2f\x72\xbc\xe4\xef\xdc\x6b\x5c\xb5\xe1\xe2\x54\x8e\xb5\
+\x94\x06\x4c\x05\xc3\x4f\x9d\x74\xa4\x3b\x06\x53\xe8\x8f\x66\x69\
+\xd0\xec\xed\x85\x3f\x11\xcc\x1e\x33\x5c\xff\xd4\xa4\x48\xc0\xb7\
+\x97\x16\x4d\x36\x74\x33\x54\xa1\xd8\xff\x73\x3c\x56\x89\xee\xc9\
+\x64\x27\x4b\x76\x5d\x73\x72\xf3\xdc\x3d\xb6\xf7\x58\xb7\xfa\x75\
+\xf9\xdd\xbf\xeb\x3d\xae\xda\xd0\xd6\x82\x0a\x08\x40\xba\x42\xa7\
+\x99\x93\xfd\xbf\x8b\x98\xa7\xd3\xc7\x5f\x24\x0c\x8e\x76\x1f\x01\
+\x3b\x53\xb8\x30\xdf\x0b\x27\xbc\x9f\xd9\x4e\xb8\x4c\xf9\x24\x8a\
+\xc0\xa1\xbd\x06\x76\x1b\x46\x1b\x2e\x35\x54\x4a\xd1\xd8\xab\x14\
+\x5d\xf3\xe8\xe8\x1e\x7c\x9d\xc8\x36\x2c\x57\x31\xb3\x8d\xaf\xfd\
+\xe6\xcd\xdb\x3d\xb7\xeb\xfd\xef\x18\x9e\xc9\x56\x37\xe7\x82\x34\
+\x4b\x6d\x1d\x4c\xf9\x93\x87\x9b\xf9\x00\x76\x65\xc0\xb8\xe5\x84\
+\xc2\xb1\xce\x1a\xb6\xdf\x0e\x8f\x35\x44\xec\xe9\x5f\x17\x5c\x6f\
+\xee\x79\xc9\xa4\x8a\xc0\xe1\x7c\x62\xf8\xc0\x30\xc3\xf0\x60\xb4\
+\x95\xb5\xdd\xba\x36\x3f\x81\x63\x2b\x3f\xfa\xed\x57\x44\xd7\x32\
+\x23\xba\xb6\x4f\x12\xdf\x4e\x05\xa5\xcc\xd3\xe8\x6d\xe9\x3b\x1d\
+\xf4\xfb\xce\x09\x71\x39\xe9\xef\xa1\x99\x2e\x37\x09\xbb\x29\xd5\
+\x35\x90\xd7\x8f\xea\x45\x27\x1d\xab\x62\x15\xad\x66\xbd\x43\x38\
+\x14\x66\x9b\x61\xbb\x9f\xc0\xcc\x8f\x8e\xed\x75\xa2\x15\x81\xce\
+\xbd\xb4\x2a\x59\x26\x17\x44\xe0\x48\x2b\x0d\x7e\x64\x58\x63\x18\
+\x69\xb8\xcd\x70\x76\x08\x9f\x11\xa2\xd7\xf7\x67\x47\xbf\x69\x64\
+\xf4\x1b\x7f\x14\xf4\x0c\xfd\xc2\x52\xa6\x9c\x56\x3d\xee\xa4\xf0\
+\x7f\x7b\xc6\xff\xf4\x2d\xee\x8a\xff\xd3\x2b\xb4\x2a\x57\xc9\x55\
+\x9b\xbe\x98\xfa\xfa\x87\x00\xa8\xe2\x86\xcd\x4e\x3a\x58\xdd\x93\
+\x4c\x31\xdb\x46\x48\x64\x73\x82\xd8\xc2\x5d\xc7\xb6\xb9\xd0\xa8\
+\xd7\xb5\xba\xbc\x8f\x09\xeb\x0a\xb9\x28\x02\x47\xe2\x53\xc3\xc7\
+\xd1\x5a\xf8\x77\xa2\x02\xbc\x20\x3a\xe9\x6e\x94\xe1\x49\xc3\x7d\
+\x86\xdb\xa3\x6d\x71\x2f\x33\x9c\x6b\x68\x61\x68\x18\xd1\x22\xfa\
+\xdf\x2e\x8b\xfe\x9d\xdb\xa3\xff\xe6\xc9\xe8\xcf\x98\x12\xfd\x99\
+\x6b\xa2\xbf\x63\x5b\xf4\x77\x7e\x9a\x8a\x7b\x5c\xa1\xb2\x56\x3d\
+\xef\x63\x82\xdf\x91\x98\xe5\xf0\x90\x1f\x3b\x96\x6b\x9e\xe0\xaa\
+\x5d\x6d\xe6\x17\x47\x00\x98\x84\x74\xe8\x4c\xf0\xdf\x3b\xe9\x68\
+\xcd\xdb\x6a\xb5\x66\x3f\x41\x21\xf1\x8d\x71\xde\x8e\xa3\x3f\x52\
+\xd4\x6e\x24\x74\xf5\xdd\x5a\x95\xaf\x92\x16\x11\x00\x69\x2a\x57\
+\xcf\x4c\xea\x5d\xb9\x8b\xf1\x77\x24\xec\x78\x74\x55\xfc\xc7\xbf\
+\xa7\x55\xe3\x56\xae\xda\xd6\x66\x7d\x2d\x6a\x1f\x02\x70\xb8\x04\
+\xd8\xfd\xc3\xbf\x74\xd2\xe1\x3a\x5d\x43\x58\x48\xcf\x36\xb6\xf3\
+\x05\x8e\xe6\xbb\xe3\xd8\x0d\x5a\x75\x7f\x40\xab\x4a\x35\x29\x68\
+\x70\x74\x54\xaf\xad\x55\xff\xa7\xb4\x5a\xbd\x97\xb1\x16\xd7\x09\
+\x7f\x6d\x2f\x77\xd5\xbe\x36\xe3\x3b\x50\xf3\x10\x80\x23\x49\xc0\
+\x83\xce\x42\xe5\x9a\xde\x84\x86\xab\x25\x85\x36\x8c\xec\xab\xc8\
+\xef\x7b\x3b\x60\x9f\x28\x6e\x7c\x44\xab\x6a\xc7\x53\xe0\xe0\xc8\
+\xd4\x3e\x41\xab\xfb\x46\xf0\xc6\xee\x68\x76\xf8\x9c\xe8\x70\xc6\
+\xff\x85\x37\xb8\x6c\xe7\x07\xa9\x75\x08\xc0\xf7\x49\xc0\x0a\x67\
+\x9d\xef\xc6\x01\x84\x87\x8f\x4f\x05\x8b\x76\x65\x76\x1e\x9c\xb4\
+\xe9\xc8\x3b\x89\xd9\x5d\x05\x8f\x6b\x40\xc1\x83\x0c\x27\x34\xd6\
+\x6a\xf0\x38\x76\xf2\x3c\xda\xf1\x35\xc9\x61\xf1\xbf\xec\x76\x97\
+\x6d\xbd\x82\x1a\x87\x00\xfc\x90\x00\x94\x35\x1c\x74\xd6\x09\x6f\
+\x67\xa3\x20\xbf\xdb\x10\xef\xcf\x4c\x24\xb4\xab\x0a\x0e\x5f\x62\
+\x68\xf7\x11\xe8\x33\x52\xab\x66\xe7\x86\x7c\xe0\x10\xb8\xa2\x58\
+\x71\xad\xce\xee\xa4\xd5\x53\xd3\x18\x23\xc7\x32\x29\xd7\xe5\x72\
+\xbf\xab\x07\xb8\x6c\x73\x9b\xe9\x65\xa9\x71\x08\xc0\xd1\x1e\x1a\
+\xf4\x3b\x67\x9d\xf1\xee\xa7\x09\x93\x38\xf7\x1b\x58\xb0\x2b\xb3\
+\x13\xa1\x3d\xb1\xd0\xbe\x25\xb0\x4b\x08\xaf\xbd\x5f\xab\x7a\xa7\
+\x50\x18\x73\x1d\xbb\x6b\xdf\x5d\x43\x38\xbc\xab\x30\xcb\x73\xb3\
+\x3d\xe1\xf3\xfb\xe8\xf1\x90\xcb\x76\xff\x5d\xda\x0e\xf9\x41\x00\
+\xb2\x97\x80\xd6\x86\xbf\x38\xe9\x90\x76\x47\xab\x07\x46\x12\x2a\
+\x21\x3d\xd9\x58\x31\xb0\x73\x09\x46\xad\xd2\xea\xf2\x5b\xb5\xaa\
+\xcc\xa4\xc1\x9c\x9a\xd4\x67\xd7\xef\x4f\x7f\x9d\xbe\x5e\x58\x66\
+\x3b\x5c\xee\xd7\xf3\x09\x57\xbb\xfc\xe9\x28\xc3\x5b\x53\xd3\x10\
+\x80\xc2\x48\x40\x17\xc3\x57\x4e\x3a\x66\x5e\x9e\x56\x8f\xbe\x40\
+\xb0\x84\xbc\xc1\xc9\xf0\xb9\x5a\x75\xbc\x3a\x57\x37\x17\xca\x6d\
+\x4a\x95\xc9\xac\xbe\x19\x31\x9f\xad\x7a\xb3\xc5\x6e\xd7\xed\xaa\
+\xf8\xf7\x1e\x96\x39\x48\xc9\x4d\x3f\xb0\xd9\xdd\x85\x5a\x86\x00\
+\x64\x23\x01\x03\x9d\x85\x54\x7e\x31\xad\x9e\x9e\x4e\xc0\x04\x3f\
+\x8f\x60\x57\xe6\x88\xd7\x96\xed\x5d\x86\x15\x48\x9c\xc8\x67\xdb\
+\xc8\xb6\xd5\xca\xdd\xf4\x5b\x09\x96\xec\x71\x57\xfc\xef\x1c\xed\
+\x7a\xfe\xcd\x40\x6a\x18\x02\x20\x21\x01\x2f\x38\xeb\xa4\x76\x8f\
+\xeb\xe1\xf3\x08\x9a\xc4\x6c\x7e\xf2\xbe\x79\x6a\x79\x38\x33\x73\
+\x9c\xa2\x1b\xce\x2c\x7e\xdb\x26\xb6\x6d\xe8\xa3\xb2\xf3\x65\x5c\
+\x2d\xf7\xbb\x67\xa2\x56\xc5\x4a\xb8\xec\x17\x2f\x50\xbb\x10\x00\
+\x29\x01\xc8\x33\xac\x73\x77\xb8\x48\x49\xad\x86\xce\x22\x70\x92\
+\xc6\xdc\x8d\x99\xb9\x1c\x17\x76\xd5\xaa\x7a\x2d\x0a\xb1\xb7\x6f\
+\xfa\xb5\x32\xf7\xdc\xde\x7b\xdb\x06\xf4\x45\x07\x6f\xbd\xf6\xb9\
+\x5b\xee\xd7\x7f\xbc\xcb\xc3\x7d\x74\x94\xd5\x79\xd4\x2e\x04\x40\
+\x52\x02\x4a\x1b\x76\xb8\x7b\x13\x60\x6c\xf8\xc9\x29\x04\x4f\x92\
+\x99\xf9\xa6\x56\x03\x9e\xd5\xea\xbc\xcb\x32\x87\x41\x51\xac\xe5\
+\x0e\xd6\xb2\xf7\xd4\xde\x5b\x7b\x8f\xe9\x6b\xee\x8b\xbf\xab\xa3\
+\x7d\xfb\x8c\xc8\x7c\xfa\x74\xd7\x5f\x6c\x46\x97\xa6\x66\x21\x00\
+\x2e\x24\xa0\xa6\xe1\x97\xee\xe6\x04\xe4\x6b\x35\x68\x2c\x01\x94\
+\x2b\x4c\x7e\x59\xab\xbe\x8f\x6b\xd5\xf6\x42\xad\xca\x96\xa7\x90\
+\x1f\x2d\xf6\x5e\xd9\x7b\x66\xef\x9d\xbd\x87\xf4\x25\xbf\xaf\xfd\
+\x5d\x15\xff\x5e\x4f\x69\x95\x97\xef\xb2\xef\xd8\x6c\xae\x49\xad\
+\x42\x00\x5c\x4a\x40\x53\xc3\x67\x4e\x27\x32\x0d\x7c\x8e\x20\xca\
+\xb9\x55\x05\x07\xb4\x1a\xbf\x52\xab\xdb\x1e\xca\x4c\x54\xb3\x67\
+\xca\x53\xec\xa3\x4f\x60\xa5\x32\xf7\xc4\xde\x1b\x7b\x8f\xd8\x91\
+\x2f\xf7\x8a\xff\x0d\x83\x5d\x2e\xf5\xd3\x51\x26\x37\xa5\x46\x21\
+\x00\x3e\x24\xa0\x8d\xe1\x4f\xce\x3a\x73\x91\x22\x5a\xf5\x7b\x82\
+\x40\xca\x75\x21\x98\xf1\x86\x56\x43\xa6\x66\x4e\x9c\xbb\xa4\x87\
+\x56\xcd\xda\x64\x4e\xa0\xcb\xe5\xd3\xf5\xec\x35\xda\x6b\xb5\xd7\
+\x6c\xaf\xdd\xde\x03\x0a\x7e\x18\xfb\xfb\xbb\x2a\xfe\xd7\xdc\x93\
+\xc9\x34\x77\x7d\xcb\x66\x71\x1b\x6a\x13\x02\xe0\xfb\xf4\xc0\xbf\
+\x39\x0d\xcc\x5e\x0f\x10\x4c\xa9\x0c\xe3\x1d\xe6\x49\x78\x85\x56\
+\x0f\x3e\xaf\xd5\xf5\x77\x69\xd5\xfe\x12\xad\x1a\x9c\x9c\x99\x2c\
+\x1a\xfc\xd3\x7c\xc9\xcc\x6f\xb5\xbf\xd9\xfe\x76\x7b\x0d\xf6\x5a\
+\xec\x35\xd1\xb6\xe1\x9e\xae\xe9\x6a\xb6\xbf\xdb\xbd\xfd\x75\x94\
+\xc1\x9c\xee\x87\x00\xc4\x22\x01\x97\x1a\xfe\xe1\xb4\x83\xdb\x1d\
+\xcc\x08\x29\xf8\xe7\x8e\x6c\x1b\x32\x2b\x46\xec\x1b\xa2\x6b\xfb\
+\x98\x80\xbd\x41\xab\x0b\xba\x64\xbe\x99\x37\x6f\xab\x55\xe3\x66\
+\x5a\xd5\x69\xa0\x55\x95\x1a\x5a\x95\x2e\x9b\xdd\xbe\x05\xf6\xbf\
+\xb5\x7f\x86\xfd\xb3\xec\x9f\x69\xff\x6c\xfb\x77\xd8\xbf\xcb\xfe\
+\x9d\xf6\xef\xb6\xbf\xc1\xfe\x16\xfb\x9b\xec\x6f\xa3\x8d\x92\xc5\
+\x32\x87\xc5\xdf\xed\xa9\x7e\x3a\xca\xde\x4b\xa9\x45\x08\x40\x9c\
+\x12\xd0\x2d\x3a\x63\xda\x5d\x47\xef\xd2\x93\xdd\xcc\x20\x8b\x6f\
+\xbb\xbb\xb4\x9a\xff\x41\x66\x2b\x5c\xfb\x8d\xdd\xee\x3b\xf1\xc4\
+\xe4\xcc\xd3\xb9\xc5\xfe\xdf\xf6\x7f\xb3\xff\x3f\xfb\xef\xd8\x7f\
+\xd7\xfe\x37\xdc\x3b\x8a\x7f\x61\xb0\x27\x6e\xb6\xbb\xca\x75\xf1\
+\xb7\x99\xdb\x8d\x1a\x84\x00\x84\x20\x01\xb7\x18\xbe\x76\xda\xe1\
+\xcf\xb9\x98\xdd\xcd\x00\x40\x86\xa5\x7b\xdc\x14\xff\xd1\x6f\x69\
+\x75\x5a\x3b\xd7\xc5\xdf\x66\xed\x2d\xd4\x1e\x04\x20\x24\x09\xe8\
+\xef\xfc\xfb\xaa\x7d\x05\xbb\xe0\x43\xc2\x0b\x00\xb2\x2c\xfe\x0e\
+\x5e\xf9\x0f\x5b\xab\x55\xdd\x93\x7d\xcc\x35\xe9\x4f\xcd\x41\x00\
+\x42\x94\x80\x41\xce\x3b\x7f\x8d\xe3\xb5\x9a\xb2\x9e\x10\x03\x80\
+\xc2\xed\xed\xef\xa2\xf8\x3f\x3a\x5f\xab\x4a\x5e\x4e\xd0\x1c\x44\
+\xad\x41\x00\x42\x96\x80\xa1\xce\x07\x41\x99\x72\x99\x93\xea\x08\
+\x34\x00\x38\x5a\xec\x71\xd7\x2e\x26\xfb\xdd\x3d\xde\xd7\x89\x99\
+\x43\xa9\x31\x08\x40\x12\x24\x60\x94\xf3\xc1\x60\xb7\xd3\xbc\x6f\
+\x04\xa1\x06\x00\xf1\x15\xff\x1b\x1f\x75\xbd\xbb\xdf\x21\x46\x51\
+\x5b\x10\x80\x24\x49\xc0\x93\x5e\xd6\x5d\x5f\xdf\x9f\x70\x03\x80\
+\xef\x66\x91\xa3\xe2\xdf\xb9\x97\xaf\xfd\x25\x9e\xa4\xa6\x20\x00\
+\x49\x94\x80\xfb\xbd\x0c\x90\xf3\xaf\xd0\x6a\xf5\x5e\x82\x0e\x00\
+\xbe\x55\xfc\x77\xc9\x17\xfe\x71\x1b\xb4\x6a\xdd\xc9\x57\xf1\xbf\
+\x9f\x5a\x82\x00\x24\x59\x02\xfa\x18\xbe\x72\x3e\x50\x1a\x9d\xc6\
+\x46\x2c\x00\xf0\x2f\xe6\xed\x90\x2f\xfe\xcf\xac\xd4\xaa\x5e\x13\
+\x1f\x85\xdf\x66\x66\x1f\x6a\x08\x02\x90\x0b\x12\x70\x83\xe1\x0b\
+\xe7\x83\xa6\x7c\xa5\xcc\x8e\x6c\x84\x1f\x40\x7a\x59\x7b\x50\xab\
+\x99\x1f\xb9\x99\xec\x57\xa6\x82\x8f\xe2\x6f\xb3\xf2\x06\x6a\x07\
+\x02\x90\x4b\x12\xd0\xc5\xf0\x77\xe7\x83\xc7\x6e\xdf\xca\x19\x02\
+\x00\xe9\x64\xd5\x7e\xad\xa6\x6c\x96\x2f\xfe\x57\xf6\x33\xd9\x52\
+\xd4\x47\xf1\xb7\x19\xd9\x85\x9a\x81\x00\xe4\xa2\x04\x5c\x64\xf8\
+\x8b\x97\x6f\x67\x76\xbf\xf6\x65\xdb\x09\x44\x80\x34\x6d\xed\x2b\
+\x7d\xa2\xdf\xf3\x6f\x68\xd5\xec\x5c\x5f\xdf\xfb\x6d\x36\x5e\x44\
+\xad\x40\x00\x72\x59\x02\xda\x19\x3e\xf7\x32\xa0\x6a\xd7\xd7\x6a\
+\xd2\xcb\x04\x23\x40\xae\xb3\x60\xa7\x9b\xcd\x7d\xaa\xd5\xf1\x55\
+\xfc\x6d\x26\xb6\xa3\x46\x20\x00\x69\x90\x80\x96\x86\x3f\xf8\x39\
+\x9e\xb5\x94\x56\x0f\x8f\x21\x20\x01\x72\x11\x7b\x48\xd8\xac\x6d\
+\xf2\xc5\xbf\xd7\xd3\x5a\x95\xf0\x76\xfc\xb4\xcd\xc2\x96\xd4\x06\
+\x04\x20\x4d\x12\x70\x82\xe1\x47\xde\xce\x69\xb7\x27\x0a\xae\xde\
+\x47\x60\x02\xe4\x0a\x6b\x0e\x68\x35\x6d\x8b\xf0\x12\xbf\x77\xb5\
+\xea\xd0\x5d\x7b\xcb\xa5\x4c\x06\x9e\x40\x4d\x40\x00\xd2\x28\x01\
+\x95\x0c\xef\x79\x1b\x6c\x0d\x9a\x68\x35\xe5\x15\x82\x13\x20\xe9\
+\x2c\x37\x32\x3f\x69\x93\x6c\xf1\x7f\x6c\x81\x56\xc7\x37\xf4\x59\
+\xfc\x6d\xf6\x55\xa2\x16\x20\x00\x69\x96\x80\xe2\x86\x05\xde\x06\
+\x5d\xf1\x02\xad\xee\x7c\x82\x00\x05\x48\xf2\xce\x7e\xd2\x07\xfa\
+\x5c\x7b\xbf\x56\xc5\x4a\xf8\x2c\xfe\x36\xf3\x8a\x53\x03\x10\x00\
+\x1a\x41\xa9\x22\x86\x67\x3c\x0e\x3e\xad\x5a\x9f\xa7\xd5\xfc\x0f\
+\x08\x53\x80\xc4\x7c\xef\x37\xcc\xd9\x2e\x7c\x84\xef\x3a\xad\x9a\
+\xb6\xd5\x5e\xb3\x47\xa9\x67\x6d\xe6\x91\xfd\x08\x00\xfc\xbb\x08\
+\xf4\x32\xfc\xc3\xdb\x40\xac\x50\x59\xab\x21\x53\x09\x56\x80\xe0\
+\xbf\xf7\x1f\xd4\x6a\xfa\x56\xd9\xe2\xdf\x77\x94\x56\x65\x2b\xf9\
+\x2c\xfc\x36\xdb\x7a\x91\xf5\x08\x00\x7c\xb7\x04\x74\x34\xfc\x8f\
+\x57\x23\xbf\xb4\x87\x56\x2b\x77\x11\xb2\x00\x21\xb2\x72\xbf\x56\
+\x93\x05\xbf\xf7\x8f\x79\x5b\xab\x76\x57\xf9\x7e\xea\xb7\x99\xd6\
+\x91\x8c\x47\x00\xe0\x87\x25\xe0\x14\xc3\x2f\xbd\x0e\xd0\xe3\x1b\
+\x68\x35\x7e\x25\x61\x0b\x10\x12\x4b\xf6\x68\x35\x51\x70\x73\x9f\
+\x87\x5f\xd2\xaa\x46\x3d\xdf\xc5\xdf\x66\xd9\x29\x64\x3b\x02\x00\
+\x47\x2f\x01\x35\x0c\x9b\xbd\x0e\xd4\xfc\x7c\xad\xae\xeb\x67\x9e\
+\x38\x76\x13\xbc\x00\x71\x7f\xef\x9f\x2b\x78\x98\xcf\x98\x77\xb4\
+\xea\xd4\x53\xab\xbc\x7c\xdf\xc5\xdf\x66\x58\x0d\x32\x1d\x01\x80\
+\xc2\xad\x10\x78\xd1\xf3\x80\xd5\xea\xb8\xba\x5a\x0d\x9b\x4d\x08\
+\x03\xc4\xf2\xca\x7f\x9f\x56\x53\x05\xf7\xf3\x1f\x30\x41\xab\xaa\
+\xb5\xb5\xf7\x1c\xc9\x64\x17\x33\xfd\x11\x00\xc8\x52\x04\x6e\xf2\
+\x76\x86\xc0\xe1\x74\xbc\x5a\xab\x45\x5b\x08\x64\x00\x5f\x4f\xfd\
+\xf6\x08\x5f\xa9\x25\x7e\x23\xd6\x6b\xd5\xe6\xd2\x38\x0a\xbf\xcd\
+\xaa\x9b\xc8\x6e\x04\x00\xe4\x24\xe0\x34\xc3\x4f\xbd\x0f\x66\x7b\
+\xc4\xf0\x03\x23\x09\x67\x00\xe7\x4f\xfd\x82\xbb\xfa\xf5\x7c\xc2\
+\xd7\xd1\xbd\xdf\xc6\x66\xd4\x69\x64\x36\x02\x00\xf2\x12\x50\xc1\
+\xb0\x36\x86\x41\xad\x55\xf3\xb3\xb5\x9a\xf9\x26\x41\x0d\x20\xfd\
+\xd4\x3f\x7f\xa7\xdc\x53\xff\x90\x65\x5a\x35\x6e\xad\x63\xc9\x88\
+\x4c\x36\x55\x20\xab\x11\x00\x70\xbb\x69\xd0\xa3\x86\xaf\xbc\x0f\
+\xf0\x12\x05\x5a\xf5\x7a\x40\xab\x35\xfb\x09\x6e\x00\x89\xe5\x7d\
+\x52\x4f\xfd\xe3\xdf\xd3\xaa\xcb\x9d\x99\x9d\x3e\xfd\x17\xfe\xaf\
+\xa2\x4c\x62\x73\x1f\x04\x00\x3c\x89\xc0\x45\x86\xff\x8a\xc5\xf4\
+\x6b\x9f\xa0\xd5\x93\x53\x08\x70\x80\x10\x9e\xfa\xfb\x8e\xd4\xaa\
+\x7a\xdd\xb8\x9e\xfa\x6d\x06\x5d\x44\x26\x23\x00\xe0\x5f\x02\xea\
+\x18\x3e\x8a\x69\xe0\x6b\xd5\xbc\xad\x56\x2f\xae\x25\xd0\x01\x8e\
+\xe5\xa9\x5f\xea\x04\xbf\x47\xe6\x6a\xd5\xb8\x95\x8e\x6d\xfc\x67\
+\xb2\xa7\x0e\x59\x8c\x00\x40\x7c\x12\x50\xcc\x30\x34\x96\x4f\x02\
+\x96\xa2\x79\x5a\x75\xee\xce\xb9\x02\x00\x3f\xc4\x37\x4f\xfd\x1f\
+\xca\xec\xdf\x7f\xf6\x95\x66\xec\x15\x8d\xab\xf0\x7f\x15\x65\x4e\
+\x31\x32\x18\x01\x80\x30\x44\xa0\x9d\xe1\x17\xb1\x3d\x0d\x94\x2a\
+\xa3\xd5\x2d\xf7\x6b\xb5\x6a\x0f\x41\x0f\x70\x38\xab\x84\x9e\xfa\
+\xc7\x6e\xd0\xea\x8a\x7e\x5a\x15\x94\x8e\xf3\xa9\xdf\x66\x4c\x3b\
+\x32\x17\x01\x80\xf0\x24\xa0\xbc\x61\x7e\x8c\xe1\xa0\x55\xf5\xda\
+\x5a\x0d\x1a\x4b\xe8\x03\x58\x16\x08\x3d\xf5\xdf\xfa\x8c\x56\x95\
+\x6b\xea\x58\xc7\x76\x26\x5b\xca\x93\xb5\x08\x00\x84\x2d\x02\x3d\
+\x0c\x9f\xc5\x1a\x16\x27\x37\xd7\x6a\xe8\x2c\x0a\x00\xf0\xd4\x9f\
+\x0d\xfd\xc7\x6b\x55\xff\xd4\xb8\x0b\xbf\xcd\x92\x1e\x64\x2b\x02\
+\x00\xc9\x9a\x20\xf8\x6e\xcc\xc1\xa1\xd5\x29\x2d\xd8\x56\x18\x52\
+\x34\xc3\xff\xa0\xcc\xb7\x7e\xbb\x7d\x6f\x83\x66\x3a\xf6\xf1\x9b\
+\xc9\x10\x26\xfa\x21\x00\x90\x40\x09\x28\x6a\x78\x38\x3a\x87\x3b\
+\xde\x20\x69\xda\x4a\xab\xe1\x73\x29\x10\x90\xbb\x2c\xda\xa5\xd5\
+\xa4\x2c\x8f\xed\xbd\x67\xa2\x56\x27\x9e\x1e\x42\xe1\xff\x47\x94\
+\x1d\x45\xc9\x52\x04\x00\x92\x2d\x02\x67\x18\xf6\x07\x10\x2a\x5a\
+\x9d\xda\xda\x88\xc0\x3c\x8a\x05\xe4\x0e\x4b\xf7\x68\x35\x65\x73\
+\xf6\x85\xff\xa4\xe6\x3a\x88\x31\x9a\xc9\x8a\x33\xc8\x4e\x04\x00\
+\x72\x6b\xb9\xa0\xdd\xad\xeb\x6f\x41\x84\x4c\xb3\x36\x5a\x8d\x9c\
+\x4f\xf1\x80\xe4\xb2\x62\x9f\x56\xd3\xb7\x66\x57\xf8\xef\x9d\xa4\
+\x55\xc3\x16\xa1\x14\xfe\xbf\x45\x19\xc1\xf2\x3e\x04\x00\x72\x54\
+\x04\x1a\x1a\x36\x04\x12\x38\x99\x37\x02\x4f\x4c\xce\x7c\x3b\xa5\
+\xa8\x40\x52\x26\xf8\xbd\xf4\x51\xe1\x8b\xfe\x84\xf7\xb5\xea\x33\
+\x32\xa4\x27\x7e\x1d\x65\x42\x43\x32\x12\x01\x80\x74\x88\xc0\xad\
+\x86\x4f\x83\x09\xa0\xda\xf5\xb5\xba\xeb\x49\xad\x56\xee\xa2\xc0\
+\x40\x98\xac\x39\xa0\xd5\x9c\xed\x85\xdf\xc2\x77\xcc\xdb\x5a\x75\
+\x7f\x40\xab\x6a\x75\x42\x2a\xfc\x36\x03\x6e\x25\x13\x11\x00\x48\
+\x9f\x04\x54\x33\x2c\x0c\x28\x8c\xb4\x2a\x5b\x41\xab\xeb\xfa\x69\
+\x35\xef\x7d\x0a\x0e\x84\x35\xb3\xff\xc5\x42\xce\xec\x1f\xba\x56\
+\xab\x4e\x3d\xb5\x2a\x5d\x5e\x07\x35\xd6\x32\x63\xbf\x1a\x59\x88\
+\x00\x40\xba\x45\xe0\x62\xc3\xcf\x83\x0a\xa7\x62\xc5\xb5\xea\x78\
+\xb5\x79\xda\x5a\x43\x01\x82\x18\x67\xf6\xef\x2e\xfc\xcc\xfe\xc1\
+\x73\xb4\x6a\x73\xa9\x56\xf9\xc5\x42\x2b\xfc\x76\xac\x5f\x4c\xf6\
+\x01\x37\x01\x0e\x49\x40\x69\xc3\xf3\x86\x2f\x03\x0b\xab\xcc\xa1\
+\x43\x76\x9e\xc0\x5a\x8e\x21\x86\xc0\x67\xf6\x8f\xdf\x98\xf9\xbe\
+\x1f\xef\x21\x3d\xdf\xc5\x97\xd1\x18\x2f\x4d\xe6\x01\x02\x00\x47\
+\x12\x81\x53\x0c\xaf\x07\x18\x5e\x5a\x55\xaa\xaa\x55\xb7\xdb\xb5\
+\x9a\xf6\x1a\x05\x0a\xc2\x9a\xd9\xff\xc4\x62\xad\x2e\xbc\x51\xab\
+\x72\x95\x75\x90\x63\x47\xa9\xd7\xec\xd8\x26\xe3\x00\x01\x80\xa3\
+\x11\x81\x4b\x0c\x1f\x07\x1a\x66\x99\x1d\x06\xef\x1d\xa6\xd5\xf2\
+\x9d\x14\x2d\x88\x67\x66\xff\xe8\xb7\xb4\xba\xf1\x91\x50\x76\xec\
+\xfb\x2e\x0e\x1a\x3a\x93\x69\x80\x00\xc0\xb1\x4a\x40\xbe\x61\x40\
+\x50\xab\x05\xbe\x4d\xc9\xd2\x5a\x75\xba\x46\xab\xe7\x17\x53\xc4\
+\xe0\xd8\x59\xbe\x57\xab\x99\xc7\x58\xf8\xef\x9f\xaa\x55\xdb\xcb\
+\xb5\x2a\x51\x2a\xe4\xc2\xff\x5f\x86\xfe\x76\x0c\x93\x65\x80\x00\
+\x40\x36\x22\x50\xc9\x30\xde\xf0\x45\xc0\x81\xa7\x55\x9d\x06\x5a\
+\xf5\x7a\xc0\x04\xfa\x9b\x14\x36\xf8\x7e\x96\xec\x39\xb6\xc3\x7a\
+\x86\x2c\xd3\xea\xca\x7e\x5a\xd5\xa8\xa7\x83\x1e\x03\x99\x2d\x7c\
+\xc7\x18\x2a\x90\x5d\x80\x00\x80\xa4\x08\x34\x32\xbc\x1c\x78\x00\
+\x66\x68\xd0\x44\xab\x9e\x03\x99\x2f\x00\xff\xbe\x9c\xcf\xee\xd7\
+\x7f\xb4\x93\xfb\xec\x77\xfd\xcb\xfb\x68\x75\x7c\x43\x9d\x88\x3e\
+\xaf\xd4\x6a\xc3\x49\x64\x15\x20\x00\xe0\x52\x04\x2e\x32\xec\x49\
+\x48\x28\x6a\x55\xaf\x91\x56\x37\x0e\xd0\x6a\xf2\xcb\x14\xc1\x34\
+\xb2\x36\x5a\xc7\x7f\x34\xcb\xf9\x1e\x9d\xaf\xd5\xa5\xbd\xb5\xaa\
+\xd5\x40\x27\xa6\x7f\x2b\xb5\xd3\x70\x3e\xd9\x04\x08\x00\xf8\x92\
+\x80\x22\x86\x6b\x0c\xfb\x12\x14\x94\x99\xcf\x04\x3d\xee\x64\x7f\
+\x81\xb4\xcc\xe8\x9f\xbd\xed\x87\x8f\xe6\xb5\xeb\xf5\x3b\xf7\x4a\
+\xc2\xeb\xfd\x6f\x63\x25\xfc\x2a\x3b\x16\xc9\x24\x40\x00\x20\x2e\
+\x11\xb8\xd6\x70\x20\x61\xe1\xa9\x55\x95\x1a\x5a\x5d\xd4\x55\xab\
+\x41\x63\xb5\x5a\xbc\x95\x82\x99\x2b\x4f\xfb\xf6\x35\xff\xd4\xef\
+\xf9\xbe\x3f\xe2\x55\xad\x6e\x7d\x26\x33\x91\xaf\x62\x35\x9d\xb8\
+\x7e\x9b\x91\xee\xae\x14\x7e\x40\x00\x20\x14\x11\x28\x6a\xe8\x1e\
+\x2d\x3b\x4a\x5e\xa8\x16\xcd\xd3\xaa\x71\x33\xad\xae\xbf\x4b\xab\
+\xe7\x17\xb1\xe9\x50\x22\x9f\xf6\xb7\x1f\x79\xbb\x5e\xbb\x39\xcf\
+\x7d\x53\xcc\x53\xfe\xad\x5a\xd5\x3b\xc5\xb4\x75\x51\x9d\xc8\x3e\
+\x9a\x39\xa6\xb7\x1b\x85\x1f\x10\x00\x08\x59\x04\x7a\x04\xbd\x87\
+\xc0\xd1\x50\xba\xac\x56\x67\x77\xd2\xea\xee\xa7\xb5\x9a\xf1\x06\
+\x05\x36\xe4\xa7\xfd\x23\xcd\xe6\x7f\x72\xa9\x56\x3d\x1e\xd2\xea\
+\xf4\x0e\x5a\x95\x2c\xa3\x13\xdd\x17\x33\x52\x7d\x9d\x1d\x5b\x64\
+\x0c\x20\x00\x90\x14\x11\xb8\xc1\xf0\xa3\x84\x87\x6f\x86\x8a\x55\
+\xb4\x3a\xab\xa3\x56\xb7\x3e\xa8\xd5\xc8\x05\x5a\xad\xda\x43\x01\
+\x8e\x8b\x65\x7b\xb5\x9a\xb5\xed\x5f\x4f\xfb\x63\x37\x68\x35\x70\
+\xb2\x56\x5d\xee\xd2\xaa\x59\x7b\xad\xca\x55\xd2\x39\xd1\xe7\x32\
+\x63\xe7\x7a\x0a\x3f\x20\x00\x90\x64\x11\xb0\x13\x95\x36\xe6\x48\
+\x28\x67\xb0\x07\xbc\xd8\x4f\x06\x5d\x7a\x6a\x35\x78\x9c\x56\x73\
+\xdf\xa3\x30\x3b\xdd\xb0\x67\x5f\xe6\x28\x5e\x3b\x93\xff\xd9\xd5\
+\x5a\xdd\xf6\x8c\x56\x1d\xba\x67\x5e\xe9\xe7\x15\xd3\x39\xd5\xb7\
+\x32\x63\xe5\x2a\x0a\x3f\x20\x00\x90\x4b\x32\xd0\xc2\x30\x3f\xda\
+\xac\x44\xe7\x1c\x55\x6b\x6a\xd5\xe6\x82\xcc\x71\xc6\x0f\x8f\x31\
+\xc5\xea\x65\xad\xd6\x30\x97\xa0\xf0\x4f\xfa\x7b\xb4\x1a\xbe\x4c\
+\xab\xde\xa6\xd8\x5f\x7c\x8b\x56\xa7\xb5\xd3\xaa\x62\x75\x9d\x93\
+\x7d\x27\x33\x26\xec\xd8\x68\x41\x56\x00\x02\x00\xb9\x2c\x02\xb5\
+\x0c\xc3\x82\xde\x62\x58\xf2\x4d\x81\xdd\x87\xe0\xbc\xcb\x32\x1b\
+\x13\xd9\x53\x0d\x67\xbe\x95\xd9\x94\x86\x22\xff\xaf\x0d\x7a\xec\
+\x3d\xb1\xf7\xe6\xc6\x7b\xb4\x6a\xdb\x59\xab\xda\x27\xe6\xe2\x93\
+\xfd\x91\xf8\x34\x1a\x0b\xb5\xc8\x06\x40\x00\x20\x4d\x22\x50\xca\
+\xd0\x2f\x67\xe6\x09\x1c\x0b\x05\xa5\x32\x62\xd0\xba\x83\x56\x97\
+\xdf\xa8\xd5\x6d\x0f\x65\x3e\x25\x8c\x35\x4f\xbc\x0b\x3e\xcc\xbd\
+\x22\x6f\xaf\xc9\x5e\x9b\xbd\x46\x7b\xad\xf6\x9a\xed\xb5\xdb\x7b\
+\x50\x50\x4a\xa7\xae\xfd\x33\x7d\xde\xf6\xfd\x52\x64\x01\x20\x00\
+\x90\xf6\xbd\x04\x2e\x35\xbc\x61\xf8\x3a\x85\xc5\xe0\x3f\x29\x51\
+\xa0\xd5\xf1\x0d\xb4\x6a\xd1\x4e\xab\xce\xdd\x33\x9b\x17\xdd\x31\
+\x58\xab\xfb\x47\x68\x35\x64\xaa\x56\x63\x96\x68\x35\xfd\xf5\xcc\
+\xfe\x05\x71\xbc\x4d\xb0\x7f\xa7\xfd\xbb\xed\x6f\xb0\xbf\xc5\xfe\
+\x26\xfb\xdb\xec\x6f\xb4\xbf\xd5\xfe\x66\xfb\xdb\xed\x35\xd8\x6b\
+\xa1\x4d\x75\xd4\xb7\xdf\x88\xfa\x3a\x4b\xf9\x00\x01\x00\xf8\x96\
+\x0c\xd4\x37\x3c\x6d\xf8\x3f\x14\x8c\x63\xd8\xc3\xa0\x5c\x45\xad\
+\x6a\xd7\xd7\xaa\xf1\xe9\x5a\x35\x6b\xa3\x55\xcb\xf6\x99\xf9\x08\
+\xe7\x5c\x9c\xf9\xfc\xd0\xf1\x2a\xad\x2e\xbe\x56\xab\xcb\xae\xcf\
+\x4c\x5c\xbc\xa6\x77\x66\xae\x82\xc5\xfe\xdf\xf6\x7f\xb3\xff\x3f\
+\xfb\xef\xd8\x7f\xd7\xfe\x37\xf6\xbf\xb5\x7f\x86\xfd\xb3\xec\x9f\
+\x69\xff\x6c\xfb\x77\xd8\xbf\xcb\xfe\x9d\xdc\xfb\xa3\xe5\xff\x44\
+\x7d\xba\x3e\x63\x1c\x10\x00\x80\xa3\x5b\x3d\xd0\xc9\xb0\xd4\xf0\
+\x77\x8a\x08\x24\x8c\xbf\x47\x7d\xb7\x13\xb3\xf9\x01\x01\x00\x28\
+\xbc\x0c\x54\x36\xdc\x6b\xd8\x4b\x61\x81\xc0\xd9\x1b\xf5\xd5\xca\
+\x8c\x5d\x40\x00\x00\x64\x65\xa0\x95\x61\x8a\xe1\x73\x8a\x0d\x04\
+\xc2\xe7\x51\x9f\x6c\xc5\x18\x05\x04\x00\xc0\xbd\x08\x14\x18\xae\
+\x34\xcc\x43\x06\x20\x06\xfe\x27\xea\x7b\xb6\x0f\x16\x30\x26\x01\
+\x01\x00\x88\x47\x06\x4a\x18\x2e\x37\xcc\x89\x82\x99\x02\x05\x2e\
+\xf8\xcc\x30\xdb\x70\x99\xa1\x38\x63\x0f\x10\x00\x80\xb0\x64\xa0\
+\xb8\xe1\x12\xc3\x2c\xc3\x7f\x53\xb4\x40\x60\xa3\x9e\x99\x86\xce\
+\x86\x62\x8c\x31\x40\x00\x00\x92\x21\x03\xc5\x0c\x17\x1b\x66\x18\
+\x7e\x4d\x31\x83\xa3\xe4\x57\x86\xa9\x86\x8b\x0c\xf9\x8c\x25\x40\
+\x00\x00\x92\x2f\x04\xa7\x18\xee\x33\xbc\x66\xf8\x2b\x85\x0e\x22\
+\xfe\x62\x78\x35\x9a\xbd\xdf\x84\xb1\x02\x08\x00\x40\xee\x4f\x22\
+\xbc\xd0\x30\xca\xb0\x87\x22\x98\x3a\x6c\x9b\x8f\x34\x74\xb4\x73\
+\x48\x18\x13\x80\x00\x00\xa4\x57\x08\x6a\x1a\x6e\x8e\x4e\x64\xe3\
+\x73\x41\xee\xf1\xeb\xa8\x6d\x6d\x1b\xd7\xa0\xcf\x03\x20\x00\x00\
+\xdf\x25\x04\x75\x0c\xd7\x19\x26\x18\xb6\x19\xbe\xa0\x88\x26\x86\
+\x2f\xa2\x36\x9b\x10\xb5\x61\x1d\xfa\x34\x00\x02\x00\x50\x58\x21\
+\xb0\x27\x17\x9e\x6b\x18\x6c\x58\x6b\xf8\x84\x42\x1b\x0c\x9f\x44\
+\x6d\x32\x38\x6a\x23\x4e\xd8\x03\x40\x00\x00\x9c\x4a\x41\xc3\xe8\
+\x95\xf2\xa8\x68\x12\xd9\xaf\x28\xc6\x5e\x66\xe8\xbf\x1a\xdd\x73\
+\x7b\xef\x1b\xd2\x17\x01\x10\x00\x80\x10\xa4\xa0\xbc\xe1\x6c\xc3\
+\x1d\xd1\x2b\xe8\x77\x0c\x7f\xa0\x70\x1f\x33\x7f\x88\xee\xdd\x84\
+\xe8\x5e\xda\x7b\x5a\x9e\x3e\x06\x80\x00\x00\x24\x4d\x0c\xaa\x19\
+\x3a\x18\xfa\x19\x46\x18\x96\x18\xb6\x1a\x7e\x9f\xe2\x22\xff\xfb\
+\xe8\x1e\x2c\x89\xee\x49\xbf\xe8\x1e\x55\xa3\xcf\x00\x20\x00\x00\
+\x69\x90\x83\x92\x86\xc6\xd1\xa6\x45\x7d\x0d\xc3\x0d\x8b\x0d\x5b\
+\x0c\xbf\x34\xfc\x39\x81\xc5\xfd\xcf\xd1\x6f\xdf\x12\x5d\xcb\xf0\
+\xe8\xda\x2e\x8e\xae\xb5\x24\x6d\x0f\x80\x00\x00\xc0\x0f\x4b\x42\
+\x89\x68\xa9\x62\xd3\x68\xa2\xdb\x55\x86\xde\x86\x87\xa3\xf5\xec\
+\x76\xbb\xda\x55\x86\x37\x0d\xef\x19\x36\x1b\x76\x18\xf6\x19\x7e\
+\x6c\xf8\xb9\xe1\x37\xd1\x84\x39\x7b\x78\xd2\xdf\x0c\x5f\x45\xfc\
+\x2d\xfa\xdf\x3e\x89\xfe\x9d\x9f\x47\xff\xcd\xbe\xe8\xcf\xd8\x1c\
+\xfd\x99\x6f\x46\x7f\xc7\xcc\xe8\xef\x7c\x38\xfa\x0d\x57\x45\xbf\
+\xa9\x69\xf4\x1b\x59\x57\x0f\x90\x00\xfe\x1f\x04\xa8\x56\x43\x94\
+\x45\x44\x49\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x4f\x83\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0d\xd7\x00\x00\x0d\xd7\
+\x01\x42\x28\x9b\x78\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x4f\x00\x49\x44\
+\x41\x54\x78\xda\xed\x9d\x07\xb8\x17\xc5\xd9\xb7\x87\x73\x0e\x70\
+\xe8\xbd\x09\x0a\x88\x02\x02\x8a\x4a\x11\x51\x50\x04\x05\xac\x28\
+\xa0\xa2\x22\x16\x10\xb0\xa0\x58\x11\x1b\x8a\x20\xbd\x49\x2f\xd2\
+\x7b\xe7\xd8\x7b\x09\xbd\x57\x93\x2f\xf9\x52\x3e\x93\x37\xc5\x18\
+\x63\x7a\x62\x74\xbe\x19\xcf\xf2\x06\x0d\xe0\xe1\xfc\x9f\xd9\x9d\
+\xdd\xbd\xcf\x75\xdd\xd7\xf5\x5e\x79\x13\xfd\xef\xce\xcc\xef\xb9\
+\x77\x77\x8a\xd2\x5a\xab\xb4\x61\xfe\x7e\x63\xd0\x00\xf0\xbf\xfc\
+\x31\x8d\x59\x00\x90\x66\x14\x02\x00\x00\x08\x00\x00\x02\x80\x00\
+\x00\x20\x00\x00\x80\x00\x20\x00\x00\x08\x00\x00\x20\x00\x08\x00\
+\x00\x02\x00\x00\x08\x00\x02\x00\x80\x00\x00\x00\x02\x80\x00\x00\
+\x20\x00\x00\x80\x00\x20\x00\x00\x08\x00\x00\x20\x00\x08\x00\x00\
+\x02\x00\x00\x08\x00\x02\x00\x80\x00\x00\x00\x02\x80\x00\x00\x20\
+\x00\x00\x80\x00\x20\x00\x00\x08\x00\x00\x20\x00\x08\x00\x00\x02\
+\x00\x00\x08\x00\x02\x00\x80\x00\x00\x00\x02\x80\x00\x00\x20\x00\
+\x00\x80\x00\x20\x00\x00\x08\x00\x00\x20\x00\x08\x00\x00\x02\x00\
+\x00\x08\x80\x98\x00\x34\x38\x4b\xab\x9b\xee\x01\x88\x1e\xdb\x17\
+\x11\x00\x00\x40\x00\x42\x12\x80\xab\x6f\xd5\xea\xe5\x8f\x01\xa2\
+\xc7\xf6\x45\x04\x00\x00\x10\x00\x04\x00\x10\x00\x04\x00\x00\x10\
+\x00\x04\x00\x10\x00\x04\x00\x00\x10\x00\x04\x00\x10\x00\x04\x00\
+\x00\x10\x00\x04\x00\x10\x00\x04\x00\x00\x01\x40\x00\x10\x00\x40\
+\x00\x00\x00\x01\x40\x00\x10\x00\x40\x00\x00\x00\x01\x40\x00\x10\
+\x00\x40\x00\x00\x00\x01\x40\x00\x28\x3c\x80\x00\x00\x00\x02\x80\
+\x00\x00\x20\x00\x00\x80\x00\x20\x00\x00\x08\x00\x00\x20\x00\x08\
+\x00\x00\x02\x00\x00\x08\x00\x02\x00\x80\x00\x00\x00\x02\x80\x00\
+\x00\x20\x00\x00\x80\x00\x20\x00\x00\x08\x00\x00\x20\x00\x08\x00\
+\x00\x02\x00\x00\x08\x00\x02\x00\x80\x00\x00\x00\x02\x80\x00\x00\
+\x02\x80\x00\x00\x00\x02\x80\x00\x00\x02\x80\x00\x00\x00\x02\x80\
+\x00\x00\x02\x80\x00\x00\x00\x02\x80\x00\x00\x02\x80\x00\x00\x00\
+\x02\x80\x00\x00\x02\x80\x00\x00\x20\x00\x08\x00\x02\x00\x08\x00\
+\x00\x20\x00\x08\x00\x02\x00\x08\x00\x00\x20\x00\x08\x00\x02\x00\
+\x08\x00\x00\x20\x00\x08\x00\x02\x90\x6e\xce\x78\xff\xff\xea\x1b\
+\x77\xfd\x2a\x63\xb2\x5e\x41\x00\x00\x00\x01\x40\x00\x20\x36\x0c\
+\xfa\xf8\x77\x5a\xe2\x2f\xf7\xd5\x1f\x22\x00\x00\x80\x00\x20\x00\
+\x80\x00\x20\x00\x00\x80\x00\x20\x00\x80\x00\x20\x00\x00\x80\x00\
+\x20\x00\x80\x00\x20\x00\x00\x80\x00\x20\x00\x80\x00\x20\x00\x00\
+\x80\x00\x20\x00\x80\x00\x20\x00\x00\x80\x00\x20\x00\x80\x00\x20\
+\x00\x00\x80\x00\x20\x00\x80\x00\x20\x00\x00\x80\x00\x20\x00\x80\
+\x00\x20\x00\x00\x08\x00\x02\x80\x00\x00\x02\x80\x00\x00\x20\x00\
+\x08\x00\x02\x00\x08\x00\x00\x20\x00\x08\x00\x02\x00\x08\x00\x00\
+\x20\x00\x08\x00\x02\x00\x08\x00\x00\x20\x00\x08\x00\x20\x00\x08\
+\x00\x00\x20\x00\x08\x00\x20\x00\x08\x00\x00\x20\x00\x08\x00\x20\
+\x00\x08\x00\x00\x20\x00\x08\x00\x20\x00\x08\x00\x00\x20\x00\x08\
+\x00\x20\x00\x08\x00\x00\x20\x00\x08\x00\x20\x00\x08\x00\x00\x20\
+\x00\x08\x00\x20\x00\x08\x00\x00\x20\x00\x08\x00\x20\x00\x08\x00\
+\x00\x20\x00\x08\x00\x20\x00\x08\x00\x00\x20\x00\x08\x00\x20\x00\
+\x08\x00\x00\x20\x00\x08\x00\x20\x00\x08\x00\x00\x20\x00\x08\x00\
+\x20\x00\x08\x00\x00\x20\x00\x08\x00\x20\x00\x08\x00\x00\x20\x00\
+\x08\x00\x20\x00\x08\x00\x00\x02\x80\x00\x20\x00\x80\x00\x00\x00\
+\x02\x80\x00\x20\x00\x80\x00\x00\x00\x02\x80\x00\x20\x00\x80\x00\
+\x00\x00\x02\x80\x00\x50\x08\x11\x00\x04\x00\x00\x10\x80\x94\x09\
+\xc0\x39\xad\xb5\x7a\x60\x78\x7a\x79\x74\xbc\x56\x79\x07\x11\x00\
+\x04\x00\x00\x10\x80\x94\x09\x40\x9a\xa9\x59\x4f\xab\x17\x37\xf0\
+\x06\x00\x01\x00\x00\x04\x00\x01\x48\x0d\x6d\xae\xd1\x6a\xe5\x4e\
+\x3e\x01\x20\x00\x00\x80\x00\x20\x00\xa9\xa0\x78\x09\xad\xfa\x3d\
+\xaf\x55\x1e\xdf\xff\x11\x00\x00\x40\x00\x10\x80\x94\xbc\xf2\x3f\
+\x4d\xab\x71\xeb\x29\xfc\x08\x00\x00\x20\x00\x08\x40\x7a\x5e\xf9\
+\x77\xd1\x6a\xe9\x0e\x8a\x3e\x02\x00\x00\x08\x00\x02\x90\x8e\x57\
+\xfe\x25\xb5\xea\xf3\xbc\x56\xeb\x0f\x52\xf0\x11\x00\x00\x40\x00\
+\x10\x80\x54\x50\xab\xbe\x56\x23\xd7\x68\x95\x77\x88\x62\x8f\x00\
+\x00\x00\x02\x80\x00\xa4\x82\xb6\xd7\x69\x35\x7f\x2b\x45\x1e\x01\
+\x00\x00\x04\x00\x01\x48\x05\x25\x4a\x6b\x75\xe7\xf3\x5a\xad\xd8\
+\x4b\x81\x47\x00\x00\x00\x01\x40\x00\x52\xc1\x29\x0d\xb5\x1a\xb2\
+\x52\xab\x95\xfb\x28\xee\x08\x00\x00\x20\x00\x08\x40\x2a\xb8\xa8\
+\xbb\x56\x13\xdf\xd7\x6a\xf5\x7e\x0a\x3b\x02\x40\x28\x02\x20\x00\
+\x08\x40\x2a\x5e\xf9\xf7\x1e\xae\xd5\xd4\x4d\x5a\xad\x39\x40\x51\
+\x47\x00\x10\x00\x00\x04\x00\x01\x48\x3c\xb5\x1b\x69\xf5\xec\x4a\
+\xad\xa6\x99\xe2\xbf\x96\xe2\x8f\x00\x20\x00\x00\x08\x00\x02\x90\
+\x7c\xda\xdd\xa0\xd5\x84\xf7\xb5\x9a\xbe\x59\xab\x75\xac\xf1\x47\
+\x00\x10\x00\x00\x04\x00\x01\x48\x36\x25\xcb\x6a\x75\xd7\x08\xad\
+\x5e\xfc\x81\x56\x33\x36\xb3\xc1\x0f\x02\x80\x00\x00\x20\x00\x08\
+\x40\xf2\x5f\xf9\x9f\xa1\xd5\x73\xab\xf3\x8b\xff\xcc\x2d\x5a\x6d\
+\x60\x83\x1f\x04\x00\x01\x00\x40\x00\x10\x80\x64\xd3\xea\x0a\xad\
+\xc6\xbf\x97\x5f\xfc\x67\x6f\x65\x77\x3f\x04\x00\x01\x00\x80\x54\
+\x0b\xc0\xc9\x86\x3a\x11\xd0\xc0\xb0\x33\x94\xc2\x9f\x9d\xa3\xd5\
+\xf5\x0f\xe5\x17\x7e\xcb\x2c\x8a\x3f\x02\x80\x00\x00\x40\xca\x05\
+\x20\x22\xe9\x28\x6e\x78\x2d\x94\xe2\x5f\xb6\xa2\x56\x0f\x4c\xfd\
+\x4f\xf1\x9f\xc1\x6b\x7f\x04\x00\x01\x00\x00\x04\x20\xaa\xe2\xff\
+\x6a\x28\xc5\xbf\x4e\x63\xad\x9e\x5f\xf7\x9f\xe2\x3f\x9d\x09\x7f\
+\x08\x00\x02\x00\x00\x08\x40\x54\xc5\xff\x95\x50\x8a\x7f\xeb\xab\
+\xb5\x9a\xf0\xde\x7f\x8a\xbf\xdd\xe4\x67\x1d\xeb\xfc\x11\x00\x04\
+\x00\x00\x10\x80\xb0\x8b\x7f\x31\xc3\xcb\xee\xbf\xf7\x17\xd5\xea\
+\xc6\x47\xff\x53\xf8\x2d\x53\x36\xb2\xc3\x1f\x02\x80\x00\x00\x00\
+\x02\x10\x51\xf1\xcf\x73\x5e\xfc\xcb\x55\xd6\xea\xc1\xe9\xdf\x2e\
+\xfe\x93\x4d\xf1\x5f\xc5\xc1\x3e\x08\x00\x02\x00\x00\x08\x40\x14\
+\xc5\x7f\x83\xf3\xe2\x7f\x72\x03\xad\x86\x6d\xf8\x4e\xf1\xff\x01\
+\x47\xfa\x22\x00\x08\x00\x00\x20\x00\x89\x2d\xfe\x8d\xce\xd3\x6a\
+\xec\xdb\xdf\x2e\xfe\x96\x65\x7b\x28\xd0\x08\x00\x02\x00\x00\x08\
+\x40\xc8\xc5\xbf\xa8\x61\x7d\x28\x9b\xfb\x4c\xfc\xe0\xbf\x8b\xff\
+\xe2\x5d\x14\x67\x04\x00\x01\x00\x00\x04\x20\x82\xe2\xbf\xce\x79\
+\xf1\xef\x74\xdb\x7f\x17\x7e\xcb\x82\x9d\x14\x66\x04\x00\x01\x00\
+\x00\x04\x20\x82\xe2\xbf\xd6\x69\xe1\xcf\xca\xfa\xef\x99\xfe\x87\
+\x99\xb3\x8d\xa2\x8c\x00\x20\x00\x00\x80\x00\x44\x50\xfc\xd7\x38\
+\x2d\xfe\xc5\x72\xb5\xea\x3b\xf2\xe8\xc5\xdf\x6e\xf4\xc3\x2e\x7f\
+\x08\x00\x02\x00\x00\x08\x40\xa8\xc5\x3f\xc7\xb0\xda\x69\xf1\x2f\
+\x5d\x4e\xab\x87\x66\x1e\xbd\xf8\xdb\xb5\xfe\x6b\x59\xeb\x8f\x00\
+\x20\x00\x00\x80\x00\x24\xab\xf8\x57\x3e\x49\xab\xa7\x97\x1d\xbd\
+\xf8\xbf\xc8\x72\x3f\x04\x00\x01\x00\x00\x04\x20\x8a\xe2\xbf\xca\
+\xf9\x1a\xff\xe1\x79\xc7\x2e\xfe\x0b\x99\xf4\x87\x00\x20\x00\x00\
+\x80\x00\x84\x2d\x00\x8b\xdc\x1e\xe8\xd3\x48\xab\x51\xaf\x1f\xbb\
+\xf8\xcf\xde\x4a\x11\x46\x00\x10\x00\x00\x40\x00\x42\x2e\xfe\x4f\
+\x3a\x3f\xcd\x6f\xf4\x1b\xc7\x2e\xfe\x4c\xfa\x43\x00\x10\x00\x00\
+\x40\x00\x42\x2f\xfe\x5d\x0d\x5f\x47\x56\xfc\x27\x73\xc0\x0f\x02\
+\x80\x00\x00\x00\x02\x10\x76\xf1\x3f\xd7\xf0\x57\x67\xc5\xbf\x6e\
+\x93\xe3\x17\x7f\xcb\x72\x26\xfd\x21\x00\x08\x00\x00\x20\x00\x61\
+\x16\xff\x1a\x86\x4f\x9c\x16\xff\x31\x6f\x1e\xbf\xf8\xb3\xd3\x1f\
+\x02\x80\x00\x00\x00\x02\x10\x6a\xf1\xcf\x35\x6c\x75\x57\xfc\xcf\
+\xfc\xfe\xe2\x3f\x6b\x0b\x45\x17\x01\x40\x00\x00\x00\x01\x08\x59\
+\x00\x96\x3a\x2b\xfe\xa7\x16\xa0\xf8\xdb\xcd\x7e\xd6\x1d\xa4\xe8\
+\x22\x00\x08\x00\x00\x20\x00\x21\x16\xff\xa7\xdc\x16\xff\xb7\x8e\
+\x5f\xfc\x2d\x4b\x39\xde\x17\x01\x40\x00\x00\x00\x01\x08\xb3\xf8\
+\x77\x73\x36\xe3\xbf\xde\x59\x05\x2b\xfe\x1c\xf2\x83\x00\x20\x00\
+\x00\x80\x00\x84\x5a\xfc\x9b\x39\x9b\xf1\x5f\xb3\xde\xf1\x37\xf9\
+\x39\xcc\xd4\x4d\x5a\xad\xe7\xd5\x3f\x02\x80\x00\x00\x00\x02\x10\
+\xe6\x8c\xff\x5f\x3a\x29\xfe\x15\xaa\x69\xf5\xfc\xba\xef\x2f\xfe\
+\xec\xf3\x8f\x00\x20\x00\x00\x80\x00\x84\x5a\xfc\x4b\x18\xb6\x39\
+\x29\xfe\x25\xcb\x6a\xf5\xe4\xe2\x82\x15\xff\x79\xdb\x29\xb2\x08\
+\x00\x02\x00\x00\x08\x40\x88\x02\xb0\xcc\x49\xf1\x2f\x5a\x5c\xab\
+\x07\xa7\x15\xac\xf8\x4f\xdb\xc4\x56\xbf\x08\x00\x02\x00\x00\x08\
+\x40\x88\xc5\xff\x19\x27\xc5\x3f\x2b\x4b\xab\x3e\x2f\x14\xac\xf8\
+\x5b\x56\xed\xa3\xc0\x66\xca\xf2\x6d\x5a\x5d\xde\x43\xab\xa1\x73\
+\x10\x00\x04\x00\x00\x10\x80\xe3\x16\xff\xee\xce\x66\xfc\xdf\xf8\
+\x48\xc1\x8b\x3f\xbb\xfd\x65\xce\x83\x23\xb4\x2a\x5f\x29\xff\xde\
+\x3f\x3b\x13\x01\x40\x00\x00\x00\x01\x38\x66\xf1\x6f\x6e\xf8\x9b\
+\x93\xe2\xdf\xf9\xf6\x82\x17\xff\x19\x5b\xb4\xca\xa3\x80\x17\x9a\
+\xa9\x79\x5a\x35\x69\xfe\xed\xfb\x8f\x00\x20\x00\x00\x80\x00\x1c\
+\xa3\xf8\x57\x37\xfc\xca\x49\xf1\x3f\xff\xca\x82\x17\x7f\xcb\x9a\
+\xfd\x14\xf1\xc2\xb0\x6a\x97\x56\x5d\xef\xd4\x2a\x27\xe7\xbf\xdb\
+\x00\x01\x40\x00\x00\x00\x01\x38\x86\x00\xbc\xee\xa4\xf8\x37\x69\
+\xad\xd5\xc4\x0f\x0b\x5e\xfc\xe7\xef\xa0\x90\x17\x86\xc1\x93\xb4\
+\xaa\x5c\xfd\xd8\xed\xe0\x50\x00\x4a\xbd\xf6\x23\x5d\xfd\xad\x1f\
+\x67\x8c\xc8\xef\x41\x00\x00\x00\x01\x38\xa1\xe2\x7f\x8f\x93\xe2\
+\x7f\x72\x03\xad\xc6\xbe\x5d\xf0\xe2\x3f\x95\x59\xff\x27\xcc\xec\
+\x37\xb5\x6a\xde\xf6\xfb\xdb\xc2\xa1\x00\x78\x05\x02\x00\x00\x08\
+\x40\x81\x8b\x7f\x03\x27\xdf\xfd\x4b\x97\xd7\xea\xb9\x35\x27\xf6\
+\xea\x7f\x19\x7b\xfd\x17\x98\xb5\x7b\xb5\xba\xf9\x3e\xad\x8a\x15\
+\x2f\x58\x7b\x20\x00\x08\x00\x00\x20\x00\x47\x14\xff\x1c\xc3\x76\
+\xf9\xe5\x7e\xd9\x5a\x0d\x78\xf1\xc4\x8a\xff\xac\xad\x14\xf5\x82\
+\x32\x74\xb6\x56\x27\xd5\x3e\xb1\x36\x41\x00\x10\x00\x00\x40\x00\
+\x8e\x10\x80\xe7\x9c\xbc\xfa\xef\x76\xff\x89\x15\xff\xc9\x76\xe2\
+\xdf\x01\x0a\xfb\xf7\xb1\x74\xb3\x56\x17\x5f\x55\xb8\x36\x41\x00\
+\x10\x00\x00\x40\x00\x82\xe2\xdf\xca\xf0\x6f\xf1\xe2\xdf\xb2\xe3\
+\x89\x15\xff\x6f\xd6\xfc\x33\xf1\xef\x7b\x79\x6c\x9c\x56\xe5\x2a\
+\x16\xbe\x5d\x10\x00\x04\x00\x00\x10\x00\xf3\x57\xca\xf0\x63\x27\
+\x93\xfe\xc6\xbd\x7b\x62\xc5\x9f\x89\x7f\xc7\x67\xc1\x07\x5a\xb5\
+\x6a\x9f\x79\xdb\x20\x00\x08\x00\x00\x20\x00\xe6\x6f\x86\x9b\x49\
+\x7f\xab\x4f\xfc\xe9\x9f\x89\x7f\xc7\x66\xc0\xf3\x5a\x95\x2a\x23\
+\xd3\x3e\x08\x00\x02\x00\x00\xe9\x16\x00\xf3\x77\xa5\x17\x93\xfe\
+\x98\xf8\x77\x6c\xe6\xbc\xa5\xd5\xd9\xe7\xcb\xb6\x11\x02\x80\x00\
+\x00\x40\x7a\x05\xc0\xfc\x55\x31\xfc\x56\x5c\x00\xba\xde\x7f\xe2\
+\xc5\xdf\x4e\xfc\x5b\xcb\xc4\xbf\x6f\x91\x77\x48\xab\xbb\x06\x6b\
+\x95\x5b\x42\x7e\x62\x26\x02\x80\x00\x00\x40\xaa\x05\x60\x9d\x17\
+\x93\xfe\x38\xec\xe7\xe8\x33\xfc\x5b\x5c\xa4\x9d\xac\xca\x40\x00\
+\x10\x00\x00\x48\xaf\x00\x98\xbf\x3b\xc5\x8b\x4a\xcd\x7a\x5a\x8d\
+\x7b\xe7\xc4\x8b\xff\x94\x8d\x4c\xfc\x3b\x92\xd1\x4b\x8e\xbf\x8d\
+\x2f\x02\x80\x00\x00\x00\x02\x50\xc8\xe2\x7f\xaa\xe1\xcf\xa2\x05\
+\xa5\x68\x31\xad\x06\x2f\x2c\xdc\xd3\xff\xa2\x5d\x14\xfd\xc3\xaf\
+\xfc\x6f\x7f\x58\xab\xec\x6c\xb7\xc5\x1f\x01\x40\x00\x00\x20\x7d\
+\x02\x60\xfe\xb2\x0d\x1b\xc5\x0b\x4a\xf7\x81\x85\x2b\xfe\x76\xd9\
+\x5f\x1e\x4f\xff\xce\x5f\xf9\x23\x00\x08\x00\x00\xa4\x5e\x00\x06\
+\x8b\x17\x93\xc6\xe7\x17\xae\xf8\x5b\x96\xec\xa6\xf8\x87\xf1\xca\
+\x1f\x01\x40\x00\x00\x20\xbd\x02\x60\xfe\xce\x35\xfc\x4b\xb4\x90\
+\x94\xa9\xa0\xd5\xf0\xbc\xc2\x15\xff\x69\xf6\xe9\x9f\x57\xfe\xa1\
+\xbc\xf2\x47\x00\x10\x00\x00\x48\xa7\x00\x98\xbf\x12\x86\x43\xe2\
+\x85\xa4\xdf\xa8\xc2\x3f\xfd\x2f\x4d\xf1\xa6\x3f\x6b\x76\x6b\x75\
+\x41\xc7\xf0\x0b\x3f\x02\x80\x00\x00\x40\xea\x04\x60\x84\x78\x11\
+\x69\x7b\x5d\xe1\x8b\xff\xf4\xcd\x29\xde\xce\xf7\x43\xad\x4e\x3f\
+\x33\xba\xe2\xef\x58\x00\x9a\x7f\xf4\x33\xfd\xc0\xc1\xdf\x66\x4c\
+\xf6\x2b\x08\x00\x00\x20\x00\x12\xb3\xfe\xff\x21\x5a\x40\x6a\xd4\
+\x3d\xf1\x7d\xfe\x8f\x64\xf9\xde\x74\x16\xff\x17\xd7\x86\xff\xbd\
+\x3f\x64\x01\x18\xf4\xf1\xef\xb4\xc4\x5f\xee\xab\x3f\x44\x00\x00\
+\x00\x01\xc8\x50\x00\xd6\x88\x16\x8f\x9c\xa2\x5a\x0d\x9a\x5f\xf8\
+\xe2\x3f\x63\x4b\x3a\x8b\xff\xd3\xd3\xb4\xca\x2d\x19\x7d\xf1\x47\
+\x00\x10\x00\x00\x48\xbe\x00\x98\xbf\x76\xe2\xc5\xe3\xba\xfb\x0a\
+\x5f\xfc\x2d\x2b\xf7\xa5\xaf\xf8\xf7\x1e\xa4\x55\x91\x2c\x3f\x8a\
+\x3f\x02\x80\x00\x00\x40\xb2\x05\xc0\xfc\x65\x19\xf6\x88\x16\x8e\
+\x86\x2d\xb4\x9a\xf4\x51\xe1\x8b\xff\xac\x94\x3d\xfd\xaf\x3f\xa0\
+\x55\xe7\x1b\xfc\x29\xfc\x08\x00\x02\x00\x00\xa9\x10\x80\xbb\x44\
+\x8b\x46\xb1\x5c\x53\x38\x56\x65\xf6\xf4\xbf\x2a\x45\x4f\xff\xcb\
+\xb7\xc9\x9f\xe2\x87\x00\x20\x00\x00\x80\x00\x7c\x4f\xf1\x2f\x2b\
+\x7e\xd2\xdf\xb5\xf7\x66\x56\xfc\xd3\xf4\xf4\x6f\x77\xf6\x3b\xad\
+\xb1\x9f\xc5\x1f\x01\x40\x00\x00\x20\xd1\x02\x30\x5a\xb4\x60\xd4\
+\xaa\xaf\xd5\xc4\x0f\x33\x13\x80\x15\x29\x99\xf9\xbf\xc8\x5c\x6b\
+\xed\xd3\xfd\x2d\xfe\x08\x00\x02\x00\x00\xc9\x14\x00\xf3\x77\x9a\
+\xe1\x9f\x62\xc5\x22\x2b\x4b\xab\x47\x66\x67\x56\xfc\xd3\xb2\xee\
+\x7f\xde\x7b\x5a\xd5\xac\xe3\x77\xf1\x47\x00\x10\x00\x00\x48\xac\
+\x00\xac\x13\x2d\x16\x17\x77\xcf\xac\xf8\x7f\xb3\xeb\x5f\x0a\xf6\
+\xfc\x9f\xf3\x96\x56\xd5\x6a\xfa\x5f\xfc\x11\x00\x04\x00\x00\x92\
+\x27\x00\xe6\xaf\xbd\x68\xa1\xa8\x50\x55\xab\x31\x6f\x65\x56\xfc\
+\xa7\x6e\x4c\xfe\x89\x7f\xd3\x5f\xd5\xaa\x52\xb5\x78\x14\x7f\x04\
+\x00\x01\x00\x80\x64\x09\x40\x70\xd4\xef\x3e\xd1\x42\x71\xd7\x88\
+\xcc\x9f\xfe\x17\xee\x4c\x76\xf1\x9f\xbc\x4e\xab\xf2\x95\xc2\x28\
+\xdc\x7f\x37\x0c\x43\x00\x10\x00\x00\x40\x00\xbe\x2b\x00\xfd\x44\
+\x0b\x4e\xd3\x8b\x32\x2f\xfe\x93\xcd\xd3\xff\xfa\x83\xc9\x2d\xfe\
+\xe3\x57\x6a\x55\xa6\x5c\x18\xc5\xdf\xae\xe8\x68\x65\x38\x1b\x01\
+\x40\x00\x00\x00\x01\x38\xb2\xf8\x97\x33\x7c\x2a\x56\x70\x72\x4b\
+\x69\xf5\xfc\xba\xcc\x05\x60\xde\x8e\x04\x3f\xf9\xaf\xd7\xaa\x54\
+\x99\x30\x8a\xbf\x3d\xc5\xb1\x6e\xd0\xce\x08\x00\x02\x00\x00\x08\
+\xc0\xb7\x04\x60\xac\x68\xd1\xe9\xfe\x60\xe6\xc5\xdf\xb2\xf6\x40\
+\x42\x27\xfc\xbd\xad\x55\xc5\x2a\x61\x14\xff\xb7\xad\xdc\x1d\xd1\
+\xce\x08\x00\x02\x00\x00\x08\xc0\xff\x16\x85\xd3\x0d\xff\x12\x2b\
+\x3a\xb5\x1b\x69\x35\xe9\xc3\xcc\x8b\xff\x9c\x6d\xc9\x5d\xe7\x7f\
+\x52\xed\x30\x8a\xff\x6c\x43\xce\x77\xda\x1a\x01\x40\x00\x00\x00\
+\x01\xf8\xdf\xa2\xb0\x41\xb4\xf0\x0c\x9c\x26\xf3\xf4\x9f\xc4\x6d\
+\x7f\x57\xee\xd0\xaa\x5e\x23\xd7\x85\xff\x6b\xc3\x63\xc7\x68\x6b\
+\x04\x00\x01\x00\x00\x04\xe0\x9b\x82\x70\xa9\xec\xc4\xbf\xb6\x32\
+\xc5\x7f\x66\x02\xb7\xfd\x5d\xbb\x57\xab\xb3\xce\x73\x5d\xfc\xff\
+\x66\xe8\x76\x9c\xf6\x46\x00\x10\x00\x00\x48\xbb\x00\x04\xa7\xfd\
+\x1d\x10\x2b\x3e\xd9\x39\x5a\x3d\xb5\x54\x46\x00\x96\xed\x49\x56\
+\xf1\xcf\x3b\xa8\xd5\x05\x97\xb9\x2e\xfe\xbf\x31\x9c\xf7\x3d\x6d\
+\x8e\x00\x20\x00\x00\x80\x00\xa8\x1b\x44\x0b\x50\xdb\xae\x32\xc5\
+\x7f\x4a\x02\x37\xfe\xe9\x74\xbd\xeb\xe2\x6f\x45\xae\x4e\x01\xda\
+\x1c\x01\x40\x00\x00\x00\x01\x50\x7b\x45\x97\xfd\xbd\xf0\xb2\x8c\
+\x00\xcc\x4f\xd8\xd2\xbf\x1b\xfb\xbb\x2e\xfe\x6f\x1e\x39\xd3\x1f\
+\x01\x40\x00\x00\x00\x01\x38\x5e\x21\xb8\x52\xb4\x08\x5d\xd5\x57\
+\xa6\xf8\x5b\xd6\xec\x4f\x4e\xf1\x7f\x64\x8c\xeb\xe2\x3f\xf3\xbb\
+\x33\xfd\x11\x00\x04\x00\x00\x10\x80\xe3\x15\x82\x4d\xa2\xfb\xfd\
+\x8f\x7b\x47\xa6\xf8\xcf\x48\xd0\xe4\xbf\x89\x6b\xb4\x2a\x96\xeb\
+\xb2\xf8\x0f\x2f\x44\xbb\x23\x00\x08\x00\x00\xa4\x55\x00\xcc\x5f\
+\x3b\xd1\x42\xd4\xf3\x49\xb9\xa7\xff\x25\xbb\x93\xb3\xd6\xbf\x4a\
+\x0d\x97\xc5\x7f\x5a\x21\xdb\xde\x7b\x01\xb8\x7d\xef\xff\xe8\x3d\
+\x5f\xfc\x23\x63\x8a\x21\x00\x00\x80\x00\xfc\x57\x11\x78\x4b\xac\
+\x10\xd5\x3a\x5d\x66\xd3\x9f\xc3\xfb\xfe\x6f\x48\xc0\xe4\xbf\x75\
+\xfb\xb5\x6a\xd2\xdc\x65\xf1\x5f\x66\x57\x70\x24\x55\x00\xbc\x02\
+\x01\x00\x80\xa4\x08\x80\xf9\x6b\x29\x5a\x8c\xee\x9d\x20\xf7\xf4\
+\x3f\x77\x7b\x32\x8a\xc6\xe5\x3d\x5c\x16\xff\xd7\x0c\x45\x33\x68\
+\x7f\x04\x00\x01\x00\x80\x94\x0a\xc0\x3a\xb1\x62\xd4\xe8\x3c\xb9\
+\xe2\x6f\x59\x99\x80\x9d\xff\xee\x7d\xd6\x65\xf1\xdf\x68\x28\x99\
+\x61\xfb\x23\x00\x08\x00\x00\xa4\x4d\x00\xcc\x5f\x93\x60\x9b\x58\
+\x99\x82\xf4\xd0\x0c\xb9\xe2\x3f\x6d\x53\xfc\x8b\xc5\xa8\x45\x5a\
+\xe5\xe4\xb8\x2a\xfe\x76\xc9\x66\x79\x81\x3e\x80\x00\x20\x00\x00\
+\x90\x42\x01\x58\x2c\x56\x90\xea\x37\x93\x7d\xfa\x5f\xb4\x2b\xde\
+\x85\x62\xde\x7b\x5a\x95\xaf\xe4\xaa\xf8\xff\xc4\x50\x5d\xa8\x0f\
+\x20\x00\x08\x00\x00\xa4\x49\x00\xcc\x5f\x3d\xc3\xbf\xc5\x8a\xd2\
+\x7d\x13\x65\x05\x60\xdd\xc1\x78\x6f\xf3\xdb\xa4\x85\xab\xe2\xff\
+\x3f\x86\xba\x82\xfd\x00\x01\x40\x00\x00\x20\x65\x02\x30\x53\xac\
+\x28\xd5\x69\x24\x5b\xfc\x67\x6f\x8d\x77\x91\xe8\x35\xd0\x55\xf1\
+\xff\x83\xfd\x6c\x23\xdc\x0f\x10\x00\x04\x00\x00\xd2\x22\x00\xe6\
+\xef\x24\xc3\x3f\xc5\x0a\x53\xdf\x91\xb2\x02\x10\xe7\x83\x7f\xc6\
+\xaf\x70\xf5\xdd\xff\x2f\x86\x56\x0e\xfa\x02\x02\x80\x00\x00\x40\
+\x8a\x04\xe0\x19\xb1\xc2\x54\xb3\x9e\x56\x93\x3e\x92\x2b\xfe\x93\
+\x7f\x10\xdf\xb5\xff\xab\x76\x6a\x75\x52\x6d\x17\xc5\xdf\xca\xda\
+\x65\x8e\xfa\x02\x02\x80\x00\x00\x40\x1a\x04\xc0\xfc\x65\x1b\x7e\
+\x29\x56\x9c\x6e\x1b\x22\xfb\xf4\x3f\x67\x5b\x7c\x8b\xc3\xa5\x5d\
+\x5d\x14\xff\xaf\x0c\xdd\x1d\xf6\x07\x04\x00\x01\x00\x80\x94\x08\
+\x40\x17\xb1\xe2\x54\xa5\x96\xdc\xae\x7f\x87\x59\x1a\xd3\xd7\xff\
+\x8f\x4f\x70\xf5\xdd\xbf\x9f\xe3\xfe\x80\x00\x20\x00\x00\x90\x12\
+\x01\x78\x5d\xac\x38\xdd\xfc\xb8\x6c\xf1\x8f\xeb\xeb\x7f\xbb\xe4\
+\xaf\x74\x59\x17\xc5\x7f\x7e\x08\xfd\x01\x01\x40\x00\x00\x20\xe9\
+\x02\x60\xfe\x4e\x15\xdb\xf8\xc7\x9e\xf8\x37\xe1\x7d\x66\xff\xdb\
+\x25\x7f\x67\xb6\x74\x51\xfc\x7f\x64\x28\x8d\x00\x20\x00\x00\x80\
+\x00\x48\x84\xfd\x08\xb1\x02\xd5\xed\x01\xd9\xe2\xff\xcd\xeb\xff\
+\x18\x9e\xfc\xd7\x7b\x90\x8b\xe2\xff\x0f\xc3\x39\x21\xf5\x09\x04\
+\x00\x01\x00\x80\x24\x0b\x80\xf9\x2b\x66\xf8\x9d\x48\xd8\x97\x2e\
+\xaf\xd5\xb8\x77\xe4\x05\x60\xfd\xc1\xf8\xbd\xfa\xcf\x2d\xe9\x42\
+\x00\x06\x84\xd8\x2f\x10\x00\x04\x00\x00\x12\x2e\x00\x37\x8a\x15\
+\xa8\xcb\x7a\xca\x17\xff\x59\x31\x7c\xfd\xdf\xaa\xbd\x8b\xe2\xbf\
+\x3e\xe4\x7e\x81\x00\x20\x00\x00\x90\x70\x01\x78\x5f\x24\xe8\x8b\
+\x64\x99\xb0\x5f\x29\x2f\x00\x4b\x62\xf6\xfa\xff\xa9\x29\x2e\x8a\
+\xff\x27\x86\x4a\x08\x00\x02\x00\x00\x08\x80\x54\xc8\x9f\x21\x77\
+\xe4\x6f\x2b\xf9\xe2\x1f\xb7\xd7\xff\xab\x76\x69\x55\xa5\x86\x74\
+\xf1\xb7\xe7\x32\xb4\x8d\xa0\x6f\x20\x00\x08\x00\x00\x24\x58\x00\
+\x26\x88\x15\xaa\xbb\x46\xc8\x17\xff\x99\x5b\xe2\x55\x04\xae\xbb\
+\xc3\xc5\xd3\xff\x33\x11\xf5\x0d\x04\x00\x01\x00\x80\x24\x0a\x80\
+\xf9\x2b\x61\xf8\x5c\x6c\xe9\xdf\xc4\x0f\xe5\x05\x60\x71\x8c\x8e\
+\xfe\x9d\xbc\x4e\xab\xec\x6c\xe9\xe2\x6f\x3f\xcf\x64\x23\x00\x08\
+\x00\x00\x20\x00\x92\x01\x7f\x9b\x58\xa1\xba\xfc\x4e\x37\xaf\xff\
+\xe3\x72\xf4\x6f\xde\x21\xad\x1a\x36\x95\x2e\xfe\xbf\x37\xd4\x8c\
+\xf0\xed\x10\x02\x80\x00\x00\x40\x42\x05\xe0\x5d\x91\x80\xcf\x32\
+\x4f\xbd\xcf\xaf\x93\x2f\xfe\xd3\x37\xc7\x27\xfc\xef\x19\xe2\xe2\
+\xd5\xff\x55\x11\x4f\x0e\x45\x00\x10\x00\x00\x48\x9a\x00\x98\xbf\
+\x6a\xc1\x61\x32\x99\x87\x56\xd3\x8b\xdc\x3c\xfd\xcf\xdf\x11\x8f\
+\xe0\x5f\xbe\xcd\xc5\x76\xbf\x13\x3c\xd8\x1c\x0a\x01\x40\x00\x00\
+\x20\x81\x02\x70\x8f\x58\xb1\xba\x67\xbc\x1b\x01\x58\xb1\x37\x1e\
+\xc1\xdf\xad\xb7\x74\xf1\xdf\x69\x37\x67\x42\x00\x10\x00\x00\x40\
+\x00\x5c\x84\xfb\x07\x22\xe1\x5e\xb9\xa6\x56\x93\x3e\x72\x23\x00\
+\x71\x38\xfc\x67\xfe\xfb\x5a\x15\xcb\x95\x2c\xfe\x5f\xda\xa5\x99\
+\x9e\x1c\x0e\x85\x00\x20\x00\x00\x90\x24\x01\x30\x7f\x27\x89\xbd\
+\xfe\xef\x72\xb7\x9b\xe2\x1f\x97\xe5\x7f\x1d\xbb\x4b\x3f\xfd\x4f\
+\xf4\xa6\x53\x22\x00\x08\x00\x00\x24\x4e\x00\x06\x88\x04\x7b\x4e\
+\x51\xad\x5e\x78\xc5\x8d\x00\x2c\xdc\xe9\x7f\xe0\x4f\x7f\x25\x7f\
+\x02\xa4\x5c\xf1\xff\xcc\x50\x21\x71\x02\x00\x08\x00\x00\x78\x23\
+\x00\x1b\x45\xc2\xea\xac\x36\x6e\x8a\xbf\x65\xd5\x7e\xff\x05\xa0\
+\xf5\xa5\xd2\xe1\x7f\x9f\x57\x9d\x12\x01\x40\x00\x00\x20\x39\x02\
+\x60\xfe\x4e\x36\x7c\x2d\x12\x56\xb7\x0d\x71\x53\xfc\xa7\x6c\xd4\
+\x2a\xcf\xf3\xe2\x3f\x76\xb9\x74\xf0\x1f\x32\xe4\x20\x00\x08\x00\
+\x81\x08\x80\x00\xb8\x0a\xf5\x07\x45\x82\xaa\x68\x71\x53\x04\xdf\
+\x76\x23\x00\x73\xb6\xf9\xff\xf4\x7f\x66\x4b\xe9\xe0\xef\xe4\x5d\
+\xa7\x44\x00\x10\x00\x00\x48\x94\x00\x6c\x11\x09\xaa\xb3\xdb\xb9\
+\x7b\xfd\xef\xfb\xe9\x7f\x43\x66\x48\x87\xfe\xab\x5e\x76\x4a\x04\
+\x00\x01\x00\x80\x64\x08\x80\xf9\xab\x23\x16\x54\x77\x0e\x75\x27\
+\x00\x6b\x0f\xf8\xbd\xe5\x6f\xdd\x86\x89\x5c\xf6\x87\x00\x20\x00\
+\x00\x90\x5c\x01\x78\x44\x24\xa4\xec\xba\xf7\x71\xef\xb8\x29\xfe\
+\xd3\x36\xf9\xfd\xf4\x6f\x97\xb4\xc9\x06\xfe\x24\x6f\x3b\x25\x02\
+\x80\x00\x00\x40\x62\x04\x60\x87\x48\x48\x35\xeb\xe0\xee\xe9\x7f\
+\xde\x76\xbf\x05\xe0\xec\xf3\xa5\x97\xfd\x55\x44\x00\x00\x01\x00\
+\x40\x00\x5c\x86\x79\x6d\xb1\x90\xea\xf3\x82\x3b\x01\x58\xb6\xc7\
+\xdf\xe2\xff\xe2\x5a\xe9\xb0\x1f\xe0\x75\xa7\x44\x00\x10\x00\x00\
+\x48\x84\x00\xf4\x11\x09\xa8\xe2\x25\xb5\x1a\xf7\x6e\x3a\xbf\xff\
+\x5f\x72\x8d\x64\xd0\x7f\xec\xdb\xb2\x3f\x04\x00\x01\x00\x80\x64\
+\x0a\xc0\x4a\x91\x80\x6a\xd1\xd1\x5d\xf1\xb7\xeb\xff\x7d\x2d\xfe\
+\x0b\x3e\xd0\x2a\x27\x47\x32\xe8\x3b\x7b\xdf\x29\x11\x00\x04\x00\
+\x00\xe2\x2d\x00\xe6\x2f\xdb\xf0\xb9\x48\x40\xf5\x1d\xe9\x4e\x00\
+\x66\x6f\xf5\x57\x00\xba\xf7\x91\x0c\xf9\xd7\x62\xd1\x29\x11\x00\
+\x04\x00\x00\x62\x2f\x00\xad\x44\xc2\xa9\x44\x69\xad\x26\xbc\xe7\
+\x4e\x00\x7c\xdd\xff\x7f\xd5\x2e\xad\x4a\x97\x95\x0a\xf8\x7f\xfb\
+\xba\xec\x0f\x01\x40\x00\x00\x20\x79\x02\xf0\xb4\x48\x38\xb5\x74\
+\xf8\xfa\xdf\xb2\x62\xaf\x9f\x02\xd0\xf7\x09\xc9\x80\x5f\x15\x9b\
+\x4e\x89\x00\x20\x00\x00\x10\x7b\x01\x90\x39\xfc\xa7\xd7\xd3\x6e\
+\x05\x60\xfd\x21\x0f\x37\xfe\x39\xa8\x55\xf5\x93\x25\x03\xfe\x22\
+\x04\x00\x10\x00\x00\x70\x2e\x00\xe6\xaf\x5c\xf0\xda\x39\xb3\x60\
+\x2a\x52\x44\xab\xe1\x79\xee\x8a\xff\xb4\xcd\x7e\x3e\xfd\x3f\x39\
+\x59\x32\xdc\xf7\xc6\xaa\x53\x22\x00\x08\x00\x00\xc4\x5a\x00\xae\
+\x15\x09\xa6\x5a\xf5\xdd\x3e\xfd\xcf\xf5\x74\x03\xa0\x96\xed\x24\
+\xc3\xbd\x37\x02\x00\x08\x00\x00\x84\x25\x00\xd3\x45\x82\xe9\xd2\
+\x9b\xdd\x0a\x80\x8f\x07\x00\x2d\x32\xbf\x2b\x3b\x5b\x72\xd7\xbf\
+\x12\x31\x13\x80\xaa\x86\x41\x10\x2a\x0f\x10\x88\x00\x08\x80\x54\
+\x88\xff\x54\xa4\x80\xdd\x37\xd1\xad\x00\xac\xde\xef\x9f\x00\xf4\
+\x7e\x4c\xf2\xc9\x6e\x14\x1d\x1d\x00\x00\x42\x11\x00\xf3\x77\x9a\
+\xd8\xe1\x3f\xe3\x1d\x2e\xff\x9b\xfc\x83\xfc\x53\xf6\x7c\x13\x80\
+\x3a\xf5\x25\x97\xfe\xd5\xa6\xa3\x03\x00\x40\x58\x02\x70\xb7\x48\
+\x01\x6b\xd4\xca\xed\xd3\xff\xcc\x2d\xfe\x15\xff\x89\xab\x25\x9f\
+\xfe\xd7\xd2\xc9\x01\x00\x20\x4c\x01\x58\x2f\x52\xc0\xae\x1b\xe0\
+\x56\x00\xe6\xef\xf0\x4f\x00\xae\xba\x45\x52\x00\x2e\xa1\x93\x03\
+\x00\x40\x98\x02\xf0\x99\x48\x01\x7b\x62\x91\x5b\x01\x58\xea\xd9\
+\x09\x80\xeb\xf6\x69\x55\xa6\xbc\x54\xf1\x3f\x40\x07\x07\x00\x80\
+\xd0\x04\xc0\xfc\xd5\x13\x29\x60\xe5\xab\xba\x2d\xfe\x3e\x4e\x00\
+\x1c\x3c\x49\xf2\xe9\xbf\x2f\x1d\x1c\x00\x84\x72\xfd\x71\xc3\xfb\
+\x10\x29\xad\xe2\x20\x00\x3d\x44\x0a\x58\xab\x2b\xdc\x0b\xc0\x86\
+\x43\x49\x5d\xfb\x6f\x0f\x60\x2a\x49\x70\x01\x80\x50\xae\xf7\x64\
+\xaf\x8c\xc8\x79\x2c\x0e\x02\x30\x5e\xe4\x62\x6f\x7f\xd6\x6d\xf1\
+\x9f\xba\xc9\xaf\xe2\xbf\x64\x93\xe4\xda\xff\x31\x84\x16\x00\x08\
+\xe6\x7a\x45\xc3\x97\x14\xe1\x48\x59\x19\x07\x01\xf8\x81\xc8\xc5\
+\x0e\xdb\xe0\x56\x00\x7c\x3b\x02\xf8\x81\xe1\x52\x9d\xe4\x2b\x43\
+\x5d\x42\x0b\x00\x84\xb3\xfd\x3d\x8a\x70\xa4\xfc\xd4\x6b\x01\x30\
+\x7f\x39\x86\xbf\x65\x7c\xa1\x15\x42\xf8\xfe\xef\xdb\x0a\x80\xf3\
+\x3b\x48\x75\x92\x0d\x84\x15\x00\x38\x10\x80\x07\x28\xc2\x91\x53\
+\xd1\x67\x01\x68\x2a\x72\x91\x4d\x2f\x72\x2f\x00\x4b\x3d\xda\x02\
+\x78\xcd\x1e\xad\x72\x4b\x48\x75\x90\xab\x09\x2b\x00\x70\x20\x00\
+\x75\x29\xc0\x91\xd3\xc1\x67\x01\xe8\x23\x72\x91\x57\xf7\x77\x2f\
+\x00\xab\x3c\x5a\x01\x30\x64\x86\x54\xe7\xf8\x3b\x93\xff\x00\xc0\
+\xa1\x04\xec\xa3\x08\x27\x67\x22\xa0\x74\xe7\x98\x15\x8b\xfd\xff\
+\x7d\x5b\x01\xd0\xf9\x06\xa9\xce\xf1\x2a\x21\x05\x00\x0e\x05\x60\
+\x28\x45\x38\x52\x96\xfb\x2c\x00\x7b\x32\xbe\xc0\x22\x45\xb4\x1a\
+\xfd\x46\x7a\x56\x00\xd8\xb3\x08\x2a\x55\x93\xea\x1c\x77\x13\x52\
+\x00\xe0\x50\x00\x9a\x53\x84\x23\xe5\x63\x2f\x05\xc0\xbe\x7a\x0e\
+\x0e\x9f\xc9\xec\x02\xab\xd5\x76\xff\xf4\xef\xd3\x0a\x80\x09\xab\
+\x24\x3b\x47\x6d\x42\x0a\x00\x1c\x0a\x40\x11\xc3\x2f\x29\xc4\x91\
+\x61\x6b\x6c\xae\x8f\x02\x70\xa1\xc8\x05\xb6\xec\x94\xae\x15\x00\
+\x3d\xee\x96\xea\x18\xfb\x09\x28\x00\x08\x41\x02\xa6\x52\x88\x23\
+\xe5\x5c\x1f\x05\x60\xa0\xc8\xc5\x75\x1f\x98\xae\x15\x00\xa7\x36\
+\x94\xea\x14\x23\x08\x27\x00\x08\x41\x00\x3a\x51\x84\x23\xa5\x97\
+\x8f\x02\xb0\x44\xe4\xe2\x1e\x9e\x19\xc2\x0a\x80\x7d\x7e\x14\xff\
+\x79\xef\x49\x76\x8a\x0b\x09\x27\x00\x08\x41\x00\x4a\x18\xfe\x41\
+\x21\x8e\x8c\xb1\x3e\x0a\xc0\xde\x8c\x2f\x2c\xbb\xa8\x56\xe3\xdf\
+\x73\x2f\x00\xeb\x0e\xfa\x21\x00\x03\x5f\x90\xea\x10\xf6\xf4\xc5\
+\x6c\xc2\x09\x00\x42\x92\x80\x77\x28\xc4\x91\xf1\xa6\x57\x02\x10\
+\x4c\x0c\xf9\x6b\xc6\x17\x76\x4a\x43\xf7\xc5\x7f\xf2\x0f\xfc\x79\
+\xfd\xdf\xb1\xbb\x54\x87\x58\x4c\x28\x01\x40\x88\x02\x30\x88\x42\
+\x1c\x19\xbf\xf1\x4d\x00\x6a\x89\x5c\x58\x9b\x6b\xdd\x0b\xc0\x34\
+\x8f\x96\x00\x9e\x52\x4f\xaa\x43\xdc\x44\x28\x01\x40\x88\x02\xd0\
+\x8c\x42\x1c\x29\x55\x7c\x12\x80\x4b\x44\x2e\xea\xfa\x87\xdc\x0b\
+\xc0\x2c\x4f\x96\x00\x2e\xdd\x92\xbf\xe7\x81\xcc\xb2\x90\x8a\x84\
+\x12\x00\x84\x28\x00\x59\x86\xdf\x53\x88\x23\xa3\xbd\x4f\x02\xd0\
+\x4f\xe4\xa2\xee\x9d\xe0\x5e\x00\xe6\x6e\xf7\x43\x00\x9e\x9e\x26\
+\xd5\x11\x3e\x22\x90\x00\x20\x02\x09\x58\x21\x92\x61\xe5\xab\x6a\
+\x75\xda\xd9\xee\x69\xd4\x5c\xab\x26\x2d\xa2\xe5\xb4\xc6\x52\xb9\
+\xff\x80\x4f\x02\x30\x56\xe4\xa2\x9e\x5d\xe5\x5e\x00\x16\xee\xf4\
+\x43\x00\xba\xf5\x96\xea\x08\x83\x08\x23\x00\x88\x40\x00\x64\xce\
+\x7e\x69\xda\xd6\x7d\xee\x5b\x16\x78\x90\xfd\x2f\xbd\x23\x95\xfb\
+\x73\x7c\x12\x80\xbc\x8c\x2f\xa8\x68\x31\xad\x26\x7d\x98\x9e\x3d\
+\x00\x1a\x35\x93\xea\x08\x4d\x08\x23\x00\x88\x40\x00\x64\x4e\x07\
+\x0c\xe3\xf8\x77\xcb\x8c\x2d\xd1\xe7\xfe\x86\x03\x5a\x65\x67\x4b\
+\xe4\xfe\x66\x9f\x04\xe0\x87\x19\x5f\x50\x8d\xba\xe1\x74\x82\x15\
+\x7b\xa3\xef\x04\xeb\xf6\xe5\x0b\x4f\xe6\x9d\xe0\xe7\x04\x11\x00\
+\x44\x28\x01\x3f\x11\x91\x80\xe1\x79\xe1\xe4\xbf\x0f\x87\xc0\x55\
+\xab\x29\x91\xfd\xbf\xf6\x42\x00\xec\xfa\x73\xc3\xbf\x32\xbe\xa0\
+\xb3\xda\x84\xd3\x01\xd6\x1c\x88\xbe\x03\x8c\x5e\x22\xf5\xf4\x3f\
+\x83\x10\x02\x80\x08\x05\x60\x9a\x48\x96\xf5\x1f\x13\x4e\xfe\xfb\
+\xb0\x09\xdc\x99\x2d\x25\xb2\xff\x6b\x89\x33\x01\x24\x3a\x40\x3d\
+\x91\x0e\xd0\xe1\xe6\xf4\x18\xe0\xed\x0f\x4b\x09\x40\x7f\x42\x08\
+\x00\x22\x14\x80\x1b\x44\xb2\xec\x8a\xde\xe1\xe4\xff\x12\x0f\x3e\
+\x01\x77\xb8\x4e\x2a\xff\x1b\xf8\x20\x00\x9d\x45\x2e\xa6\xc7\x63\
+\xee\x1b\x7f\xca\x46\x3f\xbe\xff\xb7\xbe\x94\xed\x7f\x01\x20\x09\
+\x02\x50\x5f\x24\xcb\xce\xbc\x30\x1c\x01\xf0\x61\x15\xd8\xcd\xf7\
+\x49\xe5\x7f\x47\x1f\x04\x60\x80\xc8\xc5\xdc\x3f\x39\x84\x49\x20\
+\x9b\xfd\x10\x80\x5a\x75\xa5\x3a\x40\x79\x42\x08\x00\x22\xde\x0f\
+\xe0\xcf\x19\x67\x59\xb9\xca\x21\x4d\x04\xf4\xa0\x06\x3c\x38\x42\
+\x2a\xff\xfb\xfa\x20\x00\x93\x45\x2e\x66\xd8\x7a\xf7\x8d\x3f\x67\
+\x9b\x1f\x13\x00\xb3\x44\x66\x81\x7e\x42\x00\x01\x80\x07\x12\xb0\
+\x51\xa6\x06\x6c\x08\x67\x2b\xf8\xbc\x88\x3f\x03\x8f\x5c\x24\x25\
+\x00\xc3\x7d\x10\x80\x37\x32\xbe\x90\xe2\x25\xc2\xb1\xbf\xf9\x3b\
+\xa2\x17\x80\xc9\xeb\xa5\x1a\xff\x55\xc2\x07\x00\x3c\x10\x80\x29\
+\x22\x99\xd6\x77\x54\x48\x13\xc1\xf7\x27\xe5\x14\xd8\x25\x3e\x08\
+\xc0\xa1\x8c\x2f\xa4\x56\xfd\x70\x1a\x7e\xd1\xae\xe8\x05\xe0\xb1\
+\x71\x52\x8d\x3f\x92\xf0\x01\x00\x0f\x04\xa0\xb7\x48\xa6\x5d\xd5\
+\x37\x9c\x3a\xb0\x74\x4f\xb4\x35\x20\xef\xa0\x56\x39\x39\x12\x35\
+\x60\x93\x0f\x02\x90\xf9\x7e\xd0\xe7\x5e\x92\x9e\x19\xa0\x3d\xee\
+\x96\x12\x80\x5b\x08\x1f\x00\xf0\x40\x00\x9a\x8b\x64\x5a\xab\x2b\
+\xd2\xf3\x26\xb8\xfa\xc9\x12\x35\xe0\x7f\x22\x15\x00\xf3\x97\x13\
+\xac\x47\xcc\xec\x42\xda\xf7\x08\xa7\xe1\x97\xed\x89\xbe\xe1\x2f\
+\xe8\x28\x25\x00\x67\x13\x3e\x00\xe0\x81\x00\xe4\x1a\xbe\xcc\x38\
+\xd3\xea\x35\x0d\xa7\x0e\xcc\xf2\x60\x47\xc0\xa6\xad\xa4\xf6\x02\
+\x28\x1e\xa5\x00\xd4\x10\x29\x66\x5d\xee\x09\xa7\xe1\x57\xee\x4b\
+\xca\x11\xc0\x5f\x66\xda\xf0\x00\x00\x82\x12\xb0\x3f\xe3\x5c\x2b\
+\x5b\x29\x9c\x3a\xe0\xc3\x72\xf0\xcb\xba\x4a\x3d\x08\xd6\x8f\x52\
+\x00\x9a\x8a\x5c\x44\xcf\xa7\xc2\x69\xf8\xd5\x11\x4f\xfe\x58\xb7\
+\x5f\xea\xdb\xcf\x21\x42\x07\x00\x3c\x12\x80\x85\x22\xb5\x60\xcc\
+\x5b\xe1\xd4\x82\xb5\x11\xef\x08\x7b\xcb\x00\x29\x01\xb8\x24\x4a\
+\x01\xb8\x4c\xe4\x22\xee\x19\x97\x8e\x46\x9f\xfa\xb2\x54\xa3\x2f\
+\x27\x74\x00\xc0\x23\x01\x78\x50\x24\xdb\x06\xcd\x4b\xc7\xdb\xe0\
+\x87\x46\x4a\xd5\x82\xeb\xa3\x14\x80\x5b\x62\xd5\xe8\x51\x6f\x03\
+\xfc\xf8\x04\xa9\x46\x7f\x92\xd0\x01\x00\x8f\x04\xa0\x93\x48\xb6\
+\xdd\x39\x34\x1d\x2b\x01\x46\x2d\xf6\x62\x3b\xf8\x4c\x1b\xfd\xa1\
+\xd8\x6c\x00\x61\x49\xce\x19\x00\x5d\x08\x1d\x00\xf0\x48\x00\x1a\
+\xc7\x6a\x29\xe0\xc2\x9d\xd1\xd6\x82\xf9\xef\x7b\xf1\x30\x98\x69\
+\xa3\x8f\xcc\xf8\x02\x8a\x64\x69\x35\xf1\xc3\x74\x4c\xfc\xe8\xd2\
+\x4b\xaa\xd1\xeb\x11\x3a\x00\xe0\x91\x00\x94\x8b\xd5\x52\xc0\x79\
+\xdb\x3d\xd8\x0b\xa0\xa8\x44\x2d\x98\x10\xa5\x00\xcc\xcb\xf8\x02\
+\x4a\x97\x0f\xa7\xc1\xa7\x79\xb0\x07\x74\x9b\xce\x12\x0d\xfe\x17\
+\x43\x11\x42\x07\x00\x3c\x93\x80\xcc\xcf\x04\x38\xfd\x9c\x70\xea\
+\xc1\xec\xad\xd1\xd7\x83\x1a\xa7\x48\xd4\x83\x85\x51\x0a\xc0\xab\
+\x19\x5f\x40\x8d\x53\xc3\x69\xf0\x99\x1e\xac\xfd\x6c\xd2\x5c\xa2\
+\xc1\xb7\x12\x36\x00\xe0\xa1\x00\x7c\x9c\x71\xbe\x55\xab\x1d\x4e\
+\x3d\x98\xee\xc1\x03\x61\xbd\x33\x22\xdf\x12\x3e\xd3\x06\xdf\x99\
+\xf1\x05\x34\x68\x96\x1e\xe3\x3b\xa9\x76\xe4\xc6\x07\x00\xe0\x48\
+\x00\xde\xca\x38\xdf\x4a\x96\x0d\xa7\x1e\x4c\xf6\xe0\x93\x70\xa3\
+\x66\x91\x3f\x10\x66\xda\xe0\x9f\x64\x7c\x01\xcd\x2f\x0d\xa7\xc1\
+\x5f\xf2\xe0\x1c\xe8\xdc\x92\x12\x0d\x3e\x86\xb0\x01\x00\x0f\x05\
+\x60\x6e\xe6\x73\xc2\x8a\x68\x35\xf1\x83\x74\xac\x0a\x3b\xf7\x42\
+\x89\x7a\xf0\x93\x28\x05\xe0\x9f\x19\x5f\x40\xbb\x1b\xd2\xb1\xff\
+\xf3\xca\x1d\x52\x13\x00\x1f\x21\x6c\x00\xc0\x43\x01\x18\x1a\xab\
+\x55\x61\x51\x9f\x0a\xd8\xfa\x52\x89\x7a\xf0\x79\x24\x02\x60\xfe\
+\x4a\x8a\x34\xf6\xd5\xfd\xd3\xb1\xec\x63\xc6\x6b\x52\x02\xd0\x8b\
+\xb0\x01\x00\x0f\x05\xa0\xaf\xcc\xbe\x30\xf3\xc3\xa9\x09\x2b\xf6\
+\x46\x5b\x13\x2e\xb9\x5a\xea\x3c\x80\x9c\x28\x04\xa0\xa2\x48\x63\
+\xf7\x78\x34\x1d\x02\x30\x62\x81\x94\x00\x74\x26\x6c\x00\xc0\x43\
+\x01\xb8\x5c\x24\xe3\xee\x9d\x90\x8e\xd3\x61\x3b\xdf\x28\x55\x13\
+\xaa\x46\x21\x00\x27\xc9\x9c\x03\xf0\x64\x38\x8d\xbd\x68\x57\xb4\
+\x8d\xfd\xc8\x18\xa9\xc6\x3e\x97\xb0\x01\x00\x0f\x05\xe0\x2c\x91\
+\x8c\xeb\xf5\x4c\x3a\x1e\x0a\xaf\xbd\x5d\xaa\x26\x34\x88\x42\x00\
+\x4e\x15\xf9\xf1\xb7\x3f\x1b\x4e\x63\x2f\x8e\x58\x00\x7a\x0f\x92\
+\x6a\xec\x5a\x84\x0d\x00\x78\x28\x00\xd5\x44\x32\xae\xeb\xfd\xe9\
+\x98\x17\xd6\xe3\x6e\xa9\x9a\xd0\x34\x0a\x01\x68\x24\xf2\xe3\xfb\
+\xbc\x90\x8e\xd7\x3d\x37\xdf\x27\xd5\xd8\xc5\x08\x1b\x00\xf0\x50\
+\x00\x4a\x8b\x64\xdc\x65\xb7\xa6\x63\x37\x40\xb9\xad\xe1\x5b\x44\
+\x21\x00\xe7\x88\xfc\xf8\xfe\x63\x43\x3a\xfc\x21\x62\x01\xe8\x7e\
+\x57\xe4\x33\x3e\x01\x00\x1c\x0a\x40\x96\x48\x4d\x68\xdb\x35\x9c\
+\x9a\x30\x37\x62\x01\xe8\xf7\x94\x94\x00\x5c\x18\x85\x00\x9c\x2f\
+\xf2\xe3\x07\x4c\x4a\xc7\xe9\x4f\x32\xe7\x00\x7c\x42\xd0\x00\x80\
+\xc7\x12\xf0\x8f\x8c\x73\xae\xf5\xd5\xe1\xd4\x84\x39\xdb\xa2\xad\
+\x09\x0f\x0c\x97\x12\x80\x4b\xa2\x10\x80\x76\x22\x3f\xfe\xc1\x69\
+\xe1\x34\xf6\xb2\x88\x05\xe0\xf2\x1e\x12\x0d\xfd\x63\x42\x06\x00\
+\x3c\x16\x80\x3f\x64\x9c\x73\xe7\x75\x4e\xc7\xee\xb0\x83\xc6\x47\
+\xbe\x32\x2c\x93\x86\xee\x2c\xf2\xe3\x1f\x9d\x13\x4e\x63\x2f\x8f\
+\x78\xcd\x67\x87\xeb\x24\x1a\xfa\x00\x21\x03\x00\x1e\x0b\xc0\x2f\
+\x33\xce\xb9\x66\x1d\xc2\xa9\x09\xb3\x22\x3e\x1f\x66\xc8\x8c\xc8\
+\x8f\x87\xcf\xa4\xa1\xbb\x88\xfc\xf8\xc1\x0b\xd2\xb1\xe9\x43\xdb\
+\xcb\x25\x1a\x7a\x27\x21\x03\x00\x1e\x0b\xc0\xff\xc9\x38\xe7\x9a\
+\xb6\x0d\xa7\x26\xcc\xd8\x92\x94\xbd\x61\xae\x8f\x42\x00\x6e\x14\
+\xf9\xf1\x4f\x2f\x0b\xa7\xb1\x57\xee\x8b\xb6\xb1\x5b\xb5\x97\x68\
+\xe8\x8d\x84\x0c\x00\x78\x2c\x00\x7b\x32\xce\xb9\xc6\xe7\xa7\xe3\
+\x44\xc0\xf1\x2b\xa5\x04\xa0\x67\x14\x02\x70\x9b\xc8\x8f\x7f\x6e\
+\x4d\x3a\x04\xa0\x59\x1b\x89\x86\x7e\x97\x90\x01\x00\x8f\x05\x60\
+\x53\xe6\x27\xc4\x36\x0f\xa7\x26\x4c\xdb\x14\x6d\x4d\x98\xf6\xb2\
+\x94\x00\xdc\x19\x85\x00\xf4\x13\xf9\xf1\xc3\xf3\xc2\x69\xec\x55\
+\x11\x1f\xfc\x70\x66\xcb\xc8\xcf\x7e\x06\x00\x70\x2c\x00\x6f\x67\
+\x9c\x73\xf5\x9a\x86\x53\x13\xa6\x46\x7c\x24\xf0\xdc\x77\xa5\x04\
+\xe0\xee\x28\x04\xe0\x7e\x91\x1f\x3f\xea\xf5\x70\x1a\x7b\x75\xc4\
+\x02\xd0\xb0\xa9\x44\x43\xaf\x25\x64\x00\xc0\x63\x01\xd8\x90\x71\
+\xce\xd5\x6e\x14\x4e\x4d\x98\x1c\xb1\x00\x2c\xdd\x2c\x25\x00\x03\
+\xa3\x10\x80\x47\x45\x7e\xfc\xb8\x77\xd2\x71\xf4\x63\xbd\x46\x12\
+\x0d\xbd\x82\x90\x01\x00\x8f\x05\x60\x45\xc6\x39\x77\x72\xfd\x70\
+\x6a\x82\x25\xca\x9a\xb0\x7a\xb7\x94\x00\x3c\x1a\x85\x00\x0c\x14\
+\xf9\xf1\xa3\xdf\x48\xc7\x1b\x80\x46\xcd\x24\x1a\xfa\x65\x42\x06\
+\x00\x3c\x16\x80\x97\x33\xff\x04\x70\x56\x38\x35\x61\x4a\xc4\x6f\
+\x00\x56\x6c\x8f\xf5\x1b\x80\xbb\x45\x7e\xfc\x0b\xaf\xa4\x63\x0e\
+\x40\xf3\xb6\x12\x0d\xfd\x01\x21\x03\x00\x1e\x0b\xc0\x07\x19\xe7\
+\x5c\xa3\x56\x21\xcd\x01\x88\x78\x12\xe0\x92\x4d\xb1\x9e\x03\xd0\
+\x5b\xe4\xc7\x0f\x5d\x9b\x8e\x55\x00\x17\x76\x92\x68\xe8\xdd\x84\
+\x0c\x00\x78\x2c\x00\xbb\x33\xce\xb9\x73\xda\xa5\x63\x19\xe0\xfc\
+\xf7\xa5\x04\xa0\x77\x14\x02\xd0\x53\xe4\xc7\x0f\x59\x99\x0e\x01\
+\xb8\xb4\xab\x44\x43\xff\x84\x90\x01\x00\x8f\x05\xe0\x27\x19\xe7\
+\x5c\xab\x2b\xc2\xa9\x09\x33\x23\xde\x08\x68\xce\x5b\xb1\xde\x07\
+\xe0\x06\x91\x1f\xff\xd4\x92\x74\xec\x04\x78\xf5\xad\x12\x0d\xfd\
+\x5b\x42\x06\x00\x3c\x16\x80\xdf\x66\x9c\x73\x17\x77\x0f\x69\x2b\
+\xe0\x88\xcf\x02\x98\xfe\xaa\x94\x00\xdc\x10\xdf\xad\x80\x07\xcd\
+\x4f\xc7\x59\x00\x37\xf6\x97\x68\xe8\xbf\x11\x32\x00\xe0\xb1\x00\
+\xfc\x2d\xe3\x9c\xeb\xd8\x2b\x1d\xa7\x01\x4e\x5e\x17\xeb\xb3\x00\
+\x64\x0e\x03\x7a\x64\x76\x3a\x4e\x03\xbc\xed\x21\xa9\xc6\xce\x21\
+\x68\x00\xc0\xc3\xe2\x9f\x23\x92\x71\x57\xf7\x0f\xa7\x26\xcc\xdd\
+\x9e\x94\xad\x80\x23\x39\x0d\xb0\xbd\xc8\x8f\x1f\x18\xd2\x71\xc0\
+\x4b\x23\x16\x80\xfe\x4f\x4b\x35\x76\x05\xc2\x06\x00\x3c\x14\x80\
+\x0a\x22\x19\x77\xfd\x43\xe1\xd4\x84\x79\x3b\xa2\xad\x09\xa3\x16\
+\x4b\xd5\x84\xf6\x51\x08\xc0\x85\x22\x3f\x7e\xc0\xa4\x90\x04\x60\
+\x77\xb4\x8d\xfd\xe0\x48\xa9\xc6\x3e\x85\xb0\x01\x00\x0f\x05\xe0\
+\x14\x91\x8c\xeb\xf9\x54\x38\x35\x61\xc1\xce\x68\x6b\xc2\xf0\x79\
+\x52\x35\xe1\xc2\x28\x04\xa0\x85\xc8\x8f\xef\x3f\x36\x9c\xc6\x5e\
+\x12\xb1\x00\x3c\x39\x59\xaa\xb1\x1b\x13\x36\x00\xe0\xa1\x00\x34\
+\x16\xc9\xb8\x3e\x2f\x84\x53\x13\x16\xed\x8a\xb6\x26\x3c\x3b\x53\
+\xaa\x26\xb4\x88\x42\x00\x9a\xc6\xaa\xb1\x17\x47\xdc\xd8\xcf\xbf\
+\x24\xd5\xd8\xad\x08\x1b\x00\xf0\x50\x00\x5a\x89\x64\xdc\xbd\x13\
+\x42\xaa\x09\x89\x79\x28\x6c\x1a\x85\x00\x34\x90\x79\xdd\xf3\x64\
+\x38\x8d\xbd\x30\xe2\xd7\x3d\x63\x97\x4b\x35\xf6\xa5\x84\x0d\x00\
+\x78\x28\x00\x97\x8a\x64\xdc\x43\x33\x53\xf2\x59\x78\x84\x54\x4d\
+\x68\x10\x85\x00\x54\x15\xf9\xf1\xd7\xdd\x17\x4e\x63\xcf\x8f\x78\
+\xc2\xc7\x54\xb1\xb3\x9f\xbb\x12\x36\x00\xe0\xa1\x00\x74\x15\xc9\
+\xb8\x27\x16\x85\xb4\x34\x3c\xe2\x89\xe1\xbd\x07\x49\xd5\x84\xaa\
+\x51\x08\x80\xcc\x92\x8f\xb0\xd6\x7c\x46\xbd\xe4\x63\xde\x7b\x52\
+\x8d\x7d\x1b\x61\x03\x00\x1e\x0a\xc0\x6d\x22\x19\xf7\xdc\x9a\x74\
+\x6c\x0e\x77\x43\xbf\xc8\x97\x86\x67\xda\xe0\x5f\x64\xfc\xe3\xdb\
+\x5c\x1b\x4e\x63\xcf\x8e\x78\xd7\xa7\x65\x5b\xa5\x1a\x7b\x00\x61\
+\x03\x00\x1e\x0a\xc0\x00\x91\x8c\x1b\xf9\x5a\x48\x07\xc4\x45\xbc\
+\x3d\xfc\xe5\x3d\x24\xea\xc1\x17\x19\xb5\x59\x86\x0d\xfe\xd3\x8c\
+\x2f\xe0\xdc\x4b\xd2\xb1\xef\xf3\xfa\x03\x52\x02\x30\x9e\xb0\x01\
+\x00\x0f\x05\x60\xbc\x48\xc6\x4d\xfc\x20\x9c\x9a\xb0\x26\xe2\x13\
+\x62\xdb\x74\x96\xa8\x07\x3f\x8d\x52\x00\xb6\x67\x7c\x01\x0d\x9a\
+\x85\xd3\xd8\xd3\x22\x3e\xf9\xc9\x92\x5b\x52\xa2\xc1\x5f\x25\x6c\
+\x00\xc0\x43\x01\x78\x35\xe3\x7c\x2b\x5e\x22\x9c\x7a\x60\xd9\x70\
+\x28\xda\x7a\xd0\xb4\x95\x44\x3d\xd8\x1e\xa5\x00\xbc\x91\xf1\x05\
+\xd4\x3a\x3d\x9c\xc6\x9e\xb2\x31\x7a\x01\x38\xb5\x61\xe4\xc6\x07\
+\x00\xe0\x48\x00\x7e\x1a\x9b\x7a\x30\x75\x53\x52\xea\xc1\x1b\x51\
+\x0a\xc0\x92\x8c\x2f\xa0\x42\xb5\xf0\x8c\x2f\xea\x06\x6f\x7b\xb9\
+\x44\x83\x7f\x65\x28\x4e\xe0\x00\x80\x47\xc5\xbf\x78\x90\x4d\x99\
+\xe5\x5b\xb3\x0e\xe9\x38\x09\xd0\x52\xa5\x86\x44\x3d\x58\x12\xa5\
+\x00\xbc\x98\xf1\x05\x14\xcb\x0d\x4f\x00\xd6\x1f\x8c\xb6\xc1\x6f\
+\xba\x47\x6a\x1e\x40\x13\x42\x07\x00\x3c\x12\x80\x26\x22\xd9\xd6\
+\xf9\x8e\x74\x2c\x0b\xff\xe6\x93\x70\x09\x89\x5a\xf0\x62\x94\x02\
+\x30\x44\xa4\xd1\xc7\xbf\x17\x4e\xa3\xaf\x3d\x10\x6d\x83\x3f\x32\
+\x86\xbd\x00\x00\x80\x3d\x00\x8e\xc5\x6d\x43\xd2\xb1\x35\xfc\xda\
+\xbd\x52\xb5\x60\x48\x94\x02\x20\xb3\xec\xe3\xf9\x75\x21\x2d\xfb\
+\x88\x78\xd6\xe7\xc4\x35\x52\x8d\x3e\x98\xd0\x01\x00\x8f\x04\x60\
+\xb0\x48\xb6\x3d\xf6\x52\x38\xb5\x60\x65\xc4\x4b\x00\x17\x7c\xe0\
+\xc5\xb2\xf0\x4c\x1b\xfd\x66\x91\x8b\x78\x78\x56\x3a\x36\x7e\x58\
+\xb5\x4b\xab\x22\x45\x24\x1a\x7d\x3e\xa1\x03\x00\x1e\x09\xc0\xfc\
+\x8c\x73\xcd\x66\xe3\xd8\xb7\xc3\xa9\x05\xeb\x22\xfe\x1c\x3c\x7e\
+\x85\x94\x00\xdc\x1c\xa5\x00\x74\x14\xb9\x88\x3b\x86\xa6\xe3\xb5\
+\x8f\xa5\x72\x75\x89\x46\xdf\x42\xe8\x00\x80\x47\x02\xb0\x25\xf3\
+\x09\xe1\x55\xc3\xa9\x03\x93\x3d\x58\x11\x36\x68\xbc\x94\x00\x74\
+\x8c\x52\x00\xce\x10\xb9\x88\x2e\xf7\x84\x74\xfe\xb3\x07\x13\x3f\
+\xce\x3e\x5f\xa2\xd1\x3f\x27\x74\x00\xc0\x23\x01\xf8\x3c\xf3\x3d\
+\x61\x9a\x87\x53\x07\x66\x78\xb0\x27\xcc\x1d\x8f\x48\x09\xc0\x19\
+\x51\x0a\x40\x29\x91\x8b\x68\xdb\x35\x9c\x86\x7f\x69\x5b\xf4\x0d\
+\x7f\xe5\xcd\x52\x0d\x5f\x8d\xe0\x01\x00\x0f\x8a\x7f\x35\xea\x40\
+\x64\x75\xa0\x54\x64\x02\x10\x34\xfe\xa7\x19\x5f\x44\x93\xd6\xe9\
+\xd8\x0e\xd8\xd2\xef\x49\xa9\x86\x6f\x4b\xf8\x00\x80\x07\x02\xd0\
+\x56\x24\xd3\xba\x0f\x4c\xc7\xd1\xf0\x96\x96\x17\x4b\xd4\x80\x4f\
+\x33\x6e\x3b\x81\xc6\xdf\x91\xf1\x85\x9c\x54\x2f\x3d\xbb\x3f\x0d\
+\x9d\x23\x25\x00\x7d\x08\x1f\x00\xf0\x40\x00\xfa\x88\x64\xda\x3d\
+\xe3\xc3\xa9\x03\xcb\xf6\x44\x5f\x07\xea\xd4\x97\xa8\x01\x3b\x7c\
+\x10\x80\xd5\x99\xef\xff\x5c\x32\xbc\xcd\x80\xf2\x0e\x25\xe5\x58\
+\xe0\x31\x84\x0f\x00\x78\x20\x00\x63\x62\x75\x0c\xf0\xea\xfd\xd1\
+\x0b\x40\x89\x52\x12\x35\x60\xb5\x0f\x02\x30\x2e\x56\x47\x40\x46\
+\xbd\x19\x90\x15\x90\xe2\xb9\x12\x8d\xff\x3a\xe1\x03\x00\x1e\x08\
+\xc0\xeb\x22\x3b\xc2\x4e\xfa\x28\x1d\x87\x00\xc9\x1d\x0d\x3f\xce\
+\x07\x01\x18\xc0\x06\x10\x27\x48\xbd\x33\x24\x1a\xff\xcf\x86\x1c\
+\x02\x08\x00\x22\x2c\xfe\x39\x41\x16\x65\x78\x08\x50\xfd\xf4\x7c\
+\x06\x96\xdb\x10\x6e\x80\x0f\x02\x70\x8d\xc8\xc5\xf4\x79\x21\x9c\
+\x0e\xb0\x74\x77\x52\x0e\x05\xb2\xb4\x26\x84\x00\x20\x42\x01\x68\
+\x2d\x92\x65\x61\x1d\x02\x34\xc7\x83\x15\x00\x4f\x4e\x96\xca\xff\
+\x6b\x7c\x10\x80\xb3\x45\x2e\xe6\xba\x01\xe9\x99\x01\x7a\xd3\xbd\
+\x52\x1d\xe0\x49\x42\x08\x00\x22\x14\x80\x27\x45\xb2\xec\xf2\x90\
+\x0e\x01\x5a\xbc\x2b\xfa\xfc\xef\xf3\xb8\x54\xfe\x9f\xed\x83\x00\
+\x54\x10\xb9\x98\x0b\xae\x0e\xa7\x03\xcc\xdd\x1e\x7d\x07\x78\x76\
+\xa6\x54\x07\x78\x97\x10\x02\x80\x08\x05\xe0\x5d\x91\x2c\xeb\x3f\
+\x36\x9c\xfc\x5f\xe3\xc1\x04\xc0\x4e\xd7\x4b\xe5\x7f\x85\xc8\x05\
+\x20\xe8\x04\x7f\xca\xf8\x62\xea\x9e\x19\xd2\x2e\x50\x1e\xec\x05\
+\xb0\x6a\xa7\x56\x39\x39\x12\x1d\xe0\xef\x86\x5c\x82\x08\x00\x22\
+\x28\xfe\xb9\x41\x06\x65\x96\x63\xd9\x26\x0b\xc7\xbc\xe5\x3e\xfb\
+\xa7\x78\xb0\x05\xb0\xe5\x8c\x73\x24\xb2\xff\x4f\x22\x6d\x28\xd4\
+\x11\xf6\x64\x7c\x41\xb9\xa5\xd2\xb3\x0f\xb4\x5c\x27\xb0\x5c\x42\
+\x18\x01\x40\x04\x02\x70\x89\x48\x86\x85\xf5\xf0\xe7\xc3\xf7\x7f\
+\x4b\xc9\xd2\x12\xb9\xbf\xc7\x27\x01\x58\x14\xab\x75\xa0\x51\x2f\
+\x05\xb4\xdc\xd8\x5f\x4a\x00\x9e\x27\x8c\x00\x20\x02\x01\x18\x2a\
+\x92\x61\x1d\x7b\xa5\xe7\x30\x38\xb9\x7d\x60\x16\xf9\x24\x00\x83\
+\x44\x2e\xaa\xdf\xe8\x70\x3a\xc2\xf2\xbd\xd1\x77\x84\xe1\xf3\xa4\
+\x3a\xc2\x46\xc2\x08\x00\x22\x10\x80\x8d\x22\x19\x36\x60\x52\x48\
+\xdf\xff\x3d\x78\xf0\x1b\x32\x43\x2a\xf7\x07\xf9\x24\x00\x57\x88\
+\x5c\xd4\x35\xfd\xc3\xe9\x08\x8b\x3c\x98\x09\xba\xd6\x48\x48\xb1\
+\xe2\x12\x1d\xe1\x4b\x43\x69\x02\x09\x00\x42\x2c\xfe\xa5\x83\xec\
+\xc9\x2c\xbf\x8a\x16\xd3\x6a\xfc\x7b\x21\xac\xff\xf7\xe4\xd3\xef\
+\xed\x0f\x4b\x09\xc0\x15\x3e\x09\x40\x6d\x91\x8b\x6a\xd9\x31\x3d\
+\xa7\x41\x59\x9a\xb6\x92\xea\x0c\x9d\x09\x25\x00\x08\x51\x00\x3a\
+\x8b\x64\x57\xfd\x66\xe9\xca\xfc\x4b\xae\x96\xca\xfc\xda\xde\x08\
+\x40\xd0\x21\xbe\xc8\x7c\x37\xa8\xd3\xc3\xe9\x0c\xd3\x37\xfb\xd1\
+\x19\x7a\xde\x2f\xd5\x19\x46\x13\x4a\x00\x10\xa2\x00\x8c\x16\xc9\
+\xae\x2b\xfb\xa4\xe7\xfb\xbf\xe5\xd4\x86\x12\x79\xff\x85\x58\x3b\
+\x0a\x76\x88\x4d\x22\xaf\x83\x26\x7e\x18\xc2\x4a\x00\x7b\x28\x90\
+\x07\x9d\x61\xcc\x52\x29\x01\xd8\x49\x28\x01\x40\x88\x02\xb0\x53\
+\x24\xbb\x1e\x9c\x9e\x9e\x89\xdf\x1b\x0e\x48\x7d\xf6\xdd\xe4\xa3\
+\x00\xcc\x10\xe9\x10\x4f\x2d\x49\xcf\x84\x90\xf5\xe6\x37\xe4\x96\
+\x94\xe8\x10\x5f\x19\x2a\x12\x4c\x00\x10\x42\xf1\xaf\x18\x64\x4e\
+\x86\xa7\xc0\x96\x30\x0f\x7c\x1f\xa4\x63\xff\x7f\xcb\xf4\x57\xa5\
+\x1e\xf8\x66\xf8\x28\x00\xf7\x89\x5c\xdc\x9d\x43\xd3\x73\x26\xb4\
+\xa5\x79\x5b\xa9\x4e\xd1\x8d\x70\x02\x80\x10\x04\xa0\x9b\x48\x66\
+\x35\x6a\x95\x9e\xdd\x5f\x2d\x8f\x4f\x90\xca\xfa\xfb\x7c\x14\x80\
+\x8b\x45\x2e\xae\x7d\x8f\xf4\x9c\x09\x60\xb9\xe3\x11\xa9\x4e\xb1\
+\x9a\x70\x02\x80\x10\x04\x60\xb5\x48\x66\x75\xb9\x27\xa4\x03\xe0\
+\x3c\x79\xd8\xbb\xee\x0e\xa9\xac\xbf\xd8\x47\x01\xa8\x2c\x72\x71\
+\xa7\x86\xb4\x2b\xd4\xac\xad\x7e\x74\x8a\x89\xab\xa5\x3a\xc5\x3f\
+\x25\xf6\x86\x06\x00\x38\x4e\xce\x57\x08\xb2\x26\xf3\xcc\x7a\xf4\
+\xa5\xf4\x7c\xff\xb7\x34\x3a\x57\x2a\xeb\x2b\x7b\x27\x00\x41\xe7\
+\xf8\xb5\xc8\x44\xc0\x09\xef\xa7\x67\x4b\xe0\xbc\x83\x5a\x95\x2e\
+\x2b\xd5\x31\xfa\x13\x52\x00\xe0\x50\x00\xfa\x8b\x64\x55\xc9\x32\
+\x5a\x4d\xfa\x30\x3d\x2b\xbe\xd6\xed\x97\x9a\x00\xf8\x6b\xd1\xf6\
+\x14\xee\x1c\xaf\x88\x74\x8e\x87\x67\xa6\xe7\x64\x28\xcb\xf9\x1d\
+\xa4\x04\x60\x13\x21\x05\x00\x0e\x05\x60\x93\x48\x56\x35\x6d\x9b\
+\x9e\x4d\xdf\x2c\xe3\x96\x4b\x65\xfc\x2b\x3e\x0b\x80\xcc\xd9\xd0\
+\x5d\xef\x4f\xd7\xda\xd0\x7e\x4f\x4a\x75\x0e\xcb\xe9\x04\x15\x00\
+\x38\x28\xfe\xa7\x8b\xe5\x54\xf7\x81\xe1\x64\xfc\xba\x83\x7e\x64\
+\xfc\x5d\x8f\x4b\xe5\xfb\x93\x3e\x0b\x40\x7b\x91\x8b\x3c\xb7\x7d\
+\xba\x66\x87\x2e\xf8\x40\xab\x22\x59\x52\x1d\xe4\x39\xc2\x0a\x00\
+\x1c\x08\xc0\x73\x22\x19\x65\xb3\xee\xf9\x75\xe9\x99\xe7\x65\x69\
+\xd3\x59\x2a\xdf\xdb\xfb\x2c\x00\x65\x44\xd6\x87\x56\xac\x9e\xae\
+\x1d\x01\x2d\xe7\xb4\x96\xea\x20\x3f\x33\x14\x21\xb0\x00\x40\x30\
+\xdb\x8b\x04\xd9\x92\x79\x46\x35\x6c\x91\xae\xd9\xff\x96\xaa\x27\
+\x49\xed\xf7\x52\xc6\x5b\x01\x08\x3a\xca\x5e\x91\x4e\x32\x6c\x7d\
+\x38\x9d\x64\xc3\x21\x3f\x3a\xc8\x43\x23\x25\x3f\x03\xb4\x25\xb4\
+\x00\x40\x30\xd7\xdb\x8a\xe5\xd3\xad\x4f\x85\x33\xc9\xdb\x97\x6c\
+\x5f\xf0\xa1\x54\xae\xef\x15\x6f\x57\x07\x1d\x65\xba\xc8\xc5\xf6\
+\x1e\x16\x8e\x00\xac\xd8\xeb\x47\x27\x59\xb5\x4b\x6a\x57\x40\xcb\
+\x6c\x42\x0b\x00\x04\x73\x7d\xb6\x48\x36\xd9\xdd\xff\xc6\xbe\x9d\
+\x9e\xc3\x7f\x2c\x83\x27\x49\xe5\xfa\xf4\x38\x08\x40\x2f\x36\x04\
+\x2a\xec\x49\x51\xd7\x48\x75\x14\x7b\x30\x53\x09\x82\x0b\x00\x04\
+\x32\xbd\x84\xc8\x61\x6f\xdf\x9c\xf8\xda\x29\x5d\x0f\x76\xb2\x1b\
+\x00\xf5\x8a\x83\x00\x34\x10\xb9\xd8\x3a\x8d\xc3\xe9\x28\xb3\x3d\
+\x9a\x28\x32\x6c\xae\xe4\x67\x80\x1b\x09\x2f\x00\x10\xc8\xf4\x1b\
+\xc5\x72\xe9\xde\x89\xe1\xec\xfd\x9f\xf7\xb1\x3f\xb9\xde\xe0\x2c\
+\xa9\x4c\x6f\xe0\xbd\x00\x04\x1d\xe6\xb3\x8c\x2f\x36\x2b\x4b\xab\
+\x91\xaf\x85\xf3\xad\xc8\x97\xce\x62\x37\x05\xaa\x5c\x5d\xaa\xb3\
+\xbc\x4a\x78\x01\x80\x40\x9e\xbf\x2a\x92\x49\xe5\xab\x86\xb3\xf9\
+\xcf\xfc\x1d\xfe\x14\xff\x65\xe6\x01\x33\x2b\x5b\x22\xcf\x3f\x73\
+\x31\xb9\xdb\x55\x87\x79\x25\x56\x07\x03\xad\xda\xe7\x4f\x87\xe9\
+\xd6\x5b\x4a\x00\xfe\x6d\xa8\x4e\x80\x01\x40\x06\x59\x5e\x3d\xc8\
+\x92\xcc\x33\xe9\xd2\x9b\xc3\xc9\xf3\xd5\xfb\xfd\xc9\x73\xb9\x03\
+\x80\x5e\x71\xd2\xbe\x8e\x3a\x8d\xcc\x86\x40\xad\xaf\x4a\xdf\x3c\
+\x80\xa9\x79\x92\x9f\x01\x9e\x20\xc4\x00\x20\x83\x2c\x7f\x42\x2c\
+\x8f\x06\x2f\x4c\xd7\xd2\x6e\x4b\xc7\x6e\x5e\x6e\x00\xe4\x5a\x00\
+\x2e\x11\xb9\xe8\x0a\xd5\xc2\x11\x80\x99\x5b\xfc\xea\x34\xf5\x1a\
+\x49\x75\x9a\x4f\x0d\x25\x09\x32\x00\x28\x44\x8e\x97\x0c\x32\x24\
+\xf3\x2c\x3a\xb9\x7e\x38\x59\xbe\x78\x97\x5f\x59\x5e\xa5\x86\x54\
+\x96\x5f\x12\x27\x01\x28\x6e\xf8\xab\xc8\x85\x3f\xb9\x38\x5d\xfb\
+\x01\xc8\x6e\x1b\x69\x19\x48\x98\x01\x40\x21\x72\x7c\xa0\x58\x0e\
+\x85\xb5\xbd\xbb\x2f\x5b\xff\x5a\xa6\xbf\x22\x95\xe1\xb6\x96\x16\
+\x8f\x8d\x00\x88\xce\x03\x08\xab\xe3\x2c\xf7\x68\xd9\xc8\x22\xf3\
+\x7b\xb2\xb3\xa5\x3a\xcf\xaf\x5c\x75\x1e\x00\x48\x6c\xf1\x2f\x1e\
+\x64\x47\xe6\x19\x64\x27\xc1\x0d\xcf\x4b\xd7\x8a\x2e\xd9\x07\xb9\
+\x57\x9c\xb5\xb3\xc3\x0e\x34\x40\xe4\xe2\x1b\x9f\x1f\x8e\x00\xcc\
+\xdb\xe1\x57\xe7\x69\x71\x91\xe4\x5b\x80\x7e\x84\x1a\x00\x9c\x40\
+\x7e\xf7\x13\xcb\x9f\xc6\xad\xc3\xc9\xf0\x95\xfb\xfc\xca\xf0\xe6\
+\x6d\xa5\xf2\x7b\x40\x1c\x05\x40\x66\x3f\x80\x62\xb9\x5a\x8d\x7f\
+\xcf\x7d\xe7\x99\xb6\xc9\xaf\xce\xf3\xd8\x38\x49\x01\xb0\x7b\x78\
+\xe7\x10\x6c\x00\x50\x80\xec\xce\x11\xdb\xf7\xdf\x72\xfb\xb3\xe9\
+\x9b\xc7\xb5\x76\xaf\x56\xc5\x73\xbd\x5d\xff\xef\x5c\x00\x82\x8e\
+\xf4\xf3\xd8\x6c\x1e\x61\x59\x7b\xc0\x9f\x0e\xb4\x66\x8f\x56\xa5\
+\xca\x48\x4a\xc0\xad\x84\x1b\x00\x14\x20\xb7\x6f\x15\xcb\x9d\x12\
+\xa5\xb5\x1a\xf7\x6e\xba\x76\xfe\x93\xdd\xd4\xed\xe7\x4e\xdb\xda\
+\x71\x47\x9a\x21\xb3\x2d\xf0\x4d\xe1\x08\xc0\x92\xdd\x7e\x75\xa2\
+\x2e\xbd\x24\x05\xe0\x63\x43\x16\x01\x07\x00\xc7\xc9\xec\xac\x20\
+\x2b\x64\x72\xa7\xdd\x0d\xee\x73\x7b\x86\x67\x4b\xff\x2c\x5d\xef\
+\x94\xca\xed\x19\x71\x16\x80\x6b\x45\x6e\x42\x95\x5a\xe1\x08\xc0\
+\x9c\x6d\x7e\x75\xa2\x05\x1f\x68\x55\xb4\x98\xa4\x04\x74\x27\xe4\
+\x00\xe0\x38\x99\xdd\x5d\x2c\x6f\x72\x8a\x6a\xf5\xfc\xba\x10\x26\
+\x70\xef\xf1\x4f\x00\x4e\xaa\x2d\x95\xd9\xd7\xc6\x59\x00\xca\x19\
+\xbe\x14\xb9\x11\x83\xe6\x85\xb4\x2d\xf0\x21\xbf\x3a\xd2\xe5\x3d\
+\x24\x05\x60\x0f\x21\x07\x00\xc7\xc9\xec\x3d\x62\x79\xd3\xe6\xda\
+\xf4\x6d\xfc\x63\x79\x71\xad\x54\x5e\xdb\xda\x59\x2e\xb6\x02\x10\
+\x74\xa8\x8f\x44\x6e\x46\xc7\x5e\xe9\x5b\x0e\x68\x99\xf3\xb6\xe4\
+\x92\x40\xcb\x95\x04\x1d\x00\x1c\x25\xab\xaf\x14\xcb\x19\xbb\xf4\
+\xef\xd9\x95\xee\xf3\x7a\xa9\x87\x4f\xff\x37\xf4\x93\xca\xea\x8f\
+\x9c\xb7\x79\x08\x9d\x4a\x66\x5b\xe0\xaa\x27\x87\x23\x00\x73\xb7\
+\xfb\xd7\xa1\x3a\x5c\x2b\x29\x00\x9b\x09\x3b\x00\x38\x4a\x56\x6f\
+\x16\xcb\x99\xf3\x2e\x0f\x67\xe5\x56\xde\xc7\xfe\xe5\x75\xcd\x3a\
+\x5e\x6f\xff\x1b\xb6\x00\x34\x17\xeb\x54\x83\xe6\xbb\xef\x54\x53\
+\x36\xfa\xd7\xa9\x66\xbc\xa6\x55\x91\x2c\x49\x09\x68\x4f\xe0\x01\
+\xc0\x11\x39\xdd\x5e\x2c\x5f\x6c\x56\x3d\xb5\x34\x7d\x93\xb6\x2d\
+\x93\xd7\x49\xe6\x74\xf3\x24\x08\x40\x11\xc3\x2f\x63\xf5\x19\xc0\
+\xb7\x25\x25\x96\x36\x9d\x45\xdf\x02\xb8\x38\x5a\x12\x00\x62\x59\
+\xfc\x8b\x88\x3e\xfd\x9f\xdb\xde\x7d\x46\x4f\xdd\xe4\xdf\x7c\x2d\
+\xcb\x8d\xfd\xa5\x32\xfa\x97\x61\x64\x74\x58\x1d\x6c\x92\xcc\x67\
+\x80\x53\x42\xda\x15\x70\xbb\x9f\x66\x59\xa4\x88\xa4\x04\xdc\x49\
+\xf8\x01\x80\xcd\x02\xb9\xa7\xff\x22\xe1\xbc\xa9\xf5\xed\xd0\x9f\
+\xc3\xd4\xaa\x2b\x95\xcf\x93\x42\x69\xfb\x90\x3a\x58\xdb\x58\x7d\
+\x06\x98\xba\xd1\xcf\xce\x75\xde\x25\x92\x02\xf0\x7b\x43\x25\x02\
+\x10\x20\xd5\xc5\xbf\x52\x90\x05\x32\xb9\x72\xe6\x85\x21\x7d\xa6\
+\x3d\x94\xf4\xd7\xff\x6d\x93\x24\x00\x76\x73\x89\x5f\xc7\xea\x33\
+\xc0\xaa\x7d\xfe\x75\xb0\x71\xcb\x25\x3b\x98\x65\x26\x21\x08\x90\
+\x6a\x01\x98\x29\x9a\x29\x0f\xcf\x74\x9f\xcd\x8b\x3c\x7d\xfa\x97\
+\x7b\xfd\xff\xeb\xb0\x36\x6d\x0b\xb3\xa3\x4d\x8d\xd5\x67\x80\xf9\
+\x3b\xfc\xec\x64\xe7\xb4\x96\x14\x80\xaf\x0d\xad\x08\x42\x80\x54\
+\x16\xff\x56\x41\x06\xc8\xe4\x49\xc3\x16\xe1\xbc\x9d\xdd\x70\x28\
+\xe9\xaf\xff\xa7\x86\xd6\x07\x42\xec\x6c\x97\x88\x75\xb4\x47\x5f\
+\x0a\x67\x92\x89\x8f\x9d\x6c\xc4\x42\xe9\xb7\x00\xbb\x0c\xd9\x04\
+\x22\x40\xaa\x8a\x7f\x76\x30\xf6\xe5\xb2\xe4\xfe\xc9\xe9\x5c\xf7\
+\x6f\x99\xb8\x5a\x32\x93\x2f\x49\xa2\x00\xd8\x0e\xf7\xa9\xc8\x0d\
+\x6a\x7b\x5d\x7a\x3f\x03\x58\x1a\x35\x93\x96\x80\xfb\x08\x45\x80\
+\x54\x09\xc0\x7d\xa2\x19\x52\xef\x2c\xf7\x79\x3c\x6b\x8b\x9f\x79\
+\x6c\xb9\xf2\x26\xa9\x7b\xf9\x69\x98\x0f\x64\xf1\xfc\xde\x54\xb2\
+\x4c\x38\x27\x4c\xf9\xb8\x29\x90\xe5\xb9\x59\xd2\x02\xf0\x47\x43\
+\x35\x82\x11\x20\x15\xc5\xbf\x5a\x30\xe6\xe5\x32\xe4\xee\xb1\xee\
+\xf3\x78\xcd\x01\x3f\xf3\xd8\x9e\xdc\x5a\xba\x6c\x2c\xe7\x65\x85\
+\xdd\xf1\x2e\x13\xeb\x70\xb7\x0d\x49\xef\x6c\x53\x4b\xc3\xa6\xd2\
+\x12\xb0\x90\x70\x04\x48\x85\x00\x2c\x14\xcd\x8e\x3a\x8d\xdd\x67\
+\xf1\x82\x1d\xfe\x3e\xfd\x3f\x32\x46\x32\x87\x2f\x4b\xb2\x00\x14\
+\x35\xfc\x41\xe4\x46\x35\x68\x1e\xce\x67\x80\x65\x9e\x7e\x73\x9a\
+\xb0\x4a\x7a\x77\x40\xcb\xc5\x04\x24\x40\xa2\x8b\xff\xc5\xa2\x99\
+\x61\x33\xe8\xd1\x39\xee\xe7\x63\xf9\x3a\xf1\xcf\x72\xf6\xf9\x52\
+\xf7\xd3\xd6\xc6\xa2\x89\x15\x80\xa0\x03\xce\x15\xdb\x70\x22\x8c\
+\xc3\x26\x66\x6d\xf5\xb7\xe3\x5d\xd1\x43\x5a\x00\x0e\x86\xdd\x01\
+\x01\x20\xd4\x07\xb0\x83\xa2\x99\x11\xc6\x89\x7f\xcb\xf7\xfa\x9b\
+\xc1\xf6\xb0\x36\xb9\x0d\xda\xe6\x86\xde\x27\x22\xe8\x84\x1d\xc4\
+\x3a\x5f\xe7\x3b\xc2\x79\x0b\xb0\xee\xa0\x9f\x9d\x6f\xf9\x36\xad\
+\xca\x57\x92\x96\x80\x47\x09\x4b\x80\x44\x0a\xc0\xa3\xa2\x59\x51\
+\xa6\x82\x56\xa3\x5e\x77\x9b\xbd\xb3\x3d\x7e\x00\xb3\xdc\x74\x8f\
+\x64\xf6\x76\x48\x83\x00\xd8\x7d\xa7\x7f\x26\x72\xc3\x2a\x56\xd7\
+\x6a\xd2\x87\xe9\xdd\x78\xc2\xf2\xe0\x48\x69\x01\xf8\x8b\xa1\x1e\
+\x81\x09\x90\xa8\xe2\x5f\x2f\x18\xdb\x72\x59\xd1\xf3\x29\xb7\xb9\
+\x3b\xd9\xb0\xf6\x80\xbf\xd9\x9b\x67\x1e\x0c\xab\x9e\x24\x75\x3f\
+\x7f\x16\xc5\xf9\x2c\x51\x75\xc6\xa7\xc5\x3a\xe1\x3d\xe3\xc3\x39\
+\x76\xd2\x67\x0b\x6d\xd2\x42\x5a\x02\x76\x1a\x8a\x13\x9c\x00\x89\
+\x28\xfe\xc5\x83\x31\x2d\x97\x11\xa7\x9d\xed\x3e\x77\x17\xee\xf4\
+\x3b\x77\x87\xce\x91\xcc\xdc\xa7\x23\xe9\x1b\x11\x75\xc8\x93\x0d\
+\x5f\xc5\xe6\xe4\x29\x9f\xf7\x04\xb0\x4c\xcd\xd3\x2a\x27\x47\x5a\
+\x02\x26\x13\x9e\x00\x89\x10\x80\xc9\xa2\xd9\x90\x6d\xb2\x66\xf0\
+\x42\xf7\x0f\x5d\x79\x87\xfc\x16\x00\xb9\x13\x5a\x6d\x2d\x3c\x39\
+\x35\x02\x10\x74\xca\xd7\x44\x6e\x5e\x4e\x51\xad\x5e\x78\x39\xbd\
+\x7b\x02\x1c\xa6\xeb\x9d\xd2\x02\x60\xe9\x46\x80\x02\xc4\xba\xf8\
+\x77\x13\xcf\x85\xf6\x37\xa5\xf3\x48\xf6\x23\x59\xbc\x51\xab\xa2\
+\xc5\xa4\xee\xe9\x6b\x91\xf5\x8f\x44\x74\xcc\xcb\xef\x74\xdf\x21\
+\x27\x6f\xf4\x7b\x29\xca\xaa\x5d\x5a\x55\xae\x2e\x2d\x00\x5f\x30\
+\x1f\x00\x20\xd6\xdf\xfd\xbf\x10\xcd\x84\x0a\x55\xb5\x1a\xfb\xb6\
+\xdb\xac\x9d\xb3\xcd\xef\xe2\x6f\xb9\xf9\xbe\x44\x3c\x68\x45\xd9\
+\x39\x8b\x89\x6d\x0d\x5c\xa6\xa2\x56\xe3\xdf\x73\x2f\x01\x4b\x76\
+\xfb\xdd\x29\x07\x4f\x72\xf1\x16\x80\xf9\x00\x00\x7c\xf7\xcf\xa7\
+\xf7\x30\xf7\x9b\xaf\xf9\xba\xea\xea\x30\x6b\xf7\x4a\xae\xbe\xb2\
+\x35\xb0\x58\xea\x04\x20\xe8\xa4\xe3\xc4\x3a\xe6\x2d\x83\xdd\x0b\
+\xc0\xf4\xcd\xfe\x9b\x69\xf3\xb6\x2e\x24\x60\x0a\xa1\x0a\x10\x2b\
+\x01\x98\x22\x9e\x03\x8d\x5a\xf1\xea\xdf\xf2\xc0\x70\xc9\xfb\x3a\
+\x2e\xd2\x7e\x12\x71\x27\x6d\x2c\x76\x23\x6b\xd6\x0b\x67\x32\xa0\
+\xef\x1d\x74\xd6\x1b\x5a\x15\x2b\xee\x42\x02\xba\x13\xac\x00\xb1\
+\x28\xfe\xdd\xc5\xc7\xbf\xfd\xde\xfd\xcc\xf2\x74\x1e\xc1\xfe\x5d\
+\xea\x34\x90\xbc\xb7\x8d\x53\x2b\x00\x41\x67\xdd\x2c\x76\x33\xef\
+\x9b\xe8\x5e\x00\x7c\xdf\x98\x42\xfe\xfb\x14\xf3\x01\x00\xd2\xfc\
+\xdd\x3f\x8c\x79\x56\x33\xb7\x68\x95\x17\x83\xe2\x3f\x6c\xae\xe4\
+\x7d\xdd\x1c\x79\x7f\xf1\xa0\xc3\xf6\x16\xbb\xa1\x8d\x5b\x87\xf3\
+\x16\xc0\xe7\xcd\x29\x0e\x7f\xa3\xaa\x71\x8a\x0b\x09\xd8\xc5\x7c\
+\x00\x00\xaf\xbf\xfb\xef\x12\x1f\xf7\x55\x6a\xb9\x9d\x63\xf5\xcd\
+\x77\xff\x03\xf1\x78\xfa\x6f\x71\x91\xe4\xbd\xed\x8d\x00\x28\x55\
+\xca\xf0\xb9\xd8\xf9\x00\x4f\x2d\x75\x2f\x00\x71\x78\x55\x35\x62\
+\xa1\x56\x59\xd9\xcc\x07\x00\xe0\xbb\x7f\xe1\xc9\xca\xd2\xea\xfe\
+\xc9\xe9\xdd\xeb\xff\x48\x66\xbc\x26\xb9\xef\xbf\xad\x79\xa5\x52\
+\x2f\x00\x41\xc7\x1d\x19\xab\xc3\x29\xa6\x78\xbe\x24\xf0\x30\xb7\
+\x0c\x70\x21\x00\x96\xeb\x09\x5c\x00\xaf\x8a\xff\xf5\x4e\xc6\xfa\
+\x95\x7d\x78\x98\x3a\xcc\xe5\xa2\x87\xaf\x8d\xf4\xa2\xdf\x78\xd2\
+\x79\x6b\x19\xbe\x14\xb9\xb1\xc5\x72\xb5\x1a\xf9\x2a\x4b\x02\x0f\
+\xef\x55\x7d\x4e\x6b\x17\x02\xf0\x37\x43\x6b\x82\x17\xc0\x8b\xfc\
+\x6c\x1d\x8c\x49\xd9\x71\xde\xb0\x85\xdb\xb3\x56\x66\x6c\xf1\x7f\
+\xb7\xbf\xc3\x2c\x35\xbf\xb5\x78\xae\xd4\xbd\xb5\xb5\xae\x16\x02\
+\xf0\xed\x4e\xbc\x24\x36\xd6\x1a\x97\x25\x81\x96\x45\xe6\xb7\x56\
+\xac\xe2\x42\x02\xec\xd9\xd5\x8d\x08\x60\x80\x48\x73\xb3\x51\x30\
+\x16\x65\xc7\x77\xd9\x4a\x5a\x0d\xcf\x73\xfb\x16\x75\xed\x81\xf8\
+\x3c\xfd\xcb\xbe\x4d\x5d\xe2\x4d\xff\xf1\xa8\x23\xb7\x10\xbb\xc1\
+\x25\xcb\x68\x35\xfa\x0d\x96\x04\x1e\xe6\x85\xf9\x5a\x15\xc9\x72\
+\x21\x01\x9f\x44\xb5\x87\x35\x00\xc5\xff\x9b\x33\x55\x3e\x11\x1f\
+\xd7\x36\x2b\x06\xbc\xc8\x77\xff\xc3\xac\xd8\xae\x55\xe9\xb2\x92\
+\xf7\xb8\x05\x02\x70\xf4\x0e\xfd\x51\xac\xb6\x07\xb6\x4b\x57\xe2\
+\xd2\x89\xdd\x2c\x0d\xb4\x1c\x32\x54\x22\x90\x01\x42\xcd\xca\x4a\
+\xc1\xd8\xd3\xb1\x5b\xf2\x37\x2f\x46\xdf\xfd\xe5\xb3\xf3\x23\xaf\
+\xfa\x91\x67\x9d\xfa\x3a\xb1\x1b\x5d\xa2\xb4\x56\xa3\x5e\x77\x2f\
+\x01\x2b\xf7\xc5\xa3\x13\xdb\xf9\x00\x4d\x5b\xb9\x92\x00\xbb\x97\
+\x43\x49\x82\x19\x20\x94\x9c\x2c\x29\xba\x7f\xca\x91\x34\x68\xc6\
+\x77\xff\x23\x59\xbe\x4d\xab\x52\x65\x24\xef\xf1\x75\x08\xc0\xb1\
+\x3b\x76\x96\xe1\xff\x8a\xdd\xec\xce\xb7\xbb\x17\x80\x59\x31\x7a\
+\x0b\x60\xe7\x03\x54\xa8\xec\x4a\x02\x5e\x35\xe4\x10\xd0\x00\x4e\
+\x33\x32\x27\x18\x6b\xf2\x63\xb8\x6c\x45\xad\x86\x6f\xe0\xbb\xff\
+\x91\xf4\xb8\x5b\xf2\x1e\xdb\xda\x96\x85\x00\x1c\xbf\x83\xdf\x2f\
+\x76\xc3\x73\x4b\x69\x35\xf2\x35\xf7\x12\xb0\x6a\x5f\x7c\x3a\xb4\
+\xdd\xc9\xca\xcd\x7c\x00\xcb\x02\x43\x11\x82\x1a\xc0\x49\x36\x16\
+\x09\xc6\x98\x76\xf2\xdd\xdf\xe5\x4e\xaa\xf6\x34\xd5\x55\xfb\xe3\
+\x55\xfc\x97\x6d\xd5\xaa\x64\x69\xc9\xfb\x7c\xbf\x77\x7d\xca\xc3\
+\x4e\x5e\xc6\xf0\x47\xb1\x9b\xde\xb1\x57\x08\x6f\x01\xb6\xc6\xab\
+\x63\xdf\x74\x8f\x2b\x01\xb0\x8c\x26\xac\x01\x9c\x64\xe3\x68\x67\
+\xe3\xb6\xf3\x1d\x0e\x8b\x7f\x8c\x26\x4c\x1f\xc9\x8d\xfd\x25\xef\
+\xb1\xad\x69\x65\x10\x80\xb0\x3b\x7a\xf1\x92\xe1\xec\x0b\x10\x27\
+\xbb\xb5\xf3\x01\xce\x3a\xcf\xa5\x04\x3c\x4c\x60\x03\x88\x66\xe2\
+\xc3\xce\xc6\xeb\xe9\xe7\xba\xfd\xee\xbf\x6c\x4f\xfc\x8a\xbf\x5d\
+\xf7\x5f\xa2\x54\xe2\x1f\x8c\x7c\xed\xec\xd5\x45\x37\xb6\xb8\xac\
+\x27\x87\x04\x7d\x97\x85\x1f\x49\x9e\x69\xfd\x5d\xbe\x36\xf4\x24\
+\xb8\x01\x44\xf2\xb0\x67\x30\xa6\xe4\xc7\x6a\x99\x8a\x5a\x0d\x73\
+\xf8\xdd\x7f\xf1\xae\xf8\x15\x7f\x4b\xf7\xbb\xa4\x37\x4e\xab\x8e\
+\x00\x9c\x58\xa7\x1f\x27\xf7\x16\xa0\x84\x56\x2f\xbc\xe2\x5e\x02\
+\x56\xc7\xec\x1b\xd7\xf3\x2f\xb9\x9c\x0f\x60\x77\xbb\xea\x4a\x80\
+\x03\x64\x94\x83\x5d\xc5\x76\x49\x3d\xda\x77\xff\x7b\x27\xb0\xcd\
+\xef\x77\x59\xb2\x49\xab\xdc\x92\x92\xf7\x7a\x9c\xb7\xfd\xcb\xe3\
+\x8e\x5f\x4d\xf4\x2d\xc0\xc5\xdd\xdd\x0b\xc0\x9c\x6d\xf1\xeb\xec\
+\xfd\x9e\x74\xf9\x29\xe0\x2b\x43\x5f\x82\x1c\xa0\x50\x19\xd8\x37\
+\x18\x43\x6e\xc6\x67\xf7\x81\xee\xb2\x70\xee\xf6\x78\x16\x7f\xcb\
+\xd5\xb7\x4a\x3f\xfd\x57\x43\x00\x0a\x37\x00\xc6\x8a\x35\x44\x76\
+\x4e\x38\x27\x05\xc6\x6d\xa6\xab\xfc\x64\x97\xa3\xf1\x14\x81\x0e\
+\x70\x42\xd9\xf7\x94\xd3\x31\xe9\x72\x72\xb4\xfd\x1c\x9a\x17\xd3\
+\xe2\x6f\x4f\xfc\xcb\xc9\x91\xbc\xd7\x63\xbd\xee\x67\x9e\x0f\x82\
+\xaa\x86\xbf\x8a\x35\x46\x93\x0b\xdc\x0b\xc0\x8c\x2d\xf1\xec\xf8\
+\x9d\xae\x77\x2d\x01\x93\x7d\x5b\x03\x0b\xe0\x61\xe6\x65\x05\x63\
+\xc5\xdd\x58\xbc\xe0\x6a\xb7\xbb\xa3\xc6\x69\xa3\x9f\xef\xd2\xb2\
+\x9d\xe4\xbd\xb6\xb5\xab\x2a\x02\xe0\xd3\xd2\x97\x7b\x27\xba\x97\
+\x80\xa5\x31\x9c\xf5\xba\xe1\x80\x56\xe7\x77\x70\x2d\x01\xcb\x0c\
+\xc5\x08\x7a\x80\xa3\x66\x5d\xb1\x60\x8c\xb8\x1b\x83\x4d\xdb\x6a\
+\x35\xf1\x43\x77\x07\xa4\xad\x8f\x71\xf1\xb7\x7b\xa4\xa4\x6c\x49\
+\x74\x1c\x06\x45\x15\xc3\x5f\xc4\x1a\xa5\x66\x3d\xb7\x4b\x5e\x2c\
+\x53\x37\x99\x82\x1a\xc3\x81\xb0\xc6\x88\x4b\x93\x16\xae\x25\xe0\
+\x2d\x43\x69\x02\x1f\xe0\x5b\x39\x57\x3a\x18\x1b\xee\xc6\xde\x69\
+\x67\x6b\x35\xee\x5d\x77\x99\xb7\xee\x60\x7c\x8b\xbf\x5d\x1a\x5d\
+\xa7\x81\xe4\xfd\xb6\x35\xab\x0a\x02\x20\x33\x38\x46\x89\x0e\x84\
+\x1e\x8f\xb9\x7f\x0b\xb0\x60\x67\x3c\x07\x82\xdd\xfb\xba\x6e\x43\
+\xd7\x12\xb0\x3d\x0e\x83\x03\x20\xc4\x87\x9c\xed\x4e\xc7\x5c\xcd\
+\xd3\xdc\x9d\x8d\x62\xb7\xf8\x5d\x73\x20\xbe\xc5\xdf\x72\xdf\x50\
+\xe9\x7b\x3e\x2a\x16\x7d\x2f\x46\x03\xe4\x2f\xa2\x6b\x5f\xc7\xbc\
+\xe9\x56\x00\xec\xee\x57\x6b\x63\x3a\x28\xec\x1e\x01\xd5\x6a\xb9\
+\x96\x80\x1f\x19\xea\x50\x00\x20\xe5\xc5\xbf\x4e\x30\x16\xdc\x8d\
+\xb5\x4a\x35\xdc\xad\xf5\x9f\xb6\x29\xbe\x39\x77\x98\x95\x3b\xa4\
+\xf7\x44\xf9\x4b\x5c\x1e\x70\xe2\x34\x50\x46\x88\x0e\x8a\x30\x36\
+\x07\x8a\xe3\xb2\xc0\xc3\xcc\x7a\xc3\xe5\x46\x41\x87\xf9\x95\xe1\
+\x4c\x0a\x01\xa4\xb4\xf8\x9f\x19\x8c\x01\x77\x63\xac\x4c\x05\xad\
+\x9e\x5e\xe6\x68\xc2\xb3\xfd\xe6\x7f\x30\xde\xc5\x5f\x7e\xd3\x1f\
+\xcb\x88\xd8\xf4\xc1\x18\x0d\x16\x7b\xfe\xf5\xe7\x62\x8d\x54\xb4\
+\x98\x56\xcf\xae\xe2\xb8\xe0\xe3\x31\x71\xb5\xf4\x76\x98\x47\xc3\
+\xb6\xe9\x85\x14\x04\x48\x59\xf1\xbf\x50\x34\xcf\x8e\xb5\x0d\xfa\
+\xa3\x2f\xb9\x3b\x05\x75\xc3\xa1\xf8\x17\xff\x97\xde\xd1\xaa\x58\
+\x71\xe9\x3c\xab\x84\x00\xb8\x19\x34\x0f\x8a\x0e\x90\x73\xda\x85\
+\xb0\x2c\x70\x73\xbc\x07\x88\x9d\x19\x9b\x53\xd4\xb5\x04\xfc\xd3\
+\x70\x2f\x85\x01\x52\x52\xfc\xef\x0d\xfa\xbc\xbb\x31\x95\x5d\xd4\
+\xdd\xe9\x7e\xf6\xcd\x66\x5e\x02\x8a\xbf\xe5\xc2\x4e\xd2\xf7\xfe\
+\xc1\x58\xf5\xc5\x18\x2e\x93\xf9\xb1\x68\x83\xf5\x1b\xed\x5e\x02\
+\x96\xec\x8e\xf7\x20\x19\x34\xde\xe5\x96\xc1\x47\xb2\xda\x50\x9e\
+\x22\x01\x09\x2d\xfc\xe5\x83\x3e\xee\x76\x1c\xd9\xb1\x7a\xc7\x50\
+\x77\x3b\xfc\xe5\x7d\x9c\x8c\xe2\x3f\x64\x86\xf4\xbd\xff\x71\xdc\
+\x96\x39\xc7\x71\x10\x75\x11\x6d\xb4\x0a\xd5\xb4\x1a\xf3\x96\x5b\
+\x01\xb0\xb3\x64\xe3\xfe\xba\xec\xee\xa7\xc3\x10\x00\xcb\x4f\x0d\
+\x2d\x28\x18\x90\xb0\xe2\xdf\x22\xe8\xdb\xee\xc7\xd0\xf5\x0f\xb1\
+\xb2\xe9\xfb\x58\x65\xae\xa5\x4a\x0d\xe9\x7b\xdf\x25\x76\xfd\x32\
+\xa6\x83\xe9\x5d\xd1\x86\x6b\x77\xbd\xfb\xb7\x00\x71\x3d\x18\xe3\
+\x48\x1e\x18\xa6\x55\x76\x76\x18\x12\xf0\x2f\xc3\x40\x0a\x07\x24\
+\xa4\xf8\x0f\x0c\xfa\xb4\xdb\x71\x93\x65\xc6\xe6\xcd\x8f\x73\xaa\
+\x5f\x41\xb8\xe6\x56\xe9\xfb\xff\x6e\x2c\xfb\x66\x4c\x07\xd4\xd9\
+\xa2\x87\x64\xd8\x57\x66\x0f\xcf\x62\x59\x60\x41\x78\x7a\xaa\x56\
+\xc5\x72\xc3\x7a\x1b\xb0\xde\x50\x81\x22\x02\x31\xcd\xa9\x0a\x41\
+\x1f\x76\x3f\x56\x8a\x16\xd7\xaa\xef\x48\x37\xb9\xb5\x6c\x4f\xb2\
+\x8a\xff\xf8\x15\xd2\x9f\x34\x6d\x2d\x3a\x1b\x01\x08\x77\x70\xcd\
+\x16\xdf\x28\x63\xe2\x07\x6e\x25\xc0\x1e\x92\x91\x84\x01\x34\x6a\
+\xb1\x56\xa5\xcb\x86\x25\x01\xbf\x30\x9c\x4f\x41\x81\x98\xe5\xd3\
+\xf9\x41\xdf\x75\x3f\x46\x4a\x96\xd1\x6a\xe0\x34\x07\xc5\x7f\xa3\
+\x56\x2b\xf6\x26\xab\xf8\xaf\x3f\xe0\x62\xa3\xb3\xd9\xb1\xed\xa7\
+\x31\x1e\x60\xd5\x0d\x7f\x16\x6d\xc8\xab\xfb\xbb\xff\x14\x90\x94\
+\x01\x35\x65\x83\x56\x95\xaa\x85\x25\x01\xf6\x3c\xf4\x47\x0c\x45\
+\x28\x2e\xe0\x79\x2e\x15\x09\xfa\xea\x97\xa1\x8c\x8d\xf2\x55\xb4\
+\x1a\xbc\xc0\xcd\xbc\xa5\xd5\xfb\x93\x55\xfc\x2d\xb7\x3d\x24\xdd\
+\x06\xb6\x06\x55\x47\x00\xa2\x19\x6c\x83\xc5\x5f\xa3\x3d\xb3\xdc\
+\xad\x00\xd8\x03\x33\x92\x32\x8b\xd6\xae\xa1\xad\x55\x37\x2c\x09\
+\xb0\xbc\x12\xa7\x35\xb6\x90\xba\xe2\x5f\x29\xe8\xa3\xe1\x8c\x87\
+\xaa\xa7\xb8\xd9\xcb\xc4\xae\xf1\x5f\x77\x30\x79\xc5\xdf\x6e\x6e\
+\x26\xff\xf9\x72\x70\xac\xfb\x6c\xcc\x07\x5c\xae\xe1\xe7\xa2\x0d\
+\xda\xa0\x99\xfb\xb7\x00\x8b\x77\x27\x67\x50\x2d\xd9\xa4\x55\xfd\
+\xb3\xc2\x94\x80\x4f\x0c\x97\x51\x70\xc0\xb3\x2c\xba\x2c\xe8\x9b\
+\xe1\x8c\x83\xda\x8d\xb4\x7a\xe1\x15\x37\x33\xfd\xf3\x3e\x4e\x5e\
+\xf1\xb7\x34\x6d\x25\xdd\x0e\xb6\xf6\xe4\x22\x00\xd1\x0e\xbc\xee\
+\xe2\x83\xeb\x96\x27\xdc\x2f\x0b\x5c\x9f\x20\xc3\x5e\xb5\x4b\xab\
+\x73\x2f\x0c\x53\x02\x2c\xcb\x0d\x35\x29\x3e\x10\x71\xfe\xd4\x0c\
+\xfa\x62\x78\x7d\xff\x8c\xf3\xb4\x1a\xfb\xb6\xf0\x69\x7e\x1b\xe3\
+\xbd\x6b\xe9\xf7\x31\xf0\x05\x17\x6d\xd1\x3d\xf6\xfd\x37\x21\x83\
+\x50\xf6\xb5\x5b\x89\xd2\x5a\x3d\xb7\xda\xad\x04\xcc\xdb\x9e\xac\
+\x01\xb6\x6e\xbf\x56\x17\x5f\x19\xb6\x04\xfc\x29\xd8\x1d\x32\x87\
+\x62\x04\x21\x67\x4e\x4e\xd0\xf7\xfe\x14\x6a\x9f\x6f\x7e\xa9\x56\
+\x13\xde\x17\x7e\xe5\xbf\x35\x59\x0f\x24\xdf\x65\xee\xbb\x5a\x95\
+\x2a\x23\xfe\x39\x32\x11\xfd\x38\x21\x83\xb1\xb6\xe8\x69\x81\x87\
+\xcf\xce\x9e\xf4\x21\x13\x02\x4f\xe8\x4c\xed\x43\x5a\x5d\x7d\x6b\
+\xd8\x12\x60\xd9\x67\xb8\x80\xc2\x04\x21\xe5\xcd\x05\x41\x9f\x0b\
+\xb7\x9f\x5f\xdc\xdd\x64\xd2\x47\xb2\x19\xb4\x70\x67\x72\x0b\xff\
+\x37\x99\x64\xc4\xa6\x49\x0b\xe9\xb6\xb0\xb5\xa6\x36\x02\xe0\xdf\
+\x66\x1b\xb2\x0d\xdd\xe5\x6e\xb7\x02\x30\x75\x63\x32\xcd\xbb\xd7\
+\xc0\x28\x24\xe0\x6b\xc3\x4b\x86\xca\x14\x29\x70\x94\x31\x95\x83\
+\x3e\xf6\x75\xe8\xfd\xfb\xaa\xbe\xc2\xd9\xb3\x29\xd9\xaf\xfc\x0f\
+\x73\xfb\xc3\x2e\xda\x23\x31\x9b\x94\x25\x69\x70\x66\x1b\x76\x88\
+\x1f\xa8\x31\x68\x1e\x7b\x03\x14\xf6\x9b\x9b\xec\x29\x5b\x05\xe5\
+\x33\xc3\x5d\x86\x2c\x8a\x16\x08\x65\x4b\x56\xd0\xa7\x3e\x0b\xbd\
+\x3f\xdb\x53\x4b\xa5\xe7\x24\x25\xfd\x95\xff\x61\x5e\x5c\xeb\xe2\
+\x20\x33\x5b\x63\xb2\x11\x00\x3f\x07\xea\x39\x86\x7f\x8b\x36\x78\
+\x8d\xba\x5a\x8d\x7b\x97\xc3\x82\x0a\xc3\xe4\x75\x61\x2f\x13\x3c\
+\x92\xad\x86\x73\x29\x60\x90\x61\xa6\x9c\x1b\xf4\xa5\xf0\xfb\xb0\
+\x5d\xe6\x37\x68\x3e\xaf\xfc\x0b\xc3\x9a\x3d\x5a\x9d\x72\x9a\x74\
+\x9b\xd8\xda\x72\x4e\xa2\xfa\x77\x02\x07\xec\x68\x27\xdf\xde\x9c\
+\x6e\x13\xbc\x31\x19\xdb\x04\x1f\xeb\xd0\x8d\x8b\xaf\x8a\x4a\x02\
+\xec\x80\x7d\xd1\x50\x8e\x62\x06\x27\x98\x23\xe5\x82\xbe\xf3\xef\
+\x48\xfa\x6e\xf3\xcb\x64\x0f\x29\x4b\xcb\x2b\xff\xc3\xb8\x99\x8b\
+\x34\x3a\x71\xfd\x3c\x81\x03\xb7\xa4\xf8\xa9\x5b\x45\x8a\x68\x75\
+\xcf\x78\xb7\x12\x30\x63\x4b\x72\xd7\xdf\x5a\x06\x3c\x1f\xe6\x19\
+\x02\xdf\xe5\x0f\x86\x21\x9c\x2b\x00\x05\xdc\xbf\x7f\x48\xd0\x67\
+\xc2\xef\xab\x76\x33\xb2\x9b\x06\xc9\x1f\x44\x16\xf7\xd3\x48\x4f\
+\x84\xa1\x73\xf2\x33\x5b\xfe\x94\xd2\x92\x08\x40\x3c\x06\x71\x47\
+\xf1\x81\x59\xae\xb2\x56\x23\x5f\x75\x2b\x01\x0b\x12\xfe\x7a\xce\
+\x6e\x1f\x7c\x72\xbd\xa8\x24\xe0\xf0\xb2\xc1\x11\x86\xaa\x14\x3b\
+\xf8\x4e\x66\x54\x0d\xfa\xc6\x9f\x22\xeb\x9f\xd5\xeb\xc8\x6e\xeb\
+\x3b\xd3\x3c\x54\xac\xd9\x9f\x9e\xc2\x6f\x59\x6a\xae\xb9\x62\x55\
+\x17\xed\xd3\x31\x91\xfd\x3e\xc1\x03\x7a\xb1\x78\x27\x38\xbb\x9d\
+\xfb\x5d\x02\x57\x25\xfc\x35\x9d\xdd\x34\xe8\x92\x6b\xa2\x94\x00\
+\xcb\xdf\x0c\x13\xd8\x48\x08\x82\x8d\x7c\x26\x04\x7d\x22\xba\x3e\
+\xd9\xb2\x93\xdc\xe6\x3e\x76\xa3\xb1\xa5\xbb\xd3\x55\xf8\x0f\x73\
+\x41\x47\x17\xed\xb3\x38\xb1\xfd\x3f\xc1\x03\xbb\x8a\xe1\x77\xe2\
+\x9d\xa1\xdb\xfd\x6e\x05\x60\xda\xa6\x74\xbc\xae\x7b\x60\x98\x56\
+\xc5\x73\xa3\x16\x81\x7f\x1a\xa6\x1b\xea\x52\x0c\x53\x57\xf8\xeb\
+\x06\x6d\xff\xcf\x48\xfb\xa0\xfd\x2c\x76\xf3\xe3\xb2\x1b\x8c\xad\
+\x3f\x94\xce\xe2\x7f\xd7\x60\x17\x6d\x64\x6b\x48\x15\x04\x20\x9e\
+\x83\xfc\x6a\xf1\x0e\x91\x9d\x63\x8a\xd7\x54\xb7\x12\xf0\xd2\xf6\
+\x74\x0c\xd8\xa9\x2f\x6b\x75\x4a\xbd\xa8\x25\xe0\xf0\x69\x83\xf3\
+\x0c\x0d\x28\x8e\x89\x2f\xfc\x0d\x82\xb6\xfe\x32\xf2\x7e\x67\x5f\
+\xf9\x3f\xb1\x48\x68\x0e\xd1\x66\xad\x56\xed\x4f\x67\xe1\xff\xe6\
+\x88\x72\x73\x1f\x73\x72\x5c\xb4\xd3\xd5\x89\x1e\x0f\x29\x18\xf0\
+\x33\xc4\x3b\x45\xd9\x4a\x5a\x0d\x5b\xef\x56\x02\x96\xed\x49\xc7\
+\xc0\x5d\xbd\x5b\xab\x0e\xd7\xfa\x20\x01\x96\xaf\x0c\xcb\x0c\x67\
+\x52\x2c\x13\x97\x03\x67\x06\x6d\xfb\x95\x17\x7d\xed\xbc\xcb\x65\
+\x5e\xf9\xdb\xd7\xfd\xf6\x70\xb1\xbc\x8f\xd3\x5b\xfc\x17\x7c\xa8\
+\x55\xc5\x2a\x2e\xda\x69\x46\xe2\xc7\x45\x0a\x06\xbe\x5d\x15\xf0\
+\x23\xf1\xce\x51\xef\x2c\xf9\x3d\xb9\xbf\x3b\xb0\xd7\x1d\x4c\xcf\
+\x20\x7e\x70\x84\x56\xb9\x25\x7c\x11\x01\xbb\xd3\xdb\x6b\x86\x1e\
+\x86\x12\x14\xd0\xd8\x8e\xfd\x12\x41\x1b\xbe\x16\xc9\xee\x7d\xc7\
+\x7a\xe5\xdf\xf3\x49\xa1\x37\x85\xdb\xd2\xb1\xa1\xcf\xf7\x9d\x41\
+\xd2\xa8\x99\x8b\xb6\xfa\x51\x12\x67\xfd\xa7\x4e\x00\x82\x20\x68\
+\xee\xe4\x95\xdf\x45\x8e\xf7\x07\x98\xb5\x35\x5d\x83\x79\xce\x5b\
+\x5a\xb5\xbc\xd8\x17\x09\x38\x72\xe5\x80\xdd\xfe\xb5\x9d\xa1\x08\
+\x85\xd5\xfb\xb1\x5e\x24\x68\xab\x97\x22\x9d\xd1\x7f\x34\x9a\xb4\
+\xd6\x6a\xc8\x4a\x99\xd7\xfd\x69\x5a\xd3\x7f\xdc\xf5\xfe\x3d\x5d\
+\x7d\x12\x6c\x9e\x8a\xf1\x92\xa2\x60\x78\xc2\xc9\xa0\xee\xf5\x8c\
+\x5b\x09\x58\xb4\x2b\x7d\x83\xfa\xc9\xc9\x5a\x55\x3d\xc9\x37\x11\
+\xb0\xfc\xc2\x30\xdc\x70\x06\xc5\xd6\xbb\xf1\x7d\x46\xd0\x36\xbf\
+\xf0\xae\xdf\x54\xac\xae\x55\x9f\x17\x64\x96\xf5\x25\xed\x00\xb1\
+\x4c\x78\x78\xb4\xab\x36\x7b\x22\x35\xe3\x26\x45\x01\x61\xcf\x0a\
+\xf8\xc8\xc9\x2b\xbd\xc7\xe7\x3b\xdc\x25\xd0\xb0\x3a\x85\x93\x7b\
+\xec\xdc\x80\xee\x77\xb9\xd8\xcb\x5b\x8a\xed\x86\x01\x49\x9e\x21\
+\x1c\x93\x95\x3e\x03\x82\xb6\xf0\xaf\x8f\xd8\xb3\x44\x2e\xeb\x99\
+\xf9\xb7\x7e\xfb\x26\x90\x27\xfe\xef\x6c\x33\xbe\xde\xd5\x2a\xa2\
+\x8f\x92\xb4\xd7\x3f\x02\xf0\xed\xc0\xa8\x63\xf8\x42\xbc\xd3\x54\
+\xa9\xa5\xd5\xa8\xd7\xdd\x49\xc0\xf4\xcd\xf9\x47\xed\xa6\x71\xa0\
+\x4f\x7f\x55\xab\xa6\xad\x7c\x95\x80\xc3\xaf\x0b\xf3\x0c\xd7\x1b\
+\x72\x29\xcc\xce\xc7\x70\x6e\x70\xaf\xf3\xbc\x98\xc9\x7f\x2c\x1a\
+\x34\xd3\xea\xa9\x25\x99\x1f\x14\x96\xe6\x99\xfd\xc7\x62\xf9\x36\
+\xad\x6a\x9c\xe2\xa2\xdd\x6c\x6d\xa8\x93\xaa\xf1\x94\xc2\x00\xe9\
+\xe9\x64\xc0\x37\x6e\xad\xd5\xa4\x0f\xdd\x49\x80\xdd\xce\x33\xcd\
+\x83\xfe\xd1\xb1\xae\x66\xfa\x4a\xf2\x47\xc3\x0a\x43\x3f\xc3\xe9\
+\x14\x6c\xb1\x31\x7b\x7a\x70\x4f\x57\x04\xf7\xd8\xdf\x3e\x60\x57\
+\x08\xdd\x36\x24\xf3\xc9\x7d\x6b\x28\xfc\x47\x25\xef\xa0\x56\x2d\
+\x2e\x72\xd5\x7e\x3d\x53\x37\xb6\x52\x1a\x28\xcb\x9c\x74\xa0\x8b\
+\xba\xb9\x9d\x0f\xb0\x74\x4f\xba\x07\xff\x4a\x23\x41\xd7\xdc\xaa\
+\x55\x56\xb6\xef\x22\x70\x98\x4f\x0c\xf3\x0d\xb7\x1a\x6a\x51\xcc\
+\x0b\x3c\x3e\x6b\x05\xf7\x6c\x7e\x70\x0f\xfd\x6f\xeb\xac\x2c\xad\
+\xda\x5d\xaf\xd5\x98\x37\x0b\xff\xa9\x6f\xee\xf6\xe4\x1e\x0a\x26\
+\xc5\x55\xb7\xb8\x6a\xc3\x65\xa9\x1c\x6b\x29\x0d\x98\xf2\x86\x9f\
+\x38\xe9\x48\x5d\xef\x77\x3b\x1f\x60\x15\xdf\x02\xbf\x39\x66\xf8\
+\x8c\x73\xe2\x22\x01\xdf\x5d\x5a\x34\xcd\xd0\xdd\x50\x99\x62\xff\
+\xbf\xe3\xb1\x72\x70\x4f\xa6\x39\x59\xb2\xeb\x9a\xba\x67\x16\xfe\
+\xd8\x5e\x7b\x12\xe8\xbc\x1d\xe9\x5a\xf2\x5b\xe8\x9d\xfe\x1e\x77\
+\xd5\x86\xb6\x16\x94\x47\x00\xd2\x15\x3a\x4d\x9d\xec\xff\x5d\xc4\
+\x3c\x09\xdc\x35\xc2\xed\xfe\x00\x3c\x25\xe4\xcf\x89\xb0\xdb\x09\
+\x97\xad\x10\x47\x11\x38\xbc\xd7\xc0\x1e\xc3\x58\xc3\x15\x86\x8a\
+\x29\x1a\x7b\x15\x83\x6b\x1e\x1b\xdc\x83\xaf\x63\xd9\x86\xa5\xcb\
+\xe5\x6f\xe3\x3b\xe9\xa3\xc2\xcd\xeb\xb1\x2b\x7c\xd6\x53\xf8\x0b\
+\xc4\x53\x53\xf2\xb3\xd5\xcd\xb9\x20\x4d\x53\x5b\x07\x53\xfe\xe4\
+\xe1\x66\x3e\x80\x5d\x19\xf0\xe8\x1c\xb7\x93\x02\xd3\xba\xdf\xf7\
+\xd1\x4e\xff\xea\x7a\xa7\x56\xb9\x25\xe3\x2a\x02\x47\xf2\xa9\xe1\
+\x07\x86\xd9\x86\x47\x82\xad\xac\xed\xd6\xb5\x39\x31\x1c\x5b\x39\
+\xc1\x6f\xbf\x3a\xb8\x96\xd9\xc1\xb5\x7d\x1a\xfb\x76\x2a\x5e\x42\
+\xab\xf6\x37\x9d\xf8\xe9\xa0\x56\xde\xed\x5c\x9e\xd5\x7c\xdf\x3f\
+\x21\x26\xac\x72\x79\x6e\x48\xcf\x54\xd7\x40\x5e\x3f\xaa\x29\x6e\
+\x26\x03\x55\xd4\xea\xb9\xd5\x0e\x37\x09\xda\x92\xde\x95\x01\xc7\
+\x12\x81\x1e\x77\x9b\xa7\xb2\xb2\x49\x10\x81\xa3\xad\x34\xf8\xa1\
+\x61\xbd\x61\x94\xe1\x4e\xc3\x05\x3e\x7c\x46\x08\x5e\xdf\x5f\x10\
+\xfc\xa6\x51\xc1\x6f\xfc\xa1\xd7\x33\xf4\x0b\x4b\x89\xd2\x5a\x75\
+\xbe\xfd\xc4\x0a\xbf\xfd\x6c\x37\x67\x5b\xfe\xfa\xfd\x3c\xc6\xe9\
+\x09\x33\xf7\x5d\xad\x2a\x54\x76\xd5\xa6\x53\x52\x5f\xff\x10\x00\
+\x55\xcc\xb0\xd9\x49\x07\xab\x71\xaa\x56\xa3\xdf\x70\x27\x01\x73\
+\xb7\x13\x10\x47\x9b\x28\xd8\xeb\x41\xad\xca\x57\x4a\xa2\x08\x1c\
+\x8d\xcf\x0c\x1f\x07\x6b\xe1\xdf\x0d\x0a\xf0\xe2\xe0\xa4\xbb\xd1\
+\x86\x67\x0c\x0f\x1a\xfa\x04\xdb\xe2\x5e\x69\xb8\xc8\xd0\xcc\x50\
+\x3f\xa0\x59\xf0\x9f\x5d\x19\xfc\x77\xfa\x04\xff\x9b\x67\x82\x7f\
+\xc6\xf4\xe0\x9f\xb9\x3e\xf8\x77\x6c\x0f\xfe\x9d\x9f\xa5\xe2\x1e\
+\x97\x2e\xaf\xd5\x55\x7d\x4f\x6c\x2c\xdb\x4d\x7b\x96\xec\x4e\xc7\
+\xc9\x9e\xae\x58\x61\xf2\xad\xf6\xe9\xae\xda\xd5\x66\x7e\x31\x04\
+\x80\x49\x48\x87\xcf\x04\xff\xad\x93\x8e\xd6\xb0\x85\x56\x13\x3f\
+\x70\x27\x01\x0b\x77\x12\x14\x47\x63\xcd\xee\xfc\x49\x43\x95\xaa\
+\xa5\x45\x04\x40\x9a\x72\xe6\xc9\xf3\xba\xfb\x0a\xbe\x91\x8f\x3d\
+\xca\xdb\x8e\x47\xe6\xe8\x64\xce\x7a\x73\x0f\xcf\x69\xed\xaa\x6d\
+\x6d\xd6\xd7\xa4\xf6\x21\x00\x47\x4a\x80\xdd\x3f\xfc\xdf\x4e\x3a\
+\x5c\xeb\xab\x38\x39\x30\xb2\xc3\x42\xf6\x69\x75\xef\xb3\x5a\x55\
+\xab\x45\x41\x83\x02\x6e\xdd\x5b\x43\xab\x1b\x1e\xd6\x6a\xfc\x7b\
+\x05\x9b\x8f\x63\xbf\xeb\xb3\x3a\x47\x96\x8e\xdd\x5c\xb5\xaf\xcd\
+\xf8\x76\xd4\x3c\x04\xe0\x68\x12\xf0\x88\xb3\x50\xb9\xf4\x66\x87\
+\xcb\x03\x37\xb2\x63\x58\x41\x9e\x28\x1e\x1c\xa9\x55\xad\x53\x29\
+\x70\x70\x74\xaa\x9e\xac\xd5\x2d\x83\x8f\xff\xc6\xce\x3e\xe5\xdb\
+\x4f\x6f\x56\xba\x59\xba\xe7\x86\x6e\xbd\x5d\xb6\xf3\x23\xd4\x3a\
+\x04\xe0\x78\x12\xb0\xda\x59\xe7\xbb\xb2\x8f\x3b\x09\x98\xca\xf2\
+\xc0\x02\xef\x24\xf6\xf8\x04\xad\x4e\x6d\x48\xc1\x83\x7c\x4e\xaa\
+\x97\xbf\x7b\xdf\xd1\x76\xf2\x9c\x6a\x0a\xfe\x4b\xa6\xe0\x2f\xdd\
+\xcd\xf8\x0a\x83\x5b\x06\xb8\x6c\xeb\xd5\xd4\x38\x04\xe0\xfb\x04\
+\xa0\x8c\xe1\x90\xb3\x4e\x78\xdd\x00\xb7\xcb\x03\x99\x74\x54\x70\
+\x9e\x9d\xa9\xd5\x05\x1d\xb5\x2a\x5a\x8c\x22\x98\x36\xec\x41\x3d\
+\x4d\x2f\xd2\xaa\xef\xa8\x6f\xaf\xe3\xb7\x4b\xf5\xec\xac\xfd\x25\
+\x14\xfc\xd0\xe9\xf3\xb8\xcb\x36\xb7\x99\x5e\x86\x1a\x87\x00\x14\
+\xf4\xd0\xa0\xdf\x38\xeb\x8c\x3d\x1e\x75\xb8\x3c\x70\x2b\xcb\x8d\
+\x0a\x73\xb8\xc8\x3d\x43\xe2\xba\xbb\x20\x9c\x08\x75\x1a\x6b\x75\
+\xfd\x43\xf9\x4b\xf9\xec\xd3\xbd\x1d\x2f\x76\x27\x3e\x5b\xf0\xd9\
+\x7f\x3f\x3a\xee\x7b\xce\x65\xbb\xff\x26\x6d\x87\xfc\x20\x00\x99\
+\x4b\x40\x4b\xc3\x5f\x9d\x74\x48\xbb\xa3\x55\xaf\xa7\xdd\x49\xc0\
+\x3c\x96\x07\x16\x9a\x59\x6f\xe4\xef\x27\xc0\xa4\xc1\xe4\x50\xa9\
+\x86\x56\x57\xdd\xa1\xd5\xe8\xb5\xf9\xdf\xee\xed\x46\x3c\xbc\x29\
+\xf3\x87\x87\x47\xb9\xda\xe5\x4f\x07\x19\xde\x92\x9a\x86\x00\x14\
+\x46\x02\xba\x18\xbe\x72\x73\x78\x48\xb6\x56\xbd\x87\xbb\x93\x00\
+\xbb\xcd\x28\xe1\x92\xd9\x56\xc3\x23\x17\xe5\xcf\x46\x2e\x59\x9a\
+\x22\x1a\xc7\x4d\x7b\x3a\x5c\xa7\xd5\x88\x05\x6c\x98\xe5\x33\x4f\
+\xbc\xa8\x55\xb6\xb3\xc3\xbd\x6c\x76\x77\xa1\x96\x21\x00\x99\x48\
+\xc0\x40\xa7\xdf\x21\xef\x1e\xeb\x4e\x02\x96\xef\x25\x60\x44\xf6\
+\x14\xd8\x93\x7f\x1c\x71\xf3\xb6\x71\x3a\x89\x30\x7d\xd8\xb6\xb1\
+\x6d\x64\xdb\xca\xee\x03\x41\xdf\xf5\x9b\xe7\x66\x69\x95\x53\xd4\
+\x65\x9f\x18\x48\x0d\x43\x00\x24\x24\xe0\x45\x67\x9d\xb4\x68\x71\
+\xad\xee\x9f\xec\x6e\x79\x20\xfb\x8e\xcb\xb2\xf0\x23\xad\x7a\x3f\
+\xc6\x2a\x02\x9f\xb0\x6d\x61\xdb\xc4\xb6\x0d\x7d\x34\x1e\x8c\x58\
+\x98\x7f\x66\x8a\xbb\x7e\xf1\x22\xb5\x0b\x01\x90\x12\x80\x6c\x43\
+\x9e\xb3\xce\x6a\x07\xc2\xbd\x13\xdd\x2d\x0f\x64\x72\x93\x1b\x16\
+\x7c\x98\xff\xfd\xf2\xd2\xae\x5a\x55\xab\x49\x21\x0e\x0b\x7b\xaf\
+\xed\x3d\xb7\xf7\xde\xb6\x01\x7d\x31\x5e\x0c\x9b\xab\x55\x6e\x09\
+\x97\x7d\xc4\x66\x75\x36\xb5\x0b\x01\x90\x94\x80\x52\x86\x9d\xce\
+\x3a\xad\x7d\x15\xd6\x77\xa4\xbb\x23\x84\x91\x00\xf7\xcc\x79\x4b\
+\xab\x01\xcf\x6b\x75\xf1\x95\x2e\x0f\x30\x49\x1f\xf6\x5e\xda\x7b\
+\x6a\xef\xad\xbd\xc7\xf4\xb5\xf8\xf2\xf4\x54\xd7\xcb\x6e\x6d\x46\
+\x97\xa2\x66\x21\x00\x2e\x24\xa0\x86\xe1\x17\xee\xe6\x04\xe4\x68\
+\x75\xfb\xb3\xee\x24\x80\xcf\x01\xe1\x32\xed\x65\xad\xfa\x3d\xa5\
+\x55\xeb\x4b\xb5\x2a\x53\x8e\x42\x5e\x50\xec\xbd\xb2\xf7\xcc\xde\
+\x3b\x7b\x0f\xe9\x4b\xc9\xe0\xb1\x71\xe6\x41\x27\xc7\x65\xdf\xb1\
+\xd9\x5c\x83\x5a\x85\x00\xb8\x94\x80\x26\x86\xcf\x9d\x75\x62\xbb\
+\x1c\xe6\xe6\xc7\x91\x80\x24\xee\x40\x38\x71\x8d\x56\x77\x3e\x9a\
+\x3f\x51\x2d\xb7\x24\x85\xfe\x30\xf6\x5e\xd8\x7b\x62\xef\x8d\xbd\
+\x47\x79\x6c\xb1\x9b\x38\xee\x7f\xde\xe5\x52\x3f\x1d\x64\x72\x13\
+\x6a\x14\x02\x10\x86\x04\xb4\x32\xfc\xd9\x9d\x04\x14\xd1\xaa\xdb\
+\xfd\xee\x24\x80\x73\x03\xfc\x10\x82\xd9\x6f\x6a\x35\x64\x46\xfe\
+\xa9\x85\x97\xf7\xd0\xaa\x69\xab\x64\x9f\x5e\x68\xaf\xcd\x5e\xa3\
+\xbd\x56\x7b\xcd\xf6\xda\xed\x3d\xa0\xe0\x27\x9b\xbb\x06\xe7\x67\
+\x9a\xbb\xbe\x65\xb3\xb8\x15\xb5\x09\x01\x08\xfb\xf4\xc0\xbf\x3b\
+\x0d\x4c\x57\x67\x07\x7c\x73\x78\x10\xa7\x97\x79\xcb\xaa\x9d\xe6\
+\x49\x78\xb5\x56\x8f\x8c\xd1\xea\xa6\x7b\xb4\x6a\x7b\xb9\x56\xf5\
+\xce\x70\x3d\x71\x4a\xe8\x69\xbe\x44\xfe\x6f\xb5\xbf\xd9\xfe\x76\
+\x7b\x0d\xf6\x5a\x56\x71\x6c\x75\x2a\xe9\x79\xbf\xeb\x3e\xf7\x77\
+\x4e\xf7\x43\x00\xa2\x92\x80\x2b\x0c\xff\x72\xda\xc1\x5d\x9d\x22\
+\x68\x25\x60\x25\x12\x10\x3b\xe6\xbd\x97\x3f\x8b\xba\xff\xd3\x5a\
+\x5d\xdf\xd7\x48\xa2\xe9\x1f\xed\xbb\xe4\x7f\x33\xb7\xe7\xa7\x37\
+\x6c\xaa\xd5\x29\xf5\xb4\xaa\x5c\x5d\xab\x52\x65\x32\xdb\xb7\xc0\
+\xfe\x6f\xed\x3f\xc3\xfe\xb3\xec\x3f\xd3\xfe\xb3\xed\xbf\xc3\xfe\
+\xbb\xec\xbf\xd3\xfe\xbb\xed\x6f\xb0\xbf\xc5\xfe\x26\xfb\xdb\x68\
+\x23\x08\xe7\x54\x3f\x1d\x64\xef\x15\xd4\x22\x04\x20\x4a\x09\xe8\
+\x1e\x9c\x31\xed\xae\xa3\xb7\xb9\xf6\xe8\x27\x95\x21\x01\x50\x10\
+\x56\xef\xd6\x6a\xd1\x0f\xf2\xb7\x39\xb6\xdf\xd8\xed\x1a\xec\xa7\
+\xa7\xe5\x3f\x9d\x5b\xec\xff\x6d\xff\x33\xfb\xff\xb3\xff\x1d\xfb\
+\xdf\x5d\xcd\x46\x3a\x90\xc1\xe7\xad\x2b\x7a\xb8\x2e\xfe\x36\x73\
+\xbb\x53\x83\x10\x00\x1f\x24\xe0\x36\xc3\xd7\x4e\x3b\xfc\x59\x6d\
+\xb4\x1a\xfb\xb6\x1b\x09\x58\xc1\x8e\x81\x00\x20\x24\x9b\xad\xda\
+\xbb\x2e\xfe\x36\x6b\x6f\xa3\xf6\x20\x00\x3e\x49\xc0\xbd\xce\xbf\
+\xaf\xd6\x6e\xa4\xd5\xf0\x3c\x07\x12\xf0\x03\x24\x00\x00\x32\xc3\
+\xbe\x39\xaa\x7f\x56\x18\x73\x4d\xee\xa5\xe6\x20\x00\x3e\x4a\xc0\
+\xa0\x50\x4e\x36\x7b\x72\xb1\x1b\x09\xe0\xec\x00\x00\x28\x0c\xd3\
+\x5f\x09\xeb\x04\xcd\x41\xd4\x1a\x04\xc0\x67\x09\x18\xe6\x7c\x10\
+\x94\x2c\xe3\xee\xfc\x00\x7b\x5c\x2a\x81\x06\x00\x27\xb2\xaf\x7f\
+\xe9\xb2\x61\x14\xff\x61\xd4\x18\x04\x20\x0e\x12\x30\xda\xf9\x60\
+\xb0\x27\x09\xf6\x7a\x06\x09\x00\x80\xe8\x78\x78\xb4\xeb\x13\xfd\
+\x0e\x33\x9a\xda\x82\x00\xc4\x49\x02\x9e\x71\x3e\x28\xec\xe6\x1a\
+\x57\xdd\xe5\x46\x02\x96\x22\x01\x00\x70\x1c\x6e\x7d\xc0\xf5\x06\
+\x3f\x87\x79\x86\x9a\x82\x00\xc4\x51\x02\x1e\x0a\x65\xf3\x95\xd6\
+\x57\x69\x35\xf1\x03\x07\x12\xc0\x52\x30\x00\xf8\x0e\xeb\x0f\x68\
+\xd5\xb1\x5b\x58\x9b\x4b\x3d\x44\x2d\x41\x00\xe2\x2c\x01\x7d\x0d\
+\x5f\x39\x1f\x28\xf5\x9a\x6a\x35\x6c\x83\xbc\x04\x2c\x64\x07\x37\
+\x00\x08\x58\xf8\x91\x56\x8d\x9b\x85\x51\xf8\x6d\x66\xf6\xa5\x86\
+\x20\x00\x49\x90\x80\x9b\x0d\x5f\x3a\x1f\x34\x65\x2b\x6a\xf5\xc0\
+\x14\x79\x09\x98\xb3\x4d\xab\x0d\x87\x08\x3f\x80\x34\x33\x72\x51\
+\x58\xc7\x5c\xdb\xac\xbc\x99\xda\x81\x00\x24\x49\x02\xba\x18\xfe\
+\xe9\x7c\xf0\xd8\xed\x5b\xaf\xbb\x4f\x5e\x02\xa6\x6f\xd6\x6a\xed\
+\x01\x42\x10\x20\x8d\xf4\x1e\xa4\x55\x76\x76\x18\xc5\xdf\x66\x64\
+\x17\x6a\x06\x02\x90\x44\x09\xb8\xcc\xf0\xd7\x50\xbe\x9d\x9d\xd3\
+\x4e\xab\x31\x6f\xc9\x9f\x24\xc8\xd6\xc1\x00\xe9\x3a\x98\xea\xc2\
+\x4e\x61\x7d\xef\xb7\xd9\x78\x19\xb5\x02\x01\x48\xb2\x04\xb4\x31\
+\x7c\x11\xca\x80\xaa\x5e\x47\xab\x27\x16\xc9\xbf\x0d\x58\xbc\x8b\
+\x60\x04\x48\x3a\xd3\x5e\xd6\xea\xe4\x7a\x61\x15\x7f\x9b\x89\x6d\
+\xa8\x11\x08\x40\x1a\x24\xa0\xb9\xe1\x77\xa1\x0c\xac\xe2\x25\xb4\
+\xba\x63\xa8\xbc\x04\xcc\xdd\xae\x55\x1e\xf3\x02\x00\x12\xc9\xa0\
+\xf1\x5a\xe5\x96\x0c\xab\xf8\xdb\x2c\x6c\x4e\x6d\x40\x00\xd2\x24\
+\x01\xa7\x1a\x7e\x18\xda\x39\xed\xed\x6e\xd0\x6a\xc2\xfb\xb2\x12\
+\x30\x73\x8b\x56\xeb\x0f\x12\x96\x00\x49\x61\xdd\x7e\xad\xba\xf4\
+\xd2\xa1\xe5\x52\x7e\x06\x9e\x4a\x4d\x40\x00\xd2\x28\x01\x15\x0d\
+\x1f\x84\x36\xd8\x4e\xae\x2f\x7f\x8e\xc0\xd4\x4d\x5a\xad\xda\x4f\
+\x70\x02\x24\x61\x3f\xff\x7a\x8d\xc2\x2c\xfe\x36\xfb\x2a\x52\x0b\
+\x10\x80\x34\x4b\x40\x31\xc3\xe2\xd0\x06\x5d\xd1\xe2\x5a\x5d\xff\
+\x90\xfc\x41\x42\xec\x1c\x08\x10\x5f\xee\x7e\x5a\xab\x62\xb9\x61\
+\x16\x7f\x9b\x79\xc5\xa8\x01\x08\x00\x8d\xa0\x54\x11\xc3\xd0\x10\
+\x07\x9f\x56\x4d\x5a\xcb\x1f\x2d\x3c\x7f\x87\x56\x79\x84\x29\x40\
+\xac\x8e\xf0\x6d\x79\xb1\x0e\x35\x7b\x94\x7a\xde\x66\x1e\xd9\x8f\
+\x00\xc0\xb7\x45\xe0\x76\xc3\xbf\x42\x1b\x88\x65\x2a\x6a\xd5\x6f\
+\xb4\xac\x04\xcc\xda\xaa\xd5\x7a\x26\x07\x02\x78\xcf\x90\x19\x5a\
+\x95\xaf\x14\x66\xe1\xb7\xd9\x76\x3b\x59\x8f\x00\xc0\xb1\x25\xa0\
+\x83\xe1\x8f\xa1\x1a\x79\x9b\x6b\xb5\x1a\xf7\x8e\x9c\x04\x4c\xdb\
+\xa4\xd5\x1a\x36\x0d\x02\xf0\x92\x35\xbb\xb5\xba\xa2\x47\xd8\x4f\
+\xfd\x36\xd3\x3a\x90\xf1\x08\x00\x7c\xbf\x04\x34\x36\xfc\x22\xd4\
+\x01\x6a\xf7\x0c\x78\xec\x25\xc1\x79\x01\x1b\xb5\x5a\xbe\x97\xb0\
+\x05\xf0\x89\x89\x6b\xc2\x5c\xdb\x7f\x18\x9b\x65\x8d\xc9\x76\x04\
+\x00\x0a\x2e\x01\xd5\x0d\x9b\x43\x1d\xa8\xd9\x39\x5a\x75\xec\xa5\
+\xd5\xb8\x77\xe5\x44\x60\xc1\x4e\xe6\x05\x00\x44\xfe\xd4\xbf\x47\
+\xab\x1b\xfb\x6b\x95\x93\x13\x76\xf1\xb7\x19\x56\x9d\x4c\x47\x00\
+\xa0\x70\x2b\x04\xa6\x84\x3c\x60\xb5\xaa\x52\x4b\xab\x01\x93\xe4\
+\x24\x60\xc6\x66\x13\x40\x2c\x15\x04\x88\x84\xe1\xf3\xb4\x3a\xa9\
+\xb6\x0e\x3d\x47\xf2\xb3\x8b\x99\xfe\x08\x00\x64\x28\x02\x3d\x43\
+\x3b\x43\xe0\x48\x5a\x5d\xa1\xd5\xc8\x57\xe5\x96\x0a\x2e\xe4\x6d\
+\x00\x40\x68\x2c\xdd\xa2\x55\x87\xeb\xa2\x28\xfc\x36\xab\x7a\x92\
+\xdd\x08\x00\xc8\x49\xc0\x59\x86\x9f\x84\x3e\x98\x4b\x97\xd7\xaa\
+\xd7\xd3\x82\x6f\x03\xb6\xf0\x36\x00\xc0\x35\x0f\x8f\xd2\xaa\x5c\
+\xc5\x28\x8a\xbf\xcd\xa8\xb3\xc8\x6c\x04\x00\xe4\x25\xa0\xbc\x61\
+\x43\x04\x83\x5a\xab\x86\x2d\xb5\x1a\xb2\x52\xee\x6d\xc0\xa2\x5d\
+\xbc\x0d\x00\x90\x66\xce\x5b\x5a\x9d\x73\x81\x8e\x24\x23\xf2\xb3\
+\xa9\x3c\x59\x8d\x00\x80\xdb\x4d\x83\x9e\x30\x7c\x15\xfa\x00\xb7\
+\x3b\x85\x75\xb9\x5b\xab\x89\x1f\x08\xbe\x0d\x60\xb9\x20\x40\xc6\
+\xac\x37\xe3\xe8\xf6\x87\xb5\x2a\x9e\x1b\x45\xe1\xff\x2a\xc8\x24\
+\x36\xf7\x41\x00\x20\x24\x11\xb8\xcc\xf0\xfb\x48\x4c\xbf\x5a\x6d\
+\xad\xfa\x8d\xe2\x6d\x00\x80\x0f\x3c\x33\x5d\xab\x5a\xa7\x46\xf5\
+\xd4\x6f\x33\xe8\x32\x32\x19\x01\x80\xf0\x25\xe0\x14\xc3\xb6\x88\
+\x06\xbe\x56\x0d\x5b\x68\x35\x78\x81\xdc\xc9\x82\xbc\x0d\x00\x28\
+\x38\x53\x36\x68\x75\x4e\x6b\x1d\xd9\xf8\xcf\xcf\x9e\x53\xc8\x62\
+\x04\x00\xa2\x93\x80\xa2\x86\x61\x91\x7c\x12\xb0\x64\x65\x69\x75\
+\xc1\x35\x32\xe7\x0a\xd8\xcd\x83\xec\xdb\x00\xc2\x1d\xe0\xf8\xfb\
+\xf7\x77\xbe\xc1\x8c\xbd\xec\xa8\x0a\xff\x57\x41\xe6\x14\x25\x83\
+\x11\x00\xf0\x43\x04\xda\x18\x7e\x1e\xd9\xd3\x40\x6e\x29\xad\xae\
+\xee\xaf\xd5\xf8\xf7\x64\xde\x06\xac\xe5\x6d\x00\xc0\xb7\x58\xbb\
+\x57\xab\xdb\x1e\xd2\xaa\x64\xe9\x28\x9f\xfa\x6d\xc6\xb4\x21\x73\
+\x11\x00\xf0\x4f\x02\xca\x19\x16\x45\x18\x0e\x5a\x55\xaa\xa1\xd5\
+\x1d\x43\x65\xde\x06\x2c\xe6\x6d\x00\xc0\x37\x0c\x1a\xaf\x55\xb5\
+\x5a\x3a\xd2\xb1\x9d\x9f\x2d\xe5\xc8\x5a\x04\x00\xfc\x16\x81\x1e\
+\x86\xcf\x23\x0d\x8b\xba\x67\x6a\x75\xef\x44\xde\x06\x00\x64\xc2\
+\xb0\xb9\x5a\x9d\x71\x4e\xd4\x85\xdf\x66\x49\x0f\xb2\x15\x01\x80\
+\x78\x4d\x10\x7c\x3f\xe2\xe0\xd0\xaa\x5e\xd3\xcc\xb7\x15\x3e\x3c\
+\x37\x20\x8f\x63\x86\x21\x45\xdb\xf7\x36\x6e\xa6\x23\x1f\xbf\xf9\
+\x19\xc2\x44\x3f\x04\x00\x62\x28\x01\x59\x86\xc7\x82\x73\xb8\xa3\
+\x0d\x92\xd3\xce\xd6\xea\xfe\xc9\x99\x89\xc0\xd4\x4d\x5a\x2d\xdd\
+\x4d\x71\x80\xe4\x32\x62\x81\x56\x4d\x5a\xf8\x50\xf8\xff\x15\x64\
+\x47\x16\x59\x8a\x00\x40\xbc\x45\xe0\x5c\xc3\x01\x0f\x42\x45\xab\
+\xd3\xcf\xc9\x5c\x04\xa6\x6f\xd6\x6a\x05\x47\x0d\x43\x92\x0a\xff\
+\x42\xad\xce\x6c\xa9\xbd\x18\xa3\xf9\x59\x71\x2e\xd9\x89\x00\x40\
+\xb2\x96\x0b\xda\xdd\xba\xfe\xee\x45\xc8\xd4\x6f\xa6\xd5\x03\x53\
+\x33\x13\x81\x59\x5b\xb5\x5a\xcd\xb9\x02\x10\x63\x46\x2d\xd2\xaa\
+\x69\x2b\x5f\x0a\xff\xdf\x83\x8c\x60\x79\x1f\x02\x00\x09\x15\x81\
+\xfa\x86\xf7\x3c\x09\x9c\xfc\x37\x02\x7d\x47\x69\x35\xe9\xa3\xc2\
+\x8b\xc0\x4b\xdb\x98\x28\x08\xf1\xc1\xce\x65\x79\x7a\x9a\x4f\x4f\
+\xfc\x3a\xc8\x84\xfa\x64\x24\x02\x00\xe9\x10\x81\x3b\x0c\x9f\x79\
+\x13\x40\x55\x4f\xd1\xea\x86\x87\xb5\x1a\xf7\x4e\xe1\xb7\x14\x9e\
+\xbf\x43\xab\xf5\x07\x29\x30\xe0\x27\x6b\x76\x6b\x75\xcf\x33\x5a\
+\xd5\xaa\xeb\x53\xe1\xb7\x19\x70\x07\x99\x88\x00\x40\xfa\x24\xa0\
+\xaa\x61\x89\x47\x61\xa4\x55\xa9\x72\x5a\x75\xec\xa5\xd5\xb0\x0d\
+\x85\x13\x81\x29\xac\x18\x00\xcf\x58\xf8\x91\x56\x37\xf6\xd7\xaa\
+\x4c\x79\xed\xd5\x58\xcb\x1f\xfb\x55\xc9\x42\x04\x00\xd2\x2d\x02\
+\x9d\x0c\x3f\xf3\x2a\x9c\x72\x8a\x6a\xd5\xea\x0a\xad\x1e\x9f\x9f\
+\xc1\x8a\x81\x3d\x14\x1f\x88\x8e\xc9\xeb\xb5\xea\x70\x9d\x56\x45\
+\x8b\xf9\x56\xf8\xed\x58\xef\x44\xf6\x01\x37\x01\x0e\x4b\x40\x29\
+\xc3\x18\xc3\xbf\x3d\x0b\xab\xfc\x43\x87\xec\x3c\x81\x89\x1f\xb2\
+\x62\x00\xfc\x66\xc3\x81\xfc\xef\xfb\xd1\x1e\xd2\x73\x2c\xfe\x1d\
+\x8c\xf1\x52\x64\x1e\x20\x00\x70\x34\x11\x68\x6c\x78\xc3\xc3\xf0\
+\xd2\xaa\x6c\x25\xad\x2e\xbd\xc5\x04\xec\x32\x56\x0c\x80\x5f\xcc\
+\x7c\x5d\xab\xee\x7d\xb4\xaa\x58\x45\x7b\x39\x76\x94\x7a\xdd\x8e\
+\x6d\x32\x0e\x10\x00\x28\x88\x08\x5c\x6e\xf8\xd8\xd3\x30\xcb\xdf\
+\x61\xf0\x96\xc1\x5a\x8d\x7d\x9b\x15\x03\x10\x0d\xab\x76\x69\xf5\
+\xc0\x70\x5f\x76\xec\x3b\x16\x87\x0c\x9d\xc9\x34\x40\x00\xe0\x44\
+\x25\x20\xc7\x30\xc0\xab\xd5\x02\xdf\xa5\x78\x49\xad\x5a\x5f\xa5\
+\xd5\x43\x33\x4e\x4c\x04\xe6\x18\x11\x58\xb5\x8f\x22\x06\x27\xce\
+\x98\x65\x5a\x75\xec\xa6\x55\x89\x52\x3e\x17\xfe\xdf\x1b\xee\xb5\
+\x63\x98\x2c\x03\x04\x00\x32\x11\x81\x8a\x86\x89\x86\x2f\x3d\x0e\
+\x3c\xad\xaa\xd7\xd1\xea\x9a\xfe\x5a\x0d\x59\x79\x62\x87\x0d\x2d\
+\x67\x8e\x00\x7c\x0f\x73\xde\xd2\xea\xf6\x87\xb5\x3a\xa5\x9e\xf6\
+\x7a\x0c\xe4\x6f\xe1\x3b\xce\x50\x9e\xec\x02\x04\x00\x24\x45\xa0\
+\x81\xe1\x65\xcf\x03\x30\x9f\x93\xeb\x6b\x75\x55\xdf\x82\xcf\x17\
+\xb0\x93\x05\xed\x39\x03\x2c\x1f\x84\x23\xbf\xeb\xf7\x1a\xa8\x55\
+\xbd\x46\x3a\x16\x7d\x5e\xa9\x75\x86\xd3\xc9\x2a\x40\x00\xc0\xa5\
+\x08\x5c\x66\xd8\x1b\x93\x50\xd4\xaa\xa6\x79\x6a\xbb\xa2\xb7\x56\
+\x4f\x2c\x2a\xd8\xf2\x41\xbb\x8f\xc0\x06\x44\x20\x95\x4c\x7b\x59\
+\xab\x5b\x06\x68\x55\xa7\x81\x8e\x4d\xff\x56\x6a\x97\xe1\x12\xb2\
+\x09\x10\x00\x08\x4b\x02\x8a\x18\xba\x19\xf6\xc7\x28\x28\xf3\x3f\
+\x13\x74\xbe\xfd\xfb\xf7\x17\xb0\x47\x10\xcf\xdb\xce\xca\x81\xb4\
+\xac\xd7\xef\x71\x77\x1c\x5e\xef\x7f\x17\x2b\xe1\xd7\xda\xb1\x48\
+\x26\x01\x02\x00\x51\x89\xc0\xf5\x86\x83\x31\x0b\x4f\xad\x2a\x54\
+\xd5\xea\xfc\x2b\xb5\xba\x63\xa8\x56\x23\x5f\x3b\xb6\x0c\xcc\xd8\
+\x92\xff\x79\x80\xb7\x02\xc9\x60\xd9\x56\xad\x06\x8d\xcf\x9f\xc8\
+\x57\xb9\xba\x8e\x5d\xbf\xcd\x97\xee\xae\x14\x7e\x40\x00\xc0\x17\
+\x11\xc8\x32\xdc\x10\x2c\x3b\x8a\x5f\xa8\x66\x65\x69\x55\xa7\xb1\
+\x56\x9d\xef\xd0\xea\xc1\xe9\x47\xdf\x74\xc8\x6e\x33\x3c\x6f\x07\
+\x6f\x05\xe2\xb8\x39\xcf\x98\xa5\x5a\xdd\x74\x8f\x56\x0d\x9b\x9a\
+\xb6\xce\xd6\xb1\xec\xa3\xf9\xc7\xf4\x76\xa7\xf0\x03\x02\x00\x3e\
+\x8b\x40\x0f\xaf\xf7\x10\x28\x08\x25\x4a\x6b\x75\x76\x3b\xad\x7a\
+\x3c\xaa\xd5\x33\x2b\x8e\xbe\x7a\x80\xb7\x02\xfe\x32\xfb\x4d\xad\
+\xee\x7b\x4e\xab\x0b\x3a\x6a\x55\xaa\x8c\x8e\x75\x5f\xcc\x97\xea\
+\x1b\xed\xd8\x22\x63\x00\x01\x80\xb8\x88\xc0\xcd\x86\x1f\xc6\x3c\
+\x7c\x83\x5d\x08\x2b\x6a\xd5\xb4\xad\x56\x5d\xcc\x53\xe4\xc0\x69\
+\x5a\x8d\x7f\xef\x3f\x6f\x05\xe6\x6e\xd7\x6a\x25\x7b\x0a\x44\xc6\
+\xda\xbd\x5a\x8d\x5a\xac\xd5\x1d\x8f\x68\x75\x7e\x07\xad\x2a\x54\
+\xd6\x89\xe8\x73\xf9\x63\xe7\x26\x0a\x3f\x20\x00\x10\x67\x11\xb0\
+\x13\x95\x3e\x4c\x48\x28\xe7\x93\x5d\x34\xff\x93\x41\xbb\x1b\xb4\
+\xba\x73\xa8\x56\xcf\xaf\xcb\x5f\x41\x60\x8f\x24\x5e\xc5\x27\x02\
+\xa7\x2c\xf8\x40\xab\xc7\x27\x18\x19\xeb\x95\xff\x4a\xdf\x1e\x1c\
+\x95\xa4\xbe\x95\x3f\x56\xae\xa5\xf0\x03\x02\x00\x49\x92\x81\x66\
+\x86\x45\xc1\x66\x25\x3a\x71\x54\xa8\xa6\xd5\x59\x6d\xb4\xea\x74\
+\x9b\x56\xbd\x8d\x14\x8c\x58\xa9\xd5\x4a\x36\x19\x2a\x34\xeb\x0f\
+\x18\xa9\x7a\x59\xab\xc7\xc6\xe5\x1f\xa7\xdb\xaa\xbd\x56\x55\x6a\
+\xe8\x44\xf6\x9d\xfc\x31\x61\xc7\x46\x33\xb2\x02\x10\x00\x48\xb2\
+\x08\xd4\x34\x0c\xf7\x7a\x8b\x61\xc9\x37\x05\xb5\x4e\xd3\xaa\x75\
+\x67\xad\x6e\xb9\x3f\xff\xa4\xb8\x39\x6f\xb3\xe1\xd0\x91\xd8\x7b\
+\x61\xef\x89\xbd\x37\x76\xe3\x9d\x8b\xaf\xcc\x5f\x87\x9f\xbc\x27\
+\xfb\xa3\xf1\x59\x30\x16\x6a\x92\x0d\x80\x00\x40\x9a\x44\xa0\xa4\
+\xa1\x7f\x62\xe6\x09\x9c\x08\xb9\x25\xf3\x8b\x5c\xcb\x76\x5a\x5d\
+\x75\x8b\x56\x77\x3e\x9a\xff\x5a\x7b\xfc\x4a\xad\x16\x6f\x4c\x5e\
+\x91\xb7\xd7\x64\xaf\xcd\x5e\xa3\xbd\x56\x7b\xcd\xf6\xda\xed\x3d\
+\xb0\xf7\x22\x6d\xed\x9f\xdf\xe7\x6d\xdf\x2f\x49\x16\x00\x02\x00\
+\x69\xdf\x4b\xe0\x0a\xc3\x9b\x86\xaf\x53\x58\x0c\x8e\x72\xc8\x51\
+\xae\x56\x27\xd7\xd3\xaa\x59\x1b\xad\x3a\xdf\x90\xbf\x51\xcd\x5d\
+\x8f\x6b\xf5\xd0\x48\xad\x86\xcc\xd0\x6a\xdc\x72\xad\x66\xbd\x91\
+\xbf\xa6\x3d\x8a\xb7\x09\xf6\xdf\x69\xff\xdd\xf6\x37\xd8\xdf\x62\
+\x7f\x93\xfd\x6d\xf6\x37\xda\xdf\x6a\x7f\xb3\xfd\xed\xf6\x1a\xec\
+\xb5\xd0\xa6\x3a\xe8\xdb\x6f\x06\x7d\x9d\xa5\x7c\x80\x00\x00\x7c\
+\x47\x06\xea\x1a\x9e\x33\xfc\x3f\x0a\x46\x41\xf7\x30\xc8\xd6\xaa\
+\x6c\x05\xad\x6a\xd5\xd5\xaa\xe1\xd9\x5a\x35\x6d\xa5\x55\xf3\xb6\
+\xf9\xdf\xcc\x2f\xec\x94\xff\x4a\xbd\xc3\xb5\x5a\x75\xba\x5e\xab\
+\x2b\x6f\xca\x9f\x3c\xd7\xad\x77\xfe\x77\x75\x8b\xfd\xbf\xed\x7f\
+\x66\xff\x7f\xf6\xbf\x63\xff\xbb\xf6\x7f\x63\xff\xb7\xf6\x9f\x61\
+\xff\x59\xf6\x9f\x69\xff\xd9\xf6\xdf\x61\xff\x5d\xf1\x5d\x4b\x1f\
+\x05\xff\x2f\xe8\xd3\x75\x19\xe3\x80\x00\x00\x14\x6c\xf5\x40\x47\
+\xc3\x0a\xc3\x3f\x29\x22\x10\x33\xfe\x19\xf4\xdd\x8e\xcc\xe6\x07\
+\x04\x00\xa0\xf0\x32\x50\xc9\xf0\x80\x61\x1f\x85\x05\x3c\x67\x5f\
+\xd0\x57\x2b\x31\x76\x01\x01\x00\x90\x95\x81\x16\x86\xe9\x86\x2f\
+\x28\x36\xe0\x09\x5f\x04\x7d\xb2\x05\x63\x14\x10\x00\x00\xf7\x22\
+\x90\x6b\xb8\xc6\xb0\x10\x19\x80\x08\xf8\x63\xd0\xf7\x6c\x1f\xcc\
+\x65\x4c\x02\x02\x00\x10\x8d\x0c\x14\x37\x5c\x65\x98\x1f\x04\x33\
+\x05\x0a\x5c\xf0\xb9\x61\x9e\xe1\x4a\x43\x31\xc6\x1e\x20\x00\x00\
+\x7e\xc9\x40\x31\xc3\xe5\x86\xb9\x86\x3f\x50\xb4\x40\x60\xa3\x9e\
+\x39\x86\xce\x86\xa2\x8c\x31\x40\x00\x00\xe2\x21\x03\x45\x0d\x9d\
+\x0c\xb3\x0d\xbf\xa4\x98\x41\x01\xf9\xc4\x30\xc3\x70\x99\x21\x87\
+\xb1\x04\x08\x00\x40\xfc\x85\xa0\xb1\xe1\x41\xc3\xeb\x86\xbf\x51\
+\xe8\x20\xe0\xaf\x86\xd7\x82\xd9\xfb\x8d\x18\x2b\x80\x00\x00\x24\
+\x7f\x12\xe1\xa5\x86\xd1\x86\xbd\x14\xc1\xd4\x61\xdb\x7c\x94\xa1\
+\x83\x9d\x43\xc2\x98\x00\x04\x00\x20\xbd\x42\x50\xc3\x70\x6b\x70\
+\x22\x1b\x9f\x0b\x92\xc7\x2f\x83\xb6\xb5\x6d\x5c\x9d\x3e\x0f\x80\
+\x00\x00\x1c\x4b\x08\x4e\x31\xdc\x68\x98\x64\xd8\x6e\xf8\x92\x22\
+\x1a\x1b\xbe\x0c\xda\x6c\x52\xd0\x86\xa7\xd0\xa7\x01\x10\x00\x80\
+\xc2\x0a\x81\x3d\xb9\xf0\x22\xc3\xe3\x86\x0d\x86\x4f\x29\xb4\xde\
+\xf0\x69\xd0\x26\x8f\x07\x6d\xc4\x09\x7b\x00\x08\x00\x80\x53\x29\
+\xa8\x1f\xbc\x52\x1e\x1d\x4c\x22\xfb\x84\x62\x1c\xca\x0c\xfd\xd7\
+\x82\x7b\x6e\xef\x7d\x7d\xfa\x22\x00\x02\x00\xe0\x83\x14\x94\x33\
+\x5c\x60\xb8\x2b\x78\x05\xfd\xae\xe1\x77\x14\xee\x13\xe6\x77\xc1\
+\xbd\x9b\x14\xdc\x4b\x7b\x4f\xcb\xd1\xc7\x00\x10\x00\x80\xb8\x89\
+\x41\x55\x43\x3b\x43\x7f\xc3\x48\xc3\x72\xc3\x56\xc3\x6f\x53\x5c\
+\xe4\x7f\x1b\xdc\x83\xe5\xc1\x3d\xe9\x1f\xdc\xa3\xaa\xf4\x19\x00\
+\x04\x00\x20\x0d\x72\x50\xc2\xd0\x30\xd8\xb4\xa8\x9f\x61\x84\x61\
+\x99\x61\x8b\xe1\x17\x86\xbf\xc4\xb0\xb8\xff\x25\xf8\xed\x5b\x82\
+\x6b\x19\x11\x5c\x5b\xa7\xe0\x5a\x4b\xd0\xf6\x00\x08\x00\x00\x7c\
+\xbf\x24\x14\x0f\x96\x2a\x36\x09\x26\xba\x5d\x6b\xe8\x6d\x78\x2c\
+\x58\xcf\x6e\xb7\xab\x5d\x6b\x78\xcb\xf0\x81\x61\xb3\x61\xa7\x61\
+\xbf\xe1\x47\x86\x9f\x19\x7e\x15\x4c\x98\xb3\x87\x27\xfd\xdd\xf0\
+\x55\xc0\xdf\x83\xff\xec\xd3\xe0\xbf\xf3\xb3\xe0\x7f\xb3\x3f\xf8\
+\x67\x6c\x0e\xfe\x99\x6f\x05\xff\x8e\x39\xc1\xbf\xf3\xb1\xe0\x37\
+\x5c\x1b\xfc\xa6\x26\xc1\x6f\x64\x5d\x3d\x40\x0c\xf8\xff\x04\xe4\
+\x54\x66\x5d\x32\x12\x17\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\
+\x60\x82\
+\x00\x00\x05\x30\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x03\x00\x00\x00\xc3\xa6\x24\xc8\
+\x00\x00\x00\x03\x73\x42\x49\x54\x08\x08\x08\xdb\xe1\x4f\xe0\x00\
+\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\x95\x00\x00\x0e\x95\x01\
+\xf1\x59\xb9\x5c\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\
+\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\x70\
+\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\x78\x50\x4c\x54\
+\x45\xff\xff\xff\x00\x00\x00\x00\x00\x00\x07\x07\x07\x15\x15\x15\
+\x25\x25\x25\x2d\x2d\x2d\x34\x34\x34\x3c\x3c\x3c\x5a\x5a\x5a\x62\
+\x62\x62\x71\x71\x71\x88\x88\x88\x97\x97\x97\xae\xae\xae\xbb\xbb\
+\xbb\xbd\xbd\xbd\xbf\xbf\xbf\xc7\xc7\xc7\xca\xca\xca\xcc\xcc\xcc\
+\xce\xce\xce\xd3\xd3\xd3\xd4\xd4\xd4\xd5\xd5\xd5\xd6\xd6\xd6\xda\
+\xda\xda\xdc\xdc\xdc\xe2\xe2\xe2\xe3\xe3\xe3\xe4\xe4\xe4\xe6\xe6\
+\xe6\xe7\xe7\xe7\xe8\xe8\xe8\xea\xea\xea\xeb\xeb\xeb\xec\xec\xec\
+\xee\xee\xee\xf0\xf0\xf0\xf2\xf2\xf2\x77\x4f\x0d\xab\x00\x00\x00\
+\x02\x74\x52\x4e\x53\x00\x40\x00\x4f\x8c\xa8\x00\x00\x04\x1c\x49\
+\x44\x41\x54\x78\xda\xed\xdd\xf1\x4a\xc2\x40\x00\xc7\x71\x37\x4d\
+\xcd\x28\xac\x08\x03\x21\x28\xe8\xfd\x1f\xa8\xa0\x22\x28\x88\x94\
+\x8a\xca\xa6\xce\x7a\x82\x03\xc1\x6d\xdd\xb8\xcf\xe7\x01\x06\xc7\
+\xbe\xdc\xef\xcf\xcb\x3b\xbb\xc9\x72\xfe\x55\xb6\xe3\x0f\xcc\x3b\
+\x24\x4d\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x80\xed\xbf\xd7\xa3\x56\x79\xe4\x01\
+\x0c\x2e\xa9\xd5\xc0\x04\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\
+\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\xec\xee\xf9\x86\xa0\x99\
+\x1b\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\xad\x0d\x20\xf3\xfa\x6b\x58\x37\x81\
+\x00\xce\xbd\xfe\x1a\x36\x36\x01\x08\x00\x01\x20\x00\x04\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\
+\x00\x04\x80\x00\x10\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\
+\x00\x04\x90\x88\xe2\x3e\x2a\xef\x02\x68\x58\xb9\x8a\xca\x5a\x00\
+\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\
+\x20\x00\x04\x80\x00\x10\x40\x25\x46\xd7\x51\x39\x15\x00\x02\x40\
+\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\
+\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\
+\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x20\x00\x04\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\xd4\xe6\xf5\x91\xa0\xcf\x04\x02\
+\x58\xfd\x10\x54\x98\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\
+\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\xb4\x36\x80\xf1\x11\
+\x61\x09\x04\xb0\x3f\x21\x68\xcf\x04\x20\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\
+\x80\x00\x10\x00\x02\x40\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\
+\x80\x00\xd2\x51\x3e\x45\x65\x21\x80\x86\x15\x5f\x51\xf9\x16\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\x01\x20\x00\x04\x50\x89\xfe\x28\x2a\x43\x01\x34\xac\x37\
+\x8d\xca\x81\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\
+\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\
+\x20\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x75\x5a\xce\
+\x08\x2a\x13\x08\x60\x36\x27\xe8\xcd\x04\x20\x00\x04\x80\x00\x10\
+\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\xa0\
+\xb5\x01\xf4\x06\x04\xf5\x13\x08\xe0\xec\x82\xa0\x43\x13\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\
+\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x08\x00\x01\x20\
+\x00\x04\x80\x00\x10\x00\x02\x40\x00\x89\x58\xdc\x46\x65\x2e\x80\
+\x86\xfd\x46\x46\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x2a\x3b\x7e\x37\x2a\xb9\
+\x00\x1a\x36\xbc\x8a\xca\xb1\x00\x10\x00\x02\x40\x00\x08\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\
+\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\
+\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\
+\x00\x08\x00\x01\x20\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\
+\x00\x08\xa0\x36\x2f\x0f\x04\x7d\x24\x10\x40\xb9\x24\x68\x65\x02\
+\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x08\x00\x01\xd0\xda\x00\x26\x53\x82\x4e\x12\x08\x20\x1f\
+\x11\x94\x99\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\
+\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\
+\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x40\x00\x08\xa0\x3a\xc5\x1d\xb5\x2a\x22\x0f\x60\xb3\xa6\x56\
+\x1b\x13\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\
+\x00\x10\x00\x02\x40\x00\x08\x80\xad\xfc\x01\xe7\x9e\xfd\xc6\x08\
+\x1f\x97\x08\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x0a\x55\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x03\x00\x00\x00\xc3\xa6\x24\xc8\
+\x00\x00\x00\x03\x73\x42\x49\x54\x08\x08\x08\xdb\xe1\x4f\xe0\x00\
+\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\x95\x00\x00\x0e\x95\x01\
+\xf1\x59\xb9\x5c\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\
+\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\x70\
+\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x02\x07\x50\x4c\x54\
+\x45\xff\xff\xff\x00\x00\x00\x00\x00\x00\x01\x01\x01\x02\x02\x02\
+\x03\x03\x03\x05\x05\x05\x05\x06\x06\x06\x06\x06\x07\x07\x07\x0a\
+\x0a\x0a\x0a\x0b\x0b\x0b\x0b\x0b\x0c\x0c\x0c\x0c\x0d\x0d\x0e\x0f\
+\x0f\x0f\x10\x10\x10\x10\x11\x13\x13\x13\x14\x14\x14\x15\x15\x15\
+\x16\x17\x17\x17\x18\x18\x17\x18\x19\x18\x18\x18\x19\x19\x19\x1c\
+\x1c\x1c\x1d\x1d\x1d\x1e\x1e\x1e\x1f\x20\x21\x20\x21\x22\x21\x21\
+\x21\x25\x25\x25\x27\x27\x27\x28\x28\x28\x28\x2a\x2b\x29\x29\x29\
+\x29\x2b\x2c\x2a\x2a\x2a\x2a\x2c\x2d\x2b\x2c\x2d\x2b\x2d\x2e\x2d\
+\x2d\x2d\x33\x35\x36\x33\x36\x37\x34\x34\x34\x34\x36\x38\x35\x35\
+\x35\x36\x36\x36\x37\x37\x37\x3c\x3c\x3c\x40\x42\x44\x41\x41\x41\
+\x41\x43\x45\x41\x44\x46\x43\x43\x43\x44\x44\x44\x45\x45\x45\x46\
+\x46\x46\x4d\x50\x52\x4e\x51\x53\x4e\x51\x54\x4f\x52\x54\x54\x54\
+\x54\x54\x57\x59\x54\x58\x5a\x55\x55\x55\x56\x56\x56\x57\x57\x57\
+\x5a\x5a\x5a\x5c\x60\x62\x5d\x60\x63\x5d\x61\x64\x60\x64\x67\x62\
+\x62\x62\x66\x66\x66\x67\x67\x67\x68\x68\x68\x69\x69\x69\x6a\x6a\
+\x6a\x6a\x6e\x71\x6a\x6f\x72\x6b\x6f\x72\x6c\x70\x73\x6e\x6e\x6e\
+\x71\x71\x71\x72\x76\x7a\x73\x77\x7a\x77\x7b\x7f\x77\x7c\x80\x78\
+\x7d\x80\x79\x7e\x81\x7b\x7b\x7b\x7c\x7c\x7c\x7d\x7d\x7d\x7e\x7e\
+\x7e\x7e\x83\x87\x7f\x84\x88\x82\x88\x8b\x83\x88\x8c\x84\x89\x8d\
+\x84\x8a\x8e\x86\x86\x86\x88\x88\x88\x89\x8e\x92\x89\x8f\x93\x8d\
+\x92\x96\x8d\x93\x97\x8e\x8e\x8e\x8e\x94\x98\x8f\x8f\x8f\x90\x90\
+\x90\x91\x91\x91\x92\x92\x92\x96\x9c\xa0\x96\x9c\xa1\x97\x97\x97\
+\x9d\xa3\xa8\x9e\xa4\xa9\xa1\xa1\xa1\xa2\xa2\xa2\xa3\xa3\xa3\xa4\
+\xa4\xa4\xa4\xab\xaf\xa9\xb0\xb4\xaa\xb0\xb5\xac\xb3\xb8\xad\xb4\
+\xb9\xae\xb5\xba\xaf\xb6\xbb\xb1\xb1\xb1\xb2\xb2\xb2\xb3\xb3\xb3\
+\xb4\xb4\xb4\xb5\xb5\xb5\xb6\xb6\xb6\xbb\xbb\xbb\xbd\xbd\xbd\xbf\
+\xbf\xbf\xc0\xc0\xc0\xc1\xc1\xc1\xc2\xc2\xc2\xc3\xc3\xc3\xc4\xc4\
+\xc4\xc5\xc5\xc5\xc7\xc7\xc7\xc9\xc9\xc9\xca\xca\xca\xcc\xcc\xcc\
+\xcd\xcd\xcd\xce\xce\xce\xcf\xcf\xcf\xd1\xd1\xd1\xd3\xd3\xd3\xd7\
+\xd7\xd7\xd8\xd8\xd8\xd9\xd9\xd9\xdb\xdb\xdb\xdd\xdd\xdd\xde\xde\
+\xde\xe1\xe1\xe1\xe2\xe2\xe2\xe3\xe3\xe3\xe7\xe7\xe7\xe8\xe8\xe8\
+\xe9\xe9\xe9\xea\xea\xea\xed\xed\xed\xee\xee\xee\xef\xef\xef\xf0\
+\xf0\xf0\xf1\xf1\xf1\xf2\xf2\xf2\x7f\x31\xb1\x7a\x00\x00\x00\x02\
+\x74\x52\x4e\x53\x00\x40\x00\x4f\x8c\xa8\x00\x00\x07\xb2\x49\x44\
+\x41\x54\x78\xda\xed\xdd\xff\xaf\xd5\x73\x1c\xc0\xf1\x73\x4f\x74\
+\x53\x17\x75\x17\x52\xc9\xad\x50\xa1\x18\xdd\xd8\x28\xc5\x34\x24\
+\xfa\xa9\x2c\x6e\xf8\x41\x61\x7d\xb1\x55\x6c\xb7\x6f\xf7\x6a\xd8\
+\xcc\xfc\x07\xa5\x09\xad\x58\xc2\x98\x55\xd6\x6c\x2a\x3f\x50\x31\
+\x94\xa8\xc6\xa5\x94\x34\xa5\x2f\x74\xbb\xae\xdf\xf5\xfe\xe8\x70\
+\xef\xc9\x39\xbd\x1e\xcf\x1f\xdf\xdb\xb9\xdb\x3d\xef\xc7\xce\xeb\
+\x9c\xd7\x6e\x9d\x7c\xae\x6d\x55\xe4\xf5\xbf\x56\xd1\xc6\x0b\xcc\
+\xe7\x14\x3a\x00\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\
+\x80\x00\x10\x00\x02\x40\x00\x08\x80\x82\xab\x1e\xa8\xa2\x56\x5d\
+\xe2\x00\x46\x3d\xad\xa2\x36\xca\x08\x10\x00\x02\x40\x00\x08\x00\
+\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\
+\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\
+\x10\x00\x02\x00\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\xb4\x43\x3b\
+\xc6\x2b\xb3\x1d\x5e\x01\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\
+\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\xa8\x6c\x01\x74\xf2\
+\xf5\xaf\xd9\x75\x0a\x00\xa0\x97\xaf\x7f\xcd\xae\x97\x11\x20\x00\
+\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x00\x00\x4f\x01\x00\x02\
+\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x28\x5a\xbb\x1b\x95\xd9\
+\xee\x00\x00\x8e\x7d\xa9\xcc\x8e\x19\x01\x02\x40\x00\x08\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x54\
+\xb6\x00\xfa\xaf\x50\x66\xfd\xbd\x02\x08\x00\x01\x20\x00\x04\x80\
+\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\
+\x20\x00\x04\x80\x00\x00\xc0\x53\x00\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\x01\x20\x00\xa2\xb4\xb8\xa4\xfa\x05\x80\xd3\xdd\xfb\x25\
+\xd5\xaf\x00\x08\x00\x01\x20\x00\x04\x80\x00\x50\x6c\x00\xdf\x1e\
+\x72\x45\xa1\x01\xec\x9a\xf3\x8d\x3b\x0a\x3d\x02\xf6\xce\x7f\xeb\
+\x4f\xb7\x14\xf9\x3d\x40\xcb\xab\xcf\x1b\x03\xb1\xdf\x04\x6e\xaa\
+\x37\x06\x62\x7f\x0a\xd8\x67\x0c\x04\xff\x18\x68\x0c\x84\xdf\x03\
+\x18\x03\xc1\x01\x14\x6f\x0c\x3c\x57\x52\xf5\x04\xe0\x74\x8f\x81\
+\xfe\x25\xd5\x39\x00\x18\x03\x00\xf8\x34\x00\x80\x4f\x03\x00\x18\
+\x03\x00\x18\x03\x00\x18\x03\x00\x18\x03\x00\x18\x03\x00\x18\x03\
+\x00\x18\x03\x00\x18\x03\x00\x18\x03\x00\x18\x03\x00\x18\x03\x00\
+\x18\x03\xe1\x01\xe4\x72\x9b\xea\xb7\xbb\xc3\xc8\x00\x72\xfb\x16\
+\x18\x03\xa1\x01\x18\x03\xd1\x01\x18\x03\xe1\x01\x18\x03\xd1\x01\
+\x18\x03\x71\x00\x54\x18\x03\xb1\x01\x8c\xbe\x3c\x73\x0c\xac\x32\
+\x06\x02\x00\x38\xef\xbe\x11\x19\x2f\x02\x2d\xaf\x19\x03\x11\xde\
+\x03\xe4\x47\xd5\x9d\x6b\x0c\x84\x7e\x13\xd8\x77\xb2\x31\x10\xfb\
+\x53\x40\x95\x31\x10\xfc\x63\xa0\x31\x10\x7e\x0f\xd0\x77\xf2\x15\
+\xc6\x40\x19\x03\x38\xd0\x54\x68\x59\xff\x7d\x7a\xd5\x04\x63\xa0\
+\x8c\x01\xac\x9a\x59\x68\x2b\x8d\x01\x23\xc0\x18\x00\xc0\x18\x00\
+\xc0\x18\x00\xc0\x18\x00\xc0\x18\x00\xe0\xef\x63\x60\x92\x31\x10\
+\x19\x40\x2e\x57\x63\x0c\xc4\x06\x90\xab\x9a\x70\x8b\x31\x10\x19\
+\x40\x2e\x3f\xd2\x18\x08\x0d\xc0\x18\x08\x0f\xc0\x18\x88\x0e\xc0\
+\x18\x88\x0e\xc0\x18\x08\x0f\xc0\x18\x28\x5f\x00\x83\x86\x16\x5a\
+\x75\xbb\x8f\x81\x8f\x4b\xaa\xdf\x62\x02\x18\x3e\xa6\xd0\x7a\x9c\
+\x6a\x0c\x0c\xf8\xb7\x63\xe0\xc5\x92\x6a\x9f\x11\xd0\xc6\x31\x30\
+\xde\x18\x08\x0d\xc0\xa7\x81\xe8\x00\xfe\xd3\x18\x00\xc0\x18\x00\
+\xc0\x18\x00\x20\xc8\x18\x70\xe9\x67\x3e\x80\x7f\x18\x03\xb9\x0b\
+\x5c\x7a\x00\x00\xb9\xfc\xd5\x5d\x92\xe7\x95\xb3\x6f\x72\xe9\x11\
+\x00\x34\x2d\x3e\x9c\x3a\xee\x32\xf7\x3a\x77\x1e\x01\xc0\xf6\xa5\
+\xc7\x52\xc7\xd5\x8d\x03\x5c\x79\x04\x00\x9f\x2f\x6f\x4e\x1d\xf7\
+\x5c\xd8\xc7\x8d\x47\x00\xb0\xf1\xcd\xe4\xc2\xe7\xb2\x06\x6f\x00\
+\x23\x00\x68\xfd\x60\x75\xf2\xfc\x9a\x39\x5d\xdd\x77\x00\x00\x2d\
+\xef\x7d\x94\x3c\xbf\x71\x56\x17\xd7\x1d\x00\x40\xf3\xaa\x4f\x92\
+\xe7\xb7\x4e\xaf\x4c\x9e\x3f\x52\x52\x75\x07\xa0\x8d\x1d\x5f\xfe\
+\x45\xf2\x7c\xec\x94\xb3\xd2\x0f\xb8\xbd\xa4\x3a\x1f\x80\xb6\x75\
+\x64\xe9\x8e\xe4\x79\x5d\x5d\x85\x57\xfb\x00\x00\x0e\x2d\xf9\x21\
+\xf9\x4b\xce\x18\xeb\xa6\x23\x00\xd8\xbf\x78\x7f\xea\xd8\xfa\x37\
+\x08\x80\xa6\x45\x07\x53\xc7\x5d\xe6\x5c\xef\x9e\x23\x00\xf8\x7a\
+\xe9\xef\xa9\xe3\x6e\x0d\x03\x5d\x73\x04\x00\x9f\xad\x48\xae\x7f\
+\x2f\x5e\x78\xa9\x5b\x8e\x00\x60\x63\xfa\xef\xfd\xfa\x35\x5e\xe8\
+\x92\x03\x00\x68\x5d\x9b\x5e\xff\x0e\x99\x67\xfd\x5b\x06\x00\x5a\
+\x4e\x14\x5a\x6b\xc6\x0f\x78\x77\x7d\xf2\xfc\x86\xd9\xd6\xbf\xe5\
+\x00\x60\xd1\x33\x85\xb6\x35\xf9\xf8\xe6\x55\x9f\x26\xcf\x47\x65\
+\xac\x7f\x75\x66\x8d\x80\xe3\xcb\xd2\xeb\xdf\xbb\x1f\x3d\xdb\x05\
+\x07\x00\x70\xe4\xe5\x5d\xc9\xf3\x07\x26\x59\xff\x46\x00\x70\x68\
+\xc9\x8f\xc9\x5f\x6c\xfa\x3d\x6e\x37\x02\x80\x7d\x8b\x32\xd6\xbf\
+\x37\xbb\xdc\x08\x00\xbe\x7f\x29\xf9\x8f\xbd\xac\x7f\x83\x00\xd8\
+\x66\xfd\x1b\x1a\xc0\x96\xd7\x4f\xa4\x8e\xad\x7f\x83\x00\xd8\x90\
+\xfe\xd2\xe8\x7e\x0d\xd6\xbf\x11\x00\xb4\xae\x59\x93\x3c\x1f\x32\
+\xaf\x9b\x7b\x0d\x00\xa0\xe5\x9d\x0d\xc9\x73\xeb\xdf\x18\x00\x9a\
+\x57\x6e\x4e\x9e\x5b\xff\xc6\x00\x70\x7c\xd9\x57\xc9\xf3\x31\xd6\
+\xbf\x21\x00\x1c\xce\x5a\xff\x3e\x68\xfd\x1b\x01\xc0\xc1\x8c\xf5\
+\xef\x34\xeb\xdf\xb2\x00\xd0\xfb\xda\x42\xbb\x24\xf9\xf8\xbd\x8b\
+\x93\xdf\x28\xda\x71\xd6\x70\x17\x5a\x16\x00\x46\xd7\x17\xda\x1d\
+\xa9\x87\x7f\xb7\x24\x63\xfd\x3b\xd4\x7d\x46\x18\x01\x5b\x5f\xc9\
+\x58\xff\x0e\x72\x9d\x11\x00\x6c\x7e\xc3\xfa\x37\x32\x80\xf5\x6f\
+\x5b\xff\x06\x06\xd0\xba\x7a\x6d\xf2\x7c\xc8\x5c\xeb\xdf\x10\x00\
+\x3e\xdc\x98\x3c\x1e\x36\xbb\xca\x55\x86\x00\xf0\x73\xf2\x74\xe4\
+\x0c\xeb\xdf\x40\x9f\x02\x4e\x6a\xcc\x63\xd6\xbf\x91\x01\xdc\x6f\
+\xfd\x1b\x19\x40\x7e\xda\xbd\x6e\x31\x30\x00\xeb\xdf\xd8\x00\x3a\
+\x5b\xff\x86\x06\xd0\xd5\xfa\x37\x34\x80\x1e\x0b\x6b\xdc\x60\x60\
+\x00\x35\x8d\x17\xb9\xc0\xc0\x00\x06\xcf\xb7\xfe\x8d\x0c\x60\xd8\
+\x93\xd6\xbf\x91\x01\x0c\xb7\xfe\x0d\x0d\xe0\xae\xa9\xd6\xbf\x91\
+\x01\x4c\x7c\xc8\xfa\x37\x30\x80\xfc\xd4\x71\xed\xf6\xb3\x7e\x2a\
+\xa9\x8e\x03\x50\x40\x1d\x67\x8e\x68\xbf\x1f\x36\xbd\xa4\x6a\x02\
+\xe0\xd4\x75\xae\xaf\xf5\xca\x1d\x18\x40\xd7\x86\x2b\x5d\x5b\x60\
+\x00\xd6\xbf\xb1\x01\xd4\x34\x58\xff\x46\x06\x30\x78\x7e\xb5\x3b\
+\x0b\x0c\xa0\xd6\x5f\xff\x86\x06\x30\xfc\x89\x4e\x6e\x2c\x30\x80\
+\x3b\xad\x7f\x43\x03\x98\xf8\xb0\xf5\x6f\x60\x00\xf9\xc7\xc7\xb9\
+\xad\xc0\x00\x3a\xce\x1c\xe9\xb2\x02\x03\xb0\xfe\x8d\x0d\xa0\xeb\
+\x02\xeb\xdf\xc8\x00\x7a\x2c\xec\xeb\xa6\x02\x03\xb8\xb4\x98\xeb\
+\xdf\xdb\x4a\x2a\xdf\x1e\x9e\xe8\xaa\x05\xc5\x5c\xff\x4e\x29\xa9\
+\xba\x03\x70\x52\xb5\x4f\x59\xff\x46\x06\x60\xfd\x1b\x1b\x80\xf5\
+\x6f\x6c\x00\xb5\xd6\xbf\xb1\x01\xf8\xe6\x5f\x6f\x02\x05\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\
+\x00\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x28\
+\x52\x3b\xeb\x94\xd9\xce\x00\x00\x5a\xff\x50\x66\xad\x46\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\xa8\x9c\x01\x54\xf6\x51\x66\x95\x01\x00\xf4\x7e\x41\x99\
+\xf5\x36\x02\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\
+\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x00\
+\xe0\x29\x00\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x45\
+\x6b\xcf\xb3\xca\x6c\x4f\x00\x00\x47\xb7\x28\xb3\xa3\x46\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x08\x00\x95\x2d\x80\x9a\x25\xca\xac\x26\x00\x80\x0e\x9d\
+\x95\x59\x07\x23\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\
+\x00\x00\x9e\x02\x00\x04\x40\xbb\xb5\x6e\xbe\x8a\xda\xba\x12\x07\
+\x70\x60\x9b\x8a\xda\x01\x23\x40\x00\x08\x00\x01\x20\x00\x04\x80\
+\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x0a\xea\x2f\
+\x40\x32\xfc\xe4\xf9\x4a\xba\xd1\x00\x00\x00\x00\x49\x45\x4e\x44\
+\xae\x42\x60\x82\
+\x00\x00\x0a\x01\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x03\x00\x00\x00\xc3\xa6\x24\xc8\
+\x00\x00\x00\x03\x73\x42\x49\x54\x08\x08\x08\xdb\xe1\x4f\xe0\x00\
+\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\x9d\x00\x00\x0e\x9d\x01\
+\xd5\xd3\xb1\x39\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\
+\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\x70\
+\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x02\x1c\x50\x4c\x54\
+\x45\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x01\x01\x01\x02\x02\x02\x03\x03\x03\x03\x04\x04\x05\x06\x06\
+\x06\x06\x07\x09\x09\x0a\x0c\x0d\x0d\x0d\x0d\x0d\x0d\x0e\x0e\x10\
+\x11\x12\x11\x12\x12\x15\x16\x17\x16\x16\x16\x16\x17\x17\x1a\x1b\
+\x1c\x1b\x1c\x1d\x1d\x1d\x1d\x20\x22\x22\x21\x22\x23\x25\x25\x25\
+\x26\x28\x29\x27\x29\x2a\x28\x29\x2b\x2d\x2d\x2d\x2d\x2f\x30\x2e\
+\x30\x31\x2f\x31\x32\x34\x34\x34\x35\x37\x38\x36\x38\x39\x36\x38\
+\x3a\x3d\x40\x41\x3e\x40\x42\x3e\x41\x43\x46\x49\x4b\x47\x4a\x4c\
+\x4b\x4b\x4b\x4f\x52\x54\x50\x53\x55\x50\x54\x56\x58\x58\x58\x59\
+\x5c\x5f\x59\x5d\x5f\x5a\x5a\x5a\x5a\x5d\x60\x5b\x5e\x61\x60\x60\
+\x60\x62\x62\x62\x62\x66\x69\x63\x67\x6a\x64\x67\x6a\x64\x68\x6b\
+\x6b\x6f\x72\x6c\x70\x73\x6c\x71\x74\x6d\x71\x75\x70\x70\x70\x72\
+\x72\x72\x74\x79\x7c\x75\x79\x7d\x75\x7a\x7d\x7c\x80\x84\x7c\x81\
+\x85\x7d\x82\x85\x80\x80\x80\x82\x82\x82\x83\x88\x8c\x84\x89\x8d\
+\x84\x8a\x8e\x89\x8e\x92\x8b\x90\x94\x8b\x91\x95\x91\x97\x9b\x96\
+\x9c\xa1\x97\x97\x97\x97\x9d\xa1\x9a\x9a\x9a\x9b\xa1\xa6\x9c\xa2\
+\xa6\xa0\xa6\xab\xa1\xa7\xac\xa4\xab\xaf\xa7\xad\xb2\xa7\xae\xb3\
+\xaa\xb1\xb6\xab\xab\xab\xac\xb3\xb8\xae\xb5\xba\xaf\xb6\xbb\xb5\
+\xb5\xb5\xbd\xbd\xbd\xc3\xc3\xc3\xc9\xc9\xc9\xcc\xcc\xcc\xd1\xd1\
+\xd1\xd5\xd5\xd5\xea\xea\xea\xec\xec\xec\xf2\xf2\xf2\x2a\x1f\x17\
+\xca\x00\x00\x00\x4f\x74\x52\x4e\x53\x00\x01\x02\x04\x05\x08\x0c\
+\x0d\x11\x12\x16\x17\x18\x1d\x1e\x24\x25\x26\x2d\x2e\x36\x37\x38\
+\x40\x41\x42\x4b\x4c\x4d\x56\x57\x58\x63\x64\x65\x70\x71\x72\x7e\
+\x7f\x80\x8c\x8d\x8e\x9a\x9b\x9c\xa6\xa7\xa8\xb2\xb3\xb4\xbd\xbe\
+\xbf\xc7\xc8\xc9\xd0\xd1\xd2\xd9\xda\xe0\xe1\xe2\xe7\xe8\xed\xee\
+\xf0\xf2\xf3\xf7\xfa\xfb\xfd\xfe\x66\xe3\x43\x5e\x00\x00\x06\xfc\
+\x49\x44\x41\x54\x78\xda\xed\xdd\xcd\x4f\x54\x57\x18\xc0\x61\x67\
+\x18\x40\x40\x64\xf8\x54\xbe\x19\x40\xc4\x19\xbe\x2e\x02\x2a\xb5\
+\x60\xba\xb0\x4d\xba\xf0\x0f\xe8\xae\x7f\x58\x93\x26\x4d\x37\x5d\
+\xb5\x69\x17\x35\x4d\xdc\xb1\x6b\xba\x77\xe3\xb2\x26\x5d\x12\x93\
+\xc6\xd6\xda\xbd\x39\xa4\x37\x85\x99\x7b\x67\xde\xe7\x59\x9e\x85\
+\x0b\xce\x2f\xbe\x47\x7d\x73\xad\x5e\xfb\xdf\x3e\x7d\x46\x6e\x9f\
+\x4d\x5d\x2b\xa7\xea\x35\x3a\x61\x30\x9b\x10\x40\x68\xc3\xd9\x98\
+\x00\x42\xbb\x91\x8d\x0a\x20\xb4\xb1\x6c\x58\x00\xa1\x8d\x67\xd7\
+\x05\x10\xda\xd4\xde\x80\x00\x42\xbb\xb5\xdb\x2f\x80\xd0\xe6\xb6\
+\xfb\x04\x10\xda\xe2\x56\x55\x00\xa1\xad\x34\x05\x10\xdb\xda\x3d\
+\x01\xc4\xb6\xb1\x21\x80\xd8\xee\xad\x09\x20\xb6\xd6\x4a\x2f\x06\
+\xd0\x37\xcd\x07\x86\x2e\xf8\x51\x55\xb6\x17\x7b\x30\x80\x11\xff\
+\xe8\xff\xa1\xf5\x0b\x7f\xea\x3b\x73\x46\x40\x68\xb5\xbd\x5b\x02\
+\x08\xad\x3f\x9b\x12\x40\x68\x65\x59\x11\x12\x40\x51\x86\xb3\xba\
+\x00\x42\x2b\xc7\x8a\x90\x00\x8a\x73\x33\x1b\x11\x40\x68\x65\x58\
+\x11\x12\x40\x91\x26\x8b\x5f\x11\x12\x40\xa1\x8a\x5f\x11\x12\x40\
+\xb1\xe6\x76\xfa\x04\x10\x46\x25\x71\xb6\xb0\x5d\x15\x40\x14\xf7\
+\x07\x13\x87\xcb\x4d\x01\x84\x79\xf3\x7d\x9c\x9a\xf8\x6b\x4d\x01\
+\x44\x31\x73\x5c\x4b\x9c\xde\xb9\x2b\x80\x28\xe6\x1f\xa6\xde\x01\
+\x9b\xeb\x02\x88\x62\xe9\x30\x55\x40\x73\x45\x00\x51\xac\x67\xa9\
+\x3f\x1e\x6c\x2f\x09\x20\x8a\xcd\x56\xea\x1a\xb6\xe7\x04\x10\xc5\
+\x6e\xea\xcd\x57\xd8\x8a\x90\x00\x0a\xf8\xeb\x80\xd4\x9b\xaf\x7f\
+\x7f\x4a\x00\x51\x1c\x36\x12\x87\x03\xfb\x13\x02\x08\xa2\xf2\x20\
+\xf5\xe6\x1b\xda\xaf\x0b\x20\x88\xea\xc3\xd4\x9b\x6f\xa4\x88\x15\
+\x21\x01\x14\xa2\x76\x3c\x93\x38\x2d\x62\x45\x48\x00\xc5\x18\xf8\
+\x78\x32\x71\x5a\xc0\x8a\x90\x00\x0a\x32\x78\x92\x9a\xf8\x93\xd9\
+\x80\x00\x82\x18\x3a\x4d\x4d\xfc\x99\xbd\x7e\x01\x04\x31\x72\x92\
+\x9a\xf8\xb3\x3b\x35\x01\x04\x31\x76\x9a\x9a\xf8\x0b\x9d\xfd\x8a\
+\x90\x00\x0a\x54\x7f\x92\x5c\x11\x6a\x09\x20\x8a\x89\x93\xd4\x9b\
+\x6f\xb5\x29\x80\x28\xa6\x0b\x5f\x11\x12\x40\xb1\xe6\x1e\x15\xbc\
+\x22\x24\x80\x82\x2d\x1e\xa5\x0a\x68\x35\x04\x10\xc5\xda\x7e\xea\
+\x74\x6b\x49\x00\x51\xdc\xdd\x4a\xdd\xcb\xf6\xbc\x00\xa2\xd8\xd9\
+\x4c\x1c\xd6\x76\x6f\x0b\x20\x8a\xfd\xe4\x8a\x50\x36\x2d\x80\x28\
+\x0e\x57\x13\x87\x03\xd9\xa4\x00\x82\xa8\x1c\x2d\x27\x4e\x87\x3a\
+\xf1\x15\x21\x01\x94\x42\xf5\x41\xea\xcd\x37\x92\xdd\x14\x40\x10\
+\xb5\xe3\xd4\x5a\x78\x07\x56\x84\x04\x50\x12\xfd\x8f\x53\x13\xbf\
+\xde\xf6\x15\x21\x01\x94\xc5\xe0\xc9\x78\xe2\xb4\xed\x2b\x42\x02\
+\x28\x8d\x62\x56\x84\x04\x50\x1e\xc3\x45\xac\x08\x09\xa0\x44\x2e\
+\x58\x11\x6a\xeb\x57\x84\x04\x50\x26\xe9\x15\xa1\xa5\x96\x00\xa2\
+\xb8\x60\x45\xa8\x25\x80\x28\xa6\x3f\x4a\x4d\xfc\xf5\x4d\x01\x44\
+\x31\xfb\x28\x75\x25\x77\xef\x08\x20\x8a\xf4\x8a\x50\xb3\x21\x80\
+\x28\x56\xef\xa7\x4e\xb7\x96\x05\x10\xc5\xc6\x4e\xea\xa2\xb6\xe6\
+\x05\x10\xc5\x56\xea\xbf\x17\x6e\xd3\x8a\x90\x00\xca\x28\x4b\xbd\
+\xf9\xda\xb3\x22\x24\x80\x52\x3a\xe8\xd8\x8a\x90\x00\x4a\xa9\x72\
+\xb4\x92\x38\x1d\xca\xc6\x05\x10\x44\xf5\xa8\x43\x2b\x42\x02\x28\
+\xa9\xf4\x8a\xd0\xe8\x95\xaf\x08\x09\xa0\xac\xfa\x1f\xa7\xbe\x1c\
+\x59\xdf\xbf\x2e\x80\x20\xd2\x2b\x42\x13\xfb\x03\x02\x08\xe2\xfa\
+\xe9\x58\xe2\x74\x3a\xeb\x17\x40\x10\xc3\x27\x37\x12\xa7\xb7\x77\
+\x6b\x02\x08\x62\xf4\x64\x38\x71\x3a\x7f\x95\x2b\x42\x02\x28\xb5\
+\xfa\x69\x72\x45\x68\xab\x22\x80\x20\xc6\x4f\x53\x6f\xbe\x46\x53\
+\x00\x51\x4c\xb5\x79\x45\x48\x00\x65\x37\x7b\xdc\xd6\x15\x21\x01\
+\x94\xde\xc2\x83\xe4\x8a\xd0\xaa\x00\xa2\x68\x1c\xa4\x4e\x5b\xcb\
+\x02\x88\xe2\xce\x6e\xea\xe6\xb6\x17\x04\x10\x45\x2b\xb5\x22\xd4\
+\xb7\x33\x2b\x80\x28\xd2\x2b\x42\x7b\x33\x02\x88\xe2\x60\x2d\x71\
+\x38\xb0\x37\x29\x80\x20\x2a\x87\x2b\x89\xd3\x2b\x58\x11\x12\x40\
+\x97\xa8\x1e\xa5\xde\x7c\x97\x5f\x11\x12\x40\xb7\xa8\x3d\x4a\xad\
+\x85\x8f\x66\x37\x04\xd0\x35\x7e\xfe\xf6\x32\xbe\x7b\x9d\xfa\x35\
+\xeb\xd9\x90\x00\x42\x9b\xc8\x06\x05\x10\xda\xf4\xa5\xbe\x22\x24\
+\x80\xee\x77\xa9\x15\x21\x01\xf4\x80\xf9\x96\x00\x82\xff\x1e\x20\
+\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x50\
+\x9c\x9b\xd3\xed\xd2\x27\x80\x6e\x70\xef\x59\xbb\x8c\x08\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\
+\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\
+\x00\x02\x40\x00\x08\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\
+\x00\x02\x40\x00\x08\x00\x01\x20\x80\xab\xf3\xee\xaf\x22\xfd\xed\
+\xb6\x8b\x0e\xe0\x97\xaf\x8b\xf4\x83\xdb\x36\x02\x10\x00\x02\x40\
+\x00\x08\x00\x01\x20\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\
+\x00\x08\xa0\x3d\x16\x37\x8a\xb4\xe4\xb6\x8b\x0e\xa0\x79\x52\xa4\
+\x03\xb7\x6d\x04\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x02\x40\
+\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\
+\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\
+\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x80\x0b\x9c\xbf\
+\x26\x87\xf3\x9e\x0d\xe0\xec\x47\x72\x38\x33\x02\x10\x00\x02\x40\
+\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\
+\x01\xd0\x65\x01\x64\x9f\x90\x43\xd6\xb3\x01\xcc\xac\x92\xc3\x8c\
+\x11\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x9d\x0e\xe0\xd5\xaf\xe4\xf0\
+\xaa\x67\x03\x78\xf9\x1b\x39\xbc\x34\x02\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\xd0\
+\x65\x01\x3c\xf9\x82\x1c\x9e\xf4\x6c\x00\x83\x43\xe4\x30\x68\x04\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\
+\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\
+\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\
+\x00\x08\x00\x01\x20\x00\x04\x40\xa7\x03\x38\xfb\x89\x1c\xce\x7a\
+\x36\x80\xf3\xdf\xc9\xe1\xdc\x08\x40\x00\x08\x00\x01\x20\x00\x04\
+\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x40\x97\x05\
+\xf0\xf4\x4b\x72\x78\xda\xb3\x01\x54\xaa\xe4\x50\x31\x02\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\
+\x80\x00\x10\x00\x05\x04\xf0\xfe\x1f\x72\x78\xdf\xb3\x01\x3c\xff\
+\x8a\x1c\x9e\x1b\x01\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\xe8\xb2\x00\x46\x67\xc9\
+\x61\xb4\x67\x03\x38\xfe\x9c\x1c\x8e\x8d\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\
+\x80\x00\xe8\x74\x00\x6f\xff\x24\x87\xb7\x3d\x1b\xc0\x8b\x6f\xc8\
+\xe1\x85\x11\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\
+\x80\x00\x10\x00\x02\x40\x00\x08\x80\x2e\x0b\x60\x23\x23\x87\x8d\
+\x9e\x0d\xa0\x71\x9f\x1c\x1a\x46\x00\x02\x40\x00\x08\x00\x01\x20\
+\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\
+\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\x01\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\
+\x80\x00\x88\x17\xc0\x9b\xef\xe9\x98\x37\x25\x0c\xe0\xdd\x1f\x74\
+\xcc\x3b\x23\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\xff\xe1\x5f\x84\x8e\x29\x15\
+\xda\xf7\x1e\xd2\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\
+\x00\x00\x0a\x7c\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x03\x00\x00\x00\xc3\xa6\x24\xc8\
+\x00\x00\x00\x03\x73\x42\x49\x54\x08\x08\x08\xdb\xe1\x4f\xe0\x00\
+\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\x95\x00\x00\x0e\x95\x01\
+\xf1\x59\xb9\x5c\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\
+\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\x70\
+\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x01\xcb\x50\x4c\x54\
+\x45\xff\xff\xff\x00\x00\x00\x00\x00\x00\x01\x01\x01\x04\x04\x04\
+\x05\x05\x05\x05\x06\x06\x06\x06\x07\x07\x07\x07\x10\x10\x10\x10\
+\x11\x12\x11\x11\x11\x11\x12\x12\x12\x12\x12\x12\x13\x13\x13\x13\
+\x13\x13\x13\x14\x15\x15\x15\x17\x18\x18\x1d\x1e\x1f\x22\x23\x24\
+\x22\x24\x25\x23\x24\x25\x24\x24\x24\x24\x25\x26\x24\x26\x27\x25\
+\x25\x25\x25\x27\x28\x26\x26\x26\x27\x27\x27\x28\x28\x28\x29\x29\
+\x29\x2a\x2a\x2a\x2d\x2d\x2d\x34\x34\x34\x37\x39\x3b\x38\x3b\x3c\
+\x39\x3b\x3d\x3a\x3c\x3e\x3a\x3d\x3e\x3b\x3d\x3f\x3c\x3c\x3c\x3c\
+\x3e\x40\x3c\x3f\x41\x41\x41\x41\x42\x42\x42\x43\x43\x43\x44\x44\
+\x44\x45\x45\x45\x46\x46\x46\x4c\x4f\x51\x51\x54\x57\x54\x58\x5a\
+\x55\x59\x5b\x56\x59\x5c\x56\x5a\x5c\x57\x5b\x5d\x58\x5b\x5e\x59\
+\x5c\x5f\x59\x5d\x5f\x5a\x5a\x5a\x62\x62\x62\x62\x66\x69\x65\x65\
+\x65\x66\x66\x66\x67\x67\x67\x68\x68\x68\x69\x69\x69\x6a\x6a\x6a\
+\x6b\x6b\x6b\x6c\x6c\x6c\x71\x71\x71\x71\x75\x78\x71\x76\x79\x72\
+\x76\x7a\x73\x77\x7a\x73\x78\x7b\x74\x79\x7c\x75\x79\x7d\x75\x7a\
+\x7d\x76\x76\x76\x79\x79\x79\x7e\x83\x86\x84\x89\x8d\x88\x88\x88\
+\x89\x8f\x93\x8a\x8f\x93\x8b\x90\x94\x8b\x91\x95\x8c\x92\x96\x8d\
+\x8d\x8d\x8d\x92\x96\x8e\x8e\x8e\x8f\x8f\x8f\x90\x90\x90\x91\x91\
+\x91\x92\x92\x92\x93\x93\x93\x94\x94\x94\x97\x97\x97\x98\x98\x98\
+\x9b\x9b\x9b\x9b\xa1\xa6\x9c\xa2\xa6\x9c\xa3\xa7\x9d\xa3\xa8\x9e\
+\xa4\xa9\x9f\xa5\xa9\xa7\xae\xb3\xa8\xaf\xb4\xa9\xb0\xb4\xaa\xb0\
+\xb5\xae\xae\xae\xae\xb5\xba\xaf\xb6\xbb\xb1\xb1\xb1\xb2\xb2\xb2\
+\xb3\xb3\xb3\xb4\xb4\xb4\xb5\xb5\xb5\xb6\xb6\xb6\xb7\xb7\xb7\xb9\
+\xb9\xb9\xbb\xbb\xbb\xbd\xbd\xbd\xbf\xbf\xbf\xcc\xcc\xcc\xce\xce\
+\xce\xcf\xcf\xcf\xd0\xd0\xd0\xd1\xd1\xd1\xd2\xd2\xd2\xd3\xd3\xd3\
+\xd4\xd4\xd4\xd5\xd5\xd5\xd6\xd6\xd6\xd7\xd7\xd7\xda\xda\xda\xdc\
+\xdc\xdc\xe2\xe2\xe2\xe3\xe3\xe3\xe4\xe4\xe4\xe5\xe5\xe5\xe7\xe7\
+\xe7\xe9\xe9\xe9\xea\xea\xea\xeb\xeb\xeb\xec\xec\xec\xee\xee\xee\
+\xef\xef\xef\xf0\xf0\xf0\xf1\xf1\xf1\xf2\xf2\xf2\x9f\x9d\xab\xf6\
+\x00\x00\x00\x02\x74\x52\x4e\x53\x00\x40\x00\x4f\x8c\xa8\x00\x00\
+\x08\x15\x49\x44\x41\x54\x78\xda\xed\xdd\x49\x6c\x94\x75\x1c\xc7\
+\xe1\x7f\x5b\x40\x68\x11\xd4\xb0\xc8\xa2\x88\x68\x5c\xc0\x2d\x46\
+\x16\x4d\xdc\x20\xd1\x44\x2f\x8a\xa8\x11\xdc\x0e\xa0\x72\x61\x51\
+\xe0\xe2\xc9\x03\x09\x68\x0c\x5e\x94\x83\x37\x11\x1a\x0f\xee\x02\
+\x1a\x4f\xb8\xe3\x12\x3d\xa8\x28\xd5\x44\x41\x69\x14\x54\xa4\x94\
+\x6d\x5c\x86\xfb\xfb\x2f\x53\xe9\xe0\xdb\xf9\x3d\x9f\x23\x93\x61\
+\xc9\xef\xc9\xbc\x5f\x9a\x40\x9b\xd3\xf1\xd5\xd4\xac\xff\xb5\xa6\
+\xe3\x3c\x60\x73\x52\xe8\x00\x00\x40\x00\x08\x00\x01\x20\x00\x04\
+\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x6a\x6e\xf8\x04\
+\xd5\xb5\xe1\x25\x07\x30\x75\x85\xea\xda\x54\x8f\x00\x01\x20\x00\
+\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x08\x00\x01\x20\x00\x00\x10\x00\x02\x40\x00\x08\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\xd0\x57\x55\
+\xba\x94\xed\xef\x00\x00\x3a\x96\x2b\x5b\xa7\x47\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\xf5\x5b\x00\x27\x9f\xa7\x6c\x43\x02\x00\x18\xb7\x48\xd9\
+\x4e\xf5\x08\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\
+\x00\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x40\xdd\xfa\
+\xf1\x31\x65\xdb\x1d\x00\x40\x77\xa7\xb2\x1d\xf6\x08\x10\x00\x02\
+\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\
+\x00\xf5\x67\x00\x2d\x83\x94\xad\x29\x00\x80\x73\xd7\x28\xdb\x18\
+\x8f\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\
+\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\
+\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x00\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x04\xe9\xe0\xba\
+\x52\xb5\x17\x80\x13\x5c\xe5\xfd\x52\xb5\x1f\x00\x01\x20\x00\x04\
+\x80\x00\x10\x00\x35\xb4\xeb\x07\x57\x8c\x0c\x60\xfb\xea\x5f\x5c\
+\x31\x30\x80\x2d\x4f\x1d\x72\xc4\xb8\x00\x2a\x1b\xda\xff\x76\xc3\
+\xb8\x00\xf6\xad\x7d\xc7\x05\x03\x03\xd8\xf5\xc4\x57\x0e\x18\x18\
+\xc0\xf6\xd5\xbf\xba\x5f\x60\x00\xe6\x5f\x68\x00\xe6\x5f\x6c\x00\
+\x5d\x7d\x34\xff\x5a\x1f\x2d\x55\x23\x01\xa8\x71\xfe\x3d\xde\x47\
+\xf3\xaf\x79\x6c\xa9\x1a\x08\x80\xf9\x07\x80\xf9\x07\x80\xf9\x07\
+\x40\xbd\xe7\x9f\xfa\x27\x80\x3e\x9b\x7f\xea\x97\x00\xcc\xbf\xd8\
+\x00\xcc\xbf\xd0\x00\x2a\xed\xe6\x5f\x64\x00\x5d\x6b\xb7\xb8\x57\
+\x60\x00\xe6\x5f\x6c\x00\x1d\xe6\x5f\x68\x00\x5b\xd6\x98\x7f\x81\
+\x01\x98\x7f\xb1\x01\x98\x7f\xb1\x01\x98\x7f\xb1\x01\x98\x7f\xb1\
+\x01\x98\x7f\xa1\x01\x98\x7f\xb1\x01\x98\x7f\xb1\x01\x98\x7f\xb1\
+\x01\x98\x7f\xb1\x01\x98\x7f\xa1\x01\x98\x7f\xb1\x01\x64\xe7\xdf\
+\x98\xcb\x5c\x2d\x00\x80\xce\xdc\xfc\xbb\xe0\xb6\x36\x57\x6b\x7c\
+\x00\x1d\xab\x8a\xe7\x5f\xd3\x8c\x1b\x5a\x1c\xad\xf1\x01\xbc\x9b\
+\x99\x7f\x83\x6e\x9e\xe6\x64\x8d\x0f\xa0\xd2\xbe\xbe\x78\xfe\x0d\
+\x9b\x3d\xc9\xc5\x1a\x1f\x40\x76\xfe\x8d\xbe\x6b\xb4\x83\x35\x3e\
+\x80\xfc\xfc\xbb\x7d\x70\xe1\x8f\xef\xd9\x59\x6b\x7f\xb8\x77\xf9\
+\x01\xf4\x7e\xfe\xbd\xba\xb2\xd6\x3e\x72\xef\xd2\x03\x30\xff\x42\
+\x03\x30\xff\x62\x03\x30\xff\x62\x03\xe8\xf5\xfc\x53\x43\x01\xf0\
+\xd5\xbf\xd8\x00\xcc\xbf\xd0\x00\xcc\xbf\xd8\x00\xcc\xbf\xd8\x00\
+\xcc\xbf\xd8\x00\xcc\xbf\xd8\x00\xcc\xbf\xd0\x00\xcc\xbf\xd8\x00\
+\xcc\xbf\xd8\x00\x3a\x9f\xcc\xcd\xbf\x39\xe6\x5f\x00\x00\x1d\xab\
+\x3a\x8b\xe7\xdf\xf4\x1b\x06\xe4\xde\x33\xf2\xd2\x5a\x9b\x78\xcc\
+\x5f\xff\xf0\xdb\xa5\x6a\x5f\x34\x00\xf9\xf9\x37\x3d\xff\xa6\x09\
+\xd7\xd6\xda\x25\xc7\x06\xf0\x62\xa9\x0a\x06\x20\x3f\xff\x6e\x31\
+\xff\x02\x00\xe8\x61\xfe\x8d\x71\x98\xc6\x07\x90\x9d\x7f\xe7\x9b\
+\x7f\x11\x00\xe4\xe7\xdf\x8d\x03\x9c\xa5\xf1\x01\xfc\xa7\xf9\xa7\
+\x46\x01\x60\xfe\xc5\x06\x60\xfe\xc5\x06\x60\xfe\xc5\x06\x60\xfe\
+\xc5\x06\x90\x9d\x7f\x37\x99\x7f\x01\x00\xf4\x30\xff\xce\x71\x8d\
+\xc6\x07\xf0\xcf\xb3\x99\xf9\x77\x8a\xf9\x17\x02\x40\xd3\xac\x93\
+\x8a\x5f\xd8\xfb\xb9\x5b\x84\x78\x04\x9c\xb3\xe2\xf4\xe2\x8f\x86\
+\x0f\x37\x57\x5c\x23\xc2\x08\x3c\x7d\xe9\x85\xc5\x2f\x6c\x7b\xe1\
+\xc0\x89\xff\xe3\x9f\x74\x7f\xa9\x1a\x1e\xe1\x6f\x01\x43\x1f\xba\
+\xba\xf8\x85\x5f\x36\xec\x3a\xe1\xbf\x99\x81\x57\x94\xaa\xb6\x08\
+\x00\x52\xcb\x9d\x73\x8b\x7f\xd5\x3f\x5f\xdc\xee\x23\x39\x00\x80\
+\x94\xae\x5a\x52\x3c\x05\x8f\x6c\xfc\xe0\x1f\x27\x09\x00\x20\x4d\
+\xca\x4d\xc1\x8f\x36\x99\x82\x11\x00\xe4\xa7\xe0\xb7\xff\xc7\x14\
+\x04\xe0\xc4\x97\x9f\x82\xcf\xff\xec\x2a\x01\x00\xe4\xa7\x60\xd7\
+\x4b\xa6\x60\x04\x00\x47\xa7\xe0\x90\xcc\x14\x7c\xdf\x14\x8c\x00\
+\x20\x4d\x5a\x9e\x99\x82\x5b\x37\x9a\x82\x11\x00\xa4\xd1\x4b\x27\
+\x17\xbf\xb0\xbd\xbd\x3b\xff\xae\x23\x87\x6a\xed\xa0\xfb\x96\x1b\
+\x40\x1a\xfa\xe0\x35\xc5\x2f\xec\x5e\xff\x53\xf6\x4d\x5f\x3c\x53\
+\x6b\x9b\xdd\xb7\xe4\x00\x52\xcb\x1d\xf3\x32\x53\xf0\xe5\x6f\x1d\
+\x27\x00\x80\x94\xae\xcc\x4e\xc1\xf7\x4c\xc1\x08\x00\xaa\x53\x70\
+\x6c\xf1\x0b\x1f\xbf\x71\xc4\x7d\x02\x00\x48\xa3\x97\x64\xa6\x60\
+\x47\x4f\x53\x50\x0d\x03\x20\xb5\xe5\xa6\xe0\x9e\x75\x3f\xb9\x50\
+\x00\x00\xf9\x29\xd8\xfd\xd2\x37\x4e\x14\x00\x40\x75\x0a\x2e\x2d\
+\x9e\x82\x95\x4d\xef\x9a\x82\x11\x00\xa4\xb3\x73\x53\xf0\x93\xd7\
+\x4d\xc1\x08\x00\xaa\x53\x70\x4a\xf1\x0b\xdf\xb5\xef\x77\xa6\x00\
+\x00\x52\xdb\x03\xd7\x66\xa6\xe0\xf3\x3b\xdd\x29\x00\x80\xd4\x72\
+\xfb\xbc\xe2\xff\x18\xb6\xfb\xe5\x6d\x0e\x15\x00\x40\xfe\xab\x82\
+\x95\xcd\xef\x98\x82\x11\x00\xe4\xa7\xe0\xa7\xa6\x60\x08\x00\x3d\
+\x4c\xc1\x0d\xa6\x60\x04\x00\xf9\x29\xf8\xdb\x73\x3b\x32\x6f\x39\
+\x73\x4a\xad\x8d\x70\xef\xd2\x03\xa8\x4e\xc1\xbb\x8b\xa7\xe0\xc1\
+\x57\xbe\x2e\x7e\xc7\xcc\x85\xb5\x76\xb9\x7b\x97\x1f\x40\x4a\x33\
+\x72\x5f\x15\x7c\x73\x8b\x29\x18\x01\x40\x9a\xb8\x62\x5c\xf1\x0b\
+\x9f\xbd\x76\xd8\xc5\x02\x00\x48\xa3\x16\x67\xa6\xe0\xf7\xed\x5d\
+\x4e\x16\x00\x40\x75\x0a\x5e\x97\x99\x82\xeb\x76\xb8\x59\x00\x00\
+\xa9\x65\x4e\x76\x0a\x7e\xe5\x68\x01\x00\x1c\x9d\x82\xc5\xff\x58\
+\xbe\xf2\xd6\x97\xae\x16\x01\x40\x9a\xb8\x2c\x33\x05\x7f\x77\xb5\
+\x10\x00\xaa\x53\xf0\x22\xf7\x89\x0c\x20\xb5\x2d\xb8\xce\x81\x22\
+\x03\xa8\x4e\xc1\x7b\x7c\xe7\xd0\xc8\x00\x52\x9a\xbe\xb4\xcd\x8d\
+\x22\x03\xc8\x4f\x41\xc5\x00\x90\x46\x2d\x31\x05\x43\x03\x48\xad\
+\x0b\xae\x77\xa6\xc8\x00\x52\xcb\x6d\xa6\x60\x68\x00\xd5\x29\xf8\
+\xb0\x29\x18\x1a\x40\x3a\xcb\x14\x8c\x0d\xa0\x3a\x05\x2f\x76\xab\
+\xc8\x00\x52\xeb\x7c\x53\x30\x34\x80\xea\x14\xbc\xb7\x0e\x53\xf0\
+\xaf\x9d\xa5\xea\x10\x00\x3d\x34\xad\x0e\x53\xf0\xc0\xca\x52\xb5\
+\x07\x80\x1e\xa7\xe0\xf2\xf1\x3e\xb2\x23\x03\x48\x23\x17\x9b\x82\
+\xa1\x01\x54\xa7\xe0\x4c\x27\x8b\x0c\x20\xb5\xcc\xbe\xd7\x57\x05\
+\x23\x03\xa8\xcf\x14\x04\xa0\x3f\x65\x0a\x06\x07\x60\x0a\x46\x07\
+\x90\x5a\x17\x98\x82\xa1\x01\xa4\xe6\xd9\xf7\x99\x82\x91\x01\xa4\
+\x34\xf5\x91\x93\xdd\x2e\x32\x80\x34\xe1\x11\x53\x30\x34\x80\xea\
+\x14\xbc\xc4\xf5\x22\x03\x48\xad\xf3\x67\x39\x5f\x64\x00\xa9\xf9\
+\x56\x53\x30\x34\x80\xbe\x98\x82\x03\xae\x2a\x55\x43\x01\xe8\xe5\
+\x14\x5c\x76\xc6\xf1\xfd\x04\x83\xe7\x96\xaa\x61\x00\xf4\xb2\x11\
+\x8b\x4c\xc1\xd0\x00\x8e\x4e\xc1\x26\x57\x0c\x0c\xa0\x3a\x05\x27\
+\xbb\x62\x64\x00\x29\x0d\x71\xc5\xd8\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x00\x20\x00\x04\
+\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\
+\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\xbd\x6f\
+\xdb\x42\x65\xfb\xd9\x27\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\xf5\x5b\x00\x43\
+\xcf\x52\xb6\xc1\x01\x00\x8c\x5f\xae\x6c\xa7\x79\x04\x08\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\
+\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\
+\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\
+\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x00\x08\x00\x01\x20\
+\x00\x04\x80\x00\x10\x00\x02\xa0\x6e\xed\x58\xa5\x6c\x7b\x02\x00\
+\xd8\xff\x83\xb2\x1d\xf2\x08\x10\x00\x02\x40\x00\x08\x00\x01\x20\
+\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\xa0\x7e\x0b\xe0\
+\xfc\xa7\x95\x6d\xac\x4f\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\
+\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\
+\x00\x10\x00\x02\x00\x00\x01\x20\x00\x04\x40\x5f\xb4\xd5\xf7\x7f\
+\xad\x6f\x5b\x4b\x0e\x60\xaf\xef\xff\x5a\xdf\xf6\x7a\x04\x08\x00\
+\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\
+\x04\x80\x00\x50\x4d\xfd\x0b\x7c\x5d\xfd\xe4\xca\xf1\xea\xf4\x00\
+\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x05\x0a\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x03\x00\x00\x00\xc3\xa6\x24\xc8\
+\x00\x00\x00\x03\x73\x42\x49\x54\x08\x08\x08\xdb\xe1\x4f\xe0\x00\
+\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\x95\x00\x00\x0e\x95\x01\
+\xf1\x59\xb9\x5c\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\
+\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\x70\
+\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\x5a\x50\x4c\x54\
+\x45\xff\xff\xff\x00\x00\x00\x00\x00\x00\x07\x07\x07\x15\x15\x15\
+\x25\x25\x25\x2d\x2d\x2d\x33\x33\x33\x34\x34\x34\x3c\x3c\x3c\x4c\
+\x4c\x4c\x58\x58\x58\x5a\x5a\x5a\x62\x62\x62\x71\x71\x71\x88\x88\
+\x88\x97\x97\x97\x9c\x9c\x9c\xa8\xa8\xa8\xbd\xbd\xbd\xc7\xc7\xc7\
+\xca\xca\xca\xcc\xcc\xcc\xd1\xd1\xd1\xd3\xd3\xd3\xe3\xe3\xe3\xe7\
+\xe7\xe7\xea\xea\xea\xef\xef\xef\xf2\xf2\xf2\x8a\xa9\x96\xb7\x00\
+\x00\x00\x02\x74\x52\x4e\x53\x00\x40\x00\x4f\x8c\xa8\x00\x00\x04\
+\x14\x49\x44\x41\x54\x78\xda\xed\xdd\xd1\x4a\x83\x70\x18\xc6\xe1\
+\xe9\x64\x43\xb7\x82\xb1\x03\x83\xee\xff\xd2\x0a\x5a\x63\x44\x6d\
+\xe2\x32\xac\x2b\xf8\x60\xe0\x24\xff\xf8\x3c\x17\xe0\xc1\xe7\x0f\
+\xdf\x43\xf3\xc5\x30\x59\xce\xbf\xca\x06\xbe\xc0\x7c\xc1\xac\x09\
+\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x70\xfb\xf3\x0a\x46\x95\x4f\x3c\x80\xaa\x66\
+\x54\x95\x09\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\
+\x00\x04\x80\x00\x10\x00\x02\xb8\x83\xe6\x85\x50\xe3\x0b\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x08\x80\x64\x03\xc8\xfc\xfe\x35\x96\xcd\x20\x80\xd2\xef\
+\x5f\x63\xa5\x09\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\
+\x20\x00\x27\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\
+\x26\xe3\xf4\x9e\xb0\x93\x00\x06\xeb\xbe\x13\xd6\x09\x00\x01\x20\
+\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\
+\x00\x10\x00\x02\x08\xd4\xcf\x09\xab\x05\x80\x00\x10\x00\x02\x40\
+\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\
+\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\
+\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x08\x80\xc9\x04\xd0\x7d\x10\xea\xe6\x10\xc0\x85\x50\x67\
+\x02\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x90\x6c\x00\xeb\x1d\xa1\xf5\x0c\x02\x58\
+\x56\x84\x96\x26\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\
+\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\
+\x80\x00\x9c\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\xc0\x94\
+\x5c\xbe\x12\x76\x11\xc0\x60\xe7\xcf\x84\x9d\x05\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\x01\x04\x36\x0f\x09\xdb\x08\x60\xb0\xed\x63\xc2\xb6\x02\
+\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\
+\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\
+\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\xa6\x14\x40\x7f\x25\xd4\xcf\x20\
+\x80\xf6\x48\xa8\x35\x01\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x48\x36\x80\xa2\x22\
+\x54\xcc\x20\x80\xd5\x8e\xd0\xca\x04\x20\x00\x04\x80\x00\x10\x00\
+\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\
+\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\
+\x80\x00\x10\x00\x02\x10\x80\x13\x08\x00\x01\x20\x00\x04\x80\x00\
+\x10\x00\x02\x40\x00\x93\x71\x78\x4d\xd8\x41\x00\x83\xfd\x26\x4d\
+\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\
+\x01\x20\x00\x04\x80\x00\x62\xc5\x32\x61\x85\x00\x06\xdb\x3f\x25\
+\x6c\x2f\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\
+\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\
+\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\
+\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x4c\x26\x80\xf6\
+\x48\xa8\x9d\x41\x00\xfd\x95\x50\x6f\x02\x10\x00\x02\x40\x00\x08\
+\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x90\
+\x6c\x00\x65\x4d\xa8\x9c\x41\x00\x59\x41\x28\x33\x01\x08\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\
+\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\
+\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\x80\x00\x10\x00\x02\x40\
+\x00\x08\x00\x01\x20\x00\x04\x80\x00\x04\xe0\x04\x02\x40\x00\x77\
+\xd3\xbc\x31\xaa\x66\xe2\x01\xf4\x3f\x8c\xaa\x37\x01\x08\x00\x01\
+\x20\x00\x04\x80\x00\x10\x00\x02\x40\x00\x08\x00\x01\x20\x00\x04\
+\x80\x00\xb8\xc9\x1f\x46\x2b\x11\xe4\x3c\x73\x90\x2c\x00\x00\x00\
+\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x39\xe5\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x12\x56\x00\x00\x12\x56\
+\x01\x33\xb0\xfd\x65\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x39\x62\x49\x44\
+\x41\x54\x78\xda\xed\x9d\x07\x74\x55\xc5\xa2\xb0\x4d\x27\x3d\x94\
+\x10\x4a\x48\x20\xa1\x84\xde\x92\x50\x12\x6a\x12\x82\x05\x15\xec\
+\xa2\x82\xbd\x5e\xbd\x16\xec\x05\xf5\xaa\xd7\x7e\x05\x41\xec\x05\
+\x7b\xb9\x0a\x02\xa2\x82\x22\x2a\x22\x48\x07\x7b\xc1\x06\x16\x2c\
+\x58\x2f\x0a\xce\x3f\x73\xd6\x89\x2f\xbf\x52\x92\x93\xd9\xfb\xcc\
+\xec\xf9\x58\xeb\x5b\xeb\xbd\xf5\xde\x12\xce\xde\xb3\xe7\xfb\xce\
+\xd9\x7b\xcf\xec\x26\x84\xd8\x0d\x00\x00\xdc\x41\xfe\xc9\x90\x94\
+\x48\x0e\x95\x9c\x2c\x39\x57\x72\x85\x64\x92\xe4\x6e\xc9\x63\x92\
+\xb9\x92\x57\x25\xab\x25\x1f\x49\x36\x49\x7e\x92\x7c\x29\xf9\x40\
+\xb2\x52\xf2\xb2\x64\x8e\xe4\x11\xc9\x1d\x92\x1b\x25\x97\x49\xce\
+\x96\x9c\x28\xd9\x5f\xd2\x5d\xd2\x88\xe3\x6e\xe0\x38\xe0\x20\x00\
+\x00\x04\x52\xf2\x71\x92\x42\xc9\x1e\x92\xd3\x25\xb7\x4a\x16\x48\
+\x36\x4a\x84\xcf\x6c\x0b\x47\x84\x8a\x8a\x9b\xc2\x71\x30\x5c\xd2\
+\x9a\x73\x45\x00\x00\x00\x40\xc3\x64\x5f\x12\xfe\xe6\xfd\x5f\xc9\
+\x3a\xc9\x96\x28\x88\x3e\x12\x7e\x94\x2c\x93\xdc\x2f\x39\x41\xd2\
+\x89\x73\x4a\x00\x00\x00\xc0\xf6\x85\x1f\x13\xfe\x69\xfd\x34\xc9\
+\x0c\xc9\xf7\x96\xc8\xbe\xae\x7c\x2e\x99\x2e\x39\x4a\xd2\x96\x73\
+\x4e\x00\x00\x00\xb8\x2c\xfd\x8e\xe1\x6f\xc8\x8f\x4a\xbe\x0a\x98\
+\xf0\x77\xc5\x87\x92\x3b\x25\x63\x25\xad\x18\x0f\x04\x00\x00\x40\
+\xd0\xa5\x5f\x2c\x99\x2c\xf9\xcc\x31\xe1\xef\x8a\xb7\x24\x97\xaa\
+\x67\x1c\x18\x27\x04\x00\x00\x40\x50\xa4\x9f\x1b\x7e\x2a\xff\x4d\
+\x44\x5f\x27\x5e\x91\x1c\x27\xc9\x64\xfc\x10\x00\x00\x00\xb6\x49\
+\x3f\x55\x72\x84\x64\x5e\xf8\x89\x79\xc4\x5e\x7f\x7e\x0d\xbf\x8e\
+\xa8\xde\x7a\x88\x67\x5c\x11\x00\x00\x00\xa6\x4a\x3f\x56\x52\x29\
+\xb9\x2f\xfc\x7e\x3d\x12\xd7\xc7\x17\x92\x1b\x24\x3d\x19\x6b\x04\
+\x00\x00\x80\x29\xe2\x6f\x24\x39\x45\xb2\x1e\x51\xfb\xc2\x52\xc9\
+\x68\xf5\xe6\x04\xe3\x8f\x00\x00\x00\x88\x86\xf8\xd3\x24\x67\x45\
+\x69\x21\x1e\xd8\x6d\xb7\xb5\xe1\x95\x0f\xe3\x18\x8f\x04\x00\x00\
+\x80\x1f\xe2\xcf\x92\x5c\x14\x5e\x4a\x17\x11\x47\x9f\xf7\x25\xc7\
+\x48\x12\x09\x00\x2e\x50\x00\x00\x2f\xc4\x9f\x2d\xb9\x52\xb2\x19\
+\xe9\x1a\xc9\xa7\x92\x7f\x48\x92\x09\x00\x00\x00\xd0\x21\xfe\x56\
+\xe1\x07\xd0\x7e\x46\xb2\x56\xa0\x36\x37\x3a\x47\x92\x4e\x00\x00\
+\x00\x40\x24\xe2\x4f\x92\x5c\x28\xf9\x05\xa9\x5a\x89\x5a\x5d\x71\
+\x9c\x4b\x0f\x0b\x72\xe1\x02\x00\x34\x5c\xfe\x23\x24\xef\x22\xd1\
+\x40\xa0\xb6\x38\xee\x4e\x00\x00\x00\xc0\xae\x56\xed\x7b\x0c\x69\
+\x06\x8e\xdf\xc3\xb7\x71\xd2\x09\x00\x00\x00\xa8\x2d\xfe\xf8\xf0\
+\x2b\x7d\x3f\x22\xcb\x40\xa3\x76\x25\x3c\x88\x00\x00\x00\x00\x25\
+\xff\xc1\xe1\x77\xca\x11\xa4\x3b\x3c\x2f\xe9\x44\x00\x00\x00\xb8\
+\xfb\x5a\xdf\x7d\x2e\x0a\x30\x29\x31\x56\x34\xcb\x4a\x14\xb9\x39\
+\x8d\x44\xe3\x8c\x04\x11\x1f\x17\xe3\x62\x04\x6c\x91\x5c\xa1\x56\
+\x72\x24\x00\x00\x00\xdc\x91\xff\x50\xc9\x86\xa0\xc8\x2c\x2e\x36\
+\x46\xb4\xcf\x4b\x11\x7b\x0e\xce\x16\x67\x8e\x6b\x2b\x6e\xbd\xb8\
+\xab\x78\xec\xfa\x5e\x62\xee\xb4\x62\xf1\xea\x7d\xfd\xc5\xea\x27\
+\xca\xc4\x47\x73\x87\x88\x4d\x0b\x2b\xc4\x96\x65\x23\x84\x58\x3d\
+\xf2\x6f\xfc\xba\x74\x84\xf8\xea\xa5\xe1\xe2\x83\x39\x83\xc5\xca\
+\xc7\xca\xc4\xcb\xf7\xf6\x13\x73\xa6\xf6\x15\x0f\x5f\xd3\x53\x4c\
+\x3e\xaf\x8b\x38\xe5\x90\x3c\x51\xd9\xbf\x69\x28\x1a\x62\x62\x02\
+\x15\x02\x2b\x25\x1d\x09\x00\x00\x80\x60\x8b\x3f\x36\xbc\x8a\xdf\
+\x56\x5b\xbf\xb9\x97\x76\xcb\x14\x47\x8c\x6a\x2d\xae\x38\xb5\xa3\
+\x78\xe2\x86\xde\x62\xdd\x93\xe5\x3b\x94\xba\x57\xfc\xf4\x7a\x95\
+\x58\xf6\xc8\x40\xf1\xe0\xd5\x3d\xc5\xc5\x27\xb4\x17\x07\x56\xb7\
+\x10\x3d\x3a\xa6\x8b\xd8\x58\x6b\x7f\x49\xf8\x41\x72\x08\x01\x00\
+\x00\x10\x4c\xf9\xe7\x84\xef\xfd\x5a\x23\xa6\x84\xf8\x18\x31\xb0\
+\x57\x96\xb8\xe0\xd8\x42\x31\xff\x8e\x92\xd0\xb7\x74\x3f\x45\x5f\
+\x5f\xbe\x7b\xb5\x42\xcc\x98\xd4\x47\x9c\x36\x36\x3f\x14\x04\x16\
+\xfe\x52\x70\x9b\xcd\x2b\x09\x72\xa1\x03\x00\xfc\x5d\xfe\xc3\x6d\
+\xd8\xb4\x47\x7d\x83\x2e\xee\x9a\x29\x26\x8c\x6f\x27\x9e\xb9\xa5\
+\x58\xfc\xb8\xb8\xca\x68\xe1\xef\x8a\xaf\x17\x0e\x0f\xdd\x8a\x38\
+\xf1\xc0\x3c\x51\xd4\x2e\xd5\x96\x08\x58\x6d\xeb\x03\x82\x5c\xec\
+\x00\x00\xff\xff\x4f\xfe\x13\x25\xdb\x4c\x96\xbe\xba\xb7\x3e\xfd\
+\xca\x1e\xa1\x6f\xd0\x36\x0b\x7f\x57\x7c\x3e\x7f\x98\xb8\xe9\x9c\
+\xce\xa2\x6f\x97\x0c\xd3\x23\x40\xbd\x0e\x7a\x18\x01\x00\x00\x60\
+\xa7\xfc\x5b\x48\x5e\x30\x55\x32\xea\x1b\xf1\x55\xa7\x75\x14\x9f\
+\x3e\x3f\x34\xd0\xd2\xdf\x11\x6b\x9f\x2c\x0f\xfd\xd2\xd1\x2a\x3b\
+\xc9\xe4\x10\xb8\xd3\xa6\x5b\x02\x5c\xf8\x00\x80\xfc\x77\xdb\x6d\
+\xa0\xe4\x0b\xd3\x84\xd2\x24\x33\x41\x9c\x7c\x70\x9e\x78\xfd\xc1\
+\x01\x4e\x4a\x7f\x7b\x6c\x5d\x59\x1d\x7a\x5b\xe1\x90\xdd\x5b\x8a\
+\xe4\xa4\x38\x13\x23\x60\x8d\x24\x9f\x00\x00\x00\x30\x5f\xfe\x7b\
+\x9a\xb6\x81\x4f\x59\xef\xc6\xa1\x27\xf6\xfd\x7e\x5a\xdf\x36\x36\
+\x2f\xaa\x0c\xbd\xc2\xd8\x31\x3f\xd5\xc4\x15\x04\xbb\x11\x00\x00\
+\x00\xe6\xca\x7f\x5c\x78\xdd\x77\x23\xc4\xa1\xee\xed\x2f\xb8\xab\
+\x14\xb9\xd7\x93\x6d\x2b\xab\x43\xeb\x0f\xa8\x37\x09\x0c\x8a\x80\
+\xef\x24\x65\x04\x00\x00\x80\x79\xf2\x57\x6b\xf9\xff\x11\x6d\x51\
+\xa8\x57\xdf\xf6\x1e\xda\x9c\x9f\xf9\x35\xf0\xc7\xaa\x91\x62\xe6\
+\xe4\x3e\xa2\x5f\xf7\x2c\x53\x22\x40\xfd\xb2\xb4\x17\x01\x00\x00\
+\x60\x86\xf8\x63\x24\xd7\x9a\xf0\x34\xff\x41\x23\x5b\x86\x56\xdd\
+\x43\xde\xfa\x99\x77\x7b\x89\x18\x5a\xd2\xc4\x94\x9d\x05\xc7\x13\
+\x00\x00\x00\xd1\x95\xbf\xda\xc5\xef\x9e\x68\x4b\x41\x89\xff\x9d\
+\xa7\x07\x21\x6a\x1f\x50\x4b\x1b\xab\x67\x2a\x0c\x08\x81\x09\x04\
+\x00\x00\x40\x74\xe4\x9f\x2c\x79\x3a\xda\xaf\xf2\xa9\x6f\xa6\x88\
+\xd9\xff\x5b\x03\x77\x5d\xd6\x5d\x64\x37\x4e\x8c\x76\x04\x5c\xa7\
+\x7e\x81\x22\x00\x00\x00\xfc\x93\x7f\x63\xc9\x2b\xd1\x9a\xf8\x53\
+\x1a\xc5\x85\xde\xe1\xe7\xa9\xfe\xe8\xf2\xed\x2b\x15\xe2\x84\x03\
+\xdb\x44\x7b\x0f\x82\x7b\xd5\x2f\x51\x04\x00\x00\x80\xf7\xf2\x4f\
+\x91\xbc\x16\xad\x09\x7f\x74\x45\x8e\xf8\xf8\xd9\xa1\x08\xd8\x20\
+\x96\x3c\x38\x20\xda\xab\x0b\xde\x6b\xc2\x2f\x01\x4c\x10\x00\x10\
+\xf4\x7b\xfe\x73\xa2\x31\xc9\x17\xb6\x49\x09\x6d\x8f\x8b\x70\xcd\
+\x7d\x75\x70\xca\x05\x5d\x44\x56\x7a\x42\xb4\x22\xe0\x1a\x02\x20\
+\xfa\x13\x44\x33\xc9\xfe\x92\x7f\x4a\xfe\x2d\xb9\x3b\x3c\x61\xcc\
+\x90\xdc\x2a\xb9\x4c\x72\xb2\xa4\x5a\xd2\x88\x49\x15\xc0\xaa\xa7\
+\xfd\xef\x8b\xc6\xe4\x7e\xfa\xe1\x6d\xc5\xff\xde\xe0\xe7\x7e\x1b\
+\xf8\x72\xc1\x70\xb1\x7b\x79\x76\xb4\x22\xe0\x4c\x02\xc0\xff\x89\
+\xa1\xaf\xe4\x62\xc9\xe2\x7a\x6e\xfa\xa1\xde\xe9\x9c\x25\x39\x51\
+\xd2\x86\x49\x16\xc0\xe8\xeb\xfc\x3a\xbf\x27\x74\xf5\x6d\xf2\xa9\
+\x9b\xfa\x20\x56\x0b\x1f\x12\x54\xcf\x68\xc4\xc7\xf9\xfe\x6c\x80\
+\x5a\x87\xe2\x70\x02\xc0\x9f\x09\x61\x98\xe4\x55\x4d\x27\x6e\xab\
+\xe4\x2e\x5b\xd6\x7c\x06\x70\x70\x91\x1f\x5f\x27\xf3\x92\x6e\x99\
+\xe2\xa3\xb9\x43\x10\xaa\xc5\xbc\x7c\x6f\x3f\x91\x9b\xd3\x28\x1a\
+\xeb\x04\xec\x4e\x00\x78\x37\x19\x0c\x90\xcc\xf7\xe8\xe4\x6d\x91\
+\x4c\x92\xe4\x30\xf1\x02\x18\x71\xbd\x1f\xe1\xf7\x0a\x7f\xa7\x8e\
+\xcd\xe7\x09\xff\x80\xf0\xf5\xc2\xa8\xdc\x12\xf8\x59\xd2\x9f\x00\
+\xd0\x3b\x11\xc4\x49\xae\xf7\xe9\x04\x7e\x2b\xa9\x62\x02\x06\x88\
+\xea\x35\xbf\x87\x9f\x6b\xfb\x67\xa6\xc5\x87\x36\xed\x41\x9c\xdc\
+\x12\xd0\xc0\x26\x49\x67\x02\x40\xdf\xc3\x7d\xf3\x7d\xae\x38\x75\
+\x5b\xe0\x74\x26\x62\x80\xa8\xfd\xd2\xf7\xb3\x5f\xd7\x7b\xef\xa2\
+\x0c\xf1\xc1\x9c\xc1\x08\x33\xe0\xb7\x04\x5a\x65\x27\xf9\xe9\x90\
+\x4f\x24\xb9\x04\x40\xc3\x26\x82\x3e\x92\xf5\x51\x7c\xc7\x53\xbd\
+\x49\x90\xc4\xa4\x0c\xe0\xdb\x35\xdf\x5a\xf2\xb5\x5f\xd7\xf8\x88\
+\x81\xcd\xc4\x8f\x8b\xab\x90\xa4\x03\xa8\x35\x1c\xd4\x0a\x8e\x3e\
+\xfa\x63\x85\x5f\x6f\x9c\x05\x71\x22\x28\x97\xfc\x68\xc0\xba\xcf\
+\xcf\x10\x01\x00\xbe\xdd\xea\x7b\xd9\xaf\x6b\xfb\xd0\x3d\x5a\x8a\
+\xdf\x96\x57\x23\x47\x87\xd8\xb4\xb0\xc2\xef\x1d\x06\x6f\x21\x00\
+\xec\x95\x3f\x11\x00\xe0\xdf\x75\x7f\xa5\x5f\xd7\xf4\x69\x63\xf3\
+\x43\xf7\x87\x5d\x90\xde\xf7\x8b\x2a\xc5\x7b\xb3\x06\x8b\x45\xd3\
+\xfb\x8b\x19\x93\xfa\x88\x3b\x26\x76\x13\xff\xfe\x67\x47\x71\xe5\
+\xa9\x1d\xc5\x4d\xe7\x74\x0e\xfd\xef\x0f\x5e\xdd\x33\xf4\x7f\x53\
+\xfb\x1b\xac\x7b\xb2\x5c\xfc\xbc\x24\xb8\xbf\x8a\xa8\xcf\xe6\xf3\
+\xc3\x81\x07\x12\x00\xf6\xca\x9f\x08\x00\xf0\xfe\xba\xaf\xf6\xeb\
+\x89\x7f\xf5\x50\x58\x90\x84\xf6\xd6\x8c\x41\xe2\x96\x0b\xbb\x8a\
+\x7f\x1c\x9a\x2f\x0e\x1e\xd9\x52\x54\xf4\x6b\x2a\x7a\x74\x4c\x0f\
+\xdd\xf3\x4e\x88\x8f\xfc\xe1\xb7\x9c\xa6\x89\xa2\x7f\x8f\xac\xd0\
+\x2f\x25\x13\x4f\x6c\x2f\x9e\xbb\xb5\x24\x30\xb7\x4b\x7e\x5f\x51\
+\x2d\x0e\x1f\xd5\xca\x2f\x77\x6c\x96\xb4\x27\x00\xec\x95\x3f\x11\
+\x00\xe0\xdd\x75\xdf\x4a\xf2\x95\xd7\xd7\x6f\x5c\x6c\x4c\x68\x27\
+\xb9\xa0\x08\x5f\x6d\x45\xdc\xa2\x99\xaf\x0f\xb6\x85\x8e\x61\x71\
+\xd7\xcc\xd0\x0a\x89\x6a\xa1\xa4\x5f\x96\x56\x59\xfd\x86\xc0\x99\
+\xe3\xda\xfa\x75\xec\x96\x79\xe9\x0e\xe4\x4f\x04\x00\xd8\x7a\xdf\
+\x7f\x81\xd7\xd7\x6d\x72\x52\x9c\x98\x39\xb9\x0f\xc2\xd7\x4c\x5a\
+\x4a\x5c\xe8\x17\x02\x15\x03\xb6\x2e\x99\x7c\xcd\x19\x9d\x44\x4c\
+\x8c\x2f\xc7\xeb\x66\x02\xc0\x6e\xf9\x13\x01\x00\x7a\xaf\xfd\xcb\
+\xbd\xbe\x5e\xd5\xcf\xe0\xb6\x6d\xe6\xf3\xc6\xc3\x03\xc5\x91\xfb\
+\xb6\x36\x4e\xf8\x3b\x23\x23\x2d\x5e\x1c\xb7\x7f\x1b\xf1\xee\x2c\
+\xfb\x5e\xa9\xbc\xee\xcc\x22\xbf\x8e\xd3\xfe\x04\x80\xdd\xf2\x27\
+\x02\x00\xf4\x5c\xfb\x55\xf5\xdc\xc3\xa3\xde\xa8\x6f\x76\xf7\x5f\
+\xd5\xc3\x9a\xfb\xd2\x8f\x5e\xd7\x4b\x94\xf5\x6e\x2c\x2c\x9c\x0f\
+\xff\x24\x36\x36\x46\xec\x57\x99\x23\x5e\x7f\x70\x80\x55\x11\x30\
+\x61\x7c\x3b\x3f\x8e\xcf\xf7\x92\x02\x02\xc0\x6e\xf9\x13\x01\x00\
+\x0d\xbb\xf6\x5b\x4a\xbe\xf4\xfa\x1a\xbd\xf1\xec\x22\xe3\xc5\xf3\
+\xcd\xcb\x15\xa1\xa7\xf2\xdb\xb4\x68\x64\xb5\xf8\xb7\x47\x65\xff\
+\xa6\x62\xed\x93\xe5\xd6\x44\xc0\xf8\x7d\x5a\xfb\x71\x5c\x96\x4a\
+\x12\x9d\x0e\x80\x00\xc8\x9f\x08\x00\x88\xfc\xfa\x9f\xe1\xf5\xb5\
+\x79\xee\xd1\x05\x46\xcb\x46\x89\x51\xfd\x64\xae\x9e\x4f\x08\x9a\
+\xf8\xff\x7a\x0b\x46\x7d\xbb\xfe\xe9\xf5\x2a\x2b\x7e\x85\xd9\x6b\
+\x88\x2f\xaf\x08\x5e\xea\x6c\x00\x04\x48\xfe\x44\x00\x40\xfd\xaf\
+\xff\x51\x5e\x5f\x93\x47\x8f\xc9\x35\x56\x32\x4f\x4f\xee\x1b\xfa\
+\x66\x1c\x64\xe9\x6f\x0f\xf5\x0b\x87\xfa\xec\xa6\x47\x80\x7a\xb3\
+\xc1\x87\xdb\x30\xff\xd3\xf9\x6a\x20\xf2\x27\x02\x00\x6c\xb8\xfe\
+\x93\x25\x1f\x79\x79\x2d\xee\x33\xac\xb9\xd8\xba\xd2\xbc\x15\xfe\
+\x56\x3f\x51\x26\xca\x2d\xbf\xbf\xaf\xe3\x99\x8c\xab\x4f\xef\x64\
+\x7c\x04\x7c\xf7\x6a\x85\xe8\xd6\x3e\xcd\xeb\xe3\xf1\xac\x53\x01\
+\x10\x60\xf9\x13\x01\x00\x75\x9b\x03\xae\xf0\xf2\x1a\x54\x82\xfd\
+\x75\xa9\x59\xaf\xa3\xfd\xf0\x5a\xa5\xf8\xe7\x61\x6d\xfd\xde\x91\
+\xce\x68\x8e\x19\x93\x6b\xfc\x32\xcc\x9f\xcf\x1f\x26\xf2\x5a\x7a\
+\xfe\x5c\xc6\x01\x4e\x04\x80\x03\xf2\x27\x02\x00\x76\x3e\x07\x74\
+\x92\x6c\xf1\xea\xda\x53\x2b\xd7\x6d\x7c\x61\x98\x51\x12\x79\xe8\
+\x9a\x9e\xa2\x65\x76\x12\xd2\xdf\x0e\x6a\xc5\x42\xf5\x4d\xdb\xe4\
+\x08\x50\x6f\x32\x34\x64\x35\xc5\x3a\xf0\x99\x24\x3d\xd0\x01\xe0\
+\xb7\xfc\xb3\xb3\xb3\xc5\xa4\x29\x53\xc5\x8a\xb5\xeb\xc4\x8b\x2f\
+\xbf\x22\xc6\x1d\x79\x94\x88\x89\x89\x21\x02\x00\xa2\x3b\x0f\x78\
+\xb6\xad\xb7\x7a\xf5\xec\xf9\xdb\x4a\x8c\x11\xc7\xe6\x45\x95\xe2\
+\x90\xdd\x5b\x22\xfa\x5d\xd0\xb9\x20\x4d\x7c\xf8\xcc\x10\xa3\x23\
+\xe0\x86\x09\x9e\xaf\x11\x70\x7d\x60\x03\xc0\x6f\xf9\xb7\xef\xd0\
+\x41\xac\x5c\xf7\xa6\xd8\xb8\xe9\x9b\xff\x8f\x1b\x6e\x9a\x44\x04\
+\x00\x44\x6f\x1e\x38\xc4\xcb\xeb\xed\xa2\xe3\x0b\x8d\x11\xc6\xe2\
+\x07\xfa\x8b\x82\xdc\x14\x04\x5f\xd7\x2f\x6c\x8d\x13\x43\x1b\x15\
+\x99\x1c\x01\xa3\x86\x34\xf7\xf2\x18\xfc\x2e\xe9\x11\xb8\x00\x88\
+\x86\xfc\x57\xbd\xf9\xd6\xdf\xe4\x4f\x04\x00\x44\x75\x1e\xc8\x90\
+\x6c\xf4\xea\x3a\x1b\x52\xdc\xc4\x88\x87\xfe\xd4\xda\xf2\x6a\xa3\
+\x21\xee\xf5\xd7\x9f\x46\x49\xb1\x62\xc1\x5d\xa5\x46\xaf\xd5\xe0\
+\xf1\xf3\x00\xaf\x48\x62\x02\x13\x00\xa6\xc9\x9f\x08\x00\x88\xda\
+\x5c\x30\xc9\xcb\x6f\x8f\xea\x61\x2d\x13\x7e\xf2\xdf\x73\x70\x36\
+\x32\x6f\x00\x6a\xd9\x63\xd3\x9e\xe1\xa8\x8d\xfa\x95\xc2\xe3\xb8\
+\x3b\x2a\x10\x01\x60\xaa\xfc\x89\x00\x00\xdf\xe7\x82\x1e\x92\xad\
+\x5e\xbd\x52\x36\x77\x5a\x71\xd4\xc5\xa0\xd6\xbe\x57\xf7\xb2\x91\
+\x78\xc3\x19\x5a\xd2\xc4\xc8\x57\x38\x6b\x50\xaf\x30\x7a\xf8\xf9\
+\xbf\x96\x64\x5a\x1d\x00\xa6\xcb\x9f\x08\x00\xf0\x75\x3e\x78\x2c\
+\xc8\x2b\xfd\x29\x59\xd9\xb4\x61\x8f\x0d\x9c\x7f\x8c\xb9\x2b\x38\
+\xaa\xdb\x3c\x7b\x0c\xf2\xf4\x97\x9e\x0b\xac\x0d\x00\x5b\xe4\x4f\
+\x04\x00\xf8\x32\x1f\x74\xf6\x6a\xb3\x9f\x1e\x1d\xd3\x43\xcb\xb6\
+\x9a\x20\x85\xc3\xf6\x6a\x85\xb8\x35\xff\xb2\x33\x7b\x8a\xb9\x2b\
+\x06\x7e\xb9\x60\xb8\xc8\x4a\x4f\xf0\xea\xf3\x6f\x92\xa4\x5a\x17\
+\x00\xb6\xc9\x9f\x08\x00\xf0\x7c\x4e\x98\xee\x95\x20\x5e\xb9\xb7\
+\x9f\x51\xf7\x86\x11\xb7\x5e\x9a\x64\x26\x88\x8f\x9f\x1d\x6a\x6c\
+\x04\x4c\xbd\xb0\x8b\x97\x9f\xff\x4c\xab\x02\xc0\x56\xf9\x13\x01\
+\x00\x9e\xcd\x09\x05\x5e\xdd\xfb\x3f\x6a\xb4\x79\xeb\xfc\xf7\x2a\
+\xca\x40\xdc\x9a\xe9\xd7\x3d\xcb\xd8\xd5\x02\xb7\xad\xac\x16\xc5\
+\x5d\x33\xbd\xfa\xec\x1b\x24\x8d\xac\x08\x00\xdb\xe5\x4f\x04\x00\
+\x78\x32\x2f\xdc\xe6\xd5\x37\xc3\xaf\x17\x0e\x37\x4e\x08\xb7\x5d\
+\xd2\x15\x69\x7b\xc0\xa4\x73\x3b\x1b\xfb\x2b\xc0\xd2\x87\x06\x84\
+\x16\xa0\xf2\xe8\xb3\x9f\x64\x7c\x00\x04\x45\xfe\x44\x00\x80\xd6\
+\x79\x21\xd7\xab\x25\x7f\x6f\xbd\xb8\xab\x91\x32\xf8\x79\x49\x95\
+\xc8\x4c\x8b\x47\xda\x1e\xec\x20\x68\xf2\x9e\x01\x27\x1e\x98\xe7\
+\xd5\x67\x5f\x2f\x49\x30\x36\x00\x82\x26\x7f\x22\x00\x40\xdb\xdc\
+\x70\x93\x57\x3f\x09\xab\xa7\xb0\x4d\x95\xc1\xa9\x63\xf3\x91\xb6\
+\x07\xdc\x31\xb1\x9b\xd1\xbb\x06\x36\x6f\x92\xe8\xd5\x67\x3f\xd2\
+\xc8\x00\x08\xaa\xfc\xa3\x18\x01\x73\x88\x00\x08\x88\xfc\x9b\x4b\
+\x7e\xd1\x7d\x8d\xc4\xc5\xc6\x88\xe5\x8f\x0e\x34\x7a\xb9\xd8\xb7\
+\x67\x0e\x42\xd8\x5e\xcc\xff\x79\x29\x46\xaf\x0d\x70\xef\x15\xdd\
+\xbd\xfa\xec\xef\x4a\x62\x8d\x0a\x80\xa0\xcb\x9f\x08\x00\x68\xd0\
+\xfc\x70\xb5\x17\xd7\xc7\x3f\x0e\xcd\x37\x7e\x0f\x79\x85\xda\xe1\
+\x0e\x69\xeb\xe7\x81\x7f\xf7\x34\xfa\xbc\x0f\xee\xdb\xc4\xab\xcf\
+\x7e\x88\x31\x01\xe0\x8a\xfc\x89\x00\x80\x88\xe6\x87\x2c\xc9\x0f\
+\xba\xaf\x8b\xb4\x94\xb8\xd0\x5a\xec\x36\x04\xc0\x13\x37\xf4\x46\
+\xd8\x1e\xd0\xb5\x30\xcd\xe8\xdb\x3f\x6a\xdb\x60\x8f\x3e\xfb\x6a\
+\x23\x02\xc0\x35\xf9\x13\x01\x00\xf5\x9e\x23\x8e\xf7\xe2\x9a\x98\
+\x30\xbe\x9d\x15\xf2\x57\xa8\xc5\x89\x5a\x37\x6f\x84\xb4\x3d\xe0\
+\xc9\xff\xf4\x36\xfa\xdc\x57\x0d\xf0\xec\xd7\x9f\xd2\xa8\x06\x80\
+\xab\xf2\x27\x02\x00\xea\x35\x4f\xbc\xaa\xfb\x5a\x48\x4e\x8a\x13\
+\x5f\xbc\x38\xdc\x9a\x00\x50\x5c\x7a\x52\x7b\x84\xed\x01\x65\xbd\
+\x1b\x1b\x7d\xde\x5f\xba\xbb\xd4\xab\xcf\x7e\x73\xd4\x02\xc0\x75\
+\xf9\x13\x01\x00\x75\x9a\x27\xda\xbb\x7c\xef\xbf\x36\x1b\xe6\x0f\
+\x13\x09\xf1\x6c\x09\xac\x1b\xf5\xce\xfd\xb7\xaf\x98\x7d\x2b\x68\
+\x50\x9f\xc6\x5e\x6d\x12\x94\xe0\x7b\x00\x20\x7f\x22\x00\xa0\x8e\
+\x73\xc5\xa5\xba\xc7\x7f\x62\x42\xac\xf8\xe4\xb9\xa1\xd6\x05\x80\
+\xe2\xc0\xea\x16\x51\x13\x65\x6a\x72\x9c\xe8\x90\x97\x12\xda\x59\
+\x6f\xec\x9e\xad\x42\xb7\x50\x14\xc7\x8c\xc9\x15\xfb\x55\xe6\x84\
+\x1e\x54\x54\x4f\xd6\xdb\x18\x01\xea\x19\x0b\x93\xcf\xbb\xda\x9d\
+\xd2\xa3\xcf\xbe\xb7\xaf\x01\x80\xfc\x89\x00\x80\x3a\xce\x15\x31\
+\x92\x0f\x75\x8f\x7d\x25\x2c\x1b\xe5\xaf\x58\x70\x57\xa9\x6f\x73\
+\x44\x51\xbb\x54\x71\xf6\x91\xed\xc4\xc2\x7b\xfa\x89\xef\x17\x55\
+\xd6\xf9\xdf\xa8\xbe\x4d\x2b\x61\xa9\x5b\x16\x5d\x0a\xed\xd8\xce\
+\x58\x2d\xbc\x63\xfa\xb9\xf7\x68\x89\xe0\xc7\x7d\x0b\x00\xe4\x4f\
+\x04\x00\xd4\x63\xbe\x18\xec\xc5\x7b\xff\xef\xcf\x1e\x6c\x6d\x00\
+\x28\xba\x7a\x24\xd5\xf8\xb8\x18\x31\xac\xb4\x89\xb8\x61\x42\x91\
+\x78\x6f\x96\xbe\x63\x34\xff\x8e\x12\x31\xa6\x32\x27\xb4\xd9\x92\
+\xc9\x6b\x02\x98\x7e\xde\x9f\xba\xa9\x8f\x17\x9f\xfd\x7f\xea\x2d\
+\x1b\xcf\x03\x00\xf9\x13\x01\x00\xf5\x9c\x33\xee\xd0\x3d\xde\xd5\
+\x4f\xd7\x36\xcb\x5f\x71\xf3\xf9\x5d\xb4\x3f\x10\xa9\x9e\x89\xf0\
+\xfa\xb6\xc8\xbc\xdb\x4b\x44\xab\xec\x24\x63\x23\x60\xfd\xdc\x21\
+\x46\x9f\x77\xf5\xba\x62\xf7\x0e\xe9\x5e\x7c\xf6\xe3\x3c\x0d\x00\
+\xe4\x4f\x04\x00\xd4\x73\xce\x48\x96\x6c\xd6\x3d\xd6\x57\x3d\x5e\
+\x66\x7d\x00\xfc\xf0\x5a\x65\x68\x0d\x83\x86\x1e\x8b\xf4\xd4\xf8\
+\xd0\x4f\xfc\x7e\xbe\x0d\xa1\x36\x5c\x1a\x59\xd6\x8c\xa5\x81\xcd\
+\x5a\x1d\xf0\x15\xcf\x02\x00\xf9\x13\x01\x00\x11\xcc\x1b\x07\xeb\
+\x1e\xe3\xbd\x8b\x32\xac\x97\x7f\x0d\x27\x1c\xd8\x26\xe2\xe3\xd0\
+\x38\x23\x41\x5c\x72\x62\xfb\xa8\x2d\x82\xf4\xeb\xd2\x11\xa2\x7f\
+\x8f\x2c\xe3\x02\xe0\xa0\x91\x2d\x8d\x3f\xef\x3f\xbd\x5e\xa5\x25\
+\xfe\xb6\x43\x81\xf6\x00\x40\xfe\x44\x00\x40\x84\x73\xc7\x1c\xdd\
+\xe3\x5b\xdd\xdb\x0e\x4a\x00\xac\x7e\xa2\x2c\xa2\x63\x70\xb0\x94\
+\x9c\x09\xab\x1f\xaa\x5f\x1d\xf2\x5b\x25\x1b\x15\x00\x6a\xa1\x25\
+\x1b\xce\xfd\x11\xa3\x5a\x7b\xf1\xf9\x2f\xd1\x1a\x00\xc8\x9f\x08\
+\x00\x68\xc0\xd2\xbf\x5b\x75\x3f\xfc\x67\xdb\xc2\x3f\x3a\xdf\x0d\
+\xcf\x6e\x9c\x28\x1e\xbb\xbe\x97\x51\xff\xfe\xe7\x6f\x2b\x31\x2a\
+\x00\xd4\x18\xd9\x66\xf0\xe6\x40\xb5\x9f\xa5\xf0\xe0\xf3\xaf\xd3\
+\x16\x00\xc8\x9f\x08\x00\x68\x40\x00\xec\xab\x7b\x4c\xef\x5e\x9e\
+\x1d\x28\xf9\x2b\x1e\xba\xa6\x67\x9d\x3e\xbb\x7a\x02\xff\xcb\x05\
+\x66\xc6\x4f\x79\xef\xc6\x46\x45\x80\x7a\x46\xc1\xf4\xf3\xae\x22\
+\x25\x37\xc7\x93\x65\xa1\x5b\x36\x38\x00\x90\x3f\x11\x00\xd0\xc0\
+\x00\x98\xa4\x7b\x3c\x2b\x59\x06\x2d\x00\x7e\x5b\x5e\x2d\x72\x9a\
+\xee\x78\xcf\xf8\x26\x99\x09\xc6\xef\x76\x67\xda\xaf\x00\x6f\x3e\
+\x55\x6e\xc5\xb9\x3f\xe7\xa8\x02\x2f\x3e\xff\xd8\x06\x05\x00\xf2\
+\x27\x02\x00\x34\x04\xc0\x1a\x9d\xe3\x38\x23\x2d\x5e\xfc\xb2\xb4\
+\x2a\x70\x01\xa0\xb8\xe0\xd8\xc2\xed\x7e\x66\xf5\x3e\xbf\x5a\x3a\
+\xd8\x86\xcf\xd0\xd2\xa0\x57\x03\xd5\xba\xfb\x36\x1c\xb3\xb5\x4f\
+\x96\x7b\xf1\xf9\xef\x8a\x38\x00\x90\x3f\x11\x00\xa0\x41\xfe\xcd\
+\x75\x8f\xe1\xa3\x46\xe7\x06\x52\xfe\x0a\xf5\xee\xbe\xba\x77\x5d\
+\x7b\x5d\xfb\x8b\x8e\x2f\xb4\xe2\x5e\x76\x0d\x87\xec\xde\xd2\x98\
+\x00\x30\xed\x39\x89\x9d\xd1\xa7\x73\x86\xee\xcf\xbf\x3e\xa2\x00\
+\x40\xfe\x44\x00\x80\xa6\x00\x38\x48\xf7\xf8\x7d\xf1\xce\xd2\xc0\
+\x06\x80\x62\xdf\xe1\x39\x7f\x3e\xe8\xf7\xec\xb4\x62\xeb\xfe\xfd\
+\xd3\x2e\xea\x6a\x4c\x00\x4c\xbd\xb0\x8b\x35\xc7\xed\xc6\xb3\x8b\
+\xbc\x38\x06\x85\xf5\x0a\x00\xe4\x4f\x04\x00\x68\x0c\x80\x5b\x75\
+\x8e\x5b\x25\x45\xb5\x82\x5a\x90\x03\xe0\xb9\x5b\x4b\x42\x0f\xd3\
+\x7d\x36\xcf\xce\x0d\x8e\x56\x3c\x3a\xd0\x98\x00\x50\xfb\x17\xd8\
+\x72\xdc\xd4\xf9\xf6\xe0\x18\x1c\x5b\xe7\x00\x40\xfe\x44\x00\x80\
+\xe6\x00\x78\xcf\xb5\xc5\x5d\x74\x2c\x11\xfb\xfb\x8a\x6a\x6b\xff\
+\xfd\x1e\x89\x2c\x22\x4e\x1d\x6b\xd7\x36\xd1\x9d\xda\xa6\xea\x3e\
+\x06\x0f\xd7\x29\x00\xe4\x9f\x01\xc8\x9f\x08\x00\xd0\x28\xff\x5c\
+\xdd\xe3\xf5\xd6\x8b\xbb\x06\x3e\x00\x6c\x47\xad\x0c\x68\x4a\x00\
+\xa8\x87\x2a\x6d\x3a\x76\x6a\x17\x43\xcd\xc7\xe0\x4b\xb5\x0b\xe7\
+\x4e\x03\x40\xfe\x69\x2d\xf9\x02\xf9\x13\x01\x00\x1a\x03\xe0\x08\
+\xdd\x63\x55\xe7\xae\x76\xe0\x1d\x6a\x43\x22\x13\x02\x60\xf2\x79\
+\x5d\xac\x3a\x6e\xea\xa1\x45\x0f\x8e\x43\xf7\x1d\x06\x80\xfc\x93\
+\x28\x59\x8c\xfc\x89\x00\x22\x00\x34\x07\xc0\x3d\x3a\xc7\x68\x5e\
+\xcb\x46\xc8\xd5\x12\x32\xd3\xe2\x8d\x08\x80\x47\xaf\xeb\x65\xd5\
+\x71\xdb\xb4\xb0\xc2\x8b\x6d\x96\x4f\xdb\x59\x00\xdc\x86\xfc\x89\
+\x00\x22\x00\x3c\x08\x80\xf7\x75\x8e\xcf\xf1\xfb\xb4\x46\xae\x16\
+\xf0\xe3\xe2\x2a\x63\x6e\x01\x2c\xbc\xa7\x9f\x75\xc7\xaf\x57\x91\
+\xf6\xd7\x01\x1f\xdf\x6e\x00\xc8\x3f\x07\x20\x7f\x22\xe0\x2f\xcc\
+\x26\x02\x40\x83\xfc\x93\x24\xdb\x74\x8e\xcd\xe9\x57\xf6\x40\xb0\
+\x16\xb0\xce\x9b\x45\x6d\x22\xe2\x5d\x0b\x6f\x19\x9d\x39\xae\xad\
+\x67\xfb\x02\xd4\xbe\x40\xe3\x24\x6f\x23\x7f\x22\x80\x08\x00\x0f\
+\x02\xa0\x9b\xee\x71\xf9\xb9\x25\x2b\xe1\xb9\xce\x33\xb7\x14\x1b\
+\x13\x00\x9b\x17\x55\x5a\x77\xfc\x66\x4f\xe9\xab\xfb\x38\x6c\x51\
+\xbe\xff\x6b\x00\x1c\x81\xfc\x89\x00\x22\x00\x3c\x0a\x80\xfd\x74\
+\x8e\x47\xf5\x7a\x14\x72\xb5\x03\xf5\xa6\x86\x09\xf2\x57\x0f\x22\
+\xda\x7a\x0b\x25\x3e\x4e\xfb\x5c\x5f\xf8\x67\x00\xc8\x3f\xf1\xba\
+\xef\xcf\x21\x7f\x22\x00\xa0\x56\x00\x9c\xaf\x73\x2c\x1e\x33\x26\
+\x17\xb9\x5a\xc2\xf9\xc7\x14\x18\x11\x00\xed\x5a\x27\x5b\x7b\x0c\
+\x8b\xbb\x66\xea\x3e\x1e\x7b\xd4\x0e\x80\x83\x91\x3f\x11\x40\x04\
+\x80\x87\x01\x70\xaf\xce\x71\x78\xdd\x99\x45\xc8\xd5\x12\xca\x0c\
+\xd9\x12\x78\x40\xcf\x2c\x6b\x8f\xe1\x61\x7b\xb5\xd2\x7d\x3c\x4e\
+\xaf\x1d\x00\x0f\x20\x7f\x22\x80\x08\x00\x0f\x03\x40\xeb\xab\xc5\
+\x4f\x4f\xee\x8b\x5c\x2d\x40\x3d\xa7\xe1\xc1\x6b\x6c\xce\x6d\x1a\
+\x75\xf9\x29\x1d\x74\x1f\x8f\x69\xe1\xeb\x32\xf4\xf0\xdf\x26\xe4\
+\x4f\x04\x10\x01\xe0\x61\x00\x7c\xe7\xfa\xd3\xdc\x2e\x32\xe9\xdc\
+\xce\xc6\x3c\x00\xf8\xc8\xb5\xbd\xac\x3d\x8e\x6a\xfd\x02\xcd\xc7\
+\xe3\xc5\x9a\x00\x18\x88\xfc\x89\x00\x22\x00\x6c\xd9\x02\x38\x21\
+\x3e\xc6\xea\xb5\xf1\x5d\x62\x70\xdf\x26\x46\xc8\x5f\x6d\xa3\xfc\
+\xcd\xcb\x15\xd6\x1e\xc7\x55\x8f\x97\xe9\x3e\x26\x1b\x6a\x02\xe0\
+\x52\xe4\x4f\x04\x10\x01\xe0\x61\x00\x0c\xe2\x0d\x00\xf7\xd8\xf8\
+\xc2\xb0\x90\x78\x4d\x08\x80\xd2\x6e\x99\x56\x1f\xcb\x5f\x96\x56\
+\x79\x71\x2b\x25\x43\x5d\x9c\xd3\x91\x3f\x11\x40\x04\x80\x87\x01\
+\x70\x8c\xce\xf1\xb6\xf7\xd0\xe6\x08\xd6\x02\xfe\x73\x8e\x39\x3f\
+\xff\x5f\x74\x7c\xa1\xf5\xc7\x53\x2d\x7d\xad\xf9\xb8\x14\xab\x8b\
+\xf3\x79\x9d\xff\xd1\xfc\xfc\xb6\xc8\x9f\x08\x00\xa8\x1d\x00\xd7\
+\xea\x1c\x6b\x13\xc6\xb7\x43\xb0\x16\x7c\x63\x6d\x95\x9d\x64\x4c\
+\x00\xbc\x72\x6f\x3f\xeb\x8f\x69\xd5\x80\xa6\xba\x8f\xcb\x58\x75\
+\x71\xae\xd6\xf9\x1f\x7d\xfc\xa9\x19\x08\x98\x08\x40\x7c\xe0\xd9\
+\x26\x40\xb7\x4f\xec\x86\x64\x0d\xe7\xda\x33\x3a\x19\x23\x7f\xb5\
+\x11\x51\x10\x9e\x19\x39\xf9\x60\xed\x5b\x03\xff\x53\x5d\x9c\x5f\
+\xe9\xfa\x0f\x66\x64\x66\x22\x5e\x22\x80\x08\x80\xbf\x06\xc0\x13\
+\xae\x6f\xe8\xe2\x12\x6a\xb9\xdd\xa6\x59\x09\xc6\x04\xc0\xe8\x8a\
+\x1c\xde\xa8\xd8\x3e\x17\xa9\x8b\xf3\x1b\x5d\xff\xc1\xf4\xf4\x74\
+\xb1\xe1\xeb\x4d\x88\x97\x08\x20\x02\xa0\x76\x00\x3c\xa7\x73\x7c\
+\xbd\x3d\x73\x10\xa2\x35\x18\x75\xbf\xdd\x14\xf9\x2b\xa6\x5d\xd4\
+\x35\x10\xc7\xf5\xe1\x6b\x7a\xea\x3e\x36\xd7\xa8\x8b\x73\xad\xce\
+\xff\xe8\xfd\x0f\x3f\x8c\x74\x89\x00\x22\x00\x6a\x07\xc0\x6b\x6c\
+\x02\xe4\x06\x5f\xbd\x34\x5c\xa4\xa5\xc4\x19\x23\xff\x46\x49\xb1\
+\xa1\x7f\x53\x10\x8e\xad\x07\x9b\x02\xdd\xa2\xbd\xce\x5b\xb4\x6c\
+\x29\x96\x2c\x5f\x81\x74\x89\x00\x22\x00\x6a\x02\x40\xeb\x97\x8c\
+\x1f\x5e\xab\x44\xb6\x86\x72\xca\x21\x79\x46\x7d\xfb\x3f\x6e\xff\
+\x36\x81\x39\xb6\xea\xd6\x97\xe6\xe3\x73\xbf\xf6\x35\xba\x15\xb9\
+\x6d\xda\x10\x01\x44\x00\x11\x00\x35\x01\xf0\xb1\xae\xf1\xa4\xde\
+\x85\xfe\x63\x15\xa2\x35\x91\xf9\x77\x94\x18\xb3\xec\x6f\xcd\x58\
+\x09\xd2\xed\xa2\x15\x8f\x0e\xd4\x7d\x8c\x66\x78\xb6\x10\x10\x11\
+\x40\x04\x10\x01\x10\x0e\x80\x6f\x75\x8d\x25\xf5\xf3\x32\xb2\x35\
+\x8f\x6f\x5f\xa9\x10\xb9\x39\x8d\x8c\xfa\xf6\x3f\x6a\x48\xb0\xd6\
+\x8b\x78\x7f\xf6\x60\xdd\xc7\xe8\x05\xed\xab\x74\x11\x01\x44\x00\
+\x11\x00\x7f\x09\x80\xdf\x74\x8d\x23\xf5\x6e\x39\xc2\x35\x8f\x03\
+\xab\x5b\x18\x25\x7f\xc5\x4b\x77\x97\x06\xee\xf9\x0a\xcd\xc7\x68\
+\x49\xcd\x66\x40\xdf\x12\x01\x44\x00\x11\x00\x1e\xc8\x3f\x89\x65\
+\x80\x83\xcd\x7d\x57\xf4\x30\x4e\xfe\x25\x96\x2f\xfd\xbb\x3d\x7e\
+\x5d\x3a\x42\xf7\x71\x7a\xab\xe6\x22\x7d\xc8\xcb\x93\x41\x04\x10\
+\x01\x44\x80\xb3\x01\xd0\x4c\xe7\xf8\x29\xee\x9a\x89\x74\x0d\xe2\
+\xa3\xb9\x43\x44\x46\x5a\xbc\x71\x01\x60\xf3\xce\x7f\x3b\x23\x3e\
+\x4e\xeb\x5c\xfd\x59\xcd\x45\x3a\xd6\xeb\x13\x42\x04\x10\x01\x44\
+\x80\x93\x01\xd0\x4e\xe7\xd8\x19\x56\xda\x04\xf1\x1a\xc2\xb6\x95\
+\xd5\xa2\xbc\x77\x63\xe3\xe4\xdf\xb6\x55\xb2\xd8\xba\x32\x98\xbb\
+\x45\x36\xce\xd0\xba\xc0\xd2\xe6\x9a\x8b\x34\x51\xb2\x9e\x08\x20\
+\x02\x88\x00\xd0\x1c\x00\xdd\x74\x8e\x9b\xbd\x86\x64\x23\x5f\x43\
+\x38\x6b\x7c\x3b\xe3\xe4\xaf\xb8\xf9\xfc\x2e\x81\x3d\xe6\x9a\x1f\
+\xb4\xdc\x5a\xfb\x42\x3d\xd2\x8f\x93\x43\x04\x10\x01\x44\x80\x53\
+\x01\x50\xa4\x73\xcc\x54\x0f\x6c\x86\x7c\x0d\xe0\xae\xcb\xba\x1b\
+\x29\xff\x5e\x45\x19\x81\xfd\xf6\xaf\x68\x96\x95\xa8\xf3\x78\xfd\
+\x54\xfb\x42\x55\x0f\x03\xbe\x4d\x04\x10\x01\x44\x00\x68\x0c\x80\
+\x7c\x9d\xe3\x65\x50\x9f\xc6\x08\xd8\x80\x05\x69\x12\x13\x62\x8d\
+\x93\x7f\x6c\x6c\x8c\x78\xfd\xc1\x01\x81\x3e\xf6\x49\x89\x5a\x8f\
+\xfb\xc6\xbf\x5e\xac\xfb\xf9\x75\xb2\x88\x00\x22\xa0\x16\xb3\x88\
+\x80\xc0\x06\x40\x73\x9d\x63\xa5\x6f\x97\x0c\x24\x1c\x45\x3e\x98\
+\x33\x58\xf7\xb7\x50\x6d\x9c\x74\x50\x5e\xa0\x8f\xfd\x6f\xcb\xab\
+\x75\x1f\xb3\x77\xb7\x77\xc1\xde\x4a\x04\x00\x11\x00\x9a\x02\x20\
+\x5d\xe7\x38\xe9\x5c\x90\x86\x88\xa3\xb8\xcb\x5f\x97\xc2\x34\x23\
+\xe5\xdf\xa2\x59\x92\xf8\x7e\x51\xb0\x97\x88\xfe\xe6\xe5\x0a\xdd\
+\xc7\x6d\xf9\xf6\x2e\xd8\x04\xc9\x42\x22\x00\x88\x00\xd0\x10\x00\
+\xf1\x3a\xc7\x48\x7e\xab\x64\x64\x1c\x05\xd4\x7d\xf5\x91\x65\xcd\
+\x8c\x94\xbf\x42\xed\x94\x17\xf4\x73\xb0\x7e\xee\x10\xdd\xc7\xed\
+\xa5\x1d\x5d\xb4\xd9\x3a\xd7\xef\x26\x02\x88\x80\x7a\x46\x40\x22\
+\xf2\x0c\x54\x04\xfc\xae\x6b\x7c\x64\x37\x4e\x44\xc8\x51\xe0\xb4\
+\xb1\xf9\xc6\xca\xdf\x95\x07\x43\x57\x3f\x51\xa6\x7f\xae\xdd\xc9\
+\x45\xdb\x43\xf2\x0d\x11\x00\x44\x00\x34\x30\x00\x7e\xd4\x35\x36\
+\x52\x93\xd9\x0b\xc0\x6f\xae\x3f\xab\xc8\x58\xf9\x27\x27\xc5\x85\
+\x9e\x4b\x70\xe1\x3c\xbc\x7a\x5f\x7f\xdd\xc7\xef\xa1\x5d\x5d\xb8\
+\xbd\x89\x00\x20\x02\xa0\x81\x01\xf0\xa5\xce\x27\xbd\xd9\x0d\xd0\
+\x3f\x6e\x9f\xd8\xcd\x58\xf9\x2b\xae\x3c\xb5\xa3\x33\xe7\x62\xee\
+\xb4\x62\xdd\xc7\xef\xb6\xba\x5c\xbc\x44\x00\x10\x01\xd0\x90\x00\
+\x58\xa3\x73\x5c\x7c\x36\x6f\x28\x72\xf6\x81\x87\xae\xe9\x19\x0a\
+\x2e\x53\xe5\x5f\x35\xa0\x69\x68\x35\x42\x57\xce\xc7\x63\xd7\xf7\
+\xd2\x7d\x0c\xaf\xaf\xeb\x05\x4c\x04\x00\x11\x00\x91\x06\xc0\x5c\
+\x9d\x63\xe2\x95\x7b\xfb\x21\x68\x8f\x79\x7a\x72\x5f\x91\x10\x6f\
+\xae\xfc\xf3\x5a\x36\x12\x9b\x16\x56\x38\x75\x4e\x6e\xbd\xb8\xab\
+\xee\xe3\x38\xb1\x3e\x17\x31\x11\x00\x44\x00\x44\x12\x00\x77\xea\
+\x1c\x0f\xd3\xaf\xec\x81\xa4\x3d\xe4\x85\x3b\x4a\x45\xa3\xa4\x58\
+\x63\xe5\xaf\x16\x21\x5a\x12\xf0\x05\x7f\x7c\x5a\x7a\xf9\xcc\xfa\
+\x5e\xc8\x44\x00\x10\x01\x50\xdf\x79\xe3\x32\x9d\x63\xe1\xf2\x53\
+\x3a\x20\x6a\x8f\x58\xfc\x40\x7f\x91\x96\x12\x67\xf4\x7d\xff\x69\
+\x17\x75\x75\xf2\xdc\x8c\x1a\xd2\x5c\xf7\xb1\x3c\x2a\x92\x8b\x99\
+\x08\x00\x22\x00\xea\x33\x67\x1c\xaf\x73\x1c\x1c\x3d\x26\x17\x59\
+\x7b\xc0\xaa\xc7\xcb\x74\xef\x36\xa7\x9d\x23\x46\xb5\x76\xf6\xfc\
+\x74\xcc\x4f\xd5\x7d\x3c\x07\x45\x7a\x41\x13\x01\x40\x04\x40\x5d\
+\xe7\x8b\xbd\x74\x8e\x81\xe1\xa5\x4d\x11\xb6\x66\xde\x79\x7a\x90\
+\xc8\x69\x9a\x68\xb4\xfc\x7b\x76\x4a\x17\xbf\x2c\xad\x72\xf2\xfc\
+\xfc\xbe\xa2\x5a\xc4\xc7\x69\x9f\x67\x9b\x37\xe4\xa2\x26\x02\x80\
+\x08\x80\xba\xce\x15\xda\xce\x7f\x41\x6e\x0a\xd2\xd6\xc8\x5b\x33\
+\x06\x89\x56\xd9\x49\x46\xcb\x3f\x2b\x3d\x41\xbc\x3f\x7b\xb0\xd3\
+\x81\xa6\xf9\x98\x7e\x17\xba\x36\x35\x5c\xd8\x44\x00\x10\x01\xe0\
+\xdb\x86\x40\xea\xe9\x74\xb5\x31\x0a\xf2\xd6\xf3\xb3\x7f\xf3\x26\
+\x66\x7f\xf3\x57\xaf\x22\xaa\xb7\x12\x5c\x3e\x4f\x33\x27\xf7\xd1\
+\x7d\x5c\x17\x37\x38\x00\x88\x00\x20\x02\xa0\x8e\xf3\xc4\xb7\x3a\
+\xcf\xfd\xb2\x47\x06\x22\xf0\x06\xb2\xf4\xa1\x01\xa2\x49\xa6\xd9\
+\xf7\xfc\x15\x53\x2f\xec\xe2\xfc\xb9\xba\xee\x4c\xed\xab\x31\xde\
+\xab\x25\x00\x88\x00\x20\x02\xa0\x0e\x73\xc4\x4b\x3a\xcf\xfb\x2d\
+\x17\x76\x45\xe2\x0d\x5c\x56\x36\x23\x2d\xde\x78\xf9\x5f\x70\x6c\
+\x21\xe7\x4b\x72\xec\x7e\x6d\x74\x1f\xdb\xf3\xb4\x05\x00\x11\x00\
+\x44\x00\xec\x62\x7e\x98\xa2\xf3\x9c\x1f\xb9\x6f\x6b\xc4\xd0\x80\
+\xf7\xfc\xd5\x9e\x0a\xa6\xcb\x7f\xfc\x3e\x9c\xe3\x1a\x06\xf7\x6d\
+\xa2\xfb\xf8\x8e\xd1\x1a\x00\x44\x00\x10\x01\xb0\x93\xb9\xe1\x04\
+\x9d\xe7\xbb\x6b\x61\x1a\x62\x88\x80\x39\x53\xfb\x1a\xbd\xc8\x4f\
+\x0d\xbb\x97\x67\x87\x9e\x7c\xe7\x9c\x8d\x0c\x3d\xef\xe2\x41\xb0\
+\x75\xd5\x1e\x00\x44\x00\x10\x01\xb0\x83\x79\xa1\x4c\xf7\x83\x61\
+\x3f\x2e\xae\x42\x10\xf5\xe0\xc9\xff\xf4\x0e\xad\xa2\x67\xba\xfc\
+\x4b\xba\x65\x8a\x9f\x5e\xe7\xdc\xd6\xa0\x96\xbe\xd6\x7c\x8c\xb7\
+\x49\x92\x3c\x09\x00\x22\x00\x88\x00\xd8\xce\x9c\x90\xa9\xfb\x5c\
+\xbf\x78\x67\x29\x82\xa8\x23\x0f\x5e\xdd\xd3\x8b\xf7\xc8\xb5\xd3\
+\x3e\x2f\x45\x7c\xf5\xd2\x70\xce\x59\x2d\x2e\x3b\xb9\x83\xee\xe3\
+\xfc\xc1\x9f\xd7\xa5\xc7\xef\xfe\x12\x01\x40\x04\x40\xcd\x9c\xf0\
+\x89\xce\xf3\x7c\xcd\x19\x9d\x10\x44\x1d\xb8\xeb\xb2\xee\x46\xef\
+\xea\x57\x83\x7a\x1d\xd1\xe5\x77\xfd\x77\xc4\xd0\x12\xed\xf7\xff\
+\xe7\x78\x1e\x00\x44\x00\x10\x01\xf0\x97\xf9\x60\x96\xce\x73\xac\
+\xd6\x46\x47\x10\x3b\x67\xca\x05\x5d\xe4\x75\xb7\x9b\xf1\xf2\x6f\
+\x9a\x95\x20\x56\x3c\xca\xab\x9d\x7f\x45\xad\x7c\x98\x94\xa8\xfd\
+\xb6\xcd\xc5\xbe\x04\x00\x11\x00\x44\x00\xd4\x9a\x0b\xce\xd1\x79\
+\x7e\x93\x93\xe2\x9c\x5d\x1a\x36\x4a\xef\x8e\x7b\xf6\xcd\x7f\xf5\
+\x13\x65\x9c\xb3\xed\xf0\xfc\x6d\x25\x5e\x1c\xf3\x32\xdf\x02\x80\
+\x08\x00\x22\x00\xc2\xf3\x40\x3f\xdd\xe7\xf7\xa9\x9b\xfa\x20\x0a\
+\x7f\xee\x1b\x7b\x42\xcb\xec\x24\xf1\xe6\x53\xe5\x9c\xb3\x1d\x70\
+\xde\x31\x05\xba\x8f\xf9\x4f\x92\x04\x5f\x03\x80\x08\x00\x22\x00\
+\xe4\x9f\x78\xc9\x0f\xac\x07\xe0\x2d\xe7\x1e\x5d\x60\x85\xfc\x73\
+\x73\x1a\x89\x77\x67\x71\xcf\x7f\x67\xf4\xeb\x9e\xe5\xd9\xfd\x7f\
+\x5f\x03\x80\x08\x80\x28\x47\xc0\xd3\x44\x80\x11\x11\x30\x5b\xe7\
+\x79\xcd\x6e\x9c\x28\xb6\xad\xe4\x7d\xf1\x1a\x4e\x1b\x9b\x6f\x85\
+\xfc\xf3\x5b\x25\x8b\x0f\xe6\x20\xff\x9d\xb1\x79\x51\xa5\x88\xd3\
+\xff\xf0\xe6\x59\x51\x0b\x00\x22\x00\x88\x00\xe7\x03\x60\x82\xee\
+\xf3\xaa\xde\x93\x76\x5d\x16\x2a\x82\x8e\xdb\xbf\x8d\x15\xf2\x2f\
+\x6c\x93\x22\x3e\x7e\x76\x28\x92\xaf\xc3\xab\x9b\x1e\x1c\xff\xde\
+\x51\x0d\x00\x22\x00\x88\x00\xa7\x03\xa0\x58\xf7\x39\x9d\x30\xbe\
+\x9d\xd3\xa2\xd8\x2a\xe5\x7f\xf8\xa8\x56\x56\xc8\xbf\x63\x7e\xaa\
+\xf8\x6c\x1e\xf2\xaf\x0b\x6a\x35\x44\xcd\xc7\x5f\x39\x37\x36\xea\
+\x01\x40\x04\x00\x11\xe0\x6c\x00\xc4\x49\x36\xeb\x96\x8a\xcb\xcb\
+\xc4\x1e\x30\xa2\x85\x15\xf2\xef\x52\x98\x26\x36\xbe\x30\x0c\xb9\
+\xd7\x01\x75\x9c\x3c\xf8\xf9\xff\xf1\xbf\x5d\x8f\x51\x9e\x0c\x88\
+\x00\x20\x02\xdc\x0a\x80\x16\x92\x8d\xba\xcf\xe7\x92\x07\x07\x38\
+\x27\x89\xff\xbd\x31\x22\xb4\x16\x82\x0d\xf2\xef\xd1\x31\x9d\x15\
+\xfe\xea\xc1\xf5\x67\x79\xf2\x0a\xe7\x49\x46\x05\x00\x11\x00\x44\
+\x80\x73\xf2\x7f\x8b\x9d\xe3\x1a\xce\xcf\x4b\xaa\x44\xd5\x80\xa6\
+\x56\xc8\xbf\x6f\x97\x0c\xf1\xcd\xcb\x15\x88\xbd\x1e\xf4\xec\x94\
+\xee\xc5\xb9\xe8\x64\x5c\x00\x10\x01\x40\x04\x20\x7f\x1d\x8b\x02\
+\xb9\x22\x99\xef\x17\x55\x8a\xf2\xde\x8d\xad\x90\xbf\x7a\x8d\xed\
+\xbb\x57\x91\x7f\x7d\x58\xf5\x78\x99\x17\xe7\xe2\xb3\xed\x5e\x97\
+\x06\x4d\x10\x44\x00\x10\x01\xc8\x3f\x62\xd4\xcf\xa6\x41\x97\x83\
+\xfa\x19\xbd\x77\x51\x86\x15\xf2\x57\x91\xf2\xc3\x6b\x95\x48\xbd\
+\x9e\x9c\x39\xae\xad\x17\xe7\x63\xb2\xd1\x01\x40\x04\x00\x11\x80\
+\xfc\x1b\x42\x87\xbc\x14\xf1\xc7\xaa\xe0\x8a\xe1\xd3\xe7\x87\x8a\
+\x4e\x6d\x53\xad\x90\xbf\xda\xc0\x86\x2d\x7d\x23\x7b\xa3\x43\xad\
+\x8e\xe8\xc1\x39\x29\x35\x3e\x00\x88\x00\x20\x02\x90\x7f\x43\x78\
+\x76\x5a\x71\x20\xc5\xf0\xde\xac\xc1\xa1\xc5\x73\x6c\x90\xbf\x7a\
+\x36\x81\x3d\x1a\x22\xe3\x99\x5b\x8a\xbd\x38\x27\x6f\xef\xf0\x1a\
+\x35\x74\xe2\xe8\x45\x04\x00\x11\x60\xbd\xfc\xdf\xf4\x5b\x3e\xfb\
+\x0e\xcf\x09\xe4\x3d\xe1\x9c\xa6\x89\x56\xc8\x7f\xcf\xc1\xd9\xa1\
+\xb7\x13\x90\x79\x64\x54\x0f\x6c\xe6\xc5\x79\xb9\xc0\xaa\x00\x20\
+\x02\x80\x08\xb0\x5a\xfe\x39\xd1\x90\xbf\x42\xbd\x3b\xfd\xc9\x73\
+\xc1\x59\x68\xe6\xb5\xfb\xfb\x8b\xc6\x19\x09\xc6\x8b\x3f\xa5\x51\
+\x9c\xb8\xf4\xa4\xf6\x62\xcb\x32\xe4\x1f\x29\x4b\x1f\x1a\xe0\xc5\
+\xb9\xf9\x43\x92\x6f\x5d\x00\x10\x01\x40\x04\x20\xff\x48\xb8\xf0\
+\xb8\xc2\xc0\x6c\x05\x9b\x9a\x1c\x67\xcd\x0a\x7f\x43\x8a\x9b\x18\
+\xcb\x55\xa7\x75\x34\xfe\x7c\xab\x5f\xaf\x3c\x38\x37\x0b\x76\x7a\
+\xbd\x5a\x30\xa1\x10\x01\x40\x04\x20\xff\x3a\xd3\xa2\x59\x52\x68\
+\x85\x3c\x9b\xe5\xff\xe4\x7f\x7a\x8b\xa4\xc4\x58\x2b\xe4\x6f\x03\
+\xe3\xf6\x36\x7b\x9d\x88\x35\xff\x2d\x97\x73\x9b\x27\x9f\xfd\x68\
+\xab\x03\x80\x08\x00\x22\x00\xf9\xd7\x97\xc9\xe7\x75\xb1\x56\xfe\
+\xf7\x5d\xd1\xc3\x8b\x65\x60\x09\x00\x83\xcf\xf9\xa1\x7b\xb4\xf4\
+\xe2\x73\xff\x2a\xc9\xb0\x3e\x00\x88\x00\x20\x02\x90\x7f\x7d\xb7\
+\x09\x56\xdb\xa9\xda\x26\x7f\x15\x2e\x1e\x7d\x13\x24\x00\x0c\x7e\
+\xc3\xc3\xa3\xe0\x7b\x78\x97\xd7\xae\x65\x13\x0d\x11\x00\x44\x00\
+\xf2\xaf\x13\xe7\x1d\x53\x60\x95\xfc\xff\xf5\x8f\x0e\xc8\xda\xc1\
+\x00\x38\x7a\x4c\xae\x57\x9f\x7b\xcf\x40\x05\x00\x11\x00\x44\x00\
+\xf2\xaf\x2b\x8d\x92\x62\xad\x79\x23\xe0\xac\xf1\xed\x10\xb5\x83\
+\x01\xa0\xc6\x67\x42\xbc\x27\x73\xd8\x06\x49\x7c\xe0\x02\x80\x08\
+\x00\x22\x00\xf9\xd7\x95\x23\x46\x99\x7d\xef\x77\xdb\xca\x6a\x71\
+\xec\x7e\x6d\x90\xb4\xa3\x01\xe0\xe1\xb7\xff\xb3\xea\x74\x1d\x5b\
+\x3c\x01\x11\x01\x40\x04\x20\xff\x9d\xa2\xee\xa7\x2f\x7f\x74\xa0\
+\x91\x93\xbf\x7a\x53\xe1\xa0\x91\x2d\x11\xb4\xa3\x01\xb0\x68\x7a\
+\x7f\xaf\x9e\xf7\xd8\x24\x49\x0d\x74\x00\x10\x01\x40\x04\x44\x4d\
+\xfe\xeb\x6c\x9a\xfc\x2b\xfa\x35\x35\x6e\xf2\x57\x4b\xe5\xee\x31\
+\x28\x1b\x39\x3b\x1a\x00\x6a\xcd\x7f\x8f\xb6\xfc\x55\x5c\x58\xe7\
+\xeb\x39\x00\x13\x12\x11\x00\x44\x00\xf2\xdf\x29\xb3\xa7\xf4\x35\
+\x4a\x00\x63\x2a\x73\x10\xb3\xc3\x01\x70\xc3\x84\x22\xaf\x3e\xeb\
+\x66\x49\x96\x33\x01\x40\x04\x00\x11\x80\xfc\x77\x45\xd7\xc2\xb4\
+\xd0\xb7\x2e\x53\x04\xe0\xe1\xb7\x3f\x30\x3c\x00\x3e\x9b\x37\x54\
+\xa4\xa7\xc6\x7b\xf5\x59\xaf\xa8\xd7\x75\x1d\xa0\x09\x8a\x08\x00\
+\x22\x00\xf9\x5b\xb1\x38\x10\x01\xe0\x6e\x00\x1c\x30\xa2\x85\x57\
+\x9f\xf3\x67\x49\x33\x27\x03\x80\x08\x80\x28\x47\xc0\xcc\x20\x46\
+\x80\xdf\xf2\x4f\x4d\x4d\x15\x05\x05\x05\x9e\xfc\xb7\x93\x93\xe2\
+\xc4\x9b\x4f\x95\x13\x00\x04\x40\xd4\x50\xdb\x55\x7b\xf8\x39\x6f\
+\xa8\xf7\xf5\x1d\xc0\x09\x8b\x08\x00\x22\x40\xcf\xb5\xd4\xdc\x6f\
+\xf9\xcf\x98\x35\x5b\x3c\xfe\xd4\x0c\xcf\xfe\x8e\x5e\x45\x19\x46\
+\xec\x58\x47\x00\xb8\x17\x00\x6a\x9b\xe4\xf6\x79\x29\x5e\x7d\xc6\
+\xff\x49\x5a\x39\x1f\x00\x44\x00\x10\x01\xf6\xca\xbf\xe6\xbc\x55\
+\x8d\xa8\xf6\xec\xef\x52\x8b\xee\x10\x00\x04\x80\xdf\x9c\x71\x44\
+\x5b\x2f\x3f\xe3\xd4\x88\xae\xf3\x00\xdf\xb7\x24\x02\x80\x08\xb0\
+\x50\xfe\x8a\x85\x8b\x5e\x13\xf1\xf1\xde\x3c\x28\xa5\xde\xbd\x9e\
+\x77\x7b\x09\x01\x40\x00\xf8\xc6\xcc\xc9\x7d\xbc\xfc\x7c\x5b\x24\
+\x6d\x09\x00\x22\x00\x88\x00\xeb\xe5\x5f\xc3\xb8\x23\x8f\xf2\xec\
+\xef\x6d\x95\x9d\x24\x36\x2d\xac\x20\x00\x08\x00\x5f\x96\xfb\x6d\
+\x92\x99\xe0\xe5\xe7\xfb\x57\xc4\xd7\xbb\x03\xaf\x2f\xf5\x0a\xaf\
+\x8c\x44\x04\x10\x01\x44\x80\x25\xf2\x57\xac\x79\xfb\x1d\x91\x96\
+\x96\xe6\xd9\xdf\x3f\xba\x22\x87\x00\x20\x00\x3c\xe5\xf7\x15\xd5\
+\x62\x60\xaf\x2c\x2f\x3f\xdb\x87\x92\x64\x02\x80\x08\x00\x22\xa0\
+\xa1\xf2\x5f\x6b\x8a\xfc\x6b\x38\xf7\x82\x0b\x3d\xfd\x77\xdc\x3e\
+\xb1\x1b\x01\x40\x00\x78\xc6\xd9\x47\x7a\xbe\xc9\xd3\x5e\x0d\xba\
+\xee\x1d\x5a\xc5\x8c\x08\x00\x22\xc0\x22\xf9\x2b\x3e\xfa\xec\x73\
+\xd1\xaa\x75\x6b\xef\xfe\x2d\xc9\x71\xe2\x9d\xa7\x07\x11\x00\x04\
+\x80\x76\xe6\x4c\xed\xeb\xd5\x5a\xff\x35\x3c\xd9\xe0\x6b\xdf\xb1\
+\x75\xcc\x89\x00\x20\x02\x2c\x91\x7f\x0d\x53\xa6\x4d\xf3\xf4\xdf\
+\xd4\xa3\x63\xba\xd8\xbc\xa8\x92\x00\x20\x00\xb4\xae\xf6\xd7\x2c\
+\x2b\xd1\xcb\xcf\xa4\x16\xfd\xc9\x23\x00\x88\x00\x20\x02\x02\x2b\
+\xff\x1a\x2a\xab\x46\x78\xfa\x6f\x1b\x56\xda\xc4\xd7\xf5\x01\x08\
+\x80\xe0\x06\x80\x7a\xdf\xbf\xac\x77\x63\xaf\x3f\xd3\x39\x5a\xe6\
+\x00\x47\xb7\x33\x25\x02\xc0\xe9\x08\xb0\x49\xfe\x8a\x15\x6b\xd6\
+\x8a\x8c\xcc\x4c\x4f\xff\x8d\x6a\x6b\xde\x3f\x56\x11\x00\x04\x40\
+\xe4\x6c\x5b\x59\x2d\xf6\xf3\x7e\xa3\x27\xb5\x15\x77\x02\x01\x40\
+\x04\x00\x11\x10\x78\xf9\xd7\xf0\x9f\xc9\x37\x7b\xfe\x6f\x3d\xfd\
+\xf0\xb6\x04\x00\x01\x10\x31\x27\x1c\xd8\xc6\x8f\xcf\x33\x54\xdb\
+\x5c\xe0\x6a\x00\x10\x01\xe0\x62\x04\xd8\x2a\x7f\xbf\x6e\x05\x28\
+\xae\x3d\xa3\x13\x01\x40\x00\xd4\x9b\x4b\x4e\x6c\xef\xc7\x67\x99\
+\xae\x75\x3e\x70\x39\x00\x88\x00\x70\x29\x02\x6c\x97\xbf\x5f\xb7\
+\x02\xd4\x93\xdb\x0f\xfc\xbb\x27\x01\x40\x00\xd4\x99\xa9\x17\x76\
+\xf1\xe3\x73\x6c\x90\x64\x13\x00\x44\x00\x10\x01\xce\xc9\xdf\xcf\
+\x5b\x01\x09\xf1\x31\xe2\xf9\xdb\xbc\x5b\x2e\xf8\x9c\xa3\x0a\x42\
+\xcf\x1c\x80\x3f\x28\x41\x7b\x75\x2e\x1f\xbb\xbe\x97\x88\x8d\xf5\
+\x7c\xce\xd8\xaa\xf3\xa7\x7f\x02\x80\x08\x00\x47\x22\x40\x7d\x6b\
+\x08\x8a\xfc\xfd\xbc\x15\x90\x9e\x1a\x2f\x96\x3f\x3a\xd0\x98\x7d\
+\xe4\xc1\x3c\x5e\xb8\xa3\x54\x24\x25\xc6\xfa\x71\x5d\x5d\xe4\xc9\
+\xdc\x80\xfc\x89\x00\x08\x6e\x04\x04\x51\xfe\x8a\x95\xeb\xde\x14\
+\xd9\xd9\xd9\x9e\x7f\x9e\x9c\xa6\x89\x62\x05\x11\x00\xdb\xe1\xa5\
+\xbb\x4b\x45\x46\x5a\xbc\x1f\xd7\xd5\xf3\x92\x58\x02\xc0\x9f\x08\
+\xe8\x49\x04\x40\x10\x22\x20\x2c\xff\x35\x41\x93\x7f\x0d\xff\x9d\
+\x39\xd3\xb3\x1d\x03\x6b\xa3\x26\xf9\xf9\x77\x94\x20\x3d\xf8\x93\
+\xff\xde\xd8\x5b\x34\x4a\xf2\xe5\x9b\xff\x46\x49\x8e\x67\xbe\x43\
+\xfa\x44\x00\x04\x2f\x02\x82\x2e\xff\x1a\x26\x5e\x76\xb9\x2f\x9f\
+\x2f\x31\x21\x56\x3c\x74\x4d\x4f\xe4\x07\x62\xda\x45\x5d\xfd\xb8\
+\xe7\xaf\xd8\x26\x19\xee\xa9\xeb\x10\x3e\x11\x00\xc1\x8a\x00\x57\
+\xe4\x5f\xc3\xde\xfb\xee\xeb\xcb\xe7\x54\x6f\x07\xdc\x78\x76\x11\
+\x12\x74\x98\x89\xfe\xbc\xea\x57\xc3\x44\xcf\x3d\x87\xec\x89\x00\
+\x08\x4e\x04\xb8\x26\x7f\xc5\x07\x9f\x7c\x2a\x3a\x15\x15\xf9\x76\
+\x6e\x26\x8c\x6f\xe7\xdb\x8a\x81\x60\x06\x6a\x85\xbf\xe3\x0f\x68\
+\xe3\xe7\xf5\xff\x82\x57\xf7\xfd\x09\x00\x22\x00\x02\x18\x01\x2e\
+\xca\xbf\x86\x57\x5f\x5f\x22\xd2\xd3\xfd\x7b\xb7\xfe\xf0\x51\xad\
+\xc4\x6f\xcb\xab\x91\xa3\x03\xfc\xba\x74\x84\x18\x5d\x91\xe3\xe7\
+\x75\xff\x85\xa4\x85\x2f\x7e\x43\xf2\x44\x00\xd8\x1f\x01\x2e\xcb\
+\xbf\x86\xbb\xef\x9b\xee\xeb\xb9\xa9\x1e\xd8\x4c\xfc\xb8\xb8\x0a\
+\x49\x06\x98\x8d\x2f\x0c\x13\x83\xfa\x34\xf6\xf3\x7a\xff\x45\x32\
+\xd0\x37\xb7\x21\x78\x22\x00\xec\x8e\x00\xe4\xff\x7f\x9c\x7e\xd6\
+\x59\xbe\xae\x30\xd7\xb7\x4b\x86\xf8\xf0\x99\x21\xc8\x32\x80\xa8\
+\x37\x3f\xd4\x6b\xa0\x3e\x8e\xa7\xdf\x25\x7b\xf9\xea\x35\xe4\x4e\
+\x04\x80\xbd\x11\x80\xfc\xff\xce\x61\x47\x8c\xf3\x35\x02\xd4\x6b\
+\x82\xf7\x5d\xd1\x03\x69\x06\xe8\x7e\xbf\x7a\xd8\xcf\xa7\x27\xfd\
+\x6b\x73\xa4\xef\x4e\x43\xec\x44\x00\x58\x13\x01\x33\x6a\x47\x00\
+\xf2\xdf\x3e\x9f\x7f\xf5\xb5\x18\xb5\xcf\x3e\xbe\xaf\x37\xaf\x96\
+\x9c\xfd\xee\xd5\x0a\x24\x6a\xf9\x4f\xfe\xc3\x4b\x9b\x46\x63\xbf\
+\x82\x73\xa2\xe2\x33\xa4\x4e\x04\x80\x7d\x11\x80\xfc\x77\xce\x27\
+\x1b\x36\x8a\x21\xc3\x86\xf9\x3e\x91\xb7\x69\xd1\x48\x2c\xb8\xab\
+\x14\x99\xf2\x93\x7f\x7d\xb8\x21\x6a\x2e\x43\xe8\x44\x00\x58\x17\
+\x01\xb3\x24\xab\x91\xff\xae\x5f\x0f\xec\x5b\x5c\xec\xfb\x84\xae\
+\x7e\x3a\x3e\xf7\xe8\x02\xde\x12\xb0\xe8\x27\xff\x4b\xa2\xf3\x93\
+\xbf\xe2\x7e\x49\x0c\x01\x40\x04\x10\x01\x44\x80\x71\xd8\x2a\xff\
+\x1a\xde\x7a\xef\x7d\x5f\xd7\x08\xf8\xeb\x03\x82\x6f\xcf\x1c\x84\
+\x64\x0d\xe6\x8d\x87\x07\x8a\x92\x6e\x99\xd1\xba\xbe\xe6\x4a\x12\
+\xa2\xea\x30\x44\x4e\x04\x00\x11\x10\x44\xf9\xd7\xb0\x62\xed\x3a\
+\x91\x97\x9f\x1f\x95\x63\x98\xd2\x28\x2e\xb4\x15\xad\xfa\x96\x89\
+\x70\xcd\xe1\xfb\x45\x95\xe2\xe4\x83\xf3\xa2\xf5\xad\x5f\xf1\xba\
+\x24\x35\xea\xfe\x42\xe2\x44\x00\x10\x01\x41\x95\x7f\x0d\x8b\x97\
+\x2d\x8b\x5a\x04\x28\x7a\x74\x4c\x17\xcf\xdd\xca\x86\x42\x26\x70\
+\xff\x55\x3d\xa2\x75\xaf\xbf\x86\x65\x92\xa6\x46\xb8\x0b\x81\x13\
+\x01\x40\x04\x04\x59\xfe\xb5\x7f\x09\x28\xea\xdc\x39\xaa\xc7\x76\
+\x64\x59\x33\xb1\xe6\xbf\xe5\x88\x38\x0a\xbc\x35\x63\x90\x18\x56\
+\xda\x24\xda\xd7\xd7\x7c\x49\xba\x31\xde\x42\xde\x44\x00\x10\x01\
+\x41\x97\x7f\x0d\x6f\xbf\xff\x81\x28\x2e\x29\x89\xea\x31\x56\x3f\
+\x3b\x1f\x3d\x26\x57\x6c\x98\x3f\x0c\x31\xfb\x80\x5a\xad\xf1\xbc\
+\x63\x0a\x42\x3b\x3a\x46\xf9\xfa\x7a\x4c\xe7\x76\xdf\x04\x00\x11\
+\x40\x04\x10\x01\xc8\xbf\x9e\x7c\xf8\xe9\x67\x62\x58\x45\x45\xf4\
+\x8f\x77\x72\x5c\xe8\xe9\xf3\x9f\x5e\x67\x39\x61\x2f\xf8\xf6\x95\
+\x8a\xd0\x82\x3e\x4d\x32\x13\x4c\xb8\xbe\xa6\xfa\xb1\xb9\x0f\x01\
+\x40\x04\x00\x11\x80\xfc\x77\xb5\x4e\xc0\xc6\x2f\xc4\xe8\x31\xfb\
+\x19\x71\xec\x5b\x66\x27\x89\xdb\x27\x76\x13\x5b\x79\x50\x50\x0b\
+\x5f\x2e\x18\x2e\xce\x39\xaa\x40\xa4\xa7\xc6\x9b\x72\x7d\x4d\x34\
+\xd6\x55\x08\x9b\x08\x00\xb7\x23\xc0\x35\xf9\xd7\xb0\xe1\xeb\x4d\
+\xe2\xc8\xa3\x8f\x36\xe6\x3c\xa8\x45\x84\x2e\x3f\xa5\x03\xb7\x06\
+\x22\xe4\x93\xe7\x86\x8a\x7f\x1c\x9a\x2f\x92\x93\xe2\x4c\x39\xa7\
+\xdb\x24\x27\x19\xed\x29\x64\x4d\x04\x80\xbb\x11\xe0\xaa\xfc\x6b\
+\x73\xce\x79\xe7\x1b\x75\x6e\xe2\xe3\x62\xc4\xfe\x55\x2d\xc4\xbc\
+\xdb\x4b\xc4\x1f\xab\x10\xfb\xae\x78\xe7\xe9\x41\xe2\x98\x31\xb9\
+\x26\xdc\xe3\xaf\xcd\x16\xc9\x81\xc6\x3b\x0a\x51\x13\x01\xe0\x66\
+\x04\x20\xff\xff\xe3\xde\x07\x1e\x10\x19\x19\x19\xc6\x05\x5a\xc7\
+\xfc\x54\x71\xc3\x84\x22\xf1\xcd\xcb\xec\x31\xf0\xd7\xfb\xfb\xb7\
+\x5c\xd8\x55\x0c\xe8\x99\x65\xe2\xaf\x6a\x9b\x25\x15\x56\xf8\x09\
+\x49\x13\x01\xe0\x5e\x04\x20\xff\xbf\xb3\x68\xe9\x1b\x51\x7f\x4d\
+\x70\x47\x34\x4a\x8a\x15\xe3\xf6\x6e\x2d\x16\x3f\xd0\xdf\x59\xe9\
+\xab\xa5\x95\x9f\xba\xa9\x8f\xd8\xaf\x32\xc7\xb4\x6f\xfb\x7f\x7d\
+\xc7\xbf\xbd\x35\x6e\x42\xd0\x44\x00\xb8\x15\x01\xc8\x7f\xe7\xfb\
+\x07\xec\x33\x7a\xb4\xd1\x0f\x6c\x16\xb5\x4b\x0d\x3d\xe4\xf6\xea\
+\x7d\xfd\x9d\x58\x61\x70\xc9\x83\x03\xc4\x29\x87\xe4\x89\x66\x59\
+\x89\xa6\x3f\x4c\x7b\xb3\x24\xc9\x2a\x2f\x21\x67\x22\x00\xdc\x89\
+\x00\xe4\x5f\x37\x26\x5e\x76\xb9\x88\x8f\x8f\x37\xfe\xed\x8d\xe6\
+\x4d\x12\xc5\x51\xa3\x73\xc5\x8c\x49\x7d\xc4\x2f\x4b\xab\x02\xf3\
+\x30\xdf\xbd\x57\x74\x17\xe3\xf7\x69\x2d\xf2\x5a\x36\xb2\xe1\x15\
+\xda\xef\x25\xfb\x5b\xe9\x24\xc4\x4c\x04\x80\x1b\x11\x80\xfc\xeb\
+\xc7\x13\x33\x66\x8a\x66\xcd\x9a\x59\xb3\x8e\x83\x7a\xfa\x7d\xd4\
+\x90\xe6\xe2\x9a\x33\x3a\x89\x97\xee\x2e\x15\x3f\x2f\xb1\x23\x08\
+\xbe\x78\x71\xb8\x78\xe8\x9a\x9e\xe2\xb8\xfd\xdb\x88\xf6\x79\x29\
+\xb6\x2d\x9e\xb5\x54\x52\x60\xad\x8f\x90\x32\x11\x00\xc1\x8f\x00\
+\xe4\x1f\xe1\xf2\xc1\x6b\xd6\x1a\xb1\x68\x50\x24\xc4\xc5\xc6\x88\
+\x9e\x9d\xd2\x43\x62\xbd\xf3\xd2\x6e\x62\xed\x93\xe5\x51\xbd\x65\
+\xa0\xfe\xee\x0f\x9f\x19\x22\xe6\x4c\xed\x2b\x6e\x3c\xbb\x28\xf4\
+\xef\xea\x52\x98\x66\xf3\x9e\x19\x37\x99\xb6\xb2\x1f\x01\x40\x04\
+\x10\x01\x44\x00\xf2\xf7\xe0\x1c\x99\xf8\x96\x40\x24\xbb\x13\x76\
+\x2e\x48\x0b\xed\x49\x70\xc2\x81\x6d\xc4\x55\xa7\x75\x14\x0f\x5e\
+\xdd\x53\x2c\x9a\xde\x5f\x7c\x3e\x7f\x58\x83\x5e\x3b\xfc\x7d\x45\
+\x75\xe8\xe9\xfc\xf5\x73\x87\x88\xa5\x0f\x0d\x08\x6d\xba\x73\xe1\
+\x71\x85\xa1\x57\x1a\xbb\x77\x48\x0f\x3d\xc8\x18\x90\x9d\x32\xbf\
+\x93\x8c\x0e\x84\x87\x90\x31\x11\x00\xc1\x8d\x00\xe4\xaf\x8f\xe5\
+\xab\xd7\x58\xfb\x6b\x40\x7d\xf6\x29\x48\x4b\x89\x0b\xed\x96\x57\
+\x90\x9b\x12\x12\x77\xff\x1e\x59\xa2\xa2\x5f\x53\xb1\xf7\xd0\xe6\
+\x21\x99\xef\x5e\x9e\x2d\xca\x7b\x37\x0e\xfd\xba\xa0\xfe\x7f\xb2\
+\x1b\x27\x06\x49\xee\x75\xd9\xcc\xa7\x6d\x60\x1c\x84\x88\x89\x00\
+\x08\x66\x04\x20\x7f\x7e\x0d\x00\x6d\x6c\x94\x1c\x1a\x38\xff\x20\
+\x61\x22\x00\x82\x17\x01\xc8\x9f\x5f\x03\x40\x0b\x5b\x25\x93\x24\
+\x19\x81\x74\x0f\x02\x26\x02\x20\x58\x11\x80\xfc\xfd\x63\xd2\x94\
+\xa9\xa2\x45\x8b\x16\x88\x32\x98\x2c\x96\xf4\x0e\xb4\x77\x90\xaf\
+\x51\x11\xd0\x83\x08\x80\x86\x44\x00\xf2\x8f\xce\xf6\xc2\x13\xce\
+\x39\x57\xa4\xa4\xa4\x20\xcd\x60\xf0\x8d\xe4\x38\x49\x4c\xe0\x9d\
+\x83\x78\x89\x00\x22\x20\x18\x11\x80\xfc\xa3\xcb\xca\x75\x6f\x8a\
+\x43\x0f\x3b\x4c\xc4\xc6\xc6\x22\x51\x3b\xf9\x43\x72\xb7\xa4\x99\
+\x33\xbe\x41\xba\x44\x00\x11\x60\x7f\x04\x20\x7f\x73\x98\xff\xd2\
+\x42\x31\x64\xe8\x50\x84\x6a\x17\xcf\x48\xfa\x3b\xe7\x1a\x84\x4b\
+\x04\x10\x01\x76\x47\x00\xf2\x37\x93\x07\x1e\x7e\x44\xe4\xe7\xb7\
+\x45\xae\x66\x7f\xe3\x7f\x42\xd2\xd7\x59\xcf\x20\x5b\x22\x80\x08\
+\xb0\x37\x02\x90\xbf\xb9\xcc\x7e\xf6\x39\x5e\x17\x34\xf7\xc9\xfe\
+\xfb\x25\x5d\x9c\x77\x0c\xa2\x25\x02\x88\x00\x3b\x23\x00\xf9\x23\
+\x7f\xa8\x17\x5b\x24\xb7\x49\x0a\x71\x0b\x01\x60\x5b\x04\x7c\x4d\
+\x04\x40\x4d\x04\x20\x7f\xe4\x0f\x75\xe6\x97\xf0\xba\xfd\xb9\xf8\
+\x84\x00\x20\x02\x88\x00\xab\xb9\xe9\xe6\x29\xc8\x1f\xf9\xc3\xae\
+\x79\x43\x72\x9a\x4b\x4f\xf5\x13\x00\x44\x00\x11\x00\x80\xfc\x5d\
+\xe5\x53\xc9\x55\xdc\xdf\x27\x00\x88\x00\x22\x00\x00\xf9\x07\x9f\
+\x1f\x25\xf7\x48\x2a\x24\xb1\x78\x82\x00\x20\x02\x88\x00\x00\xe4\
+\x1f\x5c\xb6\x49\x9e\x95\x1c\x26\x49\xc1\x0b\x04\x00\x11\x40\x04\
+\x00\x04\x5d\xfe\x6a\x57\xba\xef\x1d\x95\xfe\x3a\xc9\x64\xc9\x18\
+\x49\x13\x3c\x40\x00\x10\x01\x44\x00\x80\x2b\xf2\x7f\x4b\xd2\x42\
+\x12\x27\x29\x96\x9c\x25\x99\x25\xd9\x1c\x50\xe1\xbf\x17\x7e\x6d\
+\xef\x60\x49\x0e\x73\x3e\x01\x00\x44\x00\x80\xb3\xf2\xdf\xc1\x1c\
+\xa0\x82\xa0\x44\x32\x41\x32\x53\xf2\x89\xa5\x3f\xe9\xbf\x1f\xbe\
+\x97\x3f\x4e\xd2\x86\xf9\x9d\x00\x00\x22\x00\x00\xf9\xef\x40\xfe\
+\x3b\x99\x13\xb2\x24\x83\x24\x27\x4b\xa6\x49\x16\x49\x7e\x30\x40\
+\xf4\x3f\x49\x96\x49\x1e\x90\x5c\x24\x39\x40\xd2\x5d\xd2\x88\xb9\
+\x9c\x00\x00\x22\x00\x00\xf9\x37\x40\xfe\x3b\x99\x23\x62\xd4\x37\
+\x6b\xb5\xe9\x8d\x64\x3f\xc9\xa9\x92\xab\xc3\xcb\xe2\xbe\x28\x79\
+\x37\x7c\x3b\xe1\xb7\x08\x16\xda\xf9\x32\xfc\x0d\x7e\x85\x64\xa1\
+\x64\x8e\xe4\x11\xc9\xcd\x92\x53\x24\x55\xe1\xbf\x3b\x86\xf9\x9a\
+\x00\x00\x22\x00\x00\xf9\xfb\x24\xff\x08\xe6\x12\x75\x5b\x21\x4d\
+\x92\x2d\xc9\x93\x74\x92\xf4\x0c\xdf\x6a\xe8\x1c\x96\xb9\xfa\x95\
+\x21\x8e\xb9\x97\x00\x00\x22\x00\x00\xf9\x07\x40\xfe\x40\x00\x00\
+\x11\x40\x04\x00\x20\x7f\x20\x00\x80\x08\x20\x02\x00\xf9\x23\x7f\
+\x20\x00\x80\x08\x20\x02\x00\xf9\x23\x7f\x20\x00\x80\x08\x20\x02\
+\x00\xf9\x23\x7f\x20\x00\x80\x08\x20\x02\x00\xf9\x23\x7f\x20\x00\
+\x80\x08\x00\x40\xfe\xc8\x1f\x08\x00\x20\x02\x00\x90\x3f\xf2\x07\
+\x02\x00\x88\x00\x00\xe4\x0f\x40\x00\x00\x11\x00\x80\xfc\x01\x08\
+\x00\x20\x02\x00\x90\x3f\x00\x01\x00\x44\x00\x00\xf2\x07\x20\x00\
+\x80\x08\x00\x40\xfe\x00\x04\x00\x10\x01\x00\xc8\x1f\x80\x00\x80\
+\x7a\x46\x40\x77\x22\x00\x90\x3f\xf2\x07\x02\x00\x88\x00\x22\x00\
+\x90\x3f\xf2\x07\x02\x00\x88\x00\x22\x00\x90\x3f\xf2\x07\x02\x00\
+\x88\x00\x22\x00\x90\x3f\xf2\x07\x02\x00\x88\x00\x22\x00\x90\x3f\
+\xf2\x07\x02\x00\x88\x00\x22\x00\x90\x3f\x00\x01\x00\x44\x00\x11\
+\x00\xc8\x1f\x80\x00\x00\x22\x80\x08\x00\xe4\x0f\x40\x00\x00\x11\
+\x40\x04\x00\xf2\x07\x20\x00\x80\x08\x20\x02\x00\xf9\x03\x10\x00\
+\x40\x04\x10\x01\x80\xfc\x01\x08\x00\x20\x02\x00\x90\x3f\x00\x01\
+\x00\x44\x00\x20\x7f\xe4\x0f\x40\x00\x00\x11\x00\xc8\x1f\xf9\x03\
+\x10\x00\x40\x04\x00\xf2\x47\xfe\x00\x04\x00\x10\x01\x80\xfc\x91\
+\x3f\x00\x01\x00\x44\x00\x20\x7f\xe4\x0f\x04\x00\x00\x11\x00\xc8\
+\x1f\xf9\x03\x01\x00\x40\x04\x00\xf2\x47\xfe\x40\x00\x00\x10\x01\
+\x80\xfc\x01\x08\x00\x00\x22\x00\x90\x3f\x00\x01\x00\x40\x04\x00\
+\xf2\x07\x20\x00\x00\xb6\x13\x01\x5f\x11\x01\x80\xfc\x01\x08\x00\
+\x20\x02\x88\x00\x40\xfe\x00\x04\x00\x10\x01\x44\x00\x20\x7f\x00\
+\x02\x00\x88\x00\x22\x00\xf9\x23\x7f\x00\x02\x00\x88\x00\x22\x00\
+\xf9\x23\x7f\x00\x02\x00\x88\x00\x22\x00\xf9\x23\x7f\x00\x02\x00\
+\x2c\x0d\x80\x6c\xc9\x3a\xbf\x26\xfc\xd4\xd4\x54\x31\x73\xce\x33\
+\xc8\xd6\x50\x6e\xb9\xfd\x76\x11\x17\x17\xe7\x67\x00\x3c\x27\x49\
+\xe2\x5a\x04\x02\x80\x83\x00\xfe\xcb\x7f\xb5\x9f\xf2\x9f\x31\x6b\
+\x36\xa2\x35\x9c\x29\xd3\xa6\xf9\x1d\x01\xcf\x10\x01\x40\x00\x70\
+\x10\x00\xf9\x03\x11\x00\x40\x00\x00\x20\x7f\x20\x02\x00\x08\x00\
+\x00\xe4\x0f\x44\x00\x00\x01\x00\x80\xfc\x81\x08\x00\x20\x00\x00\
+\x90\x3f\x10\x01\x00\x04\x00\x00\xf2\x07\x22\x00\x80\x00\x00\xe4\
+\x8f\xfc\x81\x08\x00\x20\x00\x00\xf9\x23\x7f\x20\x02\x00\x08\x00\
+\x40\xfe\xc8\x1f\x88\x00\x00\x02\x00\x90\x3f\xf2\x07\x22\x00\x80\
+\x00\x00\xe4\x8f\xfc\x81\x08\x00\x20\x00\x00\xf9\x23\x7f\x20\x02\
+\x00\x08\x00\x40\xfe\x40\x04\x10\x01\x00\x04\x00\x20\x7f\x20\x02\
+\x88\x00\x00\x02\x00\x90\x3f\x10\x01\x44\x00\x00\x01\x00\xc8\x1f\
+\x88\x00\x22\x00\x80\x00\x00\xe4\x0f\x44\x00\x11\x00\x40\x00\x00\
+\xf2\x07\x22\x80\x08\x00\x02\x00\x00\xf9\x03\x11\x40\x04\x00\x01\
+\x00\x80\xfc\x81\x08\x20\x02\x80\x00\x00\xe4\x8f\xfc\x81\x08\x20\
+\x02\x80\x00\x00\xe4\x8f\xfc\x81\x08\x20\x02\x80\x00\x00\xe4\x8f\
+\xfc\x81\x08\x20\x02\x80\x00\x00\xe4\x8f\xfc\xc1\xe1\x08\x98\x43\
+\x04\x00\x01\x00\xc8\x1f\xf9\x03\x11\x00\x40\x00\x00\xf2\x47\xfe\
+\x40\x04\x00\x10\x00\x80\xfc\x01\x88\x00\x00\x02\x00\x90\x3f\x00\
+\x11\x00\x40\x00\x00\xf2\x07\x20\x02\x00\x08\x00\x40\xfe\x00\x44\
+\x00\x00\x01\x00\xc8\x1f\x80\x08\x00\x20\x00\x00\xf9\x03\x10\x01\
+\x00\x04\x00\x20\x7f\x00\x22\x00\x80\x00\x40\xfe\xc8\x1f\x80\x08\
+\x00\x20\x00\x90\x3f\xf2\x07\x20\x02\x80\x00\x00\xe4\x8f\xfc\x01\
+\x88\x00\x20\x00\x00\xf9\x23\x7f\x20\x02\x88\x00\x20\x00\x00\xf9\
+\x23\x7f\x20\x02\x88\x00\x20\x00\x00\xf9\x23\x7f\x20\x02\x88\x00\
+\x20\x00\x00\xf9\x23\x7f\x20\x02\x88\x00\x20\x00\x00\xf9\x03\x10\
+\x01\x44\x00\x10\x00\x80\xfc\x01\x88\x00\x22\x00\x08\x00\x40\xfe\
+\x00\x44\x00\x11\x00\x04\x00\x20\x7f\x00\x22\x80\x08\x00\x02\x00\
+\x90\x3f\x00\x11\x40\x04\x00\x01\x00\xc8\x1f\x80\x08\x20\x02\x80\
+\x00\x00\xe4\x0f\x40\x04\x10\x01\x40\x00\x20\x7f\xe4\x0f\x40\x04\
+\x30\x27\x02\x01\x80\xfc\x91\x3f\x80\x6b\x11\x30\x9b\x08\x00\x02\
+\x00\xf9\x23\x7f\x87\x98\x3b\x6f\xbe\x58\xbe\x7a\x0d\xc7\x82\x08\
+\x20\x02\x80\x00\x40\xfe\xc8\xdf\x15\x66\x3f\xfb\x9c\xc8\xc8\xc8\
+\x10\xed\xda\xb5\x23\x02\x88\x00\x22\x00\x08\x00\xe4\x8f\xfc\x5d\
+\x92\x7f\xcd\xb9\x22\x02\x88\x00\x22\x00\x08\x00\xe4\x8f\xfc\x1d\
+\x93\x3f\x11\x40\x04\x10\x01\x40\x00\x20\x7f\xe4\xef\xa8\xfc\x89\
+\x00\x22\x80\x08\x00\x02\x00\xf9\x23\x7f\x47\xe5\x4f\x04\x10\x01\
+\x44\x00\x10\x00\xc8\x1f\xf9\x3b\x2a\x7f\x22\x80\x08\x20\x02\x80\
+\x00\x40\xfe\xc8\xdf\x51\xf9\x13\x01\x44\x00\x11\x00\x04\x00\xf2\
+\x47\xfe\x8e\xca\x9f\x08\x20\x02\x88\x00\x20\x00\x90\x3f\xf2\x77\
+\x54\xfe\x44\x00\x11\x40\x04\x00\x01\x80\xfc\x91\xbf\xa3\xf2\x27\
+\x02\x88\x00\x22\x00\x08\x00\xe4\x8f\xfc\x1d\x95\x3f\x11\x40\x04\
+\x10\x01\x40\x00\x20\x7f\xe4\xef\xa8\xfc\x89\x00\x22\x80\x08\x00\
+\x02\x00\xf9\x23\x7f\x47\xe5\x4f\x04\x10\x01\x44\x00\x10\x00\xc8\
+\x1f\x1c\x95\x3f\x11\x40\x04\x10\x01\x40\x00\x20\x7f\x70\x54\xfe\
+\x44\x00\x11\x40\x04\x00\x01\x80\xfc\xc1\x51\xf9\x13\x01\x44\x00\
+\x11\x00\x04\x00\xf2\x07\x47\xe5\x4f\x04\x10\x01\x44\x00\x10\x00\
+\xc8\x1f\x1c\x95\x3f\x11\x40\x04\x10\x01\x40\x00\x20\x7f\x70\x54\
+\xfe\x44\x00\x11\x40\x04\x00\x07\x01\xf9\x83\xa3\xf2\x27\x02\x88\
+\x00\x22\x80\x00\x00\xe4\x0f\x8e\xca\x9f\x08\x20\x02\x88\x00\x02\
+\x00\x90\x3f\x38\x2a\x7f\x22\x80\x08\x20\x02\x08\x00\x40\xfe\xe0\
+\xa8\xfc\x89\x00\x22\x80\x08\x20\x00\x00\xf9\x83\xa3\xf2\x27\x02\
+\x88\x80\xed\x30\x8b\x08\x20\x00\x00\xf9\x83\x03\xf2\x27\x02\x88\
+\x00\x22\x80\x00\x00\xe4\x0f\x8e\xca\x9f\x08\x20\x02\x88\x00\x02\
+\x00\x90\x3f\x38\x2a\x7f\x22\x80\x08\xd8\x41\x04\x24\x32\xf7\x13\
+\x00\x1c\x38\xe4\x0f\xd1\x93\xff\x3b\x92\x6f\x89\x00\x20\x02\x80\
+\x00\x40\xfe\xe0\x8e\xfc\xdf\x92\xb4\x90\xf4\x21\x02\x80\x08\x00\
+\x02\x00\xf9\x83\x43\xf2\xaf\x35\x16\x89\x00\x20\x02\x80\x00\x40\
+\xfe\xe0\x92\xfc\x89\x00\x20\x02\x80\x00\x40\xfe\xe0\xa8\xfc\x89\
+\x00\x20\x02\x80\x00\x40\xfe\xe0\xa8\xfc\x89\x00\x20\x02\x80\x00\
+\x40\xfe\xe0\xa8\xfc\x89\x00\x20\x02\x80\x00\x40\xfe\xe0\xa8\xfc\
+\x89\x00\x20\x02\x80\x00\x40\xfe\xe0\xa8\xfc\x89\x00\x20\x02\x80\
+\x00\x40\xfe\xe0\xa8\xfc\x89\x00\x20\x02\x80\x00\x40\xfe\xe0\xa8\
+\xfc\x89\x00\x20\x02\x80\x00\x40\xfe\xe0\xa8\xfc\x89\x00\x20\x02\
+\x80\x00\x40\xfe\xe0\xa8\xfc\x89\x00\x20\x02\x80\x00\x40\xfe\xe0\
+\xa8\xfc\x89\x00\x20\x02\x80\x00\x40\xfe\xe0\xa8\xfc\x89\x00\x20\
+\x02\x80\x00\x40\xfe\xe0\xa8\xfc\x89\x00\x20\x02\x80\x00\x40\xfe\
+\xe0\xa8\xfc\x89\x00\x20\x02\xc0\xf9\x00\x40\xfe\xe0\xaa\xfc\x89\
+\x00\x20\x02\xc0\xd9\x00\x40\xfe\xe0\xba\xfc\x89\x00\x20\x02\xc0\
+\xb9\x00\x40\xfe\x80\xfc\x89\x00\x20\x02\xc0\xb1\x00\x40\xfe\x80\
+\xfc\x89\x00\x20\x02\xc0\xb1\x00\x40\xfe\x80\xfc\x89\x00\x30\x36\
+\x02\x9e\x26\x02\x08\x00\xe4\x0f\xc8\x9f\x08\x00\x22\x00\x08\x00\
+\xe4\x0f\xc8\x9f\x08\x00\x22\x00\x08\x00\xe4\x0f\xc8\x9f\x08\x00\
+\x22\x00\x08\x00\xe4\x0f\xc8\x9f\x08\x00\x22\x00\x08\x00\xe4\x0f\
+\xc8\x9f\x08\x00\x22\x00\x5c\x0d\x00\xe4\x0f\xc8\x9f\x08\x00\x22\
+\x00\x1c\x0b\x00\xe4\x0f\xc8\x9f\x08\x00\x22\x00\x1c\x0b\x00\xe4\
+\x0f\xc8\x9f\x08\x00\x22\x00\x1c\x0b\x00\xe4\x0f\xc8\x9f\x08\x00\
+\x22\x00\x1c\x0b\x00\xe4\x0f\xc8\x9f\x08\x00\x22\x00\x1c\x0b\x00\
+\xe4\x0f\xc8\x9f\x08\x00\x22\x00\x1c\x0b\x00\xe4\x0f\xc8\x9f\x08\
+\x00\x22\x00\x1c\x0b\x00\xe4\x0f\xc8\x9f\x08\x00\x22\x80\x08\x70\
+\x2c\x00\x90\x3f\x20\x7f\x22\x80\x08\x20\x02\x88\x00\xc7\x02\x00\
+\xf9\x03\xf2\x27\x02\x88\x00\x22\x80\x08\x70\x2c\x00\x90\x3f\x20\
+\x7f\x22\x80\x08\x20\x02\x88\x00\xc7\x02\x00\xf9\x03\xf2\x27\x02\
+\x88\x00\x22\x80\x08\x70\x2c\x00\x90\x3f\x20\x7f\x22\x80\x08\x20\
+\x02\x88\x00\xc7\x02\x00\xf9\x03\xf2\x27\x02\x88\x00\x22\x80\x08\
+\x70\x2c\x00\x90\x3f\x20\x7f\x22\x80\x08\x20\x02\x88\x00\xc7\x02\
+\x00\xf9\x03\xf2\x27\x02\x88\x00\x22\x80\x08\x70\x2c\x00\x90\x3f\
+\x20\x7f\x22\x80\x08\x20\x02\x88\x00\xc7\x02\x00\xf9\x03\xf2\x27\
+\x02\x88\x00\x22\x80\x08\x70\x2c\x00\x90\x3f\x20\x7f\x22\x80\x08\
+\x20\x02\x88\x00\xc7\x02\x00\xf9\x03\xf2\x27\x02\x88\x00\x22\xc0\
+\x63\x66\x12\x01\x86\x05\x00\xf2\x07\xe4\x4f\x04\x10\x01\x44\x00\
+\x11\xe0\x58\x00\x20\x7f\x40\xfe\x44\x00\x11\x40\x04\x10\x01\x8e\
+\x05\x00\xf2\x07\xe4\x4f\x04\x10\x01\x40\x04\x38\x16\x00\xc8\x1f\
+\x90\x3f\x10\x01\x40\x04\x38\x16\x00\xc8\x1f\x90\x3f\x10\x01\x40\
+\x04\x38\x16\x00\xc8\x1f\x90\x3f\x10\x01\x40\x04\x38\x16\x00\xc8\
+\x1f\x90\x3f\x10\x01\x40\x04\x38\x16\x00\xc8\x1f\x90\x3f\x10\x01\
+\x40\x04\x38\x16\x00\xc8\x1f\x90\x3f\x10\x01\x40\x04\x38\x16\x00\
+\xc8\x1f\x90\x3f\x10\x01\x40\x04\x38\x16\x00\xc8\x1f\x90\x3f\x10\
+\x01\x40\x04\x38\x16\x00\xc8\x1f\x90\x3f\x10\x01\x40\x04\x38\x16\
+\x00\xc8\x1f\x90\x3f\x10\x01\x40\x04\x38\x16\x00\xc8\x1f\x90\x3f\
+\x10\x01\x40\x04\x38\x16\x00\xc8\x1f\x90\x3f\x10\x01\x40\x04\x38\
+\x16\x00\xc8\x1f\x90\x3f\x10\x01\x40\x04\x38\x16\x00\xc8\x1f\x90\
+\x3f\x10\x01\x40\x04\x38\x16\x00\xc8\x1f\x90\x3f\x10\x01\x40\x04\
+\x38\x16\x00\xc8\x1f\x90\x3f\x10\x01\x40\x04\x38\x16\x00\xc8\x1f\
+\x90\x3f\x10\x01\x40\x04\xd8\x1f\x01\xc8\x1f\x90\x3f\x10\x01\x44\
+\x00\x11\xe0\x60\x04\x20\x7f\x40\xfe\x40\x04\x10\x01\x44\x80\x83\
+\x11\x80\xfc\x01\xf9\x03\x11\x40\x04\x10\x01\x0e\x46\x00\xf2\x07\
+\xe4\x0f\x44\x00\x11\x40\x04\x34\x8c\x19\x36\x46\x00\xf2\x07\xe4\
+\x0f\x44\x00\x11\x40\x04\x38\x18\x01\x3b\xbb\x90\x9a\x21\x7f\x40\
+\xfe\x40\x04\x10\x01\x44\x40\xbd\x22\x20\xc1\xea\x00\x50\x1f\x40\
+\xf2\x32\xf2\x07\xe4\x0f\x44\x00\x11\x40\x04\xd4\x8b\xdb\x6c\x0f\
+\x80\xdb\x90\x3f\x20\x7f\x20\x02\x88\x00\x22\x20\x22\x4e\xb5\x32\
+\x00\xe4\x9f\x93\x91\x3f\x20\x7f\x20\x02\x88\x00\x22\x20\x62\xb6\
+\x4a\xaa\xac\x0a\x00\xf9\xa7\x44\xf2\x3b\xf2\x47\xfe\xc8\x1f\x88\
+\x00\x22\x80\x08\x68\x10\xdf\x49\x5a\xda\x14\x00\x2f\x22\x7f\xe4\
+\x8f\xfc\x81\x08\x20\x02\x88\x00\x2d\x4c\xb1\x22\x00\xe4\x9f\x11\
+\xc8\x1f\xf9\x23\x7f\x20\x02\x88\x00\x22\x40\x1b\x5b\x24\x6d\x8d\
+\x0e\x00\xf9\x27\x46\xf2\x06\xf2\x47\xfe\xc8\x1f\x88\x00\x22\x80\
+\x08\xd0\xca\xdd\xa6\x07\xc0\x9e\xc8\x1f\xf9\x23\x7f\x20\x02\x88\
+\x00\x22\xc0\x93\x07\x02\xf3\x4d\x0e\x80\x3b\x91\x3f\xf2\x47\xfe\
+\x40\x04\x10\x01\x44\x80\x27\x9c\x66\xe8\x75\x10\xfa\xf9\x7f\x03\
+\xf2\x47\xfe\xc8\x1f\x88\x00\x22\x80\x08\xf0\x84\xe7\x4d\x0d\x80\
+\x3e\xc8\x1f\xf9\x23\x7f\x20\x02\x88\x00\x22\xc0\xb3\x08\xf8\x4d\
+\x92\x61\x62\x00\x5c\x80\xfc\x91\x3f\xf2\x07\x22\x80\x08\x20\x02\
+\x3c\x8d\x80\xfd\x4c\x0c\x80\xe9\xc8\x1f\xf9\x23\x7f\x20\x02\x88\
+\x00\xf0\x34\x02\xce\x33\x31\x00\xe6\xe9\xfc\x90\x29\x29\x29\xc8\
+\x1f\xf9\x23\x7f\x20\x02\x88\x00\xab\x23\x20\x36\x36\x56\xf7\x39\
+\xbf\xc9\xc4\x00\x58\xa7\xf3\x43\x5e\x7b\xc3\x0d\x0c\x20\xe4\x8f\
+\xfc\x81\x08\x20\x02\xac\xe6\xd8\xe3\x8f\xd7\x7d\xbe\x1f\x36\x31\
+\x00\xbe\xd3\xf5\x01\x13\x12\x13\xc5\x27\x1b\xbf\x60\xf0\x20\x7f\
+\xe4\x0f\x44\x00\x11\x60\x35\x2f\xbd\xba\x48\xf7\xb9\x5e\x60\x62\
+\x00\xfc\xaa\xeb\x03\x2a\xc9\x30\x70\x90\x3f\xf2\x07\x22\x80\x08\
+\xb0\x9d\x15\x6b\xd6\xea\x3e\xcf\xaf\x99\x18\x00\xeb\x75\x7e\xc8\
+\x67\x9e\x9f\xc7\xe0\x41\xfe\x48\x04\x88\x00\x22\xc0\x6a\xae\xbb\
+\xf1\x46\xdd\xe7\xf8\x29\x13\x03\xe0\x75\x9d\x1f\xb2\x73\x97\x2e\
+\xe2\x9d\x0f\x3f\x62\x00\x21\x7f\x00\x22\x80\x08\xb0\x92\x45\x4b\
+\xdf\x10\x59\x8d\x1b\xeb\x3e\xbf\xb7\x9a\x18\x00\x33\x74\x0f\xe2\
+\x3e\x7d\xfb\x8a\x77\x3f\x5a\xcf\x40\x42\xfe\x00\x44\x00\x11\x60\
+\x15\xaf\xbd\xf1\x86\x68\xd9\xaa\x95\x17\xe7\xf6\x52\x13\x03\x60\
+\x8a\x17\x83\x98\x08\x40\xfe\x00\x44\x00\x11\x80\xfc\xff\xe4\x58\
+\x13\x03\x60\x8c\x57\x83\xb8\x6f\x71\x31\x11\x80\xfc\x01\x88\x00\
+\x22\xc0\x78\x16\x2f\x5b\x26\x5a\xb5\x6e\xed\xe5\x39\x2d\x30\x31\
+\x00\xd2\x24\x5b\x88\x00\xe4\x8f\xfc\x01\x88\x00\xe4\xef\x09\xeb\
+\x4c\xde\x0e\xf8\x59\x2f\x07\x71\x71\x49\x89\x78\x6f\xfd\xc7\x0c\
+\x34\xe4\x0f\x40\x04\x10\x01\xae\xc9\x5f\x71\xb5\xc9\x01\x70\x8a\
+\xd7\x83\x98\x08\x40\xfe\x00\x44\x00\x11\x60\x12\xaf\x2f\x5b\x2e\
+\x5a\xe7\xe6\xfa\x71\x0e\xcb\x4d\x0e\x80\x0c\xc9\x37\x5e\x1f\x84\
+\x92\xd2\x52\x22\x00\xf9\x03\x10\x01\x44\x80\x4b\xf2\x5f\x6a\xec\
+\x18\xae\x35\x98\xcf\xf6\x63\x10\x13\x01\xc8\x1f\x80\x08\x20\x02\
+\x1c\x91\xbf\x62\x84\x0d\x01\x90\x2c\xd9\xe0\x4b\x04\xf4\xeb\x27\
+\xde\xff\xf8\x13\x06\x22\xf2\x07\x20\x02\x88\x00\x5f\x59\xb2\x7c\
+\x85\xc8\x6d\xd3\xc6\xaf\xb9\x73\x81\xd1\x63\xf7\x2f\x03\xf9\x44\
+\xbf\x06\x31\x11\x80\xfc\x01\x88\x00\x22\x20\xc0\xf2\x57\x0c\xb4\
+\x29\x00\x62\x25\x33\xfd\x3a\x38\xa5\xfd\xfb\x13\x01\xc8\x1f\x80\
+\x08\x20\x02\x82\x28\xff\x7f\x19\x3f\x66\xb7\x33\x88\xd3\xd5\x3b\
+\x8b\x44\x00\xf2\x47\xfe\x00\x44\x40\x10\x58\xba\x62\xa5\x68\x93\
+\x97\xe7\xe7\xfc\xa9\x96\xd8\x8f\xb1\x2e\x00\xc2\x83\xb8\xd0\x8f\
+\xb7\x02\x6a\xe8\xd7\x7f\x00\x11\x80\xfc\x01\x88\x00\x22\x20\x08\
+\xf2\x5f\xab\xbe\x48\x5b\x31\x56\x77\x32\x88\x87\x4b\xfe\xe7\x67\
+\x04\x7c\xf0\xc9\xa7\x0c\x58\xe4\x0f\x40\x04\x10\x01\xb6\xca\x7f\
+\xa3\x89\x4b\xfe\xd6\x3b\x00\xc2\x83\x78\xa4\x9f\x11\xd0\x7f\xc0\
+\x40\x22\x00\xf9\x03\x10\x01\x44\x40\x83\x79\x63\xe5\x2a\x91\x97\
+\x9f\xef\xb7\xfc\x8b\xac\x1a\xa3\x75\x18\xc4\x44\x00\xf2\x07\x00\
+\x22\x00\xf9\xef\x98\x2f\x24\x9d\xad\x1b\x9f\x75\x1c\xc4\xbb\x13\
+\x01\xc8\x1f\x00\x88\x00\xe4\x1f\x0c\xf9\xd7\x39\x00\xc2\x83\x78\
+\x0f\x3f\x23\x60\xc0\xc0\x32\x27\x23\x00\xf9\x03\x10\x01\x44\x40\
+\x64\x2c\x5b\xb5\x5a\xe4\xe7\xb7\x45\xfe\xba\x03\x20\x5a\x11\xf0\
+\xe1\xa7\x9f\x21\x7f\xe4\x0f\x40\x04\x10\x01\xa6\xc9\xff\x4b\x49\
+\x17\xab\xc7\x64\x04\x83\x78\x4f\xc9\x16\xbf\x0e\xf2\xc0\x32\x37\
+\x22\x00\xf9\x03\x10\x01\x44\x00\xf2\x37\x3a\x00\x88\x00\xe4\x0f\
+\x00\x44\x80\x29\xa8\xcf\xd6\xb6\x6d\x3b\xbf\xe5\xdf\x35\x10\x63\
+\xb1\x01\x83\x78\x2f\x3f\x23\xa0\xac\xbc\x3c\x90\x11\x80\xfc\x01\
+\x88\x00\x22\x00\xf9\x5b\x15\x00\x44\x00\xf2\x07\x00\x22\xc0\x21\
+\xf9\x7f\x15\x24\xf9\x37\x38\x00\xc2\x83\x78\x94\x9f\x11\x50\x3e\
+\x68\x90\xf8\xe8\xb3\xcf\x91\x3f\xf2\x07\x20\x02\x1c\x8d\x80\x15\
+\x6b\xd6\x86\x3e\x8b\xcf\xf2\xef\x16\xb8\xf1\xa7\x69\x10\x13\x01\
+\xc8\x1f\x00\x88\x00\xe4\xef\x5a\x00\x84\x07\xf1\xde\x7e\x46\xc0\
+\xa0\xc1\x83\xad\x8c\x00\xe4\x0f\x00\x44\x40\xe4\xf2\x2f\x28\x28\
+\xf0\x73\xfe\xfc\x5a\xd2\x3d\xb0\xe3\x4e\xf3\x20\x56\x11\xf0\x1b\
+\x11\x80\xfc\x01\x80\x08\xd0\x2a\xff\xb5\xeb\x90\xbf\xc9\x01\x10\
+\x1e\xc4\xfb\xf8\x19\x01\x83\x87\x0c\xb1\x22\x02\x90\x3f\x00\x10\
+\x01\xc8\x3f\xd0\x01\x10\xad\x08\x58\xff\xf9\x06\xe4\x8f\xfc\x01\
+\x88\x80\x80\x45\x40\x48\xfe\x85\x85\x7e\xcb\xbf\x87\x13\x63\xcd\
+\xc3\x41\xbc\xaf\x9f\x11\x30\x64\xe8\x50\x23\x23\x00\xf9\x03\x00\
+\x11\x10\x19\x2b\xd7\xbd\xe9\xb7\xfc\x37\xb9\x22\x7f\x4f\x03\x80\
+\x08\x40\xfe\x00\x40\x04\x58\x26\xff\x9e\x4e\x8d\x31\x1f\x06\xf1\
+\x68\x5f\x23\x60\xd8\x30\x23\x22\x00\xf9\x03\x00\x11\x10\xb9\xfc\
+\x0b\xdb\xb7\x47\xfe\xb6\x07\x40\x78\x10\x8f\x71\x29\x02\x90\x3f\
+\x00\x10\x01\x56\xc9\xbf\x97\x93\x63\xcb\xc7\x41\xac\x22\xe0\x77\
+\xbf\x4e\xea\xd0\xe1\xc3\xa3\x12\x01\xc8\x1f\x00\x88\x80\xc8\x58\
+\xf5\xe6\x5b\xa2\x7d\x87\x0e\x7e\xce\x9f\xdf\xb8\x2a\x7f\x5f\x03\
+\x20\x3c\x88\xf7\xf3\x3b\x02\x3e\xde\xb0\x01\xf9\x03\x00\x11\x60\
+\x78\x04\x20\xff\x80\x07\x40\x34\x22\x60\x58\x45\x85\x2f\x11\x80\
+\xfc\x01\x80\x08\xb0\x4a\xfe\xbd\x9d\x1f\x4f\x51\x1a\xc4\xfb\x07\
+\x29\x02\x90\x3f\x00\x10\x01\x91\xb1\xfa\xad\xb7\x45\x87\x8e\x1d\
+\x91\xbf\x2b\x01\x10\x8d\x08\x18\x5e\x59\xe9\x49\x04\x20\x7f\x00\
+\x20\x02\xac\x91\xbf\x3a\x66\x7d\x18\x43\x51\x0e\x80\xf0\x20\x3e\
+\xc0\xcf\x08\xa8\xa8\xac\xd2\x1a\x01\xc8\x1f\x00\x88\x00\xe4\x4f\
+\x00\x38\x16\x01\xc8\x1f\x00\x88\x80\xc8\x58\xf3\xf6\x3b\xa2\x63\
+\xa7\x4e\x7e\xcb\xbf\x2f\x63\xc6\xb0\x00\x08\x0f\xe2\x03\x25\x5b\
+\xfd\x1a\x0c\x95\x55\x23\xc4\x27\x1b\x36\x22\x7f\x00\x20\x02\x7c\
+\x8e\x00\xe4\x4f\x00\x6c\x6f\x10\x1f\x64\x43\x04\x20\x7f\x00\x20\
+\x02\x22\x8b\x00\x25\xff\x4e\x45\x45\x7e\xce\x9f\xdf\x21\x7f\x0b\
+\x02\x20\x1a\x11\x50\x35\xa2\xba\x5e\x11\x80\xfc\x01\x80\x08\x88\
+\x2c\x02\xa2\x24\xff\x62\xc6\x86\x25\x01\x10\x1e\xc4\x07\x9b\x18\
+\x01\xc8\x1f\x00\x88\x80\xc8\x22\x60\xed\x3b\xc8\x9f\x00\x30\x34\
+\x02\x46\x54\x8f\xdc\x69\x04\x20\x7f\x00\x20\x02\x22\x8b\x00\x25\
+\xff\xa2\xce\x9d\xfd\x96\x7f\x09\x63\xc1\xd2\x00\x08\x0f\xe2\x43\
+\x4c\x88\x00\xe4\x0f\x00\x44\x40\x64\x11\x10\x05\xf9\x7f\x8f\xfc\
+\x03\x10\x00\xd1\x88\x80\xd2\xfe\xfd\xc5\xc2\x45\xaf\x85\x06\xee\
+\xe7\x5f\x7d\x2d\x26\x4d\x99\x2a\xd2\xd3\xd3\x91\x3f\x00\x10\x01\
+\xbb\x20\xb7\x4d\x1b\xf1\xd8\x93\x4f\xfd\x29\xff\xa7\x66\xcd\x0a\
+\x85\x81\xcf\xf2\x2f\xe5\xdc\x07\x24\x00\xc2\x83\xf8\x50\x3f\x23\
+\x40\x91\x9d\x9d\x2d\x92\x93\x93\xfd\x1c\xb8\xc8\x1f\x00\xac\x8f\
+\x00\x45\x46\x66\xa6\xc8\xcc\xca\xf2\x7b\xfe\x44\xfe\x41\x0c\x80\
+\xf0\x20\x1e\xeb\x77\x04\x20\x7f\x00\x20\x02\xac\x00\xf9\x07\x39\
+\x00\x6a\x45\xc0\x36\xe4\x0f\x00\x40\x04\x84\xd9\x2c\xe9\xc7\x39\
+\x0e\x78\x00\x84\x07\xf1\x61\x01\x8b\x00\xe4\x0f\x00\x44\x00\xf2\
+\x27\x00\x1c\x8b\x00\xe4\x0f\x00\x44\x40\xe4\xf2\xef\xcf\x39\x75\
+\x2c\x00\xc2\x83\xf8\x70\xcb\x23\x00\xf9\x03\x00\x11\x80\xfc\x09\
+\x00\xc7\x22\x00\xf9\x03\x00\x11\x10\x19\x3f\x48\x06\x70\x0e\x1d\
+\x0f\x80\xf0\x20\x3e\xc2\xb2\x08\x40\xfe\x00\x40\x04\x20\x7f\x02\
+\x40\xd3\x20\x1e\x67\x49\x04\x20\x7f\x00\x20\x02\x22\x97\xff\x40\
+\xce\x19\x01\x60\x63\x04\x20\x7f\x00\x20\x02\x90\x3f\x01\xe0\xd1\
+\x20\x1e\x6f\x68\x04\x20\x7f\x00\x20\x02\x22\x97\x7f\x19\xe7\x88\
+\x00\xb0\x31\x02\x90\x3f\x00\x10\x01\x91\xf1\x23\xf2\x27\x00\xea\
+\x3b\x88\x8f\x34\x24\x02\x90\x3f\x00\x10\x01\x91\xcb\xbf\x9c\x73\
+\x42\x00\x44\x32\x88\xd5\x06\x42\xbf\x46\x71\xf0\x2e\x96\xe4\x30\
+\xc0\x00\xc0\xc2\xf9\xb3\x87\x64\x7d\x14\xe7\xcf\x2f\x78\xda\x9f\
+\x00\xd0\x51\xb2\xd1\x18\xc4\xf7\x48\x92\x18\x5c\x00\x60\xf1\xfc\
+\xd9\x4c\xb2\x20\x0a\xf3\xe7\x12\x49\x2e\xe7\x80\x00\xd0\x35\x88\
+\xe7\xfb\x34\x70\xd5\x6e\x85\x67\x30\xa8\x00\x20\x20\xf3\x67\xbc\
+\xe4\x66\x1f\xe5\x7f\x37\x5f\x9e\x08\x00\xdd\x83\x38\x4e\x72\xba\
+\xe4\x2b\x0f\x07\xee\x42\x7e\xb2\x02\x80\x80\xce\xa1\xfb\x48\xd6\
+\x79\x38\x7f\xbe\x27\x39\x84\x63\x4d\x00\x78\x39\x88\xd3\x24\x17\
+\x48\xbe\xd3\x38\x70\x97\x49\x46\x32\x90\x00\x20\xe0\xf3\x67\x6c\
+\x78\xbd\x15\x9d\xb7\x55\x3f\x92\x1c\xa5\x7e\x69\xe0\x18\x13\x00\
+\x7e\x0d\xe4\x2c\xc9\x3f\x25\xcf\x46\xf8\xa0\xe0\x06\xc9\xed\x92\
+\x3d\x24\x31\x0c\x22\x00\x70\x68\xfe\x4c\x0c\xef\xc3\xf2\x98\xe4\
+\xfb\x08\xe6\x4f\xf5\x05\xec\x61\xc9\x58\x49\x02\xc7\x94\x00\x88\
+\xe6\x60\x4e\x96\xec\x2e\xb9\x36\x3c\x28\x5f\x0c\xbf\xbe\xa7\x5e\
+\x83\xf9\x52\xb2\x5a\xf2\x9c\x64\xba\xe4\x12\x49\x09\xd2\x07\x00\
+\xf8\xf3\x19\x81\xa1\x92\x2b\x25\x0f\x84\x9f\xb7\x5a\x2b\xd9\x14\
+\x46\xfd\xcf\xf3\xc2\xff\xb7\x7f\x49\x06\xf3\x6d\xdf\x2c\xfe\x1f\
+\x85\xf1\xcf\x94\xc5\xf9\xb6\xf8\x00\x00\x00\x00\x49\x45\x4e\x44\
+\xae\x42\x60\x82\
+\x00\x00\x44\xb8\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\x9d\x00\x00\x0e\x9d\
+\x01\xd5\xd3\xb1\x39\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x44\x35\x49\x44\
+\x41\x54\x78\xda\xed\xdd\x77\x74\x55\x65\xbe\xf0\xf1\x49\x4f\x48\
+\x81\x24\x40\x42\x42\x08\x04\x42\x0d\x49\x68\x11\x90\x1a\xba\x20\
+\x45\x22\x10\xa9\x52\xa4\x77\x29\xa1\x13\x7a\x13\x29\x52\x04\x42\
+\x0b\x25\xf4\x40\x40\x44\xd4\xcb\x38\x5e\x75\x66\x1c\xcb\x20\x73\
+\x2d\xe3\x8c\xcc\xc5\x8e\xe2\xdc\x3f\x66\xad\xfb\xae\xb9\xbf\xf7\
+\x3c\x7b\xbd\xce\xeb\x75\x1c\x15\x9e\xfd\xec\xb3\xcf\x39\xdf\x59\
+\xeb\xfb\xaf\x73\x48\xce\x79\x7e\x9f\x9c\xbd\xf7\xf3\xfc\x42\x44\
+\x7e\x11\x08\x79\xfe\x77\xc7\x93\x10\x11\xf9\x48\x7f\xf5\x94\x17\
+\x28\x6b\x34\x79\x61\x2e\x02\x00\x22\x22\xd7\x76\xdb\x53\x53\x86\
+\x15\x01\x00\x00\x40\x44\x81\xd7\x27\x9e\xea\x31\xb0\x08\x00\x00\
+\x00\x22\x0a\xbc\xfe\xec\x29\x8d\xa1\x45\x00\x00\x00\x10\x51\xe0\
+\xf5\xae\xa7\xea\x0c\x2e\x02\x00\x00\x80\x88\x02\xaf\x37\x3d\xc5\
+\x33\xbc\x08\x00\x00\x00\x22\x0a\xbc\x5e\xf1\x14\xc3\x00\x23\x00\
+\x00\x00\x88\x28\xf0\x7a\xde\x53\x24\x43\x8c\x00\x00\x00\x20\xa2\
+\xc0\xeb\xbc\xa7\x50\x06\x19\x01\x00\x00\x40\x44\x81\xd7\x51\x4f\
+\xc1\x0c\x33\x02\x00\x00\x80\x88\x02\xaf\xa7\x19\x66\x04\x00\x00\
+\x00\x11\x05\x66\x1b\x19\x68\x04\x00\x00\x00\x11\x05\x66\x4b\x18\
+\x6a\x04\x00\x00\x00\x11\x05\x66\x33\x18\x6c\x04\x00\x00\x00\x11\
+\x05\x5e\xff\xe3\x69\x0c\xc3\x8d\x00\x80\x4d\x00\x08\x09\x09\x91\
+\xcc\xcc\x4c\x22\x22\xad\x62\x63\x63\x9d\x40\xc0\xdf\x3d\x0d\x62\
+\xc0\x11\x00\xb0\x01\x00\xd5\xab\x57\x97\xbf\xfe\xf5\xaf\x44\x44\
+\x5a\x3d\xf2\xc8\x23\x4e\x7d\x13\xf0\xdf\x9e\x7a\x33\xe4\x08\x00\
+\x00\x00\x22\x0a\x2c\x00\xa8\xfe\xe6\xa9\x13\x83\x8e\x00\x00\x00\
+\x20\xa2\xc0\x02\x80\xea\xaf\x9e\xf2\x18\x76\x04\x00\x00\x00\x11\
+\x05\x16\x00\x54\xb7\x3d\x35\x65\xe0\x11\x00\x00\x00\x44\x14\x58\
+\x00\x50\x7d\xe2\x29\x93\xa1\x47\x00\x00\x00\x10\x51\x60\x01\x40\
+\xf5\x91\xa7\x34\x06\x1f\x01\x00\x00\x40\x44\x81\x05\x00\xd5\xbb\
+\x9e\x92\x18\x7e\x04\x00\x00\x00\x11\x05\x16\x00\x54\x6f\x79\x8a\
+\x67\x00\x12\x00\x00\x00\x44\x14\x58\x00\x50\xbd\xe2\x29\x86\x21\
+\x08\x00\x00\x00\x00\x20\xa2\xc0\x02\x80\xea\x79\x4f\x91\x0c\x42\
+\x00\x00\x00\x00\x00\x11\x05\x16\x00\x54\x17\x3c\x85\x32\x0c\x01\
+\x00\x00\x00\x00\x44\xe4\x62\x00\x04\x05\x05\x99\x40\xc0\x31\x4f\
+\xc1\x0c\x44\x00\x00\x00\x00\x00\x11\xb9\x14\x00\x63\xc7\x4f\x92\
+\xa8\xa8\x4a\x26\x10\xf0\x34\x03\x11\x00\x00\x00\x00\x40\x44\x2e\
+\x05\xc0\xba\x27\xb6\xca\x8a\xb5\x1b\x25\x2c\x3c\xdc\x04\x02\x36\
+\x31\x14\x01\x00\x00\x00\x00\x44\xe4\x52\x00\x9c\xbd\xf4\x9c\x2c\
+\x5a\xb6\x52\x42\x42\x43\x4d\x20\x60\x29\x83\x11\x00\x00\x00\x00\
+\x40\x44\x2e\x05\x80\xea\xf1\xa2\x45\xa6\xee\x09\x98\xc9\x70\x04\
+\x00\x00\x00\x00\x10\x91\x4b\x01\xa0\x9a\x3c\x7d\x96\x09\x04\xfc\
+\x8f\xa7\x31\x0c\x48\x00\x00\x00\x00\x00\x11\xb9\x14\x00\xaa\xd1\
+\x8f\x4d\x34\xf1\x2d\xc0\xdf\x3d\x0d\x66\x48\x02\x00\x00\x00\x00\
+\x88\xc8\xa5\x00\x50\x15\x0e\x1b\x69\x02\x01\xff\xed\xa9\x37\x83\
+\x12\x00\x00\x00\x16\x2f\x22\x72\x29\x00\x54\xfd\x1e\x2a\x30\x81\
+\x80\xbf\x79\xea\xc4\xb0\x04\x00\x00\x80\x88\xc8\xa5\x00\x50\x75\
+\xef\xd5\xdb\x04\x02\xfe\xcb\x53\x1e\x03\x13\x00\x00\x00\x22\x22\
+\x97\x02\xe0\xcc\xc5\x2b\xd2\xbe\x53\x67\x13\x08\xf8\xca\x53\x53\
+\x86\x26\x00\x00\x00\x44\x44\x2e\x04\x80\xea\xd4\x85\xcb\xd2\xea\
+\xbe\xd6\x26\x10\xf0\xa9\xa7\x4c\x06\x27\x00\x00\x00\x44\x44\x2e\
+\x04\x80\xea\x44\xf9\x25\x69\x9a\x93\x6b\x02\x01\x1f\x79\x4a\x63\
+\x78\x02\x00\x00\x40\x44\xe4\x42\x00\xa8\x8e\x9d\x3e\x2f\xf5\x1b\
+\x36\x32\x81\x80\x77\x3d\x25\x31\x40\x01\x00\x00\x20\x22\x72\x21\
+\x00\x54\xa5\x27\xcf\x4a\xed\x8c\x0c\x13\x08\x78\xcb\x53\x3c\x43\
+\x14\x00\x00\x00\x22\x22\x17\x02\x40\x75\xe0\xe8\x49\x49\x49\xad\
+\x69\x02\x01\xaf\x7a\x8a\x61\x90\x02\x00\x00\xa0\xd1\xa5\x4b\x97\
+\xa4\x4b\x97\x2e\xf4\x13\xed\xd8\xb1\x83\x21\x42\x00\xe0\x2e\x01\
+\xa0\xda\x73\xf0\xa8\x54\xab\x9e\x64\x02\x01\x2f\x78\x8a\x64\x98\
+\x02\x00\x00\x70\x8f\x95\x94\x94\x98\xf8\x60\xfa\x5d\x33\x67\xce\
+\x64\x88\x10\x00\xb8\x07\x00\xa8\x76\xec\x3d\x28\x55\xe2\x13\x4c\
+\x7c\x36\x2f\x78\x0a\x63\xa0\x02\x00\x00\x00\x00\x00\x00\x91\x0b\
+\x01\xa0\xda\xb2\x73\x8f\xc4\xc4\xc6\x9a\xf8\x7c\x1e\xf3\x14\xcc\
+\x50\x05\x00\x00\x00\x00\x00\x00\x22\x17\x02\x40\xb5\xe1\xc9\xed\
+\x12\x15\x55\xc9\xc4\x67\x74\x0f\x43\x15\x00\x00\x00\x00\x00\x00\
+\x88\x5c\x0a\x00\xd5\xca\x75\x9b\x24\x3c\x3c\xc2\xc4\xe7\x74\x13\
+\x83\x15\x00\x00\x00\x00\x00\x00\x88\x5c\x0a\x00\xd5\xa2\xe5\xab\
+\x24\x24\x34\xd4\xc4\x67\x75\x29\xc3\x15\x00\x00\x00\x00\x00\x00\
+\x88\x5c\x0a\x00\xd5\x9c\xa2\xc5\x12\x14\x14\x64\xe2\xf3\x3a\x93\
+\x01\x0b\x00\x00\x00\x00\x00\x00\x44\x2e\x05\x80\x6a\xca\x8c\xd9\
+\xa6\x10\x30\x96\x21\x0b\x00\x00\x00\x00\x00\x00\x44\x2e\x05\x80\
+\x6a\xcc\xf8\x49\x26\x3e\xb3\x7f\xf7\x34\x98\x41\x0b\x00\x00\x00\
+\x00\x00\x00\x04\x00\x5c\x0a\x00\x55\xe1\xf0\x91\x26\x3e\xb7\xff\
+\xed\xa9\x0f\xc3\x16\x00\x00\x00\x00\x00\x00\x08\x00\xb8\x14\x00\
+\xaa\xfe\x03\x1f\x36\xf1\xd9\xfd\x9b\xa7\xce\x0c\x5c\x00\x00\x00\
+\x00\x00\x00\x20\x00\xe0\x52\x00\xa8\xba\xf7\xea\x6d\xe2\xf3\xfb\
+\x5f\x9e\xee\x63\xe8\x02\x00\x00\x00\x00\x00\x00\x01\x00\x97\x02\
+\xe0\xcc\xc5\x2b\xd2\xa1\x53\xbe\x89\xcf\xf0\x57\x9e\xb2\x19\xbc\
+\x00\x00\x00\x00\x00\x00\x40\x00\xc0\x85\x00\x50\x9d\xba\x70\x59\
+\xf2\x5a\xb7\x31\xf1\x39\xfe\xd4\x53\x26\xc3\x17\x00\x00\x00\x00\
+\x00\x00\x08\x00\xb8\x10\x00\xaa\x13\xe5\x97\x24\x3b\xb7\x99\x89\
+\xcf\xf2\x47\x9e\x6a\x31\x80\x01\x00\x00\x00\x00\x00\x80\x00\x80\
+\x0b\x01\xa0\x3a\x76\xe6\x82\x34\x68\xd4\xd8\xc4\xe7\xf9\x3d\x4f\
+\x49\x0c\x61\x00\x10\xf0\x00\xf8\xf4\xd3\x4f\xe5\xfa\xf5\xeb\xf4\
+\x13\xdd\xbc\x79\x93\x21\x42\x00\xc0\x41\x00\xa8\x4a\x4f\x9e\x95\
+\xda\x19\x19\x26\x10\xf0\x96\xa7\x78\x06\x31\x00\x08\x68\x00\x10\
+\x11\x00\x70\x2b\x00\x54\x07\x8e\x9e\x94\xd4\x9a\x69\x26\x10\xf0\
+\xaa\xa7\x18\x86\x31\x00\x00\x00\x44\x04\x00\x5c\x08\x00\xd5\xde\
+\x43\x47\xa5\x5a\xf5\x24\x13\x08\x78\xc1\x53\x24\x03\x19\x00\x00\
+\x00\x22\x02\x00\x2e\x04\x80\x6a\xc7\xde\x83\x52\x25\x3e\xc1\x04\
+\x02\x2e\x78\x0a\x63\x28\x03\x00\x00\x40\x44\x00\xc0\x85\x00\x50\
+\x6d\xd9\xb9\x47\x62\x62\x63\x4d\x20\xe0\xb8\xa7\x60\x06\x33\x00\
+\x00\x00\x44\x04\x00\x5c\x08\x00\xd5\x86\x27\xb7\x4b\x54\x54\x25\
+\x13\x08\xd8\xc3\x60\x06\x00\x00\x80\x88\x00\x80\x4b\x01\xa0\x5a\
+\xb9\x6e\x93\x84\x87\x47\x98\x40\xc0\x13\x0c\x67\x00\x00\x00\x88\
+\x08\x00\xb8\x14\x00\xaa\xc5\xc5\xab\x24\x24\x34\xd4\x04\x02\x96\
+\x31\xa0\x01\x00\x00\x20\x22\x00\xe0\x52\x00\xa8\xe6\x14\x2d\x96\
+\xe0\xe0\x60\x13\x08\x98\xc5\x90\x06\x00\x00\x80\x88\x00\x80\x4b\
+\x01\xa0\x9a\x32\xf3\x71\x09\x0a\x0a\x32\x81\x80\xb1\x0c\x6a\x00\
+\x00\x00\x88\x08\x00\xb8\x14\x00\xaa\xb1\xe3\x27\x99\x00\xc0\xdf\
+\x3d\x0d\x61\x58\x03\x00\x00\x40\x44\x00\xc0\xa5\x00\x50\x3d\x32\
+\x7c\x94\x09\x04\xfc\xb7\xa7\x3e\x0c\x6c\x00\x00\x00\x88\x08\x00\
+\xb8\xb8\xfe\x05\x83\x4c\x20\xe0\x6f\x9e\x3a\x33\xb4\x01\x00\x00\
+\x20\x22\x00\xe0\xe2\x7a\x3c\xd0\xc7\x04\x02\xfe\xcb\xd3\x7d\x0c\
+\x6e\x00\x00\x00\x88\x08\x00\xb8\xb4\x33\x17\xaf\x48\x87\x4e\xf9\
+\x26\x10\xf0\x95\xa7\x6c\x86\x37\x00\x00\x00\x44\x04\x00\x5c\xda\
+\xa9\x0b\x97\x25\xaf\x75\x5b\x13\x08\xf8\xd4\x53\x7d\x06\x38\x00\
+\x00\x00\x44\x04\x00\x5c\xda\x89\xf2\x4b\x92\x9d\xdb\xcc\x04\x02\
+\x6e\x7a\xaa\xc5\x10\x07\x00\x00\x80\x88\x00\x80\x4b\x3b\x76\xe6\
+\x82\x34\x68\xd4\xd8\x04\x02\xde\xf3\x94\xc4\x20\x07\x00\x00\x80\
+\x88\x00\x80\x4b\x2b\x3d\x79\x56\xea\x64\xd4\x35\x81\x80\xb7\x3d\
+\xc5\x33\xcc\x01\x00\x00\x20\x22\x00\xe0\xd2\x0e\x1e\x3b\x25\xa9\
+\x35\xd3\x4c\x20\xe0\x35\x4f\x31\x0c\x74\x00\x00\x00\x88\x08\x00\
+\xb8\xb4\xbd\x87\x8e\x4a\xf5\xa4\x24\x13\x08\x78\xd1\x53\x24\x43\
+\x1d\x00\x00\x00\x22\x02\x00\x2e\x6d\xe7\xbe\x83\x12\x9f\x90\x60\
+\x02\x01\x15\x9e\xc2\x18\xec\x00\x00\x00\x10\x11\x00\x70\x69\x5b\
+\x76\xee\x91\xd8\xb8\x38\x13\x08\x38\xee\x29\x98\xe1\x0e\x00\x00\
+\x00\x11\x01\x00\x97\xb6\x61\xcb\x53\x12\x15\x55\xc9\x04\x02\xf6\
+\x7a\x0a\x62\xc0\x03\x00\x00\x40\x44\x00\xc0\xa5\xad\x5c\xff\x84\
+\x84\x87\x47\x98\x40\xc0\x13\x0c\x78\x00\x00\x00\x88\x08\x00\xb8\
+\xb8\xc5\xc5\xab\x24\x24\x34\xd4\x04\x02\x96\x31\xe4\x01\x80\xeb\
+\x01\xf0\xea\xab\xaf\x4a\x51\x51\x11\xf9\x49\xdb\xb6\x6d\x63\xd8\
+\x11\x00\xb8\x8b\xe6\x2c\x58\x2c\xc1\xc1\xc1\x26\x10\x30\x8b\x41\
+\x0f\x00\x5c\x0d\x80\x92\x92\x12\x13\x6f\x7c\xf2\x52\x2d\x5b\xb6\
+\x64\xd8\x11\x00\xb8\xcb\xa6\xce\x9c\x23\x41\x41\x41\x26\x3e\x93\
+\xe3\x18\xf6\x00\x00\x00\x10\x00\x20\x00\xe0\xe2\xc6\x4e\x98\x6c\
+\xe2\x33\xf9\x77\x4f\x43\x18\xf8\x00\x00\x00\x10\x00\x20\x00\xe0\
+\xe2\x86\x8e\x78\xd4\xc4\xe7\xf2\xff\x78\x7a\x90\xa1\x0f\x00\x00\
+\x00\x01\x00\x02\x00\x2e\xae\x7f\xc1\x20\x13\x9f\xcd\xbf\x79\xca\
+\x67\xf0\x03\x00\x00\x40\x00\x80\x00\x80\x8b\xeb\xf1\x40\x1f\x13\
+\x9f\xcf\xff\xf2\xd4\x9a\xe1\x0f\x00\x00\x00\x01\x00\x02\x00\x2e\
+\xed\xcc\xc5\x2b\xd2\xa1\x73\x17\x13\x9f\xd1\xaf\x3c\x65\x03\x00\
+\x00\x00\x00\x08\x00\x10\x00\x70\x69\xa7\x2e\x5c\x96\xbc\xd6\x6d\
+\x4d\x7c\x4e\x3f\xf5\x54\x1f\x00\x00\x00\x00\x40\x00\x80\x00\x80\
+\x4b\x3b\x51\x7e\x49\x72\x9a\x35\x37\xf1\x59\xbd\xe9\xa9\x16\x00\
+\x00\x00\x00\x80\x00\x00\x01\x00\x97\x76\xec\xcc\x05\x69\xd8\xa8\
+\x89\x89\xcf\xeb\x7b\x9e\x92\x01\x00\x00\x00\x00\x04\x00\xc8\xd5\
+\x00\x20\x23\xbd\xed\x29\x01\x00\x00\x00\x00\x40\x00\x80\x00\x40\
+\xe0\xf5\x9a\xa7\x58\x00\x00\x00\x00\x00\x01\x00\x02\x00\x81\xd7\
+\x8b\x9e\x22\x01\x00\x00\x00\x00\x04\x00\x08\x00\x04\x5e\x15\x9e\
+\xc2\x00\x00\x00\x00\x00\x04\x00\x08\x00\x04\x5e\x47\x01\x00\x00\
+\x00\x00\x04\x00\x08\x00\x04\x5e\x77\x00\x00\x00\x70\x0c\x00\x37\
+\x6e\xdc\xb0\x10\x40\xfe\x51\x79\x79\x39\xc3\x8e\x00\x00\x00\x00\
+\x00\x00\x80\x88\x08\x00\x00\x00\x00\x00\x00\x88\x08\x00\x10\x00\
+\x00\x00\x00\x80\x88\x00\x00\x01\x00\x00\x00\x00\x88\x08\x00\x10\
+\x00\x00\x00\x00\x80\x88\x00\x00\x01\x00\x00\x00\x00\x88\x08\x00\
+\x10\x00\x00\x00\x00\x80\x88\x00\x00\x01\x00\x00\x00\x00\x88\x08\
+\x00\x10\x00\x00\x00\x00\x80\x88\xdc\xd6\xac\x59\xb3\x24\x33\x33\
+\x93\x0c\x17\x12\x12\x02\x00\x00\x00\x00\x20\x22\x0a\xb4\xd4\x9a\
+\x0d\x00\x00\x00\x00\x20\x22\x02\x00\x00\x00\x00\x00\x00\x22\x22\
+\x00\x00\x00\x00\x00\x00\x20\x22\x02\x00\x00\x00\x00\x00\x00\x22\
+\x22\x00\x00\x00\x00\x00\x00\x20\x22\x02\x00\x00\x00\x00\xf0\xa1\
+\x22\x22\x02\x00\x00\x00\x00\x10\x11\x11\x00\x00\x00\x00\x80\x88\
+\x88\x00\x00\x00\x00\x00\x44\x44\x04\x00\x00\x00\x00\x20\x22\x22\
+\x00\x00\x00\x00\x00\x11\x11\x01\x00\x00\x00\x00\x88\x88\x08\x00\
+\x00\x00\x00\x40\x44\x44\x00\x00\x00\x00\x00\x22\x22\x02\x00\x00\
+\x00\x00\x10\x11\x11\x00\x00\x00\x00\x80\x88\x88\x00\x00\x00\x00\
+\x00\x44\x44\x00\x00\x00\x00\x00\x00\x40\x44\x04\x00\x00\x00\x00\
+\x00\x00\x44\x44\x00\x00\x00\x00\x00\x00\x40\x44\x04\x00\x00\x00\
+\x00\x00\x00\x44\x44\x00\x00\x00\x00\x00\x00\x40\x44\x04\x00\x00\
+\x00\x00\xe0\x43\x45\x44\x04\x00\x00\x00\x00\x20\x22\x22\x00\x00\
+\x00\x00\x00\x11\x11\x01\x00\x00\x00\x00\x88\x4c\xf7\xc1\x07\x1f\
+\xc8\xb5\x6b\xd7\xa4\xa2\xa2\x42\xca\xca\xca\xa4\xa4\xa4\x44\xb6\
+\x6c\xd9\x22\xab\x57\xaf\x96\xa2\xa2\x22\x99\x36\x6d\x9a\x8c\x1e\
+\x3d\x5a\x06\x0d\x1a\x24\xbd\x7b\xf7\x96\x4e\x9d\x3a\x49\xb7\x6e\
+\xdd\xe4\xa1\x87\x1e\x92\xe1\xc3\x87\xcb\x84\x09\x13\x64\xce\x9c\
+\x39\xb2\x6c\xd9\x32\xd9\xb8\x71\xa3\xec\xda\xb5\x4b\x4a\x4b\x4b\
+\xe5\xdc\xb9\x73\xf2\xdc\x73\xcf\xc9\xeb\xaf\xbf\x2e\xb7\x6f\xdf\
+\xe6\x67\x4d\x00\x00\x00\x00\x00\x3e\x54\xe4\x74\x9f\x7f\xfe\xb9\
+\xbc\xfa\xea\xab\x72\xf8\xf0\x61\x59\xbc\x78\xb1\x0c\x19\x32\x44\
+\x5a\xb4\x68\x21\x71\x71\x71\x3a\x8b\xdb\xcf\x2e\x34\x34\x54\xea\
+\xd6\xad\x2b\x3d\x7b\xf6\x94\xa9\x53\xa7\xca\xd6\xad\x5b\xe5\xf2\
+\xe5\xcb\xf2\xc7\x3f\xfe\x91\xdf\x0f\x01\x00\x00\x00\x00\x88\xec\
+\xe8\xc6\x8d\x1b\xb2\x7b\xf7\x6e\x99\x38\x71\xa2\x74\xed\xda\x55\
+\xd2\xd3\xd3\x25\x38\x38\xd8\x91\x41\x7f\x2f\x55\xae\x5c\x59\x5a\
+\xb6\x6c\x29\x85\x85\x85\xb2\x7c\xf9\x72\xb9\x7a\xf5\xaa\x7c\xf5\
+\xd5\x57\xfc\x2e\x09\x00\x00\x00\x00\x40\xf4\x63\x7d\xf8\xe1\x87\
+\x72\xe0\xc0\x01\xeb\x6b\x7a\xf5\x57\xb6\x5b\x07\xfd\xdd\x14\x1d\
+\x1d\x2d\xdd\xbb\x77\x97\x55\xab\x56\xc9\x4b\x2f\xbd\x24\xdf\x7c\
+\xf3\x0d\xbf\x6b\x02\x00\x00\x00\x00\x50\x60\x77\xeb\xd6\x2d\xeb\
+\x5a\xfd\xa4\x49\x93\x24\x2b\x2b\x4b\x82\x82\x82\xfc\x62\xe8\xff\
+\x58\x09\x09\x09\xd2\xaf\x5f\x3f\xd9\xb4\x69\x93\xfc\xf6\xb7\xbf\
+\xe5\x7d\x40\x00\x00\x00\x00\x00\x0a\x9c\xaf\xf5\x97\x2e\x5d\x6a\
+\x5d\xb7\x0f\x09\x09\xf1\xfb\x81\xff\x53\xd5\xa8\x51\x43\x86\x0e\
+\x1d\x2a\xe5\xe5\xe5\x72\xe7\xce\x1d\xde\x23\x04\x00\x00\x00\x00\
+\x20\xff\xe9\x93\x4f\x3e\xb1\xee\xa8\xef\xd8\xb1\xa3\xab\xaf\xe1\
+\x7b\xbb\x94\x94\x14\x99\x39\x73\xa6\xbc\xf6\xda\x6b\xbc\x6f\x08\
+\x00\x00\x00\x00\x40\xbe\x99\xfa\x6b\x56\x3d\x3e\xa7\x1e\xb9\x8b\
+\x8a\x8a\x62\xc0\xdf\x65\x39\x39\x39\xb2\x6e\xdd\x3a\x9e\x2e\x20\
+\x00\x00\x00\x00\x00\xf9\x46\xaf\xbc\xf2\x8a\x4c\x9f\x3e\xdd\xfa\
+\x6a\x9b\x41\x6e\xcf\x63\x87\xea\x91\x43\x75\x73\xa4\x7a\x04\x92\
+\xf7\x18\x01\x00\x00\x00\x00\xc8\x35\xa9\x3b\xdb\x8f\x1d\x3b\x66\
+\x5d\xd7\x67\x68\x9b\x7d\xcc\x70\xf6\xec\xd9\xd6\xd3\x12\xbc\xef\
+\x08\x00\x00\x00\x00\x40\x5e\xfd\x9a\x7f\xff\xfe\xfd\xd2\xa4\x49\
+\x13\x06\xb4\x83\xa9\x4b\x2a\x93\x27\x4f\x96\x77\xdf\x7d\x97\xf7\
+\x21\x01\x00\x00\x00\x00\xc8\xb9\xd4\xe6\x36\x6a\x83\x9e\xcc\xcc\
+\x4c\x06\xb2\x17\x8b\x88\x88\x90\xb1\x63\xc7\xca\x3b\xef\xbc\xc3\
+\xfb\x92\x00\x00\x00\x00\x00\x64\xae\x2f\xbf\xfc\xd2\xda\xfa\xb6\
+\x76\xed\xda\x0c\x60\x17\x15\x16\x16\x26\xc3\x86\x0d\x93\x37\xde\
+\x78\x83\xf7\x29\x01\x00\x00\x00\x00\xc8\xde\xfd\xf7\x37\x6c\xd8\
+\x20\xa9\xa9\xa9\x0c\x5c\x17\xa7\x1e\xb1\x2c\x28\x28\xb0\xce\x4a\
+\xe0\x7d\x4b\x00\x00\x00\x00\x00\xd2\x4a\xdd\xdc\x97\x96\x96\xc6\
+\x80\xf5\x31\x08\x8c\x19\x33\x46\x6e\xde\xbc\xc9\x7b\x98\x00\x00\
+\x00\x00\x00\x74\x77\xfd\xfe\xf7\xbf\x97\x1e\x3d\x7a\x30\x50\x7d\
+\xb8\xaa\x55\xab\xca\xce\x9d\x3b\x39\x7f\x80\x00\x00\x00\x00\x00\
+\xf4\xd3\x7d\xf1\xc5\x17\xb2\x70\xe1\x42\x89\x8c\x8c\xf4\xbd\xc7\
+\xe4\xaa\x54\x91\x26\x59\x4d\xa5\x5b\xcf\x07\x64\xe0\xa0\x42\x19\
+\x36\x6a\xb4\x8c\x9b\x38\x45\xa6\xcd\x9a\x23\x73\x17\x2e\x91\xa5\
+\x2b\xd7\xca\xda\x4d\x5b\x64\xcb\xce\x3d\xf2\xf4\x81\x52\x39\x74\
+\xfc\xb4\xec\x3b\x7c\x5c\x9e\xda\xb3\x5f\x36\x6e\xdd\x21\x2b\xd6\
+\x6e\x94\x05\x4b\x57\xc8\xcc\xb9\x45\x32\x61\xca\x74\x19\x35\x76\
+\xbc\x0c\x1e\x3a\x5c\xfa\x0e\x18\x28\x79\xad\xdb\x4a\x6a\x5a\x9a\
+\x84\x84\x86\xfa\xdc\xcf\xa5\x4d\x9b\x36\xd6\xfe\x0c\xbc\xbf\x01\
+\x00\x00\x00\x00\x00\x80\x7e\xb0\xb3\x67\xcf\xba\xfe\x14\x3e\x35\
+\x80\xd5\x20\xbe\xaf\xcd\xfd\xf2\xd0\xa0\x21\x32\x75\xe6\x1c\x59\
+\xf7\xc4\x56\x29\x3d\x79\x56\xce\x5e\x7a\xce\x78\xa7\x2e\x5c\x96\
+\xed\x4f\x97\x48\xd1\x92\x62\x19\x31\x7a\xac\x74\xe9\xd6\x43\x1a\
+\x36\x6a\x22\x31\xb1\xb1\xae\xdf\x50\x68\xea\xd4\xa9\xd6\xb6\xcc\
+\xbc\xd7\x01\x00\x00\x00\x00\x00\x80\xac\xfe\xf0\x87\x3f\x48\xff\
+\xfe\xfd\x5d\x39\xb8\xd4\x37\x11\xcd\x5a\xb4\x94\xe1\x8f\x8e\x95\
+\x0d\x4f\x6e\xb7\x06\xb0\x13\x83\xfe\x5e\x52\xdf\x26\xa8\x6f\x0f\
+\xba\xf6\xe8\x25\x49\xc9\xc9\xae\x3d\x6f\xe0\xe0\xc1\x83\xbc\xef\
+\x01\x00\x00\x00\x00\x00\x20\xd0\x37\xf2\x51\xe7\xd4\xab\x33\xeb\
+\xdd\xf4\x48\x5b\x93\xa6\xd9\x52\x38\x6c\xa4\xac\xde\xb0\x59\x4e\
+\x9d\x7f\xc6\xb5\x03\xff\xa7\x52\x97\x19\xa6\xcc\x7c\x5c\x3a\xe6\
+\x77\x91\x84\xc4\x44\x57\x41\x20\x3f\x3f\x5f\xae\x5f\xbf\xce\xe7\
+\x00\x00\x00\x00\x00\x00\x00\x02\x2d\x75\xc8\x4c\xe7\xce\x9d\x5d\
+\x31\x8c\xe2\x13\x12\xa4\xef\x80\x02\x59\xb6\x6a\x9d\x94\x9d\xab\
+\xf0\xd9\x81\xff\x53\xa9\x4b\x07\x8f\x4d\x9a\x6a\xdd\xa7\x10\x14\
+\x14\xe4\x8a\xad\x85\x8f\x1c\x39\xc2\xe7\x01\x00\x00\x00\x00\x00\
+\x00\x02\xa5\x8a\x8a\x0a\x49\xf6\xf2\x57\xd4\x6a\x17\xbb\x0e\x9d\
+\xf2\x65\xc9\x8a\x35\x72\xba\xe2\x59\xbf\x1d\xfa\xff\xaa\xdd\xfb\
+\x4b\xe5\x91\xe1\xa3\x24\x25\xb5\xa6\xd7\x21\x30\x7e\xfc\x78\x6b\
+\x93\x27\x3e\x1b\x00\x00\x00\x00\x00\x00\xe0\xc7\x5f\xf9\x17\x15\
+\x15\x59\xcf\x89\x7b\x63\xd0\xa8\xbf\x7a\x9b\x66\xe7\x5a\x37\xee\
+\x1d\x3d\x5d\x1e\x70\x43\xff\x5f\xb5\x6e\xf3\x36\xe9\xd5\xa7\xaf\
+\xc4\xc6\xc5\x79\x0d\x01\xb9\xb9\xb9\xf2\xf6\xdb\x6f\xf3\x39\x01\
+\x00\x00\x00\x00\x00\x00\x7f\xeb\xfd\xf7\xdf\x97\x8e\x1d\x3b\x7a\
+\x65\xb8\x24\xd7\x48\xb1\x1e\xc9\xdb\x73\xf0\x28\x03\xff\x47\x3a\
+\x79\xfe\x19\x99\xbf\x78\x99\xf5\x84\x83\x37\x2e\x11\xc4\xc6\xc6\
+\x72\x83\x20\x00\x00\x00\x00\x00\x00\xf8\x53\xe5\xe5\xe5\xba\x1f\
+\xfe\x7b\xaa\x56\x7a\x6d\xeb\xae\xf8\x40\xfc\x8a\xdf\x8e\xfb\x05\
+\x3a\x77\xed\x2e\x21\x21\x21\x8e\xff\xde\xc6\x8d\x1b\x67\xed\x07\
+\xc1\x67\x07\x00\x00\x00\x00\x00\x00\x7c\xb4\xaf\xbf\xfe\x5a\xe6\
+\xce\x9d\xeb\xf8\x57\xfe\x19\xf5\x32\x65\xde\xc2\xa5\x72\xe6\xe2\
+\x15\x86\xb9\x0d\xf7\x0a\xf4\x78\xa0\x8f\xf5\x74\x84\x93\xbf\xc3\
+\xec\xec\x6c\x0e\x17\x02\x00\x00\x00\x00\x00\x00\x5f\x4c\x6d\xf8\
+\xe2\xf4\x5d\xfe\x6a\x43\x9c\xc5\xc5\xab\x18\xdc\x86\xf6\x18\x78\
+\xb0\xff\x43\xd6\xcd\x93\x4e\xfd\x3e\x63\x62\x62\xac\x6f\x8f\xf8\
+\x3c\x01\x00\x00\x00\x00\x00\x80\x0f\x3d\xe2\xa7\x6e\xea\x72\x6a\
+\x50\x34\xcd\xc9\x95\xe2\xb5\x1b\x18\xd4\x0e\x74\xf0\xd8\x29\x6b\
+\x07\xc4\xa8\xa8\x4a\x8e\xfc\x6e\xc3\xc3\xc3\xa5\xa4\xa4\x84\xcf\
+\x15\x00\x00\x00\x00\x00\x00\xf8\xc2\x21\x3e\x19\x19\x19\x8e\x0c\
+\x87\x6a\xd5\xaa\x4b\xd1\x92\xe5\x0c\x66\x2f\x54\x52\x5a\x26\xed\
+\x3a\x76\x76\xec\xe9\x8d\xf5\xeb\xd7\xf3\xf9\x02\x00\x00\x00\x00\
+\x00\x00\xb7\xf6\xf2\xcb\x2f\x4b\x52\x52\x92\x23\xfb\xf1\xab\xbf\
+\x42\x8f\x9f\xad\x60\x18\x7b\xb9\xe5\xab\xd7\x4b\x6a\x4d\x67\x8e\
+\x6b\x9e\x3d\x7b\x36\x9f\x33\x00\x00\x00\x00\x00\x00\x70\x5b\x17\
+\x2f\x5e\xb4\x1e\xe3\x32\xfe\x75\x7f\x76\xae\x6c\xdb\xbd\x8f\xe1\
+\xeb\xb2\xc7\x07\x87\x8e\x1c\x2d\xe1\xe1\xe6\xef\x0f\x18\x3e\x7c\
+\xb8\x75\x73\x29\x9f\x39\x00\x00\x00\x00\x00\xb9\xa0\xc3\x87\x0f\
+\x1b\xbf\x39\xac\x4a\x7c\x82\xf5\x48\x1f\x03\xd7\xdd\x4f\x0c\xb4\
+\xba\xaf\xb5\x71\x04\xf4\xea\xd5\x4b\x3e\xfb\xec\x33\x3e\x7b\x00\
+\x00\x00\x00\x00\xf2\x66\x9b\x37\x6f\x36\xfa\x98\x9f\xba\xfe\xdb\
+\xbb\x6f\x7f\x39\x72\xf2\x1c\x43\xd6\x47\x52\x47\x15\xab\xfb\x33\
+\x4c\x22\xa0\x75\xeb\xd6\x72\xf3\xe6\x4d\x3e\x83\x00\x00\x00\x00\
+\x00\xf2\x46\x4b\x96\x2c\x31\xba\xc8\xc7\x55\xae\x6c\xed\xd5\xcf\
+\x50\xf5\xbd\x0e\x9f\x38\x2b\x79\xad\xdb\x1a\x7d\x7f\x34\x6a\xd4\
+\x48\x3e\xfc\xf0\x43\x3e\x8b\x00\x00\x00\x00\x00\x72\xfa\x2f\x7f\
+\x93\x8b\x7b\xe3\xac\xa6\xb2\xf7\xf0\x31\x86\xa9\x8f\x37\xfa\xb1\
+\x89\x12\x1a\x1a\x6a\xec\x7d\xd2\xac\x59\x33\x6b\xcf\x09\x3e\x93\
+\x00\x00\x00\x00\x00\x72\xe8\x9a\xbf\xa9\xaf\xfd\xd5\x57\xfe\x05\
+\x83\x0b\xd9\xbe\xd7\x8f\xda\xf0\xe4\x76\x49\x32\x78\xfa\xa3\xda\
+\x70\xea\xf6\xed\xdb\x7c\x36\x01\x00\x00\x00\x00\x64\xfa\x6e\x7f\
+\x53\x37\xfc\xf1\x95\xbf\xff\x56\x7a\xf2\xac\xb4\xbe\xbf\x9d\x31\
+\x04\x14\x14\x14\xc8\x37\xdf\x7c\xc3\x67\x14\x00\x00\x00\x00\x40\
+\xa6\x9e\xf3\x37\xf5\xa8\x9f\x3f\x7d\xe5\x7f\xec\xcc\x05\xd9\xb4\
+\x6d\xa7\xcc\x9e\xb7\x40\xc6\x8c\x9f\x24\x85\xc3\x47\x4a\xff\x82\
+\x41\xd6\x9e\xfa\x1d\x3a\xe5\x5b\x77\xca\x67\x65\xe7\x48\xdd\x7a\
+\x99\xd6\xf6\xc5\xcd\x5a\xb4\x94\xb6\xed\x3b\x48\x97\xee\x3d\xa5\
+\x4f\xbf\x01\xf2\x70\xe1\x50\x19\x39\x7a\x9c\x4c\x9a\x36\x53\x8a\
+\xd7\x6c\xf0\xab\x4b\x21\x63\x27\x4c\x36\x76\x49\x60\xe2\xc4\x89\
+\x7c\x4e\x01\x00\x00\x00\x00\x64\x62\x87\x3f\x53\x9b\xfc\xf4\x1d\
+\x30\xd0\x27\xbf\xf2\x3f\x72\xaa\x5c\x96\xae\x5c\x2b\x63\x3d\x43\
+\xbe\x57\x9f\xbe\x92\x9d\xdb\x4c\x12\xab\x56\x33\x72\x94\x6e\x64\
+\x54\x94\x75\xc8\x51\xfb\x4e\x9d\x65\xc8\xd0\x11\x16\x2e\xd4\x89\
+\x7d\xbe\x88\x80\x8d\x5b\x77\x48\x7c\x42\x82\x91\xf7\xd2\xb2\x65\
+\xcb\xf8\xbc\x02\x00\x00\x00\x00\xc8\xce\xbd\xfd\x4d\x6c\xef\xab\
+\x06\xa5\xfa\x4b\xd7\x57\x06\x97\xda\x79\x70\xd9\xaa\xb5\xd6\x2e\
+\x84\x99\x0d\x1a\x3a\x7e\xca\xe1\x0f\x95\x90\x98\x28\x1d\x3a\x77\
+\x91\xc9\xd3\x67\xc9\xae\x92\x43\x3e\xf3\xb3\xdc\x55\x72\x58\x6a\
+\xa4\xa4\x1a\xf9\x99\xec\xd8\xb1\x83\xcf\x2d\x00\x00\x00\x00\x80\
+\xec\x38\xd5\xcf\xc4\xc1\x3e\xea\x9c\xf9\x69\xb3\xe6\xb8\x7e\x50\
+\x3d\xb1\x7d\x97\x0c\x1e\x3a\xdc\xba\x44\x61\xf2\x6e\x76\xdb\xce\
+\x47\xa8\x9e\x24\xf9\xdd\xba\xcb\xac\xb9\x0b\xac\x4b\x11\x6e\xfe\
+\xd9\x1e\x38\x7a\xd2\xba\x0c\x62\xe2\xbd\x55\x56\x56\xc6\xe7\x17\
+\x00\x00\x00\x00\x40\xf7\x9a\xda\x72\xd5\xc4\x91\xbe\xea\x26\xc2\
+\x45\xcb\x56\xba\x76\x30\xed\x3f\x52\x26\xa3\xc6\x8e\x97\xf4\xda\
+\x75\x5c\x3f\xf0\x7f\xea\xb2\x41\xe7\xae\xdd\xad\x93\x12\xcf\x5c\
+\xbc\xe2\xca\x9f\xf5\xd1\xd3\xe5\xd6\xa5\x13\xbb\xff\xed\x51\x9e\
+\x7f\xfb\x0b\x2f\xbc\xc0\xe7\x18\x00\x00\x00\x00\x40\xf7\xd2\xdc\
+\xb9\x73\x8d\x9c\xf1\xbe\x66\xd3\x93\xae\x1b\x44\x65\xe7\x2a\xac\
+\xeb\xea\xcd\x5a\xb4\x72\xc5\x57\xfb\x26\x4e\x4e\x2c\x18\xf2\x88\
+\x3c\xb5\x67\xbf\x2b\xcf\x12\xb8\xbf\x7d\x47\xdb\xff\xcd\x35\x6b\
+\xd6\x94\x8f\x3e\xfa\x88\xcf\x32\x00\x00\x00\x00\x80\xee\xa6\xf2\
+\xf2\x72\xdb\x07\xa1\xba\x41\x6e\xcb\xce\x3d\xae\x1a\x3e\xfb\x0e\
+\x1f\xb7\x6e\x42\xac\x54\xa9\x92\xdf\x0d\xfd\x7f\x55\xc3\xc6\x4d\
+\x64\xe1\xb2\x15\xae\xfa\x3d\xa8\x6f\x28\xd4\x8d\x94\x26\xce\x0d\
+\xe0\xf1\x40\x00\x00\x00\x00\x00\xfd\xcc\xde\x7f\xff\x7d\xdd\x0f\
+\xeb\x3f\x95\x92\x5a\x53\x9e\x3e\x78\xc4\x55\x37\xa1\xa9\xc7\xf2\
+\xc2\xc2\xc2\x02\x66\xf0\x7f\xbf\xda\x19\x19\xf2\x78\xd1\x22\x57\
+\x5d\x1e\x50\x4f\x38\xd8\xfd\xef\x5c\xb9\x72\x25\x9f\x6b\x00\x00\
+\x00\x00\x00\xfd\x54\x77\xee\xdc\x91\x8e\x1d\x3b\xda\xfe\x97\xbf\
+\x5b\x86\xff\xf6\xdd\x25\xd2\xb9\x4b\x37\xeb\x46\xb1\x40\x1d\xfc\
+\xdf\x2f\xb5\x66\x9a\x75\x43\xe6\xa9\x0b\x97\x5d\xf1\x3b\x52\x7b\
+\x26\xd8\xf9\xef\x53\xc8\xbb\x7a\xf5\x2a\x9f\x6f\x00\x00\x00\x00\
+\x00\xfd\x58\x45\x45\x45\xb6\x5f\xf3\x77\xc3\xd7\xfe\xea\xa8\x5a\
+\x75\x9d\xd9\xc4\x33\xfa\xfe\x52\xf5\xa4\x24\x99\x36\x7b\xae\x2b\
+\x2e\x07\x28\xa4\x71\x3f\x00\x00\x00\x00\x00\x00\x00\x38\x54\x45\
+\x45\x85\xad\xd7\xfd\xd5\xdd\xfe\xde\xbe\xe1\x4f\xdd\x60\x36\x74\
+\xe4\x68\x09\x0f\x8f\x60\xc8\xff\xcc\x9a\x64\x35\x95\xad\xbb\xf6\
+\x7a\xf5\xf7\xa6\xbe\x8d\x68\xde\x32\x8f\xfb\x01\x00\x00\x00\x00\
+\x00\x00\xc0\x89\xcd\x7e\x92\x6d\x3c\xb0\x45\x7d\xc5\xee\xed\x47\
+\xfd\xd4\x36\xba\xea\xeb\x6d\x86\xfa\x3d\xfc\xfe\x42\x43\x65\x40\
+\xc1\x60\xaf\xee\x25\xa0\xfe\xbf\xeb\x37\x68\xc8\xfd\x00\x00\x00\
+\x00\x00\x00\x00\x60\xf2\xba\xbf\x9d\xcf\xfb\xab\xaf\xd9\xbd\xb9\
+\xc9\x4f\x49\x69\x99\xb5\x65\x2e\x83\xdc\x9e\xc7\x07\x8b\x96\x2c\
+\xf7\xda\xef\xf2\xd0\xf1\xd3\xb6\x22\x8e\xfb\x01\x00\x00\x00\x00\
+\x00\xf4\x9d\x56\xad\x5a\x65\xeb\xd0\xf0\xe6\xf6\xbe\xea\x1a\x76\
+\x20\x3d\xd2\xe7\x54\xad\xdb\xde\x2f\x87\x4f\x9c\xf5\xca\xef\xf4\
+\xe9\x03\xa5\x92\x98\x58\xd5\xb6\x7f\x4b\x5a\x5a\x9a\x7c\xfa\xe9\
+\xa7\x7c\xf6\x01\x00\x00\x00\x00\x81\xdd\x1f\xfe\xf0\x07\x89\x8e\
+\x8e\xb6\xf5\x60\x1f\x6f\xed\xd3\xaf\xb6\xc0\x65\x58\x9b\xfd\x36\
+\x60\xed\xa6\x2d\x5e\xf9\xfd\xaa\x1b\x49\xed\x84\xdd\xcc\x99\x33\
+\xf9\xfc\x03\x00\x00\x00\x00\x02\xbb\xfe\xfd\xfb\xdb\x7a\xa4\xaf\
+\x37\x4e\xf5\x53\xc3\x21\xad\x56\x3a\x43\xda\x89\x7b\x03\x42\x42\
+\xac\x6f\x78\xbc\xb1\x77\x80\xda\xb3\xc0\xce\x4b\x01\xbf\xf9\xcd\
+\x6f\x58\x03\x00\x00\x00\x00\x00\x81\xd9\xd9\xb3\x67\x6d\x5b\x50\
+\xe3\x2a\x57\xf6\xca\xb9\xf5\x53\x66\xcc\xb6\x9e\x36\x70\xd3\x90\
+\x0c\xae\x14\x2d\x95\xea\x37\x91\xf8\x2e\xbd\xa5\xc6\xa8\x29\x92\
+\xbe\x70\xbd\xd4\x5d\xbb\x4b\x32\xb7\x1c\x96\x86\x7b\xce\x48\xe3\
+\x23\x57\xa4\xe9\xd9\x97\x25\xe7\xf2\x1b\x92\x7d\xfe\x35\x69\x52\
+\xf6\x82\x34\x3a\x50\x21\xf5\x77\x94\x49\xbd\x8d\x25\x52\xa7\x78\
+\x9b\xd4\x9c\xba\x50\xaa\xf6\x7f\x44\x62\x5b\xb4\x95\xf0\xea\x35\
+\xe4\x17\x2e\x7b\x7c\xb1\x45\xde\x7d\xd6\xf5\x79\xa7\x7f\xdf\x3d\
+\x7b\x3f\x68\xdb\xbf\xa1\x43\x87\x0e\xac\x03\x00\x00\x00\x00\x80\
+\xc0\xeb\x8b\x2f\xbe\x90\xba\x75\xeb\xda\x76\xd3\xdf\x92\x15\x6b\
+\x1c\xdf\xbb\xbf\x63\x7e\x17\xaf\x0f\xc2\xa0\xd0\x50\x89\xce\x6a\
+\x2e\xc9\x23\x26\x49\xbd\x27\xf6\x4b\xd6\xe9\x97\xa4\xd9\xbf\xfd\
+\x87\xed\xe5\x5c\x7e\x53\x1a\xee\x3b\x27\xb5\x1e\x2f\x96\xf8\xfc\
+\xde\x12\x1a\x9f\xe8\xf5\x7f\xbb\xda\xe0\xc9\xe9\x4b\x02\x27\xca\
+\x2f\x49\x46\xdd\x7a\xb6\xfd\x1b\xf6\xed\xdb\xc7\x7a\x00\x00\x00\
+\x00\x00\x08\xac\x16\x2e\x5c\x68\xdb\x22\x3a\x70\x50\xa1\xa3\x43\
+\x40\xdd\x8c\xa6\xf6\xb3\xf7\xda\x29\x7b\x75\x32\xa5\xfa\x90\x31\
+\x52\x77\xfd\x1e\xeb\xaf\x78\x13\x03\xff\xe7\xa4\xbe\x35\xa8\x39\
+\x6d\x91\x54\xbe\xbf\x8b\x04\x7b\x69\x9f\x03\xb5\xbf\x42\xd1\x92\
+\x62\x47\x7f\xff\x3b\xf6\x1e\xb4\xed\x7e\x80\xa4\xa4\x24\xb9\x75\
+\xeb\x16\x6b\x02\x00\x00\x00\x00\x20\x30\xfa\xfd\xef\x7f\x2f\x91\
+\x91\x91\x3e\x79\xdd\x5f\x5d\x66\xa8\x95\x5e\xdb\xf1\x41\xa7\xfe\
+\xe2\xae\x5e\x30\x52\x1a\xee\x3d\xeb\xb5\x81\xff\x63\x65\x5f\xfc\
+\x8d\xa4\xcd\x2e\x96\xe8\xac\x66\xce\x5f\xf2\x08\x0e\xb6\x2e\xc5\
+\xf8\xea\xfd\x00\x13\x27\x4e\x64\x5d\x00\x00\x00\x00\x00\x04\x46\
+\x3d\x7a\xf4\xf0\xc9\xeb\xfe\xdb\x9f\x2e\xb1\xee\x44\x77\xec\xeb\
+\xfd\x90\x10\xa9\xd2\xa1\xbb\x64\xac\xde\x29\xb9\xcf\xbf\xe3\xca\
+\xc1\xff\x43\xa9\x7b\x0c\xd4\x25\x09\xeb\xde\x01\x07\x21\x30\x6c\
+\xd4\x68\x9f\xbc\x1f\x40\xdd\xd8\xf8\xf2\xcb\x2f\xb3\x36\x00\x00\
+\x00\x00\x00\xfc\xbb\x63\xc7\x8e\xf9\xe4\x75\xff\xf5\x9b\xb7\x49\
+\x6c\x5c\x9c\x33\x7f\xd1\x86\x47\x48\xd5\x7e\x85\xd2\xe4\xf8\xf3\
+\x3e\x33\xf4\x7f\xa8\xdc\xab\xd7\x25\x7d\xfe\x1a\x89\x48\xab\xe3\
+\x18\x02\x7a\xf7\x1b\xe0\xd8\x13\x02\x76\xde\x0f\x90\x97\x97\xc7\
+\x36\xc1\x00\x00\x00\x00\x00\xff\xed\xf3\xcf\x3f\xb7\x36\x41\xb1\
+\x65\xa1\xef\xdb\xdf\xb1\xe1\xbf\x6c\xd5\x3a\xdb\x2e\x59\xfc\xd4\
+\xdd\xfb\xea\xda\x7e\xd6\x99\x5f\xf9\xf4\xe0\xff\xa7\x5e\xb8\x21\
+\x75\x96\x6f\x91\xa8\xcc\xc6\x8e\x20\xa0\x43\xa7\x7c\xc7\x2e\x0b\
+\xa9\xd3\x1d\x43\x43\x43\x6d\x79\xdd\x3b\x76\xec\x60\x9d\x00\x00\
+\x00\x00\x00\xf8\x67\x1b\x36\x6c\xb0\x65\xa1\xac\x12\x9f\x20\x47\
+\x4e\x9e\x73\xec\x2f\x7f\xd3\xc3\x5f\xdd\xc9\x9f\x54\x38\x56\xb2\
+\x2f\xfc\xda\xbf\x06\xff\x0f\xa4\x1e\x47\x8c\x48\x33\x7f\x0f\x45\
+\xb7\x9e\x0f\x38\x06\x44\x75\x13\xaa\x1d\xaf\xb9\x56\xad\x5a\xf2\
+\xd5\x57\x5f\xb1\x56\x00\x00\x00\x00\x00\xfc\xab\x2f\xbf\xfc\x52\
+\x52\x53\x53\xed\xd9\x45\x6d\x6e\x91\x63\xd7\xfc\x4d\x7f\xed\x1f\
+\x93\xd3\xca\xba\x9b\xde\xdf\x07\xff\xff\xba\x34\xf0\xdc\xdb\x52\
+\x63\xf4\x34\xe3\x4f\x0e\x3c\x5c\x38\xd4\xb1\x5d\x20\xab\x55\x4f\
+\xb2\xe5\x35\xef\xda\xb5\x8b\xf5\x02\x00\x00\x00\x00\xe0\x5f\x6d\
+\xdd\xba\xd5\x96\x05\xb2\x69\x76\xae\x63\x77\xfb\x9b\xbc\xe1\x2f\
+\xb4\x4a\x82\xa4\xcf\x5f\x1b\x50\x83\xff\x9f\x6e\x16\x3c\x7a\x45\
+\xe2\xf2\xda\x1b\x45\xc0\xb8\x89\x53\x1c\x79\xbf\xa8\x03\x8b\xec\
+\x78\xbd\x99\x99\x99\xd6\xe1\x58\xac\x19\x00\x00\x00\x00\x00\xbf\
+\x48\x7d\xad\x59\xbb\xb6\xfe\xd7\xbe\xea\x88\xd8\x6d\xbb\xf7\x39\
+\xf2\x9c\xbf\xc9\x47\xfd\xe2\xbb\x3d\x18\x10\x5f\xf7\xff\xdc\x6a\
+\x2f\xdd\x2c\x21\x31\x66\xbe\x69\x51\x37\x8b\xaa\x47\xf6\x9c\x40\
+\x40\xcb\xbc\xd6\xb6\xbc\xe6\xfd\xfb\xf7\xb3\x6e\x00\x00\x00\x00\
+\x00\xfc\xa3\xdd\xbb\x77\xdb\xb2\x30\x3e\x34\x68\x88\x23\x3b\xfc\
+\x99\xda\xe4\x27\x38\x22\x52\x6a\xcd\x5d\xc5\xd0\xff\x81\xd4\x13\
+\x0f\xd1\x8d\x72\xcc\x7c\xdb\xe2\x81\xe3\xf2\xd5\xeb\x8d\xbf\x77\
+\x76\x95\x1c\xb6\x36\x26\xd2\x7d\xbd\x59\x59\x59\x3c\x11\x00\x00\
+\x00\x00\x00\xf0\xfd\xd4\xd7\x99\xea\x6b\x4d\x3b\x4e\x82\x53\xd7\
+\x5a\x4d\x2f\xe2\xa6\xb6\xf7\x8d\x4c\xaf\x1b\x70\xd7\xfa\xef\xe5\
+\xb1\xc1\xea\x83\x1e\x35\xf2\xf3\xaf\x14\x1d\xed\x19\xd0\x87\x8c\
+\xbf\x7f\x86\x8e\xb0\xe7\xf5\x1f\x3f\x7e\x9c\xf5\x03\x00\x00\x00\
+\x00\xe0\xdb\xa9\xaf\x33\xed\x58\x10\xd5\x35\x56\x27\x0e\xf6\x31\
+\x31\x7c\x12\x7a\xf6\xb7\xf6\xd2\x67\xc8\xff\xbc\xd4\xc6\x47\x21\
+\x71\x95\x6d\xff\x3d\xd4\xcb\xac\x2f\x27\xcf\x3f\x63\xf4\x3d\xa4\
+\xfe\xfb\x29\xa9\x35\xf5\x0f\x3b\x6a\xd1\x82\xf5\x03\x00\x00\x00\
+\x00\xe0\xbb\xa9\xaf\x31\x9b\x34\xd1\xff\x3a\xbd\x69\x4e\xae\x23\
+\x47\xfa\x9a\x38\xd5\x2f\xe5\xb1\x59\x0c\xf5\x7b\xb9\x41\xf0\xf0\
+\x33\x12\x9e\x94\x62\x64\xa3\x20\xd3\xef\xa5\x05\x4b\x57\xd8\xf2\
+\x5a\xcb\xcb\xcb\x59\x47\x00\x00\x00\x00\x00\x81\xbd\xeb\x5f\xf1\
+\xda\x0d\xc6\x1f\xe3\x4a\xab\x95\x6e\xfb\x36\xbe\xb5\xe6\xad\x66\
+\x98\x6b\x94\x75\xea\x97\x12\x95\x51\xdf\x76\x04\xcc\x5b\xb4\xcc\
+\x38\x02\x6a\x67\x64\x68\xbf\xce\x76\xed\xda\xb1\x8e\x00\x00\x00\
+\x00\x00\x7c\x33\xf5\x35\xa6\xee\x22\xd8\xb0\x51\x13\xe3\x8b\x75\
+\x7e\xb7\xee\xb6\xdf\xec\x97\xb1\x66\x17\x43\xdc\x8e\x43\x86\x2a\
+\x7e\x2d\x31\xd9\x2d\x6d\xfd\xfd\x44\x47\xc7\xc8\xee\xfd\xa5\x46\
+\xdf\x53\x73\x8a\x16\xdb\xf2\x5a\xaf\x5e\xbd\xca\x5a\x02\x00\x00\
+\x00\x00\xf0\xad\x5e\x79\xe5\x15\x5b\x16\xc0\xc5\xc5\xab\x8c\x2e\
+\xd4\xd3\x66\xcf\xb5\x75\xb8\x84\xc4\xc6\x49\xfd\xed\xc7\x18\xde\
+\x36\x96\x73\xe5\x2d\xeb\xc8\x61\x3b\x7f\x4f\xf5\x1b\x34\x94\x53\
+\x06\xef\x07\x50\xe7\x11\xa4\xda\xb0\xed\xf5\x88\x11\x23\x58\x4f\
+\x00\x00\x00\x00\x00\xbe\xd5\xf4\xe9\xd3\xb5\x17\xbf\x8c\x7a\x99\
+\x46\x87\x7f\x49\x69\x99\x6d\xe7\xba\x7f\xfb\x97\x3f\xc3\xdf\xdc\
+\x13\x02\xb1\x2d\xdb\xda\x8a\x80\xa1\x23\x47\xbb\x1e\x97\xb1\xb1\
+\xb1\xf2\xd9\x67\x9f\xb1\xa6\x00\x00\x00\x00\x00\x7c\xe7\xd1\xbf\
+\x1a\x35\xf4\x8f\x82\x9d\xb7\x70\xa9\xd1\x05\xba\x7d\xa7\xce\xb6\
+\x5e\xf3\xe7\x6b\x7f\xc3\xdf\x04\x3c\xf3\x3b\xa9\x54\xdf\xbe\x3d\
+\x1a\xd4\x33\xfb\x26\x2f\x05\x9c\xba\x70\x59\x92\x92\x93\xb5\x5f\
+\x67\x49\x49\x09\xeb\x0a\x00\x00\x00\x00\xc0\x37\x3a\x77\xee\x9c\
+\xfe\xc1\x28\xe9\xb5\x8d\x1e\xeb\x5a\xbc\x66\x83\xad\x7f\x4d\x72\
+\xc3\x9f\x33\x35\x3d\xf7\xef\x12\x51\xd3\xbe\x1b\x36\x5b\xdd\xd7\
+\xda\x28\x32\x27\x4e\x9d\xa1\x7f\xb0\x51\xb7\x6e\xac\x2b\x00\x00\
+\x00\x00\x00\xdf\x68\xd0\xa0\x41\xae\x3e\xf0\x47\x3d\xab\x9d\x5a\
+\x33\x2d\x30\x1f\xf5\x7b\xf1\x0f\x92\x75\xf2\xdf\xa4\xc1\xce\x13\
+\x92\xb1\x72\xbb\xa4\xcd\x58\x22\xc9\xc3\x27\x48\x62\xaf\x87\x24\
+\xae\x55\x3b\xeb\xae\x7b\xd7\xef\x1a\x78\xec\xaa\x84\x25\x54\xb5\
+\xed\xf7\x57\xb4\xa4\xd8\xe8\x7b\x2d\x31\x51\xef\xb5\x86\x84\x84\
+\xc8\x07\x1f\x7c\xc0\xda\x02\x00\x00\x00\x00\x70\x77\x9f\x7c\xf2\
+\x89\x44\x45\x45\x69\x2d\x78\xc9\x35\x52\x8c\x9e\xe7\xae\xae\xfd\
+\xda\xb9\xc9\x8f\x2f\x5c\x3f\xaf\xb7\x61\x9f\x54\xed\x57\x28\x61\
+\x55\x7f\xfa\xd4\x3a\x5f\x80\x8c\x02\x8c\x3a\x46\xd9\x8e\xdf\xa1\
+\x3a\xc9\xcf\xe4\x2e\x93\x63\xc6\x4f\xd2\x7e\x8d\x6b\xd6\xac\x61\
+\x7d\x01\x00\x00\x00\x00\xb8\x3b\x75\x9c\xa9\xee\x62\x37\x6c\x94\
+\xb9\x9b\xb3\xd4\x35\xdf\x70\x9b\x8e\xa1\x55\xdb\xfb\xba\x75\x87\
+\xbf\xec\x8b\xbf\x95\xda\x4b\x9e\x90\xf8\xfc\xde\x12\x12\x1d\x7b\
+\x57\xff\x2e\x5f\xf9\x36\x23\x75\xf2\x7c\xdb\x20\x37\x70\x50\xa1\
+\xd1\xc3\xa5\xc2\xc2\xc2\xb4\x5e\x5f\x76\x76\x36\xeb\x0b\x00\x00\
+\x00\x00\xc0\xdd\x75\xec\xd8\x51\xfb\xf4\xb6\x3d\x07\x8f\x1a\x5b\
+\x8c\xef\x6f\xdf\xd1\xb6\x3b\xfe\xdd\xb8\xb7\xbf\x7a\x4d\x55\xda\
+\x77\x93\x20\x8d\x81\xe3\x4b\xf7\x04\x54\xbe\x3f\xdf\xb6\x03\x83\
+\x9e\x3e\x60\xee\x86\xc0\x36\xf7\xeb\x1f\x7b\xac\x1e\xad\x65\x8d\
+\x01\x00\x00\x00\x00\xb8\xb2\x1b\x37\x6e\x48\x70\x70\xb0\xde\xb6\
+\xbf\xd9\xe6\xb6\xfd\xdd\xbe\xbb\xc4\x02\x86\x2d\x37\xfd\xb9\xec\
+\x54\x3f\xb5\x6b\x5e\x62\xef\x02\x09\x0a\x0e\xd1\xfe\xb7\xf9\xd4\
+\x46\x41\x17\x7e\x2d\xe1\x49\x35\x6c\xf9\x9d\xf6\xec\xfd\xa0\xb1\
+\xf7\x9e\xba\xcf\x40\xf7\xf5\x4d\x9b\x36\x8d\x75\x06\x00\x00\x00\
+\x00\xe0\xce\x96\x2e\x5d\xaa\xbd\xc8\x4d\x9d\x39\xc7\xd8\x22\xdc\
+\xb9\x4b\x37\x5b\x06\x45\x7c\xb7\x07\x5d\xf5\x55\x7f\xd2\xb0\xf1\
+\xd6\x37\x12\x76\x7d\x1d\xee\x6b\x4f\x06\xd4\xdf\x51\x66\x3d\x86\
+\xa9\xfb\xef\x56\x5f\xd3\xab\xbd\x21\x8c\x3c\x12\x78\xfe\x19\x89\
+\xd3\x3c\xe0\x28\x39\x39\x59\xbe\xfe\xfa\x6b\xd6\x1a\x00\x00\x00\
+\x00\x80\xff\x6d\xfd\xab\x0e\xe3\x39\x7a\xba\xdc\xd8\x59\xed\x21\
+\x36\x0c\x89\xd0\x2a\x09\xd6\x5f\x9d\x6e\xb8\xb1\xaf\xe6\x94\x05\
+\x12\x5a\x39\xde\xf6\xbd\xf2\x7d\xf1\xf1\xc0\xea\x83\xed\x39\x86\
+\xb7\xdf\x43\x05\xc6\x00\xfa\xc0\x83\xfd\xd8\x1a\x18\x00\x00\x00\
+\x00\xe0\x7f\xdd\xba\x75\x4b\x7b\xc0\x76\xe8\x94\x6f\x6c\xf1\xed\
+\xf1\x40\x1f\x5b\x06\x44\xfa\xfc\xb5\xde\x7f\x16\xbe\xfc\x15\xdb\
+\xf7\xc7\xf7\x75\x00\xa8\x4d\x82\xc2\xaa\xe9\x6f\xba\x13\x19\x19\
+\x29\x87\x8e\x9f\x36\xf2\x1e\xdc\xf0\xe4\x76\xfd\xad\xb1\x17\x2f\
+\x66\xbd\x01\x00\x00\x00\x00\xb8\xab\xb2\xb2\x32\xed\xc5\x6d\xc9\
+\x8a\x35\x46\x16\xde\x7d\x87\x8f\x6b\xdf\x85\xad\x8a\xc9\x69\xe5\
+\xfd\x9b\xfc\xf6\x5f\x90\xf0\xe4\x54\x63\xc3\xdf\x57\x01\xa0\xaa\
+\x53\xbc\xcd\x96\x7f\xff\xc3\x85\x43\x8d\x41\x54\xf7\x7c\x00\x75\
+\x93\x2d\xeb\x0d\x00\x00\x00\x00\xc0\x55\x4d\x9a\xa4\xf7\xac\x73\
+\x7c\x42\x82\xb1\x67\xff\xfb\x0e\x18\xa8\xbf\xd5\x6f\x68\xa8\xd7\
+\xef\xfa\xcf\x58\xb5\x43\x82\xa3\x2a\x19\x1d\xfe\xbe\x0c\x00\x55\
+\x5c\x6b\xfd\xa7\x3c\xd4\x69\x81\x47\x4e\x95\xbb\x72\x0f\x0a\xf5\
+\x0d\xc5\xe7\x9f\x7f\xce\x9a\x03\x00\x00\x00\x00\x70\x4f\x59\x59\
+\x59\x5a\x0b\x5b\xdf\x01\x66\xae\xbd\x96\x9d\xab\xb0\xe5\xc0\x9f\
+\xa4\xc2\xb1\x5e\x1d\x6c\x29\x8f\xcd\x96\x5f\x68\x3e\x61\x11\x08\
+\x00\x68\x7c\xf4\x39\x09\xb6\x61\x9f\x87\xc7\x26\x4d\x35\xf2\x7e\
+\x7c\xfa\xe0\x11\xed\xd7\x56\x51\x51\xc1\x9a\x03\x00\x00\x00\x00\
+\x70\x47\x1f\x7e\xf8\xa1\xf6\xe3\x75\xcb\x56\xad\x33\xb2\xe0\xce\
+\x9e\xb7\x40\xff\x99\xff\x4a\xd1\x5e\xbb\xf1\x2f\xf7\xf9\x77\x24\
+\xa1\x7b\x3f\x47\x06\xbf\x3f\x00\x40\x55\x6d\xc0\x50\x5b\x8e\x0b\
+\x36\x75\x19\x40\x9d\x73\xa1\xf3\xda\xe6\xcc\x99\xc3\xba\x03\x00\
+\x00\x00\x00\x70\x47\x07\x0e\x1c\xd0\x7e\xfc\x4a\xfd\xa5\x6e\x62\
+\xb1\x6d\xd6\xa2\x95\xf6\x30\xa8\x3e\x64\x8c\xd7\x86\x59\xd5\xbe\
+\x43\x1c\x1d\xfe\xfe\x00\x80\x26\x27\x5e\xb4\x65\x9b\xe0\xed\x4f\
+\x97\x18\x79\x4f\xf6\xee\xdb\x5f\xeb\x75\xe5\xe5\xe5\xb1\xee\x00\
+\x00\x00\x00\x00\xdc\xd1\xe8\xd1\x7a\xd7\x35\x9b\x34\xcd\x36\xb2\
+\xd0\xee\x3f\x52\xa6\xbd\x31\x91\xfa\x3a\x39\xeb\xcc\xaf\xbc\x32\
+\xc8\x6a\x4e\x5f\xec\xf8\xf0\xf7\x07\x00\xa8\xd4\xa6\x48\xba\x3f\
+\x87\x82\xc1\x66\xb6\x07\x9e\xbf\x78\x99\xf6\xae\x85\x1f\x7f\xfc\
+\x31\x6b\x0f\x00\x00\x00\x00\xc0\xfb\xd5\xad\x5b\x57\x6b\x41\x2b\
+\x1c\x36\xd2\xc8\x42\x3b\x6a\xec\x78\xed\x21\xa0\x0e\xd0\xf1\xc6\
+\x00\xab\xf7\xc4\x7e\x5b\x36\xb7\x09\x54\x00\x34\x3e\x72\x45\x7b\
+\x57\xc4\x6a\xd5\xaa\x1b\x39\x92\x5a\x9d\x0d\xa0\x7b\xc9\xec\xd4\
+\xa9\x53\xac\x3d\x00\x00\x00\x00\x00\xef\x6f\xff\xab\x3b\x70\x56\
+\x6f\xd8\x6c\x04\x00\xe9\xb5\xeb\xe8\xdd\xf9\xef\x19\xc0\x4d\x8e\
+\x3f\xef\xfc\xf0\x2a\x7d\x56\x42\x62\xe3\xbc\x32\xfc\x7f\xe1\x19\
+\x4c\xfe\x00\x00\x55\x7c\x57\xfd\xbd\x1f\x8a\xd7\x6c\x30\xf2\xde\
+\xac\x5b\x2f\x53\x6f\xc7\xcc\xa9\x53\x59\x7f\x00\x00\x00\x00\x00\
+\xde\x6d\xf7\xee\xdd\xda\x8f\x35\xa9\x6d\x52\xed\x5e\x60\x9f\xd8\
+\xae\x7f\x2a\x61\x95\x0e\xdd\xbd\xb0\xb5\xef\x6f\x24\x22\xad\x8e\
+\xf1\x41\xaf\x6e\x6c\x8c\xef\xdc\x4b\xd2\x66\x2c\x91\x8c\x55\x4f\
+\x59\xc7\xeb\xaa\x6b\xe7\x6a\x87\x41\x7f\x01\x40\x83\x5d\x27\xb5\
+\x7f\x4e\x9d\xbb\x76\x37\x02\x80\xfe\x05\x83\xb4\x5e\x57\x4e\x4e\
+\x0e\xeb\x0f\x00\x00\x00\x00\xc0\xbb\x4d\x9c\x38\x51\xef\xeb\xe6\
+\x16\x2d\x8d\x2c\xb0\x83\x87\x0e\xd7\x5e\xfc\x33\x56\xef\xf4\xc9\
+\xe7\xd8\xff\x55\x21\x71\x95\x25\xb1\xf7\xc3\x52\x77\xed\x2e\xc9\
+\x7d\xee\x6d\xbf\x19\xf4\x3f\x56\x64\xad\x0c\xbd\xcd\x9f\x62\x62\
+\x8c\x5c\x06\x58\xb2\x62\xb5\xf6\x7d\x00\xb7\x6f\xdf\x66\x0d\x02\
+\x00\x00\x00\x00\x78\xaf\xae\x5d\xbb\x6a\x2d\x64\xc3\x1f\x1d\x6b\
+\x04\x00\x8d\xb3\x9a\xea\x2d\xb0\xf1\x89\xd6\x23\x78\x4e\x6f\xf4\
+\x63\xe4\xaf\xfd\xc8\x48\xeb\xc0\x20\x75\x70\x50\x20\x0c\xfd\xff\
+\xb5\x7f\xc2\xb8\x59\xda\x3f\xbf\x4d\x5b\x77\xd8\xfe\xfe\x3c\x76\
+\xfa\xbc\x84\x68\x3e\xa9\xf0\xfa\xeb\xaf\xb3\x06\x01\x00\x00\x00\
+\x00\xbc\x57\x7a\x7a\xba\xd6\x22\xa6\xf6\x47\xb7\x7b\x71\x3d\x7e\
+\xb6\xc2\xfa\x0b\x49\xeb\xd1\xbf\x82\x91\xce\x3e\xef\xff\xc2\x3b\
+\x12\x99\x5e\xd7\xd6\xc1\xaf\x6e\x82\x53\x7f\xf1\xab\xa3\x82\x03\
+\x6d\xf0\xff\xe3\x91\xc0\xb2\x17\xad\xfb\x1a\x74\x7e\x8e\x23\xc7\
+\x3c\x66\x04\xa9\x0d\x1b\x35\xd1\x7a\x5d\xc7\x8f\x1f\x67\x0d\x02\
+\x00\x00\x00\x00\x78\x27\xb5\x25\xa9\xce\x63\x76\xea\x2f\xa0\x53\
+\x17\x2e\xdb\xbe\xb0\x2e\x5b\xb5\x56\x7b\x78\x36\xdc\x7b\xd6\xd1\
+\x41\x55\x6b\xce\x0a\x5b\x87\xbf\x3a\xb5\x30\x73\xdb\x91\x80\x1d\
+\xfc\xdf\x2d\x26\x37\x4f\xeb\x67\xd9\xa2\x55\x9e\x2b\xb7\xa8\x5e\
+\xb1\x62\x05\x83\x1d\x00\x00\x00\x00\xe0\x9d\x5e\x7d\xf5\x55\xad\
+\x05\x4c\x1d\x8c\x62\x62\x61\x7d\x68\x90\xde\xe6\x39\x91\x75\x32\
+\x9d\x3d\xc9\xee\xf2\x9b\x12\x56\xb5\xba\x6d\xc3\x3f\x2a\xa3\xbe\
+\x57\x9e\x5e\x70\x6b\xb5\xe6\xae\xd2\xfb\x79\x46\x55\x32\x02\xd5\
+\x09\x53\xa6\x6b\xbd\xae\x11\x23\x46\x30\xd8\x01\x00\x00\x00\x00\
+\xde\xe9\xf0\xe1\xc3\x5a\x0b\xd8\x7d\x6d\xee\x37\x02\x80\xcc\x06\
+\x0d\x7d\x6a\xe7\xbf\x1a\x63\x66\xd8\x36\xfc\x2b\xb7\xed\x6c\x1d\
+\x8d\xcb\xe0\xff\xff\xa9\x4b\x20\xba\x3f\xd7\xb5\x9b\xb6\xd8\xfe\
+\x3e\x5d\xb9\x6e\x93\xd6\x6b\x6a\xdd\xba\x35\x83\x1d\x00\x00\x00\
+\x00\xe0\x9d\xd4\xd9\xe4\x3a\x0b\x98\xfa\x4b\xdd\xee\x45\x55\x9d\
+\xe2\xa6\xbb\xfb\x5f\xdd\xf5\x7b\x1c\x1b\x4e\x4d\xcb\x5f\x91\x90\
+\xe8\x18\x5b\x86\x7f\x6c\xf3\x36\x8e\xdf\xb8\xe8\x2b\xe9\x3e\x5a\
+\xa9\x4e\xf1\xb3\x7d\xa7\xca\xa3\x27\xb4\x5e\x53\x62\x62\x22\x83\
+\x1d\x00\x00\x00\x00\xe0\x9d\x86\x0c\xd1\xfb\xaa\x7d\xea\xcc\x39\
+\xb6\x2f\xaa\x4b\x57\xea\x5d\xff\x57\x7b\xc8\xe7\x5c\x7e\xc3\xb1\
+\xc1\x94\x3c\x7c\x82\x2d\xc3\x3f\xa2\x66\xba\xd7\x0e\x2c\xf2\x85\
+\xd4\x8e\x8e\x3a\x3f\xdf\xe6\x2d\xcd\xdc\x07\x10\xad\x89\xbf\x8f\
+\x3e\xfa\x88\xe1\x0e\x00\x00\x00\x00\x70\xbe\x16\x2d\x5a\x68\x2d\
+\x5e\xeb\x9e\xd8\x6a\xfb\x82\x3a\x76\xfc\x24\xbd\xb3\xe0\xb3\x9a\
+\x3b\xfb\x9c\xba\x0d\x77\xfe\x87\xc4\xc4\x49\xe3\xc3\xcf\x30\xe8\
+\x7f\xa4\x3a\xcb\xb7\xe8\x5d\x16\x4a\x4a\x32\x02\x80\xfa\x9a\x97\
+\xab\xae\x5e\xbd\xca\x70\x07\x00\x00\x00\x00\x38\x5f\x5c\x9c\xde\
+\x76\xb5\xa5\x27\xcf\xda\xbe\xa0\xf6\xea\xd3\x57\xeb\x35\x25\x8f\
+\x98\xe4\xdc\x96\xbf\x87\x2f\xdb\xf2\xd7\xbf\xda\x3f\x80\x21\xff\
+\x13\x97\x5a\xce\xbf\xaa\xf5\x38\xa0\xda\xbb\xdf\xc4\x89\x95\x6a\
+\xa7\x41\x9d\xdf\xfd\xce\x9d\x3b\x19\xee\x00\x00\x00\x00\x00\x67\
+\xfb\xe0\x83\x0f\xf4\x6e\x56\xab\x52\xc5\xc8\x5f\x54\xd9\xb9\xcd\
+\xb4\x5e\x97\x3a\x84\xc7\xa9\xa1\x94\x3a\x61\x8e\x0d\xd7\xfd\x5b\
+\x33\xe0\x7f\xee\xb7\x2d\x75\xf4\xf6\xdf\xdf\xbc\x7d\xb7\xed\xef\
+\xd7\x61\xa3\xf4\x4e\xd2\x9c\x35\x6b\x16\xc3\x1d\x00\x00\x00\x00\
+\xe0\x6c\xd7\xae\x5d\xd3\x3b\x02\x38\xab\xa9\x11\x00\x24\x56\xad\
+\xa6\xf5\xba\xb2\x4e\xbf\xe4\xd8\x40\x8a\xce\xd2\xc3\x8a\xfa\x8b\
+\xb6\xc1\xee\x53\x0c\xf7\x9f\x7b\x38\x50\xe7\x5e\x5a\x3f\xef\xd9\
+\xf3\x17\xda\xfe\x7e\x9d\xb7\x48\xef\x68\xe0\x41\x83\x06\x31\xdc\
+\x01\x00\x00\x00\x00\xce\x56\x51\x51\xa1\xb5\x70\x75\xeb\xf9\x80\
+\xfd\xdb\xab\x9e\xb9\xa0\x75\xcc\xaa\x3a\x20\xc7\xb1\xaf\xa4\xcf\
+\xbe\x2c\xbf\xd0\x7c\x5a\x41\x0d\x34\x06\xfb\xdd\xdc\x70\xa9\x77\
+\x6e\xc5\x90\xa1\x23\x6c\x7f\xcf\x6e\xdd\xb5\x57\xeb\x35\xf5\xea\
+\xd5\x8b\xe1\x0e\x00\x00\x00\x00\x70\xb6\xb2\xb2\x32\xad\x85\x6b\
+\xe0\xa0\x42\xdb\x17\xd3\x4d\xdb\x76\x6a\xbd\xa6\x4a\xf5\x9b\xf8\
+\xd4\xce\x7f\xdc\xf8\x77\x77\xa5\x2f\x5c\xaf\xf5\xf3\x6e\xd7\xb1\
+\xb3\xed\xef\xd9\x03\x47\xf5\x4e\x2c\x6c\xdf\xbe\x3d\xc3\x1d\x00\
+\x00\x00\x00\xe0\x6c\x25\x25\x25\x5a\x0b\x97\xba\xf6\x69\xf7\x62\
+\x3a\x7b\xde\x02\xbd\xbf\xa8\xbb\xf4\x76\x6c\x18\xa9\x0d\x7b\xb4\
+\x76\xa7\xcb\x6c\xcc\x50\xbf\xdb\xe3\x81\x77\xea\x3d\x77\x5f\x27\
+\xa3\xae\xed\xef\x59\x75\x63\xa1\xce\x6b\xca\xcd\xcd\x65\xb8\x03\
+\x00\x00\x00\x00\x9c\x6d\xcb\x16\xbd\xc7\xaa\xc6\x4d\x9c\x62\xfb\
+\x62\x3a\x46\xf3\x11\xc0\x1a\xa3\xa6\x38\xb7\x31\x4d\x6a\x2d\xbd\
+\xd7\x3a\x7a\x1a\x43\xfd\x2e\xcb\xbe\xf8\x1b\xad\x9f\x79\x95\xf8\
+\x04\x23\xf7\xad\xe8\x6c\x5c\x55\xaf\x5e\x3d\x86\x3b\x00\x00\x00\
+\x00\xc0\xd9\x56\xaf\xd6\x3b\xcf\x7c\xda\x2c\xfb\x37\x01\x2a\x1c\
+\x3e\x52\xeb\x35\xa9\xaf\x88\x9d\x1a\x46\xea\x88\x5e\x9d\xd7\xda\
+\x68\xff\x05\x86\xfa\x3d\x14\x5a\x39\xfe\xde\xcf\x88\x88\x8a\x72\
+\xdd\x66\x40\xc9\xc9\xc9\x0c\x77\x00\x00\x00\x00\x80\xb3\x15\x15\
+\x15\x69\x0d\xb0\xb9\x0b\x97\xd8\xbe\x90\xf6\x2f\x18\xa4\xb7\x05\
+\xf0\xda\x5d\x3e\xf1\x97\xa8\xfa\xf6\x80\x61\x7e\x8f\xdf\xbc\xd4\
+\x4c\xd7\xda\x0b\xe0\xcc\xc5\x2b\xae\x7a\x72\x25\x3a\x3a\x9a\xe1\
+\x0e\x00\x00\x00\x00\x70\xb6\x69\xd3\xa6\x69\x0d\x31\xb5\x65\xaf\
+\xdd\x0b\x69\x8f\x07\xfa\x68\xbd\xa6\xcc\x2d\x87\x1d\x19\x42\x8d\
+\x0e\x5e\xe4\xee\x7f\x2f\x55\xa9\x41\x96\xd6\xcf\xfe\xd8\xe9\xf3\
+\xb6\xbf\x6f\x6b\xa6\xd5\xd2\x42\xc9\x9d\x3b\x77\x18\xf0\x00\x00\
+\x00\x00\x00\xe7\x1a\x3d\x5a\x6f\x03\x13\x13\xa7\xab\x75\xe8\x94\
+\xaf\xf5\x9a\x1a\xee\x39\xe3\xc8\x10\x52\x9b\x0d\xe9\xbc\xce\x6a\
+\x05\x23\x18\xe6\xf7\x98\xda\x38\x49\xe7\x67\xbf\xff\x48\x99\xeb\
+\x4e\xaf\xfc\xf8\xe3\x8f\x19\xf0\x00\x00\x00\x00\x00\xe7\x52\x1b\
+\x90\xe8\x2c\x5a\x5b\x76\xee\xb1\x7d\x21\x6d\x75\x9f\xde\xe2\xde\
+\xf8\xc8\x15\x67\x1e\x47\x2b\xd2\x3b\xb0\x28\xe5\xb1\xd9\x0c\xf3\
+\x7b\x7d\xfa\xa2\x5d\x57\xad\x9f\xfd\x8e\xbd\x07\x5d\xb7\x7b\xe5\
+\xbb\xef\xbe\xcb\x80\x07\x00\x00\x00\x00\x38\x57\xef\xde\xbd\xb5\
+\x16\xad\xa7\x0f\x94\xda\xbe\x90\x66\x65\xe7\x68\xbd\x26\xb5\x39\
+\x8f\x13\x43\x28\xe5\xb1\x59\x7a\x37\x2b\x7a\x00\xc1\x30\xbf\xb7\
+\x12\x7a\xf4\xd7\xfa\xd9\xab\xbd\x26\xec\x7e\xdf\xde\xd7\xe6\x7e\
+\xad\xd7\xf4\xdb\xdf\xfe\x96\x01\x0f\x00\x00\x00\x00\x70\xae\x4e\
+\x9d\x3a\x69\x2d\x5a\x87\x8e\x9f\xb6\x7d\x21\xad\x5b\x4f\x6f\xaf\
+\x77\xa7\x8e\x01\x4e\x9b\x5d\x2c\x71\xad\xda\xdd\x73\x6c\xff\x7b\
+\xef\x55\x1b\x30\x54\xeb\x3d\xb2\x7a\xc3\x66\xdb\xdf\xb7\x1d\xf3\
+\xbb\x68\xbd\x26\xb5\x2d\x37\x03\x1e\x00\x00\x00\x00\xe0\x58\x5d\
+\xbb\x76\x75\xdd\xb5\xd4\x86\x8d\x9a\x68\xbd\xa6\xec\xf3\xaf\x31\
+\x24\xfd\xbc\xc4\xde\x0f\x6b\xbd\x47\xd6\x6f\xde\x66\xfb\xfb\xb6\
+\x5d\x07\x3d\x4c\xbf\xfc\xf2\xcb\x0c\x78\x00\x00\x00\x00\x80\x73\
+\xf5\xeb\xd7\x4f\xef\x18\xd3\x7d\xf6\x5f\x4b\x6d\xd6\xa2\xa5\xde\
+\x01\x45\x65\x2f\x30\x24\x39\x10\xe8\x47\x53\x7b\xf7\xdb\xfd\xbe\
+\x6d\x99\xa7\x77\xef\xca\x9b\x6f\xbe\xc9\x80\x07\x00\x00\x00\x00\
+\x38\x57\x61\x61\xa1\xeb\x8e\x56\x6d\xdb\xbe\x83\xde\xe6\x3a\x07\
+\x2a\x18\x92\x7e\x5e\x5c\x5e\x7b\xad\xf7\xc8\x9e\x83\x47\x5d\x77\
+\xef\xca\x7b\xef\xbd\xc7\x80\x07\x00\x00\x00\x00\x38\xd7\x98\x31\
+\x63\xb4\x16\xad\x35\x9b\x9e\xb4\x7d\x21\xed\xd2\xbd\xa7\xd6\x6b\
+\xaa\xbf\xa3\x8c\x21\xe9\xe7\xe9\x1e\xc1\x7c\xf8\xc4\x59\xdb\xdf\
+\xb7\xf5\xea\x37\xd0\x7a\x4d\xff\xf9\x9f\xff\xc9\x80\x07\x00\x00\
+\x00\x00\x38\xd7\xd4\xa9\x53\xb5\x16\xad\x65\xab\xec\xdf\x08\xa8\
+\x4f\xbf\x01\x5a\xaf\xa9\xde\xc6\x12\x86\xa4\x9f\x17\x59\x47\xef\
+\x46\xd1\x53\xe7\x9f\xb1\xfd\x7d\x9b\x56\x2b\x5d\xeb\x35\x7d\xf5\
+\xd5\x57\x0c\x78\x00\x00\x00\x00\x80\x73\xcd\x9f\x3f\x5f\x6b\xd1\
+\x9a\xbf\x78\x99\xed\x0b\xe9\xc3\x85\x7a\x77\x78\xd7\x29\xde\xc6\
+\x90\xf4\xf3\xc2\xab\xd7\xb8\xe7\xf7\x47\x58\x58\x98\x91\xb3\x00\
+\xaa\x55\x4f\xba\xe7\xd7\x14\x1e\x1e\xce\x70\x07\x00\x00\x00\x00\
+\x38\x5b\x71\x71\xb1\xd6\xb0\x9d\x39\x67\xbe\xed\x0b\xe9\xc8\xd1\
+\xe3\xb4\x5e\x53\xcd\xa9\x0b\x19\x92\x7e\x5c\xee\xf3\xef\x48\x50\
+\x68\xe8\x3d\xbf\x3f\x62\xe3\xe2\x8c\x00\x20\x2e\xae\xf2\xbd\x9f\
+\x50\x58\xa5\x0a\xc3\x1d\x00\x00\x00\x00\xe0\x6c\x1b\x37\x6e\xd4\
+\x1a\xb6\x13\xa7\xce\xb0\x7d\x21\x9d\x34\x6d\xa6\xd6\x6b\xaa\xda\
+\xff\x11\x06\xa5\x1f\xd7\xb8\xf4\x59\xad\xf7\x47\x52\x72\x0d\x23\
+\x00\x08\x0f\x8f\xb8\xe7\xd7\x94\x9a\x9a\xca\x70\x07\x00\x00\x00\
+\x00\x38\xdb\xce\x9d\x3b\xb5\x16\xd3\xe1\x8f\x8e\xb5\x7d\x21\x2d\
+\x5e\xb3\x41\xeb\x35\xc5\xb6\x68\xcb\xa0\xf4\xe3\xd4\x69\x8f\x3a\
+\xef\x8f\xdc\xe6\x2d\x6c\x7f\xcf\x9e\x38\xa7\x77\x30\x54\x66\x66\
+\x26\xc3\x1d\x00\x00\x00\x00\xe0\x6c\x47\x8f\x1e\xd5\x5a\xb8\xd4\
+\xc9\x7d\x76\x2f\xa6\x7b\x0f\x1f\xd3\x7a\x4d\xea\xfa\x30\x83\xd2\
+\x7f\x4b\x9d\x34\x4f\xeb\xfd\xd1\xbb\xdf\x00\xdb\xdf\xb3\xdb\x77\
+\x97\x68\xbd\xa6\x96\x2d\x5b\x32\xdc\x01\x00\x00\x00\x00\xce\xf6\
+\xd2\x4b\x2f\xe9\x6d\xbb\xdb\xac\x85\x91\xaf\x53\x23\xa3\xa2\xee\
+\xfd\x75\x05\x05\x49\xce\xe5\x37\x19\x96\x7e\x5a\xd5\xbe\x83\xb5\
+\xde\xb3\xe3\x27\x4f\xb3\xfd\xfd\xba\x68\xf9\x2a\xad\xd7\x34\x70\
+\xe0\x40\x86\x3b\x00\x00\x00\x00\xc0\xd9\x6e\xde\xbc\xe9\xca\xeb\
+\xa9\x19\x9a\xe7\x01\x34\xdc\x77\x8e\x61\xe9\xa7\xc5\xe4\xe6\x69\
+\xbd\x37\x8a\xd7\x6e\xb0\xfd\xfd\x3a\x76\xc2\x64\xad\xd7\x34\x6b\
+\xd6\x2c\x86\x3b\x00\x00\x00\x00\xc0\xf9\xe2\xe2\xe2\xee\xf9\x03\
+\x15\x12\x12\x22\xa7\x2e\x5c\xb6\x7d\x41\x6d\xdf\xa9\xb3\xd6\x82\
+\x5a\xeb\xf1\x62\x86\xa5\x3f\x3e\x01\xf0\xc2\x3b\x12\x12\x1d\xa3\
+\xf5\xde\x28\x29\xb5\xff\xfc\x8a\x07\xfb\x3f\xa4\xb7\x35\xf1\xd6\
+\xad\x0c\x77\x00\x00\x00\x00\x80\xf3\x35\x6d\xda\x54\x6b\xf1\xda\
+\x55\x72\xd8\xf6\x05\x75\xc8\xd0\x11\x5a\xaf\x29\x3e\xbf\x37\x03\
+\xd3\x0f\xab\xbf\xb3\x4c\xeb\x7d\x51\x29\x3a\xda\xc8\x37\x56\x79\
+\xad\xdb\x68\xbd\xae\xf2\xf2\x72\x86\x3b\x00\x00\x00\x00\xc0\xf9\
+\xfa\xf4\xe9\xa3\xb5\x78\x2d\x5f\xbd\xde\xf6\x05\x75\xf6\xbc\x05\
+\x5a\xaf\x29\x34\x3e\x91\x81\xe9\x87\xa5\x8c\x9b\xa5\x77\xb7\x7d\
+\x83\x86\x46\x00\x50\x2b\xbd\xb6\xd6\xeb\x7a\xeb\xad\xb7\x18\xee\
+\x00\x00\x00\x00\x00\xe7\x9b\x34\x69\x92\xeb\xf6\x02\xd8\xfe\xb4\
+\xde\x5d\xd5\x1c\x0a\xe4\x9f\xa9\x47\x3c\xdd\xf6\xd4\x8a\x2a\x22\
+\x22\x42\xeb\x32\xda\xed\xdb\xb7\x19\xee\x00\x00\x00\x00\x00\xe7\
+\x5b\xbf\x7e\xbd\xd6\xa2\x3a\xa0\x60\xb0\x91\x45\x35\x21\x31\x51\
+\x6f\x47\xc0\x69\x8b\x18\x9a\xfe\x74\xfd\xff\xb9\xb7\x25\x38\x22\
+\x52\xeb\x3d\xf1\x78\xd1\x22\xdb\xdf\xa7\xea\x9e\x02\x9d\xd7\x94\
+\x96\x96\xc6\x60\x07\x00\x00\x00\x00\x78\xa7\xe3\xc7\x8f\x6b\x2d\
+\x60\xd9\xb9\xcd\x8c\x00\xa0\x43\xe7\x2e\x5a\xaf\xab\xf2\xfd\x5d\
+\x18\x9c\x7e\x54\xe6\x93\x87\xb4\xde\x0f\x41\x41\x41\x72\xf0\xd8\
+\x29\xdb\xdf\xa7\x0b\x97\xad\xd0\x7a\x5d\xed\xdb\xb7\x67\xb0\x03\
+\x00\x00\x00\x00\xbc\xd3\xab\xaf\xbe\xaa\xb5\x80\xa9\x67\xf6\x4f\
+\x57\x3c\x6b\xfb\xc2\x3a\x79\xba\xde\xf5\xde\xe0\xf0\x08\xc9\xbe\
+\xf8\x1b\x86\xa7\xbf\x3c\xff\xdf\xaf\x50\xef\xc9\x90\xf4\xda\x46\
+\xa0\x3a\x70\x90\xde\xeb\x1a\x3e\x7c\x38\x83\x1d\x00\x00\x00\x00\
+\xe0\x9d\xd4\x31\xa4\x51\x3a\x1b\xef\x78\xda\xbc\x7d\xb7\xed\x0b\
+\xeb\xae\x92\x43\xda\xf7\x01\xa4\xcd\xe6\x71\x40\xff\xf8\xfa\xff\
+\xf7\x12\xa2\x71\xd8\x8e\xb5\x03\x60\xdf\xfe\x46\x00\x90\x95\x9d\
+\xa3\xf5\xba\xd4\x79\x1c\x0c\x76\x00\x00\x00\x00\x80\xd7\x6a\xdd\
+\xba\xb5\xeb\x76\x57\xd3\x3d\x62\x55\x15\x9d\xd5\x8c\x01\xea\x07\
+\xd5\x59\xb1\x4d\x1b\x83\x26\x8e\xae\x56\x7b\x60\x44\x46\xea\xdd\
+\x97\x70\xed\xda\x35\xd6\x20\x00\x00\x00\x00\x80\xf7\x9a\x32\x65\
+\x8a\xd6\x22\xd6\x29\xbf\xab\x11\x00\xe4\x77\xeb\xae\xbd\xf0\x37\
+\x3e\x72\x85\x21\xea\xe3\x55\x69\xdf\x4d\xfb\xfa\xff\xe1\x13\x67\
+\x6d\x7f\x7f\x6e\xda\xba\x43\xef\xf2\x99\x07\x0f\x3c\x01\x00\x00\
+\x00\x00\x00\xf0\x6a\x07\x0e\x1c\xd0\x5a\xc8\x92\x6b\xa4\x18\x01\
+\xc0\xac\xb9\x0b\xb4\x01\x90\x3c\x62\x12\x43\xd4\x87\xcb\x3e\xff\
+\x9a\x04\x85\x85\xb9\xf2\xf9\xff\x71\x13\xf5\xe0\x9c\x97\x97\xc7\
+\xfa\x03\x00\x00\x00\x00\xf0\x6e\xd7\xaf\x5f\xd7\x1e\xb4\x26\xee\
+\xb0\x3e\x76\xe6\x82\xde\xc1\x40\xff\xef\x74\xc0\xdc\xab\xd7\x19\
+\xa6\xbe\x7a\xfa\xdf\x94\x22\xed\xf7\xe6\xd8\xf1\x93\xcc\x3c\xa9\
+\xd2\x29\x5f\xeb\x75\xa9\x3d\x38\x58\x7f\x00\x00\x00\x00\x00\xbe\
+\xfe\xc1\x92\xa2\x25\xc5\x46\x16\xd9\xce\x5d\xf5\x2f\x03\xa4\xcf\
+\x5f\xc3\x30\xf5\xd1\x9b\xff\xc2\xaa\xea\xdd\x07\x12\x12\x1a\x6a\
+\x04\xa7\xaa\xa4\xe4\x64\xbd\x73\x09\x4a\x4a\x58\x7b\x00\x00\x00\
+\x00\x00\xde\xaf\x57\xaf\x5e\x5a\x8b\x59\xaf\x3e\x7d\x8d\x2c\xb2\
+\xea\xf4\x36\x5d\x00\x44\xa4\xd5\x91\x66\x2f\xdc\x60\xa8\xfa\x58\
+\xea\x29\x0e\xdd\xdf\xbd\xda\xa7\xdf\xc4\xfb\x72\xc7\xde\x03\xda\
+\xaf\xed\xed\xb7\xdf\x66\xed\x01\x00\x00\x00\x00\x78\xbf\xc5\x8b\
+\x17\x6b\x2d\x66\x89\x89\x55\xe5\xcc\xc5\x2b\xb6\x2f\xb4\xea\xbf\
+\x59\xad\x5a\x75\xed\xc5\xb6\xce\xf2\x2d\x0c\x55\x1f\x3b\xf9\x2f\
+\x22\x25\x4d\xfb\xf7\x3e\x77\xe1\x12\x23\x00\x18\x39\x7a\x9c\xe6\
+\xe7\x25\x91\x75\x07\x00\x00\x00\x00\xe0\x8e\xd4\x89\x64\xba\x8b\
+\xed\xfa\xcd\xdb\x8c\x2c\xb6\x05\x43\x1e\xd1\x7e\x6d\x51\x99\x8d\
+\x19\xac\x3e\x54\xfa\x82\x75\xda\xbf\xf3\x98\xd8\x58\x39\x79\xfe\
+\x19\x23\xef\xc9\x06\x8d\x1a\xeb\x9d\x4b\xd0\xa3\x07\xeb\x0e\x00\
+\x00\x00\x00\xc0\x1d\x7d\xf6\xd9\x67\xda\x1b\x02\x3d\x34\x68\x88\
+\x91\xc5\xf6\xa9\x3d\xfb\xb5\x87\x81\xaa\xee\xda\x5d\x0c\x57\x1f\
+\xf9\xeb\x3f\xb2\x56\x86\xf6\xef\xbb\x67\xef\x07\x8d\xbc\x1f\xd5\
+\xfe\xff\xea\xd1\x42\x9d\xd7\xb6\x6e\xdd\x3a\xd6\x1d\x00\x00\x00\
+\x00\x80\xff\xdc\x07\x90\x9a\x96\x66\x64\xc1\x55\x35\x6c\xdc\xc4\
+\x86\x7b\x01\x6a\x5b\x87\xca\x30\x64\x5d\x7e\xe7\xff\xe4\xf9\xb6\
+\x80\x6f\xc3\x96\xa7\x8c\xbc\x17\x27\x4c\x99\xce\xf5\x7f\x00\x00\
+\x00\x00\x80\x7f\xb5\x75\xeb\x56\xed\x85\x6d\xfb\xee\x12\x23\x8b\
+\xae\xee\xa1\x2b\xdf\x56\xe3\xd1\xa9\x0c\x59\x17\x97\x75\xea\x9a\
+\x04\x57\x8a\xd6\xfe\x3d\x9b\x3a\xa4\x4a\xd5\xac\x45\x4b\xad\xd7\
+\xd6\xb0\x61\x43\xd6\x1b\x00\x00\x00\x00\x80\xbb\x7a\xef\xbd\xf7\
+\xb4\xbf\xda\x1c\x36\x6a\xb4\xb1\x85\xb7\x76\x86\xfe\xd7\xc2\xea\
+\x90\xa0\xc6\x47\xd9\x1d\xd0\xb5\xbb\xfe\x75\xea\x69\x0b\xf4\xd4\
+\xd3\x23\x26\xde\x83\x47\x4e\x9e\x93\xd0\xd0\x50\xad\xd7\x36\x6b\
+\xd6\x2c\xd6\x1b\x00\x00\x00\x00\x80\xfb\x6a\xde\xbc\xb9\x2b\x77\
+\x5d\x53\xa9\xf3\xdc\xed\x18\x0e\x71\x79\xed\x19\xb6\x2e\xac\xee\
+\x86\xbd\xb6\xfc\x7e\xd5\x0d\x7a\xa6\xde\x83\x76\xec\x4e\xf9\xdc\
+\x73\xcf\xb1\xd6\x00\x00\x00\x00\x00\xdc\xd7\xc2\x85\x0b\xb5\x17\
+\xb8\xad\xbb\xf6\x1a\x59\x7c\xd5\x23\x81\xa9\x35\xd3\x6c\x19\x12\
+\xb5\x97\x6e\x66\xe8\xba\xa8\x9c\xcb\x6f\x4a\x44\x4a\x2d\x5b\x7e\
+\xb7\x8b\x96\xad\x34\x06\x80\xdc\xe6\x2d\xb4\x5e\x5b\xd5\xaa\x55\
+\xe5\xce\x9d\x3b\xac\x35\x00\x00\x00\x00\x00\xf7\xf5\xab\x5f\xfd\
+\x4a\x7b\x01\x7e\xe0\xc1\x7e\xc6\x16\xe0\x69\xb3\xe6\xd8\x32\x24\
+\x42\x62\xe2\xa4\xc9\xf1\xe7\x19\xbe\x2e\x29\xa1\xe7\x00\x5b\x7e\
+\xaf\x75\x32\xea\x1a\x7b\xef\xed\xd8\x7b\x50\xfb\x12\xd9\x23\x8f\
+\x3c\xc2\x3a\x03\x00\x00\x00\x00\x70\x6f\x35\x6b\xd6\xd4\x5a\xe4\
+\x2a\x55\xaa\x64\xed\xe3\x6f\x62\x11\x56\x47\xb0\x56\x4f\x4a\xb2\
+\x65\x58\x44\x37\xca\xe1\x9c\x00\x37\x3c\xf3\x5f\xb4\xd6\x96\xdf\
+\xa7\x6a\xce\x82\xc5\xc6\x00\xd0\x77\x40\x81\xf6\xeb\x2b\x2d\x2d\
+\x65\x8d\x01\x00\x00\x00\x00\xb8\xb7\x71\xe3\xc6\x69\x2f\x74\x13\
+\xa7\xce\x30\xf7\x2d\xc0\xec\xb9\xb6\x0d\x8c\xea\x83\x1e\x65\x08\
+\x7b\xb1\x46\x87\x2e\x49\x70\x64\x94\x3d\xfb\x3c\xd4\xcb\x34\xb2\
+\x1b\xa5\xea\xc4\xb9\x8b\xd6\xc6\x42\x5a\x8f\xa1\x46\x44\xc8\x27\
+\x9f\x7c\xc2\x1a\x03\x00\x00\x00\x00\x70\x6f\x2f\xbc\xf0\x82\xab\
+\xbf\x8a\x55\x35\xc9\x6a\x6a\x1b\x02\x32\x56\xef\x64\x18\x7b\xe3\
+\xba\xff\xb3\x6f\x4a\x64\x9d\x4c\x5b\x7e\x87\xea\xab\x79\x53\xcf\
+\xfd\xab\xa6\xce\xd4\xbf\xf4\x54\x50\x50\xc0\xfa\x02\x00\x00\x00\
+\x00\x70\x7f\x59\x59\x59\xda\x0b\xde\xda\x4d\x5b\x8c\x2d\xc8\xea\
+\x46\xc3\x10\xcd\xc7\xb1\xfe\x71\x3f\x40\x5c\x65\x69\x7c\xf8\x19\
+\x86\xb2\x93\xbd\xf8\x07\x89\xef\xf6\xa0\x6d\x88\x33\x75\x18\xd5\
+\xb7\xa9\xa7\x5b\x74\x5f\xe3\xf9\xf3\xe7\x59\x5b\x00\x00\x00\x00\
+\x00\xee\x6f\xe3\xc6\x8d\xda\x0b\x5e\xc7\xfc\x2e\x46\x17\xe5\x01\
+\x05\x83\x6d\x1b\x20\xe1\x49\x29\x92\x75\xea\x97\x0c\x66\x87\xaa\
+\x3e\x78\xb4\x6d\xbf\xbb\x2a\x55\xe2\xa5\xf4\xe4\x59\x63\xef\xb3\
+\x8d\x5b\x77\xe8\x3f\x75\x52\xbb\xb6\x7c\xf3\xcd\x37\xac\x2d\x00\
+\x00\x00\x00\x00\xf7\xf7\x97\xbf\xfc\x45\xfb\x6c\x80\xb0\xb0\x30\
+\xd9\x7f\xf4\x84\xb1\x85\x59\xdd\x68\x68\xc7\x49\x81\xff\x38\x30\
+\x28\xa3\xbe\x64\x57\xfc\x9a\x01\x6d\x7a\xab\xdf\x89\xf3\x6c\xfb\
+\x9d\xa9\x66\x3c\x3e\xdf\x28\x34\xf3\xbb\x75\xd7\x7e\x8d\x4b\x96\
+\x2c\x61\x5d\x01\x00\x00\x00\x00\xf8\x4e\x85\x85\x85\xda\x0b\xdf\
+\x83\xfd\x1f\x32\xba\x38\x17\x2d\x59\x6e\xeb\x30\x89\xc9\x6e\x29\
+\x39\x57\xde\x62\x50\x9b\xba\xe3\x7f\xe1\x7a\xf9\x85\xe6\xa3\x74\
+\xdf\x2d\x2b\x3b\xc7\xe8\xfb\x4b\x3d\xfa\x17\x12\x12\xa2\xf5\x1a\
+\xd5\xce\x81\x6a\x97\x4d\xd6\x14\x00\x00\x00\x00\x80\xcf\x74\xe5\
+\xca\x15\xed\x05\x3a\x2c\x3c\x5c\xf6\x1e\x3e\x66\x74\x91\x6e\xdd\
+\xf6\x7e\x5b\x11\x50\xf9\xfe\x2e\x3c\x1e\x68\x62\xa7\xbf\xb5\xbb\
+\x24\xc8\xa6\xfb\x36\xac\xcb\x36\xe1\x11\xc6\xce\x9e\xf8\x36\x75\
+\x19\x4b\x7b\x5f\x8c\x07\x1e\x60\x3d\x01\x00\x00\x00\x00\xf8\x5e\
+\xea\xe0\x12\xdd\x05\xb0\xc7\x03\x7d\x8c\x2e\xd2\x87\x4f\x9c\xb5\
+\xf5\x52\x80\x2a\xb6\x65\x5b\xc9\x79\xe6\x77\x0c\x6e\x1b\xff\xf2\
+\xb7\x73\xf8\xab\x26\x4f\x9f\x65\xf4\x7d\xa5\x6e\x34\x0d\xb2\xe1\
+\xdb\x8a\x13\x27\x4e\xb0\x96\x00\x00\x00\x00\x00\x7c\xaf\xb5\x6b\
+\xf5\x37\x69\x51\x77\xeb\xef\xde\x5f\x6a\x74\xb1\x56\x4f\x1c\xe8\
+\x7e\x55\xfb\x4f\x1b\x1a\xd5\x6f\x22\x4d\xcf\xfd\x3b\x03\xdc\x8e\
+\x6b\xfe\x36\x7e\xed\xaf\xea\xd0\xd9\xec\x0d\xa6\xaa\xb6\xed\x3a\
+\x68\xbf\xce\x94\x94\x14\xf9\xfa\xeb\xaf\x59\x4b\x00\x00\x00\x00\
+\x00\xbe\xd7\x47\x1f\x7d\x64\xed\xec\xa7\xbb\x10\x76\xe9\xd6\xc3\
+\xf8\x82\x3d\x72\xf4\x38\x5b\x87\x8c\xb5\x79\x4b\xcd\x74\x69\x72\
+\xec\x2a\x83\xfc\x1e\x1f\xf5\xb3\xf3\x6e\xff\x6f\x53\xe7\x41\x1c\
+\x3b\x7d\xde\xe8\x7b\xe9\x89\xed\xbb\x6c\xf9\xeb\x7f\xc1\x82\x05\
+\xac\x23\x00\x00\x00\x00\x00\xdf\x6d\xfa\xf4\xe9\xfa\xc7\xf0\x06\
+\x07\xcb\x53\x7b\xf6\x1b\x5d\xb4\xd5\x2e\x70\x2d\xf2\xee\xb3\x7d\
+\xe0\x84\x25\x54\x95\x06\x3b\x4f\x30\xd0\xef\x72\x93\x1f\x3b\x9f\
+\xf3\xff\xee\x3d\x25\x9b\x9f\xda\x6d\x1c\x93\xad\xee\x6b\xad\x7f\
+\x19\x29\x36\x56\x6e\xde\xbc\xc9\x1a\x02\x00\x00\x00\x00\xf0\xdd\
+\xfe\xf8\xc7\x3f\x6a\x3f\x12\xa8\x6a\xdf\xa9\xb3\xf1\x85\xfb\xd0\
+\xf1\xd3\x92\x58\xb5\x9a\xed\x83\x47\x5d\xbf\x4e\x9d\x3c\x9f\xe1\
+\xfe\x33\xb7\xf7\xb5\x6b\x87\xbf\xef\x37\x61\xca\x74\xe3\xef\xa1\
+\x75\x9b\xb7\xd9\xf2\x5a\x1f\x7f\xfc\x71\xd6\x0f\x00\x00\x00\x00\
+\x80\xef\x37\x69\xd2\x24\x5b\xb6\x6b\x5d\xb5\xfe\x09\xe3\x0b\xb8\
+\xba\x1f\x40\xdd\x21\x6e\x62\x00\x55\xbe\x3f\x5f\xb2\x2f\xb0\x57\
+\xc0\x8f\x1d\xec\x63\xd7\xde\xfe\xdf\x4f\x3d\x8f\x6f\xfa\xbd\xa3\
+\xbe\x45\xb2\x63\xd7\xbf\xe8\xe8\x68\xf9\xf3\x9f\xff\xcc\xda\x01\
+\x00\x00\x00\x00\xf0\xfd\xd4\x73\xcc\x91\x91\x91\xda\x0b\x63\xcd\
+\xb4\x5a\x72\xf2\xfc\x33\xc6\x17\xf2\xa2\x25\xc5\xd6\x65\x07\x13\
+\x83\x28\x3c\xa9\x86\xd4\xdf\x51\xc6\xc0\xff\xee\x57\xfe\x97\xdf\
+\xb4\xed\x48\xdf\x1f\xaa\x45\xab\x3c\xeb\x24\x48\xd3\xef\x9b\xb1\
+\x13\x26\xdb\xb3\x39\xd1\x8c\x19\xac\x1b\x00\x00\x00\x00\x00\xff\
+\xe9\xb1\xc7\x1e\xb3\x65\x71\x2c\x1c\x3e\xd2\xf8\x42\xae\x9a\x32\
+\x63\xb6\xb1\x81\x14\x14\x12\x22\xd5\x07\x3f\xca\xa3\x82\xea\xf9\
+\xfe\x0d\x7b\x25\x22\xa5\x96\xb1\x9f\x75\xfd\x86\x8d\xe4\xf8\xd9\
+\x0a\xe3\xef\x17\xb5\x5f\x45\x54\x94\xfe\x0d\xaf\xea\x72\x99\xba\
+\x6c\xc6\x9a\x01\x00\x00\x00\x00\xf0\x9b\x6e\xdc\xb8\x21\xe1\xe1\
+\xe1\xfa\x37\x72\x85\x85\x19\xbf\x21\xf0\xdb\x86\x8d\x1a\x6d\x6c\
+\x30\x59\xff\x96\x6a\xc9\x52\xa7\x78\x5b\x40\x0e\xfe\xac\x53\xd7\
+\xa4\x4a\xa7\x9e\x46\x7f\xbe\xea\x1b\xa3\xc3\x65\x67\x1c\x79\xaf\
+\xd8\xb5\xa1\xd4\xe4\xc9\x93\x59\x2f\x00\x00\x00\x00\x00\xfe\xd7\
+\xa3\x8f\x3e\x6a\xcb\x22\xd9\x34\x3b\xd7\x91\x45\x5d\xd5\xbb\xdf\
+\x00\xa3\x43\x4a\x15\xd7\xba\xa3\x34\x3e\xfa\x5c\x40\x0c\xfe\xdc\
+\x17\xde\xb1\x6e\x88\x0c\xae\x14\x6d\xf4\x67\xaa\x6e\xe6\xdc\x73\
+\xf0\xa8\x23\xef\x11\xbb\xb6\x94\x56\x97\xc9\xd8\xf6\x17\x00\x00\
+\x00\x00\xe0\x97\x5d\xbf\x7e\xdd\x96\x6f\x01\x54\xea\x8c\x75\x27\
+\x16\x77\x75\x63\x57\x87\x4e\xf9\xc6\x11\x10\x1c\x1e\x21\xd5\x06\
+\x0c\x95\x26\x27\x5e\xf4\xdb\xc1\x9f\xbe\x60\x9d\x44\xd6\xca\x30\
+\xfe\xb3\x8c\x89\x8d\xb5\x76\xe2\x73\xe2\xfd\xa1\xf6\x14\xb0\xeb\
+\xc9\x91\x09\x13\x26\xb0\x4e\x00\x00\x00\x00\x00\xfc\xb7\x59\xb3\
+\x66\xd9\xb3\xdd\x6e\x5c\x9c\x1c\x3c\x7e\xca\x91\x45\xfe\x74\xc5\
+\xb3\xd2\xad\xe7\x03\xc6\x07\xd7\xb7\x8f\x0c\x26\xf6\x2e\x90\xc6\
+\x47\xae\xf8\xc7\xe0\x7f\xee\xf7\x92\x36\xbb\x58\x22\x52\xd2\x1c\
+\xf9\xf9\xa9\x61\xec\xd4\xf0\xb7\xf3\x1b\xa2\x84\x84\x04\x6b\xe3\
+\x2c\xd6\x08\x00\x00\x00\x00\x80\xdf\xf6\xe9\xa7\x9f\x4a\x6a\x6a\
+\xaa\x3d\x77\x77\xe7\xdd\x67\xfd\x85\xee\xd4\x62\xff\x70\xe1\x50\
+\x47\x86\x98\x05\x81\xe0\x10\x89\xef\xda\x47\x1a\xec\x3a\xe9\x93\
+\x83\x3f\xfb\xfc\x6b\x92\x3a\xa5\x48\xc2\xaa\x26\x39\xf6\x33\x53\
+\xd7\xfc\x9d\xfa\xda\x5f\xb5\x64\xc5\x1a\x5b\x76\xfc\x53\x6d\xdd\
+\xba\x95\xf5\x01\x00\x00\x00\x00\xe0\xff\x1d\x38\x70\xc0\xb6\x45\
+\x5f\x6d\xe1\xeb\xd4\x82\xaf\x1a\x37\x71\x8a\x6d\x8b\xfe\xcf\xbe\
+\x36\x5c\x2b\x43\x52\xc6\xcd\x92\x26\x65\x2f\xba\xfe\xaf\xfd\x3a\
+\x2b\xb6\x49\x95\xf6\xdd\x24\x28\x2c\xcc\xd1\x9f\x91\xba\xdb\xdf\
+\xa9\x1b\xfe\x54\xfb\x0e\x1f\x97\xb8\xca\x95\xed\x81\x6c\x8b\x16\
+\xf2\xcd\x37\xdf\xb0\x36\x00\x00\x00\x00\x00\x02\xa3\x8e\x1d\x3b\
+\xda\xb2\x78\xaa\x43\x7c\xd4\xe6\x3d\x4e\x22\xe0\xf1\xa2\x45\xd6\
+\x39\xed\x4e\x0e\x38\x2b\x0f\x3c\x62\x72\xf3\xa4\xd6\xdc\x55\x92\
+\x75\xea\x97\x2e\x19\xfa\x6f\x4b\xe6\x93\x87\xa4\x6a\xbf\x42\x09\
+\x89\xab\xec\xfc\xcf\xe4\xff\x3d\xe7\xef\xc4\xa3\x7e\xdf\xbd\x24\
+\xd4\x24\xab\xa9\x3d\xf7\x7e\x04\x07\xcb\xb5\x6b\xd7\x58\x13\x00\
+\x00\x00\x00\x00\x81\xd3\xaf\x7f\xfd\x6b\xdb\x86\x68\xd5\x6a\xd5\
+\x1c\xfd\xeb\x4f\xb5\x7c\xf5\x7a\xa9\x14\x1d\xed\x95\x81\xf7\x8f\
+\xc3\x86\xd2\xea\x58\x83\xb7\xce\xf2\x2d\xd2\xf4\xfc\xab\x8e\xdd\
+\xcc\x57\x7f\x67\x99\xf5\x8d\x44\x6c\x8b\xb6\x12\x1c\x11\xe9\xd5\
+\x9f\x81\xda\xe1\xcf\x89\x4d\x7e\xbe\x5b\xc1\x90\x47\x6c\x7b\xfd\
+\xa3\x47\x8f\x66\x3d\x00\x00\x00\x00\x00\x04\x5e\x53\xa6\x4c\xb1\
+\x6d\x21\x6d\x99\xd7\xda\xd1\xfb\x01\x54\xbb\x4a\x0e\x49\xbd\xcc\
+\xfa\x5e\x1d\x80\xdf\xfd\x76\x40\xed\xa1\x1f\xdf\xb9\x97\x24\x0f\
+\x9f\x28\xe9\x0b\xd7\x5b\x87\x10\x65\x5f\xfc\xcd\xbd\x0d\xfa\xe7\
+\xdf\x91\xc6\xa5\xcf\x4a\xdd\xb5\xbb\x24\x75\xd2\x3c\xa9\xda\x77\
+\xb0\xf5\xed\x43\x48\x74\x8c\x2b\xfe\xbd\xea\x60\x1f\x27\xf6\xf6\
+\xff\x7e\x4b\x57\xae\xb5\xed\x12\x10\x37\xfe\x01\x00\x00\x00\x00\
+\x02\xb6\x5b\xb7\x6e\x49\x52\x92\x7d\x37\x89\x8d\x1c\xf3\x98\xe3\
+\x03\x41\x6d\x4d\xec\xc4\x5e\x01\x3a\x85\x56\x8e\xb7\x8e\x26\xae\
+\x54\xbf\x89\xc4\x36\x6f\x2d\x95\xdb\x75\x95\x84\x1e\xfd\xad\xc7\
+\x0e\x13\x7b\x3f\x6c\xa1\x21\x2e\xaf\xbd\x44\x67\x35\xb3\x10\x11\
+\x5e\xbd\x86\xf5\x34\x82\x5b\xff\x3d\xea\x48\x5f\x27\x4e\xf5\x33\
+\x79\xdd\x5f\xb5\x65\xcb\x16\xd6\x01\x00\x00\x00\x00\x40\xe0\x56\
+\x52\x52\x62\xdb\x82\x1a\xe2\x19\x5a\x2b\x1d\x38\x30\xe8\x87\x9a\
+\xb7\x68\x99\x44\xbb\xe4\xaf\x63\x7f\xae\x43\xe7\x2e\xd6\xb3\xf7\
+\xde\x80\x5e\x63\x9b\xae\xfb\xab\x5a\xb5\x6a\x25\x77\xee\xdc\x61\
+\x0d\x00\x00\x00\x00\x00\x04\x76\x03\x07\x0e\xb4\x6f\x13\x98\x98\
+\x18\x47\x9f\x03\xff\x6e\xbb\xf7\x97\x4a\x7d\x1b\x4e\x83\xa3\x1f\
+\x38\x44\x29\x3c\x42\x26\x4f\x9f\xe5\x95\xdf\xab\xba\xb4\xd4\xae\
+\x63\x67\xdb\xfe\x2d\xea\xb4\xbf\x37\xdf\x7c\x93\xcf\x3e\x00\x00\
+\x00\x00\x80\xfe\xf2\x97\xbf\x48\xcd\x9a\x35\x6d\x5b\x60\xd5\x4d\
+\x81\xea\xeb\x5a\x6f\x0c\x8b\x53\x9e\xbf\x14\x87\x8e\x1c\x6d\xec\
+\x48\xe1\x40\x2c\x2b\x3b\x47\xb6\xef\x2e\xf1\xca\xef\x53\xd5\x77\
+\x40\x81\xad\xff\x9e\xed\xdb\xb7\xf3\xb9\x07\x00\x00\x00\x00\xd0\
+\xb7\x5d\xba\x74\xc9\xd6\x23\x78\x6b\xd7\xc9\x90\x23\xa7\xca\xbd\
+\x36\x34\xd4\xb7\x01\xad\xee\x6b\xcd\x00\xd7\xa8\x4a\x95\x78\x99\
+\xf1\xf8\x7c\xaf\xfd\x0e\x55\xa3\x1f\x9b\x68\xeb\xbf\xa9\x6f\xdf\
+\xbe\x7c\xde\x01\x00\x00\x00\x00\xf4\xfd\x66\xce\x9c\x69\xeb\x62\
+\xdb\x34\x27\xd7\xba\x76\xeb\xcd\x01\x52\xb4\xa4\x58\xaa\x55\x4f\
+\x62\xa0\xdf\xcd\x2e\x88\x41\x41\xd2\xab\x4f\x5f\x29\x3d\x79\xd6\
+\xab\xbf\xbb\x39\x45\x8b\x6d\xdd\xf4\xa9\x46\x8d\x1a\xdc\xf5\x0f\
+\x00\x00\x00\x00\xa0\x1f\xea\xf6\xed\xdb\x92\x93\x93\x63\xef\x4d\
+\x63\x9d\xf2\x1d\x7f\x3c\xf0\xfb\xa9\x4d\x6a\x06\x0e\x2a\xf4\xce\
+\xe6\x41\x3e\x56\xdd\x7a\x99\xb2\x61\xcb\x53\x5e\xfd\x7d\xa9\xd4\
+\xcd\xa4\x61\x36\xee\x66\xa8\x20\x51\x5e\x5e\xce\xe7\x1c\x00\x00\
+\x00\x00\x40\xff\xaa\xd7\x5f\x7f\x5d\xa2\xa2\xa2\xec\xfd\xda\x75\
+\x40\x81\xd7\x07\x8a\xea\xe9\x03\xa5\xd2\xb3\xf7\x83\xb6\x0e\x16\
+\x7f\xa9\x4e\x46\x5d\x99\xb3\x60\xb1\xd7\xb1\xa6\x52\x8f\x18\xda\
+\xfd\x44\x87\xda\xf3\x82\xcf\x37\x00\x00\x00\x00\x80\x7e\xa2\xcd\
+\x9b\x37\xdb\x3e\x60\x7a\xf7\xed\xef\x8a\xe1\xa2\x2a\x29\x2d\x93\
+\x7e\x0f\x15\x58\xe7\xbf\x07\xfa\xe0\x6f\xd0\xa8\xb1\x2c\x5a\xb6\
+\xd2\x15\xbf\x17\x95\xfa\xf6\x41\x1d\x27\x6c\xeb\x4d\x8c\x59\x59\
+\xf2\xc5\x17\x5f\xf0\xd9\x06\x00\x00\x00\x00\xd0\xcf\x69\xc8\x90\
+\x21\xb6\x0f\x9b\x2e\xdd\x7b\xba\x06\x01\xaa\x43\xc7\x4f\x5b\x27\
+\x0c\x06\xe2\xfe\x01\xd9\xb9\xcd\xa4\x78\xed\x06\xd7\xfc\x2e\x54\
+\x6b\x36\x3e\x29\x95\x2a\x55\xb2\xf5\xdf\x19\x1f\x1f\x2f\x6f\xbc\
+\xf1\x06\x9f\x69\x00\x00\x00\x00\x00\xfd\xdc\xbe\xfc\xf2\x4b\x69\
+\xd3\xa6\x8d\xed\x83\x47\x3d\xcf\xed\xf4\xde\xf1\x3f\x95\x7a\x5a\
+\xe1\xb1\x49\x53\xfd\x7e\x0f\x01\xf5\x97\xb5\xba\x04\xe2\x86\x6b\
+\xfc\x3f\x74\xb6\x83\xdd\xdf\xc8\xa8\x4b\x3d\x15\x15\x15\x7c\x9e\
+\x01\x00\x00\x00\x00\x74\xb7\xfd\xe9\x4f\x7f\x92\xda\xb5\x6b\xdb\
+\x3e\x88\xf2\x5a\xb7\x91\x13\xe5\x97\x5c\x37\x84\x54\xdb\x9f\x2e\
+\x91\x82\xc1\x85\x52\xad\x5a\x75\xbf\x18\xfa\x6a\x77\x46\xf5\xf3\
+\x9e\xbb\x70\x89\xd7\x9f\xc8\xf8\x57\x2d\x5c\xb6\xc2\x3a\x5b\xc0\
+\xee\x7f\xfb\xd6\xad\x5b\xf9\x1c\x03\x00\x00\x00\x00\x48\xe7\xd4\
+\xc0\xb8\xb8\x38\xdb\x17\xe7\x9c\x66\xcd\x1d\x3d\x42\xf6\x5e\x76\
+\x9f\x2b\x5e\xb3\x41\x3a\x77\xed\x6e\xed\x6e\xe8\x6b\x8f\xf1\x65\
+\x36\x68\x28\x63\xc7\x4f\x92\x83\xc7\x4e\xb9\xf6\x67\x6c\x3d\xea\
+\xb7\x60\xb1\x85\x14\xbb\x7f\x06\x93\x27\x4f\xe6\xf3\x0b\x00\x00\
+\x00\x00\x20\xdd\xce\x9d\x3b\x27\x21\x21\x21\xb6\x2f\xd2\xf5\x1b\
+\x36\x92\xfd\x47\xca\x5c\x3d\xa0\xbe\xc5\xc0\xa6\xad\x3b\xac\xc3\
+\x8e\x5a\xb4\xca\x93\xa8\xa8\x4a\xae\x1b\xf8\xb5\xd2\x6b\x5b\x37\
+\x5a\xce\x5f\xbc\x4c\x0e\x9f\x38\xeb\xfa\x9f\xa9\x4a\x5d\x76\xb1\
+\x73\xf3\xa9\x6f\xeb\xd1\xa3\x07\xfb\xfc\x03\x00\x00\x00\x00\xc8\
+\xae\x36\x6d\xda\x64\x64\x78\x25\x26\x56\x95\xf5\x9b\xb7\xf9\xc4\
+\xc0\xfa\xc7\x76\xc3\x17\x2e\xcb\xda\x4d\x5b\xac\x2d\x87\x9b\xb7\
+\xcc\x93\xea\x49\x49\xb6\x6e\x58\xf3\x53\x55\x8a\x8e\xb6\xfe\xc2\
+\xef\xf1\x40\x1f\x79\xbc\x68\x91\xeb\xff\xca\xff\x7e\xea\xf2\x4f\
+\x97\x6e\x3d\x8c\xfc\x6c\x1a\x37\x6e\x2c\x1f\x7f\xfc\x31\x9f\x59\
+\x00\x00\x00\x00\x00\xd9\xd9\xf8\xf1\xe3\xcd\x9c\x2d\x1f\x16\x26\
+\x53\x66\x3e\xee\x53\x43\xec\xfb\x95\x9d\xab\x90\xcd\xdb\x77\xcb\
+\xec\xf9\x0b\x65\xc8\xd0\x11\xd6\xcd\x8e\xea\xd9\xfa\x2a\xf1\x09\
+\x12\x19\x15\x75\x57\x40\x50\x3f\x8f\xd8\xb8\x38\x49\x4a\xae\x21\
+\xb9\xcd\x5b\x58\xc7\x1d\x8f\x9f\x3c\xcd\xba\x6b\x5f\x3d\xc2\xe8\
+\xcb\x3f\xa7\xbd\x87\x8f\x59\x78\x31\xf1\x3e\xaa\x56\xad\x9a\x5c\
+\xbf\x7e\x9d\xcf\x2a\x00\x00\x00\x00\x80\xec\xee\xeb\xaf\xbf\x96\
+\x82\x82\x02\x63\x7f\xd9\x3e\xf0\x60\x3f\xd7\x3d\x21\x60\xe7\x65\
+\x04\x75\x8c\xae\xba\xe4\xb1\x63\xef\x41\xd9\xb4\x6d\xa7\xac\xde\
+\xb0\xd9\xfa\xf6\x43\x9d\x9e\xb8\xe7\xe0\x51\xeb\xab\xfb\x53\x2e\
+\xbd\x51\xcf\x8e\xd4\xbf\x57\x9d\x2f\x60\xe2\xbd\x53\xb9\x72\x65\
+\x79\xe9\xa5\x97\xf8\x9c\x02\x00\x00\x00\x00\xc8\x24\x02\xfa\xf7\
+\xef\x6f\x0c\x01\x4d\x9a\x66\xfb\xdc\x57\xda\xf4\xd3\xa9\x6f\x30\
+\x42\x0c\x6d\xc5\x1c\x1b\x1b\x2b\x2f\xbe\xf8\x22\x9f\x4f\x00\x00\
+\x00\x00\x00\x99\xee\xab\xaf\xbe\x92\x3e\x7d\xfa\x18\x43\x80\x7a\
+\x04\x4f\xfd\xb5\xc8\xe0\xf4\xfd\x8e\x9e\x2e\x97\xfc\x6e\xdd\xcd\
+\xed\x6d\x10\x13\x23\x57\xaf\x5e\xe5\x73\x09\x00\x00\x00\x00\x20\
+\x27\x0f\x0e\xea\xd9\xb3\xa7\xd1\x3b\xdb\xd5\x19\x02\x27\xce\x5d\
+\x64\x90\xfa\x68\x6a\x73\x1f\x93\x27\x31\xaa\x5d\x03\x9f\x7d\xf6\
+\x59\x3e\x8f\x00\x00\x00\x00\x00\x72\x3a\xb5\xbf\x7a\xb7\x6e\xdd\
+\x8c\xde\xf1\x9e\x5a\x33\x4d\xd6\x3d\xb1\x95\x81\xea\x43\x1d\x3b\
+\x73\xc1\xda\x71\xd0\xe4\x93\x11\xea\xc0\xaa\x8b\x17\x2f\xf2\x39\
+\x04\x00\x00\x00\x00\x90\xb7\xfa\xfc\xf3\xcf\xa5\x73\xe7\xce\x46\
+\x11\xa0\x9e\x15\x1f\x50\x30\xd8\xb5\xbb\x07\xd2\x77\x8e\xf1\x5d\
+\xb7\xc9\x7a\x7a\xc1\xe4\xfb\x41\x6d\x19\x7c\xfe\xfc\x79\x3e\x7f\
+\x00\x00\x00\x00\x00\xf2\x76\x9f\x7d\xf6\x99\x71\x04\xa8\xd2\x6a\
+\xa5\xbb\x72\x1f\x7b\x7a\xce\xda\xd5\x51\x3d\xae\x68\x7a\x3f\x04\
+\xf5\x97\xbf\xda\x98\x8a\xcf\x1d\x00\x00\x00\x00\x80\x5c\x74\x4f\
+\xc0\xb0\x61\xc3\x8c\x23\x40\x7d\x1b\xa0\x36\xc0\x39\x70\xf4\x24\
+\x83\xd7\x25\xcd\x9e\xb7\xc0\xda\x0c\xc9\xf4\xef\x3e\x39\x39\x59\
+\x7e\xf9\xcb\x5f\xf2\x79\x03\x00\x00\x00\x00\x00\x00\x37\xb6\x68\
+\xd1\x22\x47\x76\xc3\x53\xdb\xf1\xaa\x9d\xf8\xd4\x06\x3c\x0c\x61\
+\xef\x1d\xdf\xeb\xd4\x09\x8a\x6a\x87\xbf\x1b\x37\x6e\xf0\x19\x03\
+\x00\x00\x00\x00\x00\x00\x37\xb7\x6f\xdf\x3e\x09\x37\x70\xba\xdb\
+\x0f\x6e\x25\x5c\xb5\x9a\x4c\x9b\x3d\xd7\xda\x68\x87\xa1\xec\x4c\
+\x3b\xf7\x1d\x94\xb6\xed\x3a\x38\xb6\xf5\x71\x7e\x7e\xbe\xdc\xba\
+\x75\x8b\xcf\x16\x00\x00\x00\x00\x00\x00\xf8\x42\xcf\x3c\xf3\x8c\
+\xc4\xc7\xc7\x3b\x36\x24\x32\xea\xd6\xb3\xb6\xca\x65\x40\x9b\x4b\
+\xed\x54\xd8\x77\xc0\x40\x09\x35\xb4\xa1\xcf\x0f\x35\x6a\xd4\x28\
+\x6b\xdf\x09\x3e\x53\x00\x00\x00\x00\x00\x00\xe0\x43\xfd\xee\x77\
+\xbf\x93\x3a\x75\xea\x38\x7a\x32\x5e\x76\x6e\x33\x59\x5c\xbc\x8a\
+\x6f\x04\x6c\x6c\xdf\xe1\xe3\x32\x70\x50\xa1\xa3\xc7\x22\xab\x9b\
+\x09\x8b\x8b\x8b\xf9\x1c\x01\x00\x00\x00\x00\x00\x80\xaf\xf6\xe1\
+\x87\x1f\x4a\xdb\xb6\x6d\x1d\x3f\x22\x57\x3d\x31\x30\x79\xfa\x2c\
+\x1e\x1d\xd4\x48\x1d\x6e\xd4\xb9\x4b\x37\x47\xff\xe2\x57\x45\x47\
+\x47\xcb\xa1\x43\x87\xf8\xfc\x00\x00\x00\x00\x00\x00\x80\x3f\x9c\
+\x1f\x30\x7f\xfe\x7c\x23\x67\xbf\xff\x54\xea\xf0\x99\xc2\xe1\x23\
+\xe5\xe0\x71\xce\x17\xf8\xb9\x87\x16\x2d\x5a\xbe\xca\xfa\x26\xc5\
+\xe9\xdf\x95\x2a\x27\x27\x47\xde\x78\xe3\x0d\x3e\x37\x00\x00\x00\
+\x00\x00\x00\xe0\x4f\x5d\xba\x74\x49\x52\x52\x52\xbc\x32\x58\xc2\
+\xc3\x23\xac\xc7\x07\x37\x3c\xb9\x9d\x41\xff\x03\x1d\x3a\x7e\xda\
+\x3a\xb0\xa7\x66\x5a\x2d\xaf\xfc\x7e\xd4\x57\xfe\x93\x27\x4f\x96\
+\x2f\xbf\xfc\x92\xcf\x0a\x00\x00\x00\x00\x00\x00\xf8\x63\x7f\xfe\
+\xf3\x9f\xa5\x57\xaf\x5e\x5e\x19\x32\xff\x78\x9e\xbc\x46\x8a\x3c\
+\x5c\x38\xd4\x3a\x86\x37\xd0\x0f\xea\x99\xf1\xf8\x7c\x69\xd1\x2a\
+\xcf\xd8\x49\x7d\x3f\xeb\x49\x8e\xc4\x44\x39\x79\xf2\x24\x9f\x0f\
+\x00\x00\x00\x00\x00\x00\x08\x84\xd6\xaf\x5f\x2f\x11\x11\x11\x5e\
+\x85\x80\xaa\x76\x9d\x0c\x19\x3e\x6a\x8c\xec\xde\x5f\x1a\x10\x43\
+\x5f\xdd\x13\x31\x6f\xd1\x32\x69\xdb\xbe\x83\xf5\xad\x88\xb7\x7f\
+\xfe\x1d\x3a\x74\x90\x77\xdf\x7d\x97\xcf\x04\x00\x00\x00\x00\x00\
+\x00\x04\x52\xbf\xfa\xd5\xaf\xa4\x5e\xbd\x7a\x5e\x1f\x42\xdf\xd6\
+\xa0\x51\x63\x29\x1c\x36\xd2\xda\xcf\xde\x9f\x6e\x1e\x54\xcf\xed\
+\x4f\x99\x31\x5b\x3a\x74\xee\x22\x95\xa2\xa3\x5d\xf1\xb3\x56\x37\
+\x16\x2e\x5e\xbc\x58\xee\xdc\xb9\xc3\x67\x01\x00\x00\x00\x00\x00\
+\x00\x02\xf5\x1c\x81\x99\x33\x67\x4a\x58\x58\x98\x6b\x20\xa0\x52\
+\xaf\xa7\x49\xd3\x6c\x19\xf4\xc8\x30\x29\x5e\xb3\xc1\xa7\x76\x1c\
+\x7c\x6a\xcf\x7e\x99\x34\x6d\xa6\x35\xf0\x13\x13\xab\xba\xea\xe7\
+\xaa\x6a\xde\xbc\xb9\xbc\xf4\xd2\x4b\xbc\xff\x01\x00\x00\x00\x00\
+\x00\x80\xfe\x2a\xaf\xbd\xf6\x9a\x57\x1e\x17\xbc\x9b\xbf\x58\x1b\
+\x35\xc9\x92\x87\x06\x0d\x91\x79\x0b\x97\xca\x9e\x83\x47\x5d\x73\
+\x08\x8f\xda\x92\x77\xf4\x63\x13\xa5\x5d\x87\x4e\x12\x9f\x90\xe0\
+\xda\x9f\x61\x5c\x5c\x9c\x6c\xdc\xb8\x91\xbf\xfa\x01\x00\x00\x00\
+\x00\x00\x80\xfe\x77\xdf\x7c\xf3\x8d\xec\xd8\xb1\x43\x12\x5c\x3c\
+\xc4\xbe\xff\x88\x61\xcb\xbc\xd6\xd6\x65\x83\x27\x77\x3c\xed\xc8\
+\xc0\x3f\x79\xfe\x19\x99\x30\x65\xba\x74\xed\xd1\xcb\xba\x7f\xc1\
+\x1b\x8f\x56\xde\x4b\x05\x05\x05\xf2\xfe\xfb\xef\xf3\x3e\x07\x00\
+\x00\x00\x00\x00\x00\xfa\xf1\x27\x05\x86\x0f\x1f\x6e\xfc\x68\x59\
+\x3b\x7b\xe8\xe1\xc1\x8e\x00\x60\xff\x91\x32\x9f\xf9\x99\xa8\xea\
+\xd6\xad\x2b\xe5\xe5\xe5\xbc\xaf\x09\x00\x00\x00\x00\x40\x3f\xbf\
+\x67\x9f\x7d\xd6\x3a\x05\x0e\x00\xf8\x1e\x00\xd4\x13\x1e\x45\x45\
+\x45\xf2\xc5\x17\x5f\xf0\x5e\x26\x00\x00\x00\x00\x00\xdd\xdb\x2e\
+\x82\x7b\xf6\xec\xb1\xfe\x92\x04\x00\xee\x07\x80\x3a\x05\x72\xdc\
+\xb8\x71\xf2\x1f\xff\xf1\x1f\xbc\x7f\x09\x00\x00\x00\x00\x40\xf6\
+\x40\x60\xf7\xee\xdd\x92\x91\x91\x01\x00\x5c\x3a\xf8\xc7\x8c\x19\
+\x23\x37\x6e\xdc\xe0\xfd\x4a\x00\x00\x00\x00\x00\xb2\x3f\x75\x34\
+\xec\xce\x9d\x3b\xa5\x76\xed\xda\x00\xc0\x25\x8f\x4b\x3e\xfa\xe8\
+\xa3\x0c\x7e\x02\x00\x00\x00\x00\x90\x73\x10\x78\xea\xa9\xa7\x24\
+\x3d\x3d\x1d\x00\x78\x69\xf0\x8f\x1c\x39\x52\xde\x79\xe7\x1d\xde\
+\x8f\x04\x00\x00\x00\x00\x20\xef\x40\xe0\xe0\xc1\x83\xd2\xb1\x63\
+\x47\xaf\x3e\x35\x10\x28\x00\x48\x4e\x4e\x96\x79\xf3\xe6\xf1\x17\
+\x3f\x01\x00\x00\x00\x00\xc8\x3d\xfd\xee\x77\xbf\x93\xa9\x53\xa7\
+\x7a\x65\x1f\x01\x7f\x06\x80\x82\x55\x7e\x7e\xbe\x94\x96\x96\x5a\
+\xe0\xe2\xbd\x46\x00\x00\x00\x00\x00\x72\x65\xea\xd1\xb3\xbd\x7b\
+\xf7\x4a\x9b\x36\x6d\x00\x80\x46\x55\xab\x56\x95\x19\x33\x66\xc8\
+\x5b\x6f\xbd\xc5\xfb\x8a\x00\x00\x00\x00\x00\xe4\x7b\x5b\x0c\x4f\
+\x98\x30\x41\x52\x52\x52\x00\xc0\xcf\xbc\x9b\xbf\x4b\x97\x2e\x52\
+\x52\x52\x22\x5f\x7e\xf9\x25\xef\x21\x02\x00\x00\x00\x00\x90\xef\
+\x6f\x33\x7c\xed\xda\x35\x99\x33\x67\x8e\x91\xcd\x85\x7c\x19\x00\
+\x6a\x8f\x7e\xb5\x55\xef\xfe\xfd\xfb\xe5\xd6\xad\x5b\xbc\x5f\x08\
+\x00\x00\x00\x00\x40\xfe\x9b\xfa\x5a\x7b\xf5\xea\xd5\xd6\x01\x44\
+\x21\x21\x21\x01\x07\x80\xd4\xd4\x54\x6b\xc3\x9e\x73\xe7\xce\xc9\
+\xed\xdb\xb7\x79\x4f\x10\x00\x00\x00\x00\x80\x02\xaf\x3f\xfd\xe9\
+\x4f\x32\x7d\xfa\xf4\x80\x00\x40\xbd\x7a\xf5\xac\x6f\x42\xd4\x37\
+\x22\xfc\xee\x09\x00\x00\x00\x00\x40\x01\xdf\xd1\xa3\x47\x03\x02\
+\x00\xed\xda\xb5\xe3\xf7\x4d\x00\x00\x00\x00\x00\x22\x00\x40\x04\
+\x00\x00\x00\x00\x20\x00\x00\x00\x88\x00\x00\x00\x00\x00\x04\x00\
+\x00\x00\x11\x00\x00\x00\x00\x80\x00\x00\x00\x20\x02\x00\x00\x00\
+\x00\x10\x00\x00\x00\x44\x00\x00\x00\x00\x00\x02\x00\x00\x80\x08\
+\x00\x00\x00\x00\x40\x00\x00\x00\x10\x01\x00\x00\x00\x00\x08\x00\
+\x00\x00\x02\x00\x00\x00\x00\x00\x00\x02\x00\x00\x80\x00\x00\x00\
+\x00\x00\x00\x80\x00\x00\x00\x20\x00\x00\x00\x00\x00\x00\x20\x00\
+\x00\x00\x08\x00\x00\x00\x00\x00\x00\x08\x00\x00\x00\x02\x00\x00\
+\x00\x00\x00\x00\x02\x00\x00\x80\x00\x00\x00\x00\x00\x7c\xa8\x08\
+\x00\x00\x00\x02\x00\x00\x00\x00\x10\x01\x00\x00\x40\x00\x00\x00\
+\x00\x00\x22\x00\x00\x00\x08\x00\x00\x00\x00\x40\x04\x00\x00\x00\
+\x01\x00\x00\x00\x00\x88\x00\x00\x11\x00\x00\x00\x00\x80\x00\x00\
+\x00\x20\x02\x00\x00\x00\x00\x10\x00\x00\x00\x44\x00\x00\x00\x00\
+\x00\x02\x00\x00\x80\x08\x00\x00\x00\x00\x40\x00\x00\x00\x10\x01\
+\x00\x00\x00\x00\x08\x00\x00\x00\x22\x00\x00\x00\x00\x00\x01\x00\
+\x00\x40\x04\x00\x00\x00\x00\x20\x00\x00\x00\x88\x00\x00\x00\x00\
+\x00\x04\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x01\x00\x00\x40\
+\x00\x00\x00\x00\x00\x00\x40\x00\x00\x00\x10\x00\x00\x00\x00\x00\
+\x00\x10\x00\x00\x00\x04\x00\x00\x00\x00\x00\x00\x04\x00\x00\x00\
+\x01\x00\x00\x00\x00\x00\x00\x01\x00\x00\x40\x00\x00\x00\x00\x00\
+\x22\x00\x00\x00\x08\x00\x00\x00\x00\x40\x04\x00\x00\x00\x01\x00\
+\x00\x00\x00\x88\x00\x00\x00\x20\x00\x00\x00\x00\x00\x11\x00\x20\
+\x02\x00\x00\x00\x00\x10\x00\x00\x00\x44\x00\x00\x00\x00\x00\x02\
+\x00\x00\x80\x08\x00\x00\x00\x00\x40\x00\x00\x00\x10\x01\x00\x00\
+\x00\x00\x08\x00\x00\x00\x22\x00\x00\x00\x00\x00\x01\x00\x00\x40\
+\x04\x00\x00\x00\x00\x20\x00\x00\x00\x88\x00\x00\x00\x00\x00\x04\
+\x00\x00\x00\x11\x00\x00\x00\x00\x80\x00\x00\x00\x20\x00\x00\x00\
+\x00\x00\x00\x20\x00\x00\x00\x08\x00\x00\x00\x00\x00\x00\x08\x00\
+\x00\x00\x02\x00\x00\x00\x00\x00\x00\x02\x00\x00\x80\x00\x00\x00\
+\x00\x00\x00\x80\x00\x00\x00\x20\x00\x00\x00\x00\x00\x00\x20\x00\
+\x00\x00\x08\x00\x00\x00\x00\x40\x04\x00\x00\x00\x01\x00\x00\x00\
+\x00\x88\x00\x00\x00\x20\x00\x00\x00\x00\x00\x11\x00\x00\x00\x04\
+\x00\x00\x00\x00\x20\x02\x00\x44\x00\x00\x00\x00\x00\x22\x00\x40\
+\x04\x00\x00\x00\x00\x20\x00\x00\x00\x88\x00\x00\x00\x00\x00\x04\
+\x00\x00\x00\x11\x00\x00\x00\x00\x80\x00\x00\x00\x20\x02\x00\x00\
+\x00\x00\x10\x00\x00\x00\x44\x00\x00\x00\x00\x00\x02\x00\x00\x80\
+\x08\x00\x00\x00\x00\x40\x00\x00\x00\x10\x01\x00\x00\x00\x00\x08\
+\x00\x00\x00\x02\x00\x00\x00\x00\x00\x00\x02\x00\x00\x80\x00\x00\
+\x00\x00\x00\x00\x80\x00\x00\x00\x20\x00\x00\x00\x00\x00\x00\x20\
+\x00\x00\x00\x08\x00\x00\x00\x00\x00\x00\x08\x00\x00\x00\x02\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x80\x00\x00\x00\x00\x00\x44\x00\
+\x00\x00\x10\x00\x00\x00\x00\x80\x08\x00\x00\x00\x02\x00\x00\x00\
+\x00\x10\x01\x00\x00\x40\x00\x00\x00\x00\x00\x22\x00\xc0\xef\x9b\
+\x00\x00\x00\x00\x00\x44\x00\x80\x08\x00\x00\x00\x00\x40\x00\x00\
+\x00\x10\x01\x00\x00\x00\x00\x08\x00\x00\x00\x22\x00\x00\x00\x00\
+\x00\x01\x00\x00\x40\x04\x00\x00\x00\x00\x20\x00\x00\x00\x88\x00\
+\x00\x00\x00\x00\x04\x00\x00\x00\x11\x00\x00\x00\x00\x80\x00\x00\
+\x00\x20\x02\x00\x00\x00\x00\x10\x00\x00\x00\x04\x00\x00\x00\x00\
+\x00\x00\x04\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x01\x00\x00\
+\x40\x00\x00\x00\x00\x00\x00\x40\x00\x00\x00\x10\x00\x00\x00\x00\
+\x00\x00\x10\x00\x00\x00\x04\x00\x00\x00\x00\x00\x00\x04\x00\x00\
+\x00\x01\x00\x00\x00\x00\x88\x00\x00\x00\x20\x00\x00\x00\x00\x00\
+\x11\x00\x00\x00\x04\x00\x00\x00\x00\x20\x02\x00\x00\x80\x00\x00\
+\x00\x00\x00\x44\x00\x80\xdf\x37\x01\x00\x00\x00\x00\x88\x00\x00\
+\x11\x00\x00\x00\x00\x80\x00\x00\x00\x20\x02\x00\x00\x00\x00\x10\
+\x00\x00\x00\x44\x00\x00\x00\x00\x00\x02\x00\x00\x80\x08\x00\x00\
+\x00\x00\x40\x00\x00\x00\x10\x01\x00\x00\x00\x00\x08\x00\x00\x00\
+\x22\x00\x00\x00\x00\x00\x01\x00\x00\x40\x04\x00\x00\x00\x00\x20\
+\x00\x00\x00\x08\x00\x00\x00\x00\x00\x00\x08\x00\x00\x00\x02\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x80\x00\x00\x00\x00\x00\x00\x80\
+\x00\x00\x00\x20\x00\x00\x00\x00\x00\x00\x20\x00\x00\x00\x08\x00\
+\x00\x00\x00\x00\x00\x08\x00\x00\x00\x02\x00\x00\x00\x00\xf0\xa1\
+\x22\x00\x00\x00\x08\x00\x00\x00\x00\x40\x04\x00\x00\x00\x01\x00\
+\x00\x00\x00\x88\x00\x00\x00\x20\x00\x00\x00\x00\x00\x11\x00\x00\
+\x00\x04\x00\x00\x00\x00\x20\x02\x00\x44\x00\x00\x00\x00\x00\x02\
+\x00\x00\x80\x08\x00\x00\x00\x00\x40\x00\x00\x00\x10\x01\x00\x00\
+\x00\x00\x08\x00\x00\x00\x22\x00\x00\x00\x00\x00\x01\x00\x00\x40\
+\x04\x00\x00\x00\x00\x20\x00\x00\x00\x88\x00\x00\x00\x00\x00\x04\
+\x00\x00\x00\x11\x00\x00\x00\x00\x80\x00\x00\x00\x20\x02\x00\x00\
+\x00\x00\x10\x00\x00\x00\x04\x00\x00\x00\x00\x00\x00\x04\x00\x00\
+\x00\x01\x00\x00\x00\x00\x00\x00\x01\x00\x00\x40\x00\x00\x00\x00\
+\x00\x00\x40\x00\x00\x00\x10\x00\x00\x00\x00\x00\x00\x10\x00\x00\
+\x00\x04\x00\x00\x00\x00\x00\x00\x04\x00\x00\x00\x01\x00\x00\x00\
+\x00\x88\x00\x00\x00\x20\x00\x00\x00\x00\x00\x11\x00\x00\x00\x04\
+\x00\x00\x00\x00\x20\x02\x00\x00\x80\x00\x00\x00\x00\x00\x44\x00\
+\x80\x08\x00\x00\x00\x00\x40\x00\x00\x00\x10\x01\x00\x00\x00\x00\
+\x08\x00\x00\x00\x22\x00\x00\x00\x00\x00\x01\x00\x00\x40\x04\x00\
+\x00\x00\x00\x20\x00\x00\x00\x88\x00\x00\x00\x00\x00\x04\x00\x00\
+\x00\x11\x00\x00\x00\x00\x80\x00\x00\x00\x20\x02\x00\x00\x00\x00\
+\x10\x00\x00\x00\x44\x00\x00\x00\x00\x00\x02\x00\x00\x80\x00\x00\
+\x00\x00\x00\x00\x80\x00\x00\x00\x20\x00\x00\x00\x00\x00\x00\x20\
+\x00\x00\x00\x08\x00\x00\x00\x00\x00\x00\x08\x00\x00\x00\x02\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x80\x00\x00\x00\x00\x00\x00\x80\
+\x00\x00\x00\x20\x00\x00\x00\x02\x11\x00\x21\x21\x21\x92\x99\x99\
+\x49\x64\x4b\x29\x29\x29\x5a\x83\x35\x26\x36\x56\x52\x6b\xa6\x19\
+\xaf\x86\xe6\xeb\x8c\x8a\x8a\xe2\xf7\x4d\x5e\x49\xad\xd9\x00\x00\
+\x00\xd8\x02\x00\x22\x22\x0a\x98\x00\x00\x00\x20\x22\x22\x00\x00\
+\x00\x00\x00\x11\x11\x01\x00\x00\x00\x00\x88\x88\x08\x00\x00\x00\
+\x00\x40\x44\x44\x00\x00\x00\x00\x00\x22\x22\x02\x00\x00\x00\x00\
+\x10\x11\x11\x00\x00\x00\x00\x80\x88\x88\x00\x00\x00\x00\x00\x44\
+\x44\x04\x00\x00\x00\x00\x20\x22\x22\x00\x00\x00\x00\x00\x11\x11\
+\x01\x00\x00\x00\x00\x88\x88\x08\x00\x00\x00\x00\x40\x44\x44\x00\
+\x00\x00\x00\x00\x22\x22\x02\x00\x00\x00\x00\x10\x11\x11\x00\xf8\
+\x17\xfd\x5f\x6d\x27\x13\x64\xdc\x9a\xe1\x37\x00\x00\x00\x00\x49\
+\x45\x4e\x44\xae\x42\x60\x82\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00\x6f\xa6\x53\
+\x00\x69\
+\x00\x63\x00\x6f\x00\x6e\x00\x73\
+\x00\x0e\
+\x02\x2c\x1b\x27\
+\x00\x64\
+\x00\x65\x00\x6c\x00\x65\x00\x74\x00\x65\x00\x5f\x00\x74\x00\x61\x00\x62\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0f\
+\x07\xd5\x29\xf3\
+\x00\x70\
+\x00\x6f\x00\x74\x00\x65\x00\x6e\x00\x74\x00\x69\x00\x61\x00\x6c\x00\x5f\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x73\
+\x00\x0d\
+\x08\x58\x7d\x67\
+\x00\x70\
+\x00\x6c\x00\x75\x00\x73\x00\x5f\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0a\
+\x0b\x51\x17\x33\
+\x00\x74\
+\x00\x72\x00\x65\x00\x65\x00\x5f\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x73\
+\x00\x1a\
+\x01\xbb\xcb\x47\
+\x00\x62\
+\x00\x72\x00\x61\x00\x6e\x00\x63\x00\x68\x00\x2d\x00\x6d\x00\x6f\x00\x72\x00\x65\x00\x2d\x00\x6c\x00\x69\x00\x67\x00\x68\x00\x74\
+\x00\x67\x00\x72\x00\x65\x00\x65\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0f\
+\x02\x89\xc5\x87\
+\x00\x72\
+\x00\x69\x00\x67\x00\x68\x00\x74\x00\x2d\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0e\
+\x04\xac\x3c\xa7\
+\x00\x64\
+\x00\x6f\x00\x77\x00\x6e\x00\x2d\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x19\
+\x07\x6d\x81\xe7\
+\x00\x62\
+\x00\x72\x00\x61\x00\x6e\x00\x63\x00\x68\x00\x2d\x00\x65\x00\x6e\x00\x64\x00\x2d\x00\x6c\x00\x69\x00\x67\x00\x68\x00\x74\x00\x67\
+\x00\x72\x00\x65\x00\x65\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x14\
+\x08\x2c\x34\x67\
+\x00\x76\
+\x00\x6c\x00\x69\x00\x6e\x00\x65\x00\x2d\x00\x6c\x00\x69\x00\x67\x00\x68\x00\x74\x00\x67\x00\x72\x00\x65\x00\x65\x00\x6e\x00\x2e\
+\x00\x70\x00\x6e\x00\x67\
+\x00\x06\
+\x06\xfa\x65\x65\
+\x00\x69\
+\x00\x63\x00\x6f\x00\x6e\x00\x73\x00\x35\
+\x00\x03\
+\x00\x00\x77\x47\
+\x00\x70\
+\x00\x6e\x00\x67\
+\x00\x12\
+\x00\xa6\x41\xe7\
+\x00\x6c\
+\x00\x65\x00\x66\x00\x74\x00\x2d\x00\x61\x00\x6c\x00\x69\x00\x67\x00\x6e\x00\x6d\x00\x65\x00\x6e\x00\x74\x00\x2e\x00\x70\x00\x6e\
+\x00\x67\
+\x00\x08\
+\x00\xa7\x59\x27\
+\x00\x6c\
+\x00\x69\x00\x73\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x11\
+\x01\xd6\x1d\xa7\
+\x00\x6a\
+\x00\x75\x00\x73\x00\x74\x00\x69\x00\x66\x00\x79\x00\x2d\x00\x61\x00\x6c\x00\x69\x00\x67\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\
+\x00\x0a\
+\x02\xfc\x42\x47\
+\x00\x69\
+\x00\x74\x00\x61\x00\x6c\x00\x69\x00\x63\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0d\
+\x05\x04\x63\x87\
+\x00\x73\
+\x00\x75\x00\x62\x00\x73\x00\x63\x00\x72\x00\x69\x00\x70\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x06\x27\x5a\x67\
+\x00\x62\
+\x00\x6f\x00\x6c\x00\x64\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0a\
+\x07\x0e\x36\x07\
+\x00\x6c\
+\x00\x69\x00\x73\x00\x74\x00\x2d\x00\x31\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x08\xc8\x58\x67\
+\x00\x73\
+\x00\x61\x00\x76\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0d\
+\x08\xd5\xc4\xe7\
+\x00\x75\
+\x00\x6e\x00\x64\x00\x65\x00\x72\x00\x6c\x00\x69\x00\x6e\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0c\
+\x09\x3c\x0f\x27\
+\x00\x64\
+\x00\x6f\x00\x63\x00\x75\x00\x6d\x00\x65\x00\x6e\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x11\
+\x09\xa4\x41\x87\
+\x00\x73\
+\x00\x74\x00\x72\x00\x69\x00\x6b\x00\x65\x00\x74\x00\x68\x00\x72\x00\x6f\x00\x75\x00\x67\x00\x68\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\
+\x00\x0b\
+\x0a\x2a\x77\xe7\
+\x00\x70\
+\x00\x72\x00\x69\x00\x6e\x00\x74\x00\x65\x00\x72\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0a\
+\x0a\xc8\xfb\x07\
+\x00\x66\
+\x00\x6f\x00\x6c\x00\x64\x00\x65\x00\x72\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0c\
+\x0b\x43\x33\xc7\
+\x00\x75\
+\x00\x6e\x00\x64\x00\x6f\x00\x2d\x00\x6e\x00\x65\x00\x77\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0c\
+\x0b\xe1\x33\xc7\
+\x00\x72\
+\x00\x65\x00\x64\x00\x6f\x00\x2d\x00\x6e\x00\x65\x00\x77\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x13\
+\x0b\xff\xc2\x07\
+\x00\x72\
+\x00\x69\x00\x67\x00\x68\x00\x74\x00\x2d\x00\x61\x00\x6c\x00\x69\x00\x67\x00\x6e\x00\x6d\x00\x65\x00\x6e\x00\x74\x00\x2e\x00\x70\
+\x00\x6e\x00\x67\
+\x00\x0a\
+\x0c\x59\x5e\x07\
+\x00\x69\
+\x00\x6e\x00\x64\x00\x65\x00\x6e\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0e\
+\x0c\x5c\x25\x27\
+\x00\x64\
+\x00\x6f\x00\x63\x00\x75\x00\x6d\x00\x65\x00\x6e\x00\x74\x00\x2d\x00\x31\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0b\
+\x0c\xba\xc2\x07\
+\x00\x6f\
+\x00\x75\x00\x74\x00\x64\x00\x65\x00\x6e\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x14\
+\x0d\x63\xbd\x67\
+\x00\x63\
+\x00\x65\x00\x6e\x00\x74\x00\x65\x00\x72\x00\x2d\x00\x61\x00\x6c\x00\x69\x00\x67\x00\x6e\x00\x6d\x00\x65\x00\x6e\x00\x74\x00\x2e\
+\x00\x70\x00\x6e\x00\x67\
+\x00\x0f\
+\x0d\xe5\x89\x67\
+\x00\x73\
+\x00\x75\x00\x70\x00\x65\x00\x72\x00\x73\x00\x63\x00\x72\x00\x69\x00\x70\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0b\
+\x0f\x29\x4e\xc7\
+\x00\x70\
+\x00\x72\x00\x65\x00\x76\x00\x69\x00\x65\x00\x77\x00\x2e\x00\x70\x00\x6e\x00\x67\
+"
+
+qt_resource_struct_v1 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x04\x00\x00\x00\x02\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x00\x32\x00\x02\x00\x00\x00\x01\x00\x00\x00\x0b\
+\x00\x00\x00\x56\x00\x00\x00\x00\x00\x01\x00\x00\x25\xea\
+\x00\x00\x00\x76\x00\x02\x00\x00\x00\x05\x00\x00\x00\x06\
+\x00\x00\x00\x90\x00\x00\x00\x00\x00\x01\x00\x00\x36\x86\
+\x00\x00\x00\xca\x00\x00\x00\x00\x00\x01\x00\x00\x39\x31\
+\x00\x00\x00\xee\x00\x00\x00\x00\x00\x01\x00\x00\x59\x16\
+\x00\x00\x01\x10\x00\x00\x00\x00\x00\x01\x00\x00\x67\x6c\
+\x00\x00\x01\x48\x00\x00\x00\x00\x00\x01\x00\x00\x69\xa2\
+\x00\x00\x01\x76\x00\x02\x00\x00\x00\x01\x00\x00\x00\x0c\
+\x00\x00\x01\x88\x00\x02\x00\x00\x00\x16\x00\x00\x00\x0d\
+\x00\x00\x01\x94\x00\x00\x00\x00\x00\x01\x00\x00\x6c\x34\
+\x00\x00\x01\xbe\x00\x00\x00\x00\x00\x01\x00\x00\x71\x3b\
+\x00\x00\x01\xd4\x00\x00\x00\x00\x00\x01\x00\x00\x9c\xf0\
+\x00\x00\x01\xfc\x00\x00\x00\x00\x00\x01\x00\x00\xa1\xff\
+\x00\x00\x02\x16\x00\x00\x00\x00\x00\x01\x00\x00\xd7\x6b\
+\x00\x00\x02\x36\x00\x00\x00\x00\x00\x01\x00\x01\x11\x0a\
+\x00\x00\x02\x4c\x00\x00\x00\x00\x00\x01\x00\x01\x4c\xee\
+\x00\x00\x02\x66\x00\x00\x00\x00\x00\x01\x00\x01\x53\xc7\
+\x00\x00\x02\x7c\x00\x00\x00\x00\x00\x01\x00\x01\x5b\xc3\
+\x00\x00\x02\x9c\x00\x00\x00\x00\x00\x01\x00\x01\x60\xad\
+\x00\x00\x02\xba\x00\x00\x00\x00\x00\x01\x00\x01\x69\xaa\
+\x00\x00\x02\xe2\x00\x00\x00\x00\x00\x01\x00\x01\x6e\xb8\
+\x00\x00\x02\xfe\x00\x00\x00\x00\x00\x01\x00\x01\x85\xd2\
+\x00\x00\x03\x18\x00\x00\x00\x00\x00\x01\x00\x01\x94\x17\
+\x00\x00\x03\x36\x00\x00\x00\x00\x00\x01\x00\x01\xe3\x6b\
+\x00\x00\x03\x54\x00\x00\x00\x00\x00\x01\x00\x02\x32\xf2\
+\x00\x00\x03\x80\x00\x00\x00\x00\x00\x01\x00\x02\x38\x26\
+\x00\x00\x03\x9a\x00\x00\x00\x00\x00\x01\x00\x02\x42\x7f\
+\x00\x00\x03\xbc\x00\x00\x00\x00\x00\x01\x00\x02\x4c\x84\
+\x00\x00\x03\xd8\x00\x00\x00\x00\x00\x01\x00\x02\x57\x04\
+\x00\x00\x04\x06\x00\x00\x00\x00\x00\x01\x00\x02\x5c\x12\
+\x00\x00\x04\x2a\x00\x00\x00\x00\x00\x01\x00\x02\x95\xfb\
+"
+
+qt_resource_struct_v2 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x04\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x75\xba\x3f\x73\xd0\
+\x00\x00\x00\x32\x00\x02\x00\x00\x00\x01\x00\x00\x00\x0b\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x56\x00\x00\x00\x00\x00\x01\x00\x00\x25\xea\
+\x00\x00\x01\x75\xba\x3f\x73\xd0\
+\x00\x00\x00\x76\x00\x02\x00\x00\x00\x05\x00\x00\x00\x06\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x90\x00\x00\x00\x00\x00\x01\x00\x00\x36\x86\
+\x00\x00\x01\x75\xba\x3f\x73\xd0\
+\x00\x00\x00\xca\x00\x00\x00\x00\x00\x01\x00\x00\x39\x31\
+\x00\x00\x01\x75\xba\x3f\x73\xd0\
+\x00\x00\x00\xee\x00\x00\x00\x00\x00\x01\x00\x00\x59\x16\
+\x00\x00\x01\x75\xba\x3f\x73\xd0\
+\x00\x00\x01\x10\x00\x00\x00\x00\x00\x01\x00\x00\x67\x6c\
+\x00\x00\x01\x75\xba\x3f\x73\xd0\
+\x00\x00\x01\x48\x00\x00\x00\x00\x00\x01\x00\x00\x69\xa2\
+\x00\x00\x01\x75\xba\x3f\x73\xd0\
+\x00\x00\x01\x76\x00\x02\x00\x00\x00\x01\x00\x00\x00\x0c\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x01\x88\x00\x02\x00\x00\x00\x16\x00\x00\x00\x0d\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x01\x94\x00\x00\x00\x00\x00\x01\x00\x00\x6c\x34\
+\x00\x00\x01\x75\xba\x3f\x73\xd0\
+\x00\x00\x01\xbe\x00\x00\x00\x00\x00\x01\x00\x00\x71\x3b\
+\x00\x00\x01\x75\xba\x3f\x73\xd0\
+\x00\x00\x01\xd4\x00\x00\x00\x00\x00\x01\x00\x00\x9c\xf0\
+\x00\x00\x01\x75\xba\x3f\x73\xd0\
+\x00\x00\x01\xfc\x00\x00\x00\x00\x00\x01\x00\x00\xa1\xff\
+\x00\x00\x01\x75\xba\x3f\x73\xd0\
+\x00\x00\x02\x16\x00\x00\x00\x00\x00\x01\x00\x00\xd7\x6b\
+\x00\x00\x01\x75\xba\x3f\x73\xd0\
+\x00\x00\x02\x36\x00\x00\x00\x00\x00\x01\x00\x01\x11\x0a\
+\x00\x00\x01\x75\xba\x3f\x73\xd0\
+\x00\x00\x02\x4c\x00\x00\x00\x00\x00\x01\x00\x01\x4c\xee\
+\x00\x00\x01\x75\xba\x3f\x73\xd0\
+\x00\x00\x02\x66\x00\x00\x00\x00\x00\x01\x00\x01\x53\xc7\
+\x00\x00\x01\x75\xba\x3f\x73\xd0\
+\x00\x00\x02\x7c\x00\x00\x00\x00\x00\x01\x00\x01\x5b\xc3\
+\x00\x00\x01\x75\xba\x3f\x73\xd0\
+\x00\x00\x02\x9c\x00\x00\x00\x00\x00\x01\x00\x01\x60\xad\
+\x00\x00\x01\x75\xba\x3f\x73\xd0\
+\x00\x00\x02\xba\x00\x00\x00\x00\x00\x01\x00\x01\x69\xaa\
+\x00\x00\x01\x75\xba\x3f\x73\xd0\
+\x00\x00\x02\xe2\x00\x00\x00\x00\x00\x01\x00\x01\x6e\xb8\
+\x00\x00\x01\x75\xba\x3f\x73\xd0\
+\x00\x00\x02\xfe\x00\x00\x00\x00\x00\x01\x00\x01\x85\xd2\
+\x00\x00\x01\x75\xba\x3f\x73\xd0\
+\x00\x00\x03\x18\x00\x00\x00\x00\x00\x01\x00\x01\x94\x17\
+\x00\x00\x01\x75\xba\x3f\x73\xd0\
+\x00\x00\x03\x36\x00\x00\x00\x00\x00\x01\x00\x01\xe3\x6b\
+\x00\x00\x01\x75\xba\x3f\x73\xd0\
+\x00\x00\x03\x54\x00\x00\x00\x00\x00\x01\x00\x02\x32\xf2\
+\x00\x00\x01\x75\xba\x3f\x73\xd0\
+\x00\x00\x03\x80\x00\x00\x00\x00\x00\x01\x00\x02\x38\x26\
+\x00\x00\x01\x75\xba\x3f\x73\xd0\
+\x00\x00\x03\x9a\x00\x00\x00\x00\x00\x01\x00\x02\x42\x7f\
+\x00\x00\x01\x75\xba\x3f\x73\xd0\
+\x00\x00\x03\xbc\x00\x00\x00\x00\x00\x01\x00\x02\x4c\x84\
+\x00\x00\x01\x75\xba\x3f\x73\xd0\
+\x00\x00\x03\xd8\x00\x00\x00\x00\x00\x01\x00\x02\x57\x04\
+\x00\x00\x01\x75\xba\x3f\x73\xd0\
+\x00\x00\x04\x06\x00\x00\x00\x00\x00\x01\x00\x02\x5c\x12\
+\x00\x00\x01\x75\xba\x3f\x73\xd0\
+\x00\x00\x04\x2a\x00\x00\x00\x00\x00\x01\x00\x02\x95\xfb\
+\x00\x00\x01\x75\xba\x3f\x73\xd0\
+"
+
+qt_version = [int(v) for v in QtCore.qVersion().split('.')]
+if qt_version < [5, 8, 0]:
+    rcc_version = 1
+    qt_resource_struct = qt_resource_struct_v1
+else:
+    rcc_version = 2
+    qt_resource_struct = qt_resource_struct_v2
+
+def qInitResources():
+    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()